@@ -1,16 +1,36 @@
 import sys
 import os
-from gurobipy import GRB, read
-import itertools
 from itertools import product
+from functools import partial
 from collections import defaultdict
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+# The modules shared by both ciphers are in ../common
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from milp_data import PartitionTable, read_potential_pairs, potential_pairs_file
+from lp_template import LPTemplate, cached_template
+from solve_cache import cached_solve
+from milp_model import LinearSystem, add_sbox_constraints, cached_model, apply_solver_params, screened, stage_stats, stage_report
+from milp_backend import BACKENDS, build_model, benchmark
+from milp_journal import PairJournal
+from milp_pool import pair_results
+from truncated import TruncatedFilter
+from symmetry import layer_automorphisms, PairCanonicalizer
+from shard_queue import ShardQueue, queue_directory
+from propagation import Propagator, SboxLayer, LinearLayer, sbox_transitions, permutation_rows
+from permutation import generate_permutation
+from cipher_layer import block_permutation, inverse_permutation, GIFT_P64, GIFT_P16, GIFT_P2_16_BYTE
 
-def generate_permutation(P16_byte, size):
-    return [e * 4 + i for e in P16_byte for i in range(4)]
+# The data folder of this cipher, next to the script whatever the working directory
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Partition tables of the representatives, memory-mapped on first use
+ddt1 = PartitionTable("ddt1", DATA_DIR)
+ddt2 = PartitionTable("ddt2", DATA_DIR)
 
 def ID_lp(filename, GIFT, ROUND, s_boxes, P1, P2, P, conv, in_diff_bin, out_diff_bin):
     try:
+        # Bit j of a permuted state comes from bit P_inv[j]
+        P_inv, P1_inv, P2_inv = inverse_permutation(P), inverse_permutation(P1), inverse_permutation(P2)
         with open(filename, 'w+') as opGIFT:
             opGIFT.write("Minimize\n 0\n")
             opGIFT.write("Subject to\n")
@@ -48,7 +68,7 @@ def ID_lp(filename, GIFT, ROUND, s_boxes, P1, P2, P, conv, in_diff_bin, out_diff
                     opGIFT.write(buf)
 
             for j in range(GIFT):
-                opGIFT.write(f"x{1}_{j} - y{0}_{P1.index(j)} = 0\n")
+                opGIFT.write(f"x{1}_{j} - y{0}_{P1_inv[j]} = 0\n")
                 
             for j in range(s_boxes):
                     buf = ''
@@ -74,10 +94,10 @@ def ID_lp(filename, GIFT, ROUND, s_boxes, P1, P2, P, conv, in_diff_bin, out_diff
                                     buf = buf + " >= " + str(coff) + "\n"
                     opGIFT.write(buf)
             for j in range(GIFT):
-                opGIFT.write(f"u{1}_{j} - y{1}_{P2.index(j)} = 0\n")
+                opGIFT.write(f"u{1}_{j} - y{1}_{P2_inv[j]} = 0\n")
 
             for j in range(GIFT):
-                opGIFT.write(f"x{2}_{j} - u{1}_{P.index(j)} = 0\n")
+                opGIFT.write(f"x{2}_{j} - u{1}_{P_inv[j]} = 0\n")
 
             # Constraints for R^{r-4} rounds
             for i in range(2, ROUND - 2):
@@ -107,7 +127,7 @@ def ID_lp(filename, GIFT, ROUND, s_boxes, P1, P2, P, conv, in_diff_bin, out_diff
                                     buf = buf + " >= " + str(coff) + "\n"
                     opGIFT.write(buf)
                 for j in range(GIFT):
-                    opGIFT.write(f"x{i+1}_{j} - y{i}_{P.index(j)} = 0\n")    
+                    opGIFT.write(f"x{i+1}_{j} - y{i}_{P_inv[j]} = 0\n")    
             
             # Constraints for S o P1 o S
             for j in range(s_boxes):
@@ -135,7 +155,7 @@ def ID_lp(filename, GIFT, ROUND, s_boxes, P1, P2, P, conv, in_diff_bin, out_diff
                     opGIFT.write(buf)
                     
             for j in range(GIFT):
-                opGIFT.write(f"x{ROUND - 1}_{j} - y{ROUND - 2}_{P1.index(j)} = 0\n")
+                opGIFT.write(f"x{ROUND - 1}_{j} - y{ROUND - 2}_{P1_inv[j]} = 0\n")
                 
             for j in range(s_boxes):
                     buf = ''
@@ -185,10 +205,50 @@ def ID_lp(filename, GIFT, ROUND, s_boxes, P1, P2, P, conv, in_diff_bin, out_diff
         print(f"Error writing LP file: {e}")
         sys.exit(1)
 
+def ID_model(GIFT, ROUND, s_boxes, P1, P2, P, conv, backend="GUROBI"):
+    """The model of ID_lp for a backend, with x0 and x{ROUND} as boundary bits."""
+    P_inv, P1_inv, P2_inv = inverse_permutation(P), inverse_permutation(P1), inverse_permutation(P2)
+    system = LinearSystem()
+    x = [system.add_vars(GIFT, f"x{i}") for i in range(ROUND + 1)]
+    y = [system.add_vars(GIFT, f"y{i}") for i in range(ROUND)]
+    u = system.add_vars(GIFT, "u1")
+
+    # Constraints for P o P2 o S o P1 o S
+    add_sbox_constraints(system, x[0], y[0], s_boxes, conv)
+    system.add_equalities(x[1], [y[0][P1_inv[j]] for j in range(GIFT)])
+    add_sbox_constraints(system, x[1], y[1], s_boxes, conv)
+    system.add_equalities(u, [y[1][P2_inv[j]] for j in range(GIFT)])
+    system.add_equalities(x[2], [u[P_inv[j]] for j in range(GIFT)])
+
+    # Constraints for P o S rounds
+    for i in range(2, ROUND - 2):
+        add_sbox_constraints(system, x[i], y[i], s_boxes, conv)
+        system.add_equalities(x[i + 1], [y[i][P_inv[j]] for j in range(GIFT)])
+
+    # Constraints for S o P1 o S
+    add_sbox_constraints(system, x[ROUND - 2], y[ROUND - 2], s_boxes, conv)
+    system.add_equalities(x[ROUND - 1], [y[ROUND - 2][P1_inv[j]] for j in range(GIFT)])
+    add_sbox_constraints(system, x[ROUND - 1], y[ROUND - 1], s_boxes, conv)
+    system.add_equalities(x[ROUND], y[ROUND - 1])
+    return build_model(backend, system, x[0], x[ROUND])
+
+def ID_propagator(GIFT, ROUND, P1, P2, P, conv):
+    """The layers of ID_model for the bit propagation pre-filter."""
+    sbox = SboxLayer(sbox_transitions(conv))
+    perm, perm1 = LinearLayer(permutation_rows(P), GIFT), LinearLayer(permutation_rows(P1), GIFT)
+    layers = [sbox, perm1, sbox, LinearLayer(permutation_rows(P2), GIFT), perm]
+    for i in range(2, ROUND - 2):
+        layers += [sbox, perm]
+    layers += [sbox, perm1, sbox]
+    return Propagator(layers, GIFT)
+
 def solve_lp_file(filename):
     """Solve the LP file using Gurobi and return the status."""
+    # Imported here so that the data handling does not need gurobipy
+    from gurobipy import GRB, read
     try:
         model = read(filename)
+        apply_solver_params(model)
         model.optimize()
         if model.status == GRB.OPTIMAL:
             return True
@@ -201,17 +261,41 @@ def solve_lp_file(filename):
         print(f"Error solving LP file: {e}")
         return None
      
-def impossible_diff(GIFT, ROUND, P1, P2, P, conv, potential_ID):
-    non_feasible_diff = defaultdict(list)
-    list_excluded = defaultdict(list)
-    ddt1 = {0: [0], 2006: [32772, 4, 6, 8, 32776, 9, 11, 17, 18, 20, 23, 25, 26, 32796, 28, 30, 32797, 32, 33, 34, 32803, 36, 32798, 38, 39, 32799, 41, 42, 32804, 44, 45, 32814, 32815, 46, 48, 32813, 32812, 32820, 52, 32819, 55, 50, 57, 58, 60, 61, 62, 32831, 32829, 80, 89, 90, 93, 94, 96, 98, 99, 100, 102, 46895, 104, 105, 106, 107, 109, 110, 114, 115, 116, 118, 119, 120, 121, 122, 123, 124, 125, 126, 145, 146, 29, 148, 150, 151, 152, 153, 155, 156, 157, 158, 160, 161, 162, 164, 167, 169, 170, 172, 173, 174, 176, 177, 178, 180, 182, 183, 184, 185, 186, 187, 188, 189, 190, 192, 193, 194, 195, 196, 198, 199, 200, 201, 202, 203, 40, 205, 206, 209, 32978, 32979, 212, 32980, 214, 215, 32984, 216, 217, 219, 220, 221, 32986, 32987, 43, 225, 226, 32995, 32996, 228, 230, 231, 232, 233, 235, 240, 241, 33010, 242, 244, 33012, 247, 33016, 249, 250, 33018, 33019, 6562, 49, 254, 253, 260, 262, 264, 265, 267, 274, 275, 278, 282, 283, 285, 33056, 290, 291, 294, 298, 299, 301, 306, 307, 308, 310, 312, 314, 315, 6577, 33104, 338, 339, 342, 346, 347, 349, 6583, 354, 355, 358, 362, 363, 365, 33136, 372, 374, 376, 379, 33168, 402, 403, 404, 406, 408, 410, 411, 33178, 33182, 418, 419, 422, 426, 427, 429, 434, 435, 438, 442, 443, 445, 452, 454, 456, 457, 459, 461, 33232, 466, 467, 468, 470, 472, 473, 474, 475, 484, 65225, 486, 488, 489, 33258, 491, 33262, 498, 499, 500, 502, 504, 505, 506, 507, 65230, 509, 534, 536, 541, 33312, 548, 550, 555, 557, 33360, 596, 598, 603, 605, 614, 616, 621, 33392, 39205, 39206, 33424, 676, 678, 683, 685, 694, 696, 33466, 701, 33470, 708, 710, 715, 717, 33488, 758, 32715, 760, 33530, 765, 33534, 786, 787, 788, 790, 793, 794, 795, 802, 803, 804, 806, 808, 809, 810, 811, 818, 819, 820, 824, 826, 827, 850, 851, 852, 854, 856, 857, 858, 859, 866, 867, 868, 870, 872, 873, 874, 875, 914, 915, 916, 918, 921, 922, 923, 930, 931, 932, 936, 63861, 938, 939, 946, 947, 948, 950, 953, 954, 955, 978, 979, 980, 982, 984, 985, 986, 987, 1010, 1011, 1012, 1014, 1016, 1017, 1018, 1019, 1044, 1046, 1048, 33818, 1051, 1053, 33823, 210, 33840, 1078, 1085, 1108, 1110, 1112, 33882, 1115, 33887, 33888, 1126, 1133, 33936, 1172, 1174, 1176, 1179, 33952, 1190, 1197, 39318, 33984, 39319, 1220, 1222, 1224, 1227, 1229, 34000, 39327, 34051, 34052, 1300, 1302, 1303, 1304, 1305, 1307, 1308, 1309, 34076, 34079, 34077, 34078, 1318, 1319, 34092, 34093, 34094, 1324, 1325, 34095, 1332, 1334, 1335, 1336, 1337, 1339, 1340, 1341, 34110, 34108, 45858, 1364, 1366, 1367, 1368, 1369, 1371, 1372, 1373, 1382, 1383, 1388, 1389, 1396, 1398, 1400, 1401, 1403, 1428, 1430, 1432, 1433, 1435, 1446, 1447, 1452, 1453, 1462, 1463, 1468, 1469, 1476, 1478, 1479, 1480, 1481, 1483, 1484, 34253, 1485, 34254, 34255, 34252, 34257, 34263, 34273, 34279, 1526, 1527, 1532, 1533, 24818, 24819, 1812, 1814, 1815, 1816, 1817, 1819, 34588, 1821, 34590, 1820, 34591, 34593, 34589, 1828, 1830, 1831, 34599, 1833, 34602, 1835, 1836, 1837, 34605, 34606, 34604, 34608, 34607, 34609, 1846, 34615, 1847, 1848, 1852, 1853, 34622, 34620, 1876, 1878, 1879, 1881, 1883, 1884, 1885, 34656, 1892, 1894, 1895, 1896, 1897, 1899, 1900, 1901, 34682, 34687, 34704, 34720, 1956, 1958, 1959, 1960, 1961, 1963, 1964, 1965, 1974, 1975, 1976, 1980, 1981, 34752, 34755, 1988, 34756, 1990, 1991, 1992, 1993, 1995, 1996, 1997, 34766, 34767, 34764, 34765, 34768, 45990, 2038, 2039, 2040, 2044, 2045, 2322, 2323, 2324, 2326, 2329, 2330, 2331, 2336, 2338, 2339, 2340, 2342, 2344, 2345, 2346, 2347, 2349, 2352, 2354, 2355, 2356, 2360, 2361, 2362, 2363, 2365, 2384, 2386, 2387, 2388, 2390, 2392, 2393, 2394, 2395, 2397, 2400, 2402, 2403, 2404, 2406, 2408, 2409, 2410, 2411, 2413, 2420, 2422, 2424, 2427, 2429, 2450, 2451, 2452, 2454, 2456, 2457, 2458, 2459, 2461, 2464, 2466, 2467, 2468, 2472, 2473, 2474, 2475, 2477, 2480, 2482, 2483, 2484, 2486, 2489, 2490, 2491, 2493, 2496, 2505, 2509, 2514, 2515, 2516, 2518, 2520, 2521, 2522, 2523, 2525, 2544, 2546, 2547, 2548, 2550, 2552, 2553, 2554, 2555, 2557, 2582, 2584, 2585, 2589, 35360, 2592, 2596, 2598, 26568, 2603, 2605, 2608, 2617, 2621, 35408, 2640, 2644, 2646, 2649, 2651, 2653, 2656, 2662, 2664, 2669, 35440, 2678, 2681, 2685, 35472, 2710, 2717, 2720, 2724, 2726, 2731, 2733, 2736, 2740, 2742, 59161, 2744, 35514, 2747, 2749, 35518, 2752, 2756, 2758, 2763, 2765, 35536, 2774, 2781, 2788, 2790, 2792, 2795, 2800, 2806, 2808, 35578, 2813, 35582, 2820, 2822, 2824, 2825, 2827, 2834, 2835, 2838, 2842, 2843, 2845, 35616, 2848, 2850, 2851, 2852, 2854, 2856, 2857, 2858, 2859, 2861, 2864, 2866, 2867, 2868, 2870, 2872, 2873, 2874, 2875, 2877, 35664, 2896, 2898, 2899, 2902, 2905, 2906, 2907, 2909, 2912, 2914, 2915, 2918, 2921, 2922, 2923, 2925, 35696, 2932, 2934, 2936, 2939, 2941, 35728, 2962, 2963, 2964, 2966, 2968, 35738, 2971, 2970, 2973, 35742, 2976, 2978, 2979, 2982, 2985, 2986, 2987, 2989, 2992, 2994, 2995, 2998, 3001, 3002, 3003, 3005, 3008, 7111, 3012, 3014, 7112, 3016, 3017, 3019, 7113, 3021, 35792, 3026, 3027, 3028, 3030, 3032, 3033, 3034, 3035, 3037, 3044, 3046, 3048, 3049, 35818, 3051, 35822, 3056, 3058, 3059, 3060, 3062, 3064, 3065, 3066, 3067, 3069, 3092, 3094, 3095, 3096, 3097, 3099, 35868, 3100, 3101, 35871, 35869, 35873, 35870, 3108, 3110, 3111, 35879, 3113, 3115, 35884, 35885, 35886, 3116, 3117, 35887, 35889, 3126, 3127, 3128, 35895, 3132, 3133, 35902, 35900, 3156, 3158, 3159, 3161, 3163, 3164, 3165, 3172, 3174, 3175, 3176, 3177, 3179, 3180, 3181, 3236, 3238, 3239, 3240, 3241, 3243, 3244, 3245, 3254, 3255, 3256, 3260, 3261, 36035, 36036, 3268, 3270, 3271, 3272, 3273, 3275, 36044, 36045, 36046, 36047, 3276, 3277, 52761, 3318, 3319, 3320, 3324, 3325, 36118, 36119, 36120, 36124, 36128, 36144, 36176, 36192, 36198, 36199, 36200, 36204, 36256, 36262, 36263, 36268, 36282, 36287, 36288, 36294, 36295, 36300, 36346, 36351, 36355, 36356, 59332, 3604, 36374, 3606, 36375, 36376, 3609, 3608, 36380, 3613, 3612, 36383, 36384, 36381, 36382, 3611, 3622, 3623, 36394, 36396, 36397, 36398, 3628, 36400, 3629, 36399, 3636, 36406, 3639, 3638, 36408, 3640, 3641, 3644, 3645, 36414, 36412, 3643, 36432, 3668, 3670, 3671, 3672, 3673, 3675, 3676, 3677, 36448, 3684, 3686, 3687, 36456, 36455, 36454, 3691, 36460, 3693, 3692, 3688, 3700, 36470, 3702, 3704, 3705, 36474, 3707, 36472, 36479, 36496, 3732, 3734, 3736, 3737, 36506, 3739, 36511, 36512, 3748, 3750, 3751, 36519, 36518, 3752, 3755, 36524, 3757, 3756, 3766, 3767, 36538, 3772, 3773, 36543, 36544, 3780, 3782, 3783, 3784, 36551, 36550, 3785, 36556, 36557, 3789, 36558, 36560, 36561, 36559, 3788, 3787, 36567, 36577, 36583, 36586, 36591, 3830, 3831, 36602, 3836, 3837, 36607, 3860, 3862, 36631, 3864, 36634, 3867, 36636, 3869, 36639, 36640, 36656, 3894, 36662, 36664, 3901, 36688, 3924, 3926, 3928, 36698, 3931, 36703, 36704, 3942, 36711, 36716, 3949, 36726, 36728, 36752, 3988, 3990, 3992, 36762, 3995, 36767, 36768, 4006, 36775, 36774, 36780, 4013, 36800, 4036, 4038, 36807, 36806, 4040, 4043, 36812, 4045, 36816, 36842, 36847, 4100, 36868, 4102, 36870, 4104, 4105, 36872, 4107, 36873, 36875, 4113, 36882, 36883, 36884, 36885, 4118, 4119, 4120, 36886, 36888, 4123, 4124, 4125, 4126, 36895, 4127, 4129, 4130, 36893, 36900, 4132, 4134, 4133, 4135, 36899, 36898, 36901, 36907, 36909, 4141, 36911, 4143, 4144, 36910, 4138, 36916, 4149, 4150, 4142, 4151, 4153, 36917, 36923, 36915, 36925, 36926, 36927, 4157, 4159, 4177, 4178, 4180, 36948, 4182, 36950, 36952, 4185, 4186, 36953, 36955, 4187, 36958, 4191, 4192, 4193, 4194, 36961, 4196, 36962, 4198, 36964, 36966, 4201, 4202, 4203, 36968, 36969, 36970, 36971, 4200, 4209, 4210, 4204, 4212, 4213, 4214, 36982, 4216, 4217, 36984, 4219, 36985, 36988, 36990, 36987, 4223, 4218, 36986, 37010, 4243, 4244, 37011, 4246, 4242, 37012, 37013, 4250, 37014, 37016, 37019, 4245, 4255, 37020, 4251, 37026, 37027, 37028, 37029, 4262, 37030, 37032, 4265, 4266, 37035, 4268, 4270, 4271, 4272, 37038, 4274, 4275, 4276, 4277, 37045, 37044, 37042, 37043, 4282, 37051, 37054, 4287, 4289, 4290, 37058, 4292, 4293, 4294, 37059, 4296, 4297, 4298, 4299, 37060, 37061, 37062, 4303, 37064, 4305, 4306, 37075, 37067, 4309, 37078, 4311, 37080, 37081, 4312, 4315, 37084, 37076, 4310, 4319, 37083, 37082, 37090, 37091, 37092, 37093, 4325, 4327, 4321, 4322, 4330, 4335, 4336, 4337, 4338, 4339, 4340, 37108, 37110, 37107, 4344, 4345, 37112, 37113, 37114, 37115, 4341, 37118, 37122, 37123, 4356, 4357, 37124, 37125, 4354, 4355, 4369, 4370, 37142, 4377, 4378, 4379, 37148, 4382, 4383, 37152, 4385, 4386, 4384, 37157, 4393, 4394, 37167, 4401, 4402, 37174, 4406, 37176, 4409, 4410, 37200, 37205, 4442, 4443, 4446, 37215, 4447, 37222, 4460, 37228, 4462, 4464, 4470, 37238, 37240, 4473, 4476, 4478, 4496, 37265, 37266, 4497, 4498, 37268, 37270, 37272, 37273, 37274, 4505, 4506, 4509, 37275, 4513, 4514, 37282, 37281, 7410, 4518, 37289, 37290, 4521, 4522, 4525, 4524, 4527, 4528, 4529, 4530, 37296, 39977, 37301, 37298, 37297, 37305, 37306, 4537, 4538, 37311, 37313, 37314, 4546, 4548, 37316, 4550, 4551, 4552, 4553, 37319, 4555, 37318, 4556, 37320, 37321, 4560, 37329, 37330, 37323, 4564, 37332, 4566, 37335, 4568, 4569, 4571, 37345, 37346, 37348, 4580, 37350, 37351, 4584, 4585, 37352, 4587, 37355, 4589, 4582, 37360, 4593, 4594, 4592, 37364, 4596, 37366, 4599, 37368, 37369, 4600, 37371, 4603, 4601, 4598, 37375, 37367, 4630, 37398, 4633, 37404, 37408, 4640, 37413, 37414, 37416, 4649, 4651, 4653, 4654, 37423, 37456, 37461, 37462, 37464, 4697, 4701, 37471, 37478, 4710, 4713, 37484, 4720, 4731, 4734, 4752, 4762, 4767, 4774, 37542, 37544, 4780, 37552, 4784, 37556, 37557, 37563, 37567, 4806, 37574, 37576, 4812, 4816, 4826, 4831, 37616, 4848, 37620, 37621, 37627, 37631, 37649, 37650, 4881, 37652, 4882, 4884, 37655, 4888, 4889, 4890, 4897, 4898, 37665, 37668, 37666, 4902, 37671, 4904, 4905, 4906, 4907, 4900, 4913, 4914, 37681, 37682, 37684, 4918, 37687, 4916, 4921, 4922, 4923, 37730, 37731, 37732, 37733, 4965, 4964, 4962, 4963, 4972, 4974, 37746, 37747, 4980, 4981, 37748, 37749, 4978, 4979, 4988, 4990, 37777, 37778, 5009, 37780, 5010, 5012, 37783, 37784, 37785, 37786, 5016, 5015, 5017, 5018, 5025, 37794, 5026, 37796, 37793, 37798, 37799, 5030, 37801, 37802, 37803, 5033, 5035, 5037, 5034, 5039, 5041, 5042, 37810, 5044, 37809, 37812, 5047, 5048, 37817, 37818, 37815, 37816, 5049, 5050, 37826, 37827, 37828, 37829, 37910, 5147, 37916, 5150, 37920, 5152, 5168, 37941, 37942, 5174, 5176, 37945, 37951, 5211, 5214, 5216, 37989, 37990, 37996, 37999, 38000, 5232, 5238, 38006, 5240, 38009, 38032, 5280, 38053, 5286, 5292, 38063, 38068, 38070, 38072, 5305, 5306, 38075, 5309, 5310, 5312, 38084, 38085, 5318, 38086, 38088, 5321, 5322, 38091, 5324, 5325, 5326, 38095, 38096, 40146, 5378, 5380, 5381, 5382, 38148, 38152, 38153, 5384, 5387, 38169, 5402, 38172, 5405, 38174, 5407, 5408, 38173, 5413, 38182, 38188, 5421, 38190, 5423, 5424, 5429, 38198, 38201, 38204, 38205, 38206, 5439, 5461, 38230, 38233, 5466, 38236, 38237, 5471, 5472, 5477, 38246, 53192, 38252, 5487, 5488, 38265, 38269, 5520, 5524, 5526, 38294, 38296, 38297, 5530, 5531, 5528, 5534, 5541, 38310, 38316, 5551, 5552, 5556, 5557, 5558, 38326, 38328, 38329, 5562, 38331, 38332, 14130, 38334, 5567, 5566, 5560, 5563, 5572, 5573, 38342, 5574, 38344, 38345, 5578, 5576, 5580, 38349, 5582, 5583, 38351, 38353, 38354, 5586, 5588, 5584, 5585, 5593, 5594, 38361, 38362, 5602, 5604, 38374, 5606, 38376, 38377, 5610, 5611, 5608, 38379, 5614, 38382, 5616, 5617, 5618, 38385, 38386, 5621, 38390, 5625, 5626, 38393, 38394, 38396, 5631, 20671, 20673, 14186, 20705, 5910, 38678, 5912, 38684, 5917, 38686, 5919, 5920, 38688, 5922, 5924, 5925, 38694, 5926, 38696, 38697, 5930, 5928, 38700, 38701, 38702, 5935, 5936, 5934, 53283, 5938, 5940, 38709, 38710, 5941, 38708, 38713, 5946, 38715, 38716, 38717, 5950, 38718, 5951, 5947, 38719, 40615, 5973, 5974, 38742, 38744, 38745, 5978, 5976, 38748, 38749, 5982, 5983, 5984, 5988, 38756, 38758, 5990, 5992, 38761, 5994, 38757, 38764, 38765, 5998, 5999, 6000, 38768, 38767, 38763, 5995, 53297, 6010, 38779, 38782, 6015, 6032, 38800, 6042, 38811, 6043, 6046, 38814, 6048, 6047, 38821, 38822, 6054, 38824, 38825, 6058, 6053, 38828, 6061, 38829, 6063, 6064, 6062, 6060, 38831, 6068, 6069, 38838, 38841, 6075, 38844, 38845, 6079, 6080, 6082, 6085, 6086, 38854, 38856, 38857, 6090, 38853, 6092, 38861, 6094, 6095, 38863, 38865, 38866, 38864, 6096, 6093, 6102, 6100, 38872, 38873, 6106, 38875, 6107, 6105, 38878, 6110, 6111, 6104, 38874, 6128, 6129, 6130, 38897, 6132, 38898, 6134, 38900, 6136, 6137, 6138, 6139, 38904, 38905, 38906, 6143, 38909, 38908, 14278, 39185, 39186, 6417, 6420, 6418, 39188, 39191, 6424, 6425, 6426, 6432, 39201, 39202, 6433, 6436, 39204, 6438, 39207, 6434, 6441, 6442, 39210, 6443, 39211, 39214, 39208, 6448, 39217, 39218, 39215, 39220, 6452, 6454, 39223, 6449, 6457, 39226, 6458, 6459, 39230, 6480, 39258, 39262, 6496, 39266, 39267, 6498, 6499, 6501, 6500, 39268, 39269, 39274, 6508, 6510, 39278, 6514, 6515, 39284, 39285, 39286, 39283, 39288, 39282, 6517, 39291, 6524, 6516, 6526, 39295, 6545, 39313, 39314, 39316, 6546, 6548, 6551, 6552, 39321, 39322, 6553, 6554, 39317, 39320, 39323, 39328, 39329, 39330, 6561, 39332, 6564, 6566, 39334, 39335, 6569, 6570, 39337, 39338, 39339, 6574, 6575, 39344, 39345, 39346, 6571, 39348, 6573, 6580, 39351, 39352, 6585, 6586, 6578, 39354, 39353, 6590, 6584, 39360, 39362, 39363, 39364, 39365, 6602, 6606, 39380, 39381, 39382, 39384, 39387, 39391, 39408, 6650, 6654, 39444, 39446, 6678, 39448, 6681, 39451, 39452, 6688, 39456, 39461, 39462, 39464, 6697, 6699, 6701, 6702, 39471, 6704, 40645, 7848, 53440, 39504, 6736, 39508, 39509, 39510, 39512, 6745, 39515, 6749, 39519, 6752, 6758, 39526, 6761, 39532, 6768, 39541, 6779, 6782, 39551, 6800, 39573, 39578, 6810, 39582, 39583, 39584, 6814, 6815, 39590, 6822, 39592, 6828, 39600, 6832, 39604, 39605, 39610, 39611, 6842, 39614, 39615, 39616, 6846, 6854, 39622, 39624, 6858, 39626, 6860, 6862, 39630, 6864, 39637, 6874, 6879, 39647, 6890, 39658, 6894, 39662, 39664, 6896, 39668, 39669, 7885, 39675, 39679, 39682, 6914, 6915, 39683, 39684, 39685, 6917, 6916, 6929, 6930, 39702, 6937, 6938, 6939, 39708, 6942, 6943, 6944, 39712, 6945, 6946, 39716, 39717, 39718, 39720, 6953, 6954, 39722, 39723, 39726, 39727, 6960, 6961, 6962, 6966, 39734, 39736, 6969, 53488, 39738, 6970, 39742, 39760, 6992, 39765, 7002, 7003, 39770, 39774, 7007, 7008, 39775, 40470, 7006, 39782, 39786, 7020, 39788, 7022, 39790, 7024, 39796, 39797, 39798, 7030, 39800, 7033, 39803, 7036, 7038, 39807, 7056, 7057, 7058, 39826, 39828, 39825, 39830, 39829, 39832, 39833, 39834, 7065, 7066, 39835, 7069, 39839, 39840, 39841, 39842, 7073, 7074, 7078, 39849, 39850, 7081, 7082, 7085, 7086, 7087, 39856, 7088, 39858, 39857, 7084, 39861, 7089, 7090, 7097, 7098, 39866, 39865, 7102, 39871, 39872, 39873, 39874, 7106, 7108, 7105, 7110, 39879, 39880, 39881, 7114, 39883, 7116, 39876, 39878, 7118, 7120, 39889, 39890, 7115, 7124, 39893, 7126, 39895, 39896, 39892, 7128, 39899, 7131, 7129, 39894, 39903, 39905, 39906, 39908, 7140, 39910, 7142, 39912, 7145, 39911, 39915, 7144, 7149, 7147, 39920, 7153, 7154, 7152, 39924, 7156, 39926, 7158, 39927, 7160, 7162, 7163, 7161, 7159, 39925, 39928, 39929, 39931, 7166, 39935, 39964, 7197, 39966, 7199, 7200, 7202, 7204, 7205, 39974, 7206, 39976, 7208, 7210, 39979, 39980, 39981, 7214, 7213, 7216, 39982, 7215, 7218, 7220, 7221, 39990, 39993, 7227, 39996, 39997, 39998, 7231, 7253, 40022, 7254, 7256, 40025, 40024, 7258, 40028, 40029, 7262, 7263, 7264, 7268, 7269, 40038, 40041, 7275, 40044, 40045, 7279, 7280, 7290, 40059, 40062, 7295, 7312, 7322, 40091, 40094, 7327, 7333, 40102, 7334, 7336, 40104, 7338, 40105, 40108, 40109, 7342, 7343, 7344, 7348, 7349, 40118, 40121, 7355, 40124, 40125, 7359, 7362, 7365, 40134, 7366, 7368, 40137, 40136, 7370, 7372, 40141, 7374, 40140, 7376, 7377, 7378, 40143, 40148, 7380, 7382, 40145, 7384, 40153, 7386, 7387, 40154, 40155, 40158, 7391, 7385, 40152, 40548, 40549, 7408, 40177, 40178, 7409, 7412, 40180, 7414, 40182, 40184, 40185, 40186, 7417, 7418, 40188, 7413, 7419, 7416, 40189, 7423, 7444, 7445, 7446, 40215, 7451, 40220, 7452, 7455, 40224, 7467, 7470, 7472, 7482, 7487, 40272, 7515, 7518, 7520, 7524, 7525, 7526, 40295, 7530, 7531, 7532, 40300, 7535, 7584, 7588, 7589, 7590, 40359, 7592, 7595, 40364, 7598, 7599, 40368, 7600, 7616, 7620, 7621, 7622, 40391, 7624, 7627, 40396, 7630, 7631, 40432, 7664, 7682, 40452, 7684, 7686, 7685, 7688, 40456, 40457, 7691, 7700, 7701, 7702, 40471, 7704, 40473, 7706, 7707, 40476, 7708, 40478, 7711, 40480, 7712, 7709, 40477, 7717, 40486, 7723, 40492, 7725, 7726, 40494, 7728, 7727, 40500, 7733, 7734, 40502, 40501, 7736, 7738, 40507, 7732, 7739, 7742, 40511, 7743, 40505, 40508, 40509, 40510, 40617, 40528, 7765, 40534, 40537, 7770, 7771, 40540, 40541, 7774, 7775, 7776, 7780, 7781, 7782, 40551, 7784, 40550, 7786, 7787, 7788, 40556, 7790, 7791, 7792, 40560, 40555, 40559, 7796, 7798, 7800, 40569, 7803, 40573, 40592, 7824, 7828, 40598, 7830, 7832, 40601, 40600, 7835, 7834, 7838, 7840, 7844, 7845, 40613, 40614, 40616, 7849, 7846, 7851, 40620, 7853, 7854, 7855, 7856, 40623, 40624, 7852, 7860, 7861, 40630, 7862, 7864, 40632, 40633, 7867, 40636, 40635, 40638, 7871, 7872, 7870, 7866, 7876, 7877, 7878, 40647, 7880, 7881, 7882, 7883, 7884, 40648, 7886, 7887, 7888, 40649, 7890, 40653, 40652, 40646, 40656, 7889, 40655, 40665, 40666, 7899, 7892, 7897, 7902, 7898, 7906, 7908, 7910, 40678, 7912, 40680, 40681, 7915, 40683, 7914, 7918, 40686, 40688, 7920, 40689, 40690, 7921, 7925, 7922, 40694, 40697, 40698, 7929, 7930, 40700, 7935, 40657, 40658, 7957, 7958, 40727, 40726, 7963, 40732, 7964, 7966, 7967, 40736, 7968, 7984, 7988, 40757, 7990, 40758, 7992, 40761, 7995, 40767, 40784, 8027, 8030, 8032, 8037, 8038, 40807, 40806, 40805, 40812, 8044, 8047, 40816, 8048, 40815, 8052, 40822, 8054, 8056, 40825, 8059, 40848, 8091, 8094, 8096, 40869, 8101, 40871, 8102, 8108, 40876, 40879, 40880, 8112, 8111, 40884, 40886, 40888, 8121, 8122, 40891, 8123, 8125, 8126, 8127, 8128, 40900, 8133, 8134, 40903, 40902, 40904, 8138, 40907, 8140, 8137, 8142, 8143, 40912, 8141, 40908, 8139, 40911, 8171, 8174, 40944, 8176, 8196, 40964, 8198, 40966, 40968, 40969, 8201, 40971, 8203, 8209, 40978, 40979, 40980, 40981, 40982, 8215, 8214, 40985, 40986, 40987, 8220, 40989, 8221, 40991, 8223, 8225, 40994, 40995, 40996, 40997, 40990, 8231, 8234, 41003, 41004, 8237, 41005, 8239, 41006, 41007, 41008, 8240, 41012, 41013, 8246, 8247, 8241, 8249, 41018, 41019, 41011, 8253, 41022, 41023, 41021, 8255, 41020, 22471, 8273, 8274, 41041, 41044, 8276, 41046, 8278, 41042, 41049, 41050, 41051, 8281, 8282, 8283, 41054, 41055, 41048, 41057, 41058, 41060, 41061, 8294, 41062, 41064, 41065, 41066, 41067, 8300, 8297, 8299, 41071, 41070, 8298, 41076, 8310, 8313, 41082, 41083, 41086, 41087, 41106, 41107, 8338, 8339, 8340, 8341, 41108, 41109, 41112, 41113, 41115, 41110, 8346, 8351, 41118, 41122, 41123, 41124, 41125, 41126, 8358, 41128, 41129, 8362, 41131, 41132, 8364, 8366, 8367, 8368, 41134, 41135, 41136, 41140, 41141, 8373, 8372, 41138, 41139, 41146, 41147, 8378, 60280, 41150, 41151, 8383, 41154, 41155, 41156, 41157, 8390, 41158, 41160, 8393, 41162, 41163, 8394, 41161, 41166, 8399, 41167, 8396, 41170, 41171, 41172, 41173, 8401, 8407, 41176, 41177, 41169, 41179, 41174, 41178, 8417, 41186, 41187, 41188, 41189, 8423, 8426, 41195, 41198, 8431, 8432, 41201, 8434, 41203, 41204, 41205, 8435, 41202, 41206, 41209, 41210, 41211, 8436, 8437, 41208, 41215, 41214, 8450, 8451, 41220, 41221, 8452, 8453, 41218, 41219, 41238, 8475, 41244, 8478, 41261, 41263, 8502, 41270, 41272, 8505, 41273, 41277, 41279, 8539, 8542, 41318, 41324, 8556, 41326, 8558, 41334, 8566, 41336, 41337, 8569, 41340, 41341, 8572, 8217, 41342, 8574, 8592, 8601, 8605, 8614, 14738, 8620, 41389, 8621, 41391, 8623, 8624, 41403, 41406, 41409, 41410, 8642, 41412, 8641, 8646, 41415, 8644, 8647, 41420, 8652, 41422, 8656, 41425, 41426, 41428, 41431, 41441, 41442, 41444, 41447, 8681, 41451, 8685, 41454, 8688, 41457, 41458, 8690, 41460, 8689, 8692, 41463, 8695, 41494, 8726, 8729, 41500, 41513, 8745, 8747, 41515, 41517, 8749, 41518, 8750, 8793, 41561, 41565, 8797, 41574, 8806, 8809, 41580, 41595, 8827, 41598, 8830, 8848, 41627, 41630, 41638, 8870, 41640, 8876, 8880, 41657, 41661, 8902, 41670, 41672, 8908, 8912, 41691, 41694, 8287, 8288, 8289, 8290, 8944, 8292, 41721, 41725, 41745, 41746, 41748, 41751, 41761, 41762, 41764, 41767, 41773, 41775, 41777, 41778, 41780, 41783, 41789, 41791, 41826, 41827, 9058, 9059, 9060, 9061, 41828, 41829, 41836, 9068, 9070, 41838, 41842, 41843, 41844, 41845, 9074, 9075, 9077, 9076, 41852, 9084, 41854, 9086, 47397, 41873, 41874, 9106, 9105, 9108, 41876, 41879, 9111, 47400, 41889, 41890, 41892, 41895, 9133, 41901, 41903, 9135, 41905, 41906, 9138, 41908, 9137, 9140, 41911, 9143, 41922, 41923, 41924, 41925, 41932, 41934, 40901, 42006, 42009, 9243, 42012, 42013, 9246, 9248, 9264, 9270, 42038, 9272, 42041, 8361, 42073, 9307, 42077, 9310, 9312, 42086, 42092, 9328, 42102, 9334, 9336, 42105, 8370, 8371, 9382, 9388, 9401, 42171, 9405, 42174, 9414, 9417, 9420, 9421, 8386, 8387, 8388, 8389, 42219, 42222, 42244, 9476, 9478, 9480, 42248, 42249, 9483, 42265, 42266, 9498, 42267, 42269, 42270, 9503, 9504, 42272, 9520, 42288, 42297, 42298, 42301, 42302, 42329, 42330, 9562, 42331, 42333, 42334, 9567, 9568, 42336, 9584, 42352, 42361, 42362, 40984, 42365, 42366, 9616, 42384, 42393, 9626, 42397, 9630, 9648, 42416, 42425, 42426, 42427, 9658, 42429, 42430, 42431, 9662, 42441, 9674, 42445, 9678, 9680, 9681, 9682, 42448, 41002, 42449, 42450, 42457, 42458, 9689, 9690, 42473, 42474, 42475, 9706, 42477, 9710, 42479, 9712, 42481, 42482, 9713, 9714, 42480, 42478, 42489, 42490, 9721, 9722, 41010, 41056, 42774, 10006, 10008, 42780, 10016, 42784, 42793, 42794, 42795, 10026, 42797, 10030, 42798, 10032, 42800, 10031, 42799, 42809, 42810, 42813, 42814, 42841, 42842, 10074, 42845, 10078, 42846, 10080, 42848, 42854, 10086, 10088, 42857, 42858, 42860, 42861, 42862, 10096, 42864, 10106, 42875, 42874, 42878, 10111, 42879, 10128, 42896, 42906, 42907, 10139, 10138, 42910, 10143, 10142, 42911, 42918, 10150, 42921, 10154, 42922, 10153, 42925, 10158, 10157, 10160, 42928, 42926, 10156, 42937, 42938, 42941, 42942, 10182, 42950, 42953, 42954, 10185, 10188, 42957, 10190, 10189, 10192, 10193, 10194, 42960, 42964, 42961, 42962, 10198, 10200, 42969, 10202, 10203, 42971, 42970, 42974, 10207, 10206, 42975, 10201, 10224, 42993, 42994, 10225, 42996, 10226, 10230, 10228, 43000, 43001, 43002, 10235, 10232, 10233, 10234, 43006, 43005, 41130, 43281, 43282, 43284, 43287, 10528, 43297, 43298, 43300, 43303, 43306, 43309, 43310, 43311, 10544, 43313, 43314, 43316, 43319, 43322, 43325, 43326, 43327, 10576, 43354, 43358, 10592, 43362, 43363, 10594, 10595, 43364, 43365, 10597, 10596, 43370, 10604, 43372, 43374, 10606, 43378, 43379, 43380, 43381, 10613, 10612, 10610, 10611, 43388, 10620, 43390, 10622, 43409, 43410, 10642, 10641, 43412, 10644, 43415, 10647, 43424, 43425, 43426, 43428, 43431, 10666, 43437, 10670, 43439, 43440, 10671, 10669, 43442, 43444, 10676, 43441, 43447, 10679, 41200, 10682, 10674, 10686, 43456, 43458, 43459, 43460, 43461, 10698, 43468, 43470, 10702, 43504, 10746, 10750, 10774, 43542, 10777, 43548, 10784, 10793, 43561, 43563, 10795, 10797, 43565, 10798, 10800, 43566, 10832, 43609, 10841, 10845, 43613, 10848, 43622, 10854, 10857, 43628, 10875, 43643, 10878, 43646, 10896, 10906, 43675, 43674, 10910, 43678, 43680, 43686, 10918, 43688, 10924, 43696, 10928, 43705, 10938, 43706, 43709, 10942, 43710, 43712, 43718, 10950, 43720, 43722, 10954, 10956, 43726, 10958, 10960, 43739, 43742, 43754, 10986, 43758, 10990, 43760, 10992, 43769, 43773, 43778, 43779, 11010, 11011, 43780, 43781, 11013, 11012, 43798, 11035, 43804, 11038, 11040, 43818, 43821, 43822, 43823, 11056, 43830, 11062, 43832, 43833, 11065, 43834, 43837, 43838, 43839, 11088, 43866, 11099, 11102, 43870, 11104, 43878, 43882, 11116, 43884, 43886, 11118, 11126, 43894, 43896, 43897, 11129, 43900, 43901, 43902, 11134, 11132, 11152, 11161, 11165, 43936, 11174, 11178, 11180, 43949, 11182, 43951, 11184, 43952, 11183, 11181, 15250, 11194, 43963, 11198, 43966, 43968, 43969, 43970, 11202, 43972, 11204, 11206, 43975, 11207, 11201, 11210, 43980, 11212, 43982, 11214, 11216, 43985, 43986, 43988, 43991, 44001, 44002, 44004, 44007, 11241, 44011, 11245, 44014, 44016, 44017, 44018, 11250, 11249, 11248, 44020, 44023, 11252, 11255, 11258, 11262, 11296, 44064, 44073, 11306, 44075, 44074, 44077, 44078, 11310, 11312, 44080, 44079, 11311, 44089, 44090, 44093, 44094, 44121, 11354, 44122, 44125, 44126, 11358, 11360, 44128, 44137, 44138, 44141, 44142, 11376, 44144, 44154, 44155, 11386, 44158, 44159, 11391, 11408, 44176, 11418, 44187, 44186, 44190, 44191, 11423, 44201, 44202, 11434, 44205, 44206, 11438, 11440, 44208, 44217, 44218, 44221, 44222, 44233, 11466, 44234, 44237, 44238, 11470, 11472, 44240, 44241, 44242, 11476, 44244, 11478, 11473, 44248, 44249, 44250, 44251, 11481, 11482, 44254, 44255, 11487, 11483, 11504, 44272, 11505, 11506, 11508, 44276, 11510, 44273, 11512, 11513, 11514, 44281, 44282, 11515, 44286, 44285, 44280, 44308, 11541, 44310, 11540, 44312, 11547, 44315, 11551, 11563, 44331, 11566, 44334, 11568, 44347, 44350, 44379, 11611, 11614, 44382, 11616, 11620, 11621, 44390, 44388, 44392, 44395, 11627, 44398, 11631, 44452, 11685, 44454, 11684, 44456, 11691, 44459, 11694, 44462, 11696, 11695, 44475, 44478, 11716, 11717, 44484, 44486, 44488, 44491, 11723, 11726, 11727, 44494, 60952, 11760, 60955, 44539, 60956, 44542, 11780, 44548, 11782, 44552, 44553, 11784, 11787, 11796, 11797, 11798, 44566, 44568, 44569, 11802, 44571, 11803, 44573, 44574, 11807, 11808, 44576, 44572, 44570, 44587, 11819, 44590, 11822, 11824, 44592, 11828, 44601, 44602, 44603, 11835, 44605, 44606, 44633, 11866, 44635, 11867, 44637, 44638, 44634, 11872, 44640, 11871, 11870, 44644, 11877, 44646, 11878, 44648, 44649, 11880, 44651, 44652, 11883, 44654, 11887, 44656, 11888, 44653, 11892, 44665, 44666, 44667, 11899, 44669, 44670, 11920, 44688, 44692, 44694, 44696, 44697, 11930, 44699, 11931, 44701, 11934, 44702, 11940, 11941, 44710, 44708, 44712, 11945, 44713, 44715, 11948, 11949, 44718, 11950, 11952, 44720, 44717, 11951, 11947, 44729, 11962, 44730, 44731, 44733, 44734, 44735, 11966, 11963, 44740, 11973, 44742, 11974, 44744, 44745, 11978, 11979, 44747, 44749, 11982, 11983, 11984, 44752, 11980, 44753, 44754, 44750, 11981, 11985, 11986, 11993, 11994, 11995, 44763, 44761, 11998, 44766, 44762, 44777, 12010, 12011, 44778, 44781, 12014, 44783, 12016, 44784, 12017, 12018, 44782, 44785, 44786, 12025, 12026, 44793, 44794, 44795, 44798, 12053, 44822, 44825, 12059, 44828, 44827, 12062, 12063, 44830, 12064, 44829, 12080, 12084, 44854, 12086, 12088, 44857, 12091, 44859, 44862, 44889, 44891, 12123, 44893, 44894, 12126, 12128, 12133, 44902, 44908, 12143, 12144, 12148, 12150, 44918, 12152, 44921, 44923, 12155, 44926, 44948, 44950, 44952, 44955, 12187, 12190, 12197, 12198, 12204, 12207, 12208, 12217, 44987, 12219, 12221, 44990, 12222, 44996, 12229, 12230, 44998, 45000, 12233, 45003, 12236, 12237, 12238, 12239, 12235, 45035, 12267, 12270, 45038, 12272, 12292, 45060, 12294, 45062, 12296, 45064, 45065, 45067, 12297, 12299, 45074, 45075, 45076, 12308, 12310, 45077, 12312, 45080, 45081, 12315, 12316, 45085, 12318, 45087, 45082, 45083, 12322, 45091, 45092, 45093, 45094, 12325, 12326, 12324, 45098, 45099, 45100, 45101, 12334, 45102, 45103, 45104, 12335, 12338, 45108, 12341, 45114, 45115, 45116, 45117, 45118, 45119, 45137, 45138, 45140, 12372, 45142, 12374, 45144, 45145, 45146, 45147, 12376, 12379, 45150, 45151, 45152, 45153, 45154, 12385, 12386, 12388, 12390, 45156, 12392, 45161, 12393, 45163, 12394, 12395, 45158, 45160, 45162, 45169, 45170, 45167, 45172, 12404, 12405, 12406, 45176, 45177, 12408, 45179, 12411, 45174, 45178, 45183, 12415, 45180, 12409, 12410, 45202, 45203, 45204, 45205, 45206, 12436, 45208, 45209, 12438, 45211, 45212, 12443, 45214, 12447, 12440, 45218, 45219, 45220, 45221, 45222, 45224, 45225, 45226, 45227, 45228, 45230, 45231, 45232, 45234, 45235, 45236, 45237, 45242, 45243, 45246, 45247, 12481, 12482, 45250, 45252, 45253, 12484, 12486, 12488, 12489, 12490, 45259, 12491, 45254, 45256, 45257, 45262, 12497, 45265, 45266, 12498, 12500, 12502, 12501, 12504, 45273, 45267, 12507, 45275, 45270, 45272, 12511, 45276, 12505, 12514, 45283, 45284, 12517, 45285, 45282, 45291, 45294, 45296, 12529, 45298, 45299, 12532, 45300, 45302, 45301, 12536, 12537, 45306, 45305, 45307, 45311, 45314, 45315, 45316, 45317, 12561, 12562, 12569, 12570, 12575, 45344, 12577, 12578, 12576, 45349, 12585, 12586, 45357, 45359, 12593, 12594, 45369, 12601, 12602, 45373, 45375, 45392, 45397, 12634, 12639, 45407, 61129, 45420, 45422, 12656, 45433, 45436, 45437, 45438, 12689, 12690, 45458, 45457, 45460, 45462, 45464, 12697, 12698, 45466, 45465, 45467, 45473, 45474, 12705, 12706, 12713, 12714, 45482, 45481, 45485, 48117, 45487, 45488, 45489, 45490, 12721, 12722, 45493, 12729, 12730, 45499, 45498, 45497, 45502, 45503, 45505, 45506, 45508, 12740, 12742, 45511, 45512, 45513, 12744, 45515, 45516, 12747, 45518, 12745, 45521, 45522, 12756, 45524, 12758, 45527, 12760, 12761, 12763, 45537, 45538, 45540, 12772, 45542, 45543, 45544, 12774, 12776, 45547, 12779, 12777, 45550, 45552, 45553, 45554, 12788, 45556, 12790, 45559, 12792, 12793, 45560, 12795, 45561, 45563, 45558, 45567, 45600, 12832, 45605, 45606, 45608, 45609, 45611, 45613, 45614, 45615, 45648, 45653, 45654, 45656, 45657, 45661, 45663, 12912, 45691, 45694, 12954, 45723, 45726, 12959, 45744, 45748, 45749, 45753, 48171, 45755, 45757, 45759, 13018, 45787, 45790, 13023, 45808, 45812, 45813, 45817, 45819, 45821, 45823, 13073, 13074, 45841, 13076, 45844, 45842, 45847, 13080, 13081, 13082, 13089, 13090, 45857, 45860, 13092, 13094, 45863, 13096, 13097, 13098, 13099, 45869, 45871, 13105, 13106, 13108, 13110, 13113, 13114, 13115, 45885, 45887, 45922, 45923, 45924, 45925, 45932, 45934, 45938, 45939, 45940, 45941, 31784, 45948, 45950, 45969, 13202, 45970, 45972, 13204, 13201, 45975, 13208, 13209, 13210, 45976, 45978, 45977, 13217, 13218, 45985, 13220, 45988, 45986, 45991, 13222, 13225, 13226, 13227, 45993, 45995, 45997, 45999, 45994, 46001, 46002, 13233, 46004, 13236, 13234, 46007, 46008, 13241, 13242, 13240, 46010, 46009, 46018, 46019, 46020, 46021, 46028, 46030, 28696, 28702, 46105, 46109, 46112, 46133, 46143, 46169, 46173, 46181, 46191, 46192, 28721, 28722, 28724, 46224, 28727, 13472, 46245, 46255, 46260, 46262, 46264, 13498, 46267, 46270, 13502, 13504, 46276, 46277, 46278, 46280, 13514, 46283, 13518, 46287, 46288, 46315, 46318, 13570, 13573, 28752, 46362, 46363, 46364, 13597, 46366, 13599, 46368, 13605, 46374, 46380, 13613, 46382, 13615, 46384, 13621, 46390, 46394, 46396, 46398, 13631, 13653, 46422, 46426, 46427, 46428, 46430, 13663, 46432, 28768, 13669, 46438, 28769, 46444, 13679, 46448, 28772, 46458, 46462, 46480, 13716, 46486, 13718, 13720, 46489, 46488, 13723, 46493, 13733, 46502, 46508, 13743, 46512, 13748, 13749, 46518, 13750, 13752, 46521, 46522, 13755, 46524, 46520, 46525, 13759, 46527, 13764, 13765, 13766, 46534, 13768, 46537, 46536, 13771, 46540, 46541, 13774, 46543, 46544, 13772, 13778, 13775, 13780, 13794, 13796, 13798, 46566, 13800, 46569, 46568, 13803, 46570, 46573, 46575, 46576, 13813, 46582, 46588, 13823, 22293, 22296, 28838, 28840, 46876, 14109, 46878, 14111, 46880, 14114, 14116, 14117, 14118, 46886, 14120, 46889, 46890, 46891, 46892, 14125, 46894, 14127, 46896, 46888, 46893, 28860, 14132, 14133, 46901, 46902, 46900, 46905, 46906, 14139, 46907, 46909, 14142, 46910, 14143, 46908, 28862, 14138, 46911, 28864, 14165, 46934, 28867, 14168, 46937, 46938, 14166, 46940, 46936, 46942, 14175, 46944, 28869, 46941, 14180, 46949, 46950, 14181, 46948, 46953, 28871, 46955, 46956, 14187, 14190, 46958, 46960, 46957, 46954, 14191, 46959, 46970, 46971, 46974, 46975, 46992, 47002, 47003, 47006, 47007, 14240, 14245, 14246, 47013, 14248, 47016, 47018, 47014, 47020, 47021, 47022, 14255, 47024, 47017, 47023, 14260, 14261, 47030, 47033, 47034, 14267, 47036, 47038, 14271, 14272, 14274, 14277, 47046, 47045, 47048, 47049, 14280, 47050, 47052, 47053, 14286, 47055, 47056, 14284, 47054, 14287, 47066, 47067, 47070, 47071, 61461, 28897, 47088, 14324, 14325, 47094, 47097, 47098, 14331, 47100, 47102, 14335, 61470, 61476, 28912, 28925, 61490, 61491, 47377, 47378, 14609, 14612, 47380, 14610, 47383, 14616, 14617, 14618, 14625, 14626, 47393, 47396, 14628, 47398, 14630, 14632, 14633, 14634, 47394, 14635, 47405, 47399, 47407, 47403, 14641, 14642, 14644, 14646, 14649, 14650, 14651, 47421, 47423, 47458, 47459, 47460, 47461, 47468, 47470, 47474, 47475, 47476, 47477, 47478, 47480, 61540, 47483, 47484, 47486, 47487, 47505, 47506, 14737, 14740, 47508, 47510, 47511, 47512, 14745, 14746, 47514, 47513, 14744, 47509, 47519, 47515, 47521, 47522, 14753, 14756, 47524, 14758, 47526, 14754, 14761, 14762, 47529, 47530, 14763, 47527, 47535, 47533, 14769, 14770, 47531, 47540, 47537, 47538, 47543, 14776, 47545, 47546, 14777, 14772, 14778, 47544, 47554, 47555, 47556, 47557, 47564, 47566, 47572, 47573, 47574, 47576, 47579, 47583, 47636, 47638, 47640, 47643, 14880, 47648, 47653, 47654, 47656, 47657, 47659, 47661, 47662, 47663, 47696, 47700, 47701, 47702, 47704, 47705, 47707, 47709, 47711, 14960, 47733, 47739, 47742, 47743, 61596, 47765, 61597, 15002, 61598, 47771, 47774, 47775, 61599, 15007, 61600, 47792, 47796, 61603, 47797, 47801, 47803, 47805, 47807, 61607, 61608, 47829, 15066, 47835, 47838, 47839, 15071, 47856, 47860, 47861, 47865, 47867, 47869, 47871, 47874, 47875, 47876, 47877, 15121, 15122, 15129, 15130, 15135, 15136, 47904, 15137, 15138, 47908, 47909, 47910, 47912, 15145, 15146, 47915, 47917, 47919, 15153, 15154, 16038, 61629, 15161, 15162, 47929, 47933, 47935, 47952, 61634, 47957, 61635, 15194, 47967, 15199, 47980, 47982, 61640, 15216, 61641, 47989, 47988, 47990, 47992, 47993, 47995, 47996, 47997, 61643, 47999, 47998, 61644, 16056, 48017, 61647, 48018, 48020, 48021, 48022, 15249, 48024, 15257, 15258, 48025, 48026, 48027, 48031, 15265, 15266, 48034, 48033, 15273, 15274, 48041, 48042, 48045, 48047, 48048, 15281, 15282, 48050, 48049, 48053, 61654, 48057, 48058, 48059, 15289, 15290, 48062, 48063, 48065, 48066, 48068, 15300, 48070, 48071, 15304, 15305, 15302, 15307, 48076, 48072, 48078, 48073, 16069, 48081, 48082, 48075, 15316, 48085, 15318, 48084, 48088, 48087, 16070, 48091, 48086, 15320, 15323, 48095, 15321, 48097, 48098, 48100, 15332, 48102, 15334, 48104, 15336, 15337, 48107, 15339, 48103, 48110, 48112, 48113, 48114, 15348, 48116, 15350, 48118, 48119, 48120, 48121, 48123, 15352, 15355, 15353, 48127, 48156, 15389, 48158, 15391, 48160, 15394, 15396, 15397, 48166, 15398, 48168, 15400, 48170, 48169, 48172, 48173, 48174, 15407, 48176, 48175, 15410, 15405, 15412, 15413, 48182, 48185, 48186, 15419, 48188, 48190, 15423, 61682, 61683, 61685, 15445, 15446, 48214, 48216, 15448, 48218, 48217, 48220, 48221, 48222, 15455, 48224, 15460, 15461, 48230, 48233, 48234, 15467, 48236, 48238, 15471, 48240, 48250, 48251, 48254, 48255, 48272, 61698, 48282, 48283, 48286, 48287, 15525, 48294, 15526, 48296, 15528, 48297, 48298, 48300, 48301, 48302, 15535, 48304, 15540, 15541, 48310, 48313, 48314, 15547, 48316, 48318, 15551, 15554, 15557, 15558, 48326, 48328, 15560, 48330, 48329, 15564, 48333, 15566, 48335, 48336, 15567, 48334, 48332, 48346, 48347, 48350, 48351, 48368, 15604, 15605, 48374, 48377, 48378, 15611, 48380, 48382, 15615, 48404, 48406, 48407, 48408, 15638, 48411, 15644, 48412, 48416, 48427, 48430, 15674, 48443, 48446, 15679, 48464, 48475, 48478, 48484, 48486, 48487, 48488, 15718, 15722, 48491, 48492, 15724, 48494, 15727, 15776, 48548, 15782, 48551, 48552, 48550, 15784, 48555, 48556, 48558, 48560, 48571, 48574, 15808, 48580, 48582, 48583, 48584, 15814, 15816, 48587, 48588, 48590, 48741, 48624, 48635, 48638, 48745, 15874, 15877, 48660, 48662, 15894, 48663, 48664, 48666, 48667, 48668, 15900, 48670, 15903, 48672, 15901, 15909, 48678, 48683, 48684, 15917, 48686, 15919, 48688, 48692, 15925, 48694, 15926, 15928, 48697, 15930, 48693, 48699, 48701, 48702, 15935, 48703, 15934, 48698, 48700, 48720, 15957, 48726, 48730, 48731, 48732, 48734, 15967, 48736, 48740, 15973, 15974, 48743, 48744, 48742, 15978, 48747, 48748, 15980, 48749, 48751, 48752, 15983, 48750, 15982, 15990, 15992, 48762, 48763, 48766, 48784, 48788, 16020, 48790, 16022, 48792, 48793, 16024, 48795, 16027, 48797, 48798, 16032, 48804, 16037, 48806, 48805, 48808, 48809, 16040, 48807, 48812, 48813, 48814, 48815, 48816, 16047, 48811, 16052, 16053, 48822, 16054, 48824, 48825, 16058, 48826, 48828, 48829, 48830, 48831, 16064, 16063, 48827, 16059, 16068, 48836, 48838, 48839, 16072, 48840, 48841, 16075, 16076, 48844, 48845, 48847, 48848, 48843, 16082, 16074, 16079, 16078, 16084, 48846, 48859, 48862, 16098, 16100, 48870, 16102, 48872, 48873, 16104, 16107, 48874, 48877, 48879, 48880, 16117, 48886, 48891, 48892, 48894, 16127, 16150, 48919, 48921, 48923, 48924, 48925, 48926, 16156, 48928, 48949, 16182, 16184, 48955, 48958, 48959, 48976, 48985, 48987, 48989, 48990, 48997, 16230, 48999, 16236, 49004, 49007, 49008, 16246, 16248, 49019, 49022, 49040, 49044, 49046, 49048, 49051, 16288, 49061, 49063, 49068, 49071, 49072, 49076, 49078, 49080, 16314, 49083, 49086, 16319, 16320, 16318, 49092, 49093, 49094, 49095, 49096, 16330, 49099, 49100, 16334, 49103, 49104, 16335, 48837, 49131, 49134, 49136, 16388, 49156, 49158, 49160, 49161, 16392, 49163, 16393, 49169, 49170, 16403, 16404, 49172, 16406, 49175, 16408, 16412, 16416, 49184, 16418, 49185, 49188, 16421, 49186, 49191, 16420, 16419, 49194, 49198, 49200, 49201, 49202, 16434, 49204, 16437, 16438, 49207, 16440, 49210, 16442, 49214, 16447, 16464, 16465, 16466, 49232, 16468, 16472, 16473, 16474, 49242, 49246, 49248, 16481, 16482, 16484, 16486, 16488, 16489, 16490, 49258, 16492, 49262, 16495, 16502, 16504, 49297, 49298, 49300, 49303, 16538, 49306, 16540, 49309, 16542, 49311, 49312, 49313, 49314, 16544, 16548, 16549, 16550, 49316, 49319, 16546, 49322, 16547, 16556, 49325, 49326, 49327, 49328, 16552, 49329, 49330, 49332, 49335, 16570, 49338, 16572, 49341, 16574, 16575, 16576, 49342, 49345, 49346, 16580, 16581, 49348, 49350, 49352, 49353, 49354, 49355, 16582, 16584, 49358, 16591, 16588, 16586, 16596, 16600, 16601, 49377, 16610, 16611, 16612, 16613, 49378, 49380, 49383, 49386, 16618, 49390, 16623, 49392, 49393, 16626, 16627, 49396, 16628, 49394, 49399, 16632, 16633, 16634, 16629, 49402, 49406, 16639, 16642, 16643, 16644, 16645, 49414, 49412, 49416, 49417, 49419, 49429, 16667, 16670, 49439, 16672, 49460, 49462, 49464, 49465, 16698, 49467, 16702, 61936, 16720, 49489, 49490, 49497, 49498, 16731, 16734, 49505, 49506, 49509, 49513, 49514, 16748, 16750, 49519, 16752, 49524, 49526, 49528, 49529, 16762, 49531, 16764, 16766, 49558, 49560, 49561, 16793, 16797, 16799, 49573, 49583, 49590, 49596, 16829, 16831, 16833, 16834, 16836, 49605, 49606, 16839, 49608, 49609, 49615, 49638, 49640, 16873, 16877, 16881, 16882, 16884, 49654, 16887, 49660, 49684, 49685, 49686, 49688, 49691, 49695, 16928, 49702, 49704, 49705, 16938, 16942, 16976, 49750, 49752, 49753, 16986, 16990, 49764, 49765, 49766, 49768, 49771, 49775, 17008, 17051, 17054, 49829, 49830, 49832, 49833, 49839, 49846, 49848, 17081, 17082, 49852, 17085, 17086, 49861, 49862, 49864, 49865, 49871, 17115, 17118, 49910, 49912, 17145, 17146, 49916, 17149, 17150, 50001, 50002, 50004, 50006, 50008, 50009, 50010, 50011, 50017, 17250, 17251, 17252, 17253, 50020, 50022, 50024, 50025, 50026, 50027, 17260, 17262, 17266, 17267, 17268, 17269, 17276, 17278, 17309, 17311, 17313, 17314, 17316, 17319, 17341, 17343, 50197, 50198, 50200, 50201, 17435, 17438, 50207, 50228, 50230, 50232, 50235, 50262, 50264, 50265, 17499, 17502, 50277, 50287, 50292, 50294, 50296, 50299, 17552, 50326, 50328, 50329, 17568, 29544, 50341, 50342, 50348, 50351, 29547, 50358, 50361, 17594, 17593, 17597, 17599, 17600, 50373, 50374, 50376, 50377, 17609, 50380, 17613, 50383, 17616, 17642, 17647, 17666, 17667, 17668, 17669, 50436, 50438, 50440, 50441, 50443, 50450, 50454, 50458, 17690, 50460, 17695, 17696, 50465, 16543, 50466, 50473, 50474, 50481, 50486, 50488, 50489, 17744, 17754, 17759, 50534, 50540, 17776, 50550, 50552, 50553, 17808, 17818, 17822, 17824, 50598, 50604, 17850, 17854, 17856, 50630, 17866, 50636, 17870, 17872, 16578, 50644, 16579, 50648, 50649, 17889, 17890, 17892, 50660, 50662, 17895, 50664, 50665, 17898, 50667, 17902, 17905, 17906, 17908, 50676, 50678, 17911, 50680, 50681, 50683, 3607, 18193, 50962, 50964, 50965, 50966, 18199, 50968, 50969, 50970, 50971, 50972, 50975, 18208, 50977, 18210, 18209, 18212, 50980, 50978, 18215, 50984, 50985, 18218, 50987, 50986, 18219, 18222, 18223, 50993, 18226, 50996, 18228, 50998, 51000, 51001, 18234, 18233, 18237, 18238, 18256, 51045, 51046, 51048, 51049, 18282, 18281, 51052, 18285, 18286, 51055, 18288, 18298, 18299, 18302, 18303, 18320, 18330, 18335, 18336, 51108, 51109, 51110, 51112, 51113, 51115, 51116, 51119, 18362, 18366, 18368, 18370, 18371, 18372, 18373, 51142, 51141, 51144, 51145, 51140, 51147, 51148, 51151, 18384, 51156, 51158, 51160, 51161, 18394, 51163, 18399, 51188, 51190, 51192, 51193, 18426, 51195, 18430, 10186, 10196, 49310, 51488, 51494, 51496, 51497, 51498, 51500, 51501, 51502, 51504, 51513, 51514, 51517, 51518, 51536, 51537, 51538, 51540, 51542, 51544, 51545, 51546, 51547, 51549, 51550, 51552, 51553, 18786, 18787, 51554, 18788, 18789, 51556, 51560, 51561, 51562, 51563, 18796, 51565, 18798, 51558, 51566, 18802, 18803, 18804, 18805, 51574, 51576, 51577, 51580, 18812, 18814, 51606, 51608, 51609, 18845, 18847, 51616, 18849, 18850, 18852, 18855, 51625, 51626, 51629, 51630, 51632, 51641, 51642, 51645, 51646, 18879, 51648, 49343, 18877, 49344, 51657, 51658, 51661, 51662, 51670, 51672, 51673, 49351, 51696, 51705, 51706, 51709, 51710, 51732, 51733, 51734, 51736, 51737, 51738, 51739, 51742, 51743, 18976, 51744, 51750, 51752, 51753, 18986, 51756, 18990, 51760, 51770, 51774, 19024, 51792, 51798, 51800, 51801, 51802, 19034, 51806, 19038, 51808, 51812, 51813, 51814, 51816, 51819, 51823, 19056, 51830, 51834, 51836, 51838, 51865, 19099, 51869, 19102, 51872, 51877, 51878, 51880, 51881, 51887, 51888, 51894, 51896, 51897, 19130, 19129, 51900, 19133, 19134, 51901, 51904, 51909, 51910, 51912, 51913, 51917, 51919, 19163, 19166, 51942, 51944, 51945, 51949, 51952, 51958, 51960, 19193, 19194, 51964, 19197, 19198, 19202, 19203, 51972, 19204, 51974, 19205, 51976, 51977, 51979, 51989, 19227, 19230, 51999, 19232, 52000, 52006, 52008, 52009, 52010, 52012, 52013, 52014, 52016, 52020, 52022, 52024, 52025, 52026, 52027, 19258, 52029, 52030, 19262, 19280, 52048, 52049, 52050, 52057, 52058, 19291, 52061, 52062, 19294, 52064, 52065, 52066, 52069, 52073, 52074, 19308, 52077, 19310, 52079, 19312, 52078, 52084, 52086, 52088, 52089, 19322, 52091, 19324, 52092, 19326, 52118, 52120, 19353, 52121, 19357, 19359, 52128, 52133, 52137, 52138, 52141, 52142, 52143, 52144, 52150, 52153, 52154, 52156, 52157, 52158, 19391, 52160, 19393, 19394, 19389, 19396, 52165, 52166, 19399, 52168, 52169, 52170, 52173, 52174, 52175, 52182, 52184, 52185, 52198, 52200, 19433, 19437, 52208, 19441, 19442, 19444, 52214, 19447, 52217, 52218, 52220, 52221, 52222, 19473, 52242, 52244, 52246, 19479, 52248, 52249, 52250, 52251, 52252, 19488, 52257, 19490, 52258, 52260, 19492, 52262, 19495, 52264, 52265, 19489, 52266, 52267, 19498, 19503, 52273, 19506, 19508, 52276, 52280, 52281, 19514, 19518, 42958, 19536, 52326, 52328, 52329, 19562, 52332, 19566, 19568, 42968, 19578, 19583, 19600, 19610, 19615, 19616, 52390, 52392, 52393, 52396, 19642, 19646, 19648, 19650, 19651, 19652, 19653, 52422, 52424, 52425, 52428, 19664, 52436, 52438, 52440, 52441, 19674, 52443, 19679, 42992, 52468, 52470, 52472, 52473, 19706, 52475, 19710, 19733, 19734, 19736, 19737, 19743, 19744, 19754, 19759, 19771, 19774, 19792, 19802, 19807, 19813, 19814, 19816, 19817, 19819, 19822, 19823, 19872, 19877, 19878, 19880, 19887, 19898, 19899, 19902, 19903, 19904, 19909, 19910, 19912, 19919, 19962, 19963, 19966, 19967, 19970, 19971, 52740, 19973, 52742, 19972, 52744, 52745, 52747, 52754, 19989, 52758, 19990, 19992, 52760, 52762, 19994, 52764, 52757, 19993, 19999, 20000, 52769, 52770, 52767, 52777, 20010, 20011, 52778, 20014, 20015, 52785, 52790, 20022, 52792, 52793, 20025, 20024, 20027, 20029, 20030, 20031, 20026, 20048, 20058, 20063, 20069, 52837, 52838, 20072, 20073, 52840, 52841, 20070, 52844, 20078, 52847, 20080, 20079, 20075, 20077, 20086, 52854, 52856, 52857, 20090, 20091, 20088, 20094, 20095, 20112, 20118, 20120, 20121, 20122, 20123, 20126, 20127, 20128, 52900, 20133, 52902, 20134, 20136, 52905, 52901, 52907, 52908, 52904, 20143, 52911, 20154, 20155, 20158, 20159, 20160, 52932, 20165, 52934, 52933, 20168, 52936, 20170, 52939, 20171, 20166, 20174, 52943, 20176, 20175, 20169, 52940, 52948, 52952, 52953, 20186, 20191, 20193, 20194, 52964, 20196, 52966, 20199, 52968, 52969, 20202, 20203, 52971, 20206, 20209, 20210, 20212, 52980, 52982, 20215, 52984, 52985, 20218, 52987, 20219, 20222, 20223, 20245, 53014, 53013, 53016, 53017, 20251, 20254, 53023, 20256, 20255, 53044, 53046, 20278, 53048, 20280, 20282, 53051, 20287, 20304, 53078, 53080, 53081, 20315, 20318, 53093, 20325, 53103, 20335, 53108, 53110, 20342, 20344, 53112, 20346, 53115, 20351, 20368, 53142, 20374, 20376, 20377, 53144, 53145, 20379, 20382, 20384, 20389, 53158, 53157, 53164, 53167, 20399, 53174, 20409, 20410, 53177, 20411, 20413, 20414, 20415, 20416, 53189, 53190, 20421, 20422, 53193, 20425, 20427, 20424, 20429, 20430, 53199, 20432, 20431, 53196, 20458, 20459, 20462, 20463, 53252, 53254, 53256, 53257, 53259, 20497, 53266, 20498, 53265, 53267, 53268, 53271, 20500, 20503, 53270, 53277, 20509, 20511, 53279, 53281, 20514, 53280, 53284, 20516, 53282, 20519, 53287, 20512, 20513, 20521, 53292, 20525, 53293, 20527, 20528, 53296, 53295, 53294, 20532, 53300, 20529, 20535, 53303, 20537, 20530, 53298, 53308, 20541, 53310, 53311, 20543, 53309, 20560, 53328, 53330, 53331, 20569, 53338, 53339, 20573, 20576, 53344, 53346, 53347, 53350, 20585, 53354, 53355, 53357, 20589, 20625, 20626, 20628, 20631, 20633, 53405, 20637, 20639, 20640, 20641, 20642, 53407, 20644, 53408, 53414, 20647, 20649, 20653, 53421, 20655, 20656, 53423, 53424, 20658, 20660, 20657, 20663, 20665, 20669, 53437, 53439, 20672, 53441, 53442, 20674, 20676, 20675, 53444, 20679, 53448, 53449, 20681, 20682, 20683, 20685, 53446, 53450, 53453, 53457, 20689, 20690, 53459, 53460, 20692, 20695, 53458, 53465, 53462, 53467, 53466, 53473, 53474, 53475, 53476, 20708, 4116, 20711, 53479, 20713, 20706, 20717, 20720, 20721, 20722, 53490, 53491, 53489, 53494, 20724, 20727, 20729, 53498, 53499, 53497, 53492, 53495, 4121, 20733, 20740, 20742, 20744, 20745, 20747, 53530, 53532, 53534, 53535, 20775, 53548, 20780, 53550, 30182, 53564, 53566, 4136, 20817, 20818, 20823, 20825, 20826, 4139, 20828, 53594, 4140, 53599, 20833, 20834, 20841, 20842, 53613, 53615, 4145, 4146, 53629, 53631, 53648, 53654, 53656, 53657, 53660, 53662, 53676, 53678, 53686, 20919, 53692, 20924, 53694, 10673, 53702, 53704, 53705, 53709, 53711, 53712, 20945, 20946, 20953, 20954, 53734, 53736, 20977, 20978, 53750, 20983, 20985, 20986, 20988, 53756, 53782, 53784, 53798, 21031, 53800, 52937, 53802, 21036, 53807, 4184, 53846, 21079, 53848, 21084, 53862, 53864, 53882, 53887, 53904, 53926, 53929, 53942, 21175, 53948, 21180, 53958, 53961, 53968, 54006, 21239, 21244, 54012, 39921, 54044, 54046, 39922, 54060, 54062, 54076, 54078, 21329, 21330, 21332, 21334, 21336, 21337, 21338, 21339, 21345, 21346, 21348, 21350, 21352, 21353, 21354, 21355, 54125, 54127, 4248, 54141, 54143, 54172, 54174, 54188, 54190, 54204, 54206, 54221, 54223, 21457, 21458, 21460, 21462, 21464, 21465, 21466, 21467, 21489, 21490, 21492, 21494, 21496, 21497, 21498, 21499, 54320, 21559, 21564, 4291, 54368, 21607, 21612, 4300, 54422, 54424, 54425, 54438, 21671, 4308, 54444, 21676, 62925, 54454, 54457, 54458, 54462, 7375, 4313, 54470, 21703, 54472, 54473, 54474, 21708, 54476, 54478, 36889, 54531, 54532, 54534, 54536, 54537, 36891, 54539, 21778, 21779, 54546, 21781, 36894, 21786, 21787, 54554, 21791, 54560, 54561, 21794, 21795, 54562, 54569, 21802, 21803, 54570, 54573, 54575, 54576, 54577, 21810, 21811, 21812, 21814, 21816, 54585, 21818, 21819, 54589, 54591, 36902, 36904, 36905, 54608, 36908, 54624, 21861, 21871, 54640, 21876, 21878, 21880, 21883, 36914, 54672, 54688, 21925, 21935, 54704, 54720, 21957, 54732, 54734, 21967, 54736, 54737, 54740, 54743, 54744, 54745, 54753, 54756, 54759, 54760, 54761, 54768, 6088, 36974, 36977, 36978, 36980, 50018, 55057, 22290, 22291, 22292, 55058, 22294, 55063, 55064, 55060, 22298, 22299, 55066, 55062, 55065, 22303, 55072, 55073, 22306, 22307, 55074, 55076, 55079, 55080, 55081, 22314, 22315, 30486, 55085, 55082, 55087, 55088, 55089, 22322, 22323, 55092, 55094, 22327, 55097, 22330, 22331, 22332, 55101, 55103, 30492, 55120, 55136, 22372, 22373, 22374, 55142, 22376, 55145, 22375, 22379, 22380, 22383, 55152, 37017, 30505, 55184, 55200, 22436, 22437, 22438, 22439, 55206, 55208, 55210, 22440, 55212, 22444, 55214, 22447, 55216, 22443, 55232, 55235, 55236, 22468, 22470, 22469, 55240, 22472, 55238, 22475, 55244, 22476, 55246, 22479, 55248, 55242, 55252, 55254, 55256, 55257, 55259, 55280, 55284, 55286, 55288, 55289, 55291, 37070, 37074, 37077, 55580, 55582, 55590, 22823, 55594, 55596, 22828, 55598, 55610, 55612, 55614, 37106, 37109, 22866, 22865, 22868, 4545, 22870, 22872, 22873, 22874, 22875, 55642, 55646, 22881, 22882, 22884, 22886, 22888, 22889, 22890, 55658, 22891, 55661, 55662, 55663, 55670, 22903, 22908, 55676, 55677, 55679, 55702, 22935, 55704, 55705, 55708, 22940, 55710, 55722, 55724, 55726, 55738, 55740, 55742, 55754, 55757, 55758, 55759, 22993, 22994, 22996, 55766, 22999, 55768, 55769, 23002, 22998, 23004, 23001, 23000, 23003, 23025, 23026, 23028, 23030, 23032, 23033, 23034, 23035, 55802, 55806, 55830, 55832, 55833, 55834, 55838, 55846, 23079, 55848, 55850, 55852, 23084, 55855, 55866, 55870, 55894, 23127, 55896, 55897, 55898, 23132, 55902, 55910, 55912, 55926, 23159, 55930, 23164, 55932, 55934, 55935, 55952, 23191, 23196, 55974, 55977, 55990, 23223, 23228, 55996, 56006, 56009, 56016, 23255, 23260, 56054, 23287, 56060, 23292, 23300, 23302, 23304, 23305, 23307, 56090, 56092, 56094, 56095, 56102, 23335, 56106, 23340, 56108, 56110, 56122, 56124, 56126, 23377, 23378, 23383, 23385, 56154, 23386, 23388, 56158, 63265, 56159, 23393, 23394, 23401, 56170, 23402, 56173, 56174, 56175, 56182, 23415, 56188, 23420, 56189, 56191, 63271, 63273, 56208, 56214, 23447, 56216, 56217, 56220, 23452, 56222, 56234, 56236, 56238, 56246, 23479, 56250, 23484, 56252, 56254, 56262, 56264, 56265, 56266, 56269, 56270, 56271, 56272, 23505, 23506, 56278, 23511, 56280, 56281, 23514, 23513, 23516, 56294, 56296, 23537, 23538, 56310, 23543, 23545, 23546, 56314, 56316, 23548, 56318, 56337, 56338, 23571, 56340, 23573, 23570, 56343, 56344, 23576, 56346, 23578, 23579, 23572, 23574, 23583, 56352, 56353, 23586, 23587, 56356, 56354, 56359, 56360, 56361, 23594, 23595, 56362, 56365, 56367, 56368, 56369, 23602, 23603, 56372, 56377, 23610, 23611, 56381, 56383, 56400, 56416, 23652, 23653, 23654, 23656, 23659, 23663, 56432, 56464, 56480, 23716, 23717, 23718, 23720, 23723, 23727, 56496, 56512, 56515, 56516, 23749, 23750, 23748, 23752, 63336, 23755, 56524, 56526, 23759, 56528, 56532, 56534, 56536, 56537, 56539, 56560, 56564, 56566, 56568, 56569, 56571, 56598, 56601, 56624, 56672, 56678, 56681, 56742, 56746, 56748, 56751, 56774, 56778, 56780, 56783, 56835, 56836, 56838, 56840, 56841, 56843, 56850, 24083, 24082, 24085, 56854, 56857, 56858, 24091, 24090, 24095, 56864, 56865, 24098, 24099, 56866, 56873, 24106, 24107, 56874, 56877, 56879, 56880, 56881, 24114, 24115, 24116, 56886, 24119, 24120, 56889, 24118, 24123, 24124, 24122, 56893, 56895, 37361, 37362, 56912, 37365, 56928, 24165, 56934, 24167, 56937, 24172, 24175, 56944, 24180, 56950, 24182, 24184, 56953, 24187, 56976, 63430, 56992, 24229, 56998, 24231, 57000, 57002, 57004, 24236, 57006, 57007, 57008, 63433, 24239, 57018, 57023, 57024, 24261, 57030, 24263, 57032, 57034, 57036, 24268, 57038, 57039, 57040, 57041, 24271, 57044, 57047, 57048, 57049, 57057, 57060, 57063, 57064, 57065, 57072, 57136, 57142, 24375, 57145, 24380, 57184, 24423, 24428, 57206, 57209, 57238, 57240, 57241, 57254, 24487, 24492, 57260, 57270, 57273, 57274, 57278, 57279, 57286, 24519, 57288, 57289, 57290, 57292, 24524, 57294, 57295, 24580, 57348, 24582, 24584, 24585, 57352, 24587, 24594, 24595, 24596, 24597, 57366, 57367, 57368, 57365, 24604, 57373, 24606, 57372, 57374, 57376, 57378, 24611, 24612, 24613, 57379, 57380, 57381, 24610, 57386, 24620, 57389, 24622, 57391, 57390, 57392, 24626, 24627, 24628, 24629, 57398, 57397, 57400, 57396, 57402, 57403, 24636, 57405, 57406, 57407, 24638, 57424, 57425, 57426, 57427, 57428, 57432, 57433, 57434, 57435, 57438, 57440, 57441, 57442, 57443, 57444, 57445, 57446, 57447, 57448, 57449, 57450, 57451, 57452, 57453, 57454, 57455, 57462, 57464, 57489, 57490, 57492, 57495, 57498, 57499, 57500, 57501, 57502, 57503, 57504, 57505, 57506, 57507, 57508, 57509, 57510, 57511, 57512, 57514, 57516, 57517, 57518, 57519, 57520, 57521, 57522, 57524, 57527, 57530, 57531, 57532, 57533, 57534, 57535, 57536, 24769, 24770, 24771, 57540, 24772, 24774, 57543, 24776, 24777, 57546, 24778, 24779, 57541, 57542, 57544, 57547, 57548, 57554, 57550, 57551, 57555, 57556, 57557, 24792, 24793, 57553, 24795, 57560, 24788, 24790, 57563, 57562, 57561, 24802, 24803, 24804, 24805, 57573, 57572, 57570, 57571, 57578, 57579, 57582, 57584, 57585, 57586, 57587, 24820, 24821, 24822, 57588, 24824, 57589, 57594, 24827, 57592, 57593, 57595, 24825, 57591, 57598, 57602, 57603, 57604, 57605, 57606, 57608, 57609, 57611, 57621, 24855, 57628, 57629, 57630, 57631, 57632, 24860, 24870, 24871, 57644, 24876, 57646, 57647, 57645, 57652, 57654, 57656, 24890, 57659, 57660, 57662, 24894, 57680, 57681, 57682, 24918, 24919, 57689, 57690, 24924, 57697, 57698, 57701, 24935, 57705, 57706, 57708, 57709, 57710, 57711, 57712, 24940, 57716, 57718, 57720, 24954, 57723, 57724, 57725, 24958, 57727, 57726, 11474, 57744, 24982, 24985, 57756, 57757, 57758, 57759, 11480, 57765, 24999, 57772, 25004, 57774, 57775, 57776, 25015, 25018, 25020, 57788, 57790, 25023, 57791, 57793, 57794, 57789, 57796, 57797, 25031, 57799, 57804, 57805, 57806, 57807, 57808, 57809, 57810, 25036, 57812, 57815, 57825, 57826, 57828, 25062, 57831, 25065, 25066, 25071, 57840, 57841, 57842, 57844, 57847, 25079, 25084, 57876, 57877, 25111, 57883, 25116, 57887, 57888, 25126, 25127, 25130, 25132, 25134, 25135, 57936, 25174, 25175, 25178, 25180, 25182, 57956, 57957, 25191, 57963, 25196, 57967, 57968, 25210, 25215, 58000, 25242, 25247, 58021, 58022, 25255, 58024, 25260, 58031, 58032, 25270, 25271, 25273, 25274, 25276, 25278, 58053, 58054, 25287, 58056, 31077, 31078, 25292, 58063, 58064, 5028, 25306, 31082, 25311, 58096, 25334, 25335, 25337, 25338, 25340, 25342, 31090, 31091, 58140, 58141, 58142, 58143, 58145, 58146, 58148, 58151, 58156, 58157, 58158, 58159, 58161, 58162, 58164, 58167, 58172, 58174, 58193, 58194, 58196, 58198, 58200, 58201, 58202, 58203, 58209, 58210, 58211, 58212, 58213, 58214, 58216, 58217, 58218, 58219, 58220, 58221, 58222, 58223, 58226, 58227, 58228, 58229, 58236, 58237, 58238, 58239, 58268, 58269, 58270, 58271, 58273, 58274, 58276, 58279, 58284, 58286, 58300, 58301, 58302, 58303, 58306, 58307, 58308, 58309, 58316, 58317, 58318, 58319, 31133, 58389, 25623, 25626, 25628, 25630, 58399, 58400, 58416, 58420, 25654, 25655, 58424, 58422, 58427, 25660, 25690, 25694, 58464, 58469, 25702, 25703, 25708, 58479, 58480, 58484, 58486, 58488, 58491, 58512, 58528, 58533, 25767, 25772, 58543, 25782, 25784, 25786, 25791, 58560, 58565, 25798, 25799, 25800, 25804, 58575, 58576, 25834, 25839, 25858, 25859, 25860, 25861, 25873, 25874, 25875, 58646, 25881, 25882, 58651, 58652, 25883, 58654, 58656, 25889, 25890, 25891, 25897, 25898, 25899, 58672, 25906, 25907, 58678, 58680, 58681, 25914, 25915, 58704, 58715, 58718, 58720, 58726, 58732, 58736, 58742, 58744, 58745, 58768, 58777, 58781, 58784, 58790, 58796, 58800, 58809, 58813, 58816, 58822, 58825, 58828, 58829, 58832, 26066, 26067, 26068, 26070, 26072, 26074, 26075, 26081, 26082, 26084, 26086, 26087, 26088, 58857, 26091, 58861, 58864, 26097, 26098, 26099, 26100, 26103, 26106, 26107, 44274, 63860, 26385, 26386, 26387, 26388, 59157, 59158, 26391, 26392, 26393, 26394, 26395, 59164, 26396, 59160, 59167, 59168, 26401, 26402, 26403, 26404, 26406, 26407, 26408, 26409, 26410, 26411, 59179, 59182, 26415, 59184, 26417, 26418, 26419, 26420, 26422, 26423, 59193, 26426, 26427, 26428, 59197, 26430, 59216, 59232, 59237, 59238, 26471, 59240, 59241, 26474, 26470, 59244, 26476, 26478, 59247, 59248, 59245, 26490, 59259, 59262, 26495, 59280, 26522, 59291, 57375, 59294, 26527, 59296, 59300, 59301, 59302, 26535, 26536, 26534, 26538, 59307, 59308, 26540, 26542, 59311, 59312, 59304, 59305, 59321, 59325, 59328, 26562, 26563, 26564, 59333, 26565, 26567, 59334, 59336, 59337, 59339, 59340, 26570, 26566, 59343, 59344, 26574, 26572, 26578, 26579, 26586, 59355, 26587, 59358, 26591, 57388, 63902, 11800, 59376, 26610, 26611, 59385, 26618, 26619, 57394, 59389, 57395, 59676, 59677, 59678, 59679, 26912, 59681, 59682, 59680, 59684, 26918, 59687, 26920, 59689, 26921, 26919, 26924, 59692, 59693, 59694, 26928, 59696, 59695, 59698, 59700, 59697, 59703, 59705, 59708, 59709, 59710, 59728, 59729, 59730, 26960, 59732, 59734, 59736, 59737, 59738, 59739, 59741, 59744, 26976, 59746, 59747, 59748, 59749, 59750, 59745, 11876, 59753, 59754, 59752, 59756, 59757, 59758, 59759, 59755, 59762, 59763, 59764, 59765, 26998, 26999, 27000, 27001, 27004, 59773, 59774, 59775, 59772, 27030, 27031, 27036, 59804, 59806, 59807, 27040, 59809, 59810, 59808, 59812, 59805, 59815, 59817, 59820, 59821, 59822, 27056, 59824, 59833, 59836, 59837, 59838, 59839, 59840, 27072, 59842, 59843, 59844, 59845, 59849, 59852, 59853, 59854, 59855, 27094, 27095, 27100, 59888, 27120, 50982, 59897, 59901, 59924, 59925, 27158, 27159, 27160, 27161, 59931, 27164, 59935, 27168, 59936, 27174, 27175, 27178, 27180, 27182, 27183, 27184, 59952, 59984, 27216, 27222, 27223, 27224, 27225, 27226, 27228, 27230, 60000, 27232, 60004, 60005, 27239, 60011, 27244, 60015, 60016, 27255, 27258, 27260, 27263, 60048, 27286, 27287, 60057, 27290, 27292, 60061, 27295, 27296, 60064, 60069, 60070, 27303, 60072, 27308, 60079, 27312, 60080, 11942, 27318, 27319, 60089, 27321, 27322, 27324, 60093, 27326, 60096, 27328, 60101, 60102, 27335, 60104, 60105, 27340, 60109, 57537, 60111, 60112, 57538, 27350, 27351, 57539, 27354, 27356, 27359, 60137, 60141, 60144, 27376, 27382, 27383, 27385, 27386, 27388, 27390, 60162, 60163, 60164, 60165, 60166, 57549, 60168, 60169, 60171, 60181, 27415, 60188, 60189, 60190, 60191, 60192, 27424, 27420, 27430, 27431, 27432, 60201, 27433, 27436, 60204, 60205, 60206, 27440, 60208, 60207, 60212, 60214, 60216, 60217, 27450, 60219, 60220, 60221, 60222, 27454, 11972, 27472, 60241, 60242, 60240, 27478, 27479, 60249, 60250, 27484, 60253, 27488, 60256, 60257, 60258, 11977, 60261, 27495, 60265, 60266, 60268, 60269, 27500, 60271, 60272, 60270, 60276, 60278, 27511, 27512, 27513, 27514, 27510, 27516, 60285, 27518, 60286, 60287, 60284, 60283, 60304, 27542, 27543, 27545, 60316, 27548, 60318, 60319, 60320, 27552, 60317, 60325, 27559, 60329, 60332, 60333, 60334, 60335, 60336, 27568, 27564, 27575, 60345, 27578, 27580, 60349, 60350, 27583, 27584, 60348, 60352, 60354, 60356, 60357, 60351, 27591, 60359, 60353, 60361, 60364, 27596, 60365, 60367, 60368, 60369, 60370, 60366, 60372, 44564, 27606, 27607, 60375, 27612, 60385, 60386, 60388, 27622, 60391, 27625, 27626, 27631, 27632, 60401, 60402, 60400, 60404, 60407, 27639, 60409, 27644, 60413, 27665, 27666, 27667, 27668, 60438, 27671, 60440, 27673, 27674, 27675, 60441, 27672, 60444, 60448, 27681, 27682, 27683, 27684, 27686, 27687, 27688, 27689, 27690, 27691, 60459, 60462, 60464, 27697, 27698, 27699, 27700, 27702, 27703, 60473, 27706, 27707, 60477, 60496, 60512, 60518, 60520, 60521, 60524, 60525, 60528, 60539, 60542, 60560, 60571, 60574, 60576, 60582, 60584, 60585, 60588, 60592, 60601, 60605, 60608, 27842, 27843, 27844, 27845, 60614, 60616, 60617, 60620, 60624, 27858, 27859, 27866, 60635, 27867, 60638, 60656, 27890, 27891, 60665, 27898, 27899, 60669, 27926, 60694, 27928, 27929, 60701, 60704, 27946, 27951, 60720, 27962, 27967, 60752, 27994, 27999, 60768, 28006, 60774, 28008, 28009, 28010, 60781, 28015, 60832, 28070, 5579, 60838, 28073, 28074, 28072, 60845, 28079, 60848, 28090, 28095, 60864, 60870, 28102, 28104, 28105, 28106, 60877, 28111, 60912, 28154, 28159, 28162, 28163, 28164, 28165, 28177, 28178, 28179, 60949, 60950, 28182, 28184, 28185, 28186, 28187, 28183, 60957, 60958, 60959, 60960, 28193, 28194, 28195, 28191, 28188, 28201, 28202, 28203, 28207, 60976, 28210, 28211, 28214, 28215, 60984, 60985, 28218, 60982, 28220, 28219, 28222, 28223, 61008, 28250, 61019, 61022, 28255, 61024, 61029, 61030, 28263, 28264, 28265, 28266, 61032, 28268, 61037, 28262, 61039, 61040, 61036, 28271, 28270, 61046, 61048, 61049, 28282, 28287, 61072, 28310, 28312, 28313, 28314, 61081, 61085, 28319, 61088, 61092, 61093, 28326, 28327, 28328, 28329, 28330, 61094, 28332, 61101, 28334, 61103, 61104, 28335, 61100, 61099, 61113, 28346, 61117, 28351, 61120, 61124, 61125, 28358, 28359, 28360, 28361, 28362, 61126, 28364, 61133, 61131, 61135, 61136, 61132, 28370, 28371, 28372, 28367, 28374, 28366, 28376, 28378, 28379, 28383, 28385, 28386, 28388, 28390, 28391, 28392, 61161, 28395, 61165, 61168, 28401, 28402, 28403, 28404, 28407, 28410, 28411, 28415, 61205, 61206, 28439, 28442, 28444, 61213, 28446, 61215, 61216, 28447, 61232, 61236, 28470, 61238, 28471, 61240, 28474, 61243, 28476, 28479, 61264, 28506, 28510, 28511, 61280, 61285, 61286, 28519, 28518, 28524, 61293, 61295, 61296, 61300, 61302, 61304, 28538, 61307, 28543, 61328, 28566, 28568, 28569, 61344, 61349, 61350, 28583, 28588, 61357, 61359, 61360, 28598, 28600, 28602, 28607, 61376, 61381, 28614, 28615, 28616, 61382, 28617, 28620, 61389, 61391, 61392, 28650, 28655, 61424, 28676, 61444, 28678, 61446, 28680, 28681, 61448, 28683, 61449, 61451, 44779, 28689, 28690, 61459, 28692, 28693, 61462, 28695, 61460, 28694, 61463, 61464, 61468, 28700, 28701, 61471, 28703, 28704, 28705, 28706, 28708, 28709, 61472, 28711, 61474, 28713, 61475, 61477, 28716, 28717, 28718, 61486, 28719, 28720, 61484, 61488, 61492, 61493, 28726, 61494, 28728, 28729, 28730, 61496, 61499, 28733, 28734, 28735, 61502, 28732, 61500, 61520, 28753, 28754, 61521, 28756, 61524, 61522, 61523, 28760, 28761, 28762, 61529, 61530, 61531, 61528, 28765, 61536, 61537, 61538, 61539, 28770, 61541, 28774, 61543, 61544, 28776, 61542, 61547, 28780, 61548, 28778, 61551, 28777, 61545, 61546, 61550, 28783, 28781, 61558, 28790, 61560, 28792, 31777, 28817, 28818, 28820, 28823, 28825, 28826, 61595, 28828, 28829, 28830, 28831, 28832, 28833, 28834, 28835, 61604, 61605, 61606, 28836, 28837, 28839, 28841, 61602, 61612, 28845, 61613, 61615, 28847, 28848, 61616, 28844, 28852, 28850, 28849, 28855, 28857, 28858, 61627, 61628, 28861, 61630, 61631, 61632, 28865, 28866, 28863, 28868, 61636, 28870, 61637, 28872, 28873, 28874, 28875, 28876, 28877, 61638, 28879, 61639, 28881, 28882, 61650, 28884, 28885, 61646, 28887, 61656, 28889, 61649, 61651, 61652, 61653, 61659, 28890, 61657, 61658, 28898, 61666, 61668, 28901, 61669, 28900, 28903, 28905, 28906, 61675, 61667, 28909, 61678, 28911, 61680, 28913, 28914, 28915, 28916, 28917, 61686, 28919, 61681, 61689, 28922, 61691, 28921, 61684, 61690, 61688, 61694, 28927, 28930, 28931, 61700, 61701, 28932, 28934, 28936, 28937, 28933, 28939, 61699, 28951, 61722, 28955, 28956, 61725, 28958, 61727, 61728, 28960, 28966, 28972, 61741, 61743, 61750, 61752, 61753, 29008, 29009, 29010, 61776, 29014, 29017, 29018, 61786, 29019, 29020, 29022, 61791, 29025, 29026, 29031, 29033, 29034, 29036, 61804, 29038, 61806, 61808, 29040, 61807, 61805, 61814, 61816, 61817, 29052, 61820, 61822, 61823, 29054, 61821, 61840, 29078, 29081, 29082, 61852, 29085, 61853, 29087, 61854, 61855, 29086, 29095, 38348, 61868, 29100, 61870, 29104, 61872, 61884, 61885, 61886, 29119, 29117, 29121, 29122, 61890, 61892, 29124, 61887, 61895, 29127, 61889, 61900, 29132, 61902, 61904, 61905, 61906, 29138, 61908, 29137, 61911, 29145, 29146, 61921, 61922, 61924, 29158, 61927, 29161, 29162, 29165, 29166, 29168, 29169, 29170, 61938, 29172, 61940, 61937, 29175, 61943, 29177, 29178, 29207, 29212, 61984, 29216, 29222, 61990, 61993, 61994, 29226, 29228, 29230, 61999, 12328, 29264, 62032, 62038, 29270, 12331, 29274, 62041, 29276, 12332, 29278, 29287, 29292, 62064, 29296, 62074, 62079, 62096, 64446, 29339, 29342, 29351, 29356, 29360, 62128, 29366, 62134, 62136, 29369, 29373, 29383, 29388, 62160, 29403, 29406, 29424, 62192, 62198, 29430, 62200, 29433, 29437, 62237, 62239, 62241, 62242, 62244, 62247, 62253, 62255, 62257, 62258, 62260, 62263, 29521, 29522, 29524, 29526, 29528, 29529, 29530, 29531, 29537, 29538, 29539, 29540, 29541, 62309, 62308, 62306, 62307, 29546, 29542, 29548, 62316, 29550, 62318, 62319, 62317, 29545, 29555, 62324, 62325, 29554, 29556, 29557, 62322, 62323, 29564, 62332, 62334, 62335, 29566, 62333, 62364, 29597, 62365, 29599, 62366, 29601, 29602, 62367, 62372, 29604, 62370, 62375, 29607, 62369, 62380, 62382, 12401, 62396, 62397, 62398, 12402, 29631, 29629, 62402, 62403, 62404, 62405, 62399, 62412, 62414, 29649, 29650, 29652, 29654, 29656, 29657, 29658, 29659, 29681, 29682, 29684, 29686, 29688, 29689, 29690, 29691, 62486, 29719, 62488, 62489, 29722, 29723, 29724, 29726, 29727, 29728, 62496, 62512, 29750, 29756, 62550, 62552, 62553, 29786, 29787, 29790, 29791, 62560, 29798, 29799, 29804, 12437, 29808, 62576, 29840, 62608, 5933, 62624, 29856, 64550, 29863, 29868, 29878, 29880, 29881, 62650, 29885, 62654, 29888, 62656, 29894, 29895, 29896, 29897, 62666, 29900, 29901, 62670, 62672, 29904, 29954, 62723, 62724, 29957, 29969, 29973, 29977, 29978, 62747, 62750, 29983, 62752, 29985, 29984, 29986, 29993, 29994, 29997, 62765, 29999, 62767, 62768, 30002, 30004, 30006, 30008, 30010, 30011, 30013, 62781, 30015, 62783, 62800, 30032, 30042, 62811, 62814, 30047, 62816, 30053, 30063, 30064, 62832, 30068, 30070, 30072, 30075, 62864, 30096, 62873, 30106, 62877, 30110, 30112, 62880, 30117, 30127, 62896, 5989, 62905, 30138, 62909, 30142, 62912, 30144, 30149, 62921, 30154, 62924, 30156, 62926, 30159, 30158, 62929, 30162, 30163, 30160, 30164, 62928, 62935, 30168, 30166, 30170, 30171, 62945, 30178, 30180, 62948, 62950, 62951, 62952, 62953, 30186, 62955, 30184, 30187, 30190, 45078, 62960, 62957, 30194, 30195, 62964, 62966, 62968, 62969, 30202, 30203, 62971, 45090, 45096, 45097, 6056, 6057, 63249, 30482, 30481, 63252, 30484, 63254, 63255, 30488, 63257, 30489, 63259, 30487, 30485, 30491, 30495, 63264, 30497, 30496, 30498, 30500, 63268, 30502, 63270, 30504, 63272, 30506, 63275, 30507, 30509, 63277, 30511, 63280, 63279, 30514, 30510, 63284, 63278, 30518, 63286, 63288, 63289, 30522, 30523, 30524, 30525, 30526, 63293, 30527, 63295, 30521, 63312, 30544, 63328, 30564, 30565, 30566, 30567, 30568, 63337, 63334, 30571, 30569, 30572, 30574, 30575, 30576, 63344, 30573, 30570, 63341, 30586, 63355, 30587, 45157, 30590, 30591, 63358, 63376, 30608, 30618, 63387, 63390, 30623, 30624, 63392, 30628, 30629, 30630, 30631, 30632, 63401, 63402, 30635, 63398, 30636, 63406, 30639, 63408, 6089, 63417, 30650, 63421, 30654, 63424, 30656, 30658, 63427, 30660, 30661, 30662, 30663, 30664, 63428, 63434, 30667, 30668, 63436, 30670, 63438, 30672, 63440, 30674, 30675, 30671, 6097, 6098, 30682, 63451, 30683, 63454, 30687, 63472, 30706, 30707, 63481, 30714, 30715, 63485, 30718, 45510, 6133, 38699, 63773, 63775, 31008, 63777, 63778, 63780, 31014, 63783, 63784, 63785, 63782, 31017, 31016, 63789, 63791, 31024, 63793, 63794, 63796, 63799, 31056, 31057, 31058, 31060, 45251, 31062, 31064, 31065, 31066, 31067, 31072, 31073, 31074, 31075, 63842, 63843, 63845, 63844, 31080, 31081, 31076, 31083, 63852, 63853, 31084, 63854, 63855, 31086, 63858, 63859, 31092, 31093, 63862, 31094, 63864, 63865, 31097, 31096, 45258, 63868, 31102, 63869, 31100, 63870, 63871, 45263, 63894, 31126, 63896, 63897, 31132, 63900, 63901, 31135, 63903, 31137, 31138, 63906, 63905, 31136, 31140, 31143, 63908, 63911, 45268, 63916, 63918, 45269, 31152, 63932, 31165, 63933, 63935, 31168, 31167, 63938, 63939, 63940, 63941, 63934, 45274, 63948, 63950, 31185, 31186, 31188, 63958, 31190, 63960, 63961, 31192, 31193, 31196, 31195, 31194, 31216, 31217, 31218, 31220, 31222, 31224, 31225, 31226, 31227, 31254, 31255, 31256, 31257, 31260, 64032, 31264, 64038, 31270, 64041, 31274, 64042, 31276, 31278, 64047, 31280, 45297, 31312, 64080, 31318, 64086, 31320, 31321, 31322, 64089, 31324, 31326, 31328, 32279, 31335, 31340, 31344, 64112, 64122, 64127, 64144, 31382, 31387, 31388, 31390, 31392, 31399, 31404, 31408, 64176, 64182, 31414, 64184, 31417, 64185, 31421, 31424, 31431, 31436, 64208, 31446, 31451, 31452, 31454, 64230, 64232, 64233, 31472, 64240, 31478, 64246, 64248, 31481, 31485, 31490, 31491, 64258, 64259, 31492, 31494, 31496, 31497, 31493, 31499, 64261, 64260, 31511, 64282, 31515, 31516, 64285, 31518, 64287, 64288, 31520, 31526, 64294, 31528, 31529, 64296, 64297, 31532, 64301, 64303, 31536, 64310, 64312, 64313, 64336, 31568, 31570, 31569, 31574, 31577, 31578, 64346, 31580, 31579, 31582, 64351, 31584, 31585, 31586, 31591, 31593, 31594, 31596, 64364, 64365, 64366, 31600, 64368, 64367, 31598, 64374, 31606, 64376, 64377, 31609, 31608, 64380, 64381, 31614, 31612, 64382, 64383, 64400, 31638, 64406, 64408, 64409, 31642, 31641, 64412, 64413, 64414, 64415, 31648, 31647, 31646, 31645, 31644, 31655, 31660, 64428, 64430, 31664, 64432, 38860, 64444, 31677, 64445, 64447, 31680, 64449, 64450, 31681, 31684, 31679, 31682, 31687, 64452, 64455, 64460, 31692, 64462, 64464, 64465, 64466, 31698, 31697, 64468, 31702, 64471, 64472, 64473, 64470, 31706, 31708, 31705, 64481, 64482, 38868, 64484, 31718, 64487, 31721, 31722, 31725, 31726, 31728, 31729, 31730, 64496, 64498, 64497, 64500, 64503, 31735, 31737, 31738, 31732, 32361, 64529, 31762, 31761, 31764, 64532, 64534, 31766, 31768, 31769, 64537, 64539, 64535, 31765, 31771, 31775, 31776, 64544, 31778, 64545, 64548, 31780, 31782, 64551, 64552, 64553, 31786, 64555, 31787, 31789, 31785, 64559, 31791, 64560, 64558, 64557, 64564, 31794, 31798, 64568, 64569, 31802, 31803, 64573, 31806, 31805, 31807, 64575, 31824, 64592, 64608, 31844, 31845, 31846, 31848, 64617, 31850, 31851, 64621, 31854, 31855, 64624, 31856, 31866, 64635, 64638, 31871, 38902, 31888, 64656, 31898, 64667, 64670, 31903, 64672, 31904, 31908, 31909, 31910, 31912, 31915, 31919, 64688, 64697, 31930, 64701, 31934, 31936, 64704, 31938, 64707, 64708, 31941, 31942, 31940, 31944, 31947, 31948, 64716, 31950, 64718, 64720, 31952, 31951, 31954, 31955, 31962, 64731, 31963, 64734, 31967, 64752, 31986, 31987, 64761, 31994, 31995, 64765, 31998, 32021, 32022, 64790, 32024, 64793, 32028, 64797, 32031, 32032, 64800, 32042, 32047, 64816, 32423, 32059, 32062, 64848, 32080, 32090, 32095, 64864, 32101, 32102, 64870, 32104, 64873, 32107, 32108, 64877, 32110, 32111, 32160, 64928, 32165, 32166, 64934, 32168, 32169, 64938, 64940, 64941, 64943, 32176, 64944, 32175, 32187, 32190, 64960, 32192, 32197, 32198, 64966, 32200, 32201, 64970, 64972, 64973, 32207, 64975, 32455, 32458, 65008, 32240, 32251, 32254, 32258, 65027, 65028, 32261, 32273, 32277, 65046, 32278, 32280, 32281, 32282, 65051, 32284, 65053, 65054, 32287, 32288, 65056, 32290, 32289, 32297, 32298, 32299, 32301, 32302, 32303, 65072, 65071, 65069, 32306, 32308, 32310, 65078, 65080, 65081, 32313, 32312, 32315, 32317, 32318, 32316, 65085, 32319, 32314, 65087, 65104, 32336, 32346, 65115, 65118, 32351, 65120, 32357, 32358, 65126, 32360, 65129, 32359, 32363, 32364, 65133, 65128, 32367, 32368, 65136, 32365, 65049, 32372, 32366, 32374, 65142, 32376, 65145, 32377, 32379, 32382, 32488, 65168, 32400, 6440, 65177, 32410, 32411, 65181, 32414, 32415, 32416, 65184, 32421, 65190, 32422, 32424, 65193, 65194, 32425, 32428, 65197, 65198, 65199, 65200, 32432, 65196, 32431, 65209, 32442, 32443, 65210, 65213, 32446, 65215, 65216, 32448, 6450, 32453, 32454, 65222, 32456, 32457, 65226, 32459, 32460, 65229, 32462, 65231, 65232, 65233, 32464, 65228, 32463, 32466, 32468, 32470, 32472, 65239, 32474, 32475, 32467, 32479, 65249, 32482, 65252, 32484, 65254, 65255, 32486, 65257, 32490, 32491, 65256, 65261, 32494, 32495, 32496, 65264, 32498, 32499, 65259, 65268, 65270, 65272, 65273, 32506, 32507, 65275, 32510, 32533, 32534, 65302, 65304, 65305, 32538, 32539, 32540, 65309, 32542, 32543, 32544, 65312, 65328, 32566, 65334, 32568, 32569, 65337, 32572, 32592, 65360, 65366, 65368, 65369, 32602, 45557, 32603, 32606, 32607, 65376, 32613, 32614, 65382, 32615, 32620, 65389, 32535, 32623, 32624, 65392, 65398, 32630, 32632, 32633, 65401, 65424, 32656, 32666, 32667, 32670, 32671, 32672, 65440, 32677, 65446, 32679, 32684, 65452, 65453, 32687, 32688, 65456, 32694, 32696, 32697, 65466, 32699, 32701, 65470, 65471, 65472, 32704, 32702, 32709, 65478, 32710, 32711, 32713, 65482, 32712, 32716, 32717, 65486, 65487, 32720, 32718, 65488, 65485, 65484, 32719, 32746, 32747, 32750, 32751, 32752, 65520], 2105: [65131, 81, 82, 92, 97, 108, 52125, 147, 149, 179, 181, 197, 204, 227, 229, 252, 257, 258, 33030, 263, 33032, 33033, 33034, 269, 33039, 273, 276, 279, 280, 281, 33052, 33054, 33057, 292, 296, 33065, 305, 311, 313, 317, 337, 340, 343, 345, 33117, 33119, 33123, 33130, 33132, 33133, 33134, 33135, 33137, 370, 33139, 369, 375, 33145, 377, 33146, 381, 33172, 33175, 33176, 33180, 33184, 33186, 33187, 420, 33188, 33189, 424, 436, 440, 33216, 33218, 33219, 33220, 33221, 33236, 33239, 33240, 33244, 477, 65224, 482, 483, 490, 512, 524, 526, 528, 65234, 532, 65235, 537, 544, 552, 553, 564, 566, 568, 569, 571, 573, 592, 33362, 33365, 600, 601, 608, 33378, 612, 33381, 33380, 33384, 617, 33385, 619, 624, 33396, 630, 33400, 633, 33401, 637, 656, 660, 33430, 662, 664, 33433, 33432, 667, 672, 680, 33450, 33455, 688, 692, 699, 704, 705, 33478, 711, 33480, 33482, 33484, 33487, 720, 719, 721, 33494, 727, 33496, 33497, 33498, 726, 733, 735, 736, 33503, 738, 739, 746, 747, 33520, 753, 754, 755, 759, 763, 762, 33535, 768, 767, 780, 782, 33554, 33557, 792, 33562, 797, 799, 33567, 33572, 33574, 33577, 813, 815, 822, 829, 33619, 33620, 861, 58787, 33634, 33635, 33636, 33637, 33638, 33642, 33643, 877, 879, 33647, 33652, 33654, 886, 889, 33657, 33659, 893, 895, 912, 58798, 920, 925, 927, 934, 937, 941, 943, 944, 952, 960, 962, 964, 966, 968, 969, 971, 973, 975, 989, 991, 992, 994, 995, 1002, 1003, 32765, 1024, 1025, 33794, 33795, 33796, 1026, 33798, 33797, 33800, 1033, 1028, 33803, 1036, 1037, 1038, 1031, 1040, 1042, 1043, 1045, 33814, 1049, 33817, 33816, 1058, 1059, 1060, 1061, 1062, 1064, 1065, 1067, 1069, 1070, 1072, 1074, 1075, 1076, 1077, 1081, 33850, 1083, 1086, 33855, 1104, 33878, 33880, 1113, 33881, 1117, 1118, 1124, 1129, 1131, 1134, 1136, 1142, 1145, 33914, 1149, 33919, 1168, 1182, 1188, 1192, 1195, 1198, 1200, 1204, 1206, 1208, 1211, 1214, 1216, 1217, 33990, 1223, 33993, 33991, 33996, 1230, 1232, 1233, 1238, 1239, 34010, 1245, 34015, 1248, 1250, 1251, 6762, 1258, 1259, 1261, 1263, 34032, 1265, 1266, 1267, 1268, 1271, 34042, 1275, 1274, 1277, 1278, 1279, 1280, 34047, 1292, 1294, 34064, 1296, 1298, 34068, 1301, 34072, 34073, 1314, 1316, 1317, 34086, 1320, 1321, 1323, 1326, 1328, 34098, 34099, 34100, 34101, 1333, 1330, 1342, 1360, 34131, 34132, 34136, 34137, 34140, 34142, 1374, 34144, 1378, 34146, 34148, 1380, 34147, 34152, 1385, 34154, 1387, 34156, 34158, 1390, 1392, 34162, 1394, 34164, 34165, 34166, 34168, 34170, 34172, 1405, 1424, 1425, 34194, 34198, 1431, 1436, 1437, 1438, 34200, 34203, 1441, 1444, 1449, 34218, 1451, 1454, 34223, 1456, 34221, 39368, 1464, 1467, 1470, 1472, 1473, 1474, 34246, 34248, 34250, 1486, 1489, 34258, 1488, 1492, 1490, 34262, 1495, 34264, 1497, 34266, 34267, 1494, 1501, 34271, 1504, 1506, 1507, 1514, 1515, 1516, 1517, 1518, 1519, 1522, 1523, 1524, 34298, 1530, 1531, 34303, 1535, 1808, 1810, 1811, 1824, 1826, 1827, 1832, 1840, 1843, 1844, 1851, 1872, 1888, 1890, 1904, 1906, 1908, 1910, 1917, 1936, 1937, 1942, 1943, 1944, 34710, 1947, 1948, 34715, 1950, 1952, 1953, 34723, 34724, 1966, 1972, 1979, 1982, 1984, 1985, 34758, 34761, 1998, 1999, 2000, 2001, 34774, 2007, 2006, 34778, 34779, 2013, 34783, 2015, 2018, 2019, 17013, 2026, 2027, 2028, 2029, 2030, 2031, 2034, 2035, 2036, 34810, 2043, 2042, 2046, 2047, 34815, 17016, 2304, 2316, 2318, 2321, 35090, 35093, 35098, 2332, 2333, 2334, 2335, 2337, 35103, 35108, 2341, 35110, 35113, 2348, 2350, 2351, 2353, 26519, 2357, 26521, 2364, 2366, 2367, 35155, 35156, 2389, 2399, 35170, 35171, 35172, 35173, 35174, 2405, 35178, 35179, 2415, 35183, 35188, 35190, 35193, 2425, 35195, 2431, 2448, 2453, 13515, 2463, 2469, 2479, 2485, 2495, 2498, 2500, 2501, 2511, 2527, 2528, 2549, 2559, 2560, 2572, 2574, 2576, 2601, 35410, 35413, 35426, 35428, 35429, 35432, 35433, 2665, 2672, 35444, 35448, 35449, 2704, 2708, 35478, 2712, 35480, 35481, 2715, 2718, 35498, 35503, 2750, 2753, 35526, 2760, 35528, 35530, 35532, 2766, 2767, 2768, 35535, 2770, 2771, 2772, 2773, 35542, 2776, 35545, 2777, 2779, 35544, 35546, 2775, 2784, 35551, 2786, 2787, 2789, 2783, 2793, 2798, 35568, 2801, 2804, 2807, 2811, 2814, 2815, 35583, 2817, 2818, 35590, 2823, 35592, 35594, 35593, 2829, 35599, 2833, 2836, 2839, 2841, 2844, 35614, 2846, 35617, 2849, 35612, 2853, 35625, 2860, 2862, 2863, 2865, 2869, 2871, 2876, 2878, 2879, 2897, 2900, 2901, 2903, 35677, 35679, 2911, 35683, 2917, 35690, 35692, 35693, 35694, 35695, 2927, 35697, 2930, 35699, 2929, 2935, 2937, 35705, 35706, 2960, 35732, 2965, 35735, 35736, 35740, 2975, 35744, 35746, 35747, 35748, 35749, 2981, 2991, 2997, 3007, 35776, 35778, 35779, 35780, 35781, 3013, 3023, 35796, 35799, 35800, 35804, 3061, 3071, 3090, 3091, 3098, 3106, 3112, 3122, 3123, 3124, 39698, 3130, 3131, 3154, 3155, 3160, 3162, 3170, 3186, 3187, 3188, 3194, 3195, 3217, 35990, 3223, 35995, 3228, 3230, 3233, 36003, 36004, 3252, 3257, 3262, 3265, 3278, 3281, 36054, 3287, 36059, 3308, 3310, 3316, 3321, 3328, 3340, 3342, 3345, 3346, 3353, 3354, 3355, 3357, 3359, 3361, 3362, 3363, 3364, 3365, 3368, 3369, 3370, 3373, 3375, 3377, 3378, 3379, 3380, 3381, 3382, 3385, 3386, 3387, 3389, 3391, 3410, 3411, 3412, 3413, 3416, 3417, 3419, 3421, 3423, 3427, 3428, 3429, 3430, 3433, 3435, 3437, 3439, 3443, 3449, 3450, 3453, 3455, 3472, 3477, 3487, 3490, 3492, 3493, 3496, 3503, 3504, 3506, 3508, 3509, 3513, 3519, 3520, 3521, 3522, 3524, 3525, 3527, 3528, 36297, 3535, 3537, 3543, 36314, 36319, 3552, 3569, 3570, 3572, 3573, 3575, 3577, 3583, 3584, 3596, 3598, 3600, 36368, 3602, 3601, 36372, 3610, 36377, 3615, 3616, 3617, 3618, 3619, 3620, 3621, 36390, 3624, 3625, 3626, 3631, 3633, 36402, 3635, 36403, 3637, 3634, 36404, 36405, 3642, 3647, 52830, 3664, 3666, 36435, 36436, 3669, 3667, 36440, 36441, 36444, 36446, 3679, 3680, 3682, 36450, 36452, 36451, 3685, 3689, 36458, 36462, 3695, 3696, 52836, 3698, 36466, 36468, 36469, 3706, 3699, 36476, 3709, 3711, 3728, 3729, 36498, 3733, 3735, 36502, 36504, 36507, 3740, 3741, 3742, 3743, 3744, 3746, 3749, 3745, 3753, 36522, 36525, 3759, 3760, 36527, 3762, 3764, 3765, 3768, 3769, 3771, 3774, 3775, 3776, 3777, 3778, 3781, 36552, 36553, 3790, 3791, 3792, 3793, 3796, 36562, 3798, 3799, 3800, 3801, 36570, 3803, 36568, 3805, 36571, 36566, 3808, 36575, 3807, 3812, 3814, 3816, 3817, 3819, 3820, 3822, 3826, 3828, 3829, 3832, 3833, 3835, 3839, 3841, 3842, 36610, 36611, 3844, 36612, 3847, 36613, 36616, 3849, 36619, 36614, 3853, 3858, 3859, 36630, 36632, 36633, 3865, 3866, 3876, 3878, 3880, 3883, 3890, 3891, 3892, 3896, 3897, 36666, 3899, 3898, 46365, 36671, 3922, 3923, 36694, 3929, 3930, 36697, 3933, 36696, 3940, 3944, 3947, 3954, 3955, 3961, 36730, 3962, 3963, 3965, 36735, 4004, 4008, 4009, 4020, 4022, 4024, 4025, 4027, 4041, 4052, 4054, 4056, 4057, 4059, 4068, 4070, 4072, 4073, 4075, 36848, 4084, 4086, 4088, 4089, 4091, 4131, 4148, 4147, 4152, 4154, 4155, 4179, 36947, 36957, 36959, 4195, 36963, 36973, 36975, 37033, 37034, 37037, 37039, 37048, 37049, 37050, 37053, 37055, 37065, 37066, 37069, 37071, 46450, 37117, 37119, 37128, 37129, 4368, 37138, 4371, 4372, 37141, 4374, 4376, 37144, 37145, 4380, 37150, 4381, 37156, 4388, 4390, 37158, 4392, 37160, 4395, 4396, 37164, 37166, 4408, 37178, 37180, 4412, 37183, 4432, 37206, 37208, 37209, 37212, 4448, 37216, 37218, 4451, 4452, 37221, 4454, 4461, 37230, 4463, 37232, 4466, 37236, 4468, 4472, 37242, 4475, 37244, 4477, 37246, 37247, 4499, 37276, 37278, 4512, 37284, 37286, 37288, 37292, 4526, 37294, 37300, 37302, 37304, 4544, 37324, 37326, 4559, 4557, 4558, 4563, 4562, 4570, 37340, 37342, 4572, 4574, 4604, 4606, 37379, 37386, 37389, 37391, 4624, 37392, 37400, 37401, 4634, 4637, 4639, 4646, 4648, 37417, 37420, 37430, 4662, 4664, 4665, 37432, 37433, 37436, 4690, 4693, 4694, 4696, 37465, 4699, 4700, 37469, 4702, 37472, 4705, 4704, 4706, 4708, 4709, 4712, 37481, 4714, 4716, 37485, 4717, 4719, 4718, 37488, 4721, 4724, 37493, 4726, 4728, 37497, 4729, 4733, 37501, 37503, 37520, 4753, 4754, 4756, 37525, 4758, 4760, 4761, 4763, 4764, 4765, 37535, 37536, 4769, 4770, 4768, 4772, 4776, 4777, 4778, 4779, 4781, 4785, 4786, 4788, 37558, 4790, 4792, 4793, 4794, 4795, 4796, 37565, 4800, 4801, 4802, 37568, 37569, 4804, 4807, 4809, 37577, 4813, 4815, 4817, 4818, 4820, 37589, 4822, 4823, 4825, 37594, 4828, 4829, 37598, 37599, 37596, 37606, 37613, 4849, 4850, 4852, 4854, 4855, 37626, 4858, 37628, 4861, 4860, 4863, 37630, 37635, 37642, 37645, 37647, 4885, 4886, 4892, 4893, 37670, 4908, 37676, 4909, 37686, 4920, 4924, 37692, 37712, 4944, 37718, 37721, 4955, 37724, 37725, 4958, 4960, 37728, 37734, 37737, 4969, 4971, 37740, 37741, 4973, 4975, 37744, 4984, 4985, 37753, 4987, 4989, 37757, 4991, 5008, 37776, 37782, 37787, 5024, 37795, 37800, 5027, 37814, 37821, 5056, 37825, 5058, 5060, 5059, 37830, 37831, 37833, 37832, 5069, 5071, 5072, 37841, 5074, 5076, 37846, 37847, 5080, 37850, 37851, 5085, 37855, 5087, 37862, 37869, 5106, 5108, 37878, 37880, 37881, 37882, 5117, 37887, 5119, 37890, 37894, 37896, 37897, 37898, 37899, 37901, 37903, 5136, 5138, 5139, 5140, 5141, 5142, 5145, 37913, 5148, 5154, 5155, 5156, 5157, 37926, 5158, 5160, 5161, 37928, 5163, 37932, 5164, 5166, 5159, 37929, 5170, 5171, 5172, 5173, 37944, 5179, 37948, 5180, 5182, 5200, 37968, 37970, 37973, 37974, 5206, 37977, 5209, 37980, 37981, 5213, 37984, 5218, 5215, 5220, 5222, 37988, 5221, 37993, 5227, 5224, 37997, 5229, 5231, 5234, 5230, 5236, 5239, 38004, 5237, 5243, 5244, 38013, 5245, 5247, 38033, 5266, 5264, 38036, 38038, 5270, 38041, 5273, 5274, 5275, 38043, 38046, 5277, 5281, 38048, 38050, 38052, 5284, 38054, 5288, 5289, 38058, 38059, 38057, 38062, 5291, 5296, 5294, 38064, 5298, 38065, 5302, 38073, 5307, 5308, 38077, 5313, 38080, 38078, 5319, 38090, 5323, 5327, 5328, 38089, 5329, 38102, 5335, 5337, 38105, 5340, 5341, 5342, 5343, 38118, 38125, 5360, 5361, 5366, 5367, 38136, 38134, 5371, 5372, 5373, 5374, 5375, 38146, 38155, 38157, 38159, 38161, 5394, 38164, 5397, 38166, 38167, 38168, 5401, 38170, 5404, 38171, 5406, 5410, 38175, 38183, 38184, 5417, 38185, 5418, 5420, 38189, 5422, 38191, 38194, 38195, 38196, 38197, 5426, 5432, 38200, 5430, 5436, 5438, 38224, 5456, 38227, 38228, 5462, 38232, 5465, 38235, 38240, 38241, 38243, 38244, 5478, 38247, 38248, 38249, 5481, 38250, 5480, 38253, 5485, 38255, 38257, 38256, 5491, 38260, 38261, 38262, 38263, 38264, 5497, 5498, 38259, 5501, 38271, 7608, 38288, 5522, 38290, 38292, 38299, 38301, 38302, 38303, 5536, 38304, 5537, 38306, 5540, 38308, 5542, 5544, 5545, 38315, 5547, 38317, 5550, 38318, 38320, 5548, 5554, 38319, 38333, 5564, 5568, 38336, 38338, 5570, 38340, 5581, 38356, 5597, 38365, 38367, 5599, 38381, 5620, 5622, 5627, 5628, 5629, 5630, 40608, 14185, 38672, 38673, 5906, 5907, 5908, 5909, 38679, 5913, 5914, 5916, 38685, 5918, 38687, 38689, 5923, 38693, 38695, 5931, 5932, 38703, 5929, 5939, 5942, 5944, 5948, 5971, 5972, 5979, 38752, 38753, 5986, 5987, 38759, 5993, 5996, 5997, 38769, 6002, 6004, 38773, 6006, 6008, 6009, 6011, 38777, 6013, 38781, 38783, 38775, 38801, 38802, 6033, 38804, 6036, 38805, 38809, 6041, 38813, 38815, 38816, 38818, 6045, 38820, 6050, 38826, 38827, 38830, 38833, 38832, 38836, 38840, 38843, 38846, 6081, 38848, 38850, 6084, 6087, 38858, 38852, 38869, 6103, 40289, 40621, 38876, 6109, 38879, 38877, 40622, 6135, 38910, 7768, 7769, 7772, 7783, 39171, 39178, 39181, 39183, 6419, 6421, 6422, 39190, 39192, 6429, 40634, 27330, 6435, 6437, 39209, 6445, 6446, 7795, 6453, 39222, 6451, 39225, 6462, 40362, 20824, 39248, 6486, 6488, 39257, 6491, 39261, 6494, 39264, 6502, 39273, 6505, 6507, 6509, 39277, 6511, 39280, 6520, 39289, 6521, 6523, 6525, 39293, 6527, 39312, 6544, 39326, 6560, 6563, 39336, 39331, 39342, 39350, 6587, 39355, 39357, 39358, 6592, 39361, 6594, 6595, 39366, 6596, 39369, 6603, 39367, 6605, 6607, 6608, 39377, 6610, 6612, 39383, 6616, 39386, 40393, 6621, 6623, 39398, 39405, 6642, 6644, 39414, 39417, 39418, 6651, 6653, 39423, 6655, 39427, 40643, 7837, 39434, 39437, 39439, 6672, 39440, 6679, 39447, 6682, 6684, 6685, 6687, 6694, 39463, 6695, 6696, 39468, 6700, 6703, 6711, 39479, 39484, 6716, 6719, 6717, 6738, 6741, 6743, 39513, 6747, 6748, 39517, 6750, 39520, 6753, 6754, 6756, 6757, 6759, 6760, 39529, 6763, 6764, 39533, 6765, 6767, 6769, 6766, 39536, 6772, 6774, 7859, 6776, 6777, 39545, 6781, 39549, 39568, 6802, 39571, 6806, 6809, 6811, 6812, 6813, 6816, 39586, 6819, 39591, 6825, 6826, 39595, 39596, 6829, 6834, 39603, 39606, 39607, 6843, 39612, 7873, 39613, 6848, 39617, 6849, 6852, 6850, 6855, 39625, 6857, 39628, 6861, 39623, 6863, 6865, 6866, 6868, 6870, 6871, 6873, 39642, 39644, 6877, 6876, 39646, 39654, 39661, 6897, 6898, 6900, 6903, 39671, 6906, 39674, 39676, 6909, 39678, 6911, 39688, 39689, 6928, 6931, 6932, 39701, 6933, 39704, 6936, 39705, 6934, 6941, 39710, 6947, 6948, 6949, 6950, 39721, 6952, 6955, 39724, 6958, 6963, 6964, 6965, 6971, 39737, 6974, 39743, 39766, 6998, 7000, 39768, 39769, 39776, 39778, 7011, 7012, 39781, 7014, 7017, 7019, 7021, 7023, 39792, 7026, 7028, 40474, 7032, 39802, 7035, 39804, 7037, 39806, 40479, 7059, 7060, 40481, 7064, 39836, 39838, 7072, 7076, 39846, 39848, 39851, 7083, 39854, 40485, 39852, 39860, 7092, 39862, 7096, 39864, 39867, 7099, 39870, 7104, 7117, 39884, 7119, 7122, 7123, 39886, 40493, 7130, 39900, 40495, 7134, 39902, 7132, 7164, 40503, 39953, 7186, 7189, 39959, 39965, 39967, 39969, 39970, 39975, 7209, 39978, 39983, 39985, 39986, 7224, 7225, 39994, 40017, 40018, 7252, 7257, 40026, 40033, 40034, 7266, 40039, 7272, 7273, 40042, 40047, 40049, 7284, 40055, 7289, 40061, 40063, 40082, 40084, 40093, 40095, 7329, 7330, 40098, 40100, 7337, 40107, 40536, 40111, 7345, 7346, 40116, 40538, 40120, 7353, 7354, 40123, 40539, 7361, 40130, 40132, 7369, 40139, 40157, 40546, 40159, 40547, 40187, 40552, 40194, 40554, 40203, 40205, 40207, 7440, 40214, 7448, 7449, 40216, 40217, 40558, 7456, 40225, 40226, 7460, 40229, 7462, 40230, 7464, 7465, 40234, 40233, 40236, 40232, 40238, 40562, 40241, 40242, 40563, 7476, 40245, 7478, 40246, 7480, 7481, 40249, 40250, 40252, 40564, 40254, 40248, 40566, 7504, 40274, 40273, 7508, 40277, 7510, 7512, 7513, 40282, 40281, 40285, 40284, 40288, 40290, 40286, 40292, 40293, 7528, 40297, 7529, 40298, 40301, 7534, 7536, 40304, 40302, 40308, 7541, 7540, 40313, 7547, 40317, 7551, 60118, 40336, 7572, 40340, 40342, 7576, 7577, 40344, 40347, 40345, 7581, 7585, 7586, 40355, 40356, 40358, 40360, 7593, 40363, 7594, 40366, 40361, 7597, 40367, 7602, 40371, 40372, 7604, 40374, 7601, 40376, 7609, 7610, 40379, 40380, 40377, 40382, 40381, 40384, 7617, 7618, 40387, 40388, 40390, 7623, 40392, 7625, 40394, 7626, 7629, 40398, 40399, 7633, 40395, 40406, 7639, 40409, 7641, 7645, 40597, 7647, 40422, 40429, 7665, 7666, 40435, 40436, 40438, 7671, 40440, 7673, 7674, 40443, 40444, 7677, 40446, 7679, 40441, 40450, 40605, 40459, 40461, 40463, 40464, 40465, 7699, 40468, 7703, 40472, 7705, 7710, 40475, 7714, 40482, 7716, 7715, 7718, 7719, 40488, 40489, 7721, 7724, 7720, 40487, 40490, 40497, 40498, 40499, 7735, 7737, 7740, 40504, 40530, 40531, 7763, 7764, 40533, 7766, 40532, 7767, 40542, 40544, 40545, 7779, 40553, 7785, 7789, 40557, 40561, 7794, 40565, 40567, 40568, 7801, 7802, 7805, 40575, 7825, 7826, 7827, 40596, 40595, 40594, 7833, 40602, 40603, 40607, 7841, 7842, 7843, 40612, 40610, 40611, 7850, 40619, 40618, 40626, 40627, 7858, 40628, 40631, 7865, 40637, 40640, 40642, 7874, 40644, 7879, 40650, 40651, 40661, 40660, 7895, 40668, 40669, 7901, 40671, 7903, 40670, 40685, 40691, 7924, 40692, 7927, 40696, 40695, 40654, 40702, 7933, 40710, 40712, 40713, 40714, 40719, 7952, 7959, 40738, 7972, 40743, 7975, 7977, 40746, 7980, 40748, 40753, 7991, 40759, 7996, 40764, 8016, 40786, 8020, 8023, 8025, 40794, 8028, 8029, 8031, 40800, 8034, 40801, 8036, 8039, 8040, 40809, 8043, 8045, 34163, 8050, 8055, 8060, 8061, 8080, 40850, 40851, 8082, 8083, 40858, 40859, 8090, 8097, 8098, 8099, 40866, 40867, 40870, 8105, 40874, 40875, 8106, 8107, 8114, 8115, 40883, 40882, 40887, 40890, 40892, 8129, 8144, 8156, 8158, 8178, 40948, 40951, 40952, 8186, 8188, 40956, 8190, 8226, 8227, 8228, 8230, 8232, 8235, 8242, 8243, 8244, 8248, 8250, 8251, 8275, 8280, 8291, 8296, 41144, 41145, 14699, 8470, 8472, 8473, 8476, 8477, 8479, 8482, 8486, 41254, 8488, 8489, 8491, 8492, 41260, 8504, 8508, 41276, 8528, 41302, 41308, 8544, 8550, 8557, 8559, 8562, 8571, 8573, 41361, 41362, 8595, 41364, 41366, 41368, 41369, 41370, 8602, 41373, 41376, 41377, 41378, 41380, 41382, 41384, 41385, 41386, 41393, 41394, 41396, 41398, 41400, 41401, 41402, 41408, 41414, 41416, 41417, 41419, 8653, 8655, 8659, 41430, 8666, 41437, 41439, 41462, 41464, 41465, 41469, 41471, 41472, 41475, 41478, 41482, 41485, 41487, 41488, 41496, 41497, 41509, 41510, 8742, 41512, 8744, 41516, 41519, 8758, 41526, 8760, 8761, 41528, 41529, 41532, 41552, 8790, 8792, 8795, 8798, 41568, 41573, 8808, 8811, 8814, 41583, 41589, 8822, 8824, 41599, 27809, 41616, 8849, 8850, 8852, 41621, 8854, 41622, 8856, 8857, 8858, 8859, 41624, 41631, 41632, 8865, 8866, 8868, 8872, 8873, 8874, 8875, 41643, 41646, 8881, 8882, 8884, 8886, 41654, 8888, 8889, 8890, 8891, 8892, 41664, 41665, 41668, 14795, 41673, 41675, 41678, 41682, 41685, 41686, 41688, 41692, 41695, 41702, 41709, 41714, 41717, 8950, 8956, 41724, 41726, 41728, 41731, 41734, 41738, 41741, 41743, 8978, 8981, 8982, 8984, 8985, 41755, 8988, 41756, 41758, 8996, 8998, 41766, 9000, 9001, 41770, 41771, 9004, 41772, 41769, 41782, 9014, 9016, 9017, 41788, 9020, 9040, 41814, 9051, 41820, 9054, 9056, 41830, 9067, 41835, 9071, 41841, 9080, 41849, 41850, 41851, 9083, 9087, 41872, 41877, 41880, 41881, 41882, 9112, 41887, 41888, 9123, 9124, 41894, 41896, 41897, 41898, 41900, 41902, 41910, 41912, 41913, 41914, 41917, 41920, 9155, 9156, 41926, 41928, 41929, 41930, 41937, 41938, 9172, 41941, 9176, 41945, 41946, 41948, 41950, 41951, 41958, 41965, 41970, 41973, 41974, 41976, 41977, 41980, 41982, 41984, 41986, 41990, 41995, 41997, 41999, 42000, 9238, 9241, 9244, 42021, 42022, 9254, 42024, 9256, 9257, 42025, 42028, 42029, 9260, 42031, 42040, 42044, 9276, 9296, 9302, 42070, 9305, 42076, 42080, 9316, 9317, 9318, 9320, 9323, 9325, 9326, 9327, 9332, 42101, 9333, 9339, 9341, 42109, 42111, 9343, 42128, 42129, 9362, 42132, 9366, 42137, 9370, 9371, 42139, 9377, 42146, 42148, 9380, 42150, 9384, 42153, 42154, 9385, 42152, 42158, 42155, 42161, 9394, 42164, 42166, 9398, 42168, 42169, 9402, 9403, 9404, 42173, 42176, 42177, 42179, 42182, 42185, 42186, 42187, 42190, 42195, 42196, 42203, 42204, 42205, 42206, 42207, 42214, 42221, 42227, 42228, 42230, 9462, 42232, 9468, 42236, 42238, 42237, 42240, 42239, 42242, 42246, 42251, 42253, 42255, 42262, 42268, 42278, 9510, 42280, 9513, 42281, 42284, 42294, 9526, 9528, 42296, 42300, 9558, 9561, 9574, 9576, 9618, 9622, 9627, 42399, 9633, 9636, 9638, 9640, 9641, 21455, 9644, 42418, 42419, 9650, 9654, 42422, 9660, 9659, 42432, 9670, 9676, 42447, 42466, 42467, 42470, 9718, 9724, 42768, 10003, 10004, 10009, 42779, 10012, 10014, 42782, 10018, 42789, 10022, 42790, 10024, 21531, 42792, 10027, 10028, 42796, 10025, 60610, 10038, 42806, 10040, 10044, 42812, 42832, 42838, 10075, 42844, 10083, 10084, 42853, 10091, 10092, 42859, 42863, 10094, 10098, 42869, 10102, 42870, 42872, 10104, 10107, 54115, 42897, 10129, 42900, 42901, 10132, 42905, 10137, 42909, 42912, 42914, 10146, 42916, 10149, 42920, 42929, 42930, 42931, 42932, 42934, 42936, 42939, 42944, 10178, 42946, 42948, 10181, 42952, 42959, 42963, 42965, 42972, 42978, 42979, 42986, 42987, 42995, 42998, 43004, 44693, 43264, 43267, 43270, 43274, 43277, 43279, 10514, 10517, 43286, 10518, 43288, 10520, 43291, 43292, 43294, 10532, 10534, 43302, 10536, 43305, 10537, 43304, 43307, 10550, 43318, 10553, 43321, 10582, 10584, 10587, 10590, 10598, 10601, 10603, 43371, 10607, 43377, 10616, 43385, 43386, 43387, 10619, 10623, 43408, 43413, 43416, 10648, 43418, 43417, 43423, 10659, 10660, 43430, 43432, 10665, 43435, 43436, 43438, 43446, 10680, 43449, 43448, 43453, 10691, 10692, 43462, 43464, 43465, 43466, 43473, 43474, 10708, 43477, 10712, 43481, 43482, 43484, 43486, 43487, 43494, 43501, 43506, 43509, 43510, 43513, 43516, 43518, 43520, 43523, 43526, 43530, 43533, 43535, 43536, 43543, 10775, 10780, 43557, 43559, 10791, 10796, 43564, 43567, 10807, 43575, 10812, 43580, 43600, 10839, 10843, 10844, 10846, 43616, 43621, 10855, 10856, 10859, 10860, 10862, 43631, 43637, 10870, 10872, 43647, 43664, 10898, 43667, 43669, 43670, 43672, 10907, 21707, 43679, 43682, 10915, 43687, 10922, 43691, 43692, 43694, 10930, 43699, 43702, 43703, 10939, 43708, 43713, 43716, 43719, 43721, 43723, 43724, 43730, 43733, 43734, 43736, 43740, 43743, 43750, 43757, 43762, 43765, 43767, 43772, 43774, 54294, 28243, 11030, 11032, 43800, 11037, 11039, 11042, 43814, 11046, 11048, 11049, 43817, 43816, 11051, 54308, 11094, 11096, 28259, 11110, 11113, 11117, 28261, 11119, 11122, 11131, 11133, 28267, 11155, 11156, 43924, 43926, 11160, 43928, 11162, 43933, 11172, 43942, 43944, 11177, 43947, 11188, 43956, 43958, 43960, 43961, 28276, 11192, 43974, 43976, 43979, 11213, 11215, 11219, 43990, 11226, 43997, 43999, 44022, 44025, 44029, 44031, 44065, 44066, 11300, 11304, 11305, 44081, 44082, 11316, 11320, 11321, 44113, 44114, 11348, 11352, 11353, 44129, 44130, 11364, 11368, 11369, 54363, 44189, 11425, 11426, 44196, 44198, 44200, 11433, 44203, 11441, 44210, 44211, 44212, 11442, 44214, 44216, 11449, 44219, 11450, 11457, 11458, 44228, 44230, 44232, 11465, 44235, 44239, 44258, 44259, 44266, 44267, 44278, 44283, 44288, 44290, 28342, 44294, 44299, 44301, 44303, 44304, 11542, 44313, 11544, 11545, 44321, 44322, 11556, 44325, 11558, 44326, 44328, 44329, 44330, 11561, 11560, 44335, 44337, 44338, 11572, 11574, 44342, 11576, 44345, 44346, 11577, 44344, 28354, 28356, 11600, 44369, 44370, 11604, 11606, 11608, 44377, 44378, 11609, 44384, 44385, 44386, 11622, 11624, 44393, 44394, 11625, 11630, 11636, 44405, 11637, 11643, 11647, 44415, 44432, 44436, 11668, 44438, 44440, 11672, 11673, 44443, 11681, 11682, 44457, 11688, 11689, 11690, 11697, 11698, 44468, 11700, 44470, 11704, 11705, 44473, 44472, 11706, 44477, 44480, 44481, 11713, 11714, 44489, 11721, 11722, 44499, 44500, 44507, 44508, 44510, 44518, 44525, 11761, 11762, 44531, 44532, 44534, 44536, 11769, 11770, 44540, 44537, 44544, 44546, 44550, 44555, 44557, 44559, 44560, 11795, 44567, 11801, 11804, 11799, 11806, 44578, 11810, 11812, 44581, 44582, 44583, 11816, 11817, 44586, 44585, 11820, 44588, 44584, 44591, 11815, 44593, 11818, 44598, 11831, 11832, 11833, 11830, 11836, 44599, 44600, 44604, 44624, 44626, 11860, 11862, 11863, 11864, 11865, 11868, 44641, 11875, 44645, 11879, 11881, 11884, 11886, 44655, 11890, 44661, 11894, 44662, 44664, 11896, 11898, 44671, 11921, 44690, 44691, 11924, 11922, 11923, 11928, 44698, 44703, 44704, 11937, 44706, 44707, 11938, 11939, 44711, 44714, 44716, 11946, 11954, 11955, 44724, 44723, 44726, 44727, 44728, 44722, 44732, 44736, 11969, 11970, 44738, 44743, 44746, 44748, 44751, 44755, 11988, 44757, 44756, 44764, 44767, 44770, 44771, 44774, 44787, 44788, 44790, 44791, 44792, 44796, 44816, 12055, 44823, 12060, 44834, 12068, 44838, 12071, 44839, 12073, 44842, 44844, 12076, 44845, 44849, 12087, 44855, 44860, 12092, 12112, 44882, 12116, 12119, 61025, 44890, 12121, 12124, 44896, 44897, 12132, 12134, 12135, 61028, 44905, 12136, 12140, 12141, 44925, 12157, 12178, 12179, 44947, 44946, 12186, 44954, 12193, 44962, 44963, 12195, 12194, 44966, 44967, 12201, 12202, 12203, 44971, 44970, 44972, 44978, 44979, 44980, 12210, 12211, 44983, 44984, 12218, 44988, 44986, 12225, 44995, 44999, 45002, 45004, 45021, 45023, 12274, 45044, 45047, 45048, 12282, 45052, 45053, 45055, 45107, 45139, 45149, 45155, 45165, 61091, 45229, 45245, 45261, 45309, 61110, 45320, 45321, 12560, 45330, 12563, 12564, 45333, 45334, 45336, 45337, 45340, 45342, 12580, 45348, 45352, 12584, 45356, 45358, 45370, 45398, 45400, 45401, 45408, 12640, 45410, 12643, 12644, 45413, 45424, 12660, 45428, 12664, 45432, 45434, 45439, 12688, 45468, 45469, 45470, 28576, 12704, 45472, 12716, 45484, 45486, 12718, 45504, 12736, 12743, 12748, 12750, 12752, 12754, 45526, 12762, 45532, 45533, 45534, 12766, 12764, 45535, 12784, 12796, 45565, 12798, 45568, 45574, 45581, 12816, 12825, 12826, 12829, 12831, 12838, 12840, 12841, 12845, 61172, 61176, 12882, 12885, 28613, 12892, 12894, 45664, 12896, 12897, 12898, 12900, 12901, 45669, 12904, 45673, 12906, 12905, 12908, 45677, 12910, 12909, 45680, 12913, 12911, 45679, 45685, 12918, 12916, 12920, 45689, 12921, 12925, 45693, 45695, 61187, 45718, 12950, 45720, 12953, 12956, 12957, 12960, 12969, 45739, 12973, 45742, 12992, 12993, 12994, 45764, 12996, 45766, 12999, 45768, 13001, 12998, 45771, 13005, 45774, 13007, 13009, 45778, 13010, 13012, 45781, 13014, 13015, 45784, 13017, 45782, 45786, 13020, 13021, 45791, 13041, 45810, 13042, 13044, 13047, 45818, 13050, 13053, 45824, 13055, 45830, 45837, 45851, 45852, 13085, 45854, 45865, 45866, 45867, 13101, 45904, 45913, 45917, 45920, 13161, 45929, 45931, 13165, 45933, 45936, 45937, 45945, 45946, 13177, 45947, 13181, 45949, 13200, 45973, 45974, 45979, 45983, 45984, 13216, 45987, 45996, 45998, 13248, 46016, 13250, 13252, 46022, 46023, 46017, 46025, 46026, 13261, 13263, 13264, 46033, 46034, 13266, 13268, 46037, 46038, 46039, 46041, 46042, 46043, 46044, 13277, 46046, 46047, 13279, 13298, 46066, 13300, 46069, 46074, 46076, 13309, 46078, 46079, 46080, 13311, 46086, 46088, 46089, 46090, 46093, 46095, 46096, 13328, 13330, 13331, 13332, 13333, 13340, 13342, 13344, 13346, 13347, 13348, 13349, 46118, 13351, 46117, 13355, 13356, 46125, 13358, 46127, 13360, 13362, 13363, 13364, 13365, 13371, 13372, 13374, 46160, 13392, 46162, 46165, 13403, 13405, 13407, 46176, 13408, 13410, 46178, 46180, 13406, 46185, 13419, 46189, 13421, 13422, 13424, 13426, 13423, 46196, 46197, 46198, 13431, 46201, 13435, 13436, 46205, 46207, 13456, 46228, 46230, 46233, 13465, 46235, 13469, 46238, 46240, 13481, 46250, 13483, 46251, 13485, 13486, 46254, 46256, 13488, 13499, 46273, 13505, 46275, 13511, 13513, 46282, 13516, 13517, 46286, 13519, 13520, 46281, 46292, 13521, 46294, 13527, 46291, 46297, 13529, 46299, 13532, 13533, 46302, 13534, 46301, 13535, 46303, 46300, 13552, 13553, 46323, 46324, 13559, 13563, 13564, 13565, 46333, 13567, 46336, 46334, 46332, 46335, 13566, 46342, 46349, 46353, 13586, 46356, 13589, 46358, 46359, 46360, 13593, 13596, 13598, 13600, 46367, 13602, 13603, 46369, 46375, 46376, 13609, 13610, 13612, 13614, 46383, 13616, 46381, 46386, 46387, 46388, 46389, 13618, 13628, 13630, 46416, 13648, 46419, 46420, 46424, 46425, 46429, 46433, 13664, 46435, 46436, 46439, 46440, 13673, 46442, 46441, 13677, 46445, 46447, 46449, 13683, 46452, 46451, 46454, 46455, 46456, 46457, 13689, 13690, 46453, 13693, 46461, 46463, 13712, 46482, 46484, 46491, 46494, 46495, 46496, 13728, 46498, 46500, 46507, 13739, 46509, 46510, 13742, 46511, 46514, 46515, 46523, 13758, 46526, 13760, 13762, 46530, 46532, 13773, 13776, 46546, 46548, 13786, 46557, 13789, 46559, 13791, 46562, 46563, 46571, 13808, 13810, 13812, 13818, 13819, 13821, 13822, 61373, 2759, 61380, 2769, 46865, 14098, 14099, 14100, 14101, 46871, 14105, 14106, 46875, 14108, 14110, 46879, 46881, 14115, 46877, 46887, 14121, 14123, 14124, 14126, 14131, 14140, 61430, 46928, 14163, 14164, 14171, 14174, 46945, 14178, 14179, 14182, 46951, 46961, 14189, 14196, 46965, 46966, 46967, 46968, 14201, 14198, 14203, 46969, 14205, 46973, 46994, 46996, 14233, 47005, 47008, 47010, 14237, 47012, 14249, 47019, 14253, 14256, 47026, 47027, 47035, 14273, 47042, 47044, 14276, 14279, 14281, 14285, 14289, 47058, 47059, 14292, 47060, 14290, 14295, 14297, 14301, 47069, 47074, 47075, 47082, 47083, 14320, 14321, 14322, 47091, 47092, 14327, 47360, 47366, 47373, 14611, 14613, 47387, 47388, 14621, 47390, 14627, 14629, 47402, 14637, 14638, 47401, 14643, 14645, 14654, 47440, 47449, 14683, 47453, 14686, 47456, 47465, 14697, 47467, 47469, 14701, 47472, 14702, 47473, 47481, 47482, 14713, 14717, 47485, 28978, 14736, 47518, 14752, 47520, 47523, 47532, 14766, 47534, 47547, 14779, 14782, 47550, 47552, 47553, 14784, 14786, 47558, 14788, 47559, 47561, 47562, 14797, 14798, 14799, 14800, 47569, 47570, 14804, 47575, 14802, 47577, 47578, 47580, 14813, 47582, 14815, 15971, 47602, 14834, 14836, 47605, 47610, 14843, 47612, 14845, 47614, 47615, 47616, 14847, 14846, 47622, 47629, 14864, 14873, 14874, 14877, 14879, 14886, 14888, 14889, 14893, 14895, 14896, 15987, 14909, 14911, 14928, 14930, 14933, 14940, 14942, 47712, 14944, 14945, 14946, 14948, 47717, 14949, 14952, 14953, 47721, 14954, 14956, 14957, 47725, 47727, 14959, 47728, 14961, 14964, 14966, 14958, 14968, 47737, 14969, 14973, 47741, 47760, 47766, 14998, 47768, 15001, 15004, 15005, 47776, 15008, 15017, 47787, 15021, 47790, 15024, 15040, 15041, 15042, 15044, 47812, 15046, 15047, 47816, 15049, 47814, 47819, 15053, 47822, 15055, 15057, 15058, 47826, 15060, 15062, 47830, 47832, 15065, 47834, 15063, 15069, 15068, 15088, 15089, 15090, 47858, 15092, 15095, 15098, 47866, 15101, 15103, 47880, 47881, 15120, 15123, 15124, 47890, 47894, 15125, 47896, 47897, 47893, 47900, 47902, 15139, 15140, 15141, 15144, 15147, 47916, 15150, 47918, 15155, 15156, 15157, 47930, 15163, 15166, 47958, 47960, 47961, 15195, 15198, 47968, 15200, 47970, 15203, 15204, 47973, 15211, 15214, 47984, 15220, 15224, 47994, 15248, 48028, 48029, 48030, 48032, 15264, 48043, 48044, 15275, 15278, 48046, 15276, 15291, 15294, 15296, 48064, 15303, 15308, 15310, 15312, 15314, 15322, 48092, 48093, 48094, 15324, 15326, 15344, 15356, 48125, 15358, 48145, 15378, 15381, 48151, 48157, 48159, 48161, 48167, 15401, 48225, 15458, 48231, 48237, 48239, 48241, 15476, 48247, 15481, 48253, 48274, 48276, 48673, 48285, 48290, 48292, 48303, 48306, 48307, 48315, 48322, 48324, 48338, 48340, 48349, 48354, 48355, 48362, 48363, 48384, 48390, 48397, 15632, 48400, 15648, 48418, 48421, 48428, 48431, 48434, 48437, 48444, 48466, 48469, 48473, 48476, 48477, 48480, 15712, 48482, 48485, 48489, 48493, 15728, 48496, 48500, 48501, 48505, 48509, 48511, 48532, 48534, 15769, 48537, 48539, 15773, 48547, 15785, 48554, 15789, 48559, 48563, 48564, 48572, 15809, 48577, 48579, 15815, 48585, 15817, 48586, 15821, 15823, 48591, 15825, 48595, 48596, 48598, 15831, 48601, 15833, 48603, 48604, 15837, 48606, 15839, 15857, 48627, 48628, 15863, 48636, 15871, 48640, 15869, 48646, 48746, 48653, 48657, 15897, 15898, 48669, 48671, 48674, 15907, 48677, 15910, 48679, 15913, 15914, 48680, 48685, 48754, 48687, 48690, 48691, 48755, 48722, 48723, 15956, 15955, 48724, 48728, 48729, 48725, 48733, 48737, 48738, 48739, 15972, 15977, 15979, 15981, 48753, 48756, 48757, 48758, 48759, 48760, 48761, 15993, 15995, 15994, 15997, 48765, 48767, 16016, 48786, 16025, 16029, 48799, 48802, 48803, 16041, 16045, 48818, 48819, 48820, 16065, 16066, 48834, 16071, 16073, 48835, 16077, 16080, 48850, 48852, 16081, 16087, 16089, 16090, 48851, 16093, 48861, 48863, 16095, 48866, 48867, 48875, 16112, 16113, 16114, 48883, 16116, 48884, 16119, 16122, 16125, 48902, 48904, 48905, 48906, 48911, 48912, 16144, 16160, 48934, 16167, 16172, 48941, 16221, 16223, 48992, 16224, 16226, 16235, 16237, 16239, 16240, 16242, 29280, 49014, 16247, 16251, 16252, 49021, 29283, 16272, 49091, 49098, 16332, 16336, 16348, 49117, 16350, 49119, 16380, 49149, 16382, 49151, 49187, 49190, 49192, 49193, 49195, 49196, 49203, 49206, 49208, 49209, 49211, 49212, 49233, 49234, 49235, 49236, 49238, 49240, 49241, 49243, 49244, 49249, 49250, 49251, 49252, 49254, 49256, 49257, 49259, 49260, 49315, 49317, 49320, 49321, 49323, 49324, 49331, 49333, 49336, 49337, 49339, 49340, 49347, 49349, 49356, 49357, 49359, 49395, 49397, 49400, 49401, 49403, 49404, 49405, 49407, 49424, 49425, 49431, 49436, 16669, 16671, 49440, 49441, 16675, 49447, 16682, 49463, 49468, 49495, 49500, 49502, 49504, 16736, 16742, 49511, 49516, 16749, 49518, 16751, 49520, 49521, 16755, 16758, 49527, 49532, 16765, 49534, 16786, 49556, 49557, 49563, 49564, 49565, 49567, 49566, 16795, 49572, 49574, 49576, 49579, 49581, 16813, 16815, 16818, 49588, 49589, 49592, 16827, 49595, 49598, 49599, 49600, 49602, 49603, 49610, 49611, 49612, 16845, 49613, 16847, 49616, 49618, 49619, 16850, 49614, 49626, 16859, 49627, 49629, 49631, 16866, 49639, 16875, 49644, 49646, 49648, 49655, 49664, 16896, 16903, 16908, 49676, 49678, 16912, 49680, 49687, 49690, 49692, 49694, 49696, 16934, 49706, 16940, 49710, 49719, 49724, 49745, 49746, 49748, 49751, 16987, 16988, 49757, 49759, 16992, 49760, 49762, 49761, 49756, 16998, 16997, 17000, 49767, 49770, 17003, 17002, 49773, 49774, 49776, 17007, 17010, 17006, 49778, 17004, 17014, 49783, 49777, 49780, 49786, 17019, 49788, 17020, 49790, 17023, 49791, 17018, 49789, 49808, 49812, 49813, 49814, 17046, 49816, 49819, 17052, 49823, 17056, 49824, 49828, 49835, 49840, 49844, 49845, 49851, 49855, 49856, 17088, 49858, 49859, 49866, 49867, 49870, 49872, 49874, 49875, 17110, 49882, 49883, 17116, 49886, 49888, 49895, 49900, 49904, 22945, 49911, 49914, 49918, 49920, 17152, 17159, 17164, 49932, 49934, 49937, 17170, 17173, 49943, 49948, 49953, 17188, 49959, 17193, 49975, 49980, 50007, 50012, 50023, 50033, 50039, 17273, 50044, 50064, 50068, 50069, 50070, 17302, 50072, 17307, 50076, 50075, 50077, 50078, 50079, 17315, 50085, 50086, 50084, 50088, 50091, 50093, 50095, 50096, 17330, 50100, 50101, 50102, 22984, 50104, 17339, 50108, 50107, 50110, 50111, 50112, 50114, 17347, 17348, 50115, 50122, 50123, 50124, 50125, 50126, 50127, 17359, 50128, 17357, 50131, 50130, 17366, 50138, 17371, 50139, 50141, 50142, 50143, 50144, 17378, 50151, 17387, 50156, 50158, 50160, 50167, 50170, 50172, 50174, 50176, 17411, 17418, 50188, 17421, 50190, 17423, 50192, 50199, 50202, 50204, 50206, 50208, 50218, 50222, 50223, 50224, 50231, 50234, 50236, 50239, 17488, 50256, 50258, 50260, 50263, 50268, 50269, 50270, 50271, 50272, 17504, 50274, 50276, 17510, 50282, 50284, 50285, 50286, 50288, 17517, 50290, 17526, 50295, 50298, 50300, 50301, 50302, 50303, 17533, 50320, 50322, 50324, 50325, 50331, 50332, 50334, 50335, 50336, 50338, 50344, 50346, 50350, 50352, 50354, 50356, 50357, 17591, 50362, 50363, 17596, 50364, 50366, 50367, 50368, 50370, 50371, 50378, 50379, 50381, 50384, 29553, 50386, 50387, 50394, 50395, 50397, 50399, 50400, 50407, 17639, 50412, 17644, 50416, 50423, 50426, 50428, 50431, 50432, 17674, 50444, 17677, 50446, 17679, 50448, 17683, 17684, 50455, 17692, 50462, 50463, 50464, 17697, 17694, 17700, 17704, 17705, 50476, 50478, 50479, 50480, 50487, 50490, 50492, 50495, 50512, 50519, 17755, 50524, 17758, 17760, 17763, 17764, 17765, 17766, 17768, 17771, 17772, 50542, 17775, 50544, 17777, 17774, 17780, 17781, 17782, 50551, 17784, 17785, 50556, 50558, 17791, 50576, 17810, 17812, 50581, 50580, 17816, 50587, 50591, 17826, 50597, 17829, 50600, 17836, 17838, 50607, 50608, 50612, 50613, 17847, 50619, 17852, 50623, 50624, 17858, 50626, 50627, 17861, 50634, 50635, 17868, 50637, 50638, 50639, 50640, 17874, 50642, 17876, 50643, 17880, 17882, 50651, 50650, 50653, 50654, 50655, 50656, 50663, 50668, 17900, 50672, 50679, 50682, 50684, 50686, 50960, 50967, 50973, 18204, 50974, 50976, 18206, 18217, 50989, 50990, 50991, 50992, 50999, 51004, 51024, 51025, 51031, 18267, 51036, 51037, 18270, 51039, 51040, 51041, 51042, 51044, 18276, 51047, 51050, 18283, 18284, 51053, 51056, 18289, 51058, 51054, 51060, 51057, 18292, 51063, 18297, 51066, 51068, 51069, 51070, 51071, 51088, 18321, 51090, 51092, 51093, 18329, 51099, 51100, 51101, 51102, 51103, 51104, 51106, 51114, 51117, 51118, 18348, 18350, 51122, 51124, 51125, 51130, 51131, 51132, 51134, 51135, 51136, 51138, 51139, 18374, 51146, 18380, 51149, 18382, 51150, 51152, 18385, 51154, 51155, 18393, 51162, 51165, 51166, 51167, 51168, 51175, 51180, 51184, 18416, 59346, 51191, 51194, 51196, 51198, 51199, 3683, 62321, 51456, 18688, 18695, 51468, 18700, 51470, 51472, 51473, 18706, 18709, 51478, 51479, 51482, 51484, 51487, 51489, 18724, 51495, 18729, 51503, 51510, 51516, 51519, 51548, 51559, 25495, 51564, 51569, 51575, 18809, 51600, 51601, 51602, 51603, 51604, 18838, 51610, 18843, 51612, 51614, 51617, 51618, 51619, 51620, 18851, 51622, 51615, 51627, 51628, 51631, 51633, 51634, 18866, 51635, 51636, 51638, 51640, 18875, 51644, 51647, 18883, 18884, 51654, 51660, 51663, 51664, 18893, 18895, 18902, 51674, 18907, 51677, 51678, 51679, 51680, 18914, 18923, 51692, 51694, 51702, 51708, 51711, 51712, 18944, 18951, 51724, 18956, 51726, 51728, 18960, 18982, 51754, 18988, 51758, 51793, 51794, 51796, 51799, 19035, 19036, 51805, 51807, 19040, 51809, 19042, 51810, 19044, 19045, 51815, 19048, 51818, 19050, 19051, 51821, 51822, 51824, 19055, 19054, 19052, 19060, 51828, 19062, 19061, 19064, 51825, 19066, 19068, 51837, 51839, 51831, 19071, 19067, 51856, 3794, 51862, 19094, 19100, 51871, 19104, 51885, 51903, 19136, 51914, 51918, 51920, 19158, 51930, 19164, 51934, 51936, 51962, 51966, 51984, 51985, 51990, 51991, 51994, 51996, 19229, 52001, 19231, 19235, 52007, 19242, 52015, 52028, 52031, 52054, 52060, 19296, 19302, 52071, 52070, 52076, 19309, 19311, 52080, 52081, 19315, 19318, 52087, 19325, 52094, 52113, 52114, 52115, 52116, 19346, 52122, 19355, 52124, 52126, 52129, 52130, 52131, 52132, 52127, 52134, 52139, 52140, 19373, 19378, 52147, 52148, 52145, 52146, 52152, 19387, 52159, 52172, 19405, 19407, 19410, 52176, 19419, 52189, 52191, 19426, 19435, 52204, 52206, 52223, 52243, 19476, 19475, 19484, 52253, 19486, 52255, 19496, 19497, 52269, 52271, 52274, 52275, 52282, 52283, 52305, 52306, 52307, 52308, 52312, 52313, 52314, 52315, 52321, 52322, 19555, 19556, 52324, 52330, 19564, 52333, 52335, 19569, 52338, 52339, 19572, 52340, 19576, 19577, 52346, 52347, 52349, 52351, 19601, 19602, 19604, 19608, 19609, 52381, 52383, 52385, 52386, 19618, 52388, 19621, 52394, 52395, 19628, 52397, 19630, 52399, 52401, 52402, 36467, 52404, 52406, 52408, 52409, 52410, 52411, 52417, 52418, 52420, 52426, 52427, 19660, 52429, 19662, 52431, 19665, 19666, 19668, 19672, 19673, 52445, 52447, 52465, 52466, 52474, 52480, 19715, 19722, 52492, 19725, 52494, 19727, 52498, 52499, 52502, 52506, 52507, 52508, 52510, 52514, 52516, 52518, 52521, 52522, 52524, 52526, 52529, 52530, 52531, 52532, 52534, 52536, 52537, 52538, 52539, 52540, 52562, 52563, 52564, 52566, 52569, 52570, 52571, 52572, 52573, 52575, 52577, 52578, 52580, 52582, 52584, 52585, 52586, 52588, 52589, 52590, 52591, 52594, 52595, 52596, 52602, 52603, 52605, 52606, 52607, 52624, 19856, 52626, 52625, 52628, 52630, 52632, 52633, 52634, 52635, 52640, 52641, 52642, 52644, 52646, 52648, 52649, 52650, 52651, 52652, 52656, 52657, 52658, 52660, 52662, 19895, 52664, 52665, 52666, 52667, 52668, 19900, 52672, 52673, 62573, 52678, 52681, 52683, 52684, 52688, 52704, 19943, 19948, 52722, 52724, 52726, 52728, 52730, 52732, 16994, 52736, 16996, 19978, 52748, 19981, 52750, 19983, 52752, 52763, 52765, 52766, 52768, 52772, 52774, 52780, 52782, 52787, 52788, 52794, 52796, 52797, 52798, 52799, 52817, 52818, 52820, 52822, 52823, 17012, 52825, 52826, 20059, 52827, 52829, 20062, 52831, 52832, 52833, 20064, 52828, 20068, 52839, 52842, 52845, 52846, 52848, 36554, 52851, 20084, 20085, 52849, 52855, 52858, 52860, 52861, 52862, 52863, 52880, 52882, 52881, 52884, 52886, 52888, 52889, 52890, 52891, 52893, 52896, 52897, 52898, 52899, 30052, 52906, 52909, 52912, 52913, 52914, 52915, 52916, 52918, 20151, 52920, 52921, 52922, 52923, 52924, 20156, 52925, 30058, 52928, 52929, 52931, 30059, 52938, 20172, 52942, 52944, 52954, 52958, 52960, 30065, 20204, 20208, 52976, 52978, 52979, 52986, 52988, 52990, 53008, 53010, 53019, 53021, 53024, 53025, 53026, 53028, 53032, 53033, 53034, 53036, 53038, 53041, 53042, 53043, 53049, 53050, 53052, 53053, 53054, 53055, 53073, 53074, 53076, 53082, 53083, 53084, 53085, 53086, 53087, 20320, 53088, 53089, 53090, 53092, 20326, 53096, 53097, 53098, 53100, 20333, 53102, 53104, 53107, 53114, 53116, 20349, 53117, 53119, 53118, 53149, 53153, 53154, 53155, 53156, 53160, 53161, 53162, 53163, 53165, 53169, 53170, 53171, 53172, 53176, 53178, 53179, 53181, 53184, 53185, 53186, 53187, 53188, 53194, 53195, 53200, 53232, 53233, 53234, 53235, 53236, 53238, 53240, 53241, 53242, 53243, 53289, 53290, 53305, 53306, 53329, 53337, 53345, 53353, 30150, 20627, 20629, 53409, 53410, 53413, 53417, 53418, 53425, 53426, 20659, 53429, 20661, 53433, 53434, 53445, 20677, 53455, 20707, 20709, 53493, 53501, 53503, 20737, 20738, 53506, 53508, 53507, 53510, 20743, 53512, 20746, 53515, 53509, 20750, 53520, 20753, 20754, 53521, 20756, 53524, 20758, 53527, 53528, 20760, 20762, 53531, 20763, 20761, 20766, 53526, 53536, 20769, 20770, 53537, 20772, 20774, 53543, 20776, 20777, 20778, 20779, 20785, 20786, 20788, 20790, 53559, 20792, 20793, 20794, 20795, 53563, 20798, 20820, 53588, 20822, 53591, 53590, 53592, 53595, 53596, 20827, 53598, 20830, 53600, 53601, 20836, 20838, 53607, 20840, 20843, 53612, 53614, 53616, 53617, 20850, 20852, 53623, 20858, 53627, 53628, 53630, 20862, 20881, 20887, 53661, 53663, 20897, 20901, 20903, 53677, 20911, 53679, 20917, 20927, 53696, 20929, 53698, 53699, 20933, 53703, 20935, 53706, 53707, 53708, 20943, 53715, 53714, 20951, 53722, 53723, 53725, 53727, 53735, 53740, 53744, 20981, 53751, 20991, 21009, 21010, 21012, 53783, 21016, 21017, 53786, 21018, 53788, 53787, 53790, 21025, 21026, 21028, 21029, 21032, 21033, 21034, 53806, 21039, 21041, 21042, 21044, 21045, 53815, 21048, 21049, 21050, 53820, 21055, 53841, 21074, 53842, 21076, 53844, 21077, 53847, 53852, 53853, 21087, 53855, 53857, 21090, 53858, 53860, 21092, 21093, 53863, 53866, 53867, 53869, 53870, 21103, 53871, 53873, 21106, 53874, 53876, 21108, 53878, 53879, 53880, 53884, 53885, 53886, 21146, 21150, 53920, 21156, 62821, 21158, 21160, 21162, 21163, 21166, 21172, 21174, 21176, 21179, 53952, 53954, 53955, 21188, 53956, 21190, 53960, 21192, 21194, 53962, 53963, 21195, 21198, 53966, 53970, 53971, 53972, 21210, 53978, 53979, 21214, 53982, 53983, 53991, 53996, 54003, 21236, 54004, 21238, 54007, 21240, 21242, 54010, 21243, 21246, 54014, 54015, 54032, 21265, 21266, 54033, 21268, 21270, 54039, 21272, 21273, 21274, 21275, 21278, 21281, 21282, 54049, 21284, 54050, 21286, 54055, 21288, 21289, 21290, 21291, 54058, 21294, 54054, 21297, 21298, 21300, 21302, 54071, 21304, 21305, 21306, 21307, 54099, 54100, 21335, 54103, 54108, 54110, 54112, 54113, 54116, 54118, 21351, 54119, 54121, 54123, 54124, 21358, 54126, 54129, 21362, 54130, 21361, 21364, 54134, 54135, 21367, 54137, 21370, 54139, 54138, 54140, 21374, 21393, 54164, 54166, 21399, 54169, 54171, 54173, 54175, 21409, 54178, 21413, 54181, 21415, 54186, 54187, 54189, 21423, 54191, 21429, 21439, 54208, 21441, 54210, 54211, 54212, 54213, 21445, 21447, 54217, 21450, 54219, 54218, 21454, 54222, 54224, 54227, 54228, 54226, 54230, 21463, 54229, 54233, 54234, 54235, 54237, 21470, 54239, 54238, 54247, 54252, 54256, 54258, 54261, 21493, 54263, 54266, 54268, 21502, 54270, 21503, 21505, 21506, 54274, 54276, 54275, 21508, 21511, 54280, 54281, 21514, 54277, 21518, 54288, 21521, 21522, 21524, 54292, 21526, 54295, 54296, 21529, 54298, 21530, 54299, 54300, 21534, 21535, 54304, 21537, 21538, 54303, 21540, 21541, 21542, 54302, 21544, 21545, 21546, 21547, 54314, 54315, 54318, 21551, 54319, 21554, 21553, 21556, 21557, 21558, 54327, 21560, 21561, 54330, 21562, 54332, 54331, 54334, 21566, 21567, 54335, 54352, 21586, 54354, 21588, 54356, 54358, 54359, 54360, 21589, 21594, 21595, 54364, 54365, 54366, 21599, 54367, 21602, 54370, 21604, 54372, 21598, 21606, 21608, 21605, 54378, 54379, 54380, 54381, 54382, 21615, 54384, 54383, 21610, 21618, 54388, 21620, 54386, 54391, 54394, 54395, 54396, 54397, 54398, 21626, 21630, 54399, 54416, 54418, 21651, 21652, 21650, 54421, 54423, 21653, 21658, 54428, 54430, 21662, 54432, 54434, 21667, 21668, 21669, 21666, 54437, 21674, 21675, 54442, 54446, 21679, 54447, 21678, 54450, 21683, 21682, 21685, 21686, 21684, 21688, 54453, 21690, 54460, 21695, 54464, 54463, 54466, 54467, 21700, 21701, 21706, 54475, 21710, 54479, 54480, 21711, 54482, 54483, 54484, 54487, 21722, 54490, 54492, 54491, 21726, 54495, 54503, 54508, 54512, 54515, 54516, 21749, 21750, 54519, 21752, 21754, 54522, 54524, 21758, 54527, 21759, 54544, 21777, 21780, 21783, 54551, 21785, 54556, 54558, 54559, 21790, 21796, 21797, 21793, 21800, 21801, 54572, 54574, 21807, 21809, 21813, 21806, 21815, 54583, 54586, 54588, 21823, 21841, 21842, 21844, 21845, 21847, 54615, 54620, 21855, 21857, 21863, 21866, 54636, 21870, 54638, 21873, 21874, 54647, 21879, 21882, 54652, 21886, 54654, 54675, 21907, 21908, 54678, 54680, 54682, 21923, 21924, 21930, 21931, 54699, 54701, 54702, 54703, 21939, 21940, 21942, 21944, 21946, 21951, 54722, 54723, 54724, 21956, 54728, 54730, 54731, 21962, 54733, 21966, 54735, 54738, 54739, 21963, 54742, 54741, 54746, 54747, 21978, 21982, 54750, 54764, 54770, 54773, 22006, 54775, 22008, 22010, 54778, 54780, 22014, 54782, 22015, 55068, 55070, 22305, 22308, 22310, 22312, 22313, 55086, 22319, 22321, 22324, 22326, 55095, 22328, 22329, 55100, 22335, 55121, 55122, 22356, 55125, 55127, 22362, 22363, 55132, 22367, 55137, 55138, 55140, 55141, 55143, 55144, 55146, 22378, 55150, 55153, 55154, 55156, 55159, 55160, 55162, 55164, 55166, 22418, 55186, 55188, 22421, 55189, 55190, 55192, 55196, 55198, 22434, 55202, 55204, 55205, 55203, 55215, 22450, 55218, 55221, 22453, 55226, 55228, 55230, 22463, 55231, 55234, 55243, 55247, 55250, 55251, 55258, 55262, 55271, 55276, 22517, 55287, 55290, 55292, 55294, 22527, 55295, 55568, 55569, 22802, 22804, 55574, 55575, 22808, 55578, 22810, 55583, 22814, 55585, 55586, 22818, 22820, 55591, 22824, 22822, 22825, 22827, 22826, 55599, 22830, 22836, 55606, 22838, 22841, 22843, 55615, 55635, 55636, 55638, 22871, 55644, 55648, 55649, 55651, 55654, 55655, 22887, 55657, 55659, 55660, 55652, 22894, 55665, 22898, 55666, 22900, 22897, 55671, 55673, 55674, 22906, 55675, 22910, 55697, 55698, 55699, 55700, 22929, 55706, 55707, 55709, 55711, 55713, 55714, 55715, 55716, 55717, 55718, 22950, 22952, 55721, 55723, 55725, 55727, 22951, 55729, 55730, 55731, 55732, 22964, 55734, 55737, 22971, 55743, 55744, 22977, 55746, 55748, 55749, 22982, 22983, 55750, 55753, 22986, 55755, 22990, 55760, 55762, 55764, 55765, 55771, 55770, 55773, 55774, 55775, 23006, 55792, 55794, 55797, 55798, 55804, 23038, 55807, 55824, 23058, 23059, 23066, 23067, 55835, 55840, 23074, 23075, 23078, 23082, 23083, 23085, 55854, 55856, 23090, 23091, 23094, 23098, 23099, 23101, 55889, 55890, 23122, 55892, 23124, 23126, 55895, 23133, 55901, 55903, 55905, 55906, 23138, 23140, 55908, 23142, 55911, 55914, 55915, 23149, 55918, 55919, 55917, 55921, 55922, 23154, 23156, 55924, 55927, 55928, 55933, 24146, 23194, 55965, 23198, 55967, 55968, 23199, 24150, 23206, 23210, 55981, 23213, 55983, 55984, 23214, 23222, 23226, 23229, 55997, 55999, 56000, 23231, 23234, 23235, 56004, 23236, 23237, 56008, 23238, 23242, 56010, 23245, 23246, 23247, 56014, 56019, 56020, 56026, 23258, 23262, 23263, 56030, 56031, 24164, 23274, 23279, 56048, 23282, 23283, 23284, 23285, 56051, 23286, 56052, 24166, 56058, 23290, 23293, 23294, 56062, 56063, 23297, 56066, 56067, 56069, 23298, 23303, 56072, 56068, 56070, 56075, 23306, 23310, 56080, 56081, 23314, 56084, 23316, 56086, 56087, 56088, 23320, 23322, 56091, 23326, 56096, 56097, 23330, 23332, 23334, 56103, 23336, 23337, 23339, 56111, 23348, 56118, 23350, 23353, 23354, 56123, 23355, 23358, 56127, 56148, 56150, 23382, 23384, 56152, 56155, 56156, 23390, 56160, 56161, 23396, 56166, 56167, 23403, 56172, 56176, 56177, 23410, 23412, 56183, 23418, 56187, 56190, 23422, 23441, 56209, 56211, 56212, 56210, 56218, 56221, 56223, 56225, 56226, 56227, 56228, 23457, 56230, 23462, 23464, 56233, 23463, 56237, 56239, 56241, 56242, 56243, 23476, 56244, 56249, 23483, 56255, 56256, 23489, 23495, 56263, 23496, 23494, 56268, 56285, 56287, 56304, 23540, 23547, 56319, 56339, 56347, 24228, 56370, 56371, 56378, 56379, 56402, 56403, 56410, 56411, 56418, 56420, 56434, 56435, 56436, 56442, 56443, 56468, 56472, 56483, 56484, 4715, 24260, 56594, 56595, 23828, 23830, 23832, 23833, 56602, 23835, 56604, 56603, 56606, 23844, 56612, 56614, 23846, 23848, 23849, 56618, 23851, 56620, 56619, 56622, 56626, 56627, 23860, 56630, 23862, 23864, 23865, 56634, 23867, 56636, 56635, 56658, 23890, 23892, 56660, 23894, 56662, 56659, 23896, 56666, 56667, 56668, 56669, 23899, 56671, 56674, 23906, 23908, 56676, 23910, 23912, 56682, 56683, 56684, 56685, 56686, 56687, 23915, 56690, 56691, 23924, 56692, 23922, 56698, 56699, 56701, 56702, 56703, 56720, 56721, 56722, 56729, 56730, 23962, 23966, 56736, 56737, 56738, 23972, 23974, 23976, 56745, 23979, 23978, 23982, 56753, 56754, 23988, 56758, 23990, 23992, 56761, 56762, 23995, 56764, 56768, 24004, 24006, 24310, 56777, 24010, 56779, 24008, 24014, 24011, 56784, 56787, 56788, 24026, 56794, 24030, 56799, 56816, 56819, 24052, 56820, 24054, 56822, 24056, 56826, 24058, 56828, 24059, 24062, 56831, 24081, 24084, 24086, 24088, 24089, 56860, 56859, 24087, 24094, 56862, 24100, 24102, 56870, 24104, 24105, 24109, 56878, 56876, 24110, 24113, 56883, 56890, 56892, 24125, 56894, 24121, 24145, 56914, 56913, 24148, 56917, 24147, 56919, 24151, 24152, 56918, 56923, 56924, 24157, 56926, 24155, 24161, 56929, 24163, 56932, 56933, 56935, 56936, 56938, 24171, 56940, 24173, 56942, 24174, 24168, 24170, 24177, 56947, 24178, 56948, 56951, 56952, 24183, 56954, 24186, 56956, 24190, 56958, 56977, 56978, 56979, 56982, 56984, 56985, 56986, 56993, 24226, 56995, 56996, 24230, 24232, 57001, 24235, 57003, 24237, 57005, 57009, 24242, 57011, 57012, 24245, 57014, 24246, 24248, 57010, 24244, 24251, 57020, 24253, 57017, 24258, 57027, 57028, 24262, 24264, 24266, 24269, 57037, 24270, 57043, 24267, 57045, 57046, 57042, 57050, 24282, 57054, 24286, 56930, 57074, 24306, 57076, 57077, 57078, 24309, 24312, 24308, 57082, 24315, 57084, 24317, 57086, 24318, 24314, 24321, 57090, 24322, 24324, 57093, 57092, 24327, 57096, 57097, 57091, 24330, 24334, 57104, 57106, 24338, 57108, 24339, 57110, 57112, 24346, 57115, 24347, 24350, 57120, 24354, 24355, 24356, 24358, 56945, 24362, 24363, 57132, 24365, 57134, 24370, 24371, 57139, 24372, 24374, 24378, 57147, 57148, 24381, 57150, 24382, 24379, 57146, 57170, 24403, 24404, 57172, 24406, 57174, 57176, 24410, 57179, 57180, 57181, 57182, 57183, 24414, 57186, 24419, 24420, 24413, 24422, 57195, 57196, 24429, 57198, 57199, 57200, 57197, 57202, 57203, 57210, 57211, 24442, 57212, 57214, 24446, 57239, 57244, 57248, 24482, 57251, 57252, 24485, 24486, 24493, 24498, 57267, 57268, 24501, 24502, 24509, 57280, 24514, 57283, 57284, 24517, 24518, 24525, 57296, 57303, 57308, 57328, 24562, 57331, 57332, 24565, 24566, 24573, 56994, 57382, 57384, 57387, 24621, 24623, 24637, 24639, 24660, 57430, 24659, 24669, 24671, 24676, 24675, 24685, 24687, 24722, 24723, 24724, 24725, 24726, 24728, 24729, 24731, 57513, 57515, 57523, 24756, 24757, 24755, 57528, 57529, 24763, 24760, 24761, 24758, 57545, 24773, 24806, 24808, 24809, 24811, 57035, 24833, 24834, 24839, 24836, 24842, 24846, 57614, 57616, 24850, 57620, 24852, 57622, 24854, 24856, 24857, 57625, 57624, 57627, 24861, 24862, 24858, 24863, 24866, 24868, 57638, 24872, 24873, 24877, 24879, 57650, 57651, 57653, 24886, 24888, 24889, 57684, 57686, 57688, 24920, 24921, 57691, 24926, 24922, 57696, 24930, 24932, 24934, 24936, 24937, 24941, 24942, 24943, 24946, 57714, 24948, 57715, 57717, 24956, 24959, 24957, 24976, 24977, 24978, 24980, 57748, 57750, 57749, 24984, 57752, 57755, 24983, 24989, 24992, 24991, 24993, 24994, 57764, 24996, 57766, 25000, 25001, 57768, 57771, 25010, 25011, 57780, 25012, 57782, 57781, 25016, 25017, 25019, 57787, 57784, 57075, 25024, 25025, 25026, 25028, 57803, 25037, 25039, 25040, 25041, 25042, 25044, 25047, 57821, 57823, 25058, 25059, 25067, 25072, 57853, 57855, 25088, 25090, 25095, 25099, 25100, 25101, 25103, 25104, 57872, 25110, 25112, 25113, 57886, 57892, 57893, 57894, 25128, 25129, 57896, 57899, 57903, 25142, 25144, 25145, 25170, 25172, 57947, 57950, 57952, 25184, 25186, 25188, 57958, 57960, 25194, 57966, 25198, 25202, 25204, 57973, 25206, 57974, 57976, 57972, 57979, 25212, 57983, 25232, 25236, 58005, 25238, 58004, 25240, 58008, 25243, 58011, 58006, 25246, 58015, 25248, 25244, 58020, 25252, 25254, 25256, 25257, 25258, 25259, 58027, 58030, 25262, 58036, 58037, 58038, 25272, 25275, 58043, 58040, 58047, 25280, 58050, 58052, 25286, 25288, 25290, 58058, 58059, 25294, 58062, 25296, 25289, 58067, 58068, 58070, 25302, 58072, 25308, 58076, 25310, 58078, 25319, 25324, 25328, 58099, 58100, 25336, 58108, 58110, 25344, 25346, 25351, 25355, 25356, 25357, 25359, 25360, 25362, 25364, 25366, 25368, 25369, 25370, 25373, 25374, 25375, 25376, 25378, 25380, 25382, 25384, 25385, 25386, 25389, 25390, 25391, 25398, 25400, 25401, 25425, 25430, 25431, 25432, 25433, 25437, 58206, 25439, 25440, 25441, 25442, 25444, 25446, 25447, 25448, 25449, 25450, 25453, 25454, 25455, 25456, 25457, 25458, 25460, 25463, 25466, 58235, 25469, 25470, 25471, 25488, 25489, 25490, 58260, 58261, 25492, 58262, 58264, 25496, 25497, 58267, 25498, 25501, 25502, 25503, 25505, 25506, 25508, 58277, 58278, 58280, 25513, 25512, 58283, 25514, 25511, 25518, 58287, 25522, 25523, 25524, 58293, 58292, 25527, 25528, 25529, 25530, 25531, 25532, 58299, 58296, 25536, 25537, 25538, 25540, 25543, 58313, 25546, 58315, 25549, 25550, 25551, 25553, 25554, 58322, 58324, 58325, 25556, 25559, 25562, 58331, 25566, 25570, 25571, 25575, 25578, 25579, 25580, 58354, 58357, 25594, 25598, 25600, 25601, 25602, 25603, 58372, 58370, 58371, 25607, 58376, 58374, 25610, 58379, 25612, 25613, 25614, 25615, 25616, 58382, 58377, 58388, 25622, 58390, 25624, 58392, 58395, 25631, 25632, 58398, 58404, 25638, 25640, 25641, 25642, 58411, 25647, 25648, 25657, 25658, 58430, 25663, 25662, 25682, 25684, 58452, 25686, 58454, 58456, 25688, 58459, 25692, 58462, 25695, 25698, 25700, 58468, 25705, 25706, 58475, 58478, 25710, 25711, 25714, 25716, 25722, 25724, 25726, 58494, 25744, 25746, 25747, 25748, 58517, 58516, 25749, 25752, 58518, 25754, 58523, 25756, 58525, 25758, 58527, 25760, 25762, 25763, 25764, 58534, 25766, 25768, 58536, 25770, 25771, 25769, 25774, 25776, 25775, 25778, 25779, 25780, 58548, 25783, 25785, 58549, 25788, 58555, 25790, 58559, 25792, 58563, 58566, 25802, 58571, 58570, 25806, 25807, 25808, 58579, 58580, 58582, 25818, 58589, 25822, 58591, 25831, 25836, 25840, 58611, 58612, 25846, 25849, 25850, 58621, 25854, 58623, 25856, 25855, 25863, 25866, 25868, 25869, 25871, 25872, 58642, 25876, 58645, 25878, 25879, 25880, 25887, 25888, 25886, 58660, 25894, 58662, 58664, 25896, 25902, 25903, 25905, 25908, 25910, 25911, 25913, 25919, 25937, 25938, 25940, 25943, 25946, 25949, 25951, 25952, 25953, 58722, 58725, 25959, 58728, 25962, 58731, 25965, 58734, 25967, 25968, 25966, 25969, 25970, 25972, 58740, 25975, 25978, 25981, 25982, 25983, 26000, 26003, 26004, 58773, 58774, 58772, 58776, 26008, 26010, 58779, 26012, 26014, 58783, 26016, 26019, 26020, 58789, 26022, 58788, 58792, 26024, 58795, 26028, 26027, 26030, 26031, 26032, 58799, 26026, 26035, 26036, 58805, 26038, 26039, 26040, 26041, 26042, 58811, 26044, 58804, 26046, 26047, 26048, 58817, 58819, 58820, 58815, 26054, 58824, 26058, 58827, 26060, 26056, 26062, 58830, 26063, 58834, 58836, 58837, 58838, 58840, 26076, 58844, 26078, 58847, 58846, 26092, 26096, 58866, 58869, 26102, 26105, 58876, 58878, 26110, 26111, 24754, 63841, 26384, 59154, 26390, 26398, 26399, 26400, 59172, 59177, 26412, 55756, 26416, 26425, 26431, 26450, 26452, 26454, 26456, 26458, 26460, 26462, 37824, 26464, 26465, 26466, 59234, 26468, 26463, 26473, 26479, 26481, 26482, 59252, 26484, 26486, 26489, 59257, 26492, 26513, 26514, 26516, 26517, 59284, 59285, 26520, 26518, 26524, 59286, 26526, 59295, 26528, 26529, 26530, 59299, 26532, 26533, 26537, 59310, 26546, 59316, 26549, 26548, 59317, 26552, 59323, 59327, 26560, 26561, 59331, 31331, 59342, 26576, 26577, 31334, 59348, 59349, 26582, 26583, 59350, 26585, 26588, 26590, 26608, 59378, 59381, 26622, 5293, 31346, 11814, 26880, 26882, 26887, 26891, 26892, 26893, 26895, 26896, 26898, 26900, 26906, 26909, 26910, 26911, 26914, 26916, 26922, 26925, 26926, 26927, 26938, 26943, 26961, 26967, 26970, 26973, 59742, 26975, 26977, 26978, 26980, 26983, 26986, 26989, 26990, 26991, 26992, 26993, 26994, 26996, 27002, 59771, 27005, 27006, 27007, 27024, 27025, 27026, 27028, 27029, 59798, 59800, 59796, 27034, 59803, 27037, 27038, 27039, 27041, 27042, 27045, 27044, 27047, 27050, 59819, 27054, 27058, 27059, 27061, 59830, 27063, 59832, 27066, 27067, 27068, 27073, 27074, 27076, 27079, 27082, 59851, 27085, 27086, 27087, 27089, 27090, 59858, 27092, 59860, 59861, 27098, 59867, 27102, 27106, 27107, 27111, 27114, 27115, 27116, 59890, 59893, 27130, 27134, 27136, 27138, 27143, 27147, 27148, 27149, 27151, 27152, 59920, 59934, 59940, 59941, 59942, 59944, 59947, 59951, 27218, 27220, 5411, 59995, 59998, 27234, 27236, 60006, 60008, 5414, 27242, 27246, 60014, 27250, 11929, 60020, 60021, 27254, 60022, 60024, 27252, 60027, 60031, 37986, 27280, 60054, 27288, 27289, 60056, 27293, 27294, 27306, 60075, 60077, 27309, 27311, 27310, 60078, 60086, 27320, 11944, 27327, 27325, 60098, 27331, 27332, 27333, 27334, 27336, 27337, 27338, 60107, 60100, 27342, 27343, 27344, 60110, 60106, 27339, 60116, 60115, 27352, 27353, 60120, 27358, 60126, 60124, 27366, 27367, 27368, 27369, 27370, 27372, 27375, 27378, 27379, 60147, 27380, 60148, 27384, 27387, 60156, 27381, 11956, 60158, 27393, 27394, 27396, 27399, 27402, 60174, 27406, 60176, 11960, 27410, 11961, 27412, 60180, 60182, 60184, 60185, 27418, 60187, 27421, 27422, 27423, 27426, 27428, 60198, 27434, 27437, 27439, 60210, 60211, 60213, 27455, 60244, 60246, 60248, 27482, 60251, 27486, 27487, 27490, 27492, 27498, 27501, 27502, 27503, 27506, 60274, 27508, 60277, 60275, 27517, 27519, 27536, 27537, 27538, 27540, 27541, 60310, 60312, 27549, 27551, 27553, 27554, 60324, 27557, 27556, 60331, 27570, 27571, 27573, 60342, 60344, 27579, 27585, 27586, 27588, 60363, 27597, 27599, 27600, 27601, 27602, 64102, 27604, 60381, 60383, 27618, 27619, 27627, 38056, 60415, 60434, 60437, 27676, 27678, 60449, 60450, 60452, 60457, 60458, 60456, 60465, 60466, 60468, 27704, 60474, 60472, 60497, 60498, 60500, 27732, 27734, 27736, 60505, 60506, 27739, 60504, 60513, 60514, 60516, 60517, 27750, 27748, 27752, 60522, 27755, 27756, 27758, 27761, 27762, 60532, 60536, 27769, 27770, 27793, 27794, 60564, 27799, 60568, 27801, 27802, 60577, 60578, 60579, 27812, 60580, 27815, 27816, 27817, 60586, 60587, 27822, 27820, 60593, 60594, 27828, 60596, 60598, 27832, 27833, 60602, 60600, 60603, 27841, 60609, 60611, 60612, 27847, 27848, 60618, 27849, 27852, 60619, 27854, 27857, 60628, 27863, 60632, 27865, 60657, 60658, 60660, 27892, 60662, 27896, 60666, 27897, 60664, 60667, 27904, 27907, 27911, 27914, 27916, 27917, 27919, 60699, 60702, 60706, 27940, 60708, 27942, 27944, 60713, 60714, 60715, 27947, 60721, 27956, 60724, 27958, 60728, 60729, 27960, 27963, 27986, 60754, 27988, 60756, 27990, 27992, 60761, 60762, 27995, 60763, 60766, 60769, 28002, 28004, 60772, 60776, 60777, 60779, 28011, 60782, 28018, 60788, 28020, 60795, 28048, 60820, 60822, 60824, 28058, 60827, 28062, 60833, 60836, 28068, 60840, 60841, 60843, 28078, 60850, 60852, 28084, 60854, 28087, 60856, 28089, 60858, 28088, 28092, 60859, 28096, 60865, 28100, 60875, 60873, 28110, 28112, 60883, 60884, 28122, 28126, 28135, 28140, 28144, 60914, 60915, 60916, 28148, 60920, 28153, 28152, 60922, 28158, 28160, 28167, 28170, 28172, 28173, 28175, 28176, 60946, 28180, 28190, 28192, 28196, 28197, 60964, 60966, 28200, 60962, 60970, 60969, 28204, 28198, 28206, 60968, 28209, 60980, 28213, 28212, 60977, 38177, 28241, 28242, 61010, 28244, 61012, 28245, 28247, 28248, 61017, 61018, 28252, 28253, 28254, 28256, 28257, 28258, 61026, 28260, 61035, 61033, 28269, 61038, 28273, 28272, 28274, 61044, 28278, 28279, 28284, 28285, 28286, 28281, 28304, 61076, 61077, 61078, 61080, 61083, 28316, 28318, 61087, 28320, 28322, 61089, 28324, 28325, 61097, 61096, 61102, 28338, 61106, 28340, 61108, 28341, 28343, 61112, 28345, 61114, 61115, 28348, 28350, 28344, 28352, 61121, 61123, 28357, 61134, 28368, 61128, 61138, 28363, 61140, 61141, 61142, 28377, 61147, 28380, 61144, 28382, 61150, 61151, 61148, 28393, 28396, 28400, 61170, 28405, 28406, 61173, 28408, 28409, 61180, 61178, 28414, 28412, 61182, 28417, 28418, 61186, 61188, 61189, 28420, 28423, 61192, 61193, 28426, 61195, 61190, 61198, 28430, 61204, 61208, 61211, 61217, 28450, 28451, 28452, 61218, 61220, 28453, 61224, 61225, 61226, 28456, 61233, 28466, 28467, 61234, 28468, 61241, 61242, 28469, 61246, 28478, 28475, 61265, 61266, 28499, 61268, 28501, 61270, 28498, 61272, 61273, 28504, 28508, 28500, 61275, 61274, 61281, 61282, 28515, 28514, 28517, 28516, 61288, 61289, 61284, 28523, 61290, 28526, 28540, 28542, 61310, 28560, 61334, 61341, 61345, 28578, 61346, 28580, 61348, 28581, 61352, 61353, 61354, 61355, 28590, 28584, 61361, 28594, 61362, 28596, 61364, 61366, 61368, 61369, 61370, 61371, 28604, 28597, 28606, 28601, 28608, 61377, 61378, 61379, 28610, 28612, 61384, 61386, 61387, 28619, 28622, 28624, 61385, 61398, 28630, 28632, 28633, 61405, 61407, 28646, 38258, 28648, 28649, 28656, 61425, 61426, 28658, 28660, 28661, 28662, 61428, 61432, 28665, 28664, 61435, 28667, 61437, 28670, 61439, 28668, 61434, 61433, 28707, 28723, 28755, 61532, 61534, 28767, 28771, 28822, 28824, 25268, 28827, 61614, 28854, 28856, 28859, 28902, 28904, 28907, 61692, 61702, 61704, 61707, 61710, 28944, 28945, 28946, 61712, 28948, 61716, 28950, 61718, 28952, 28953, 28954, 61721, 61720, 61723, 28959, 28957, 28961, 28962, 28963, 28964, 61734, 28968, 28969, 28970, 28971, 28967, 28975, 28973, 28977, 61746, 61747, 28980, 61749, 28982, 61748, 28984, 28985, 28986, 28987, 29012, 61780, 61782, 61784, 61785, 29016, 61787, 29021, 29023, 61792, 29024, 29027, 29028, 29030, 29032, 29035, 29037, 29039, 61810, 29043, 61812, 61813, 29047, 29046, 61811, 29050, 29053, 29055, 29072, 29074, 29076, 29080, 29083, 29088, 29090, 29092, 29093, 29096, 29097, 29101, 29103, 29108, 29109, 29112, 29113, 29120, 29125, 61899, 29133, 29135, 29136, 29140, 29147, 61917, 61919, 61932, 61934, 29173, 61949, 61951, 61952, 29183, 61964, 61966, 61968, 29201, 29202, 29204, 29206, 29208, 29209, 29210, 61979, 61982, 29215, 29217, 29218, 29220, 29221, 61988, 29224, 29225, 61995, 61989, 29231, 29233, 29234, 29236, 29237, 29238, 29240, 29241, 29242, 29247, 29266, 29267, 29268, 29269, 29275, 62043, 62045, 62047, 62048, 62046, 29282, 29279, 29284, 29285, 29286, 62054, 29288, 62056, 29290, 62059, 29291, 62061, 62062, 29295, 62063, 29298, 29294, 29300, 62069, 62070, 62068, 29304, 29302, 29301, 62075, 29307, 62077, 62072, 29311, 29332, 62102, 29334, 29336, 62104, 29338, 62112, 29348, 29350, 29352, 29353, 29354, 29355, 62123, 29358, 62126, 29364, 29368, 29371, 29376, 62144, 62146, 62148, 29380, 29382, 62150, 62152, 29384, 29386, 62155, 62154, 29385, 29390, 62158, 29392, 29387, 62163, 62164, 62166, 62168, 29402, 62170, 62172, 62174, 62176, 62175, 62195, 62196, 29428, 29432, 29434, 29435, 62204, 62202, 29438, 62207, 62208, 62206, 62220, 62222, 29456, 62224, 29458, 29459, 29460, 29457, 29462, 29461, 29464, 29465, 29466, 29467, 62236, 29469, 62238, 29471, 29472, 29473, 29474, 29476, 29478, 62246, 29480, 29481, 29482, 29483, 62250, 62252, 29485, 29487, 29489, 29490, 29492, 29494, 29496, 29497, 29498, 29499, 62291, 62292, 29527, 62299, 62300, 29533, 62302, 29535, 62304, 62305, 62310, 29543, 29536, 62313, 62315, 29549, 29551, 29552, 62326, 29559, 29558, 29561, 62330, 29563, 29565, 62329, 29567, 62331, 62352, 29585, 29586, 29588, 62356, 29590, 62358, 29592, 62361, 29594, 29593, 29595, 29598, 29603, 29605, 62373, 29608, 29609, 29610, 62378, 29612, 29614, 62383, 62384, 29615, 29620, 29621, 29624, 29625, 62400, 29634, 29635, 29636, 29638, 29637, 29641, 62410, 29642, 29644, 29646, 62415, 29648, 29647, 62420, 62422, 62425, 29662, 29663, 62432, 62444, 62446, 29680, 29685, 29695, 62464, 62468, 62470, 62472, 62475, 62476, 62478, 29712, 29713, 62480, 29714, 29716, 29718, 29720, 29721, 29729, 29730, 29732, 29733, 29734, 29736, 29737, 29738, 29739, 29743, 29745, 29744, 29746, 29748, 29749, 29752, 29753, 29754, 29759, 62544, 29776, 29778, 29780, 29781, 29782, 29784, 62555, 29788, 62557, 62558, 29792, 62559, 29794, 62562, 29796, 29797, 62564, 29800, 29801, 29802, 62571, 29805, 29806, 29807, 62575, 29810, 62578, 62580, 29812, 29814, 62574, 29817, 29818, 62587, 29820, 29821, 29822, 29843, 29844, 62614, 29846, 29848, 62615, 29852, 62620, 29854, 62621, 29859, 29860, 29861, 29862, 29864, 29865, 29867, 29870, 29871, 62640, 29872, 29875, 29876, 29877, 29884, 29886, 29887, 62659, 29892, 29893, 62662, 62665, 29898, 62668, 62669, 29902, 62671, 29903, 29899, 62678, 29910, 62679, 29914, 62682, 29916, 62685, 62684, 62687, 62688, 29918, 29936, 62704, 29941, 29942, 29944, 29945, 62714, 29946, 62717, 29950, 62719, 62720, 29951, 62732, 62734, 29968, 62736, 62738, 29972, 29971, 29974, 62741, 29976, 29980, 29981, 29982, 29988, 29989, 62758, 29990, 29992, 62756, 29995, 62760, 30005, 30009, 30033, 30037, 30039, 30043, 30045, 30046, 30048, 30049, 62818, 30051, 30054, 30055, 30056, 62822, 62824, 62827, 30060, 30061, 62830, 30066, 30062, 62836, 62838, 30071, 62840, 30073, 30069, 30077, 30079, 30098, 30099, 30100, 62868, 62867, 62869, 30104, 62872, 62874, 30108, 62879, 30114, 30115, 30116, 30118, 62883, 30120, 62884, 30122, 30123, 30124, 62893, 30126, 62895, 30128, 30131, 30132, 30134, 30136, 30137, 30140, 62913, 30146, 62915, 62916, 30148, 62920, 30152, 62927, 30155, 62931, 62932, 62933, 62930, 62936, 62938, 30172, 62941, 62942, 62943, 62944, 30174, 62940, 30192, 62962, 62965, 30198, 30200, 30201, 62972, 62974, 19046, 51613, 19058, 7722, 30480, 63248, 63250, 63253, 30490, 63261, 63263, 30512, 30513, 30516, 25604, 30520, 30546, 63314, 30548, 63317, 30550, 30552, 30555, 63325, 30558, 63327, 30562, 63330, 63332, 63333, 63343, 30578, 30580, 63348, 30584, 63352, 63353, 63357, 63359, 30609, 30612, 63380, 63382, 30615, 30616, 63384, 63389, 30622, 63391, 30625, 63395, 63396, 30633, 63403, 30634, 63405, 30638, 63407, 30644, 30645, 30648, 30655, 30657, 30666, 63435, 63437, 63439, 30673, 63442, 63444, 63446, 30679, 63448, 63445, 63453, 30686, 63455, 63456, 63474, 63477, 30709, 30719, 63744, 63756, 63758, 63760, 30992, 30994, 30995, 30996, 30997, 31000, 31002, 63772, 31005, 63774, 31007, 63776, 31012, 31018, 31019, 63788, 31021, 63786, 31023, 63792, 31028, 31030, 31033, 31034, 31035, 31039, 63824, 63827, 63828, 31063, 63835, 63836, 31069, 63838, 31071, 63840, 63846, 31079, 63849, 63851, 31085, 31087, 31088, 63857, 31089, 31095, 63866, 31099, 63867, 31101, 31103, 63888, 31121, 31122, 31124, 31125, 63892, 31129, 31131, 31130, 31134, 63904, 31141, 31142, 31139, 31144, 63909, 63914, 31146, 31148, 31150, 63920, 63919, 58294, 31154, 31156, 31157, 31163, 63936, 31171, 31172, 31174, 31170, 31176, 31177, 31178, 63946, 31180, 31182, 63951, 31184, 63956, 31198, 31199, 63968, 63980, 63982, 63984, 31231, 64000, 64012, 64014, 31248, 64016, 31250, 31251, 31258, 64027, 31259, 64030, 31263, 31266, 31267, 64036, 64037, 31272, 31275, 64043, 31277, 31282, 31283, 31286, 31290, 31291, 31293, 31314, 31315, 31316, 31323, 64091, 64093, 64095, 64096, 64094, 31330, 31332, 31333, 31325, 25765, 31336, 64104, 31338, 31339, 64107, 64109, 64110, 64111, 31343, 31341, 31342, 31348, 64117, 31350, 64116, 31352, 64120, 31349, 64123, 31355, 64125, 64118, 31359, 51826, 64150, 64152, 31385, 31386, 31384, 31389, 31391, 64160, 31398, 31402, 64171, 31405, 64174, 31407, 25781, 31406, 31416, 31423, 64192, 64194, 64196, 31428, 64198, 31430, 64200, 31432, 31433, 31435, 31434, 64203, 31438, 64206, 64202, 31437, 31440, 64212, 64211, 64214, 31448, 31449, 64216, 31450, 64220, 64218, 64223, 64224, 64222, 31462, 31464, 31465, 64243, 31476, 64244, 31480, 64250, 31482, 64252, 31483, 31486, 64255, 64254, 64262, 64264, 64267, 64270, 64272, 31504, 64276, 31508, 64278, 64280, 64281, 31514, 64283, 31512, 31517, 31519, 31523, 31524, 31527, 31530, 31531, 31533, 31535, 64304, 64306, 64307, 64308, 64309, 31540, 31542, 31545, 58373, 31547, 31546, 31551, 64340, 64342, 31576, 64345, 64344, 64347, 31581, 31583, 64352, 31587, 31588, 31590, 31595, 31597, 31599, 64370, 31603, 64371, 64373, 31607, 64372, 31610, 31613, 31615, 31632, 31634, 31636, 31637, 31643, 64416, 31650, 31652, 31653, 31654, 31656, 31661, 31663, 31666, 31668, 31669, 31675, 64448, 32349, 31686, 31688, 64459, 31693, 31695, 31696, 31700, 31707, 64477, 32354, 64479, 64492, 64494, 31739, 64509, 64511, 31763, 64533, 64530, 31772, 64541, 31774, 64543, 32369, 31796, 31800, 32375, 31828, 31830, 31832, 31835, 31842, 31843, 64613, 64610, 31852, 64623, 31857, 31860, 64628, 31864, 31865, 64632, 64637, 64639, 31889, 31890, 31892, 64660, 31895, 64664, 31896, 64669, 64671, 31905, 31906, 64675, 64676, 31911, 31913, 31916, 64685, 31918, 64687, 31924, 31928, 31929, 31937, 31943, 31945, 19375, 64717, 64719, 31953, 31956, 64724, 31959, 31960, 64728, 64733, 64735, 31988, 31992, 31993, 64768, 64780, 64782, 32020, 32025, 32026, 32027, 32036, 32038, 32040, 32041, 32043, 32052, 32054, 32056, 32057, 32082, 32084, 32085, 32086, 32088, 64859, 32092, 32091, 64862, 32094, 32098, 32100, 64868, 32105, 32106, 64875, 64878, 32114, 32116, 64884, 32118, 32121, 32122, 64891, 64912, 32150, 32156, 32164, 32171, 32180, 32182, 32184, 32185, 32196, 64969, 32202, 32203, 32206, 64976, 32208, 32214, 64986, 32218, 32220, 32222, 64991, 64992, 32244, 32246, 32248, 32461, 32250, 65018, 32249, 65023, 65024, 65036, 65038, 32272, 65040, 32274, 32275, 32276, 65045, 65042, 32283, 32285, 32291, 32292, 32293, 32294, 65055, 32296, 65065, 65064, 65062, 32307, 32309, 32337, 65106, 32338, 32340, 32341, 65109, 32342, 32344, 32343, 32347, 65117, 32350, 65119, 32353, 32356, 65124, 32352, 65125, 65134, 65135, 65140, 65144, 32370, 65149, 32373, 65151, 32383, 32381, 65171, 65172, 65173, 32406, 65174, 65176, 32409, 65179, 32412, 65178, 65183, 32408, 65187, 65188, 32420, 65060, 32426, 65195, 32427, 32429, 32430, 32436, 32438, 32440, 32441, 32444, 32445, 65217, 65219, 65220, 32452, 65227, 65236, 65237, 65238, 65240, 65242, 32476, 65243, 32478, 32473, 65248, 65247, 65244, 65246, 32489, 65266, 32500, 65269, 32502, 32504, 32505, 65276, 32509, 32511, 65278, 32508, 65284, 65286, 65288, 65291, 65294, 32530, 32531, 65311, 32546, 32547, 32548, 32549, 32550, 32552, 32554, 32555, 32557, 32562, 32563, 32565, 32570, 32571, 32573, 65341, 65343, 32594, 32596, 32597, 32598, 32600, 32604, 65373, 65375, 32605, 32608, 65378, 32610, 65387, 32621, 32622, 65391, 32619, 65394, 65403, 32636, 65405, 32638, 65407, 32637, 32662, 65431, 32664, 32665, 65430, 65436, 65437, 32676, 32678, 32680, 32685, 32686, 32692, 32700, 65475, 32708, 65494, 65495, 32728, 32729, 32726, 65500, 65501, 65122, 65503, 32742, 32744, 32745, 32756, 32758, 32760, 32761, 32763, 32764, 65533, 32766, 65535], 2821: [16, 27, 31, 47, 26061, 65138, 59, 63, 91, 95, 61891, 111, 112, 127, 144, 21196, 21197, 154, 159, 21199, 171, 175, 207, 208, 218, 57031, 222, 223, 22478, 256, 24832, 49409, 49411, 49415, 49418, 24844, 24845, 24847, 270, 49422, 49423, 49428, 49426, 284, 287, 286, 49444, 49445, 24108, 49442, 21228, 21229, 24892, 24893, 316, 24895, 318, 319, 29372, 21230, 29374, 29375, 57055, 49492, 49493, 31004, 24927, 351, 350, 24925, 49508, 361, 24111, 366, 49522, 49525, 52177, 382, 383, 380, 49553, 49555, 405, 407, 49559, 29389, 412, 413, 24988, 24990, 414, 415, 417, 423, 52186, 49585, 49587, 437, 49591, 25021, 444, 449, 25022, 451, 49604, 453, 49607, 455, 462, 463, 25038, 465, 49620, 49621, 471, 49630, 49633, 49635, 49636, 485, 25068, 25069, 25070, 495, 494, 57087, 49652, 49653, 49650, 3356, 49658, 49662, 49663, 49666, 49668, 49669, 521, 49674, 523, 525, 25102, 49679, 533, 530, 25117, 540, 25119, 25118, 543, 542, 549, 546, 57098, 25148, 25149, 572, 25150, 25151, 574, 575, 49747, 25183, 607, 606, 610, 49763, 613, 622, 626, 49779, 629, 628, 635, 25214, 638, 639, 25213, 636, 657, 49810, 659, 49815, 663, 31068, 49811, 25245, 668, 669, 670, 671, 31070, 49831, 49825, 49827, 1004, 689, 49842, 691, 695, 25277, 700, 25279, 703, 702, 49860, 49863, 25293, 25295, 718, 49873, 49876, 49879, 65274, 29454, 49887, 737, 49890, 49892, 49893, 740, 743, 29455, 56275, 24572, 25325, 25326, 25327, 751, 750, 49905, 49907, 49908, 749, 24575, 24574, 49919, 49921, 49923, 49924, 49927, 50629, 777, 49930, 779, 781, 49935, 25358, 49938, 49940, 53109, 49941, 25372, 796, 798, 49954, 49957, 49956, 65290, 1986, 25404, 25405, 828, 25406, 25407, 830, 831, 53111, 50005, 25436, 862, 25438, 863, 50021, 53905, 878, 50034, 50036, 50037, 891, 25468, 894, 892, 57169, 50065, 50067, 917, 919, 50071, 913, 57171, 25500, 924, 926, 929, 935, 3444, 50097, 50099, 949, 50103, 25533, 957, 3447, 956, 961, 963, 965, 50117, 50116, 25535, 967, 25548, 22989, 977, 974, 983, 50132, 50133, 22992, 50145, 50147, 996, 997, 50148, 25581, 25582, 25583, 1007, 1006, 50162, 1005, 50164, 50165, 50175, 50177, 50179, 50180, 50181, 50178, 50183, 50186, 1035, 50191, 50194, 50196, 25629, 1052, 1054, 1055, 50210, 50212, 50213, 57201, 25661, 1084, 1087, 50257, 50259, 50261, 1119, 1122, 1125, 50279, 50273, 50275, 29534, 1138, 1140, 1141, 50293, 3484, 1147, 25727, 1150, 1151, 25725, 1148, 1169, 50321, 1171, 50323, 50327, 1175, 1170, 25757, 1180, 1181, 25759, 1183, 50340, 1185, 50343, 1191, 1187, 50337, 50339, 1201, 50353, 1203, 50355, 1202, 1207, 50359, 25789, 1212, 1213, 1215, 50372, 50375, 1219, 1231, 50382, 50388, 1235, 50391, 50385, 31183, 1236, 50398, 50401, 50403, 50404, 50405, 1252, 1255, 1253, 1249, 25837, 25838, 1262, 50418, 50417, 50420, 50419, 50421, 50430, 50434, 50437, 1289, 50442, 1291, 1293, 50447, 25870, 25884, 25885, 1310, 1311, 65393, 25916, 25917, 25918, 1343, 50513, 50515, 50516, 21438, 3529, 25950, 50529, 50531, 1375, 50532, 3531, 50535, 1381, 3533, 50545, 50547, 1397, 50548, 25980, 1406, 1407, 1404, 50578, 1427, 50577, 50579, 50583, 21452, 26013, 26015, 1439, 50593, 50595, 21453, 50599, 50596, 3545, 1457, 50610, 1459, 1460, 3547, 26045, 31228, 50625, 31229, 55653, 31230, 50631, 50628, 54026, 50641, 1487, 50647, 1505, 50658, 1508, 50661, 1511, 26093, 26094, 26095, 50673, 50675, 54034, 50687, 55669, 716, 28012, 62914, 31279, 62218, 348, 1983, 1792, 26368, 50945, 50947, 50948, 50951, 1801, 50954, 1803, 26380, 26381, 26382, 26383, 1805, 1806, 50958, 50959, 26397, 1822, 1823, 50981, 26429, 1854, 1855, 29678, 29679, 51026, 51028, 51029, 1886, 1887, 26461, 1902, 51061, 1913, 1915, 26494, 1918, 1919, 26493, 1916, 51089, 1938, 51091, 1940, 1941, 51095, 1939, 26525, 1949, 1951, 1955, 51121, 1970, 51123, 1973, 51127, 26556, 26557, 26558, 26559, 1987, 51143, 1989, 26573, 26575, 2003, 51157, 2004, 29708, 51169, 401, 51172, 2020, 2021, 55761, 51171, 26604, 26605, 26606, 26607, 51186, 55763, 51189, 55767, 3665, 52183, 52513, 52515, 21964, 21596, 21597, 3690, 3694, 55799, 3697, 446, 447, 450, 63953, 30700, 63955, 3022, 63959, 55818, 30701, 460, 63962, 51476, 2327, 51475, 26908, 51492, 2343, 63967, 51491, 57079, 55829, 51541, 51543, 51539, 26972, 2398, 2401, 26974, 51557, 2407, 26988, 2416, 2414, 51572, 51573, 2417, 2419, 2423, 2428, 2430, 51605, 2462, 52593, 51621, 27052, 27053, 2478, 27055, 63994, 493, 492, 51649, 51650, 51652, 51653, 63998, 51655, 51651, 27084, 27088, 2508, 51668, 51669, 51671, 2517, 51666, 27101, 27103, 2524, 2526, 51697, 51698, 51699, 51700, 51701, 51703, 27132, 27133, 27135, 51713, 51714, 64010, 51716, 51717, 51715, 51719, 2569, 51722, 2571, 2573, 51727, 2577, 2578, 2579, 2580, 2581, 51730, 2583, 51729, 51731, 51735, 27165, 27166, 2590, 27167, 2591, 2588, 27181, 2606, 2609, 2610, 2611, 2612, 2613, 51762, 2615, 51761, 51763, 51764, 51767, 51765, 51797, 2647, 2645, 51795, 2642, 27229, 27231, 62401, 23324, 27245, 2671, 27247, 2668, 51829, 2676, 2679, 2677, 51827, 27261, 27262, 2687, 2684, 2686, 54271, 3797, 2719, 2716, 21709, 2734, 2735, 3802, 54279, 57095, 27341, 2764, 27357, 2780, 2782, 54290, 27389, 27391, 51987, 55923, 51988, 52003, 2847, 2855, 54494, 52004, 27438, 21740, 21741, 52051, 21743, 52052, 52053, 52055, 2910, 52067, 2913, 52068, 2926, 52083, 2924, 2931, 52686, 2928, 52687, 2940, 2943, 2942, 52689, 52690, 52691, 52117, 27550, 2974, 2980, 54499, 27565, 27566, 62467, 2990, 27567, 2988, 23389, 52161, 52162, 52163, 3010, 62471, 52164, 52167, 3020, 52178, 27598, 52180, 52181, 3029, 52179, 3036, 27614, 27615, 3039, 27613, 3861, 3038, 52190, 604, 3863, 64506, 53525, 52209, 52210, 52211, 52212, 52213, 52215, 27645, 27647, 27646, 23406, 64113, 3088, 64115, 3102, 3103, 3114, 3118, 3119, 3120, 3152, 3884, 3885, 3887, 3178, 3182, 3183, 3184, 3193, 3197, 3198, 3199, 3216, 3225, 3226, 3227, 3229, 3231, 3242, 3246, 3247, 3248, 3258, 3259, 52751, 3263, 3264, 52753, 3274, 3279, 3289, 3290, 3291, 3293, 3294, 3295, 3296, 54387, 3305, 3306, 3307, 3309, 3311, 51137, 3344, 52497, 3347, 52500, 3348, 52503, 3351, 27932, 27933, 27934, 3358, 27935, 52519, 3367, 3371, 27949, 27950, 3374, 3376, 27948, 3372, 52775, 62549, 3408, 52561, 52565, 52567, 27996, 3422, 3424, 3425, 27997, 52581, 27998, 52583, 3431, 3434, 3436, 28013, 28014, 3440, 3438, 52597, 52599, 3441, 3451, 3452, 28029, 28030, 28028, 28031, 3454, 21853, 3474, 52629, 3476, 3481, 3482, 3483, 28060, 28061, 3486, 3485, 28063, 52645, 3497, 3498, 3499, 28076, 28077, 3501, 3502, 3953, 3500, 3514, 3515, 3517, 3518, 52674, 52676, 52677, 52679, 52675, 3530, 52682, 28108, 3532, 3534, 28109, 52692, 52693, 3538, 52695, 3541, 3540, 52698, 3546, 3548, 28125, 28124, 28127, 3550, 3551, 3549, 23501, 23502, 707, 52703, 3561, 3562, 3563, 3565, 3566, 23504, 52721, 52723, 52725, 3567, 52727, 62583, 28156, 28157, 52734, 52737, 52738, 52739, 52741, 52735, 52743, 3593, 52746, 3595, 3597, 3603, 3605, 52756, 52759, 52755, 28189, 3614, 52771, 3627, 28205, 3630, 3632, 52791, 52789, 52786, 52819, 52821, 3678, 52835, 52834, 3681, 52852, 52853, 3703, 3701, 3708, 3710, 3730, 52885, 3738, 28317, 3754, 28333, 3758, 52850, 748, 3770, 52930, 52935, 3786, 28365, 52946, 52949, 3804, 28381, 3806, 31694, 25181, 52959, 3818, 3821, 3823, 52977, 52981, 52983, 52579, 28413, 52993, 52994, 52995, 52991, 52996, 52997, 52999, 53002, 3851, 3854, 53006, 3856, 53009, 53011, 53007, 3857, 28445, 3870, 3871, 3868, 54501, 3881, 3882, 28460, 28461, 28462, 3886, 3888, 3889, 53047, 53045, 3895, 3893, 62647, 3920, 53075, 3925, 3927, 3921, 53077, 28509, 3936, 54514, 21950, 28463, 2412, 3945, 3946, 3948, 3950, 3951, 3952, 28527, 62658, 28525, 3956, 3959, 3957, 3964, 3966, 3967, 28541, 56151, 3984, 3993, 3994, 28572, 3997, 3998, 3999, 28574, 28573, 28575, 3996, 4010, 4011, 28589, 4016, 4014, 28591, 4015, 4012, 21965, 4026, 4029, 4030, 4031, 4032, 62674, 4042, 4044, 4046, 4047, 28623, 28621, 4058, 28636, 4060, 4062, 4063, 4064, 28639, 4061, 28637, 28638, 4074, 4077, 4078, 4079, 28669, 28671, 62693, 21996, 21997, 2460, 30143, 52945, 52947, 2476, 52951, 860, 28928, 61697, 53505, 20736, 61703, 53511, 61706, 53514, 20748, 20749, 28943, 28942, 53518, 53519, 61711, 20751, 28941, 61714, 53522, 61717, 20764, 20765, 20767, 61730, 53538, 61733, 61732, 53541, 53540, 20796, 20797, 20799, 28990, 28991, 28988, 28989, 61778, 53586, 61781, 53589, 2510, 30191, 20829, 20831, 53602, 61794, 61796, 61797, 53604, 53605, 53618, 53621, 53620, 20860, 20861, 20863, 61841, 53649, 61843, 53651, 61844, 53652, 61847, 53655, 20892, 20893, 20894, 20895, 29084, 61873, 53681, 61875, 53683, 61876, 53684, 61879, 53687, 56261, 20925, 20926, 29118, 61893, 53701, 53700, 61898, 20940, 20941, 61903, 29134, 53710, 61909, 53716, 53717, 61914, 53012, 61918, 53726, 53729, 61923, 53731, 53732, 53015, 20973, 29167, 20972, 20975, 53746, 61941, 53748, 53749, 56273, 29164, 61946, 53754, 53758, 53759, 61950, 53762, 61954, 29184, 20992, 61956, 61957, 53765, 53764, 61962, 53770, 21004, 21005, 53774, 53775, 61967, 29199, 29198, 21006, 21007, 29197, 56279, 21020, 21021, 21022, 21023, 29213, 29214, 56282, 56286, 21052, 21053, 21054, 29244, 29245, 29246, 62033, 62035, 53843, 62036, 62039, 29277, 62049, 62051, 53859, 62052, 62055, 62065, 62067, 53875, 62071, 29308, 29309, 29310, 21118, 21119, 21116, 21117, 62097, 62098, 53906, 62100, 62101, 53908, 53909, 62103, 53911, 62099, 53907, 21148, 21149, 21151, 29340, 29341, 29343, 62116, 53924, 62113, 62119, 53927, 62115, 53921, 53923, 62130, 53938, 62132, 62133, 53941, 53940, 64453, 56311, 21181, 21182, 21183, 62145, 53953, 62147, 62151, 53959, 62149, 53957, 29391, 53967, 53969, 62159, 62161, 62167, 53975, 959, 62178, 53986, 62180, 62181, 53989, 53988, 49809, 29420, 29421, 29422, 29423, 21231, 62193, 54001, 62199, 29440, 62209, 62211, 54019, 54017, 21248, 62215, 62212, 54020, 54023, 29452, 29453, 21260, 21261, 62223, 54031, 54030, 21262, 21263, 62228, 62229, 54036, 54037, 62226, 972, 29468, 21277, 21276, 29470, 21279, 62245, 54053, 54052, 2604, 53079, 29500, 29501, 21308, 21309, 29502, 29503, 2607, 21310, 21311, 1173, 62290, 54098, 62293, 54101, 29532, 21342, 21343, 21341, 21340, 54114, 54117, 54133, 54132, 21375, 21372, 21373, 62353, 54161, 62355, 54163, 62359, 54167, 29596, 21404, 21405, 21406, 21407, 64501, 49601, 62385, 54193, 62387, 54195, 53105, 53106, 62388, 62391, 54196, 54199, 29628, 21437, 21436, 29630, 62407, 54215, 29645, 62421, 62418, 62426, 49857, 62430, 62431, 62433, 54241, 62435, 62436, 54244, 54243, 62439, 2641, 29676, 29677, 21486, 21487, 21485, 21484, 62450, 2643, 62452, 62453, 54260, 62458, 62462, 62463, 29696, 21504, 62466, 62469, 54273, 62465, 54282, 62474, 21516, 21517, 54286, 62479, 29710, 29711, 54287, 21519, 29709, 62484, 54293, 62485, 62482, 21532, 21533, 29725, 62500, 62501, 54309, 54306, 62498, 21565, 29757, 29758, 62545, 54353, 54355, 62547, 62548, 62551, 62546, 54357, 29789, 54369, 62561, 62563, 54371, 54375, 62567, 54373, 62565, 55891, 62581, 54389, 54385, 62577, 2670, 62579, 29823, 21631, 21628, 21629, 23838, 2673, 2674, 62609, 62610, 62612, 62613, 54420, 54419, 62611, 54417, 2675, 21660, 21661, 21663, 29853, 29855, 62625, 54435, 62627, 54433, 62631, 54436, 62628, 54439, 54449, 62642, 54452, 62644, 62645, 62641, 62643, 54451, 54455, 21692, 21693, 21694, 54465, 62657, 62660, 54468, 54471, 62663, 62661, 54469, 54481, 62673, 62675, 62676, 54485, 62677, 62686, 54498, 62690, 62692, 54500, 62695, 54497, 62689, 62691, 29932, 29933, 29934, 29935, 21742, 62705, 54513, 62707, 62708, 62711, 62706, 54517, 62709, 62718, 54526, 29952, 54530, 62722, 21760, 54533, 62725, 54538, 62730, 29964, 29965, 21772, 21773, 54542, 54543, 62735, 21774, 21775, 29966, 29967, 29196, 21788, 21789, 51555, 30012, 21820, 21821, 30014, 21822, 62801, 54609, 54611, 62803, 54612, 62804, 62807, 30044, 21854, 21852, 54625, 62817, 62819, 54627, 54628, 62820, 62823, 54631, 54641, 62833, 62835, 54644, 54643, 62839, 30076, 21887, 21884, 21885, 30078, 51570, 51571, 54673, 62866, 54674, 54676, 54677, 54679, 62871, 62865, 30109, 21916, 21917, 30111, 21918, 21919, 54692, 62881, 62887, 54695, 54691, 54706, 62898, 2732, 54708, 62900, 62901, 54709, 30141, 21948, 21949, 54721, 54727, 62919, 54725, 62917, 62922, 30157, 25534, 54751, 54754, 62946, 62949, 54757, 30188, 25948, 21998, 21999, 30189, 62961, 54769, 54771, 62963, 1116, 54772, 62967, 62970, 54783, 62975, 30476, 22272, 30464, 55041, 63235, 63233, 55043, 55044, 55047, 63239, 63236, 55050, 63242, 22284, 22285, 55054, 55055, 63246, 63247, 30478, 30479, 22286, 22287, 30477, 55061, 22300, 22301, 22302, 30494, 30493, 63266, 63269, 55077, 22333, 22334, 63316, 55124, 22364, 22365, 30559, 22366, 51665, 51667, 63346, 63349, 55157, 22396, 22397, 22398, 22399, 30589, 30588, 63377, 55185, 55187, 63379, 63383, 55191, 22428, 22429, 22430, 22431, 30621, 30620, 54689, 1205, 55217, 63409, 63411, 55219, 63412, 55220, 55223, 63415, 22460, 22461, 22462, 63426, 63429, 55237, 63425, 22477, 55253, 63450, 55263, 55265, 63457, 63459, 55267, 63463, 63460, 55268, 22508, 30702, 30703, 24013, 1218, 55282, 63476, 55285, 63482, 63487, 63486, 1221, 24016, 32159, 21085, 1228, 30556, 30557, 1260, 28940, 50113, 32204, 25693, 50119, 63761, 55571, 63763, 55572, 63764, 63767, 22812, 31006, 22815, 22813, 63779, 55587, 55588, 31022, 22831, 22829, 31020, 2916, 63825, 63826, 55634, 55633, 63831, 55637, 63829, 22876, 22877, 22878, 22879, 55639, 55650, 63847, 22892, 22895, 22893, 55667, 63863, 55668, 22911, 22909, 24092, 63890, 56661, 63893, 55701, 22943, 22941, 22942, 22956, 31149, 22959, 22957, 22958, 31151, 63937, 55745, 22976, 55747, 55751, 63943, 22988, 31181, 22991, 63954, 63957, 31197, 23007, 23005, 32253, 32252, 56677, 63966, 32255, 23024, 55793, 63986, 63985, 55795, 63987, 63988, 63991, 55796, 63989, 23036, 23037, 63999, 64001, 55810, 55811, 64002, 64003, 23039, 55809, 55815, 55812, 64007, 64004, 55813, 64005, 55823, 55822, 55825, 55826, 55827, 64018, 64019, 64017, 64015, 55828, 55831, 64020, 64023, 64021, 31261, 31262, 23069, 23070, 23071, 23068, 23086, 64049, 64050, 55858, 55859, 64051, 55857, 64052, 64055, 55861, 55860, 64053, 55863, 56693, 24364, 64082, 64084, 64085, 64087, 55893, 64081, 64083, 23134, 23135, 31327, 22509, 22510, 2972, 30652, 22511, 23148, 23151, 23150, 30653, 55925, 64119, 64114, 31357, 31358, 23167, 23165, 23166, 31356, 23197, 23215, 23212, 23232, 30669, 23244, 31439, 23248, 31453, 23261, 31455, 23280, 23295, 31484, 31487, 54209, 52702, 64273, 56083, 64275, 64279, 23325, 23327, 64292, 56100, 64289, 64295, 25805, 64291, 56099, 23341, 23342, 23343, 31534, 64885, 64337, 64338, 56147, 56146, 64339, 56145, 64343, 56149, 64341, 23391, 64353, 56163, 64355, 56162, 64354, 64359, 64356, 56164, 56165, 64357, 23404, 23405, 23407, 64369, 56179, 56180, 64375, 56181, 56178, 23421, 23423, 64402, 64404, 64405, 56213, 20942, 23453, 23454, 23455, 64418, 64420, 56229, 64421, 23469, 23470, 23471, 23468, 31662, 56257, 56258, 56772, 64451, 56259, 23488, 56260, 23500, 23503, 56775, 56274, 64463, 56277, 56276, 64469, 23517, 31711, 23519, 23518, 64474, 31709, 31710, 64478, 56306, 56307, 64499, 56305, 23536, 56309, 56308, 31740, 64510, 31743, 23551, 31742, 31741, 56785, 23550, 56791, 27485, 20974, 29116, 50289, 50291, 56821, 23087, 1471, 1475, 64977, 24272, 64979, 64785, 56593, 64787, 56839, 64788, 64791, 56599, 56596, 23836, 32029, 32030, 23839, 23837, 64801, 56609, 56842, 64803, 56611, 64983, 64804, 64807, 56615, 23852, 32045, 32046, 23855, 23854, 23853, 32044, 64849, 64850, 64851, 56657, 64855, 64852, 64853, 56663, 23900, 23901, 23902, 23903, 32093, 64865, 56673, 64867, 56675, 64866, 64871, 56679, 64869, 23916, 32109, 23919, 23917, 56689, 64881, 64883, 23918, 64887, 56695, 64882, 23932, 32125, 32126, 23935, 23934, 23933, 32124, 32127, 55233, 64914, 64916, 64917, 56725, 56724, 23964, 32157, 32158, 23967, 23965, 64930, 64932, 64933, 56740, 56741, 55239, 23980, 32173, 32174, 23983, 23981, 32172, 56769, 64962, 56771, 64963, 64961, 56770, 24000, 64965, 64964, 64967, 56773, 24012, 32205, 56782, 64974, 24015, 64978, 56786, 64981, 64980, 56789, 24028, 32221, 24031, 24029, 32223, 64990, 56798, 50369, 24048, 65009, 65010, 65011, 56818, 56817, 65012, 65015, 65013, 56823, 24060, 24061, 56830, 56833, 65022, 24063, 65025, 65026, 56834, 65031, 65029, 56837, 56846, 65039, 65041, 65043, 56851, 56849, 56847, 65044, 65047, 56853, 56852, 32286, 56855, 24093, 65034, 56868, 958, 65063, 56871, 65059, 65057, 56867, 32300, 65073, 65074, 65075, 56882, 65076, 65079, 65077, 56884, 56887, 56885, 50389, 65105, 65107, 56915, 64458, 23549, 65111, 65108, 24156, 24158, 24159, 32348, 65121, 65123, 56931, 65127, 21086, 65139, 65137, 65141, 65143, 24188, 24191, 24189, 32380, 65170, 56981, 56980, 56916, 50402, 32413, 24222, 24221, 24220, 24223, 65189, 56997, 65186, 63431, 24238, 24256, 65218, 57026, 57025, 65221, 65223, 57029, 24284, 32477, 24287, 24285, 2919, 24367, 24304, 65265, 65267, 57073, 65271, 24316, 24319, 65281, 65282, 65283, 57089, 65279, 65287, 65285, 65295, 57103, 65297, 65298, 65299, 57107, 57105, 57102, 65301, 65300, 65303, 57109, 24349, 57111, 24351, 24348, 32541, 32556, 24366, 32559, 56946, 65329, 65330, 65331, 57138, 57137, 65332, 65335, 65333, 57140, 57143, 57141, 56949, 64467, 65361, 65362, 65363, 65364, 65365, 57173, 65367, 57175, 53697, 24412, 24415, 24431, 24430, 65396, 65397, 57204, 65399, 57207, 57205, 65395, 24444, 32639, 24447, 24445, 52082, 32668, 24477, 24478, 24476, 24479, 32669, 52085, 24494, 24495, 24512, 24526, 24527, 24528, 32732, 24540, 24541, 32735, 24543, 24542, 32734, 32733, 32558, 24560, 32767], 4133: [19, 24, 35, 65, 67, 70, 71, 72, 76, 77, 79, 45610, 103, 113, 134, 135, 140, 141, 143, 45634, 277, 289, 293, 295, 297, 300, 302, 303, 309, 321, 322, 323, 324, 325, 327, 329, 330, 331, 332, 334, 335, 341, 356, 359, 373, 385, 386, 387, 388, 391, 393, 394, 395, 398, 399, 425, 430, 431, 433, 439, 441, 529, 535, 545, 547, 551, 554, 556, 558, 559, 561, 563, 565, 567, 570, 577, 579, 580, 581, 583, 585, 586, 587, 588, 590, 591, 593, 594, 625, 631, 641, 643, 644, 647, 649, 651, 654, 655, 673, 675, 681, 682, 686, 687, 690, 697, 706, 709, 714, 722, 724, 725, 730, 731, 732, 734, 741, 756, 757, 764, 766, 789, 791, 801, 805, 807, 812, 814, 817, 821, 823, 833, 834, 836, 837, 839, 842, 843, 844, 846, 847, 849, 853, 855, 865, 885, 887, 900, 903, 910, 911, 945, 52291, 65318, 981, 65324, 988, 990, 999, 1009, 1013, 1015, 1020, 1022, 1023, 45795, 1313, 1315, 1322, 1327, 1329, 1331, 1338, 1345, 1346, 1347, 1348, 1349, 1350, 1351, 1352, 1354, 1355, 1356, 1357, 1358, 1359, 1361, 1362, 1365, 1370, 1377, 1379, 1384, 1386, 1399, 1412, 1414, 1415, 1420, 1421, 1422, 1423, 1426, 1443, 1448, 1450, 1455, 1458, 1466, 1477, 1493, 1498, 1499, 1500, 1502, 1503, 1509, 45891, 1521, 1525, 1534, 45898, 1553, 1555, 1557, 1559, 1560, 1565, 1567, 1569, 1570, 1571, 1572, 1574, 1575, 1576, 1577, 1578, 1579, 1580, 1581, 1582, 1583, 1585, 1586, 1587, 1588, 1589, 1590, 1591, 1592, 1593, 1594, 1595, 1596, 1597, 1598, 1599, 1601, 1602, 1603, 1605, 1606, 1607, 1608, 1609, 1610, 1611, 1612, 1613, 1614, 1615, 1620, 1623, 1628, 1630, 1633, 1635, 1636, 1638, 1639, 1640, 1641, 1642, 1643, 1644, 1645, 1649, 1651, 1653, 1655, 1656, 1661, 1663, 1665, 1666, 1667, 1670, 1671, 1673, 1674, 1675, 1676, 1677, 1679, 1681, 1682, 1683, 1686, 1687, 1688, 1692, 1693, 1694, 1695, 1697, 1698, 1699, 1700, 1702, 1703, 1704, 1705, 1706, 1707, 1708, 1709, 1710, 1711, 1713, 1714, 1715, 1716, 1718, 1719, 1720, 1721, 1722, 1723, 1724, 1725, 1726, 1727, 1729, 1731, 1733, 1735, 1736, 1740, 1741, 1742, 1743, 1745, 1746, 1748, 1749, 1751, 1754, 1755, 1756, 1758, 1759, 1761, 1763, 1765, 1767, 1768, 1772, 1773, 1774, 1775, 1777, 1778, 1780, 1781, 1783, 1786, 1787, 1788, 1790, 1791, 1809, 1813, 1825, 1829, 1834, 1838, 1839, 1841, 1845, 1849, 1850, 1857, 1859, 1860, 1861, 1862, 1863, 1864, 1865, 1866, 1867, 1868, 1869, 1870, 1871, 1873, 1874, 1877, 1889, 1905, 1907, 1909, 1911, 1912, 1921, 1923, 1924, 1926, 1927, 1929, 1931, 1932, 1933, 1934, 1935, 1946, 1969, 1971, 1977, 1994, 2017, 2023, 2024, 2359, 2369, 2370, 2371, 2372, 2375, 2376, 2377, 2378, 2379, 2381, 2382, 2383, 2385, 2391, 2418, 2426, 2433, 2434, 2435, 2440, 2441, 2442, 2443, 2449, 2455, 2465, 2471, 2481, 2487, 2488, 2494, 2497, 2503, 2506, 2507, 2513, 2519, 2529, 2530, 2532, 2535, 2537, 2538, 2539, 2542, 2543, 2545, 2551, 2586, 2593, 2594, 2595, 2597, 2599, 2600, 2602, 2616, 2618, 2619, 2620, 2622, 2623, 2625, 2626, 2627, 2628, 2629, 2631, 2632, 2633, 2634, 2635, 2636, 2637, 2638, 2639, 2648, 2650, 2657, 2659, 2663, 2682, 2689, 2690, 2691, 2692, 2695, 2697, 2698, 2699, 2702, 2703, 2711, 2713, 2721, 2722, 2723, 2727, 2728, 2729, 2730, 2737, 2738, 2739, 2743, 2745, 2746, 2751, 2754, 2757, 2761, 2762, 2778, 2785, 2791, 2794, 2796, 2802, 2803, 2805, 2809, 2810, 2812, 2881, 2882, 2883, 2884, 2885, 2887, 2888, 2889, 2890, 2891, 2892, 2893, 2894, 2895, 2938, 2945, 2947, 2952, 2953, 2955, 2961, 2969, 2977, 2983, 2984, 2993, 2996, 2999, 3000, 3009, 3015, 3018, 3025, 3031, 3041, 3042, 3045, 3047, 3050, 3052, 3054, 3057, 3063, 3068, 3070, 3089, 3105, 3107, 3109, 3121, 3129, 3134, 3135, 3137, 3138, 3139, 3140, 3141, 3143, 3144, 3145, 3146, 3147, 3148, 3149, 3150, 3151, 3153, 3157, 3167, 3169, 3171, 3185, 3196, 3201, 3202, 3203, 3204, 3207, 3208, 3209, 3210, 3211, 3214, 3215, 3219, 3220, 3234, 3235, 3249, 3250, 3251, 3269, 3282, 3284, 3285, 3292, 3301, 3303, 3313, 3314, 3317, 3322, 3323, 3326, 3327, 3383, 3384, 3393, 3394, 3395, 3396, 3399, 3400, 3401, 3402, 3403, 3405, 3407, 3409, 3415, 3418, 3442, 3457, 3459, 3464, 3465, 3467, 3479, 3489, 3491, 3505, 3507, 3511, 3553, 3554, 3556, 3559, 3649, 3650, 3651, 3652, 3655, 3657, 3658, 3659, 3662, 3663, 3713, 3715, 3721, 3723, 3731, 3761, 3763, 20290, 3873, 3874, 3877, 3879, 3900, 3902, 3903, 3908, 3909, 3911, 3914, 3915, 3916, 3918, 3934, 3935, 3937, 3938, 4017, 4018, 4023, 4037, 4039, 4049, 4050, 4053, 4055, 4069, 4071, 4076, 4081, 4082, 4085, 4087, 4090, 4092, 4094, 4095, 4161, 4163, 4172, 4173, 4225, 4227, 4236, 4237, 4252, 4253, 4273, 4389, 4391, 37159, 37162, 4397, 37163, 37165, 37169, 37171, 37170, 37175, 37179, 37181, 4417, 4418, 37185, 37187, 4421, 4422, 4423, 37192, 4425, 37194, 4427, 37191, 37195, 37198, 37199, 37197, 4437, 4439, 37210, 37211, 37213, 37224, 4457, 4459, 4465, 37249, 37250, 37251, 4486, 4487, 37256, 4489, 4491, 37261, 37262, 37263, 4502, 4503, 37271, 4507, 4508, 37283, 4523, 37291, 37295, 37293, 37303, 4539, 37307, 4549, 4554, 4561, 37331, 4565, 4567, 37336, 37343, 4577, 4578, 4581, 4583, 4586, 37363, 4597, 4602, 37374, 4625, 4626, 4635, 4636, 37405, 37407, 37409, 37410, 37412, 4645, 4647, 37415, 4652, 37422, 4657, 4658, 37425, 37426, 37427, 40003, 37431, 40004, 4666, 37434, 37435, 37437, 37438, 37439, 4673, 4674, 37441, 37444, 4677, 37442, 4679, 37447, 4681, 4682, 37451, 4684, 37450, 4686, 37455, 37454, 37453, 40010, 4695, 37463, 37466, 37467, 37470, 37479, 37482, 37483, 4722, 37496, 4730, 37505, 37507, 37508, 37511, 37512, 37518, 37519, 37530, 37531, 37533, 37537, 37538, 37539, 37546, 37550, 37551, 37547, 37549, 37559, 37560, 37562, 37566, 37570, 4805, 37572, 37575, 4810, 37571, 4814, 37585, 37588, 4821, 37587, 37591, 37592, 4830, 37595, 4833, 4834, 37601, 37604, 4837, 37603, 4839, 37607, 4841, 4842, 37602, 4844, 4846, 37619, 4853, 37617, 37624, 4857, 37623, 4862, 37629, 37667, 4901, 4903, 37672, 4910, 37678, 37679, 37683, 37688, 37694, 37695, 4929, 4930, 37699, 37700, 4933, 4934, 4935, 37703, 4937, 4938, 4939, 4940, 37706, 4942, 37711, 37710, 37713, 37707, 37715, 37709, 4949, 4951, 37720, 4956, 37727, 37726, 37729, 37735, 37738, 37739, 4977, 4986, 4998, 4999, 5001, 5003, 5014, 37789, 37791, 37806, 37807, 5051, 37819, 37822, 37823, 5057, 5061, 5063, 5065, 5066, 5068, 5070, 5073, 37842, 5077, 5079, 5081, 5082, 5084, 37853, 5086, 5089, 5090, 5093, 5095, 5097, 5098, 5100, 5102, 5105, 37874, 37873, 5109, 5111, 37879, 5113, 5114, 37883, 5116, 37885, 5118, 38193, 5433, 5434, 38209, 38210, 38211, 38212, 5446, 5447, 38215, 5449, 5450, 5451, 5452, 5454, 38231, 5468, 5470, 5483, 38273, 38275, 38276, 5510, 5511, 38279, 5513, 5515, 5527, 38305, 5561, 38335, 5569, 38359, 38360, 5596, 5598, 5601, 5612, 38388, 38391, 38392, 5657, 5658, 5659, 5660, 5661, 38433, 38435, 38436, 38439, 5673, 5675, 5676, 5677, 5678, 38449, 38450, 38451, 38452, 38455, 38456, 5689, 5690, 38465, 38466, 38468, 38471, 5705, 5706, 5708, 38477, 5710, 38479, 38481, 38483, 5724, 5726, 38497, 38498, 38504, 5753, 5754, 38529, 38530, 38541, 38543, 38548, 38551, 5785, 5787, 5788, 5789, 38561, 38562, 38563, 38568, 5801, 5803, 5804, 5805, 38577, 38578, 38580, 38583, 38584, 5825, 5826, 5836, 5838, 5841, 5842, 38610, 38609, 5852, 38621, 5854, 38623, 5857, 5858, 5868, 5870, 5873, 5874, 38641, 38642, 5884, 38653, 5886, 38655, 38680, 5915, 38690, 38692, 38721, 38722, 38724, 5958, 5959, 38727, 5961, 5963, 38776, 6022, 6023, 6025, 6027, 6038, 6039, 6044, 6059, 6073, 38849, 38851, 38855, 38881, 38882, 38883, 38884, 38887, 6423, 6427, 6428, 6430, 39203, 6439, 6460, 6465, 6466, 39235, 39233, 39239, 6473, 6475, 6476, 6477, 6478, 6481, 6482, 39281, 39287, 6537, 6539, 6540, 6541, 6550, 6555, 6567, 6588, 6589, 39373, 39375, 39393, 39394, 39396, 39399, 39400, 39407, 6683, 39457, 39458, 39476, 39485, 39487, 39489, 39490, 39491, 39492, 39495, 39496, 6729, 6731, 6732, 6733, 39501, 39503, 39505, 39506, 39524, 39527, 39553, 39554, 39556, 39559, 39560, 6793, 6795, 6796, 6797, 39569, 6807, 39588, 6823, 6827, 39597, 39599, 39601, 39602, 62793, 39608, 6844, 6845, 39633, 39635, 39636, 39639, 6878, 6889, 6892, 39665, 39667, 6905, 6908, 6910, 6940, 39713, 39715, 39719, 39732, 39735, 6972, 6977, 6978, 39746, 39745, 39752, 6988, 6990, 6993, 6994, 39764, 39767, 39789, 39791, 39844, 39847, 39859, 39869, 7146, 7148, 7150, 7185, 7187, 39955, 7190, 7191, 7193, 39962, 7195, 7196, 7198, 7201, 7203, 39963, 7207, 7211, 7212, 39988, 39991, 7228, 7230, 39999, 7233, 7234, 7235, 40002, 40001, 7238, 7239, 40008, 7241, 40007, 7243, 7244, 7245, 7246, 40015, 40011, 7249, 7250, 40013, 40014, 40036, 7270, 7271, 7276, 7277, 40051, 40058, 7292, 7294, 7297, 40066, 7299, 40068, 40065, 7302, 7303, 40072, 7305, 40071, 7307, 7308, 7309, 7313, 40081, 7315, 40083, 7318, 7319, 7321, 7323, 7324, 7325, 7331, 7335, 40103, 7339, 7340, 7341, 40113, 40114, 7350, 7351, 40119, 7356, 7357, 40129, 40131, 40135, 40138, 40142, 40147, 53570, 40151, 7388, 7390, 40161, 40163, 53573, 40167, 40168, 7401, 7402, 53574, 7404, 40171, 7406, 40175, 40173, 40174, 40170, 40179, 40183, 7420, 7422, 7441, 40210, 7443, 40212, 7447, 40209, 7453, 7457, 7459, 40227, 7463, 40231, 7466, 7468, 7469, 40235, 40239, 40237, 7477, 7479, 40247, 40251, 40255, 7489, 40257, 7491, 40259, 7493, 7494, 7495, 40263, 7497, 7498, 7499, 7500, 7501, 40266, 40270, 40271, 40264, 40267, 40269, 7514, 40291, 7527, 7533, 40303, 40305, 40306, 7543, 40311, 7553, 7555, 7558, 7559, 40327, 7561, 40330, 7563, 7564, 7565, 40331, 40333, 40335, 7569, 7571, 7574, 7575, 7579, 7580, 40350, 40351, 7587, 7591, 7596, 40369, 7606, 7607, 40378, 7612, 7613, 40383, 40385, 40386, 40397, 40417, 40418, 40420, 40423, 40424, 40431, 7713, 7745, 7746, 7749, 7751, 7753, 7754, 7756, 7758, 7761, 7762, 7797, 7799, 7804, 7806, 7953, 7955, 7965, 7969, 40737, 7971, 40740, 40739, 7974, 40747, 7981, 40750, 40751, 40749, 40756, 40760, 40762, 40763, 40766, 8001, 40770, 8003, 40769, 8006, 8007, 40776, 40775, 40778, 40779, 40781, 40782, 40783, 40788, 40791, 40803, 40813, 40814, 8065, 8067, 8070, 8071, 40839, 40842, 40843, 40845, 40847, 8081, 40849, 8086, 8087, 40856, 8092, 8093, 40862, 40863, 40868, 8103, 40872, 8109, 40878, 40881, 8118, 8119, 40893, 40894, 40895, 40913, 40914, 40919, 8153, 8154, 8169, 8170, 8172, 40945, 40946, 8185, 40977, 40983, 41000, 8257, 8259, 8262, 8263, 41032, 41031, 41034, 41035, 41037, 41038, 41039, 41059, 8295, 41073, 41075, 41079, 8321, 8323, 8326, 8327, 41095, 41098, 41099, 41101, 41103, 8337, 41119, 41137, 8374, 8375, 8469, 8471, 41249, 41250, 41251, 41256, 8490, 8493, 41262, 41265, 41267, 41268, 8501, 8503, 41271, 53794, 41278, 41284, 8517, 8518, 8519, 41287, 8521, 8522, 8523, 8524, 8525, 41293, 41295, 41288, 41297, 41298, 41299, 8537, 8538, 41313, 41314, 8553, 8555, 8565, 8567, 41348, 8582, 8583, 41352, 8585, 41351, 8587, 8588, 8589, 8598, 8599, 41367, 8603, 8604, 41379, 41383, 8617, 8619, 41390, 8633, 53819, 8635, 8636, 8637, 41407, 53821, 8645, 8649, 8650, 8657, 8658, 8661, 8663, 8665, 41434, 41435, 8673, 8674, 8677, 8679, 8682, 53830, 8693, 8697, 8698, 41466, 41467, 53834, 8725, 8727, 8731, 8732, 8733, 41505, 41507, 41511, 8746, 8748, 41514, 41521, 41523, 41524, 8757, 8759, 41527, 41530, 41531, 41533, 41534, 41535, 8773, 8774, 8775, 8777, 8778, 8779, 8794, 8821, 8823, 8838, 8839, 8841, 8843, 8855, 8860, 8861, 41633, 41635, 41636, 41639, 41642, 8877, 41647, 41645, 41649, 41651, 41655, 41656, 41658, 41659, 41662, 41663, 8897, 8898, 8901, 41666, 8903, 8905, 8906, 41671, 41677, 8910, 41679, 8913, 8914, 41681, 8917, 41683, 8919, 8921, 8922, 41687, 8924, 8926, 8929, 8930, 41697, 41700, 8933, 41698, 8935, 41704, 8937, 8938, 41703, 8940, 8942, 41711, 8945, 8946, 41713, 8949, 41715, 8951, 41719, 8953, 8954, 41723, 8958, 41720, 41727, 41722, 8983, 9002, 9013, 9015, 41784, 41786, 41787, 41793, 41794, 41795, 41796, 9029, 9031, 41800, 9033, 9034, 9035, 9036, 9037, 41799, 41812, 41815, 9049, 9050, 9069, 41837, 41839, 9079, 41857, 41859, 41860, 41863, 9097, 9099, 9100, 9101, 9113, 9115, 41899, 41915, 9148, 9149, 41919, 9153, 9154, 9157, 9159, 9161, 9162, 9164, 9166, 9169, 9170, 41939, 9173, 41940, 9175, 41943, 9177, 9178, 41944, 9180, 9182, 9185, 9186, 9189, 9191, 9193, 9194, 9196, 9198, 9201, 9202, 41971, 41969, 9205, 41972, 9207, 9209, 9210, 41975, 9212, 9214, 41983, 42273, 42274, 42275, 53993, 53994, 42292, 42295, 42303, 42308, 42311, 42312, 9545, 9547, 9548, 9549, 42317, 42319, 42321, 42322, 42323, 42337, 42338, 9580, 9581, 42372, 42375, 42376, 9609, 9611, 9612, 9613, 42391, 9625, 42404, 42407, 42417, 9661, 9665, 9666, 42455, 9692, 9694, 9697, 9698, 9708, 42487, 9726, 9753, 9755, 9756, 9757, 42529, 42530, 42536, 9769, 9771, 9772, 9773, 42548, 42551, 42557, 42559, 9798, 9799, 9801, 9803, 9833, 9835, 9862, 9863, 9865, 9867, 9878, 9879, 9881, 9883, 9884, 9885, 42660, 42663, 9897, 9899, 9900, 9901, 42669, 42671, 42673, 42674, 42680, 9913, 9915, 9921, 9922, 9932, 9934, 9937, 9938, 42707, 42708, 42705, 42711, 9948, 9950, 9953, 9954, 54082, 9964, 9966, 9969, 9970, 42739, 42740, 42737, 42743, 9980, 9982, 54090, 10011, 10013, 42788, 42791, 10029, 42801, 42802, 42808, 42817, 42818, 42819, 42820, 10054, 10055, 42823, 10057, 42824, 10059, 10060, 10061, 42836, 42839, 10089, 10093, 42881, 42883, 42884, 10118, 10119, 42887, 10121, 10123, 10124, 10125, 42898, 10134, 10135, 10140, 10141, 10155, 10169, 10171, 10172, 10173, 42943, 42945, 42951, 42977, 42980, 42983, 42984, 42989, 42991, 10519, 10521, 10522, 10523, 10535, 10539, 10540, 10542, 10554, 43329, 43330, 43331, 43332, 43335, 10569, 10570, 10572, 43341, 10574, 43343, 10588, 43367, 43368, 10617, 10618, 43393, 43394, 43399, 43405, 43407, 43411, 10646, 10649, 10651, 10662, 10663, 10667, 43457, 43463, 43489, 43490, 43491, 43492, 43495, 10779, 10782, 10785, 10786, 43556, 10790, 43569, 43570, 43571, 43576, 10814, 10817, 10818, 10828, 10830, 10833, 10834, 10876, 10902, 10903, 10905, 43681, 43683, 10919, 10921, 10923, 43700, 10953, 43729, 10969, 10970, 10972, 43741, 10974, 10985, 10988, 43761, 11001, 11002, 11004, 11006, 43775, 43793, 43794, 43796, 43799, 11033, 11034, 11036, 43805, 43807, 11041, 43809, 43810, 43811, 43812, 43815, 11052, 11054, 43825, 43826, 11066, 11068, 11070, 11073, 11074, 43841, 43842, 43843, 43844, 43847, 11081, 11082, 11084, 11086, 11089, 11090, 11100, 43889, 43890, 43892, 43895, 11130, 43903, 43937, 43938, 43965, 43967, 11209, 43992, 11225, 11228, 11230, 11242, 11244, 11246, 44024, 11257, 11260, 11281, 11283, 11286, 11287, 11289, 11290, 11291, 11292, 11293, 11294, 11297, 11298, 11299, 44068, 11302, 11303, 44071, 11307, 11308, 11309, 44083, 44088, 11322, 11324, 11326, 11329, 11330, 11331, 44099, 44100, 44097, 44103, 44098, 11337, 11338, 11340, 11341, 11342, 44109, 44111, 11345, 11346, 11356, 11361, 11363, 44132, 44135, 44136, 11385, 11388, 11390, 11393, 44161, 11395, 44162, 44167, 11404, 11405, 44173, 44175, 11409, 44177, 11411, 44179, 44180, 11414, 11415, 44183, 11417, 11419, 11420, 11421, 44193, 11427, 44194, 44195, 11430, 11431, 11435, 11436, 11437, 11443, 44215, 44225, 44227, 44231, 11468, 11484, 44253, 11486, 44257, 44263, 44264, 11497, 11498, 11500, 44269, 11502, 44271, 44270, 11516, 11518, 44287, 11537, 11538, 11539, 11543, 11548, 11549, 11553, 11555, 44323, 11557, 11559, 11564, 11565, 44333, 11569, 11570, 44343, 44351, 11585, 11586, 11587, 11589, 11591, 11596, 11597, 11605, 11607, 11617, 11619, 11633, 11634, 11649, 11651, 11660, 11661, 11665, 11667, 11670, 11671, 11675, 11676, 11677, 11683, 11686, 11687, 44455, 11692, 11693, 44463, 44458, 11699, 44467, 44465, 44474, 44479, 44482, 44483, 44487, 44513, 44514, 44515, 44516, 44519, 11793, 11794, 44561, 44562, 44575, 44577, 44579, 44580, 11813, 44589, 11825, 11826, 44595, 11834, 44607, 11841, 11842, 44611, 44609, 11845, 44612, 11847, 44615, 11849, 11850, 44618, 11852, 44616, 11854, 44622, 44623, 44619, 44621, 11861, 44632, 44639, 44647, 44650, 11889, 44657, 44660, 44658, 44663, 11897, 44673, 44675, 44680, 44686, 44687, 12049, 12051, 12054, 12061, 12065, 12066, 12067, 44833, 44835, 12070, 44840, 44843, 12077, 44847, 44846, 44850, 44851, 44856, 44858, 12094, 44863, 12097, 12098, 12099, 44867, 44865, 44871, 44872, 44874, 44875, 12108, 12109, 12110, 44879, 44878, 12113, 12114, 44877, 44888, 44895, 12129, 12131, 44903, 44906, 44907, 12156, 12158, 12161, 44929, 12163, 44931, 44936, 12172, 12173, 44942, 44943, 12177, 12182, 12183, 12188, 12189, 44957, 44959, 44961, 12199, 44968, 12205, 44974, 44975, 12209, 44977, 44989, 44991, 12234, 45012, 45015, 45016, 12249, 12250, 12252, 12254, 12265, 12266, 12268, 12281, 12284, 12286, 12353, 12355, 12364, 12365, 12387, 12417, 12419, 12428, 12429, 12444, 12445, 12465, 12467, 12571, 12572, 12573, 12581, 12583, 45351, 45354, 12587, 12588, 12589, 45355, 45362, 45361, 45363, 45367, 45371, 12609, 12610, 45379, 45377, 12613, 12614, 12615, 45384, 12617, 45383, 12619, 45387, 45389, 45390, 45391, 45386, 12629, 12631, 45402, 45403, 45405, 45416, 12649, 12651, 12657, 12658, 45441, 45442, 45443, 12678, 12679, 45448, 12681, 12683, 45453, 45454, 45455, 12694, 12695, 45463, 12699, 12700, 12701, 45475, 12715, 12717, 45483, 45492, 45495, 45496, 12731, 12737, 12738, 12741, 12746, 12753, 45523, 12757, 12759, 45528, 12769, 12770, 12773, 12775, 12778, 12785, 12786, 45555, 12789, 12791, 12794, 45566, 12817, 12818, 45592, 12827, 12828, 45597, 45599, 45601, 45602, 45604, 12837, 12839, 45607, 12843, 12844, 12846, 12849, 12850, 45619, 45617, 45618, 45623, 12857, 12858, 45627, 45626, 45629, 45630, 45631, 12865, 12866, 45635, 45636, 12869, 45633, 12871, 45639, 12873, 12874, 45643, 12876, 45645, 12878, 45642, 45647, 45640, 45646, 12887, 45655, 45658, 45659, 45662, 45671, 45674, 45675, 12914, 45688, 12922, 45697, 45699, 45700, 45703, 45704, 48162, 45710, 45711, 45722, 12955, 45725, 45727, 45729, 45730, 45731, 45738, 12971, 12972, 45743, 45741, 45751, 45752, 45754, 45758, 45761, 12997, 45763, 45767, 13002, 45762, 13004, 13006, 45779, 45780, 13013, 45777, 45783, 45789, 13022, 13025, 13026, 45794, 13029, 45793, 13031, 45799, 13033, 13034, 45796, 13036, 13038, 45809, 13045, 45811, 45816, 13049, 13052, 45815, 13054, 45822, 45859, 13093, 13095, 45864, 13100, 13102, 45870, 45875, 45876, 45873, 45879, 48196, 45880, 45886, 13121, 13122, 45889, 45892, 13125, 13126, 13127, 45895, 13129, 13130, 13131, 13132, 48200, 13134, 45902, 45899, 45901, 45905, 45907, 45903, 13141, 13143, 45912, 41690, 48203, 13148, 13150, 45918, 45919, 45921, 45927, 41693, 45930, 13163, 13169, 13170, 13178, 13190, 13191, 13193, 13195, 13206, 13207, 45981, 45992, 13243, 46011, 46014, 46015, 13249, 13253, 13255, 13257, 13258, 13260, 13262, 13265, 13269, 13271, 13273, 13274, 13276, 46045, 13278, 13281, 13282, 13285, 13287, 13289, 13290, 13292, 13294, 13297, 46065, 13301, 13303, 46071, 13305, 13306, 13308, 46077, 13310, 46075, 13594, 46385, 13625, 13626, 46401, 46402, 46403, 46404, 13638, 13639, 46407, 13641, 13642, 13643, 13644, 13646, 46423, 13660, 13662, 13675, 46465, 46467, 46468, 13702, 13703, 46471, 13705, 13707, 13719, 46497, 13753, 13761, 13777, 46551, 46552, 13788, 13790, 13793, 13804, 13806, 13809, 46580, 46583, 46584, 13820, 13849, 13850, 13851, 13852, 13853, 46625, 46627, 46628, 46631, 13865, 13867, 13868, 13869, 13870, 46641, 46642, 46643, 46644, 46647, 46648, 13881, 13882, 46657, 46658, 46660, 46663, 13897, 13898, 13900, 46669, 13902, 46671, 46673, 46675, 13916, 13918, 46689, 46690, 46696, 13945, 13946, 46721, 46722, 46733, 46735, 46740, 46743, 13977, 13979, 13980, 13981, 46753, 46754, 46755, 46760, 13993, 13995, 13996, 13997, 46769, 46770, 46772, 46775, 46776, 14017, 14018, 14028, 14030, 14033, 14034, 46801, 46802, 14044, 46813, 14046, 46815, 14049, 14050, 14060, 14062, 14065, 14066, 46834, 46833, 14076, 46845, 14078, 46847, 46872, 14107, 46882, 46884, 46913, 46914, 46916, 14150, 14151, 46919, 14153, 14155, 14214, 14215, 14217, 14219, 14230, 14231, 14235, 14236, 14251, 14252, 14265, 47041, 47043, 47047, 47073, 47076, 47079, 14614, 14615, 14619, 14620, 14622, 47395, 14631, 14652, 14657, 14658, 47425, 47427, 47431, 14665, 14667, 14668, 14669, 14670, 14673, 14674, 14700, 47479, 14716, 14718, 14729, 14731, 14732, 14733, 14742, 14743, 14747, 14759, 14780, 14781, 47560, 47565, 47567, 47585, 47586, 47588, 47591, 47592, 47597, 47599, 14870, 14871, 14875, 47649, 47650, 14887, 14891, 47668, 47671, 47677, 47679, 47681, 47682, 47683, 47684, 47687, 47688, 14921, 14923, 14924, 14925, 47693, 47695, 47697, 47698, 47716, 47719, 47745, 47746, 47748, 47751, 47752, 14985, 14987, 14988, 14989, 47761, 47763, 14999, 15003, 47780, 15014, 15015, 47783, 15019, 47789, 47791, 47793, 47794, 47799, 47800, 15036, 15037, 15050, 15052, 15054, 47825, 47827, 47828, 47831, 15070, 15081, 15082, 15084, 15086, 47857, 47859, 47863, 15097, 15100, 15102, 55110, 15132, 15134, 47907, 47905, 47911, 47924, 47927, 47928, 15164, 15169, 15170, 47937, 47938, 47944, 15180, 15182, 15185, 15186, 47956, 47959, 47981, 47983, 15228, 15230, 48036, 48039, 48051, 48061, 15306, 15338, 15340, 15342, 15354, 15377, 15379, 48147, 15382, 15383, 15385, 48154, 15387, 15388, 15390, 48155, 15393, 15395, 15399, 15403, 15404, 48180, 48183, 15420, 48189, 15422, 48191, 15425, 15426, 15427, 48193, 48195, 15430, 15431, 48199, 15433, 48194, 15435, 15436, 15437, 15438, 48206, 48202, 15441, 15442, 48207, 48210, 48205, 48209, 48228, 15462, 15463, 15468, 15469, 48243, 15484, 15486, 15489, 48257, 15491, 48258, 48260, 15494, 15495, 48264, 15497, 48263, 15499, 15500, 15501, 15505, 48273, 15507, 48275, 15510, 15511, 15513, 15515, 15516, 15517, 15521, 15523, 15527, 48295, 15529, 15531, 15532, 15533, 48305, 48308, 15542, 15543, 48311, 48312, 15548, 15549, 48321, 48323, 48327, 15561, 15562, 48331, 48337, 48339, 48343, 15577, 15578, 15580, 15582, 48353, 48359, 48360, 15593, 15594, 15596, 15598, 48366, 48367, 48369, 48365, 48371, 48372, 48375, 15609, 15610, 15612, 15614, 15633, 48401, 15635, 15637, 15639, 15641, 48402, 15643, 15645, 15649, 48417, 15651, 48419, 15654, 15655, 48423, 15657, 15658, 15659, 15660, 15661, 48426, 48429, 15669, 15671, 48439, 48440, 48442, 48447, 15681, 48449, 15683, 48451, 15685, 15686, 15687, 48455, 15689, 15690, 15691, 15692, 15693, 48459, 48463, 48461, 48456, 48458, 48462, 15705, 15706, 48481, 48483, 15719, 15725, 48495, 48497, 48498, 15733, 15735, 48503, 15745, 15747, 15750, 15751, 48519, 15753, 48522, 15755, 15756, 15757, 48523, 48527, 48525, 15761, 15763, 15766, 15767, 48536, 15771, 15772, 48542, 48543, 15777, 15779, 15783, 15787, 15788, 48561, 15798, 15799, 48570, 15804, 15805, 48575, 48573, 48578, 48589, 48609, 48610, 48612, 48615, 48616, 48621, 48623, 15893, 15895, 15902, 15905, 15906, 15927, 15932, 15937, 15938, 15941, 15943, 15945, 15946, 15948, 15950, 15953, 15954, 15961, 15962, 15989, 15991, 15996, 15998, 16145, 16147, 16151, 16157, 16161, 48929, 16163, 48932, 48931, 16166, 48935, 48938, 48939, 16173, 48943, 48942, 48948, 48951, 48952, 48954, 16193, 48961, 16195, 48962, 16198, 16199, 48967, 48968, 48970, 48971, 48973, 48974, 48975, 48980, 48983, 48993, 48995, 16231, 49005, 49006, 16257, 16259, 16262, 16263, 49031, 49034, 49035, 49037, 49039, 16273, 49042, 16275, 49041, 16278, 16279, 16284, 16285, 49054, 49055, 16289, 16291, 49060, 16294, 16295, 49064, 49066, 49067, 16300, 16301, 49070, 49073, 49075, 16310, 16311, 49082, 49085, 49087, 16329, 49105, 49106, 49111, 16345, 16346, 16361, 16362, 16364, 16366, 49137, 49138, 49143, 16377, 16378, 16410, 16411, 16413, 16414, 16415, 16417, 16423, 16426, 16427, 16430, 16431, 16449, 16451, 49222, 16455, 16456, 49223, 16458, 16459, 49228, 49229, 16462, 16463, 49255, 16491, 49261, 16493, 16506, 16507, 16509, 16510, 16511, 16513, 16515, 49286, 49287, 16520, 49292, 49293, 16526, 16527, 49302, 16535, 16539, 49308, 49334, 16571, 16573, 16657, 16658, 16659, 16660, 49427, 16663, 49433, 16666, 49435, 16673, 16674, 16676, 49443, 16679, 16680, 49449, 49451, 16683, 16685, 16687, 16699, 16701, 16703, 16705, 16706, 49475, 16708, 49473, 16707, 16711, 16712, 49481, 16714, 49483, 16715, 16717, 16718, 16719, 16727, 16730, 16738, 49507, 16737, 16744, 49515, 16753, 16754, 16756, 16759, 49537, 49539, 16772, 16775, 16776, 49545, 49547, 16785, 16788, 16787, 16791, 16794, 16798, 16801, 16802, 16803, 49571, 49569, 49577, 16810, 16811, 16817, 16824, 49593, 16830, 16835, 16840, 16846, 16865, 16867, 16872, 16878, 16879, 49681, 16914, 49683, 61978, 16916, 16913, 16919, 16920, 49689, 16922, 16923, 16925, 16926, 16927, 49697, 16929, 16930, 16931, 49699, 49703, 49701, 16939, 49707, 16941, 16943, 16935, 16936, 16951, 16952, 16954, 16955, 16957, 16958, 16959, 49726, 16961, 49729, 49731, 16964, 49733, 16963, 16967, 16968, 49735, 16970, 16971, 49740, 16973, 16974, 16975, 49742, 16977, 49737, 16979, 16978, 49749, 16983, 16991, 16993, 16995, 17009, 17015, 49793, 49795, 17031, 49801, 17034, 49803, 17035, 17037, 17039, 17041, 17043, 17044, 17047, 17048, 49817, 17050, 17053, 17055, 17057, 17058, 17059, 17066, 17067, 17069, 17070, 17071, 49841, 17073, 17075, 49843, 17080, 17087, 17089, 17091, 17092, 17095, 17096, 17098, 17099, 49868, 17101, 17102, 17103, 17105, 17106, 17107, 17108, 49877, 17111, 49884, 17121, 17123, 17124, 17127, 17128, 17130, 17131, 17133, 17134, 17135, 49902, 17137, 17138, 17139, 17140, 49909, 17143, 17172, 17175, 17176, 17182, 17183, 49950, 17185, 17187, 17192, 17191, 17198, 17199, 17201, 17203, 17208, 49982, 17214, 17215, 49985, 17218, 17219, 17220, 17217, 49987, 17223, 17224, 49993, 49991, 49995, 49996, 17229, 49998, 17231, 17227, 17226, 17230, 17235, 17236, 17233, 17239, 17246, 17247, 17249, 50019, 17255, 50046, 17281, 50049, 50051, 17283, 17284, 17282, 17287, 17288, 50057, 17290, 50059, 17291, 17293, 17295, 17297, 17298, 17300, 17303, 17304, 50073, 17310, 17320, 17326, 17327, 17329, 17335, 50105, 17345, 17346, 17351, 17354, 17355, 50135, 50140, 17377, 50149, 17383, 17386, 17389, 17391, 17681, 17682, 17687, 17693, 50461, 17698, 50469, 50470, 17703, 50471, 17709, 50477, 17711, 17719, 50494, 50497, 17729, 50499, 17732, 17730, 50501, 17735, 17736, 50505, 50503, 50507, 50508, 17741, 50510, 17743, 50509, 17745, 17746, 50517, 17761, 50537, 50539, 50541, 17778, 17779, 17783, 50561, 50563, 50566, 50567, 50569, 50571, 50572, 50573, 62156, 50582, 17815, 50585, 50588, 50589, 17821, 17823, 17825, 50605, 50609, 17841, 50611, 17843, 50614, 50615, 50617, 50620, 50621, 17860, 17863, 17864, 50645, 50652, 17896, 50670, 50677, 50705, 50707, 17940, 50710, 50711, 17943, 50713, 50715, 50716, 50717, 50718, 17953, 17954, 50721, 50723, 17955, 50726, 50727, 17960, 50729, 17956, 50731, 50732, 50733, 17959, 17969, 17971, 62188, 50748, 50750, 50753, 17985, 50755, 17988, 50757, 50758, 17991, 17992, 50761, 50759, 50763, 50764, 50765, 50766, 17999, 17997, 18004, 50773, 18007, 50775, 18017, 18018, 50787, 50785, 50790, 50791, 50796, 50797, 50812, 50814, 50817, 18050, 50819, 18052, 18049, 50822, 18055, 18056, 50825, 50823, 50827, 50828, 50829, 50833, 50835, 18068, 50838, 50839, 18071, 50841, 50843, 50844, 50845, 18077, 18079, 18081, 18082, 50851, 18083, 50849, 50854, 50855, 18088, 50857, 50859, 50860, 50861, 18097, 18098, 50867, 50865, 50870, 50871, 50876, 50877, 18113, 18114, 50885, 50887, 50892, 18125, 50894, 18127, 50901, 50903, 50908, 50910, 18145, 18146, 50917, 50919, 50924, 18157, 50926, 18159, 50933, 50935, 50940, 50942, 50961, 18194, 50963, 18196, 50979, 50983, 18216, 50988, 18221, 18241, 18242, 51011, 18244, 18243, 51009, 18247, 18248, 51017, 51015, 51019, 51020, 18253, 51021, 18255, 18273, 18274, 51043, 18279, 51051, 18290, 18295, 51073, 18305, 18307, 18308, 51075, 51078, 18311, 18312, 51081, 51079, 51083, 51084, 51085, 18322, 51094, 51097, 18333, 51105, 51107, 51111, 18354, 18353, 51126, 18359, 51129, 51133, 18386, 18387, 18388, 18391, 18417, 18418, 18419, 18420, 18423, 62281, 51474, 18707, 51477, 18705, 18711, 51481, 51483, 51486, 18721, 18722, 51493, 51490, 18728, 51499, 18727, 51505, 51506, 18740, 51509, 18743, 51511, 18753, 18754, 51522, 18756, 51525, 51523, 18759, 51527, 51529, 51530, 51531, 51532, 18765, 51534, 18767, 18769, 18770, 18776, 18785, 18801, 18807, 51578, 51582, 18817, 18818, 51585, 51587, 51593, 51595, 18829, 18831, 18836, 18839, 51611, 18865, 18867, 51643, 18897, 18900, 18898, 18903, 18904, 18909, 18911, 51681, 51682, 51689, 51690, 18930, 18929, 18932, 18935, 18936, 18941, 18943, 18961, 18962, 18968, 51745, 51746, 51747, 18980, 18983, 51755, 18989, 18991, 18994, 18993, 51769, 19009, 19010, 51777, 51778, 51781, 19012, 51783, 19016, 51785, 51786, 19011, 51788, 19015, 51790, 51787, 51804, 19037, 19039, 19047, 51817, 51833, 51841, 19073, 51843, 19076, 19075, 19079, 51849, 51851, 51857, 19089, 19090, 51859, 19096, 51867, 51873, 51875, 19108, 19111, 51883, 19117, 19119, 19124, 19127, 51899, 51905, 51906, 19139, 19140, 19137, 51911, 19143, 51916, 51921, 51922, 51925, 51927, 51929, 51932, 51937, 51938, 19171, 19172, 51941, 19169, 51943, 19175, 51946, 51948, 51950, 51953, 51954, 51957, 51959, 51961, 19217, 51986, 19219, 51993, 51998, 52002, 19236, 52005, 19239, 19240, 19245, 19247, 19249, 19250, 19251, 19252, 52021, 52018, 52023, 19255, 19265, 19266, 19267, 19268, 52037, 52033, 19271, 19272, 52039, 52042, 52041, 52044, 19277, 52046, 19279, 19284, 19287, 19288, 19293, 19295, 19300, 19303, 52090, 19329, 19330, 19335, 19341, 19343, 19345, 19347, 19352, 19364, 19367, 19380, 19383, 52188, 52193, 52194, 19425, 52197, 52199, 19431, 52201, 52202, 52241, 19474, 52245, 52247, 19480, 19482, 52254, 19485, 52259, 52261, 52263, 52268, 19501, 52270, 19499, 19505, 19507, 52277, 52279, 52284, 52286, 52289, 52290, 19521, 19522, 52293, 19523, 52295, 19527, 52297, 52298, 19528, 52300, 19524, 52302, 52299, 19534, 19530, 19540, 52309, 19535, 19543, 52311, 52316, 19549, 52318, 19551, 19559, 52331, 52337, 52341, 52343, 52345, 19579, 52348, 52350, 19582, 19585, 19586, 52355, 52353, 19581, 19588, 19591, 19587, 52361, 52363, 52369, 52371, 52377, 52379, 52387, 19620, 19623, 19629, 19631, 19636, 19639, 19649, 52421, 52423, 19655, 52430, 19667, 52437, 19671, 52439, 19675, 52444, 19677, 52446, 19678, 19681, 19683, 19684, 52453, 19687, 52455, 52460, 52462, 19697, 19699, 52469, 19703, 19704, 52471, 19707, 52476, 19709, 19711, 52478, 19729, 19731, 19735, 52505, 19738, 19739, 19741, 19742, 19745, 19747, 19748, 19746, 19751, 19752, 19755, 52523, 19758, 19768, 19770, 19773, 19775, 19777, 52545, 19779, 52547, 19780, 19778, 19783, 19784, 52553, 19786, 19787, 52555, 19789, 19790, 19791, 19793, 19795, 19799, 19803, 19806, 19818, 52587, 19821, 19825, 19827, 19831, 52609, 19841, 19843, 52611, 19847, 19848, 52617, 19850, 19851, 52619, 19853, 19854, 19855, 19857, 19859, 52627, 19863, 19866, 19867, 19869, 19870, 19871, 52643, 19879, 19882, 19883, 19886, 19896, 19901, 19921, 19922, 19924, 19927, 19928, 19933, 19935, 19953, 19954, 19956, 19959, 19960, 19965, 20001, 20002, 20003, 52773, 20007, 20008, 20020, 20023, 20033, 20034, 20035, 20036, 52805, 20039, 20040, 52807, 20042, 20043, 52812, 20045, 20046, 20047, 52814, 20049, 20050, 20051, 20055, 20056, 20065, 20067, 20097, 20098, 20103, 20106, 20107, 20109, 20111, 20113, 20115, 20116, 20119, 20145, 20147, 20152, 20241, 20243, 53018, 20250, 20253, 20260, 20263, 20264, 20266, 20267, 20270, 20271, 20276, 20279, 53057, 53058, 20289, 20292, 53061, 20291, 20295, 20296, 53065, 53066, 20299, 20298, 53063, 53070, 20302, 20303, 53068, 20301, 20312, 20330, 20331, 53113, 20353, 20354, 20355, 20360, 20365, 20366, 20367, 20369, 20371, 20375, 20378, 20381, 20383, 20388, 20391, 20392, 20394, 20395, 20398, 20417, 20418, 20423, 53191, 53198, 53205, 53207, 53212, 53214, 20449, 20450, 53221, 20455, 53223, 53228, 53230, 53237, 53239, 53244, 53246, 53272, 20504, 53288, 20522, 20523, 20526, 53313, 53315, 53319, 53320, 20552, 20554, 20555, 53325, 20558, 53327, 20559, 53351, 53359, 20591, 53361, 53363, 53367, 53368, 20600, 53373, 20605, 53375, 20607, 53377, 53379, 53384, 20616, 20622, 20623, 53399, 20634, 20635, 53431, 20755, 53523, 20759, 53529, 53539, 20771, 53545, 53547, 20781, 20783, 53549, 53557, 53561, 53562, 53565, 53569, 20801, 53571, 20804, 20802, 20803, 20807, 20808, 53577, 20810, 53579, 20811, 20813, 53575, 20815, 53578, 53585, 53603, 53606, 53609, 53611, 20846, 20847, 20849, 20851, 20855, 62761, 53626, 53625, 53633, 53635, 20868, 53638, 20871, 20872, 53641, 49739, 53643, 53639, 20884, 20883, 20890, 53659, 20891, 53665, 53667, 20899, 20898, 53673, 20906, 20907, 53675, 20909, 20914, 20913, 53689, 53691, 53693, 20931, 20936, 53713, 53719, 53721, 20961, 20963, 53730, 53733, 20968, 53737, 53738, 53745, 53753, 53777, 53779, 53781, 21015, 53785, 21019, 53795, 21027, 53793, 53797, 53799, 53801, 53803, 21035, 21037, 21038, 53805, 53804, 53813, 53817, 21051, 53818, 53822, 53825, 21057, 21059, 53827, 53829, 53826, 21063, 21064, 53831, 21066, 21067, 53835, 53836, 53838, 21071, 21070, 21073, 53833, 21075, 21069, 53845, 53850, 53849, 21102, 21105, 53877, 21111, 53881, 53889, 53891, 53894, 21127, 53895, 53897, 21130, 21131, 53899, 21137, 21139, 21143, 21144, 53913, 53915, 21147, 21153, 21154, 21155, 53931, 21165, 21167, 53932, 53937, 53933, 53939, 53943, 53945, 53947, 53949, 21185, 21187, 21191, 53964, 21201, 21202, 21203, 21204, 53973, 21207, 53977, 53980, 21217, 21219, 21220, 53985, 21223, 21224, 21226, 21227, 53998, 21233, 21234, 21235, 54005, 54002, 54009, 21271, 54042, 54041, 21283, 54057, 21295, 54069, 54073, 54074, 54081, 21313, 54083, 21314, 21315, 21316, 21319, 54085, 54089, 54087, 54091, 21323, 54092, 21326, 54094, 21322, 21327, 21331, 54097, 54105, 54106, 54142, 54145, 21377, 54147, 21379, 21380, 21383, 54153, 21386, 54155, 21387, 21396, 21394, 21400, 56358, 21411, 21416, 21422, 21431, 54201, 54203, 21442, 21451, 54220, 54225, 54231, 54236, 21473, 21474, 54242, 54245, 21479, 54249, 21482, 21483, 54254, 54250, 54257, 54265, 56386, 56390, 54545, 54547, 54552, 54557, 54563, 54567, 54568, 21799, 54565, 54590, 54593, 21826, 54595, 21828, 21825, 54597, 21831, 54600, 54601, 54599, 54603, 54604, 54605, 54606, 54607, 54602, 54613, 54617, 54618, 54633, 54635, 54637, 54639, 21875, 54657, 54659, 54664, 54665, 54667, 54681, 54683, 54685, 54687, 21922, 21921, 54696, 54705, 54707, 54711, 54713, 54715, 54717, 54719, 21959, 21960, 54748, 21988, 21991, 21992, 54766, 54801, 54803, 22036, 22039, 54808, 54809, 54807, 54811, 54812, 54813, 54814, 54815, 54817, 22049, 54819, 22051, 22050, 54821, 54823, 54824, 54825, 22056, 54827, 54826, 54829, 54828, 54831, 54841, 54843, 54844, 54845, 54846, 54849, 54851, 22084, 54853, 54854, 54855, 54856, 22088, 22087, 54859, 54857, 22093, 54861, 54863, 22095, 54860, 54862, 54858, 54869, 54871, 54873, 54874, 22113, 54881, 22114, 54883, 54886, 54887, 54893, 54895, 54897, 54899, 49989, 54903, 54904, 54908, 54909, 54910, 54911, 54913, 54915, 22148, 54918, 22151, 54920, 22152, 54921, 54923, 54919, 54929, 54931, 22164, 22167, 54936, 54937, 54935, 54939, 54941, 22173, 54943, 22175, 54945, 22177, 54947, 22179, 22178, 54951, 22184, 54952, 54953, 54955, 54956, 54957, 54959, 22193, 54961, 22194, 54963, 54966, 54967, 54969, 54971, 54972, 54973, 54975, 22209, 22210, 54977, 54978, 54981, 54983, 54988, 22221, 54990, 22223, 54993, 54994, 54995, 54997, 54999, 55000, 55004, 55005, 55006, 55007, 22241, 22242, 55010, 55009, 55013, 55015, 55020, 22253, 55022, 22255, 55025, 55026, 55027, 55029, 55031, 55032, 55036, 55037, 55038, 55039, 22289, 55059, 22295, 55067, 55069, 55071, 55075, 55083, 55084, 22317, 55099, 22337, 22338, 22339, 22340, 55105, 55107, 22343, 55112, 55113, 55111, 55115, 22344, 55117, 22349, 22351, 55119, 55139, 55147, 22385, 22386, 55155, 22388, 22391, 55165, 55167, 22401, 55169, 55171, 22403, 22404, 55174, 22407, 55175, 55177, 55179, 22417, 55193, 55195, 55201, 55209, 55211, 55213, 55222, 22455, 55225, 55227, 55229, 55249, 22481, 22484, 22483, 22482, 55255, 22487, 55261, 55281, 22513, 55283, 22516, 22515, 22514, 22519, 55293, 55573, 55577, 55579, 55581, 22817, 55589, 55593, 55595, 55597, 55605, 22839, 55607, 55609, 55611, 55613, 55617, 55619, 22852, 55621, 22855, 55623, 55624, 55625, 55627, 55628, 55629, 55630, 55631, 56647, 55645, 55647, 22883, 55656, 55678, 55681, 55683, 55689, 55691, 55692, 55693, 22932, 55703, 55719, 22961, 22963, 55735, 55736, 55739, 55752, 55777, 55779, 55784, 23031, 23057, 23064, 55841, 55843, 23076, 55849, 55847, 55851, 23089, 55864, 55862, 55865, 55867, 55873, 23105, 55875, 23106, 55877, 55874, 55879, 55880, 23112, 55881, 55883, 55884, 55885, 55886, 55887, 55900, 23143, 55913, 55937, 55939, 55943, 55945, 55947, 55948, 55949, 55951, 55953, 23186, 55955, 23185, 55960, 23192, 55961, 55963, 55964, 55969, 55971, 23204, 23207, 55976, 55975, 55979, 23220, 55991, 55993, 55995, 23233, 56005, 56007, 23239, 56012, 56013, 56015, 56021, 37186, 56023, 56025, 56028, 37188, 23265, 23267, 23268, 56037, 56039, 23271, 56041, 56042, 56044, 56045, 56046, 56047, 56053, 56055, 56057, 23313, 23315, 56082, 56085, 56093, 56101, 56109, 23345, 56113, 23347, 56117, 56114, 56119, 23351, 56125, 23361, 23362, 23363, 23364, 56133, 56129, 56135, 23367, 56136, 56131, 56130, 56140, 56141, 56142, 23373, 23375, 56143, 23380, 56157, 56168, 23425, 23426, 23431, 23437, 23439, 23443, 56215, 23460, 56231, 56248, 23490, 56284, 56289, 23521, 56291, 23522, 56293, 56295, 23527, 56298, 56297, 56300, 56302, 56313, 23569, 56341, 56345, 56348, 56350, 23582, 23585, 56355, 23588, 56357, 23591, 56363, 56364, 23597, 23599, 56366, 56373, 23601, 56375, 56376, 56374, 56380, 56382, 56385, 23617, 23619, 23618, 56389, 56387, 23623, 56391, 56392, 56393, 56395, 56396, 56397, 56398, 56399, 23624, 56401, 23636, 56405, 23639, 56407, 56408, 56412, 56413, 56414, 56415, 23647, 56417, 23645, 56419, 23655, 56424, 56425, 56427, 56428, 56429, 56433, 56437, 56439, 23674, 23675, 56444, 56446, 23678, 23679, 23681, 23682, 56449, 56451, 56454, 56455, 23687, 56457, 56459, 56460, 56461, 56463, 23697, 23698, 56465, 56467, 56470, 56471, 23704, 56473, 56475, 56476, 56477, 56481, 56486, 23719, 56487, 56489, 56491, 56492, 23725, 56493, 56497, 56499, 23732, 56502, 23735, 56504, 56505, 56503, 56507, 56508, 56509, 23745, 23747, 56517, 56519, 23751, 56521, 56522, 23761, 23763, 56533, 56535, 23767, 23768, 23770, 23771, 56540, 23773, 56542, 23774, 23775, 23777, 56538, 23779, 23780, 56549, 56551, 23783, 56553, 56554, 56556, 56558, 23793, 23795, 56565, 56567, 23799, 23800, 23802, 23803, 56572, 23805, 23806, 23807, 56574, 56570, 23825, 23827, 23834, 23847, 56617, 23850, 56621, 56625, 56631, 56633, 23869, 56637, 23871, 56641, 23873, 56643, 23875, 56646, 23879, 23880, 56649, 23882, 23883, 56651, 23885, 23886, 23887, 56652, 56653, 23898, 23914, 23937, 56705, 56707, 23939, 56710, 56711, 56713, 23946, 23947, 56715, 23949, 23950, 23951, 56717, 23953, 56723, 23955, 56716, 56726, 23959, 56727, 56731, 23963, 56732, 56733, 56739, 23975, 56747, 56743, 56749, 56755, 56759, 23994, 56763, 56765, 24017, 24018, 24020, 24023, 24024, 24049, 24050, 24055, 24097, 56869, 24127, 24132, 56901, 56903, 24135, 24136, 24138, 24139, 56908, 24141, 24142, 24143, 56910, 24154, 24202, 24203, 24205, 24207, 24212, 24215, 24241, 24243, 62185, 24337, 57121, 57123, 57126, 24359, 57127, 57128, 24360, 57133, 57135, 57144, 57149, 57151, 57153, 24385, 57155, 24387, 24386, 24388, 57159, 57160, 24391, 57157, 57154, 57164, 57165, 24398, 57167, 24399, 24397, 57166, 24408, 57185, 57187, 37418, 57192, 37419, 24426, 24427, 37421, 24449, 24450, 24451, 57219, 57217, 57222, 57223, 57228, 57229, 24462, 57231, 24463, 24465, 57233, 57235, 24467, 24461, 24471, 24474, 24475, 57249, 24484, 24488, 57255, 24490, 24491, 57261, 57265, 57271, 57272, 24506, 24507, 57276, 57277, 24513, 57285, 57287, 57301, 57305, 57306, 57310, 24545, 24546, 37443, 57317, 57319, 24551, 57321, 57322, 57324, 57326, 57333, 57335, 57337, 57338, 37448, 57340, 57342, 57361, 57363, 57377, 57383, 57409, 57411, 57414, 57415, 57416, 57420, 57421, 57423, 57457, 57459, 57463, 57469, 57471, 57473, 57475, 57478, 57479, 57480, 50502, 57484, 57485, 57491, 57494, 57617, 57618, 57623, 57626, 57633, 57634, 57636, 57637, 57639, 57641, 57642, 57643, 57649, 57655, 57657, 57658, 57661, 57665, 57666, 57668, 57669, 57670, 57671, 57673, 57674, 57675, 57676, 57678, 57679, 57685, 57687, 57692, 57694, 57702, 57703, 57707, 57713, 57719, 57721, 57722, 17986, 17987, 57732, 57734, 57735, 57737, 57739, 57742, 57743, 57745, 57746, 57753, 57767, 57769, 57770, 57773, 57783, 57785, 57786, 57801, 57802, 57813, 57817, 57818, 57829, 57833, 57834, 57845, 57849, 57850, 57873, 57874, 57879, 57881, 57882, 57884, 57889, 57890, 57895, 57897, 57898, 57900, 57901, 57905, 57906, 57909, 57910, 57911, 57913, 57914, 57915, 57916, 57917, 57918, 57921, 57922, 57924, 57925, 57926, 57927, 57929, 57930, 57931, 57932, 57934, 57935, 57937, 57938, 57941, 57943, 57945, 57946, 57959, 57975, 57977, 57978, 57980, 57982, 57990, 57991, 57993, 57995, 58001, 58002, 58009, 58014, 58023, 58025, 58026, 58028, 58029, 58039, 58041, 58044, 58045, 58049, 58055, 58057, 58060, 58065, 58066, 58069, 58071, 58073, 58074, 58075, 58079, 58081, 58082, 58084, 58085, 58087, 37597, 58089, 58090, 58092, 58094, 58095, 58097, 58098, 58101, 58103, 58105, 58106, 58107, 58111, 58129, 58130, 58133, 58135, 58137, 58138, 58149, 58153, 58154, 58165, 58169, 58170, 58177, 58178, 58180, 58181, 58183, 58185, 58186, 58187, 58188, 58190, 58191, 58197, 58199, 57158, 58204, 58207, 58225, 58231, 58233, 58234, 58241, 58242, 58244, 58247, 58250, 58251, 58254, 58255, 58257, 58258, 58266, 58289, 58290, 58298, 58305, 58311, 58314, 58321, 58327, 58329, 58330, 58332, 58334, 58337, 58338, 58341, 58343, 58345, 58346, 58347, 58348, 58350, 58353, 58359, 58361, 58362, 58364, 58366, 37697, 50725, 58641, 58643, 58644, 58647, 58648, 58650, 58653, 58655, 58657, 58658, 58659, 58663, 58665, 58666, 58667, 58668, 58669, 58670, 58671, 58673, 58674, 58684, 58686, 58689, 58690, 58691, 58692, 58695, 58696, 58697, 58698, 58699, 58700, 58701, 58702, 58703, 58713, 58714, 58716, 58724, 58727, 58733, 58735, 58737, 58738, 58743, 58746, 58747, 58748, 58750, 58751, 58753, 58755, 58760, 58769, 58770, 58771, 58775, 58782, 58785, 58791, 58794, 58797, 58807, 58818, 58823, 58826, 58831, 58833, 58841, 58842, 58849, 58850, 58852, 58855, 58858, 58860, 58862, 58863, 58865, 58873, 58874, 58897, 58898, 58899, 58903, 58904, 58908, 58909, 58910, 58911, 58913, 58915, 58916, 58918, 58919, 58920, 58921, 58922, 58923, 58924, 58925, 58926, 58927, 58932, 58934, 58935, 58937, 58939, 58940, 58941, 58942, 58945, 58946, 58947, 58948, 58950, 58951, 58952, 58953, 58954, 58955, 58956, 58957, 58958, 58959, 58969, 58970, 58974, 58975, 58982, 58983, 58986, 58987, 58989, 58991, 58993, 58995, 58999, 59000, 59004, 59005, 59006, 59007, 59009, 59010, 59011, 59012, 59014, 59015, 59016, 59017, 59018, 59019, 59022, 59023, 59025, 59026, 59027, 59031, 59032, 59033, 59035, 59037, 59038, 59039, 59041, 59043, 59044, 59046, 59047, 59048, 59049, 59050, 59051, 59052, 59053, 59055, 59062, 59063, 59065, 59066, 59067, 59068, 59069, 59071, 59073, 59074, 59081, 59082, 59083, 59084, 59086, 59089, 59090, 59091, 59095, 59096, 59097, 59098, 59100, 59101, 59102, 59103, 59105, 59106, 59113, 59114, 59115, 59116, 59118, 59121, 59122, 59123, 59127, 59128, 59129, 59130, 59132, 59133, 59134, 59135, 59153, 59155, 59159, 59162, 59163, 59165, 59166, 59169, 59170, 59171, 59174, 59175, 59176, 59178, 59180, 59181, 59183, 59185, 59186, 59190, 59191, 59195, 59196, 59198, 59201, 59202, 59203, 59204, 59206, 59207, 59208, 59209, 59210, 59211, 59212, 59213, 59214, 59215, 59225, 59226, 59228, 59230, 59233, 59239, 59242, 59243, 59249, 59250, 59251, 59255, 59256, 59258, 59260, 59261, 59263, 59268, 59270, 59271, 59273, 59275, 59278, 59279, 59281, 59282, 59289, 59290, 59303, 59309, 59313, 59314, 59318, 59319, 59322, 59324, 59345, 59347, 59351, 59352, 59354, 59357, 59359, 59377, 59379, 59380, 59383, 59384, 59386, 59387, 59390, 59391, 59665, 59666, 59668, 59671, 59686, 59690, 59691, 59702, 59707, 59711, 59713, 59714, 59715, 59718, 59719, 59720, 59721, 59722, 59723, 59724, 59725, 59726, 59727, 59735, 59743, 59751, 59761, 59767, 59777, 59778, 59782, 59783, 59785, 59786, 59787, 59788, 59789, 59793, 59795, 59799, 59801, 59814, 59823, 59825, 59827, 59828, 59831, 59835, 59841, 59848, 59857, 59863, 59866, 59870, 59871, 59873, 59875, 59880, 59889, 59892, 59895, 59898, 59899, 59902, 59903, 59921, 59922, 59923, 59927, 59928, 59930, 59937, 59938, 59939, 59943, 59945, 59948, 59949, 59950, 59953, 59954, 59955, 59958, 59959, 59960, 59961, 59962, 59963, 59964, 59965, 59969, 59970, 59971, 59972, 59975, 59976, 59977, 59978, 59979, 59980, 59981, 59982, 59983, 59985, 59986, 59987, 59992, 59996, 60001, 60002, 60009, 60017, 60018, 60036, 60039, 60041, 60043, 60044, 60045, 60046, 60047, 60049, 60051, 60052, 60055, 51014, 60058, 60059, 60060, 60065, 60066, 60067, 60071, 60073, 60076, 60081, 60082, 60087, 60091, 60092, 60094, 60095, 60097, 60103, 60108, 60113, 60114, 60121, 60122, 60129, 60130, 60132, 60135, 60138, 60140, 60142, 60143, 60145, 60146, 60153, 60154, 60177, 60178, 60183, 60193, 60194, 60196, 60199, 60209, 60215, 60218, 60223, 60225, 60226, 60227, 60228, 60230, 60231, 60232, 60233, 60234, 60235, 60236, 60237, 60238, 60239, 60247, 60252, 60254, 60255, 60259, 60262, 60263, 60264, 60267, 60273, 60289, 60290, 60294, 60295, 60297, 60298, 60299, 60300, 60301, 60305, 60307, 60308, 60311, 60313, 60315, 60327, 60337, 60339, 60343, 60347, 60355, 60360, 60362, 60377, 60378, 60380, 60382, 60387, 60392, 60393, 60394, 60395, 60396, 60398, 60410, 60412, 60414, 60433, 60436, 60439, 60442, 60443, 60451, 60454, 60455, 60460, 60461, 60463, 60467, 60470, 60471, 60475, 60476, 60479, 60481, 60482, 60483, 60484, 60486, 60487, 60488, 60489, 60490, 60491, 60492, 60493, 60494, 60495, 60499, 60503, 60508, 60509, 60510, 60511, 60515, 60519, 60523, 60526, 60527, 60529, 60530, 60545, 60546, 60547, 60548, 60550, 60551, 60553, 60554, 60555, 60556, 60557, 60558, 60559, 60561, 60563, 60566, 60567, 60569, 60570, 60572, 60573, 60583, 60589, 60590, 60591, 60595, 60599, 60604, 44610, 60606, 60607, 60615, 60622, 60623, 60625, 60626, 60633, 60634, 60636, 60641, 60642, 60644, 60647, 60649, 60650, 60652, 60654, 60655, 60668, 60670, 60689, 60690, 60692, 60695, 60705, 60707, 60710, 60711, 60716, 60717, 60718, 60719, 60723, 64935, 60726, 60727, 60731, 60732, 60733, 60737, 60739, 60742, 60743, 60745, 60746, 60747, 60748, 60749, 60750, 60751, 60771, 60780, 60785, 60786, 60791, 60801, 60803, 60806, 60807, 60809, 60811, 60812, 60813, 60817, 60819, 60823, 60828, 60829, 60835, 60839, 60844, 60849, 60851, 60855, 60857, 60860, 60861, 60881, 60882, 60887, 60890, 60891, 60894, 60895, 60913, 60919, 60923, 60926, 60927, 60951, 60953, 60954, 60961, 60965, 60967, 60971, 60978, 60981, 60983, 60986, 60990, 60991, 60993, 60994, 60997, 60998, 60999, 61001, 61002, 61003, 61004, 61005, 61006, 61007, 61009, 61013, 61015, 61031, 61045, 61047, 61050, 61057, 61058, 61062, 61063, 61065, 61066, 61067, 61068, 61069, 61084, 61086, 61111, 61201, 61202, 61207, 61209, 61210, 61219, 61221, 61222, 61223, 61228, 61229, 61230, 61231, 61235, 61237, 61239, 61244, 61245, 61247, 61249, 61250, 61251, 61253, 61254, 61255, 61256, 61257, 61258, 61259, 61260, 61261, 61262, 61263, 61267, 61269, 61271, 61276, 61277, 61278, 61279, 61283, 61292, 61297, 61298, 61301, 61303, 61305, 61306, 61313, 61314, 61315, 61318, 61319, 61322, 61323, 61324, 61325, 61327, 61329, 61331, 61332, 61335, 61336, 61347, 61351, 61356, 61358, 61363, 61367, 61372, 61388, 61390, 61393, 61394, 61401, 61402, 61404, 61406, 61409, 61410, 61417, 61418, 61419, 61420, 61422, 61436, 61438, 28698, 28699, 28737, 61505, 28739, 61507, 61510, 28743, 61511, 61516, 61517, 28750, 28751, 28779, 61549, 28794, 28795, 28798, 28799, 28801, 61569, 28803, 61571, 61574, 61575, 61580, 61581, 28814, 28815, 61585, 61587, 61590, 61591, 61617, 61619, 61622, 61623, 61713, 61719, 61726, 61724, 61729, 61735, 61737, 61738, 61739, 61742, 31811, 61740, 61745, 61751, 61755, 61756, 61758, 61761, 61762, 61764, 61767, 29000, 61769, 61770, 61771, 61772, 29005, 61774, 29007, 61775, 29006, 61788, 61790, 61802, 61803, 29041, 29042, 61809, 29044, 61815, 61818, 61819, 61828, 61831, 61838, 61839, 61842, 29079, 29089, 29091, 61860, 61862, 61863, 61865, 61866, 61867, 29098, 29099, 61878, 61881, 61882, 61883, 29123, 29128, 61897, 61913, 29153, 29155, 61925, 29160, 61929, 61930, 61945, 61969, 61970, 29211, 61983, 29219, 61985, 61991, 61986, 29227, 29229, 62001, 62002, 62006, 29239, 62009, 62007, 62011, 62017, 62018, 29252, 62020, 29255, 29256, 62023, 29258, 29259, 29261, 62030, 29263, 62031, 29265, 29262, 62042, 29281, 62078, 29322, 29323, 29325, 29327, 29335, 62111, 29345, 29346, 29347, 62110, 62118, 62121, 62122, 29357, 29359, 29361, 29363, 62135, 62137, 62139, 29377, 29379, 62153, 29394, 62162, 29393, 29395, 29396, 29399, 62171, 62165, 62169, 29409, 29411, 29412, 62177, 62183, 29416, 29415, 29418, 29419, 62186, 62190, 62191, 29425, 29426, 29427, 62194, 29431, 62203, 62197, 62201, 62225, 29463, 29475, 29479, 62249, 29486, 62254, 29491, 62268, 62270, 62273, 62274, 29506, 62276, 29508, 29505, 62279, 29511, 29512, 62282, 62283, 29507, 29517, 62286, 29519, 62287, 29514, 29515, 62284, 62297, 62298, 62303, 62314, 29569, 29570, 62337, 62340, 29572, 62338, 62343, 29575, 29576, 62346, 29579, 62347, 29581, 62350, 62351, 29578, 62354, 29583, 29591, 62362, 62363, 29617, 29618, 62386, 62394, 62395, 29633, 29639, 62409, 29643, 62411, 62417, 62423, 62428, 62434, 29666, 29665, 62437, 29671, 62441, 29674, 29675, 62443, 62442, 62449, 62455, 62457, 62460, 51521, 64556, 62737, 29970, 62740, 29975, 62743, 62742, 62746, 62748, 62749, 62751, 62753, 62754, 62759, 62762, 62763, 62764, 62766, 62769, 62770, 30007, 62780, 62782, 62785, 62786, 64582, 62788, 30020, 62790, 62791, 30024, 30023, 62794, 62795, 62796, 30029, 62798, 30031, 62799, 62797, 30034, 62809, 62810, 62812, 64588, 62828, 62829, 62834, 62842, 62843, 62844, 62846, 62847, 62854, 62855, 62860, 62861, 62870, 30103, 62876, 62878, 30113, 62886, 62890, 62891, 62892, 30129, 62902, 62903, 62908, 30151, 62937, 30183, 62954, 62956, 62958, 62959, 62993, 62994, 30228, 62998, 62999, 30231, 63004, 63005, 63006, 63007, 30241, 30242, 30243, 63012, 30244, 63014, 63015, 30248, 30247, 63018, 63019, 63020, 63021, 63022, 63023, 63017, 30257, 30259, 63028, 63030, 63031, 63033, 63035, 63041, 63042, 30275, 63044, 30274, 63046, 63047, 30279, 30273, 63050, 63051, 63052, 63053, 63054, 63055, 30292, 30295, 63070, 63071, 63078, 63079, 63082, 63083, 63084, 63085, 30337, 63106, 30338, 63108, 63105, 63110, 63111, 30343, 63114, 63115, 63116, 63117, 63118, 63119, 63121, 63122, 30356, 63126, 30359, 63127, 63132, 63133, 63134, 63135, 30369, 30370, 30371, 63140, 63142, 63143, 30376, 63145, 63146, 63147, 63148, 63149, 63158, 63159, 63161, 63162, 63163, 63164, 63165, 63169, 63170, 30402, 30401, 63177, 63178, 63179, 63180, 30413, 63182, 30415, 63193, 63194, 63196, 63198, 63201, 63202, 30433, 30434, 63209, 63210, 63211, 63212, 30445, 63214, 30447, 63225, 63226, 63228, 63230, 63258, 63260, 63262, 63274, 63276, 63281, 63282, 63287, 63291, 63292, 63294, 63297, 63298, 63300, 30532, 63302, 63303, 30535, 30536, 63306, 63307, 63308, 30541, 63310, 63311, 30543, 63309, 63305, 63321, 63322, 63324, 63326, 63329, 30561, 63335, 63338, 63339, 63340, 63345, 63354, 63356, 30596, 63364, 63366, 63367, 30600, 30599, 63372, 63373, 63374, 63375, 63378, 63386, 63388, 63399, 63404, 30641, 63410, 30642, 63414, 63418, 63419, 63420, 30676, 63441, 63447, 30705, 63473, 30711, 63479, 30708, 63483, 63762, 30993, 30999, 63769, 63770, 31010, 31009, 63787, 31015, 63790, 31031, 63801, 63802, 63803, 63804, 63805, 63806, 63807, 31041, 63810, 63809, 31044, 31042, 63814, 31047, 63815, 63817, 63818, 63819, 63820, 31053, 63822, 63823, 31055, 63821, 63833, 63834, 31105, 63874, 31106, 63873, 63878, 63879, 63881, 63882, 63883, 63884, 31117, 63885, 31119, 63899, 51779, 63913, 63915, 63917, 63924, 63926, 63927, 63929, 63931, 63945, 63963, 31191, 63969, 63970, 63977, 63978, 63993, 63995, 31223, 31249, 64025, 64026, 64033, 64034, 31268, 31271, 64044, 64046, 64045, 64057, 64058, 64059, 64060, 64061, 64065, 64066, 31298, 64068, 31297, 31300, 64071, 31303, 64073, 64074, 64075, 31299, 64078, 64079, 64090, 64097, 64098, 64121, 31361, 31363, 31364, 64132, 64135, 31367, 64142, 64143, 31377, 31378, 64148, 64151, 64154, 64155, 64161, 64162, 31396, 64169, 64172, 64175, 64177, 64178, 64173, 31415, 64187, 64188, 64189, 64190, 64191, 64193, 31425, 31427, 64199, 64201, 64204, 64207, 64209, 64210, 64217, 64225, 64226, 31457, 64228, 31459, 31460, 64231, 31463, 64234, 64236, 64238, 64239, 64241, 64242, 64249, 31505, 31507, 64274, 64290, 64298, 64302, 31537, 31538, 64305, 64311, 64314, 64315, 64318, 64319, 31553, 64322, 64321, 64324, 31554, 64326, 64327, 31560, 64329, 64330, 64331, 64332, 64333, 64334, 64335, 64350, 64358, 64361, 64363, 64378, 64385, 64386, 64390, 64391, 64393, 64394, 64395, 64396, 64397, 31633, 31635, 64407, 31640, 64411, 64431, 64438, 31671, 64439, 64441, 64443, 64457, 45378, 64476, 45380, 31713, 31714, 31719, 64489, 64490, 64491, 64505, 64508, 64538, 31773, 64546, 64547, 31783, 64554, 64561, 64562, 31793, 31790, 64567, 64563, 64570, 64571, 64566, 64572, 31809, 64578, 31810, 64580, 64577, 31812, 64583, 31816, 64585, 64586, 64587, 31819, 31815, 31822, 31823, 31818, 64593, 64594, 64591, 64590, 64589, 64601, 64602, 31837, 64606, 31839, 64607, 64609, 64614, 31847, 64615, 64619, 64622, 64625, 64626, 64633, 64634, 31869, 64641, 64642, 31873, 31876, 31875, 64644, 31879, 64647, 64649, 64650, 64651, 64652, 64646, 64654, 64655, 64653, 64663, 64665, 64666, 64668, 64673, 64674, 64678, 64679, 64681, 64683, 64684, 31917, 64686, 64689, 64690, 64691, 64694, 31927, 64695, 64699, 64700, 64702, 64703, 64706, 31939, 64705, 64711, 64722, 64721, 64732, 31965, 31966, 31969, 64737, 31971, 64740, 31972, 64738, 64743, 31975, 64748, 64750, 64751, 31985, 64753, 64754, 31991, 64764, 31997, 31999, 64766, 32017, 32019, 64786, 32023, 32033, 32034, 32035, 64806, 32039, 64809, 64811, 64810, 64815, 64814, 64812, 64819, 64813, 64817, 64822, 64823, 64825, 32058, 64828, 64829, 32063, 64827, 32065, 32066, 32067, 32068, 32071, 32072, 32074, 32075, 64843, 64842, 32078, 32079, 64847, 32081, 64846, 32083, 32087, 32113, 32115, 32119, 32135, 32136, 32138, 32139, 32142, 32143, 32145, 32147, 32154, 32155, 64929, 64931, 32167, 64937, 32170, 64939, 64945, 64947, 64950, 64951, 64953, 64955, 64956, 32189, 32191, 64957, 32210, 32212, 32209, 32216, 32215, 64987, 32242, 32241, 32247, 65019, 65050, 65058, 65061, 32295, 65066, 65067, 32311, 65082, 65086, 32321, 32322, 32323, 32324, 65089, 32327, 65090, 65093, 32330, 32331, 65098, 32333, 32334, 32335, 65103, 65099, 32339, 65102, 52017, 65114, 65146, 32385, 32386, 65153, 65154, 65158, 32391, 65159, 65161, 65162, 32395, 65163, 32397, 32394, 32399, 65164, 32401, 65165, 32403, 65180, 65182, 52034, 65204, 65206, 65207, 65211, 32447, 19483, 19487, 32529, 19491, 65306, 65313, 65314, 65315, 65316, 65317, 32551, 65321, 65322, 65319, 65326, 65327, 65325, 65338, 65340, 65342, 65345, 65346, 65349, 65351, 32584, 65353, 65354, 32586, 19502, 32587, 32590, 32591, 65358, 65355, 65359, 65095, 65094, 65370, 65097, 65100, 65101, 65402, 65409, 65410, 32648, 65418, 65419, 32654, 32655, 32657, 32659, 65428, 65441, 65443, 65447, 32682, 32683, 65454, 65455, 65457, 65459, 65462, 65463, 65468, 65469, 32703, 65473, 32706, 65474, 32705, 65483, 65489, 65490, 19531, 65502, 32737, 65506, 32738, 65505, 32743, 65514, 65515, 65516, 65518, 65521, 65522, 65532, 65534], 12299: [1, 2, 7, 10, 14, 15, 66, 74, 75, 84, 87, 132, 142, 234, 238, 239, 251, 255, 367, 45690, 609, 615, 618, 623, 642, 650, 897, 898, 45769, 906, 907, 45785, 1434, 1442, 1634, 1646, 1647, 1668, 1678, 1684, 1690, 1691, 1762, 1764, 1770, 1771, 1858, 1898, 1903, 1978, 65529, 65530, 65531, 2658, 2666, 2667, 2967, 3006, 3166, 3218, 3266, 3406, 3426, 3458, 3466, 3473, 3495, 3578, 3579, 3582, 3674, 3714, 3722, 3825, 3834, 3838, 3919, 3943, 3969, 3970, 3978, 3979, 3985, 3986, 3991, 4001, 4002, 4007, 4033, 4034, 4065, 4066, 4096, 4097, 36864, 4099, 36865, 4101, 36867, 4103, 36869, 36871, 36876, 36878, 4110, 4108, 37025, 37031, 37036, 37041, 37047, 37052, 37089, 37095, 37097, 37099, 37100, 37102, 37105, 37111, 37116, 4361, 4362, 4363, 4365, 4366, 4367, 37133, 37134, 37135, 4455, 4458, 37229, 37231, 4474, 4479, 37245, 4484, 4494, 4495, 7411, 37325, 37327, 4573, 4575, 37341, 37385, 37387, 4617, 4621, 4622, 4623, 37390, 4619, 4683, 4711, 37486, 37487, 37498, 37499, 37502, 4735, 4740, 4743, 4750, 4751, 4759, 4766, 4775, 4782, 4783, 37578, 37579, 37581, 37582, 37583, 37593, 4827, 4836, 4843, 4847, 37641, 37643, 37646, 4877, 4878, 4879, 4961, 4970, 37742, 37743, 37754, 37755, 37758, 37759, 5019, 5022, 5023, 5031, 5038, 37834, 37835, 37837, 37838, 37839, 37849, 37854, 5092, 5103, 38144, 5376, 5543, 5559, 5605, 5607, 40193, 5623, 5632, 38400, 5793, 5795, 5797, 5799, 5806, 5809, 5811, 5813, 5815, 5817, 7669, 5819, 5820, 5822, 7676, 5859, 5861, 5863, 5865, 5867, 5875, 5877, 7681, 5879, 5881, 5883, 5888, 38656, 6049, 6051, 6065, 6067, 6113, 6115, 6121, 6123, 6131, 6409, 6410, 6411, 6413, 6414, 6415, 39182, 6503, 6506, 39279, 6522, 39294, 6532, 6535, 6542, 6543, 6601, 39374, 6609, 6617, 6618, 6619, 6622, 39389, 6625, 6626, 39390, 20857, 6634, 6635, 39433, 39435, 39438, 6671, 6670, 6669, 6721, 6722, 6730, 39531, 39534, 39535, 39530, 39546, 39547, 39550, 6783, 6801, 6804, 6820, 6830, 6831, 6833, 39627, 21113, 39629, 39631, 39641, 39643, 39645, 6884, 6887, 6895, 6921, 6922, 6923, 6925, 6926, 6927, 39695, 39694, 39693, 7015, 7018, 7034, 20937, 7039, 39805, 20938, 7044, 20939, 7047, 7054, 7055, 7067, 39887, 7121, 39885, 7133, 7135, 7137, 7138, 39901, 7168, 7169, 7170, 39936, 7172, 39938, 39937, 7175, 39943, 7177, 7178, 7179, 39945, 39940, 7182, 39946, 39947, 39950, 39951, 7183, 40020, 7255, 40023, 7259, 40027, 40031, 7265, 40030, 7274, 40043, 40046, 7278, 40078, 40079, 40087, 40090, 40097, 40106, 40110, 7347, 40122, 7364, 7367, 7371, 40162, 7393, 40164, 7395, 7403, 7415, 40192, 7425, 7426, 7424, 7428, 40190, 40191, 7431, 40199, 7433, 7434, 7435, 40201, 40196, 7438, 7439, 40202, 40206, 40258, 7505, 7506, 40276, 7511, 40279, 40283, 7519, 7521, 7522, 40287, 40299, 40324, 40334, 40337, 40338, 40343, 40346, 40353, 40354, 40370, 7605, 7614, 40402, 40401, 40404, 40407, 40410, 40411, 40414, 40415, 7653, 7655, 40426, 40427, 7660, 40430, 7662, 40433, 7668, 40434, 40439, 7675, 40442, 40447, 40449, 7678, 7687, 7689, 7690, 40458, 7694, 40455, 40462, 7695, 40513, 40514, 40522, 40523, 40529, 40535, 7777, 7778, 40543, 40580, 40583, 40590, 40591, 40593, 40599, 40606, 40609, 21097, 40625, 40641, 40663, 40667, 40673, 40674, 40676, 40679, 40682, 40687, 7931, 7934, 40704, 7936, 7938, 7937, 7940, 40705, 40708, 7943, 40706, 7945, 7946, 7947, 40711, 40715, 7951, 40718, 7950, 8017, 8018, 40785, 40793, 8026, 40795, 8033, 40799, 40804, 40802, 8041, 8042, 40811, 40810, 8046, 40836, 40846, 40852, 40855, 40865, 8110, 8117, 8124, 40897, 40898, 8130, 8132, 8135, 40905, 40906, 40910, 40916, 40922, 40923, 40926, 40699, 40927, 40929, 40930, 40932, 8165, 40935, 40703, 8167, 40938, 40939, 40942, 40943, 8177, 8180, 8183, 8187, 40953, 40954, 40955, 8191, 40958, 40959, 8181, 21209, 40798, 15362, 15450, 12288, 12289, 45056, 12291, 45057, 12293, 45059, 12295, 45061, 45063, 12300, 12302, 45068, 45070, 12449, 12451, 12453, 12455, 12457, 12459, 12460, 12462, 12469, 12471, 12473, 12475, 12476, 12478, 12513, 12515, 12519, 12521, 12523, 12524, 12526, 12531, 12533, 12535, 12539, 12540, 12542, 45322, 45323, 45325, 45326, 45327, 12558, 12559, 12557, 16130, 45412, 45415, 45417, 45418, 45419, 45421, 45423, 12655, 12654, 12653, 45435, 12670, 12671, 12669, 45444, 45447, 45514, 45517, 45519, 12751, 12749, 45529, 45530, 45531, 12767, 12765, 45546, 12809, 45578, 12810, 12811, 12813, 45582, 45583, 12814, 12815, 45579, 45665, 45666, 45668, 45678, 12907, 12923, 12926, 12927, 45713, 45714, 45716, 45719, 15602, 45732, 45735, 45745, 45746, 45770, 13003, 45775, 45773, 45802, 45803, 45806, 45807, 13065, 13066, 13067, 13069, 13070, 13071, 45838, 45839, 45890, 13162, 13166, 13167, 45935, 13179, 13182, 13183, 45951, 45982, 13259, 46031, 46029, 46036, 13275, 46052, 46055, 46062, 46063, 13568, 46501, 46503, 46517, 46519, 46565, 46567, 46572, 46574, 46581, 46590, 46592, 13824, 46757, 46759, 46761, 46763, 46764, 46766, 46771, 46773, 46777, 46779, 46780, 46782, 46817, 46819, 48383, 46821, 46823, 46825, 46827, 46828, 46830, 48385, 46835, 46837, 46839, 46841, 46843, 46844, 46846, 14080, 46848, 47009, 47011, 47025, 15870, 47081, 47089, 47099, 15876, 47369, 47370, 47371, 47374, 47375, 14607, 14606, 14605, 47463, 47466, 47471, 14703, 14719, 47492, 47495, 47502, 47503, 47563, 47581, 14814, 47594, 47595, 14857, 14858, 14859, 14861, 14862, 14863, 47631, 47630, 47690, 47691, 47713, 47714, 47722, 47723, 47726, 14955, 14970, 14971, 14974, 14975, 47762, 47764, 47767, 47770, 47802, 15051, 47823, 47821, 15067, 47837, 47844, 47847, 47854, 47855, 47882, 47883, 47885, 47886, 47887, 15118, 15117, 15119, 47972, 47975, 47977, 47978, 47979, 15215, 15213, 15231, 15229, 48004, 48007, 48014, 48015, 48074, 48077, 48079, 15309, 15311, 48089, 48090, 15325, 15327, 48106, 15360, 48129, 48130, 48128, 48132, 15361, 15364, 15367, 48135, 15369, 48137, 48138, 48139, 15371, 48142, 48143, 15375, 15370, 15374, 15434, 15444, 48212, 48215, 15447, 15449, 15451, 48219, 48223, 15457, 48226, 15454, 15465, 48235, 15466, 15470, 15492, 15502, 15503, 15506, 15508, 15514, 15518, 15519, 48289, 48291, 15524, 15522, 15530, 48299, 15534, 15537, 15538, 15546, 15553, 15556, 15559, 15563, 15569, 15572, 15570, 15575, 15579, 15583, 16123, 15585, 15588, 15586, 15591, 48361, 15595, 15599, 48370, 15601, 15607, 48379, 15617, 48386, 15616, 15620, 48388, 48391, 15618, 15625, 48393, 48394, 48395, 15623, 48398, 48399, 15626, 15630, 15627, 15631, 15682, 15697, 48465, 15700, 48468, 15698, 48471, 15703, 15707, 48474, 15711, 48479, 15713, 15716, 15710, 15714, 15721, 48490, 15726, 15723, 15748, 15758, 15759, 15762, 15764, 15770, 15774, 15775, 15778, 15780, 48549, 15786, 15790, 15791, 15793, 15794, 48565, 48567, 15802, 15803, 15810, 15812, 15818, 15819, 15822, 15828, 15826, 15834, 15835, 15838, 15841, 15842, 15844, 48613, 15847, 15850, 15851, 48620, 15854, 15855, 48622, 48625, 48626, 15860, 15858, 48629, 15865, 48633, 15867, 48634, 48631, 48639, 15866, 48641, 48642, 48644, 15873, 15879, 48647, 15881, 15882, 48649, 48650, 48651, 48654, 48655, 15883, 15887, 15886, 15947, 48721, 48727, 15959, 15963, 48735, 15969, 15966, 15970, 15975, 16004, 16007, 16014, 16015, 16017, 16018, 16023, 16026, 16030, 16031, 16033, 16034, 16036, 16039, 16042, 16043, 16046, 16049, 16050, 16218, 48833, 48842, 16091, 16094, 16097, 16103, 16106, 16110, 16111, 48881, 48882, 48887, 48889, 48890, 16121, 48895, 48896, 48897, 48898, 16129, 48900, 16128, 16126, 48903, 16132, 48907, 16137, 16135, 48910, 16138, 16142, 16139, 16143, 16194, 16202, 16203, 48977, 48978, 16210, 16212, 16209, 16215, 16217, 48986, 16219, 48991, 48994, 16225, 48996, 16228, 16222, 49001, 49002, 49003, 16233, 16234, 16238, 16260, 16270, 16271, 16274, 16276, 16282, 16283, 16286, 16287, 16290, 29289, 16292, 16298, 16299, 16302, 16303, 16305, 16306, 49077, 49079, 16315, 49084, 49089, 49090, 16322, 16321, 16324, 16327, 49097, 49102, 16331, 16337, 16338, 16340, 29305, 16343, 16347, 16351, 16353, 16354, 16356, 49125, 16359, 49127, 16363, 49132, 16367, 49140, 16370, 16369, 16375, 49145, 49146, 49147, 49148, 49150, 49152, 49153, 49155, 16379, 49157, 16383, 49159, 49162, 49164, 49166, 49379, 49381, 49385, 49387, 49388, 49421, 49517, 49530, 49533, 49535, 16372, 29401, 49625, 49673, 49675, 49677, 22905, 49769, 49785, 49787, 49869, 49881, 49885, 49933, 50029, 50030, 50031, 50041, 50042, 50043, 50045, 50047, 22985, 22987, 50121, 50137, 50445, 49141, 50688, 50697, 50698, 50699, 50701, 50702, 50703, 50944, 51465, 51466, 51467, 51469, 51471, 51567, 51579, 51581, 51583, 51659, 51675, 51725, 51835, 51915, 51931, 51933, 51935, 51978, 51981, 51982, 51983, 52075, 52093, 52095, 52171, 52187, 52224, 52225, 52226, 52228, 52231, 52233, 52234, 52235, 52238, 52239, 23417, 52319, 52327, 52334, 52356, 52359, 52366, 52367, 52370, 52372, 52375, 52378, 52382, 52391, 52398, 52433, 52434, 52442, 52449, 52450, 52452, 52458, 52459, 52463, 52479, 52481, 52482, 52484, 52487, 52489, 52490, 52491, 52493, 52495, 52546, 52554, 52574, 52612, 52615, 52622, 52623, 52631, 52638, 52639, 52647, 52654, 52655, 23498, 52699, 52705, 52706, 52708, 52711, 52714, 52715, 52718, 52719, 52729, 52731, 52801, 52802, 52810, 52811, 52843, 52868, 52871, 52878, 52879, 52887, 52894, 52895, 52903, 52910, 52955, 52961, 52962, 52967, 52970, 52974, 52975, 52992, 53001, 53003, 53005, 53067, 53095, 53099, 53124, 53127, 53134, 53135, 53137, 53138, 53140, 53143, 53146, 53147, 53150, 53151, 53159, 53166, 53201, 53202, 53204, 53210, 53211, 53215, 53217, 53218, 53220, 53226, 53227, 53231, 53247, 20480, 20481, 20483, 20485, 20487, 53258, 20492, 20491, 20494, 20489, 53451, 20839, 53610, 20845, 20859, 20878, 20879, 20882, 20955, 20957, 20958, 20962, 20959, 20970, 20971, 21001, 21002, 21003, 56283, 21058, 21089, 21095, 53865, 21098, 21099, 21101, 53883, 21114, 21115, 21124, 21134, 21135, 21138, 21140, 21159, 21169, 21170, 21178, 21193, 53965, 21211, 21213, 53981, 21215, 21218, 54122, 21359, 21357, 21402, 21403, 21412, 21425, 21426, 21434, 21435, 21471, 21469, 21476, 54541, 21927, 21932, 21934, 21941, 21943, 21989, 22005, 22007, 22012, 22016, 54793, 54794, 54795, 54797, 54798, 54799, 54889, 54890, 54891, 54894, 54905, 54906, 54907, 22181, 22183, 22185, 22187, 22188, 22190, 22195, 22197, 22199, 22201, 22203, 22204, 22206, 54985, 54986, 54987, 54989, 54991, 55001, 55002, 55003, 22243, 22245, 22247, 22249, 22251, 22252, 22254, 22257, 22259, 22261, 22263, 22265, 22267, 22268, 22270, 55149, 55151, 55161, 55163, 22433, 22435, 22441, 22449, 22451, 22457, 22459, 55241, 55245, 22497, 22499, 22505, 22507, 22521, 22523, 22793, 22794, 22795, 22797, 22798, 22799, 22907, 22916, 22919, 22926, 22927, 22930, 22938, 22939, 22946, 22954, 22955, 23010, 23009, 23018, 23019, 23053, 23054, 23055, 23114, 23115, 23137, 23146, 23147, 55929, 55931, 23188, 23195, 23217, 23218, 23227, 4618, 56011, 23252, 56027, 56029, 23278, 23309, 23311, 23399, 56169, 56171, 56185, 56186, 23419, 23428, 23438, 23442, 23450, 23451, 23458, 23466, 23467, 23497, 23499, 56267, 23515, 23530, 23531, 23552, 23553, 23554, 23556, 23559, 23561, 23562, 23563, 23566, 23567, 23633, 23634, 23641, 23642, 23643, 56409, 23646, 23649, 23650, 23657, 23658, 56426, 23662, 56430, 56431, 56441, 56445, 56447, 23713, 23715, 23721, 23729, 23731, 23737, 23739, 23746, 56523, 23754, 56525, 56527, 23758, 23753, 56541, 56543, 23785, 23787, 23794, 23796, 23801, 23808, 23809, 23810, 23812, 23815, 23817, 23818, 23819, 56585, 56589, 23822, 23823, 56590, 56591, 56587, 56586, 23889, 23895, 23897, 56665, 23905, 23911, 23913, 23973, 23989, 23991, 23996, 23998, 24001, 24002, 24007, 24009, 24037, 24039, 24044, 24046, 24053, 56825, 56827, 24057, 24065, 24066, 24068, 24071, 24073, 24074, 24075, 24078, 24079, 24153, 56921, 56922, 24162, 24169, 56939, 4811, 24257, 57033, 24265, 24305, 24311, 57081, 57083, 24313, 24320, 24329, 24331, 57101, 24335, 57099, 24401, 24402, 24407, 57177, 57178, 24409, 24411, 24417, 24418, 24425, 57193, 57194, 24503, 24508, 24510, 24516, 24521, 24522, 24523, 57291, 24549, 24556, 24558, 24561, 24564, 24567, 24569, 57339, 24570, 24571, 57344, 57345, 57347, 57349, 57351, 57353, 57355, 57356, 57358, 57613, 57615, 57700, 57754, 57761, 57762, 57819, 57822, 57835, 57865, 57866, 57867, 57869, 57870, 57871, 57953, 57954, 57961, 57962, 57965, 57981, 57988, 57998, 57999, 58007, 58010, 58017, 58018, 58033, 58034, 58042, 58061, 58077, 58091, 58121, 58122, 58123, 58125, 58126, 58127, 58263, 58333, 58335, 58340, 58351, 58624, 58812, 58814, 58853, 58871, 58880, 58985, 58990, 59001, 59002, 59003, 59045, 59054, 59057, 59059, 59061, 59070, 59085, 59087, 59099, 59107, 59109, 59111, 59125, 59131, 59136, 59246, 59297, 59315, 59338, 59341, 59353, 59361, 31337, 59363, 59369, 59371, 31353, 59661, 59662, 59663, 59769, 59770, 59780, 59790, 59791, 59794, 59802, 59818, 59850, 59865, 59869, 59874, 59882, 59883, 59913, 59914, 59915, 59917, 59918, 59919, 60010, 60013, 60025, 60026, 60029, 60030, 60050, 60062, 60063, 60068, 60090, 60119, 60123, 60125, 60127, 60173, 60175, 60260, 60281, 60282, 60292, 60302, 60303, 60306, 60314, 60321, 60322, 60330, 60379, 60416, 60417, 60418, 60420, 60423, 60425, 60426, 60427, 60430, 60431, 60507, 60537, 60538, 60541, 60543, 60621, 60637, 60639, 60643, 60651, 60659, 60663, 60671, 60672, 60673, 60674, 60676, 60679, 60681, 60682, 60683, 60686, 60687, 60753, 60759, 60767, 60770, 60775, 60778, 60783, 60837, 60846, 60853, 60862, 60866, 60868, 60871, 60874, 60878, 60879, 60901, 60903, 60908, 60910, 60917, 60921, 60924, 60929, 60930, 60932, 60935, 60937, 60938, 60939, 60942, 60943, 61023, 61034, 61122, 61127, 61130, 61169, 61175, 61177, 61179, 61183, 61184, 61185, 61191, 61194, 61199, 61287, 61291, 61294, 61365, 61374, 61383, 61413, 61415, 61429, 61431, 28672, 28673, 28675, 28677, 28679, 28684, 61450, 28686, 28843, 28846, 28851, 28853, 61642, 28899, 28908, 28910, 28924, 28923, 28926, 61801, 61901, 61915, 29150, 29151, 29149, 29193, 29194, 29195, 62057, 62058, 29293, 62073, 29306, 62157, 29405, 29407, 62173, 29449, 29450, 29451, 29562, 62413, 62427, 29661, 62429, 62729, 62731, 62733, 30208, 62985, 62986, 62987, 62989, 62990, 62991, 63081, 63086, 63087, 63097, 63098, 63099, 63101, 63102, 63103, 63181, 63183, 63195, 63197, 63199, 63342, 63449, 64730, 30989, 30990, 30991, 63850, 63947, 63949, 63965, 31241, 31242, 31243, 31245, 31246, 31247, 64105, 64106, 31354, 64126, 64205, 64219, 64221, 31501, 31502, 31503, 64362, 64379, 64461, 64475, 31744, 31745, 31746, 31748, 31751, 31753, 31754, 31755, 31758, 31759, 31825, 31826, 31831, 31833, 64603, 31834, 31838, 31841, 64618, 31849, 31886, 31887, 31899, 31902, 31914, 31921, 31922, 31931, 64713, 64714, 64715, 31946, 64729, 31970, 31978, 31979, 31982, 31983, 64762, 64763, 32000, 32001, 32002, 32004, 32007, 32009, 32010, 32011, 64778, 64781, 64783, 32014, 32015, 64777, 64779, 64857, 32089, 64858, 32097, 32103, 64874, 32132, 32146, 32148, 32151, 32161, 32162, 32177, 32178, 32186, 32193, 32194, 32199, 64971, 32219, 32225, 32226, 32228, 32231, 32234, 32235, 32238, 32239, 65017, 32257, 32260, 32263, 32265, 32266, 32267, 32270, 32271, 65113, 32345, 65130, 32362, 32388, 32398, 32402, 32404, 32407, 32417, 32418, 32433, 32434, 32449, 32450, 32465, 32471, 32481, 32487, 32497, 32503, 32512, 32513, 32514, 32516, 32519, 32521, 32522, 32523, 65289, 65293, 32526, 32527, 32577, 32578, 32593, 32599, 32601, 65371, 32609, 32612, 32617, 65385, 65386, 32618, 32644, 32647, 32658, 32660, 32663, 32673, 32674, 32689, 32690, 32698, 45577, 65481, 32714, 32721, 32722, 32724, 32727, 32730, 32731, 13019, 32740, 32753, 32754, 32759, 32762], 15871: [32768, 32769, 32770, 32773, 32774, 32775, 32777, 32778, 32780, 32781, 32785, 32787, 32788, 32790, 32791, 32792, 45595, 32794, 32795, 32801, 32802, 32807, 32809, 32816, 32817, 32823, 32825, 32827, 32830, 32838, 32843, 32846, 32848, 32849, 32850, 32853, 32855, 32857, 32859, 32860, 32861, 32862, 32866, 32867, 32868, 32871, 32872, 32874, 26073, 32877, 32878, 32879, 32883, 32885, 32887, 32888, 32890, 32894, 32895, 32898, 32900, 32903, 32904, 32906, 32910, 32912, 32913, 32915, 32917, 32924, 32925, 32926, 32930, 32935, 32937, 32939, 32941, 32945, 32946, 32947, 32950, 32951, 32954, 32955, 32956, 32957, 13063, 32959, 32960, 32961, 39115, 32963, 32965, 32967, 32968, 32970, 32972, 32973, 32974, 32975, 32976, 32977, 32981, 32990, 32991, 32992, 32997, 32999, 33001, 33003, 33009, 33015, 33017, 33022, 33023, 33031, 33038, 33040, 33041, 10431, 33047, 33048, 33050, 33051, 33055, 33059, 33061, 33067, 33069, 33071, 33074, 33075, 33077, 33076, 33080, 33081, 33082, 33086, 33087, 33089, 33095, 33098, 33102, 33105, 33108, 33118, 33122, 33125, 33140, 33143, 33156, 397, 409, 33179, 33177, 33181, 421, 33192, 33191, 33202, 33203, 33204, 33206, 33208, 33211, 33217, 33222, 33223, 33224, 33225, 33227, 33234, 33237, 33241, 33242, 33246, 479, 33245, 33254, 39174, 33256, 33263, 39176, 33266, 33274, 33277, 33279, 33281, 515, 517, 33286, 33287, 33288, 33290, 33295, 33294, 33300, 33303, 33304, 33310, 33314, 33318, 33319, 33321, 33322, 33329, 33330, 33331, 33332, 33333, 33335, 33338, 33339, 33340, 33342, 33343, 33348, 33351, 33354, 33355, 589, 33364, 33367, 33369, 33371, 33373, 33377, 611, 33387, 33390, 33391, 33393, 33395, 33399, 33402, 33405, 33409, 33412, 33418, 33423, 33426, 33428, 33431, 665, 33437, 33439, 33442, 33444, 33449, 33453, 33456, 33457, 33459, 693, 33460, 33467, 33471, 33473, 33474, 33476, 33479, 33481, 33483, 33485, 33489, 33490, 729, 33502, 33507, 33511, 33512, 745, 33510, 33514, 33519, 33521, 33522, 33526, 33527, 33528, 33529, 6664, 770, 6666, 772, 33540, 33542, 778, 33558, 33559, 33563, 33570, 33575, 33582, 33586, 33588, 33589, 33591, 33594, 33595, 33598, 33601, 33608, 33615, 33617, 33618, 33622, 33624, 33626, 33628, 33630, 33631, 33646, 881, 33651, 33662, 33661, 899, 905, 33674, 909, 33683, 33687, 33690, 33693, 33694, 33697, 933, 33705, 33707, 33709, 33713, 33719, 33723, 33728, 33729, 33726, 33737, 33739, 33741, 33743, 33751, 33753, 33757, 33758, 33761, 33765, 33766, 33767, 33770, 33774, 33773, 33775, 33782, 33783, 33784, 33785, 33786, 33787, 33790, 33792, 1027, 1029, 33802, 33801, 33805, 33806, 33815, 33826, 33831, 33842, 33847, 33849, 33857, 33863, 33864, 33871, 33886, 33890, 33895, 1137, 33908, 33915, 33921, 1154, 1155, 1156, 1153, 1161, 1162, 1163, 1165, 33938, 33943, 1177, 33951, 33963, 33966, 33986, 33994, 33995, 33998, 45835, 1234, 34011, 34014, 1247, 34019, 34023, 34024, 34026, 34030, 34033, 34034, 34039, 34040, 34043, 1282, 1284, 34054, 34056, 34057, 1290, 34060, 34067, 34070, 34071, 34082, 34087, 34090, 34097, 34103, 34105, 34109, 34111, 34119, 34120, 34123, 34129, 34134, 34138, 34139, 34143, 1393, 34167, 34179, 34190, 34195, 34197, 34196, 34202, 34205, 34209, 1445, 34215, 34216, 34217, 34234, 34238, 34247, 34249, 34251, 34260, 34261, 14600, 34270, 34274, 34277, 34278, 34282, 34287, 34286, 34288, 34295, 34296, 1529, 34304, 34308, 34310, 34311, 34312, 34313, 34315, 34316, 34317, 34320, 34324, 34330, 34331, 34332, 34333, 34335, 34338, 34339, 34345, 34348, 34354, 34360, 34361, 34362, 34365, 34367, 34369, 34370, 34374, 34375, 34381, 34382, 34385, 34387, 34388, 34390, 34392, 34394, 34395, 34397, 34399, 34402, 34403, 34407, 34408, 34409, 34413, 34419, 34420, 34427, 34430, 34436, 34440, 34446, 34449, 34450, 34452, 34455, 34459, 34462, 34466, 34473, 34475, 34478, 34481, 34484, 34486, 34488, 34490, 34491, 34493, 34489, 34495, 34496, 34507, 34510, 34512, 34515, 34517, 34519, 34523, 34526, 34528, 34531, 34533, 34534, 34536, 34537, 34538, 34542, 34543, 34544, 39430, 34550, 34551, 34553, 34556, 34559, 1794, 1795, 1796, 1797, 1802, 34570, 34574, 34578, 34582, 34583, 34595, 34598, 34601, 34610, 34611, 34627, 34630, 34634, 34635, 34638, 34639, 34642, 34643, 34644, 34645, 34646, 34648, 34651, 34652, 34653, 34677, 34678, 34679, 34681, 34684, 1922, 34691, 34690, 34693, 34695, 1930, 34703, 34707, 34708, 34714, 1962, 34735, 34736, 34743, 34746, 34747, 34748, 34750, 34754, 34759, 2002, 34770, 34773, 34776, 2009, 2010, 2014, 34784, 34787, 34790, 2025, 34794, 34792, 34791, 34796, 34801, 34804, 34806, 34807, 6918, 6920, 34820, 34821, 34822, 34824, 34825, 34827, 34829, 34831, 2066, 2068, 2069, 34839, 34850, 34856, 34857, 34858, 2090, 34860, 34862, 2094, 34866, 34867, 34871, 2111, 34881, 34887, 2123, 34895, 2127, 34914, 34919, 34921, 34925, 2161, 2164, 2165, 2174, 2177, 2178, 34952, 2186, 2187, 34958, 2197, 34975, 19979, 2218, 34987, 2222, 34990, 2226, 34996, 2229, 35003, 2238, 35008, 35012, 35014, 35016, 35019, 35022, 35024, 2258, 35033, 2266, 35034, 35035, 35037, 2270, 35038, 2273, 2274, 2276, 2277, 2282, 35050, 2286, 35054, 2290, 2293, 2298, 2299, 35068, 2303, 2306, 35075, 2308, 2309, 2307, 35078, 35080, 2313, 2314, 35081, 2317, 35085, 35091, 35095, 35100, 35102, 35111, 35114, 35119, 35121, 35122, 35123, 35124, 35125, 35128, 35130, 35135, 35137, 35138, 35143, 35144, 35150, 35149, 35153, 35159, 35160, 35162, 35165, 35166, 35167, 35186, 35194, 35198, 35201, 35204, 35215, 35220, 35222, 35223, 35225, 35227, 35229, 35239, 35242, 35245, 35246, 35248, 35251, 35252, 35256, 35258, 35264, 35270, 35272, 35273, 35274, 35275, 35278, 35283, 35286, 35290, 35291, 35293, 35294, 35296, 35297, 35300, 35302, 35303, 35304, 35306, 35308, 2541, 35310, 35311, 35307, 35322, 35326, 35327, 35328, 2562, 2563, 2564, 2565, 35334, 35335, 35336, 2570, 35337, 35344, 35349, 35350, 35352, 2587, 35356, 35357, 35355, 35367, 35368, 35369, 35372, 35378, 35379, 35381, 26571, 35383, 35380, 35386, 35387, 35391, 35390, 35393, 35394, 35396, 35399, 35400, 35403, 35407, 35412, 35414, 35416, 35418, 35421, 35422, 35435, 35437, 35438, 35447, 35457, 35459, 35470, 35471, 35474, 35476, 35479, 2714, 35483, 35485, 35491, 2725, 35495, 35496, 35490, 35497, 35505, 35507, 35508, 35510, 35511, 35512, 35515, 13572, 35524, 35529, 35541, 35543, 35555, 35556, 35558, 35560, 35562, 35563, 35567, 35566, 35573, 35574, 35576, 35577, 35580, 35584, 2819, 2821, 35589, 2826, 35595, 2830, 35597, 35602, 35604, 35608, 35615, 35618, 35619, 35622, 35633, 35637, 35639, 35641, 35643, 35646, 35647, 35650, 35651, 35653, 35654, 35655, 35663, 35666, 35668, 35670, 35671, 35672, 35675, 35673, 35689, 35691, 35701, 35710, 35711, 35715, 35717, 35720, 35727, 35730, 35739, 35741, 35754, 35755, 35758, 35759, 35761, 35767, 35771, 35774, 35775, 35787, 35790, 35793, 35794, 35803, 35806, 35807, 35811, 35812, 35814, 35815, 35816, 35819, 35825, 35827, 35830, 35832, 35834, 35835, 35838, 35840, 35846, 35857, 35859, 35860, 35861, 35863, 35864, 35866, 35867, 35875, 35881, 35882, 35890, 35893, 35897, 35898, 35901, 35905, 35908, 35911, 35912, 35915, 35918, 35919, 35920, 35921, 35922, 35924, 35925, 35927, 35928, 35932, 35933, 35934, 35939, 35945, 35949, 35951, 35952, 35953, 35954, 35955, 35956, 35957, 35959, 35962, 35964, 35966, 35967, 35969, 35970, 35972, 35978, 35982, 35985, 35986, 35988, 35989, 35991, 35993, 35997, 36002, 3237, 36007, 36008, 36011, 36013, 36016, 36017, 36020, 36022, 36023, 36024, 36025, 36027, 36029, 36031, 36034, 36038, 36039, 36055, 36056, 36057, 36058, 36060, 36061, 36062, 36064, 36067, 36069, 36070, 36071, 36072, 36073, 36074, 36075, 36076, 36078, 36079, 36080, 36082, 36085, 36086, 36087, 36089, 36092, 36094, 36102, 36107, 36108, 36111, 36112, 36113, 36116, 3349, 36122, 36127, 36131, 36135, 36136, 36138, 36147, 36149, 36151, 36155, 36158, 36159, 36161, 36162, 36165, 36167, 36174, 36178, 36180, 36187, 36194, 36196, 36202, 36211, 36218, 36217, 36221, 36222, 36219, 36227, 3460, 36232, 3469, 36239, 36242, 36243, 36245, 36244, 36247, 36250, 36251, 36253, 36254, 36265, 36266, 36269, 36276, 36278, 36279, 36284, 36286, 36299, 36301, 36302, 36305, 36306, 36308, 36311, 36315, 36320, 36321, 36324, 36327, 36329, 36332, 36339, 3571, 36342, 36344, 36347, 36353, 3586, 3587, 3588, 3589, 36358, 36362, 3594, 36367, 36379, 36386, 36389, 36391, 36392, 36393, 36401, 36407, 36410, 36409, 3646, 36417, 36420, 36426, 36427, 3661, 36431, 36433, 36439, 36442, 36445, 36447, 36449, 36463, 36471, 36484, 36490, 36495, 36500, 36503, 36505, 36509, 36510, 36514, 36516, 36517, 36529, 36539, 36546, 36547, 36548, 36549, 36574, 13783, 36579, 36587, 36589, 36594, 36598, 36603, 36604, 36606, 36608, 36615, 36618, 36621, 36622, 36625, 36628, 36629, 36638, 36647, 36650, 36652, 7285, 36654, 36655, 36663, 36665, 36667, 36668, 36669, 36674, 36679, 36683, 36686, 36690, 36692, 36699, 3939, 3941, 36706, 36721, 36722, 36724, 36727, 36729, 36731, 36734, 36733, 36737, 36744, 36746, 36754, 36755, 36756, 36757, 36758, 36759, 36760, 36761, 36769, 4003, 36778, 36781, 36783, 36785, 36787, 36789, 36792, 13826, 36799, 36803, 36809, 36811, 36813, 36814, 36815, 36817, 36818, 4051, 36820, 36821, 36823, 36824, 36822, 36830, 36831, 36833, 4067, 36837, 36836, 36846, 4083, 36855, 36862, 36866, 4098, 36874, 36877, 4109, 36879, 36881, 4114, 4117, 4122, 36897, 36919, 36921, 4156, 4158, 4162, 36937, 36938, 4171, 36941, 36942, 4174, 4208, 4211, 4215, 36989, 4222, 36991, 4240, 4247, 4249, 4254, 4258, 4263, 4267, 4269, 4278, 4284, 37063, 4304, 37079, 39934, 37085, 37086, 4318, 4320, 4323, 4329, 4331, 4332, 4343, 4346, 37121, 4359, 4360, 37127, 37130, 37139, 37136, 4375, 37147, 37143, 37151, 37153, 37155, 4398, 4400, 4404, 37173, 4415, 4419, 37189, 37201, 37202, 37203, 4440, 37214, 4449, 4453, 4456, 4471, 37241, 4490, 4493, 4501, 4510, 4519, 37299, 4533, 4535, 37309, 37334, 37338, 37344, 4576, 37356, 37357, 37358, 37359, 4591, 4595, 37370, 4609, 4610, 37380, 4612, 4614, 37383, 37384, 37388, 37393, 37394, 4627, 37395, 37397, 37396, 37403, 37406, 4641, 37411, 4643, 4642, 4644, 37428, 4659, 4660, 4663, 4667, 4670, 4671, 37458, 37459, 37460, 4692, 37480, 37491, 37494, 4727, 37500, 37521, 4755, 37545, 37553, 4803, 37605, 4838, 4840, 37610, 4851, 37622, 4856, 4859, 4865, 37633, 4866, 37636, 4868, 37638, 37639, 4871, 4874, 4876, 37651, 37654, 4887, 37656, 37659, 37662, 4895, 37674, 4911, 4925, 4926, 37698, 4931, 37701, 4946, 37716, 37717, 4948, 4954, 37719, 4953, 37736, 37745, 37750, 4993, 5002, 37781, 5013, 5032, 37808, 5052, 37820, 5054, 5062, 37836, 37844, 37858, 5091, 37863, 5096, 37866, 5101, 37870, 5107, 37877, 5112, 37886, 5120, 5122, 5124, 37892, 5126, 5128, 37902, 5134, 37904, 5143, 5146, 5149, 37918, 5153, 37922, 37925, 37927, 5162, 37930, 37936, 37937, 37940, 37943, 5177, 37946, 5183, 5185, 5191, 5193, 5197, 5198, 5201, 37971, 5204, 5205, 5203, 37975, 37978, 37979, 37983, 5226, 37994, 37998, 5233, 38003, 38008, 38010, 5249, 5253, 5255, 5262, 38034, 5269, 5268, 5272, 38040, 5278, 38047, 5297, 38066, 5299, 5300, 38067, 38069, 5303, 5304, 38074, 38079, 38081, 38082, 38083, 38087, 38092, 38094, 38097, 38099, 5336, 5338, 38107, 38108, 38110, 5345, 5347, 5348, 5350, 5351, 5352, 5353, 38122, 5355, 5356, 5357, 38126, 5359, 38129, 5363, 38131, 38133, 38135, 5370, 38142, 5377, 5379, 38145, 38151, 5386, 38154, 5385, 5390, 38158, 5388, 5399, 38178, 5416, 5419, 5425, 5428, 5431, 38202, 5437, 5442, 5448, 38225, 38226, 38229, 5463, 5460, 38238, 40166, 5482, 5486, 5489, 5490, 5492, 5495, 5502, 5507, 5508, 38286, 38293, 5525, 5533, 5539, 38312, 5546, 38314, 38321, 38322, 38323, 38324, 38325, 38337, 38343, 5577, 38347, 38346, 38350, 5609, 38378, 5615, 38383, 5619, 5624, 38401, 38402, 38404, 5639, 38408, 38409, 5642, 38412, 38413, 38414, 38415, 38416, 5649, 5647, 5651, 5650, 5644, 5655, 38425, 38428, 38429, 5662, 5665, 5667, 5671, 5680, 38448, 5682, 38453, 5685, 5687, 5688, 38458, 38459, 5693, 5694, 5695, 5709, 38478, 5714, 38484, 5717, 38486, 14555, 38488, 38489, 38490, 5723, 38491, 38493, 38495, 38499, 7652, 5730, 5733, 38503, 38509, 38512, 5746, 38516, 5747, 5749, 5748, 38520, 38522, 38532, 5765, 38542, 38544, 38545, 38550, 38552, 5786, 38554, 38553, 38559, 5791, 5794, 5796, 38576, 38579, 38586, 38587, 38590, 5824, 38592, 38594, 5827, 38593, 38597, 5828, 38603, 5835, 38605, 38606, 5840, 38607, 5844, 38617, 5849, 5851, 38620, 38622, 5856, 5860, 38630, 38632, 38633, 5864, 38638, 5872, 5876, 5871, 5878, 5885, 5891, 5893, 5895, 5898, 38666, 5899, 5901, 5902, 38670, 5903, 5900, 38675, 38676, 38704, 38705, 38707, 38711, 38712, 5937, 5954, 38725, 38728, 38733, 38735, 38736, 5968, 38738, 5970, 38740, 5980, 38750, 5981, 38766, 6003, 38786, 38787, 6020, 6021, 38792, 38799, 6031, 6034, 38803, 6037, 38807, 38835, 38839, 6091, 38859, 38867, 38871, 6112, 38885, 38886, 6119, 38890, 38893, 38895, 38899, 6142, 38913, 6145, 38914, 6146, 6149, 6150, 6151, 38920, 38921, 38922, 38923, 6156, 38925, 6157, 6159, 38928, 6158, 6162, 6163, 6164, 38926, 6166, 6167, 38934, 6161, 6168, 6171, 38940, 6173, 38942, 38938, 38945, 6178, 6179, 38946, 6181, 6180, 6183, 38952, 6185, 38951, 6182, 6186, 6184, 6190, 38959, 38960, 6194, 6195, 6199, 6204, 6205, 6207, 6209, 38978, 6213, 38983, 6217, 6221, 38990, 6222, 6224, 38993, 38994, 6226, 6228, 38996, 38999, 39002, 6235, 39004, 6234, 6238, 39006, 39007, 39009, 6242, 39010, 39012, 6245, 6249, 39018, 39019, 6253, 39022, 6257, 6258, 6260, 39034, 6267, 6270, 39038, 39041, 6273, 6275, 39054, 39056, 39058, 6292, 39063, 39065, 39066, 6297, 39070, 39071, 6302, 6305, 39076, 6314, 6315, 6317, 6318, 6319, 39088, 39089, 6322, 39090, 6324, 39086, 39091, 39095, 39093, 6329, 39098, 39100, 39103, 6336, 6337, 6338, 6339, 39107, 39106, 39110, 6342, 39108, 6340, 39114, 6347, 39116, 39117, 39118, 6350, 6352, 39119, 6349, 6355, 6356, 6357, 39122, 39128, 39130, 6363, 39132, 39131, 39134, 39135, 6368, 6373, 39142, 39143, 39146, 6379, 39148, 39149, 39150, 6383, 39151, 6385, 6386, 39155, 6387, 6388, 6391, 6392, 39160, 6394, 6395, 6399, 39169, 6403, 6406, 6407, 6408, 6412, 39179, 39180, 39177, 39187, 39189, 39194, 39195, 39198, 39219, 39221, 6456, 6463, 39249, 6484, 6485, 6487, 39255, 39260, 39263, 6519, 39297, 39304, 39305, 39306, 6547, 6549, 6558, 39341, 6581, 6582, 39359, 6593, 6597, 6599, 39370, 6598, 39378, 6620, 6624, 39395, 39397, 6630, 39401, 39402, 6636, 39406, 6639, 6638, 6643, 39412, 6646, 39415, 39416, 6649, 6656, 6659, 39429, 6660, 6663, 39431, 6665, 6662, 6667, 39432, 39441, 39443, 6677, 39442, 39453, 39454, 6693, 39472, 39475, 6709, 39478, 39481, 6714, 6718, 39493, 39499, 6735, 6740, 6744, 39514, 39518, 39537, 6775, 39543, 39562, 39570, 6805, 39575, 14598, 39576, 39579, 39587, 39593, 6836, 6837, 6839, 39609, 39618, 6851, 39620, 39619, 39621, 39640, 39648, 39649, 39652, 39655, 39656, 39659, 6899, 6901, 39670, 39673, 6912, 39681, 6919, 39687, 39690, 40454, 39691, 39696, 39703, 39706, 39707, 39725, 39728, 39730, 20922, 39741, 6975, 39747, 6981, 6983, 6986, 6987, 39754, 6989, 39758, 39759, 7004, 39777, 39780, 39783, 39787, 7909, 7029, 39799, 7042, 39824, 39831, 7070, 39843, 7077, 39845, 39855, 7107, 39877, 39875, 7109, 7125, 39898, 39907, 39909, 7139, 7141, 39914, 39916, 7155, 7157, 7165, 39930, 39939, 39941, 39942, 7174, 39944, 39949, 39954, 39956, 7192, 7219, 39995, 7229, 40005, 7242, 40021, 7267, 7282, 40050, 40053, 7283, 40052, 40056, 7291, 53551, 7300, 40074, 7310, 7326, 40127, 7379, 40149, 7383, 7392, 7394, 7397, 7398, 7399, 40169, 7421, 7427, 7430, 7432, 7436, 40211, 40213, 7450, 40221, 7454, 40223, 7473, 7474, 7492, 40265, 7502, 40296, 7537, 7554, 40325, 40328, 40339, 40341, 40349, 7582, 40348, 7578, 40357, 40365, 7611, 7619, 14543, 7636, 14544, 7642, 14545, 40413, 7648, 7651, 40419, 40421, 7657, 40425, 7658, 7661, 7659, 40437, 14552, 7683, 40451, 40453, 7692, 7698, 40466, 7741, 7755, 40526, 7773, 40577, 7812, 40585, 7822, 7829, 7831, 7839, 7857, 40629, 7863, 7875, 40659, 14593, 7904, 40675, 40677, 7911, 40693, 7926, 7923, 7932, 40707, 7944, 40717, 7949, 7956, 7960, 7961, 40733, 7973, 7982, 40752, 7985, 7986, 7987, 7989, 7993, 7998, 8005, 40777, 8013, 8014, 40797, 40817, 40818, 40820, 40823, 40826, 8058, 8066, 8089, 40857, 8100, 40885, 8116, 8120, 40896, 8131, 8136, 8145, 8147, 8148, 8152, 40921, 8157, 40925, 8159, 40928, 8161, 8160, 8164, 8173, 40941, 40947, 8182, 40961, 40962, 40963, 40965, 8193, 40970, 40972, 40973, 40974, 40975, 8205, 8206, 8212, 8213, 8229, 41025, 41027, 41029, 41045, 41047, 41148, 8392, 8395, 41181, 41182, 8415, 41191, 8430, 8439, 8448, 41216, 41224, 41225, 8194, 8459, 41229, 8462, 8463, 41231, 8195, 41230, 8467, 41235, 8468, 8466, 41241, 41243, 41247, 41252, 41253, 41257, 8497, 41269, 8500, 8498, 8506, 8507, 41275, 8511, 8510, 41282, 8515, 41283, 41300, 41304, 41305, 41307, 41309, 41310, 41311, 8541, 41306, 8549, 8552, 41321, 41323, 41329, 41330, 41331, 41332, 41333, 41338, 41343, 41346, 41347, 41365, 41371, 41374, 8612, 8615, 8616, 8618, 21252, 8626, 41395, 8628, 41397, 8630, 41399, 8634, 41405, 8640, 8651, 8654, 41427, 8660, 8664, 8667, 41440, 8676, 41449, 8683, 41452, 47316, 8691, 8701, 8702, 41470, 8705, 41473, 8704, 8706, 41477, 8703, 8711, 41480, 8712, 8715, 41483, 8717, 41486, 8713, 41489, 8723, 8724, 8719, 8718, 41491, 41499, 41501, 41502, 8737, 8738, 8739, 8740, 8741, 8753, 8754, 8756, 41525, 8763, 8767, 8766, 8769, 41549, 41550, 8782, 8785, 41553, 41556, 8788, 41559, 41560, 41562, 41563, 41566, 41567, 8805, 41576, 41578, 41582, 8815, 41584, 41585, 8816, 41587, 41588, 8820, 41592, 41594, 8826, 41590, 41597, 41596, 8837, 41614, 41625, 41629, 41634, 8869, 8878, 41650, 41652, 8885, 41653, 8887, 8893, 41667, 8900, 41669, 8899, 41674, 8907, 8911, 41689, 8920, 8925, 8927, 41699, 8932, 41701, 8931, 41706, 41708, 8941, 8939, 8947, 41716, 8948, 8957, 41729, 8961, 8962, 8960, 8964, 8967, 8968, 41737, 8970, 8969, 8974, 41742, 8975, 8973, 41747, 8980, 8977, 41750, 41754, 8987, 8990, 8993, 8994, 8995, 41765, 8997, 41768, 41785, 9019, 41790, 9022, 41801, 41802, 41806, 9042, 41811, 9044, 9045, 41817, 41818, 41819, 41821, 41823, 41832, 9064, 9066, 9082, 41853, 41855, 9089, 9092, 41861, 9093, 41864, 9102, 9107, 9109, 9114, 41883, 9116, 9121, 9122, 9127, 9128, 41904, 41907, 9139, 9142, 9144, 9145, 41916, 41918, 9150, 41921, 9163, 9165, 41933, 41942, 9174, 41947, 9179, 9183, 41953, 9187, 9188, 41954, 9192, 41962, 41959, 9199, 9203, 9204, 41978, 9213, 9216, 9218, 9220, 41988, 9222, 9224, 41994, 41993, 41998, 9227, 9234, 42003, 9235, 42005, 42007, 42008, 9236, 42010, 42014, 9247, 42017, 9249, 9242, 42020, 9253, 9252, 9255, 42026, 42030, 9263, 42032, 42033, 42034, 9267, 42036, 9268, 9266, 9269, 42042, 9275, 9274, 42045, 42046, 9279, 42047, 42049, 42051, 9278, 42053, 42054, 42056, 42058, 9290, 42059, 9293, 42062, 42063, 42065, 9298, 9299, 9300, 9301, 42067, 42069, 42068, 42071, 42074, 42075, 9306, 42078, 42079, 9319, 42089, 42090, 42094, 42097, 42099, 42100, 42104, 42106, 42107, 9338, 9345, 9346, 42116, 42130, 9363, 9365, 9364, 42134, 9368, 9369, 42141, 42136, 42143, 42138, 42149, 9383, 9386, 42157, 9390, 9391, 9393, 42163, 9396, 42162, 42165, 9399, 9400, 42170, 9397, 42175, 42178, 9411, 42181, 9413, 42180, 9412, 42188, 42189, 42191, 9423, 42193, 42194, 9427, 42197, 9429, 9428, 9426, 42202, 42209, 9441, 9443, 42212, 9444, 42211, 42215, 9446, 9449, 42218, 9451, 9453, 9454, 42223, 9448, 42225, 42226, 9459, 42229, 9466, 9469, 9471, 9479, 42247, 9481, 9482, 42250, 9485, 9486, 42254, 42259, 9492, 9494, 42263, 9495, 9497, 9496, 9501, 9502, 9505, 9506, 9509, 9514, 42285, 9521, 42290, 42291, 9524, 42293, 9522, 9527, 9529, 9537, 9550, 9553, 42324, 42325, 9556, 42328, 9554, 42340, 42344, 9578, 42347, 42346, 9579, 9582, 42351, 42350, 9588, 42357, 42359, 42360, 9594, 42363, 9595, 9598, 42367, 9603, 42382, 9617, 9620, 42389, 9621, 9623, 42388, 42402, 42403, 9635, 9637, 42410, 42411, 9643, 9646, 42415, 42420, 9653, 9652, 42423, 9655, 9663, 42433, 42434, 42436, 42437, 9668, 9669, 42440, 42439, 42442, 9675, 42443, 42446, 9684, 42453, 42454, 42456, 9688, 42459, 42460, 42461, 42463, 42468, 9700, 9705, 9707, 9709, 9711, 9716, 42484, 9719, 9727, 42496, 9728, 9730, 9729, 9732, 42500, 9737, 9738, 42508, 42509, 9742, 42511, 9743, 9745, 9746, 42515, 42512, 9749, 42510, 9751, 42520, 42521, 9754, 42523, 42525, 9758, 42526, 9759, 9764, 42537, 42541, 42542, 42544, 9778, 9780, 9784, 42553, 9786, 9788, 42558, 9791, 42561, 42564, 42567, 42569, 42570, 8461, 42573, 42574, 9806, 42577, 42578, 42579, 42580, 42581, 9810, 9809, 9812, 42585, 9818, 9815, 9813, 9823, 42591, 9825, 9826, 9828, 9829, 9831, 9834, 9839, 42608, 9842, 9843, 42612, 9844, 9845, 42617, 42618, 42619, 9852, 42621, 42622, 9854, 9866, 22535, 42640, 42641, 42648, 42655, 9887, 42657, 9889, 42659, 9890, 42661, 9891, 9892, 42664, 9893, 9898, 42667, 22536, 9902, 42672, 9906, 9907, 42675, 9908, 9909, 9917, 22537, 9919, 42688, 42690, 9923, 9924, 21512, 9930, 42699, 42700, 42701, 9935, 42702, 42703, 9941, 42716, 42718, 42723, 42724, 9956, 9958, 9960, 9961, 42729, 9963, 9965, 42734, 42733, 22539, 9971, 9972, 9974, 9975, 42744, 9978, 9983, 42752, 9984, 9986, 9987, 42755, 9989, 42757, 9993, 42762, 9995, 9994, 9997, 9998, 10001, 42771, 42772, 10015, 42785, 42786, 42787, 10019, 10021, 10020, 10033, 10034, 42803, 10036, 42805, 10035, 10037, 42811, 10043, 42815, 10047, 42833, 42834, 42835, 10068, 42837, 10066, 10073, 42850, 10082, 42852, 42865, 42868, 42873, 10109, 42877, 42899, 10133, 42903, 42908, 10145, 10148, 42917, 42923, 42927, 10161, 10163, 10164, 42935, 10167, 10166, 10177, 10180, 10183, 10184, 10187, 42955, 10191, 42956, 42973, 10209, 10215, 42985, 42988, 10221, 42990, 10223, 10227, 10238, 10240, 10241, 10242, 43010, 43008, 43009, 47626, 43012, 43011, 43017, 43018, 43019, 10249, 10253, 10254, 43022, 43024, 10257, 43026, 10258, 10259, 43029, 43021, 43030, 43032, 43033, 10260, 10262, 10268, 43037, 43038, 10271, 10263, 10266, 43042, 43043, 10276, 43045, 10278, 43047, 10280, 43049, 10281, 43051, 10283, 43053, 43055, 43056, 10290, 10291, 10292, 10293, 10296, 43065, 10297, 10298, 10300, 43069, 10302, 10303, 15073, 43073, 43074, 10301, 43076, 43077, 43080, 15076, 43085, 43089, 10322, 10323, 43092, 10324, 10325, 43095, 10329, 10330, 10331, 43100, 43098, 43102, 43103, 10335, 43105, 10338, 43106, 10340, 10342, 43111, 10344, 10346, 10347, 43115, 43118, 10351, 10350, 10353, 10354, 43123, 43124, 10356, 10358, 10360, 43130, 10363, 43133, 43134, 43152, 10387, 10388, 43158, 10390, 43160, 43161, 10394, 43163, 10393, 43165, 10396, 43167, 10397, 10392, 10402, 10403, 10404, 43172, 10401, 43166, 43176, 43177, 10408, 43178, 43181, 43182, 43184, 43185, 10418, 43187, 10420, 43186, 10422, 43191, 43192, 10419, 10425, 10427, 43188, 43197, 10429, 43199, 15099, 10433, 10434, 10435, 43202, 43203, 43206, 10438, 43205, 10441, 43210, 43211, 43212, 43213, 10446, 10447, 43215, 43217, 10450, 10451, 43220, 10449, 10452, 10454, 10455, 10453, 43226, 43228, 43229, 43230, 43231, 43233, 43234, 43235, 43236, 43237, 43238, 10471, 43240, 10473, 10474, 10466, 43244, 10478, 43247, 43249, 10481, 10483, 10484, 43253, 43254, 15110, 43256, 10488, 43263, 10496, 43266, 43268, 43269, 10497, 43265, 10495, 43273, 10506, 43275, 10508, 10507, 10510, 10505, 15115, 10515, 10516, 43285, 43290, 10525, 10526, 10527, 10529, 10531, 10530, 43315, 43317, 10549, 10548, 10552, 10546, 43323, 10547, 10551, 10559, 10565, 43342, 10578, 43349, 43351, 10583, 10581, 10586, 43355, 10589, 43356, 10591, 10600, 10608, 43376, 10609, 10614, 43383, 10615, 43391, 43400, 10643, 43420, 43421, 43422, 10654, 10653, 10658, 10655, 10661, 43434, 10675, 43445, 43450, 10685, 43455, 10689, 10693, 10695, 10696, 43469, 43471, 10703, 43475, 10707, 43485, 43493, 10723, 10727, 10722, 43497, 43498, 10731, 10730, 43502, 43503, 10732, 10739, 10743, 43511, 43514, 43517, 10751, 10755, 10756, 10758, 10760, 10761, 43529, 10763, 43531, 10762, 43534, 10767, 10769, 43538, 10771, 10766, 10773, 43539, 43555, 10787, 10789, 10788, 10794, 43568, 10805, 43574, 43577, 10810, 43579, 41227, 43585, 43586, 43587, 43588, 43589, 10819, 10820, 43593, 43594, 43601, 43602, 43604, 10836, 10838, 43610, 10842, 43612, 43614, 10847, 41232, 10858, 10863, 10865, 43634, 10867, 10868, 10871, 10873, 10877, 10891, 43662, 10900, 10901, 54272, 10914, 10916, 43685, 10917, 43693, 43695, 10932, 10933, 10936, 10946, 43715, 43714, 43717, 10948, 10952, 43727, 10959, 10962, 10971, 10975, 43744, 43745, 43746, 43747, 10979, 10981, 10977, 43751, 43752, 43753, 43755, 43759, 10993, 10995, 43763, 43764, 10991, 43768, 10994, 10997, 11008, 43776, 11007, 11014, 43783, 11015, 43785, 43786, 11019, 11018, 43789, 43790, 11023, 43791, 11022, 43792, 43795, 11026, 11025, 11029, 43802, 43806, 43813, 11047, 11045, 11043, 43820, 8708, 43824, 11058, 43828, 11061, 11063, 11071, 8714, 43850, 43853, 43854, 43856, 43869, 43871, 43873, 43876, 11115, 43888, 11121, 11123, 43893, 43899, 11140, 43920, 43921, 43927, 11163, 43935, 11170, 43939, 43941, 43943, 11179, 43950, 11186, 43955, 43957, 21764, 11203, 43971, 43973, 43977, 43978, 43987, 43989, 11218, 11221, 43994, 11227, 43996, 43998, 11231, 11234, 44003, 44005, 11237, 44008, 44006, 11243, 44013, 44012, 44019, 11251, 11253, 11259, 44026, 44032, 44033, 11264, 44035, 44037, 44040, 11274, 44043, 11275, 44045, 11276, 44047, 11279, 11278, 44050, 44051, 44052, 11285, 21782, 44062, 11301, 11314, 11315, 11317, 11323, 44101, 44104, 44108, 44110, 11351, 44123, 44124, 47849, 28311, 11378, 11379, 11380, 11381, 11387, 44229, 11467, 44236, 11471, 44243, 44245, 11479, 11489, 11490, 11492, 11494, 44265, 11501, 11503, 47878, 11520, 44289, 11522, 11523, 44291, 44293, 44296, 11529, 11530, 11531, 11528, 44297, 44305, 11535, 44307, 44309, 44311, 11546, 44317, 11550, 44319, 44327, 44341, 11581, 44361, 44362, 44365, 44366, 44371, 44373, 8819, 44375, 44376, 15333, 47899, 11618, 44389, 11638, 44407, 44409, 44410, 11642, 44413, 44414, 11645, 11655, 44425, 44426, 44430, 44434, 44435, 44437, 44439, 44442, 44445, 44446, 44449, 44450, 44451, 28375, 44453, 44461, 44466, 11702, 11703, 11707, 11709, 11708, 11710, 11719, 11720, 44490, 11718, 44492, 44493, 11730, 11732, 11733, 44506, 44511, 11749, 11748, 11751, 44520, 44521, 44522, 44526, 44527, 11764, 11766, 11768, 44538, 11772, 44541, 11774, 44545, 44547, 44549, 11781, 11779, 28394, 11788, 11785, 11791, 44565, 44563, 11805, 11829, 11839, 11843, 44617, 44620, 11851, 11853, 11857, 11869, 44659, 44668, 11902, 44677, 44695, 11953, 44737, 44739, 11971, 11975, 11987, 44765, 44769, 44772, 44773, 44776, 12019, 44789, 12027, 44797, 12032, 44800, 44802, 44803, 12036, 44807, 12039, 44809, 12043, 44811, 44813, 12046, 44814, 12045, 12050, 44819, 44820, 12052, 44824, 12057, 12056, 12058, 44831, 44836, 12069, 12074, 12078, 44848, 12081, 12085, 12090, 44866, 44868, 44869, 44873, 44881, 44898, 44899, 12137, 12139, 44910, 44937, 12170, 44938, 12174, 44945, 44949, 12181, 12180, 44958, 12196, 61041, 12206, 12212, 44982, 44992, 44993, 12226, 45006, 12241, 12244, 12245, 12246, 12247, 12248, 45017, 45024, 12257, 12258, 12260, 12261, 45030, 12262, 54540, 45033, 45037, 12269, 45039, 12271, 12273, 12275, 12276, 45045, 12278, 12279, 12280, 12283, 12287, 45058, 12290, 12301, 45071, 45066, 45073, 12305, 12309, 12306, 12314, 12317, 45086, 45089, 12336, 45106, 45109, 45111, 45112, 45113, 12345, 12343, 12347, 12350, 45131, 8971, 45159, 45166, 12400, 45173, 45175, 12407, 45181, 12414, 45185, 45186, 45188, 45194, 45198, 45199, 12432, 45201, 12435, 12446, 45223, 45233, 12466, 12470, 12474, 12479, 45255, 12496, 45271, 45277, 12510, 12512, 45287, 12527, 45310, 45312, 45313, 12544, 12546, 12551, 12552, 45319, 12553, 45331, 12565, 45335, 45339, 45332, 12574, 45343, 45345, 45347, 12582, 12592, 45365, 12600, 12603, 12605, 12606, 12607, 22644, 45388, 12621, 12622, 45393, 45394, 41586, 45396, 12633, 12637, 12638, 12641, 12650, 45425, 45429, 12676, 12702, 45476, 12708, 12712, 45491, 12726, 45501, 48122, 12755, 12768, 12771, 45545, 45549, 45551, 12783, 12787, 45562, 12800, 45569, 12802, 45572, 45573, 12806, 45575, 45576, 12808, 45580, 45585, 45587, 45588, 45591, 45586, 45589, 12823, 12830, 45598, 45603, 12835, 12834, 12836, 12842, 12852, 45620, 45624, 45625, 12862, 12863, 12875, 45649, 12881, 45652, 12890, 12893, 45667, 15590, 45681, 45682, 45686, 12917, 45684, 12919, 45705, 45706, 12942, 12943, 12944, 12946, 45717, 12949, 45721, 12958, 12961, 12962, 12975, 12976, 12977, 45747, 12980, 12982, 12989, 45765, 13016, 13028, 45797, 13027, 13032, 13035, 13039, 13043, 45814, 13048, 13051, 13056, 13057, 45828, 13058, 45831, 13064, 45834, 13068, 45843, 13079, 45848, 13091, 45861, 15629, 45874, 45881, 45883, 13117, 13118, 45893, 13128, 45897, 13133, 13136, 13138, 13146, 45915, 45916, 13156, 13158, 13160, 13171, 13172, 45942, 13176, 13180, 13186, 13187, 45961, 45971, 13211, 13212, 13213, 13214, 13221, 13224, 13229, 13230, 13238, 13254, 46027, 46035, 13270, 46049, 46050, 13283, 46058, 46061, 13293, 46067, 46068, 46070, 46072, 46073, 13307, 13312, 46082, 46084, 13316, 13318, 13320, 46091, 46094, 13326, 13323, 13321, 13335, 13338, 46110, 13343, 46119, 13353, 46121, 46124, 46126, 46129, 46130, 46132, 13366, 46137, 13369, 13370, 46142, 13375, 46154, 46158, 41739, 46161, 13394, 46164, 13396, 13398, 13397, 22202, 46170, 13402, 13415, 13418, 46186, 46193, 46195, 13428, 46200, 13434, 46203, 46216, 46222, 46225, 13459, 13460, 13464, 13466, 13470, 13471, 46239, 46241, 13473, 13476, 13478, 13479, 46248, 13480, 13482, 13490, 46269, 46274, 13509, 46279, 13507, 46285, 13522, 13523, 46293, 13524, 13525, 54792, 13539, 46308, 46309, 46307, 13542, 13544, 13545, 46314, 13550, 46321, 13562, 13569, 13571, 46338, 46337, 13574, 13575, 46344, 13577, 46346, 13578, 46345, 13582, 46350, 13581, 13580, 46354, 13591, 13592, 12263, 13601, 46370, 13604, 13607, 46378, 46379, 13620, 46391, 13623, 46392, 13629, 46397, 13633, 13634, 46405, 46411, 46413, 46417, 13650, 46418, 13657, 13659, 13658, 46431, 46446, 13678, 13681, 13682, 46459, 13687, 13694, 46469, 46472, 46474, 13713, 46485, 13721, 13722, 13726, 13735, 46506, 13741, 46513, 46516, 13751, 46529, 46533, 46535, 13769, 13770, 46539, 46545, 13781, 46549, 46550, 46553, 46554, 46555, 46556, 46558, 46561, 46564, 13799, 13801, 13805, 13816, 46586, 46593, 46594, 13828, 13825, 46596, 13831, 46600, 13833, 13834, 46598, 13832, 46605, 13838, 13836, 46599, 13841, 13846, 46618, 46621, 13854, 13855, 46622, 13858, 13860, 13864, 13872, 13875, 13876, 46651, 13884, 13886, 13887, 13889, 46659, 46661, 13895, 13901, 46670, 13906, 13905, 13908, 46677, 46676, 46679, 13912, 46680, 13913, 46683, 13915, 46678, 13911, 13919, 13914, 13921, 13922, 13924, 13927, 13930, 13935, 13947, 13948, 46718, 13950, 13953, 13967, 46741, 13983, 13986, 13987, 13988, 13989, 46762, 13994, 13998, 14002, 14003, 14005, 14004, 14012, 14013, 14015, 14016, 46785, 46786, 14019, 14020, 46788, 46791, 14026, 46796, 46798, 14031, 14032, 14029, 46805, 14037, 14039, 14041, 46811, 46814, 14048, 14051, 14052, 14053, 14054, 14055, 14056, 46824, 14057, 46826, 46829, 14061, 14064, 14063, 14069, 14070, 14073, 14074, 14077, 14079, 14082, 46851, 14083, 14085, 46853, 14087, 14089, 46858, 14090, 14092, 14093, 46862, 14094, 14095, 14091, 46866, 46869, 14102, 46883, 14119, 46885, 46899, 46915, 14156, 46927, 14160, 46929, 46932, 14169, 14170, 46939, 46943, 14172, 46946, 14173, 14194, 46963, 46964, 14197, 14195, 14199, 14207, 61443, 46993, 14226, 14224, 14242, 14244, 14257, 14258, 47028, 14262, 14263, 47031, 14268, 47037, 14270, 47051, 14288, 47057, 14294, 14304, 47077, 47078, 14311, 47084, 14317, 47086, 47087, 14319, 47085, 14316, 14326, 14328, 14330, 14334, 14336, 14337, 14338, 47104, 14340, 14341, 14342, 14343, 47112, 47113, 47115, 14348, 47117, 14349, 14351, 14350, 14353, 47118, 47123, 47124, 14359, 14362, 14364, 14367, 47137, 47139, 14374, 14376, 14377, 14378, 47149, 14382, 14386, 47155, 47157, 14390, 14392, 14393, 47161, 14394, 14396, 14398, 14399, 47170, 47174, 47179, 14414, 14416, 47185, 47186, 47187, 14418, 14421, 47191, 14426, 14427, 47196, 47197, 14430, 14431, 47198, 14434, 14436, 14440, 14442, 14445, 14446, 14447, 47214, 14449, 14450, 14452, 14454, 14455, 14456, 47225, 14457, 47227, 47229, 47233, 47236, 47237, 47242, 47250, 14483, 47252, 14484, 14486, 47255, 14488, 14489, 14490, 14492, 14493, 14494, 14495, 14497, 14498, 14499, 14500, 14501, 47271, 14503, 14505, 14509, 14510, 14514, 14515, 14516, 14518, 14522, 14525, 47294, 14528, 14529, 14531, 14534, 14535, 14537, 47305, 14538, 14541, 14542, 47309, 47310, 47313, 14546, 47315, 14547, 14548, 14550, 14549, 47320, 47321, 47322, 47323, 47324, 47318, 47326, 14558, 14560, 47329, 14561, 47331, 47332, 47333, 14559, 14569, 14570, 47342, 47343, 47341, 47349, 14582, 14586, 47359, 14592, 47362, 47363, 47364, 47365, 14595, 14599, 14591, 14601, 14602, 47372, 47368, 47379, 47381, 47384, 14623, 14636, 47410, 14647, 47419, 14653, 14655, 47422, 47433, 47435, 47436, 47439, 47441, 14676, 47445, 14678, 47447, 14675, 47450, 47451, 14682, 47454, 14687, 14691, 14692, 14698, 14704, 14705, 14708, 14710, 14712, 14714, 14715, 14724, 14739, 47516, 47517, 14750, 14749, 14755, 14771, 14773, 47542, 14774, 47548, 14783, 14791, 14792, 14793, 14794, 47571, 14803, 14816, 14823, 47593, 14826, 14828, 14829, 14830, 14827, 14831, 14835, 14838, 14840, 14841, 14842, 47609, 47613, 14848, 14852, 47621, 14854, 14855, 47623, 47625, 14856, 47624, 47633, 47634, 47635, 14869, 47637, 47639, 47646, 14882, 47651, 14883, 14884, 14890, 47669, 47672, 47673, 47674, 47675, 14906, 14910, 14919, 47689, 14922, 14932, 14934, 14935, 14936, 14937, 47706, 47708, 14939, 47710, 14938, 14941, 14951, 47720, 47730, 14963, 14967, 47735, 14978, 14979, 14990, 47758, 14995, 14996, 14997, 14994, 47773, 15006, 47778, 15010, 15012, 15013, 15016, 15018, 15022, 15025, 15029, 15032, 15034, 47809, 47808, 15043, 47811, 47817, 47841, 15074, 47843, 15075, 15078, 47848, 47842, 47851, 47853, 15087, 15091, 47864, 47872, 47873, 15104, 15108, 47870, 15106, 15109, 15113, 15114, 47891, 15127, 47892, 47898, 47901, 47906, 47913, 47914, 15142, 47922, 47921, 47934, 15167, 47940, 15175, 47950, 47953, 15192, 47962, 47966, 35588, 15218, 15219, 47986, 47991, 48003, 15237, 48005, 48008, 48009, 48010, 15246, 48023, 15261, 15262, 48035, 48037, 15269, 15284, 15285, 48055, 15288, 15298, 15299, 48069, 48083, 15317, 15329, 15330, 15331, 48101, 48111, 15335, 15351, 15357, 48126, 48131, 15366, 48134, 15372, 48141, 48152, 15384, 48153, 15402, 15411, 15416, 48187, 15421, 48197, 48213, 15472, 48244, 48245, 48248, 15483, 48259, 15504, 15509, 48280, 48281, 48319, 48325, 15576, 48345, 15584, 48356, 15589, 48358, 15597, 15600, 15606, 15613, 48387, 48389, 15622, 48392, 15628, 48403, 15636, 15642, 48413, 15646, 15656, 48425, 15662, 15664, 48433, 15666, 48435, 15668, 15673, 48453, 15695, 15696, 15708, 15729, 15731, 15732, 15734, 15738, 15741, 15743, 48530, 48531, 48533, 29185, 48541, 48546, 29188, 48562, 48566, 15811, 15813, 15829, 48605, 48607, 15840, 15849, 15853, 15864, 48637, 15868, 48643, 48645, 48661, 48665, 15899, 48676, 15911, 48681, 48682, 48689, 15920, 15924, 48695, 48696, 48705, 48708, 22714, 48764, 48775, 48778, 22721, 16019, 16021, 48791, 48794, 22725, 22726, 22728, 22729, 48823, 22730, 16083, 55300, 55299, 48855, 48857, 48858, 48865, 48869, 16096, 16101, 55303, 16109, 48878, 48885, 48888, 16124, 48893, 48899, 16136, 48909, 16141, 16146, 16148, 16149, 16152, 16153, 16158, 16159, 16162, 16169, 16170, 16174, 48945, 16177, 16179, 16185, 16186, 16188, 16190, 16206, 16232, 49009, 49010, 49012, 16244, 49015, 49018, 16254, 49023, 49025, 49032, 49033, 16266, 16277, 49047, 49049, 49050, 49057, 49058, 16293, 49074, 16312, 16323, 16328, 16333, 16339, 16341, 16342, 16344, 16352, 49121, 49122, 49124, 49126, 49129, 16365, 49133, 49135, 16368, 49130, 16385, 16386, 16387, 16391, 16395, 16397, 16398, 16399, 16401, 16405, 16407, 16425, 16429, 16435, 16436, 16443, 16446, 16452, 16471, 16478, 16487, 16497, 16500, 16551, 16554, 16555, 16557, 16558, 16561, 16564, 16567, 16568, 16583, 16585, 16589, 16590, 16593, 16597, 16598, 16607, 16622, 16625, 49408, 16641, 49410, 49413, 16648, 16650, 49420, 16655, 16654, 16661, 16664, 16686, 49457, 16690, 49459, 16691, 16692, 16693, 16696, 49471, 16724, 16729, 16740, 16761, 16779, 16792, 49570, 16806, 49575, 16809, 16820, 16822, 16825, 49594, 16838, 16841, 16851, 16852, 49623, 16855, 16856, 16857, 16854, 49628, 16861, 49632, 49634, 16868, 16870, 16871, 49641, 49642, 49643, 16889, 16890, 16893, 16894, 16895, 49667, 16900, 16901, 49671, 16904, 16902, 16907, 16910, 16915, 16945, 16946, 16947, 16948, 16949, 49732, 49744, 16980, 16985, 16989, 17005, 55483, 17011, 55485, 17021, 55487, 17049, 49822, 55493, 17060, 55494, 55496, 17078, 17083, 55499, 17090, 17097, 55503, 17113, 17122, 17125, 17126, 49897, 17132, 17141, 17142, 17144, 17147, 17151, 49922, 17153, 17156, 17158, 17160, 17161, 49931, 49925, 17169, 17171, 49939, 49945, 17177, 49947, 17179, 17174, 49951, 49946, 49962, 9931, 17202, 17204, 9933, 49977, 49978, 17209, 17211, 49981, 17210, 17234, 17237, 17238, 17241, 17242, 50035, 17270, 17274, 17275, 22975, 50066, 17299, 17301, 17306, 17308, 50082, 17318, 50087, 17321, 50090, 17323, 17325, 17332, 17334, 17336, 17337, 17349, 17353, 17358, 17361, 17363, 17362, 55553, 17367, 17368, 55554, 17369, 17364, 17373, 17375, 50146, 17380, 17381, 17379, 17384, 17393, 17394, 17395, 17396, 17397, 17398, 17401, 17402, 17406, 17407, 17409, 17410, 17412, 17416, 17417, 17419, 17414, 17422, 17415, 17426, 17427, 17428, 17433, 17434, 50203, 17436, 17439, 17444, 17445, 17446, 17447, 17451, 17453, 17455, 17458, 17459, 17460, 17461, 17466, 17467, 17468, 17470, 17471, 17476, 17481, 17489, 17491, 17493, 17492, 17496, 17498, 17506, 17509, 17511, 17515, 17518, 17519, 17521, 17522, 17524, 17525, 17527, 17530, 17534, 17537, 17549, 17551, 17553, 17554, 17555, 17556, 17561, 17562, 17563, 17566, 17567, 17569, 17572, 17574, 17577, 17579, 17586, 17587, 17588, 17589, 17592, 17601, 17602, 17603, 17604, 17605, 17607, 17611, 17615, 17618, 17619, 17620, 17621, 50396, 17627, 17630, 17635, 17636, 17637, 17638, 17640, 50409, 50411, 17643, 17646, 17641, 23046, 17651, 17653, 17656, 17658, 17661, 50433, 50435, 50439, 17671, 17673, 50451, 50452, 17686, 17688, 50457, 50459, 17689, 17702, 17707, 17713, 17714, 17716, 17717, 17720, 17721, 17725, 50506, 17739, 17748, 17751, 17752, 50525, 50533, 50546, 17786, 50555, 50557, 50559, 17813, 50594, 17827, 17828, 50602, 17839, 17853, 17867, 17873, 17875, 17878, 17879, 17883, 17885, 50657, 17894, 50669, 17909, 17912, 50689, 17921, 50691, 17924, 17922, 50690, 17926, 17928, 17929, 17930, 17931, 50693, 50692, 17927, 50695, 17937, 17938, 17939, 17941, 17945, 17946, 17947, 17948, 17949, 17951, 17950, 17958, 17962, 17963, 17966, 17967, 17970, 17975, 17977, 17978, 17979, 17980, 17981, 17982, 17983, 17994, 17998, 18002, 18005, 18008, 50777, 50781, 18014, 18021, 18025, 18029, 18033, 18034, 18036, 50807, 18039, 18042, 18044, 18046, 18061, 18066, 18067, 50836, 18069, 18072, 18073, 18074, 18085, 50858, 18091, 50862, 50863, 18094, 50866, 18099, 50869, 18107, 18109, 18110, 18111, 18115, 18116, 18117, 18118, 62217, 18120, 18121, 50898, 18130, 50899, 50900, 18133, 18137, 18139, 18142, 18147, 18148, 18149, 18150, 18152, 50921, 18153, 18155, 50925, 18158, 50927, 18161, 18162, 50931, 18164, 50932, 18163, 18167, 18166, 18172, 18174, 18178, 18179, 18181, 18186, 18187, 18190, 18202, 18201, 18207, 18214, 18220, 50994, 18229, 18230, 18232, 18235, 18239, 18258, 18260, 18264, 18265, 18269, 51038, 18280, 18296, 18301, 55741, 18324, 18326, 18327, 18328, 18331, 18334, 18339, 18344, 18345, 18349, 18356, 18358, 10162, 18361, 18363, 18364, 18365, 18369, 18375, 18376, 18378, 18379, 18383, 51159, 18397, 18401, 18404, 18405, 18406, 18407, 18408, 51177, 51178, 18410, 18409, 51181, 51182, 18415, 18413, 18424, 18425, 18427, 51200, 18433, 18434, 51202, 18436, 51203, 18438, 51204, 51205, 51209, 18439, 18441, 18440, 18445, 51213, 18449, 18450, 18451, 51219, 18452, 18454, 18455, 18457, 51226, 18459, 18460, 18461, 18462, 51231, 18463, 51233, 18467, 18469, 18471, 51239, 18473, 18477, 18482, 18483, 18484, 18485, 18486, 18487, 18488, 18489, 18490, 18491, 18492, 18493, 18494, 18495, 18498, 18499, 18500, 18505, 18510, 18513, 18515, 18516, 18518, 18520, 18521, 18522, 18523, 18525, 18526, 18530, 51298, 51299, 51300, 51301, 18533, 18541, 18545, 18546, 51315, 51314, 51316, 18548, 18550, 18552, 51321, 18551, 18555, 51325, 51327, 18561, 18563, 18577, 18578, 18579, 18580, 51346, 51348, 18581, 18584, 18585, 18586, 18588, 18589, 18590, 18591, 18593, 18594, 51362, 18596, 51365, 18598, 18600, 51370, 18603, 18605, 18606, 18607, 51375, 18609, 18610, 18611, 18612, 18616, 18617, 18618, 18619, 18621, 18622, 18623, 18625, 18626, 18627, 18628, 18629, 18630, 18631, 51402, 18635, 51404, 18634, 18638, 51407, 51406, 18641, 51410, 18643, 18644, 18642, 18646, 51415, 18648, 18649, 18645, 18651, 18653, 18654, 51425, 51426, 18658, 51428, 18661, 51431, 18665, 51434, 18667, 18666, 51438, 18671, 55814, 18674, 18675, 51450, 18683, 51454, 18687, 18689, 51460, 18694, 18696, 18698, 18697, 18702, 18701, 18708, 18714, 18719, 18723, 18730, 18734, 18737, 18738, 51508, 18741, 18739, 18750, 18751, 18760, 18763, 18773, 18774, 10244, 18777, 18778, 18779, 18781, 18782, 10247, 18790, 18792, 18793, 18797, 18806, 18808, 10251, 18811, 18815, 18827, 18833, 51607, 18859, 18862, 18869, 51639, 18878, 18881, 18885, 18886, 18887, 18889, 18888, 18891, 18894, 18890, 18899, 10270, 18910, 18915, 51684, 18916, 18918, 18920, 18921, 18922, 18924, 18927, 18937, 18938, 18948, 18950, 18952, 51721, 18955, 18953, 18963, 18964, 18966, 18971, 18974, 18995, 18996, 18997, 19001, 19002, 19003, 19006, 51775, 51780, 19030, 19033, 19057, 19063, 19065, 19069, 51842, 51847, 51860, 51866, 51874, 51879, 19115, 51889, 51890, 51892, 51898, 51902, 19138, 19142, 19145, 19146, 19148, 19150, 19151, 51939, 19170, 19174, 19176, 19179, 19182, 19183, 19185, 19186, 19187, 19188, 19189, 19190, 19191, 19192, 51963, 19199, 51968, 19206, 19207, 19208, 19209, 51980, 19213, 19211, 19218, 19220, 19222, 19223, 19221, 19224, 19226, 19228, 19234, 19237, 19238, 19241, 19246, 19253, 19256, 19259, 19260, 19263, 52035, 19274, 19286, 19289, 19290, 19314, 19316, 19319, 19320, 19349, 52119, 19371, 19379, 19381, 19384, 19386, 19397, 19398, 19395, 19401, 19402, 19403, 19406, 19413, 19418, 19422, 52195, 19428, 19429, 19427, 19430, 19432, 19434, 19443, 19445, 19446, 19448, 19449, 19450, 19451, 19452, 19454, 52227, 19462, 19468, 19470, 16897, 19481, 16898, 19511, 19512, 19513, 19515, 52285, 19517, 19519, 16906, 19525, 19537, 19538, 19541, 19546, 10398, 19547, 52317, 19550, 19554, 19557, 19563, 19573, 19619, 19624, 19625, 52400, 19633, 52403, 52405, 19640, 19641, 29955, 19643, 19647, 19659, 10421, 52435, 19682, 19688, 52457, 19690, 19691, 52461, 19694, 19695, 19693, 52467, 19700, 19702, 19698, 19705, 19713, 19714, 52485, 19716, 19719, 19720, 19721, 19723, 10436, 52511, 19749, 19750, 19753, 10439, 19761, 19762, 19764, 52533, 19766, 10442, 52543, 19781, 19785, 19794, 19796, 19800, 19801, 19805, 19810, 19812, 19830, 19834, 19835, 52610, 19858, 19860, 19861, 23486, 23487, 19874, 19881, 19885, 19892, 19894, 19897, 52671, 19905, 19908, 19911, 19913, 19915, 19925, 19929, 19931, 56065, 19937, 19938, 52707, 19940, 52709, 19941, 19939, 19964, 19974, 19976, 19980, 19977, 19986, 19991, 19995, 20004, 20005, 20009, 20052, 20053, 20061, 10503, 20081, 20083, 20093, 52867, 52875, 20132, 20137, 20141, 52917, 20146, 52919, 20150, 20153, 20163, 20164, 20167, 20178, 20179, 20190, 20195, 20197, 20200, 52972, 20205, 20207, 20211, 20213, 20227, 20228, 20231, 20232, 53004, 20237, 20242, 20246, 20248, 20249, 53022, 20261, 20262, 53031, 53037, 20273, 20274, 20281, 20285, 20286, 10545, 20308, 20313, 20314, 20317, 20324, 20347, 20350, 20372, 20386, 20401, 20402, 20404, 20405, 20406, 20408, 20420, 20433, 53203, 20436, 20437, 20440, 20438, 20441, 20445, 20452, 20453, 20465, 20466, 20468, 20470, 20471, 20472, 20473, 20475, 20479, 53249, 53250, 20482, 53253, 53248, 53255, 53261, 20493, 53260, 20499, 53269, 53273, 53274, 53276, 53278, 53307, 20542, 53316, 53317, 43162, 20574, 53349, 53352, 53360, 53365, 53369, 53374, 53385, 53386, 20624, 53392, 53395, 53404, 53406, 53430, 53436, 53438, 53443, 20688, 53456, 20687, 53470, 20703, 20704, 53472, 53483, 53484, 20718, 53487, 20741, 20752, 17154, 53542, 20784, 53553, 53554, 53555, 53552, 53558, 20789, 53572, 53576, 43214, 53582, 20814, 53587, 53593, 20835, 53619, 53636, 53637, 53666, 53669, 20908, 20910, 53682, 53685, 20918, 20916, 53688, 20920, 20921, 53695, 20928, 20930, 20934, 20932, 20944, 20948, 20952, 53728, 20960, 20964, 53739, 53742, 20979, 20980, 53743, 20989, 53761, 20994, 20996, 20993, 20999, 53767, 53768, 21000, 21011, 21013, 53789, 21043, 53812, 53828, 53832, 53837, 21072, 21082, 53854, 21094, 43271, 53872, 53892, 53896, 21136, 21142, 53917, 53918, 53919, 53922, 53925, 21161, 53930, 21168, 53944, 21173, 53946, 56320, 53987, 21222, 53997, 53999, 21249, 21250, 54021, 21251, 21255, 21256, 21257, 54027, 54024, 54035, 54040, 54038, 21287, 54067, 21299, 54072, 54070, 21301, 54093, 54095, 54107, 54120, 21360, 21371, 21369, 54154, 54165, 54168, 21401, 54170, 54180, 21414, 54185, 21417, 54192, 21428, 21430, 54198, 21440, 21444, 54214, 21449, 21459, 21461, 21475, 21477, 21478, 54246, 21481, 54253, 54267, 21510, 21515, 54283, 54285, 21523, 21525, 54301, 54311, 54310, 54313, 21552, 54338, 54343, 54361, 54362, 21592, 54390, 21622, 21624, 54392, 54393, 54405, 21639, 54408, 54427, 21657, 54426, 54431, 54441, 21691, 54459, 21698, 21699, 21712, 21714, 21715, 21716, 21717, 21731, 21733, 21734, 21736, 21737, 54510, 54511, 21744, 21747, 21748, 54523, 54525, 54529, 21762, 21763, 21766, 21767, 54535, 21769, 21771, 21770, 54548, 54549, 21784, 54564, 21798, 54566, 54584, 54594, 54596, 54610, 54616, 21849, 21850, 54619, 54621, 54623, 21858, 21859, 54634, 21877, 21881, 54663, 21906, 21912, 21913, 21914, 21915, 54693, 54698, 21937, 21938, 54712, 54714, 21945, 54718, 21954, 54729, 21961, 21969, 21970, 21971, 21973, 21974, 21972, 21977, 21976, 21986, 21993, 54762, 21994, 22000, 4373, 22001, 22011, 54784, 22017, 54787, 22018, 22020, 54788, 22023, 54791, 22025, 22026, 54786, 54796, 54789, 22032, 54800, 22028, 54806, 22044, 22045, 22047, 22054, 54832, 22065, 22066, 54835, 22068, 22071, 22074, 22076, 54847, 22079, 22078, 54866, 22099, 22100, 54870, 54872, 22106, 54875, 22109, 22116, 22117, 54888, 54896, 54898, 54902, 22138, 22140, 22142, 54928, 22162, 54934, 22171, 54946, 54948, 54960, 54964, 54970, 22205, 54974, 22207, 54976, 22208, 22211, 22213, 22212, 54992, 22224, 22226, 22229, 22240, 55008, 55011, 22244, 22248, 22246, 55024, 22256, 55023, 22262, 55030, 22264, 22274, 22275, 22282, 22283, 10944, 22297, 10947, 22318, 10949, 55093, 55108, 55116, 55126, 22358, 55129, 55134, 55133, 22384, 22393, 22416, 22419, 22424, 22426, 22425, 55194, 22448, 22452, 22464, 22465, 22466, 10978, 22474, 10980, 22485, 22490, 55260, 10983, 55264, 22496, 22495, 22503, 55273, 55274, 55278, 22520, 22528, 22529, 22530, 55297, 22532, 22533, 22534, 55301, 55302, 55298, 55306, 22531, 22540, 22541, 55309, 55305, 55312, 22545, 55314, 55307, 22543, 22542, 55318, 55311, 22551, 55322, 22554, 22556, 55324, 55326, 22559, 10996, 55338, 55342, 55344, 22578, 22584, 55353, 22586, 22585, 55356, 22588, 22590, 22591, 55367, 55370, 22610, 55382, 55383, 22616, 22617, 55385, 22619, 22618, 55388, 22614, 55393, 55394, 22626, 22627, 22628, 22629, 55396, 55401, 22633, 22637, 55405, 55407, 22640, 55409, 22642, 55410, 55411, 22645, 22641, 55412, 55413, 22649, 22650, 55415, 55418, 22653, 55422, 22655, 11017, 55431, 55438, 55440, 22674, 22675, 22677, 55446, 55448, 22682, 55450, 22684, 22685, 55454, 55455, 22687, 55458, 22690, 55459, 55461, 22694, 22696, 55470, 22703, 55472, 22705, 22706, 22707, 22708, 22709, 55478, 55479, 22712, 22713, 22711, 22715, 22710, 22717, 55486, 22718, 22720, 55488, 22719, 22723, 22722, 55491, 22724, 55492, 55490, 55489, 55498, 22731, 55500, 55501, 55502, 22734, 22736, 55504, 55506, 22738, 22739, 22737, 22742, 22740, 55509, 22743, 55514, 22741, 55516, 55517, 55518, 55519, 55521, 22753, 55526, 55529, 22761, 22762, 55530, 55532, 55534, 22771, 22772, 55542, 55546, 55550, 55551, 22784, 22785, 22786, 22787, 22788, 55555, 22789, 55559, 22790, 55561, 55563, 55562, 55558, 22791, 55602, 22842, 22847, 55618, 22864, 22867, 22869, 22885, 55684, 55696, 22934, 22937, 22948, 55720, 22953, 22960, 55728, 22962, 55733, 22965, 22973, 22974, 22979, 22980, 22981, 22978, 22995, 23008, 55778, 55780, 55781, 23015, 55776, 23016, 55786, 55788, 55789, 23020, 55791, 23023, 23022, 55800, 23040, 55808, 23045, 23044, 55817, 23049, 23048, 23050, 23056, 55839, 23080, 23092, 23093, 23096, 23102, 23103, 55876, 23121, 23129, 23130, 23131, 55899, 23145, 55940, 55944, 55950, 55957, 55956, 55958, 23193, 55966, 55978, 4615, 23221, 55994, 23230, 56003, 23241, 23240, 23243, 56024, 56032, 23264, 23266, 23269, 56038, 23270, 23273, 56049, 56050, 23288, 23289, 23296, 56064, 23299, 23301, 56073, 56074, 56076, 56077, 23321, 23323, 56105, 23338, 56112, 56115, 23346, 23356, 23359, 56144, 23387, 56232, 23474, 56247, 23491, 23492, 23493, 43748, 23509, 56290, 56292, 23523, 23529, 23534, 23539, 23541, 56321, 56323, 56325, 56324, 23558, 56328, 56326, 56322, 56331, 23564, 56333, 56335, 23577, 56351, 23581, 56394, 23632, 43777, 23651, 23664, 56440, 23672, 23676, 23700, 56469, 23705, 23706, 23707, 23709, 23710, 56478, 56479, 23728, 56498, 56500, 56501, 56506, 23741, 56510, 23743, 56518, 11233, 11235, 11236, 56544, 56546, 56547, 23778, 56548, 23776, 56557, 23789, 23792, 56561, 23791, 23798, 23804, 56578, 56580, 23813, 56582, 23816, 56588, 23821, 23824, 23845, 56629, 23866, 56642, 56645, 56650, 56654, 56670, 23907, 23920, 23926, 23930, 23940, 23954, 23956, 56734, 56744, 23986, 56766, 56790, 24021, 56793, 56796, 24032, 56800, 24034, 56803, 56805, 56806, 56807, 56809, 56810, 56811, 56812, 56814, 24051, 56824, 24072, 24080, 56856, 24149, 56957, 56962, 24194, 56963, 56965, 56973, 56975, 24217, 24218, 57013, 57015, 57016, 24252, 57021, 24254, 24274, 24275, 57053, 57056, 24290, 57058, 57061, 24295, 57066, 24298, 57069, 57070, 24301, 57088, 24323, 57100, 24333, 24332, 24344, 24345, 57114, 57116, 57119, 57124, 57125, 24357, 24361, 57131, 24377, 57161, 57162, 57163, 24421, 57208, 57224, 57230, 24468, 24470, 24472, 24473, 57245, 24483, 57266, 57269, 24505, 24520, 57297, 24529, 57300, 24532, 24533, 24535, 57309, 57311, 57312, 24548, 24552, 57323, 24559, 57329, 57343, 57346, 24579, 57350, 24583, 57354, 24589, 24591, 24593, 57359, 24599, 24600, 57369, 57370, 24602, 24605, 24607, 57385, 24618, 24631, 24633, 24634, 24635, 24641, 24642, 24644, 57413, 24647, 24650, 24654, 57429, 57431, 24679, 24681, 24689, 24692, 24694, 24696, 57497, 24735, 24738, 24739, 24741, 24743, 24744, 24746, 24749, 24750, 24747, 24767, 24775, 24781, 24782, 24785, 24807, 57575, 24810, 24813, 24814, 24817, 24823, 24826, 24831, 57601, 24840, 57607, 57612, 57619, 24851, 24865, 24869, 24874, 24878, 24881, 24883, 57663, 24897, 57667, 24903, 24906, 24910, 24913, 57693, 57704, 24938, 24953, 24962, 57741, 24974, 57747, 24986, 57763, 24998, 25005, 57779, 57800, 25033, 25035, 25043, 25045, 25048, 25049, 25050, 25052, 25054, 57824, 25056, 57827, 25063, 25064, 57836, 25073, 25076, 57848, 25082, 57854, 57857, 25089, 57859, 57861, 57860, 57864, 25096, 25098, 25092, 25106, 25107, 57878, 57880, 25114, 25109, 57885, 25115, 25122, 57902, 25138, 25140, 57919, 57923, 25156, 57928, 57933, 25168, 25169, 57940, 57944, 25179, 57949, 57951, 25193, 25197, 57969, 25203, 57971, 25218, 57987, 57986, 57997, 25233, 25234, 25241, 25250, 11533, 11534, 25265, 58035, 25282, 58051, 25281, 25284, 25291, 25298, 25314, 25315, 25317, 58088, 25321, 25322, 58093, 25329, 58104, 58109, 25343, 58114, 58116, 58117, 25350, 58119, 58120, 25354, 58115, 25361, 58131, 58134, 58136, 58139, 25371, 58147, 25396, 25399, 25402, 25418, 58189, 25422, 25426, 58195, 58205, 25462, 25465, 58243, 25474, 25479, 25491, 25493, 25517, 58288, 58291, 58295, 25539, 25541, 25544, 25547, 25555, 58326, 25560, 25561, 25563, 25565, 25567, 25573, 25572, 25569, 25576, 58355, 58356, 25590, 25591, 25592, 58360, 25593, 58367, 25608, 25609, 25611, 58383, 58384, 58381, 25618, 58397, 25634, 58406, 25639, 58409, 58414, 58415, 25650, 58418, 58425, 58426, 58431, 58433, 58434, 58435, 58436, 58437, 58438, 58440, 58443, 58445, 58447, 58449, 58451, 58453, 58455, 58458, 58461, 58463, 58466, 58472, 58474, 58481, 58483, 58489, 58490, 58493, 58495, 58500, 58507, 58509, 25742, 58513, 58514, 58521, 25753, 58522, 58529, 58530, 58531, 58532, 58537, 58541, 58554, 25793, 25794, 58562, 58564, 25803, 58573, 58572, 58586, 25820, 58587, 58588, 25819, 58590, 58595, 58596, 58597, 58602, 58605, 25841, 58610, 58613, 25847, 25848, 58618, 58622, 58625, 58626, 58628, 58627, 58629, 58631, 25865, 25877, 58661, 25895, 25901, 58675, 25912, 58682, 58687, 58685, 25921, 25923, 25924, 25927, 25930, 25931, 25934, 58705, 58707, 58708, 58709, 58706, 25944, 58712, 25954, 58723, 25956, 58730, 58741, 58739, 25977, 58754, 58763, 25997, 58766, 26001, 58786, 26023, 26029, 26037, 58806, 58808, 58810, 26050, 58821, 26055, 26059, 58835, 26069, 58843, 58845, 26077, 26085, 26089, 26090, 58868, 26101, 26104, 58875, 58879, 58881, 26112, 58882, 58883, 58884, 26118, 57293, 26120, 58887, 58892, 58893, 58894, 58895, 58896, 26130, 26135, 58906, 26141, 26146, 26147, 26148, 26151, 26152, 26154, 26159, 58928, 26162, 26164, 26167, 58938, 24740, 26171, 26170, 26175, 26178, 26181, 26183, 26184, 26189, 26194, 58963, 58962, 58965, 26199, 58968, 26201, 58973, 26205, 26210, 26213, 26217, 26221, 58992, 26227, 58997, 58998, 26231, 26235, 26239, 59024, 26260, 26264, 26265, 26269, 26270, 26283, 26286, 44302, 59056, 26289, 26295, 26296, 26299, 26302, 26303, 59072, 26307, 26308, 26310, 26312, 26313, 26330, 26331, 26334, 26344, 26349, 26350, 26351, 26353, 26359, 26360, 26367, 59138, 59139, 59140, 59141, 26378, 59156, 26389, 26414, 59187, 59189, 26424, 59194, 26433, 26435, 26436, 26447, 59217, 59218, 59220, 59223, 26459, 59235, 59236, 26475, 26488, 59267, 59269, 26503, 59274, 26509, 59283, 59287, 26523, 59293, 59306, 26539, 26543, 26555, 59326, 59330, 26580, 59356, 26593, 59362, 26595, 26598, 26599, 26600, 26601, 59370, 59372, 26602, 59374, 26612, 59388, 26624, 59393, 59394, 59395, 59396, 59397, 59401, 59402, 59403, 26637, 59408, 26641, 59410, 26642, 59411, 59412, 59414, 26647, 26650, 59420, 59421, 26654, 59422, 26658, 26663, 26664, 26666, 26670, 26671, 59440, 26674, 59445, 24841, 26679, 59455, 59457, 59473, 59474, 59476, 59479, 59481, 59484, 59485, 59489, 59490, 59495, 59498, 59503, 59506, 59507, 59508, 59509, 26744, 59514, 26747, 59517, 59518, 59519, 26749, 59521, 59522, 59525, 26759, 59528, 59531, 59536, 59541, 59544, 59545, 59546, 59549, 59550, 59551, 59554, 59555, 59556, 59561, 26793, 59562, 59565, 59566, 26797, 59568, 26798, 26802, 59574, 59575, 26809, 59578, 59580, 26813, 26814, 59583, 59585, 59586, 59587, 59588, 59589, 59591, 59594, 59596, 59597, 59598, 59599, 59602, 26836, 26838, 26840, 59609, 59610, 26843, 59612, 26846, 59615, 59614, 26849, 26850, 59619, 59618, 59621, 59622, 26855, 26856, 59617, 26858, 59627, 59620, 59623, 26862, 26863, 59628, 59637, 59641, 59642, 59643, 59644, 59646, 59647, 59649, 59651, 59652, 26886, 59655, 26888, 26889, 26890, 59658, 59659, 26894, 26899, 59667, 59669, 26903, 26904, 59674, 26917, 26929, 26930, 26932, 26931, 26935, 59706, 26945, 26946, 26949, 26952, 26955, 26957, 26959, 26963, 26964, 59733, 26965, 26971, 59740, 26995, 59768, 27003, 27010, 59779, 59781, 27015, 59792, 59797, 59811, 59813, 27051, 27069, 27070, 59846, 27081, 5383, 59859, 27099, 59876, 59877, 27108, 27112, 59885, 27118, 59887, 27122, 59891, 27126, 27127, 59896, 27128, 59905, 59906, 59908, 59909, 27142, 59911, 27144, 27145, 59916, 27150, 27153, 27154, 27155, 27157, 27163, 59933, 27176, 59956, 59957, 27188, 27191, 27192, 27194, 27198, 27199, 59966, 27201, 27204, 27205, 27207, 27208, 27211, 27215, 59988, 59989, 27217, 59993, 59994, 27241, 31467, 60033, 60034, 60035, 27282, 27291, 27299, 27300, 27304, 27305, 60074, 27313, 27307, 60084, 60085, 60099, 27349, 60128, 27360, 60131, 27364, 60136, 27371, 27377, 60159, 27392, 60170, 27404, 27405, 27401, 27414, 27419, 60195, 60197, 60200, 60203, 27442, 27443, 27444, 27447, 27459, 27463, 27471, 27473, 27474, 27480, 27499, 27509, 27524, 60309, 27555, 60323, 60328, 27572, 27576, 27582, 27594, 60373, 60376, 27610, 27611, 27617, 60389, 27623, 27624, 60390, 27640, 27642, 27648, 27649, 60419, 27652, 60421, 60424, 27654, 27659, 60429, 27663, 27669, 60445, 60446, 27677, 27695, 27701, 27705, 27710, 27711, 27713, 60485, 27716, 27720, 27722, 27723, 27725, 27726, 27727, 27729, 27730, 27731, 27733, 27735, 27741, 27743, 27746, 27749, 27754, 27757, 27763, 27765, 27767, 27768, 27805, 27806, 27810, 27811, 27818, 27821, 27824, 27825, 27826, 27827, 27829, 27831, 27839, 27851, 60627, 60629, 27870, 27879, 27880, 27883, 27882, 60653, 27887, 27885, 27889, 27905, 60677, 27912, 27913, 27915, 25087, 60691, 27938, 60709, 27943, 27945, 27954, 60722, 60725, 27959, 27966, 60735, 27969, 27970, 27975, 60757, 27991, 60760, 27993, 60789, 28025, 28026, 60794, 60793, 60797, 60799, 28039, 60810, 28045, 60816, 28050, 28053, 60821, 28051, 28052, 28055, 60826, 28082, 28086, 28091, 60863, 28097, 38150, 60876, 28114, 28119, 28129, 60898, 60899, 28132, 60900, 60902, 60905, 28138, 28142, 28146, 28151, 28161, 60931, 60933, 28169, 28171, 60940, 60947, 28199, 60974, 28217, 28225, 28228, 61027, 61043, 28275, 61051, 61052, 61053, 61054, 61059, 28295, 28298, 28308, 61079, 61082, 61095, 61098, 61105, 28339, 28347, 61116, 61139, 61143, 61145, 61146, 61149, 61153, 61155, 28387, 61157, 61162, 28397, 28399, 61166, 61171, 28416, 28419, 28424, 28428, 28429, 28433, 28441, 61212, 28455, 28457, 28458, 28473, 28472, 28477, 28481, 28484, 61252, 28490, 28494, 28503, 28505, 28507, 28522, 28529, 61299, 28532, 28535, 28537, 61309, 61311, 61317, 61321, 61330, 61333, 28562, 28567, 28571, 28577, 28587, 28593, 28595, 28605, 28625, 28626, 61395, 61396, 28631, 61400, 61408, 28641, 28642, 28643, 28644, 61412, 61414, 61423, 61440, 61442, 61441, 28674, 61445, 61447, 61452, 28685, 61453, 61454, 61455, 61457, 28691, 61458, 61466, 61469, 61495, 61497, 28731, 61506, 28742, 61515, 28747, 61518, 28757, 28759, 28763, 28764, 61552, 61555, 28787, 61557, 61559, 61561, 61566, 38918, 61584, 28819, 28821, 61589, 61593, 61609, 61611, 61618, 61626, 61648, 28894, 61662, 61664, 61665, 61671, 61673, 61676, 61679, 61696, 28929, 28947, 28949, 61731, 28976, 28979, 28981, 61744, 61759, 61763, 28997, 29001, 61777, 29029, 29049, 29060, 29066, 29073, 61851, 61858, 61869, 61880, 29115, 29129, 29131, 61907, 29141, 29139, 29148, 29154, 61920, 29156, 29159, 61931, 29163, 61935, 29182, 61953, 29186, 29189, 61959, 29192, 61960, 29191, 61965, 29203, 29205, 61973, 61976, 61987, 29223, 61998, 29235, 62003, 29257, 62029, 62034, 62040, 62050, 29299, 29320, 62089, 62090, 62088, 29326, 29328, 29329, 29331, 29337, 62107, 62114, 62125, 62129, 62131, 29367, 62141, 29413, 62184, 62189, 29429, 62210, 29442, 62213, 29441, 29447, 29443, 29444, 62221, 62227, 62233, 62243, 62248, 62264, 62265, 62266, 62269, 62271, 62277, 62275, 29525, 62295, 62301, 62327, 29573, 29582, 62349, 29587, 29589, 62360, 29611, 62381, 62390, 62406, 29651, 29653, 29660, 29669, 29668, 29673, 29672, 62445, 29683, 29687, 62459, 29698, 29700, 62473, 29706, 62483, 29715, 29717, 62487, 62490, 62493, 62497, 29735, 62505, 62506, 62508, 62509, 29742, 62514, 62510, 62516, 29747, 62522, 29755, 62521, 62525, 62527, 29762, 62531, 29764, 29767, 62536, 62538, 29770, 29779, 62554, 29803, 29813, 29809, 62584, 29815, 29819, 62589, 62591, 62593, 29825, 29826, 62606, 29838, 29842, 29845, 29847, 29849, 62619, 62623, 29857, 62626, 29874, 29882, 29883, 29889, 29907, 29909, 29921, 29923, 29924, 29926, 29928, 29929, 62698, 29931, 62701, 29937, 29939, 62712, 62713, 29940, 29949, 62715, 62721, 62726, 62727, 29959, 29961, 29962, 29963, 30001, 62771, 62773, 62776, 62789, 62792, 30025, 30026, 30027, 30030, 30036, 62813, 30050, 62841, 30074, 62845, 62850, 62851, 30083, 62853, 30085, 30091, 62862, 62863, 30095, 30107, 62875, 30119, 62888, 30125, 62894, 62897, 30130, 30133, 62906, 62923, 30165, 30167, 62934, 62939, 30177, 30181, 30193, 30196, 30197, 30199, 30206, 30207, 62976, 62978, 62979, 30212, 62981, 30214, 62983, 30216, 30217, 62980, 62988, 25545, 30219, 30226, 62996, 63001, 30236, 30238, 63011, 30245, 30249, 30252, 63024, 30258, 63027, 30261, 63034, 63038, 63039, 63045, 30278, 63049, 30285, 30286, 30289, 63057, 63058, 63061, 63063, 63067, 63069, 30302, 63080, 30321, 30322, 30324, 63094, 30327, 63096, 30334, 63107, 30344, 30346, 30354, 63123, 30355, 63137, 63138, 63139, 30377, 30382, 30386, 30387, 63156, 63157, 30390, 30389, 63160, 30388, 30395, 63166, 63168, 12555, 63184, 30419, 63188, 30423, 63200, 30435, 30436, 63205, 30437, 30439, 30440, 30441, 63213, 63215, 30449, 63216, 63219, 63220, 30452, 30454, 63222, 63224, 30450, 30457, 30459, 30463, 63231, 63232, 63234, 30467, 30469, 63237, 30474, 63251, 30499, 30508, 30515, 63283, 63285, 63299, 63301, 30534, 30542, 63313, 30547, 63315, 63318, 63320, 30554, 63323, 63347, 30579, 30581, 30582, 63351, 30585, 63368, 30606, 30617, 30626, 63394, 63397, 30637, 30646, 30647, 30651, 30684, 30689, 63458, 30691, 30692, 30695, 30696, 30697, 63466, 63467, 63468, 63470, 63480, 30713, 63488, 63489, 63490, 30722, 30723, 63493, 63494, 63495, 63492, 30725, 30732, 30733, 63501, 30734, 30735, 30737, 30738, 63507, 63508, 30739, 30742, 30743, 30740, 30744, 30741, 30747, 30751, 63522, 63523, 63525, 30759, 63529, 30761, 63531, 30764, 63533, 30767, 63535, 63538, 63539, 30771, 63540, 30770, 63545, 63549, 63554, 30786, 63558, 30792, 63561, 64736, 63563, 63565, 30804, 63573, 30806, 63575, 30808, 30809, 63578, 63579, 63581, 63582, 30818, 30819, 30820, 63589, 63592, 63597, 30832, 63607, 30842, 63613, 30847, 63617, 63619, 63620, 63621, 30862, 63631, 63633, 30866, 30865, 30867, 30868, 63639, 63640, 30871, 30874, 63643, 63645, 63647, 63650, 63653, 63655, 30890, 30895, 30898, 30899, 30900, 30901, 63673, 30906, 63677, 63678, 30912, 30913, 30914, 63682, 63683, 63680, 63686, 63684, 63685, 63689, 30919, 30916, 63693, 63694, 63696, 63697, 63699, 63700, 63701, 30935, 63704, 30940, 63708, 30942, 63711, 63713, 63715, 63716, 30953, 30954, 63722, 63726, 6153, 64770, 63733, 6155, 63737, 30970, 30972, 30974, 63743, 30978, 30979, 63747, 30981, 30980, 63751, 63750, 63753, 30988, 63757, 63765, 6165, 31025, 31026, 63795, 31027, 31029, 63800, 31038, 31043, 63816, 31061, 63830, 31098, 31108, 63877, 31114, 63886, 63891, 63889, 63895, 63912, 31162, 63930, 31166, 31173, 31169, 31175, 63944, 63942, 31187, 63964, 31201, 63975, 31212, 63981, 31215, 63983, 31237, 31238, 31239, 31236, 64009, 31253, 64028, 31265, 31269, 64039, 31273, 64048, 31285, 64054, 64056, 31294, 31306, 31309, 31310, 31319, 64092, 64099, 64100, 31345, 31351, 31362, 31373, 31374, 31375, 64147, 64149, 64153, 64157, 64158, 31395, 64164, 64165, 31397, 64166, 64170, 31403, 31409, 64180, 31413, 64186, 31420, 31422, 31426, 64195, 31442, 31443, 31447, 64215, 64227, 31461, 31458, 31470, 31473, 31474, 31475, 31477, 64256, 64265, 31500, 64269, 64271, 31506, 31513, 64286, 31521, 31522, 31525, 64293, 64299, 31541, 31543, 31544, 31550, 31555, 31557, 31558, 31559, 64325, 31565, 31572, 64348, 31601, 31605, 31624, 12799, 31629, 31630, 64401, 12801, 64417, 64419, 12804, 64424, 31659, 64435, 31667, 12807, 64442, 31674, 31678, 31683, 31685, 38862, 31690, 31703, 31715, 64483, 64485, 31717, 31716, 31723, 31724, 31731, 31733, 31734, 64512, 64513, 64514, 64516, 64517, 64518, 64520, 64515, 31770, 64542, 31779, 31781, 64549, 31788, 31795, 31797, 31799, 31801, 64579, 31836, 64605, 64616, 31853, 64627, 31863, 64631, 64636, 31870, 64648, 64657, 64659, 31893, 31894, 31907, 6343, 64692, 31923, 31925, 31933, 64710, 64723, 64725, 38916, 31961, 31964, 64739, 64741, 64742, 31977, 38919, 31980, 64749, 64758, 31990, 64767, 32003, 64772, 32005, 64774, 32006, 32008, 32012, 32013, 64799, 64805, 32037, 32050, 32051, 64821, 64835, 64834, 32069, 64837, 64839, 64860, 32099, 64872, 32112, 32117, 32123, 32130, 64903, 64907, 64921, 64924, 64926, 64936, 64946, 32181, 32183, 64954, 64958, 64959, 32195, 64982, 64984, 12915, 64994, 32227, 32229, 64999, 65000, 32233, 65001, 65003, 65002, 65006, 65007, 32243, 32262, 32268, 65033, 65048, 65052, 65070, 32305, 65092, 65147, 65148, 65150, 65156, 65169, 65185, 65192, 65201, 65202, 32435, 32437, 32451, 65241, 65245, 65250, 65251, 32485, 32493, 65280, 32515, 32524, 32525, 32537, 65308, 32545, 65323, 32561, 32564, 65339, 32574, 65374, 65400, 32634, 32642, 65427, 65429, 65432, 65442, 65444, 65448, 65450, 65451, 65460, 65461, 32695, 65476, 65480, 65479, 65492, 32725, 32741, 65510, 65513, 65517, 32748, 65523, 65519], 25552: [32789, 22, 37, 32805, 51, 53, 32821, 64, 32833, 69, 32835, 73, 78, 32839, 83, 32851, 85, 32863, 32881, 32914, 32918, 32923, 32927, 163, 165, 166, 191, 211, 213, 32982, 32988, 224, 32994, 32998, 32993, 33002, 33004, 33007, 246, 33025, 33027, 33029, 33036, 33037, 33049, 33072, 33073, 33070, 33083, 33084, 33088, 326, 33099, 33100, 26117, 333, 33101, 26121, 33141, 378, 33147, 33148, 33169, 33173, 428, 33198, 33200, 33199, 33228, 33230, 33231, 33247, 481, 33249, 33251, 33253, 487, 33255, 33257, 33264, 33265, 33267, 33260, 33269, 33271, 33273, 33275, 33276, 33278, 33283, 33285, 33292, 33293, 33296, 33305, 33307, 33308, 26160, 33325, 33326, 33337, 33344, 33356, 33357, 33358, 33374, 33403, 33404, 33443, 33447, 33454, 26190, 26191, 26192, 33486, 33500, 33505, 33509, 33513, 33516, 33518, 33523, 33525, 33531, 33532, 33584, 33585, 825, 33600, 835, 838, 845, 882, 33649, 33653, 890, 33680, 33681, 33685, 940, 33744, 993, 998, 1001, 26256, 26258, 1041, 1050, 1056, 1071, 33856, 1091, 1095, 1101, 1103, 1107, 1109, 1111, 1139, 1143, 1184, 1199, 26290, 1210, 1254, 34075, 34089, 34091, 26317, 34107, 26320, 34121, 34124, 34126, 32837, 58889, 26327, 34171, 26333, 32847, 26336, 34211, 34213, 26343, 34275, 34289, 34291, 34293, 1538, 34307, 1539, 1541, 1542, 34306, 34309, 34314, 1546, 1545, 34319, 1552, 34321, 34323, 1547, 34325, 1558, 34327, 1562, 1564, 34334, 1568, 34337, 34341, 34343, 34350, 1584, 34353, 34351, 34355, 34357, 34359, 34366, 1600, 34371, 34373, 1616, 1617, 1618, 1619, 1621, 1622, 34391, 1625, 1626, 1629, 34398, 1631, 34417, 1650, 34421, 1654, 1657, 1658, 1659, 1660, 34431, 1680, 34451, 1685, 34454, 1689, 34463, 1696, 1712, 34483, 1717, 34482, 34497, 34499, 34501, 34503, 1737, 1738, 1734, 34508, 34509, 1744, 1747, 1750, 34518, 34514, 34522, 34524, 34527, 34525, 34530, 1766, 34540, 34539, 1769, 34547, 34545, 34549, 1782, 1785, 34557, 1789, 34563, 34566, 1798, 34562, 34565, 34571, 34572, 34575, 34577, 34569, 34579, 34581, 34585, 34587, 34597, 34603, 34613, 34617, 34619, 34625, 34629, 34631, 34633, 34636, 34640, 34647, 1875, 34649, 1882, 34654, 34655, 34673, 1914, 34683, 34686, 1945, 34719, 1954, 34721, 34725, 34727, 1967, 34739, 34742, 34738, 34751, 34753, 34757, 26448, 34771, 2005, 34780, 34775, 34785, 34789, 2022, 34795, 34799, 34803, 34805, 34797, 34800, 2041, 34812, 34813, 2081, 2086, 34864, 2101, 2102, 34873, 2106, 34875, 2108, 34877, 34878, 2109, 34880, 2113, 34885, 2118, 34929, 34930, 34933, 34934, 34935, 2166, 2170, 34939, 2172, 2173, 34942, 2175, 26487, 34960, 2198, 34969, 2202, 34971, 2204, 34973, 34974, 2207, 2205, 2209, 2214, 34988, 2245, 35015, 2246, 35025, 2257, 35029, 2262, 35041, 35042, 35045, 35047, 35051, 2284, 2285, 2287, 35073, 35077, 35079, 35084, 35101, 35115, 35116, 35117, 35118, 35120, 35127, 35133, 35134, 2374, 35145, 35147, 2380, 35161, 2396, 35191, 35196, 35197, 35216, 35218, 59104, 35233, 35237, 35241, 35247, 2492, 35271, 35276, 35279, 35292, 35295, 2531, 35299, 35301, 2540, 35313, 35315, 35317, 35319, 35321, 35323, 2556, 35324, 35329, 35331, 35333, 35340, 35341, 35358, 35371, 35374, 35389, 2624, 2630, 35401, 35406, 35405, 35417, 2652, 35453, 35454, 26589, 2707, 35489, 26592, 35493, 35502, 2748, 35531, 35534, 35547, 35548, 35553, 35557, 35559, 35564, 35569, 35571, 35575, 35579, 35611, 35629, 35632, 35634, 2880, 35659, 35662, 2908, 35702, 35703, 35707, 35708, 35753, 35757, 35782, 35783, 3024, 3040, 3053, 3055, 35820, 3074, 3075, 3077, 3078, 3081, 3082, 3083, 3084, 3087, 3093, 3104, 3125, 3136, 3142, 35917, 3189, 3190, 3191, 35965, 3221, 3222, 3232, 36014, 36015, 3253, 3267, 3280, 3283, 3297, 3298, 3299, 3302, 36095, 3337, 3338, 3339, 3343, 3350, 36123, 36126, 3366, 36137, 36141, 3388, 3397, 3398, 36171, 3404, 3414, 3420, 36210, 3445, 3446, 36215, 3475, 26742, 3478, 3494, 36272, 3510, 36283, 3526, 36318, 36322, 3558, 3564, 36350, 36411, 36413, 36416, 36421, 3654, 36429, 36430, 36477, 36478, 36497, 36501, 59360, 36521, 36526, 59365, 36565, 36578, 36588, 36590, 3843, 3845, 3846, 3850, 3852, 3855, 36624, 36635, 3872, 3875, 36657, 36661, 36672, 36673, 3906, 3907, 3905, 36677, 3910, 3913, 3917, 3932, 3958, 36732, 36753, 3987, 3989, 4000, 4005, 36784, 4021, 36795, 4028, 36798, 4035, 4048, 36832, 36844, 36859, 4093, 36887, 36903, 36913, 36929, 36931, 36933, 36935, 36943, 36945, 36949, 36979, 36983, 37009, 37018, 37073, 37087, 37094, 37098, 37103, 37132, 37280, 37310, 37339, 37372, 37377, 37381, 37580, 37600, 37611, 37612, 37615, 37625, 59616, 37856, 37952, 38128, 38160, 38176, 38186, 38187, 38192, 38199, 38203, 38208, 38217, 38219, 38220, 38222, 38266, 38267, 38268, 38270, 38289, 38295, 38298, 38300, 38307, 38309, 38311, 38313, 38341, 38352, 38363, 38364, 38366, 38368, 38369, 38370, 38371, 38373, 38375, 38380, 38387, 38389, 38403, 38405, 38406, 38410, 38411, 38427, 38430, 38432, 38434, 38437, 38438, 38441, 38442, 38443, 38444, 38445, 38446, 38447, 38454, 38457, 38460, 38461, 38462, 38464, 38467, 38469, 38473, 38475, 38476, 38480, 38485, 38487, 38492, 38494, 38513, 38514, 38515, 38517, 38518, 38519, 38521, 38523, 38524, 38525, 38526, 38527, 38546, 38555, 38556, 38557, 38558, 38560, 38565, 38566, 38567, 38569, 38570, 38571, 38572, 38573, 38574, 38575, 38585, 38588, 38595, 38598, 38599, 38601, 38604, 38608, 38611, 38613, 38615, 38619, 38624, 38625, 38626, 38627, 38629, 38631, 38634, 38635, 38636, 38637, 38639, 38640, 38643, 38645, 38647, 38649, 38651, 38652, 38654, 38658, 38659, 38661, 38662, 38665, 38667, 38668, 38671, 38681, 38683, 38691, 38720, 38723, 38729, 38731, 38732, 38734, 38737, 38739, 38741, 38743, 38747, 38771, 38817, 38819, 38823, 38880, 38892, 38896, 38901, 38903, 38907, 38939, 38962, 38967, 38992, 39003, 39030, 39031, 39099, 39102, 39111, 39136, 39173, 39175, 39184, 39229, 39259, 39325, 39371, 39372, 39385, 39388, 39404, 39419, 39420, 39422, 39425, 39436, 39585, 39589, 39653, 39657, 39660, 39663, 39761, 39771, 39837, 39952, 39961, 39968, 39984, 39987, 39989, 40000, 40009, 40012, 40016, 40019, 40080, 40085, 40096, 40112, 40126, 40133, 40144, 40160, 40165, 40176, 40208, 40219, 40222, 40240, 40243, 40256, 40268, 40275, 40307, 40309, 40352, 40389, 40400, 40416, 40491, 40525, 40572, 40574, 40672, 40684, 40720, 40731, 40734, 40789, 40828, 40864, 40940, 40992, 40993, 40998, 40999, 41001, 41017, 41024, 41033, 41036, 41040, 41043, 41052, 41074, 41077, 41078, 41081, 41084, 41085, 41104, 41105, 41114, 41116, 41120, 41121, 41127, 41133, 41142, 41168, 41180, 41184, 41185, 41190, 41193, 41194, 41196, 41197, 41199, 41246, 41248, 41255, 41264, 41280, 41281, 41285, 41289, 41291, 41292, 41294, 41296, 41301, 41303, 41335, 41339, 41360, 41363, 41381, 41392, 41404, 41429, 41443, 41445, 41456, 41468, 41504, 41536, 1760, 41648, 41696, 41712, 41753, 41763, 41776, 41779, 41781, 41797, 41803, 41804, 41808, 41809, 41813, 41822, 41847, 41875, 41891, 41893, 34383, 41952, 41955, 41957, 41979, 42048, 42160, 42192, 42224, 42243, 42245, 42252, 42256, 42289, 42332, 42358, 42364, 42385, 42386, 42390, 42394, 42396, 42438, 42444, 42451, 42465, 42469, 42471, 42476, 27981, 42492, 42493, 42497, 42498, 42499, 42501, 42502, 42503, 42505, 42506, 42507, 42524, 42545, 42546, 42550, 42554, 42556, 34513, 42576, 42583, 42587, 42588, 42590, 42609, 42611, 42613, 42614, 42615, 42620, 42642, 42646, 42647, 42649, 42650, 42652, 34529, 42653, 42681, 34535, 42684, 42683, 42686, 42689, 42691, 42693, 42694, 42695, 42697, 42709, 42713, 34541, 42715, 42720, 42721, 42725, 42727, 42731, 42732, 42735, 42748, 42749, 42751, 42753, 42759, 42764, 42765, 42777, 42816, 42867, 42871, 42940, 42947, 42949, 42976, 42981, 43007, 43036, 43057, 43062, 43066, 43068, 43088, 43097, 43125, 43126, 43127, 34623, 43129, 34624, 43132, 43153, 43164, 43193, 43196, 43209, 43232, 43239, 43241, 43280, 43296, 43312, 43324, 43328, 43344, 43353, 43357, 43382, 43389, 43414, 43472, 43488, 43500, 34706, 43545, 43596, 43603, 43607, 43801, 43808, 43836, 43840, 43849, 43852, 43859, 34769, 43863, 43865, 43868, 34781, 43930, 43932, 34786, 43964, 43984, 44000, 44009, 44028, 44039, 44044, 44048, 44057, 44059, 44060, 44112, 44115, 44117, 44119, 44145, 44147, 44149, 44151, 44220, 44252, 44256, 44261, 44268, 44284, 44295, 44300, 44316, 44318, 44332, 44336, 44348, 44364, 44368, 44380, 44401, 44403, 44406, 44412, 44441, 44444, 44460, 44464, 44476, 44485, 44505, 44512, 44517, 44523, 44524, 44543, 44608, 44636, 44700, 44705, 44719, 44759, 44768, 44780, 44832, 44864, 44876, 44880, 44883, 44887, 44927, 44944, 44951, 44960, 44973, 44976, 44985, 45008, 45011, 45049, 45324, 45328, 45360, 45372, 45374, 45376, 45385, 45406, 45427, 45431, 45456, 45459, 45477, 45500, 45520, 45536, 45539, 45541, 45548, 45564, 45571, 45593, 45596, 45628, 45641, 45733, 45772, 45788, 45804, 45820, 45840, 45849, 45872, 45888, 45900, 45943, 45968, 46000, 46012, 46032, 46048, 46051, 46339, 46341, 46347, 46348, 46351, 46414, 46415, 46421, 46481, 46483, 46490, 46492, 46547, 46589, 46595, 46597, 46601, 46602, 46603, 46604, 46607, 46609, 46611, 46613, 46615, 46623, 46629, 46638, 46639, 46645, 46654, 46655, 46665, 46667, 46668, 46685, 46686, 46687, 46705, 46707, 46709, 46711, 46713, 46715, 46716, 46719, 46737, 46738, 46739, 46742, 46746, 46747, 46748, 46751, 46767, 46774, 46778, 46783, 46787, 46789, 46797, 46803, 46806, 46807, 46809, 46810, 46812, 46818, 46822, 46831, 46849, 46850, 46854, 46855, 46857, 46859, 46860, 46861, 46863, 46864, 46867, 46873, 46897, 46903, 46912, 46917, 46921, 46923, 46924, 46925, 46926, 46931, 46933, 46935, 46972, 46997, 47004, 47015, 47029, 47061, 47062, 47063, 47065, 47068, 47072, 47093, 47095, 47101, 47103, 47120, 47129, 47131, 47132, 47134, 47145, 47147, 47148, 47150, 47151, 47152, 47153, 47154, 47158, 47159, 47162, 47164, 47168, 47171, 47175, 47184, 47193, 47195, 47217, 47219, 47221, 47222, 47223, 47226, 47228, 47248, 47249, 47254, 47257, 47258, 47260, 47273, 47275, 47276, 47277, 47278, 47279, 47280, 47289, 47291, 47292, 47301, 47302, 47303, 47307, 47308, 47312, 47319, 47328, 47334, 47335, 47337, 47338, 47340, 47344, 47361, 47367, 47376, 47389, 47392, 47404, 47406, 47408, 47409, 47414, 47417, 47418, 47420, 47437, 47438, 47452, 47504, 47536, 47587, 47589, 47596, 47598, 47601, 47603, 47607, 47611, 47617, 47619, 47628, 47645, 47660, 47678, 47692, 47694, 47779, 47820, 47833, 47836, 47845, 47852, 47868, 47888, 47920, 47926, 47932, 47945, 47948, 47963, 47964, 48016, 48038, 48105, 48108, 48109, 48133, 48140, 48201, 48204, 48293, 48348, 48364, 48396, 48409, 48457, 48460, 48467, 48510, 48545, 48569, 48581, 48608, 48617, 48619, 48933, 48969, 48972, 48979, 48981, 49059, 49081, 49120, 49177, 49179, 49180, 49181, 49182, 49197, 49213, 49225, 49227, 49230, 49245, 49273, 49275, 49276, 49277, 49278, 49318, 49382, 49391, 49398, 16647, 16652, 16653, 16656, 16665, 16668, 49452, 49458, 16697, 16700, 16713, 16733, 49554, 16805, 49580, 16814, 16816, 16843, 16844, 49622, 16860, 16863, 16864, 16869, 49637, 16876, 16883, 49651, 16885, 49657, 16891, 16892, 49659, 16899, 49670, 16909, 16921, 16924, 49708, 16953, 16956, 16969, 17017, 17022, 17061, 49836, 17100, 49878, 17119, 49891, 49894, 49898, 49899, 49906, 49913, 17148, 49915, 17168, 49970, 49974, 17232, 50038, 17328, 17342, 50118, 17376, 17403, 50205, 50220, 50252, 50365, 50406, 50467, 50491, 50498, 50511, 50514, 50518, 50554, 50586, 50618, 50646, 50659, 50666, 50671, 17923, 17925, 17932, 17935, 50704, 50706, 17957, 50736, 17973, 17989, 18001, 50769, 50774, 18015, 50801, 18035, 50805, 18047, 50832, 18065, 18076, 50864, 18101, 50873, 18106, 18108, 50881, 18119, 18124, 18129, 18131, 18134, 18135, 18138, 18140, 18141, 18143, 50913, 18151, 50918, 18154, 18156, 18165, 18173, 18182, 18185, 18188, 18191, 18192, 18195, 18197, 18211, 18213, 18225, 18227, 18231, 51002, 51003, 51007, 51010, 18245, 51013, 51018, 18254, 51023, 18257, 51027, 18261, 51030, 18271, 18291, 51062, 51067, 18325, 51098, 18332, 18352, 18357, 18381, 18389, 18390, 51164, 18395, 18396, 51170, 51173, 51174, 18402, 51179, 18412, 51183, 18411, 18421, 18428, 18429, 18448, 18475, 18476, 18478, 51254, 51255, 51257, 51261, 18496, 18512, 51318, 51319, 18553, 18557, 51350, 18583, 51351, 51353, 51357, 18604, 18608, 51398, 51399, 18656, 51433, 18669, 51437, 18672, 18691, 18693, 18704, 51485, 18718, 18717, 18720, 18731, 18732, 18745, 18749, 18764, 51533, 18766, 18780, 18813, 18841, 18848, 18863, 18864, 18892, 18905, 51676, 18913, 18908, 51685, 18917, 18919, 51691, 18926, 51695, 18931, 18933, 18939, 18940, 18942, 18945, 18947, 51707, 18949, 51723, 18957, 51740, 51741, 18973, 51749, 51751, 18985, 18987, 51757, 19005, 51776, 19019, 19020, 51789, 19022, 19021, 19070, 51861, 19107, 19118, 51895, 19147, 19161, 19173, 19177, 51947, 51951, 19195, 19196, 51965, 51967, 19216, 19257, 19261, 52032, 52112, 19360, 19362, 52135, 19376, 52192, 19436, 52205, 19438, 52229, 52230, 52236, 3904, 52451, 52483, 52486, 19728, 52541, 19797, 52598, 52637, 19873, 19888, 52663, 52685, 52697, 52700, 19936, 52713, 52716, 52803, 52883, 52963, 52973, 20240, 20257, 20305, 20309, 20385, 20400, 53175, 53197, 20448, 53225, 53229, 53513, 20791, 20812, 20819, 53622, 53650, 20886, 20889, 53658, 53690, 20947, 20949, 20950, 53724, 20956, 20965, 20966, 20967, 53741, 20969, 20982, 20987, 53763, 53766, 53769, 53771, 21068, 53914, 53916, 53951, 21186, 21189, 21205, 21206, 21221, 21225, 53995, 21237, 21241, 54066, 21303, 21324, 54162, 21398, 21468, 21527, 54337, 54341, 21580, 21590, 21591, 54448, 21687, 21689, 21735, 21756, 54571, 54578, 54582, 54587, 54592, 54622, 54642, 54645, 54646, 54649, 54650, 54651, 54653, 54655, 54684, 54686, 54690, 54694, 54697, 54700, 54726, 54752, 54758, 54763, 54765, 54767, 22034, 22041, 54816, 54818, 54822, 54830, 54833, 54834, 54837, 54838, 54839, 54842, 54848, 22082, 22089, 22092, 54864, 54865, 54867, 22102, 22103, 54876, 54878, 54901, 54930, 54933, 54938, 54940, 54942, 54944, 54949, 54950, 54954, 54958, 54979, 54982, 55014, 55017, 55018, 55019, 55021, 22258, 55033, 55035, 22269, 55056, 22316, 55090, 55104, 55109, 55118, 22354, 55123, 22359, 22361, 55158, 55207, 22454, 55269, 55330, 55335, 22582, 22583, 55357, 22594, 22599, 24033, 55414, 55420, 22678, 22679, 55449, 55453, 55463, 55495, 22765, 55564, 55567, 22801, 22803, 22819, 22821, 22833, 22834, 22835, 22849, 22850, 22851, 22853, 22854, 22899, 55782, 23017, 55819, 55820, 23077, 23107, 23109, 23110, 23123, 23125, 23153, 23155, 55954, 55985, 55986, 55987, 55989, 56017, 56018, 56022, 23257, 23259, 56033, 56034, 56035, 23275, 23276, 23291, 23555, 23557, 56336, 56349, 56384, 23714, 23722, 23724, 56513, 56545, 23781, 23782, 23786, 23788, 56555, 56559, 23797, 56575, 23811, 23814, 23820, 56592, 23831, 56605, 56608, 23842, 56638, 56640, 56656, 56694, 56697, 56700, 23969, 23970, 23971, 56752, 56795, 56801, 24035, 56802, 24038, 24042, 24043, 24047, 56815, 24342, 24343, 57314, 24609, 24615, 24625, 57401, 57404, 57408, 24643, 24645, 57417, 57419, 57422, 24655, 24657, 24661, 24663, 57436, 24670, 57458, 24691, 24693, 24695, 57465, 57466, 57468, 24702, 24703, 57488, 24721, 24730, 24732, 24742, 24748, 24751, 24753, 24762, 24764, 57552, 24786, 24787, 24789, 24794, 57564, 57566, 24796, 24799, 57569, 57574, 57577, 57580, 24815, 24812, 57581, 57583, 24828, 24835, 24837, 24838, 24843, 24848, 24859, 24864, 57635, 24880, 24882, 24885, 24887, 24891, 24896, 57664, 24907, 24908, 24912, 57683, 24909, 24945, 24949, 24950, 24951, 24955, 24981, 57751, 24987, 24995, 25006, 25007, 25008, 25009, 25027, 25029, 25030, 25034, 57811, 25046, 25051, 25055, 25057, 25061, 25074, 25075, 25077, 25078, 25081, 57851, 57852, 25086, 25083, 25091, 25093, 25094, 25097, 25120, 25133, 25147, 25152, 25163, 25164, 25165, 25166, 25211, 25235, 25251, 25263, 25264, 25266, 25267, 25283, 25285, 25297, 25299, 25301, 25305, 25307, 25312, 25313, 25318, 25323, 25330, 25331, 25333, 25339, 58128, 25388, 25392, 25393, 58163, 25394, 25397, 25408, 58176, 58179, 25424, 58192, 25461, 58259, 25494, 58275, 25516, 58297, 25542, 25552, 58320, 58323, 25568, 58339, 25577, 58363, 25625, 25664, 25665, 25669, 25676, 25681, 25685, 25687, 25713, 25717, 25797, 25809, 25813, 25825, 25829, 25830, 58630, 58633, 58634, 58635, 58636, 58639, 58640, 25893, 25900, 58679, 25922, 58693, 25926, 25925, 25929, 25932, 25935, 25939, 25942, 58711, 25941, 25945, 25947, 58719, 25979, 58778, 58780, 26017, 26021, 58801, 58802, 58803, 58839, 26083, 58851, 58859, 58877, 26115, 58885, 58886, 26114, 58890, 58891, 26123, 26122, 26127, 26129, 26124, 26131, 26133, 26128, 26137, 58905, 58907, 26142, 26144, 26145, 26143, 26149, 24737, 26158, 26161, 58929, 26163, 58930, 26165, 26174, 26176, 26177, 26179, 58949, 58960, 26193, 58961, 26195, 26197, 58967, 26198, 58971, 58972, 26207, 26206, 26225, 26229, 26238, 26257, 26259, 26261, 26262, 59030, 59029, 59034, 26267, 59036, 26271, 26273, 26272, 26277, 26288, 59058, 26291, 26294, 26297, 26301, 26305, 59075, 26309, 26311, 59079, 59077, 59078, 26316, 26321, 26322, 26323, 26325, 26326, 59093, 26332, 26335, 26337, 26338, 26339, 26341, 26342, 26346, 26347, 26348, 26355, 59119, 26357, 59117, 26364, 26365, 59137, 26370, 26371, 26374, 59143, 26373, 26377, 26379, 59148, 59149, 59152, 26405, 26413, 26421, 26432, 26434, 59200, 26437, 26438, 26439, 26441, 26442, 26443, 26444, 26446, 26451, 59219, 26453, 26455, 26457, 26449, 59221, 59229, 24801, 26485, 59253, 26491, 26512, 26515, 26531, 26541, 26544, 26547, 26550, 26551, 59329, 59335, 26581, 26594, 26597, 59367, 26603, 26609, 26613, 59375, 26615, 26620, 26621, 26640, 59417, 26651, 59433, 59436, 26668, 59437, 59439, 26672, 59441, 59446, 26678, 59449, 26681, 26683, 59452, 26685, 26686, 59450, 26688, 26689, 59456, 59459, 26693, 59463, 26704, 59472, 26715, 26718, 59505, 26738, 26737, 26741, 59510, 26743, 59511, 59513, 59516, 26750, 26745, 26748, 26768, 59537, 26770, 59542, 26775, 26774, 26777, 26779, 59548, 26781, 26782, 26786, 26791, 59564, 26796, 59567, 26800, 59577, 26811, 26822, 26823, 59590, 59593, 26827, 26830, 26832, 26833, 59600, 59603, 26837, 59607, 26848, 26853, 59625, 59626, 26859, 26861, 26857, 26860, 59632, 26881, 26883, 26885, 59664, 26905, 26923, 26937, 26941, 26942, 59712, 26951, 26953, 26958, 26969, 59766, 27027, 27033, 27049, 18403, 27062, 27057, 27065, 27078, 27083, 59856, 27091, 27093, 27097, 59868, 27105, 59872, 27109, 27110, 59881, 27113, 59884, 27119, 27121, 27123, 27125, 27129, 27131, 27137, 27139, 27141, 27146, 27169, 27170, 27173, 27177, 27179, 27197, 27202, 27209, 27212, 27213, 27214, 27221, 27281, 27283, 27285, 27297, 27298, 27301, 27314, 27315, 27317, 27323, 27345, 27346, 27347, 27355, 27361, 27362, 27363, 27365, 27373, 27374, 24979, 27408, 27425, 27429, 60202, 27449, 27453, 60224, 27467, 27468, 27470, 27477, 27481, 27483, 57568, 27515, 60326, 27561, 27590, 60358, 27595, 60384, 27621, 27629, 27630, 27628, 60399, 60397, 27643, 27650, 27651, 27653, 27657, 27658, 27660, 60428, 60432, 27692, 27693, 27694, 27708, 27709, 27714, 27715, 27721, 27724, 60501, 27737, 27742, 27740, 60531, 60533, 60535, 27771, 27772, 27773, 27774, 60581, 27823, 60613, 27855, 27868, 60640, 27871, 60645, 27881, 27884, 27886, 57648, 27900, 27902, 27903, 27906, 60675, 27910, 27909, 60684, 60685, 60688, 27920, 27927, 60697, 27931, 60700, 27961, 27964, 27965, 27977, 27979, 27982, 27980, 27985, 60755, 27989, 27984, 60764, 60787, 28022, 28023, 28027, 60798, 28057, 28059, 28066, 28071, 28075, 28080, 60847, 28094, 60867, 28101, 60869, 28103, 28107, 60889, 28121, 28123, 60892, 60897, 28130, 60896, 28128, 28137, 28139, 28141, 60907, 60911, 28143, 28155, 28208, 28221, 28224, 28226, 28227, 28229, 28231, 28235, 28237, 28238, 28240, 28251, 28305, 28309, 28315, 28331, 28369, 28373, 28384, 28398, 28432, 61200, 28438, 28443, 28448, 28464, 28465, 28480, 28482, 28485, 28487, 28491, 28496, 28497, 28530, 28534, 28561, 28565, 28592, 28599, 28603, 28609, 28629, 28640, 28647, 28652, 28697, 28715, 61509, 28745, 28748, 28749, 61519, 61525, 61527, 28766, 61535, 61553, 28793, 28796, 28797, 61567, 61586, 61594, 61621, 28938, 28983, 61754, 61757, 61760, 61779, 61846, 61849, 61856, 61857, 61859, 61861, 61894, 29126, 61910, 61916, 61926, 61939, 61942, 61947, 29187, 29190, 61980, 62010, 62012, 62015, 62016, 62019, 62026, 62027, 62028, 62076, 62179, 62182, 62187, 62256, 62262, 29495, 62288, 62371, 62393, 29740, 62528, 62540, 29777, 62649, 62653, 29925, 62694, 62716, 30101, 30102, 30139, 30175, 30179, 62947, 62973, 62977, 62982, 30224, 30256, 30293, 63062, 30325, 30352, 30384, 63154, 30405, 63185, 63187, 63189, 63191, 63203, 63207, 63206, 63218, 63223, 63229, 58160, 63244, 63245, 30519, 63296, 63319, 30583, 30610, 30611, 30613, 30614, 30619, 30643, 30677, 30678, 63452, 30690, 30693, 30694, 63465, 30698, 30699, 63469, 63471, 63484, 63504, 63513, 63516, 63536, 63537, 63542, 63543, 30777, 63546, 63548, 30781, 63559, 63568, 63577, 63580, 63603, 63605, 30838, 30839, 63609, 63606, 63612, 63632, 63638, 30873, 63642, 63644, 30877, 63664, 19167, 63676, 30918, 63692, 63698, 63703, 63712, 63719, 63721, 63724, 63725, 58256, 19180, 30985, 30986, 30987, 63781, 31013, 63798, 63811, 31045, 63813, 63837, 63898, 31189, 31205, 63979, 63996, 31244, 64035, 31281, 31296, 64067, 31301, 64069, 64070, 64076, 31313, 31317, 58336, 31376, 31381, 31393, 64163, 64167, 31401, 31441, 31445, 31456, 64235, 64251, 64284, 64316, 31552, 64349, 31602, 64410, 64423, 31657, 64454, 31712, 64519, 64521, 64522, 64523, 64524, 64525, 64527, 31891, 64677, 64682, 64745, 64746, 64747, 64755, 64757, 31996, 64769, 64771, 64773, 64775, 64784, 64796, 64802, 32061, 64841, 64844, 64861, 64886, 64890, 64892, 32153, 64985, 32217, 64988, 64993, 64995, 64997, 64998, 65004, 32236, 65014, 65020, 65068, 65084, 65088, 65091, 65116, 65175, 65212, 32483, 65258, 65260, 65263, 65296, 65344, 65347, 65356, 65372, 32631, 65465, 65491, 65504, 32749], 30590: [21, 54, 56, 68, 88, 101, 129, 130, 131, 133, 137, 138, 139, 243, 245, 248, 33044, 33062, 33063, 33121, 33128, 33129, 364, 371, 33153, 33159, 33163, 396, 33185, 33196, 33197, 33201, 33226, 33238, 476, 497, 503, 510, 511, 33297, 531, 538, 562, 33341, 578, 33349, 595, 33363, 599, 602, 33386, 627, 634, 645, 646, 652, 653, 658, 33427, 661, 666, 33441, 698, 33472, 33475, 713, 761, 33541, 33544, 33545, 33547, 33549, 33550, 33552, 785, 33556, 33580, 33592, 33602, 33623, 33632, 869, 871, 876, 883, 33660, 901, 908, 33692, 33689, 33696, 33701, 33704, 942, 951, 33732, 33738, 970, 33778, 33788, 1047, 1057, 1063, 1066, 1068, 1079, 1080, 1082, 1098, 1102, 1106, 1114, 1123, 33898, 1132, 33903, 33910, 33911, 33912, 1146, 1158, 1159, 1164, 1167, 1178, 33975, 33980, 34007, 1241, 1244, 1270, 1273, 1276, 34050, 1283, 1285, 34063, 1299, 1353, 1363, 1395, 1402, 1409, 1410, 1411, 1413, 1417, 1418, 1419, 1429, 34199, 34204, 34206, 34208, 34212, 1461, 34232, 34237, 34241, 34242, 34243, 1491, 34281, 1513, 34300, 34301, 34302, 1556, 1566, 1604, 1627, 34458, 34469, 34477, 34498, 1753, 1779, 1784, 34580, 34586, 1818, 34600, 1891, 1893, 34675, 34676, 34685, 34689, 1925, 34716, 34717, 34760, 34763, 34777, 2012, 34782, 2037, 34811, 34832, 34841, 34842, 34854, 2087, 2104, 2110, 2130, 2131, 2134, 2135, 2138, 2140, 2162, 2163, 2167, 2169, 34941, 34972, 34976, 2231, 2259, 2263, 35032, 2265, 2268, 35052, 2291, 35060, 2294, 2295, 2300, 2302, 35074, 35083, 35086, 35087, 2325, 2358, 2373, 35168, 35175, 35185, 2421, 2437, 2439, 2444, 2446, 35236, 35265, 35266, 35267, 35268, 2504, 35314, 2558, 35411, 2654, 2655, 2661, 35434, 35439, 35441, 35446, 2683, 2693, 2700, 2706, 35475, 2709, 35492, 35517, 35520, 35540, 2797, 35585, 35587, 35596, 35623, 2904, 2946, 2949, 2950, 2951, 2954, 2956, 2958, 2959, 3011, 35784, 35786, 35798, 35802, 35805, 35836, 3076, 3085, 3086, 35913, 35937, 3173, 35941, 35946, 3205, 3206, 3212, 36001, 36012, 36033, 36040, 36037, 3300, 36083, 3315, 3390, 36207, 36216, 36231, 3463, 36235, 3468, 3471, 36240, 36252, 3516, 3523, 39779, 3539, 3555, 3557, 3560, 3576, 36369, 3653, 36418, 3660, 36465, 3717, 3719, 3724, 3726, 36499, 36513, 3747, 3779, 3809, 3810, 3811, 3813, 36585, 3827, 36605, 36623, 36646, 3971, 3973, 3974, 3975, 3977, 3980, 3981, 3983, 36773, 4019, 36802, 36808, 36828, 36890, 36906, 36920, 36930, 36932, 36940, 4183, 4190, 4199, 36967, 36972, 4206, 36993, 4226, 36996, 4232, 4235, 37003, 37007, 4241, 4257, 4260, 4264, 4279, 4281, 4285, 4286, 4295, 37057, 4302, 4350, 37131, 37146, 37161, 4407, 4411, 4414, 4420, 4430, 4441, 4445, 37217, 37220, 37219, 37225, 37226, 37237, 37239, 4482, 4483, 37252, 4481, 37254, 4488, 37257, 37259, 37264, 39971, 4515, 4531, 37312, 37317, 37322, 37333, 37337, 37354, 37373, 4613, 4628, 4631, 37399, 4638, 4669, 4676, 37445, 37474, 37476, 37477, 37492, 37506, 37509, 4745, 4746, 37514, 4749, 4757, 37527, 37528, 37532, 37540, 37543, 37548, 4789, 37573, 4819, 40037, 4835, 37614, 4869, 37637, 4872, 37648, 4880, 37657, 4891, 4896, 4899, 4912, 37691, 20517, 4932, 37702, 4945, 37714, 4947, 4950, 37722, 4967, 4966, 4968, 37756, 20531, 20533, 5004, 37772, 37769, 37779, 5011, 37788, 5021, 37804, 5040, 5064, 5067, 37843, 27060, 37845, 5078, 5083, 37852, 37857, 37860, 37868, 37871, 37876, 5110, 37884, 37906, 37911, 37938, 37949, 5181, 37950, 5207, 5208, 37982, 5219, 5225, 5246, 5259, 38039, 38042, 38049, 38055, 38101, 38103, 5339, 38119, 38138, 38141, 38156, 5389, 5391, 5393, 5396, 38180, 38181, 5427, 5443, 5444, 5445, 38213, 5453, 5457, 5458, 38242, 5474, 5475, 38245, 38251, 5494, 5499, 5503, 38274, 5509, 38277, 38282, 5517, 5518, 5523, 5521, 5529, 20638, 5555, 38327, 38339, 5571, 5575, 20648, 5587, 38358, 5589, 20650, 5591, 5595, 20651, 5600, 38397, 38399, 38398, 5674, 5701, 5703, 5712, 5718, 5719, 5727, 5728, 5732, 38500, 38501, 5735, 5740, 5742, 5743, 38510, 5755, 5767, 38535, 5772, 5774, 5781, 5783, 5790, 5802, 5818, 38596, 5830, 5839, 38612, 5850, 5882, 5887, 5889, 5890, 5892, 5894, 38669, 5904, 5945, 5969, 5977, 38754, 38755, 38762, 38770, 38774, 6014, 6012, 6019, 38789, 6026, 38794, 38791, 38795, 6040, 6052, 6055, 38837, 6070, 6072, 6099, 38870, 38894, 6160, 6170, 6176, 38949, 38950, 6188, 39005, 39025, 6263, 6264, 39035, 6299, 39072, 39073, 6313, 39081, 6353, 39121, 39124, 6358, 6390, 6393, 39163, 39167, 6401, 6416, 39193, 6431, 39200, 39212, 7793, 6461, 6467, 6474, 39246, 6483, 39250, 39251, 6489, 6493, 39271, 39276, 6504, 6513, 6530, 6531, 6538, 39324, 6559, 6568, 6576, 6600, 6604, 6640, 39409, 39410, 39426, 6673, 6674, 39449, 39455, 6689, 6691, 6692, 39460, 6698, 39467, 6705, 6707, 6713, 6715, 6723, 6724, 6725, 6734, 6737, 6739, 39507, 39511, 6746, 39523, 39525, 39528, 39540, 6785, 6786, 39555, 6791, 6794, 6821, 6847, 6869, 39638, 6875, 6872, 6913, 39699, 6935, 6957, 6967, 6973, 39772, 7013, 39785, 7027, 39801, 39809, 39811, 7043, 39813, 39814, 7048, 39820, 39822, 39823, 7063, 7068, 7079, 7080, 39863, 39868, 7101, 39882, 7127, 39897, 7143, 39932, 7167, 7171, 7173, 7176, 7180, 7181, 39948, 7188, 39957, 7226, 7251, 7260, 40035, 7288, 40067, 7304, 40086, 7320, 40099, 7332, 7358, 40128, 7381, 40172, 7442, 40228, 7471, 40244, 7484, 40278, 40280, 40318, 7550, 40321, 7566, 7568, 7570, 40373, 7628, 40403, 40405, 7649, 7670, 40460, 7693, 7697, 40469, 40484, 7730, 7731, 7729, 40506, 40515, 40516, 40517, 40570, 40571, 40586, 40588, 40639, 7894, 40662, 40701, 7954, 40723, 40724, 7962, 40729, 40735, 40741, 40744, 7978, 7979, 7983, 40755, 8002, 8004, 40773, 8010, 40787, 40790, 8035, 8049, 8062, 40833, 40835, 8068, 8069, 8072, 40841, 8077, 40853, 40854, 40873, 40877, 40889, 40915, 40917, 40933, 40949, 40950, 8211, 8210, 8218, 8219, 40988, 8222, 8236, 8238, 8245, 41016, 41089, 41091, 41096, 41149, 41217, 8449, 8457, 8465, 41233, 8474, 41242, 8480, 8484, 41258, 8496, 8532, 8540, 8546, 8545, 41312, 41319, 8551, 8554, 41322, 41317, 41327, 8560, 8563, 8570, 8596, 41372, 8622, 41387, 41388, 8638, 8639, 41413, 41411, 41418, 41423, 41433, 41450, 41455, 8700, 8728, 41498, 41503, 41508, 41522, 8765, 41541, 41543, 8780, 8796, 41570, 41571, 8807, 41579, 41601, 41602, 41604, 8840, 41612, 8845, 41615, 41618, 41619, 8864, 8879, 8896, 8923, 41705, 41710, 8963, 41730, 41759, 8992, 8991, 21328, 9005, 9006, 9008, 9009, 9011, 9012, 9021, 9023, 9026, 9038, 9043, 41810, 9046, 9055, 9062, 9065, 41831, 41833, 9072, 9073, 41848, 9081, 9085, 41858, 41862, 41865, 41866, 41868, 41871, 41878, 41884, 41885, 9119, 9134, 9151, 9158, 9160, 41935, 9171, 41949, 41960, 41963, 41966, 41967, 9215, 9233, 42001, 9239, 42011, 42015, 9259, 42043, 42064, 42096, 9347, 9352, 9353, 9356, 9376, 42156, 9392, 9406, 9408, 42184, 9418, 9424, 9430, 42201, 42210, 42216, 42217, 9450, 9456, 9465, 9474, 9475, 9488, 9490, 9499, 42271, 9511, 9517, 42286, 9531, 9534, 42320, 9555, 9559, 9560, 9570, 9571, 9572, 42342, 42343, 42341, 9585, 42354, 9589, 42355, 9599, 42377, 42379, 42380, 42381, 9629, 9632, 42409, 9664, 42435, 9677, 9679, 42452, 9685, 9693, 42462, 9695, 42472, 9715, 9744, 42522, 42532, 42533, 42535, 9767, 42534, 9776, 42549, 9783, 9796, 9808, 42582, 42586, 9820, 9821, 9824, 42598, 42602, 9836, 9837, 9848, 9849, 9851, 9876, 42666, 9920, 9928, 9929, 42698, 9940, 9943, 9949, 42717, 42736, 9968, 42742, 42745, 42746, 9981, 42747, 9988, 9990, 10000, 42770, 10002, 42775, 10023, 10039, 10046, 10045, 42829, 42830, 10064, 42849, 42851, 42855, 10090, 10095, 42866, 10100, 10105, 42876, 42890, 10122, 42892, 42893, 42895, 10127, 10131, 42902, 42904, 10136, 10144, 42919, 42924, 10159, 10170, 10174, 42966, 42967, 10211, 42982, 42999, 10229, 42997, 43003, 10236, 10239, 10256, 10267, 10272, 10277, 10320, 10336, 43114, 43121, 10367, 10384, 10386, 43156, 10400, 10409, 10411, 43179, 43190, 43194, 43200, 10432, 10459, 43245, 10480, 43257, 43258, 43260, 10512, 10513, 43289, 43295, 43308, 10541, 10543, 54200, 43320, 10555, 10558, 43337, 43338, 10579, 43347, 43346, 10599, 43373, 10631, 54216, 43401, 43402, 43404, 10637, 43406, 10632, 10638, 10645, 10656, 10657, 43433, 10681, 43454, 10694, 10700, 10713, 10718, 10729, 10734, 10738, 43512, 10748, 10749, 10757, 10770, 10776, 43546, 43547, 43550, 43551, 43553, 43558, 10792, 43572, 10813, 43582, 43591, 43598, 10853, 43623, 43626, 43627, 43629, 43630, 43642, 43649, 43655, 43659, 43661, 43676, 10912, 43689, 43690, 43701, 10935, 10940, 10951, 10955, 10957, 43732, 10964, 43735, 43738, 10999, 11005, 43787, 11024, 11044, 11053, 11060, 11067, 11069, 43845, 11091, 43864, 11101, 43872, 43875, 43874, 43877, 43879, 11112, 43881, 43887, 11120, 11114, 43883, 11124, 43909, 11141, 43911, 11143, 43914, 43915, 11147, 11146, 11154, 43923, 43922, 11158, 43931, 11164, 43945, 11190, 43959, 11191, 11189, 11197, 11200, 11211, 43983, 11220, 43993, 41315, 11261, 11263, 11266, 11267, 44036, 11268, 11269, 11272, 44034, 44042, 11277, 44049, 11282, 11284, 44055, 11295, 44067, 44087, 11319, 11325, 11347, 11350, 11349, 44116, 11362, 44133, 11365, 44134, 11366, 44139, 11371, 11374, 11375, 44143, 11370, 44150, 44152, 11384, 44153, 11394, 11396, 44166, 44168, 44169, 11400, 11403, 44171, 11451, 44226, 11460, 11462, 11464, 11477, 44247, 11485, 11507, 11509, 11554, 44324, 11567, 44340, 11575, 11582, 44353, 44355, 44387, 44402, 11644, 44417, 44419, 44421, 44422, 11650, 11656, 11659, 44428, 44427, 11663, 11669, 11711, 11712, 11728, 44497, 44498, 11729, 11742, 11756, 11757, 11767, 11777, 11778, 44556, 11809, 11821, 11823, 11838, 11882, 11891, 11893, 11901, 11903, 44681, 11915, 44684, 11917, 44689, 11927, 11936, 11943, 11967, 11968, 11989, 44758, 11992, 44760, 11990, 11996, 12012, 12028, 44799, 44804, 44817, 44826, 12072, 12079, 12093, 12100, 44870, 12118, 44892, 12149, 12154, 44922, 44933, 44940, 12192, 12224, 12240, 45009, 45010, 45013, 45014, 12253, 45036, 12277, 45051, 12307, 45084, 12319, 12321, 12323, 12330, 12333, 12342, 12339, 12348, 12349, 12346, 12354, 12356, 12357, 12359, 12361, 12362, 12366, 12370, 12371, 12375, 12377, 12378, 12382, 12389, 12391, 12396, 12398, 12420, 12421, 12423, 12425, 12430, 12433, 12434, 12441, 12442, 45210, 12439, 12450, 12452, 12454, 12456, 12458, 45244, 45239, 45241, 45249, 12477, 12487, 12483, 12494, 12499, 12506, 12530, 12538, 12545, 12547, 12550, 12568, 45353, 12624, 12636, 12642, 45409, 45411, 12652, 45430, 12667, 12675, 45451, 45452, 12719, 12720, 12734, 12735, 45509, 12805, 45584, 12822, 12824, 45594, 12847, 45622, 12859, 12860, 48146, 45637, 45650, 12886, 12902, 12903, 45687, 45709, 45712, 45724, 45728, 45734, 45736, 45737, 13008, 45800, 13046, 45825, 45826, 45827, 13060, 13061, 13072, 45850, 13083, 45853, 45855, 13088, 45862, 45868, 45882, 45884, 13119, 13137, 45906, 13139, 45908, 45911, 13140, 13152, 13154, 13155, 45926, 13157, 13168, 45963, 45965, 45989, 13231, 13232, 13239, 13244, 13246, 13247, 13256, 13272, 13280, 46053, 46056, 46057, 48232, 13299, 46103, 46106, 13339, 46108, 48242, 46111, 13350, 46122, 46128, 46135, 13368, 46138, 46166, 46167, 46168, 46182, 13417, 13430, 13437, 13438, 46204, 46210, 46218, 46220, 46231, 13463, 46236, 46247, 46249, 13484, 46252, 13494, 13496, 13500, 46272, 13510, 46289, 46295, 46310, 46311, 46312, 46313, 46316, 13556, 46326, 46327, 46330, 46340, 46343, 13579, 13590, 46361, 46377, 13611, 13624, 13627, 46409, 46410, 13649, 13651, 13654, 4450, 13666, 13668, 13667, 13670, 46434, 13680, 13685, 13686, 46460, 13695, 46466, 13734, 13738, 13744, 46528, 46531, 13784, 13787, 13792, 46577, 46578, 13811, 46591, 46617, 46619, 13863, 46635, 41834, 13879, 46666, 13904, 13910, 46682, 13920, 13925, 46692, 46695, 46698, 46693, 13932, 46700, 46702, 13928, 13940, 13941, 46708, 13944, 46723, 46724, 13990, 14001, 46784, 14024, 14036, 46804, 28842, 14045, 46816, 46832, 46842, 14084, 14086, 14097, 46874, 14134, 14141, 14161, 14162, 46930, 46947, 14192, 14193, 14200, 14202, 14206, 46977, 46981, 46983, 46986, 46987, 46995, 14228, 14250, 14254, 14264, 14266, 14282, 14283, 14296, 14298, 14302, 14303, 47090, 14352, 14361, 47130, 14365, 47146, 14379, 14380, 14384, 14397, 14420, 14422, 47194, 14428, 14432, 14438, 47210, 14444, 14459, 14480, 47264, 14496, 14506, 47274, 47296, 14540, 47314, 14557, 14577, 47346, 47347, 47353, 47354, 14588, 47358, 14608, 47385, 47391, 14624, 47411, 47416, 47426, 47434, 47442, 14688, 14690, 14694, 14693, 47491, 47497, 47498, 47500, 14760, 14768, 14775, 14796, 14808, 14810, 14850, 14851, 14865, 14868, 14872, 47641, 47647, 14885, 14892, 47665, 47667, 14900, 14901, 14903, 14908, 47676, 47685, 47699, 47715, 14965, 47734, 47738, 47755, 14992, 47777, 47781, 47785, 15020, 15023, 15031, 15039, 47813, 47818, 15056, 15061, 47879, 15126, 15128, 15133, 47903, 15165, 47949, 15196, 47971, 47969, 15210, 15212, 15209, 47987, 15226, 15227, 48001, 48006, 48012, 48019, 15272, 15280, 48054, 15286, 48056, 15293, 48067, 48099, 48124, 15359, 15363, 15365, 15368, 15373, 15380, 48148, 15386, 48163, 48164, 48177, 48178, 15409, 15415, 15417, 15428, 15429, 15443, 15452, 15459, 48227, 48229, 15477, 15480, 15487, 15490, 15498, 48269, 48270, 48279, 15539, 48309, 48317, 15550, 15552, 15565, 15581, 15603, 15634, 48405, 48414, 48415, 15650, 48420, 15652, 48424, 15653, 15667, 48436, 48438, 15678, 15702, 48470, 15739, 48508, 15742, 15746, 15754, 15760, 15781, 15792, 15795, 15796, 15797, 15806, 15807, 48576, 15824, 15836, 48611, 48618, 15852, 15862, 48632, 15875, 15878, 15884, 48652, 15885, 15890, 15889, 15892, 15896, 15904, 15908, 15915, 15931, 15929, 15939, 15940, 15964, 15968, 15984, 15988, 16002, 16003, 48770, 48774, 48777, 48782, 48796, 48800, 16048, 48821, 16062, 48832, 16067, 16085, 48854, 16086, 48856, 16088, 48860, 16108, 48876, 16131, 48901, 48913, 48917, 16154, 16164, 16165, 48936, 48940, 16176, 16178, 16180, 16181, 48953, 16189, 48963, 48964, 48965, 48982, 49020, 49026, 49056, 49065, 16297, 16307, 16308, 16309, 16313, 16317, 49088, 49108, 49110, 16349, 49139, 16371, 49171, 49173, 49174, 49176, 49178, 49183, 49189, 49199, 49205, 49215, 49217, 49218, 49219, 49221, 49224, 49226, 49239, 49263, 49283, 49284, 49285, 49288, 49299, 49301, 49305, 49307, 49367, 49373, 49438, 16678, 16684, 49454, 49461, 49469, 49470, 16709, 49486, 16726, 16732, 16735, 16739, 16743, 16745, 16746, 16747, 49523, 16757, 16769, 16770, 16782, 16790, 16804, 16832, 16842, 16853, 49645, 49649, 16911, 16918, 49698, 49700, 49714, 49716, 35944, 49799, 35950, 49806, 49818, 49820, 17063, 49847, 49850, 49854, 17109, 49896, 49901, 17155, 49936, 49963, 17197, 49968, 49972, 49976, 17212, 49983, 17248, 17254, 17257, 17259, 17258, 17265, 17272, 17279, 50050, 50053, 50058, 50060, 50062, 17296, 50074, 17312, 50094, 50106, 17344, 17350, 17365, 50157, 50161, 50163, 50169, 50193, 50195, 17430, 50214, 50215, 50217, 50225, 50233, 50267, 50278, 50281, 50297, 50307, 50313, 17558, 17559, 17564, 17565, 17622, 50393, 17631, 50413, 50425, 50427, 17665, 17670, 17676, 17680, 50449, 17691, 50468, 50475, 17708, 50484, 50485, 17722, 17727, 17750, 50523, 17756, 17769, 17770, 17773, 17788, 17789, 50562, 50570, 50575, 17814, 17820, 50590, 17835, 50606, 17865, 17877, 17884, 17887, 17901, 17916, 50685, 17936, 50709, 17964, 50734, 50738, 50741, 50749, 17993, 50770, 50778, 50779, 50788, 50789, 50793, 50794, 50795, 50798, 50804, 50809, 50818, 18051, 50821, 18062, 10103, 18080, 50875, 50878, 50884, 50889, 50890, 50891, 50905, 50930, 50937, 50938, 50939, 50946, 18189, 50997, 18259, 18268, 18287, 51074, 51082, 51086, 18377, 18392, 51185, 51187, 51216, 18458, 51232, 18470, 18479, 51281, 51285, 51287, 51289, 51291, 51293, 51294, 51305, 51307, 51313, 51317, 51323, 51326, 18582, 51354, 18592, 18602, 51385, 51392, 51401, 51403, 51409, 51413, 51419, 51421, 51422, 18655, 51424, 51441, 51445, 51447, 51449, 51451, 18690, 18692, 18699, 18713, 18715, 18735, 18771, 51551, 18784, 18794, 18795, 51588, 51589, 51597, 51598, 18832, 18844, 18870, 18880, 18882, 18901, 51704, 18967, 51748, 18984, 51766, 19007, 51803, 51820, 19059, 19077, 51845, 51846, 19081, 19082, 51850, 51852, 51854, 51858, 19092, 51863, 51876, 51882, 51884, 51886, 51893, 51908, 19144, 19156, 19157, 51924, 19178, 42889, 51973, 51975, 51995, 52056, 52059, 19292, 52063, 19301, 19306, 19305, 19307, 19313, 19317, 19323, 19327, 52097, 52101, 52103, 52104, 52108, 52109, 52110, 19374, 52149, 52151, 19392, 19414, 19415, 19420, 19421, 19423, 52219, 19453, 19460, 19461, 19464, 19472, 52304, 19548, 52320, 19553, 52325, 19561, 52323, 52336, 52357, 52358, 52364, 19603, 52380, 19613, 19617, 52413, 52414, 52416, 19654, 19657, 19658, 19669, 52464, 19708, 52501, 52517, 52520, 52525, 52535, 19767, 52542, 52556, 52560, 19798, 52592, 19826, 19836, 19837, 19842, 19845, 52613, 19846, 19849, 52618, 52653, 52661, 52669, 52670, 19906, 52694, 52696, 19934, 52776, 52779, 52781, 20013, 52783, 52795, 52813, 52815, 52816, 52824, 20060, 20066, 20074, 20076, 20087, 20089, 52859, 52865, 20125, 20130, 20135, 20139, 52926, 20161, 20162, 20181, 20182, 52950, 20184, 20183, 20189, 20220, 52989, 20229, 20233, 20235, 53027, 53029, 53035, 53072, 20310, 53121, 53123, 53131, 53133, 53139, 53141, 53173, 53209, 53224, 20505, 53285, 20518, 53286, 20515, 53301, 53302, 53304, 20536, 20538, 20539, 20561, 20566, 20572, 20575, 20582, 20583, 20584, 20588, 20610, 20611, 53381, 53382, 20617, 20618, 53388, 53391, 53396, 53398, 53401, 53403, 20636, 20643, 53412, 53416, 20645, 53420, 20652, 20654, 53422, 53432, 20666, 20667, 20670, 20678, 20684, 20726, 20728, 20732, 53517, 53546, 20805, 20806, 53580, 20816, 4137, 20832, 20848, 20854, 20869, 20877, 53646, 20896, 53671, 53674, 20905, 20923, 20990, 21008, 21046, 21060, 21061, 21062, 53840, 53856, 21091, 53861, 21096, 21104, 21107, 21122, 21123, 21129, 53910, 21152, 21177, 21184, 21208, 54000, 54022, 21264, 54043, 54047, 54059, 21296, 54063, 54077, 21317, 54096, 21333, 21344, 54131, 21365, 21366, 21368, 54136, 54157, 21391, 54160, 21392, 54176, 54183, 21418, 21421, 21433, 54197, 4259, 54205, 4261, 21446, 54232, 21491, 54264, 21520, 21549, 54317, 54325, 54329, 54333, 21579, 21584, 21593, 21600, 54374, 21609, 21611, 21614, 21616, 21623, 54407, 54413, 54414, 21648, 21659, 21673, 21677, 21680, 54461, 21696, 21702, 21705, 54477, 21718, 54486, 54493, 21727, 54502, 54504, 54507, 54518, 21753, 21755, 21761, 21776, 54555, 21805, 21836, 21839, 21840, 21856, 21860, 21865, 21872, 21904, 21920, 21952, 21953, 21975, 21980, 21983, 21984, 54749, 54755, 22013, 22031, 54804, 22055, 54836, 22083, 22096, 54868, 22108, 54879, 22112, 54884, 22121, 22122, 22124, 22125, 22126, 22130, 54900, 22135, 22137, 22139, 36965, 22146, 54916, 22149, 22154, 54925, 22158, 22157, 22169, 22170, 22189, 54962, 54980, 22217, 22219, 22218, 22228, 22266, 55042, 22273, 22281, 55051, 55053, 22288, 22348, 22350, 22352, 22355, 22368, 22370, 22371, 22377, 22382, 22387, 22395, 22394, 22405, 55173, 22412, 55180, 22414, 22422, 22423, 22427, 55197, 55199, 22432, 22442, 22445, 22456, 22467, 22473, 22491, 22494, 55272, 55275, 22512, 22544, 55321, 55323, 55334, 22570, 55339, 22573, 22576, 22608, 55380, 55387, 55391, 22624, 55416, 55417, 22672, 55444, 55445, 55451, 22688, 55465, 22698, 55476, 55505, 55511, 55515, 22752, 22764, 55533, 55537, 22777, 22779, 55547, 22796, 22800, 22832, 55608, 22845, 55640, 22880, 22901, 22902, 55672, 22904, 22915, 55685, 22921, 55690, 55695, 22928, 55712, 22966, 22969, 22997, 55772, 55785, 23027, 23072, 55853, 23088, 23100, 55869, 55888, 11111, 55904, 23139, 23162, 23170, 23171, 55938, 23175, 23177, 23178, 23182, 23184, 55962, 23200, 23201, 23203, 23205, 55982, 23216, 23225, 55998, 56002, 23250, 23253, 23254, 23256, 23281, 56071, 23308, 56079, 56107, 56120, 23357, 23365, 56137, 56153, 23392, 23397, 23409, 23413, 23414, 23416, 56195, 56201, 23435, 23459, 56235, 23477, 23481, 23485, 23508, 23510, 23542, 56315, 56327, 56329, 56330, 23568, 56334, 23580, 23596, 23598, 23606, 23607, 23615, 23614, 23626, 23627, 23628, 23638, 23644, 23648, 56421, 56423, 23661, 23671, 23683, 23684, 23685, 23686, 56450, 23690, 23691, 23693, 23694, 23692, 23699, 23703, 23708, 23712, 23726, 56494, 56495, 23730, 23738, 23742, 23744, 56520, 23756, 23757, 56529, 23764, 23772, 23790, 56563, 24276, 56607, 56613, 56623, 23870, 23874, 23876, 23877, 23881, 23884, 23888, 23909, 23923, 23925, 56696, 23929, 56708, 23941, 23943, 23944, 23948, 23952, 23957, 56735, 23968, 23977, 23984, 23993, 23997, 23999, 24067, 24077, 56845, 56863, 24096, 24101, 56875, 24112, 56891, 24126, 56905, 56907, 24144, 24160, 56941, 56943, 24176, 24181, 56955, 56961, 24193, 56971, 24208, 24209, 24210, 56991, 24224, 24225, 24227, 24234, 24240, 24247, 24250, 24277, 24279, 24281, 24278, 57051, 24291, 24292, 24293, 57062, 24299, 24307, 24336, 24340, 57113, 57117, 57118, 24352, 24368, 24369, 24389, 24392, 24396, 24400, 24416, 24432, 24434, 24435, 24436, 24438, 24439, 24437, 57215, 57218, 24456, 24458, 57227, 57226, 24466, 24469, 57242, 57243, 57247, 24480, 24481, 57246, 57256, 57257, 57259, 57263, 57262, 57264, 24496, 24500, 57275, 24511, 57302, 24534, 57320, 24554, 24555, 24557, 57325, 57362, 57364, 24601, 57371, 24614, 24619, 57437, 24709, 24711, 24717, 24718, 24719, 57493, 57526, 57597, 57677, 57695, 24931, 24933, 24939, 57730, 11475, 57738, 25002, 57777, 57778, 57792, 57795, 57816, 57837, 57838, 57843, 57875, 57904, 25141, 57912, 25153, 25155, 25157, 25185, 25187, 25195, 25199, 57970, 25205, 25201, 25208, 57985, 25217, 57994, 25227, 25237, 25239, 58012, 58013, 58016, 25253, 58048, 25300, 25309, 25332, 25347, 58144, 25383, 25410, 25411, 25413, 25428, 58208, 25443, 25451, 58224, 25459, 58232, 25467, 25481, 58249, 25483, 58253, 25486, 58265, 25499, 25504, 58281, 58285, 25521, 58304, 37640, 24616, 24617, 25557, 58328, 58349, 58352, 25586, 25587, 58385, 58387, 58391, 25621, 58394, 25633, 25635, 25636, 25643, 25649, 58417, 25652, 25653, 25656, 25659, 25668, 25671, 25679, 58448, 25691, 25707, 58482, 58485, 25719, 58487, 25723, 58497, 58504, 25737, 25739, 25755, 58544, 58550, 25787, 58557, 58567, 58568, 25810, 58608, 58609, 25867, 58637, 58638, 58649, 58676, 58677, 57253, 58721, 25955, 58729, 58749, 58757, 58761, 58762, 25995, 26005, 26011, 58793, 26043, 26065, 26071, 26079, 58870, 26109, 26126, 58912, 58917, 26187, 58966, 26204, 26203, 58976, 58977, 58979, 58980, 58981, 26211, 26215, 26220, 26242, 26243, 59013, 26249, 26250, 59021, 59020, 59040, 26292, 26293, 26324, 59120, 26358, 59126, 59144, 59145, 59146, 59147, 59150, 59231, 59254, 26497, 59266, 26507, 59276, 59288, 59298, 26569, 59368, 26623, 26652, 59431, 26667, 26684, 26687, 26705, 26710, 59487, 59488, 26746, 59540, 59563, 59584, 59601, 26834, 26845, 26847, 59635, 26868, 26870, 59640, 26875, 26879, 26878, 26884, 26907, 59685, 59701, 26947, 59731, 26968, 26979, 26981, 26982, 26987, 59760, 27019, 27021, 11885, 27046, 27048, 59829, 59834, 27075, 27077, 59847, 27080, 59862, 59864, 27124, 27172, 27185, 27190, 27196, 27203, 27210, 59990, 60012, 27251, 60023, 27256, 27257, 27259, 60042, 27284, 27329, 27348, 60139, 60150, 60151, 60155, 27397, 27395, 27400, 27407, 27411, 27448, 27460, 27461, 60229, 27469, 60243, 60279, 27521, 60291, 60293, 27527, 27531, 27533, 27535, 27560, 11991, 60340, 60341, 27577, 27587, 27589, 27603, 27605, 27634, 60403, 27636, 60408, 60411, 60422, 60435, 60447, 60453, 60478, 27717, 27719, 27747, 27753, 60549, 60562, 60575, 27846, 27930, 60698, 60734, 27971, 27987, 28001, 60784, 60792, 28034, 28035, 60805, 60802, 60808, 28042, 60814, 28046, 60818, 60825, 60831, 28064, 60834, 60842, 28081, 28085, 28093, 28131, 28133, 60925, 60936, 60941, 60945, 60973, 60975, 60988, 60989, 61011, 61021, 28292, 28303, 61073, 61074, 61090, 61109, 61119, 28353, 61154, 28389, 61164, 61181, 28431, 61203, 28436, 61214, 28483, 28489, 28536, 28546, 28555, 28557, 61326, 28564, 61340, 61342, 61343, 28628, 28645, 28651, 61421, 61427, 61473, 61479, 28712, 61481, 28714, 61483, 61485, 28725, 61489, 61501, 28741, 28738, 28744, 28746, 28758, 28775, 28802, 28806, 28808, 61577, 28810, 28811, 61579, 28812, 61588, 61601, 61610, 61625, 28892, 28918, 28920, 61708, 61709, 61736, 28974, 28994, 28996, 29002, 29004, 61789, 61793, 29045, 29051, 29057, 61826, 61825, 29058, 29062, 29063, 29065, 29067, 29069, 61837, 61848, 61850, 29102, 61874, 29111, 61888, 61896, 29130, 29143, 61912, 29144, 12311, 61944, 29181, 12313, 29200, 61975, 29232, 62008, 29243, 29249, 29251, 12327, 12329, 62044, 62060, 29297, 29303, 29314, 29316, 62086, 12340, 62105, 62140, 29378, 29445, 62240, 29509, 29513, 29516, 62285, 29518, 29520, 62296, 62312, 62320, 62368, 62374, 29613, 29619, 29632, 62416, 29655, 62447, 62454, 29694, 29731, 62502, 29741, 62517, 62518, 62520, 29785, 62556, 62588, 29831, 29835, 62603, 29837, 62605, 29839, 62629, 29869, 62639, 62655, 29908, 29919, 29922, 12461, 12468, 29979, 62757, 29991, 62772, 62775, 30021, 62815, 30057, 62825, 62826, 62837, 30082, 30089, 30090, 30105, 62882, 62885, 30135, 62904, 62911, 30153, 30173, 30185, 6001, 30204, 62992, 30225, 63002, 63008, 30255, 30288, 63065, 30298, 30297, 30301, 30304, 63073, 63075, 30313, 30314, 63090, 63095, 63100, 63109, 30341, 63113, 30350, 63120, 30361, 30367, 63136, 30368, 30378, 30381, 63155, 30393, 30397, 30398, 30400, 30410, 30409, 30411, 30427, 63204, 30448, 30456, 63227, 30458, 63240, 63241, 30503, 30533, 30560, 30563, 30577, 30593, 30594, 30595, 30601, 30602, 30627, 63413, 30649, 63432, 30665, 30685, 6101, 30704, 63475, 30716, 30736, 30745, 63514, 63520, 30755, 63526, 30766, 30768, 30776, 30801, 63574, 30811, 63583, 63590, 30825, 30827, 63599, 30833, 63602, 30843, 63615, 30869, 63648, 30885, 45217, 30891, 63665, 30897, 63671, 63695, 30929, 30931, 30932, 30939, 30943, 30960, 30961, 30964, 63735, 30971, 30975, 30977, 63745, 63759, 31003, 31037, 63832, 63856, 31107, 31109, 31115, 31118, 31127, 31145, 31155, 31159, 31161, 63952, 63972, 63973, 31252, 31305, 64101, 64129, 64133, 64137, 64138, 31380, 31394, 64179, 31412, 64183, 64197, 64213, 64229, 64245, 31479, 64266, 64268, 31549, 31563, 31564, 31566, 31575, 31589, 31618, 31619, 31620, 31621, 31623, 31626, 31628, 31631, 31639, 31649, 31658, 31676, 31689, 31691, 31701, 31747, 31749, 31750, 31756, 64526, 64528, 64565, 64574, 64604, 31840, 64620, 31859, 31861, 31900, 64698, 31932, 31935, 31949, 64727, 31957, 31984, 64759, 64808, 32049, 32055, 64856, 64895, 32129, 64898, 64899, 32133, 64901, 64908, 32141, 64910, 64913, 64919, 64922, 32163, 32179, 64949, 32211, 32213, 65005, 32245, 32259, 32304, 32325, 32326, 32355, 65132, 32371, 32378, 32387, 32389, 32393, 32469, 65307, 65310, 32560, 65336, 32611, 32641, 65413, 32651, 65420, 65422, 65423, 32661, 65434, 65438, 32675, 32681, 65464, 65493, 32739, 65508, 65524, 65525, 65527, 65528], 31199: [3, 5, 13, 117, 168, 261, 328, 360, 501, 519, 520, 677, 712, 723, 728, 769, 771, 783, 1000, 1021, 1032, 1096, 1127, 1128, 1243, 1256, 1272, 1287, 1288, 1496, 1512, 1528, 1563, 1793, 1799, 1800, 1807, 2008, 2011, 2088, 2091, 2093, 2095, 2099, 2103, 2107, 2120, 2125, 2189, 2232, 2264, 2269, 2275, 2279, 2296, 2301, 2305, 2311, 2312, 2319, 2567, 2568, 2680, 2701, 2755, 2920, 3043, 3073, 3080, 3192, 3224, 3304, 3331, 3341, 3512, 3585, 3591, 3592, 3599, 3720, 3795, 3815, 3848, 4106, 4111, 4165, 4167, 4169, 4181, 4188, 4220, 4221, 4283, 4301, 4316, 4333, 4352, 4353, 4358, 4364, 4387, 4413, 4424, 4433, 4435, 4436, 4444, 4467, 4469, 4517, 4532, 4536, 4540, 4579, 4588, 4590, 4611, 4616, 4620, 4685, 4688, 4698, 4707, 4732, 4737, 4771, 4797, 4808, 4824, 4845, 4864, 4870, 4873, 4894, 4941, 4943, 4952, 4957, 4959, 4982, 5007, 5029, 5075, 5088, 5094, 5121, 5123, 5127, 5129, 5130, 5131, 5133, 5135, 5175, 5187, 5189, 5194, 5202, 5210, 5235, 5267, 5287, 5290, 5301, 5314, 5316, 5320, 5333, 5344, 5349, 5365, 5392, 5398, 5409, 5415, 5441, 5467, 5479, 5493, 5496, 5506, 5519, 5538, 5549, 5592, 5638, 5645, 5654, 5720, 5721, 5722, 5810, 5816, 5823, 5862, 5896, 5897, 5949, 5953, 5955, 5960, 5962, 5991, 6018, 6035, 6074, 6076, 6078, 6114, 6118, 6120, 6122, 6147, 6192, 6215, 6231, 6239, 6243, 6246, 6266, 6269, 6279, 6285, 6288, 6291, 6294, 6296, 6330, 6344, 6351, 6360, 6361, 6362, 6366, 6371, 6375, 6376, 6377, 6381, 6382, 6400, 6402, 6404, 6468, 6471, 6495, 6518, 6611, 6628, 6631, 6637, 6657, 6658, 6661, 6668, 6727, 6742, 6787, 6803, 6835, 6838, 6841, 6853, 6856, 6859, 6888, 6891, 6893, 6904, 6956, 6985, 6996, 7001, 7016, 7025, 7031, 7053, 7071, 7075, 7151, 7222, 7287, 7293, 7298, 7301, 7306, 7316, 7363, 7389, 7396, 7400, 7407, 7437, 7458, 7486, 7490, 7507, 7523, 7544, 7546, 7548, 7560, 7573, 7583, 7637, 7640, 7646, 7663, 7667, 7696, 7815, 7818, 7821, 7836, 7868, 7869, 7893, 7896, 7900, 7907, 7913, 7917, 7919, 7928, 7941, 7942, 7948, 7970, 7999, 8011, 8012, 8019, 8024, 8053, 8079, 8088, 8095, 8146, 8150, 8155, 8162, 8189, 8197, 8200, 8202, 8204, 8207, 8216, 8252, 8254, 8261, 8277, 8279, 8305, 8307, 8342, 8345, 8347, 8348, 8369, 8377, 8379, 8380, 8385, 8391, 8398, 8409, 8413, 8418, 8419, 8420, 8438, 8440, 8441, 8443, 8454, 8456, 8487, 8514, 8526, 8530, 8534, 8536, 8561, 8564, 8568, 8575, 8580, 8581, 8586, 8600, 8606, 8611, 8627, 8629, 8648, 8662, 8669, 8675, 8680, 8707, 8710, 8730, 8743, 8751, 8762, 8787, 8789, 8810, 8862, 8894, 8904, 8934, 8936, 8952, 8955, 8959, 8966, 8986, 9018, 9025, 9041, 9048, 9078, 9103, 9110, 9126, 9129, 9130, 9131, 9147, 9152, 9167, 9190, 9208, 9217, 9221, 9225, 9226, 9228, 9231, 9240, 9297, 9304, 9309, 9322, 9329, 9330, 9337, 9340, 9374, 9379, 9381, 9395, 9409, 9410, 9415, 9416, 9419, 9422, 9434, 9436, 9452, 9455, 9467, 9470, 9473, 9477, 9487, 9489, 9491, 9508, 9563, 9565, 9583, 9586, 9592, 9593, 9597, 9619, 9624, 9651, 9656, 9667, 9671, 9672, 9673, 9691, 9699, 9703, 9704, 9731, 9733, 9734, 9736, 9739, 9770, 9774, 9782, 9785, 9790, 9811, 9814, 9819, 9830, 9880, 9886, 9895, 9910, 9911, 9926, 9939, 9946, 9955, 9985, 9991, 9992, 9999, 10005, 10041, 10065, 10070, 10071, 10076, 10077, 10097, 10101, 10108, 10168, 10176, 10179, 10199, 10214, 10216, 10217, 10218, 10219, 10248, 10250, 10252, 10275, 10282, 10295, 10307, 10314, 10328, 10339, 10365, 10376, 10382, 10410, 10412, 10424, 10426, 10448, 10460, 10461, 10465, 10468, 10470, 10498, 10499, 10500, 10501, 10502, 10504, 10509, 10511, 10580, 10585, 10626, 10664, 10677, 10678, 10683, 10684, 10687, 10688, 10690, 10697, 10699, 10701, 10715, 10721, 10724, 10725, 10726, 10728, 10733, 10737, 10740, 10752, 10754, 10778, 10781, 10804, 10806, 10808, 10809, 10811, 10837, 10851, 10866, 10874, 10904, 10913, 10927, 10937, 10984, 11000, 11009, 11016, 11020, 11027, 11028, 11059, 11064, 11077, 11080, 11097, 11125, 11135, 11166, 11167, 11176, 11193, 11208, 11222, 11223, 11238, 11239, 11240, 11254, 11265, 11270, 11273, 11288, 11333, 11335, 11339, 11355, 11382, 11383, 11412, 11429, 11448, 11452, 11463, 11469, 11491, 11493, 11496, 11499, 11511, 11519, 11521, 11524, 11526, 11532, 11593, 11594, 11601, 11602, 11639, 11646, 11662, 11674, 11679, 11734, 11736, 11739, 11743, 11745, 11746, 11747, 11753, 11759, 11776, 11783, 11858, 11935, 11958, 11976, 12004, 12006, 12007, 12008, 12013, 12020, 12021, 12022, 12024, 12038, 12042, 12047, 12082, 12115, 12120, 12127, 12138, 12153, 12191, 12214, 12215, 12216, 12223, 12232, 12298, 12303, 12380, 12493, 12495, 12508, 12509, 12516, 12522, 12525, 12534, 12548, 12590, 12596, 12598, 12625, 12627, 12628, 12630, 12632, 12662, 12693, 12696, 12780, 12782, 12803, 12812, 12853, 12855, 12856, 12861, 12884, 12888, 12938, 12948, 12951, 12964, 12968, 12970, 12979, 12984, 12988, 12990, 13000, 13030, 13037, 13059, 13062, 13075, 13077, 13087, 13111, 13112, 13144, 13145, 13149, 13151, 13159, 13173, 13197, 13215, 13223, 13251, 13267, 13284, 13286, 13288, 13295, 13302, 13304, 13315, 13319, 13325, 13334, 13336, 13337, 13341, 13373, 13383, 13386, 13389, 13393, 13395, 13399, 13401, 13412, 13413, 13414, 13416, 13425, 13427, 13432, 13433, 13441, 13447, 13453, 13455, 13461, 13462, 13492, 13495, 13497, 13501, 13506, 13508, 13528, 13531, 13536, 13537, 13538, 13540, 13543, 13549, 13583, 13584, 13585, 13588, 13595, 13647, 13661, 13674, 13688, 13691, 13709, 13715, 13725, 13730, 13736, 13747, 13754, 13756, 13757, 13763, 13767, 13795, 13797, 13814, 13815, 13817, 13827, 13830, 13835, 13837, 13859, 13874, 13907, 13917, 13929, 13939, 13942, 13949, 13956, 13969, 13978, 14009, 14022, 14023, 14040, 14043, 14067, 14068, 14071, 14081, 14088, 14104, 14136, 14137, 14158, 14167, 14204, 14227, 14259, 14299, 14300, 14305, 14309, 14313, 14314, 14318, 14323, 14332, 14344, 14345, 14346, 14355, 14357, 14372, 14387, 14391, 14402, 14412, 14453, 14458, 14471, 14487, 14491, 14513, 14536, 14551, 14553, 14565, 14571, 14574, 14578, 14585, 14594, 14596, 14597, 14603, 14604, 14661, 14663, 14664, 14672, 14681, 14711, 14722, 14748, 14764, 14785, 14787, 14789, 14806, 14817, 14818, 14820, 14821, 14822, 14824, 14825, 14833, 14839, 14849, 14860, 14866, 14867, 14894, 14897, 14902, 14904, 14905, 14907, 14913, 14914, 14943, 14947, 14962, 14986, 15072, 15079, 15085, 15093, 15107, 15116, 15152, 15159, 15172, 15178, 15187, 15189, 15222, 15234, 15254, 15270, 15297, 15341, 15345, 15346, 15347, 15349, 15414, 15478, 15536, 15545, 15555, 15587, 15619, 15624, 15640, 15663, 15672, 15688, 15730, 15736, 15740, 15765, 15768, 15820, 15830, 15832, 15843, 15859, 15861, 15872, 15880, 15888, 15891, 15912, 15922, 15933, 15949, 15985, 15986, 15999, 16060, 16133, 16134, 16155, 16187, 16196, 16213, 16241, 16245, 16249, 16250, 16326, 16358, 16381, 16389, 16390, 16394, 16396, 16441, 16445, 16450, 16498, 16499, 16501, 16503, 16529, 16536, 16537, 16541, 16559, 16562, 16565, 16587, 16594, 16595, 16609, 16615, 16616, 16621, 16630, 16631, 16635, 16640, 16646, 16649, 16651, 16681, 16689, 16695, 16723, 16763, 16807, 16848, 16858, 16862, 16880, 16905, 16917, 16932, 16937, 16981, 16982, 17065, 17076, 17093, 17157, 17162, 17163, 17166, 17167, 17189, 17195, 17205, 17245, 17263, 17277, 17333, 17370, 17390, 17408, 17429, 17457, 17497, 17501, 17507, 17514, 17570, 17595, 17598, 17606, 17608, 17610, 17614, 17626, 17645, 17648, 17678, 17706, 17710, 17726, 17738, 17753, 17757, 17796, 17797, 17811, 17831, 17834, 17842, 17845, 17851, 17893, 17897, 17914, 17918, 17944, 17972, 18020, 18026, 18093, 18123, 18132, 18176, 18180, 18198, 18249, 18263, 18266, 18293, 18338, 18342, 18343, 18355, 18367, 18414, 18432, 18437, 18442, 18444, 18456, 18535, 18536, 18537, 18539, 18597, 18599, 18613, 18624, 18640, 18660, 18677, 18681, 18703, 18710, 18712, 18757, 18762, 18772, 18799, 18810, 18842, 18856, 18874, 18954, 18959, 18965, 18970, 19023, 19025, 19097, 19098, 19109, 19123, 19141, 19200, 19212, 19233, 19297, 19298, 19299, 19321, 19342, 19351, 19369, 19408, 19411, 19412, 19440, 19458, 19459, 19463, 19465, 19467, 19493, 19509, 19539, 19565, 19570, 19571, 19606, 19626, 19634, 19635, 19637, 19656, 19661, 19685, 19689, 19712, 19717, 19718, 19724, 19769, 19815, 19828, 19829, 19832, 19839, 19864, 19865, 19876, 19890, 19891, 19914, 19917, 19918, 19923, 19945, 19946, 19947, 19949, 19950, 19968, 19969, 19975, 19982, 19998, 20018, 20019, 20021, 20041, 20054, 20057, 20082, 20114, 20117, 20129, 20131, 20138, 20142, 20148, 20149, 20201, 20224, 20225, 20230, 20234, 20239, 20259, 20265, 20269, 20275, 20293, 20306, 20307, 20322, 20323, 20328, 20338, 20339, 20340, 20341, 20370, 20387, 20419, 20426, 20435, 20443, 20446, 20464, 20484, 20486, 20488, 20490, 20495, 20520, 20540, 20577, 20592, 20595, 20597, 20604, 20606, 20613, 20630, 20632, 20680, 20686, 20691, 20693, 20696, 20701, 20716, 20719, 20739, 20787, 20821, 20837, 20856, 20888, 20900, 20976, 20984, 20995, 20998, 21047, 21078, 21081, 21141, 21247, 21253, 21254, 21258, 21259, 21267, 21285, 21389, 21410, 21448, 21472, 21507, 21509, 21513, 21555, 21563, 21569, 21571, 21573, 21576, 21625, 21633, 21637, 21649, 21655, 21665, 21670, 21672, 21697, 21713, 21720, 21725, 21729, 21745, 21746, 21751, 21757, 21765, 21768, 21817, 21829, 21843, 21848, 21851, 21862, 21864, 21867, 21901, 21905, 21909, 21928, 21933, 21947, 21955, 21979, 21981, 22002, 22003, 22021, 22022, 22024, 22027, 22029, 22037, 22038, 22053, 22077, 22118, 22120, 22123, 22132, 22134, 22160, 22174, 22182, 22192, 22220, 22222, 22276, 22277, 22279, 22280, 22489, 22493, 22498, 22501, 22504, 22506, 22538, 22550, 22555, 22557, 22558, 22571, 22575, 22603, 22607, 22613, 22632, 22639, 22643, 22663, 22676, 22692, 22704, 22727, 22735, 22750, 22759, 22811, 22840, 22846, 22863, 22896, 22967, 22972, 23011, 23012, 23029, 23042, 23043, 23047, 23051, 23073, 23095, 23120, 23157, 23158, 23160, 23163, 23169, 23173, 23176, 23183, 23189, 23208, 23251, 23312, 23319, 23352, 23371, 23376, 23381, 23398, 23400, 23408, 23429, 23448, 23461, 23473, 23482, 23512, 23524, 23532, 23544, 23560, 23592, 23604, 23605, 23608, 23609, 23613, 23666, 23669, 23696, 23702, 23762, 23841, 23856, 23857, 23863, 23931, 23987, 24025, 24036, 24040, 24045, 24064, 24070, 24076, 24129, 24133, 24195, 24200, 24213, 24280, 24283, 24289, 24296, 24302, 24326, 24424, 24455, 24499, 24515, 24531, 24539, 24547, 24568, 24577, 24586, 24588, 24603, 24651, 24653, 24656, 24658, 24662, 24665, 24666, 24667, 24668, 24674, 24678, 24680, 24683, 24688, 24690, 24701, 24706, 24714, 24727, 24733, 24734, 24765, 24766, 24768, 24780, 24783, 24784, 24800, 24849, 24853, 24867, 24901, 24902, 24911, 24915, 24916, 24923, 24952, 24961, 24963, 24965, 24968, 24997, 25013, 25032, 25053, 25060, 25080, 25085, 25123, 25131, 25139, 25143, 25146, 25154, 25160, 25161, 25173, 25176, 25177, 25192, 25207, 25224, 25303, 25320, 25341, 25345, 25348, 25349, 25352, 25353, 25363, 25367, 25379, 25381, 25395, 25403, 25412, 25415, 25416, 25417, 25421, 25427, 25434, 25435, 25445, 25464, 25473, 25480, 25525, 25596, 25605, 25619, 25620, 25627, 25637, 25644, 25645, 25646, 25651, 25674, 25683, 25689, 25699, 25701, 25704, 25720, 25731, 25736, 25743, 25745, 25751, 25761, 25773, 25777, 25795, 25801, 25811, 25815, 25826, 25827, 25832, 25833, 25842, 25843, 25844, 25864, 25909, 25928, 25958, 25960, 25973, 25974, 25976, 25999, 26002, 26007, 26009, 26018, 26033, 26034, 26052, 26053, 26136, 26138, 26139, 26155, 26157, 26168, 26180, 26186, 26196, 26232, 26237, 26241, 26245, 26248, 26255, 26263, 26274, 26275, 26279, 26280, 26285, 26298, 26306, 26318, 26328, 26361, 26369, 26375, 26376, 26440, 26445, 26477, 26483, 26501, 26511, 26545, 26554, 26617, 26648, 26649, 26653, 26655, 26661, 26665, 26669, 26675, 26677, 26680, 26682, 26690, 26691, 26695, 26696, 26703, 26706, 26709, 26711, 26712, 26724, 26740, 26757, 26785, 26792, 26794, 26799, 26807, 26810, 26817, 26820, 26821, 26825, 26839, 26865, 26866, 26869, 26871, 26872, 26873, 26874, 26901, 26913, 26915, 26934, 26936, 26939, 26954, 26956, 26962, 26966, 26984, 26985, 26997, 27011, 27013, 27035, 27064, 27071, 27096, 27140, 27156, 27162, 27171, 27187, 27189, 27195, 27219, 27235, 27249, 27253, 27265, 27266, 27278, 27316, 27398, 27403, 27409, 27413, 27416, 27427, 27446, 27451, 27457, 27458, 27462, 27464, 27466, 27475, 27489, 27493, 27494, 27496, 27504, 27507, 27525, 27544, 27569, 27592, 27608, 27620, 27635, 27637, 27655, 27656, 27662, 27670, 27738, 27745, 27751, 27759, 27764, 27766, 27779, 27781, 27784, 27791, 27792, 27796, 27798, 27800, 27803, 27807, 27834, 27835, 27838, 27853, 27864, 27869, 27872, 27894, 27895, 27901, 27921, 27922, 27923, 27924, 27925, 27937, 27939, 27941, 27952, 27953, 27955, 27957, 27973, 27976, 28017, 28019, 28021, 28024, 28040, 28049, 28056, 28083, 28098, 28099, 28113, 28116, 28120, 28145, 28166, 28168, 28174, 28181, 28216, 28232, 28233, 28234, 28246, 28249, 28277, 28280, 28291, 28293, 28296, 28301, 28306, 28307, 28321, 28323, 28349, 28355, 28422, 28427, 28435, 28440, 28502, 28520, 28531, 28533, 28539, 28563, 28570, 28579, 28635, 28653, 28654, 28659, 28663, 28682, 28687, 28785, 28786, 28789, 28791, 29003, 29011, 29015, 29064, 29075, 29105, 29114, 29142, 29171, 29271, 29317, 29319, 29362, 29365, 29370, 29381, 29397, 29404, 29410, 29448, 29477, 29493, 29560, 29623, 29626, 29640, 29667, 29697, 29699, 29701, 29702, 29704, 29766, 29771, 29772, 29773, 29775, 29783, 29795, 29811, 29816, 29829, 29832, 29841, 29850, 29906, 29913, 29943, 29948, 29953, 29960, 29987, 29998, 30003, 30019, 30035, 30040, 30041, 30067, 30087, 30097, 30147, 30161, 30229, 30230, 30234, 30251, 30253, 30266, 30270, 30276, 30277, 30283, 30284, 30291, 30294, 30303, 30306, 30307, 30332, 30339, 30353, 30362, 30363, 30366, 30379, 30380, 30385, 30394, 30396, 30420, 30426, 30438, 30442, 30443, 30444, 30453, 30465, 30466, 30471, 30529, 30537, 30553, 30597, 30659, 30712, 30726, 30730, 30749, 30753, 30756, 30760, 30762, 30765, 30769, 30772, 30793, 30812, 30814, 30837, 30840, 30851, 30856, 30861, 30870, 30879, 30883, 30884, 30887, 30903, 30911, 30922, 30933, 30938, 30945, 30946, 30952, 30956, 30957, 30958, 30959, 30963, 30965, 31036, 31049, 31059, 31111, 31160, 31202, 31203, 31204, 31207, 31209, 31214, 31219, 31240, 31304, 31368, 31370, 31383, 31410, 31411, 31429, 31469, 31498, 31509, 31567, 31571, 31573, 31651, 31665, 31704, 31736, 31752, 31767, 31820, 31827, 31858, 31874, 31882, 31897, 31926, 31981, 31989, 32070, 32077, 32120, 32137, 32149, 32152, 32232, 32237, 32264, 32269, 32329, 32405, 32419, 32517, 32518, 32575, 32583, 32595, 32625, 32627, 32653, 32691, 32707, 32779, 32783, 32810, 32818, 32822, 32824, 32828, 32840, 32841, 32844, 32852, 32882, 32889, 32892, 32893, 32899, 32901, 32919, 32921, 32922, 32929, 32936, 32940, 32958, 32962, 32964, 32969, 32983, 32989, 33005, 33021, 33024, 33028, 33042, 33045, 33053, 33058, 33060, 33066, 33079, 33085, 33091, 33106, 33107, 33109, 33111, 33114, 33124, 33127, 33144, 33149, 33150, 33154, 33165, 33166, 33170, 33174, 33183, 33193, 33207, 33215, 33229, 33243, 33248, 33252, 33259, 33268, 33282, 33284, 33289, 33291, 33299, 33301, 33306, 33315, 33320, 33334, 33336, 33346, 33366, 33375, 33389, 33394, 33397, 33406, 33407, 33435, 33448, 33451, 33465, 33468, 33477, 33492, 33495, 33501, 33506, 33508, 33517, 33536, 33537, 33538, 33551, 33553, 33555, 33566, 33573, 33578, 33581, 33583, 33596, 33597, 33599, 33604, 33609, 33610, 33614, 33616, 33627, 33639, 33655, 33656, 33663, 33667, 33671, 33673, 33678, 33679, 33684, 33686, 33688, 33691, 33698, 33700, 33703, 33710, 33711, 33714, 33715, 33717, 33721, 33724, 33727, 33730, 33731, 33733, 33735, 33736, 33746, 33747, 33749, 33752, 33754, 33755, 33759, 33760, 33763, 33764, 33768, 33769, 33771, 33779, 33789, 33793, 33808, 33809, 33811, 33812, 33827, 33832, 33833, 33837, 33838, 33839, 33844, 33845, 33851, 33853, 33858, 33860, 33861, 33865, 33874, 33883, 33884, 33891, 33899, 33902, 33905, 33906, 33909, 33917, 33927, 33929, 33930, 33934, 33945, 33946, 33949, 33954, 33955, 33956, 33957, 33959, 33960, 33971, 33972, 33973, 33977, 33978, 33979, 33982, 33983, 33988, 33989, 33992, 34002, 34004, 34005, 34008, 34013, 34017, 34018, 34021, 34044, 34046, 34053, 34055, 34062, 34066, 34074, 34081, 34084, 34085, 34106, 34116, 34122, 34133, 34141, 34151, 34169, 34178, 34185, 34193, 34210, 34226, 34228, 34229, 34230, 34231, 34235, 34236, 34240, 34244, 34269, 34276, 34283, 34285, 34290, 34292, 34299, 34329, 34346, 34349, 34356, 34363, 34376, 34380, 34389, 34393, 34415, 34418, 34422, 34423, 34424, 34428, 34429, 34434, 34435, 34437, 34442, 34476, 34487, 34502, 34506, 34516, 34552, 34560, 34564, 34567, 34576, 34612, 34618, 34621, 34626, 34637, 34650, 34658, 34663, 34680, 34692, 34697, 34698, 34702, 34711, 34718, 34722, 34729, 34732, 34734, 34737, 34793, 34798, 34802, 34814, 34817, 34818, 34830, 34834, 34840, 34845, 34846, 34851, 34853, 34855, 34868, 34882, 34889, 34893, 34896, 34900, 34901, 34905, 34907, 34908, 34910, 34931, 34932, 34936, 34938, 34945, 34951, 34959, 34964, 34965, 34983, 34986, 34992, 34997, 34999, 35001, 35006, 35007, 35010, 35013, 35017, 35023, 35026, 35040, 35049, 35055, 35061, 35066, 35069, 35070, 35071, 35072, 35076, 35089, 35092, 35099, 35107, 35109, 35131, 35132, 35139, 35146, 35152, 35157, 35187, 35189, 35192, 35199, 35202, 35208, 35210, 35221, 35224, 35226, 35230, 35238, 35243, 35249, 35250, 35253, 35259, 35260, 35261, 35262, 35263, 35284, 35285, 35305, 35330, 35332, 35338, 35339, 35347, 35348, 35351, 35354, 35362, 35373, 35409, 35415, 35443, 35460, 35473, 35477, 35482, 35486, 35499, 35501, 35506, 35516, 35519, 35521, 35533, 35537, 35538, 35550, 35552, 35554, 35561, 35565, 35600, 35606, 35613, 35620, 35624, 35626, 35630, 35636, 35642, 35645, 35658, 35661, 35665, 35667, 35669, 35674, 35682, 35684, 35687, 35700, 35704, 35709, 35714, 35721, 35722, 35729, 35733, 35737, 35756, 35770, 35785, 35791, 35809, 35813, 35829, 35833, 35841, 35842, 35847, 35848, 35851, 35854, 35855, 35858, 35865, 35880, 35892, 35894, 35896, 35906, 35907, 35914, 35923, 35929, 35930, 35940, 35942, 35960, 35983, 35992, 35994, 35999, 36005, 36009, 36010, 36018, 36021, 36026, 36042, 36049, 36063, 36065, 36066, 36068, 36077, 36084, 36090, 36091, 36096, 36097, 36098, 36099, 36100, 36104, 36105, 36106, 36109, 36114, 36115, 36117, 36121, 36125, 36132, 36142, 36145, 36146, 36148, 36150, 36152, 36153, 36163, 36173, 36177, 36179, 36183, 36186, 36188, 36190, 36191, 36193, 36201, 36206, 36209, 36223, 36228, 36234, 36237, 36238, 36241, 36248, 36249, 36255, 36259, 36261, 36271, 36273, 36274, 36290, 36291, 36292, 36296, 36303, 36309, 36323, 36325, 36328, 36331, 36333, 36334, 36338, 36340, 36341, 36349, 36354, 36357, 36359, 36361, 36363, 36364, 36366, 36370, 36371, 36373, 36385, 36387, 36388, 36434, 36437, 36443, 36453, 36461, 36475, 36520, 36528, 36531, 36532, 36533, 36537, 36540, 36542, 36545, 36555, 36563, 36564, 36581, 36593, 36595, 36596, 36597, 36599, 36601, 36609, 36620, 36626, 36627, 36637, 36643, 36644, 36649, 36651, 36658, 36659, 36660, 36681, 36682, 36685, 36689, 36691, 36693, 36695, 36700, 36701, 36702, 36705, 36709, 36712, 36713, 36717, 36725, 36743, 36751, 36763, 36765, 36770, 36772, 36776, 36793, 36796, 36797, 36801, 36805, 36827, 36829, 36834, 36835, 36839, 36843, 36850, 36851, 36852, 36857, 36858, 36861, 36863, 36892, 36918, 36924, 36954, 37126, 37149, 37204, 37233, 37234, 37253, 37258, 37277, 37285, 37315, 37382, 37449, 37457, 37524, 37526, 37529, 37534, 37586, 37608, 37609, 37618, 37634, 37644, 37653, 37658, 37661, 37663, 37675, 37689, 37705, 37751, 37752, 37761, 37768, 37773, 37859, 37861, 37864, 37889, 37893, 37895, 37900, 37909, 37915, 37921, 37933, 37976, 38001, 38005, 38012, 38014, 38015, 38035, 38051, 38061, 38100, 38111, 38114, 38115, 38120, 38124, 38127, 38280, 38330, 38355, 38417, 38420, 38422, 38424, 38440, 38472, 38511, 38531, 38538, 38582, 38600, 38657, 38660, 38663, 38664, 38682, 38706, 38772, 38778, 38780, 38788, 38810, 38834, 38888, 38889, 38924, 38929, 38931, 38932, 38947, 38948, 38954, 38964, 38965, 38970, 38980, 38985, 38989, 38995, 38998, 39001, 39014, 39028, 39042, 39045, 39047, 39048, 39082, 39083, 39084, 39085, 39092, 39096, 39101, 39109, 39129, 39133, 39137, 39140, 39141, 39144, 39145, 39147, 39156, 39159, 39170, 39199, 39224, 39231, 39234, 39252, 39254, 39256, 39270, 39272, 39299, 39349, 39428, 39445, 39450, 39459, 39469, 39477, 39483, 39542, 39544, 39577, 39581, 39650, 39666, 39692, 39731, 39733, 39739, 39740, 39762, 39923, 39972, 39973, 40057, 40088, 40089, 40115, 40195, 40198, 40200, 40204, 40218, 40253, 40260, 40294, 40322, 40329, 40445, 40524, 40527, 40664, 40709, 40716, 40725, 40728, 40730, 40742, 40771, 40808, 40819, 40821, 40827, 40840, 40924, 41009, 41015, 41080, 41183, 41222, 41226, 41236, 41237, 41240, 41259, 41316, 41320, 41432, 41448, 41459, 41461, 41476, 41479, 41495, 41537, 41557, 41558, 41572, 41575, 41607, 41620, 41628, 41684, 41707, 41718, 41732, 41735, 41736, 41740, 41752, 41816, 41846, 41931, 41985, 41992, 42004, 42037, 42050, 42066, 42072, 42084, 42091, 42098, 42142, 42198, 42200, 42213, 42234, 42235, 42257, 42260, 42261, 42264, 42276, 42277, 42282, 42283, 42287, 42305, 42306, 42307, 42318, 42326, 42345, 42349, 42356, 42392, 42395, 42406, 42408, 42424, 42513, 42565, 42589, 42599, 42601, 42616, 42643, 42644, 42645, 42651, 42670, 42676, 42679, 42692, 42722, 42728, 42750, 42754, 42756, 42758, 42760, 42763, 42766, 42776, 42783, 42804, 42840, 42856, 42915, 43016, 43025, 43028, 43041, 43044, 43064, 43067, 43071, 43096, 43108, 43208, 43219, 43223, 43224, 43252, 43283, 43299, 43348, 43350, 43352, 43384, 43452, 43476, 43479, 43483, 43496, 43521, 43522, 43524, 43549, 43560, 43581, 43595, 43597, 43605, 43606, 43611, 43615, 43620, 43624, 43625, 43635, 43636, 43638, 43640, 43641, 43663, 43665, 43666, 43668, 43671, 43673, 43684, 43697, 43698, 43704, 43707, 43766, 43782, 43784, 43819, 43829, 43831, 43835, 43860, 43862, 43880, 43898, 43929, 43934, 43940, 43948, 43962, 43981, 44010, 44015, 44027, 44038, 44041, 44046, 44054, 44056, 44069, 44070, 44072, 44118, 44148, 44157, 44182, 44184, 44185, 44260, 44292, 44372, 44404, 44408, 44469, 44502, 44529, 44551, 44554, 44613, 44625, 44628, 44629, 44674, 44682, 44709, 44775, 44805, 44808, 44812, 44815, 44884, 44885, 44886, 44900, 44904, 44913, 44917, 44924, 44964, 44994, 44997, 45025, 45026, 45028, 45042, 45069, 45079, 45095, 45105, 45110, 45121, 45128, 45129, 45130, 45133, 45134, 45171, 45182, 45192, 45207, 45213, 45215, 45238, 45278, 45279, 45289, 45290, 45293, 45303, 45318, 45329, 45338, 45341, 45381, 45395, 45449, 45494, 45507, 45590, 45644, 45672, 45756, 45829, 45832, 45833, 45836, 45845, 45877, 45878, 45909, 45910, 45928, 45944, 46024, 46059, 46087, 46097, 46100, 46101, 46104, 46107, 46116, 46139, 46145, 46163, 46187, 46194, 46199, 46215, 46221, 46232, 46234, 46244, 46259, 46290, 46296, 46305, 46306, 46317, 46328, 46331, 46372, 46443, 46674, 46681, 46697, 46710, 46712, 46727, 46756, 46781, 46790, 46793, 46800, 46836, 46852, 46856, 46868, 46870, 46898, 46952, 47064, 47108, 47109, 47110, 47116, 47121, 47127, 47141, 47156, 47163, 47188, 47190, 47192, 47206, 47208, 47211, 47215, 47224, 47270, 47282, 47284, 47285, 47290, 47300, 47306, 47355, 47382, 47412, 47448, 47541, 47551, 47604, 47618, 47620, 47627, 47642, 47655, 47806, 47810, 47862, 47884, 47931, 47955, 47974, 47976, 48002, 48052, 48115, 48136, 48150, 48165, 48179, 48181, 48211, 48246, 48278, 48381, 48410, 48441, 48504, 48568, 48648, 48675, 48713, 48772, 48783, 48801, 48810, 48849, 48868, 48871, 48908, 48916, 48920, 48927, 48930, 48946, 48957, 48984, 48998, 49000, 49011, 49013, 49017, 49027, 49029, 49045, 49101, 49112, 49113, 49144, 49167, 49237, 49247, 49264, 49279, 49360, 49376, 49389, 49430, 49432, 49437, 49448, 49450, 49455, 49466, 49477, 49478, 49479, 49485, 49487, 49491, 49496, 49501, 49624, 49647, 49665, 49672, 49709, 49715, 49721, 49723, 49736, 49738, 49754, 49781, 49784, 49821, 49903, 49926, 49928, 49929, 49949, 49960, 49971, 49979, 49997, 50040, 50089, 50136, 50152, 50155, 50166, 50168, 50182, 50184, 50185, 50187, 50189, 50209, 50216, 50221, 50226, 50237, 50238, 50242, 50245, 50250, 50280, 50309, 50319, 50333, 50345, 50360, 50392, 50408, 50415, 50422, 50424, 50453, 50456, 50483, 50504, 50536, 50568, 50584, 50616, 50632, 50700, 50708, 50724, 50737, 50739, 50740, 50760, 50762, 50767, 50771, 50782, 50840, 50846, 50847, 50853, 50872, 50874, 50879, 50920, 50929, 50936, 50943, 50949, 50950, 50952, 50953, 50955, 50957, 51005, 51016, 51032, 51059, 51064, 51077, 51096, 51128, 51201, 51206, 51208, 51217, 51223, 51224, 51235, 51236, 51237, 51240, 51245, 51251, 51252, 51256, 51263, 51265, 51269, 51272, 51279, 51283, 51302, 51303, 51347, 51361, 51363, 51364, 51366, 51367, 51380, 51411, 51416, 51418, 51420, 51432, 51439, 51448, 51455, 51457, 51458, 51459, 51461, 51462, 51463, 51464, 51480, 51512, 51515, 51528, 51535, 51568, 51637, 51683, 51686, 51687, 51688, 51718, 51720, 51768, 51771, 51864, 51870, 51923, 51926, 51928, 51969, 51971, 51997, 52019, 52038, 52040, 52043, 52196, 52203, 52278, 52296, 52301, 52342, 52344, 52368, 52373, 52374, 52376, 52407, 52448, 52456, 52488, 52496, 52504, 52509, 52527, 52528, 52557, 52559, 52568, 52600, 52659, 52680, 52701, 52712, 52733, 52809, 52892, 52927, 52957, 52965, 52998, 53059, 53060, 53125, 53128, 53180, 53213, 53219, 53245, 53251, 53263, 53291, 53299, 53314, 53322, 53323, 53326, 53333, 53334, 53340, 53342, 53343, 53362, 53366, 53370, 53394, 53397, 53402, 53427, 53428, 53435, 53447, 53469, 53471, 53482, 53485, 53486, 53504, 53533, 53544, 53560, 53583, 53608, 53624, 53672, 53718, 53772, 53773, 53780, 53796, 53809, 53810, 53811, 53928, 53935, 53936, 53950, 53976, 53992, 54008, 54016, 54018, 54029, 54051, 54061, 54065, 54068, 54079, 54088, 54104, 54109, 54111, 54152, 54177, 54184, 54194, 54240, 54248, 54259, 54269, 54278, 54291, 54307, 54312, 54322, 54323, 54324, 54342, 54347, 54348, 54350, 54351, 54376, 54377, 54401, 54410, 54496, 54506, 54579, 54581, 54648, 54710, 54716, 54774, 54776, 54777, 54779, 54785, 54790, 54820, 54850, 54927, 54932, 55012, 55034, 55040, 55046, 55048, 55049, 55052, 55091, 55096, 55098, 55102, 55130, 55131, 55135, 55277, 55279, 55315, 55317, 55320, 55340, 55345, 55346, 55347, 55351, 55365, 55372, 55373, 55377, 55421, 55425, 55426, 55429, 55432, 55439, 55443, 55447, 55457, 55473, 55480, 55510, 55513, 55525, 55531, 55535, 55540, 55543, 55544, 55552, 55556, 55557, 55560, 55570, 55603, 55641, 55682, 55688, 55783, 55787, 55790, 55816, 55821, 55844, 55845, 55941, 55946, 55992, 56036, 56040, 56056, 56061, 56098, 56116, 56138, 56197, 56245, 56251, 56253, 56299, 56317, 56332, 56422, 56482, 56488, 56490, 56511, 56514, 56530, 56531, 56552, 56562, 56597, 56616, 56628, 56639, 56680, 56688, 56718, 56767, 56776, 56813, 56848, 56872, 56906, 56920, 56927, 56959, 56989, 57022, 57052, 57071, 57080, 57085, 57094, 57156, 57188, 57281, 57282, 57307, 57313, 57318, 57327, 57334, 57336, 57341, 57486, 57565, 57567, 57596, 57699, 57798, 57820, 57830, 57832, 57862, 57863, 57955, 57989, 58102, 58113, 58118, 58132, 58282, 58358, 58380, 58401, 58405, 58470, 58473, 58539, 58574, 58599, 58600, 58606, 58614, 58615, 58616, 58632, 58872, 59112, 59142, 59265, 59373, 59398, 59451, 59460, 59467, 59471, 59492, 59527, 59533, 59571, 59576, 59633, 59636, 59650, 59653, 59654, 59656, 59657, 59660, 59716, 59910, 59912, 60083, 60405, 60565, 60630, 60678, 60680, 60703, 60765, 60918, 60934, 60987, 61060, 61061, 61075, 61107, 61137, 61156, 61159, 61411, 61482, 61498, 61513, 61533, 61554, 61563, 61564, 61565, 61624, 61645, 61655, 61661, 61663, 61687, 61693, 61695, 61705, 61783, 61800, 61864, 61877, 61928, 61948, 61958, 61961, 61963, 61971, 61972, 61977, 61981, 62004, 62005, 62024, 62025, 62066, 62084, 62085, 62106, 62117, 62120, 62142, 62205, 62216, 62219, 62231, 62232, 62328, 62344, 62357, 62389, 62392, 62408, 62419, 62440, 62451, 62477, 62481, 62495, 62503, 62507, 62513, 62519, 62523, 62529, 62532, 62535, 62568, 62585, 62590, 62616, 62633, 62664, 62667, 62680, 62696, 62703, 62728, 62739, 62744, 62774, 62777, 62787, 62802, 62808, 62849, 62858, 62889, 62910, 62918, 63066, 63091, 63150, 63152, 63167, 63192, 63238, 63243, 63256, 63267, 63331, 63369, 63381, 63385, 63416, 63422, 63443, 63461, 63464, 63518, 63519, 63521, 63534, 63547, 63550, 63593, 63604, 63636, 63641, 63652, 63654, 63656, 63668, 63670, 63681, 63687, 63702, 63705, 63709, 63739, 63748, 63749, 63752, 63797, 63839, 63876, 63922, 63923, 63971, 64006, 64008, 64011, 64022, 64062, 64077, 64145, 64146, 64159, 64168, 64181, 64257, 64317, 64422, 64425, 64433, 64436, 64437, 64440, 64456, 64488, 64493, 64495, 64504, 64536, 64584, 64595, 64596, 64600, 64612, 64645, 64662, 64680, 64709, 64760, 64776, 64818, 64820, 64824, 64833, 64863, 64880, 64888, 64893, 64894, 64900, 64927, 64948, 64968, 64989, 64996, 65021, 65030, 65032, 65037, 65083, 65096, 65191, 65203, 65205, 65208, 65214, 65253, 65262, 65277, 65352, 65357, 65449, 65477, 65496, 65499, 65509, 65511, 65526], 31868: [136, 357, 458, 478, 514, 516, 522, 584, 597, 674, 679, 773, 775, 841, 1034, 1089, 1090, 1092, 1093, 1097, 1105, 1130, 1135, 1160, 1166, 1186, 1189, 1194, 1226, 1242, 1246, 1306, 1482, 1554, 1573, 1624, 1637, 1652, 1662, 1669, 1672, 1957, 2067, 2071, 2072, 2074, 2078, 2079, 2083, 2084, 2085, 2089, 2098, 2100, 2105, 2114, 2115, 2116, 2117, 2119, 2121, 2122, 2126, 2136, 2142, 2143, 2146, 2147, 2148, 2151, 2154, 2157, 2158, 2159, 2181, 2183, 2184, 2190, 2191, 2194, 2200, 2206, 2210, 2215, 2225, 2234, 2261, 2328, 2436, 2445, 2499, 2660, 2696, 2741, 2840, 2933, 2948, 2957, 3330, 3332, 3335, 3432, 3461, 3470, 3480, 3656, 3716, 3725, 3972, 3982, 4280, 4324, 4328, 4434, 4500, 4511, 4542, 4543, 4605, 4608, 4629, 4632, 4650, 4655, 4773, 4787, 4791, 4875, 4883, 4915, 4917, 4919, 4927, 4983, 4995, 5043, 5055, 5099, 5104, 5115, 5125, 5137, 5144, 5165, 5167, 5178, 5186, 5195, 5252, 5260, 5261, 5263, 5283, 5311, 5317, 5330, 5331, 5362, 5369, 5395, 5403, 5435, 5473, 5484, 5500, 5532, 5535, 5603, 5652, 5653, 5663, 5668, 5669, 5670, 5684, 5692, 5697, 5698, 5699, 5700, 5707, 5716, 5729, 5731, 5739, 5751, 5779, 5869, 5905, 5911, 5921, 5927, 6005, 6066, 6116, 6117, 6127, 6144, 6148, 6152, 6169, 6189, 6196, 6202, 6206, 6210, 6211, 6212, 6218, 6230, 6248, 6250, 6252, 6286, 6290, 6316, 6346, 6367, 6380, 6389, 6444, 6469, 6490, 6497, 6533, 6557, 6565, 6614, 6615, 6627, 6629, 6632, 6645, 6647, 6680, 6686, 6712, 6728, 6755, 6780, 6789, 6792, 6798, 6799, 6818, 6824, 6881, 6907, 6951, 6979, 6995, 6997, 6999, 7010, 7061, 7217, 7223, 7352, 7461, 7475, 7483, 7538, 7545, 7557, 7603, 7650, 7680, 7807, 7811, 7813, 7817, 7847, 7905, 8021, 8022, 8051, 8306, 8308, 8309, 8311, 8312, 8349, 8376, 8421, 8455, 8481, 8483, 8485, 8494, 8495, 8531, 8547, 8548, 8590, 8597, 8607, 8610, 8671, 8684, 8686, 8687, 8699, 8709, 8716, 8722, 8799, 8831, 8835, 8863, 8895, 8965, 8972, 8979, 8989, 9047, 9053, 9057, 9063, 9104, 9118, 9125, 9141, 9181, 9219, 9230, 9232, 9250, 9258, 9261, 9262, 9273, 9283, 9285, 9287, 9311, 9314, 9315, 9360, 9378, 9407, 9431, 9432, 9435, 9437, 9457, 9460, 9463, 9484, 9512, 9518, 9519, 9523, 9525, 9532, 9533, 9538, 9543, 9566, 9577, 9591, 9596, 9615, 9639, 9686, 9717, 9723, 9747, 9748, 9750, 9765, 9768, 9781, 9789, 9795, 9800, 9805, 9816, 9827, 9857, 9864, 9877, 9882, 9914, 9959, 9976, 9977, 9979, 10007, 10017, 10087, 10130, 10152, 10165, 10175, 10273, 10279, 10285, 10286, 10288, 10299, 10306, 10313, 10326, 10341, 10345, 10349, 10355, 10362, 10391, 10407, 10413, 10415, 10430, 10458, 10462, 10479, 10485, 10486, 10491, 10493, 10562, 10602, 10627, 10629, 10633, 10639, 10640, 10672, 10704, 10705, 10710, 10711, 10717, 10719, 10741, 10753, 10759, 10772, 10849, 10852, 10869, 10879, 10920, 10926, 10931, 10941, 10943, 11092, 11093, 11106, 11107, 11108, 11128, 11145, 11205, 11217, 11224, 11247, 11313, 11327, 11357, 11359, 11367, 11389, 11401, 11410, 11413, 11428, 11444, 11445, 11461, 11562, 11571, 11580, 11610, 11612, 11613, 11615, 11626, 11640, 11641, 11652, 11653, 11664, 11701, 11715, 11731, 11735, 11754, 11758, 11771, 11775, 11786, 11790, 11827, 11873, 11999, 12001, 12002, 12003, 12015, 12030, 12031, 12033, 12037, 12083, 12095, 12107, 12117, 12142, 12145, 12146, 12159, 12165, 12220, 12228, 12231, 12242, 12251, 12255, 12337, 12485, 12520, 12554, 12591, 12595, 12659, 12661, 12665, 12666, 12691, 12707, 12723, 12725, 12739, 12781, 12797, 12819, 12821, 12851, 12867, 12880, 12883, 12899, 12935, 12940, 12947, 12963, 12985, 12987, 12991, 12995, 13011, 13040, 13084, 13086, 13103, 13104, 13109, 13116, 13123, 13147, 13153, 13203, 13219, 13237, 13291, 13296, 13314, 13322, 13324, 13352, 13357, 13367, 13385, 13387, 13409, 13411, 13439, 13475, 13493, 13503, 13512, 13541, 13551, 13560, 13561, 13587, 13606, 13608, 13619, 13676, 13684, 13692, 13698, 13710, 13727, 13731, 13737, 13779, 13807, 13840, 13862, 13871, 13909, 13943, 13972, 13973, 13991, 14010, 14038, 14112, 14128, 14183, 14188, 14225, 14232, 14238, 14239, 14241, 14247, 14347, 14381, 14403, 14437, 14462, 14465, 14477, 14502, 14507, 14512, 14519, 14532, 14533, 14539, 14568, 14680, 14685, 14706, 14709, 14790, 14801, 14807, 14811, 14832, 14853, 14915, 14916, 14917, 15011, 15026, 15027, 15028, 15077, 15151, 15184, 15188, 15193, 15202, 15208, 15221, 15225, 15260, 15263, 15313, 15315, 15406, 15453, 15479, 15485, 15621, 15675, 15676, 15677, 15709, 15715, 15827, 15856, 15916, 15918, 15923, 15965, 16035, 16051, 16057, 16061, 16175, 16191, 16197, 16201, 16205, 16214, 16227, 16255, 16280, 16281, 16376, 16662, 16722, 16741, 16760, 16777, 16783, 16933, 16962, 17027, 17029, 17040, 17077, 17094, 17112, 17114, 17117, 17181, 17190, 17352, 17374, 17413, 17432, 17490, 17503, 17505, 17508, 17512, 17513, 17528, 17529, 17531, 17623, 17624, 17650, 17659, 17662, 17672, 17675, 17747, 17762, 17787, 17830, 17849, 17855, 17859, 17862, 17881, 17915, 18009, 18037, 18090, 18183, 18184, 18200, 18205, 18262, 18277, 18337, 18341, 18346, 18347, 18360, 18443, 18446, 18508, 18538, 18543, 18547, 18554, 18632, 18633, 18662, 18761, 18834, 18835, 18837, 18840, 18853, 18858, 18861, 18868, 18946, 18958, 18969, 19018, 19026, 19041, 19053, 19088, 19125, 19126, 19128, 19131, 19160, 19165, 19225, 19275, 19282, 19285, 19304, 19370, 19400, 19417, 19477, 19545, 19726, 19757, 19862, 19932, 19951, 20180, 20187, 20300, 20319, 20329, 20334, 20345, 20396, 20454, 20467, 20469, 20506, 20534, 20563, 20564, 20565, 20579, 20581, 20590, 20697, 20723, 20730, 20768, 20867, 20873, 20880, 20997, 21024, 21083, 21088, 21110, 21200, 21216, 21280, 21321, 21363, 21395, 21397, 21408, 21427, 21432, 21443, 21495, 21501, 21528, 21536, 21539, 21543, 21583, 21587, 21603, 21619, 21621, 21627, 21723, 21728, 21730, 21732, 21738, 21792, 21804, 21833, 21835, 21889, 21895, 21899, 21900, 21911, 21926, 21958, 21985, 22040, 22048, 22057, 22064, 22073, 22081, 22085, 22097, 22104, 22111, 22119, 22127, 22145, 22166, 22198, 22231, 22260, 22271, 22278, 22304, 22311, 22390, 22486, 22560, 22562, 22564, 22566, 22569, 22577, 22579, 22587, 22597, 22601, 22620, 22634, 22636, 22651, 22652, 22657, 22661, 22666, 22667, 22668, 22670, 22673, 22748, 22758, 22763, 22766, 22768, 22769, 22770, 22773, 22775, 22805, 22860, 22931, 23014, 23041, 23052, 23060, 23061, 23062, 23063, 23065, 23081, 23097, 23119, 23136, 23144, 23179, 23190, 23209, 23211, 23219, 23317, 23328, 23344, 23372, 23446, 23480, 23612, 23640, 23668, 23701, 23733, 23740, 23843, 23859, 23868, 23893, 23921, 23927, 23945, 23961, 24003, 24005, 24027, 24041, 24069, 24117, 24179, 24185, 24211, 24255, 24259, 24297, 24328, 24383, 24395, 24405, 24440, 24443, 24457, 24459, 24538, 24553, 24563, 24630, 24664, 24677, 24686, 24707, 24712, 24829, 24830, 24884, 24899, 24900, 24917, 24964, 24971, 24975, 25105, 25121, 25124, 25137, 25159, 25171, 25219, 25225, 25249, 25316, 25377, 25387, 25429, 25477, 25485, 25509, 25597, 25606, 25617, 25666, 25667, 25675, 25677, 25678, 25709, 25718, 25721, 25729, 25732, 25750, 25796, 25812, 25816, 25821, 25823, 25835, 25845, 25852, 25857, 25862, 25936, 25957, 25985, 25993, 26049, 26051, 26080, 26132, 26169, 26185, 26214, 26219, 26228, 26233, 26234, 26251, 26278, 26372, 26510, 26553, 26596, 26616, 26628, 26630, 26631, 26634, 26638, 26657, 26660, 26692, 26697, 26699, 26714, 26721, 26728, 26731, 26733, 26735, 26739, 26753, 26754, 26762, 26771, 26773, 26778, 26784, 26789, 26804, 26805, 26812, 26816, 26831, 26844, 26852, 26877, 26933, 26948, 27009, 27017, 27032, 27186, 27193, 27227, 27233, 27243, 27268, 27269, 27271, 27277, 27279, 27302, 27435, 27452, 27497, 27505, 27562, 27563, 27593, 27633, 27641, 27850, 27873, 27875, 27877, 27978, 28005, 28036, 28117, 28239, 28337, 28449, 28488, 28493, 28495, 28512, 28513, 28528, 28545, 28548, 28549, 28551, 28553, 28618, 28627, 28634, 28657, 28878, 28965, 28999, 29048, 29061, 29070, 29077, 29106, 29107, 29152, 29273, 29330, 29398, 29400, 29408, 29417, 29436, 29446, 29523, 29627, 29664, 29703, 29705, 29751, 29763, 29765, 29769, 29774, 29793, 29827, 29828, 29833, 29851, 29873, 29879, 29891, 29905, 29915, 29920, 30022, 30028, 30081, 30121, 30176, 30227, 30235, 30239, 30260, 30264, 30265, 30267, 30269, 30280, 30282, 30287, 30290, 30308, 30309, 30311, 30318, 30319, 30340, 30349, 30351, 30373, 30392, 30404, 30461, 30468, 30470, 30472, 30473, 30483, 30501, 30517, 30530, 30539, 30607, 30688, 30752, 30758, 30763, 30779, 30785, 30787, 30788, 30789, 30795, 30796, 30798, 30805, 30815, 30821, 30829, 30836, 30841, 30845, 30846, 30852, 30857, 30863, 30875, 30881, 30889, 30893, 30907, 30909, 30948, 30955, 30973, 31001, 31011, 31032, 31052, 31054, 31113, 31123, 31128, 31153, 31213, 31221, 31233, 31234, 31235, 31284, 31289, 31295, 31329, 31347, 31369, 31372, 31400, 31419, 31468, 31556, 31561, 31625, 31699, 31804, 31868, 31880, 32053, 32060, 32073, 32076, 32131, 32140, 32188, 32492, 32501, 32635, 32693, 33110, 33112, 33171, 33194, 33205, 33209, 33235, 33370, 33382, 33421, 33462, 33464, 33491, 33533, 33539, 33543, 33548, 33629, 33641, 33645, 33658, 33668, 33669, 33706, 33725, 33734, 33745, 33756, 33762, 33777, 33799, 33807, 33866, 33875, 33885, 33889, 33892, 33901, 33907, 33913, 33923, 33924, 33928, 33969, 33985, 33997, 33999, 34009, 34035, 34036, 34048, 34058, 34061, 34069, 34083, 34114, 34128, 34135, 34159, 34161, 34181, 34219, 34222, 34280, 34284, 34456, 34468, 34479, 34568, 34584, 34664, 34665, 34666, 34671, 34709, 34713, 34728, 34740, 34744, 34745, 34762, 34816, 34826, 34828, 34902, 34912, 34913, 34940, 34948, 34966, 34977, 34980, 34981, 34984, 34991, 34993, 34995, 35000, 35028, 35057, 35106, 35177, 35209, 35214, 35235, 35255, 35269, 35281, 35282, 35298, 35309, 35343, 35423, 35445, 35487, 35513, 35525, 35581, 35601, 35681, 35686, 35745, 35769, 35789, 35801, 35987, 36088, 36103, 36110, 36189, 36195, 36197, 36212, 36214, 36225, 36226, 36260, 36275, 36343, 36352, 36360, 36365, 36378, 36415, 36481, 36489, 36493, 36535, 36573, 36580, 36600, 36645, 36653, 36708, 36710, 36714, 36723, 36745, 36750, 36771, 36804, 36810, 36825, 36826, 36838, 36840, 36845, 36849, 36853, 36946, 36994, 37002, 37021, 37022, 37120, 37182, 37227, 37235, 37267, 37308, 37328, 37347, 37349, 37378, 37468, 37490, 37495, 37510, 37516, 37564, 37632, 37685, 37767, 37790, 37813, 37840, 37872, 37888, 37905, 37907, 37908, 37917, 37953, 37955, 37959, 37969, 37987, 37995, 38023, 38045, 38071, 38093, 38098, 38106, 38109, 38116, 38117, 38130, 38139, 38162, 38165, 38234, 38239, 38254, 38357, 38395, 38423, 38506, 38536, 38549, 38591, 38602, 38644, 38648, 38650, 38677, 38751, 38785, 38808, 38812, 38842, 38911, 38917, 38943, 38973, 38975, 38979, 39011, 39013, 39017, 39029, 39033, 39037, 39039, 39046, 39051, 39052, 39060, 39067, 39074, 39079, 39104, 39139, 39154, 39162, 39165, 39168, 39241, 39290, 39303, 39309, 39376, 39403, 39466, 39470, 39480, 39482, 39486, 39516, 39566, 39572, 39594, 39598, 39651, 39711, 39714, 39810, 39817, 39827, 39917, 40069, 40075, 40077, 40117, 40156, 40197, 40312, 40319, 40467, 40483, 40519, 40587, 40589, 40604, 40721, 40722, 40830, 40834, 40899, 40909, 41053, 41093, 41143, 41153, 41159, 41234, 41239, 41266, 41345, 41355, 41358, 41453, 41474, 41481, 41484, 41506, 41569, 41623, 41637, 41733, 41749, 41869, 41968, 41989, 41991, 41996, 42085, 42095, 42113, 42114, 42118, 42119, 42120, 42121, 42123, 42124, 42125, 42133, 42135, 42144, 42199, 42233, 42241, 42258, 42279, 42313, 42339, 42371, 42400, 42412, 42413, 42488, 42494, 42517, 42538, 42539, 42552, 42656, 42662, 42678, 42682, 42704, 42761, 42767, 42778, 42781, 42807, 42913, 43013, 43015, 43023, 43034, 43050, 43054, 43060, 43063, 43070, 43079, 43087, 43122, 43137, 43143, 43144, 43150, 43183, 43204, 43216, 43242, 43246, 43248, 43251, 43261, 43278, 43301, 43397, 43443, 43499, 43515, 43537, 43540, 43541, 43554, 43562, 43573, 43578, 43590, 43592, 43617, 43619, 43633, 43639, 43651, 43653, 43656, 43660, 43711, 43731, 43749, 43770, 43797, 43913, 44030, 44061, 44127, 44156, 44197, 44204, 44207, 44223, 44279, 44298, 44359, 44363, 44383, 44447, 44471, 44495, 44501, 44503, 44528, 44558, 44630, 44678, 44721, 44725, 44810, 44818, 44909, 44911, 44916, 44920, 44934, 44941, 45001, 45005, 45018, 45034, 45041, 45054, 45240, 45281, 45479, 45570, 45612, 45660, 45805, 45846, 45914, 45960, 46003, 46081, 46083, 46085, 46092, 46098, 46120, 46131, 46134, 46141, 46147, 46153, 46157, 46172, 46174, 46175, 46177, 46179, 46184, 46190, 46202, 46206, 46209, 46226, 46243, 46246, 46263, 46266, 46268, 46319, 46320, 46322, 46329, 46352, 46371, 46373, 46393, 46406, 46473, 46476, 46479, 46505, 46538, 46560, 46579, 46585, 46632, 46633, 46694, 46714, 46730, 46750, 46758, 46792, 46794, 46795, 46838, 46904, 46962, 46984, 46985, 46990, 47032, 47040, 47080, 47096, 47114, 47135, 47136, 47167, 47178, 47180, 47182, 47207, 47213, 47218, 47220, 47230, 47231, 47234, 47238, 47239, 47240, 47253, 47262, 47267, 47286, 47287, 47330, 47336, 47339, 47415, 47429, 47432, 47443, 47455, 47464, 47489, 47490, 47499, 47549, 47568, 47590, 47600, 47606, 47608, 47644, 47652, 47658, 47670, 47736, 47740, 47769, 47782, 47784, 47786, 47798, 47846, 47939, 47943, 47946, 47954, 48149, 48252, 48376, 48422, 48506, 48515, 48517, 48528, 48535, 48538, 48553, 48557, 48593, 48594, 48597, 48599, 48602, 48659, 48711, 48776, 48781, 48785, 48789, 48853, 48915, 48947, 49043, 49053, 49109, 49114, 49115, 49118, 49253, 49282, 49290, 49304, 49364, 49368, 49384, 49434, 49474, 49476, 49488, 49499, 49540, 49551, 49562, 49568, 49578, 49582, 49584, 49586, 49712, 49713, 49717, 49725, 49755, 49826, 49837, 49838, 49880, 49889, 49952, 49961, 49965, 49966, 49969, 50000, 50003, 50013, 50014, 50015, 50016, 50028, 50032, 50061, 50080, 50081, 50092, 50129, 50171, 50219, 50227, 50229, 50241, 50243, 50244, 50248, 50251, 50254, 50255, 50305, 50308, 50314, 50315, 50318, 50330, 50347, 50410, 50493, 50527, 50528, 50530, 50543, 50549, 50603, 50728, 50735, 50743, 50745, 50747, 50751, 50754, 50772, 50802, 50810, 50820, 50852, 50856, 50868, 50880, 50886, 50906, 50909, 50914, 50922, 50923, 50928, 50934, 50995, 51006, 51120, 51153, 51207, 51210, 51220, 51225, 51228, 51241, 51243, 51247, 51248, 51249, 51250, 51259, 51260, 51266, 51267, 51271, 51274, 51275, 51277, 51278, 51280, 51282, 51288, 51290, 51295, 51296, 51306, 51309, 51311, 51312, 51322, 51329, 51331, 51333, 51336, 51339, 51345, 51349, 51355, 51359, 51369, 51371, 51373, 51374, 51378, 51379, 51381, 51382, 51387, 51389, 51390, 51391, 51396, 51400, 51435, 51442, 51444, 51452, 51453, 51592, 51599, 51623, 51656, 51693, 51759, 51773, 51791, 51855, 51891, 51992, 52011, 52036, 52045, 52047, 52099, 52100, 52105, 52123, 52155, 52207, 52216, 52419, 52551, 52576, 52601, 52717, 52804, 52870, 52876, 52941, 53071, 53091, 53101, 53129, 53182, 53216, 53332, 53341, 53348, 53393, 53419, 53464, 53477, 53634, 53642, 53645, 53653, 53668, 53720, 53757, 53760, 53791, 53823, 53893, 53912, 53934, 54025, 54028, 54075, 54146, 54151, 54158, 54202, 54284, 54289, 54297, 54305, 54321, 54328, 54340, 54344, 54349, 54402, 54409, 54411, 54415, 54440, 54443, 54445, 54488, 54521, 54528, 54781, 54917, 54926, 54965, 54996, 54998, 55170, 55178, 55296, 55310, 55313, 55325, 55329, 55332, 55343, 55348, 55355, 55359, 55362, 55364, 55375, 55395, 55397, 55435, 55441, 55452, 55456, 55460, 55497, 55508, 55524, 55541, 55545, 55565, 55566, 55576, 55601, 55632, 55801, 55805, 55871, 55959, 55970, 56059, 56089, 56104, 56121, 56132, 56139, 56184, 56193, 56203, 56219, 56301, 56576, 56712, 56719, 56781, 56797, 56804, 56808, 56829, 56832, 56899, 56925, 56987, 56999, 57019, 57129, 57190, 57221, 57250, 57304, 57460, 57461, 57496, 57525, 57640, 57729, 57740, 57760, 57814, 57856, 57858, 58046, 58112, 58155, 58215, 58272, 58342, 58369, 58375, 58386, 58393, 58396, 58408, 58410, 58413, 58450, 58465, 58467, 58471, 58477, 58499, 58510, 58519, 58520, 58524, 58526, 58535, 58540, 58542, 58553, 58558, 58569, 58584, 58585, 58598, 58604, 58617, 58620, 58900, 58902, 58996, 59042, 59060, 59076, 59108, 59188, 59277, 59292, 59399, 59415, 59435, 59448, 59468, 59470, 59478, 59500, 59530, 59535, 59539, 59547, 59559, 59572, 59579, 59582, 59595, 59611, 59613, 59624, 59629, 59639, 59699, 59879, 59904, 59907, 59991, 60007, 60149, 60179, 60296, 60346, 60374, 60815, 60888, 60893, 60904, 60909, 60928, 60979, 61014, 61016, 61042, 61118, 61174, 61227, 61338, 61399, 61465, 61526, 61556, 61620, 61672, 61674, 61715, 61827, 61832, 61871, 61933, 61955, 62014, 62094, 62095, 62127, 62143, 62214, 62235, 62267, 62311, 62376, 62456, 62461, 62491, 62499, 62515, 62539, 62543, 62569, 62582, 62596, 62599, 62617, 62635, 62636, 62646, 62651, 62652, 62697, 62710, 62745, 62805, 62806, 62831, 62899, 63016, 63129, 63131, 63172, 63174, 63175, 63361, 63423, 63497, 63498, 63499, 63502, 63506, 63530, 63551, 63564, 63591, 63594, 63595, 63610, 63626, 63628, 63630, 63634, 63649, 63660, 63669, 63691, 63706, 63710, 63717, 63731, 63736, 63746, 63754, 63771, 63925, 63974, 63976, 63990, 63992, 63997, 64013, 64024, 64031, 64063, 64247, 64253, 64323, 64403, 64427, 64531, 64629, 64712, 64789, 64795, 64798, 64830, 64831, 64879, 64897, 64904, 64906, 64909, 64918, 64920, 65035, 65157, 65166, 65377, 65380, 65384, 65390, 65404, 65425, 65426, 65497], 32160: [12, 32782, 32784, 32793, 32826, 32834, 32842, 32845, 86, 32886, 32891, 32942, 32944, 32953, 236, 33013, 33020, 266, 268, 33043, 33068, 33113, 33115, 33116, 33212, 33213, 33214, 469, 33280, 539, 33324, 33452, 684, 33463, 33504, 33564, 33565, 33625, 33740, 33742, 33772, 1030, 1039, 33820, 33836, 33852, 1099, 1193, 1225, 1237, 34012, 1257, 1286, 1295, 34113, 34117, 34125, 34130, 34173, 34224, 34227, 34233, 34358, 34364, 34377, 34378, 34379, 34384, 34386, 34425, 34460, 34461, 34465, 1701, 34492, 34494, 1804, 34614, 34705, 34809, 2073, 34844, 34874, 34876, 2213, 2219, 2223, 35021, 2267, 35039, 2271, 2283, 35065, 2310, 2315, 35088, 35097, 35105, 35148, 35164, 35163, 35257, 2502, 35277, 35280, 2566, 2575, 2614, 35395, 35420, 2705, 35504, 2799, 35591, 2828, 2831, 35603, 2837, 35605, 35607, 35621, 35660, 35676, 35678, 35763, 35765, 35772, 3004, 35788, 35808, 35817, 35856, 35916, 35931, 36019, 36028, 36030, 36032, 36172, 36257, 36289, 36293, 36298, 36310, 36316, 36336, 36348, 3590, 36419, 36423, 36569, 36572, 36592, 36617, 36641, 36841, 36854, 36860, 36880, 36934, 36939, 4189, 36956, 36981, 37040, 37046, 4307, 4314, 4326, 37101, 4403, 37177, 37193, 37196, 37207, 4607, 37452, 37541, 37561, 4799, 37660, 37690, 37875, 37891, 5151, 37963, 37964, 38037, 38140, 38163, 38179, 38207, 38221, 5613, 5646, 38418, 38419, 38431, 38482, 38589, 5837, 5853, 5855, 38698, 38806, 38847, 6083, 6108, 6124, 6125, 6126, 38912, 6193, 6289, 6303, 39161, 39164, 39196, 39216, 39227, 39228, 39292, 39315, 6579, 39347, 39356, 39392, 39413, 39421, 6751, 39580, 6902, 39677, 39680, 39686, 39697, 39729, 7005, 7091, 7100, 7103, 39888, 39904, 39913, 39918, 40048, 7281, 7314, 7317, 40092, 40101, 7405, 7485, 7615, 40448, 7916, 40754, 40796, 8057, 8063, 40860, 8113, 40918, 40937, 8175, 8199, 40967, 41014, 8285, 8314, 8317, 8319, 41117, 8397, 41165, 8402, 8403, 8406, 8410, 8411, 8412, 41175, 8422, 8425, 8427, 8428, 8429, 41212, 41223, 8460, 41228, 8464, 8499, 41274, 8543, 8593, 8594, 41421, 41424, 8670, 8672, 8720, 41493, 8735, 8752, 41539, 41564, 41591, 8829, 60371, 41641, 41644, 8909, 8928, 8976, 9010, 9052, 9136, 41909, 9168, 41936, 9184, 41964, 9197, 42035, 42039, 42131, 42183, 9439, 42220, 9535, 9552, 9631, 42464, 9696, 9740, 9741, 42562, 42563, 42566, 42571, 42572, 42575, 9841, 42610, 42685, 42719, 9952, 9951, 9996, 42821, 42822, 42826, 42827, 42828, 42831, 42843, 42847, 10204, 10205, 10208, 10210, 10220, 10222, 10237, 10255, 43027, 43031, 43035, 43046, 43052, 43059, 43075, 43081, 43090, 10333, 10334, 43171, 43174, 43195, 43198, 43225, 10464, 10477, 43262, 10524, 43333, 43339, 43345, 43359, 10621, 10650, 43419, 10706, 10720, 10735, 43507, 10742, 43519, 43525, 10764, 10765, 10768, 10783, 10864, 43645, 43725, 10976, 10998, 11021, 11057, 43851, 43867, 11103, 11153, 11196, 11199, 11232, 44021, 44063, 44085, 44086, 11318, 44095, 11344, 44146, 11377, 44178, 44181, 44209, 11453, 11454, 11455, 11459, 11456, 44224, 11488, 44275, 44277, 11536, 44349, 11583, 11603, 11635, 11724, 11725, 11744, 11750, 11755, 11763, 11789, 11792, 44594, 44597, 11856, 11859, 44627, 44631, 11895, 11900, 11925, 11926, 11964, 11965, 11997, 12000, 12009, 12029, 44801, 44806, 12044, 12048, 44821, 44837, 44853, 44861, 12122, 12125, 44914, 44915, 12147, 12151, 44953, 44956, 44965, 44981, 12227, 45007, 45019, 45020, 45022, 12256, 45027, 45029, 45031, 45040, 12285, 45072, 12351, 45122, 45125, 45127, 45132, 45141, 45143, 45148, 45286, 45292, 45295, 45308, 12556, 45404, 12668, 45461, 45616, 45621, 45760, 13024, 45801, 46013, 46060, 13327, 46099, 46113, 46123, 46149, 46171, 46257, 46261, 46325, 46355, 13839, 46610, 46653, 46672, 46749, 14014, 14096, 47001, 14269, 47039, 14333, 14524, 14530, 47311, 47325, 47327, 14640, 47413, 14684, 47525, 47584, 47632, 47815, 47840, 47925, 47947, 48060, 48080, 35609, 15328, 48096, 15343, 48144, 48208, 15440, 15473, 15474, 15475, 48284, 48320, 48352, 48445, 48592, 15846, 48630, 48656, 48658, 48707, 48715, 48716, 48717, 48718, 15952, 15958, 48864, 16115, 16140, 48918, 48914, 48922, 48937, 48950, 48956, 16208, 16243, 49069, 16304, 49107, 49123, 49142, 16384, 49154, 16400, 49165, 16409, 16422, 16428, 16453, 16457, 16460, 16461, 16467, 16469, 16470, 16475, 16476, 16477, 16479, 49267, 49265, 49270, 49269, 16505, 49274, 16560, 16563, 16566, 16599, 16602, 16603, 16604, 16614, 16617, 16619, 16620, 16636, 16637, 49446, 49503, 16767, 16789, 16828, 49661, 49718, 49782, 17072, 17084, 17120, 17136, 49917, 17165, 17180, 49955, 17207, 17243, 17244, 17340, 17356, 17360, 17385, 50154, 17388, 17420, 17424, 17532, 17584, 17612, 50390, 17655, 17660, 17664, 17724, 17809, 17817, 16569, 17840, 17888, 17886, 17891, 17903, 17920, 17934, 50730, 50742, 18000, 18013, 50803, 50834, 50882, 50883, 50897, 50902, 18144, 18160, 50956, 18236, 51022, 18300, 18398, 18400, 18447, 51262, 49266, 18527, 51324, 51358, 18620, 18637, 18639, 51414, 51430, 18670, 18716, 18736, 51507, 18748, 18755, 18768, 18783, 18873, 18876, 18896, 18912, 18925, 18972, 18975, 18992, 51772, 51868, 19120, 19132, 19135, 51907, 19149, 19168, 51955, 19184, 51970, 19214, 19215, 19276, 19278, 19356, 19361, 19365, 19385, 19388, 19390, 19404, 19424, 19439, 19455, 19456, 19471, 19516, 52294, 19529, 19532, 52303, 19614, 19612, 52389, 19632, 19676, 19680, 52454, 19696, 19692, 19740, 19760, 52549, 52550, 19804, 19833, 52604, 52636, 19907, 19916, 19926, 19930, 19942, 52710, 19952, 19955, 19957, 19958, 19961, 19984, 19987, 19996, 19997, 20006, 20028, 20044, 20092, 20124, 20144, 20157, 20173, 20177, 20185, 20188, 52956, 20192, 20198, 20214, 20217, 20221, 20236, 20238, 20252, 53039, 20272, 20284, 53069, 20311, 20343, 20348, 53148, 20412, 20428, 53206, 20447, 53222, 20457, 20460, 20461, 20474, 20476, 20477, 20478, 20501, 20502, 20508, 20524, 20545, 20546, 20550, 20551, 53318, 20553, 20557, 53324, 20562, 20570, 20594, 20599, 53371, 53372, 53411, 20646, 53415, 20662, 20668, 53452, 20694, 20699, 53478, 53481, 20714, 53500, 20853, 20912, 53680, 53755, 21212, 53984, 54011, 21245, 21424, 54339, 21724, 54802, 36951, 22320, 22492, 22502, 22524, 22525, 55643, 22949, 55868, 55920, 23152, 56001, 23249, 56043, 23318, 23333, 23411, 23449, 23472, 23520, 56288, 23526, 23590, 23665, 23670, 56897, 56898, 56983, 56988, 57059, 24294, 57067, 24300, 57068, 57168, 57232, 57234, 57237, 57299, 57298, 24544, 24550, 24576, 24590, 24592, 24598, 24649, 24652, 24697, 24698, 24699, 24700, 24752, 24759, 24791, 57590, 57599, 24905, 57891, 25136, 57948, 24578, 25365, 58173, 25564, 25585, 25589, 25595, 58378, 58419, 58421, 58423, 58428, 58457, 58460, 58492, 58515, 58545, 58556, 58561, 58577, 58578, 25817, 58601, 58603, 58607, 58619, 25933, 26108, 26134, 26140, 26150, 26156, 26166, 26172, 26188, 58994, 26236, 26266, 26268, 26282, 26284, 26287, 26300, 26352, 26363, 59173, 59205, 59227, 26480, 59427, 26662, 59430, 59453, 59454, 59461, 59558, 26829, 26851, 26854, 26867, 26876, 26897, 26940, 59717, 27104, 59878, 59886, 27117, 59973, 59997, 59999, 60028, 60117, 60133, 60134, 60157, 60161, 60172, 27417, 27441, 27445, 27465, 60245, 27539, 27547, 27609, 27616, 27664, 27685, 27718, 27760, 27795, 27797, 27804, 27813, 27814, 27836, 27837, 27862, 27874, 27878, 60661, 27974, 60796, 28065, 28069, 60885, 28118, 60886, 28134, 28147, 28149, 28150, 60972, 61055, 28336, 61163, 61167, 28425, 61196, 28454, 44741, 61308, 28586, 61375, 28611, 61397, 61478, 61503, 28883, 28891, 61677, 28995, 62037, 29439, 62494, 62618, 29911, 29930, 62700, 30222, 30223, 63026, 30281, 63153, 30417, 30422, 30425, 30428, 30430, 30451, 63290, 63350, 30681, 63462, 63510, 63511, 63515, 63532, 30775, 30782, 30783, 63553, 63557, 63570, 30878, 63659, 63662, 63675, 63714, 63729, 63742, 63755, 31164, 31287, 31379, 64156, 31489, 64277, 64300, 31548, 64429, 64434, 31673, 64480, 64486, 31727, 64507, 31813, 31829, 31862, 64630, 31901, 31974, 32230, 32439, 65292, 32567, 65433, 65458, 65498], 34527: [344, 392, 632, 744, 840, 888, 902, 1144, 1752, 2070, 2139, 2150, 2152, 2168, 2182, 2203, 2211, 2216, 2221, 2227, 2230, 2237, 2278, 2470, 2886, 3352, 3448, 3462, 3542, 3544, 3574, 3912, 3960, 3976, 4112, 4115, 4128, 4160, 4176, 4256, 4317, 4334, 4348, 4405, 4416, 4438, 4504, 4534, 4678, 4680, 4689, 4691, 4725, 4738, 4798, 4832, 4928, 4976, 5000, 5006, 5169, 5184, 5188, 5190, 5192, 5196, 5223, 5241, 5242, 5258, 5265, 5279, 5295, 5346, 5354, 5400, 5469, 5476, 5505, 5514, 5553, 5565, 5672, 5696, 5713, 5734, 5744, 5745, 5758, 5770, 5782, 5784, 5798, 5800, 5832, 5834, 5847, 5952, 5956, 5957, 5965, 5966, 6071, 6174, 6175, 6187, 6200, 6203, 6208, 6216, 6219, 6227, 6236, 6241, 6254, 6256, 6261, 6262, 6281, 6287, 6295, 6300, 6304, 6308, 6312, 6326, 6327, 6332, 6333, 6359, 6369, 6374, 6397, 6464, 6479, 6512, 6534, 6556, 6648, 6720, 6726, 6867, 6880, 6883, 6976, 7041, 7050, 7093, 7095, 7136, 7184, 7236, 7247, 7311, 7488, 7503, 7516, 7517, 7542, 7567, 7643, 7656, 7744, 7747, 7757, 7759, 7760, 7814, 7816, 7939, 7994, 8000, 8015, 8078, 8104, 8151, 8166, 8184, 8233, 8265, 8266, 8381, 8442, 8444, 8446, 8447, 8512, 8516, 8520, 8527, 8533, 8577, 8584, 8608, 8632, 8678, 8696, 8734, 8755, 8768, 8772, 8776, 8783, 8784, 8791, 8813, 8817, 8833, 8842, 8847, 8851, 8867, 8916, 8943, 9003, 9030, 9039, 9117, 9195, 9200, 9206, 9211, 9223, 9237, 9245, 9265, 9280, 9286, 9289, 9295, 9303, 9313, 9354, 9375, 9387, 9425, 9445, 9464, 9500, 9515, 9516, 9540, 9544, 9546, 9551, 9604, 9606, 9608, 9610, 9642, 9647, 9683, 9702, 9720, 9735, 9760, 9766, 9775, 9792, 9840, 9846, 9847, 9853, 9855, 9859, 9875, 9894, 9905, 9912, 9918, 9927, 9936, 9942, 9967, 10048, 10056, 10079, 10099, 10126, 10213, 10265, 10304, 10310, 10311, 10312, 10315, 10317, 10327, 10361, 10374, 10379, 10383, 10385, 10399, 10463, 10475, 10557, 10560, 10564, 10566, 10568, 10575, 10577, 10714, 10716, 10745, 10816, 10840, 10894, 10925, 10929, 10945, 10961, 10968, 10973, 10982, 10989, 11031, 11078, 11085, 11098, 11195, 11229, 11256, 11271, 11280, 11328, 11398, 11495, 11517, 11527, 11552, 11579, 11588, 11590, 11595, 11678, 11737, 11738, 11752, 11765, 11840, 11844, 11846, 11855, 11908, 11910, 11914, 11918, 11959, 12035, 12040, 12075, 12096, 12101, 12102, 12104, 12167, 12168, 12176, 12184, 12200, 12243, 12259, 12264, 12304, 12352, 12367, 12541, 12543, 12566, 12597, 12604, 12608, 12612, 12703, 12868, 12891, 12931, 12932, 12934, 12945, 12966, 13120, 13192, 13194, 13199, 13228, 13329, 13354, 13359, 13376, 13382, 13390, 13391, 13443, 13444, 13448, 13450, 13451, 13454, 13457, 13458, 13467, 13477, 13489, 13491, 13530, 13546, 13548, 13576, 13640, 13656, 13704, 13785, 13847, 13856, 13873, 13883, 13885, 13888, 13893, 13896, 13899, 13903, 13936, 13951, 13954, 13959, 13968, 13982, 13992, 14008, 14035, 14058, 14059, 14103, 14135, 14149, 14154, 14218, 14229, 14307, 14315, 14363, 14383, 14385, 14395, 14400, 14405, 14409, 14411, 14417, 14425, 14429, 14439, 14443, 14448, 14460, 14463, 14472, 14474, 14478, 14479, 14481, 14485, 14511, 14517, 14520, 14523, 14526, 14527, 14567, 14576, 14579, 14584, 14587, 14590, 14639, 14648, 14656, 14660, 14662, 14666, 14679, 14696, 14707, 14735, 14751, 14767, 14881, 14912, 14926, 14927, 14977, 14982, 14984, 15000, 15030, 15033, 15035, 15048, 15064, 15080, 15083, 15096, 15105, 15131, 15143, 15174, 15176, 15177, 15179, 15181, 15197, 15206, 15207, 15238, 15242, 15255, 15292, 15295, 15424, 15568, 15574, 15680, 15704, 15936, 15942, 15960, 16010, 16028, 16044, 16105, 16183, 16192, 16207, 16265, 16267, 16360, 16374, 16402, 16439, 16483, 16516, 16518, 16522, 16523, 16530, 16532, 16545, 16553, 16577, 16605, 16704, 16721, 16778, 16800, 16823, 16837, 17038, 17042, 17062, 17186, 17194, 17213, 17221, 17225, 17264, 17271, 17294, 17322, 17338, 17392, 17399, 17405, 17425, 17431, 17448, 17450, 17454, 17478, 17479, 17482, 17485, 17486, 17487, 17540, 17545, 17546, 17560, 17576, 17578, 17582, 17585, 17649, 17652, 17723, 17737, 17742, 17790, 17802, 17803, 17806, 17807, 17819, 17833, 17837, 17844, 17919, 17961, 17965, 18022, 18023, 18040, 18041, 18043, 18058, 18063, 18070, 18087, 18104, 18168, 18169, 18171, 18175, 18177, 18203, 18240, 18275, 18313, 18315, 18317, 18318, 18319, 18340, 18351, 18431, 18464, 18466, 18474, 18497, 18504, 18507, 18511, 18532, 18542, 18544, 18549, 18558, 18559, 18568, 18570, 18571, 18573, 18574, 18587, 18615, 18647, 18657, 18663, 18664, 18686, 18733, 18746, 18752, 18800, 18830, 18846, 18871, 19008, 19101, 19103, 19114, 19121, 19122, 19153, 19154, 19201, 19243, 19264, 19337, 19348, 19368, 19409, 19575, 19607, 19627, 19686, 19756, 19776, 19838, 19944, 19988, 20016, 20038, 20071, 20100, 20140, 20226, 20247, 20258, 20283, 20321, 20327, 20361, 20362, 20363, 20407, 20442, 20496, 20544, 20571, 20593, 20601, 20603, 20609, 20615, 20619, 20621, 20700, 20725, 20734, 20782, 20865, 20874, 20875, 20902, 20904, 21014, 21080, 21126, 21133, 21292, 21293, 21312, 21318, 21320, 21390, 21419, 21420, 21480, 21550, 21574, 21575, 21577, 21578, 21582, 21640, 21641, 21643, 21646, 21654, 21664, 21721, 21739, 21832, 21834, 21837, 21838, 21894, 21897, 21929, 21990, 21995, 22019, 22033, 22035, 22067, 22069, 22080, 22094, 22101, 22115, 22128, 22129, 22131, 22133, 22159, 22161, 22176, 22214, 22215, 22233, 22235, 22239, 22309, 22336, 22488, 22565, 22567, 22592, 22598, 22602, 22605, 22612, 22622, 22638, 22646, 22647, 22662, 22664, 22680, 22681, 22691, 22695, 22697, 22733, 22751, 22754, 22755, 22756, 22767, 22783, 22809, 22816, 22848, 22856, 22857, 22858, 22859, 22918, 22936, 22944, 22970, 23104, 23116, 23118, 23360, 23374, 23379, 23430, 23432, 23433, 23434, 23533, 23565, 23584, 23600, 23616, 23711, 23734, 23736, 23766, 23769, 23784, 23840, 23872, 23891, 23958, 24019, 24128, 24137, 24140, 24201, 24214, 24273, 24303, 24353, 24384, 24390, 24464, 24497, 24608, 24624, 24646, 24708, 24710, 24715, 24720, 24736, 24745, 24797, 24798, 24875, 24898, 24904, 24914, 24947, 24969, 24970, 25003, 25108, 25158, 25162, 25167, 25231, 25409, 25419, 25423, 25476, 25478, 25510, 25515, 25526, 25558, 25574, 25588, 25599, 25670, 25672, 25673, 25680, 25735, 25851, 25892, 25963, 25991, 25992, 25994, 26006, 26202, 26209, 26212, 26216, 26223, 26224, 26230, 26244, 26246, 26247, 26329, 26354, 26356, 26362, 26366, 26472, 26500, 26502, 26504, 26505, 26584, 26614, 26644, 26646, 26694, 26698, 26702, 26708, 26758, 26760, 26765, 26766, 26767, 26769, 26772, 26776, 26783, 26788, 26790, 26795, 26815, 26818, 26902, 26944, 26950, 27022, 27023, 27200, 27248, 27272, 27274, 27491, 27528, 27529, 27546, 27558, 27574, 27661, 27680, 27712, 27728, 27775, 27777, 27780, 27782, 27783, 27789, 27860, 27876, 27936, 27972, 28038, 28043, 28047, 28115, 28136, 28230, 28236, 28283, 28294, 28297, 28299, 28486, 28552, 28666, 28688, 28710, 28886, 28896, 28992, 28993, 28998, 29013, 29110, 29174, 29179, 29180, 29248, 29254, 29313, 29318, 29344, 29414, 29504, 29510, 29571, 29574, 29577, 29600, 29670, 29760, 29830, 29927, 29996, 30086, 30205, 30210, 30215, 30221, 30233, 30240, 30250, 30254, 30272, 30300, 30310, 30345, 30364, 30374, 30375, 30383, 30408, 30431, 30432, 30462, 30528, 30538, 30598, 30605, 30710, 30717, 30727, 30780, 30784, 30790, 30791, 30794, 30797, 30799, 30800, 30807, 30810, 30817, 30822, 30824, 30834, 30844, 30855, 30864, 30880, 30886, 30888, 30892, 30894, 30902, 30905, 30908, 30915, 30920, 30928, 30934, 30937, 30951, 30967, 30968, 30983, 31040, 31050, 31110, 31158, 31200, 31208, 31210, 31292, 31308, 31366, 31495, 31562, 31592, 31622, 31627, 31670, 31760, 31792, 31814, 31817, 31881, 31883, 31976, 32064, 32134, 32320, 32332, 32392, 32480, 32528, 32532, 32576, 32579, 32580, 32581, 32582, 32585, 32588, 32589, 32629, 32771, 32786, 32800, 32806, 32811, 32836, 32897, 32905, 32907, 32909, 32911, 32928, 32932, 32934, 32938, 32952, 32971, 32985, 33026, 33035, 33090, 33097, 33167, 33190, 33195, 33233, 33250, 33298, 33311, 33313, 33353, 33359, 33383, 33398, 33415, 33416, 33417, 33419, 33422, 33425, 33434, 33438, 33515, 33561, 33579, 33593, 33611, 33613, 33633, 33640, 33666, 33699, 33708, 33720, 33722, 33791, 33804, 33810, 33819, 33828, 33830, 33854, 33862, 33867, 33870, 33879, 33918, 33926, 33933, 33935, 33940, 33944, 33947, 33950, 33961, 33974, 33976, 33981, 34020, 34025, 34027, 34038, 34080, 34127, 34155, 34174, 34175, 34177, 34183, 34189, 34207, 34225, 34239, 34272, 34305, 34326, 34328, 34336, 34344, 34347, 34352, 34368, 34396, 34406, 34426, 34433, 34438, 34439, 34443, 34445, 34447, 34464, 34467, 34470, 34471, 34472, 34500, 34504, 34520, 34521, 34546, 34548, 34554, 34555, 34558, 34561, 34592, 34628, 34657, 34667, 34672, 34674, 34694, 34696, 34699, 34701, 34741, 34749, 34823, 34833, 34863, 34884, 34894, 34898, 34903, 34918, 34920, 34928, 34937, 34953, 34955, 34957, 34962, 34967, 34968, 34970, 34978, 34985, 34989, 34994, 35002, 35004, 35027, 35031, 35046, 35048, 35053, 35067, 35094, 35104, 35112, 35129, 35136, 35142, 35151, 35169, 35184, 35207, 35211, 35217, 35228, 35231, 35232, 35240, 35287, 35316, 35320, 35345, 35346, 35353, 35361, 35363, 35366, 35370, 35375, 35376, 35377, 35392, 35402, 35419, 35442, 35455, 35465, 35466, 35467, 35494, 35522, 35527, 35539, 35549, 35610, 35627, 35628, 35631, 35648, 35649, 35657, 35713, 35718, 35725, 35726, 35752, 35760, 35762, 35766, 35773, 35810, 35824, 35826, 35828, 35831, 35837, 35844, 35849, 35872, 35874, 35876, 35883, 35888, 35891, 35899, 35903, 35904, 35935, 35943, 35947, 35961, 35963, 35974, 35979, 35981, 35998, 36000, 36134, 36139, 36143, 36154, 36157, 36160, 36169, 36175, 36181, 36184, 36185, 36203, 36208, 36220, 36233, 36246, 36258, 36267, 36270, 36277, 36280, 36304, 36313, 36326, 36337, 36424, 36425, 36428, 36464, 36473, 36482, 36487, 36488, 36491, 36494, 36508, 36576, 36648, 36670, 36675, 36680, 36687, 36715, 36718, 36720, 36740, 36742, 36747, 36766, 36782, 36794, 36998, 37137, 37140, 37402, 37446, 37515, 37517, 37522, 37555, 37673, 37696, 37766, 37770, 37805, 37865, 37867, 37914, 37919, 37924, 37935, 37954, 37956, 37958, 37960, 37961, 37962, 37965, 37967, 37991, 37992, 38007, 38011, 38026, 38112, 38113, 38123, 38214, 38216, 38278, 38285, 38372, 38407, 38507, 38534, 38539, 38547, 38581, 38614, 38616, 38618, 38646, 38714, 38726, 38730, 38746, 38760, 38790, 38793, 38798, 38891, 38930, 38935, 38936, 38958, 38968, 38974, 38976, 38982, 38987, 39015, 39023, 39026, 39049, 39050, 39055, 39057, 39069, 39080, 39094, 39138, 39153, 39158, 39166, 39232, 39236, 39240, 39242, 39243, 39247, 39298, 39300, 39302, 39307, 39310, 39473, 39474, 39488, 39497, 39498, 39548, 39558, 39565, 39567, 39634, 39755, 39793, 39812, 39818, 39853, 39992, 40060, 40070, 40073, 40150, 40310, 40314, 40315, 40375, 40428, 40512, 40521, 40584, 40745, 40792, 40861, 40931, 40936, 40976, 41063, 41069, 41092, 41094, 41286, 41290, 41350, 41375, 41438, 41446, 41542, 41545, 41546, 41547, 41581, 41608, 41609, 41611, 41626, 41774, 41798, 41807, 41867, 41927, 41961, 41981, 42023, 42052, 42057, 42061, 42088, 42103, 42110, 42122, 42127, 42145, 42159, 42167, 42231, 42299, 42310, 42314, 42315, 42335, 42374, 42401, 42504, 42531, 42555, 42568, 42600, 42603, 42632, 42635, 42637, 42696, 42726, 42769, 42825, 42888, 42891, 42894, 42933, 43072, 43078, 43082, 43083, 43099, 43112, 43119, 43120, 43131, 43135, 43147, 43155, 43159, 43169, 43201, 43207, 43221, 43243, 43259, 43334, 43336, 43361, 43427, 43451, 43480, 43527, 43544, 43552, 43584, 43632, 43644, 43657, 43737, 43788, 43846, 43857, 43861, 43885, 43908, 43917, 43919, 43953, 43995, 44091, 44102, 44163, 44174, 44262, 44314, 44356, 44358, 44367, 44399, 44400, 44411, 44424, 44433, 44504, 44533, 44535, 44676, 45032, 45124, 45135, 45191, 45193, 45195, 45197, 45364, 45366, 45368, 45382, 45702, 45707, 45715, 45750, 45798, 45894, 45958, 45980, 46006, 46054, 46151, 46155, 46159, 46183, 46212, 46214, 46253, 46298, 46304, 46470, 46475, 46487, 46504, 46614, 46624, 46634, 46637, 46640, 46650, 46656, 46736, 46752, 46765, 46808, 46918, 46922, 46999, 47105, 47106, 47111, 47119, 47142, 47144, 47166, 47173, 47176, 47181, 47203, 47235, 47243, 47256, 47259, 47263, 47272, 47295, 47297, 47304, 47352, 47428, 47430, 47446, 47457, 47462, 47496, 47664, 47680, 47753, 47942, 47965, 47985, 48013, 48040, 48249, 48357, 48452, 48502, 48521, 48614, 48706, 48712, 48719, 48769, 48966, 48988, 49016, 49028, 49030, 49038, 49128, 49168, 49216, 49480, 49482, 49494, 49512, 49693, 49711, 49720, 49722, 49727, 49734, 49741, 49743, 49798, 49834, 49944, 49958, 49964, 49967, 49990, 49992, 49999, 50052, 50055, 50056, 50083, 50120, 50134, 50150, 50153, 50173, 50246, 50249, 50266, 50310, 50312, 50472, 50520, 50521, 50574, 50622, 50746, 50752, 50768, 50783, 50792, 50799, 50800, 50806, 50824, 50830, 50888, 50893, 50895, 50907, 50916, 51033, 51035, 51065, 51080, 51222, 51227, 51268, 51270, 51273, 51320, 51337, 51341, 51352, 51368, 51377, 51383, 51384, 51395, 51417, 51443, 51520, 51524, 51526, 51624, 51784, 51832, 51848, 51940, 52102, 52136, 52232, 52237, 52240, 52256, 52272, 52287, 52292, 52512, 52548, 52616, 52808, 52872, 52873, 52877, 53030, 53062, 53126, 53136, 53152, 53183, 53208, 53275, 53468, 53502, 53516, 53567, 53568, 53647, 53664, 53747, 53752, 53776, 53778, 53792, 53898, 53974, 53990, 54056, 54080, 54084, 54102, 54128, 54150, 54179, 54207, 54255, 54345, 54346, 54404, 54429, 54456, 54509, 54520, 54550, 54580, 54598, 54666, 54669, 54671, 54810, 54877, 54882, 55106, 55114, 55128, 55319, 55328, 55337, 55352, 55358, 55360, 55361, 55363, 55366, 55368, 55369, 55374, 55376, 55386, 55390, 55398, 55399, 55402, 55403, 55406, 55408, 55462, 55464, 55467, 55469, 55471, 55481, 55484, 55512, 55520, 55523, 55527, 55528, 55536, 55584, 55592, 55616, 55620, 55626, 55664, 55803, 55842, 55882, 55988, 56128, 56134, 56196, 56198, 56207, 56224, 56458, 56573, 56577, 56579, 56583, 56584, 56644, 56648, 56655, 56750, 56760, 56792, 56844, 56861, 56896, 56902, 56911, 56964, 56968, 56990, 57152, 57220, 57225, 57316, 57672, 57907, 57920, 57942, 57992, 58080, 58150, 58171, 58182, 58230, 58312, 58407, 58432, 58446, 58511, 58538, 58581, 58583, 58593, 58594, 58694, 58710, 58756, 58888, 58944, 59092, 59192, 59199, 59366, 59382, 59400, 59405, 59409, 59416, 59418, 59419, 59423, 59432, 59447, 59462, 59466, 59480, 59482, 59491, 59494, 59512, 59515, 59529, 59534, 59538, 59543, 59552, 59560, 59604, 59606, 59630, 59631, 59638, 59670, 59675, 59683, 59688, 59816, 59929, 59967, 59968, 59974, 60167, 60730, 60736, 60992, 60995, 61000, 61071, 61152, 61158, 61160, 61248, 61416, 61456, 61487, 61504, 61633, 61660, 61670, 61765, 61768, 61773, 61799, 61834, 61992, 61997, 62013, 62091, 62108, 62138, 62261, 62272, 62289, 62345, 62377, 62438, 62492, 62534, 62537, 62542, 62598, 62602, 62622, 62630, 62632, 62648, 62681, 62699, 62778, 62779, 62907, 63013, 63025, 63032, 63040, 63060, 63088, 63092, 63112, 63128, 63144, 63304, 63370, 63393, 63400, 63491, 63496, 63505, 63552, 63560, 63562, 63566, 63585, 63587, 63588, 63601, 63624, 63627, 63629, 63658, 63672, 63674, 63720, 63728, 63738, 63768, 63808, 63848, 63880, 63910, 63921, 63928, 64064, 64072, 64088, 64134, 64141, 64320, 64576, 64611, 64661, 64693, 64696, 64726, 64744, 64792, 64826, 64832, 64840, 64845, 64889, 64905, 64911, 64942, 65016, 65112, 65412, 65414, 65415, 65439, 65507, 65512], 37043: [620, 752, 848, 864, 1008, 1376, 1465, 1520, 1536, 1632, 1728, 1776, 2368, 2432, 2816, 2944, 3072, 3168, 3200, 3312, 3648, 3712, 3824, 3840, 4080, 4166, 4168, 4205, 4233, 4238, 37068, 4347, 37184, 37190, 4429, 37287, 4541, 4547, 37353, 37376, 4672, 37440, 37473, 4736, 4742, 37513, 37554, 37584, 37677, 37693, 37708, 4992, 4994, 5036, 5053, 38147, 5440, 38218, 5504, 38281, 38291, 5633, 5634, 5635, 5636, 5643, 5641, 38421, 5681, 5683, 38463, 38474, 38505, 5738, 5760, 5769, 5776, 38564, 5807, 5808, 5812, 5831, 5843, 5848, 5880, 5975, 6007, 6030, 6077, 46820, 39197, 39213, 6447, 6455, 6470, 39238, 39265, 39275, 6528, 6529, 39301, 39340, 6591, 39424, 6690, 39494, 39521, 39522, 6784, 39557, 6790, 6817, 39632, 39709, 39749, 6982, 39751, 39750, 39753, 39763, 39773, 7040, 7046, 39815, 7045, 7062, 39919, 39958, 7194, 7237, 40040, 40054, 7373, 40316, 7556, 7632, 7635, 40412, 7654, 7997, 40829, 40934, 8179, 40957, 8192, 40960, 14659, 41164, 8404, 8509, 8513, 8578, 8631, 8643, 41436, 8668, 8721, 8771, 41544, 41551, 8801, 8802, 41593, 8834, 41610, 41617, 8853, 41680, 9090, 9094, 9095, 9098, 9120, 9132, 9146, 9472, 9507, 9541, 9542, 42309, 42316, 9575, 9590, 9605, 9607, 42387, 9634, 42405, 9645, 9687, 42483, 42486, 42495, 42518, 9752, 42519, 9761, 9762, 9763, 42540, 9793, 9797, 9807, 9804, 9817, 9822, 9838, 42606, 42605, 42607, 9861, 42633, 9869, 42638, 9872, 9873, 9874, 9870, 42639, 42677, 42710, 42730, 9962, 10010, 10049, 10051, 10053, 10058, 10062, 10063, 10120, 10195, 10231, 43293, 10538, 10561, 10563, 10567, 43340, 10573, 43375, 10624, 10625, 43395, 10630, 10634, 43398, 43478, 10736, 43505, 10815, 43583, 10821, 10822, 10823, 10826, 10825, 10829, 43599, 10831, 10835, 10850, 10880, 10881, 10882, 10885, 10886, 10887, 10889, 10890, 10934, 10963, 43728, 11050, 11072, 11079, 11095, 11105, 11109, 11136, 11137, 11138, 43904, 11142, 43910, 11157, 11159, 11173, 11175, 43946, 11185, 44076, 11334, 44105, 44107, 11343, 44131, 11392, 44160, 11407, 11416, 44199, 44213, 44246, 44357, 11598, 11599, 44374, 44391, 11632, 44423, 44429, 44496, 8846, 11740, 11837, 44614, 44672, 44679, 44841, 12103, 12111, 12130, 44919, 12160, 12162, 44928, 44935, 45043, 45046, 45126, 45200, 12492, 45264, 12567, 45350, 12623, 12646, 12647, 12663, 12674, 12673, 45450, 12682, 45471, 45478, 12711, 12732, 12733, 12833, 12864, 12870, 45638, 12877, 12879, 45676, 12928, 45698, 12930, 12929, 45701, 12937, 12965, 12967, 45740, 12978, 45776, 45792, 45856, 13184, 13185, 13205, 46005, 13245, 46357, 13632, 46400, 46412, 13696, 13706, 46478, 46477, 13717, 13740, 13802, 46606, 46608, 13845, 46620, 13861, 46652, 46699, 13931, 46703, 13952, 13961, 13962, 13971, 13975, 46745, 13985, 14000, 14007, 14011, 14027, 46799, 46840, 14075, 14122, 14144, 14145, 14146, 14157, 14159, 14177, 14209, 14210, 46980, 46991, 14291, 14671, 47444, 14677, 14689, 14695, 14720, 14721, 47493, 14726, 14727, 14725, 47539, 14809, 14837, 14918, 14920, 47686, 47703, 14976, 47749, 14983, 14981, 14993, 47772, 15009, 47788, 47795, 15038, 47824, 15094, 15168, 47941, 15173, 15191, 15205, 15232, 15233, 15239, 15287, 15432, 15456, 15464, 48261, 15493, 15512, 15647, 15694, 15720, 48516, 48526, 15800, 15845, 16229, 16253, 16261, 16296, 16316, 16357, 16454, 16494, 16521, 16525, 16528, 16592, 16677, 16694, 16710, 16716, 16725, 16774, 16781, 16812, 16826, 16886, 9871, 16944, 16950, 49728, 16960, 16965, 16966, 16972, 49758, 16999, 17001, 49772, 49792, 17024, 49794, 17025, 17026, 17030, 17033, 49796, 49804, 49807, 17045, 17068, 17079, 17178, 17184, 17196, 17200, 17206, 49984, 17216, 17222, 17228, 17240, 50048, 17285, 17289, 17305, 17317, 17324, 17372, 17382, 17404, 42584, 17685, 17699, 17701, 17712, 17718, 50496, 17728, 17733, 17734, 50526, 17792, 50560, 17798, 17799, 17800, 17805, 17848, 17857, 17869, 17871, 42634, 17899, 17904, 17910, 17968, 17974, 23111, 17984, 17990, 17995, 18003, 18010, 18011, 50780, 18012, 50784, 18016, 18027, 18030, 18031, 50816, 18053, 18057, 18064, 50848, 18095, 18096, 18102, 18103, 18128, 18136, 50912, 42687, 18170, 18224, 51012, 18246, 18251, 18250, 51034, 18294, 51076, 51087, 18323, 18422, 18725, 18726, 18742, 18747, 18758, 18775, 18816, 51586, 18822, 18823, 51591, 18857, 18906, 18934, 18977, 18978, 18981, 18998, 18999, 19004, 19013, 19014, 19017, 19029, 19031, 51840, 19072, 19074, 19078, 19093, 19095, 19105, 19106, 19155, 19162, 19181, 51956, 19254, 19269, 19270, 52096, 19328, 19333, 19334, 19344, 19350, 19366, 19377, 19469, 19494, 19500, 19510, 52288, 19520, 19526, 19533, 19542, 19552, 19584, 52352, 19590, 19605, 19611, 52384, 19622, 52412, 19645, 19644, 19663, 19670, 19772, 19782, 19788, 19808, 19824, 19884, 19889, 19920, 20012, 20268, 53056, 20288, 20294, 53120, 20357, 20359, 53132, 20390, 20393, 20397, 53168, 20439, 20444, 20451, 23622, 20586, 20596, 53364, 20598, 20698, 20800, 20870, 21056, 53824, 21065, 53868, 53888, 53890, 21121, 21128, 53900, 53902, 21145, 21157, 54013, 54045, 54048, 21325, 54144, 21378, 54149, 21381, 54156, 21385, 21456, 21488, 21500, 43392, 21827, 21830, 54629, 54656, 54661, 54668, 54670, 21902, 21903, 21936, 21968, 21987, 22030, 22061, 22062, 22070, 22072, 22086, 22110, 54880, 54885, 54892, 22141, 54912, 22147, 54922, 54924, 22163, 22180, 22191, 22225, 22227, 22236, 22237, 55078, 22369, 22381, 22389, 22408, 22413, 22415, 22480, 22526, 22806, 22837, 22844, 22861, 22862, 22912, 55687, 22923, 23021, 55836, 55837, 55872, 23113, 23117, 55909, 23141, 55916, 55936, 23168, 55980, 23272, 23277, 23349, 23366, 56192, 23424, 56194, 56199, 56202, 56204, 56206, 23440, 23465, 56240, 23475, 23535, 56303, 23575, 23625, 23677, 23680, 56448, 56453, 23688, 23689, 56462, 56466, 56485, 23760, 56550, 23829, 56664, 23904, 24022, 24249, 11336, 24288, 24341, 24376, 57216, 24489, 11399, 57558, 57600, 57839, 57964, 57984, 44096, 58245, 58252, 58752, 58759, 58767, 58848, 58854, 58901, 58931, 58933, 58936, 58984, 58988, 59028, 59064, 59088, 59110, 59272, 59320, 59648, 59776, 59826, 59894, 59900, 59926, 59932, 59946, 60019, 60032, 60037, 60053, 60160, 60288, 60338, 60469, 60480, 60534, 60540, 60544, 60552, 60597, 60631, 60646, 60648, 60693, 60712, 60744, 60790, 60830, 60880, 61056, 61312, 61576, 61582, 61592, 61766, 29094, 29250, 62080, 29312, 29321, 62092, 29349, 62230, 29484, 29488, 62280, 62278, 62336, 62348, 29606, 29616, 29692, 29693, 30000, 30016, 62784, 30080, 62848, 62856, 30145, 30209, 30218, 30246, 63029, 63068, 63072, 30312, 30315, 30326, 63104, 30347, 30357, 30358, 63141, 30391, 30399, 30403, 63171, 30406, 30416, 30446, 30460, 30475, 30531, 30540, 30603, 30976, 30998, 31046, 31051, 31104, 63872, 31147, 31206, 31211, 31232, 31302, 31307, 64103, 64108, 64128, 31365, 64140, 31466, 64237, 31488, 31539, 31611, 64384, 31616, 64398, 64426, 31821, 64640, 31878, 31885, 31968, 64838, 32096, 64902, 32224, 32256, 65152, 32553, 65350, 65383, 65388, 65408, 32645, 65445, 65467, 32755]}
-    ddt2 = {0: [0], 13: [5, 6, 8, 9, 10, 11, 12, 15, 80, 96, 144, 14683, 160, 208, 13067, 14696, 14697, 14698, 224, 30981, 14699, 30984, 64998, 46437, 30623, 14741, 14744, 14745, 14746, 14747, 14758, 14760, 14761, 14762, 14763, 62869, 31061, 31064, 31065, 31066, 31067, 13160, 29445, 13163, 31080, 29452, 31081, 31082, 31083, 47368, 47369, 47370, 14806, 768, 47371, 14808, 14809, 14810, 14811, 14821, 14822, 14824, 14825, 14826, 13205, 13210, 13211, 31128, 31129, 31130, 31131, 13224, 13225, 13226, 13227, 31144, 31145, 31146, 31147, 29525, 29528, 29529, 29530, 29531, 29532, 47448, 47449, 47450, 47451, 29541, 29544, 29545, 29546, 45829, 29547, 45830, 45832, 45833, 45834, 45835, 47464, 13272, 47465, 13273, 47466, 13274, 47467, 13275, 13276, 63752, 63753, 63754, 63755, 1280, 31193, 31194, 31195, 13288, 13289, 13290, 13291, 13292, 31208, 31209, 31210, 31211, 29592, 29593, 29594, 29595, 29596, 47512, 47513, 47514, 47515, 29605, 29606, 29608, 29609, 29610, 29611, 47528, 47529, 47530, 47531, 45909, 45910, 45912, 45913, 45914, 45915, 63832, 63833, 63834, 63835, 45925, 45928, 45929, 45930, 62213, 45931, 62216, 63845, 62217, 62218, 62219, 63848, 29656, 63849, 29657, 63850, 29658, 63851, 29659, 29663, 1792, 47576, 47577, 47578, 47579, 29669, 29670, 29672, 29673, 29674, 29675, 47592, 47593, 47594, 47595, 45973, 45974, 45976, 45977, 45978, 45979, 63896, 63897, 63898, 63899, 45989, 45990, 45992, 45993, 45994, 45995, 63912, 63913, 63914, 63915, 62293, 62294, 62312, 62313, 62314, 62315, 46037, 46040, 46041, 46042, 46043, 2304, 63960, 63961, 63964, 46057, 46058, 63976, 63977, 63978, 63979, 62943, 62374, 62377, 62378, 13577, 62441, 62442, 13653, 13654, 13663, 13673, 13674, 29961, 3328, 15768, 13717, 13718, 13720, 13722, 13723, 13727, 13733, 13734, 13736, 13737, 13738, 13739, 13740, 30037, 30038, 30040, 30041, 30042, 30043, 30047, 30053, 30054, 30056, 30057, 30058, 46341, 30059, 46342, 30060, 46345, 13781, 46346, 13782, 46347, 46348, 13784, 13785, 13786, 46351, 13787, 13791, 13797, 13798, 13800, 13801, 13802, 13803, 13804, 30101, 30102, 30104, 30105, 30106, 30107, 30117, 30118, 30120, 30121, 30122, 28752, 12368, 45136, 61520, 28757, 12374, 12373, 28758, 45141, 61526, 61525, 12380, 28764, 45142, 28767, 28768, 12384, 45152, 61536, 12383, 45151, 61535, 61541, 12392, 28777, 12394, 12393, 28778, 28779, 12395, 28776, 45161, 61546, 61545, 45162, 45163, 61551, 12399, 46428, 28783, 46431, 45200, 61584, 28816, 12432, 28821, 12438, 28822, 45208, 45209, 45210, 45211, 12437, 45205, 61590, 45206, 61596, 45212, 45215, 45216, 61600, 28832, 12448, 61599, 28831, 61608, 45224, 28841, 45227, 61611, 12458, 28842, 12457, 45225, 61610, 45226, 28843, 28847, 45231, 12463, 46440, 46442, 62725, 61648, 45264, 12496, 28880, 12501, 12502, 28886, 28885, 61653, 61654, 45269, 61660, 45276, 45270, 61663, 12512, 61664, 45280, 28896, 45279, 28901, 28902, 12511, 12520, 28905, 28906, 28904, 28908, 61673, 45289, 28911, 45290, 12523, 28907, 45291, 61675, 45292, 45295, 61679, 62735, 30172, 30175, 30184, 30185, 30186, 47068, 46492, 46495, 46422, 46507, 62811, 62812, 62815, 62825, 48492, 46549, 46550, 47083, 46556, 13061, 13062, 29446, 13064, 13065, 13066, 29448, 29449, 29450, 29451, 62214, 62220, 45836, 62223, 45839, 13068, 13071, 29455, 46568, 12376, 46569, 12377, 12378, 46571, 32108, 12379, 64997, 13141, 13142, 29526, 62296, 62297, 62298, 62299, 13144, 13145, 13146, 13147, 62300, 45916, 62303, 45919, 13148, 13151, 29535, 13158, 13157, 13161, 13162, 62310, 62316, 62309, 45926, 29542, 45932, 45935, 29548, 29551, 13164, 13167, 62319, 12389, 12390, 62357, 29589, 13206, 62360, 62361, 62362, 62363, 13208, 13209, 29590, 62358, 62364, 45980, 13212, 45983, 62367, 13221, 29599, 13215, 62376, 12396, 13222, 62379, 62380, 62373, 45996, 29612, 29615, 45999, 13228, 62383, 13231, 62876, 62879, 13269, 62422, 29654, 62424, 62425, 62426, 62427, 29653, 13270, 62421, 46038, 46044, 62428, 29660, 62431, 46047, 46053, 46054, 13279, 46056, 62440, 13285, 46059, 62443, 62438, 62437, 13286, 29676, 46060, 46063, 29679, 13295, 62444, 62447, 62891, 30165, 62729, 30166, 12440, 12441, 62730, 12442, 12443, 12444, 15701, 63382, 15702, 12447, 15704, 15705, 12453, 12454, 12456, 14085, 14086, 12459, 14088, 12460, 15717, 14089, 15718, 14091, 62940, 32150, 13573, 13574, 29957, 13576, 29958, 13578, 13579, 62732, 29960, 29963, 62726, 62728, 46344, 29962, 62731, 13580, 29964, 13583, 29967, 32008, 32009, 32010, 15845, 32011, 32012, 15846, 62952, 28760, 28761, 28762, 62955, 28763, 46421, 62805, 62806, 46424, 46425, 46426, 46427, 62808, 62809, 62810, 13656, 13657, 13658, 13659, 13660, 30044, 62821, 62822, 46438, 13669, 13670, 13672, 46443, 46444, 62828, 13675, 46447, 13676, 62824, 46441, 62826, 62827, 62831, 13679, 30063, 63391, 28773, 28774, 46485, 46486, 62870, 46488, 46489, 46490, 46491, 62872, 62873, 62874, 62875, 28780, 13721, 30108, 13724, 30111, 46501, 46502, 62885, 46504, 46505, 46506, 30123, 30124, 46508, 62886, 30127, 46511, 62888, 62889, 62890, 62892, 62895, 13743, 12504, 12505, 12506, 12507, 12508, 62933, 15765, 62934, 46552, 46553, 30170, 30171, 46554, 46555, 30168, 30169, 62936, 62937, 62938, 62939, 13788, 30181, 30182, 46565, 46566, 62949, 62950, 62953, 30188, 46572, 62954, 46575, 13807, 62956, 15769, 46570, 30187, 15771, 15770, 30191, 62959, 15772, 32152, 12517, 12518, 12521, 12522, 12524, 15781, 15782, 12527, 15785, 15786, 15787, 14229, 14230, 14168, 14169, 28824, 14170, 28825, 28826, 14172, 28827, 28828, 32085, 14175, 32086, 32088, 32089, 32090, 32091, 14181, 32092, 14182, 28837, 28838, 14184, 32095, 28840, 14186, 30469, 30470, 30472, 28844, 32101, 32102, 32104, 32105, 32106, 48389, 46853, 46854, 63237, 63238, 48390, 14090, 63243, 46860, 63244, 14092, 14095, 30473, 30476, 30479, 30474, 30475, 48392, 48393, 46863, 63247, 15829, 48394, 15830, 48395, 48396, 15832, 15833, 15834, 15835, 45144, 15836, 45145, 45146, 14239, 45147, 45148, 30549, 14165, 14166, 30552, 30553, 30554, 30555, 46936, 46937, 46938, 46939, 63320, 63321, 63322, 63323, 14171, 30565, 30566, 46949, 46950, 30569, 30570, 63334, 46956, 30572, 63338, 63340, 14185, 14188, 14187, 46954, 46955, 30575, 46959, 63343, 14191, 15848, 15849, 45157, 15850, 45158, 28895, 45160, 15852, 63381, 30613, 30614, 30616, 30617, 30618, 47000, 47001, 47002, 47003, 63384, 63385, 63386, 63387, 45164, 47004, 30629, 30630, 47013, 47014, 14249, 14250, 30634, 14252, 30636, 47020, 14255, 30639, 47023, 63404, 63407, 45167, 14232, 14233, 28888, 14234, 28889, 14235, 14236, 28890, 28891, 28892, 47061, 32149, 14293, 14296, 14297, 14298, 63451, 47067, 30680, 30681, 30682, 47064, 47065, 47066, 14299, 30683, 30693, 30694, 47077, 47078, 30697, 14314, 30698, 63468, 47084, 30700, 14319, 63471, 30703, 14316, 32153, 14315, 32154, 32155, 14245, 47087, 32156, 14246, 14248, 14251, 32165, 32166, 32172, 30550, 30556, 30559, 48470, 45221, 45222, 30568, 30571, 46856, 45228, 48485, 46857, 48486, 46858, 14294, 46859, 63749, 63750, 47366, 47365, 30985, 30986, 30987, 14598, 14597, 30982, 14604, 30988, 63756, 14607, 30991, 63759, 47372, 47375, 48495, 14303, 14309, 61528, 14310, 61529, 61530, 14312, 61531, 14313, 61532, 63829, 63830, 47446, 14680, 14681, 14682, 47445, 14678, 14677, 31062, 14684, 31068, 63836, 14687, 31071, 63839, 47452, 47455, 47461, 47462, 31078, 31077, 14694, 14693, 63846, 14700, 63852, 47468, 14703, 63855, 47471, 31084, 31087, 32230, 61542, 61544, 32236, 47509, 63894, 47510, 63893, 14742, 31125, 61547, 14748, 31132, 31126, 31135, 14751, 63900, 47519, 47516, 63903, 61548, 63910, 47526, 31141, 31142, 47525, 63909, 14764, 63916, 14757, 63919, 14767, 31151, 31148, 47532, 47535, 45272, 45273, 30619, 45274, 30620, 45275, 63957, 47574, 47573, 31192, 63958, 63962, 63963, 14805, 31190, 31189, 31196, 14812, 14815, 31199, 63967, 47580, 63973, 63974, 47583, 47589, 31206, 31205, 47590, 63980, 14828, 31212, 14831, 63983, 47599, 31215, 47596, 14827, 45285, 45286, 30632, 30633, 45288, 30635, 48549, 48550, 48556, 46933, 46934, 61589, 61592, 61593, 61594, 46940, 61595, 46943, 61605, 61606, 46952, 46953, 61609, 63240, 61612, 64869, 63241, 30677, 64870, 63242, 30678, 61615, 64876, 30684, 30687, 30696, 30699, 48613, 48614, 48620, 48623, 46997, 46998, 61656, 61657, 61658, 61659, 47007, 61669, 61670, 47016, 47017, 61672, 47018, 47019, 61674, 61676, 64933, 64934, 64940, 64943, 63317, 63318, 63324, 63327, 63333, 63336, 63337, 63339, 47062, 64773, 32005, 32006, 64776, 64777, 64778, 64779, 64780, 64774, 15621, 64783, 15624, 15625, 15626, 15627, 15628, 15631, 32015, 48399, 64981, 47071, 64982, 64984, 64985, 64986, 64987, 14300, 47080, 47081, 47082, 64853, 64854, 48469, 64856, 64857, 48474, 48475, 48476, 64858, 64859, 48479, 64860, 48472, 48473, 15706, 15707, 15708, 15711, 64863, 48488, 48489, 48490, 48491, 64872, 64873, 15720, 15721, 15722, 15723, 64874, 64875, 32107, 15724, 15727, 32111, 64879, 65004, 48533, 48534, 15766, 48536, 48537, 48538, 48539, 48540, 64917, 64918, 32159, 48543, 64920, 64921, 64922, 64923, 64924, 64927, 15775, 15784, 32169, 32170, 48555, 64937, 64938, 64939, 32168, 64936, 48552, 48553, 48554, 32171, 15788, 32175, 15791, 48559, 63388, 32213, 32214, 48597, 32216, 32217, 32218, 32219, 32220, 48598, 48600, 32223, 48601, 48602, 48603, 48604, 48607, 64988, 15839, 64991, 32232, 32233, 32234, 32235, 48616, 48617, 48618, 48619, 65000, 65001, 65002, 65003, 15851, 15855, 32239, 63397, 65007, 63398, 63400, 63401, 63402, 63403, 63445, 63446, 14600, 14601, 63448, 14602, 63449, 14603, 63450, 63452, 63455, 32229, 15622, 63461, 63462, 63464, 63465, 63466, 63467, 46559], 161: [32768, 32773, 32774, 32776, 32777, 32778, 32779, 32780, 32783, 64345, 32848, 32853, 32854, 32856, 32857, 32858, 32859, 32860, 45608, 32863, 32864, 32869, 32870, 32872, 32873, 32874, 32875, 32876, 32879, 45621, 32601, 32976, 32981, 32982, 32607, 32984, 32985, 32986, 32987, 32988, 32991, 32992, 32997, 32998, 33000, 33001, 33002, 33003, 33004, 65176, 33007, 32616, 13101, 13102, 45685, 32665, 33280, 517, 33285, 518, 520, 33289, 33291, 524, 523, 526, 33295, 525, 527, 549, 33318, 33320, 553, 33322, 33324, 557, 33328, 565, 33334, 33336, 569, 33338, 33340, 573, 33360, 597, 598, 33366, 33368, 601, 33370, 600, 604, 605, 606, 607, 33372, 603, 33371, 33375, 613, 33381, 33385, 617, 33387, 621, 33391, 33392, 629, 630, 33398, 632, 633, 33402, 635, 33404, 637, 638, 639, 636, 33400, 45720, 33424, 661, 33429, 665, 33435, 33433, 669, 33439, 677, 33446, 33445, 33448, 33449, 681, 33451, 33452, 685, 33450, 33455, 45733, 725, 726, 33494, 33496, 728, 33498, 731, 732, 733, 734, 735, 33500, 741, 13173, 745, 749, 13178, 33536, 33541, 33542, 33544, 33545, 33546, 33547, 33548, 33551, 33568, 33574, 33576, 33578, 33580, 33584, 33590, 33592, 33594, 33596, 33616, 33621, 33622, 33624, 33625, 33626, 33627, 33628, 33631, 33632, 33637, 33638, 33640, 33641, 33642, 33643, 33644, 33647, 33648, 33654, 33656, 33658, 33660, 33680, 33685, 33686, 33688, 33689, 33690, 33691, 33692, 33695, 33696, 33701, 33705, 33707, 33711, 33744, 33749, 33750, 33752, 33753, 33754, 33755, 33756, 33759, 33765, 33766, 33768, 33769, 33770, 33771, 33772, 33775, 33792, 1029, 1030, 33797, 1032, 33801, 33803, 1036, 1037, 1038, 1039, 1035, 33807, 1061, 33830, 33832, 1065, 33834, 33836, 1069, 33840, 1077, 33846, 33848, 1081, 33850, 33852, 1085, 33872, 1109, 33878, 1110, 33880, 1112, 33882, 1115, 1116, 1117, 1118, 1119, 1113, 33884, 33881, 33883, 33887, 1125, 33893, 33897, 1129, 33899, 1133, 33903, 33904, 1141, 1142, 33910, 1144, 1145, 33912, 1147, 1148, 1149, 1150, 1151, 33914, 33916, 33936, 1173, 33941, 1177, 33945, 33947, 1181, 33951, 1189, 33957, 33958, 33960, 33961, 1193, 33963, 33962, 1197, 33964, 33967, 65368, 65370, 65371, 1237, 1238, 34006, 34008, 1240, 34010, 1243, 1244, 1245, 1246, 1247, 34012, 1253, 1257, 1261, 65389, 1317, 65391, 1321, 1325, 1333, 1337, 1341, 65400, 1365, 1366, 1368, 1371, 1372, 1373, 1374, 1375, 1397, 1398, 1400, 1401, 1403, 1404, 1405, 1406, 1407, 45870, 1445, 1449, 1453, 45882, 1493, 1494, 1496, 1499, 1500, 1501, 1502, 1503, 1509, 65429, 1513, 1517, 65434, 65439, 65446, 45918, 13354, 13360, 45946, 34560, 34565, 34566, 34568, 34569, 34570, 34571, 34572, 34575, 34592, 1829, 34598, 34600, 1833, 34602, 34604, 1837, 34608, 1845, 34614, 34616, 1849, 34618, 34620, 1853, 34640, 1877, 1878, 34646, 1880, 34648, 34650, 1883, 1884, 1885, 1886, 1887, 34656, 34652, 34651, 34655, 34661, 34662, 34664, 34665, 34666, 34667, 34668, 34671, 34672, 1909, 1910, 34678, 1912, 1913, 34680, 34682, 1915, 34684, 1918, 1917, 1916, 1919, 34704, 34709, 34710, 34712, 34713, 34714, 34715, 34716, 34720, 34719, 1957, 34725, 34729, 1961, 34731, 1965, 34735, 34768, 2005, 2006, 34773, 2008, 34777, 34778, 2011, 2012, 2013, 2014, 2015, 34779, 34776, 34783, 34780, 2021, 34789, 34790, 34792, 2025, 34793, 34794, 34795, 2029, 34796, 34799, 34821, 2054, 2056, 34825, 34827, 2060, 2062, 34831, 2085, 2089, 2093, 34864, 2101, 2105, 2109, 34896, 34901, 2133, 34902, 34904, 2137, 34906, 2139, 34905, 2141, 34907, 34911, 2143, 34908, 2149, 34917, 2153, 34921, 34923, 2157, 34927, 34928, 2165, 34934, 34936, 34938, 2171, 34940, 2173, 2175, 13461, 34960, 34965, 2197, 2201, 34969, 34971, 2205, 34975, 2213, 34981, 2217, 34985, 34987, 2221, 34991, 2261, 35030, 35032, 35034, 2267, 35036, 2269, 2271, 13477, 35072, 35077, 35078, 35080, 35081, 35082, 35083, 35084, 35087, 35157, 35158, 35160, 35161, 35162, 35163, 35164, 35167, 35173, 35174, 35176, 35177, 35178, 35179, 35180, 35183, 35285, 35286, 35288, 35289, 35290, 35291, 35292, 35295, 35301, 35302, 35304, 35305, 35306, 35307, 35308, 35311, 35328, 2565, 35333, 35337, 35339, 2571, 2573, 2575, 35343, 48296, 2597, 35366, 35368, 2601, 35370, 35372, 2605, 2613, 35382, 35384, 2617, 35386, 35388, 2621, 2645, 2646, 35414, 35416, 2649, 35418, 2648, 2652, 2653, 2654, 35420, 2661, 2665, 2669, 2677, 2678, 35446, 2680, 2681, 35450, 35448, 2684, 2685, 2686, 35452, 2709, 2713, 2717, 2725, 35494, 35496, 2729, 35498, 46133, 35500, 2733, 35542, 2774, 35544, 2776, 35546, 2780, 35548, 2782, 2789, 2793, 2797, 35584, 35589, 35593, 35595, 35599, 35616, 35622, 35624, 35626, 35628, 35632, 35638, 35640, 35642, 35644, 46165, 35664, 35669, 35670, 35672, 35673, 35674, 35675, 35676, 35679, 35680, 35685, 35689, 35691, 35695, 35696, 35702, 35704, 35706, 35708, 35728, 35733, 35734, 35736, 35737, 35738, 35739, 35740, 35743, 35744, 35749, 35753, 35755, 35759, 35792, 35814, 35816, 35818, 35820, 46200, 35840, 3077, 35845, 35849, 3083, 35851, 3085, 35855, 3087, 3109, 35878, 35880, 3113, 35882, 35884, 3117, 3125, 35894, 35896, 3129, 35898, 35900, 3133, 3157, 3158, 35926, 35928, 3160, 3161, 35930, 3164, 3165, 3166, 35932, 3173, 3177, 3181, 3189, 35958, 3190, 3192, 3193, 35960, 35962, 35964, 3196, 3198, 3197, 3221, 3225, 3229, 3237, 36006, 36008, 3241, 36010, 36012, 3245, 3286, 36054, 3288, 36056, 36058, 3292, 36060, 3294, 3301, 3305, 3309, 36096, 36101, 36102, 36104, 36105, 36106, 36107, 36108, 36111, 36181, 36182, 36184, 36185, 36186, 36187, 36188, 36191, 36197, 36198, 36200, 36201, 36202, 36203, 36204, 36207, 36309, 36310, 36312, 36313, 36314, 36315, 36316, 36319, 36325, 36326, 36328, 36329, 36330, 36331, 36332, 36335, 36357, 3590, 3592, 36361, 36363, 3596, 3598, 36367, 3621, 3625, 3629, 36400, 3637, 3641, 3645, 36432, 36437, 3669, 36438, 36440, 3673, 36442, 3675, 36443, 3677, 36441, 36447, 3679, 36444, 3685, 36453, 3689, 36457, 36459, 3693, 36463, 36464, 3701, 36470, 36472, 36474, 3707, 36476, 3709, 3711, 36496, 36501, 3733, 3737, 36505, 36507, 3741, 36511, 3749, 36517, 3753, 36521, 36523, 3757, 36527, 3797, 36566, 36568, 36570, 3803, 36572, 3805, 3807, 36608, 36613, 36617, 36619, 36623, 36640, 36646, 36648, 36650, 36652, 36656, 36662, 36664, 36666, 36668, 36688, 36693, 36694, 36696, 36697, 36698, 36699, 36700, 36703, 36704, 36709, 36713, 36715, 36719, 36720, 36726, 36728, 36730, 36732, 36752, 36757, 36758, 36760, 36761, 36762, 36763, 36764, 36767, 36768, 36773, 36777, 36779, 36783, 33365, 36816, 33369, 36838, 36840, 36842, 36844, 4096, 4101, 4102, 4104, 4105, 4106, 4107, 4108, 4111, 4176, 4181, 4182, 4184, 4185, 4186, 4187, 4188, 4191, 4192, 4197, 4198, 4200, 4201, 4202, 4203, 4204, 4207, 4304, 4309, 4310, 4312, 4313, 4314, 4315, 4316, 4319, 4320, 4325, 4326, 4328, 4329, 4330, 4331, 4332, 4335, 4608, 37381, 37385, 37387, 37391, 4646, 4648, 4650, 4652, 4656, 4662, 4664, 4666, 4668, 4688, 4693, 37462, 37464, 4697, 37466, 4699, 37468, 4703, 4709, 4713, 4715, 4719, 4720, 37494, 37496, 37498, 37500, 4752, 4757, 4761, 4763, 4767, 4773, 4774, 4776, 4777, 4778, 4779, 4780, 4783, 37590, 37592, 37594, 37596, 4864, 37637, 37638, 4869, 37640, 37641, 37642, 37643, 37644, 4873, 4875, 37647, 4879, 4896, 4902, 4904, 4906, 4908, 4912, 4918, 4920, 4922, 4924, 4944, 4949, 4950, 4952, 4953, 4954, 4955, 4956, 4959, 4960, 4965, 4966, 4968, 4969, 4970, 4971, 4972, 4975, 4976, 4982, 4984, 4986, 4988, 5008, 5013, 5014, 5016, 5017, 5018, 5019, 5020, 5023, 5024, 5029, 5033, 5035, 5039, 5072, 5077, 5078, 5080, 5081, 5082, 5083, 5084, 5087, 5093, 5094, 5096, 5097, 5098, 5099, 5100, 5103, 5120, 37893, 37897, 37899, 37903, 5158, 5160, 5162, 5164, 5168, 5174, 5176, 5178, 5180, 5200, 5205, 37974, 37976, 5209, 37978, 5211, 37980, 5215, 5221, 5225, 5227, 5231, 5232, 38006, 38008, 38010, 38012, 5264, 5269, 5273, 5275, 5279, 5285, 5286, 5288, 5289, 5290, 5291, 5292, 5295, 38102, 38104, 38106, 38108, 5888, 5893, 38661, 38662, 38664, 5897, 38665, 5899, 38666, 38667, 38668, 5903, 38671, 5920, 5926, 5928, 5930, 5932, 5936, 5942, 5944, 5946, 5948, 5968, 5973, 5974, 5976, 5977, 5978, 5979, 5980, 5983, 5984, 5989, 5990, 5992, 5993, 5994, 5995, 5996, 5999, 6000, 6006, 6008, 6010, 6012, 6032, 6037, 6038, 6040, 6041, 6042, 6043, 6044, 6047, 6048, 6053, 6057, 6059, 6063, 6096, 6101, 6102, 6104, 6105, 6106, 6107, 6108, 6111, 6117, 6118, 6120, 6121, 6122, 6123, 6124, 6127, 38917, 38921, 38923, 38927, 6192, 6224, 6229, 38998, 39000, 6233, 39002, 6235, 39004, 6239, 6245, 6249, 6251, 6255, 6256, 39030, 39032, 39034, 39036, 6288, 6293, 6297, 6299, 6303, 6309, 6313, 6315, 6319, 39126, 39128, 39130, 39132, 6400, 39173, 39174, 39176, 39177, 39178, 39179, 39180, 39183, 6485, 6486, 6488, 6489, 6490, 6491, 6492, 6495, 6501, 6502, 6504, 6505, 6506, 6507, 6508, 6511, 46885, 46895, 46902, 33877, 46904, 6613, 6614, 6616, 6617, 6618, 6619, 6620, 6623, 46907, 6629, 6630, 6632, 6633, 6634, 6635, 6636, 6639, 6656, 39429, 39433, 39435, 39439, 6694, 6696, 6698, 6700, 6710, 6712, 6714, 6716, 39510, 39512, 39514, 39516, 39542, 39544, 39546, 39548, 46942, 6822, 6824, 6826, 6828, 39638, 39640, 39642, 39644, 6912, 6917, 6921, 46966, 6923, 6927, 46968, 46969, 46970, 6944, 6950, 6952, 6954, 6956, 6960, 6966, 6968, 6970, 6972, 6992, 6997, 6998, 7000, 7001, 7002, 7003, 7004, 7007, 7008, 7013, 7017, 7019, 7023, 7024, 7030, 7032, 7034, 7036, 7056, 7061, 7062, 7064, 7065, 7066, 7067, 7068, 7071, 7072, 7077, 7081, 7083, 7087, 47005, 7120, 7142, 7144, 7146, 7148, 7168, 39941, 39945, 39947, 39951, 7206, 7208, 7210, 7212, 7222, 7224, 7226, 7228, 40022, 40024, 40026, 40028, 40054, 40056, 40058, 40060, 7334, 7336, 7338, 7340, 40150, 40152, 40154, 40156, 7424, 40197, 40198, 40200, 40201, 40202, 40203, 40204, 40207, 7509, 7510, 7512, 7513, 7514, 7515, 7516, 7519, 7525, 7526, 7528, 7529, 7530, 7531, 7532, 7535, 7637, 7638, 7640, 7641, 7642, 7643, 7644, 7647, 7653, 7654, 7656, 7657, 7658, 7659, 7660, 7663, 40453, 40457, 40459, 40463, 7728, 7760, 7765, 40534, 40536, 7769, 40538, 7771, 40540, 7775, 7781, 7785, 7787, 7791, 7792, 40566, 40568, 40570, 40572, 7824, 7829, 7833, 7835, 7839, 7845, 7849, 7851, 7855, 40662, 40664, 40666, 40668, 47162, 7936, 7941, 7945, 7947, 7951, 7968, 7974, 7976, 7978, 7980, 7984, 7990, 7992, 7994, 7996, 8016, 8021, 8022, 8024, 8025, 8026, 8027, 8028, 8031, 8032, 8037, 8041, 8043, 8047, 8048, 8054, 8056, 8058, 8060, 8080, 8085, 8086, 8088, 8089, 8090, 8091, 8092, 8095, 8096, 8101, 8105, 8107, 8111, 8144, 8166, 8168, 8170, 8172, 40960, 40965, 40966, 40968, 40969, 40970, 40971, 40972, 40975, 47224, 41040, 41045, 41046, 41048, 41049, 41050, 41051, 41052, 41055, 41056, 41061, 41062, 41064, 41065, 41066, 41067, 41068, 41071, 41168, 41173, 41174, 41176, 41177, 41178, 41179, 41180, 41183, 41184, 41189, 41190, 41192, 41193, 41194, 41195, 41196, 41199, 41472, 41477, 41481, 41483, 41487, 41510, 41512, 41514, 41516, 41520, 41526, 41528, 41530, 41532, 41552, 41557, 41558, 41560, 41561, 41562, 41563, 41564, 41567, 41573, 41577, 41579, 41583, 41584, 41590, 41592, 41594, 41596, 41616, 41621, 41625, 41627, 41631, 41637, 41638, 41640, 41641, 41642, 41643, 41644, 41647, 41686, 41688, 41690, 41692, 41728, 41733, 41734, 41736, 41737, 41738, 41739, 41740, 41743, 41760, 41766, 41768, 41770, 41772, 41776, 41782, 41784, 41786, 41788, 41808, 41813, 41814, 41816, 41817, 41818, 41819, 41820, 41823, 41824, 41829, 41830, 41832, 41833, 41834, 41835, 41836, 41839, 41840, 41846, 41848, 41850, 41852, 41872, 41877, 41878, 41880, 41881, 41882, 41883, 41884, 41887, 41888, 41893, 41897, 41899, 41903, 41936, 41941, 41942, 41944, 41945, 41946, 41947, 41948, 41951, 41957, 41958, 41960, 41961, 41962, 41963, 41964, 41967, 41984, 41989, 41993, 41995, 41999, 42022, 42024, 42026, 42028, 42032, 42038, 42040, 42042, 42044, 42064, 42069, 42070, 42072, 42073, 42074, 42075, 42076, 42079, 42085, 42089, 42091, 42095, 42096, 42102, 42104, 42106, 42108, 42128, 42133, 42137, 42139, 42143, 42149, 42150, 42152, 42153, 42154, 42155, 42156, 42159, 42198, 42200, 42202, 42204, 14933, 42752, 42757, 42758, 42760, 42761, 42762, 42763, 42764, 42767, 42784, 42790, 42792, 42794, 42796, 42800, 42806, 42808, 42810, 42812, 42832, 42837, 42838, 42840, 42841, 42842, 42843, 42844, 42847, 42848, 42853, 42854, 42856, 42857, 42858, 42859, 42860, 42863, 42864, 42870, 42872, 42874, 42876, 42896, 42901, 42902, 42904, 42905, 42906, 42907, 42908, 42911, 42912, 42917, 42921, 42923, 42927, 42960, 42965, 42966, 42968, 42969, 42970, 42971, 42972, 42975, 42981, 42982, 42984, 42985, 42986, 42987, 42988, 42991, 43013, 43017, 43019, 43023, 43056, 43088, 43093, 43094, 43096, 43097, 43098, 43099, 43100, 43103, 43109, 43113, 43115, 43119, 43120, 43126, 43128, 43130, 43132, 43152, 43157, 43161, 43163, 43167, 43173, 43177, 43179, 43183, 43222, 43224, 43226, 43228, 34645, 34649, 43264, 43269, 43270, 43272, 43273, 43274, 43275, 43276, 43279, 43349, 43350, 43352, 43353, 43354, 43355, 43356, 43359, 43365, 43366, 43368, 43369, 43370, 43371, 43372, 43375, 43477, 43478, 43480, 43481, 43482, 43483, 43484, 43487, 43493, 43494, 43496, 43497, 43498, 43499, 43500, 43503, 43520, 43525, 43529, 43531, 43535, 43558, 43560, 43562, 43564, 43574, 43576, 43578, 43580, 43606, 43608, 43610, 43612, 43638, 43640, 43642, 43644, 15189, 43686, 43688, 43690, 43692, 15205, 43734, 43736, 43738, 43740, 43776, 43781, 43785, 43787, 43791, 47781, 43808, 43814, 43816, 43818, 43820, 43824, 43830, 43832, 43834, 43836, 43856, 43861, 43862, 43864, 43865, 43866, 43867, 43868, 43871, 43872, 43877, 43881, 43883, 34774, 43887, 43888, 43894, 43896, 43898, 43900, 43920, 43925, 43926, 43928, 43929, 43930, 43931, 43932, 43935, 43936, 43941, 43945, 43947, 43951, 43984, 15257, 44006, 44008, 44010, 44012, 44032, 44037, 44041, 44043, 44047, 15269, 44070, 44072, 44074, 44076, 44086, 44088, 44090, 44092, 44118, 44120, 44122, 44124, 44150, 44152, 44154, 44156, 44198, 44200, 44202, 44204, 44246, 44248, 44250, 44252, 44288, 44293, 44294, 44296, 44297, 44298, 44299, 44300, 44303, 44373, 44374, 44376, 44377, 44378, 44379, 44380, 44383, 44389, 44390, 44392, 44393, 44394, 44395, 44396, 44399, 47912, 47914, 47915, 44501, 44502, 44504, 44505, 44506, 44507, 44508, 44511, 44517, 44518, 44520, 44521, 44522, 44523, 44524, 44527, 44549, 44553, 44555, 44559, 44592, 44624, 44629, 44630, 44632, 44633, 44634, 44635, 44636, 44639, 44645, 44649, 44651, 44655, 44656, 44662, 44664, 44666, 44668, 44688, 47960, 44693, 44697, 44699, 44703, 44709, 47964, 44713, 44715, 44719, 44758, 44760, 44762, 44764, 47976, 44800, 44805, 44809, 44811, 44815, 44832, 44838, 44840, 44842, 47990, 44844, 44848, 47992, 44854, 44856, 47993, 44858, 44860, 44880, 44885, 44886, 44888, 44889, 44890, 44891, 44892, 44895, 44896, 44901, 44905, 44907, 44911, 44912, 44918, 44920, 44922, 44924, 44944, 44949, 44950, 44952, 44953, 44954, 44955, 44956, 44959, 44960, 44965, 44969, 44971, 44975, 48022, 45008, 45030, 45032, 45034, 45036, 48029, 12288, 12293, 12294, 12296, 12297, 12298, 12299, 12300, 12303, 48037, 12325, 12326, 45093, 12328, 45094, 12330, 12331, 45099, 12332, 12334, 45102, 12333, 12335, 45098, 45100, 45101, 45109, 12342, 45110, 12344, 12341, 45112, 12347, 12348, 12349, 12350, 45117, 12351, 45119, 45114, 45115, 45116, 45118, 12381, 12382, 45150, 12405, 45174, 12406, 12408, 12409, 12410, 12411, 12412, 45180, 45182, 12414, 12413, 12415, 45178, 45179, 45181, 45183, 45214, 45213, 12446, 12445, 45229, 12462, 45230, 12461, 45277, 12509, 12526, 45294, 12800, 45573, 45574, 45577, 45578, 45579, 45582, 45583, 45605, 12837, 12838, 12840, 45606, 12842, 45611, 45612, 12845, 45614, 45613, 12848, 45615, 12847, 12843, 12844, 12853, 45622, 12854, 45624, 12856, 45626, 12858, 12860, 12861, 12862, 12863, 45630, 12859, 45627, 45628, 45629, 45631, 12880, 45653, 12886, 12885, 45656, 45654, 45658, 45659, 45660, 12890, 45662, 12895, 12894, 45661, 12891, 45663, 45669, 45670, 12901, 45672, 12905, 12907, 45676, 45677, 45678, 45679, 12912, 12911, 45675, 12917, 45686, 12918, 12920, 45688, 45690, 12922, 45692, 12925, 12926, 12927, 45694, 12923, 12924, 45691, 45695, 45693, 12944, 12949, 12950, 45717, 45718, 12953, 45722, 45723, 12954, 45725, 45726, 12959, 12958, 45727, 12955, 45724, 12965, 12966, 45734, 45736, 12968, 12969, 12971, 45740, 45741, 45742, 12974, 12972, 45743, 45739, 12975, 45782, 45784, 45786, 45788, 13029, 45797, 13030, 13032, 13034, 45803, 13035, 13037, 45805, 45807, 13039, 13036, 13056, 45837, 45838, 13088, 13093, 45861, 13094, 13096, 45864, 13098, 13099, 45866, 45867, 45862, 13100, 45868, 45869, 13103, 13104, 45871, 13109, 45877, 45878, 45880, 13110, 13112, 13115, 45883, 45884, 13114, 13116, 13119, 13117, 13118, 45886, 45885, 45887, 13136, 64346, 13149, 13150, 13152, 45917, 45934, 13168, 45933, 45941, 45942, 13174, 13176, 13177, 45944, 13179, 45945, 45947, 45949, 13181, 13183, 13180, 45948, 45951, 45950, 13182, 13200, 48214, 13213, 13214, 13216, 45982, 45981, 45997, 45998, 13230, 13264, 13277, 46045, 13280, 46061, 13293, 13294, 46062, 13312, 46085, 46086, 46089, 46090, 46091, 46094, 46095, 13349, 13350, 46118, 13352, 46120, 46117, 13355, 46123, 13357, 13356, 46124, 46126, 13359, 46127, 46125, 13358, 13365, 46134, 13366, 13368, 46136, 46138, 13371, 13370, 13372, 13374, 13375, 13373, 46142, 46139, 46140, 46143, 46141, 13392, 13397, 13398, 46166, 46168, 13401, 46170, 13402, 46172, 46173, 13406, 46174, 46175, 13403, 46171, 13407, 13413, 46181, 46182, 46184, 13417, 13419, 46187, 46188, 46189, 46191, 46190, 13423, 13424, 13429, 13430, 46198, 13432, 46197, 46202, 13435, 13434, 13437, 13438, 13439, 46206, 13436, 46203, 46205, 46207, 46204, 13456, 46229, 13462, 46230, 46232, 13465, 13466, 46234, 13467, 46237, 13470, 46238, 46239, 46236, 13471, 46235, 46245, 13478, 46246, 13480, 46248, 13481, 13483, 46252, 46253, 46254, 13487, 46255, 13484, 13486, 46251, 46294, 46296, 46298, 46300, 46309, 13541, 13542, 13544, 13546, 13547, 46315, 46317, 13549, 13551, 46319, 13548, 13605, 13606, 46374, 13608, 46373, 46376, 46379, 13612, 46380, 46381, 13615, 46382, 46383, 13611, 13613, 13614, 13621, 46389, 46390, 13624, 46392, 46394, 13627, 46395, 46396, 46397, 13622, 13626, 13628, 13629, 13630, 46399, 46398, 13631, 46430, 13662, 46454, 13686, 13688, 46456, 46458, 13690, 46460, 13692, 13694, 46462, 46494, 13726, 13741, 46509, 13806, 46574, 14080, 46861, 46862, 14112, 14117, 14118, 46886, 14120, 46888, 14122, 14123, 14124, 46891, 14125, 14126, 14128, 14127, 46890, 46892, 46893, 14133, 14134, 46894, 14136, 46901, 46906, 14139, 46908, 14138, 46910, 14140, 14141, 14142, 46909, 14143, 46911, 14160, 14173, 14174, 14176, 46941, 46957, 46958, 14192, 46965, 14197, 14198, 14200, 14201, 14202, 14203, 46972, 46973, 14204, 46974, 14205, 14207, 14206, 46975, 46971, 14224, 14237, 14238, 14240, 47006, 47021, 47022, 14254, 14253, 14288, 14301, 47069, 14304, 14317, 47086, 14318, 47085, 14336, 47109, 47110, 47113, 47114, 47115, 47118, 47119, 14373, 14374, 47141, 14376, 14378, 14379, 14380, 47149, 14381, 14383, 47151, 47147, 14389, 47158, 14390, 14392, 47157, 14394, 14395, 47163, 14397, 14398, 14399, 61478, 14396, 47167, 47165, 47166, 14422, 47190, 47192, 14426, 47194, 47196, 47198, 14430, 47206, 47208, 47212, 61487, 47214, 47221, 47222, 14454, 14453, 14456, 14458, 47227, 47228, 14461, 14462, 14459, 14463, 47226, 14460, 47229, 47231, 47230, 47254, 14486, 47256, 47258, 61496, 14490, 47260, 47262, 14494, 47270, 47272, 47276, 47278, 47318, 47320, 47322, 47324, 14565, 14566, 47333, 14568, 14570, 14571, 14572, 47341, 14573, 14575, 47343, 47339, 14592, 61557, 61561, 61562, 61563, 47621, 47622, 47625, 47626, 47627, 47630, 47631, 14886, 47654, 14888, 47656, 47660, 14892, 14894, 47662, 14896, 47670, 14902, 14904, 47672, 14906, 47674, 14908, 47676, 14910, 47678, 14928, 47701, 14934, 47702, 47704, 14937, 14938, 47706, 47708, 47709, 14942, 47710, 14939, 47711, 14943, 47707, 47717, 14949, 14953, 14955, 47723, 47725, 14959, 47727, 14960, 14966, 47734, 47736, 14970, 47738, 47740, 47742, 14974, 14992, 14997, 14998, 47766, 47765, 15001, 15002, 47770, 15003, 47773, 15006, 47774, 47775, 47771, 15007, 15013, 47782, 15014, 15016, 47784, 15017, 47787, 15019, 47788, 47789, 47791, 15022, 15020, 47790, 15023, 47830, 47832, 47834, 47836, 15104, 15109, 47877, 47878, 47880, 15113, 47881, 15115, 47884, 47883, 47886, 47887, 47885, 15119, 15136, 15141, 47910, 15142, 15144, 47909, 15146, 15147, 47916, 15148, 47918, 15151, 15152, 47919, 15150, 15149, 47917, 47925, 47926, 15158, 47928, 15160, 15162, 47930, 47931, 47932, 15157, 15163, 15164, 47934, 47933, 15167, 15166, 15165, 47935, 15184, 47957, 15190, 47958, 15192, 15193, 15194, 15195, 15196, 15197, 15198, 47961, 15200, 47965, 47962, 47963, 47966, 15199, 47974, 47967, 47973, 15209, 47978, 15211, 47980, 47981, 47982, 47983, 15216, 15215, 47979, 15221, 47989, 15222, 15224, 15225, 15226, 47994, 47995, 47997, 15230, 47998, 15227, 15229, 15228, 15231, 47996, 47999, 15248, 48021, 15254, 15253, 15256, 48024, 15258, 15259, 15260, 15261, 15262, 48027, 15264, 48030, 48026, 15263, 48028, 48031, 48038, 15270, 15272, 15273, 15274, 15275, 15276, 48045, 15278, 48044, 48046, 48047, 48043, 48042, 15279, 15312, 15317, 48085, 48089, 15321, 15325, 48093, 15328, 15333, 15334, 48102, 48101, 15338, 15339, 48107, 48109, 15342, 48111, 15341, 15343, 48110, 48106, 48133, 48134, 48137, 48138, 48139, 48142, 48143, 15398, 48166, 15400, 48168, 15404, 48172, 48174, 15406, 15408, 48182, 15414, 15416, 48184, 15418, 48186, 15420, 48188, 15422, 48190, 15440, 15445, 15446, 48213, 48216, 15449, 15450, 48218, 48219, 48221, 15454, 15455, 48222, 48223, 15451, 48220, 15461, 48229, 15465, 15467, 48235, 48237, 48239, 15472, 15471, 48246, 15478, 48248, 15482, 48250, 48252, 15486, 48254, 15504, 48277, 15510, 15509, 48278, 15513, 15514, 48282, 48283, 48285, 48286, 15519, 15518, 15515, 48287, 48293, 15526, 15525, 15528, 15529, 48294, 15531, 15532, 48300, 48302, 15534, 48301, 48303, 15535, 48299, 48342, 48344, 48346, 48348, 15616, 48698, 12346, 15872, 48645, 48646, 48649, 48650, 48651, 48654, 48655, 15909, 15910, 48677, 15912, 15914, 15915, 15916, 15917, 48685, 48687, 15919, 48683, 15925, 48694, 15926, 15928, 48693, 15930, 48699, 15931, 15933, 15934, 15935, 15932, 48701, 48703, 48702, 15958, 48726, 48728, 48730, 15962, 48732, 15966, 48734, 48742, 48744, 48748, 48750, 48757, 15989, 48758, 15992, 15990, 15994, 48763, 48764, 15995, 15998, 15997, 15999, 48760, 48762, 15996, 48767, 48765, 48766, 16022, 48790, 48792, 16026, 48794, 48796, 48798, 16030, 48806, 48808, 48812, 48814, 16219, 48854, 48856, 48858, 48860, 16101, 16102, 48869, 16104, 16106, 16107, 16108, 16109, 48877, 48879, 16111, 48875, 16229, 16128, 16133, 48902, 48901, 48904, 48905, 16137, 48907, 16139, 48908, 48909, 16143, 48911, 48910, 16160, 16165, 48934, 16166, 16168, 48936, 16170, 16171, 48940, 48941, 48942, 16173, 16176, 16172, 16174, 16175, 48943, 48949, 48950, 16182, 48952, 16184, 48954, 16186, 16187, 16181, 48956, 16189, 16190, 48959, 16188, 16191, 48958, 48957, 16246, 16208, 29273, 48981, 48982, 16214, 16213, 16217, 48986, 48984, 48987, 16216, 48990, 16218, 16224, 16220, 16223, 16221, 16222, 48988, 48998, 48991, 16252, 16233, 49000, 16235, 49004, 49005, 49006, 49007, 16240, 49003, 49002, 16239, 16245, 49014, 49013, 49016, 49017, 49018, 49019, 16249, 16250, 16248, 16251, 49020, 16253, 16254, 49022, 49021, 49023, 16255, 16272, 49045, 16278, 49046, 49048, 16280, 49050, 49051, 16284, 16285, 49054, 16287, 16288, 16282, 16286, 16283, 49053, 49052, 49062, 16294, 16296, 16297, 16298, 16299, 16300, 49069, 16302, 49071, 49070, 49068, 49066, 16303, 49067, 16336, 16341, 49109, 16345, 49113, 16349, 49117, 16352, 16357, 16358, 49126, 16277, 49125, 16362, 16363, 49130, 49133, 16366, 16367, 16365, 49135, 49131, 49134, 16281, 49152, 49157, 49158, 49160, 49161, 49162, 49163, 49164, 49167, 16293, 49232, 49237, 49238, 49240, 49241, 49242, 49243, 49244, 49247, 49248, 49253, 49254, 49256, 49257, 49258, 49259, 49260, 49263, 29337, 49360, 49365, 49366, 49368, 49369, 49370, 49371, 49372, 49375, 49376, 49381, 49382, 49384, 49385, 49386, 49387, 49388, 49391, 48933, 48938, 48939, 49664, 49696, 48955, 49702, 49704, 49706, 49708, 49712, 49718, 49720, 49722, 49724, 49744, 49749, 49753, 49755, 49759, 49760, 49765, 49769, 49771, 49775, 49776, 49782, 49784, 49786, 49788, 49808, 49813, 49817, 49819, 49823, 49824, 49829, 49833, 49835, 49839, 48985, 48989, 49888, 49894, 49896, 49898, 49900, 48997, 49920, 49925, 49929, 49931, 49935, 49952, 49958, 49960, 49962, 49964, 49968, 49974, 49976, 49978, 49980, 62037, 50000, 50005, 50006, 50008, 50009, 50010, 50011, 50012, 62043, 50015, 50016, 50021, 50022, 50024, 50025, 50026, 50027, 50028, 50031, 50032, 50038, 50040, 50042, 50044, 50064, 50069, 50070, 50072, 50073, 50074, 50075, 50076, 62056, 50079, 50080, 50085, 50086, 50088, 50089, 50090, 50091, 50092, 50095, 62060, 50128, 50133, 50134, 50136, 50137, 50138, 50139, 50140, 50143, 50144, 50149, 50150, 50152, 50153, 50154, 50155, 50156, 50159, 50176, 49055, 50208, 50214, 50216, 50218, 50220, 50224, 50230, 49061, 50232, 50234, 50236, 49064, 50256, 50261, 50265, 50267, 50271, 50272, 50277, 50281, 50283, 50287, 50288, 50294, 50296, 50298, 50300, 62101, 50320, 50325, 50329, 50331, 62107, 50335, 50336, 50341, 50345, 50347, 50351, 50400, 50406, 50408, 50410, 50412, 50944, 50949, 50953, 50955, 50959, 50976, 50982, 50984, 50986, 50988, 50992, 50998, 51000, 51002, 51004, 51024, 51029, 51030, 51032, 51033, 51034, 51035, 51036, 51039, 51040, 51045, 51046, 51048, 51049, 51050, 51051, 51052, 51055, 51056, 51062, 51064, 51066, 51068, 51088, 51093, 51094, 51096, 51097, 51098, 51099, 51100, 51103, 51104, 51109, 51110, 51112, 51113, 51114, 51115, 51116, 51119, 51152, 51157, 51158, 51160, 51161, 51162, 51163, 51164, 51167, 51168, 51173, 51174, 51176, 51177, 51178, 51179, 51180, 51183, 51200, 51232, 51238, 51240, 51242, 51244, 51248, 51254, 51256, 51258, 51260, 51280, 51296, 62301, 51318, 51320, 51322, 51324, 51344, 51360, 62317, 51430, 51432, 51434, 51436, 62328, 51456, 51536, 51541, 51542, 51544, 51545, 51546, 51547, 51548, 51551, 51552, 29785, 51557, 51558, 51560, 51561, 51562, 51563, 51564, 51567, 51664, 51669, 51670, 51672, 51673, 51674, 51675, 51676, 51679, 51680, 51685, 51686, 51688, 51689, 51690, 51691, 51692, 51695, 51744, 51760, 51792, 51797, 51801, 51803, 51807, 51808, 51813, 51817, 51819, 51823, 51824, 51856, 51861, 51865, 51867, 51871, 51872, 29849, 51877, 51881, 51883, 51887, 51936, 29866, 51968, 51973, 51977, 51979, 51983, 52000, 52006, 52008, 52010, 52012, 52016, 52022, 52024, 52026, 52028, 52048, 52053, 52054, 52056, 52057, 52058, 52059, 52060, 52063, 52064, 52069, 52073, 52075, 52079, 52080, 52086, 52088, 52090, 52092, 52112, 52117, 52118, 52120, 52121, 52122, 52123, 52124, 52127, 52128, 52133, 52134, 52136, 52137, 52138, 52139, 52140, 52143, 52176, 52192, 52256, 52272, 52304, 52309, 52313, 52315, 52319, 52320, 52325, 52329, 52331, 52335, 52336, 52368, 52373, 52377, 52379, 52383, 52384, 52389, 52393, 52395, 52399, 52448, 52480, 52560, 52565, 52566, 52568, 52569, 52570, 52571, 52572, 52575, 52576, 62554, 52581, 52582, 52584, 52585, 52586, 52587, 52588, 52591, 62565, 62566, 52688, 52693, 52694, 52696, 52697, 52698, 52699, 52700, 52703, 52704, 52709, 52710, 52712, 52713, 52714, 52715, 52716, 52719, 52736, 52768, 52774, 52776, 52778, 52780, 52784, 52790, 52792, 52794, 52796, 52816, 52832, 52854, 52856, 52858, 52860, 52880, 52896, 62629, 62630, 52966, 52968, 52970, 52972, 52992, 52997, 53001, 53003, 53007, 53024, 53030, 53032, 53034, 53036, 53040, 53046, 53048, 53050, 53052, 53072, 53077, 53078, 53080, 53081, 53082, 53083, 53084, 53087, 53088, 53093, 53097, 53099, 53103, 53104, 53110, 53112, 53114, 53116, 53136, 53141, 53142, 53144, 53145, 53146, 53147, 53148, 53151, 53152, 53157, 53158, 53160, 53161, 53162, 53163, 53164, 53167, 53200, 53216, 53248, 53253, 53254, 53256, 53257, 53258, 53259, 53260, 53263, 53328, 53333, 53334, 53336, 53337, 53338, 53339, 53340, 53343, 53344, 53349, 53350, 53352, 53353, 53354, 53355, 53356, 53359, 53456, 53461, 53462, 53464, 53465, 53466, 53467, 53468, 53471, 53472, 53477, 53478, 53480, 53481, 53482, 53483, 53484, 53487, 53760, 21024, 53798, 53800, 53802, 53804, 53808, 21040, 53814, 53816, 53818, 53820, 21072, 53840, 53845, 53849, 53851, 53855, 21088, 53861, 53865, 53867, 53871, 53872, 21104, 53878, 53880, 53882, 53884, 21136, 53904, 53909, 53913, 53915, 53919, 21152, 53925, 53929, 53931, 53935, 21216, 53990, 53992, 53994, 53996, 54016, 54021, 54025, 54027, 54031, 54048, 54054, 54056, 54058, 54060, 54064, 54070, 54072, 54074, 54076, 54096, 21328, 54101, 54102, 54104, 54105, 54106, 54107, 54108, 54111, 21344, 54112, 54117, 54118, 54120, 54121, 54122, 54123, 54124, 54127, 54128, 54134, 54136, 54138, 54140, 54160, 54165, 54166, 54168, 54169, 54170, 54171, 54172, 54175, 54176, 54181, 54182, 54184, 54185, 54186, 54187, 54188, 54191, 21456, 54224, 54229, 54230, 54232, 54233, 54234, 54235, 54236, 54239, 21472, 54240, 54245, 54246, 54248, 54249, 54250, 54251, 54252, 54255, 54272, 21536, 54310, 54312, 54314, 54316, 54320, 21552, 54326, 54328, 54330, 54332, 21584, 54352, 54357, 54361, 54363, 54367, 21600, 54373, 54377, 54379, 54383, 54384, 21616, 54390, 54392, 54394, 54396, 21648, 54416, 54421, 54425, 54427, 54431, 21664, 54437, 54441, 54443, 54447, 21728, 54502, 54504, 54506, 54508, 55040, 55045, 55049, 55051, 55055, 55072, 55078, 55080, 55082, 55084, 55088, 55094, 55096, 55098, 55100, 22352, 55120, 55125, 55126, 55128, 55129, 55130, 55131, 55132, 55135, 22368, 55136, 55141, 55142, 55144, 55145, 55146, 55147, 55148, 55151, 55152, 55158, 55160, 55162, 55164, 30506, 55184, 55189, 55190, 55192, 55193, 55194, 55195, 55196, 55199, 55200, 55205, 55206, 55208, 55209, 55210, 55211, 55212, 55215, 22480, 55248, 55253, 55254, 55256, 55257, 55258, 55259, 55260, 55263, 55264, 22496, 55269, 55270, 55272, 55273, 55274, 55275, 55276, 55279, 55296, 22560, 55334, 55336, 55338, 55340, 22576, 55350, 55352, 55354, 55356, 22608, 22624, 55414, 55416, 55418, 55420, 22672, 22688, 55526, 55528, 55530, 55532, 55552, 22864, 55637, 55638, 55640, 55641, 55642, 55643, 55644, 55647, 22880, 55653, 55654, 55656, 55657, 55658, 55659, 55660, 55663, 22992, 55765, 55766, 55768, 55769, 55770, 55771, 55772, 55775, 23008, 55781, 55782, 55784, 55785, 55786, 55787, 55788, 55791, 23072, 55856, 23088, 23120, 55888, 55893, 55897, 55899, 55903, 23136, 55909, 55913, 55915, 55919, 55920, 23152, 23184, 55952, 55957, 55961, 55963, 55967, 23200, 55973, 55977, 55979, 55983, 23264, 56064, 56069, 56073, 56075, 56079, 56096, 56102, 56104, 56106, 56108, 56112, 56118, 56120, 56122, 56124, 56144, 56149, 56150, 56152, 56153, 56154, 56155, 56156, 56159, 56160, 56165, 56169, 56171, 56175, 56176, 56182, 56184, 56186, 56188, 63274, 56208, 56213, 56214, 56216, 56217, 56218, 56219, 56220, 56223, 56224, 56229, 63279, 56230, 56232, 56233, 56234, 56235, 56236, 56239, 56272, 63288, 56288, 23584, 56368, 23600, 23632, 56400, 56405, 56409, 56411, 56415, 23648, 56421, 56425, 56427, 56431, 56432, 23664, 23696, 56464, 56469, 56473, 56475, 56479, 23712, 56485, 56489, 56491, 56495, 23776, 56576, 23888, 56661, 56662, 56664, 56665, 56666, 56667, 56668, 56671, 23904, 56677, 56678, 56680, 56681, 56682, 56683, 56684, 56687, 24016, 56789, 56790, 56792, 56793, 56794, 56795, 56796, 56799, 24032, 56805, 56806, 56808, 56809, 56810, 56811, 56812, 56815, 56832, 24096, 56870, 56872, 56874, 56876, 24112, 56886, 56888, 56890, 56892, 24144, 24160, 56950, 56952, 56954, 56956, 24208, 24224, 57062, 57064, 57066, 57068, 57088, 57093, 57097, 57099, 57103, 57120, 57126, 57128, 57130, 57132, 57136, 57142, 57144, 57146, 57148, 57168, 57173, 57174, 57176, 57177, 57178, 57179, 57180, 57183, 57184, 57189, 57193, 57195, 57199, 57200, 57206, 57208, 57210, 57212, 57232, 57237, 57238, 57240, 57241, 57242, 57243, 57244, 57247, 57248, 57253, 57254, 57256, 57257, 57258, 57259, 57260, 57263, 57296, 57312, 24576, 24581, 24582, 24584, 24585, 24586, 24587, 24588, 24591, 24656, 24661, 24662, 24664, 24665, 24666, 24667, 24668, 24671, 24672, 24677, 24678, 24680, 24681, 24682, 24683, 24684, 24687, 24784, 24789, 24790, 24792, 24793, 24794, 24795, 24796, 24799, 24800, 24805, 24806, 24808, 24809, 24810, 24811, 24812, 24815, 63576, 25088, 25120, 25126, 25128, 25130, 25132, 25136, 25142, 25144, 25146, 25148, 25168, 25173, 25177, 25179, 25183, 25184, 25189, 25193, 25195, 25199, 25200, 25206, 25208, 25210, 25212, 25232, 25237, 25241, 25243, 25247, 25248, 25253, 25257, 25259, 25263, 63640, 25312, 25318, 25320, 25322, 25324, 25344, 25349, 25353, 25355, 25359, 25376, 25382, 25384, 25386, 25388, 25392, 25398, 25400, 25402, 25404, 25424, 25429, 25430, 25432, 25433, 25434, 25435, 25436, 25439, 25440, 25445, 25446, 25448, 25449, 25450, 25451, 25452, 25455, 25456, 25462, 25464, 25466, 25468, 25488, 25493, 25494, 25496, 25497, 25498, 25499, 25500, 25503, 25504, 25509, 25510, 25512, 25513, 25514, 25515, 25516, 25519, 25552, 25557, 25558, 25560, 25561, 25562, 25563, 25564, 25567, 25568, 25573, 25574, 25576, 25577, 25578, 25579, 25580, 25583, 25600, 25632, 25638, 25640, 25642, 25644, 25648, 25654, 25656, 25658, 25660, 25680, 25685, 25689, 25691, 25695, 25696, 25701, 25705, 25707, 25711, 25712, 25718, 25720, 25722, 25724, 25744, 25749, 25753, 25755, 25759, 25760, 25765, 25769, 25771, 25775, 25824, 25830, 25832, 25834, 25836, 26368, 26373, 26377, 26379, 26383, 26400, 26406, 26408, 26410, 26412, 26416, 26422, 26424, 26426, 26428, 26448, 26453, 26454, 26456, 26457, 26458, 26459, 26460, 26463, 26464, 26469, 26470, 26472, 26473, 26474, 26475, 26476, 26479, 26480, 26486, 26488, 26490, 26492, 26512, 26517, 26518, 26520, 26521, 26522, 26523, 26524, 26527, 26528, 26533, 26534, 26536, 26537, 26538, 26539, 26540, 26543, 26576, 26581, 26582, 26584, 26585, 26586, 26587, 26588, 26591, 26592, 26597, 26598, 26600, 26601, 26602, 26603, 26604, 26607, 26624, 26656, 26662, 26664, 26666, 26668, 26672, 26678, 26680, 26682, 26684, 26704, 26720, 26742, 26744, 26746, 26748, 26768, 26784, 26854, 26856, 26858, 26860, 26880, 26960, 26965, 26966, 26968, 26969, 26970, 26971, 26972, 26975, 26976, 26981, 26982, 26984, 26985, 26986, 26987, 26988, 26991, 27088, 27093, 27094, 27096, 27097, 27098, 27099, 27100, 27103, 27104, 27109, 27110, 27112, 27113, 27114, 27115, 27116, 27119, 27168, 27184, 27216, 27221, 27225, 27227, 27231, 27232, 27237, 27241, 27243, 27247, 27248, 27280, 27285, 27289, 27291, 27295, 27296, 27301, 27305, 27307, 27311, 27360, 27392, 27397, 27401, 27403, 27407, 27424, 27430, 27432, 27434, 27436, 27440, 27446, 27448, 27450, 27452, 27472, 27477, 27478, 27480, 27481, 27482, 27483, 27484, 27487, 27488, 27493, 27497, 27499, 27503, 27504, 27510, 27512, 27514, 27516, 27536, 27541, 27542, 27544, 27545, 27546, 27547, 27548, 27551, 27552, 27557, 27558, 27560, 27561, 27562, 27563, 27564, 27567, 27600, 27616, 27680, 27696, 27728, 27733, 27737, 27739, 27743, 27744, 27749, 27753, 27755, 27759, 27760, 27792, 27797, 31577, 27801, 27803, 27807, 27808, 27813, 27817, 27819, 27823, 31589, 27872, 27904, 64166, 27984, 27989, 27990, 27992, 27993, 27994, 27995, 27996, 27999, 28000, 28005, 28006, 28008, 28009, 28010, 28011, 28012, 28015, 28112, 28117, 28118, 28120, 28121, 28122, 28123, 28124, 28127, 28128, 28133, 28134, 28136, 28137, 28138, 28139, 28140, 28143, 28160, 28192, 28198, 28200, 28202, 28204, 28208, 28214, 28216, 28218, 28220, 28240, 28256, 28278, 28280, 28282, 28284, 28304, 28320, 28390, 28392, 28394, 28396, 28416, 28421, 28425, 28427, 28431, 28448, 28454, 28456, 28458, 28460, 28464, 28470, 28472, 28474, 28476, 28496, 28501, 28502, 28504, 28505, 28506, 28507, 28508, 28511, 28512, 28517, 28521, 28523, 28527, 28528, 28534, 28536, 28538, 28540, 28560, 28565, 28566, 28568, 28569, 28570, 28571, 28572, 28575, 28576, 28581, 28582, 28584, 28585, 28586, 28587, 28588, 28591, 28624, 28640, 28672, 28677, 28678, 28680, 28681, 28682, 28683, 28684, 28687, 28709, 28710, 61477, 61480, 28712, 28714, 28715, 61483, 28716, 28718, 28719, 61486, 28717, 61482, 61484, 61485, 61493, 28726, 61494, 28725, 28728, 28730, 28731, 28732, 28733, 28734, 61501, 28735, 61503, 61498, 61499, 61500, 61502, 28765, 28766, 61533, 61534, 28789, 61558, 28790, 61560, 28792, 28794, 28793, 28796, 61564, 61566, 28798, 61565, 28797, 61567, 28795, 28799, 64344, 61597, 61598, 28829, 28830, 64347, 28845, 28846, 61614, 61613, 28893, 61661, 28910, 61678, 48040, 64364, 64365, 64367, 64405, 64408, 64410, 64411, 29184, 29190, 61958, 29194, 61962, 29198, 61966, 61984, 61989, 61990, 29222, 61992, 29224, 29226, 61995, 29228, 61996, 61998, 61997, 62000, 29232, 61999, 62005, 62006, 29238, 29240, 62008, 62010, 29242, 62012, 62013, 62014, 62015, 62011, 29244, 29264, 62032, 29269, 62038, 29270, 62040, 29272, 62042, 29275, 62044, 62045, 62046, 62047, 62048, 29278, 29276, 29279, 29277, 62053, 29285, 29286, 29288, 29289, 62054, 62059, 29291, 29292, 29294, 29293, 62064, 29295, 62061, 62063, 62062, 62069, 62070, 29296, 62074, 62075, 62077, 62078, 62079, 29328, 62096, 29333, 29334, 62102, 29336, 62104, 62106, 29339, 29340, 29341, 62109, 29343, 62111, 62110, 62112, 62108, 29342, 29349, 62117, 62118, 29350, 62120, 29353, 29355, 29356, 29357, 29358, 29359, 62123, 29352, 29354, 62124, 62126, 62125, 62127, 62176, 62181, 62187, 62189, 62191, 29440, 62221, 29453, 29454, 62222, 29472, 62245, 62246, 29478, 29480, 62248, 29482, 62251, 62252, 62253, 62254, 62255, 29488, 29484, 62250, 62261, 29494, 62262, 62264, 29496, 62266, 62267, 29498, 62268, 62270, 62271, 62269, 29500, 62288, 29520, 29533, 29534, 62304, 62302, 29536, 29550, 29549, 62318, 62325, 62326, 29558, 29560, 29552, 62330, 29562, 29564, 62333, 62331, 62335, 62334, 62332, 62329, 29584, 29597, 29598, 62365, 62366, 29600, 29613, 29614, 62382, 62381, 62416, 29648, 62429, 62432, 62445, 62446, 29696, 29702, 62470, 29706, 62474, 62478, 29710, 62496, 62501, 29734, 62502, 29736, 62504, 29738, 62507, 62508, 62509, 62510, 62511, 62512, 29744, 29740, 62517, 29750, 62518, 62520, 29752, 29754, 62523, 29756, 62524, 62526, 62527, 62525, 62522, 29776, 62544, 29781, 29782, 62549, 62552, 29784, 62550, 29787, 62555, 62556, 29788, 62559, 62560, 29791, 29789, 29790, 62557, 29797, 62558, 29798, 29800, 29801, 62568, 29803, 29804, 29805, 29806, 29807, 62576, 62571, 62575, 62572, 62573, 62581, 62574, 29808, 62582, 62586, 62587, 62589, 62590, 62591, 29840, 62608, 62613, 29846, 29845, 29848, 62616, 62618, 29851, 29852, 62619, 62614, 29853, 29854, 62623, 62624, 62620, 62621, 62622, 29855, 29861, 29864, 29865, 29862, 29867, 29868, 29869, 29870, 29871, 62635, 62632, 62639, 62636, 62637, 62638, 62688, 62693, 62699, 62701, 62703, 29989, 29990, 62757, 29992, 62758, 62760, 62763, 29996, 29997, 29998, 29999, 62764, 62767, 29995, 62766, 62765, 30005, 62773, 62774, 30008, 62776, 62778, 30011, 30012, 62779, 30006, 30010, 62780, 30014, 30013, 62783, 62781, 62782, 30015, 30046, 62814, 30070, 62838, 30072, 62840, 62842, 30074, 62844, 30076, 30078, 62846, 30110, 62878, 62893, 30125, 62958, 30190, 45096, 45103, 30464, 30477, 30478, 63245, 63246, 30496, 30501, 30502, 63269, 63270, 63272, 30504, 63275, 63276, 63277, 30509, 30510, 30511, 30507, 30512, 30508, 63278, 30517, 63286, 30518, 30520, 63285, 63290, 30523, 30524, 63293, 30522, 30527, 63295, 30526, 30525, 63291, 63292, 63294, 30544, 63312, 45149, 63325, 63326, 63328, 30560, 30558, 30557, 30573, 30574, 30576, 63342, 63341, 63349, 63350, 30582, 30584, 63352, 30586, 63353, 63356, 30588, 63358, 63359, 63357, 30590, 63354, 63355, 30608, 63389, 63390, 30624, 30621, 30622, 30637, 30638, 63405, 63406, 45173, 30672, 63440, 45176, 63453, 63456, 45177, 30702, 63470, 63469, 30726, 63494, 30730, 63498, 30734, 63502, 63520, 63525, 63531, 63533, 63535, 63536, 30768, 63541, 63542, 63546, 63547, 63549, 63550, 63551, 63568, 30800, 30805, 63574, 30806, 30808, 30809, 63578, 30811, 63580, 30812, 30814, 30815, 63584, 63582, 30821, 63590, 30822, 63592, 30824, 30825, 30827, 30828, 63596, 30830, 30831, 30832, 63598, 63605, 63606, 63610, 63611, 63613, 63614, 63615, 63632, 30864, 30869, 63638, 30870, 30872, 30873, 63642, 30875, 63644, 30876, 30878, 30879, 63648, 63646, 30885, 30886, 63654, 63656, 30888, 30889, 30891, 30892, 63660, 30894, 30895, 63662, 63717, 63723, 63725, 63727, 65112, 30976, 63824, 63840, 63952, 63968, 31232, 31238, 64006, 64010, 31242, 31246, 64014, 64032, 64038, 31270, 31272, 64040, 31274, 64044, 31276, 64046, 64048, 31286, 64054, 64056, 31288, 31290, 64058, 64060, 31292, 64062, 64080, 64085, 64086, 31317, 64090, 31323, 64091, 64093, 31325, 31327, 64096, 64095, 64094, 31333, 64101, 31339, 64107, 31341, 64109, 31343, 64112, 64111, 64118, 64122, 64126, 64144, 31381, 64150, 64149, 64154, 31387, 64155, 64157, 31389, 31391, 64160, 64159, 64158, 31397, 64165, 31398, 31400, 64168, 31402, 31403, 64171, 31405, 64173, 31407, 64175, 64172, 64174, 31404, 64224, 31488, 64261, 31494, 64262, 64264, 64265, 31493, 64267, 31500, 64268, 31496, 31499, 31501, 31503, 31497, 31502, 64271, 64269, 64270, 31520, 64293, 64294, 31526, 64296, 31528, 64298, 64299, 31532, 64301, 64302, 31530, 31536, 64303, 64300, 64309, 64310, 31542, 31544, 64312, 31546, 64315, 64316, 31548, 64318, 64319, 64317, 64314, 31568, 64341, 64342, 31573, 31574, 31576, 31578, 31579, 31580, 64349, 31581, 64348, 31584, 31583, 31582, 64350, 64351, 64357, 64358, 31590, 31592, 31593, 64360, 31595, 31596, 31597, 31598, 31599, 64363, 64366, 64362, 31594, 31600, 64373, 64374, 31606, 31608, 64376, 31610, 64377, 64379, 64381, 31612, 64383, 64380, 64382, 64378, 31632, 31637, 64406, 31638, 31640, 31641, 31642, 31643, 31644, 31645, 64412, 64413, 64414, 64415, 31646, 31648, 31647, 31653, 31654, 64421, 31656, 31657, 31658, 64427, 31660, 31661, 64422, 31663, 64424, 64426, 64430, 31659, 31662, 64428, 64429, 64431, 31696, 64469, 64473, 64477, 64485, 31718, 64486, 31720, 64490, 64491, 31724, 31722, 64494, 64495, 64493, 31744, 31750, 64518, 64522, 31754, 31758, 64526, 64544, 31782, 64550, 64552, 31784, 31786, 31788, 64556, 64558, 64560, 64566, 31798, 31800, 64568, 64570, 31802, 64572, 31804, 64574, 64592, 31829, 64598, 64597, 64602, 31835, 64603, 31837, 64605, 64607, 64608, 31839, 64606, 31845, 64613, 64619, 31851, 31853, 64621, 31855, 64624, 64623, 64630, 12846, 64634, 64638, 64656, 31893, 64662, 64661, 64666, 31899, 64667, 31901, 64669, 64671, 64672, 31903, 64670, 64677, 31909, 64678, 31910, 64680, 31912, 31915, 31916, 31917, 64683, 31919, 64686, 31914, 64684, 64687, 64685, 64736, 32000, 12889, 64848, 64864, 64976, 64992, 65030, 32262, 32266, 65034, 32270, 65038, 65056, 65061, 65067, 65069, 65071, 32304, 65072, 65077, 65078, 65082, 65083, 65085, 65086, 65087, 65104, 32336, 32341, 32342, 65110, 32344, 32345, 65114, 32347, 32348, 65116, 65118, 32351, 32350, 65120, 32357, 65126, 32358, 32360, 65128, 32361, 32363, 32364, 65132, 32366, 32367, 32368, 65134, 65141, 65142, 65146, 65147, 65149, 65150, 65151, 65168, 32400, 32405, 65174, 32406, 32408, 32409, 65178, 32411, 32412, 65180, 65182, 32415, 65184, 32414, 32421, 65190, 32422, 32424, 65192, 32425, 32427, 32428, 65196, 32430, 32431, 65198, 65253, 65259, 65261, 65263, 32512, 32517, 65285, 65286, 65288, 65289, 32521, 65291, 65292, 32524, 32525, 32526, 32527, 32523, 65293, 65294, 65295, 32518, 32544, 32520, 65317, 32550, 65318, 65320, 32552, 65322, 65323, 32556, 32554, 65326, 65327, 32560, 65324, 65325, 65333, 65334, 32566, 32568, 65336, 32570, 65338, 65340, 65341, 65342, 65343, 65339, 32572, 32592, 65365, 32598, 65366, 32597, 65369, 32600, 32602, 32604, 32605, 65373, 32603, 32608, 65372, 32606, 65375, 65374, 32613, 32614, 65381, 65382, 32617, 32618, 65386, 32620, 32621, 65384, 32623, 65387, 65390, 32619, 32622, 65388, 65397, 65398, 32630, 32632, 32624, 32634, 65402, 32636, 65405, 65403, 65407, 65406, 65404, 65401, 32656, 32661, 65430, 32662, 65432, 32664, 32666, 65435, 32668, 32669, 32667, 65437, 32670, 32671, 32672, 65438, 65436, 32677, 32678, 65445, 32680, 32681, 32682, 65451, 32683, 32685, 32684, 32687, 65450, 65448, 65454, 32686, 65452, 65455, 65453, 32720, 65493, 65497, 65501, 65509, 32742, 65510, 32744, 65514, 65515, 32748, 65517, 65518, 32746, 65519], 2039: [32784, 16, 19, 32789, 22, 21, 32792, 25, 26, 23, 32796, 29, 32793, 32816, 32574, 64, 69, 73, 77, 39096, 99, 102, 103, 106, 39098, 32886, 32888, 32890, 32892, 128, 133, 137, 141, 32912, 32917, 149, 32918, 32920, 153, 32921, 32922, 32924, 157, 163, 166, 167, 170, 32950, 32952, 32954, 32956, 192, 197, 201, 205, 211, 213, 214, 215, 217, 218, 221, 33008, 33031, 33040, 13080, 33045, 278, 33046, 33049, 282, 33050, 33051, 33053, 33055, 294, 302, 33074, 307, 33077, 33081, 33082, 33083, 33087, 33093, 326, 33094, 33097, 330, 33099, 33098, 33101, 334, 33103, 32633, 33120, 33126, 33130, 33138, 371, 379, 33150, 33158, 33160, 33164, 33166, 33168, 33170, 406, 33174, 33176, 410, 33178, 33180, 33186, 419, 33189, 33190, 33192, 33194, 33195, 33196, 33197, 26137, 33199, 33205, 33209, 33213, 454, 33222, 458, 33226, 33238, 33239, 33240, 33242, 475, 33244, 33246, 33248, 33250, 483, 33253, 33255, 33256, 33257, 33259, 33260, 33262, 33263, 33269, 33273, 33275, 33277, 13127, 33279, 33282, 33290, 33292, 33293, 33288, 33317, 550, 552, 33321, 556, 558, 566, 33333, 33339, 574, 33343, 33341, 581, 582, 584, 588, 589, 590, 33373, 33397, 33403, 33405, 33407, 33413, 33417, 33421, 678, 680, 684, 686, 33456, 33461, 33465, 33477, 33481, 33509, 33513, 33517, 33525, 33529, 33539, 33543, 33549, 33552, 33555, 787, 33557, 791, 33560, 33559, 33564, 33565, 805, 33579, 813, 815, 33583, 818, 821, 33589, 824, 825, 826, 827, 828, 33598, 33593, 13190, 835, 33603, 837, 33606, 839, 33607, 13192, 33605, 845, 33614, 847, 33613, 13194, 33635, 33639, 33645, 882, 33651, 885, 33653, 888, 889, 891, 892, 890, 33662, 33657, 899, 33667, 33671, 33682, 915, 33683, 919, 33693, 33698, 33699, 933, 33702, 33704, 33703, 33706, 33708, 33709, 33710, 943, 941, 33717, 33721, 33723, 33725, 33727, 963, 33731, 967, 33736, 33739, 33740, 33743, 33746, 33747, 979, 33751, 32761, 33758, 33757, 33760, 33762, 33773, 33774, 33776, 33781, 65331, 33787, 33789, 33791, 33794, 33799, 33806, 33829, 1064, 33835, 1068, 33837, 33839, 33842, 33845, 33849, 33851, 33854, 33855, 1090, 1093, 1094, 33862, 1096, 1097, 1098, 1099, 33868, 1100, 33864, 33871, 33867, 1101, 1102, 33870, 65349, 1138, 1146, 33915, 33918, 33919, 33938, 33950, 1186, 1190, 1194, 1195, 1198, 33966, 33968, 33973, 33981, 33989, 33997, 1234, 1241, 1242, 34037, 34041, 34043, 34045, 34047, 34048, 45845, 34054, 1288, 34058, 1291, 1292, 1296, 1302, 1306, 13287, 1320, 1323, 1324, 1327, 1334, 1342, 1344, 1352, 1355, 1356, 1359, 26325, 26326, 1382, 1386, 34160, 1408, 1424, 1427, 1431, 58902, 1443, 1446, 1447, 1448, 1450, 1451, 1452, 1455, 34224, 58906, 1472, 1488, 65426, 1498, 45891, 65431, 45895, 34320, 1552, 34325, 34326, 1558, 34329, 1562, 34330, 34333, 1587, 1589, 1591, 34360, 1593, 34364, 1600, 34374, 1606, 34378, 1610, 34400, 34405, 1638, 34406, 34409, 1642, 34410, 34413, 34418, 1651, 1653, 1655, 1657, 34426, 1664, 34438, 1670, 34442, 1674, 34448, 1680, 34450, 1683, 1687, 34458, 34462, 34466, 1699, 1701, 34470, 1703, 34472, 1705, 34474, 1706, 34476, 1702, 34478, 1728, 1744, 34514, 34518, 1750, 34520, 34519, 1754, 34522, 34524, 34526, 34528, 34530, 1763, 1765, 34535, 1767, 1769, 34538, 34542, 34562, 34563, 34573, 34574, 34576, 34581, 1814, 34585, 1818, 34587, 34589, 34591, 1826, 34597, 1832, 1836, 34606, 1838, 1839, 1842, 34610, 34613, 1848, 34619, 1852, 1850, 1851, 34621, 1858, 1861, 34630, 1862, 1864, 34629, 1866, 45961, 1868, 34637, 1870, 1871, 1869, 34634, 34638, 34653, 34654, 34669, 1906, 34675, 34677, 34679, 1914, 34683, 34686, 34687, 34681, 34693, 34694, 1926, 34696, 34697, 1930, 34699, 34700, 34701, 34702, 34703, 1942, 1946, 34717, 34722, 1954, 34726, 1960, 34728, 34730, 1964, 1966, 1967, 34736, 34733, 34732, 34741, 34742, 34745, 34747, 34750, 34751, 34757, 1990, 34758, 34761, 1994, 34766, 34771, 34775, 2010, 34781, 34782, 34784, 34797, 34798, 34800, 65533, 34806, 34810, 34814, 2050, 34819, 34818, 2053, 2057, 2058, 34829, 34830, 34837, 34838, 34840, 34841, 34842, 34843, 34844, 34847, 34853, 34854, 2088, 34856, 34858, 2092, 34861, 34862, 34860, 34866, 2102, 34869, 34873, 34874, 34875, 2110, 34879, 2114, 6933, 34886, 2120, 34888, 34890, 2122, 2124, 34892, 34894, 26477, 34931, 59046, 2166, 34933, 34939, 2174, 34943, 34937, 59048, 59049, 34949, 34950, 34952, 34955, 34956, 34957, 34958, 34959, 26487, 34968, 34972, 2210, 37861, 34978, 2216, 34984, 2218, 34986, 2220, 34988, 34992, 26494, 34997, 34998, 35000, 35001, 35002, 35003, 35004, 35007, 35013, 35021, 35027, 35029, 35031, 35037, 35038, 35039, 35045, 35046, 35048, 35049, 35050, 35051, 35052, 35053, 35055, 35056, 35061, 35065, 37865, 35088, 2320, 35094, 35096, 35098, 35100, 2344, 2348, 2357, 2358, 2365, 2366, 2368, 2376, 2380, 35168, 2421, 2422, 2429, 2430, 2432, 35216, 2448, 2469, 2472, 2476, 2477, 2496, 2512, 35283, 35287, 35293, 35296, 35299, 2533, 35303, 35309, 2541, 35335, 35336, 35340, 35341, 35344, 2576, 35349, 35350, 2582, 35352, 35353, 2586, 35354, 35356, 35357, 35355, 35359, 35365, 2598, 35369, 2606, 35378, 2611, 35381, 35385, 35387, 35391, 2624, 35397, 2630, 35398, 35401, 2634, 35402, 35403, 35405, 2638, 35407, 59141, 35419, 35423, 35424, 59144, 35430, 35434, 35440, 35442, 2675, 2683, 35451, 35454, 35455, 2688, 35461, 35462, 35464, 35465, 35468, 35470, 35472, 2704, 35474, 2710, 35478, 35480, 2714, 35482, 35484, 35490, 2723, 35493, 2726, 35499, 2734, 35503, 35501, 35504, 35509, 35513, 35517, 2752, 35525, 2758, 35526, 35529, 2762, 35530, 2768, 35539, 35541, 35543, 2779, 35549, 35550, 35551, 35552, 35554, 2787, 35555, 35557, 35559, 35560, 35561, 35562, 35563, 35564, 35565, 35567, 35566, 35573, 35577, 35579, 35581, 35583, 35586, 35590, 59178, 35597, 35598, 35600, 35603, 2835, 35605, 35606, 2839, 35607, 35608, 35610, 35611, 35612, 35613, 35615, 2853, 2861, 35630, 35637, 35641, 35643, 35647, 2883, 35651, 2885, 35654, 2887, 35656, 35653, 35658, 35655, 35660, 2893, 35662, 35661, 39653, 35678, 35683, 35687, 35688, 35692, 35693, 2930, 2938, 35707, 35710, 35711, 2947, 35715, 35718, 35719, 35726, 35731, 2963, 2967, 35741, 35747, 35750, 35751, 35752, 35754, 35756, 35757, 35758, 35766, 35768, 35770, 35771, 35772, 35774, 35775, 35779, 3011, 35782, 3015, 35784, 35788, 35790, 3026, 3027, 35795, 35797, 35799, 3034, 35805, 35807, 35808, 35813, 35819, 35821, 35822, 35823, 35824, 35829, 35830, 59225, 35833, 35835, 35838, 35839, 35843, 35847, 35848, 35852, 35853, 59231, 3115, 35883, 3119, 35887, 35893, 35897, 35902, 3141, 3145, 3147, 35915, 3151, 35919, 59245, 35955, 35966, 59254, 35986, 59256, 35989, 35993, 35994, 26694, 36002, 39721, 3243, 36014, 3247, 36021, 26698, 36027, 36029, 36031, 36050, 36051, 36062, 36066, 36078, 36085, 36086, 36088, 36089, 36090, 36091, 36092, 36093, 36095, 36098, 36099, 36103, 36112, 36117, 3350, 36118, 36121, 36122, 3354, 36125, 3368, 3371, 3372, 3375, 3379, 3381, 3382, 36149, 36152, 3383, 36154, 36155, 36156, 3389, 3390, 36159, 36157, 3397, 36166, 3398, 3400, 3402, 3403, 3404, 3405, 36170, 3407, 7192, 36192, 7194, 36205, 36208, 3442, 3443, 36210, 3445, 3446, 3447, 3448, 36213, 36218, 36219, 3452, 3453, 3454, 36223, 36221, 36229, 36230, 3462, 36233, 3466, 36234, 36237, 36240, 36242, 39769, 36250, 36254, 36258, 3491, 3493, 36262, 3495, 3496, 36264, 36266, 3499, 36268, 3501, 36270, 3503, 36272, 3500, 36306, 3538, 3542, 36311, 3544, 3546, 3548, 3550, 36318, 36320, 36322, 3555, 39784, 3559, 36327, 36333, 36334, 36342, 36344, 36346, 36348, 36352, 36355, 36359, 3627, 3631, 36406, 36408, 36410, 36412, 3653, 3659, 3661, 3663, 36445, 3698, 36469, 36477, 3710, 61368, 3755, 3759, 36528, 36533, 36537, 3794, 3806, 36597, 36598, 36600, 36601, 36602, 36604, 3842, 36611, 3845, 36615, 3849, 3850, 36624, 36629, 3862, 36632, 36633, 3866, 36635, 36636, 36637, 36639, 36645, 3880, 36651, 36653, 3884, 3887, 3883, 36655, 36658, 3893, 3894, 36661, 3901, 36670, 3902, 36669, 36677, 3910, 36678, 3912, 3914, 3915, 3916, 36685, 3918, 3919, 36686, 36701, 36712, 36716, 36717, 3957, 3958, 36725, 3960, 3961, 3964, 3965, 36734, 3967, 3966, 36729, 36741, 3974, 36745, 3978, 36754, 3990, 3994, 36765, 36766, 4006, 36774, 4008, 4011, 4012, 36781, 4014, 4015, 36782, 36789, 36793, 36795, 36799, 36805, 4038, 36808, 36809, 4042, 36811, 36812, 36815, 36821, 4054, 4053, 4056, 4057, 4058, 36825, 4060, 36829, 4063, 36832, 7977, 36843, 36847, 36848, 36854, 36856, 36858, 36859, 36860, 36863, 36864, 36870, 36874, 59432, 59433, 4112, 36880, 4115, 4117, 4118, 36886, 4119, 36890, 4122, 13845, 4125, 59436, 4128, 36896, 4134, 36902, 4138, 36906, 4144, 36912, 4149, 36918, 4150, 4153, 4154, 36922, 4160, 36928, 36934, 4166, 4170, 36938, 36944, 36950, 36954, 36960, 4195, 4199, 36966, 36970, 4208, 36976, 7349, 4213, 4214, 36982, 4218, 36986, 4221, 4223, 4224, 4230, 36998, 4234, 37002, 37008, 4240, 4243, 4246, 37014, 4247, 4250, 37018, 4255, 4256, 37024, 59465, 4277, 37046, 4278, 37050, 4282, 4285, 4287, 4288, 37056, 4294, 37062, 4298, 37066, 7368, 37078, 37082, 37088, 4323, 37094, 4327, 37098, 4333, 4336, 37104, 4341, 4345, 4373, 4374, 37142, 4376, 37144, 4377, 4379, 37148, 4380, 37150, 4383, 4382, 4381, 4389, 4393, 4397, 37171, 37175, 4421, 37190, 4422, 37192, 4425, 4424, 4428, 4429, 4430, 37196, 37198, 39958, 4448, 4453, 37222, 37224, 4457, 37228, 4461, 37230, 39964, 4464, 37235, 37239, 39966, 4485, 37253, 4489, 37257, 4491, 37261, 4493, 4495, 4496, 59510, 37267, 4501, 39973, 4509, 37283, 4517, 37285, 37287, 37289, 39976, 4523, 4521, 37293, 4525, 4527, 4528, 39978, 4549, 4553, 4557, 37333, 4565, 4569, 37337, 4571, 4573, 37341, 4575, 37347, 59526, 37349, 4581, 37351, 4585, 4587, 37357, 59528, 4591, 37376, 4613, 37389, 4621, 4640, 37429, 37430, 37432, 37435, 37436, 37437, 37438, 37439, 40005, 40009, 37461, 37469, 4701, 4725, 37493, 37499, 37501, 37502, 37503, 4733, 4736, 4741, 4745, 4749, 4789, 4793, 4797, 4800, 4832, 59577, 4837, 4841, 4845, 59579, 4853, 4857, 4861, 4880, 4882, 4885, 37654, 37653, 4888, 37657, 4890, 37656, 4892, 37661, 4891, 4895, 4893, 37663, 37664, 37660, 4901, 37670, 37672, 4907, 37677, 4910, 4911, 37680, 37679, 4915, 37678, 4917, 4919, 37688, 37686, 37691, 37692, 4925, 4926, 37695, 37694, 4930, 4931, 37701, 4934, 4935, 37702, 4933, 4938, 37706, 4940, 4936, 4942, 4943, 37710, 4941, 4939, 37709, 37708, 7497, 37728, 4962, 37733, 4967, 37737, 37739, 37743, 37741, 4978, 4979, 37749, 37750, 4981, 4985, 37753, 37756, 4987, 37755, 4991, 4992, 37760, 37759, 4990, 37758, 4997, 4994, 4998, 37768, 5000, 5003, 37772, 5005, 5006, 5007, 37776, 37771, 37775, 5004, 37781, 5015, 37784, 5021, 37788, 5022, 37785, 5026, 37787, 5027, 37791, 5030, 37798, 5032, 37802, 5034, 5036, 5037, 5038, 37806, 37804, 37800, 5042, 37813, 5045, 5046, 5048, 37817, 5049, 5051, 5052, 37819, 5054, 5055, 37823, 5056, 37824, 5058, 37829, 5061, 5062, 5064, 5065, 5066, 37835, 5068, 37836, 5069, 37839, 5071, 37838, 5074, 5070, 37837, 59625, 37848, 37851, 37852, 5085, 5086, 37855, 5088, 37856, 5090, 59627, 5095, 37864, 37867, 5102, 37871, 37872, 5104, 37868, 5109, 5110, 5112, 5113, 5115, 5116, 5117, 5118, 37887, 37883, 5154, 5157, 37925, 5161, 37929, 37933, 5165, 38000, 5239, 5250, 5253, 38021, 5257, 38025, 5261, 38029, 5262, 38064, 5296, 5298, 5301, 38069, 5303, 5305, 5306, 38073, 5309, 38077, 5310, 5314, 5317, 38085, 5321, 38089, 5322, 38093, 5325, 7574, 5346, 5349, 38117, 38121, 5353, 38125, 5357, 5358, 5362, 5365, 38133, 38137, 5370, 5369, 38141, 5374, 5373, 38144, 5376, 5392, 38166, 5398, 38168, 5400, 38170, 5402, 38172, 5404, 5408, 38197, 38198, 38200, 38203, 38204, 38205, 38206, 38207, 5440, 38208, 5446, 38214, 5448, 38216, 5450, 38218, 5452, 38220, 38229, 38233, 38261, 38262, 38264, 38265, 38267, 38268, 38269, 38270, 38271, 5504, 38272, 5510, 5512, 5514, 5516, 38288, 5520, 5526, 5528, 5530, 5532, 5568, 5574, 38342, 5576, 38344, 5578, 38346, 5580, 38348, 38352, 5584, 5590, 5592, 5594, 5596, 5600, 38416, 5648, 5653, 5654, 38421, 38424, 5657, 38426, 38427, 5659, 5660, 5661, 38431, 38429, 5663, 5658, 38428, 38430, 38451, 5696, 38464, 38469, 5701, 38470, 5702, 5704, 5706, 5707, 5708, 5709, 38476, 5711, 38477, 5705, 38473, 38474, 5710, 5728, 5733, 38501, 5737, 38505, 5739, 38507, 5743, 38511, 38515, 38528, 5760, 5765, 5766, 5768, 5769, 5770, 5772, 5776, 38544, 38547, 38549, 5782, 38551, 5784, 38553, 5786, 38555, 5788, 38557, 5790, 38559, 5791, 5787, 5789, 38563, 5797, 38567, 5805, 5824, 5829, 38598, 38597, 5832, 38600, 5834, 5835, 38604, 5837, 38606, 5839, 5840, 38608, 5833, 38603, 5836, 5845, 38613, 38607, 5848, 5849, 5850, 5846, 5852, 38621, 5853, 5856, 38624, 38627, 38629, 5861, 5865, 5867, 38637, 5871, 46758, 38656, 5894, 5896, 5900, 38670, 38672, 5902, 5909, 5910, 38678, 5912, 38680, 38682, 5915, 38684, 5916, 38686, 5919, 5918, 38688, 5917, 5925, 38693, 38697, 38696, 5931, 5933, 38701, 5935, 38703, 38700, 38699, 5934, 38702, 5941, 38712, 38714, 38716, 5950, 5951, 38718, 5949, 38717, 5947, 38715, 38725, 5958, 38726, 5957, 38728, 5962, 38730, 5964, 38729, 5966, 5960, 38736, 5965, 38732, 38734, 38741, 38742, 38744, 5981, 38749, 38751, 38752, 5982, 38750, 38758, 38757, 38760, 38761, 38764, 5997, 38766, 38768, 38765, 6003, 38774, 38776, 38779, 38780, 38782, 38783, 6016, 38784, 6015, 6014, 6011, 6021, 38790, 6022, 6024, 38789, 38794, 6027, 6028, 38797, 6030, 38799, 38800, 6031, 6029, 38795, 38806, 38810, 6045, 38822, 38821, 6054, 38825, 6058, 38826, 6061, 6064, 38832, 6067, 38837, 6070, 6071, 6072, 6075, 6076, 38845, 6078, 38847, 6080, 38848, 38843, 6079, 38854, 6086, 38858, 6094, 38870, 38874, 6109, 6112, 38880, 38885, 38891, 6125, 6128, 38895, 6126, 38893, 38901, 6134, 6136, 38907, 6140, 38909, 6142, 38911, 6165, 38934, 6166, 38936, 6168, 6170, 6171, 38940, 6172, 38942, 6175, 6176, 38944, 6173, 6174, 6181, 6182, 38950, 6186, 38954, 6189, 6190, 38958, 38960, 38965, 6198, 38966, 38968, 6202, 38971, 38972, 38973, 38974, 38975, 6206, 38970, 6213, 6214, 38982, 6216, 38984, 6218, 38986, 6220, 6221, 6222, 38990, 38988, 39014, 6248, 39016, 39018, 39020, 6253, 39022, 6252, 39024, 39029, 6262, 6264, 6266, 39037, 39038, 39039, 39040, 6268, 39035, 6270, 6271, 39045, 6278, 6277, 6280, 6272, 39051, 6284, 39053, 6285, 39055, 6286, 6283, 6287, 39062, 39064, 6296, 39066, 6300, 6301, 39068, 6310, 6314, 6317, 39088, 6322, 6325, 39094, 6326, 6328, 39093, 6330, 6331, 6332, 39101, 6334, 39103, 39100, 39104, 6335, 39099, 6333, 6341, 6342, 6336, 6349, 6350, 6357, 6363, 6365, 6367, 6368, 39136, 39141, 6374, 6373, 6376, 6378, 6379, 6380, 6381, 39149, 6383, 6384, 39152, 6386, 39147, 39151, 6389, 6390, 6382, 6392, 39157, 6394, 39163, 6396, 6397, 6398, 39167, 39165, 39184, 6416, 6422, 6424, 6426, 6428, 39248, 6480, 6496, 39270, 39272, 39274, 39276, 6512, 39280, 27349, 27352, 6544, 39318, 39320, 6552, 39322, 39324, 6556, 59925, 39381, 39385, 6624, 39392, 39397, 39401, 39437, 6672, 39440, 6677, 39446, 6678, 39448, 6681, 6682, 6680, 39452, 6685, 39454, 6684, 6687, 6683, 6686, 6693, 6697, 6701, 39475, 39479, 6725, 6726, 39494, 6728, 39496, 6729, 6732, 6733, 6734, 39500, 39502, 6741, 39509, 6749, 39517, 6752, 6757, 39526, 6760, 39528, 39530, 6761, 39532, 6765, 39534, 6764, 6768, 39539, 39541, 6773, 27398, 39543, 39549, 6781, 6789, 39557, 6793, 39561, 6795, 6797, 39565, 6799, 6800, 39571, 6805, 39574, 39576, 6808, 39578, 6812, 6813, 39580, 39587, 6821, 39589, 39591, 6825, 39593, 6827, 6829, 39597, 6831, 6832, 59974, 59977, 6853, 6857, 6861, 39637, 6869, 39641, 6873, 6875, 39645, 6877, 6879, 39648, 6880, 39651, 6885, 6886, 39655, 6888, 6889, 39657, 6891, 6892, 6890, 39661, 6895, 39680, 39685, 39686, 6920, 39689, 39691, 6924, 6918, 39694, 6926, 6928, 39695, 6930, 39701, 6934, 6935, 6936, 39705, 6938, 6939, 6940, 39709, 6941, 6943, 6942, 39717, 6949, 39720, 6953, 6955, 39724, 39725, 6959, 39727, 6957, 39728, 39723, 39736, 6971, 39739, 39740, 6975, 39743, 6978, 39749, 6981, 6984, 39752, 6986, 6987, 6988, 39757, 6989, 6991, 39756, 39765, 39768, 39766, 39771, 39774, 7006, 39776, 7010, 39775, 39772, 39781, 7015, 7016, 7018, 7020, 39789, 39785, 39792, 39788, 39786, 39798, 39800, 39802, 39803, 7035, 7038, 39806, 39807, 7039, 39804, 7042, 7045, 39816, 39819, 39820, 7053, 7054, 7055, 39824, 7051, 39823, 39830, 7063, 39832, 39834, 39836, 7069, 7074, 39848, 7080, 39852, 7085, 7084, 7086, 39856, 7093, 39862, 7094, 7096, 7097, 39866, 7098, 7100, 39864, 39868, 7106, 27464, 39877, 7109, 39881, 7114, 7115, 7113, 39885, 7117, 7119, 27466, 7122, 7125, 39896, 7128, 7131, 7132, 7133, 7134, 39903, 7136, 39900, 7135, 39899, 7138, 39909, 7143, 39913, 7150, 7152, 39920, 7157, 7161, 60201, 7189, 7190, 39957, 39960, 7193, 39962, 39963, 7195, 7196, 7197, 39967, 39965, 7200, 39968, 7199, 7202, 7205, 39974, 39977, 39979, 39981, 7214, 39983, 7216, 39980, 7211, 7213, 7215, 39982, 39984, 7232, 40000, 7237, 40006, 7238, 7240, 40008, 7242, 40010, 7244, 7245, 7246, 7247, 40014, 40012, 7243, 40011, 40015, 27494, 40037, 40041, 7275, 40043, 7279, 40048, 7280, 7960, 40047, 40053, 7285, 7287, 7286, 40057, 7289, 7291, 40059, 7290, 7295, 40063, 7298, 7301, 7302, 40070, 7304, 40072, 40074, 7306, 7308, 7309, 7310, 40076, 40085, 7318, 7317, 7320, 40089, 7322, 40091, 7324, 7323, 7326, 40095, 7328, 40096, 7327, 7325, 7333, 40102, 40101, 40105, 40107, 40106, 7341, 7342, 40110, 7344, 40111, 40112, 40117, 7350, 7351, 40121, 7353, 7355, 40123, 40125, 7358, 7359, 40127, 7362, 7365, 7366, 40134, 40136, 40133, 40138, 7371, 40140, 7373, 40142, 7375, 7372, 7370, 40139, 40143, 40141, 7381, 7374, 7382, 7384, 7386, 7388, 7389, 7982, 7394, 7397, 40166, 7398, 7400, 40168, 7402, 40170, 7404, 7405, 7406, 40172, 7408, 40176, 7401, 7403, 7407, 40181, 7414, 40189, 7422, 7991, 7440, 40208, 7445, 40214, 40213, 40216, 7449, 7451, 40220, 7453, 40221, 40223, 7455, 7995, 40222, 40219, 40229, 40233, 40235, 7997, 40239, 40243, 40261, 7493, 7494, 7496, 40265, 40267, 7499, 40269, 7501, 40271, 7504, 7503, 40272, 7500, 7502, 8007, 7520, 40293, 40297, 40299, 40303, 40304, 7536, 40307, 7557, 7561, 7565, 7568, 40339, 7573, 40341, 40343, 7576, 7577, 40345, 7579, 7580, 40349, 7581, 7582, 7583, 40347, 40351, 40355, 40357, 7589, 40359, 60125, 40361, 40363, 7597, 40367, 7600, 60127, 7605, 7609, 7613, 40389, 7621, 40390, 40392, 7625, 40395, 40396, 7629, 40398, 7631, 7627, 40399, 40397, 40405, 7645, 40413, 40416, 7648, 40419, 40421, 27574, 40429, 7661, 7669, 7673, 7677, 40448, 8040, 7685, 7693, 40485, 40489, 40491, 40495, 8053, 40517, 40521, 40523, 40527, 40533, 7773, 40541, 7797, 40565, 7805, 40573, 60169, 8069, 40613, 40617, 8073, 40619, 40623, 7856, 8077, 60181, 21116, 40720, 7954, 40725, 40726, 7958, 40728, 40729, 40730, 7963, 40732, 7964, 7962, 7967, 40736, 7966, 7971, 40741, 7973, 7975, 40744, 7979, 40748, 7981, 40751, 7983, 40752, 40749, 40747, 7989, 40758, 40757, 40760, 7987, 40763, 40764, 7998, 7999, 40768, 8000, 40766, 8003, 8002, 40773, 8006, 40774, 8008, 40776, 8010, 40777, 8012, 40779, 8014, 40782, 40783, 8015, 40778, 40780, 8011, 40784, 40789, 40793, 40792, 40796, 8029, 40797, 40800, 8034, 40806, 40805, 40808, 40809, 40810, 40812, 8044, 8042, 8050, 8051, 40816, 8045, 8055, 40822, 40825, 8057, 40828, 40829, 40830, 40831, 8064, 40832, 40827, 8062, 40837, 40838, 8070, 40840, 8072, 8074, 40843, 40842, 40845, 40841, 8076, 40844, 8079, 8075, 40847, 40848, 40854, 40858, 40860, 40856, 40864, 8099, 40869, 40870, 8102, 40872, 8104, 40874, 40873, 40875, 40876, 8110, 40878, 8112, 40880, 40879, 8114, 8108, 40885, 8117, 8120, 40889, 8121, 8123, 8124, 40893, 8126, 40895, 8128, 40896, 40891, 8133, 40902, 8134, 40904, 8136, 8138, 8139, 40906, 8137, 8140, 40908, 40911, 8143, 40907, 8150, 40918, 8152, 40920, 8154, 40922, 8155, 8156, 40924, 40927, 40928, 8160, 8159, 40923, 8162, 8165, 40933, 40936, 8171, 8173, 8174, 40943, 8176, 40944, 8169, 40941, 40940, 8175, 8181, 40949, 8184, 8185, 40953, 40955, 8187, 8189, 8188, 40959, 40957, 40974, 40976, 60248, 40981, 40984, 40985, 40987, 40988, 40991, 40992, 40997, 41001, 41008, 41013, 41014, 41017, 41022, 41024, 41029, 41033, 41053, 60264, 41069, 41072, 41077, 41078, 41080, 41081, 41084, 41086, 41088, 41093, 41097, 41104, 41109, 41112, 41113, 41116, 41120, 41125, 41133, 41144, 40742, 41147, 41148, 41151, 41157, 40745, 41161, 40746, 41181, 40750, 41200, 41208, 41211, 41212, 41215, 41223, 41232, 41238, 41242, 40765, 41266, 40767, 41274, 41286, 41288, 41290, 41292, 41294, 41312, 41318, 41322, 41330, 41342, 41360, 41362, 41366, 41368, 41370, 41372, 41378, 41382, 41384, 41386, 41388, 41390, 41414, 41418, 41430, 41431, 41432, 41434, 41436, 41440, 41442, 41447, 41448, 41452, 41454, 41474, 41482, 40813, 41509, 41513, 41515, 41517, 41519, 41541, 40821, 41542, 41544, 41546, 41547, 41548, 41549, 41551, 40824, 41595, 41599, 41605, 41609, 41648, 41653, 41657, 41661, 41669, 41673, 41701, 41705, 41717, 41721, 41725, 41731, 41735, 41741, 41747, 41749, 41751, 41757, 41781, 41785, 41795, 41798, 41799, 41802, 41827, 41831, 41837, 41843, 41859, 41863, 41874, 41875, 41885, 41890, 41891, 41894, 41895, 41896, 41898, 41900, 41909, 41917, 41923, 41938, 41939, 41943, 41950, 41954, 41965, 41966, 41973, 41981, 41986, 41991, 41998, 42027, 42030, 42031, 42034, 42046, 42053, 42054, 42056, 42059, 42060, 42061, 42062, 42063, 40934, 40937, 42130, 40938, 40939, 42142, 42157, 42261, 42265, 42269, 42278, 42280, 42282, 42284, 42310, 42312, 42314, 42316, 42320, 42341, 42345, 42349, 42352, 42405, 42406, 42408, 42410, 42411, 42412, 42413, 42414, 42415, 42416, 42421, 42425, 42429, 42453, 42454, 42456, 42459, 42460, 42461, 42462, 42463, 42485, 42489, 42493, 42512, 42517, 42518, 42521, 42522, 42525, 42552, 42556, 42566, 42570, 42592, 42597, 42598, 42601, 42602, 42605, 42610, 42618, 42630, 42634, 42640, 42642, 42650, 42654, 42658, 42661, 42662, 42664, 42666, 42667, 42668, 42669, 42670, 42671, 42706, 42709, 42710, 42711, 42712, 42714, 42715, 42716, 42717, 42718, 42719, 42720, 42722, 42727, 42730, 42734, 42754, 42755, 42765, 42766, 42768, 42773, 42777, 42779, 42781, 42783, 42798, 42802, 42811, 42821, 42822, 42826, 42829, 42861, 42867, 42871, 42875, 42879, 42880, 42885, 42886, 42889, 42894, 42909, 42914, 42918, 42920, 42922, 42924, 42925, 42933, 42934, 42939, 42941, 42942, 42943, 42944, 42949, 42950, 42953, 42958, 42963, 42967, 42973, 42976, 42990, 42992, 42997, 42998, 43005, 43006, 43010, 43011, 43021, 43022, 34605, 43040, 43045, 43046, 43048, 43049, 43050, 43051, 43052, 43055, 60661, 43058, 43066, 43067, 43072, 60664, 43077, 43078, 43080, 43081, 43082, 43083, 43084, 43087, 60667, 43123, 43127, 43141, 43145, 43147, 43151, 43160, 43164, 43168, 43170, 43174, 43176, 43178, 43180, 43205, 43209, 43211, 43215, 43219, 43221, 43223, 43225, 43227, 43229, 43231, 43237, 43240, 43241, 43243, 43244, 43245, 43247, 43277, 43280, 43328, 43333, 43337, 43339, 43343, 43360, 43382, 43386, 43397, 43401, 43403, 43407, 43408, 43413, 43417, 43419, 43423, 43456, 43475, 43479, 43485, 43488, 43491, 43495, 43501, 43527, 43536, 43542, 43546, 43557, 43561, 43570, 43584, 43589, 43590, 43592, 43593, 43594, 43595, 43596, 43598, 43599, 43616, 43622, 43626, 43632, 43634, 43646, 43653, 43657, 43659, 43663, 43664, 43666, 43669, 43670, 43672, 43673, 43674, 43675, 43676, 43679, 43682, 43694, 43696, 43712, 43717, 43718, 43721, 43722, 43731, 43733, 43735, 43737, 43739, 43741, 43743, 43744, 43746, 43747, 43749, 43751, 43752, 43753, 43756, 43757, 43758, 43759, 43778, 43789, 43790, 43795, 43797, 43799, 43803, 43805, 43807, 43813, 43817, 43819, 43822, 43823, 43840, 43843, 43845, 43846, 43847, 43849, 43850, 43851, 43853, 43855, 43875, 43879, 43885, 43899, 43903, 43907, 43909, 43910, 43911, 43913, 43915, 43918, 43919, 43923, 43933, 43939, 43942, 43943, 43946, 43949, 43958, 43963, 43966, 43967, 43971, 43973, 43974, 43977, 43979, 43982, 43983, 43987, 43989, 43991, 43993, 43995, 43997, 43999, 44005, 44009, 44011, 44013, 44014, 44015, 44016, 44022, 44030, 44035, 44039, 44040, 44044, 44045, 44085, 44089, 44094, 44104, 44108, 44147, 44158, 64277, 44178, 44181, 44185, 44186, 44194, 44197, 44203, 44205, 44206, 44207, 44213, 44214, 44216, 44219, 44220, 44221, 44222, 44223, 44242, 44243, 44245, 44251, 44253, 44254, 44255, 44258, 44270, 44277, 44278, 44280, 44283, 44284, 44285, 44286, 44287, 44290, 44291, 44295, 44301, 44304, 44310, 44314, 44320, 44325, 44331, 44333, 44335, 44344, 44348, 44357, 44358, 44362, 44363, 44365, 44367, 44384, 44402, 44406, 44410, 44416, 64287, 44422, 44426, 44432, 44434, 44442, 44446, 44450, 44454, 44456, 44458, 44460, 44462, 44480, 44498, 44503, 44510, 44512, 44514, 44519, 44526, 44547, 44551, 44576, 44667, 44671, 44672, 34935, 44725, 44729, 44736, 44768, 44789, 44793, 44803, 44807, 44816, 44821, 44825, 44827, 44829, 44831, 44846, 44850, 44862, 44869, 44870, 44872, 44874, 44876, 44877, 44878, 28461, 44909, 44926, 44933, 44937, 48009, 44946, 44957, 44958, 44966, 44968, 44970, 44972, 44973, 44974, 44981, 44982, 44984, 44987, 44988, 44989, 44990, 44991, 44997, 45001, 45013, 45014, 45016, 45017, 45019, 45020, 45021, 45022, 45023, 45024, 45035, 45039, 45045, 45046, 45048, 45051, 45052, 45053, 45054, 45055, 45072, 12304, 45074, 45075, 12307, 12309, 12310, 12311, 45079, 45080, 12313, 12315, 45084, 12317, 12318, 12319, 12320, 45087, 45086, 45090, 45097, 12336, 45107, 45111, 12345, 12352, 45122, 45123, 45125, 45127, 45128, 45129, 12363, 45132, 45133, 45134, 45135, 12367, 45154, 12387, 12391, 12397, 12398, 45166, 45171, 45175, 28518, 12416, 45186, 45187, 45189, 45191, 45192, 12427, 45196, 45197, 45198, 12431, 45199, 45203, 45202, 12435, 12439, 45207, 45218, 45234, 12469, 12470, 45237, 45240, 45241, 12474, 45243, 45244, 12477, 12478, 12479, 12480, 45242, 45250, 45251, 45253, 28533, 45255, 45256, 12491, 45260, 45261, 45262, 45263, 12495, 45266, 45267, 45271, 12510, 45278, 45282, 12515, 12519, 45293, 12525, 12528, 45298, 12533, 12534, 45301, 45304, 45305, 45306, 45307, 45308, 12541, 12542, 12537, 12560, 45333, 12566, 12565, 12568, 45337, 12569, 12572, 45341, 12574, 45363, 45366, 45367, 45368, 45372, 45374, 45381, 12613, 45382, 45385, 12617, 45390, 12645, 12646, 12648, 12649, 12651, 12652, 12654, 12655, 45427, 45430, 45431, 45432, 45436, 45438, 45445, 45449, 45459, 45461, 45462, 12693, 45465, 12697, 12699, 45470, 12703, 45475, 12709, 12710, 45479, 12713, 12717, 12718, 12725, 12729, 45509, 12742, 45513, 45517, 12750, 45525, 12758, 12757, 12761, 45533, 12765, 12766, 12768, 45539, 45541, 45543, 45545, 45549, 12789, 12793, 12802, 12805, 45576, 12810, 45580, 12813, 12814, 45600, 45609, 12841, 45625, 45638, 45640, 45644, 45646, 12893, 45696, 12976, 45749, 45753, 45760, 45765, 12997, 45769, 13001, 45792, 45813, 45817, 45819, 45823, 13074, 45842, 13077, 45846, 13079, 13078, 13081, 45850, 13083, 13084, 13085, 13086, 45854, 13087, 45849, 45858, 13091, 45859, 45863, 13095, 13107, 13111, 13122, 45890, 13123, 45893, 13126, 45894, 13125, 45897, 13130, 45899, 45898, 13133, 13134, 28662, 45902, 61227, 61229, 28666, 13154, 13159, 13165, 13166, 13170, 13171, 13175, 45954, 45955, 13186, 13189, 45958, 45957, 45960, 45959, 45962, 13195, 45964, 45965, 13198, 13199, 13197, 45966, 13196, 13202, 45970, 13207, 13218, 13219, 45987, 45991, 13234, 46002, 13237, 13240, 13241, 13242, 13243, 46010, 13245, 46014, 13247, 13244, 13246, 46018, 46019, 13253, 13254, 46023, 13256, 13257, 46026, 46027, 13260, 13261, 46030, 13263, 13262, 13259, 13266, 46034, 13278, 13282, 46051, 46055, 13296, 46066, 13301, 13298, 13304, 28696, 13306, 13307, 13308, 13309, 46078, 13311, 46074, 46114, 13346, 13353, 46121, 46137, 46149, 46152, 46155, 46156, 46157, 46159, 13431, 46210, 13442, 13445, 46213, 13449, 46217, 46218, 13453, 13454, 13488, 13490, 13493, 13495, 13497, 13498, 13501, 13502, 13506, 46274, 13509, 46277, 46281, 13514, 13513, 13517, 46286, 46306, 13538, 13545, 46314, 46313, 13550, 13554, 13557, 46325, 13561, 46329, 46331, 13562, 13565, 13566, 46335, 13568, 13570, 13582, 46352, 46357, 46358, 46360, 46361, 46364, 46365, 46366, 13600, 46368, 46400, 46408, 46412, 46445, 46446, 46464, 13696, 46472, 46476, 46480, 13714, 13730, 46510, 13742, 46517, 46521, 46528, 13760, 46536, 46540, 46544, 46557, 46558, 13792, 46560, 46581, 46585, 61366, 46608, 13840, 46613, 13846, 46614, 13848, 46617, 46616, 13851, 46620, 13852, 13854, 13855, 46622, 46621, 13849, 46643, 46656, 13893, 46661, 46662, 46664, 13897, 46665, 46668, 13901, 46670, 13920, 13925, 46693, 13926, 46694, 13929, 46697, 13931, 46701, 46702, 13935, 13934, 46707, 46720, 46725, 13958, 46728, 46729, 46732, 46733, 13966, 13968, 46736, 13970, 46739, 13973, 46743, 13976, 13977, 13978, 13979, 46748, 13981, 13980, 13982, 46744, 13983, 13986, 46755, 46757, 13989, 46759, 13992, 13993, 13994, 13995, 13996, 46765, 46766, 13998, 46761, 46784, 14022, 46792, 14024, 46796, 14028, 14030, 46800, 14037, 46805, 46806, 46808, 46809, 14041, 14038, 46812, 46813, 46814, 14046, 14048, 46819, 46821, 14059, 46829, 14063, 14094, 46864, 46869, 14102, 46870, 14104, 46874, 14108, 46877, 14110, 46883, 46887, 46918, 14150, 46922, 14154, 46926, 46944, 61435, 14189, 14190, 14195, 14199, 46979, 46982, 46983, 46986, 46992, 14256, 47026, 14259, 14261, 14263, 47034, 14267, 14269, 47038, 14271, 47043, 47045, 47046, 14277, 47047, 14278, 47050, 47053, 14286, 47054, 14285, 14302, 47072, 47075, 47079, 14320, 47090, 14325, 47094, 47098, 14331, 14333, 47102, 14335, 14338, 14346, 14350, 47125, 14358, 14360, 47131, 14364, 47133, 14366, 47135, 47136, 14370, 47138, 47142, 47150, 14384, 14386, 47161, 47168, 47174, 14406, 47176, 47178, 47179, 47180, 14410, 47182, 47183, 14438, 14440, 14442, 14443, 14444, 14446, 14447, 14448, 14450, 14455, 47234, 14466, 47232, 14469, 47242, 47243, 14477, 14478, 47247, 14482, 14488, 14491, 47259, 14492, 14495, 47264, 14498, 47263, 14502, 14504, 47274, 14506, 14508, 14510, 14512, 14517, 47285, 14519, 14520, 47289, 14522, 14523, 14524, 14525, 14518, 14527, 47296, 14530, 47298, 47301, 14534, 47302, 14533, 14538, 47307, 47309, 14542, 47310, 47311, 14541, 14549, 14550, 47323, 14557, 14558, 47327, 47328, 14562, 47330, 47338, 14574, 14576, 47349, 14581, 47353, 14587, 14589, 14591, 14608, 47376, 14616, 47387, 14620, 47391, 14642, 14647, 14648, 14652, 14654, 47424, 47435, 47439, 14688, 14706, 14711, 14712, 14716, 14718, 47488, 47499, 47503, 14736, 47504, 14754, 14759, 14766, 14773, 14777, 47552, 47563, 47567, 47568, 14816, 14818, 14823, 14830, 14837, 14841, 14853, 47624, 47628, 14861, 14864, 47632, 14869, 14870, 47637, 14872, 14873, 47641, 47643, 14876, 47645, 14878, 47647, 14898, 47667, 14903, 47671, 47680, 47685, 14917, 47686, 47689, 14921, 47691, 47694, 47695, 14944, 14950, 14952, 14954, 14956, 14958, 14962, 47731, 14967, 14968, 47735, 47739, 14972, 47743, 47744, 47749, 47753, 47755, 47759, 47760, 47763, 15000, 47769, 15004, 15010, 47779, 15015, 47783, 15021, 15029, 15033, 47808, 47813, 15046, 47817, 47819, 47821, 15054, 47823, 47824, 47829, 15062, 15061, 35558, 47833, 15065, 47835, 15069, 15070, 47837, 15072, 47839, 15074, 47843, 47845, 15079, 15080, 47849, 47847, 15084, 47853, 15086, 15093, 15097, 15110, 15118, 47890, 15122, 47893, 15125, 15127, 15128, 15129, 47898, 47899, 15132, 15133, 47902, 47903, 15134, 47897, 47904, 15145, 15154, 47936, 15170, 47938, 47941, 15173, 47945, 15178, 47947, 47946, 15181, 47950, 47951, 15182, 15202, 15206, 15207, 15208, 15210, 15212, 15213, 15214, 15218, 48002, 15237, 48005, 15240, 48008, 48010, 48011, 15243, 48012, 15244, 48015, 15241, 15250, 48018, 15255, 48032, 15266, 15280, 15286, 15288, 15290, 15292, 48066, 15301, 15305, 48074, 48075, 15309, 48078, 48079, 15314, 48082, 15320, 48088, 48090, 48091, 48092, 15323, 15324, 48095, 15322, 15330, 15335, 15336, 15337, 48105, 15340, 15344, 15362, 15363, 15365, 15367, 15368, 15369, 15370, 15371, 15372, 48149, 15382, 48150, 15384, 48152, 15387, 48156, 15388, 15390, 15391, 48160, 48158, 48162, 48157, 15397, 15402, 48170, 15403, 15407, 15405, 48181, 15415, 48185, 48192, 15430, 48198, 48200, 15434, 48202, 48204, 48203, 48206, 15438, 48207, 15462, 48230, 48238, 15470, 15477, 15481, 15483, 15487, 48256, 48258, 48261, 15494, 15493, 48264, 48262, 48266, 48268, 48269, 15502, 15501, 48270, 15506, 15511, 15512, 48284, 15516, 48280, 48288, 15522, 15530, 15536, 15538, 15541, 48310, 48309, 15545, 15546, 15547, 15549, 15550, 15551, 48320, 48318, 48322, 48317, 15557, 15558, 48328, 15560, 15563, 48332, 15565, 48334, 15567, 15564, 15566, 48341, 15574, 48349, 48350, 15582, 48352, 48354, 15589, 48358, 48357, 48360, 48362, 15595, 48364, 15597, 48366, 48365, 15600, 15599, 15602, 15605, 48373, 48374, 48376, 48377, 15610, 48378, 48380, 48381, 15614, 48382, 15613, 15632, 15637, 48406, 48405, 15638, 15641, 48409, 15643, 15644, 15640, 15646, 48414, 48416, 15647, 48421, 15653, 48422, 48424, 48425, 15657, 48428, 48430, 48435, 48437, 48438, 15671, 48440, 48441, 48442, 48443, 48444, 48447, 15685, 48454, 48453, 48456, 15689, 48457, 48460, 15693, 48462, 15712, 15726, 15728, 48499, 48512, 48517, 15750, 48521, 48525, 15758, 15760, 48531, 48535, 15767, 15773, 48547, 48551, 15792, 15797, 15801, 48576, 48581, 15814, 15813, 15816, 48585, 15817, 15820, 15822, 48605, 15838, 15840, 48608, 48611, 48621, 15861, 48630, 48629, 48632, 15865, 48634, 48633, 48636, 48635, 48639, 48672, 15927, 48696, 48700, 15957, 15965, 15984, 48768, 16023, 16048, 48832, 48864, 48886, 48888, 48890, 48892, 16130, 16131, 16135, 16136, 16138, 16140, 16142, 48912, 48914, 16146, 16149, 48918, 48917, 48920, 16153, 48922, 48921, 48924, 48925, 16158, 48926, 48928, 48930, 48931, 16163, 16167, 48937, 16179, 16183, 48953, 48960, 48963, 16195, 48965, 48966, 16199, 48968, 48967, 16198, 48971, 48969, 48973, 48970, 48975, 48972, 16206, 48992, 16232, 16236, 16237, 16242, 16243, 16247, 49024, 16258, 49029, 49030, 49032, 16264, 49034, 16267, 49036, 49033, 16266, 16271, 49040, 16268, 16274, 16279, 49056, 16290, 16291, 49059, 49063, 16304, 16306, 16309, 49078, 49077, 16312, 16313, 49081, 16315, 16314, 16316, 16318, 16317, 49088, 16319, 49090, 49086, 49085, 16325, 49094, 49093, 49096, 16329, 49098, 49099, 16332, 49100, 16328, 49097, 49110, 16344, 49112, 49114, 16347, 49116, 16348, 49118, 49120, 16354, 49128, 16361, 49129, 49132, 16368, 16370, 49141, 49142, 16373, 16376, 16377, 16378, 49146, 16380, 16381, 49149, 49150, 16383, 49148, 49151, 49147, 49168, 49174, 49176, 49178, 49180, 49200, 49270, 49272, 49274, 49276, 49296, 49304, 49308, 49334, 49336, 49338, 49340, 49392, 49410, 49422, 49424, 49429, 49430, 49434, 49435, 49437, 49438, 49439, 49445, 49453, 49458, 49462, 49467, 49470, 49471, 49477, 49483, 49485, 49487, 49509, 49510, 49513, 49514, 49515, 49518, 49519, 49526, 49531, 49534, 49541, 49545, 49549, 49554, 49557, 49561, 49562, 49563, 49567, 49570, 49573, 49574, 49577, 49578, 49582, 49618, 49621, 49622, 49623, 49625, 49626, 49629, 49630, 49632, 49634, 49639, 16379, 49643, 49646, 49659, 49663, 49669, 49671, 49677, 49701, 49705, 49714, 49717, 49723, 49725, 49726, 49727, 49734, 49742, 49757, 49781, 49789, 49797, 49801, 49810, 49822, 49830, 49838, 49840, 49845, 49849, 49861, 49865, 49893, 49897, 49909, 49913, 49915, 49919, 49922, 49923, 49927, 49930, 49933, 49934, 49936, 49941, 49942, 49945, 49947, 49949, 49950, 49951, 49982, 49990, 49995, 49998, 49999, 50029, 50030, 50035, 50037, 50041, 50046, 50054, 50062, 50094, 50101, 50102, 50104, 50105, 50108, 50110, 50117, 50120, 50124, 50125, 50131, 50142, 50160, 50166, 50168, 50172, 50174, 50178, 50183, 50186, 50210, 50213, 50219, 50221, 50222, 50226, 50229, 50233, 50235, 50237, 50238, 50239, 50242, 50245, 50246, 50248, 50249, 50250, 50251, 50252, 50253, 50254, 50290, 50293, 50297, 50299, 50301, 50302, 50309, 50313, 50317, 50322, 50330, 50344, 50348, 50349, 50352, 50357, 50361, 50365, 50373, 50381, 50405, 50409, 50413, 50418, 50421, 50424, 50425, 50427, 50428, 50429, 50430, 50431, 50432, 39782, 50544, 50608, 49144, 49145, 50704, 50709, 50710, 50714, 50715, 50717, 50718, 50719, 50738, 50746, 50758, 50762, 50766, 50784, 50789, 50795, 50797, 50799, 50805, 36150, 50809, 50832, 50834, 50838, 50842, 50843, 50846, 50850, 50853, 50857, 50858, 50859, 50861, 50862, 50886, 50890, 50894, 50901, 50903, 50904, 50905, 50908, 50909, 50912, 50917, 50919, 50920, 50921, 50924, 50947, 50950, 50952, 50956, 50957, 50958, 50960, 50965, 50966, 50969, 50971, 50973, 50974, 50975, 50981, 50987, 50989, 50990, 50991, 50994, 50997, 51003, 51005, 51006, 51007, 51013, 51014, 51017, 51018, 51019, 51021, 51022, 51023, 51037, 51038, 51053, 51054, 51059, 51061, 51063, 51065, 51067, 51070, 51071, 51077, 51078, 51080, 51084, 51085, 51086, 51090, 51118, 51120, 51125, 51129, 51131, 51133, 51135, 51141, 51142, 51149, 51150, 51154, 51155, 51159, 51166, 51170, 51181, 51182, 51184, 51189, 51197, 51199, 51203, 51205, 51208, 51209, 51212, 51213, 51215, 51221, 51227, 51229, 51231, 51243, 51246, 51250, 51262, 51269, 51270, 51273, 51274, 51275, 51277, 51278, 51279, 51301, 51302, 51304, 51305, 51306, 51307, 51308, 51311, 51314, 51315, 51317, 51319, 51321, 51323, 51327, 51334, 51336, 51340, 51342, 51346, 51349, 51350, 51352, 51353, 51354, 51355, 51356, 51359, 51365, 51369, 51381, 51382, 51384, 51385, 51386, 51387, 51388, 51389, 51391, 51410, 51411, 51413, 51415, 51421, 51422, 51423, 51426, 51429, 51435, 51437, 51438, 51439, 51440, 62327, 51442, 51445, 51448, 51452, 51453, 51454, 51472, 51600, 51606, 51608, 51610, 51612, 51667, 51671, 51677, 51683, 51687, 51693, 51712, 51714, 51726, 51728, 51733, 51734, 51738, 51739, 51741, 51742, 51743, 51749, 51757, 51762, 51766, 51771, 51774, 51775, 51781, 51787, 51789, 51791, 51805, 51814, 51816, 51818, 51820, 51822, 51829, 51830, 51835, 51837, 51838, 51845, 51849, 51853, 51858, 51862, 51864, 51866, 51868, 51874, 51878, 51882, 51886, 51893, 51897, 51922, 51923, 51925, 51926, 51927, 51929, 51930, 51933, 51934, 51935, 51938, 51939, 51941, 51943, 51947, 51949, 51950, 51951, 51957, 51961, 51963, 51967, 51974, 51975, 51976, 51980, 51981, 51982, 51984, 51989, 51990, 51993, 51995, 51997, 51998, 51999, 52005, 52011, 52013, 52014, 52015, 52018, 52021, 52027, 52029, 52031, 52038, 52042, 52043, 52046, 52047, 52062, 52070, 52072, 52074, 52076, 52077, 52078, 52085, 52091, 52093, 52094, 52095, 52101, 52102, 52109, 52110, 52114, 52142, 52149, 52150, 52152, 52153, 52154, 52155, 52156, 52157, 52159, 52165, 52166, 52173, 52174, 52181, 52182, 52187, 52189, 52190, 52191, 52197, 52201, 52203, 52205, 52207, 52208, 52213, 52217, 52219, 52221, 52223, 52226, 52227, 52229, 52231, 52234, 52237, 52238, 52245, 52251, 52253, 52255, 52258, 52261, 52266, 52269, 52274, 52277, 52278, 52280, 52281, 52282, 52283, 52284, 52286, 52290, 52296, 52298, 52300, 52333, 52339, 52341, 52342, 52345, 52346, 52347, 52350, 52376, 52380, 52392, 52396, 52400, 52406, 52408, 52412, 52414, 52421, 52429, 52435, 52440, 52444, 52453, 52456, 52457, 52460, 52466, 52470, 52472, 52476, 52478, 52483, 52487, 52496, 52501, 52502, 52506, 52507, 52509, 52510, 52511, 52530, 52533, 52536, 52538, 52539, 52540, 52541, 52542, 52543, 52550, 52554, 52558, 52589, 52597, 52601, 52605, 52624, 52626, 52630, 52634, 52635, 52638, 52642, 52645, 52646, 52649, 52650, 52651, 52653, 52654, 52678, 52682, 52686, 52695, 52701, 52711, 52728, 52731, 52732, 52735, 52739, 52741, 52743, 52749, 52773, 52777, 52848, 52869, 52873, 52912, 52933, 52937, 52965, 52969, 52984, 52988, 52994, 52995, 52999, 53002, 53008, 53013, 53014, 53017, 53019, 53022, 53023, 53029, 53035, 53037, 53038, 53039, 53045, 53051, 53053, 53054, 53055, 53061, 53062, 53065, 53067, 53069, 53070, 53071, 53085, 53086, 53094, 53101, 53102, 53109, 53113, 53118, 53125, 53126, 53129, 53133, 53134, 53165, 53166, 53168, 53173, 53176, 53177, 53180, 53190, 53192, 53196, 53198, 53205, 53206, 53209, 53211, 53214, 53215, 53221, 53225, 53227, 53229, 53231, 53232, 53240, 53243, 53244, 53247, 53264, 20496, 53267, 53269, 20502, 53270, 53271, 53274, 53277, 20510, 53280, 20512, 53286, 53290, 20528, 53296, 53301, 53302, 53305, 53306, 20544, 53312, 53318, 53322, 20566, 20574, 53347, 20582, 53351, 20590, 53360, 53365, 53366, 53370, 53373, 53375, 53376, 20608, 53382, 53386, 53392, 20624, 53395, 53399, 53407, 53408, 20646, 20654, 53429, 53437, 53439, 20672, 53446, 53450, 20688, 20694, 20702, 53475, 53479, 53485, 53493, 53497, 20738, 20747, 20750, 53520, 53525, 53526, 53529, 53530, 53533, 53534, 53541, 53545, 53549, 20790, 20792, 20796, 20798, 53573, 53574, 53577, 53578, 53581, 53582, 53600, 53605, 53609, 53611, 53615, 20854, 20856, 20860, 20862, 53637, 53638, 53642, 53643, 53645, 53646, 53647, 53648, 53653, 53657, 53659, 53663, 53670, 53678, 53685, 53689, 53701, 53702, 53705, 53709, 53710, 53717, 53718, 20952, 53722, 53723, 20956, 53725, 53726, 53727, 53728, 53749, 53753, 20994, 20997, 21000, 21001, 21003, 21004, 21006, 21007, 53792, 21029, 21030, 53797, 21032, 53801, 21036, 21037, 21038, 21045, 53813, 21049, 21046, 21051, 21053, 53821, 21055, 53823, 53822, 53819, 21054, 21061, 21062, 21064, 21068, 21069, 21070, 21080, 21083, 21084, 53853, 21087, 53877, 21110, 21109, 21112, 21115, 53883, 53885, 21118, 21119, 21117, 53887, 53886, 53888, 53893, 53897, 53901, 21157, 21158, 21165, 21166, 53936, 53952, 53957, 53961, 21211, 53984, 53989, 53993, 53997, 21237, 21241, 21243, 21247, 54032, 54034, 54037, 54038, 54039, 54040, 54041, 54043, 54044, 54046, 54047, 54051, 54053, 54055, 54059, 54061, 54062, 54063, 54067, 54069, 54071, 54075, 54077, 54079, 54082, 54083, 54085, 54086, 54087, 54088, 54090, 54092, 54093, 54094, 54114, 54119, 54126, 54130, 54131, 54135, 54139, 54142, 54143, 54144, 54146, 54149, 54150, 54154, 54155, 54157, 54158, 54159, 54162, 54167, 54173, 54174, 54178, 54179, 54190, 54194, 54197, 54200, 54202, 54203, 54204, 54205, 54206, 54207, 54208, 54213, 54214, 54216, 54217, 54219, 54220, 54221, 54222, 54223, 54226, 54237, 54238, 54242, 54247, 54253, 54254, 54256, 54258, 54261, 54264, 54266, 54268, 54269, 21506, 21509, 21512, 21513, 21514, 21516, 54306, 54309, 21541, 21547, 21549, 54317, 21551, 21557, 21560, 21561, 21563, 21564, 21565, 21567, 21573, 21576, 21579, 21580, 21581, 21583, 21618, 21621, 54391, 21624, 21625, 21626, 21627, 21628, 21629, 21631, 54402, 54405, 54409, 54413, 54414, 21672, 21675, 21676, 21679, 54448, 54450, 54453, 54455, 54457, 54458, 54462, 54466, 54469, 54474, 54477, 21714, 21717, 21721, 21722, 54498, 54501, 54505, 54509, 54510, 54514, 54517, 21749, 21753, 54522, 21755, 54521, 54526, 21759, 21766, 21770, 54544, 21782, 21786, 21790, 54560, 54581, 54582, 21816, 54584, 54587, 21820, 54588, 54589, 54591, 54592, 54590, 54598, 54600, 54602, 54604, 54613, 54617, 21862, 21866, 21870, 54645, 54646, 54648, 54649, 54651, 54652, 54653, 54654, 54655, 54656, 54662, 54664, 54666, 54668, 54678, 54680, 54682, 54684, 21926, 21930, 21934, 54720, 21974, 54742, 54744, 21978, 54746, 54748, 21982, 54752, 22008, 22012, 54800, 54805, 54806, 22038, 54809, 22042, 54810, 54811, 54813, 22046, 54814, 54815, 54848, 54853, 54854, 54856, 54857, 54858, 54860, 54862, 54880, 54886, 22118, 22122, 54890, 22126, 54894, 54918, 54920, 54922, 54924, 54926, 54928, 54934, 54936, 54938, 54940, 54942, 54949, 22182, 54950, 54953, 22186, 54954, 22190, 54958, 54976, 54981, 54985, 54989, 54997, 54998, 22230, 55000, 55001, 22234, 55002, 55004, 55006, 22238, 55019, 55023, 55062, 55070, 55077, 55081, 55083, 55085, 55086, 55087, 55093, 22326, 22330, 55099, 55101, 55102, 55103, 55109, 55110, 55113, 55114, 55118, 55134, 55150, 55155, 55159, 55163, 30503, 55166, 55167, 55168, 55173, 55174, 55176, 55179, 55180, 55181, 55182, 55183, 55214, 55219, 55221, 55223, 55227, 55229, 55231, 55232, 55237, 55238, 55245, 55246, 55261, 55262, 55278, 55280, 55285, 22518, 22522, 55293, 55318, 55320, 55324, 55326, 55330, 55333, 55341, 55342, 55344, 22581, 55349, 22585, 22587, 55357, 55358, 55359, 55355, 22591, 55366, 22600, 55370, 22604, 55374, 55400, 55403, 55404, 55407, 55413, 55415, 55419, 22651, 55422, 22655, 55423, 55421, 55426, 55429, 55430, 55432, 55435, 55436, 55437, 55438, 55439, 55448, 55451, 55452, 55455, 55462, 22696, 55466, 22700, 55470, 55477, 55479, 55480, 55483, 55484, 55485, 55487, 55490, 55493, 55494, 55498, 55501, 55502, 55509, 55510, 55515, 55517, 55518, 55519, 55522, 63139, 55534, 55536, 55541, 22773, 22777, 55549, 55560, 55563, 55564, 55567, 55568, 22800, 55576, 55580, 22848, 55632, 55648, 55664, 22912, 55696, 22928, 55704, 55708, 22976, 55776, 23042, 23045, 23048, 23049, 23051, 23052, 23054, 55824, 23056, 55829, 55830, 55832, 55833, 55834, 55836, 55837, 55838, 55845, 23077, 55849, 55853, 23085, 63205, 23094, 23096, 23099, 23100, 23102, 23103, 23104, 55877, 55878, 23109, 55881, 55882, 23117, 55885, 55886, 23131, 55901, 23135, 55904, 55912, 55916, 55925, 23158, 23160, 23163, 23164, 55933, 23166, 23167, 23168, 55941, 55942, 55946, 55947, 55949, 55950, 55951, 55960, 55964, 23205, 55974, 23213, 55982, 55989, 55993, 23232, 56005, 56006, 56009, 56013, 56014, 23248, 56021, 56022, 23256, 56026, 56027, 23260, 56029, 56030, 56031, 56032, 56040, 56044, 56053, 56057, 23291, 23295, 23298, 23304, 23306, 23308, 56080, 56082, 56085, 56086, 56087, 56088, 56089, 56091, 56092, 56094, 56095, 56107, 56111, 23349, 56123, 23357, 23355, 56127, 23359, 56130, 30695, 56133, 56134, 56136, 56138, 56140, 56141, 56142, 56158, 56162, 56166, 56167, 56168, 56172, 56174, 23413, 23417, 56187, 23419, 23421, 56190, 23423, 56191, 56197, 56201, 56203, 56205, 56210, 56215, 56221, 56222, 56226, 56238, 56240, 56248, 56252, 56261, 56262, 56265, 56267, 56270, 56271, 56274, 56277, 56278, 23509, 23513, 56282, 56283, 56285, 56286, 56290, 56293, 56295, 56296, 56297, 56300, 56302, 56304, 23567, 56342, 56347, 56350, 56351, 56352, 56357, 56358, 56360, 56361, 56362, 56363, 56364, 56365, 56367, 23605, 56374, 23606, 23608, 23609, 56378, 23610, 23612, 56384, 56389, 56390, 56392, 56393, 56394, 23627, 56396, 56395, 56398, 56399, 23631, 56422, 56430, 56438, 23672, 56442, 56443, 23676, 56447, 56453, 56454, 56456, 56458, 56460, 56461, 56462, 56470, 56472, 56474, 56476, 56478, 56480, 56486, 56490, 23723, 56494, 23727, 56496, 56498, 56501, 56506, 56507, 56509, 56510, 56511, 56517, 56518, 56520, 56522, 56523, 56524, 56525, 56527, 56534, 56536, 56538, 56540, 56542, 56549, 56550, 56552, 56554, 56555, 56556, 56557, 56559, 56560, 56562, 56565, 23798, 23797, 23800, 23801, 23802, 56570, 23804, 56573, 56574, 23810, 23813, 23816, 56584, 56587, 56588, 23820, 23822, 56591, 23821, 56597, 56598, 56601, 56602, 56603, 56605, 56606, 56607, 56613, 23846, 23848, 56617, 56619, 23852, 23854, 56623, 23861, 23862, 23864, 23865, 23866, 23867, 23868, 23871, 56645, 56646, 23878, 56648, 56649, 23880, 56651, 56652, 23884, 56654, 23886, 56656, 56655, 56672, 56686, 56688, 23931, 56709, 56710, 56713, 56717, 56718, 56720, 56726, 56728, 56732, 56734, 56741, 56742, 56745, 56746, 56747, 56750, 56751, 56752, 56773, 56777, 56781, 24027, 56798, 56813, 24053, 24054, 24056, 24057, 24058, 24059, 24060, 24063, 24069, 24073, 24075, 24077, 24079, 56869, 24102, 56873, 56875, 24110, 56879, 24117, 24118, 24120, 24122, 24123, 24124, 24125, 24127, 56901, 24134, 56905, 56907, 24142, 56911, 56917, 24152, 24156, 56925, 56944, 24181, 56949, 24184, 24188, 56957, 24189, 56997, 24230, 57001, 57003, 24238, 57007, 57008, 24310, 24312, 24314, 24315, 24316, 24319, 24373, 24325, 24328, 24329, 24332, 24335, 57106, 57109, 57112, 57113, 57115, 57116, 57118, 57119, 24379, 57123, 57125, 57127, 24357, 24363, 24365, 57134, 24367, 57135, 57129, 57131, 57139, 57133, 57141, 24374, 24376, 24378, 57147, 24380, 57150, 57151, 57149, 24377, 57155, 57152, 24389, 57158, 24383, 57160, 57161, 57162, 57163, 57164, 24397, 57166, 24399, 24395, 57167, 57182, 57190, 57192, 57196, 57198, 24434, 57203, 57202, 57205, 57207, 24442, 57211, 57213, 57214, 57215, 57218, 57222, 57224, 57226, 57227, 57228, 57231, 57251, 57262, 57264, 57266, 57269, 57272, 57273, 57274, 57276, 57278, 57285, 57286, 57288, 57289, 57290, 57291, 57292, 57295, 24530, 57302, 57304, 24538, 57307, 57306, 57308, 57314, 57318, 57320, 57322, 57323, 57324, 57326, 57327, 57330, 57333, 24565, 24566, 57336, 57337, 24569, 24571, 57338, 57341, 24570, 24568, 57344, 24575, 24572, 57340, 57350, 57352, 57354, 24590, 24592, 57360, 57359, 57356, 57358, 24597, 57365, 4889, 57368, 57369, 57370, 57371, 24604, 24605, 57366, 24600, 24608, 57376, 57372, 57375, 24613, 57381, 24617, 57385, 4894, 24624, 57392, 24629, 57398, 24630, 57397, 24633, 57401, 24638, 57406, 24640, 57408, 4887, 24645, 57413, 24649, 57417, 4899, 57424, 57429, 57430, 24669, 57436, 57440, 57439, 57437, 57435, 57446, 57448, 57450, 24685, 57451, 24688, 57452, 57455, 57456, 57453, 24693, 24694, 57461, 57462, 57465, 57466, 24698, 24697, 24700, 57470, 24702, 24704, 57472, 4909, 24709, 57477, 24713, 57481, 57488, 24720, 24725, 24726, 24728, 24729, 24730, 24732, 24736, 57504, 57509, 24744, 24747, 24748, 57517, 24751, 57526, 24758, 24760, 57528, 57530, 57531, 24764, 24763, 24762, 24767, 24768, 57535, 57532, 24773, 57541, 24777, 57545, 57552, 57557, 57565, 57568, 57574, 57573, 57578, 57577, 24816, 57584, 24824, 57592, 24827, 24828, 57596, 57595, 57599, 24831, 24834, 24846, 57616, 57621, 24854, 57622, 24853, 24857, 24858, 57627, 24859, 24861, 24862, 57631, 57629, 57630, 57626, 24863, 24869, 24877, 24882, 24885, 24886, 24889, 24891, 24894, 24895, 24901, 57670, 24902, 57672, 57669, 24906, 57675, 57676, 24909, 57678, 24910, 57679, 57677, 24905, 24911, 24907, 24928, 57701, 57702, 57705, 57706, 57707, 57710, 57711, 24950, 24955, 24958, 57733, 24966, 24968, 57737, 24970, 24972, 57741, 24974, 24976, 24978, 57749, 24981, 24985, 57753, 57755, 24986, 57759, 24994, 24997, 57766, 57768, 25001, 57770, 25002, 25003, 25005, 57774, 25007, 57772, 25006, 25013, 25017, 25021, 25042, 57813, 25046, 25047, 25048, 57817, 25050, 57814, 25052, 57821, 25054, 4903, 57824, 57822, 25058, 57818, 25061, 25063, 25065, 25067, 25070, 25071, 4983, 25077, 25081, 25083, 25085, 25087, 57856, 57861, 25093, 25095, 25096, 25097, 4905, 25099, 25100, 25101, 57869, 25103, 57893, 57894, 25125, 57896, 25129, 57898, 57899, 57900, 57901, 57903, 25138, 25141, 25147, 25149, 25150, 25151, 57925, 57926, 25158, 57928, 57930, 57931, 57932, 57933, 25166, 57935, 57941, 57944, 25176, 57947, 25180, 25181, 57949, 57948, 57951, 25205, 57973, 57976, 25211, 57979, 57981, 57980, 57983, 25215, 25213, 25221, 25225, 25229, 25234, 25246, 25254, 58022, 58024, 58026, 58028, 25262, 25264, 25269, 58037, 63639, 25273, 58041, 58045, 25285, 25289, 25317, 25321, 25325, 58101, 25333, 58105, 25337, 25339, 58109, 25343, 25346, 25347, 25351, 25354, 25357, 25358, 57143, 25360, 58128, 58133, 58134, 25366, 25368, 58137, 58139, 25372, 58141, 25374, 58143, 58142, 58150, 58152, 58154, 25387, 58156, 25391, 58160, 58166, 58170, 25406, 58174, 25413, 58182, 25414, 58186, 58187, 25421, 58190, 58191, 25422, 57157, 57159, 58208, 58213, 58214, 58219, 58221, 58222, 58223, 25459, 25461, 58230, 58229, 58233, 25465, 58234, 25470, 58238, 58246, 25478, 58254, 25486, 58256, 5067, 25501, 25502, 58271, 58267, 58278, 58282, 25517, 25518, 58286, 58287, 58283, 25525, 58294, 58293, 58296, 58297, 25529, 25531, 58300, 58301, 25533, 25535, 58302, 58309, 25542, 25544, 58312, 25547, 25548, 58317, 25550, 58316, 25551, 25555, 58326, 58331, 25565, 25566, 58335, 58334, 58336, 58341, 58345, 25584, 58352, 25589, 58358, 58357, 58360, 25595, 58364, 25597, 58366, 25599, 58365, 25602, 25607, 25610, 37659, 25634, 58405, 25637, 58408, 58406, 25643, 25645, 58413, 25647, 37662, 58411, 25650, 25646, 58412, 25653, 58414, 25657, 25659, 25661, 25662, 25663, 25666, 25669, 25670, 58438, 25672, 25673, 25674, 58443, 58444, 25675, 25676, 58447, 58440, 25678, 25677, 58446, 58445, 37669, 25679, 58480, 37675, 25714, 25717, 37676, 25721, 25723, 25725, 25726, 25727, 58501, 58505, 58509, 25746, 25754, 58533, 25766, 58536, 25768, 58539, 25772, 25773, 25774, 58543, 58544, 58541, 58540, 25776, 25781, 58549, 58553, 25789, 58557, 25797, 58565, 25805, 58573, 58597, 58601, 58605, 25842, 25845, 58613, 25848, 25849, 58617, 25851, 25852, 58621, 25854, 25855, 58624, 25856, 25853, 37704, 25862, 25866, 25872, 25877, 25878, 58645, 25880, 58649, 25884, 25885, 25886, 25887, 25883, 58653, 58662, 58664, 58666, 58668, 25920, 58694, 58696, 58698, 58700, 25936, 58704, 24696, 58725, 25958, 25957, 25960, 58729, 25963, 25964, 25965, 25966, 25967, 25968, 58736, 58733, 25984, 26000, 26021, 58789, 58790, 58792, 26025, 58794, 58795, 58796, 58797, 58798, 58799, 26032, 26029, 58805, 58809, 58813, 26048, 26064, 26069, 58837, 58838, 58840, 26073, 58843, 58844, 26077, 58845, 58847, 58846, 37752, 58869, 58873, 58877, 58896, 26128, 26133, 26134, 58901, 26136, 58905, 26138, 26139, 26140, 58909, 26142, 58911, 26143, 26141, 58907, 58910, 26162, 26170, 26176, 26182, 58950, 26186, 58954, 58958, 26190, 58976, 26213, 26214, 58981, 26216, 26217, 58985, 26219, 26220, 26221, 26222, 26223, 58991, 58989, 58987, 26229, 26233, 26240, 59024, 26256, 26258, 26262, 59030, 26266, 26267, 59034, 26270, 59038, 26274, 26277, 59045, 26278, 26280, 26281, 26282, 26283, 59052, 26285, 59053, 59055, 59054, 26286, 26284, 59051, 26304, 59078, 26310, 26314, 59082, 59086, 26318, 26320, 59093, 59094, 26327, 26328, 59096, 26329, 59099, 26332, 26333, 26334, 59101, 59097, 59100, 59103, 59102, 59104, 26341, 26343, 26344, 26345, 26348, 59136, 26371, 59142, 26374, 26376, 59145, 59148, 26380, 26381, 26384, 59150, 26382, 59157, 26390, 26389, 26393, 59163, 26395, 59165, 26398, 26399, 59168, 59167, 26405, 59174, 59173, 59179, 26413, 26414, 59181, 59184, 59182, 59183, 26418, 26421, 59189, 57355, 59190, 26429, 26430, 59199, 26431, 59195, 59197, 59198, 59205, 26438, 59206, 26437, 26441, 59210, 26442, 59211, 59213, 26446, 59214, 59216, 59215, 59221, 59222, 59224, 59227, 59228, 26461, 59229, 59230, 59232, 26462, 59237, 59238, 59241, 26478, 59247, 59248, 26483, 59243, 59253, 26485, 59246, 59257, 26489, 26491, 59259, 37830, 26495, 26496, 59264, 59263, 59260, 59262, 26501, 59270, 26502, 59272, 37832, 26504, 26507, 26508, 26509, 26510, 59276, 26511, 26514, 59278, 59285, 59289, 59291, 59295, 59302, 59306, 26542, 26544, 59312, 26549, 59317, 59321, 26553, 26555, 59323, 26557, 59325, 26559, 26560, 59327, 59328, 26565, 26566, 26573, 26574, 26578, 26579, 26583, 26590, 6267, 59360, 26594, 59366, 59368, 59372, 26605, 59374, 26608, 59376, 26606, 59381, 26613, 26614, 26618, 26621, 59389, 26623, 26627, 26629, 26632, 26633, 26636, 26637, 26639, 26645, 26646, 59413, 26648, 26649, 26650, 26651, 26652, 59421, 59419, 26655, 59424, 59423, 26661, 59430, 59429, 26665, 59434, 59435, 26667, 26670, 59439, 59440, 26674, 26671, 59438, 26677, 26669, 26681, 26683, 26686, 26687, 26688, 59456, 26693, 59462, 59461, 26696, 59464, 59466, 26697, 59468, 59469, 26699, 59471, 26703, 59467, 26700, 26702, 59470, 59493, 59494, 59496, 59497, 59498, 59499, 59500, 59503, 26736, 26738, 26739, 59509, 26741, 26743, 59513, 26745, 26747, 59515, 59514, 26751, 59512, 59519, 59516, 26757, 59525, 26758, 26760, 26761, 59529, 59531, 26764, 26763, 26766, 26767, 59535, 59532, 26770, 26765, 59534, 26773, 59541, 59542, 59544, 59545, 26777, 59547, 59546, 59548, 26778, 59551, 59552, 26789, 59558, 59560, 26793, 59562, 59563, 59564, 59567, 26800, 26805, 59574, 26806, 59573, 26809, 59578, 57432, 26812, 59580, 26813, 26810, 26808, 59576, 59581, 57433, 26811, 26821, 57434, 26815, 59583, 26825, 59593, 59595, 26827, 26829, 59589, 26831, 59599, 26834, 26835, 59605, 26838, 26839, 26840, 59609, 26837, 59611, 26844, 26845, 26846, 26847, 59615, 26850, 26853, 59621, 59624, 26857, 59622, 26859, 59628, 26861, 59630, 26863, 26864, 59632, 26866, 59631, 26869, 59637, 26862, 26872, 26873, 26876, 59645, 26877, 26878, 57445, 26885, 59653, 26893, 59661, 59664, 26901, 26902, 26904, 26905, 26906, 26907, 26908, 26911, 26944, 59712, 26949, 59717, 26953, 59721, 26955, 59723, 26959, 59727, 59734, 59738, 59744, 59750, 59752, 59754, 59756, 59766, 59770, 27008, 59781, 59785, 59787, 59791, 27024, 59792, 59797, 59798, 59800, 59801, 59802, 59803, 59804, 59807, 59840, 27077, 27081, 27083, 27087, 27091, 59861, 27095, 59865, 59867, 27101, 59871, 59872, 27107, 27111, 27117, 59904, 27138, 27141, 27144, 27145, 27148, 27149, 27150, 59920, 27157, 59926, 27158, 27160, 27161, 27162, 27163, 59930, 27164, 27166, 27167, 59934, 59935, 59933, 27165, 59931, 27173, 27181, 27186, 27189, 27190, 27193, 27195, 27198, 27199, 59968, 27200, 27205, 27206, 59973, 59976, 27209, 27210, 27211, 59980, 59981, 27213, 59983, 59982, 27215, 27214, 59979, 59989, 31462, 59992, 59996, 59997, 60000, 60005, 60006, 60008, 60009, 60010, 60011, 60012, 60014, 60015, 60021, 27254, 60024, 27259, 60028, 60029, 27262, 27263, 27264, 60037, 27270, 27272, 60041, 27274, 60043, 27276, 60045, 27278, 60047, 60048, 27282, 60053, 60054, 60056, 60057, 60059, 27290, 60058, 60060, 60063, 27298, 60070, 60072, 27306, 60076, 27309, 27310, 60078, 60074, 27317, 27321, 27325, 60096, 27333, 27337, 27339, 27343, 27344, 27346, 27347, 60117, 60118, 27350, 27351, 60121, 27354, 60123, 60122, 27357, 27358, 27359, 60128, 60126, 27362, 27363, 27356, 27365, 27366, 27367, 27368, 27369, 27370, 27371, 27372, 27373, 27374, 27375, 27381, 27385, 27387, 27389, 27391, 60160, 60165, 27399, 60168, 60166, 60172, 27405, 60174, 27406, 27408, 60176, 27413, 27414, 60182, 27416, 27417, 27418, 27419, 60185, 60189, 60190, 27422, 27423, 27420, 60192, 27429, 60197, 27433, 27435, 60203, 27437, 27439, 60207, 27442, 27438, 60208, 27445, 27449, 27451, 27453, 60219, 27455, 60224, 27456, 60223, 60229, 27462, 60230, 27461, 27465, 60233, 27467, 60235, 60237, 27470, 60239, 27471, 60238, 27469, 27468, 60245, 60246, 60251, 60252, 60249, 60256, 60255, 60254, 27486, 60262, 60261, 27496, 60265, 27500, 60269, 60270, 27502, 60271, 60267, 60266, 60268, 27509, 60278, 60280, 60282, 27515, 60286, 27518, 27519, 60284, 27517, 27525, 60293, 27526, 60294, 27529, 60297, 60299, 27531, 27533, 27534, 60303, 27535, 60304, 60302, 27538, 60309, 60310, 60312, 60313, 60314, 60315, 27549, 27550, 60319, 60316, 60320, 60326, 60325, 60331, 27565, 27566, 60334, 60335, 60333, 31531, 60341, 27573, 60342, 27576, 60345, 60346, 27579, 27578, 60349, 27581, 60344, 27580, 60348, 27583, 27589, 60357, 27590, 27592, 27593, 60361, 27595, 60363, 27597, 27598, 60367, 27599, 27596, 60365, 60373, 27605, 27606, 60374, 60377, 60379, 27613, 60382, 27614, 60384, 27615, 60383, 60389, 27621, 27622, 27624, 27625, 60393, 27627, 60395, 27629, 27626, 27631, 27632, 60400, 60399, 27628, 27637, 60405, 27641, 60409, 27643, 27645, 60413, 27647, 27650, 27651, 27653, 27655, 27658, 27661, 27662, 27669, 27670, 60437, 27672, 27675, 27676, 60445, 27678, 60447, 27679, 27682, 27677, 60443, 60453, 60456, 27690, 27691, 60460, 60461, 27695, 27698, 27701, 60470, 27702, 27704, 27705, 27706, 27707, 27708, 60474, 27710, 60478, 27714, 27720, 60488, 27722, 27723, 60492, 27724, 27727, 27750, 60517, 27752, 27756, 27757, 27758, 60528, 60527, 60525, 27763, 60523, 27765, 27766, 60534, 27768, 27769, 27770, 27771, 60538, 27772, 60542, 27774, 27776, 27800, 27804, 60581, 27814, 60582, 60584, 27816, 60588, 60589, 60590, 60591, 60592, 27820, 27822, 60587, 27829, 60598, 60597, 27832, 60600, 27830, 60603, 60604, 27837, 60606, 27839, 27840, 27835, 27836, 27838, 60607, 60613, 60605, 60621, 27859, 60629, 60630, 27862, 27864, 60632, 60635, 27868, 60636, 27870, 60639, 60637, 60638, 27877, 27880, 27881, 27884, 27890, 27893, 27894, 60662, 27896, 27897, 27898, 27899, 27900, 27901, 60668, 60671, 27903, 60670, 60669, 27902, 27907, 27909, 60677, 27911, 27917, 60685, 60688, 27925, 27926, 60694, 60693, 27929, 27930, 60698, 60699, 60701, 60702, 27934, 60704, 60703, 27933, 60709, 60715, 60717, 60719, 27954, 27957, 27958, 27960, 27962, 27963, 27964, 27965, 27966, 27967, 60741, 27974, 60742, 27978, 60747, 60746, 60749, 27982, 60751, 60750, 60758, 60762, 60768, 60773, 60779, 28013, 60781, 60783, 28016, 28021, 60790, 28025, 60794, 28027, 28029, 28031, 60800, 28037, 28041, 28045, 60816, 28050, 28054, 60822, 28058, 60826, 28059, 60830, 28062, 28066, 60837, 28070, 28072, 60841, 28074, 28075, 28076, 60845, 28078, 28080, 60864, 60870, 28102, 28106, 60874, 28110, 60878, 60885, 28119, 60889, 60893, 28126, 60896, 28135, 28141, 28150, 28152, 28154, 28155, 28156, 28159, 28163, 28165, 60933, 28167, 28169, 28171, 60941, 28175, 60960, 28197, 28201, 28245, 28248, 61019, 28252, 28253, 61023, 28272, 28277, 61051, 28285, 61055, 61056, 28293, 28297, 58437, 28336, 61120, 28357, 28361, 61152, 28389, 28393, 28406, 28408, 28410, 28412, 28418, 28419, 28423, 28426, 28432, 28437, 28438, 61205, 28440, 28441, 61209, 28443, 28444, 28445, 28446, 28447, 28453, 61222, 61224, 5656, 61226, 28459, 61228, 61221, 28462, 28463, 61232, 61230, 61231, 28469, 61237, 61238, 28475, 61242, 28478, 61247, 61246, 28479, 61243, 28477, 61245, 28485, 61254, 28486, 61256, 28489, 61258, 61259, 61260, 28493, 28494, 61262, 61263, 61264, 61269, 61270, 31717, 61273, 61275, 28509, 61279, 61280, 61277, 61278, 61285, 61286, 28520, 61289, 28524, 28525, 28526, 61295, 61296, 61291, 61293, 61294, 61301, 61302, 61305, 28537, 61306, 28542, 61310, 28544, 61317, 28550, 61321, 61325, 28558, 61339, 61343, 61349, 61352, 61350, 61355, 61356, 61357, 28590, 61359, 61360, 61358, 61354, 28589, 61365, 28597, 28598, 28600, 28601, 61369, 28603, 28604, 28605, 28606, 28607, 28608, 61372, 61371, 61375, 61374, 61373, 28614, 61384, 28616, 28619, 28620, 61388, 28622, 28623, 61397, 28630, 61398, 61400, 28633, 28629, 61403, 61404, 61405, 28638, 61407, 61406, 61413, 61417, 28651, 61421, 28655, 28656, 61424, 28661, 61430, 61429, 61432, 28665, 28664, 28667, 28668, 28669, 61436, 61439, 28671, 61438, 61437, 28670, 28688, 61456, 61458, 28691, 28693, 61461, 28695, 61463, 61465, 61466, 61464, 28700, 28701, 61468, 28703, 28704, 61472, 61470, 61474, 28713, 28720, 61491, 61495, 28729, 28736, 61504, 61506, 28739, 28741, 61509, 61511, 28744, 28745, 61512, 28743, 61516, 61517, 61518, 28751, 28748, 28749, 61538, 28771, 28775, 61550, 61555, 61559, 28800, 61568, 61570, 28803, 28805, 61575, 28808, 61576, 28807, 28812, 28813, 61582, 28815, 61580, 28819, 61586, 28823, 61591, 61602, 61618, 28853, 28854, 61621, 61624, 61625, 61626, 61627, 28858, 61628, 28861, 28863, 28864, 61632, 61634, 28867, 28869, 61639, 28872, 61640, 28871, 61644, 28876, 28877, 28879, 61650, 28883, 61646, 61655, 28887, 61662, 61666, 28899, 28903, 28912, 28909, 61682, 28917, 61685, 61688, 28921, 61690, 61691, 61692, 61689, 61698, 61707, 61710, 61712, 28949, 61718, 28953, 61722, 28955, 28957, 61726, 28959, 28965, 28969, 28973, 61746, 28978, 61749, 28981, 28985, 61754, 28986, 61753, 61758, 28990, 28997, 28998, 61766, 29001, 61770, 29005, 61774, 29006, 29024, 61792, 29029, 29033, 29037, 29040, 29042, 61810, 29048, 61816, 61818, 29050, 61820, 29052, 64390, 29061, 61830, 29065, 61834, 61838, 61840, 29072, 29074, 61842, 29077, 29078, 29081, 29085, 29086, 61854, 5781, 61858, 29090, 29093, 61861, 29097, 29098, 61865, 29099, 29101, 61866, 29103, 29104, 5785, 29125, 29129, 29133, 29141, 61910, 61912, 29145, 61914, 29147, 61916, 29149, 61918, 29151, 61920, 61922, 29154, 29157, 61928, 29161, 29162, 29163, 29164, 29160, 61930, 29167, 61932, 61954, 12314, 29189, 61960, 61964, 29197, 29216, 31859, 29221, 61993, 29225, 62002, 62003, 29234, 62007, 29239, 29235, 62021, 62022, 62029, 62030, 29301, 29309, 29312, 62085, 29317, 29321, 62089, 29330, 29331, 62099, 5830, 62098, 29335, 62103, 29338, 62133, 29365, 29369, 62137, 29373, 29376, 62149, 29381, 29385, 62153, 62171, 29408, 29413, 62185, 29417, 29429, 62197, 29433, 62201, 62203, 29437, 62207, 62224, 29456, 29458, 29461, 62230, 29463, 29462, 29465, 29466, 29467, 29469, 29470, 29471, 62238, 38422, 29474, 29475, 29477, 29479, 29481, 29483, 29486, 29490, 29491, 62258, 29493, 29495, 29499, 29502, 29501, 29506, 29507, 29509, 29510, 29511, 29512, 62278, 29514, 29515, 29516, 29517, 29518, 62286, 29519, 29513, 29538, 29543, 62322, 29555, 62323, 29557, 29559, 29554, 29563, 29561, 29566, 29567, 29570, 29571, 29573, 29574, 29575, 29576, 29577, 29578, 29579, 29580, 29581, 29582, 62352, 29586, 62354, 29591, 29603, 29602, 29607, 62386, 29618, 29621, 29622, 29624, 29625, 62394, 29627, 29628, 29630, 29631, 62398, 29634, 29635, 29637, 62406, 29639, 29640, 29641, 29642, 29643, 29644, 29638, 29646, 62414, 29650, 29651, 62419, 62423, 29655, 29661, 29662, 62430, 29664, 29666, 29667, 62434, 29671, 29678, 29677, 29680, 62450, 29685, 29686, 29688, 29689, 62458, 29691, 29692, 29693, 62462, 29694, 62466, 62469, 62472, 62473, 62476, 38472, 29730, 29733, 29737, 29742, 62514, 29746, 29758, 62578, 29815, 62585, 29826, 29829, 29833, 29834, 29837, 29838, 29842, 62610, 29850, 29872, 29874, 29877, 29879, 29881, 29882, 29885, 29886, 29890, 29893, 29897, 29898, 29902, 62674, 62677, 62681, 62682, 29922, 29925, 29929, 29930, 29933, 29934, 29938, 29941, 29945, 29946, 29949, 29950, 29952, 29968, 62741, 62742, 29976, 62745, 29980, 62749, 62750, 29984, 30003, 62771, 30007, 62775, 30016, 30024, 30028, 62829, 62830, 30067, 62835, 30069, 62837, 30071, 62839, 30077, 62845, 30079, 30080, 62847, 30088, 30092, 30096, 62867, 30099, 30103, 62871, 62883, 30115, 62887, 30119, 62894, 62901, 62905, 30144, 30152, 30156, 30160, 62941, 62942, 30176, 62947, 30179, 62951, 30183, 45077, 62957, 30189, 62965, 62968, 62969, 62972, 45081, 45082, 6007, 30224, 30229, 30230, 62997, 30232, 30233, 63002, 62998, 63001, 30237, 30238, 63006, 63005, 30239, 30235, 30236, 30258, 63027, 30259, 63029, 30261, 30263, 63031, 63026, 30267, 63035, 30269, 30270, 63039, 30272, 30271, 63038, 63037, 64633, 30277, 30278, 30280, 30281, 30283, 30284, 30285, 30286, 30287, 30304, 63077, 63078, 30309, 63081, 63082, 30315, 30313, 63085, 63086, 30319, 30322, 63091, 63090, 63093, 30323, 30327, 30325, 63095, 30330, 63098, 30333, 30334, 63103, 30336, 30335, 63102, 63101, 30341, 30344, 30345, 30348, 30349, 30352, 30357, 30360, 30363, 30364, 30365, 30367, 63138, 30371, 30370, 63141, 63142, 30373, 63143, 63145, 63146, 63147, 30375, 63149, 63150, 30383, 63151, 30381, 38602, 30379, 30382, 38605, 30400, 30405, 30408, 30409, 30412, 30413, 30416, 30421, 63189, 63190, 30424, 30425, 63194, 63193, 30428, 30429, 63197, 63198, 30432, 63202, 30435, 30434, 30437, 63203, 63207, 30439, 30441, 63210, 30443, 30442, 63213, 63214, 30447, 63215, 30445, 30446, 63253, 30485, 30486, 63254, 30489, 63257, 30491, 63261, 63262, 30493, 30494, 30495, 30499, 63271, 63289, 30521, 30533, 63302, 30534, 63301, 63305, 63306, 30538, 30537, 30541, 30542, 63310, 30579, 63347, 30583, 30587, 30591, 30595, 63365, 63366, 63367, 30599, 63369, 30597, 30601, 30598, 30605, 63373, 63374, 30606, 30640, 63410, 30643, 30646, 30647, 30648, 63418, 30651, 30652, 30654, 30655, 63422, 30659, 63429, 30662, 63431, 30663, 63430, 63433, 30661, 30665, 30669, 63438, 63437, 30670, 63443, 30675, 30685, 30691, 63463, 30701, 30704, 63474, 30710, 30712, 63482, 30716, 30718, 63486, 30741, 30742, 30744, 30746, 30747, 30748, 30749, 63515, 63519, 30751, 30752, 30754, 30757, 30758, 30765, 30766, 63539, 30771, 30774, 63543, 63544, 63545, 30777, 30778, 63548, 30773, 30782, 30775, 63552, 30776, 30780, 30789, 30790, 30794, 63563, 30797, 30798, 63567, 30829, 63603, 30835, 30838, 30840, 38694, 30842, 30843, 30844, 63612, 30846, 30847, 30848, 63608, 30850, 30858, 63627, 38698, 63631, 30867, 63635, 30871, 63637, 63643, 63647, 63641, 30877, 63653, 63657, 30890, 30893, 30898, 63669, 30902, 30901, 30904, 63673, 30906, 30907, 30908, 30909, 30910, 30911, 30912, 30914, 38709, 30917, 30918, 38710, 63691, 30925, 30926, 63695, 30931, 63699, 30933, 63707, 30939, 30941, 63711, 30944, 30943, 30946, 30950, 63720, 30952, 30954, 63724, 30956, 30955, 30960, 30959, 30962, 30965, 30966, 38719, 30968, 63733, 30970, 63737, 30972, 30973, 30974, 30992, 63760, 30998, 31000, 31002, 63771, 31004, 63775, 63776, 31008, 63808, 63819, 63823, 31072, 38745, 63872, 31104, 38747, 38748, 63883, 63887, 31120, 63888, 63936, 31168, 63947, 38762, 63951, 31200, 64002, 64011, 64016, 31248, 31253, 64022, 31254, 31256, 31257, 64026, 31259, 31260, 31261, 64030, 64031, 31263, 64027, 38778, 31258, 31269, 64037, 31273, 64041, 64045, 31277, 31282, 64050, 31285, 64053, 31289, 64057, 64059, 31294, 64064, 64063, 31301, 31302, 64070, 64069, 31305, 64074, 64075, 31309, 64078, 64079, 31310, 64077, 31328, 31336, 31337, 31340, 31344, 31346, 64114, 31349, 31352, 64120, 31354, 64124, 31357, 31356, 64128, 64133, 31365, 64134, 31369, 64137, 64139, 64138, 64142, 64143, 31376, 31378, 64146, 31382, 31384, 31385, 31388, 31390, 64162, 31394, 64169, 64170, 31401, 31408, 64192, 31429, 64197, 64201, 31433, 64203, 31437, 64207, 64208, 31445, 64214, 64216, 31449, 64218, 64219, 31451, 64220, 64222, 64223, 31456, 64226, 31455, 31453, 31461, 64229, 31458, 64232, 31464, 64234, 31466, 31468, 64236, 31465, 64233, 31467, 31471, 64251, 64255, 64258, 64266, 64272, 31504, 31506, 31509, 31510, 64278, 31512, 31513, 31514, 31515, 31511, 64285, 64286, 31519, 64288, 31518, 31516, 31517, 64283, 31525, 31533, 31534, 31535, 64306, 31538, 31547, 31551, 64320, 31550, 31554, 31557, 64326, 31558, 31560, 31561, 31562, 64331, 31563, 31564, 64334, 31566, 64335, 31567, 64330, 64352, 31586, 31591, 31614, 31618, 31621, 31622, 64389, 31624, 31625, 31626, 64395, 31628, 64397, 64398, 31629, 64400, 64399, 31634, 31630, 64402, 31639, 64416, 31650, 31669, 31670, 31672, 31673, 31674, 31676, 31682, 31685, 31686, 64453, 64454, 31690, 64459, 64461, 64462, 31694, 31693, 64463, 31698, 31701, 64470, 31704, 31706, 64475, 31708, 31710, 31709, 64480, 31712, 31714, 64478, 64479, 31719, 31725, 31726, 31728, 31721, 31733, 31737, 58415, 64527, 31765, 31766, 64534, 31768, 64533, 31769, 31771, 31772, 64541, 31774, 64542, 31776, 31778, 31775, 31773, 31790, 31792, 64562, 31794, 31797, 64565, 31803, 64571, 64573, 31805, 31807, 31808, 64575, 31813, 31814, 31816, 31818, 31819, 31820, 31821, 31822, 31823, 64614, 64622, 31856, 31858, 64627, 64626, 64629, 31862, 64631, 31865, 31866, 31867, 31863, 31869, 31861, 64639, 31871, 31874, 64637, 64640, 31877, 31878, 31880, 31882, 31884, 31885, 31886, 31890, 64658, 31896, 31898, 31904, 31900, 31920, 31918, 31925, 31926, 31927, 64694, 31929, 64693, 31931, 64701, 31934, 31935, 64702, 64704, 31938, 31942, 31944, 31946, 31948, 31950, 31955, 64723, 31957, 64725, 31959, 31960, 64729, 64727, 64726, 31961, 31965, 64733, 64734, 31964, 64738, 31970, 31973, 31974, 64741, 31976, 31977, 64746, 31979, 31980, 64749, 31982, 31983, 31984, 64751, 31981, 31978, 64757, 64758, 31990, 64765, 64766, 31998, 64770, 64781, 64782, 32016, 32021, 64790, 32022, 32025, 64794, 32027, 32029, 32030, 64798, 32032, 32031, 64800, 32037, 32041, 64818, 32050, 64826, 64827, 32059, 32058, 64830, 32062, 32069, 32070, 32073, 32075, 32077, 32078, 32079, 32096, 64878, 32112, 64882, 32114, 32122, 64890, 64891, 64894, 32126, 64896, 32128, 32133, 32137, 32141, 32144, 32146, 64914, 32157, 64930, 32162, 32173, 32174, 64942, 32176, 32181, 32185, 32189, 64960, 32192, 32197, 32201, 32205, 32221, 64990, 32224, 32226, 64994, 32238, 65006, 32245, 32249, 32253, 32261, 65029, 65037, 32269, 32293, 65062, 65065, 32297, 65070, 65094, 65102, 65152, 65157, 32389, 32393, 65161, 32432, 65216, 65221, 32453, 32457, 65225, 65248, 32485, 65257, 32489, 65275, 65279, 32530, 65301, 65302, 32533, 32536, 65305, 32538, 32537, 32540, 65309, 65310, 32543, 32539, 32546, 32547, 65312, 32549, 32542, 32551, 32553, 32555, 32557, 32559, 32558, 65330, 32563, 32562, 32567, 65335, 32565, 32571, 32573, 32576, 32575, 32579, 32578, 32581, 32582, 32583, 32584, 32585, 32586, 32587, 65350, 65353, 32590, 32588, 65360, 32591, 65358, 65376, 32610, 32534, 32626, 32627, 65394, 32629, 32631, 32637, 32638, 32639, 65408, 32640, 32645, 65413, 32648, 32649, 65417, 32651, 32652, 32653, 65421, 32541, 32658, 65427, 32659, 65433, 32663, 32675, 32679, 32688, 32690, 65461, 65462, 32693, 32696, 32697, 65465, 32699, 32700, 65469, 65470, 32702, 65472, 32704, 32706, 32709, 65477, 32712, 32713, 32714, 32715, 32716, 32717, 65481, 65485, 65490, 32725, 65494, 32728, 65498, 32729, 32732, 65502, 32733, 32736, 65504, 32738, 32741, 32745, 32747, 32750, 32752, 32751, 32749, 32757, 65525, 65526, 32760, 65529, 32763, 32764, 32765, 65534], 2480: [32770, 32771, 32775, 32782, 34, 35, 37, 38, 32805, 32806, 41, 42, 39, 32809, 32810, 46, 32813, 32814, 32821, 32822, 32825, 32826, 32829, 32830, 66, 67, 70, 71, 32837, 74, 32841, 32842, 32838, 78, 32845, 32846, 32850, 32851, 32855, 32862, 32880, 32882, 32883, 32885, 32887, 32889, 32893, 32894, 130, 131, 134, 135, 32901, 138, 32905, 32906, 32902, 142, 32909, 32910, 162, 32933, 32934, 165, 169, 32937, 32938, 32944, 32949, 32953, 32957, 32958, 194, 195, 198, 32965, 32966, 32969, 202, 32970, 226, 227, 229, 230, 231, 233, 234, 33005, 238, 33006, 33013, 33014, 33017, 33018, 33021, 33022, 256, 33024, 33029, 33037, 290, 291, 293, 295, 301, 304, 309, 310, 33079, 311, 313, 314, 33085, 322, 323, 325, 327, 333, 368, 373, 374, 33143, 375, 377, 378, 33141, 33149, 389, 391, 397, 400, 405, 409, 418, 423, 430, 435, 437, 33207, 439, 441, 450, 451, 455, 462, 464, 469, 470, 473, 474, 485, 487, 493, 499, 501, 33271, 503, 505, 800, 802, 803, 806, 807, 809, 810, 816, 819, 822, 33591, 823, 33597, 832, 834, 838, 841, 842, 880, 883, 886, 887, 33655, 33661, 896, 898, 26230, 901, 902, 905, 906, 912, 917, 918, 921, 922, 928, 934, 935, 937, 938, 944, 33712, 947, 949, 33719, 951, 953, 960, 965, 966, 969, 970, 973, 976, 981, 982, 985, 986, 992, 994, 995, 997, 998, 1001, 1002, 1008, 1011, 1013, 33783, 1015, 1017, 34051, 34053, 34055, 34057, 34082, 34083, 34087, 34090, 34094, 34098, 34099, 34101, 34103, 34105, 34106, 34114, 34115, 34119, 34122, 34126, 34133, 34134, 34141, 34142, 34162, 34163, 34165, 34166, 34167, 34169, 34170, 34173, 34174, 34178, 34179, 34183, 34190, 34194, 34195, 34202, 34210, 34211, 34218, 34227, 34229, 34231, 34233, 34242, 34243, 34250, 34258, 34259, 34266, 34274, 34275, 34279, 34286, 34291, 34293, 34295, 34297, 1536, 34304, 34307, 34309, 34311, 34313, 34338, 34339, 1570, 1571, 1573, 34343, 1575, 1578, 34346, 1581, 34350, 1584, 34354, 34355, 34357, 34359, 1590, 34361, 1594, 34365, 34362, 1602, 34371, 1603, 1605, 34370, 34375, 1607, 1613, 34382, 34389, 34390, 34397, 34398, 1648, 34419, 34421, 1654, 34422, 34423, 1658, 34425, 34429, 34430, 34434, 34435, 1666, 1667, 34439, 34446, 34451, 1685, 1686, 1689, 1690, 34467, 1709, 1715, 34483, 34485, 1717, 1719, 34487, 1721, 34489, 34493, 34498, 34499, 1733, 1735, 34506, 1741, 34515, 1749, 1753, 1762, 34531, 1770, 1779, 34547, 34549, 1781, 34551, 1783, 1785, 34553, 34557, 34567, 1827, 1831, 1834, 1840, 1843, 1846, 1847, 34615, 1859, 1863, 1904, 1907, 1911, 34685, 1922, 1923, 1925, 1927, 58999, 1933, 1936, 1941, 1945, 1955, 1959, 1971, 1973, 34743, 1975, 1977, 34749, 1986, 1987, 1989, 1991, 1997, 1998, 2000, 2009, 2018, 2019, 2023, 2026, 2035, 2037, 34805, 2039, 34807, 2041, 34813, 2048, 34816, 34822, 34823, 34826, 2082, 2083, 2087, 2090, 2094, 2096, 34867, 2099, 34871, 2103, 2106, 34877, 34878, 2115, 2117, 2119, 2125, 2126, 2160, 34930, 2163, 2167, 2169, 2170, 34941, 34942, 2178, 2179, 2181, 2183, 2189, 2190, 2192, 2198, 2202, 2211, 2215, 2222, 34994, 2227, 34995, 2229, 2231, 34999, 2233, 35005, 35006, 2242, 2243, 2247, 2250, 2254, 2256, 2262, 2265, 2266, 2274, 2275, 2277, 2279, 2285, 2286, 35058, 35059, 2291, 2293, 35063, 2295, 2297, 35066, 35069, 35070, 35074, 35075, 35085, 35086, 2338, 2339, 2343, 2346, 2350, 35122, 35123, 35127, 2361, 2362, 35130, 35134, 2370, 2371, 2375, 2378, 2382, 35186, 35187, 35191, 2425, 2426, 35194, 35198, 2434, 2435, 2439, 2446, 2453, 2454, 2457, 2458, 2466, 2467, 2474, 35250, 35251, 35255, 35258, 35262, 2498, 2499, 2506, 2517, 2518, 2521, 2522, 2530, 2531, 2535, 2542, 35314, 35315, 35319, 35322, 35326, 2560, 35330, 35331, 35334, 35338, 35342, 2594, 2595, 2599, 2602, 2608, 35379, 2614, 35383, 2615, 2618, 35389, 35390, 2626, 2627, 2629, 2631, 2637, 2672, 35443, 35445, 35447, 2679, 2682, 35453, 2690, 2691, 2693, 2695, 2701, 2702, 2722, 2727, 2730, 35506, 2739, 35507, 2741, 2743, 35511, 2745, 35514, 35518, 2754, 2755, 2759, 2766, 2773, 2777, 2778, 2786, 2791, 2798, 35570, 35571, 2803, 2805, 35575, 2807, 2809, 35578, 35582, 35587, 35591, 35594, 2848, 2850, 2851, 2854, 2855, 2857, 2858, 2862, 2864, 35634, 2867, 35635, 2869, 2870, 2871, 35639, 2873, 2874, 35646, 2880, 2882, 2886, 2889, 2890, 2894, 2928, 35698, 35699, 2931, 2933, 2934, 2935, 35703, 2937, 2944, 2946, 2949, 2950, 2951, 2953, 2954, 2957, 2958, 2965, 2966, 2969, 2970, 2976, 2978, 2979, 2981, 2982, 2983, 2985, 2986, 2989, 2990, 2992, 35760, 35762, 35763, 2995, 2997, 2999, 35767, 3001, 3008, 3010, 3013, 3014, 3017, 3018, 3021, 3022, 3029, 3030, 3033, 3040, 3042, 3043, 3045, 3046, 3047, 3049, 3050, 3053, 3054, 3056, 35826, 3059, 35827, 3061, 3063, 35831, 3065, 35834, 3072, 35874, 3106, 3107, 35875, 35879, 3111, 3114, 35886, 3120, 35890, 35891, 3123, 35895, 3127, 3126, 3130, 35901, 35906, 3138, 35907, 3139, 35911, 3143, 35914, 3146, 3149, 35918, 35925, 35933, 35934, 3184, 35954, 3187, 35957, 35959, 3191, 35961, 35965, 3194, 35970, 3202, 3203, 35971, 35975, 3210, 35982, 3216, 35987, 3222, 3226, 36003, 3239, 3251, 36019, 3253, 36023, 3255, 36025, 3257, 36034, 36035, 3269, 3271, 36042, 3277, 3280, 3285, 3289, 3290, 3298, 3299, 36067, 36071, 3306, 3315, 36083, 3317, 36087, 3319, 3321, 3362, 3363, 3365, 3367, 3370, 3373, 3376, 36151, 3385, 3386, 3394, 3395, 3399, 3440, 36215, 3449, 3450, 3458, 3459, 3472, 3477, 3478, 3481, 3482, 3507, 36277, 3509, 36279, 3511, 3513, 36285, 3525, 3527, 3533, 3536, 3541, 3545, 3554, 3562, 3571, 36341, 3573, 36343, 3575, 3577, 36349, 36621, 3872, 36642, 36643, 3874, 3875, 3877, 3879, 3878, 3881, 3882, 36647, 3885, 3886, 36654, 3888, 3891, 36659, 3895, 36663, 3897, 36665, 3904, 3906, 3907, 36675, 3909, 3911, 36674, 3913, 59394, 36679, 3917, 36682, 36702, 3952, 36722, 3955, 36723, 3959, 36727, 36733, 3968, 3970, 3971, 36739, 3973, 3975, 36738, 3977, 36743, 3981, 36750, 36755, 4000, 36770, 36771, 4002, 4003, 4005, 4007, 4009, 4010, 36778, 4013, 36784, 4016, 4019, 36787, 4021, 36791, 4023, 4025, 4032, 4034, 4035, 36803, 4037, 4039, 36802, 4041, 36810, 4045, 4046, 36818, 36819, 36826, 4064, 36834, 36835, 4066, 4067, 4069, 4071, 4070, 4073, 4074, 36839, 4077, 36846, 4080, 4083, 36851, 4085, 36853, 4087, 36855, 4089, 36857, 36898, 36899, 36903, 36910, 36914, 36915, 36917, 36919, 36921, 36926, 36930, 36931, 36935, 36942, 36978, 36979, 36981, 36983, 36985, 36990, 36994, 36995, 36999, 37006, 37026, 37027, 37034, 37042, 37043, 37045, 37047, 37049, 37054, 37058, 37059, 37090, 37091, 37095, 37102, 37106, 37107, 37109, 37111, 37113, 37114, 37118, 37120, 37123, 37125, 37127, 37129, 37170, 37182, 37205, 37206, 37213, 37214, 37234, 37237, 37238, 37245, 37246, 37266, 37271, 37278, 37330, 37331, 37335, 37342, 37632, 37635, 37639, 37682, 37683, 37690, 37714, 37715, 37717, 37718, 37719, 37722, 37725, 37726, 37746, 37747, 37751, 37754, 37757, 37778, 37779, 37786, 37842, 37843, 37850, 38201, 38202, 38266, 38293, 38294, 38297, 38298, 38357, 38358, 38361, 38362, 38400, 38403, 38405, 38407, 38409, 38450, 38453, 38454, 38457, 38458, 38485, 38486, 38493, 38494, 38514, 38517, 38518, 38521, 38522, 38525, 38526, 38546, 38550, 38554, 38610, 38611, 38614, 38617, 38618, 38659, 38663, 38704, 38706, 38707, 38711, 38733, 38770, 38771, 38773, 38775, 38781, 38798, 38802, 38803, 38807, 38814, 38829, 38830, 38839, 38853, 38861, 38862, 38866, 38867, 38871, 38878, 38886, 38894, 38896, 38903, 38912, 38915, 38918, 38919, 38922, 38962, 38963, 38967, 38997, 39005, 39006, 39026, 39027, 39031, 39058, 39059, 39063, 39070, 53362, 39122, 39123, 39127, 39134, 59906, 39424, 39427, 39430, 39431, 39434, 39474, 39486, 39518, 39538, 39550, 39570, 39575, 39582, 39634, 39635, 39639, 39646, 39683, 39687, 39690, 39718, 39726, 39733, 39735, 39741, 39750, 39758, 39762, 39763, 39767, 39770, 39794, 39795, 39797, 39799, 39805, 39813, 39814, 39821, 39822, 39845, 39846, 39853, 39854, 39861, 39863, 39869, 39878, 39886, 39910, 39917, 39918, 39925, 39927, 39933, 39936, 39939, 39943, 39986, 39987, 39989, 39990, 39993, 39994, 40021, 40029, 40030, 40050, 40051, 40061, 40062, 40082, 40083, 27506, 40086, 40090, 40146, 40147, 40149, 40153, 40192, 40195, 40199, 40242, 40250, 40277, 40278, 40285, 40286, 40306, 40309, 40310, 40314, 40317, 40318, 40338, 40346, 40402, 40403, 40410, 40704, 40707, 40709, 40711, 40713, 40759, 40761, 40762, 40781, 40786, 40787, 40791, 40794, 40798, 40818, 40819, 40823, 40826, 40846, 40853, 40857, 40877, 40887, 40901, 40909, 40910, 40917, 40921, 40942, 40951, 40998, 41002, 41005, 41006, 41018, 41030, 41034, 41037, 41038, 41042, 41043, 41047, 41054, 41074, 41075, 41079, 41082, 41094, 41098, 41101, 41102, 41126, 41129, 41130, 41134, 41136, 41141, 41142, 41145, 41146, 41158, 41162, 41165, 41166, 41197, 41198, 41205, 41206, 41209, 41210, 41269, 41271, 41277, 41296, 41328, 41333, 41335, 41341, 41365, 41367, 41373, 41397, 41399, 41405, 41429, 41437, 41461, 41463, 41469, 41783, 41789, 41815, 41821, 41845, 41847, 41853, 41879, 41904, 41911, 41949, 41968, 41975, 42274, 42275, 42279, 42286, 42291, 42293, 42295, 42297, 42306, 42307, 42311, 42318, 42355, 42357, 42359, 42361, 42370, 42371, 42375, 42382, 42402, 42403, 42419, 42423, 42434, 42435, 42442, 42466, 42467, 42471, 42478, 42483, 42487, 42530, 42531, 42535, 42538, 42542, 42547, 42549, 42551, 42553, 42557, 42562, 42563, 42567, 42574, 42576, 42608, 42611, 42613, 42615, 42617, 42621, 42626, 42627, 42631, 42638, 42645, 42647, 42653, 42659, 42675, 42677, 42679, 42681, 42685, 42690, 42691, 42698, 42723, 42739, 42741, 42743, 42745, 42749, 42805, 54098, 42807, 42813, 42816, 42869, 42877, 42903, 42935, 42999, 43059, 43061, 43063, 43069, 43070, 43101, 43102, 43122, 43125, 43133, 43134, 43154, 43155, 43159, 43162, 43165, 43166, 43186, 43187, 43189, 43191, 43194, 43197, 43198, 43218, 43230, 43250, 43251, 43253, 43255, 43258, 43261, 43262, 43314, 43315, 43319, 43322, 43326, 43357, 43358, 43378, 43379, 43381, 43383, 43389, 43390, 43410, 43411, 43415, 43418, 43422, 43442, 43443, 43447, 43450, 43454, 43474, 43486, 43506, 43507, 43511, 43514, 43518, 43571, 43573, 43575, 43581, 43582, 43600, 43605, 43613, 43614, 43635, 43637, 43639, 43645, 43667, 43671, 43677, 43678, 43698, 43699, 43701, 43703, 43706, 43709, 43710, 43730, 43742, 43762, 43763, 43765, 43767, 43770, 43773, 43774, 43826, 43827, 43831, 43838, 43863, 43869, 43870, 43890, 43891, 43893, 43895, 43901, 43902, 43904, 43922, 43927, 43934, 43952, 43954, 43955, 43959, 43962, 43968, 43986, 43994, 43998, 44000, 44018, 44019, 44023, 44026, 44066, 44067, 44071, 44078, 44083, 44087, 44093, 44098, 44099, 44103, 44106, 44110, 44112, 44144, 44149, 44151, 44153, 44157, 44162, 44163, 44167, 44174, 44183, 44189, 44195, 44211, 44215, 44217, 44226, 44227, 44234, 44247, 44259, 44263, 44275, 44279, 44281, 44341, 44343, 44349, 44368, 44400, 44405, 44407, 44413, 44437, 44439, 44445, 44469, 44471, 44477, 44509, 44533, 44535, 44541, 44834, 44835, 44839, 44851, 44853, 44855, 44857, 44864, 44866, 44867, 44871, 44887, 44893, 44915, 44917, 44919, 44921, 44925, 44928, 44930, 44931, 44935, 44942, 44962, 44963, 44976, 44979, 44983, 44985, 44992, 44994, 44995, 45002, 45026, 45027, 45031, 45038, 45040, 45043, 45047, 45049, 45058, 45059, 45061, 45063, 45065, 45066, 45091, 45095, 45104, 45106, 45113, 45126, 45130, 45138, 45139, 45168, 45170, 45219, 45232, 45235, 45238, 45239, 28530, 45245, 45246, 45254, 45258, 45283, 45287, 45296, 45299, 45302, 45303, 45309, 45310, 45312, 54647, 45824, 22134, 45831, 46336, 46339, 46343, 46386, 46387, 46391, 46393, 46429, 46450, 46451, 46453, 46455, 46457, 46461, 46482, 46483, 46487, 46546, 46547, 46551, 46592, 46595, 46597, 46599, 46601, 46605, 46642, 46645, 46646, 46647, 46649, 46650, 46654, 46677, 46678, 46685, 46686, 46706, 46709, 46710, 46711, 46713, 46714, 46717, 46718, 46738, 46741, 46742, 46745, 46746, 46750, 46802, 46803, 46807, 46810, 46848, 46896, 46903, 46960, 46967, 47024, 47029, 47031, 47037, 47088, 47093, 47095, 47101, 47104, 47106, 47107, 47111, 47117, 47362, 47363, 47367, 47373, 47374, 47616, 47618, 47619, 47623, 47629, 47874, 47875, 47879, 47882, 47920, 47927, 47984, 47991, 48048, 48053, 48055, 48061, 48112, 48117, 48119, 48125, 48128, 48131, 48135, 48141, 48178, 48179, 48183, 48242, 48243, 48245, 48247, 48249, 48253, 48274, 48275, 48279, 48281, 48338, 48339, 48343, 48345, 48384, 48391, 48397, 55302, 48896, 48899, 48903, 48944, 48946, 48947, 48951, 49008, 49010, 49011, 49015, 49042, 49043, 49047, 49049, 49072, 49079, 49106, 49107, 49111, 49136, 49143, 49154, 49155, 49159, 49166, 49189, 49190, 49193, 49194, 49197, 49198, 49205, 49206, 49209, 49210, 49213, 49214, 49221, 49222, 49225, 49226, 49229, 49230, 49234, 49235, 49239, 49246, 49264, 49266, 49267, 49269, 49271, 49273, 49277, 49278, 49285, 49286, 49289, 49290, 49293, 49294, 49317, 49318, 49321, 49322, 49328, 49333, 49337, 49341, 49342, 49349, 49350, 49353, 49354, 49389, 49390, 49397, 49398, 49401, 49402, 49405, 49406, 49408, 49413, 49415, 49421, 49461, 49463, 49469, 49525, 49527, 49533, 49589, 49591, 49597, 49653, 49655, 49661, 49973, 49975, 49981, 50039, 50045, 50096, 50103, 50109, 50165, 50167, 50173, 50435, 50437, 50439, 50441, 50466, 50467, 50471, 50474, 50478, 50482, 50483, 50485, 50487, 50489, 50490, 50498, 50499, 50503, 50506, 50510, 50517, 50518, 50525, 50526, 50546, 50547, 50549, 50550, 50551, 50553, 50554, 50557, 50558, 50562, 50563, 50567, 50574, 50578, 50579, 50586, 50594, 50595, 50602, 50611, 50613, 50615, 50617, 50626, 50627, 50634, 50642, 50643, 50650, 50658, 50659, 50663, 50670, 50675, 50677, 50679, 50681, 50688, 50691, 50693, 50695, 50697, 50722, 50723, 50727, 50730, 50734, 50739, 50741, 50743, 50745, 50749, 50754, 50755, 50759, 50773, 50774, 50781, 50782, 50802, 50803, 50806, 50807, 50810, 50813, 50814, 50818, 50819, 50823, 50830, 50835, 50851, 50867, 50869, 50871, 50873, 50877, 50882, 50883, 50898, 50899, 50906, 50914, 50915, 50926, 50931, 50933, 50935, 50937, 50941, 50951, 50999, 51069, 51127, 51191, 51202, 51206, 51207, 51210, 51214, 51251, 51253, 51255, 51261, 51325, 51326, 51378, 51379, 51383, 51390, 51443, 51447, 51450, 51458, 51459, 51461, 51462, 51466, 51469, 51470, 51506, 51507, 51511, 51514, 51518, 51570, 51571, 51575, 51578, 51582, 51634, 51635, 51639, 51642, 51646, 51698, 51699, 51703, 51706, 51710, 51715, 51717, 51718, 51719, 51722, 51725, 51763, 51765, 51767, 51770, 51773, 51826, 51827, 51831, 51834, 51890, 51891, 51895, 51898, 51901, 51902, 51954, 51955, 51959, 51962, 51965, 51966, 51970, 51971, 51978, 52019, 52023, 52030, 52082, 52083, 52087, 52144, 52146, 52147, 52151, 52158, 52210, 52211, 52215, 52218, 52222, 52224, 52233, 52259, 52263, 52270, 52275, 52279, 52285, 52291, 52295, 52302, 52310, 52317, 52318, 52338, 52343, 52349, 52354, 52355, 52359, 52366, 52370, 52371, 52378, 52386, 52387, 52394, 52403, 52405, 52407, 52409, 52413, 52418, 52419, 52426, 52434, 52442, 52450, 52451, 52455, 52462, 52467, 52469, 52471, 52473, 52477, 52535, 52599, 52661, 52663, 52669, 52725, 52727, 52733, 53005, 53026, 53027, 53031, 53042, 53043, 53047, 53049, 53058, 53059, 53063, 53066, 53106, 53107, 53111, 53117, 53122, 53123, 53127, 53138, 53139, 53154, 53155, 53171, 53175, 53186, 53187, 53194, 53202, 53203, 53210, 53218, 53219, 53223, 53230, 53235, 53237, 53239, 53241, 20482, 53251, 20483, 20485, 53250, 20487, 20489, 20490, 53255, 20514, 20515, 20517, 20518, 53285, 20519, 20522, 20525, 20526, 53293, 20530, 20531, 53294, 20533, 20534, 20535, 20537, 20538, 53309, 53310, 20541, 20542, 20546, 20547, 20549, 20550, 20551, 53317, 20554, 53325, 53326, 20557, 20558, 53330, 53331, 20563, 20562, 20570, 20592, 20594, 53363, 20595, 20598, 20597, 20599, 20602, 20601, 20605, 20606, 53374, 20610, 20611, 20615, 20622, 20642, 20643, 53413, 53414, 20645, 20650, 20653, 53421, 53424, 20656, 53422, 20659, 20658, 20661, 20662, 53430, 20665, 20663, 20666, 20669, 20670, 53438, 20674, 20675, 20677, 20678, 53445, 20682, 20685, 53453, 20686, 53454, 20706, 20707, 20711, 20718, 20720, 53488, 20722, 20723, 20725, 20726, 20727, 20729, 20730, 53494, 20733, 53501, 20734, 20736, 53502, 53504, 20739, 53507, 53509, 20741, 20743, 53511, 20745, 53513, 20786, 53555, 20787, 53554, 20791, 53559, 53566, 20821, 20822, 53589, 53590, 20829, 53597, 53598, 20830, 20850, 53618, 53619, 20853, 53621, 20855, 53622, 20851, 53623, 20861, 53629, 53630, 20882, 20883, 53651, 53650, 53655, 20887, 20894, 53662, 20946, 20947, 53714, 53715, 53719, 20951, 20958, 21248, 54019, 21251, 21253, 21255, 54023, 21257, 54029, 21261, 54066, 21299, 21298, 21306, 21330, 54099, 21331, 21333, 21334, 21335, 54103, 21338, 54109, 21342, 54110, 21341, 21363, 21362, 21365, 21366, 54133, 21367, 21370, 21373, 21374, 54141, 21394, 21395, 54163, 21402, 21458, 21459, 54227, 21466, 54528, 21760, 21763, 54531, 21765, 54533, 54535, 21767, 21769, 54537, 54578, 21811, 54579, 21813, 21814, 21810, 21815, 21817, 21818, 54583, 21822, 21845, 21846, 54614, 54621, 21853, 21854, 54622, 54642, 21874, 21875, 21877, 21878, 21881, 21882, 54643, 21879, 21885, 21886, 54674, 21907, 54675, 21906, 21910, 21911, 54679, 21913, 21914, 21909, 54686, 21918, 54738, 21970, 21971, 54739, 21973, 21975, 54743, 21977, 54750, 54784, 22016, 54787, 22019, 22021, 54789, 54791, 22023, 22025, 54793, 54797, 22029, 22066, 54835, 22067, 22069, 22070, 54834, 22071, 54839, 22074, 54842, 22073, 54846, 22078, 22101, 22102, 54869, 54870, 22109, 22110, 54877, 54878, 22130, 22131, 54898, 54899, 22133, 54901, 54903, 22135, 22138, 54906, 54902, 54909, 22141, 22142, 54910, 22137, 22162, 22163, 54930, 54931, 22166, 22167, 54935, 22169, 22170, 22165, 22174, 22226, 22227, 54994, 54995, 22229, 22231, 54999, 22233, 22272, 22275, 55043, 22277, 55047, 22279, 22281, 22309, 22310, 22317, 22318, 22320, 22322, 55090, 22323, 22325, 22327, 55091, 55095, 22333, 22334, 22341, 22342, 22349, 22350, 55117, 22357, 22358, 55133, 22366, 22365, 22384, 22386, 22387, 55157, 22390, 22391, 22389, 55154, 22397, 22398, 55165, 22406, 22405, 22413, 22414, 22418, 22419, 55186, 55187, 22423, 55191, 55198, 22430, 22437, 22438, 22445, 55213, 22446, 22448, 55216, 22453, 22455, 22461, 22470, 22469, 22477, 22478, 22482, 22483, 55251, 55250, 22487, 55255, 22494, 22501, 22502, 22509, 22510, 22512, 55277, 22517, 22519, 22525, 22528, 22530, 22531, 55298, 22533, 22534, 22535, 55303, 22537, 22538, 55299, 55301, 22541, 55310, 22542, 55309, 55305, 55346, 22579, 22578, 55347, 22583, 55351, 22590, 22613, 22614, 55381, 55382, 22621, 22622, 55389, 55390, 22642, 22643, 55411, 22646, 22645, 55410, 22647, 22654, 22653, 22674, 22675, 55442, 55443, 22679, 55447, 22686, 55454, 22738, 22739, 55507, 55506, 22743, 55511, 22750, 55554, 55555, 22786, 22789, 22790, 55559, 55557, 55558, 22794, 22787, 22791, 55565, 22797, 22798, 55566, 22793, 23040, 55808, 23043, 55811, 55810, 23046, 55813, 55814, 23050, 23047, 55815, 55821, 23053, 55822, 55817, 23090, 55859, 23091, 55858, 55863, 23095, 55870, 23125, 23126, 55894, 23133, 23134, 55902, 23154, 55922, 55923, 23157, 55926, 23155, 55927, 23159, 23165, 55934, 23186, 23187, 55955, 55954, 23191, 55959, 23198, 55966, 23250, 23251, 56018, 56019, 23255, 56023, 23262, 56066, 56067, 23299, 23301, 56070, 23303, 23302, 23305, 23309, 56071, 56077, 56078, 23310, 23333, 23334, 56101, 56109, 56110, 23342, 23341, 23344, 23351, 23365, 23366, 23373, 23374, 23378, 56147, 23379, 56146, 56151, 23383, 23386, 23390, 23408, 23410, 23411, 56178, 56179, 23415, 56183, 23418, 23422, 23430, 23429, 56198, 23437, 23438, 56206, 23461, 23462, 56237, 23469, 23470, 23472, 23477, 23479, 23485, 23494, 23493, 23501, 23502, 56269, 23525, 23526, 56294, 56301, 23534, 23533, 23536, 23541, 23543, 23549, 56320, 23552, 23555, 56323, 56325, 23557, 23559, 56327, 56329, 23561, 23565, 56333, 56370, 23603, 23602, 56371, 56375, 23607, 23614, 56382, 23637, 23638, 56406, 56413, 23646, 23645, 56414, 56434, 23666, 23667, 23669, 56435, 56437, 23670, 23671, 56439, 23674, 23677, 56446, 23678, 56445, 23673, 56466, 56467, 23699, 23698, 23701, 56471, 23703, 23705, 23706, 23702, 23710, 56530, 23762, 23763, 56531, 23766, 23767, 56535, 23769, 23770, 23765, 23774, 23808, 56579, 23811, 56581, 56583, 23815, 23817, 56585, 56589, 23858, 23859, 56627, 56626, 56634, 23893, 23894, 23901, 56669, 56670, 23902, 56690, 56691, 23923, 23925, 56693, 56694, 23926, 23922, 23930, 56698, 23933, 23934, 56701, 56702, 23954, 56723, 23955, 56722, 23962, 56730, 24018, 56787, 24019, 56786, 24026, 24320, 57091, 24323, 57095, 24327, 57101, 24333, 24358, 24366, 24368, 24370, 24375, 57138, 24371, 24381, 24382, 24390, 57165, 24398, 24402, 24403, 57171, 24405, 24406, 24407, 57175, 24410, 24413, 24414, 57181, 24432, 24437, 24438, 24435, 24439, 24441, 24445, 24446, 24453, 24454, 57221, 24461, 57230, 24462, 57229, 24466, 57235, 57234, 24467, 24469, 57239, 24471, 24473, 24474, 24470, 24478, 57246, 24485, 24486, 57261, 24494, 24493, 24496, 24501, 24503, 24509, 24517, 24518, 24525, 57294, 24526, 57293, 57299, 24531, 57298, 24534, 57303, 24535, 24537, 24533, 57310, 24542, 24549, 24550, 57317, 57325, 24557, 24558, 24560, 57328, 24567, 24573, 24578, 24579, 57346, 57349, 24583, 57351, 57347, 57353, 24614, 57382, 24618, 24621, 24622, 57390, 57389, 24634, 57405, 24637, 24646, 57414, 24650, 24653, 24654, 57421, 57422, 24658, 24659, 57426, 57427, 24663, 57431, 57438, 24670, 24690, 24691, 57458, 57463, 24695, 57469, 24701, 24710, 57478, 24714, 24717, 24718, 57485, 57486, 24741, 24742, 57510, 24745, 24746, 24749, 24750, 57520, 24752, 57518, 57525, 24757, 24761, 24765, 24766, 57534, 57533, 24774, 57542, 24778, 24781, 24782, 57549, 57550, 24813, 24814, 57581, 57582, 24821, 24822, 57589, 57590, 24825, 24826, 24829, 57597, 24830, 24832, 57600, 57598, 24837, 57605, 57607, 24839, 24845, 57613, 57653, 24887, 57655, 24893, 57661, 24912, 57680, 24944, 57712, 57717, 24949, 24951, 57719, 24957, 57725, 24983, 57751, 57757, 24989, 25015, 25045, 57815, 25053, 25079, 58117, 58119, 58125, 25397, 58165, 25399, 58167, 25405, 58173, 58192, 58197, 25431, 58199, 25437, 58205, 58224, 25463, 58231, 25469, 58237, 58261, 58263, 25495, 57170, 58269, 25520, 25527, 58325, 25559, 58327, 58333, 25591, 58627, 25859, 25861, 58629, 58631, 25863, 25865, 58633, 25890, 25891, 25895, 25898, 25902, 58674, 25907, 58675, 25909, 25906, 25911, 25913, 58682, 25914, 25922, 25923, 25927, 25930, 25934, 58709, 25942, 25941, 58710, 58717, 25949, 25950, 58718, 58738, 25971, 25970, 25973, 58741, 25975, 25974, 25977, 58742, 58739, 58746, 58749, 25981, 25982, 58750, 25978, 25986, 25987, 25991, 25998, 26002, 58771, 58770, 26003, 58778, 26010, 26018, 26019, 26026, 26035, 26037, 26039, 26041, 26050, 26051, 26058, 58834, 26066, 26067, 58835, 58842, 26074, 26082, 26083, 26087, 26094, 26099, 26101, 26103, 26105, 26112, 58880, 26115, 58883, 26117, 58885, 26119, 58887, 26121, 58889, 26146, 26147, 26151, 26154, 26158, 26163, 58931, 58933, 26165, 26167, 58935, 58930, 58938, 26169, 26173, 58941, 26178, 26179, 26183, 58960, 26192, 58965, 26197, 26198, 58966, 58973, 26205, 26206, 58974, 26224, 58992, 26226, 26227, 58995, 58998, 26231, 58994, 26234, 59002, 58997, 59005, 26237, 26238, 59006, 26242, 26243, 26247, 26254, 26259, 59026, 26261, 59027, 26263, 59031, 59029, 26269, 59037, 26275, 26291, 26293, 26295, 26297, 26301, 26306, 26307, 26322, 26323, 59090, 59091, 59095, 26330, 59098, 26338, 26339, 26350, 26355, 26357, 26359, 26361, 26365, 59143, 26375, 59149, 26423, 59191, 26432, 59200, 59255, 26493, 59261, 59287, 26519, 26525, 59293, 59296, 26551, 59349, 59351, 26589, 59357, 26615, 59392, 26626, 59395, 59397, 26631, 59399, 26630, 26634, 59402, 59398, 59406, 26638, 59405, 59442, 26675, 59443, 59445, 26679, 59447, 59450, 59453, 26685, 59454, 59472, 26709, 26710, 59477, 59478, 59485, 26718, 59486, 26717, 59504, 59506, 59507, 59511, 26749, 26750, 59517, 59518, 26771, 59539, 59538, 26775, 59543, 26781, 59550, 26782, 59549, 26802, 26803, 26807, 26814, 59603, 59602, 59607, 26842, 59610, 59614, 59613, 26867, 26871, 26874, 26882, 26883, 59650, 26886, 59654, 59651, 26890, 59658, 26894, 59662, 26930, 59699, 26931, 59698, 59703, 26935, 26938, 59706, 26942, 59710, 57459, 59733, 26973, 26974, 59741, 59742, 26994, 59762, 59763, 26997, 59765, 26998, 26995, 26999, 27002, 59767, 27005, 59773, 59774, 27006, 27026, 27027, 59795, 59794, 27031, 59799, 27034, 27038, 59806, 27058, 27059, 27063, 27066, 27070, 27090, 59859, 59858, 59863, 59866, 27102, 59870, 27122, 27123, 27127, 27130, 27134, 27136, 59907, 27139, 59909, 59911, 27143, 27142, 59914, 27146, 59910, 59917, 59918, 27187, 59954, 59955, 27191, 59957, 59959, 27194, 59962, 59965, 27197, 59966, 59984, 27222, 59990, 27229, 59998, 27230, 60016, 27250, 27251, 60018, 27253, 27255, 60019, 27258, 60022, 60023, 27261, 60030, 60026, 60051, 27283, 60050, 27287, 60055, 27293, 27294, 60062, 60061, 27314, 27315, 27319, 27322, 27326, 60115, 60114, 60119, 27378, 27379, 27383, 27386, 27390, 27394, 60162, 60163, 27395, 60167, 27402, 60173, 60170, 60210, 27443, 60211, 27447, 60215, 60218, 60222, 27454, 27479, 60247, 60253, 27485, 60272, 60274, 60275, 27507, 60277, 60279, 27511, 60288, 27520, 60285, 60307, 27539, 60306, 60311, 27543, 60318, 60336, 27568, 27570, 27571, 27575, 27582, 27584, 60352, 27602, 60371, 27603, 60370, 60375, 27607, 60378, 27610, 27634, 27635, 27639, 27642, 27646, 60416, 27648, 60419, 60421, 60423, 60425, 27657, 27683, 27687, 27694, 60466, 60467, 27699, 60471, 27703, 60469, 27709, 60477, 27715, 27719, 27726, 60496, 60502, 27734, 60501, 27741, 60510, 27742, 60509, 27762, 60530, 60531, 27767, 60533, 60535, 27773, 60541, 27778, 27779, 27783, 27790, 27794, 27795, 60562, 60563, 60567, 27799, 60565, 27802, 60570, 27805, 60573, 27810, 27811, 27818, 27827, 27831, 27833, 27842, 27843, 27850, 60626, 60627, 27861, 27858, 27863, 60631, 27866, 60634, 27869, 27874, 27875, 27879, 27886, 27891, 27895, 60725, 60727, 27959, 60733, 60752, 60784, 60789, 28023, 60791, 60797, 28053, 60821, 28055, 60823, 60829, 28061, 28085, 28087, 28093, 60887, 28125, 28149, 28151, 28157, 61184, 61187, 61189, 61191, 61193, 61197, 28429, 61216, 28450, 28451, 28455, 28466, 28467, 61235, 61234, 28471, 28473, 28480, 61248, 28482, 28483, 28487, 28490, 61271, 28503, 28510, 61298, 28531, 61299, 28535, 61303, 28541, 61312, 28546, 28547, 61309, 28551, 61330, 61331, 28563, 28562, 61338, 61344, 28578, 28579, 28592, 28595, 28599, 61376, 28610, 28611, 28618, 61394, 28626, 61395, 28627, 61402, 28634, 61408, 28642, 28643, 28647, 28654, 28659, 28663, 61442, 61443, 61445, 61447, 61449, 61450, 61475, 61479, 61488, 61490, 61497, 61507, 61510, 61514, 61522, 61523, 61552, 61554, 61571, 61603, 61616, 61619, 61622, 61623, 61629, 61630, 61635, 61637, 61638, 61642, 61645, 61667, 61671, 61680, 61683, 61686, 61687, 61693, 61694, 61696, 62208, 62215, 62720, 62723, 62727, 62770, 62777, 62813, 62834, 62841, 62866, 62930, 62931, 62935, 62976, 62979, 62981, 62983, 62985, 62989, 63030, 63033, 63034, 63061, 63062, 63069, 63070, 63094, 63097, 63122, 63123, 63125, 63126, 63127, 63129, 63130, 63134, 63186, 63187, 63191, 63232, 63280, 63287, 63344, 63351, 63408, 63413, 63415, 63421, 63472, 63477, 63479, 63485, 63488, 63490, 63491, 63493, 63495, 63497, 63501, 63746, 63747, 63751, 63757, 63758, 64000, 64003, 64005, 64007, 64009, 64013, 64259, 64263, 64304, 64311, 64368, 64375, 64432, 64437, 64439, 64445, 64496, 64501, 64503, 64509, 64512, 64515, 64517, 64519, 64521, 64525, 64563, 64567, 64569, 64659, 64663, 64665, 64722, 64730, 64768, 64775, 65280, 65283, 65287, 65328, 65337, 65392, 65395, 65399, 65456, 65463, 65491, 65495, 65520, 65527], 4354: [32769, 32786, 32791, 32794, 32795, 32798, 32799, 32824, 32827, 32877, 32878, 32881, 32884, 32891, 32895, 32896, 58644, 32914, 32926, 58648, 32930, 32945, 32947, 32948, 32955, 32973, 32974, 32978, 32983, 32989, 32990, 32994, 58677, 58678, 54719, 514, 516, 33296, 529, 531, 534, 535, 538, 539, 541, 543, 58724, 561, 563, 567, 570, 571, 58730, 575, 594, 596, 33364, 602, 33376, 609, 610, 611, 612, 58737, 614, 615, 616, 618, 619, 33380, 622, 623, 33384, 625, 58740, 627, 33389, 631, 634, 641, 643, 33412, 646, 647, 33414, 33416, 650, 651, 33419, 653, 655, 657, 659, 33427, 663, 33431, 666, 667, 671, 33440, 673, 679, 682, 33453, 687, 58752, 689, 694, 698, 701, 705, 58756, 707, 708, 710, 711, 714, 715, 716, 717, 33482, 719, 33486, 721, 722, 723, 33485, 33491, 727, 33495, 730, 33504, 739, 740, 743, 747, 748, 751, 753, 754, 58766, 33524, 758, 762, 33531, 765, 58768, 33540, 785, 786, 788, 33556, 790, 792, 794, 795, 796, 797, 798, 799, 817, 820, 33587, 33588, 829, 831, 33599, 865, 866, 867, 868, 870, 871, 33636, 874, 875, 876, 877, 879, 881, 884, 33652, 893, 894, 895, 897, 900, 33665, 903, 907, 908, 909, 33674, 911, 914, 916, 33684, 920, 923, 924, 926, 927, 929, 930, 33697, 932, 33700, 939, 39264, 945, 946, 948, 954, 955, 957, 959, 961, 962, 964, 968, 33732, 971, 974, 975, 977, 978, 980, 984, 988, 989, 990, 991, 996, 33764, 33763, 999, 1000, 33767, 1003, 1006, 1007, 1009, 1010, 1012, 1018, 1019, 1021, 1023, 58826, 13250, 58848, 58870, 1281, 34050, 1290, 1297, 1298, 1299, 1300, 34067, 1303, 34065, 34068, 1307, 1308, 1309, 34074, 1311, 34079, 34075, 34076, 34096, 1329, 1330, 1331, 1332, 34100, 1335, 1336, 1338, 1339, 34107, 1343, 34108, 34130, 34144, 1377, 1378, 1379, 1380, 34146, 34149, 1383, 1384, 34152, 1387, 1388, 1389, 1390, 1391, 34157, 1393, 1394, 1396, 34161, 1399, 34168, 1402, 34175, 1409, 1410, 1411, 1412, 34176, 1414, 1415, 1416, 34181, 1418, 1419, 1421, 1422, 1423, 34192, 34189, 1426, 1428, 34196, 1432, 34199, 34201, 1435, 34203, 1437, 1438, 1439, 34204, 1441, 1442, 34207, 1444, 34205, 1454, 34222, 1457, 1458, 34226, 1460, 34221, 1462, 34230, 34232, 1466, 1467, 34236, 1469, 34238, 1471, 34240, 1473, 1474, 1475, 1476, 34239, 34248, 1482, 1483, 1484, 1485, 1486, 34253, 34251, 1489, 1490, 1491, 1492, 34260, 34255, 34264, 34267, 34265, 34269, 34272, 1506, 1507, 1508, 1512, 1514, 1515, 1516, 1518, 1521, 1522, 34289, 1524, 34290, 1526, 1528, 34296, 1530, 1531, 34298, 1533, 34301, 1535, 34303, 34300, 34322, 34324, 34327, 34328, 34331, 34334, 34335, 34353, 34356, 34367, 34402, 34407, 34411, 34414, 34420, 34424, 34431, 34443, 34455, 34459, 34463, 34464, 34473, 34477, 34482, 34486, 34488, 34492, 34495, 34513, 34516, 34525, 34527, 34537, 34541, 34546, 34550, 34552, 34556, 34559, 34564, 1809, 1810, 1811, 1812, 1815, 1816, 1819, 1820, 1821, 1822, 1823, 1841, 1844, 1855, 1889, 1890, 1891, 34659, 34660, 1894, 1895, 34663, 1898, 1899, 1901, 1903, 1905, 1908, 1921, 1924, 34689, 34695, 1931, 34698, 1935, 1938, 1939, 1940, 1943, 1944, 1947, 1948, 1951, 1953, 34721, 1956, 34724, 1958, 34723, 34727, 1962, 1963, 1969, 1970, 1972, 1974, 1978, 1981, 1983, 1985, 34755, 34756, 1995, 34764, 1999, 34763, 2001, 2002, 2004, 34788, 34787, 34791, 2027, 2030, 2031, 2033, 2034, 2036, 2038, 2042, 34812, 2045, 2047, 34815, 2049, 2052, 2059, 2061, 34832, 2065, 2067, 34835, 2071, 2074, 2075, 2079, 2097, 34870, 34876, 2130, 2132, 2136, 2138, 2140, 2142, 34912, 2146, 34914, 2148, 2151, 2152, 34919, 34922, 2158, 2159, 2161, 34932, 2177, 34946, 2180, 34951, 34953, 2186, 34954, 2191, 2195, 2196, 34967, 2203, 2207, 2209, 2212, 2219, 2223, 2225, 2228, 34996, 2230, 2234, 2237, 2239, 35015, 2251, 35019, 2260, 2263, 2268, 35047, 2282, 2283, 2289, 2292, 2294, 2298, 2300, 2301, 2305, 2314, 2321, 2322, 2323, 2324, 35091, 35092, 2327, 2330, 2331, 2332, 2335, 35103, 2353, 2354, 2356, 35124, 35125, 2359, 2360, 35126, 2363, 35131, 2367, 35132, 2401, 2402, 2403, 2404, 35170, 2408, 2410, 2411, 2412, 2413, 2414, 35181, 2417, 2418, 2420, 35192, 35188, 2428, 35197, 2431, 35199, 2433, 2436, 35200, 35205, 2440, 2442, 2443, 2445, 2447, 2450, 35219, 2452, 35220, 2455, 2456, 35227, 35228, 2461, 2462, 2463, 35231, 2465, 2468, 2479, 2482, 2486, 2493, 35264, 2497, 35266, 2500, 2507, 2508, 2509, 2510, 35277, 2513, 2514, 2515, 2516, 35284, 2520, 2523, 2525, 2532, 2538, 2540, 2548, 35316, 2550, 2552, 35320, 2557, 35325, 35327, 2562, 2577, 35346, 2579, 35348, 2583, 35351, 2587, 2589, 35358, 2591, 2609, 2623, 2657, 2658, 2659, 2660, 35428, 35427, 35431, 2664, 35432, 2666, 2667, 2670, 2673, 35444, 2687, 2689, 35460, 2694, 2698, 2699, 35469, 2705, 2707, 2711, 35479, 2715, 35483, 2719, 35487, 2721, 35488, 2737, 2742, 35512, 2746, 35516, 2749, 35519, 2753, 2756, 2763, 2764, 2767, 2769, 2770, 2771, 35538, 2775, 2783, 2788, 2795, 2796, 2799, 2801, 2802, 2806, 35576, 2810, 35580, 2813, 2820, 13588, 2831, 13589, 35609, 2843, 2847, 13592, 2875, 2877, 35681, 2914, 2916, 2918, 2919, 35686, 2922, 35690, 2924, 2925, 2927, 2929, 35705, 2948, 2955, 35724, 2959, 2964, 2971, 2980, 13618, 2987, 2993, 2996, 3002, 3003, 35777, 3012, 3016, 35783, 35786, 35789, 35791, 3031, 35801, 35802, 35804, 3037, 3038, 3039, 3044, 35815, 3048, 35817, 3057, 3058, 3066, 3070, 3073, 3074, 3076, 3082, 35856, 3089, 3091, 35859, 3095, 3098, 3099, 35867, 3103, 59235, 35888, 3121, 35903, 3154, 3156, 3162, 35936, 3170, 35938, 3172, 3175, 3176, 35943, 35946, 3182, 3183, 35951, 3185, 35952, 35956, 35963, 3199, 3201, 3204, 35977, 35978, 3215, 35983, 35984, 3219, 3220, 35991, 3227, 3231, 3233, 3235, 3236, 36009, 3242, 3249, 3252, 36020, 3254, 36022, 3258, 36028, 3261, 3263, 3266, 3267, 36039, 3274, 3275, 36043, 13677, 3284, 3287, 13680, 3295, 3307, 36075, 13684, 3313, 3316, 13685, 3318, 3322, 3324, 3325, 36113, 36115, 13691, 3351, 36119, 36123, 3357, 3359, 36144, 3377, 3378, 3380, 3387, 3391, 13701, 36178, 36190, 3425, 3426, 3428, 3431, 3432, 3434, 3436, 3438, 3439, 36209, 36216, 3455, 3460, 3463, 3467, 3469, 3471, 36238, 3475, 3476, 36247, 36249, 3483, 36253, 3487, 3490, 3492, 3494, 3498, 3502, 3505, 3506, 36274, 3508, 36269, 36278, 36280, 3514, 3515, 36284, 3517, 36286, 3519, 36287, 3521, 3522, 3523, 3524, 36296, 3530, 3531, 3532, 36299, 3534, 36303, 36300, 3537, 36307, 3540, 36317, 3556, 3560, 3563, 3564, 3566, 3569, 3570, 36337, 3572, 36338, 3576, 3578, 3579, 3581, 3583, 36351, 3588, 3595, 3599, 36368, 3603, 3606, 3607, 36375, 36376, 3611, 3613, 3615, 3633, 36401, 3635, 36404, 3638, 13749, 3642, 3643, 36415, 3666, 3668, 36436, 3672, 3674, 3676, 3678, 36450, 3683, 3686, 3687, 36455, 36458, 3691, 36462, 3695, 3697, 36461, 3699, 3702, 36471, 3706, 36482, 3718, 3719, 36487, 36488, 36491, 3725, 36494, 3727, 3731, 36499, 3735, 36503, 3739, 3743, 36512, 3750, 3751, 36520, 36525, 3761, 3766, 36534, 3770, 3773, 36546, 3782, 3783, 36553, 36554, 3789, 36558, 3791, 36557, 36561, 3795, 36564, 36563, 3798, 3799, 36567, 36575, 36576, 36578, 3815, 36585, 36586, 36589, 3823, 3825, 36596, 3830, 3834, 36603, 3837, 3857, 3859, 36627, 36628, 3867, 36634, 3903, 36671, 3939, 3942, 3947, 3949, 3953, 36721, 3962, 3963, 36731, 3969, 3979, 3985, 3986, 36756, 3991, 3997, 3999, 4001, 4017, 4018, 4026, 4029, 4036, 4040, 36807, 4047, 4050, 4052, 4061, 4062, 36831, 36828, 4068, 4072, 36841, 36845, 4079, 36849, 4082, 4084, 4092, 4094, 4097, 4098, 36866, 36868, 4100, 33379, 36875, 4109, 36877, 36879, 36887, 36888, 4120, 4123, 4124, 36891, 33383, 33386, 4151, 4152, 33390, 36923, 36924, 4155, 59446, 36946, 4178, 4190, 4193, 4194, 36962, 36964, 36965, 36967, 36971, 4205, 36974, 36975, 4211, 36973, 36984, 4215, 4216, 4219, 4220, 36987, 4226, 4229, 36997, 4231, 4235, 37010, 4242, 37015, 37019, 4251, 4254, 37022, 4258, 4263, 4266, 4267, 4270, 37038, 4275, 4274, 4279, 4280, 37048, 37052, 4284, 4286, 4289, 4290, 37060, 37063, 37067, 4300, 4301, 37069, 37071, 4303, 37070, 37074, 4306, 37075, 4311, 37079, 37084, 37083, 4318, 37086, 4322, 37099, 4334, 4339, 4343, 4344, 37112, 37116, 4348, 39956, 4609, 4610, 37384, 4618, 37392, 37394, 37395, 37396, 37399, 37400, 4631, 37403, 37404, 37406, 37407, 4657, 4658, 37427, 4659, 37424, 4663, 4669, 4671, 4689, 37458, 4690, 4692, 37460, 4696, 4698, 4700, 37470, 37471, 37472, 37474, 37475, 37476, 4708, 4707, 37479, 37480, 4711, 37482, 4712, 37484, 37483, 37486, 37487, 4716, 37488, 4723, 37492, 4724, 37491, 4727, 4731, 4732, 37504, 37506, 37507, 37508, 4740, 37511, 37512, 4744, 37514, 37515, 37516, 4747, 37518, 4751, 37519, 4748, 37522, 37523, 37520, 37517, 4755, 37527, 4759, 37534, 37535, 37536, 37538, 37540, 4772, 37544, 37546, 37548, 37550, 37549, 37554, 37556, 4788, 37560, 4792, 37562, 37564, 4796, 37566, 37568, 37570, 4803, 37572, 4807, 4808, 37575, 37578, 37576, 4812, 37579, 37583, 37587, 37588, 4819, 37591, 4823, 37595, 37600, 37602, 37604, 4836, 37607, 37608, 4840, 37610, 37612, 4844, 37614, 37615, 4849, 4850, 4851, 4852, 37620, 4858, 4859, 4860, 37631, 4865, 4866, 37636, 4874, 4877, 37650, 4883, 37651, 37652, 37655, 37658, 40052, 37684, 37687, 4927, 37713, 4948, 37716, 37720, 37730, 4963, 37731, 37732, 4964, 37735, 37736, 37740, 37742, 37748, 37762, 37763, 4995, 37764, 4996, 4999, 37767, 37774, 37780, 37783, 37790, 37796, 5028, 37795, 5031, 37799, 37801, 37805, 5044, 37812, 37816, 37826, 37827, 5059, 37828, 37831, 5063, 37834, 5075, 37847, 37858, 37859, 37860, 5092, 37863, 37866, 37869, 37873, 37874, 5107, 5108, 5111, 37882, 37885, 5119, 33586, 38146, 5380, 38149, 5384, 5387, 5391, 5393, 38162, 38163, 38164, 5394, 5395, 38167, 5396, 38171, 5405, 38175, 5407, 38174, 38192, 38194, 38195, 5427, 5429, 5431, 5432, 38199, 5436, 5439, 5458, 5466, 5470, 5472, 5473, 38242, 5475, 5474, 5476, 38244, 5479, 5480, 38248, 38250, 5483, 5482, 38247, 38254, 5487, 38255, 5489, 5484, 38259, 38252, 38260, 5492, 38263, 5495, 5498, 5496, 5501, 5503, 5500, 5506, 5507, 38276, 38275, 38274, 5511, 38280, 38283, 38284, 5517, 38287, 38282, 5518, 38290, 38291, 5523, 38292, 38295, 38296, 5525, 38299, 38300, 38302, 38303, 5535, 38304, 5538, 38307, 5539, 5533, 38301, 38311, 5543, 5544, 5546, 38315, 5548, 38316, 5550, 38319, 5549, 5547, 5554, 5557, 5559, 5560, 5562, 5564, 5565, 5566, 5567, 38336, 5569, 38337, 38339, 5572, 5571, 5573, 5575, 38343, 5579, 5583, 38351, 38354, 5587, 38356, 38355, 5588, 38359, 5591, 38360, 38363, 38364, 38366, 38367, 5599, 5602, 38371, 5603, 38368, 5605, 38375, 38373, 5610, 38379, 5614, 38383, 5615, 38385, 5618, 38387, 5620, 5619, 5621, 5623, 5624, 38394, 38396, 5628, 5631, 5650, 5651, 38419, 38418, 38423, 5655, 5662, 5681, 5682, 5683, 5687, 5688, 5691, 5692, 5693, 5690, 5730, 38503, 5738, 5745, 5746, 5747, 38519, 5751, 5752, 5754, 38523, 5756, 38524, 5758, 5762, 38535, 38539, 59764, 5778, 5783, 38560, 5809, 5810, 5811, 5813, 5815, 5816, 38584, 5818, 5820, 38588, 38591, 5823, 38594, 5831, 5841, 5842, 5843, 5847, 5851, 38626, 5863, 38638, 5874, 5877, 38648, 38652, 5884, 38655, 5887, 38657, 38658, 5890, 5892, 38660, 5889, 38669, 5901, 5898, 38675, 5907, 38676, 38679, 38683, 38687, 38708, 38737, 38738, 5972, 38740, 5975, 38743, 38746, 38754, 5987, 38756, 5988, 38759, 5991, 38755, 38763, 38772, 38786, 6019, 38788, 6020, 6023, 38791, 38796, 6036, 38804, 38808, 38811, 38812, 38815, 6051, 38820, 6052, 38819, 6055, 6056, 38824, 38823, 6060, 6068, 38836, 38840, 38850, 38851, 38855, 38859, 38863, 6099, 6100, 38868, 38872, 38875, 38876, 38879, 38882, 38883, 38884, 6116, 38887, 38888, 38890, 38889, 38897, 38898, 6131, 6132, 38906, 6139, 6141, 6143, 38908, 38928, 38930, 38931, 6164, 6163, 6162, 6167, 38935, 38938, 38941, 38943, 38939, 38961, 6194, 6195, 38964, 6196, 6204, 6207, 39008, 6240, 39011, 6244, 39015, 39023, 6257, 6260, 6259, 6258, 6263, 6269, 39042, 39043, 39056, 6290, 6291, 39060, 6298, 39067, 6302, 6304, 39072, 39074, 6307, 6311, 6312, 39081, 6316, 39085, 6321, 6323, 39092, 39095, 6327, 39107, 39108, 39111, 39112, 6344, 39115, 39116, 6347, 6348, 6351, 39121, 6355, 6356, 6359, 6364, 6360, 39135, 6371, 39140, 39139, 39143, 6375, 39145, 39148, 39170, 6404, 6408, 6411, 6415, 39186, 39187, 39188, 6419, 39189, 39191, 39192, 39194, 39195, 39196, 39198, 39199, 6431, 39216, 39218, 6451, 6453, 39223, 6456, 6460, 39230, 6463, 39231, 39265, 39266, 6499, 6500, 39268, 39267, 6503, 39271, 39275, 39278, 39279, 39283, 6516, 6515, 39285, 39287, 6520, 6519, 39291, 6524, 39292, 39295, 6527, 6528, 6531, 39300, 39299, 6535, 39304, 6536, 39307, 6540, 39308, 39311, 39312, 39314, 6547, 39315, 39316, 6549, 39319, 39326, 6559, 39327, 39328, 6562, 6563, 39331, 39335, 6567, 6568, 6570, 39339, 6572, 39340, 6574, 39361, 39363, 6596, 6595, 6597, 39367, 39368, 39370, 6603, 6604, 39375, 6607, 39378, 6611, 39380, 39383, 39384, 39386, 39387, 39388, 39390, 6626, 39395, 6627, 39399, 39403, 6638, 39407, 6643, 6644, 39411, 6647, 6648, 6652, 39420, 6655, 6658, 6661, 6669, 6674, 6675, 39444, 39443, 39442, 39447, 6679, 39451, 39455, 39450, 6707, 6711, 39482, 6715, 39487, 6719, 6737, 6738, 39508, 6746, 39519, 39520, 39522, 6754, 6756, 6755, 39523, 39527, 6759, 39531, 6762, 39535, 6770, 6771, 39540, 6772, 6775, 6776, 39547, 6780, 6782, 6779, 39554, 6786, 6788, 39555, 39559, 6792, 39562, 39563, 6794, 39566, 39567, 6796, 6802, 6803, 6807, 6811, 39579, 6810, 39583, 6814, 39584, 39586, 6820, 39588, 39592, 39594, 39596, 39598, 6835, 39604, 6839, 39608, 6840, 39612, 6844, 6847, 39615, 39618, 6851, 39620, 6855, 6856, 39623, 39626, 6859, 6860, 39624, 39630, 39631, 6867, 39636, 6871, 6872, 39643, 6876, 39650, 39652, 6884, 6887, 39656, 39658, 39660, 39662, 39663, 6897, 6898, 6899, 6900, 39668, 6906, 6907, 6908, 6909, 39676, 39679, 6911, 39698, 39699, 6931, 6932, 39700, 39703, 39706, 39707, 39708, 39711, 39710, 39730, 39731, 39732, 6973, 6974, 39778, 7012, 39783, 7021, 39790, 39791, 7037, 39810, 7044, 7047, 7048, 39815, 7052, 7058, 7059, 39828, 39827, 39831, 39835, 7070, 39840, 7075, 7079, 39857, 39858, 7091, 7092, 39859, 7095, 7099, 7103, 7107, 39879, 39883, 7118, 39890, 39891, 7124, 7127, 39898, 7139, 39904, 39911, 39915, 7151, 39921, 39922, 39923, 7155, 7156, 39928, 7160, 39930, 7163, 7164, 39932, 7159, 7167, 39952, 39954, 39955, 7188, 7187, 7186, 7191, 39959, 39985, 7218, 7219, 39988, 7220, 39991, 39992, 39995, 39996, 7230, 7231, 39999, 23733, 40032, 7264, 40035, 7268, 40039, 7272, 40040, 7273, 7276, 7277, 7281, 7284, 7283, 7282, 7288, 40055, 7292, 7293, 40066, 40067, 40064, 7307, 40077, 40079, 40080, 7311, 7314, 7315, 40084, 40087, 40088, 40098, 7331, 7335, 7339, 40109, 7343, 7345, 7346, 7347, 40116, 40119, 40120, 7352, 7354, 7356, 7357, 40128, 40131, 40132, 40135, 40145, 7379, 7380, 40151, 7383, 7387, 40158, 7391, 40159, 40160, 7392, 7395, 40164, 40163, 40167, 7399, 40169, 40171, 40173, 7441, 7442, 7443, 40212, 40211, 7444, 40215, 7448, 7450, 7452, 7475, 40245, 40247, 7480, 40248, 7479, 7484, 40252, 40255, 7506, 7518, 7521, 7522, 7523, 40292, 40290, 7527, 40295, 40298, 40300, 7534, 7537, 7538, 40308, 40305, 7543, 40312, 7544, 7546, 40315, 40316, 7549, 40311, 7552, 7554, 7555, 40324, 40322, 40325, 40327, 7560, 40328, 7562, 40330, 7564, 40332, 7566, 7563, 40331, 7571, 34071, 34072, 7586, 7587, 7592, 40360, 7594, 7595, 7596, 7598, 7602, 7607, 7608, 7610, 7612, 7614, 7615, 40384, 7617, 40387, 7623, 7624, 40391, 7626, 7635, 7636, 7639, 40407, 40409, 40412, 40415, 7650, 40423, 7662, 40431, 40433, 7666, 40435, 40442, 40444, 7676, 7679, 7681, 7682, 40456, 7690, 40464, 7699, 7703, 7704, 40471, 7707, 7708, 40475, 7729, 7730, 7731, 40496, 7735, 7736, 34102, 7738, 7739, 7740, 7741, 7761, 40530, 7762, 7764, 40532, 7768, 7770, 7772, 40542, 40544, 7776, 40547, 40548, 7783, 40552, 40555, 40556, 40559, 40560, 7793, 7795, 7799, 7800, 40567, 7802, 40571, 7804, 40576, 40580, 7815, 40584, 40588, 40589, 40590, 40592, 7827, 7831, 40608, 21097, 40610, 40612, 7844, 40616, 7848, 40618, 40620, 40621, 40622, 7857, 40626, 7859, 7860, 40628, 7858, 7861, 7864, 40632, 40634, 7866, 7868, 40636, 40638, 40639, 7872, 40640, 7871, 7879, 40648, 7883, 40651, 7889, 7890, 7891, 7895, 7898, 7901, 7904, 40672, 40674, 40676, 7908, 7911, 40680, 7912, 40682, 7915, 40684, 40686, 7921, 7922, 7925, 40696, 7930, 40700, 7933, 7932, 40703, 7935, 7955, 40722, 40723, 40724, 7959, 40727, 40731, 40734, 40735, 7965, 7988, 34155, 34156, 34159, 8035, 40803, 40804, 8039, 40815, 34164, 8052, 8059, 8061, 8063, 8067, 40836, 8071, 40839, 8082, 8084, 40852, 40855, 40859, 8094, 40863, 40868, 40871, 40881, 40882, 8115, 40883, 8116, 40888, 8119, 40890, 40892, 8127, 8130, 40899, 40900, 8132, 8142, 21164, 40915, 8151, 8157, 8158, 8164, 40945, 40946, 8179, 8180, 40947, 8183, 40954, 40956, 40952, 8191, 8210, 8213, 8215, 40983, 8217, 8218, 40986, 8221, 8222, 8223, 8245, 8249, 8250, 8252, 8255, 8288, 41073, 8306, 8308, 8309, 8310, 8313, 8314, 8317, 8318, 8319, 8320, 21193, 8338, 8341, 41111, 8343, 8346, 41119, 8351, 41137, 8370, 8372, 8374, 8381, 8383, 8384, 17781, 8402, 8407, 41175, 8409, 8410, 8412, 8414, 8415, 8416, 34252, 21238, 34292, 34294, 8706, 41476, 8709, 41480, 8712, 8719, 41490, 41491, 41492, 8723, 8722, 41495, 41496, 8728, 41493, 41499, 41500, 8731, 41502, 41503, 8733, 8732, 8735, 8754, 41523, 8755, 41525, 8757, 8759, 8760, 8758, 8763, 8764, 41535, 8767, 8785, 41554, 8786, 41556, 8788, 8787, 8791, 8794, 41566, 8799, 41569, 41570, 41571, 41572, 8801, 8806, 41575, 41576, 8808, 41578, 41580, 8807, 41582, 8813, 8815, 8818, 8819, 41588, 41589, 53856, 8824, 8827, 8829, 8828, 8831, 41600, 41601, 41602, 41603, 41604, 8834, 8838, 41607, 41608, 8840, 41610, 41611, 41612, 8845, 41614, 41615, 8843, 41618, 41619, 41620, 8851, 8852, 8847, 41624, 41623, 8859, 8861, 41630, 8862, 41633, 41634, 8866, 41636, 41629, 8870, 41632, 8872, 8875, 8877, 41646, 8874, 8873, 8876, 41650, 8879, 41652, 8884, 53869, 8882, 41656, 8885, 41658, 8891, 41660, 8893, 41662, 8894, 41665, 41666, 41667, 41668, 8899, 8902, 8903, 8904, 8900, 41674, 41675, 41676, 8909, 8907, 41678, 8906, 8911, 8908, 41683, 41684, 41687, 8920, 8919, 41691, 8923, 8924, 41693, 41695, 8927, 41696, 41698, 41699, 41700, 8931, 8928, 41703, 41704, 8935, 41706, 41707, 41708, 8939, 41710, 8945, 8946, 41716, 8948, 8949, 41719, 41720, 8954, 41723, 8955, 8957, 8956, 41727, 8959, 8961, 8962, 8964, 8970, 8971, 8973, 8975, 8979, 8984, 8983, 41755, 8988, 8987, 41759, 9010, 41779, 9011, 9013, 9015, 9016, 41787, 9020, 41791, 9023, 9058, 9059, 9060, 9064, 9063, 9068, 9069, 9073, 9075, 9079, 9080, 41851, 9084, 9082, 41855, 9091, 9092, 9095, 9096, 41867, 41868, 9100, 41871, 9103, 9107, 9115, 9123, 9124, 41892, 9127, 9128, 9132, 41902, 9135, 9148, 9151, 9154, 9155, 9156, 41927, 41928, 9159, 9160, 41931, 9164, 9165, 41935, 9171, 9176, 9175, 9180, 9179, 41952, 41955, 9188, 41956, 9187, 41959, 9191, 9196, 9201, 41971, 41974, 41976, 9210, 41980, 9212, 9215, 53965, 42241, 42242, 9474, 42245, 9480, 42250, 42253, 9485, 9487, 9488, 9489, 42258, 42259, 42260, 9491, 42262, 42263, 9494, 9492, 42266, 42267, 42268, 9500, 42271, 9498, 9501, 9499, 21429, 9520, 9521, 42290, 9522, 42292, 9525, 42294, 42296, 9528, 9530, 9531, 9532, 42301, 42302, 42303, 9535, 42322, 42323, 42327, 42330, 42336, 42337, 42338, 9569, 42340, 9572, 9568, 9575, 42344, 9576, 42346, 9578, 9580, 42350, 9583, 9584, 9585, 42356, 9587, 42358, 9590, 9591, 9594, 42363, 42364, 9596, 42365, 42367, 9597, 9592, 9603, 42372, 9602, 9599, 9607, 42376, 9608, 42379, 9612, 9613, 9615, 9616, 9611, 42386, 42387, 42388, 9620, 42391, 42392, 9624, 42394, 42395, 42396, 42398, 42399, 42400, 9632, 9635, 42404, 9634, 42407, 9640, 9644, 9645, 9643, 9647, 42418, 42420, 9651, 9652, 9655, 9656, 42422, 42426, 42427, 42428, 9660, 9659, 42431, 9663, 42433, 9665, 9668, 42432, 9671, 9672, 42437, 9674, 9676, 42445, 9675, 42447, 9679, 9681, 42450, 42451, 42452, 9683, 42455, 9684, 9690, 9691, 42458, 9692, 9700, 42464, 42469, 9703, 9696, 42474, 9708, 42479, 9711, 9713, 9714, 9715, 9716, 9717, 9718, 9719, 9720, 9722, 9723, 9724, 9725, 42486, 9727, 9730, 9733, 42504, 42511, 9745, 9746, 42515, 42519, 42520, 14964, 9754, 42523, 42524, 9751, 9759, 9778, 42548, 9780, 9782, 42555, 9789, 9787, 9790, 9826, 42594, 42599, 21493, 9834, 42603, 9837, 9838, 42606, 9833, 9841, 9842, 42612, 42616, 9850, 42619, 42620, 42623, 42625, 9860, 42635, 9871, 9874, 9879, 9886, 9887, 42657, 9892, 9897, 9901, 9903, 9906, 42676, 9909, 9910, 42680, 9912, 42684, 42687, 9919, 42707, 42708, 9940, 9942, 9943, 9949, 9947, 9951, 9961, 9965, 9970, 9973, 9974, 9976, 9983, 9985, 9986, 9988, 9994, 9995, 9997, 9999, 10000, 42771, 10003, 42775, 10008, 10007, 10011, 10032, 10034, 42803, 10037, 10039, 10040, 10044, 42815, 10047, 42839, 10076, 10077, 10078, 10079, 10084, 42855, 10088, 10087, 10090, 10089, 10096, 10097, 10094, 10092, 10093, 10103, 10104, 10106, 10116, 42887, 10119, 10120, 10121, 42891, 54115, 10122, 42890, 10128, 42899, 10131, 10139, 42916, 10151, 10152, 10154, 10153, 42926, 10172, 10175, 42947, 10180, 42951, 42952, 10183, 10184, 42955, 10188, 10185, 42959, 10186, 42954, 10189, 10195, 10191, 10190, 10200, 10199, 10203, 42978, 42979, 10212, 42980, 42983, 10220, 10225, 42995, 10234, 43004, 10237, 10239, 10236, 10241, 10238, 43012, 10244, 10242, 10245, 10250, 10251, 43026, 43027, 43028, 10260, 43031, 43032, 10264, 43034, 43035, 10267, 10269, 43038, 43039, 10270, 10291, 10295, 10296, 10300, 10299, 10301, 10303, 10302, 43091, 43095, 10329, 10333, 43104, 43106, 43107, 10339, 10344, 10345, 10346, 10347, 43116, 10348, 43118, 10350, 10353, 10349, 10356, 10360, 10363, 10362, 10365, 43136, 43137, 43138, 43139, 10369, 10372, 10366, 10376, 43146, 10378, 10379, 10381, 43150, 10382, 43156, 10391, 10396, 10399, 43169, 10401, 10400, 10404, 10408, 10410, 10411, 10413, 10414, 10417, 10424, 10426, 43196, 10428, 43199, 10432, 10431, 43202, 43203, 43204, 10435, 10436, 43207, 43208, 10440, 43210, 43212, 10444, 10443, 10441, 10442, 10445, 10451, 10450, 10446, 10456, 10458, 10460, 10459, 10464, 10462, 43234, 10461, 43236, 10468, 43239, 10472, 43242, 10471, 10482, 43256, 10488, 10490, 10492, 10495, 43265, 43266, 10504, 10511, 10512, 10513, 43282, 43283, 43284, 10515, 43286, 43287, 10516, 10520, 43290, 43291, 43292, 10524, 43293, 43295, 10522, 10544, 10545, 10546, 43316, 10549, 43318, 43320, 10554, 10556, 43325, 10559, 43347, 43351, 43361, 43362, 10593, 43364, 10592, 10602, 43373, 10608, 10609, 10611, 10612, 10615, 10616, 10618, 43387, 10620, 10619, 43391, 10627, 43396, 43400, 10636, 10640, 43412, 10644, 43416, 10648, 43420, 43424, 10659, 43427, 43431, 10668, 10674, 10675, 43444, 43445, 43446, 10679, 10680, 10678, 10677, 10684, 43455, 10687, 43457, 43458, 43459, 10689, 10692, 43461, 43466, 10698, 10700, 43469, 43471, 10705, 43476, 10708, 10709, 10714, 10716, 10724, 10732, 10737, 10738, 10739, 10740, 10741, 43509, 10743, 10744, 43510, 10746, 10747, 10748, 10742, 10751, 10754, 43524, 10757, 43528, 10760, 10767, 10769, 43538, 43539, 43540, 10771, 10770, 43543, 43544, 10775, 10778, 43547, 43548, 10779, 43550, 43551, 10781, 10783, 10802, 10803, 10804, 10806, 10807, 10808, 10805, 10811, 10812, 43583, 10815, 10833, 10835, 43604, 10836, 10839, 10842, 43611, 10843, 43617, 43618, 43619, 43620, 10849, 10852, 43623, 10856, 10855, 43627, 43628, 10858, 43630, 43631, 10859, 10865, 10866, 43636, 10867, 10862, 10874, 10875, 10877, 43649, 43650, 43651, 43652, 10882, 43655, 43658, 43660, 10893, 43662, 43668, 10899, 10900, 10903, 10907, 10911, 43681, 10914, 43684, 43680, 10925, 10930, 43700, 10932, 10933, 43704, 10936, 10939, 43708, 10940, 10943, 43713, 43714, 10947, 43716, 10945, 10948, 10951, 10952, 10955, 43724, 10954, 43726, 43732, 10964, 10968, 10967, 10971, 10975, 10979, 43748, 43754, 10987, 10993, 10994, 43764, 10996, 10997, 43768, 11000, 11002, 43771, 11003, 11004, 11007, 43794, 43796, 11032, 11031, 43802, 43804, 11034, 43806, 11039, 11033, 43828, 11060, 11061, 11065, 11066, 43835, 11068, 11062, 11064, 11071, 11091, 11095, 11097, 11101, 11104, 43874, 11107, 11108, 11115, 43886, 11119, 43889, 11127, 11128, 11129, 11130, 11135, 43906, 11139, 43912, 11143, 11144, 11147, 11148, 43917, 11151, 11150, 11153, 43916, 11149, 43924, 11162, 43944, 11176, 11175, 11180, 43950, 11183, 11181, 11185, 11182, 43948, 11192, 11194, 11196, 11199, 43970, 11204, 43975, 43981, 11215, 11220, 11218, 43988, 11225, 11226, 43996, 11231, 11230, 44002, 44007, 44017, 11250, 44020, 11256, 44028, 11260, 11262, 11263, 11265, 44034, 11266, 44036, 11268, 11269, 11274, 11275, 44050, 44051, 44052, 11284, 44055, 44056, 11288, 44058, 44059, 11291, 11293, 44062, 44063, 11294, 44080, 11315, 11319, 11320, 44091, 11324, 11323, 11325, 11327, 11326, 44115, 44119, 11353, 44121, 11357, 44125, 44128, 44130, 44131, 11363, 11368, 11369, 11370, 11371, 44140, 11372, 44142, 44143, 11374, 11377, 44146, 11373, 11380, 11384, 11387, 11386, 11389, 44160, 44161, 11393, 11396, 11390, 11400, 44170, 11402, 11403, 11405, 44175, 44176, 11406, 44180, 44184, 11415, 44187, 44188, 11420, 11423, 44191, 44193, 11425, 11424, 11428, 11432, 11434, 11435, 11437, 11438, 11441, 44210, 11448, 11450, 11452, 11456, 11455, 44228, 11459, 11460, 44231, 44232, 11464, 44235, 44236, 11468, 11467, 11465, 11466, 11469, 11475, 11474, 11470, 11480, 11482, 11484, 8795, 11483, 11488, 11486, 44260, 11492, 8797, 44264, 11496, 44266, 44267, 44268, 44261, 11495, 44274, 11506, 8800, 11512, 11514, 11516, 8802, 11519, 44289, 11522, 8804, 11528, 11533, 11535, 44306, 44307, 44308, 11539, 11542, 44311, 11544, 44315, 11547, 11549, 44316, 44319, 8810, 8811, 8812, 11576, 11579, 44351, 44370, 11616, 44386, 11620, 44388, 11623, 11624, 11627, 11628, 11629, 44398, 11631, 11630, 44403, 44404, 11635, 11638, 11640, 11639, 11636, 44411, 44412, 11645, 11644, 44415, 11643, 11647, 44418, 11650, 44420, 11655, 11656, 44427, 11659, 11661, 44430, 11663, 11660, 44436, 8832, 44443, 44444, 44447, 11680, 44448, 11682, 44452, 11688, 44459, 11693, 11691, 11695, 11692, 44466, 44467, 44468, 11699, 11700, 11703, 11704, 11702, 44474, 44475, 44476, 11708, 11707, 11711, 8841, 11719, 8842, 11720, 11723, 11725, 11726, 11727, 8844, 44499, 11731, 11736, 11739, 21873, 11744, 38240, 11751, 11759, 11763, 11764, 11765, 11766, 11767, 11768, 11771, 11772, 11773, 11775, 11778, 44548, 11781, 44552, 11784, 11791, 11794, 44563, 44565, 44567, 11800, 11802, 44571, 44572, 11803, 11804, 11807, 21887, 11826, 44596, 44597, 11830, 44598, 11832, 8864, 44603, 11835, 11837, 11838, 11839, 11836, 44626, 11858, 44628, 11860, 11869, 44638, 11871, 44640, 11874, 44643, 44644, 11876, 11878, 44647, 44648, 11880, 11881, 44652, 11885, 11883, 11887, 11884, 11890, 44659, 44660, 44661, 44663, 11896, 11898, 11899, 11900, 44673, 11904, 44675, 44676, 11908, 11910, 44679, 44680, 11912, 44682, 44683, 44684, 11917, 11915, 11919, 11913, 11922, 11914, 11916, 44691, 44695, 11933, 11934, 44701, 44702, 44705, 44706, 11936, 44708, 11940, 11942, 44712, 11944, 44714, 11947, 44716, 11949, 44718, 11951, 11946, 11945, 44722, 11948, 44724, 11957, 11958, 44727, 44728, 44730, 11965, 44734, 44735, 11966, 44733, 11970, 44739, 11972, 8892, 11974, 44743, 11976, 11975, 44747, 11979, 11981, 11980, 11983, 8895, 44755, 44756, 11990, 44759, 11992, 44761, 44763, 8897, 11997, 11995, 11996, 11999, 8898, 44770, 44771, 44772, 12000, 44765, 44775, 44776, 12007, 44778, 44779, 44780, 12009, 44782, 12013, 12018, 44788, 38251, 12020, 44791, 12021, 12022, 12029, 44799, 12031, 12036, 44804, 12047, 21933, 44818, 44819, 12051, 44820, 44823, 12055, 12057, 44826, 12059, 44828, 44830, 12063, 12058, 21935, 21940, 21941, 12089, 12090, 44859, 21947, 12121, 12125, 12128, 44900, 12132, 12136, 21951, 44908, 12145, 44914, 12147, 12146, 12150, 12151, 12152, 12153, 12154, 12156, 12157, 12159, 12172, 21958, 12175, 44941, 12174, 44947, 12179, 44940, 12173, 44951, 44943, 12187, 12204, 12207, 12205, 12209, 12210, 12211, 21966, 12206, 12215, 12216, 12218, 12220, 12221, 45006, 45010, 12242, 45012, 45015, 12249, 12250, 12254, 12273, 12274, 12275, 12278, 12279, 12280, 12282, 12284, 12285, 12286, 12305, 45073, 45076, 12337, 45108, 12343, 22002, 12401, 45169, 45172, 12407, 22005, 12423, 12455, 12465, 45233, 45236, 45247, 12487, 12497, 45268, 12529, 45297, 45300, 41568, 12538, 45311, 54628, 54629, 54632, 54636, 12801, 12804, 12808, 12811, 12815, 12816, 12818, 12819, 45587, 12820, 12821, 12824, 12827, 45595, 12829, 12831, 12828, 45617, 12850, 12851, 12855, 54661, 12881, 12882, 12884, 12888, 12892, 12896, 12897, 12898, 12899, 12900, 12902, 12903, 12904, 12906, 12908, 12909, 12913, 12914, 12915, 12916, 12928, 45697, 12929, 12931, 12930, 12932, 12934, 12935, 12936, 45706, 12938, 12939, 12941, 12940, 12943, 12947, 12948, 45715, 12951, 12957, 12960, 12961, 45729, 45731, 12962, 12970, 45738, 12973, 12978, 12980, 12981, 12986, 12988, 12991, 12992, 12993, 12994, 45763, 12995, 12996, 12998, 12999, 13000, 13002, 45771, 13003, 13005, 13006, 13007, 13004, 13011, 13012, 13015, 13016, 13017, 13019, 13020, 13021, 13023, 13024, 13026, 13027, 45795, 13031, 13038, 13041, 13042, 13044, 13045, 13046, 45814, 13050, 13051, 13052, 13053, 45821, 13055, 41671, 13057, 13058, 13060, 13069, 13075, 45844, 13076, 45848, 13082, 45852, 13106, 45876, 13108, 54712, 41689, 13153, 45921, 13155, 45924, 13156, 45937, 45938, 45940, 13172, 13185, 13187, 45956, 54724, 13191, 13188, 45963, 13203, 45972, 13204, 13217, 45986, 45988, 13220, 13223, 13229, 13249, 46017, 13251, 46020, 13252, 13255, 46024, 13258, 46031, 13267, 46036, 13271, 13283, 46052, 13284, 46065, 54745, 46068, 46075, 46077, 46079, 13572, 13581, 13584, 13585, 46353, 46355, 46356, 13587, 13591, 13590, 13586, 46362, 13594, 46363, 13597, 13599, 13596, 13595, 13598, 46385, 13617, 46388, 13623, 13650, 13664, 13665, 46434, 46435, 46436, 13668, 46439, 13671, 13667, 46449, 13681, 46452, 13683, 13687, 46459, 13693, 13695, 13697, 46465, 46467, 13700, 46468, 13699, 13703, 13704, 13706, 46475, 46474, 13708, 13707, 13711, 46479, 13713, 13716, 46484, 13715, 13719, 13725, 13729, 46497, 13731, 46500, 13732, 13728, 46503, 13745, 13746, 46513, 13748, 13747, 13750, 46518, 13752, 13751, 13754, 13755, 46522, 13757, 46525, 13756, 13759, 13761, 46530, 13764, 46532, 46534, 13767, 13768, 13765, 13770, 46539, 46541, 13771, 13775, 13777, 13778, 13779, 13780, 13783, 13789, 13790, 13795, 46564, 13796, 13799, 46567, 46577, 13810, 13811, 13812, 13813, 13815, 13816, 46586, 13819, 13820, 13823, 13825, 13828, 13834, 13839, 46610, 46612, 46615, 46618, 46619, 46623, 46641, 46644, 46653, 46655, 46690, 46695, 46698, 46703, 46705, 46708, 46715, 46719, 46722, 13954, 13956, 46727, 46730, 13963, 13965, 46735, 46751, 13988, 13997, 46769, 46770, 46772, 46774, 46778, 46779, 46781, 46783, 46786, 14018, 46791, 14026, 46798, 46799, 46801, 14034, 46804, 14042, 46815, 46818, 14050, 46823, 14058, 46830, 46831, 14062, 14066, 14074, 14078, 14081, 14082, 14084, 14093, 14099, 46868, 14100, 14103, 46872, 14107, 46876, 14111, 14129, 14131, 14132, 14135, 14167, 14177, 14178, 14179, 46948, 14183, 46961, 46964, 14196, 14209, 46978, 14211, 46980, 14210, 14214, 14215, 14216, 14213, 14218, 14219, 46988, 14221, 46989, 14222, 14227, 46996, 14228, 14241, 47010, 14243, 14244, 14242, 14247, 14268, 14273, 14274, 14275, 47044, 14279, 47048, 14280, 14282, 14283, 22377, 47055, 14284, 14287, 47060, 14295, 14306, 14307, 47076, 14308, 14311, 47089, 47092, 47099, 14332, 14334, 14340, 14347, 14349, 14351, 14352, 47121, 14354, 47123, 14356, 47126, 47127, 14359, 47130, 14363, 14367, 14365, 47153, 14387, 47159, 14391, 14420, 14424, 14428, 14432, 14434, 47203, 14436, 14435, 47207, 47211, 14445, 47215, 47217, 47219, 14452, 14464, 14465, 14467, 14468, 47238, 47239, 14472, 14474, 14475, 47245, 14479, 14481, 14480, 47255, 14487, 14496, 14497, 14500, 14507, 47277, 14509, 14511, 14513, 14528, 14531, 14532, 14536, 14539, 14540, 47313, 14546, 47315, 14547, 47319, 14552, 14556, 47325, 14555, 14560, 14563, 14564, 47345, 14578, 14584, 47354, 14588, 14590, 14596, 14609, 14610, 47379, 47380, 14611, 14614, 14615, 14612, 14618, 47388, 14621, 14623, 14619, 14622, 14641, 47411, 47412, 14645, 14646, 47416, 22450, 14650, 47419, 14653, 14655, 14674, 14686, 14689, 47458, 14691, 47460, 14692, 47463, 47469, 14701, 14705, 47473, 14707, 47476, 14710, 14714, 47482, 47484, 14717, 47489, 14723, 47492, 47496, 47498, 14731, 14732, 21426, 14738, 47507, 14740, 47508, 14739, 14743, 14750, 14752, 47521, 14755, 47524, 47527, 14769, 14770, 14771, 14772, 14774, 14775, 14776, 14778, 14779, 14780, 14781, 14783, 14785, 47554, 14788, 47556, 47558, 14792, 14794, 47564, 47565, 14801, 14802, 14803, 14804, 14807, 14813, 14814, 14819, 14820, 47588, 47591, 47601, 14834, 14835, 14839, 14840, 47610, 14844, 14847, 14850, 14852, 14856, 14859, 14863, 47634, 14867, 47636, 47635, 14868, 47639, 14866, 14875, 14877, 47665, 14899, 47668, 14901, 14907, 47679, 14911, 14929, 14932, 14940, 14945, 14946, 14948, 47719, 14951, 14957, 14961, 47730, 14963, 47732, 47729, 14971, 47741, 14973, 47745, 14978, 14982, 47751, 14983, 47754, 14987, 14986, 14989, 14995, 14996, 47767, 14999, 15005, 47777, 9496, 15008, 47786, 47793, 47794, 15026, 15028, 47796, 47802, 47803, 15036, 47805, 15039, 47807, 15041, 15042, 47811, 15044, 47815, 15048, 15047, 15050, 15051, 15053, 15055, 47825, 15058, 15059, 15060, 47828, 15063, 15064, 15066, 15068, 15067, 15082, 47851, 47855, 15087, 15089, 15090, 15092, 47862, 15098, 15099, 15100, 47869, 15102, 15103, 15105, 15106, 15108, 15114, 15117, 47891, 47895, 15155, 15156, 54007, 47969, 47971, 15204, 15203, 15223, 48003, 15239, 15247, 15251, 48023, 15271, 15277, 48049, 15282, 48054, 48058, 15293, 15295, 48065, 15298, 15300, 48071, 15306, 15311, 48083, 15316, 48087, 15327, 48103, 48113, 15346, 15348, 48118, 15352, 15354, 48122, 15356, 15359, 15364, 15373, 15375, 15376, 48145, 15378, 48147, 15380, 48151, 15383, 48154, 48155, 48159, 15389, 48177, 15411, 15419, 48189, 48191, 15421, 15423, 9579, 9581, 9582, 15444, 15448, 15452, 15456, 15458, 48227, 15460, 15459, 48231, 15464, 15466, 15468, 15469, 48241, 15474, 15476, 9588, 15479, 15480, 48251, 15488, 15489, 15490, 15491, 15492, 15485, 48263, 15496, 15498, 15499, 48271, 15503, 15505, 9595, 15520, 15521, 15524, 15533, 15537, 15544, 15548, 15552, 15554, 15555, 15556, 48337, 15570, 15571, 15576, 48347, 15580, 48351, 15579, 15584, 15586, 15587, 15588, 15581, 15592, 15596, 15598, 48369, 15608, 15612, 15615, 15618, 15620, 15629, 48401, 15634, 48403, 15635, 15636, 15639, 48410, 48411, 48413, 15642, 22650, 48433, 48434, 48436, 15669, 15672, 15675, 48445, 15679, 48483, 48484, 15719, 48493, 48497, 15731, 15732, 48502, 15735, 15736, 15733, 48506, 48507, 15740, 48509, 15739, 15743, 15745, 48513, 48515, 15748, 15749, 15751, 15752, 15754, 48523, 48522, 15755, 15759, 15761, 15762, 15763, 15764, 15777, 48545, 15780, 48548, 9650, 15793, 15794, 48561, 15795, 15796, 48566, 15799, 15800, 9653, 15802, 48570, 15804, 15805, 48573, 15803, 15807, 15808, 9654, 15812, 48582, 15815, 15819, 48589, 15823, 15826, 15827, 15828, 15831, 48612, 15844, 15847, 15859, 15860, 15863, 15864, 15867, 15868, 15871, 15873, 15874, 15876, 15877, 15880, 15882, 15885, 15887, 15888, 48658, 15891, 15893, 15896, 48666, 15899, 15900, 48670, 15903, 22702, 15920, 48689, 48690, 9677, 9678, 22709, 15954, 15956, 15960, 9685, 15964, 15967, 15968, 15969, 48738, 15971, 15972, 15970, 9688, 15976, 15978, 15979, 48746, 15980, 15981, 15983, 48753, 48754, 42256, 16000, 16001, 16002, 16003, 16004, 48770, 16008, 16010, 16011, 48778, 16013, 16012, 16015, 16016, 48786, 16019, 16025, 16027, 16029, 16033, 16034, 48803, 16036, 16040, 16042, 16043, 48811, 16045, 16044, 16047, 48817, 16050, 48822, 48826, 16058, 48829, 16064, 16065, 48834, 16067, 16068, 16066, 16071, 16072, 16074, 16075, 16076, 16077, 48846, 16079, 48849, 48850, 16083, 16087, 16088, 16089, 16091, 16092, 48861, 48862, 16095, 16096, 16093, 48866, 16099, 48867, 16103, 48878, 16114, 16116, 16118, 16125, 16127, 16129, 16132, 16141, 16147, 16148, 48919, 16151, 16154, 16155, 16156, 48927, 16159, 48993, 16226, 16238, 16241, 49037, 16276, 16275, 22774, 49073, 16307, 16308, 16305, 16311, 49082, 49089, 16322, 49091, 16324, 49095, 16330, 49103, 16338, 16339, 16340, 16343, 16346, 49119, 49123, 16356, 49127, 16364, 49137, 16371, 16372, 16369, 16375, 16386, 16388, 49156, 16395, 16397, 16400, 49170, 49173, 16407, 49175, 16409, 49179, 16411, 16410, 49182, 16415, 16408, 49181, 16432, 49208, 16441, 16442, 49211, 49212, 49215, 16469, 16480, 16485, 16493, 16492, 16496, 16497, 16499, 49268, 16502, 16503, 16506, 16504, 16508, 16509, 49279, 16505, 16512, 16507, 16517, 16528, 49298, 49301, 16535, 49303, 49306, 49307, 16539, 16543, 16546, 49314, 16558, 16561, 49330, 16563, 49332, 16565, 16566, 49335, 16568, 16570, 16567, 16572, 16573, 49343, 16576, 49356, 16588, 16590, 49359, 16591, 16589, 49362, 22837, 16599, 16601, 16602, 16603, 49374, 16607, 16608, 16610, 49378, 16622, 16898, 49666, 16901, 16904, 16911, 16915, 16919, 16923, 16944, 16947, 16949, 16950, 16955, 16977, 49746, 16979, 16980, 49748, 16983, 49752, 16986, 16988, 16991, 16993, 16992, 16995, 16996, 16998, 49767, 17000, 17002, 17003, 17004, 17005, 17007, 17011, 17015, 17019, 49792, 17025, 17027, 17028, 17030, 49799, 17034, 17035, 17036, 17037, 49802, 17039, 17040, 17038, 17043, 17044, 49811, 17047, 49815, 17051, 17053, 17054, 17056, 17057, 17060, 17062, 17066, 17067, 49834, 17069, 17070, 17076, 49844, 49848, 17083, 17084, 17085, 17086, 49856, 17089, 17091, 49859, 17092, 17094, 17095, 17096, 17098, 17099, 17100, 17101, 49867, 17107, 17108, 49875, 17111, 17112, 49879, 17120, 17123, 49891, 17124, 17127, 17128, 17131, 49899, 17137, 49906, 17140, 17143, 17144, 17146, 49917, 17151, 49921, 17154, 17156, 17163, 17165, 17171, 17179, 17183, 49970, 17212, 49983, 17215, 17248, 50018, 50019, 50020, 50023, 17265, 17267, 17270, 17274, 17277, 17279, 50051, 17283, 50052, 17287, 17288, 50056, 17292, 50063, 17299, 17307, 17312, 17315, 50084, 17316, 50083, 17319, 17320, 50087, 17324, 50114, 17347, 50116, 50119, 17359, 17363, 17371, 17376, 17379, 50148, 17380, 50147, 50151, 17384, 17391, 17393, 17398, 17402, 17405, 16494, 16495, 17665, 17666, 17669, 17672, 50440, 17674, 17677, 17679, 50448, 17681, 17682, 17683, 17684, 50451, 17686, 17687, 50454, 50456, 17690, 17691, 50459, 17693, 50461, 17695, 50463, 17692, 50460, 17712, 17713, 50480, 17715, 17718, 17719, 17720, 17722, 17724, 17725, 17727, 17746, 17747, 17751, 17754, 17760, 50529, 17762, 17761, 50532, 17764, 50530, 17767, 17768, 50528, 50538, 17770, 50539, 17772, 50542, 17775, 50543, 17777, 17778, 17779, 17780, 17782, 17783, 17784, 17786, 17787, 17788, 17789, 17791, 50556, 50555, 17794, 17796, 17792, 50560, 50568, 17799, 17802, 17803, 17800, 17805, 17807, 17808, 50576, 50575, 17811, 17812, 50580, 17815, 50584, 50581, 17817, 50585, 17821, 50589, 17823, 50591, 17824, 17826, 17828, 50599, 50600, 17832, 17835, 50604, 17837, 50607, 17842, 50610, 17844, 17845, 17846, 50614, 17850, 50620, 17855, 17856, 50625, 17857, 50623, 50628, 17860, 17861, 17863, 50632, 17866, 17868, 50635, 50637, 17871, 50639, 17873, 50638, 17875, 50644, 17878, 17879, 17880, 50648, 17882, 50651, 17884, 17885, 50652, 50655, 17887, 17888, 17881, 50653, 17892, 17893, 17895, 17900, 17903, 17905, 50673, 17907, 50676, 50678, 17911, 17912, 17909, 17914, 50683, 17916, 50685, 50684, 50682, 50687, 17922, 17925, 17928, 17935, 50705, 50706, 50707, 17939, 17938, 17943, 17944, 50711, 17947, 50716, 17948, 17946, 50737, 50740, 50742, 50747, 50748, 50750, 18016, 18018, 10095, 50793, 18026, 18030, 50801, 18035, 18039, 18040, 18043, 50812, 18044, 18049, 18052, 18058, 18063, 18066, 50839, 18071, 18074, 18075, 50847, 18080, 18081, 18084, 18090, 18095, 18098, 50866, 50870, 18101, 18104, 50872, 18108, 50876, 18111, 50879, 18119, 18123, 50897, 18130, 50900, 50902, 18135, 50907, 18139, 50911, 18138, 18144, 18151, 18155, 50925, 18162, 50930, 50934, 18165, 18168, 50936, 18172, 50940, 18175, 50943, 50945, 18178, 18180, 50954, 18187, 18189, 18192, 18195, 18203, 18224, 18236, 18239, 51031, 18263, 18268, 18269, 18272, 18271, 18270, 51043, 51044, 18279, 18281, 18282, 18288, 18289, 18294, 18298, 18301, 18304, 51075, 18307, 51076, 18311, 18313, 18314, 18316, 51087, 18320, 18323, 18331, 18336, 18339, 18340, 51108, 18344, 18345, 18346, 18348, 18359, 18368, 18371, 51140, 18377, 18378, 51148, 18383, 18387, 18395, 18400, 18403, 51172, 18404, 18408, 18415, 18417, 18422, 18426, 18428, 18429, 51198, 18430, 18433, 18434, 18431, 18436, 18437, 18442, 18443, 18445, 18447, 18452, 51223, 18456, 18483, 18495, 51263, 18515, 18519, 18521, 18525, 18528, 18535, 18536, 18539, 18537, 18541, 51313, 18547, 18548, 18545, 18552, 18551, 18556, 18554, 18559, 51329, 18562, 18560, 51338, 51339, 18572, 18573, 18575, 18579, 18578, 51351, 18588, 18589, 18591, 51361, 18594, 18592, 51363, 51367, 51368, 18601, 51370, 51371, 18604, 18605, 18607, 51377, 18610, 18611, 18609, 18612, 18615, 18616, 18620, 18621, 18623, 18618, 51392, 18626, 18628, 18631, 18632, 51401, 18634, 18635, 51402, 51404, 51407, 18642, 18647, 18650, 51424, 18656, 18658, 51427, 18660, 18663, 18664, 51431, 18666, 18665, 18669, 18674, 18679, 18682, 18690, 18693, 18696, 51464, 18703, 18705, 51471, 51475, 18707, 51476, 18710, 18709, 51480, 18714, 51484, 18717, 51487, 18719, 18736, 18737, 51504, 51509, 18742, 18744, 18746, 18748, 18749, 18751, 18771, 18775, 18784, 51553, 18785, 51556, 18788, 18787, 18791, 18794, 18799, 18801, 51569, 18803, 51572, 18806, 18807, 18808, 51568, 18810, 51579, 51580, 18813, 18812, 18816, 51591, 51592, 18832, 18835, 18836, 51604, 51605, 18847, 18848, 51623, 51624, 18868, 18869, 18870, 18879, 51649, 18881, 51652, 18884, 18885, 51658, 18890, 18892, 51659, 51663, 18895, 18897, 18899, 51668, 18902, 18901, 18906, 18909, 18911, 18912, 18916, 18917, 18924, 51697, 18931, 51700, 18933, 18935, 18936, 18934, 51707, 51708, 18940, 18946, 18949, 18952, 18959, 51729, 51730, 18963, 18962, 18967, 18968, 51735, 18971, 18972, 18970, 18995, 51764, 18998, 18997, 19003, 51772, 51768, 51794, 19027, 19028, 19031, 19039, 19040, 19041, 19042, 19043, 19044, 19050, 19052, 19054, 19055, 51825, 19059, 19063, 19064, 19067, 19068, 19073, 19075, 19076, 19082, 19083, 19084, 19087, 19091, 19092, 19090, 51859, 19095, 51863, 19098, 19099, 51870, 19104, 19105, 19108, 19114, 19115, 19124, 51896, 19131, 51900, 19132, 51903, 19135, 19137, 19139, 51907, 19140, 19144, 19146, 51915, 19148, 19154, 51924, 19156, 19155, 19159, 19160, 19162, 51931, 51932, 19163, 19168, 19172, 19176, 19188, 19192, 51960, 51964, 19196, 19199, 19202, 19205, 19218, 51991, 51992, 51994, 19228, 19229, 19230, 19231, 19250, 19255, 19256, 52025, 19259, 19260, 19263, 19283, 19287, 19289, 19293, 19296, 52067, 52068, 19303, 19307, 19314, 52089, 19324, 19325, 19326, 19327, 52099, 52100, 19335, 19339, 52107, 52108, 19341, 19343, 19340, 19345, 19342, 19351, 19354, 19355, 19363, 19367, 19372, 19373, 19374, 19375, 19377, 19386, 19394, 52163, 19406, 52175, 19410, 19412, 19416, 52185, 52186, 19419, 19420, 19422, 19426, 52195, 19427, 19431, 19438, 19442, 19444, 19452, 19454, 19457, 19458, 19460, 19461, 19466, 19467, 19469, 19471, 19476, 52247, 19480, 19507, 19519, 52287, 19539, 19543, 19545, 19549, 19552, 19559, 19560, 52330, 19563, 52332, 19565, 19561, 52337, 19571, 19572, 19569, 19576, 19575, 52344, 19580, 19578, 19583, 52353, 19586, 19584, 52360, 52362, 52363, 19596, 19597, 19599, 19603, 19602, 52375, 19612, 19613, 19615, 52385, 19618, 19616, 52391, 19625, 19628, 19629, 19631, 52401, 19634, 19635, 52402, 19633, 19636, 19639, 19640, 52410, 19644, 19645, 19647, 19642, 52416, 19650, 19652, 19655, 19656, 52425, 19658, 19659, 52428, 52431, 19666, 19671, 19674, 19680, 19682, 19684, 19687, 19688, 19690, 19689, 19693, 19698, 19703, 19706, 19713, 19714, 19717, 19720, 19722, 19725, 19727, 19728, 19730, 19731, 19732, 52499, 19735, 52504, 52500, 19739, 19741, 19743, 19740, 10439, 19763, 19767, 19768, 19772, 19775, 19794, 19802, 19808, 19810, 52578, 19812, 19815, 19816, 19818, 19820, 52583, 52590, 19823, 19824, 19825, 19826, 19827, 19828, 52598, 19831, 19834, 19835, 19836, 19837, 19839, 52608, 19842, 52610, 19844, 19847, 19848, 52615, 19850, 19851, 52620, 19853, 52622, 19855, 52623, 19859, 52627, 19863, 19865, 52633, 19869, 52637, 19871, 52639, 19872, 19874, 19876, 19880, 19883, 52652, 19885, 52655, 19890, 52658, 52662, 19898, 52668, 52671, 19904, 19911, 52680, 52679, 52683, 52685, 19919, 19923, 52691, 52692, 19924, 19927, 19928, 19929, 19932, 19933, 19936, 19943, 19951, 19953, 52722, 19955, 52726, 19962, 19964, 19970, 52738, 19973, 19976, 19983, 52754, 52755, 19991, 52762, 19995, 52764, 20016, 52785, 52786, 20021, 52791, 20022, 52795, 52797, 52798, 20049, 20052, 52820, 52824, 20058, 20060, 20064, 20067, 20070, 52839, 20072, 52841, 20075, 20077, 52845, 52850, 52851, 20087, 20091, 52864, 20097, 20099, 20100, 20102, 52871, 20106, 20107, 52874, 20109, 20110, 20111, 20112, 52882, 20115, 52887, 20119, 52891, 20125, 52894, 20126, 20128, 20129, 20132, 20134, 52905, 20138, 52906, 20141, 20142, 20143, 52909, 20146, 20148, 52916, 52917, 52918, 52920, 20149, 20152, 20156, 20157, 20158, 20159, 52928, 20163, 20166, 20167, 20168, 20171, 20173, 52945, 20179, 52950, 20183, 52954, 52957, 52960, 20192, 20195, 20199, 20203, 52973, 20209, 20210, 52981, 52982, 20215, 20216, 20213, 20218, 20220, 20223, 20228, 20235, 20239, 20242, 20243, 53011, 20244, 53015, 53016, 53018, 20252, 20253, 20254, 20255, 20279, 20280, 20283, 20313, 20317, 20324, 20327, 20328, 20331, 20332, 20338, 53108, 20340, 20344, 20343, 53115, 20350, 53119, 20351, 20348, 20349, 20359, 20363, 20364, 20365, 20366, 20367, 20372, 20375, 20379, 20380, 20396, 20397, 20398, 20399, 20418, 20430, 20434, 20435, 20440, 20443, 53213, 20446, 20447, 20450, 20462, 20466, 53236, 20468, 53238, 20471, 20472, 53245, 20478, 20479, 53249, 53275, 53304, 53307, 53357, 53358, 53372, 53410, 53418, 53427, 30158, 53436, 53463, 53474, 20993, 20996, 53764, 53768, 21002, 53771, 21005, 53775, 21009, 53779, 53780, 21014, 53783, 53784, 21017, 21018, 53787, 21021, 53791, 21041, 21043, 21044, 53811, 21047, 21048, 53815, 21050, 21052, 23726, 21073, 21074, 53843, 21076, 53844, 53847, 53848, 21082, 21085, 21089, 21090, 53859, 53860, 21091, 21092, 53863, 53864, 21094, 21098, 53868, 21100, 21099, 21103, 21105, 21101, 21106, 53875, 53870, 21111, 53879, 21114, 21113, 21121, 21122, 53891, 53892, 21126, 53895, 53896, 21129, 21130, 53899, 53900, 21133, 21132, 53903, 21135, 21138, 53907, 53908, 53911, 53912, 21148, 21149, 21151, 21153, 53922, 53923, 53924, 21154, 53920, 53928, 21161, 53930, 21162, 53932, 53934, 21167, 21170, 21171, 21172, 53940, 21174, 21175, 21176, 53944, 21173, 21179, 21180, 21181, 21183, 21185, 21186, 21187, 21188, 53956, 21190, 53959, 53955, 53960, 21194, 21195, 21196, 21197, 53964, 21199, 53963, 21201, 53967, 21203, 53971, 53970, 21206, 53966, 53973, 21209, 21210, 53975, 21212, 21213, 53982, 53983, 53986, 53987, 53988, 53991, 53995, 53998, 53999, 21233, 21234, 21235, 54004, 21236, 54002, 21239, 21240, 54005, 21242, 54011, 21245, 21244, 54015, 54014, 54020, 21265, 21267, 54035, 21268, 21271, 21272, 21274, 21276, 21279, 21300, 21301, 21303, 21304, 21307, 21308, 21309, 21311, 21329, 54100, 21332, 21343, 21339, 21345, 21347, 54116, 21348, 21346, 21351, 21352, 21356, 21354, 21359, 21355, 21357, 21361, 21364, 21368, 21372, 21375, 21377, 54147, 21379, 54148, 21380, 21383, 21384, 54152, 21386, 54156, 21388, 21391, 21409, 21411, 21412, 54180, 21415, 21416, 21418, 21420, 21423, 21425, 21427, 54196, 21430, 21431, 21432, 21434, 21436, 21437, 21439, 21441, 21442, 54211, 21443, 21444, 21447, 54215, 21448, 21450, 21452, 21451, 21453, 21455, 21460, 21463, 21464, 54231, 21467, 21468, 21469, 54243, 54244, 56373, 21489, 21490, 21491, 21492, 54259, 21494, 21495, 21496, 54263, 21498, 21499, 21500, 21501, 21503, 54529, 54530, 21762, 21764, 54538, 21771, 54541, 21775, 54546, 54547, 54548, 21779, 21780, 21783, 21784, 54551, 54555, 21788, 21787, 54558, 54559, 54556, 21791, 21789, 54576, 54580, 21812, 21821, 21823, 10850, 54610, 54611, 54615, 54618, 54625, 54626, 21859, 54627, 21858, 21860, 54631, 21864, 21863, 54634, 54635, 21868, 21869, 54637, 54638, 54639, 21871, 54644, 21876, 21880, 21884, 21883, 21889, 54658, 54659, 21891, 21892, 21895, 21896, 54663, 54667, 21900, 21899, 54670, 54671, 21898, 21905, 54672, 54676, 21902, 21901, 54681, 54683, 54685, 54687, 21921, 54690, 54691, 21923, 21924, 21927, 21928, 54695, 54698, 54699, 21932, 21931, 54702, 54703, 21937, 54706, 21939, 54707, 54708, 21942, 21943, 21944, 21938, 54714, 21946, 21948, 54716, 54715, 54718, 21949, 54721, 54722, 21955, 21954, 54723, 21956, 54727, 21959, 21960, 54730, 54731, 21964, 54733, 21965, 54735, 21967, 54728, 21972, 21976, 54740, 21980, 21981, 21983, 54751, 54754, 54755, 54756, 54749, 54759, 54760, 54762, 54763, 54766, 54767, 22001, 54770, 22003, 54772, 22004, 22006, 22007, 54776, 22010, 54775, 54780, 22013, 54781, 22011, 22015, 54783, 23917, 54802, 54803, 23918, 54807, 54808, 54812, 54836, 54840, 54843, 54844, 54847, 23932, 54887, 23935, 54891, 54900, 54904, 54907, 54908, 54911, 54919, 54923, 54939, 54944, 54963, 54964, 54967, 54968, 54972, 54975, 54996, 55003, 55007, 55008, 55036, 55039, 22273, 22274, 22276, 55044, 22282, 22283, 22285, 22287, 55056, 22291, 55059, 22292, 55063, 22297, 22298, 55067, 22300, 55071, 22303, 22328, 22329, 22332, 22335, 23980, 22353, 55122, 22354, 22356, 55124, 23982, 22362, 22363, 22367, 22369, 55138, 22371, 22372, 55140, 22370, 55143, 55139, 22378, 22380, 22379, 22383, 22381, 22385, 22388, 22392, 22393, 22394, 22396, 22399, 55170, 22403, 55172, 22404, 55175, 22409, 55178, 22410, 22412, 22415, 55188, 22435, 22436, 55204, 22441, 22442, 22444, 22447, 22449, 55218, 55220, 22454, 55224, 22456, 55226, 22458, 55228, 55230, 22463, 22465, 22466, 55235, 22467, 22468, 55239, 55240, 22473, 22474, 22475, 22476, 55244, 55247, 22479, 55252, 22489, 22492, 22493, 22490, 55267, 55268, 22513, 22514, 55283, 22516, 22520, 22523, 55292, 22527, 55295, 22536, 22543, 55312, 55314, 22548, 22550, 55319, 22553, 55322, 55323, 22554, 22557, 22559, 30855, 22577, 22582, 22584, 22586, 22588, 22589, 55379, 55383, 55385, 55394, 55395, 22631, 22632, 22633, 55402, 22634, 55406, 55408, 22644, 55412, 22649, 22652, 55425, 22660, 22662, 22665, 55434, 22667, 22666, 22669, 22671, 22670, 22676, 22683, 22685, 55457, 22692, 55460, 22694, 55463, 55464, 22697, 55467, 55468, 22701, 22699, 22703, 22698, 22705, 22706, 22707, 22708, 55475, 55476, 22711, 22712, 22710, 22714, 22715, 22716, 22717, 22718, 55491, 55495, 22727, 22728, 22729, 55499, 55500, 22730, 55508, 22744, 55512, 55514, 22746, 22745, 55524, 55525, 55527, 55531, 22769, 22770, 22771, 22772, 55538, 55540, 22775, 22776, 55543, 22778, 55544, 22780, 22781, 22779, 55553, 55562, 55571, 22803, 55572, 22807, 22808, 55575, 55579, 22812, 55583, 22834, 22835, 55604, 55603, 22838, 22839, 55608, 55607, 22840, 55611, 22844, 22845, 55612, 55615, 55635, 55639, 55645, 55649, 22882, 55650, 55651, 22883, 22886, 55655, 22888, 22887, 22892, 22893, 55661, 22897, 22898, 55667, 22899, 22900, 22903, 22904, 55671, 22906, 55675, 22908, 55672, 22907, 55679, 22909, 22913, 22911, 55683, 22915, 55685, 22919, 22920, 55687, 22922, 55691, 22924, 55695, 22929, 55699, 55700, 55703, 22938, 55707, 55711, 22945, 22947, 22951, 22952, 22954, 22956, 22961, 22962, 22963, 22964, 22965, 22966, 22970, 22971, 22972, 22973, 22975, 55744, 55745, 55746, 22978, 22979, 55747, 22982, 22983, 22984, 55751, 55754, 55755, 22988, 22989, 55757, 55759, 22994, 22995, 55763, 55764, 22998, 22999, 23000, 23004, 23005, 55778, 55779, 55783, 23025, 23026, 23027, 55796, 23028, 23029, 55799, 55800, 23030, 23034, 23035, 23036, 55804, 23037, 23039, 23041, 55812, 23044, 55816, 55823, 23057, 55826, 55827, 55828, 23062, 55831, 23066, 55835, 23069, 55839, 23093, 55864, 55868, 23101, 55871, 23122, 55891, 23124, 55892, 55895, 23138, 55907, 23140, 23139, 55908, 23142, 55911, 23149, 23148, 23151, 23153, 55928, 23162, 55932, 55935, 23169, 23170, 55939, 55940, 23174, 55944, 23178, 55948, 23181, 55956, 23197, 55968, 23201, 23202, 55972, 23206, 55976, 23210, 23218, 55987, 23221, 23222, 23223, 23224, 55992, 55991, 55996, 23229, 55999, 23234, 23235, 23236, 56004, 23238, 56003, 56008, 56011, 23244, 23245, 56012, 23247, 23254, 56024, 56028, 23261, 56035, 56036, 56043, 23282, 56050, 23284, 56052, 23285, 23287, 23288, 23286, 56059, 56060, 23293, 56062, 56063, 23311, 23315, 56090, 23324, 23345, 23348, 23350, 56119, 23354, 56157, 23393, 56161, 23396, 23402, 23403, 56170, 56173, 56177, 23412, 23416, 23420, 17680, 23427, 56195, 23428, 56199, 56200, 23436, 56204, 23439, 17685, 23444, 23455, 23459, 56227, 23460, 56231, 23468, 23471, 23476, 23478, 23480, 23487, 23489, 56258, 56257, 23492, 56260, 23498, 23499, 56266, 56268, 23505, 23508, 23514, 23515, 56284, 56287, 56292, 56305, 56306, 56307, 23540, 23542, 23544, 56314, 56316, 23551, 23560, 56336, 56338, 23572, 23574, 56343, 23577, 56346, 23578, 23581, 23583, 23601, 23613, 56380, 56383, 56403, 56407, 56418, 56419, 23655, 23656, 23657, 56426, 23658, 56428, 23668, 56440, 56436, 23675, 23679, 56444, 56449, 56450, 23684, 23686, 23689, 23691, 23690, 23693, 23695, 23694, 23700, 23707, 23709, 56481, 23716, 56484, 23718, 56487, 56488, 23721, 56492, 23725, 23722, 23729, 23730, 23731, 23732, 56499, 56500, 23735, 23736, 23734, 23738, 23739, 23740, 23741, 56508, 23742, 56514, 56515, 56519, 23751, 23752, 23753, 23754, 56526, 13735, 56532, 56533, 23768, 56546, 56548, 56551, 56558, 23793, 23794, 23795, 23796, 56564, 23799, 56567, 56568, 23805, 23803, 23812, 23819, 23823, 56594, 56595, 56596, 23828, 23831, 23832, 23835, 23836, 23837, 23839, 23838, 17763, 56624, 56628, 23860, 56631, 56632, 23863, 56635, 56636, 4743, 23870, 23869, 56658, 17776, 56674, 23907, 56675, 23908, 56676, 56679, 23916, 23919, 23921, 56692, 23924, 23927, 23928, 56695, 56696, 56700, 56699, 56703, 56706, 56707, 23940, 23943, 23944, 56714, 23947, 23948, 23949, 56719, 23950, 23951, 56724, 56727, 56729, 56731, 56733, 56738, 56739, 23972, 23975, 23976, 56743, 23979, 23981, 23983, 23985, 56754, 23987, 56755, 56756, 23990, 23991, 23992, 56760, 56762, 56763, 23996, 56764, 56766, 23997, 23994, 56767, 24003, 24004, 56772, 56775, 56776, 56779, 24012, 24013, 24014, 24015, 24020, 56791, 24028, 24029, 24030, 24031, 56797, 56802, 56803, 56804, 56807, 56814, 24049, 56818, 24051, 24055, 56824, 56823, 24061, 56829, 56828, 56831, 24066, 24068, 56836, 56843, 24081, 56851, 56855, 56856, 24089, 24090, 56859, 56860, 24113, 24115, 24116, 56884, 56883, 24119, 24121, 56891, 56895, 24145, 56916, 24148, 56920, 24154, 24155, 56923, 56927, 56928, 24161, 24164, 56932, 56935, 56936, 24169, 24170, 24171, 56939, 56940, 56942, 56943, 56941, 24177, 56947, 56948, 56951, 24185, 24186, 56955, 56959, 24193, 56967, 56968, 24201, 24202, 56971, 24204, 56975, 24207, 56979, 56983, 56987, 24220, 24223, 56992, 24225, 56994, 56995, 56996, 57000, 24233, 57002, 24234, 57004, 57006, 24239, 24236, 24243, 24244, 57012, 24246, 24247, 57016, 24248, 57015, 24251, 24252, 24245, 24255, 57023, 24257, 24260, 57029, 57031, 24265, 24266, 24267, 57037, 57038, 57039, 24273, 57043, 57044, 57045, 57047, 24281, 24282, 57051, 57055, 57056, 57058, 57059, 57060, 57061, 57063, 57070, 57071, 24305, 24307, 57076, 24308, 57077, 24311, 57079, 57083, 24309, 57087, 24321, 24322, 24330, 24339, 24338, 57108, 57107, 57111, 57114, 24348, 24349, 24369, 17876, 17877, 24417, 57186, 57188, 24423, 24424, 57191, 24426, 57194, 24433, 57204, 50447, 24444, 24450, 24451, 57220, 57223, 24460, 50452, 57236, 24482, 24483, 24492, 24497, 24502, 24506, 24513, 57282, 57283, 24519, 24520, 24522, 24529, 24536, 57311, 57315, 57321, 24561, 17910, 57345, 24580, 57357, 57362, 57363, 24599, 57367, 57374, 24627, 57399, 24631, 57400, 24635, 24636, 57441, 57442, 24674, 24676, 24679, 57447, 24686, 57457, 57460, 57467, 57468, 57471, 57474, 24706, 57479, 57482, 57483, 24722, 57490, 24727, 57498, 24731, 57502, 24734, 57511, 57515, 57521, 24754, 24755, 57523, 57522, 57524, 57527, 24759, 57537, 57538, 24772, 24775, 57546, 24779, 24783, 24786, 57554, 24787, 57559, 57560, 57562, 57566, 24798, 57575, 24807, 57579, 24819, 57587, 57591, 24823, 50535, 50536, 11463, 50541, 50545, 50548, 11485, 50572, 25089, 25090, 25092, 25098, 57872, 25105, 25114, 57905, 57906, 25139, 25140, 57907, 57911, 57912, 57914, 57916, 57917, 25143, 25169, 25170, 57938, 25172, 57940, 25178, 57950, 57952, 25185, 25186, 25187, 25188, 57956, 57954, 25191, 25192, 57959, 25194, 25196, 25197, 57960, 57963, 25201, 57964, 25203, 25204, 25202, 57966, 25207, 57968, 25217, 57986, 25220, 57988, 57990, 57989, 25224, 57992, 25226, 57997, 57998, 25231, 58003, 58007, 58009, 58013, 58016, 25249, 58018, 58019, 25252, 58023, 25256, 25258, 25260, 58029, 58030, 58031, 25266, 25267, 25268, 58036, 58034, 25271, 25272, 58040, 25275, 25276, 25277, 58046, 25279, 58048, 25281, 25282, 25283, 25284, 25287, 25288, 58057, 25290, 25291, 25292, 25293, 58058, 25295, 25299, 58067, 58071, 58073, 25308, 58077, 58080, 58082, 58083, 25316, 58087, 58090, 58094, 58095, 25329, 25330, 25331, 25332, 25335, 25336, 25338, 25340, 25341, 50631, 25363, 58132, 25367, 58140, 25375, 58162, 25395, 58163, 58164, 58168, 58171, 58175, 25425, 58194, 25426, 25428, 58196, 58200, 58202, 58204, 58203, 58207, 25441, 58210, 25443, 25444, 58212, 25442, 25447, 58216, 58218, 58220, 25453, 58228, 58236, 25471, 58241, 58242, 25475, 25476, 58244, 58243, 25479, 25480, 58248, 58250, 58247, 25484, 58252, 25487, 58255, 58251, 58259, 58260, 58264, 58272, 58273, 58274, 25507, 58276, 58275, 25511, 58279, 58284, 58290, 25523, 58292, 25524, 25528, 58298, 25532, 25537, 25538, 25539, 25540, 58308, 25543, 25546, 25549, 58315, 58338, 58339, 58340, 58343, 58346, 50674, 58348, 25585, 25586, 25587, 58356, 25588, 25592, 25594, 58363, 25596, 58367, 25860, 25867, 25871, 25873, 58642, 58643, 25875, 25876, 58641, 25879, 58647, 25882, 58651, 58654, 58655, 58650, 58652, 58672, 58676, 25908, 58679, 25912, 58680, 58683, 25916, 25917, 58684, 25919, 58687, 44229, 25938, 58720, 58721, 25954, 58723, 25956, 25955, 58722, 58727, 58728, 25962, 58731, 58735, 25969, 58732, 25972, 25976, 58743, 58747, 25980, 25979, 58751, 25983, 58755, 25988, 58754, 25992, 58759, 25994, 58763, 25996, 58764, 58760, 58767, 25999, 58762, 25995, 58772, 58765, 58775, 58776, 58779, 58780, 26015, 58783, 58786, 58787, 26020, 26023, 26024, 58791, 26027, 26028, 26031, 26034, 26033, 26030, 26040, 58806, 26042, 26044, 26045, 26046, 58816, 58817, 26052, 58819, 58820, 58823, 58824, 26056, 26055, 58827, 26060, 26059, 26061, 26063, 58828, 58831, 26068, 26071, 26072, 58839, 58836, 26076, 26079, 58850, 58851, 58852, 58855, 58856, 58858, 26091, 58859, 26090, 58862, 26095, 58863, 26097, 26100, 58865, 58866, 26104, 58868, 26106, 58874, 26108, 26111, 58879, 58898, 26131, 58900, 26135, 58903, 58929, 26168, 26171, 58939, 58978, 26215, 58986, 58990, 26225, 58996, 26232, 26235, 26236, 59007, 59010, 59018, 26251, 59022, 59035, 59039, 26289, 59058, 59061, 59062, 26296, 59064, 26298, 26300, 59071, 59074, 26311, 59079, 26315, 59083, 59089, 59106, 59111, 59113, 59114, 26347, 59115, 59117, 59122, 59125, 59126, 59128, 59135, 26369, 26370, 59140, 26372, 26378, 59147, 59151, 26387, 26396, 26419, 59187, 26449, 59218, 26450, 59220, 26452, 59223, 59226, 26465, 59234, 26467, 59236, 26468, 26466, 59240, 59239, 59242, 59244, 59265, 59266, 26499, 26500, 59268, 59269, 26503, 59274, 59271, 59275, 59282, 59283, 59284, 26516, 59288, 59290, 59292, 59294, 59297, 59298, 26531, 59300, 59299, 26535, 59303, 59308, 59314, 59316, 26548, 26552, 59320, 59322, 59319, 59324, 59326, 26561, 26562, 26563, 26564, 59332, 26570, 26571, 26572, 59339, 26575, 59346, 59348, 26580, 59352, 59354, 59356, 59358, 59362, 59363, 59364, 59367, 59370, 26609, 26610, 26611, 26612, 59380, 26616, 26619, 59387, 26620, 59391, 59408, 26642, 26643, 26644, 59412, 59411, 26647, 59416, 59415, 26653, 26673, 26676, 59444, 59452, 59455, 59488, 59490, 59491, 59492, 26727, 26728, 59495, 59502, 21903, 26740, 59508, 26756, 59527, 59530, 59536, 26783, 59555, 26788, 59556, 59559, 59561, 59565, 26799, 26801, 26804, 59584, 26823, 26824, 26833, 59604, 26836, 26843, 59612, 59616, 59619, 59620, 59623, 59629, 26865, 26868, 26875, 26884, 26891, 26895, 26899, 59667, 59668, 26903, 59671, 59672, 59675, 59676, 59679, 59701, 26936, 59707, 26940, 26941, 59702, 59711, 11872, 26978, 26979, 26980, 59747, 59748, 59751, 26983, 59755, 26989, 26990, 59759, 26993, 26996, 27000, 59771, 27004, 59775, 27007, 59776, 27011, 59779, 59780, 27015, 27016, 59783, 59784, 27020, 59788, 27023, 59796, 59810, 27043, 27047, 27048, 59816, 59818, 27051, 27052, 59815, 59822, 27057, 27068, 27074, 59843, 27076, 27075, 27079, 27080, 59847, 27084, 27085, 59852, 59855, 59851, 59860, 59864, 59874, 59875, 59879, 59882, 59883, 59886, 59887, 11903, 27121, 59890, 27124, 59892, 27128, 27132, 59901, 27135, 59903, 27137, 27140, 27147, 27153, 59922, 27155, 59924, 27159, 59927, 27192, 59963, 27196, 27217, 27218, 27220, 59988, 27226, 27234, 27235, 27236, 60002, 27239, 27240, 27244, 27245, 60013, 27249, 27252, 60020, 27256, 27260, 60031, 27265, 60034, 27268, 60038, 27271, 27275, 60042, 60046, 27279, 60064, 27297, 60067, 27300, 60071, 27308, 60077, 60084, 60085, 60082, 27320, 60088, 27324, 60095, 27330, 27331, 27332, 27335, 27336, 60103, 60107, 27340, 27341, 27342, 60131, 27364, 60135, 60139, 27377, 27380, 60146, 60149, 27384, 60152, 27388, 60159, 27410, 27411, 27412, 60179, 27415, 60186, 60191, 27444, 60212, 60217, 60220, 60258, 27492, 27495, 27508, 60281, 60287, 60290, 27523, 27524, 27527, 27528, 60298, 27532, 60308, 27555, 27569, 60339, 60340, 27572, 60343, 60347, 60351, 27586, 27587, 27588, 60358, 60359, 27594, 5486, 27604, 27611, 27612, 5488, 27618, 27619, 5490, 60391, 5491, 27633, 60403, 60404, 27636, 27640, 60407, 60408, 60412, 27644, 60411, 60415, 60432, 27666, 27667, 27668, 60436, 60435, 27671, 60440, 60439, 27674, 60464, 27697, 27700, 60468, 60476, 27711, 60479, 60512, 60514, 60515, 60516, 5515, 27751, 60520, 60522, 60519, 60524, 60526, 27764, 60532, 60536, 60539, 27775, 27780, 60551, 60553, 60554, 27791, 60559, 60560, 27806, 60576, 60579, 60580, 27812, 60583, 60585, 60586, 5529, 27825, 27826, 27828, 27834, 60608, 27847, 27848, 27857, 60628, 27860, 27867, 60640, 60643, 60644, 60647, 60648, 60649, 60651, 60652, 60653, 60655, 27889, 27892, 27921, 60690, 60691, 27924, 60689, 60692, 27927, 27928, 60695, 27931, 60696, 60720, 27955, 60723, 27956, 60724, 60728, 60731, 60732, 27986, 27998, 60769, 28002, 28003, 60771, 60770, 28004, 60775, 60776, 60778, 60780, 28017, 60786, 60787, 28020, 28018, 60785, 28024, 28026, 60798, 60799, 28034, 60803, 28036, 60802, 28039, 28040, 28042, 60810, 60812, 28044, 28043, 60815, 60813, 60814, 28051, 60820, 60824, 60827, 60828, 28063, 60834, 60835, 28067, 28068, 60839, 28071, 60843, 60844, 28079, 60847, 28082, 28083, 60846, 60853, 60854, 28088, 28092, 28094, 60865, 28099, 28100, 60868, 60871, 60872, 60875, 28108, 60876, 28111, 60879, 60882, 28115, 28116, 60883, 60891, 60894, 60895, 28130, 28131, 60899, 60900, 60903, 60904, 60907, 5593, 28142, 60911, 60913, 28147, 60917, 60918, 60922, 5597, 28161, 28162, 28164, 28170, 28173, 60944, 38165, 28183, 28184, 28187, 60977, 60978, 28210, 28211, 60979, 28212, 28215, 60984, 60983, 28219, 28221, 60988, 28223, 60989, 60986, 28241, 28242, 61010, 28244, 28250, 28251, 61022, 28257, 61026, 28259, 28260, 61028, 61029, 61031, 61032, 61033, 28266, 28267, 61035, 61036, 61038, 28271, 61040, 28273, 61034, 28275, 61037, 28279, 61058, 61060, 61061, 61064, 61070, 61075, 28311, 61079, 61081, 28315, 61085, 61090, 61091, 28324, 28328, 61097, 61098, 28332, 61101, 61102, 61103, 28337, 61106, 28339, 28340, 61109, 61110, 28343, 28344, 28346, 28347, 28348, 61118, 28351, 28353, 61122, 28356, 28359, 61129, 28362, 28363, 61130, 61137, 28370, 61139, 61143, 61145, 61146, 28381, 61149, 61154, 61155, 28388, 28391, 61161, 61162, 28395, 61165, 61166, 61167, 28401, 28402, 28403, 28404, 61173, 61174, 28407, 28411, 28413, 28415, 28434, 28435, 61203, 61204, 61202, 61207, 61208, 28439, 61210, 61211, 61215, 61214, 28465, 61236, 61241, 61244, 28513, 28515, 61283, 61284, 28516, 28519, 61287, 28522, 61292, 61297, 61300, 61304, 61307, 61311, 61315, 61316, 28548, 61319, 28552, 28555, 61323, 28556, 61324, 61327, 28557, 38241, 61332, 38243, 61340, 28574, 61342, 28580, 38245, 28583, 28593, 28594, 61363, 61364, 61367, 28602, 28609, 61379, 28612, 61380, 28615, 61378, 61383, 61390, 61391, 28625, 61396, 28631, 28632, 61399, 28635, 61401, 38257, 61411, 61410, 61412, 61415, 61416, 28650, 61422, 61423, 28657, 28658, 61427, 61428, 61425, 61431, 61434, 61457, 28690, 28689, 28692, 61462, 28698, 61469, 61471, 61489, 28722, 28724, 38277, 38279, 28770, 61543, 28782, 61553, 28785, 28786, 28788, 28802, 28814, 61583, 28818, 28834, 61607, 61617, 28849, 28850, 28852, 28859, 28866, 28874, 61647, 61649, 28882, 28884, 28898, 61681, 28914, 28913, 28916, 38312, 28922, 28923, 28925, 28927, 50649, 38341, 18805, 38365, 61953, 29186, 29188, 29195, 61965, 29200, 29201, 29203, 61971, 29206, 29207, 29209, 29210, 29211, 61979, 29213, 29215, 29233, 29237, 29241, 29243, 29245, 29247, 29266, 29267, 62036, 29268, 29271, 29280, 29281, 29282, 29283, 29284, 29287, 29290, 29297, 29299, 29302, 29303, 29305, 29306, 29307, 29311, 29313, 62081, 29315, 29314, 29316, 29318, 29319, 29320, 29322, 29323, 62090, 29325, 29326, 29327, 31879, 29324, 29332, 29344, 29345, 62113, 29347, 29346, 29351, 62122, 29362, 29364, 29366, 29368, 29372, 29374, 29375, 29377, 29379, 62147, 29380, 29382, 29383, 29384, 29386, 29387, 62155, 29389, 29391, 29393, 29394, 29395, 29396, 29397, 29398, 29399, 29401, 29402, 29403, 29404, 29405, 29406, 29411, 62179, 29412, 29415, 29416, 29419, 29423, 29425, 29426, 29428, 29430, 62198, 29431, 29434, 29436, 62205, 29438, 57957, 29457, 62227, 62228, 29460, 29459, 62232, 62235, 62236, 57961, 57962, 62259, 62260, 29492, 57965, 29503, 62305, 62307, 62308, 29539, 29540, 62321, 62324, 29556, 29553, 29565, 62337, 62338, 62339, 62340, 62342, 29572, 29569, 62346, 62347, 62348, 62349, 29583, 62355, 62356, 29587, 62369, 62370, 29601, 62372, 29604, 29617, 29626, 29629, 62401, 62403, 62404, 29636, 62408, 62410, 62411, 62413, 29645, 62415, 62420, 29652, 62435, 62436, 29668, 62449, 29681, 62452, 29682, 62459, 29690, 62461, 62463, 29695, 29954, 29956, 29965, 62737, 29969, 29971, 29972, 62739, 29975, 29974, 29970, 29978, 62746, 29979, 29981, 29983, 62747, 29982, 30000, 30001, 30002, 30004, 62802, 30035, 30039, 30045, 30048, 30050, 30051, 30052, 30055, 30061, 30062, 62833, 30065, 30068, 30066, 30075, 30081, 30083, 30084, 30087, 30090, 30091, 30093, 30094, 30095, 62865, 30100, 30098, 30097, 62877, 30113, 30116, 30126, 62897, 62898, 30129, 30132, 30130, 30134, 62902, 30133, 62906, 30139, 30138, 62909, 30141, 30143, 30146, 30147, 30148, 62916, 62918, 30151, 30150, 62920, 30155, 62925, 30157, 30159, 30154, 30161, 30162, 30163, 62932, 30164, 30167, 30173, 30174, 30178, 30180, 62948, 62961, 30193, 30194, 62964, 30196, 30198, 30197, 62970, 30202, 30204, 30205, 30203, 30207, 30209, 30212, 30218, 30223, 62994, 62996, 30231, 63003, 63025, 63028, 63074, 30311, 63089, 63092, 63099, 30338, 63106, 30340, 30343, 63114, 30347, 30351, 30359, 30372, 63153, 63154, 63156, 63158, 63162, 63163, 63165, 63167, 63170, 30407, 63178, 63182, 30415, 63185, 63188, 63199, 63218, 63226, 63230, 30480, 63251, 63252, 30484, 30483, 30487, 63256, 30490, 63259, 63260, 63281, 30514, 63283, 30515, 30551, 63329, 30562, 63331, 63332, 30567, 63345, 30577, 63348, 30580, 30585, 30589, 30592, 63361, 63362, 63363, 63364, 30596, 63370, 63371, 63372, 30603, 30607, 30602, 63379, 63380, 30611, 30615, 63393, 63394, 63395, 30628, 30626, 30641, 30642, 30645, 30650, 30653, 30656, 63425, 30658, 63427, 63428, 63432, 63434, 63435, 30666, 63439, 30674, 63444, 30679, 30688, 30690, 63459, 63460, 30692, 58206, 63473, 30705, 63476, 30709, 30706, 63483, 30714, 30717, 30719, 30722, 63492, 30728, 63499, 58211, 30733, 63503, 30736, 30737, 30735, 63507, 63511, 30745, 58215, 30769, 30781, 30803, 63572, 30807, 30813, 30816, 30818, 30819, 30820, 63591, 30826, 30823, 63599, 30833, 63601, 30841, 30845, 63617, 63618, 63620, 30852, 63622, 63623, 30854, 30857, 63626, 30859, 63629, 30861, 30865, 30862, 30868, 30874, 30880, 63649, 63650, 63652, 30884, 63658, 63659, 63661, 63663, 30897, 30900, 30916, 30919, 30921, 30922, 30924, 30929, 30930, 30932, 30934, 63703, 30936, 30937, 30938, 30935, 30942, 30948, 30949, 30951, 30953, 30957, 30958, 63729, 30964, 30967, 63738, 30978, 30980, 30993, 63763, 30996, 30995, 30999, 31005, 31003, 31007, 31025, 31026, 63795, 31028, 31029, 31030, 31032, 31034, 63803, 31037, 63826, 31059, 31063, 31069, 63838, 31074, 31076, 31079, 63853, 31085, 31089, 63857, 31090, 31092, 31094, 31095, 31098, 63866, 31100, 31101, 31099, 31103, 31105, 31108, 31112, 31114, 31116, 31119, 31121, 31122, 63891, 31124, 31123, 31127, 31137, 31140, 31143, 31153, 31154, 31156, 31157, 31158, 31162, 31163, 31165, 31167, 31170, 31171, 31172, 63942, 31174, 31176, 31178, 31179, 31180, 63949, 31181, 31183, 31185, 31187, 31188, 31191, 31197, 31202, 31203, 31204, 31207, 63985, 31218, 31217, 31220, 31221, 31222, 63994, 31227, 31228, 31229, 31226, 31231, 31234, 31236, 31237, 31243, 31249, 64018, 31251, 64020, 64019, 31255, 64029, 64049, 31283, 64052, 31287, 31291, 31293, 31295, 31315, 31316, 31319, 31320, 31321, 31330, 31331, 31332, 19253, 31334, 31335, 31342, 31345, 31347, 64116, 64113, 31351, 31350, 64123, 31355, 64125, 31359, 64127, 64129, 31363, 31361, 31362, 31366, 31367, 31371, 31370, 31373, 31374, 31375, 31379, 31380, 64147, 31383, 31392, 64161, 31393, 31395, 31399, 64177, 64178, 31410, 31412, 64180, 31413, 31414, 31416, 64186, 64187, 64189, 31421, 31423, 64191, 64194, 64195, 31427, 31428, 31430, 31431, 31432, 64202, 31435, 64206, 31439, 64209, 64210, 31443, 64212, 31444, 31446, 31442, 31447, 31452, 31454, 64227, 31459, 31460, 31463, 64235, 64238, 31473, 64242, 31474, 31476, 31477, 64246, 31478, 64250, 31482, 31484, 64253, 64254, 31486, 64257, 31489, 64260, 31498, 64275, 31507, 64279, 31537, 31540, 31541, 31571, 31575, 64353, 64355, 31588, 31585, 31603, 31615, 64387, 31620, 31631, 31636, 64407, 31652, 31665, 31666, 31668, 31677, 31679, 64449, 31681, 31684, 64455, 31687, 64458, 31691, 31692, 31697, 64467, 31700, 64471, 31716, 64487, 31723, 31729, 31730, 31732, 31734, 64502, 31736, 31738, 31741, 31746, 64516, 31752, 64523, 31757, 31760, 31761, 31759, 64531, 64535, 31770, 64539, 64543, 31793, 31801, 31827, 64596, 31831, 64600, 31833, 64604, 31840, 31842, 31843, 31844, 64615, 31848, 31849, 31850, 31847, 31857, 64625, 64635, 64641, 64642, 64644, 31876, 64646, 64647, 31881, 64650, 64651, 31883, 64653, 64655, 31889, 31892, 31902, 64673, 64674, 64676, 31908, 31913, 64682, 31921, 31924, 31930, 31933, 31936, 31940, 31941, 31943, 31945, 31953, 31954, 31956, 31958, 31962, 64731, 31966, 64735, 31968, 31972, 31975, 64753, 31986, 31988, 31989, 31991, 31992, 64762, 32002, 32004, 32013, 64785, 32018, 32019, 32020, 32023, 32024, 32028, 64797, 38932, 32048, 32049, 32052, 32055, 32060, 32061, 32063, 32098, 32099, 32100, 32103, 32109, 32110, 64881, 32113, 32115, 64886, 32119, 32118, 32123, 64893, 32125, 32127, 32129, 32124, 32131, 32132, 32135, 32138, 32139, 32140, 32142, 32143, 64913, 32148, 32151, 64925, 32161, 32164, 64945, 64946, 32177, 64950, 32182, 64954, 32186, 64957, 64964, 32198, 32199, 64968, 32204, 32206, 32207, 32210, 32211, 64980, 32215, 32222, 11701, 32228, 64996, 32231, 32241, 65012, 32246, 32250, 65020, 65025, 65026, 32257, 32260, 32271, 32272, 32273, 65042, 32275, 32281, 65050, 32283, 32282, 65054, 25959, 32305, 65073, 65074, 32307, 32309, 32310, 32311, 32313, 32314, 32315, 32317, 32338, 65108, 32352, 32353, 65122, 32355, 32356, 32359, 32362, 65130, 65137, 65138, 32369, 32371, 32374, 32377, 32378, 32379, 32381, 32385, 65154, 32387, 32388, 32386, 32391, 32392, 32394, 32395, 65162, 32397, 32396, 32399, 65170, 32403, 32407, 32413, 32416, 32417, 32418, 32419, 32420, 32426, 32429, 65201, 32434, 32437, 65206, 32438, 65210, 32444, 65213, 32446, 32447, 32448, 32449, 65218, 32451, 32455, 32458, 32459, 65230, 32463, 65233, 65234, 32467, 32465, 32469, 65238, 32471, 32473, 65242, 32475, 32474, 65245, 65246, 32477, 32480, 65250, 32483, 32487, 32491, 65262, 32495, 32501, 32502, 32503, 32509, 65281, 65282, 32513, 65284, 32514, 39028, 65290, 32522, 32531, 32532, 65303, 32535, 65311, 32609, 32612, 32625, 32646, 65428, 32689, 65460, 32694, 32698, 65467, 32701, 65471, 32705, 32707, 65476, 65479, 65484, 65487, 32722, 65492, 32724, 65496, 32727, 32730, 32731, 65503, 32739, 65508, 65511, 65516, 32753, 32754, 65524, 32758, 65528, 32762], 7901: [1, 2, 4, 14, 17, 18, 20, 24, 30, 31, 33, 36, 43, 45, 47, 49, 50, 51, 52, 55, 56, 57, 59, 60, 62, 63, 65, 68, 75, 79, 82, 84, 88, 90, 92, 94, 97, 100, 104, 105, 108, 113, 114, 116, 122, 123, 125, 127, 129, 132, 136, 139, 140, 143, 145, 146, 148, 151, 152, 154, 156, 158, 159, 161, 164, 168, 172, 174, 177, 178, 180, 182, 183, 186, 189, 190, 191, 196, 199, 200, 204, 206, 207, 209, 210, 212, 219, 222, 223, 225, 228, 232, 239, 241, 242, 244, 246, 247, 249, 250, 251, 253, 254, 255, 257, 258, 259, 260, 262, 264, 265, 266, 268, 269, 270, 271, 273, 276, 280, 284, 305, 308, 317, 337, 340, 345, 347, 350, 353, 354, 355, 356, 361, 362, 364, 367, 369, 372, 376, 380, 381, 388, 393, 396, 401, 404, 407, 408, 414, 417, 422, 428, 429, 433, 436, 440, 444, 445, 449, 457, 461, 468, 477, 484, 488, 497, 502, 504, 507, 509, 510, 513, 521, 522, 532, 536, 537, 546, 547, 548, 551, 554, 578, 579, 580, 583, 593, 595, 599, 620, 628, 642, 648, 649, 652, 658, 662, 670, 675, 676, 691, 692, 696, 697, 700, 702, 706, 724, 729, 738, 746, 750, 756, 759, 760, 764, 766, 767, 769, 770, 772, 776, 777, 779, 780, 781, 782, 783, 804, 808, 811, 812, 830, 850, 858, 862, 872, 873, 878, 904, 910, 913, 931, 972, 987, 1004, 1022, 1025, 1028, 1033, 1034, 1041, 1044, 1049, 1052, 1053, 1073, 1105, 1121, 1124, 1126, 1128, 1130, 1132, 1134, 1137, 1140, 1174, 1178, 1182, 1185, 1204, 1208, 1212, 1233, 1236, 1265, 1270, 1274, 1277, 1278, 1283, 1286, 1287, 1289, 1293, 1294, 1304, 1310, 1313, 1314, 1315, 1316, 1319, 1322, 1326, 1340, 1346, 1351, 1354, 1358, 1362, 1363, 1367, 1370, 1385, 1417, 1420, 1425, 1459, 1463, 1464, 1465, 1468, 1470, 1478, 1479, 1480, 1481, 1495, 1497, 1505, 1510, 1511, 1523, 1527, 1534, 1537, 1538, 1539, 1540, 1542, 1543, 1544, 1545, 1548, 1550, 1551, 1553, 1556, 1559, 1560, 1564, 1565, 1567, 1569, 1572, 1576, 1579, 1580, 1582, 1586, 1588, 1597, 1598, 1599, 1618, 1620, 1622, 1624, 1625, 1626, 1627, 1628, 1630, 1633, 1636, 1641, 1643, 1644, 1645, 1646, 1649, 1650, 1652, 1656, 1659, 1660, 1662, 1665, 1668, 1671, 1673, 1676, 1677, 1678, 1679, 1681, 1684, 1688, 1692, 1695, 1697, 1700, 1704, 1707, 1708, 1711, 1713, 1714, 1716, 1718, 1720, 1724, 1725, 1726, 1727, 1729, 1730, 1732, 1734, 1736, 1737, 1738, 1740, 1742, 1743, 1745, 1746, 1748, 1752, 1756, 1757, 1761, 1764, 1766, 1768, 1772, 1773, 1777, 1778, 1780, 1784, 1786, 1788, 1789, 1790, 1791, 1793, 1794, 1796, 1800, 1801, 1803, 1804, 1805, 1806, 1807, 1828, 1854, 1860, 1874, 1882, 1897, 1902, 1928, 1932, 1934, 1937, 1950, 1980, 1988, 1992, 1993, 1996, 2003, 2017, 2040, 2044, 2046, 2051, 2055, 2066, 2068, 2072, 2078, 2091, 2095, 2098, 2107, 2111, 2116, 2123, 2129, 2135, 2145, 2156, 2187, 2194, 2199, 2226, 2235, 2241, 2253, 2255, 2257, 2259, 2264, 2273, 2276, 2287, 2296, 2299, 2302, 2306, 2308, 2310, 2311, 2312, 2313, 2315, 2316, 2317, 2318, 2319, 2328, 2333, 2337, 2340, 2347, 2349, 2351, 2364, 2379, 2383, 2386, 2388, 2391, 2392, 2393, 2394, 2395, 2396, 2397, 2399, 2406, 2409, 2427, 2438, 2441, 2444, 2451, 2460, 2473, 2475, 2478, 2483, 2490, 2491, 2492, 2502, 2504, 2505, 2511, 2519, 2524, 2527, 2539, 2543, 2545, 2546, 2547, 2551, 2553, 2554, 2555, 2558, 2559, 2561, 2564, 2568, 2569, 2572, 2574, 2580, 2585, 2588, 2593, 2596, 2603, 2604, 2607, 2610, 2612, 2616, 2622, 2635, 2639, 2641, 2642, 2644, 2647, 2650, 2651, 2655, 2662, 2668, 2674, 2676, 2692, 2696, 2697, 2700, 2703, 2706, 2708, 2716, 2718, 2724, 2728, 2731, 2732, 2735, 2738, 2740, 2744, 2748, 2751, 2760, 2765, 2772, 2781, 2785, 2794, 2804, 2808, 2811, 2814, 2815, 2817, 2822, 2825, 2826, 2829, 2830, 2834, 2836, 2844, 2846, 2852, 2856, 2859, 2863, 2865, 2868, 2876, 2884, 2891, 2897, 2898, 2899, 2900, 2903, 2905, 2907, 2910, 2911, 2915, 2920, 2932, 2941, 2945, 2952, 2956, 2962, 2974, 2977, 2984, 2988, 2991, 2998, 3000, 3004, 3005, 3006, 3009, 3019, 3023, 3025, 3035, 3051, 3055, 3067, 3071, 3075, 3078, 3079, 3080, 3081, 3084, 3086, 3090, 3092, 3096, 3097, 3100, 3101, 3108, 3124, 3134, 3144, 3148, 3153, 3155, 3159, 3167, 3169, 3174, 3180, 3188, 3195, 3206, 3207, 3209, 3211, 3213, 3214, 3217, 3223, 3224, 3238, 3256, 3259, 3260, 3262, 3265, 3268, 3270, 3272, 3273, 3276, 3278, 3281, 3293, 3297, 3300, 3302, 3303, 3304, 3308, 3314, 3320, 3326, 3327, 3329, 3332, 3334, 3336, 3337, 3338, 3339, 3340, 3341, 3342, 3347, 3348, 3352, 3353, 3355, 3364, 3374, 3406, 3409, 3410, 3411, 3412, 3415, 3417, 3421, 3423, 3437, 3441, 3444, 3457, 3464, 3479, 3486, 3497, 3512, 3518, 3535, 3543, 3547, 3551, 3553, 3565, 3567, 3580, 3585, 3591, 3593, 3594, 3597, 3601, 3602, 3604, 3609, 3610, 3618, 3619, 3620, 3623, 3626, 3636, 3639, 3640, 3650, 3656, 3658, 3660, 3662, 3665, 3667, 3671, 3681, 3684, 3688, 3692, 3694, 3700, 3703, 3704, 3705, 3708, 3713, 3714, 3716, 3721, 3723, 3726, 3730, 3732, 3734, 3738, 3740, 3742, 3745, 3746, 3747, 3748, 3758, 3764, 3767, 3768, 3771, 3772, 3777, 3778, 3779, 3780, 3784, 3785, 3787, 3788, 3790, 3793, 3796, 3801, 3804, 3809, 3810, 3811, 3818, 3821, 3826, 3827, 3828, 3831, 3833, 3839, 3841, 3843, 3846, 3847, 3848, 3852, 3853, 3854, 3858, 3860, 3863, 3864, 3871, 3889, 3890, 3892, 3896, 3898, 3899, 3900, 3905, 3921, 3922, 3924, 3929, 3931, 3933, 3934, 3935, 3937, 3938, 3940, 3944, 3945, 3946, 3948, 3951, 3956, 3972, 3976, 3980, 3998, 4004, 4020, 4022, 4024, 4028, 4030, 4031, 4033, 4043, 4051, 4055, 4059, 4075, 4081, 4086, 4091, 4095, 4116, 4180, 4183, 4189, 4196, 4206, 4241, 4244, 4253, 4259, 4260, 4262, 4269, 4271, 4308, 4372, 4378, 4387, 4388, 4390, 4391, 4392, 4399, 4401, 4407, 4411, 4414, 4417, 4426, 4431, 4433, 4441, 4443, 4450, 4455, 4462, 4465, 4470, 4478, 4481, 4487, 4494, 4497, 4498, 4499, 4502, 4505, 4515, 4522, 4524, 4530, 4532, 4534, 4542, 4543, 4545, 4550, 4551, 4555, 4563, 4564, 4570, 4574, 4580, 4596, 4602, 4603, 4605, 4606, 4612, 4616, 4625, 4627, 4630, 4633, 4644, 4675, 4676, 4680, 4685, 4686, 4695, 4706, 4726, 4737, 4753, 4754, 4756, 4769, 4782, 4790, 4794, 4798, 4801, 4813, 4815, 4817, 4833, 4856, 4872, 4886, 4923, 4937, 4957, 5010, 5025, 5047, 5053, 5057, 5073, 5089, 5101, 5106, 5121, 5125, 5127, 5129, 5131, 5135, 5138, 5140, 5145, 5151, 5153, 5155, 5159, 5163, 5167, 5169, 5170, 5172, 5173, 5177, 5179, 5181, 5183, 5187, 5188, 5190, 5194, 5199, 5201, 5207, 5224, 5233, 5236, 5252, 5258, 5270, 5276, 5281, 5282, 5283, 5287, 5293, 5294, 5299, 5304, 5307, 5316, 5320, 5323, 5330, 5331, 5332, 5335, 5339, 5341, 5342, 5348, 5354, 5361, 5363, 5366, 5375, 5389, 5403, 5430, 5434, 5468, 5478, 5494, 5521, 5537, 5542, 5582, 5604, 5622, 5626, 5649, 5667, 5670, 5671, 5674, 5678, 5679, 5684, 5700, 5716, 5718, 5722, 5726, 5729, 5761, 5808, 5825, 5905, 5945, 5961, 5963, 5985, 6002, 6004, 6033, 6046, 6065, 6077, 6081, 6091, 6092, 6093, 6095, 6114, 6129, 6149, 6160, 6161, 6178, 6180, 6212, 6217, 6226, 6228, 6232, 6237, 6238, 6241, 6324, 6354, 6362, 6370, 6388, 6399, 6405, 6421, 6427, 6443, 6483, 6532, 6542, 6543, 6555, 6561, 6564, 6573, 6577, 6580, 6581, 6586, 6587, 6600, 6608, 6621, 6649, 6663, 6673, 6676, 6691, 6695, 6702, 6703, 6718, 6721, 6724, 6742, 6750, 6751, 6753, 6763, 6767, 6769, 6784, 6790, 6804, 6815, 6823, 6837, 6842, 6850, 6858, 6865, 6878, 6881, 6883, 6893, 6896, 6901, 6902, 6945, 6985, 6993, 6996, 7027, 7031, 7041, 7046, 7050, 7060, 7089, 7101, 7108, 7176, 7180, 7204, 7225, 7227, 7233, 7235, 7248, 7252, 7253, 7256, 7257, 7258, 7259, 7260, 7278, 7300, 7305, 7329, 7330, 7348, 7363, 7385, 7396, 7409, 7421, 7423, 7430, 7434, 7438, 7454, 7457, 7465, 7466, 7470, 7473, 7483, 7486, 7489, 7498, 7539, 7551, 7556, 7559, 7578, 7588, 7599, 7601, 7606, 7622, 7649, 7672, 7674, 7678, 7688, 7692, 7701, 7713, 7732, 7747, 7748, 7757, 7758, 7786, 7803, 7809, 7817, 7826, 7828, 7841, 7863, 7878, 7886, 7896, 7897, 7900, 7903, 7905, 7909, 7918, 7919, 7931, 7944, 7946, 7953, 8017, 8038, 8046, 8049, 8081, 8093, 8118, 8125, 8135, 8146, 8147, 8190, 8208, 8209, 8211, 8212, 8214, 8220, 8231, 8234, 8237, 8239, 8242, 8244, 8248, 8257, 8260, 8263, 8264, 8266, 8267, 8268, 8274, 8277, 8279, 8280, 8281, 8282, 8283, 8284, 8285, 8286, 8287, 8290, 8293, 8295, 8296, 8297, 8298, 8299, 8312, 8316, 8321, 8324, 8331, 8332, 8336, 8348, 8349, 8353, 8354, 8356, 8361, 8362, 8363, 8365, 8366, 8367, 8368, 8375, 8385, 8391, 8392, 8394, 8395, 8397, 8399, 8401, 8403, 8406, 8421, 8423, 8424, 8425, 8426, 8427, 8432, 8447, 8453, 8461, 8464, 8469, 8470, 8476, 8477, 8480, 8490, 8498, 8499, 8502, 8505, 8506, 8508, 8511, 8512, 8513, 8516, 8518, 8522, 8526, 8527, 8530, 8532, 8542, 8545, 8550, 8553, 8554, 8555, 8557, 8560, 8572, 8580, 8584, 8585, 8588, 8590, 8592, 8593, 8597, 8598, 8609, 8611, 8613, 8615, 8625, 8626, 8628, 8632, 8633, 8634, 8636, 8638, 8642, 8645, 8649, 8654, 8656, 8664, 8669, 8672, 8675, 8677, 8678, 8679, 8682, 8683, 8685, 8700, 8710, 8713, 8715, 8717, 8718, 8725, 8727, 8734, 8738, 8740, 8743, 8744, 8746, 8748, 8753, 8761, 8762, 8765, 8766, 8768, 8770, 8772, 8778, 8780, 8789, 8790, 8798, 8816, 8817, 8820, 8833, 8836, 8837, 8846, 8850, 8854, 8855, 8856, 8857, 8863, 8868, 8869, 8901, 8917, 8918, 8921, 8925, 8926, 8932, 8933, 8934, 8936, 8937, 8938, 8940, 8943, 8950, 8967, 8969, 8977, 8978, 8980, 8982, 8989, 8997, 9001, 9005, 9009, 9018, 9027, 9029, 9032, 9035, 9037, 9042, 9044, 9050, 9057, 9061, 9090, 9094, 9099, 9105, 9106, 9109, 9110, 9116, 9117, 9121, 9125, 9133, 9134, 9137, 9138, 9139, 9140, 9141, 9143, 9144, 9146, 9150, 9158, 9161, 9162, 9163, 9167, 9170, 9174, 9177, 9182, 9189, 9199, 9202, 9203, 9204, 9205, 9208, 9211, 9214, 9221, 9222, 9226, 9229, 9230, 9234, 9236, 9238, 9239, 9240, 9244, 9249, 9256, 9258, 9260, 9263, 9265, 9271, 9273, 9278, 9280, 9284, 9289, 9294, 9297, 9299, 9302, 9304, 9306, 9307, 9309, 9310, 9311, 9313, 9314, 9320, 9322, 9328, 9331, 9333, 9338, 9340, 9341, 9342, 9343, 9346, 9348, 9353, 9355, 9359, 9366, 9377, 9378, 9382, 9386, 9388, 9391, 9394, 9395, 9401, 9403, 9405, 9407, 9417, 9426, 9430, 9431, 9432, 9436, 9439, 9446, 9448, 9451, 9466, 9473, 9475, 9476, 9477, 9478, 9486, 9490, 9493, 9497, 9502, 9505, 9512, 9514, 9516, 9524, 9529, 9544, 9546, 9548, 9549, 9556, 9560, 9562, 9563, 9565, 9567, 9570, 9573, 9574, 9577, 9586, 9593, 9598, 9618, 9619, 9621, 9623, 9625, 9626, 9631, 9637, 9642, 9657, 9658, 9661, 9694, 9695, 9697, 9698, 9699, 9701, 9709, 9710, 9744, 9747, 9750, 9753, 9755, 9757, 9760, 9762, 9764, 9773, 9788, 9793, 9794, 9799, 9805, 9806, 9810, 9816, 9818, 9820, 9822, 9824, 9825, 9827, 9829, 9830, 9832, 9844, 9857, 9864, 9865, 9868, 9869, 9872, 9875, 9878, 9883, 9885, 9888, 9890, 9891, 9893, 9900, 9904, 9913, 9914, 9915, 9916, 9918, 9922, 9924, 9925, 9936, 9937, 9939, 9945, 9946, 9955, 9957, 9962, 9966, 9967, 9969, 9979, 9981, 9989, 9996, 10009, 10010, 10013, 10014, 10015, 10016, 10020, 10026, 10028, 10029, 10031, 10033, 10035, 10036, 10041, 10042, 10049, 10050, 10052, 10056, 10059, 10061, 10063, 10069, 10072, 10073, 10074, 10075, 10081, 10082, 10091, 10099, 10100, 10107, 10115, 10123, 10125, 10126, 10130, 10132, 10136, 10141, 10142, 10155, 10157, 10159, 10163, 10165, 10166, 10178, 10179, 10181, 10187, 10218, 10221, 10222, 10235, 10240, 10254, 10255, 10259, 10262, 10263, 10266, 10272, 10273, 10278, 10281, 10284, 10288, 10294, 10304, 10305, 10307, 10310, 10311, 10325, 10326, 10328, 10331, 10335, 10337, 10351, 10354, 10355, 10364, 10367, 10368, 10374, 10375, 10380, 10383, 10385, 10388, 10389, 10394, 10397, 10398, 10405, 10406, 10407, 10412, 10416, 10419, 10420, 10422, 10425, 10427, 10438, 10447, 10449, 10454, 10455, 10465, 10470, 10473, 10476, 10478, 10479, 10480, 10481, 10486, 10489, 10493, 10496, 10497, 10500, 10510, 10514, 10519, 10523, 10525, 10527, 10528, 10534, 10535, 10541, 10542, 10550, 10557, 10558, 10560, 10563, 10567, 10569, 10570, 10571, 10573, 10575, 10585, 10587, 10591, 10598, 10606, 10613, 10614, 10621, 10624, 10629, 10631, 10632, 10634, 10646, 10647, 10650, 10651, 10656, 10658, 10660, 10663, 10665, 10666, 10667, 10672, 10673, 10683, 10693, 10697, 10707, 10712, 10715, 10717, 10720, 10725, 10731, 10735, 10745, 10752, 10763, 10764, 10766, 10772, 10777, 10786, 10791, 10794, 10796, 10799, 10800, 10809, 10813, 10818, 10819, 10820, 10823, 10824, 10826, 10828, 10831, 10834, 10838, 10841, 10846, 10851, 10860, 10868, 10870, 10876, 10883, 10888, 10892, 10895, 10898, 10901, 10905, 10909, 10917, 10922, 10927, 10928, 10931, 10941, 10949, 10956, 10959, 10961, 10963, 10965, 10969, 10977, 10983, 10988, 10995, 11005, 11008, 11016, 11019, 11023, 11024, 11028, 11029, 11030, 11043, 11044, 11046, 11052, 11056, 11057, 11058, 11070, 11075, 11076, 11081, 11083, 11093, 11094, 11096, 11099, 11105, 11106, 11109, 11110, 11118, 11122, 11124, 11126, 11132, 11133, 11134, 11142, 11145, 11152, 11157, 11158, 11163, 11165, 11172, 11173, 11177, 11178, 11187, 11197, 11198, 11212, 11216, 11219, 11222, 11223, 11224, 11228, 11232, 11233, 11235, 11236, 11237, 11238, 11240, 11241, 11243, 11244, 11245, 11246, 11247, 11251, 11253, 11254, 11270, 11280, 11283, 11290, 11296, 11301, 11302, 11304, 11305, 11308, 11309, 11311, 11313, 11328, 11332, 11334, 11336, 11340, 11341, 11343, 11344, 11345, 11352, 11355, 11359, 11378, 11379, 11382, 11392, 11398, 11399, 11404, 11407, 11409, 11411, 11412, 11413, 11418, 11419, 11429, 11430, 11431, 11439, 11440, 11443, 11444, 11446, 11447, 11451, 11462, 11473, 11477, 11490, 11491, 11497, 11499, 11509, 11510, 11513, 11517, 11518, 11523, 11532, 11536, 11537, 11546, 11551, 11555, 11556, 11567, 11569, 11571, 11573, 11574, 11578, 11580, 11582, 11583, 11585, 11587, 11588, 11591, 11593, 11594, 11600, 11601, 11607, 11609, 11613, 11617, 11618, 11621, 11622, 11625, 11626, 11665, 11666, 11669, 11671, 11673, 11674, 11675, 11676, 11678, 11685, 11689, 11690, 11694, 11710, 11716, 11721, 11722, 11724, 11729, 11733, 11735, 11743, 11747, 11748, 11749, 11753, 11755, 11756, 11785, 11789, 11793, 11795, 11799, 11806, 11814, 11816, 11821, 11822, 11825, 11848, 11849, 11851, 11855, 11856, 11865, 11867, 11873, 11886, 11901, 11905, 11911, 11923, 11924, 11925, 11926, 11928, 11930, 11931, 11932, 11935, 11938, 11941, 11950, 11952, 11953, 11959, 11962, 11967, 11968, 11969, 11977, 11982, 11986, 11991, 11993, 11994, 11998, 12003, 12006, 12011, 12014, 12015, 12024, 12025, 12026, 12027, 12028, 12033, 12035, 12040, 12044, 12045, 12046, 12048, 12049, 12052, 12054, 12056, 12060, 12062, 12064, 12066, 12067, 12070, 12073, 12074, 12076, 12081, 12083, 12085, 12096, 12098, 12100, 12101, 12103, 12104, 12106, 12109, 12110, 12111, 12112, 12118, 12119, 12127, 12133, 12134, 12135, 12137, 12140, 12144, 12149, 12155, 12161, 12162, 12164, 12170, 12176, 12180, 12181, 12184, 12188, 12193, 12194, 12200, 12212, 12214, 12217, 12219, 12223, 12231, 12232, 12238, 12239, 12240, 12243, 12244, 12245, 12248, 12253, 12255, 12256, 12258, 12259, 12261, 12262, 12271, 12287, 12308, 12324, 12338, 12353, 12356, 12369, 12372, 12402, 12436, 12449, 12452, 12464, 12468, 12475, 12484, 12485, 12493, 12500, 12513, 12516, 12532, 12543, 12547, 12548, 12552, 12553, 12554, 12556, 12558, 12561, 12562, 12564, 12567, 12573, 12575, 12578, 12580, 12587, 12593, 12594, 12595, 12596, 12598, 12602, 12603, 12606, 12607, 12614, 12615, 12618, 12619, 12626, 12628, 12632, 12633, 12634, 12635, 12636, 12637, 12642, 12643, 12644, 12657, 12658, 12660, 12662, 12665, 12667, 12671, 12673, 12674, 12675, 12676, 12681, 12682, 12685, 12686, 12690, 12692, 12694, 12695, 12698, 12701, 12702, 12705, 12706, 12711, 12721, 12726, 12733, 12734, 12735, 12737, 12739, 12740, 12743, 12744, 12746, 12753, 12763, 12769, 12771, 12772, 12774, 12777, 12779, 12782, 12785, 12788, 12790, 12791, 12796, 12798, 12806, 12809, 12812, 12822, 12823, 12825, 12871, 12872, 12874, 12875, 12876, 12887, 12921, 12952, 12956, 12963, 12967, 12983, 12985, 12987, 13009, 13010, 13018, 13022, 13043, 13047, 13048, 13049, 13054, 13073, 13089, 13105, 13120, 13121, 13124, 13128, 13131, 13135, 13137, 13193, 13201, 13235, 13238, 13239, 13268, 13281, 13297, 13299, 13302, 13314, 13315, 13316, 13318, 13320, 13321, 13322, 13323, 13329, 13331, 13334, 13337, 13340, 13342, 13345, 13348, 13351, 13363, 13369, 13377, 13379, 13380, 13388, 13389, 13394, 13395, 13409, 13411, 13412, 13414, 13416, 13421, 13422, 13425, 13433, 13448, 13457, 13463, 13468, 13473, 13474, 13475, 13476, 13479, 13489, 13492, 13496, 13499, 13503, 13505, 13507, 13511, 13512, 13516, 13518, 13521, 13522, 13523, 13526, 13527, 13529, 13537, 13540, 13543, 13553, 13559, 13560, 13564, 13603, 13604, 13610, 13639, 13640, 13642, 13644, 13649, 13651, 13652, 13702, 13763, 13814, 13818, 13841, 13842, 13843, 13850, 13853, 13856, 13859, 13860, 13868, 13870, 13873, 13880, 13881, 13883, 13884, 13885, 13890, 13891, 13900, 13905, 13907, 13910, 13911, 13912, 13914, 13916, 13918, 13921, 13923, 13927, 13930, 13937, 13938, 13940, 13945, 13946, 13948, 13953, 13955, 13959, 13960, 13962, 13971, 13972, 13974, 13975, 13987, 13991, 14002, 14003, 14004, 14006, 14007, 14008, 14009, 14013, 14017, 14020, 14035, 14039, 14045, 14049, 14051, 14052, 14054, 14055, 14060, 14065, 14067, 14072, 14097, 14105, 14106, 14109, 14119, 14137, 14144, 14145, 14146, 14152, 14193, 14212, 14217, 14223, 14225, 14257, 14258, 14260, 14265, 14291, 14323, 14328, 14329, 14337, 14344, 14345, 14361, 14369, 14371, 14375, 14385, 14388, 14393, 14401, 14403, 14404, 14408, 14412, 14413, 14433, 14449, 14451, 14470, 14476, 14483, 14484, 14489, 14499, 14503, 14515, 14535, 14548, 14551, 14561, 14582, 14583, 14585, 14594, 14606, 14617, 14626, 14627, 14630, 14634, 14635, 14637, 14639, 14649, 14651, 14657, 14667, 14670, 14671, 14673, 14675, 14685, 14695, 14702, 14708, 14713, 14715, 14721, 14727, 14728, 14729, 14733, 14734, 14753, 14765, 14782, 14786, 14791, 14796, 14797, 14798, 14799, 14817, 14829, 14833, 14836, 14842, 14843, 14845, 14849, 14854, 14857, 14858, 14860, 14879, 14881, 14884, 14893, 14895, 14913, 14923, 14925, 14927, 14931, 14935, 14936, 14980, 14984, 14988, 14990, 14991, 14993, 15025, 15056, 15057, 15071, 15073, 15078, 15081, 15085, 15101, 15107, 15111, 15116, 15121, 15123, 15124, 15131, 15138, 15153, 15159, 15161, 15171, 15172, 15175, 15176, 15180, 15185, 15187, 15191, 15201, 15217, 15233, 15234, 15235, 15238, 15249, 15267, 15281, 15283, 15284, 15289, 15291, 15297, 15299, 15307, 15308, 15331, 15347, 15350, 15353, 15361, 15377, 15386, 15393, 15409, 15426, 15431, 15432, 15433, 15436, 15457, 15463, 15473, 15475, 15497, 15508, 15543, 15553, 15562, 15572, 15575, 15577, 15583, 15585, 15603, 15604, 15606, 15619, 15623, 15630, 15652, 15663, 15665, 15668, 15670, 15673, 15674, 15677, 15681, 15684, 15691, 15695, 15697, 15698, 15699, 15700, 15703, 15714, 15730, 15734, 15737, 15738, 15742, 15753, 15774, 15778, 15789, 15809, 15811, 15818, 15821, 15824, 15841, 15853, 15854, 15856, 15862, 15870, 15879, 15881, 15889, 15897, 15902, 15905, 15908, 15921, 15924, 15937, 15938, 15940, 15947, 15949, 15951, 15953, 15975, 15982, 15985, 15986, 15988, 15991, 15993, 16014, 16017, 16020, 16035, 16052, 16061, 16062, 16063, 16073, 16097, 16098, 16100, 16105, 16115, 16121, 16122, 16126, 16157, 16164, 16196, 16197, 16200, 16201, 16204, 16211, 16215, 16227, 16230, 16256, 16262, 16289, 16292, 16310, 16337, 16342, 16350, 16351, 16355, 16360, 16374, 16403, 16406, 16412, 16423, 16428, 16430, 16433, 16436, 16443, 16445, 16447, 16449, 16452, 16455, 16459, 16460, 16461, 16462, 16463, 16471, 16476, 16478, 16487, 16489, 16500, 16511, 16516, 16523, 16527, 16537, 16542, 16545, 16548, 16555, 16557, 16559, 16574, 16577, 16580, 16583, 16595, 16598, 16615, 16617, 16631, 16636, 16642, 16645, 16648, 16651, 16652, 16657, 16660, 16662, 16664, 16665, 16666, 16667, 16669, 16671, 16674, 16676, 16678, 16682, 16683, 16685, 16691, 16693, 16694, 16695, 16696, 16697, 16702, 16703, 16705, 16708, 16714, 16715, 16716, 16719, 16721, 16728, 16735, 16739, 16742, 16743, 16744, 16745, 16747, 16748, 16750, 16753, 16758, 16760, 16765, 16766, 16767, 16769, 16770, 16772, 16775, 16778, 16779, 16780, 16781, 16782, 16785, 16787, 16790, 16793, 16794, 16795, 16797, 16798, 16799, 16803, 16805, 16806, 16808, 16814, 16815, 16817, 16818, 16821, 16822, 16825, 16827, 16828, 16833, 16835, 16836, 16838, 16839, 16841, 16846, 16847, 16850, 16853, 16856, 16857, 16858, 16859, 16860, 16861, 16862, 16863, 16866, 16869, 16874, 16875, 16877, 16879, 16881, 16882, 16883, 16884, 16888, 16893, 16894, 16895, 16897, 16899, 16903, 16905, 16907, 16910, 16913, 16914, 16921, 16924, 16926, 16927, 16933, 16938, 16939, 16940, 16941, 16942, 16951, 16953, 16959, 16962, 16964, 16970, 16971, 16972, 16985, 16987, 16989, 16997, 16999, 17001, 17006, 17009, 17013, 17017, 17023, 17033, 17042, 17046, 17048, 17049, 17052, 17063, 17065, 17068, 17077, 17078, 17081, 17102, 17103, 17110, 17113, 17119, 17121, 17129, 17130, 17132, 17133, 17135, 17142, 17145, 17147, 17148, 17172, 17174, 17181, 17184, 17185, 17186, 17191, 17193, 17195, 17196, 17197, 17199, 17202, 17206, 17208, 17210, 17211, 17217, 17227, 17229, 17231, 17234, 17237, 17238, 17239, 17240, 17241, 17242, 17243, 17245, 17247, 17253, 17254, 17257, 17258, 17266, 17273, 17282, 17289, 17290, 17291, 17295, 17301, 17302, 17306, 17313, 17314, 17317, 17322, 17330, 17337, 17339, 17345, 17346, 17352, 17354, 17355, 17357, 17358, 17377, 17378, 17381, 17385, 17386, 17387, 17388, 17389, 17397, 17399, 17406, 17407, 17410, 17411, 17413, 17414, 17415, 17416, 17417, 17419, 17420, 17422, 17425, 17428, 17429, 17430, 17431, 17432, 17433, 17434, 17435, 17439, 17442, 17446, 17449, 17451, 17452, 17453, 17455, 17457, 17459, 17463, 17464, 17465, 17467, 17470, 17473, 17474, 17476, 17479, 17483, 17491, 17494, 17495, 17496, 17497, 17498, 17499, 17501, 17502, 17503, 17506, 17507, 17508, 17509, 17511, 17512, 17513, 17514, 17515, 17516, 17518, 17521, 17524, 17526, 17529, 17530, 17531, 17532, 17534, 17540, 17542, 17543, 17544, 17545, 17546, 17547, 17553, 17555, 17558, 17559, 17561, 17563, 17566, 17571, 17574, 17576, 17586, 17588, 17589, 17590, 17593, 17595, 17603, 17605, 17606, 17607, 17608, 17611, 17615, 17617, 17618, 17621, 17623, 17624, 17625, 17626, 17627, 17628, 17633, 17636, 17637, 17638, 17642, 17643, 17651, 17654, 17656, 17657, 17658, 17659, 17661, 17663, 17689, 17696, 17701, 17704, 17707, 17708, 17721, 17728, 17736, 17739, 17740, 17748, 17750, 17757, 17759, 17769, 17771, 17785, 17801, 17804, 17810, 17816, 17819, 17833, 17834, 17840, 17848, 17849, 17851, 17896, 17897, 17899, 17904, 17915, 17942, 17954, 17956, 17959, 17961, 17965, 17971, 17973, 17974, 17977, 17978, 17982, 17983, 17987, 17992, 17996, 18001, 18009, 18013, 18015, 18019, 18021, 18027, 18028, 18033, 18034, 18037, 18045, 18050, 18051, 18053, 18056, 18057, 18060, 18061, 18064, 18067, 18069, 18070, 18072, 18077, 18079, 18083, 18085, 18088, 18094, 18114, 18115, 18116, 18117, 18120, 18121, 18124, 18125, 18126, 18127, 18133, 18140, 18142, 18146, 18147, 18149, 18154, 18158, 18159, 18174, 18177, 18191, 18194, 18197, 18198, 18200, 18202, 18204, 18213, 18214, 18217, 18220, 18222, 18225, 18226, 18232, 18237, 18241, 18246, 18251, 18252, 18254, 18257, 18264, 18267, 18277, 18284, 18286, 18297, 18308, 18310, 18315, 18317, 18326, 18330, 18332, 18334, 18335, 18337, 18338, 18343, 18347, 18349, 18350, 18351, 18353, 18363, 18366, 18374, 18379, 18380, 18381, 18382, 18401, 18402, 18406, 18409, 18411, 18413, 18414, 18427, 18441, 18448, 18450, 18462, 18463, 18464, 18467, 18469, 18470, 18473, 18474, 18475, 18476, 18477, 18482, 18484, 18486, 18488, 18489, 18499, 18507, 18508, 18509, 18520, 18523, 18527, 18532, 18534, 18542, 18546, 18553, 18558, 18563, 18564, 18566, 18568, 18569, 18570, 18574, 18576, 18580, 18582, 18584, 18585, 18587, 18590, 18595, 18599, 18602, 18603, 18614, 18617, 18619, 18627, 18630, 18633, 18640, 18645, 18648, 18649, 18651, 18654, 18655, 18661, 18667, 18671, 18673, 18678, 18680, 18681, 18684, 18694, 18699, 18704, 18711, 18715, 18718, 18722, 18724, 18728, 18732, 18734, 18735, 18738, 18747, 18767, 18774, 18779, 18783, 18786, 18789, 18792, 18795, 18796, 18797, 18798, 18811, 18815, 18817, 18821, 18824, 18825, 18829, 18831, 18833, 18838, 18839, 18843, 18844, 18845, 18846, 18850, 18856, 18860, 18866, 18873, 18875, 18876, 18877, 18888, 18891, 18896, 18898, 18904, 18905, 18907, 18908, 18910, 18914, 18919, 18920, 18923, 18925, 18926, 18930, 18932, 18953, 18956, 18961, 18964, 18966, 18973, 18974, 18975, 18978, 18980, 18984, 18989, 18991, 18994, 19002, 19005, 19006, 19017, 19018, 19021, 19023, 19038, 19048, 19049, 19057, 19061, 19062, 19070, 19074, 19077, 19080, 19086, 19088, 19093, 19096, 19097, 19101, 19102, 19106, 19109, 19112, 19118, 19119, 19128, 19130, 19133, 19138, 19141, 19149, 19151, 19153, 19164, 19165, 19175, 19177, 19180, 19183, 19186, 19189, 19198, 19208, 19215, 19216, 19217, 19219, 19224, 19225, 19227, 19232, 19237, 19244, 19245, 19249, 19252, 19257, 19262, 19266, 19267, 19275, 19276, 19277, 19285, 19288, 19295, 19298, 19304, 19313, 19316, 19317, 19320, 19322, 19329, 19331, 19338, 19344, 19346, 19347, 19348, 19350, 19352, 19353, 19357, 19359, 19361, 19370, 19378, 19379, 19382, 19404, 19405, 19407, 19408, 19409, 19414, 19423, 19425, 19428, 19430, 19433, 19435, 19436, 19441, 19443, 19446, 19447, 19448, 19468, 19470, 19473, 19475, 19478, 19481, 19486, 19487, 19488, 19493, 19496, 19497, 19500, 19503, 19510, 19513, 19514, 19515, 19518, 19528, 19536, 19541, 19542, 19544, 19547, 19551, 19553, 19554, 19556, 19557, 19566, 19567, 19573, 19577, 19579, 19582, 19585, 19590, 19594, 19595, 19604, 19606, 19609, 19610, 19611, 19617, 19623, 19624, 19626, 19654, 19662, 19663, 19667, 19669, 19670, 19672, 19675, 19676, 19679, 19683, 19686, 19691, 19692, 19694, 19704, 19710, 19724, 19729, 19734, 19738, 19742, 19748, 19755, 19756, 19758, 19764, 19765, 19766, 19769, 19770, 19771, 19774, 19777, 19778, 19780, 19784, 19785, 19787, 19791, 19796, 19804, 19806, 19809, 19811, 19814, 19817, 19819, 19822, 19838, 19841, 19854, 19857, 19860, 19862, 19864, 19866, 19870, 19884, 19886, 19892, 19893, 19899, 19900, 19901, 19902, 19903, 19908, 19912, 19916, 19917, 19918, 19930, 19934, 19937, 19940, 19941, 19947, 19956, 19960, 19966, 19967, 19972, 19982, 19985, 19986, 19988, 19996, 20001, 20002, 20003, 20004, 20008, 20011, 20012, 20013, 20015, 20017, 20020, 20028, 20033, 20036, 20043, 20053, 20056, 20059, 20074, 20076, 20078, 20081, 20092, 20094, 20098, 20104, 20105, 20117, 20120, 20124, 20130, 20135, 20136, 20140, 20145, 20150, 20153, 20155, 20161, 20162, 20164, 20165, 20175, 20184, 20187, 20193, 20194, 20196, 20197, 20200, 20202, 20204, 20206, 20232, 20236, 20240, 20241, 20245, 20250, 20256, 20261, 20264, 20266, 20268, 20271, 20277, 20278, 20282, 20285, 20287, 20292, 20296, 20300, 20301, 20304, 20310, 20314, 20315, 20319, 20341, 20354, 20357, 20360, 20361, 20362, 20368, 20373, 20378, 20381, 20385, 20386, 20391, 20392, 20401, 20402, 20405, 20408, 20409, 20410, 20411, 20413, 20421, 20424, 20428, 20429, 20431, 20433, 20445, 20448, 20451, 20452, 20453, 20456, 20458, 20460, 20463, 20465, 20476, 20477, 20481, 20484, 20491, 20494, 20495, 20498, 20506, 20509, 20511, 20513, 20516, 20527, 20565, 20576, 20578, 20581, 20586, 20593, 20596, 20600, 20603, 20604, 20607, 20616, 20617, 20618, 20619, 20620, 20621, 20623, 20626, 20634, 20641, 20644, 20671, 20680, 20681, 20683, 20684, 20687, 20690, 20692, 20698, 20701, 20703, 20704, 20728, 20731, 20735, 20742, 20759, 20761, 20766, 20768, 20776, 20780, 20793, 20794, 20803, 20804, 20806, 20807, 20810, 20815, 20817, 20826, 20834, 20839, 20848, 20857, 20858, 20859, 20865, 20873, 20885, 20913, 20919, 20937, 20945, 20953, 20960, 20965, 20966, 20967, 20980, 20983, 20999, 21008, 21013, 21023, 21025, 21035, 21058, 21059, 21081, 21086, 21093, 21107, 21108, 21128, 21142, 21150, 21163, 21178, 21198, 21200, 21205, 21222, 21227, 21246, 21252, 21256, 21260, 21266, 21275, 21278, 21287, 21293, 21296, 21297, 21305, 21313, 21314, 21319, 21320, 21323, 21369, 21376, 21385, 21389, 21393, 21396, 21399, 21400, 21404, 21405, 21406, 21428, 21433, 21435, 21440, 21445, 21449, 21470, 21476, 21480, 21483, 21484, 21497, 21502, 21521, 21526, 21528, 21531, 21535, 21538, 21543, 21544, 21553, 21566, 21568, 21569, 21571, 21577, 21582, 21586, 21594, 21599, 21601, 21606, 21610, 21654, 21662, 21670, 21673, 21674, 21690, 21695, 21707, 21710, 21718, 21723, 21727, 21734, 21739, 21743, 21754, 21757, 21761, 21768, 21773, 21774, 21792, 21794, 21796, 21799, 21802, 21819, 21824, 21829, 21839, 21842, 21850, 21888, 21890, 21897, 21917, 21920, 21945, 21950, 21952, 21953, 21961, 21991, 22022, 22024, 22027, 22033, 22041, 22045, 22047, 22048, 22050, 22052, 22058, 22075, 22076, 22086, 22092, 22106, 22112, 22115, 22127, 22143, 22145, 22146, 22148, 22150, 22153, 22154, 22156, 22158, 22175, 22176, 22179, 22183, 22193, 22194, 22195, 22196, 22198, 22199, 22200, 22201, 22204, 22205, 22206, 22209, 22210, 22212, 22219, 22222, 22225, 22237, 22243, 22247, 22255, 22257, 22269, 22296, 22301, 22306, 22315, 22321, 22324, 22331, 22336, 22337, 22340, 22347, 22401, 22407, 22417, 22424, 22427, 22433, 22434, 22439, 22440, 22457, 22472, 22484, 22488, 22498, 22500, 22504, 22508, 22521, 22526, 22545, 22546, 22551, 22555, 22556, 22561, 22562, 22563, 22564, 22567, 22569, 22570, 22592, 22594, 22595, 22597, 22603, 22609, 22611, 22615, 22617, 22625, 22637, 22640, 22656, 22689, 22690, 22691, 22695, 22704, 22713, 22720, 22723, 22726, 22737, 22742, 22747, 22748, 22749, 22751, 22753, 22759, 22765, 22767, 22784, 22788, 22792, 22795, 22796, 22817, 22826, 22827, 22836, 22843, 22858, 22859, 22862, 22896, 22905, 22916, 22921, 22923, 22926, 22934, 22958, 22969, 22977, 22980, 22985, 22991, 23003, 23023, 23031, 23033, 23038, 23061, 23074, 23092, 23106, 23115, 23130, 23141, 23146, 23156, 23161, 23171, 23172, 23175, 23176, 23177, 23180, 23190, 23209, 23211, 23212, 23219, 23220, 23228, 23231, 23239, 23240, 23241, 23243, 23246, 23253, 23259, 23263, 23270, 23273, 23275, 23281, 23283, 23289, 23290, 23294, 23296, 23313, 23317, 23319, 23320, 23325, 23327, 23330, 23332, 23336, 23339, 23352, 23361, 23367, 23370, 23371, 23375, 23380, 23384, 23391, 23394, 23397, 23399, 23409, 23414, 23424, 23425, 23431, 23432, 23433, 23441, 23445, 23446, 23457, 23463, 23474, 23475, 23484, 23486, 23488, 23490, 23495, 23496, 23497, 23500, 23504, 23506, 23511, 23512, 23516, 23517, 23519, 23520, 23528, 23530, 23535, 23539, 23546, 23547, 23553, 23558, 23562, 23564, 23566, 23569, 23579, 23580, 23585, 23589, 23591, 23593, 23616, 23619, 23621, 23629, 23633, 23641, 23649, 23654, 23661, 23665, 23680, 23681, 23683, 23687, 23697, 23713, 23717, 23728, 23737, 23750, 23760, 23761, 23771, 23772, 23773, 23777, 23789, 23792, 23814, 23818, 23824, 23826, 23827, 23834, 23841, 23842, 23851, 23877, 23881, 23882, 23887, 23895, 23899, 23939, 23952, 23957, 23970, 23993, 24001, 24007, 24023, 24033, 24034, 24035, 24037, 24039, 24042, 24043, 24045, 24046, 24052, 24067, 24071, 24082, 24083, 24084, 24088, 24097, 24101, 24104, 24106, 24107, 24108, 24128, 24130, 24133, 24140, 24143, 24153, 24157, 24162, 24173, 24180, 24182, 24199, 24200, 24203, 24205, 24210, 24211, 24214, 24229, 24235, 24237, 24240, 24242, 24259, 24263, 24264, 24268, 24269, 24272, 24275, 24279, 24289, 24291, 24295, 24301, 24303, 24304, 24318, 24326, 24334, 24340, 24354, 24360, 24372, 24386, 24387, 24388, 24394, 24396, 24411, 24436, 24440, 24443, 24452, 24456, 24457, 24458, 24459, 24472, 24499, 24500, 24504, 24508, 24510, 24511, 24515, 24516, 24521, 24523, 24544, 24546, 24548, 24552, 24555, 24562, 24596, 24603, 24607, 24660, 24673, 24721, 24724, 24733, 24735, 24740, 24804, 24835, 24838, 24842, 24849, 24872, 24876, 24879, 24881, 24897, 24899, 24904, 24908, 24945, 24954, 24959, 24963, 24967, 24971, 24982, 24987, 24990, 24993, 24999, 25009, 25011, 25014, 25025, 25027, 25038, 25066, 25078, 25110, 25115, 25123, 25153, 25163, 25190, 25198, 25230, 25238, 25242, 25245, 25250, 25278, 25297, 25302, 25305, 25307, 25311, 25327, 25342, 25361, 25362, 25364, 25369, 25370, 25378, 25396, 25420, 25460, 25473, 25483, 25489, 25490, 25506, 25508, 25521, 25554, 25556, 25569, 25570, 25572, 25581, 25582, 25598, 25601, 25609, 25613, 25617, 25618, 25624, 25626, 25627, 25631, 25665, 25671, 25697, 25709, 25713, 25729, 25730, 25732, 25740, 25742, 25745, 25748, 25750, 25752, 25757, 25761, 25763, 25767, 25778, 25780, 25783, 25784, 25790, 25794, 25796, 25800, 25802, 25806, 25807, 25809, 25811, 25817, 25820, 25821, 25825, 25827, 25833, 25839, 25841, 25847, 25857, 25869, 25951, 25953, 26001, 26011, 26013, 26049, 26129, 26145, 26150, 26155, 26157, 26195, 26199, 26218, 26337, 26385, 26391, 26402, 26404, 26417, 26434, 26436, 26497, 26505, 26513, 26541, 26545, 26546, 26554, 26558, 26568, 26577, 26593, 26654, 26657, 26660, 26690, 26692, 26705, 26713, 26722, 26732, 26737, 26772, 26855, 26963, 27169, 27171, 27174, 27175, 27179, 27182, 27188, 27207, 27219, 27223, 27233, 27286, 27288, 27292, 27299, 27303, 27338, 27345, 27353, 27409, 27425, 27431, 27441, 27457, 27460, 27463, 27490, 27498, 27505, 27513, 27521, 27522, 27537, 27540, 27554, 27577, 27585, 27617, 27623, 27654, 27681, 27684, 27688, 27692, 27693, 27716, 27729, 27738, 27748, 27784, 27785, 27788, 27789, 27876, 27887, 27910, 27914, 27932, 27937, 27946, 27949, 27953, 27969, 27971, 27976, 27977, 27980, 28019, 28022, 28028, 28033, 28038, 28049, 28065, 28095, 28166, 28182, 28246, 28254, 28262, 28270, 28289, 28303, 28326, 28334, 28345, 28350, 28354, 28374, 28379, 28414, 28422, 28452, 28481, 28488, 28492, 28498, 28500, 28529, 28543, 28554, 28577, 28596, 28628, 28637, 28644, 28646, 28648, 28694, 28697, 28699, 28702, 28705, 28706, 28708, 28738, 28746, 28747, 28753, 28754, 28756, 28769, 28772, 28781, 28810, 28817, 28820, 28833, 28835, 28836, 28839, 28856, 28857, 28860, 28862, 28868, 28881, 28894, 28900, 28924, 28926, 28930, 28931, 28933, 28934, 28935, 28936, 28937, 28938, 28939, 28940, 28941, 28942, 28947, 28950, 28952, 28956, 28958, 28961, 28964, 28970, 28974, 28982, 28984, 28987, 28988, 28994, 28996, 29004, 29009, 29010, 29011, 29012, 29018, 29022, 29023, 29025, 29028, 29030, 29031, 29032, 29034, 29035, 29038, 29039, 29041, 29044, 29055, 29058, 29060, 29062, 29064, 29067, 29073, 29075, 29076, 29080, 29083, 29084, 29087, 29089, 29094, 29095, 29096, 29102, 29105, 29106, 29107, 29108, 29111, 29112, 29114, 29121, 29126, 29131, 29137, 29139, 29140, 29142, 29143, 29153, 29156, 29166, 29175, 29176, 29177, 29179, 29185, 29187, 29192, 29193, 29196, 29199, 29204, 29218, 29220, 29227, 29246, 29248, 29250, 29252, 29253, 29255, 29258, 29265, 29300, 29329, 29348, 29360, 29363, 29370, 29378, 29392, 29407, 29410, 29418, 29420, 29424, 29439, 29441, 29442, 29443, 29444, 29447, 29476, 29487, 29497, 29505, 29521, 29522, 29524, 29537, 29568, 29585, 29588, 29620, 29632, 29633, 29647, 29684, 29697, 29699, 29703, 29705, 29709, 29713, 29715, 29719, 29720, 29721, 29725, 29729, 29741, 29747, 29753, 29762, 29764, 29769, 29777, 29779, 29794, 29795, 29796, 29809, 29812, 29816, 29820, 29821, 29825, 29827, 29831, 29843, 29847, 29857, 29858, 29873, 29875, 29889, 29891, 29892, 29895, 29905, 29907, 29908, 29912, 29913, 29921, 29924, 29932, 29942, 29943, 29959, 29985, 29986, 29987, 29988, 29991, 29994, 30017, 30018, 30020, 30023, 30026, 30029, 30031, 30033, 30036, 30049, 30064, 30073, 30086, 30089, 30109, 30114, 30136, 30140, 30142, 30145, 30195, 30199, 30200, 30210, 30213, 30214, 30216, 30219, 30220, 30225, 30227, 30228, 30234, 30240, 30241, 30244, 30247, 30248, 30250, 30252, 30257, 30260, 30262, 30264, 30266, 30268, 30274, 30279, 30289, 30290, 30292, 30296, 30297, 30299, 30300, 30302, 30303, 30305, 30306, 30307, 30308, 30310, 30314, 30317, 30318, 30324, 30328, 30329, 30332, 30337, 30353, 30355, 30361, 30362, 30366, 30369, 30377, 30385, 30386, 30388, 30391, 30392, 30395, 30396, 30397, 30399, 30404, 30406, 30410, 30417, 30419, 30422, 30426, 30430, 30433, 30438, 30440, 30444, 30456, 30457, 30460, 30465, 30466, 30467, 30468, 30471, 30481, 30492, 30498, 30500, 30516, 30532, 30539, 30543, 30546, 30548, 30561, 30564, 30593, 30600, 30609, 30610, 30612, 30625, 30644, 30657, 30660, 30667, 30708, 30711, 30713, 30715, 30721, 30723, 30724, 30727, 30729, 30732, 30739, 30750, 30759, 30783, 30784, 30785, 30787, 30791, 30793, 30801, 30836, 30849, 30851, 30860, 30883, 30896, 30913, 30915, 30928, 30940, 30961, 30963, 30969, 30971, 30975, 30979, 30983, 30989, 30990, 31009, 31010, 31011, 31012, 31015, 31018, 31019, 31020, 31021, 31023, 31027, 31031, 31033, 31035, 31036, 31038, 31041, 31042, 31043, 31047, 31048, 31050, 31051, 31057, 31070, 31073, 31091, 31096, 31102, 31115, 31117, 31118, 31133, 31134, 31149, 31155, 31159, 31166, 31169, 31175, 31182, 31186, 31230, 31233, 31241, 31244, 31245, 31250, 31252, 31265, 31266, 31267, 31275, 31279, 31281, 31298, 31299, 31300, 31303, 31304, 31306, 31308, 31314, 31322, 31326, 31329, 31348, 31368, 31372, 31377, 31406, 31409, 31411, 31417, 31418, 31419, 31420, 31426, 31434, 31441, 31450, 31469, 31480, 31490, 31491, 31492, 31505, 31508, 31523, 31524, 31527, 31545, 31549, 31552, 31555, 31559, 31587, 31601, 31609, 31616, 31619, 31623, 31633, 31649, 31667, 31675, 31680, 31683, 31699, 31702, 31703, 31705, 31711, 31715, 31731, 31735, 31740, 31743, 31747, 31748, 31751, 31756, 31763, 31764, 31777, 31779, 31783, 31787, 31789, 31791, 31799, 31809, 31811, 31812, 31815, 31830, 31832, 31834, 31836, 31841, 31846, 31852, 31854, 31860, 31864, 31868, 31872, 31875, 31887, 31891, 31897, 31905, 31911, 31923, 31937, 31939, 31949, 31951, 31967, 31971, 31985, 31993, 31997, 31999, 32001, 32003, 32007, 32017, 32036, 32039, 32056, 32064, 32068, 32084, 32094, 32097, 32116, 32145, 32147, 32160, 32163, 32167, 32178, 32179, 32180, 32183, 32188, 32209, 32225, 32242, 32243, 32244, 32247, 32248, 32252, 32264, 32265, 32267, 32268, 32274, 32276, 32285, 32287, 32290, 32291, 32295, 32296, 32300, 32308, 32316, 32322, 32327, 32330, 32337, 32340, 32343, 32346, 32349, 32354, 32365, 32370, 32375, 32376, 32380, 32401, 32404, 32433, 32436, 32439, 32441, 32442, 32445, 32452, 32461, 32468, 32472, 32478, 32479, 32481, 32490, 32493, 32497, 32498, 32500, 32506, 32516, 32528, 32545, 32561, 32564, 32569, 32595, 32599, 32611, 32628, 32641, 32647, 32654, 32655, 32657, 32660, 32673, 32674, 32691, 32695, 32708, 32718, 32719, 32721, 32723, 32726, 32734, 32740, 32743, 32755, 32756, 32759, 32766, 32767, 32800, 32812, 32817, 32820, 32832, 32835, 32899, 32951, 32963, 32972, 33025, 33026, 33028, 33030, 33032, 33036, 33041, 33042, 33044, 33054, 33057, 33058, 33060, 33063, 33064, 33066, 33067, 33068, 33069, 33070, 33075, 33076, 33078, 33086, 33089, 33090, 33091, 33092, 33095, 33102, 33105, 33106, 33107, 33108, 33111, 33112, 33113, 33115, 33117, 33118, 33122, 33124, 33125, 33127, 33128, 33129, 33133, 33137, 33140, 33142, 33144, 33145, 33147, 33148, 33153, 33154, 33156, 33161, 33163, 33167, 33172, 33173, 33175, 33177, 33179, 33182, 33185, 33188, 33191, 33193, 33198, 33200, 33201, 33203, 33204, 33210, 33211, 33212, 33215, 33216, 33217, 33219, 33220, 33221, 33223, 33225, 33227, 33228, 33229, 33231, 33233, 33235, 33237, 33243, 33245, 33249, 33251, 33254, 33261, 33265, 33267, 33268, 33276, 33281, 33286, 33297, 33308, 33309, 33311, 33313, 33316, 33329, 33335, 33345, 33346, 33353, 33356, 33361, 33362, 33377, 33393, 33406, 33410, 33415, 33425, 33426, 33436, 33437, 33438, 33441, 33444, 33454, 33457, 33467, 33468, 33469, 33471, 33474, 33476, 33479, 33483, 33489, 33499, 33501, 33503, 33505, 33516, 33518, 33523, 33526, 33535, 33537, 33553, 33558, 33571, 33573, 33582, 33585, 33595, 33601, 33610, 33611, 33615, 33617, 33634, 33663, 33666, 33668, 33675, 33677, 33679, 33681, 33694, 33715, 33720, 33722, 33729, 33734, 33738, 33741, 33742, 33777, 33780, 33784, 33793, 33798, 33800, 33802, 33805, 33809, 33812, 33815, 33817, 33819, 33820, 33822, 33825, 33827, 33828, 33831, 33833, 33838, 33841, 33843, 33853, 33856, 33857, 33858, 33863, 33865, 33873, 33876, 33885, 33889, 33890, 33891, 33896, 33898, 33902, 33905, 33906, 33907, 33908, 33913, 33917, 33923, 33928, 33929, 33930, 33931, 33932, 33933, 33940, 33953, 33954, 33956, 33959, 33965, 33969, 33970, 33972, 33975, 33982, 33990, 33991, 33993, 33995, 33998, 34001, 34004, 34007, 34009, 34011, 34013, 34017, 34018, 34020, 34023, 34024, 34025, 34027, 34030, 34033, 34034, 34038, 34039, 34042, 34044, 34049, 34052, 34059, 34061, 34063, 34066, 34077, 34078, 34091, 34095, 34104, 34125, 34127, 34140, 34148, 34154, 34187, 34219, 34271, 34273, 34276, 34283, 34299, 34302, 34305, 34308, 34310, 34315, 34318, 34321, 34340, 34344, 34345, 34369, 34372, 34376, 34379, 34380, 34383, 34385, 34386, 34387, 34388, 34391, 34393, 34394, 34395, 34399, 34403, 34404, 34415, 34433, 34436, 34440, 34441, 34445, 34449, 34456, 34457, 34461, 34465, 34468, 34471, 34475, 34479, 34484, 34490, 34497, 34500, 34501, 34502, 34503, 34507, 34508, 34509, 34511, 34521, 34529, 34532, 34534, 34539, 34545, 34548, 34558, 34577, 34579, 34582, 34584, 34590, 34595, 34599, 34609, 34617, 34625, 34627, 34635, 34643, 34670, 34676, 34691, 34705, 34707, 34718, 34739, 34748, 34759, 34767, 34817, 34820, 34839, 34845, 34848, 34849, 34855, 34857, 34863, 34883, 34884, 34887, 34909, 34920, 34924, 34926, 34929, 34961, 34963, 34964, 34966, 34970, 34976, 34977, 34982, 34990, 35011, 35014, 35017, 35020, 35033, 35035, 35042, 35044, 35057, 35060, 35062, 35067, 35073, 35076, 35079, 35090, 35104, 35105, 35108, 35110, 35113, 35117, 35118, 35119, 35120, 35121, 35129, 35133, 35135, 35136, 35140, 35143, 35146, 35150, 35153, 35155, 35156, 35159, 35165, 35166, 35171, 35172, 35184, 35193, 35196, 35203, 35204, 35206, 35207, 35209, 35210, 35213, 35214, 35217, 35218, 35222, 35225, 35226, 35229, 35230, 35233, 35234, 35236, 35245, 35249, 35252, 35256, 35257, 35260, 35263, 35267, 35268, 35270, 35271, 35273, 35274, 35278, 35280, 35282, 35297, 35298, 35313, 35323, 35324, 35329, 35332, 35347, 35361, 35362, 35364, 35374, 35375, 35376, 35380, 35410, 35412, 35417, 35421, 35422, 35438, 35441, 35458, 35463, 35466, 35481, 35486, 35523, 35528, 35540, 35545, 35547, 35574, 35585, 35596, 35602, 35620, 35623, 35631, 35636, 35648, 35652, 35659, 35665, 35677, 35700, 35713, 35720, 35722, 35730, 35745, 35776, 35781, 35794, 35798, 35803, 35809, 35810, 35812, 35825, 35841, 35850, 35854, 35857, 35862, 35864, 35870, 35873, 35889, 35899, 35910, 35913, 35929, 35939, 35942, 35948, 35968, 35972, 35974, 35981, 35985, 35990, 35996, 35999, 36000, 36001, 36007, 36016, 36018, 36032, 36038, 36046, 36047, 36049, 36064, 36065, 36068, 36073, 36074, 36076, 36081, 36100, 36116, 36120, 36129, 36130, 36131, 36132, 36137, 36140, 36141, 36142, 36143, 36153, 36162, 36164, 36169, 36174, 36176, 36180, 36195, 36196, 36199, 36211, 36228, 36232, 36235, 36241, 36244, 36245, 36252, 36256, 36257, 36259, 36261, 36263, 36265, 36273, 36276, 36288, 36292, 36293, 36301, 36302, 36323, 36336, 36350, 36353, 36360, 36364, 36365, 36366, 36369, 36373, 36374, 36377, 36378, 36381, 36384, 36387, 36388, 36394, 36398, 36402, 36407, 36409, 36411, 36416, 36419, 36420, 36425, 36426, 36427, 36428, 36429, 36433, 36435, 36439, 36446, 36448, 36467, 36468, 36473, 36475, 36478, 36480, 36481, 36492, 36497, 36502, 36506, 36508, 36509, 36513, 36514, 36515, 36516, 36529, 36536, 36538, 36539, 36540, 36543, 36544, 36545, 36552, 36559, 36560, 36562, 36565, 36571, 36573, 36574, 36579, 36583, 36584, 36587, 36591, 36593, 36606, 36625, 36641, 36657, 36676, 36681, 36684, 36689, 36706, 36707, 36710, 36711, 36714, 36724, 36740, 36748, 36749, 36751, 36769, 36800, 36813, 36822, 36824, 36833, 36865, 36881, 36889, 36901, 36913, 36925, 36927, 36947, 36949, 36963, 37003, 37005, 37028, 37032, 37036, 37040, 37057, 37061, 37073, 37081, 37105, 37115, 37117, 37119, 37121, 37233, 37241, 37259, 37297, 37309, 37313, 37325, 37380, 37388, 37405, 37409, 37416, 37420, 37426, 37428, 37434, 37451, 37453, 37505, 37513, 37537, 37545, 37547, 37557, 37558, 37585, 37593, 37617, 37618, 37623, 37624, 37630, 37633, 37645, 37681, 37689, 37693, 37696, 37697, 37698, 37700, 37705, 37707, 37711, 37729, 37734, 37766, 37811, 37815, 37825, 37857, 37878, 37905, 37917, 37921, 37931, 37963, 37965, 38018, 38020, 38030, 38049, 38057, 38059, 38068, 38072, 38076, 38082, 38088, 38092, 38094, 38097, 38103, 38105, 38109, 38129, 38135, 38150, 38153, 38154, 38160, 38178, 38187, 38190, 38226, 38234, 38238, 38313, 38320, 38322, 38326, 38330, 38334, 38338, 38349, 38350, 38353, 38369, 38372, 38377, 38380, 38381, 38384, 38439, 38471, 38490, 38499, 38500, 38504, 38548, 38552, 38583, 38609, 38625, 38631, 38647, 38695, 38769, 38777, 38817, 38833, 38838, 38849, 38856, 38873, 38881, 38892, 38899, 38920, 38924, 38948, 38969, 38977, 38978, 38979, 38980, 38983, 38985, 39025, 39048, 39052, 39054, 39084, 39106, 39118, 39119, 39124, 39164, 39235, 39252, 39256, 39260, 39286, 39294, 39352, 39428, 39432, 39436, 39438, 39441, 39449, 39467, 39476, 39480, 39484, 39491, 39499, 39501, 39521, 39529, 39536, 39569, 39577, 39585, 39649, 39665, 39671, 39673, 39677, 39681, 39704, 39714, 39716, 39722, 39738, 39742, 39747, 39761, 39764, 39793, 39801, 39808, 39809, 39812, 39818, 39829, 39873, 39887, 39919, 39944, 39948, 39972, 39998, 40001, 40002, 40003, 40004, 40007, 40033, 40045, 40049, 40065, 40073, 40108, 40118, 40122, 40148, 40183, 40193, 40217, 40224, 40226, 40232, 40236, 40258, 40287, 40313, 40321, 40333, 40335, 40364, 40369, 40370, 40379, 40381, 40458, 40462, 40473, 40478, 40480, 40526, 40587, 40601, 40603, 40631, 40635, 40663, 40665, 40689, 40690, 40692, 40695, 40697, 40701, 40702, 40705, 40710, 40714, 40799, 40802, 40817, 40833, 40851, 40865, 40884, 40914, 40916, 40926, 40931, 40948, 40961, 40973, 40977, 40979, 40980, 40999, 41007, 41010, 41012, 41016, 41020, 41026, 41028, 41032, 41036, 41039, 41044, 41057, 41058, 41060, 41070, 41076, 41092, 41096, 41105, 41108, 41115, 41117, 41121, 41122, 41124, 41131, 41135, 41143, 41149, 41154, 41159, 41164, 41169, 41170, 41171, 41186, 41188, 41201, 41207, 41213, 41217, 41229, 41236, 41249, 41251, 41252, 41260, 41261, 41265, 41270, 41275, 41279, 41283, 41289, 41295, 41299, 41300, 41301, 41303, 41306, 41313, 41316, 41320, 41325, 41326, 41329, 41334, 41336, 41339, 41340, 41345, 41346, 41352, 41356, 41357, 41358, 41375, 41387, 41391, 41396, 41398, 41401, 41402, 41403, 41406, 41410, 41412, 41416, 41422, 41427, 41433, 41441, 41446, 41449, 41453, 41462, 41468, 41470, 41473, 41478, 41489, 41494, 41497, 41505, 41506, 41508, 41511, 41522, 41524, 41529, 41537, 41539, 41540, 41543, 41545, 41550, 41553, 41565, 41574, 41581, 41591, 41597, 41598, 41617, 41639, 41645, 41649, 41651, 41659, 41679, 41681, 41694, 41697, 41713, 41722, 41729, 41730, 41732, 41742, 41745, 41746, 41748, 41752, 41754, 41756, 41758, 41762, 41764, 41769, 41790, 41796, 41810, 41812, 41825, 41838, 41841, 41842, 41844, 41849, 41854, 41857, 41865, 41873, 41876, 41886, 41905, 41906, 41907, 41908, 41913, 41915, 41919, 41921, 41922, 41924, 41926, 41929, 41937, 41940, 41953, 41972, 41978, 41985, 41988, 41992, 41996, 42002, 42004, 42010, 42012, 42014, 42015, 42018, 42021, 42023, 42035, 42036, 42041, 42050, 42051, 42052, 42057, 42058, 42065, 42071, 42077, 42082, 42084, 42086, 42100, 42114, 42118, 42120, 42122, 42123, 42124, 42127, 42129, 42135, 42145, 42148, 42151, 42158, 42161, 42163, 42168, 42169, 42170, 42171, 42172, 42173, 42175, 42177, 42179, 42180, 42182, 42184, 42185, 42186, 42188, 42189, 42191, 42193, 42194, 42195, 42196, 42201, 42203, 42206, 42210, 42212, 42222, 42225, 42231, 42232, 42235, 42236, 42237, 42247, 42248, 42251, 42252, 42255, 42270, 42276, 42285, 42287, 42298, 42308, 42324, 42333, 42335, 42339, 42347, 42362, 42385, 42397, 42417, 42424, 42430, 42443, 42457, 42465, 42473, 42476, 42492, 42495, 42513, 42526, 42529, 42534, 42536, 42539, 42540, 42541, 42571, 42575, 42580, 42582, 42584, 42586, 42588, 42590, 42595, 42604, 42624, 42628, 42629, 42646, 42656, 42673, 42674, 42682, 42686, 42696, 42700, 42702, 42705, 42725, 42726, 42731, 42735, 42782, 42786, 42788, 42793, 42797, 42799, 42801, 42817, 42819, 42820, 42823, 42824, 42827, 42828, 42830, 42831, 42833, 42836, 42846, 42849, 42852, 42862, 42873, 42881, 42884, 42895, 42897, 42898, 42910, 42913, 42929, 42930, 42932, 42936, 42937, 42940, 42945, 42946, 42948, 42956, 42964, 42989, 42993, 42994, 43003, 43007, 43009, 43014, 43025, 43030, 43033, 43042, 43043, 43057, 43060, 43065, 43074, 43076, 43086, 43090, 43092, 43108, 43110, 43112, 43121, 43129, 43142, 43148, 43158, 43171, 43172, 43185, 43192, 43193, 43213, 43233, 43235, 43238, 43246, 43252, 43268, 43288, 43294, 43301, 43304, 43306, 43317, 43327, 43336, 43341, 43363, 43367, 43392, 43393, 43398, 43404, 43421, 43425, 43428, 43432, 43433, 43436, 43438, 43439, 43440, 43451, 43462, 43465, 43467, 43468, 43472, 43504, 43515, 43521, 43553, 43556, 43563, 43565, 43566, 43569, 43577, 43579, 43585, 43586, 43587, 43591, 43597, 43607, 43615, 43624, 43625, 43633, 43641, 43643, 43648, 43683, 43693, 43697, 43705, 43711, 43715, 43719, 43727, 43729, 43750, 43755, 43772, 43775, 43777, 43784, 43788, 43793, 43801, 43809, 43811, 43812, 43815, 43825, 43833, 43837, 43839, 43841, 43848, 43852, 43878, 43880, 43882, 43884, 43892, 43897, 43953, 43956, 43960, 43965, 43985, 43990, 44003, 44004, 44024, 44025, 44029, 44033, 44038, 44042, 44046, 44053, 44060, 44064, 44073, 44075, 44077, 44081, 44082, 44084, 44095, 44097, 44100, 44105, 44111, 44114, 44116, 44126, 44127, 44129, 44132, 44135, 44136, 44145, 44148, 44171, 44201, 44225, 44233, 44240, 44276, 44282, 44305, 44313, 44318, 44323, 44326, 44327, 44337, 44338, 44342, 44346, 44355, 44364, 44369, 44372, 44382, 44385, 44401, 44417, 44419, 44423, 44424, 44428, 44440, 44453, 44457, 44463, 44470, 44472, 44478, 44479, 44483, 44484, 44486, 44487, 44488, 44489, 44490, 44491, 44494, 44497, 44513, 44515, 44525, 44540, 44542, 44550, 44554, 44561, 44568, 44569, 44578, 44580, 44583, 44584, 44585, 44604, 44607, 44609, 44615, 44616, 44621, 44625, 44637, 44641, 44654, 44657, 44670, 44690, 44696, 44698, 44700, 44707, 44711, 44737, 44753, 44757, 44766, 44773, 44783, 44786, 44792, 44794, 44796, 44798, 44801, 44806, 44808, 44812, 44813, 44817, 44822, 44833, 44836, 44841, 44843, 44845, 44861, 44881, 44882, 44883, 44884, 44894, 44897, 44899, 44904, 44913, 44923, 44929, 44932, 44934, 44938, 44939, 44961, 44964, 44967, 44977, 44996, 45007, 45009, 45011, 45018, 45025, 45028, 45033, 45037, 45078, 45092, 45137, 45140, 45159, 45217, 45220, 45252, 45281, 45284, 45313, 45316, 45318, 45319, 45320, 45321, 45323, 45326, 45332, 45334, 45345, 45346, 45348, 45352, 45353, 45354, 45357, 45358, 45361, 45371, 45373, 45378, 45380, 45384, 45387, 45388, 45391, 45393, 45394, 45395, 45396, 45398, 45399, 45400, 45401, 45404, 45405, 45406, 45407, 45409, 45411, 45414, 45417, 45420, 45428, 45433, 45437, 45439, 45441, 45444, 45451, 45453, 45454, 45455, 45468, 45469, 45471, 45481, 45482, 45484, 45485, 45486, 45489, 45490, 45492, 45493, 45497, 45499, 45505, 45506, 45507, 45510, 45512, 45514, 45521, 45522, 45524, 45526, 45528, 45530, 45534, 45535, 45538, 45540, 45544, 45547, 45550, 45551, 45553, 45555, 45558, 45559, 45562, 45566, 45569, 45572, 45585, 45586, 45588, 45589, 45592, 45596, 45598, 45599, 45604, 45610, 45618, 45620, 45639, 45643, 45650, 45651, 45652, 45655, 45657, 45666, 45667, 45671, 45673, 45682, 45684, 45704, 45707, 45708, 45710, 45711, 45713, 45714, 45716, 45735, 45737, 45746, 45747, 45748, 45751, 45754, 45759, 45762, 45764, 45770, 45772, 45775, 45777, 45780, 45790, 45791, 45793, 45799, 45801, 45806, 45809, 45810, 45812, 45815, 45816, 45818, 45826, 45840, 45847, 45853, 45855, 45856, 45857, 45874, 45875, 45889, 45901, 45905, 45923, 45939, 45953, 45969, 45985, 46001, 46007, 46011, 46012, 46013, 46029, 46033, 46039, 46046, 46049, 46050, 46081, 46082, 46083, 46084, 46088, 46092, 46097, 46100, 46107, 46109, 46111, 46115, 46122, 46129, 46145, 46151, 46153, 46158, 46161, 46162, 46163, 46164, 46167, 46169, 46178, 46180, 46193, 46196, 46201, 46212, 46214, 46219, 46220, 46226, 46228, 46241, 46242, 46249, 46262, 46278, 46280, 46289, 46290, 46292, 46295, 46297, 46299, 46302, 46303, 46305, 46312, 46321, 46322, 46324, 46327, 46332, 46334, 46337, 46350, 46367, 46371, 46372, 46378, 46411, 46415, 46418, 46420, 46433, 46463, 46470, 46473, 46481, 46493, 46514, 46516, 46520, 46523, 46524, 46527, 46538, 46542, 46545, 46548, 46573, 46584, 46588, 46593, 46600, 46603, 46607, 46609, 46611, 46625, 46626, 46627, 46628, 46629, 46631, 46635, 46637, 46639, 46657, 46660, 46667, 46669, 46673, 46675, 46681, 46682, 46684, 46687, 46689, 46692, 46699, 46721, 46723, 46731, 46734, 46740, 46747, 46749, 46753, 46754, 46756, 46760, 46762, 46764, 46767, 46771, 46775, 46780, 46782, 46785, 46789, 46795, 46797, 46816, 46817, 46820, 46824, 46825, 46827, 46833, 46836, 46838, 46841, 46843, 46844, 46845, 46846, 46847, 46867, 46871, 46873, 46897, 46899, 46963, 46990, 46999, 47009, 47025, 47027, 47032, 47035, 47041, 47052, 47059, 47073, 47108, 47112, 47129, 47134, 47140, 47144, 47148, 47160, 47170, 47172, 47188, 47189, 47191, 47201, 47202, 47204, 47209, 47210, 47233, 47235, 47236, 47246, 47249, 47250, 47252, 47257, 47261, 47265, 47267, 47279, 47282, 47284, 47287, 47297, 47300, 47316, 47321, 47329, 47332, 47334, 47342, 47346, 47347, 47351, 47358, 47386, 47394, 47395, 47396, 47398, 47399, 47402, 47403, 47404, 47406, 47415, 47425, 47426, 47428, 47430, 47434, 47438, 47441, 47447, 47453, 47478, 47479, 47480, 47490, 47491, 47506, 47511, 47523, 47542, 47543, 47546, 47555, 47570, 47571, 47572, 47575, 47581, 47582, 47584, 47585, 47586, 47597, 47603, 47609, 47614, 47620, 47633, 47644, 47646, 47648, 47650, 47652, 47658, 47659, 47682, 47690, 47697, 47699, 47700, 47705, 47713, 47714, 47715, 47718, 47720, 47721, 47724, 47726, 47733, 47737, 47768, 47772, 47778, 47780, 47785, 47799, 47800, 47804, 47809, 47812, 47814, 47822, 47826, 47827, 47831, 47841, 47846, 47848, 47850, 47852, 47857, 47858, 47860, 47863, 47866, 47868, 47870, 47871, 47873, 47889, 47892, 47900, 47901, 47908, 47922, 47923, 47929, 47937, 47940, 47944, 47948, 47953, 47955, 47959, 47977, 47985, 48001, 48004, 48013, 48014, 48017, 48020, 48025, 48033, 48036, 48050, 48052, 48057, 48059, 48062, 48068, 48081, 48084, 48086, 48097, 48100, 48104, 48121, 48124, 48127, 48129, 48132, 48140, 48146, 48153, 48194, 48196, 48201, 48208, 48209, 48210, 48224, 48225, 48228, 48232, 48233, 48244, 48257, 48259, 48265, 48272, 48276, 48291, 48295, 48306, 48311, 48313, 48315, 48319, 48324, 48353, 48355, 48356, 48361, 48372, 48385, 48386, 48388, 48412, 48417, 48418, 48420, 48431, 48450, 48463, 48465, 48468, 48477, 48478, 48481, 48482, 48494, 48500, 48504, 48508, 48514, 48516, 48518, 48546, 48557, 48558, 48562, 48572, 48574, 48577, 48584, 48586, 48587, 48588, 48591, 48594, 48596, 48606, 48610, 48625, 48638, 48641, 48643, 48644, 48652, 48659, 48660, 48662, 48663, 48664, 48667, 48668, 48669, 48673, 48678, 48680, 48691, 48692, 48697, 48705, 48721, 48727, 48731, 48733, 48737, 48739, 48740, 48741, 48745, 48747, 48755, 48775, 48776, 48777, 48780, 48788, 48791, 48801, 48804, 48807, 48815, 48825, 48830, 48835, 48836, 48839, 48841, 48843, 48844, 48851, 48853, 48855, 48865, 48870, 48872, 48873, 48876, 48887, 48889, 48894, 48897, 48929, 48961, 48962, 48964, 48976, 48978, 48983, 48995, 48999, 49026, 49027, 49039, 49044, 49065, 49076, 49080, 49083, 49084, 49087, 49092, 49105, 49153, 49165, 49191, 49204, 49219, 49265, 49275, 49283, 49292, 49347, 49351, 49358, 49404, 49409, 49418, 49419, 49420, 49426, 49428, 49432, 49433, 49441, 49444, 49448, 49449, 49450, 49452, 49457, 49459, 49464, 49468, 49472, 49473, 49474, 49475, 49476, 49478, 49479, 49480, 49486, 49491, 49494, 49496, 49497, 49500, 49501, 49503, 49505, 49512, 49517, 49521, 49522, 49523, 49524, 49528, 49535, 49537, 49538, 49540, 49542, 49543, 49548, 49550, 49551, 49553, 49558, 49559, 49560, 49569, 49579, 49580, 49581, 49586, 49587, 49588, 49594, 49598, 49601, 49604, 49606, 49607, 49609, 49610, 49612, 49613, 49615, 49620, 49624, 49628, 49636, 49641, 49642, 49645, 49648, 49649, 49651, 49652, 49654, 49656, 49657, 49665, 49668, 49673, 49674, 49676, 49681, 49688, 49689, 49692, 49693, 49695, 49697, 49703, 49707, 49711, 49729, 49731, 49739, 49740, 49745, 49750, 49751, 49761, 49763, 49777, 49778, 49790, 49791, 49800, 49803, 49804, 49812, 49814, 49816, 49820, 49821, 49825, 49827, 49836, 49841, 49846, 49851, 49852, 49853, 49855, 49868, 49871, 49874, 49883, 49884, 49887, 49889, 49907, 49908, 49911, 49916, 49918, 49932, 49946, 49955, 49959, 49969, 49979, 49991, 49994, 50001, 50003, 50013, 50033, 50043, 50053, 50057, 50058, 50059, 50061, 50077, 50081, 50093, 50097, 50098, 50106, 50111, 50113, 50115, 50118, 50122, 50123, 50127, 50169, 50170, 50171, 50175, 50177, 50179, 50180, 50182, 50185, 50190, 50193, 50195, 50196, 50198, 50201, 50203, 50204, 50205, 50206, 50207, 50209, 50215, 50227, 50228, 50231, 50243, 50259, 50262, 50263, 50266, 50269, 50273, 50274, 50276, 50278, 50280, 50282, 50286, 50289, 50292, 50304, 50311, 50314, 50316, 50321, 50324, 50326, 50332, 50337, 50342, 50343, 50350, 50353, 50358, 50360, 50362, 50363, 50364, 50367, 50369, 50372, 50374, 50375, 50378, 50380, 50383, 50385, 50387, 50391, 50395, 50398, 50401, 50403, 50411, 50415, 50417, 50420, 50422, 50423, 50426, 50434, 50442, 50449, 50455, 50479, 50488, 50492, 50507, 50508, 50514, 50520, 50522, 50559, 50571, 50573, 50583, 50587, 50592, 50619, 50629, 50657, 50660, 50668, 50671, 50690, 50696, 50708, 50721, 50724, 50732, 50744, 50756, 50757, 50760, 50761, 50764, 50765, 50767, 50769, 50772, 50779, 50780, 50785, 50788, 50790, 50804, 50808, 50811, 50817, 50820, 50824, 50828, 50829, 50831, 50833, 50836, 50840, 50849, 50852, 50863, 50868, 50878, 50881, 50884, 50889, 50893, 50895, 50910, 50913, 50916, 50927, 50929, 50932, 50939, 50967, 50970, 50972, 50985, 50993, 50995, 51009, 51025, 51027, 51047, 51073, 51081, 51082, 51083, 51089, 51091, 51095, 51102, 51107, 51111, 51117, 51122, 51130, 51143, 51145, 51187, 51190, 51193, 51196, 51204, 51217, 51219, 51220, 51230, 51234, 51247, 51249, 51252, 51259, 51265, 51282, 51284, 51285, 51289, 51298, 51300, 51303, 51310, 51316, 51331, 51332, 51335, 51337, 51343, 51348, 51358, 51366, 51373, 51374, 51393, 51398, 51414, 51416, 51419, 51425, 51428, 51444, 51446, 51451, 51465, 51467, 51468, 51490, 51491, 51492, 51497, 51498, 51500, 51501, 51502, 51508, 51510, 51512, 51513, 51515, 51516, 51517, 51522, 51524, 51526, 51528, 51529, 51530, 51531, 51532, 51533, 51534, 51537, 51549, 51565, 51574, 51576, 51577, 51586, 51587, 51588, 51590, 51595, 51596, 51598, 51599, 51601, 51617, 51622, 51625, 51629, 51636, 51640, 51641, 51643, 51645, 51647, 51648, 51654, 51655, 51656, 51660, 51661, 51662, 51665, 51678, 51681, 51684, 51694, 51696, 51702, 51709, 51721, 51740, 51745, 51746, 51758, 51759, 51769, 51778, 51788, 51799, 51806, 51810, 51811, 51828, 51832, 51833, 51836, 51842, 51844, 51850, 51852, 51855, 51857, 51873, 51876, 51892, 51906, 51908, 51912, 51917, 51918, 51919, 51940, 51944, 51946, 51952, 51956, 51972, 52001, 52017, 52032, 52033, 52039, 52041, 52045, 52055, 52084, 52106, 52111, 52116, 52119, 52131, 52141, 52148, 52160, 52162, 52164, 52171, 52178, 52180, 52183, 52184, 52188, 52193, 52194, 52196, 52202, 52209, 52214, 52216, 52220, 52228, 52235, 52243, 52246, 52248, 52249, 52267, 52268, 52273, 52303, 52306, 52308, 52322, 52323, 52324, 52326, 52334, 52340, 52348, 52351, 52352, 52372, 52374, 52398, 52415, 52422, 52423, 52424, 52438, 52443, 52449, 52452, 52454, 52458, 52459, 52463, 52468, 52474, 52479, 52485, 52489, 52493, 52495, 52497, 52498, 52503, 52505, 52514, 52516, 52519, 52521, 52525, 52537, 52544, 52545, 52546, 52548, 52551, 52553, 52561, 52562, 52564, 52577, 52580, 52594, 52603, 52604, 52611, 52612, 52616, 52617, 52618, 52625, 52631, 52644, 52647, 52648, 52657, 52665, 52666, 52667, 52676, 52681, 52684, 52689, 52706, 52718, 52720, 52721, 52729, 52734, 52740, 52742, 52744, 52747, 52748, 52750, 52752, 52756, 52757, 52765, 52769, 52772, 52781, 52789, 52799, 52801, 52802, 52804, 52806, 52807, 52808, 52809, 52812, 52813, 52814, 52817, 52823, 52826, 52827, 52831, 52833, 52842, 52844, 52849, 52855, 52866, 52868, 52872, 52875, 52876, 52877, 52878, 52881, 52883, 52884, 52885, 52889, 52890, 52892, 52897, 52898, 52904, 52913, 52915, 52921, 52922, 52923, 52926, 52930, 52932, 52934, 52935, 52936, 52941, 52944, 52946, 52949, 52951, 52956, 52958, 52962, 52967, 52975, 52977, 52979, 52987, 52989, 53020, 53025, 53028, 53056, 53057, 53073, 53091, 53098, 53100, 53105, 53121, 53128, 53153, 53156, 53170, 53189, 53193, 53199, 53208, 53226, 53246, 53261, 53265, 53268, 53272, 53276, 53298, 53314, 53332, 53341, 53342, 53345, 53348, 53378, 53385, 53390, 53393, 53396, 53397, 53398, 53403, 53405, 53409, 53411, 53412, 53416, 53419, 53420, 53442, 53449, 53460, 53486, 53500, 53505, 53510, 53514, 53515, 53521, 53522, 53531, 53538, 53539, 53542, 53548, 53550, 53556, 53560, 53563, 53565, 53571, 53572, 53576, 53579, 53583, 53586, 53603, 53604, 53608, 53612, 53614, 53616, 53620, 53628, 53636, 53644, 53658, 53665, 53667, 53668, 53669, 53671, 53676, 53677, 53679, 53681, 53682, 53683, 53690, 53692, 53694, 53697, 53698, 53700, 53706, 53707, 53708, 53711, 53712, 53713, 53721, 53724, 53731, 53736, 53737, 53742, 53745, 53750, 53770, 53773, 53777, 53782, 53788, 53789, 53793, 53795, 53796, 53799, 53805, 53806, 53809, 53817, 53825, 53826, 53827, 53858, 53862, 53866, 53873, 53874, 53876, 53889, 53905, 53917, 53926, 53933, 53941, 53942, 53943, 53945, 53947, 53948, 53950, 53954, 53958, 53962, 53969, 53974, 53976, 53977, 53980, 53985, 54001, 54008, 54012, 54017, 54018, 54022, 54024, 54026, 54030, 54049, 54052, 54057, 54095, 54097, 54113, 54129, 54137, 54145, 54177, 54189, 54199, 54225, 54228, 54257, 54265, 54271, 54274, 54276, 54280, 54282, 54283, 54285, 54286, 54292, 54296, 54297, 54308, 54311, 54313, 54319, 54321, 54322, 54324, 54327, 54331, 54334, 54338, 54339, 54340, 54345, 54347, 54349, 54351, 54354, 54355, 54356, 54360, 54365, 54371, 54375, 54388, 54393, 54395, 54399, 54400, 54407, 54411, 54417, 54419, 54422, 54433, 54434, 54436, 54439, 54442, 54446, 54451, 54461, 54464, 54465, 54467, 54470, 54471, 54476, 54478, 54481, 54483, 54484, 54485, 54489, 54490, 54491, 54495, 54499, 54507, 54511, 54513, 54519, 54523, 54534, 54536, 54539, 54542, 54550, 54553, 54567, 54574, 54585, 54586, 54594, 54606, 54630, 54640, 54650, 54673, 54694, 54696, 54701, 54710, 54732, 54734, 54737, 54753, 54761, 54765, 54769, 54774, 54778, 54779, 54790, 54801, 54804, 54817, 54818, 54819, 54820, 54822, 54823, 54825, 54826, 54830, 54831, 54833, 54837, 54863, 54865, 54866, 54868, 54873, 54874, 54875, 54879, 54882, 54884, 54897, 54921, 54927, 54960, 54962, 54965, 54974, 54978, 54982, 54986, 54987, 54990, 54993, 55009, 55017, 55021, 55022, 55028, 55037, 55041, 55042, 55046, 55050, 55053, 55054, 55057, 55066, 55068, 55069, 55074, 55076, 55089, 55092, 55107, 55121, 55123, 55127, 55137, 55161, 55185, 55197, 55202, 55217, 55222, 55233, 55234, 55243, 55265, 55281, 55284, 55286, 55287, 55289, 55291, 55300, 55304, 55308, 55321, 55327, 55328, 55332, 55337, 55360, 55371, 55380, 55386, 55387, 55397, 55409, 55424, 55431, 55444, 55453, 55465, 55471, 55478, 55481, 55486, 55488, 55492, 55504, 55529, 55533, 55550, 55561, 55570, 55573, 55586, 55595, 55602, 55609, 55616, 55618, 55619, 55627, 55636, 55652, 55662, 55669, 55670, 55674, 55681, 55690, 55705, 55710, 55713, 55714, 55715, 55716, 55719, 55721, 55724, 55725, 55736, 55737, 55739, 55740, 55741, 55748, 55780, 55790, 55805, 55807, 55819, 55820, 55825, 55840, 55841, 55842, 55843, 55844, 55846, 55847, 55850, 55851, 55854, 55855, 55857, 55861, 55866, 55872, 55876, 55889, 55896, 55898, 55900, 55905, 55910, 55917, 55924, 55930, 55937, 55943, 55945, 55953, 55958, 55969, 55984, 55997, 56001, 56033, 56038, 56047, 56055, 56056, 56061, 56081, 56093, 56097, 56098, 56099, 56100, 56103, 56114, 56121, 56128, 56129, 56132, 56143, 56185, 56192, 56196, 56202, 56225, 56241, 56242, 56244, 56246, 56250, 56251, 56254, 56259, 56264, 56273, 56275, 56299, 56303, 56311, 56312, 56317, 56319, 56324, 56328, 56332, 56337, 56339, 56341, 56345, 56349, 56353, 56359, 56377, 56401, 56404, 56408, 56410, 56412, 56416, 56417, 56420, 56424, 56448, 56452, 56457, 56468, 56477, 56493, 56502, 56512, 56521, 56528, 56529, 56537, 56539, 56541, 56544, 56547, 56553, 56561, 56572, 56582, 56592, 56604, 56608, 56611, 56615, 56620, 56633, 56637, 56638, 56643, 56644, 56660, 56673, 56689, 56697, 56705, 56711, 56712, 56716, 56735, 56737, 56744, 56753, 56759, 56761, 56770, 56778, 56782, 56783, 56784, 56817, 56822, 56827, 56833, 56840, 56844, 56847, 56848, 56853, 56854, 56862, 56864, 56865, 56867, 56871, 56877, 56882, 56885, 56894, 56897, 56903, 56908, 56924, 56945, 56946, 56960, 56961, 56969, 56972, 56973, 56976, 56980, 56985, 56986, 56990, 56991, 56993, 56999, 57009, 57019, 57020, 57024, 57025, 57033, 57035, 57036, 57040, 57041, 57050, 57057, 57065, 57069, 57072, 57073, 57081, 57089, 57090, 57092, 57094, 57098, 57102, 57105, 57110, 57117, 57187, 57197, 57201, 57267, 57268, 57271, 57297, 57300, 57309, 57319, 57391, 57396, 57402, 57404, 57419, 57464, 57484, 57493, 57505, 57508, 57513, 57519, 57547, 57548, 57551, 57555, 57558, 57580, 57583, 57594, 57608, 57611, 57614, 57620, 57632, 57634, 57636, 57642, 57646, 57654, 57684, 57689, 57691, 57694, 57714, 57718, 57723, 57724, 57728, 57731, 57761, 57762, 57786, 57799, 57808, 57820, 57827, 57836, 57857, 57860, 57862, 57864, 57870, 57876, 57887, 57889, 57909, 57919, 57937, 57939, 57943, 57946, 57955, 57970, 57977, 57978, 58002, 58004, 58008, 58010, 58014, 58021, 58042, 58085, 58086, 58089, 58093, 58098, 58100, 58107, 58108, 58113, 58116, 58120, 58126, 58127, 58138, 58145, 58147, 58151, 58157, 58172, 58177, 58189, 58193, 58262, 58280, 58281, 58306, 58310, 58314, 58328, 58329, 58349, 58353, 58369, 58371, 58375, 58382, 58385, 58387, 58401, 58403, 58419, 58423, 58425, 58449, 58450, 58452, 58455, 58460, 58462, 58468, 58476, 58493, 58494, 58531, 58537, 58554, 58560, 58570, 58579, 58583, 58585, 58603, 58626, 58630, 58634, 58658, 58660, 58669, 58689, 58712, 58716, 58734, 58753, 58801, 58808, 58812, 58814, 58818, 58821, 58853, 58857, 58861, 58882, 58888, 58891, 58897, 58923, 58934, 58946, 58949, 58955, 58956, 58980, 58982, 59025, 59057, 59088, 59092, 59107, 59116, 59121, 59131, 59133, 59155, 59160, 59169, 59176, 59177, 59186, 59188, 59217, 59250, 59252, 59336, 59337, 59338, 59377, 59382, 59384, 59428, 59448, 59449, 59451, 59460, 59476, 59481, 59484, 59501, 59533, 59537, 59566, 59601, 59618, 59626, 59639, 59648, 59677, 59684, 59687, 59692, 59714, 59718, 59719, 59768, 59786, 59817, 59819, 59820, 59824, 59827, 59831, 59832, 59839, 59849, 59857, 59868, 59873, 59885, 59888, 59895, 59905, 59929, 59946, 59949, 59964, 59967, 59972, 59978, 59985, 59987, 59991, 60003, 60040, 60083, 60098, 60100, 60101, 60105, 60108, 60144, 60161, 60164, 60175, 60177, 60228, 60305, 60329, 60332, 60368, 60369, 60372, 60386, 60388, 60390, 60394, 60402, 60434, 60446, 60448, 60462, 60493, 60498, 60537, 60544, 60545, 60558, 60568, 60572, 60575, 60642, 60650, 60658, 60674, 60683, 60684, 60687, 60700, 60708, 60710, 60713, 60718, 60735, 60740, 60754, 60755, 60756, 60761, 60763, 60777, 60796, 60809, 60818, 60831, 60832, 60838, 60851, 60855, 60858, 60873, 60880, 60886, 60930, 60932, 60936, 60939, 60940, 60945, 60947, 60950, 60951, 60958, 60971, 60975, 60976, 60991, 60997, 60998, 61007, 61025, 61039, 61048, 61054, 61068, 61074, 61076, 61078, 61080, 61084, 61086, 61096, 61099, 61112, 61114, 61144, 61153, 61159, 61164, 61176, 61190, 61198, 61199, 61218, 61220, 61239, 61250, 61267, 61281, 61314, 61333, 61345, 61346, 61348, 61351, 61370, 61392, 61418, 61426, 61441, 61451, 61453, 61455, 61460, 61476, 61508, 61521, 61524, 61527, 61537, 61540, 61549, 61577, 61585, 61588, 61601, 61604, 61620, 61636, 61641, 61652, 61665, 61668, 61677, 61684, 61697, 61699, 61700, 61703, 61705, 61706, 61711, 61713, 61714, 61715, 61716, 61717, 61720, 61724, 61725, 61729, 61732, 61736, 61737, 61738, 61739, 61740, 61743, 61745, 61748, 61750, 61751, 61752, 61755, 61756, 61761, 61762, 61763, 61765, 61767, 61771, 61772, 61773, 61775, 61780, 61782, 61786, 61787, 61788, 61793, 61796, 61798, 61801, 61803, 61804, 61805, 61806, 61809, 61811, 61812, 61813, 61814, 61815, 61817, 61822, 61825, 61828, 61829, 61831, 61832, 61833, 61835, 61837, 61839, 61841, 61843, 61844, 61845, 61846, 61847, 61850, 61851, 61852, 61853, 61857, 61862, 61863, 61864, 61867, 61868, 61869, 61873, 61874, 61876, 61879, 61880, 61881, 61884, 61885, 61886, 61887, 61888, 61889, 61890, 61891, 61893, 61895, 61896, 61897, 61899, 61901, 61902, 61903, 61904, 61919, 61921, 61924, 61925, 61934, 61935, 61936, 61937, 61940, 61942, 61943, 61944, 61945, 61946, 61947, 61948, 61949, 61951, 61955, 61959, 61974, 61985, 61988, 61991, 62001, 62016, 62017, 62026, 62033, 62035, 62039, 62050, 62058, 62068, 62073, 62076, 62084, 62095, 62105, 62121, 62128, 62136, 62145, 62146, 62148, 62154, 62159, 62166, 62168, 62170, 62175, 62177, 62178, 62180, 62183, 62190, 62192, 62193, 62194, 62196, 62199, 62200, 62202, 62206, 62210, 62212, 62225, 62226, 62231, 62237, 62240, 62243, 62244, 62249, 62256, 62257, 62265, 62282, 62284, 62291, 62295, 62306, 62344, 62345, 62351, 62353, 62359, 62387, 62390, 62402, 62448, 62454, 62457, 62465, 62477, 62481, 62483, 62486, 62487, 62488, 62489, 62490, 62492, 62495, 62497, 62498, 62500, 62505, 62515, 62521, 62528, 62529, 62531, 62534, 62535, 62536, 62538, 62541, 62542, 62543, 62545, 62546, 62553, 62563, 62569, 62577, 62580, 62583, 62588, 62592, 62593, 62594, 62595, 62599, 62600, 62601, 62604, 62606, 62609, 62615, 62617, 62625, 62634, 62642, 62643, 62644, 62648, 62651, 62653, 62654, 62656, 62657, 62659, 62662, 62664, 62665, 62666, 62667, 62670, 62671, 62673, 62675, 62678, 62680, 62684, 62685, 62687, 62690, 62694, 62695, 62700, 62702, 62705, 62707, 62709, 62710, 62712, 62714, 62715, 62717, 62718, 62719, 62722, 62733, 62738, 62754, 62756, 62768, 62769, 62772, 62785, 62797, 62803, 62804, 62807, 62817, 62818, 62820, 62823, 62832, 62848, 62851, 62855, 62856, 62860, 62861, 62881, 62882, 62884, 62900, 62911, 62912, 62914, 62924, 62926, 62946, 62962, 62971, 62973, 62975, 62978, 62987, 62988, 62992, 62995, 62999, 63004, 63007, 63009, 63010, 63012, 63016, 63018, 63020, 63021, 63032, 63041, 63042, 63044, 63048, 63051, 63053, 63054, 63058, 63060, 63064, 63066, 63072, 63073, 63083, 63084, 63087, 63105, 63108, 63109, 63110, 63112, 63113, 63115, 63118, 63119, 63121, 63124, 63128, 63131, 63132, 63133, 63135, 63136, 63166, 63169, 63171, 63172, 63174, 63175, 63176, 63177, 63181, 63183, 63196, 63201, 63204, 63206, 63208, 63209, 63211, 63220, 63221, 63225, 63229, 63234, 63236, 63248, 63249, 63250, 63258, 63264, 63266, 63267, 63268, 63282, 63284, 63298, 63300, 63315, 63319, 63375, 63376, 63377, 63378, 63396, 63420, 63423, 63426, 63457, 63478, 63481, 63484, 63487, 63489, 63496, 63500, 63505, 63506, 63508, 63509, 63513, 63514, 63523, 63524, 63529, 63556, 63559, 63565, 63569, 63571, 63575, 63585, 63593, 63594, 63595, 63604, 63607, 63609, 63619, 63624, 63628, 63630, 63633, 63634, 63636, 63645, 63651, 63667, 63672, 63675, 63677, 63679, 63681, 63683, 63684, 63686, 63688, 63690, 63693, 63694, 63697, 63698, 63704, 63706, 63708, 63714, 63715, 63716, 63732, 63734, 63736, 63739, 63741, 63742, 63743, 63744, 63761, 63764, 63767, 63768, 63769, 63772, 63773, 63774, 63777, 63782, 63785, 63786, 63787, 63788, 63789, 63793, 63794, 63797, 63798, 63799, 63804, 63806, 63811, 63812, 63813, 63814, 63821, 63825, 63828, 63837, 63841, 63843, 63844, 63854, 63856, 63859, 63862, 63867, 63868, 63869, 63870, 63871, 63874, 63875, 63878, 63879, 63880, 63881, 63884, 63889, 63890, 63895, 63901, 63902, 63905, 63917, 63918, 63921, 63923, 63924, 63926, 63927, 63928, 63931, 63935, 63937, 63938, 63939, 63940, 63945, 63946, 63950, 63954, 63955, 63959, 63966, 63971, 63986, 63990, 63992, 63993, 63996, 63997, 63998, 63999, 64001, 64021, 64023, 64024, 64025, 64033, 64034, 64035, 64043, 64047, 64055, 64061, 64066, 64067, 64068, 64072, 64076, 64081, 64082, 64084, 64092, 64099, 64106, 64115, 64117, 64130, 64131, 64132, 64135, 64136, 64148, 64151, 64152, 64163, 64167, 64176, 64179, 64181, 64183, 64184, 64185, 64193, 64204, 64211, 64231, 64237, 64239, 64240, 64241, 64245, 64247, 64248, 64256, 64273, 64281, 64289, 64291, 64292, 64307, 64321, 64322, 64323, 64324, 64325, 64327, 64328, 64329, 64333, 64370, 64371, 64385, 64388, 64391, 64392, 64393, 64396, 64401, 64403, 64404, 64409, 64417, 64418, 64419, 64423, 64425, 64434, 64435, 64436, 64438, 64440, 64443, 64448, 64452, 64457, 64460, 64464, 64472, 64499, 64504, 64505, 64506, 64508, 64513, 64524, 64528, 64536, 64537, 64538, 64540, 64545, 64549, 64553, 64555, 64557, 64559, 64576, 64577, 64587, 64591, 64601, 64609, 64617, 64618, 64632, 64636, 64643, 64649, 64652, 64660, 64664, 64668, 64681, 64688, 64698, 64699, 64705, 64707, 64710, 64711, 64712, 64714, 64717, 64718, 64719, 64721, 64728, 64732, 64739, 64742, 64747, 64761, 64764, 64767, 64769, 64771, 64772, 64791, 64795, 64801, 64802, 64803, 64804, 64807, 64811, 64812, 64814, 64817, 64819, 64820, 64822, 64823, 64824, 64828, 64829, 64831, 64835, 64836, 64837, 64839, 64840, 64842, 64843, 64846, 64850, 64852, 64861, 64862, 64865, 64866, 64868, 64871, 64877, 64884, 64892, 64895, 64897, 64898, 64900, 64904, 64908, 64911, 64916, 64919, 64926, 64929, 64935, 64941, 64948, 64951, 64952, 64956, 64959, 64961, 64965, 64966, 64971, 64977, 64979, 64983, 64989, 64999, 65008, 65009, 65010, 65014, 65015, 65017, 65018, 65021, 65022, 65033, 65035, 65039, 65041, 65043, 65044, 65046, 65047, 65049, 65052, 65057, 65059, 65060, 65063, 65066, 65079, 65080, 65091, 65093, 65096, 65098, 65099, 65101, 65103, 65115, 65117, 65119, 65121, 65127, 65129, 65131, 65133, 65135, 65136, 65140, 65145, 65148, 65155, 65156, 65158, 65159, 65164, 65165, 65169, 65171, 65172, 65175, 65177, 65179, 65181, 65191, 65193, 65194, 65195, 65197, 65200, 65203, 65205, 65207, 65208, 65209, 65212, 65215, 65217, 65219, 65222, 65223, 65226, 65227, 65229, 65235, 65236, 65239, 65241, 65247, 65249, 65251, 65252, 65255, 65258, 65265, 65266, 65267, 65270, 65273, 65277, 65297, 65300, 65306, 65308, 65314, 65319, 65332, 65346, 65347, 65351, 65357, 65378, 65379, 65393, 65396, 65409, 65411, 65415, 65416, 65418, 65420, 65441, 65443, 65449, 65458, 65464, 65466, 65473, 65483, 65486, 65489, 65499, 65500, 65505, 65507, 65512, 65521, 65522, 65530, 65531, 65532, 65535], 14777: [150, 155, 275, 281, 283, 292, 296, 300, 319, 321, 331, 339, 343, 360, 383, 386, 387, 392, 398, 399, 403, 413, 420, 424, 426, 442, 443, 447, 452, 463, 465, 466, 467, 471, 479, 482, 486, 490, 492, 494, 500, 506, 511, 530, 542, 545, 585, 660, 695, 703, 712, 742, 744, 793, 801, 833, 836, 840, 844, 846, 860, 950, 993, 1005, 1043, 1046, 1048, 1050, 1051, 1054, 1057, 1059, 1060, 1062, 1080, 1089, 1092, 1103, 1123, 1127, 1135, 1154, 1155, 1169, 1171, 1172, 1176, 1180, 1183, 1202, 1206, 1209, 1215, 1219, 1220, 1226, 1228, 1235, 1249, 1251, 1252, 1255, 1263, 1268, 1305, 1318, 1353, 1433, 1554, 1563, 1566, 1583, 1604, 1614, 1619, 1623, 1634, 1635, 1639, 1682, 1693, 1723, 1747, 1751, 1755, 1759, 1774, 1787, 1817, 1857, 1865, 1867, 1881, 2081, 2084, 2100, 2113, 2121, 2127, 2168, 2172, 2184, 2193, 2236, 2248, 2252, 2329, 2334, 2342, 2345, 2369, 2387, 2459, 2470, 2488, 2489, 2495, 2503, 2529, 2534, 2537, 2584, 2663, 2750, 2790, 2792, 2845, 2872, 2881, 2895, 2902, 2942, 3052, 3060, 3102, 3105, 3112, 3122, 3137, 3140, 3150, 3208, 3218, 3246, 3345, 3358, 3369, 3489, 3539, 3549, 3558, 3561, 3614, 3617, 3622, 3624, 3630, 3657, 3682, 3720, 3724, 3754, 3762, 3814, 3817, 3832, 3865, 3870, 3873, 3908, 3926, 3983, 3988, 4049, 4065, 4076, 4078, 4093, 4113, 4114, 4121, 4126, 4130, 4132, 4136, 4137, 4140, 4146, 4148, 4157, 4164, 4165, 4168, 4169, 4173, 4177, 4209, 4210, 4217, 4225, 4228, 4232, 4238, 4248, 4257, 4265, 4281, 4283, 4302, 4305, 4338, 4342, 4347, 4350, 4352, 4354, 4355, 4356, 4357, 4358, 4359, 4361, 4362, 4363, 4364, 4365, 4366, 4367, 4368, 4408, 4409, 4410, 4412, 4419, 4434, 4435, 4436, 4439, 4440, 4442, 4444, 4445, 4446, 4449, 4451, 4452, 4456, 4466, 4467, 4468, 4471, 4472, 4473, 4479, 4484, 4486, 4503, 4506, 4510, 4511, 4513, 4514, 4518, 4519, 4533, 4539, 4544, 4546, 4547, 4554, 4558, 4568, 4577, 4578, 4583, 4588, 4589, 4590, 4592, 4594, 4599, 4607, 4611, 4614, 4615, 4617, 4619, 4620, 4622, 4623, 4634, 4637, 4638, 4641, 4649, 4655, 4660, 4665, 4667, 4670, 4673, 4687, 4702, 4704, 4721, 4728, 4729, 4734, 4735, 4738, 4742, 4746, 4758, 4768, 4775, 4781, 4791, 4804, 4810, 4814, 4822, 4825, 4826, 4828, 4830, 4855, 4863, 4867, 4868, 4876, 4878, 4897, 4898, 4913, 4916, 4929, 4932, 4946, 4951, 4958, 4980, 5009, 5012, 5041, 5079, 5105, 5122, 5124, 5128, 5130, 5132, 5133, 5134, 5137, 5147, 5166, 5175, 5185, 5192, 5193, 5202, 5203, 5208, 5210, 5212, 5223, 5226, 5229, 5234, 5237, 5238, 5242, 5245, 5251, 5260, 5265, 5266, 5278, 5297, 5318, 5319, 5324, 5327, 5329, 5334, 5336, 5340, 5343, 5350, 5352, 5355, 5359, 5360, 5364, 5371, 5372, 5378, 5379, 5383, 5385, 5386, 5409, 5414, 5417, 5425, 5428, 5433, 5437, 5441, 5449, 5453, 5459, 5460, 5463, 5465, 5469, 5485, 5497, 5499, 5502, 5505, 5508, 5513, 5522, 5524, 5534, 5552, 5555, 5556, 5577, 5581, 5585, 5613, 5616, 5625, 5627, 5629, 5632, 5635, 5636, 5639, 5640, 5643, 5644, 5647, 5652, 5665, 5668, 5672, 5686, 5689, 5694, 5712, 5714, 5715, 5725, 5731, 5735, 5740, 5750, 5753, 5757, 5764, 5767, 5771, 5793, 5794, 5796, 5798, 5800, 5801, 5802, 5803, 5804, 5812, 5821, 5822, 5826, 5844, 5854, 5873, 5876, 5878, 5879, 5881, 5882, 5886, 5891, 5908, 5914, 5927, 5929, 5937, 5938, 5943, 5953, 5956, 5970, 6001, 6009, 6025, 6034, 6039, 6062, 6069, 6083, 6085, 6087, 6089, 6090, 6098, 6110, 6130, 6133, 6138, 6145, 6146, 6147, 6148, 6150, 6151, 6152, 6154, 6155, 6158, 6184, 6185, 6199, 6203, 6215, 6225, 6231, 6236, 6243, 6273, 6274, 6279, 6292, 6305, 6318, 6337, 6338, 6339, 6340, 6343, 6345, 6366, 6372, 6377, 6385, 6391, 6395, 6402, 6403, 6406, 6407, 6409, 6410, 6412, 6413, 6414, 6417, 6420, 6429, 6433, 6434, 6435, 6438, 6440, 6441, 6444, 6447, 6449, 6455, 6457, 6473, 6474, 6476, 6478, 6481, 6482, 6493, 6494, 6509, 6513, 6514, 6521, 6522, 6523, 6525, 6526, 6533, 6546, 6548, 6551, 6554, 6557, 6566, 6569, 6571, 6578, 6585, 6589, 6599, 6601, 6606, 6615, 6628, 6641, 6646, 6657, 6659, 6660, 6662, 6664, 6665, 6666, 6668, 6671, 6705, 6735, 6736, 6739, 6748, 6766, 6785, 6791, 6809, 6830, 6841, 6846, 6849, 6854, 6862, 6866, 6868, 6870, 6874, 6882, 6894, 6903, 6904, 6905, 6913, 6915, 6922, 6948, 6958, 6961, 6964, 6967, 6969, 6980, 6994, 6999, 7022, 7025, 7026, 7028, 7043, 7073, 7105, 7123, 7130, 7137, 7145, 7162, 7165, 7166, 7169, 7170, 7173, 7174, 7175, 7177, 7178, 7179, 7182, 7183, 7185, 7201, 7217, 7223, 7250, 7254, 7255, 7262, 7263, 7265, 7267, 7296, 7297, 7313, 7360, 7361, 7367, 7377, 7390, 7410, 7413, 7415, 7416, 7417, 7419, 7425, 7426, 7427, 7428, 7429, 7433, 7436, 7437, 7439, 7459, 7460, 7469, 7474, 7481, 7485, 7490, 7492, 7505, 7511, 7540, 7548, 7558, 7590, 7591, 7603, 7611, 7616, 7630, 7634, 7655, 7664, 7665, 7667, 7668, 7670, 7680, 7683, 7684, 7686, 7687, 7689, 7691, 7695, 7702, 7705, 7706, 7710, 7711, 7715, 7716, 7719, 7724, 7750, 7751, 7756, 7774, 7778, 7780, 7788, 7789, 7796, 7801, 7806, 7810, 7811, 7812, 7819, 7822, 7825, 7838, 7840, 7847, 7850, 7852, 7853, 7854, 7865, 7869, 7873, 7874, 7876, 7885, 7888, 7892, 7894, 7913, 7916, 7923, 7924, 7926, 7927, 7929, 7934, 7937, 7938, 7940, 7943, 7948, 7949, 7970, 7985, 7986, 7993, 8001, 8018, 8023, 8030, 8033, 8036, 8087, 8097, 8103, 8106, 8109, 8113, 8161, 8178, 8182, 8186, 8193, 8194, 8196, 8203, 8204, 8206, 8216, 8219, 8225, 8226, 8227, 8228, 8229, 8230, 8233, 8240, 8258, 8259, 8261, 8262, 8265, 8269, 8273, 8294, 8300, 8301, 8304, 8305, 8307, 8315, 8322, 8327, 8328, 8329, 8330, 8333, 8335, 8340, 8342, 8355, 8357, 8358, 8364, 8369, 8376, 8377, 8378, 8379, 8380, 8382, 8386, 8387, 8388, 8393, 8396, 8405, 8411, 8413, 8417, 8418, 8419, 8422, 8428, 8429, 8430, 8434, 8436, 8438, 8444, 8448, 8451, 8452, 8455, 8466, 8467, 8468, 8472, 8484, 8486, 8487, 8488, 8489, 8493, 8495, 8497, 8500, 8501, 8503, 8504, 8507, 8509, 8510, 8514, 8519, 8520, 8524, 8528, 8529, 8531, 8534, 8536, 8539, 8540, 8544, 8547, 8549, 8559, 8561, 8567, 8569, 8570, 8575, 8577, 8583, 8586, 8587, 8589, 8591, 8594, 8595, 8600, 8602, 8604, 8608, 8619, 8621, 8622, 8623, 8624, 8629, 8631, 8637, 8639, 8644, 8646, 8648, 8650, 8651, 8652, 8653, 8655, 8666, 8667, 8668, 8671, 8673, 8674, 8676, 8680, 8687, 8688, 8689, 8690, 8695, 8696, 8698, 8699, 8705, 8711, 8714, 8726, 8730, 8737, 8741, 8742, 8747, 8750, 8752, 8756, 8769, 8774, 8777, 8781, 8782, 8783, 8803, 8805, 8814, 8822, 8823, 8826, 8830, 8839, 8848, 8860, 8865, 8878, 8881, 8883, 8887, 8888, 8896, 8905, 8912, 8914, 8922, 8930, 8941, 8944, 8958, 8966, 8968, 8972, 8981, 8985, 8986, 8991, 8994, 8995, 8996, 8998, 8999, 9000, 9004, 9008, 9019, 9022, 9026, 9028, 9031, 9033, 9036, 9040, 9041, 9049, 9051, 9052, 9053, 9054, 9062, 9065, 9066, 9070, 9076, 9083, 9085, 9086, 9088, 9089, 9097, 9108, 9111, 9112, 9113, 9118, 9122, 9129, 9131, 9147, 9152, 9153, 9166, 9169, 9172, 9173, 9178, 9183, 9186, 9190, 9194, 9195, 9197, 9198, 9200, 9213, 9216, 9217, 9218, 9231, 9232, 9237, 9245, 9246, 9248, 9250, 9254, 9255, 9261, 9262, 9270, 9274, 9275, 9277, 9282, 9286, 9288, 9290, 9292, 9293, 9298, 9312, 9319, 9323, 9327, 9329, 9337, 9339, 9344, 9345, 9349, 9350, 9351, 9352, 9356, 9357, 9360, 9361, 9365, 9368, 9370, 9372, 9381, 9383, 9384, 9385, 9389, 9390, 9397, 9399, 9400, 9408, 9409, 9410, 9416, 9418, 9419, 9420, 9421, 9423, 9438, 9441, 9442, 9443, 9452, 9453, 9454, 9455, 9456, 9458, 9463, 9464, 9467, 9468, 9469, 9479, 9484, 9503, 9508, 9511, 9513, 9515, 9518, 9519, 9523, 9526, 9533, 9537, 9542, 9545, 9547, 9551, 9555, 9561, 9564, 9606, 9609, 9610, 9614, 9617, 9627, 9633, 9636, 9639, 9646, 9648, 9662, 9669, 9670, 9682, 9686, 9693, 9704, 9705, 9706, 9728, 9731, 9734, 9735, 9736, 9738, 9739, 9740, 9741, 9748, 9749, 9752, 9756, 9761, 9763, 9767, 9770, 9771, 9775, 9779, 9781, 9783, 9784, 9785, 9795, 9811, 9812, 9813, 9821, 9831, 9839, 9840, 9845, 9848, 9849, 9851, 9852, 9854, 9856, 9858, 9859, 9863, 9866, 9867, 9870, 9873, 9876, 9877, 9882, 9889, 9894, 9902, 9905, 9907, 9908, 9917, 9920, 9921, 9923, 9927, 9928, 9929, 9933, 9941, 9948, 9950, 9952, 9959, 9960, 9971, 9972, 9975, 9978, 9980, 9982, 9987, 9992, 9993, 10001, 10002, 10006, 10017, 10019, 10021, 10023, 10027, 10030, 10038, 10043, 10045, 10051, 10053, 10054, 10055, 10058, 10064, 10065, 10068, 10080, 10086, 10098, 10102, 10109, 10112, 10114, 10118, 10124, 10129, 10135, 10143, 10144, 10145, 10148, 10158, 10162, 10164, 10173, 10174, 10177, 10182, 10193, 10194, 10196, 10197, 10198, 10201, 10202, 10209, 10213, 10215, 10216, 10217, 10219, 10223, 10224, 10230, 10243, 10246, 10249, 10252, 10256, 10261, 10274, 10275, 10276, 10279, 10280, 10283, 10285, 10287, 10289, 10290, 10292, 10293, 10297, 10306, 10308, 10314, 10317, 10321, 10322, 10323, 10324, 10327, 10332, 10336, 10340, 10342, 10352, 10357, 10373, 10384, 10386, 10390, 10402, 10403, 10409, 10415, 10418, 10429, 10433, 10434, 10448, 10452, 10457, 10469, 10475, 10477, 10483, 10484, 10485, 10487, 10491, 10494, 10499, 10501, 10506, 10508, 10518, 10529, 10532, 10537, 10540, 10543, 10547, 10561, 10562, 10564, 10566, 10568, 10572, 10574, 10577, 10581, 10584, 10588, 10589, 10590, 10595, 10596, 10600, 10605, 10610, 10623, 10628, 10630, 10635, 10637, 10642, 10645, 10649, 10652, 10653, 10654, 10655, 10661, 10669, 10676, 10682, 10688, 10690, 10691, 10694, 10696, 10699, 10701, 10706, 10711, 10721, 10722, 10723, 10728, 10729, 10730, 10733, 10753, 10756, 10759, 10776, 10784, 10787, 10789, 10790, 10793, 10795, 10797, 10798, 10801, 10810, 10814, 10817, 10825, 10827, 10830, 10840, 10854, 10857, 10863, 10864, 10869, 10879, 10881, 10884, 10885, 10887, 10890, 10891, 10894, 10897, 10908, 10915, 10916, 10918, 10920, 10923, 10924, 10929, 10934, 10935, 10937, 10942, 10944, 10946, 10957, 10958, 10966, 10970, 10976, 10978, 10981, 10982, 10984, 10989, 10992, 10999, 11001, 11006, 11009, 11010, 11011, 11012, 11013, 11014, 11015, 11017, 11018, 11020, 11021, 11022, 11036, 11041, 11047, 11053, 11054, 11067, 11069, 11073, 11079, 11084, 11085, 11087, 11089, 11098, 11100, 11102, 11111, 11114, 11116, 11120, 11121, 11123, 11131, 11137, 11140, 11155, 11159, 11161, 11164, 11167, 11169, 11171, 11174, 11184, 11188, 11190, 11191, 11193, 11201, 11203, 11207, 11211, 11213, 11227, 11239, 11248, 11249, 11252, 11257, 11258, 11259, 11261, 11267, 11271, 11272, 11277, 11282, 11292, 11297, 11298, 11300, 11303, 11310, 11312, 11317, 11321, 11322, 11330, 11335, 11339, 11347, 11350, 11356, 11362, 11366, 11383, 11385, 11394, 11395, 11408, 11410, 11414, 11416, 11421, 11422, 11426, 11427, 11436, 11445, 11449, 11457, 11471, 11476, 11478, 11479, 11481, 11489, 11493, 11498, 11501, 11503, 11504, 11507, 11508, 11511, 11521, 11524, 11525, 11526, 11527, 11529, 11531, 11534, 11538, 11540, 11552, 11553, 11558, 11559, 11560, 11562, 11563, 11564, 11570, 11575, 11592, 11597, 11602, 11608, 11610, 11611, 11612, 11614, 11619, 11632, 11633, 11637, 11652, 11654, 11658, 11662, 11668, 11670, 11677, 11679, 11681, 11684, 11686, 11687, 11696, 11698, 11706, 11709, 11713, 11714, 11715, 11728, 11737, 11740, 11741, 11745, 11746, 11754, 11758, 11761, 11769, 11770, 11774, 11780, 11782, 11786, 11788, 11790, 11796, 11797, 11809, 11812, 11817, 11818, 11819, 11823, 11824, 11827, 11829, 11831, 11834, 11840, 11841, 11844, 11845, 11847, 11852, 11854, 11857, 11863, 11866, 11877, 11888, 11889, 11895, 11897, 11918, 11920, 11927, 11929, 11937, 11939, 11943, 11954, 11956, 11960, 11961, 11963, 11984, 11985, 12001, 12004, 12017, 12019, 12030, 12043, 12050, 12065, 12068, 12072, 12079, 12086, 12088, 12092, 12093, 12099, 12105, 12113, 12120, 12122, 12123, 12129, 12138, 12142, 12143, 12158, 12163, 12165, 12166, 12167, 12171, 12182, 12185, 12186, 12190, 12191, 12192, 12195, 12196, 12198, 12199, 12201, 12222, 12225, 12235, 12237, 12241, 12246, 12257, 12265, 12266, 12268, 12276, 12283, 12316, 12323, 12340, 12355, 12360, 12364, 12370, 12385, 12419, 12422, 12424, 12425, 12426, 12433, 12450, 12473, 12476, 12482, 12483, 12486, 12490, 12499, 12535, 12536, 12540, 12551, 12555, 12563, 12570, 12571, 12579, 12581, 12585, 12588, 12589, 12590, 12592, 12599, 12600, 12612, 12622, 12623, 12629, 12647, 12663, 12666, 12669, 12677, 12689, 12700, 12707, 12708, 12715, 12723, 12724, 12730, 12738, 12741, 12748, 12749, 12754, 12760, 12770, 12775, 12794, 12799, 12826, 12833, 12835, 12836, 12852, 12864, 12868, 12870, 12919, 12937, 12942, 12945, 12979, 12984, 12989, 12990, 13028, 13033, 13090, 13233, 13265, 13300, 13305, 13310, 13332, 13333, 13336, 13347, 13362, 13364, 13367, 13376, 13378, 13381, 13382, 13385, 13386, 13387, 13390, 13399, 13426, 13427, 13428, 13440, 13441, 13443, 13444, 13447, 13452, 13455, 13459, 13460, 13472, 13494, 13500, 13504, 13508, 13519, 13524, 13530, 13535, 13539, 13601, 13602, 13609, 13635, 13637, 13638, 13646, 13666, 13678, 13709, 13710, 13766, 13774, 13793, 13847, 13857, 13861, 13862, 13864, 13867, 13869, 13871, 13874, 13875, 13876, 13879, 13886, 13889, 13894, 13895, 13896, 13899, 13902, 13906, 13922, 13924, 13942, 13947, 13949, 13969, 13985, 13990, 14011, 14015, 14027, 14029, 14040, 14043, 14057, 14061, 14069, 14070, 14073, 14076, 14079, 14113, 14115, 14121, 14130, 14153, 14157, 14161, 14194, 14226, 14264, 14266, 14281, 14305, 14321, 14322, 14324, 14326, 14327, 14330, 14353, 14355, 14362, 14372, 14382, 14400, 14409, 14414, 14417, 14419, 14423, 14471, 14473, 14516, 14521, 14526, 14529, 14543, 14545, 14567, 14579, 14580, 14628, 14629, 14631, 14636, 14638, 14640, 14644, 14658, 14660, 14661, 14664, 14665, 14709, 14719, 14725, 14756, 14787, 14789, 14793, 14795, 14874, 14885, 14887, 14889, 14891, 14897, 14905, 14909, 14915, 14916, 14920, 14924, 14926, 14930, 14947, 14979, 15009, 15011, 15012, 15018, 15024, 15030, 15031, 15034, 15035, 15038, 15049, 15083, 15094, 15137, 15139, 15179, 15188, 15236, 15242, 15246, 15252, 15265, 15268, 15294, 15303, 15304, 15319, 15332, 15345, 15357, 15379, 15395, 15399, 15410, 15412, 15413, 15429, 15437, 15441, 15507, 15517, 15523, 15527, 15539, 15540, 15542, 15590, 15594, 15649, 15650, 15659, 15660, 15661, 15676, 15678, 15686, 15690, 15710, 15715, 15729, 15741, 15746, 15747, 15756, 15810, 15843, 15890, 15892, 15904, 15907, 15913, 15922, 15939, 15941, 15945, 15963, 15987, 16006, 16031, 16039, 16046, 16049, 16054, 16057, 16070, 16082, 16084, 16085, 16112, 16117, 16152, 16161, 16162, 16169, 16177, 16178, 16180, 16185, 16193, 16209, 16210, 16212, 16231, 16257, 16261, 16269, 16321, 16334, 16335, 16382, 16392, 16401, 16417, 16421, 16422, 16437, 16438, 16440, 16444, 16446, 16453, 16454, 16457, 16465, 16473, 16477, 16481, 16486, 16488, 16491, 16501, 16513, 16514, 16515, 16519, 16520, 16521, 16524, 16525, 16529, 16531, 16532, 16534, 16536, 16547, 16549, 16550, 16552, 16569, 16571, 16575, 16593, 16594, 16597, 16600, 16606, 16609, 16611, 16613, 16614, 16616, 16619, 16625, 16626, 16630, 16633, 16637, 16640, 16641, 16643, 16650, 16653, 16655, 16658, 16668, 16673, 16680, 16686, 16689, 16690, 16692, 16701, 16704, 16707, 16711, 16720, 16722, 16726, 16731, 16733, 16738, 16740, 16751, 16752, 16754, 16755, 16757, 16759, 16763, 16768, 16771, 16773, 16777, 16783, 16786, 16791, 16792, 16796, 16801, 16807, 16810, 16816, 16819, 16820, 16824, 16831, 16832, 16834, 16837, 16845, 16852, 16864, 16868, 16878, 16880, 16890, 16891, 16896, 16900, 16902, 16906, 16908, 16909, 16912, 16916, 16920, 16922, 16925, 16929, 16930, 16932, 16934, 16935, 16936, 16937, 16943, 16945, 16946, 16948, 16954, 16957, 16958, 16968, 16969, 16974, 16976, 16978, 16981, 16984, 16990, 17010, 17012, 17014, 17016, 17018, 17021, 17022, 17026, 17041, 17045, 17055, 17058, 17061, 17064, 17071, 17072, 17075, 17079, 17087, 17090, 17105, 17106, 17114, 17116, 17117, 17122, 17138, 17139, 17149, 17150, 17166, 17167, 17192, 17198, 17200, 17203, 17207, 17209, 17213, 17219, 17225, 17228, 17230, 17233, 17235, 17236, 17264, 17268, 17271, 17272, 17275, 17278, 17280, 17293, 17300, 17325, 17326, 17329, 17331, 17333, 17334, 17335, 17336, 17338, 17344, 17351, 17353, 17356, 17361, 17364, 17367, 17370, 17390, 17392, 17394, 17395, 17396, 17401, 17404, 17408, 17418, 17423, 17436, 17437, 17440, 17441, 17443, 17445, 17454, 17458, 17462, 17466, 17471, 17478, 17480, 17484, 17487, 17488, 17490, 17493, 17500, 17517, 17519, 17522, 17525, 17533, 17535, 17538, 17541, 17549, 17552, 17554, 17557, 17567, 17568, 17570, 17572, 17573, 17575, 17577, 17578, 17579, 17581, 17582, 17585, 17594, 17600, 17604, 17609, 17610, 17620, 17622, 17629, 17631, 17632, 17644, 17648, 17649, 17650, 17660, 17662, 17664, 17667, 17671, 17675, 17678, 17697, 17699, 17700, 17703, 17705, 17714, 17732, 17735, 17743, 17745, 17752, 17756, 17758, 17773, 17774, 17790, 17793, 17797, 17798, 17806, 17809, 17818, 17822, 17825, 17827, 17836, 17839, 17843, 17847, 17852, 17858, 17865, 17869, 17890, 17891, 17894, 17901, 17902, 17908, 17918, 17920, 17924, 17927, 17937, 17941, 17945, 17950, 17953, 17955, 17962, 17966, 17969, 17972, 17975, 17981, 17985, 17988, 17990, 17998, 18004, 18005, 18007, 18010, 18023, 18025, 18029, 18031, 18036, 18042, 18054, 18055, 18059, 18062, 18073, 18082, 18089, 18097, 18099, 18100, 18102, 18107, 18109, 18118, 18122, 18128, 18129, 18131, 18157, 18161, 18164, 18166, 18170, 18179, 18184, 18193, 18199, 18205, 18206, 18207, 18211, 18221, 18223, 18227, 18229, 18231, 18233, 18234, 18238, 18240, 18243, 18244, 18248, 18249, 18255, 18258, 18259, 18260, 18261, 18265, 18291, 18292, 18293, 18295, 18302, 18305, 18306, 18309, 18319, 18322, 18324, 18333, 18354, 18355, 18358, 18360, 18361, 18369, 18372, 18373, 18375, 18376, 18384, 18385, 18388, 18392, 18393, 18410, 18412, 18416, 18418, 18419, 18420, 18421, 18435, 18444, 18446, 18457, 18459, 18461, 18468, 18490, 18494, 18498, 18500, 18504, 18511, 18513, 18514, 18516, 18518, 18522, 18526, 18530, 18543, 18549, 18561, 18565, 18571, 18577, 18581, 18593, 18606, 18625, 18629, 18638, 18644, 18652, 18657, 18670, 18675, 18676, 18677, 18686, 18688, 18691, 18700, 18701, 18708, 18712, 18713, 18716, 18721, 18729, 18730, 18740, 18743, 18745, 18752, 18755, 18756, 18759, 18764, 18768, 18770, 18772, 18776, 18781, 18782, 18802, 18804, 18809, 18814, 18818, 18819, 18826, 18828, 18834, 18837, 18840, 18841, 18842, 18849, 18858, 18864, 18865, 18872, 18887, 18894, 18900, 18903, 18913, 18921, 18927, 18928, 18929, 18938, 18943, 18947, 18948, 18951, 18955, 18958, 18977, 18979, 18982, 18986, 18993, 18996, 19000, 19001, 19014, 19019, 19024, 19025, 19026, 19034, 19037, 19045, 19056, 19060, 19065, 19078, 19094, 19103, 19110, 19120, 19122, 19123, 19126, 19136, 19145, 19147, 19158, 19166, 19167, 19169, 19171, 19174, 19181, 19185, 19191, 19193, 19194, 19195, 19197, 19200, 19207, 19210, 19211, 19212, 19213, 19223, 19233, 19234, 19235, 19236, 19241, 19248, 19251, 19258, 19264, 19268, 19271, 19281, 19291, 19294, 19299, 19306, 19310, 19312, 19315, 19321, 19328, 19332, 19333, 19336, 19349, 19356, 19358, 19360, 19362, 19364, 19365, 19369, 19381, 19383, 19385, 19388, 19392, 19397, 19401, 19403, 19411, 19415, 19417, 19418, 19439, 19445, 19449, 19450, 19451, 19453, 19455, 19456, 19462, 19463, 19465, 19474, 19483, 19484, 19489, 19490, 19491, 19492, 19495, 19498, 19499, 19506, 19511, 19522, 19524, 19530, 19535, 19537, 19538, 19540, 19546, 19550, 19588, 19591, 19592, 19605, 19620, 19630, 19637, 19638, 19643, 19649, 19653, 19668, 19673, 19678, 19681, 19685, 19696, 19697, 19700, 19702, 19705, 19708, 19711, 19716, 19718, 19736, 19744, 19747, 19749, 19750, 19757, 19761, 19762, 19773, 19783, 19786, 19789, 19793, 19797, 19798, 19799, 19800, 19801, 19803, 19805, 19832, 19840, 19843, 19845, 19856, 19867, 19868, 19878, 19887, 19888, 19889, 19894, 19896, 19905, 19907, 19910, 19914, 19920, 19922, 19938, 19942, 19946, 19952, 19958, 19961, 19965, 19968, 19971, 19975, 19977, 19978, 19979, 19980, 19984, 19987, 19993, 19997, 19999, 20005, 20009, 20010, 20023, 20025, 20026, 20027, 20029, 20031, 20041, 20045, 20046, 20048, 20054, 20055, 20057, 20061, 20069, 20071, 20079, 20080, 20082, 20084, 20086, 20090, 20093, 20095, 20108, 20118, 20121, 20122, 20133, 20137, 20139, 20144, 20147, 20154, 20170, 20172, 20176, 20180, 20185, 20186, 20188, 20189, 20191, 20198, 20201, 20211, 20212, 20217, 20222, 20224, 20225, 20226, 20231, 20247, 20257, 20259, 20269, 20270, 20274, 20286, 20297, 20298, 20303, 20305, 20307, 20308, 20311, 20312, 20316, 20322, 20323, 20334, 20335, 20337, 20339, 20345, 20353, 20355, 20369, 20370, 20377, 20382, 20383, 20387, 20388, 20393, 20394, 20400, 20403, 20404, 20406, 20414, 20415, 20419, 20420, 20422, 20425, 20432, 20436, 20438, 20439, 20442, 20444, 20454, 20457, 20467, 20469, 20470, 20473, 20475, 20497, 20500, 20507, 20520, 20524, 20529, 20536, 20540, 20545, 20548, 20552, 20553, 20555, 20556, 20559, 20564, 20569, 20609, 20612, 20614, 20625, 20633, 20638, 20657, 20660, 20667, 20668, 20673, 20679, 20691, 20700, 20705, 20708, 20710, 20713, 20714, 20717, 20721, 20737, 20744, 20746, 20751, 20755, 20763, 20764, 20767, 20769, 20771, 20774, 20779, 20782, 20784, 20797, 20799, 20800, 20802, 20808, 20811, 20813, 20814, 20824, 20827, 20828, 20840, 20843, 20844, 20845, 20864, 20866, 20876, 20877, 20884, 20892, 20893, 20895, 20897, 20899, 20902, 20905, 20906, 20907, 20909, 20911, 20915, 20920, 20921, 20923, 20924, 20925, 20928, 20929, 20931, 20936, 20939, 20940, 20941, 20957, 20963, 20968, 20972, 20977, 20984, 20987, 20988, 21012, 21015, 21022, 21027, 21028, 21031, 21039, 21060, 21063, 21065, 21066, 21078, 21102, 21124, 21127, 21134, 21140, 21143, 21146, 21177, 21184, 21189, 21204, 21214, 21215, 21217, 21219, 21220, 21223, 21224, 21225, 21226, 21229, 21249, 21259, 21263, 21273, 21277, 21281, 21282, 21284, 21289, 21291, 21292, 21294, 21295, 21318, 21321, 21322, 21324, 21325, 21326, 21336, 21390, 21401, 21403, 21407, 21419, 21422, 21457, 21462, 21473, 21474, 21481, 21485, 21487, 21522, 21523, 21524, 21525, 21527, 21537, 21539, 21540, 21542, 21545, 21555, 21572, 21575, 21585, 21590, 21592, 21595, 21596, 21597, 21605, 21619, 21636, 21639, 21640, 21644, 21645, 21646, 21651, 21652, 21659, 21663, 21667, 21680, 21683, 21684, 21692, 21696, 21697, 21699, 21702, 21703, 21704, 21705, 21708, 21711, 21713, 21716, 21729, 21730, 21731, 21732, 21738, 21747, 21751, 21777, 21778, 21785, 21793, 21801, 21806, 21807, 21825, 21826, 21833, 21835, 21837, 21838, 21841, 21847, 21848, 21857, 21894, 21908, 21919, 21922, 21925, 21962, 21969, 21986, 21988, 21992, 21994, 21996, 21997, 21998, 22017, 22020, 22026, 22031, 22034, 22036, 22040, 22044, 22049, 22051, 22055, 22056, 22057, 22059, 22060, 22062, 22068, 22072, 22082, 22084, 22089, 22091, 22095, 22097, 22104, 22107, 22108, 22113, 22136, 22139, 22151, 22152, 22155, 22159, 22171, 22172, 22173, 22178, 22207, 22213, 22216, 22218, 22223, 22228, 22232, 22236, 22248, 22249, 22251, 22258, 22259, 22260, 22263, 22267, 22270, 22271, 22278, 22289, 22293, 22294, 22302, 22313, 22314, 22319, 22343, 22344, 22346, 22348, 22351, 22364, 22375, 22382, 22402, 22420, 22421, 22422, 22425, 22426, 22428, 22452, 22459, 22460, 22481, 22486, 22491, 22497, 22503, 22506, 22539, 22540, 22568, 22571, 22572, 22599, 22601, 22606, 22607, 22619, 22623, 22628, 22630, 22639, 22641, 22677, 22678, 22682, 22684, 22719, 22731, 22732, 22733, 22752, 22756, 22758, 22764, 22768, 22799, 22801, 22802, 22804, 22811, 22815, 22819, 22821, 22822, 22829, 22831, 22833, 22841, 22847, 22850, 22851, 22852, 22856, 22857, 22860, 22861, 22865, 22866, 22870, 22871, 22872, 22875, 22876, 22877, 22878, 22889, 22890, 22891, 22914, 22927, 22930, 22936, 22937, 22939, 22949, 22950, 22967, 22968, 22974, 22986, 22990, 22993, 22996, 23009, 23011, 23012, 23014, 23022, 23032, 23060, 23065, 23067, 23068, 23070, 23075, 23076, 23078, 23079, 23080, 23083, 23084, 23086, 23089, 23097, 23105, 23108, 23111, 23112, 23113, 23114, 23119, 23121, 23132, 23143, 23144, 23145, 23147, 23150, 23182, 23185, 23188, 23193, 23204, 23207, 23208, 23216, 23217, 23226, 23230, 23242, 23252, 23257, 23258, 23265, 23267, 23271, 23274, 23297, 23300, 23314, 23316, 23321, 23323, 23353, 23356, 23368, 23372, 23382, 23387, 23389, 23395, 23398, 23401, 23426, 23435, 23450, 23451, 23466, 23473, 23481, 23483, 23491, 23521, 23524, 23529, 23531, 23550, 23554, 23556, 23563, 23568, 23570, 23576, 23588, 23594, 23595, 23596, 23611, 23615, 23617, 23618, 23620, 23624, 23628, 23635, 23639, 23640, 23642, 23644, 23659, 23662, 23682, 23688, 23704, 23711, 23714, 23724, 23747, 23748, 23749, 23755, 23756, 23757, 23758, 23759, 23764, 23778, 23779, 23784, 23785, 23791, 23806, 23807, 23845, 23872, 23873, 23874, 23875, 23885, 23891, 23905, 23912, 23915, 23960, 23964, 23969, 23986, 23988, 23989, 23995, 24005, 24009, 24011, 24024, 24036, 24047, 24050, 24062, 24072, 24076, 24087, 24092, 24095, 24100, 24103, 24114, 24129, 24132, 24135, 24136, 24147, 24151, 24159, 24163, 24175, 24178, 24187, 24198, 24206, 24212, 24215, 24216, 24217, 24218, 24222, 24227, 24241, 24249, 24254, 24262, 24271, 24284, 24290, 24302, 24306, 24313, 24324, 24337, 24343, 24344, 24350, 24353, 24355, 24361, 24385, 24393, 24401, 24409, 24415, 24419, 24427, 24429, 24449, 24475, 24476, 24479, 24481, 24484, 24491, 24514, 24527, 24532, 24540, 24545, 24547, 24553, 24554, 24556, 24559, 24564, 24577, 24595, 24609, 24610, 24612, 24619, 24623, 24625, 24632, 24643, 24647, 24648, 24652, 24689, 24692, 24737, 24743, 24791, 24833, 24847, 24852, 24867, 24878, 24892, 24926, 24931, 24932, 24940, 24956, 24964, 24980, 24996, 25018, 25028, 25031, 25032, 25033, 25044, 25051, 25055, 25060, 25064, 25073, 25075, 25082, 25086, 25102, 25107, 25113, 25121, 25161, 25175, 25209, 25228, 25235, 25236, 25239, 25261, 25265, 25313, 25326, 25345, 25348, 25352, 25356, 25377, 25380, 25389, 25390, 25394, 25410, 25412, 25438, 25457, 25458, 25474, 25526, 25590, 25611, 25614, 25615, 25635, 25636, 25667, 25681, 25687, 25693, 25698, 25703, 25708, 25716, 25731, 25770, 25785, 25889, 25897, 25905, 25943, 25985, 25990, 25993, 25997, 26006, 26014, 26036, 26054, 26057, 26062, 26070, 26078, 26084, 26107, 26132, 26152, 26153, 26161, 26207, 26211, 26212, 26244, 26250, 26257, 26264, 26273, 26287, 26319, 26324, 26340, 26351, 26353, 26354, 26358, 26362, 26364, 26367, 26388, 26401, 26409, 26420, 26482, 26484, 26498, 26506, 26547, 26550, 26567, 26625, 26635, 26659, 26663, 26691, 26715, 26724, 26731, 26759, 26762, 26791, 26817, 26910, 26915, 26916, 26918, 26919, 26920, 26924, 26939, 26945, 26961, 26967, 27010, 27032, 27036, 27041, 27042, 27049, 27053, 27055, 27060, 27062, 27073, 27082, 27105, 27106, 27108, 27118, 27126, 27131, 27133, 27177, 27178, 27201, 27281, 27304, 27313, 27318, 27329, 27361, 27393, 27396, 27400, 27404, 27427, 27476, 27556, 27652, 27656, 27659, 27660, 27665, 27686, 27731, 27735, 27746, 27777, 27798, 27809, 27815, 27849, 27873, 27885, 27939, 28001, 28077, 28097, 28103, 28107, 28113, 28145, 28148, 28168, 28172, 28178, 28179, 28196, 28206, 28233, 28264, 28269, 28290, 28292, 28301, 28307, 28308, 28318, 28319, 28321, 28331, 28333, 28358, 28366, 28367, 28375, 28382, 28385, 28386, 28417, 28420, 28424, 28428, 28430, 28433, 28442, 28497, 28539, 28639, 28711, 28801, 28806, 28855, 28865, 28870, 28873, 28918, 28944, 28946, 28948, 28954, 28966, 28971, 28972, 28975, 28977, 28980, 28991, 28993, 29000, 29002, 29003, 29007, 29014, 29015, 29046, 29047, 29049, 29053, 29054, 29057, 29059, 29063, 29066, 29068, 29069, 29071, 29082, 29091, 29092, 29110, 29113, 29117, 29119, 29122, 29124, 29130, 29132, 29134, 29135, 29146, 29150, 29152, 29155, 29158, 29159, 29173, 29174, 29183, 29202, 29208, 29212, 29229, 29230, 29231, 29236, 29249, 29254, 29256, 29257, 29261, 29262, 29274, 29304, 29308, 29388, 29390, 29422, 29468, 29485, 29619, 29649, 29714, 29717, 29718, 29722, 29724, 29727, 29745, 29751, 29759, 29761, 29765, 29770, 29771, 29773, 29774, 29786, 29793, 29813, 29814, 29817, 29818, 29822, 29823, 29824, 29832, 29836, 29839, 29841, 29844, 29880, 29883, 29884, 29887, 29894, 29896, 29903, 29914, 29915, 29919, 29920, 29923, 29926, 29927, 29935, 29940, 30019, 30034, 30153, 30211, 30215, 30251, 30254, 30275, 30291, 30293, 30295, 30321, 30326, 30331, 30339, 30342, 30376, 30387, 30390, 30393, 30401, 30403, 30418, 30462, 30482, 30488, 30513, 30529, 30530, 30536, 30545, 30578, 30581, 30604, 30649, 30671, 30673, 30686, 30707, 30740, 30753, 30756, 30760, 30761, 30764, 30767, 30770, 30772, 30779, 30786, 30788, 30792, 30795, 30796, 30802, 30834, 30837, 30853, 30881, 30899, 30905, 30920, 30923, 30927, 30994, 30997, 31014, 31016, 31017, 31022, 31039, 31044, 31045, 31049, 31054, 31093, 31111, 31139, 31201, 31213, 31268, 31278, 31284, 31297, 31311, 31338, 31358, 31360, 31364, 31396, 31415, 31425, 31436, 31438, 31457, 31470, 31485, 31522, 31529, 31553, 31565, 31570, 31602, 31607, 31635, 31671, 31678, 31688, 31689, 31695, 31739, 31742, 31762, 31780, 31781, 31795, 31796, 31806, 31817, 31828, 31873, 31894, 31932, 32026, 32033, 32038, 32043, 32044, 32045, 32051, 32057, 32066, 32072, 32074, 32120, 32134, 32136, 32184, 32191, 32193, 32200, 32227, 32255, 32259, 32263, 32278, 32279, 32280, 32284, 32286, 32289, 32292, 32299, 32302, 32318, 32319, 32321, 32324, 32326, 32329, 32334, 32335, 32339, 32398, 32402, 32435, 32454, 32456, 32460, 32466, 32470, 32488, 32492, 32507, 32511, 32529, 32548, 32577, 32580, 32642, 32643, 32650, 32703, 32735, 32785, 32788, 32790, 32797, 32804, 32808, 32818, 32831, 32840, 32844, 32849, 32861, 32865, 32866, 32867, 32868, 32871, 32897, 32900, 32904, 32911, 32915, 32919, 32927, 32929, 32931, 32935, 32936, 32939, 32940, 32942, 32961, 32962, 32964, 32967, 32971, 32975, 32977, 32980, 32993, 32999, 33009, 33010, 33016, 33020, 33023, 33039, 33047, 33048, 33056, 33059, 33062, 33071, 33096, 33109, 33119, 33121, 33131, 33135, 33139, 33146, 33151, 33152, 33162, 33236, 33247, 33264, 33270, 33283, 33287, 33299, 33305, 33314, 33327, 33330, 33342, 33363, 33367, 33388, 33394, 33396, 33401, 33408, 33422, 33447, 33459, 33460, 33470, 33472, 33475, 33484, 33487, 33488, 33490, 33492, 33497, 33508, 33510, 33512, 33515, 33519, 33522, 33530, 33534, 33554, 33561, 33563, 33567, 33570, 33602, 33609, 33612, 33619, 33623, 33633, 33649, 33676, 33713, 33714, 33716, 33724, 33733, 33735, 33737, 33745, 33748, 33761, 33810, 33811, 33818, 33821, 33823, 33824, 33826, 33860, 33866, 33875, 33888, 33921, 33922, 33927, 33944, 33952, 33979, 33984, 33986, 33988, 33994, 33999, 34003, 34019, 34021, 34028, 34029, 34031, 34035, 34036, 34040, 34046, 34060, 34073, 34081, 34084, 34086, 34092, 34109, 34110, 34120, 34124, 34129, 34131, 34132, 34135, 34136, 34138, 34139, 34177, 34180, 34185, 34197, 34200, 34206, 34215, 34216, 34217, 34220, 34225, 34228, 34237, 34246, 34256, 34257, 34261, 34262, 34270, 34280, 34281, 34284, 34285, 34312, 34316, 34319, 34332, 34337, 34342, 34349, 34358, 34377, 34384, 34401, 34408, 34416, 34417, 34427, 34428, 34444, 34447, 34481, 34491, 34504, 34510, 34517, 34523, 34554, 34578, 34583, 34586, 34593, 34624, 34626, 34628, 34631, 34636, 34639, 34641, 34644, 34708, 34740, 34754, 34760, 34770, 34786, 34801, 34809, 34834, 34836, 34851, 34868, 34872, 34881, 34897, 34898, 34900, 34903, 34910, 34913, 34915, 34916, 34918, 34989, 34993, 35012, 35018, 35022, 35023, 35025, 35041, 35064, 35068, 35093, 35099, 35101, 35109, 35112, 35114, 35137, 35141, 35145, 35147, 35154, 35169, 35182, 35208, 35211, 35212, 35215, 35221, 35235, 35238, 35241, 35242, 35243, 35246, 35247, 35265, 35276, 35281, 35300, 35312, 35317, 35321, 35371, 35377, 35393, 35394, 35396, 35400, 35406, 35409, 35411, 35415, 35425, 35429, 35435, 35439, 35457, 35471, 35473, 35485, 35489, 35492, 35510, 35515, 35521, 35522, 35524, 35533, 35537, 35553, 35556, 35568, 35592, 35619, 35627, 35645, 35668, 35684, 35694, 35701, 35716, 35725, 35729, 35761, 35764, 35765, 35769, 35773, 35780, 35785, 35796, 35811, 35836, 35837, 35846, 35868, 35876, 35881, 35885, 35905, 35917, 35921, 35922, 35923, 35931, 35940, 35944, 35945, 35947, 35950, 35969, 35976, 35980, 35988, 36011, 36013, 36033, 36040, 36057, 36069, 36070, 36084, 36094, 36097, 36126, 36138, 36139, 36145, 36146, 36158, 36161, 36163, 36168, 36172, 36177, 36179, 36189, 36194, 36206, 36214, 36222, 36225, 36227, 36251, 36255, 36267, 36275, 36281, 36294, 36297, 36308, 36324, 36340, 36345, 36347, 36358, 36371, 36385, 36390, 36396, 36413, 36449, 36451, 36479, 36484, 36486, 36490, 36532, 36535, 36542, 36555, 36580, 36581, 36590, 36592, 36594, 36607, 36649, 36690, 36692, 36718, 36735, 36747, 36775, 36776, 36786, 36820, 36823, 36836, 36837, 36872, 36876, 36883, 36892, 36893, 36894, 36897, 36904, 36905, 36908, 36916, 36933, 36937, 36940, 36945, 36952, 36956, 36958, 36961, 36969, 36972, 36977, 36989, 36993, 37000, 37001, 37017, 37023, 37025, 37030, 37033, 37035, 37041, 37044, 37051, 37053, 37065, 37076, 37077, 37085, 37089, 37092, 37100, 37103, 37110, 37122, 37124, 37126, 37128, 37131, 37132, 37133, 37134, 37135, 37136, 37141, 37147, 37153, 37154, 37155, 37158, 37160, 37164, 37165, 37169, 37179, 37185, 37187, 37199, 37201, 37202, 37204, 37207, 37211, 37218, 37223, 37226, 37231, 37232, 37240, 37252, 37262, 37263, 37264, 37269, 37274, 37276, 37281, 37284, 37286, 37299, 37301, 37307, 37308, 37311, 37314, 37316, 37320, 37321, 37322, 37326, 37327, 37334, 37336, 37338, 37339, 37348, 37352, 37354, 37355, 37358, 37359, 37360, 37361, 37364, 37369, 37371, 37372, 37373, 37377, 37378, 37379, 37382, 37383, 37390, 37393, 37398, 37401, 37415, 37418, 37422, 37425, 37441, 37445, 37448, 37454, 37457, 37459, 37463, 37467, 37473, 37485, 37489, 37510, 37524, 37526, 37529, 37543, 37551, 37553, 37559, 37563, 37574, 37577, 37597, 37601, 37611, 37613, 37616, 37622, 37627, 37628, 37634, 37646, 37648, 37649, 37665, 37667, 37673, 37703, 37723, 37745, 37773, 37777, 37789, 37792, 37793, 37794, 37803, 37807, 37809, 37820, 37845, 37849, 37853, 37870, 37880, 37884, 37886, 37888, 37889, 37890, 37894, 37895, 37898, 37901, 37912, 37919, 37922, 37923, 37924, 37932, 37934, 37935, 37940, 37951, 37954, 37960, 37962, 37964, 37967, 37970, 37971, 37972, 37973, 37979, 37982, 37984, 37987, 37996, 37999, 38001, 38003, 38004, 38009, 38023, 38032, 38033, 38034, 38040, 38043, 38044, 38052, 38055, 38058, 38061, 38067, 38079, 38080, 38084, 38091, 38095, 38098, 38099, 38100, 38116, 38119, 38124, 38132, 38136, 38147, 38152, 38155, 38161, 38177, 38181, 38182, 38184, 38185, 38193, 38209, 38217, 38222, 38225, 38228, 38231, 38235, 38237, 38278, 38281, 38285, 38308, 38309, 38310, 38323, 38324, 38327, 38329, 38332, 38340, 38345, 38347, 38374, 38391, 38393, 38397, 38398, 38404, 38408, 38417, 38420, 38435, 38438, 38440, 38441, 38447, 38455, 38459, 38460, 38462, 38475, 38478, 38484, 38488, 38495, 38497, 38508, 38509, 38538, 38542, 38545, 38558, 38562, 38564, 38566, 38568, 38570, 38571, 38572, 38575, 38580, 38585, 38589, 38599, 38616, 38622, 38632, 38633, 38634, 38644, 38649, 38651, 38654, 38673, 38685, 38689, 38705, 38713, 38721, 38723, 38727, 38753, 38785, 38792, 38793, 38801, 38809, 38813, 38816, 38827, 38835, 38842, 38844, 38846, 38857, 38864, 38865, 38902, 38910, 38913, 38914, 38916, 38925, 38926, 38937, 38945, 38951, 38952, 38953, 38956, 38987, 38993, 38994, 38996, 38999, 39001, 39007, 39012, 39017, 39033, 39041, 39044, 39046, 39057, 39061, 39077, 39083, 39086, 39087, 39089, 39097, 39105, 39131, 39138, 39144, 39150, 39154, 39159, 39160, 39161, 39168, 39171, 39193, 39212, 39225, 39227, 39233, 39234, 39238, 39240, 39241, 39246, 39247, 39249, 39257, 39258, 39259, 39261, 39262, 39277, 39281, 39289, 39290, 39296, 39298, 39302, 39309, 39313, 39321, 39330, 39332, 39336, 39337, 39338, 39345, 39347, 39348, 39356, 39365, 39366, 39389, 39394, 39409, 39410, 39412, 39414, 39415, 39416, 39419, 39421, 39425, 39426, 39459, 39460, 39469, 39470, 39471, 39483, 39489, 39490, 39507, 39513, 39533, 39537, 39560, 39568, 39595, 39599, 39600, 39601, 39602, 39606, 39610, 39613, 39617, 39619, 39621, 39622, 39647, 39654, 39672, 39674, 39675, 39678, 39696, 39697, 39713, 39715, 39719, 39748, 39755, 39773, 39777, 39779, 39780, 39811, 39833, 39838, 39839, 39842, 39843, 39849, 39850, 39860, 39865, 39875, 39884, 39888, 39892, 39897, 39901, 39905, 39912, 39934, 39935, 39937, 39938, 39940, 39946, 39949, 39950, 39970, 40017, 40020, 40023, 40025, 40036, 40038, 40044, 40068, 40081, 40099, 40113, 40124, 40126, 40137, 40161, 40177, 40178, 40182, 40187, 40188, 40191, 40194, 40196, 40205, 40206, 40210, 40225, 40227, 40228, 40231, 40241, 40244, 40249, 40251, 40257, 40260, 40262, 40264, 40270, 40273, 40274, 40275, 40276, 40294, 40323, 40326, 40353, 40356, 40371, 40372, 40373, 40374, 40377, 40401, 40404, 40406, 40417, 40418, 40426, 40427, 40430, 40432, 40440, 40445, 40446, 40450, 40465, 40467, 40468, 40470, 40472, 40474, 40479, 40481, 40482, 40484, 40488, 40493, 40499, 40510, 40513, 40514, 40516, 40519, 40524, 40525, 40529, 40531, 40539, 40545, 40546, 40551, 40553, 40557, 40561, 40564, 40575, 40579, 40586, 40594, 40596, 40599, 40600, 40607, 40609, 40614, 40625, 40630, 40633, 40653, 40654, 40655, 40657, 40660, 40673, 40678, 40679, 40685, 40691, 40698, 40699, 40706, 40708, 40712, 40715, 40716, 40719, 40753, 40769, 40770, 40785, 40807, 40811, 40814, 40835, 40861, 40886, 40897, 40898, 40929, 40935, 40989, 40993, 40994, 40996, 41019, 41023, 41027, 41031, 41083, 41087, 41099, 41100, 41107, 41139, 41150, 41155, 41156, 41185, 41203, 41218, 41220, 41221, 41222, 41226, 41230, 41231, 41237, 41248, 41254, 41255, 41258, 41259, 41267, 41276, 41282, 41284, 41287, 41293, 41298, 41304, 41307, 41314, 41315, 41317, 41324, 41327, 41331, 41332, 41337, 41343, 41347, 41348, 41349, 41377, 41389, 41394, 41404, 41408, 41409, 41411, 41424, 41426, 41428, 41435, 41456, 41457, 41459, 41460, 41498, 41501, 41504, 41507, 41518, 41521, 41527, 41531, 41533, 41534, 41586, 41593, 41606, 41613, 41622, 41626, 41628, 41635, 41654, 41655, 41663, 41702, 41709, 41711, 41718, 41750, 41761, 41765, 41767, 41773, 41774, 41777, 41778, 41800, 41804, 41805, 41806, 41811, 41822, 41856, 41858, 41860, 41869, 41901, 41916, 41920, 41930, 41934, 42000, 42006, 42008, 42016, 42017, 42019, 42029, 42043, 42049, 42083, 42087, 42092, 42093, 42097, 42098, 42103, 42105, 42110, 42111, 42112, 42132, 42136, 42164, 42167, 42192, 42199, 42205, 42209, 42211, 42213, 42223, 42224, 42226, 42227, 42228, 42234, 42257, 42264, 42273, 42281, 42283, 42289, 42300, 42305, 42326, 42334, 42342, 42343, 42348, 42366, 42373, 42380, 42389, 42390, 42393, 42401, 42409, 42439, 42441, 42449, 42468, 42472, 42475, 42477, 42484, 42488, 42490, 42491, 42498, 42500, 42501, 42516, 42532, 42537, 42545, 42546, 42561, 42564, 42568, 42578, 42579, 42583, 42587, 42589, 42593, 42600, 42607, 42609, 42632, 42637, 42639, 42641, 42644, 42655, 42660, 42665, 42689, 42694, 42695, 42697, 42703, 42724, 42732, 42737, 42746, 42748, 42753, 42756, 42778, 42785, 42795, 42804, 42814, 42818, 42845, 42865, 42866, 42868, 42878, 42882, 42893, 42919, 42957, 42961, 42962, 42977, 42996, 43016, 43020, 43036, 43041, 43044, 43047, 43053, 43079, 43114, 43117, 43124, 43131, 43135, 43144, 43149, 43153, 43175, 43181, 43182, 43188, 43190, 43201, 43214, 43249, 43257, 43281, 43289, 43298, 43305, 43307, 43309, 43324, 43334, 43346, 43348, 43384, 43405, 43441, 43449, 43452, 43470, 43502, 43505, 43508, 43513, 43517, 43519, 43522, 43567, 43572, 43629, 43661, 43685, 43689, 43720, 43723, 43761, 43821, 43854, 43857, 43908, 43937, 43957, 43964, 43972, 44001, 44027, 44061, 44065, 44113, 44123, 44138, 44141, 44155, 44159, 44164, 44173, 44177, 44182, 44192, 44218, 44239, 44244, 44262, 44265, 44269, 44273, 44302, 44321, 44322, 44324, 44328, 44330, 44334, 44340, 44361, 44391, 44408, 44409, 44431, 44433, 44435, 44441, 44449, 44461, 44482, 44485, 44496, 44500, 44516, 44529, 44534, 44536, 44537, 44562, 44566, 44570, 44573, 44577, 44579, 44582, 44586, 44588, 44590, 44591, 44595, 44599, 44600, 44602, 44611, 44612, 44619, 44620, 44631, 44642, 44646, 44653, 44681, 44685, 44689, 44692, 44717, 44726, 44732, 44742, 44744, 44745, 44746, 44774, 44781, 44785, 44787, 44790, 44810, 44847, 44852, 44863, 44873, 44902, 44906, 44916, 44945, 44948, 44978, 44980, 44986, 45000, 45005, 45057, 45060, 45068, 45085, 45089, 45105, 45124, 45153, 45156, 45190, 45193, 45194, 45201, 45249, 45265, 45314, 45315, 45325, 45331, 45335, 45340, 45350, 45370, 45377, 45386, 45402, 45403, 45410, 45415, 45416, 45418, 45419, 45422, 45423, 45424, 45440, 45446, 45452, 45466, 45473, 45478, 45483, 45491, 45502, 45515, 45519, 45523, 45527, 45537, 45546, 45557, 45561, 45565, 45568, 45571, 45575, 45590, 45594, 45601, 45603, 45641, 45649, 45664, 45668, 45674, 45681, 45689, 45699, 45700, 45703, 45730, 45755, 45758, 45767, 45778, 45787, 45796, 45798, 45802, 45820, 45827, 45828, 45843, 45851, 45873, 45879, 45881, 45892, 45896, 45908, 45920, 45922, 45927, 45936, 45943, 45971, 45975, 45984, 46004, 46005, 46006, 46015, 46028, 46032, 46076, 46087, 46096, 46106, 46130, 46131, 46148, 46160, 46179, 46186, 46194, 46209, 46216, 46221, 46224, 46260, 46263, 46266, 46269, 46271, 46276, 46282, 46283, 46284, 46307, 46308, 46320, 46323, 46333, 46338, 46340, 46349, 46370, 46417, 46499, 46526, 46529, 46531, 46535, 46537, 46543, 46561, 46576, 46578, 46580, 46582, 46590, 46594, 46596, 46604, 46633, 46634, 46648, 46651, 46652, 46674, 46683, 46688, 46691, 46696, 46700, 46712, 46763, 46777, 46787, 46826, 46828, 46834, 46842, 46849, 46851, 46852, 46866, 46884, 46900, 46913, 46915, 46924, 46925, 46945, 46962, 46977, 46984, 46985, 46991, 46993, 47012, 47028, 47042, 47049, 47058, 47063, 47074, 47097, 47103, 47105, 47124, 47137, 47145, 47185, 47193, 47195, 47199, 47200, 47213, 47223, 47237, 47240, 47253, 47271, 47273, 47290, 47292, 47295, 47299, 47303, 47340, 47352, 47355, 47356, 47359, 47360, 47361, 47364, 47381, 47382, 47383, 47384, 47389, 47400, 47401, 47418, 47421, 47429, 47432, 47433, 47436, 47442, 47443, 47454, 47456, 47457, 47459, 47470, 47474, 47481, 47486, 47487, 47493, 47495, 47502, 47505, 47518, 47537, 47538, 47539, 47540, 47541, 47549, 47551, 47557, 47561, 47569, 47598, 47615, 47642, 47649, 47657, 47661, 47666, 47677, 47683, 47692, 47696, 47716, 47756, 47757, 47761, 47792, 47795, 47801, 47844, 47854, 47864, 47867, 47896, 47905, 47907, 47954, 47968, 47970, 47972, 47987, 47988, 48041, 48051, 48056, 48069, 48070, 48073, 48077, 48080, 48098, 48099, 48108, 48114, 48123, 48136, 48164, 48169, 48187, 48215, 48217, 48234, 48290, 48298, 48305, 48314, 48321, 48327, 48329, 48367, 48375, 48383, 48387, 48398, 48404, 48407, 48458, 48503, 48519, 48529, 48530, 48541, 48564, 48567, 48568, 48590, 48593, 48595, 48615, 48622, 48627, 48628, 48640, 48642, 48648, 48653, 48656, 48657, 48665, 48674, 48676, 48707, 48708, 48711, 48712, 48715, 48716, 48729, 48736, 48743, 48749, 48751, 48752, 48772, 48779, 48785, 48793, 48799, 48802, 48813, 48819, 48824, 48828, 48831, 48842, 48847, 48852, 48857, 48868, 48871, 48874, 48881, 48882, 48884, 48891, 48895, 48900, 48977, 48979, 49001, 49028, 49035, 49041, 49058, 49060, 49102, 49104, 49121, 49139, 49140, 49172, 49177, 49183, 49192, 49201, 49203, 49207, 49217, 49220, 49227, 49233, 49245, 49250, 49261, 49262, 49281, 49284, 49287, 49288, 49300, 49302, 49305, 49310, 49311, 49315, 49316, 49319, 49320, 49326, 49345, 49346, 49361, 49364, 49377, 49380, 49393, 49394, 49399, 49400, 49403, 49416, 49425, 49427, 49440, 49443, 49454, 49466, 49484, 49488, 49490, 49492, 49493, 49499, 49506, 49530, 49532, 49546, 49547, 49555, 49566, 49568, 49595, 49596, 49603, 49605, 49608, 49617, 49619, 49633, 49637, 49640, 49644, 49658, 49667, 49675, 49684, 49698, 49700, 49713, 49716, 49719, 49721, 49737, 49738, 49747, 49756, 49758, 49764, 49772, 49780, 49783, 49785, 49796, 49798, 49805, 49807, 49818, 49826, 49831, 49832, 49847, 49857, 49860, 49862, 49866, 49873, 49876, 49878, 49885, 49886, 49892, 49901, 49903, 49904, 49905, 49912, 49926, 49937, 49939, 49940, 49943, 49944, 49948, 49953, 49954, 49963, 49966, 49985, 49986, 49987, 49988, 49993, 49997, 50002, 50007, 50014, 50049, 50065, 50066, 50067, 50068, 50078, 50121, 50132, 50135, 50141, 50145, 50157, 50158, 50164, 50197, 50199, 50211, 50212, 50217, 50244, 50268, 50284, 50291, 50319, 50327, 50346, 50355, 50356, 50368, 50370, 50393, 50394, 50397, 50399, 50402, 50404, 50419, 50443, 50444, 50446, 50450, 50457, 50465, 50468, 50469, 50476, 50484, 50486, 50491, 50511, 50512, 50513, 50519, 50521, 50531, 50534, 50540, 50561, 50564, 50569, 50577, 50588, 50590, 50593, 50601, 50605, 50609, 50612, 50618, 50621, 50622, 50636, 50641, 50646, 50665, 50666, 50667, 50686, 50689, 50692, 50694, 50698, 50699, 50701, 50703, 50713, 50726, 50729, 50733, 50753, 50768, 50775, 50776, 50778, 50783, 50786, 50791, 50792, 50800, 50822, 50826, 50827, 50841, 50845, 50854, 50855, 50892, 50922, 50923, 50961, 50963, 50977, 51010, 51011, 51016, 51028, 51041, 51042, 51079, 51092, 51105, 51106, 51124, 51126, 51139, 51144, 51146, 51151, 51153, 51156, 51165, 51171, 51185, 51188, 51192, 51194, 51201, 51211, 51218, 51222, 51224, 51225, 51228, 51233, 51245, 51257, 51281, 51283, 51286, 51293, 51294, 51295, 51297, 51345, 51347, 51362, 51372, 51375, 51409, 51412, 51420, 51455, 51457, 51460, 51473, 51474, 51479, 51489, 51496, 51519, 51521, 51540, 51550, 51559, 51581, 51583, 51585, 51593, 51602, 51607, 51609, 51613, 51618, 51619, 51627, 51644, 51657, 51682, 51705, 51711, 51747, 51748, 51752, 51753, 51755, 51756, 51761, 51779, 51784, 51786, 51790, 51793, 51800, 51802, 51821, 51840, 51841, 51846, 51848, 51854, 51869, 51880, 51889, 51899, 51905, 51910, 51913, 51914, 51945, 51948, 51988, 51996, 52002, 52003, 52009, 52020, 52049, 52050, 52051, 52061, 52066, 52071, 52096, 52115, 52129, 52130, 52132, 52145, 52170, 52177, 52212, 52225, 52252, 52257, 52260, 52265, 52271, 52289, 52311, 52312, 52314, 52321, 52328, 52356, 52369, 52390, 52397, 52417, 52420, 52433, 52436, 52439, 52445, 52475, 52508, 52518, 52520, 52522, 52529, 52552, 52556, 52573, 52593, 52602, 52606, 52613, 52619, 52632, 52641, 52643, 52659, 52660, 52674, 52677, 52690, 52705, 52708, 52717, 52724, 52730, 52737, 52745, 52753, 52758, 52759, 52767, 52782, 52783, 52788, 52803, 52822, 52829, 52836, 52837, 52838, 52843, 52847, 52859, 52865, 52867, 52870, 52893, 52895, 52900, 52907, 52910, 52911, 52914, 52924, 52929, 52938, 52939, 52943, 52948, 52952, 52959, 52961, 52964, 52971, 52986, 52991, 52993, 53000, 53004, 53012, 53033, 53041, 53044, 53060, 53076, 53079, 53089, 53090, 53096, 53124, 53135, 53137, 53150, 53169, 53172, 53181, 53191, 53201, 53204, 53207, 53212, 53222, 53224, 53234, 53242, 53266, 53273, 53278, 53281, 53282, 53284, 53288, 53289, 53291, 53292, 53295, 53303, 53315, 53321, 53361, 53367, 53369, 53377, 53384, 53400, 53401, 53404, 53406, 53423, 53425, 53428, 53432, 53433, 53434, 53435, 53441, 53444, 53457, 53459, 53470, 53473, 53476, 53490, 53496, 53503, 53506, 53508, 53519, 53524, 53527, 53528, 53532, 53540, 53544, 53553, 53561, 53564, 53569, 53587, 53588, 53591, 53594, 53596, 53599, 53601, 53607, 53610, 53613, 53624, 53626, 53631, 53632, 53634, 53639, 53641, 53649, 53661, 53666, 53672, 53675, 53684, 53686, 53688, 53691, 53695, 53696, 53699, 53704, 53716, 53720, 53729, 53730, 53735, 53740, 53741, 53746, 53748, 53755, 53757, 53758, 53762, 53767, 53772, 53785, 53786, 53803, 53812, 53834, 53835, 53837, 53839, 53881, 53910, 53916, 53921, 53953, 53979, 53981, 54006, 54028, 54033, 54036, 54050, 54068, 54073, 54078, 54084, 54132, 54153, 54193, 54212, 54218, 54241, 54260, 54267, 54270, 54279, 54284, 54289, 54300, 54303, 54315, 54318, 54323, 54335, 54337, 54344, 54359, 54366, 54370, 54372, 54376, 54386, 54387, 54401, 54403, 54408, 54410, 54423, 54428, 54429, 54430, 54444, 54449, 54456, 54459, 54463, 54468, 54472, 54475, 54492, 54493, 54512, 54516, 54525, 54540, 54543, 54549, 54552, 54554, 54557, 54561, 54563, 54566, 54568, 54572, 54573, 54575, 54577, 54593, 54596, 54601, 54603, 54605, 54607, 54609, 54619, 54633, 54641, 54660, 54677, 54689, 54697, 54700, 54705, 54713, 54729, 54741, 54768, 54792, 54795, 54796, 54799, 54824, 54827, 54828, 54838, 54849, 54850, 54852, 54859, 54883, 54888, 54889, 54892, 54893, 54905, 54913, 54916, 54925, 54929, 54932, 54937, 54941, 54943, 54955, 54956, 54966, 54969, 54970, 54979, 54980, 54983, 54988, 54991, 55005, 55010, 55012, 55016, 55018, 55020, 55025, 55026, 55030, 55031, 55032, 55035, 55038, 55052, 55058, 55060, 55061, 55073, 55105, 55115, 55153, 55156, 55171, 55177, 55201, 55249, 55297, 55306, 55315, 55325, 55329, 55331, 55339, 55348, 55362, 55367, 55373, 55375, 55392, 55393, 55396, 55399, 55441, 55445, 55456, 55458, 55473, 55496, 55505, 55513, 55521, 55523, 55537, 55542, 55547, 55556, 55569, 55581, 55585, 55590, 55592, 55593, 55594, 55599, 55605, 55613, 55626, 55633, 55634, 55666, 55673, 55676, 55678, 55684, 55688, 55692, 55694, 55697, 55709, 55718, 55720, 55723, 55726, 55729, 55732, 55738, 55749, 55750, 55761, 55774, 55777, 55794, 55801, 55818, 55852, 55873, 55887, 55921, 55962, 55970, 55978, 55980, 55981, 55985, 55986, 56007, 56015, 56016, 56020, 56041, 56042, 56046, 56049, 56065, 56072, 56083, 56084, 56105, 56113, 56116, 56117, 56125, 56164, 56180, 56193, 56194, 56209, 56211, 56212, 56243, 56263, 56276, 56279, 56289, 56308, 56315, 56318, 56331, 56334, 56335, 56340, 56372, 56381, 56386, 56388, 56423, 56429, 56433, 56465, 56504, 56505, 56545, 56593, 56599, 56609, 56610, 56614, 56616, 56621, 56622, 56625, 56630, 56641, 56653, 56659, 56663, 56685, 56704, 56740, 56749, 56768, 56771, 56774, 56780, 56788, 56819, 56820, 56835, 56838, 56839, 56841, 56849, 56852, 56857, 56858, 56868, 56887, 56893, 56910, 56914, 56918, 56926, 56930, 56933, 56937, 56953, 56958, 56974, 56977, 56982, 56988, 56989, 57017, 57026, 57027, 57030, 57046, 57049, 57052, 57054, 57074, 57082, 57085, 57096, 57140, 57154, 57169, 57209, 57233, 57255, 57305, 57329, 57334, 57361, 57364, 57373, 57377, 57380, 57386, 57409, 57418, 57423, 57425, 57428, 57444, 57449, 57473, 57476, 57489, 57491, 57492, 57494, 57497, 57501, 57503, 57507, 57529, 57553, 57556, 57564, 57567, 57569, 57570, 57571, 57572, 57585, 57586, 57603, 57604, 57619, 57625, 57628, 57633, 57635, 57640, 57641, 57643, 57647, 57649, 57656, 57660, 57663, 57665, 57671, 57674, 57682, 57690, 57693, 57697, 57708, 57709, 57729, 57730, 57732, 57735, 57736, 57738, 57739, 57744, 57745, 57746, 57758, 57760, 57764, 57771, 57773, 57775, 57779, 57782, 57783, 57784, 57785, 57787, 57791, 57792, 57796, 57800, 57803, 57805, 57809, 57810, 57812, 57819, 57826, 57828, 57829, 57830, 57831, 57832, 57834, 57839, 57841, 57846, 57847, 57850, 57863, 57866, 57867, 57871, 57873, 57885, 57892, 57902, 57908, 57913, 57921, 57934, 57967, 57974, 57984, 57985, 57987, 57991, 57993, 57994, 57995, 57996, 57999, 58001, 58012, 58015, 58017, 58020, 58033, 58038, 58039, 58049, 58052, 58055, 58056, 58059, 58062, 58063, 58081, 58088, 58097, 58103, 58106, 58111, 58114, 58122, 58129, 58131, 58135, 58136, 58148, 58158, 58161, 58179, 58183, 58209, 58249, 58253, 58257, 58258, 58266, 58268, 58295, 58307, 58318, 58319, 58321, 58322, 58323, 58330, 58332, 58337, 58344, 58351, 58359, 58362, 58370, 58374, 58378, 58379, 58381, 58383, 58391, 58392, 58394, 58396, 58402, 58404, 58407, 58418, 58420, 58428, 58431, 58453, 58457, 58463, 58465, 58474, 58484, 58485, 58489, 58496, 58498, 58500, 58508, 58511, 58512, 58518, 58519, 58522, 58524, 58526, 58529, 58530, 58535, 58545, 58547, 58550, 58551, 58555, 58556, 58559, 58561, 58564, 58569, 58571, 58577, 58578, 58581, 58584, 58592, 58593, 58595, 58596, 58608, 58610, 58611, 58612, 58615, 58618, 58625, 58628, 58637, 58638, 58639, 58657, 58659, 58663, 58665, 58673, 58681, 58705, 58711, 58713, 58726, 58745, 58758, 58761, 58769, 58773, 58781, 58782, 58784, 58803, 58822, 58833, 58841, 58854, 58860, 58872, 58876, 58881, 58884, 58886, 58890, 58892, 58893, 58895, 58899, 58908, 58912, 58919, 58925, 58932, 58937, 58944, 58947, 58963, 58968, 58971, 58972, 58975, 58977, 58983, 58984, 58993, 59003, 59004, 59011, 59016, 59020, 59028, 59033, 59043, 59044, 59047, 59060, 59063, 59069, 59070, 59073, 59075, 59076, 59085, 59087, 59105, 59108, 59110, 59118, 59127, 59134, 59137, 59138, 59139, 59146, 59153, 59158, 59159, 59175, 59180, 59196, 59207, 59219, 59233, 59249, 59277, 59281, 59304, 59305, 59309, 59315, 59318, 59340, 59345, 59347, 59350, 59353, 59369, 59373, 59375, 59383, 59393, 59396, 59410, 59414, 59425, 59426, 59431, 59441, 59458, 59459, 59475, 59479, 59482, 59483, 59487, 59505, 59524, 59553, 59554, 59568, 59575, 59586, 59587, 59588, 59591, 59596, 59597, 59617, 59642, 59646, 59647, 59649, 59652, 59655, 59656, 59666, 59680, 59682, 59685, 59688, 59689, 59691, 59694, 59695, 59713, 59716, 59724, 59725, 59729, 59730, 59731, 59732, 59735, 59736, 59737, 59739, 59740, 59777, 59789, 59793, 59805, 59808, 59811, 59812, 59823, 59826, 59830, 59834, 59836, 59837, 59842, 59844, 59846, 59848, 59850, 59869, 59884, 59889, 59897, 59898, 59908, 59913, 59919, 59932, 59936, 59937, 59939, 59944, 59950, 59956, 59960, 59971, 59986, 59994, 59995, 60025, 60027, 60033, 60035, 60039, 60044, 60052, 60065, 60066, 60068, 60073, 60079, 60080, 60081, 60090, 60092, 60093, 60094, 60099, 60111, 60113, 60129, 60134, 60138, 60141, 60143, 60145, 60148, 60154, 60155, 60171, 60178, 60193, 60195, 60196, 60198, 60199, 60200, 60204, 60205, 60213, 60216, 60226, 60231, 60241, 60242, 60243, 60244, 60263, 60289, 60295, 60301, 60321, 60324, 60327, 60328, 60330, 60353, 60354, 60356, 60376, 60380, 60385, 60401, 60417, 60420, 60424, 60426, 60427, 60428, 60433, 60438, 60442, 60450, 60454, 60455, 60459, 60463, 60465, 60475, 60481, 60483, 60484, 60497, 60500, 60505, 60506, 60547, 60555, 60561, 60564, 60569, 60574, 60593, 60601, 60602, 60615, 60622, 60624, 60646, 60660, 60705, 60707, 60712, 60714, 60716, 60721, 60737, 60738, 60739, 60745, 60748, 60757, 60766, 60801, 60804, 60807, 60808, 60811, 60819, 60825, 60836, 60840, 60842, 60849, 60856, 60859, 60877, 60884, 60890, 60908, 60909, 60910, 60925, 60926, 60929, 60934, 60937, 60938, 60942, 60943, 60946, 60948, 60953, 60959, 60964, 60968, 60969, 60970, 60972, 60973, 60993, 60994, 60995, 60996, 60999, 61002, 61004, 61006, 61014, 61016, 61018, 61021, 61041, 61044, 61047, 61050, 61057, 61059, 61067, 61069, 61071, 61073, 61083, 61092, 61105, 61108, 61111, 61116, 61125, 61126, 61127, 61128, 61134, 61135, 61138, 61140, 61141, 61147, 61148, 61150, 61156, 61160, 61172, 61175, 61181, 61182, 61186, 61188, 61192, 61195, 61196, 61212, 61219, 61225, 61233, 61255, 61257, 61265, 61266, 61268, 61282, 61290, 61308, 61322, 61335, 61337, 61341, 61362, 61381, 61382, 61385, 61386, 61387, 61389, 61393, 61409, 61414, 61419, 61433, 61452, 61459, 61473, 61481, 61492, 61505, 61513, 61515, 61519, 61539, 61581, 61587, 61651, 61704, 61708, 61709, 61719, 61735, 61747, 61759, 61764, 61778, 61779, 61802, 61808, 61823, 61827, 61836, 61848, 61855, 61872, 61875, 61882, 61892, 61898, 61900, 61908, 61927, 61938, 61939, 61952, 61956, 61957, 61963, 61969, 61973, 61975, 61977, 61978, 61981, 61983, 62018, 62020, 62049, 62052, 62088, 62094, 62097, 62100, 62129, 62132, 62135, 62151, 62161, 62163, 62165, 62169, 62173, 62182, 62186, 62188, 62211, 62229, 62239, 62241, 62247, 62273, 62274, 62275, 62276, 62287, 62290, 62292, 62311, 62343, 62350, 62368, 62389, 62392, 62396, 62399, 62409, 62417, 62451, 62464, 62471, 62479, 62482, 62484, 62491, 62503, 62564, 62570, 62579, 62598, 62626, 62647, 62660, 62668, 62689, 62716, 62721, 62734, 62744, 62748, 62751, 62755, 62788, 62794, 62795, 62798, 62801, 62819, 62836, 62849, 62852, 62854, 62858, 62859, 62868, 62896, 62903, 62907, 62913, 62915, 62917, 62922, 62927, 62929, 62960, 62966, 62980, 62991, 63000, 63014, 63049, 63052, 63055, 63056, 63059, 63076, 63079, 63080, 63096, 63111, 63116, 63137, 63144, 63148, 63164, 63179, 63180, 63184, 63222, 63224, 63235, 63263, 63304, 63335, 63360, 63411, 63412, 63414, 63447, 63454, 63458, 63512, 63516, 63518, 63521, 63538, 63553, 63564, 63566, 63587, 63588, 63597, 63602, 63616, 63621, 63625, 63665, 63668, 63671, 63676, 63680, 63682, 63685, 63687, 63689, 63701, 63712, 63713, 63721, 63726, 63740, 63748, 63762, 63765, 63766, 63781, 63783, 63802, 63807, 63809, 63816, 63818, 63842, 63858, 63863, 63876, 63877, 63882, 63885, 63908, 63922, 63941, 63943, 63953, 63969, 63970, 63987, 64015, 64017, 64028, 64042, 64073, 64083, 64089, 64097, 64098, 64103, 64105, 64110, 64141, 64153, 64156, 64164, 64182, 64190, 64196, 64198, 64225, 64252, 64274, 64276, 64280, 64282, 64284, 64308, 64332, 64337, 64338, 64343, 64354, 64356, 64361, 64372, 64386, 64465, 64468, 64474, 64476, 64488, 64511, 64520, 64529, 64532, 64548, 64551, 64585, 64590, 64594, 64599, 64610, 64611, 64612, 64616, 64628, 64657, 64675, 64679, 64689, 64690, 64695, 64696, 64700, 64713, 64715, 64724, 64737, 64745, 64752, 64754, 64755, 64756, 64760, 64763, 64784, 64786, 64787, 64788, 64792, 64793, 64796, 64799, 64809, 64833, 64844, 64855, 64867, 64887, 64902, 64903, 64907, 64909, 64910, 64912, 64931, 64932, 64944, 64949, 64958, 64962, 64970, 64973, 64974, 64975, 64978, 64995, 65011, 65028, 65040, 65053, 65055, 65064, 65089, 65092, 65107, 65109, 65111, 65123, 65125, 65153, 65183, 65187, 65189, 65199, 65220, 65232, 65240, 65244, 65256, 65260, 65272, 65274, 65276, 65298, 65307, 65345, 65352, 65356, 65364, 65377, 65380, 65383, 65412, 65414, 65419, 65444, 65447, 65457, 65474, 65475, 65480, 65513], 30427: [32803, 32836, 32839, 32898, 32908, 32928, 33027, 33033, 33034, 33038, 33065, 33072, 33073, 33084, 33104, 33110, 33116, 33123, 33132, 33134, 26127, 33155, 33157, 33169, 33171, 33181, 33183, 33187, 33206, 33214, 33224, 33232, 33234, 33241, 33258, 58714, 33266, 33272, 33274, 33278, 33300, 33304, 33307, 33323, 33331, 37797, 33409, 33418, 33432, 33443, 33480, 33502, 33507, 33511, 33514, 33538, 33566, 33572, 33577, 33620, 33629, 33630, 33646, 33670, 33672, 33718, 33730, 26265, 33844, 33847, 33869, 33879, 33886, 33892, 33901, 33909, 33911, 33920, 33934, 33935, 33949, 33955, 33974, 33978, 33980, 33983, 34000, 34022, 26305, 34171, 34172, 34182, 34186, 34188, 34198, 34208, 34234, 34235, 34249, 34314, 34317, 26366, 34363, 34392, 34396, 34412, 34460, 34494, 34533, 34555, 34561, 34596, 34601, 34603, 34623, 34642, 34673, 34688, 39466, 34752, 34762, 6910, 34785, 6914, 34828, 34833, 34846, 59032, 34882, 34891, 34899, 34925, 34945, 35010, 35016, 35028, 35071, 35097, 35102, 35106, 35111, 35115, 35116, 35128, 35138, 35144, 35148, 35151, 35152, 35175, 35185, 35190, 6995, 35223, 35224, 35232, 35240, 35259, 35261, 35269, 35272, 35294, 59129, 35373, 35395, 35436, 35456, 35459, 59154, 35475, 59156, 35491, 35495, 35497, 35505, 39625, 35527, 35534, 39632, 35618, 35625, 35629, 35667, 7090, 60032, 35723, 35732, 35742, 39682, 39688, 35844, 35860, 35866, 35872, 35892, 35908, 35920, 35927, 35937, 35941, 35973, 35979, 35995, 36015, 36024, 36030, 36041, 36077, 36109, 26716, 36110, 36128, 36134, 36136, 26725, 26726, 36167, 36171, 59301, 36217, 36226, 36231, 36239, 59310, 36282, 36298, 36362, 36382, 36386, 36392, 36395, 36397, 36399, 36423, 36452, 36456, 36465, 36466, 36483, 36493, 36495, 36500, 36504, 36510, 59361, 36518, 36519, 36547, 36550, 36551, 36556, 36577, 36605, 36609, 36612, 36614, 36616, 36618, 36620, 36622, 59390, 36691, 59400, 36737, 26841, 36742, 36759, 36785, 36794, 36796, 36798, 36801, 36817, 36830, 4099, 36867, 4103, 4110, 36895, 4131, 4127, 4135, 36907, 36909, 4143, 36911, 4145, 4147, 4159, 36929, 4161, 26879, 4167, 36936, 36939, 4172, 36941, 4175, 36943, 4179, 36968, 4212, 36980, 36988, 4222, 4227, 36996, 4233, 37004, 39924, 37031, 4268, 37039, 4273, 4276, 4291, 4292, 4295, 37064, 4293, 37072, 4307, 37080, 37087, 4321, 37093, 37096, 37101, 37108, 4340, 4351, 4353, 4360, 37130, 4369, 37137, 37140, 37145, 4384, 37159, 37163, 4396, 37166, 4406, 37183, 4415, 37197, 37200, 37203, 37209, 37210, 37217, 4454, 37227, 4474, 37243, 4477, 37247, 37248, 37249, 37251, 37255, 37258, 4490, 4492, 37265, 37273, 4507, 37279, 37291, 37294, 4529, 37300, 37302, 4537, 4541, 37319, 37324, 4548, 4559, 37329, 7420, 4567, 37340, 4572, 37343, 37350, 37353, 4586, 37356, 24930, 37363, 4598, 37366, 4600, 37368, 37374, 37370, 4635, 4639, 37410, 4636, 37408, 37414, 37411, 37419, 4653, 4651, 37421, 24933, 4672, 37442, 37440, 4683, 4684, 37455, 37456, 4694, 37465, 4710, 37481, 4714, 37495, 4750, 4760, 4762, 37531, 4765, 4766, 37530, 4771, 37541, 37552, 4786, 4784, 4795, 37567, 37569, 4809, 4811, 37582, 4827, 4831, 37598, 37603, 4835, 4839, 4843, 4846, 37619, 4847, 37625, 37629, 4870, 4881, 37666, 37674, 4928, 37712, 4945, 4961, 37738, 4974, 4993, 37761, 37770, 5002, 37782, 37814, 37821, 37822, 5060, 37841, 37846, 5091, 37862, 37881, 37892, 37900, 5136, 37910, 5142, 37913, 5146, 37918, 37920, 59640, 37926, 37927, 37928, 37930, 37942, 37945, 37947, 37950, 5182, 37953, 37969, 5206, 37975, 37977, 37981, 5213, 7550, 5222, 37990, 37991, 37992, 37994, 37998, 5230, 59657, 5240, 38007, 38011, 38013, 5246, 38017, 5249, 38019, 5254, 38024, 38022, 38027, 5255, 5259, 5268, 38028, 38038, 38036, 38041, 38042, 5274, 38045, 38046, 5280, 38048, 38056, 38062, 38065, 38070, 38071, 5302, 38075, 38074, 38078, 38081, 5312, 38086, 38090, 5326, 5338, 38110, 38112, 38113, 5345, 38123, 38130, 38126, 38134, 38142, 5377, 38145, 5382, 38151, 5388, 5390, 38157, 5399, 38176, 5410, 38180, 5413, 5416, 38186, 38188, 5422, 5423, 38191, 5443, 38211, 38215, 5447, 38223, 5455, 5456, 38227, 38224, 38230, 5462, 5467, 38236, 38232, 38246, 38253, 38258, 5509, 5519, 38289, 38306, 5541, 38317, 5551, 38321, 5558, 5595, 5598, 5601, 38370, 5607, 5608, 5611, 5617, 38390, 38395, 5630, 38401, 38399, 38406, 5638, 38410, 5642, 5646, 38414, 38425, 38444, 5676, 38445, 38452, 38466, 59749, 38479, 38481, 5713, 38482, 5717, 38480, 5720, 5721, 38489, 5723, 38491, 5727, 38492, 38502, 5741, 38513, 5748, 5755, 5759, 38527, 38529, 5763, 38531, 38533, 38534, 38536, 5773, 38540, 5775, 38556, 38561, 38573, 5806, 38574, 38578, 5807, 5817, 38593, 5827, 38595, 5838, 38615, 5855, 38623, 38619, 5859, 5868, 5872, 38640, 5875, 38643, 5880, 38650, 5885, 38653, 38674, 5904, 5906, 5921, 38692, 5940, 5954, 38720, 5952, 5967, 38735, 5971, 38739, 5998, 6013, 6049, 38828, 6073, 38841, 6084, 6088, 38860, 6097, 6113, 6115, 6119, 59835, 6153, 6157, 6156, 6159, 38947, 6177, 38949, 6183, 6187, 38955, 38957, 6191, 6193, 6205, 6219, 38989, 38992, 38995, 6230, 39003, 6246, 6250, 39021, 39047, 6282, 6295, 39065, 39069, 39071, 39073, 39078, 39082, 6320, 39102, 39109, 39110, 6346, 39114, 59877, 39117, 39120, 6352, 6369, 39142, 39153, 39155, 6387, 6393, 39166, 6401, 39172, 27328, 39201, 39203, 6439, 39207, 39208, 6442, 39211, 39209, 6448, 39222, 6466, 6472, 39243, 39244, 6484, 6497, 39273, 59912, 39303, 6539, 39310, 6550, 6553, 39325, 6558, 20842, 6575, 39342, 39346, 6584, 39355, 39357, 6591, 6592, 39360, 39358, 6598, 39369, 6594, 39376, 6609, 6612, 39382, 39393, 39396, 6631, 6645, 39413, 39418, 39417, 39423, 6667, 6670, 39445, 53431, 39453, 39457, 6690, 6689, 39464, 39463, 6699, 39468, 39473, 39472, 6704, 6717, 39485, 39503, 39505, 6745, 6744, 6747, 39515, 39525, 6774, 6778, 39553, 6787, 39556, 39558, 39564, 6801, 6806, 6816, 25019, 39590, 6833, 39609, 39611, 6845, 39614, 39616, 6852, 39627, 6863, 39633, 6864, 39659, 39664, 39670, 39684, 6916, 6919, 39693, 6925, 39692, 39702, 39712, 6951, 39729, 39734, 39737, 6977, 6982, 6983, 39759, 39760, 7014, 7040, 7049, 39817, 39837, 39841, 7078, 7082, 39851, 39855, 39870, 39874, 7110, 39882, 7116, 7121, 39889, 39895, 7129, 39902, 39907, 7147, 7149, 7153, 27473, 7158, 39926, 39929, 39931, 39942, 7181, 39969, 7203, 39971, 39975, 7207, 39997, 7229, 40016, 7249, 40027, 7261, 40031, 7266, 7270, 40042, 7274, 40046, 7299, 40071, 7303, 40078, 7312, 7321, 40094, 40097, 7337, 40155, 40157, 7393, 60089, 40184, 40185, 40186, 7418, 7431, 7432, 7447, 7463, 7464, 7467, 7471, 40246, 7478, 7482, 40254, 40263, 7495, 7507, 7508, 40279, 40281, 40282, 40283, 40291, 40289, 40302, 7542, 7553, 60116, 40329, 40334, 40336, 7575, 7584, 40358, 40366, 40368, 40375, 40376, 40378, 40380, 40385, 7618, 40382, 40393, 7633, 7652, 40425, 7671, 40438, 7675, 40443, 40447, 40449, 40454, 40461, 7694, 40469, 60147, 7721, 7722, 60151, 40497, 40500, 40504, 7737, 40507, 40509, 7743, 7742, 40511, 7746, 40520, 40522, 7754, 40528, 7766, 7782, 40550, 40549, 40554, 40558, 7790, 7798, 40569, 40574, 7807, 40578, 7814, 40582, 40583, 7818, 7821, 7823, 40591, 40593, 40595, 40602, 40604, 40605, 7836, 40611, 7843, 7846, 40627, 7862, 40637, 7870, 40641, 40644, 40647, 7880, 40649, 7893, 7899, 40667, 40669, 40670, 7902, 7910, 40681, 40683, 7917, 7914, 40688, 7920, 7942, 7950, 40721, 7969, 40738, 40739, 40740, 7972, 40737, 40743, 40771, 8019, 40788, 40790, 40795, 40801, 40820, 8065, 8068, 8078, 40849, 8083, 40862, 40867, 8122, 8131, 40913, 8145, 40925, 8163, 40932, 8177, 40963, 8195, 40967, 8198, 8202, 8200, 40995, 41000, 8232, 41003, 41004, 8236, 41009, 8247, 8251, 8271, 41041, 41089, 41091, 8325, 41095, 8344, 8347, 41123, 41127, 41128, 41132, 41138, 41140, 8373, 41160, 41163, 8408, 41187, 41191, 8431, 8433, 8435, 8440, 8456, 41225, 8457, 8462, 8463, 41241, 27736, 8485, 8491, 41262, 41297, 41302, 8538, 41308, 8541, 41310, 41321, 8566, 27754, 8568, 8573, 8576, 41350, 41355, 41361, 41364, 41369, 8643, 41415, 8691, 41485, 8736, 8784, 8792, 8793, 8796, 41587, 8835, 8853, 8871, 8880, 41670, 41677, 60387, 8913, 41715, 41724, 60396, 41753, 41763, 9007, 9014, 9021, 9024, 41794, 9030, 41809, 9055, 60418, 9074, 9077, 9078, 60422, 41861, 9093, 41889, 41914, 9157, 41969, 41977, 9206, 41979, 41982, 9220, 9252, 9257, 42033, 21381, 42045, 42066, 9300, 9308, 42094, 9330, 9332, 42101, 9335, 9354, 42126, 42140, 9373, 9374, 42144, 42141, 9387, 42166, 42174, 42181, 42187, 9422, 42190, 40950, 9425, 9433, 9434, 9437, 42208, 42215, 42218, 9470, 42238, 9506, 60507, 42321, 42329, 42328, 42332, 42377, 42383, 42438, 42440, 42444, 42446, 42448, 42470, 42481, 42497, 42499, 42502, 42503, 42505, 42506, 42507, 42508, 42510, 9819, 60571, 9862, 42636, 42643, 42652, 9932, 42701, 42721, 42733, 9968, 42740, 9990, 42759, 9991, 42769, 42770, 10005, 42774, 10012, 42787, 42789, 42791, 10048, 10060, 10067, 10070, 42850, 42851, 10101, 10111, 42883, 10117, 42900, 10147, 42915, 10150, 10149, 10156, 10160, 10204, 42974, 10206, 10208, 10229, 10248, 10253, 10257, 43037, 10320, 43089, 10334, 28104, 43105, 10341, 60678, 10421, 43195, 43220, 10474, 43254, 43299, 43308, 43313, 43321, 43332, 43374, 43377, 43385, 21650, 43395, 43399, 43409, 43430, 43463, 43473, 43492, 43523, 10755, 43526, 10758, 43530, 43532, 43533, 43534, 10765, 43555, 28199, 60765, 43601, 43609, 21694, 10861, 10871, 43647, 43654, 10886, 43665, 10906, 10913, 43687, 10926, 10950, 10973, 43745, 10990, 43769, 43780, 43782, 43798, 11078, 11088, 43858, 43860, 43859, 43873, 28258, 11138, 11146, 43914, 43921, 43940, 11186, 11195, 43969, 11202, 11205, 11210, 43992, 11234, 11287, 44069, 11307, 44079, 28299, 28302, 11349, 11351, 11360, 11361, 44133, 44134, 11365, 44139, 11375, 11397, 44168, 44169, 44212, 11453, 28329, 11461, 44230, 44238, 28335, 11494, 11500, 11515, 11530, 44312, 11565, 44339, 28352, 44354, 44356, 60921, 44371, 11604, 44375, 44381, 44397, 11641, 11648, 11664, 11667, 44451, 44481, 11757, 44531, 44532, 44538, 44539, 28397, 44574, 11811, 44587, 44589, 44593, 44594, 44601, 44605, 44627, 11861, 11862, 44669, 44678, 25222, 44710, 60992, 44731, 44748, 44751, 44754, 44767, 12002, 12016, 44797, 44802, 44814, 12042, 12069, 12075, 12115, 12117, 12124, 12130, 12160, 12168, 12178, 12213, 44993, 12229, 61045, 44999, 12233, 12236, 12263, 12270, 45041, 45042, 12272, 12281, 12289, 12291, 12295, 45064, 45062, 12302, 12306, 12321, 12327, 12357, 12371, 12375, 12386, 12388, 12403, 45184, 12418, 12420, 12421, 12428, 61088, 61094, 61100, 12503, 12539, 12545, 12549, 45324, 12557, 45330, 45329, 45327, 45343, 12577, 45344, 12583, 45351, 12597, 45375, 12610, 61123, 12621, 12624, 12625, 12630, 12638, 45425, 12661, 45434, 45443, 12680, 45448, 45457, 45463, 45464, 12704, 45494, 45496, 45498, 45500, 45504, 12736, 45508, 45511, 45516, 12752, 45529, 12762, 12767, 45556, 45560, 12795, 45602, 45647, 12883, 12910, 45687, 45702, 45744, 45756, 45773, 45783, 45785, 13014, 45804, 45811, 28645, 13059, 13063, 13070, 45865, 61223, 45900, 13138, 13139, 13143, 46035, 46070, 46072, 13313, 46098, 13330, 46105, 46113, 46116, 46119, 46144, 46154, 46199, 46208, 46211, 46215, 46222, 13469, 46243, 46247, 46250, 46256, 46257, 46267, 46268, 46265, 46270, 13510, 13515, 46287, 46288, 13520, 46291, 46285, 13528, 13533, 46304, 46310, 46311, 46318, 46316, 13555, 46326, 46328, 46330, 13571, 13593, 13607, 13619, 13641, 46419, 46423, 22262, 13712, 22264, 61347, 13744, 46512, 13753, 61353, 13772, 46562, 13817, 13824, 13827, 13830, 13832, 13829, 13835, 13836, 46602, 46630, 46638, 46659, 46663, 13903, 46672, 13904, 13909, 54871, 13941, 13943, 13950, 46726, 14012, 14031, 14068, 14071, 46840, 46839, 14075, 14087, 14096, 14101, 46875, 46882, 46905, 46914, 46923, 14156, 46927, 14163, 46931, 46947, 46951, 14208, 46976, 14231, 47011, 47015, 14262, 47036, 47051, 47056, 14341, 14343, 14342, 47116, 15878, 14348, 47139, 47143, 47169, 47177, 14416, 14418, 14421, 14425, 14427, 47197, 14431, 47225, 14485, 47269, 47275, 47286, 47288, 47291, 47304, 47308, 47317, 14554, 14599, 14625, 47393, 14632, 14633, 47409, 47414, 47423, 14666, 14672, 14676, 14690, 14704, 47501, 14737, 47517, 47533, 47544, 47545, 47548, 14784, 14790, 47602, 47604, 47605, 47613, 14848, 14855, 47651, 47655, 47681, 47687, 47722, 47747, 47758, 47797, 47798, 47838, 47840, 47842, 15095, 47911, 47913, 47943, 48006, 48039, 15285, 48060, 48064, 48067, 15302, 48072, 48094, 15349, 48126, 15360, 15366, 15374, 15392, 48163, 48167, 15401, 48173, 15442, 48211, 15447, 15495, 48267, 48312, 48316, 48326, 15578, 48368, 15611, 15617, 48419, 15654, 15658, 48429, 15662, 48455, 15696, 48466, 15713, 48505, 48510, 48520, 48526, 48527, 15776, 15783, 15790, 48560, 48565, 48569, 48575, 48579, 48580, 48599, 48609, 15886, 15884, 48679, 48681, 48695, 15943, 15946, 48720, 48723, 15952, 48725, 48735, 15977, 48756, 16005, 16007, 16009, 48781, 16037, 16038, 16041, 16060, 48838, 48840, 16080, 16086, 16110, 48880, 16113, 48883, 48893, 16134, 48980, 49009, 16244, 16260, 49038, 16273, 49057, 16295, 16301, 49075, 16323, 16326, 16331, 49101, 16353, 16359, 16385, 16387, 16390, 16391, 16393, 16394, 16396, 16398, 16405, 16416, 49187, 49202, 16448, 16450, 16451, 49216, 16518, 49291, 49295, 49312, 49339, 16578, 16581, 16582, 16584, 16587, 16592, 16604, 16620, 16627, 16628, 16624, 16634, 49414, 16646, 49417, 16654, 16672, 49442, 49446, 49447, 49451, 49456, 49460, 16699, 49481, 49482, 49489, 49495, 16730, 49502, 16734, 49508, 49520, 16756, 49529, 16761, 16764, 49556, 49565, 49571, 49575, 49576, 49585, 49590, 49592, 49593, 49600, 49611, 49614, 49631, 16867, 49638, 49647, 49662, 49670, 49679, 49680, 49687, 49691, 49699, 49709, 49710, 16956, 49733, 16982, 49773, 49787, 17024, 49806, 17050, 49843, 49863, 49872, 17126, 49895, 49902, 17134, 17153, 49924, 17161, 17173, 17180, 49957, 49971, 17201, 49977, 17246, 50036, 55539, 17304, 50082, 17318, 17321, 17360, 17369, 17373, 17382, 17409, 17412, 50188, 50189, 17424, 50194, 50200, 17448, 50223, 17472, 50247, 17481, 50257, 17489, 50260, 50275, 50295, 17527, 17536, 50305, 50307, 50310, 50312, 50315, 50323, 50328, 50339, 17583, 17584, 50354, 50359, 17597, 50366, 50376, 50379, 17613, 50382, 50384, 50386, 50390, 50396, 50407, 17646, 50433, 50436, 17668, 50438, 17673, 17676, 17688, 17711, 17731, 17742, 17753, 50524, 50537, 50570, 50582, 17814, 50603, 50624, 50633, 17872, 50656, 50680, 17921, 17923, 50700, 17926, 17934, 17932, 50702, 17930, 17929, 50728, 17960, 17958, 50731, 17963, 17964, 50751, 18000, 50771, 18006, 18008, 18011, 50796, 50798, 50815, 50865, 50887, 50888, 18156, 18182, 18185, 18190, 18201, 18208, 50983, 18219, 18228, 51008, 18250, 51026, 18275, 51057, 51060, 18303, 18352, 51134, 51136, 51137, 18397, 18399, 18454, 51235, 18481, 18497, 51266, 51267, 51268, 51271, 51287, 51288, 51290, 51291, 51292, 51299, 51309, 51333, 51357, 51405, 51418, 18662, 51433, 18689, 51463, 51478, 51481, 51483, 51488, 51494, 51495, 18726, 51503, 51520, 51525, 51535, 51543, 18778, 51555, 18822, 18823, 51603, 51611, 51614, 51615, 51616, 51626, 51630, 51631, 18861, 51633, 51638, 18880, 51651, 51666, 51704, 18945, 18950, 18954, 18957, 51727, 51731, 18981, 51754, 18987, 19007, 19011, 51783, 51795, 51796, 19032, 19033, 19035, 51815, 19053, 19066, 19069, 19081, 19100, 19111, 51885, 19134, 51916, 19161, 51937, 19173, 19179, 19178, 51958, 19203, 19206, 52007, 19246, 19273, 19278, 52052, 19290, 52081, 19318, 19323, 52098, 52104, 19389, 52161, 19398, 52168, 52169, 52198, 52199, 52204, 52230, 52236, 52239, 52242, 19494, 19505, 52276, 19521, 52293, 19531, 52305, 52307, 19558, 19587, 52358, 52365, 52381, 19619, 52388, 19632, 52411, 19648, 19657, 52427, 52437, 52446, 52447, 52465, 19715, 19719, 19721, 19726, 52515, 19754, 52523, 52526, 52528, 52534, 52555, 52557, 52574, 52629, 52636, 19897, 52673, 52672, 19945, 19969, 52751, 20000, 52770, 20006, 52775, 52779, 52787, 20034, 52810, 20044, 52821, 52828, 52830, 20065, 52834, 52840, 52846, 52853, 52861, 52863, 20096, 52879, 52886, 52888, 52902, 52903, 52925, 20160, 52931, 20169, 20177, 52947, 52953, 52955, 20208, 52990, 52996, 52998, 20233, 20237, 20318, 20347, 20371, 20374, 53159, 20395, 53174, 53179, 53182, 53183, 20426, 53195, 20437, 20441, 20459, 20486, 20488, 20492, 53262, 20504, 53279, 53283, 53287, 20523, 53297, 20543, 53319, 53320, 53324, 53327, 53329, 53335, 53368, 53379, 53380, 20613, 20630, 20632, 20636, 20637, 53415, 20648, 20664, 53443, 53447, 53455, 20716, 53492, 53495, 53499, 20732, 53516, 53517, 53518, 20754, 20758, 20762, 20785, 20795, 53585, 20819, 20820, 53592, 20825, 20823, 20835, 20836, 53606, 20841, 20838, 20846, 20847, 53617, 20849, 53625, 53633, 20867, 53627, 20870, 20871, 20872, 20878, 20881, 53652, 20886, 20888, 20891, 53673, 20908, 20910, 20916, 20918, 53687, 53693, 20932, 20935, 20942, 20961, 20962, 53734, 20969, 53739, 20973, 20974, 20975, 53747, 20979, 20985, 53754, 53761, 53769, 21010, 21016, 21026, 21034, 53807, 21042, 53828, 21071, 21075, 53846, 21079, 53850, 53854, 53857, 26889, 21139, 21144, 21147, 53914, 21159, 53927, 53937, 21169, 53949, 21182, 53946, 53951, 21191, 21208, 21228, 21231, 54009, 54013, 21254, 21269, 21270, 54042, 54045, 54065, 54081, 21317, 54089, 21340, 54151, 21382, 54161, 21398, 21417, 7364, 54198, 54201, 21438, 54209, 21454, 21475, 21478, 21479, 21486, 54273, 54281, 54298, 21533, 54301, 21534, 21548, 21559, 54329, 54353, 21587, 21588, 21591, 21593, 54369, 21603, 21604, 21607, 21608, 21609, 21612, 54378, 54382, 54381, 21622, 21633, 21635, 54404, 21638, 21641, 54412, 21649, 54420, 21653, 54418, 21656, 21657, 21658, 54424, 21660, 21661, 21665, 21668, 21671, 54445, 21681, 21687, 21688, 21689, 21693, 21700, 21701, 54479, 54486, 21719, 54488, 21725, 21720, 54494, 21736, 21740, 21741, 21745, 21748, 54518, 21750, 21756, 54524, 21758, 54532, 54562, 54564, 54565, 21798, 21803, 21804, 21805, 21808, 54608, 54616, 54620, 21855, 21852, 21872, 54711, 54726, 21979, 54747, 21990, 54764, 21999, 54771, 54777, 54782, 54798, 22054, 22063, 22077, 22083, 22087, 22103, 54872, 54876, 54881, 22124, 22120, 22121, 22129, 54915, 54946, 54947, 22180, 22184, 54952, 22187, 22188, 54959, 54957, 54961, 22185, 22202, 54971, 22214, 22217, 22220, 22241, 55011, 22246, 55015, 22250, 22252, 22253, 22254, 55027, 55033, 55034, 36992, 22280, 22286, 22290, 22308, 55079, 22311, 55097, 55106, 22338, 55108, 55116, 55119, 22355, 22359, 22361, 22360, 22374, 22376, 22395, 22408, 22431, 55225, 22462, 55236, 22471, 55242, 22485, 55271, 22511, 22515, 22524, 22529, 22547, 55335, 22573, 55345, 55353, 37055, 22612, 55384, 22616, 55391, 22620, 55398, 22635, 22636, 22657, 22663, 22673, 22680, 55449, 22693, 55489, 22734, 22755, 22760, 22761, 22766, 55545, 55548, 22783, 22806, 22810, 22818, 55587, 55591, 22824, 55596, 55597, 55624, 55628, 22867, 22873, 22879, 22881, 22918, 55686, 22925, 55693, 55698, 22935, 22940, 22948, 55742, 55743, 55752, 55753, 22987, 55756, 55758, 55762, 55767, 55773, 23016, 23018, 23020, 55789, 23021, 55793, 55798, 55802, 55809, 23058, 23063, 23064, 23087, 55865, 55867, 55869, 55874, 23110, 55879, 55883, 23116, 23123, 23118, 23137, 23183, 23192, 23194, 23195, 23196, 23199, 55971, 23203, 55975, 23215, 23225, 55998, 23233, 56002, 56010, 56017, 23249, 56034, 23269, 23272, 23277, 23278, 23279, 56051, 23307, 56076, 23326, 23331, 23338, 23340, 23347, 56126, 23362, 23364, 56148, 4647, 23400, 23442, 23458, 23465, 56249, 56253, 56255, 23503, 23507, 23510, 23527, 23532, 23537, 23545, 56313, 23548, 56321, 23571, 23582, 23586, 56355, 56354, 23592, 23599, 56369, 23604, 56379, 23622, 56397, 23634, 56402, 23636, 23647, 23650, 23652, 23653, 23663, 56441, 56451, 56455, 23708, 23720, 23719, 56497, 23745, 23782, 23783, 23788, 23790, 56569, 56571, 56575, 56577, 56586, 56590, 23830, 23833, 56642, 23879, 23889, 23896, 23897, 23898, 23910, 23937, 23938, 23946, 56715, 56721, 23958, 23959, 23963, 56736, 23973, 23977, 56748, 56765, 24002, 56769, 24006, 24008, 24010, 56785, 56800, 56801, 24038, 24040, 24041, 24044, 56825, 56830, 56842, 56845, 56846, 24099, 24109, 24111, 56881, 56889, 56898, 56904, 24138, 4799, 24149, 24150, 56922, 56919, 56931, 24165, 24166, 24167, 56938, 24168, 24192, 56962, 24196, 56964, 56966, 56913, 56970, 24228, 24232, 24231, 57011, 57014, 57018, 57022, 57028, 24256, 24274, 24276, 24278, 24280, 24285, 24294, 24300, 57080, 56934, 24317, 57086, 24342, 57121, 24359, 57145, 24391, 24404, 24408, 24422, 24428, 57217, 57245, 57249, 57250, 24487, 24488, 24490, 57265, 24498, 57270, 57275, 57277, 57279, 57281, 57287, 24541, 24543, 57313, 24551, 24563, 57335, 57339, 57343, 24593, 24598, 24601, 24606, 57378, 24611, 24616, 57384, 24620, 57395, 24628, 24639, 24642, 24644, 57410, 57416, 24675, 24699, 24703, 24705, 24707, 24708, 57475, 24711, 24712, 57480, 24715, 24716, 57487, 24723, 57500, 24739, 24753, 24756, 24770, 24771, 24776, 57544, 24780, 24785, 57563, 24797, 24801, 24803, 57576, 24820, 57588, 57601, 57602, 24836, 57606, 57609, 24841, 57612, 57618, 24865, 24868, 57638, 24871, 24873, 24874, 57645, 24883, 57652, 24884, 24888, 57658, 57659, 57662, 57657, 24898, 24900, 57673, 24913, 24915, 57681, 57686, 24919, 24920, 24921, 57688, 24923, 24924, 24927, 24929, 57695, 57692, 24925, 24934, 24938, 24941, 24942, 57713, 57716, 24946, 24952, 57721, 57734, 57740, 24973, 57742, 24977, 24979, 57748, 57750, 24988, 57763, 24998, 57767, 25000, 57777, 57780, 57781, 25020, 57789, 25022, 57790, 57793, 57795, 57798, 25030, 57801, 57804, 57806, 25041, 25049, 57823, 57825, 25057, 25059, 25062, 57833, 57837, 25074, 25080, 57851, 57855, 57854, 25094, 57859, 57865, 57868, 57874, 25108, 57875, 57879, 57880, 57881, 57884, 25117, 57886, 25112, 57891, 25124, 57895, 25127, 25131, 25135, 25137, 57904, 25145, 57915, 25152, 25156, 57927, 25164, 25171, 57942, 57945, 57953, 57958, 57975, 25216, 25223, 25227, 25233, 58006, 25240, 58011, 25244, 25255, 25251, 58025, 58035, 25270, 25274, 25286, 58060, 58061, 58064, 25296, 58070, 58072, 58079, 25315, 58091, 25323, 58099, 25334, 58102, 58110, 58115, 25350, 58118, 58124, 58130, 25373, 25379, 25383, 25385, 58176, 25411, 58180, 58178, 58185, 25418, 25415, 25427, 58195, 58198, 25454, 37626, 25477, 25482, 25491, 25492, 58270, 25505, 58285, 58289, 25522, 58291, 58303, 58305, 58311, 25541, 25553, 58324, 25571, 58342, 25575, 25593, 25604, 25603, 25606, 58377, 25612, 25620, 58388, 25622, 25625, 58397, 58398, 25633, 25639, 58409, 25641, 58417, 25649, 25651, 58422, 25655, 58427, 58433, 58430, 58429, 58442, 25683, 58454, 58459, 58458, 58461, 25686, 25690, 25699, 25700, 58470, 25702, 25704, 58473, 25710, 58478, 58481, 58487, 58491, 58497, 25734, 25735, 58502, 25738, 58507, 25737, 25743, 58504, 58513, 58516, 58521, 58525, 25758, 25756, 58528, 58527, 58532, 25764, 58538, 25777, 25779, 58546, 25782, 25786, 25787, 58558, 25791, 25793, 25795, 25788, 25798, 25799, 58567, 25801, 25804, 58574, 58575, 58582, 25814, 25818, 58588, 58590, 25822, 25829, 25837, 25838, 58606, 58609, 25844, 25846, 25843, 58616, 58619, 58632, 58635, 58636, 25874, 25892, 25901, 25903, 58671, 25904, 25915, 58691, 58695, 25928, 25937, 58706, 25939, 25940, 58707, 25944, 25945, 25947, 25948, 25961, 26004, 26007, 26008, 26009, 26012, 58788, 26022, 58800, 58807, 26038, 26043, 58810, 58825, 58829, 58830, 58832, 26075, 26089, 26092, 26093, 26098, 26113, 26114, 26116, 26120, 26118, 26122, 26126, 58894, 26124, 26125, 26130, 58916, 26148, 58920, 58922, 26156, 58918, 58927, 26164, 26166, 26180, 58948, 26189, 26191, 58959, 26193, 26194, 58964, 26196, 26200, 26202, 26201, 26204, 58967, 26209, 26228, 26239, 59009, 59012, 26246, 59014, 26248, 59019, 26252, 26255, 26260, 26268, 59036, 59042, 26279, 59059, 59066, 59068, 59065, 59077, 59080, 59081, 59084, 26317, 26321, 59112, 59120, 26356, 59123, 59119, 59130, 26363, 26360, 26386, 26392, 59161, 59162, 26397, 59164, 26403, 59171, 26407, 26411, 59185, 59193, 59201, 59202, 26435, 59204, 26433, 26439, 59208, 26440, 26443, 5256, 26451, 26455, 26471, 26481, 59258, 59267, 59273, 59286, 26526, 26530, 26532, 59307, 59329, 59335, 26569, 59342, 59343, 59344, 59359, 26596, 26595, 26599, 59378, 26617, 26622, 59401, 59404, 59403, 59407, 59418, 59427, 59437, 59473, 26706, 26707, 26708, 26711, 59480, 26712, 26714, 26721, 59489, 26723, 26730, 26734, 59521, 26753, 26754, 26769, 26774, 26776, 26780, 26785, 26786, 26790, 26795, 26797, 26794, 59569, 59585, 26822, 59590, 26826, 26828, 59594, 26830, 26849, 26852, 59635, 26870, 59636, 59638, 59641, 26881, 26888, 26892, 59660, 59659, 59663, 26897, 59665, 26900, 59669, 59673, 26909, 26914, 59683, 26921, 26923, 59693, 26927, 26928, 59697, 26929, 26932, 26933, 59704, 59705, 26943, 26948, 26956, 59743, 26977, 59757, 59758, 26992, 59761, 59769, 27017, 27021, 27022, 59790, 27025, 27028, 27030, 27029, 27033, 59809, 27044, 59814, 27046, 27054, 27050, 59825, 59833, 27065, 27069, 27067, 27078, 59853, 59854, 27086, 27089, 59862, 59876, 59878, 59893, 59894, 59899, 59902, 59916, 27154, 59923, 59940, 59943, 59945, 27180, 59953, 59952, 59958, 59969, 59970, 27202, 27203, 59975, 59993, 60001, 27238, 60007, 27242, 27246, 60017, 27267, 60036, 27273, 27284, 60087, 27323, 60091, 27327, 60106, 60110, 60120, 60124, 60137, 60142, 60150, 27382, 60156, 60158, 60153, 60157, 60180, 27426, 27428, 60202, 60209, 60225, 60221, 27474, 27475, 60250, 27489, 60257, 27491, 60273, 27501, 60276, 60283, 60292, 60296, 27530, 27553, 60322, 60323, 27559, 60337, 60338, 60350, 60355, 60362, 60364, 27601, 60381, 27609, 27620, 60392, 60397, 27630, 60398, 60406, 27638, 60414, 27649, 60429, 27663, 60431, 60430, 60452, 60472, 27718, 27721, 27730, 60499, 27732, 60504, 27740, 60513, 27747, 60508, 60518, 60529, 60540, 60543, 60548, 27782, 60550, 60557, 27793, 60566, 60577, 12039, 60595, 60596, 60609, 27841, 60611, 27846, 60617, 60619, 27854, 27856, 60625, 27865, 60641, 27882, 60654, 60657, 60656, 60659, 27905, 60673, 60666, 60679, 27912, 27913, 60681, 60682, 27916, 60686, 27936, 27938, 27940, 27943, 27947, 60722, 27961, 60729, 60734, 27972, 27975, 60744, 60753, 27985, 27987, 27991, 60760, 60759, 60764, 60767, 60772, 60774, 28014, 60782, 60788, 60793, 28030, 28035, 28046, 60817, 28052, 28047, 28057, 60833, 28073, 28081, 60850, 28084, 28091, 60861, 57687, 60863, 60867, 28109, 60881, 60888, 60892, 60897, 28129, 28132, 60902, 60905, 60906, 60915, 60916, 60919, 60923, 60924, 60927, 28158, 60931, 28180, 28177, 60954, 60955, 28186, 28189, 60961, 60957, 28195, 60963, 60967, 28205, 28207, 60985, 28217, 28222, 60990, 28225, 28224, 28228, 28231, 28234, 61003, 28237, 61008, 61009, 61011, 12126, 28243, 61015, 28247, 61017, 28249, 61020, 61030, 28263, 61043, 28283, 61052, 28287, 28291, 28294, 61062, 61065, 28295, 61063, 28305, 28306, 28313, 28312, 28317, 61087, 61082, 28322, 28323, 61095, 28327, 28330, 28338, 28342, 61115, 28349, 61117, 61121, 28355, 61124, 28360, 61132, 61133, 28365, 28364, 28369, 28371, 28378, 61151, 28387, 61157, 28399, 61169, 61171, 61170, 61168, 61178, 61180, 61183, 61185, 61194, 28449, 61217, 28457, 28468, 61251, 28499, 61274, 28514, 61313, 28545, 61326, 28559, 57778, 28564, 61334, 61361, 28621, 28636, 28660, 28675, 28673, 61446, 28679, 28686, 28787, 28791, 28804, 28811, 61631, 25280, 57849, 61702, 28945, 61721, 61723, 61727, 61731, 61734, 61742, 61744, 28976, 61757, 28992, 61760, 61769, 29008, 61777, 29013, 61783, 61784, 61785, 29016, 61789, 61790, 29021, 61795, 29043, 61821, 61824, 29088, 61859, 29127, 61905, 61911, 61915, 61917, 61923, 61926, 61931, 61933, 29178, 61950, 61961, 61968, 61976, 29223, 62051, 62055, 62065, 29298, 62071, 38392, 62119, 62160, 25381, 62233, 62234, 29523, 29527, 5883, 29623, 62439, 62494, 29731, 29743, 29749, 29757, 62533, 29767, 29768, 62537, 62551, 29819, 62596, 62603, 29835, 62612, 62611, 62631, 62633, 62640, 62641, 29878, 62649, 62661, 29899, 62669, 62672, 29906, 58047, 29904, 29910, 29916, 29918, 62692, 58051, 29928, 29931, 29937, 58053, 62708, 58054, 29939, 38516, 29955, 30128, 62944, 30208, 62993, 63015, 30245, 63036, 58121, 58123, 63057, 30288, 63063, 63065, 30298, 63068, 63107, 63117, 30374, 12550, 63155, 63161, 30411, 58149, 63192, 63212, 30451, 30452, 30459, 30461, 30497, 30540, 38646, 63409, 58201, 30720, 30725, 30755, 25652, 63526, 63537, 63540, 63555, 59838, 63570, 30804, 30810, 63581, 63583, 63589, 30856, 30863, 30866, 63702, 30977, 63780, 63784, 63792, 63805, 31056, 63831, 58277, 31075, 63873, 63904, 31138, 31136, 63911, 31150, 63929, 63932, 63934, 25736, 31184, 31214, 63989, 64004, 64012, 31247, 64071, 64087, 64088, 64108, 64121, 64230, 64243, 31487, 31495, 25803, 31521, 64295, 31543, 64313, 31569, 31572, 64359, 45359, 31613, 64433, 64441, 64482, 64489, 31745, 31749, 31753, 31755, 64546, 58421, 58424, 31810, 64580, 64581, 31824, 64593, 31888, 31947, 64740, 31987, 31994, 31995, 31996, 58466, 58469, 32034, 64816, 32065, 64834, 64838, 64841, 64847, 64849, 64883, 32121, 64889, 64899, 64915, 58503, 64969, 65005, 32237, 58514, 58520, 32288, 65058, 32294, 65076, 65084, 32323, 65105, 32372, 32373, 65144, 65185, 58548, 65243, 32484, 65254, 65264, 32510, 32515, 58566, 32519, 58568, 65313, 58572, 32593, 32635, 65410, 32644, 32710, 65488, 32737], 37113: [3, 7, 32781, 40, 32807, 44, 32815, 32823, 81, 83, 85, 86, 87, 89, 95, 91, 101, 107, 115, 118, 120, 119, 124, 32903, 32913, 147, 32925, 32941, 173, 32943, 175, 181, 184, 187, 188, 32960, 32979, 216, 235, 236, 237, 33011, 245, 248, 303, 312, 316, 318, 341, 342, 344, 348, 382, 412, 421, 431, 460, 472, 544, 33312, 555, 33326, 33325, 33337, 568, 572, 592, 33374, 33382, 33395, 33399, 640, 33420, 656, 33430, 664, 33434, 672, 683, 688, 33462, 33464, 33466, 699, 704, 33478, 713, 33493, 33520, 33528, 33532, 848, 849, 851, 853, 854, 857, 855, 859, 856, 33659, 33664, 33669, 33673, 33678, 940, 942, 952, 33726, 33728, 33782, 33785, 33786, 33788, 33790, 1067, 1078, 1082, 1079, 1084, 1086, 33894, 33895, 33900, 1157, 33925, 1158, 1160, 1161, 33926, 1165, 33948, 1205, 33977, 1211, 1213, 1221, 1222, 33992, 1225, 1224, 1229, 34026, 34032, 34056, 34080, 1312, 34128, 1360, 1369, 34143, 34145, 34147, 34150, 34151, 1413, 34191, 1429, 1440, 34214, 1456, 1461, 1477, 34247, 1487, 34263, 34268, 34287, 34288, 34336, 1577, 34352, 1585, 1592, 1596, 45911, 1617, 34432, 34437, 1675, 34453, 34454, 1691, 1694, 34496, 1739, 34512, 1771, 34544, 1824, 1825, 1830, 34607, 1872, 34647, 34657, 1893, 1896, 1920, 34711, 1952, 34734, 1968, 34737, 1984, 34765, 34769, 2022, 2024, 2028, 2086, 2188, 34974, 2278, 35054, 2307, 2385, 2390, 2398, 2424, 2437, 2449, 2471, 2494, 2501, 2536, 35310, 2556, 2563, 2566, 2567, 2592, 2600, 2619, 35408, 2643, 2671, 35437, 35467, 2712, 2720, 2747, 35520, 35531, 2761, 2812, 35617, 2849, 2860, 35671, 2936, 2940, 35735, 35800, 35832, 3110, 3116, 3118, 3128, 35935, 35953, 35997, 35998, 36026, 36072, 3310, 3360, 3366, 3408, 3413, 3414, 3416, 3418, 3420, 3422, 3427, 3429, 3430, 3433, 3435, 36220, 3456, 3468, 3470, 36246, 3480, 3484, 3488, 36271, 3504, 36283, 3516, 3510, 3520, 3526, 3528, 3557, 3644, 3646, 3647, 3664, 3690, 3722, 3728, 3736, 3752, 3756, 3760, 3775, 3786, 33319, 3813, 36582, 3820, 3822, 3928, 36736, 36744, 36746, 3992, 36790, 36792, 4027, 36806, 36814, 36827, 36951, 36957, 4299, 37157, 37167, 4405, 37174, 37176, 4413, 4432, 4438, 37208, 37212, 37219, 37221, 37225, 4459, 37229, 4463, 4469, 37244, 4480, 37254, 37256, 37270, 37272, 4512, 37292, 37290, 37296, 37305, 4538, 37310, 37312, 37318, 37317, 37323, 4556, 4561, 4582, 4597, 4604, 37431, 37433, 4764, 4785, 4871, 37671, 4921, 37721, 37724, 4977, 37808, 37854, 5126, 37937, 37939, 37943, 37944, 37946, 37948, 5214, 38014, 5247, 5271, 38053, 38054, 38060, 38101, 5337, 38115, 38127, 38128, 5527, 5531, 5536, 38328, 38446, 5685, 38506, 38510, 5742, 5749, 38537, 5792, 38586, 38587, 38601, 5862, 38630, 5866, 38636, 5870, 5895, 39013, 7784, 39206, 39213, 39214, 39215, 39219, 39226, 39228, 39251, 39253, 6487, 39263, 6510, 20833, 39288, 39297, 39301, 39305, 6545, 39329, 39334, 39344, 39349, 39353, 39371, 39372, 6622, 39391, 39398, 39400, 39402, 39404, 39405, 39406, 39408, 39461, 39462, 39478, 39551, 39628, 7009, 7011, 7111, 7126, 7251, 40165, 40175, 40230, 40238, 40253, 7517, 40319, 40320, 7628, 40422, 40424, 40486, 40490, 40492, 40502, 40503, 7767, 40537, 7777, 7808, 40577, 40585, 7830, 40646, 40652, 40687, 40905, 8167, 8199, 8205, 8207, 8235, 41015, 8275, 41063, 8303, 8311, 8337, 8339, 8359, 8439, 8443, 41216, 41219, 8459, 41227, 41228, 41253, 8492, 8494, 41272, 41278, 8533, 8537, 41305, 8552, 41319, 41323, 8565, 8574, 41344, 8582, 41353, 41359, 41363, 41376, 41379, 41381, 8614, 41385, 41392, 8630, 8635, 41413, 41417, 41419, 41420, 41421, 41423, 41425, 8661, 8665, 41438, 41443, 41445, 41450, 8684, 8686, 41455, 8693, 41465, 8697, 41467, 41466, 8701, 8707, 8702, 8704, 41479, 8745, 8749, 41559, 8809, 8849, 8867, 8886, 8889, 41664, 8915, 8929, 41712, 41726, 8960, 8963, 8974, 8992, 9003, 41771, 9017, 9043, 9046, 9048, 9047, 9071, 9072, 9081, 9104, 9114, 9126, 9142, 9181, 9184, 9207, 9219, 9223, 41994, 9225, 9228, 41997, 1835, 9267, 9276, 42047, 9279, 9296, 9305, 9303, 42078, 9315, 9317, 9318, 9321, 9324, 9326, 42090, 9334, 42109, 42117, 9363, 9358, 9369, 9367, 9375, 9379, 42160, 9398, 9402, 9406, 9414, 9413, 42197, 9429, 9435, 42214, 9450, 42230, 9462, 42240, 9472, 9482, 9483, 9552, 9558, 9559, 42331, 9571, 42368, 42378, 9622, 9628, 9649, 9667, 9680, 42480, 9712, 42496, 9737, 9766, 9774, 42558, 9808, 9814, 42591, 9853, 9855, 42633, 9884, 42663, 9898, 42672, 42683, 42688, 42693, 42699, 42704, 9958, 42728, 42736, 42744, 42747, 9977, 9998, 10025, 10071, 10083, 10113, 10134, 10138, 10161, 10167, 10176, 10211, 10231, 10282, 43054, 10286, 10358, 10371, 10377, 43200, 10437, 43217, 10467, 43271, 43302, 43303, 10538, 10539, 43310, 43312, 43344, 10576, 43345, 10579, 10582, 10586, 10597, 10607, 43376, 10639, 43414, 10662, 43435, 10671, 10670, 43437, 10695, 10703, 10704, 10710, 10718, 10726, 10734, 10736, 10749, 10792, 43568, 10832, 10837, 10844, 10845, 10848, 10847, 10872, 10873, 10880, 10902, 10904, 10910, 10912, 43728, 10960, 10972, 8694, 43760, 10998, 11049, 11160, 43961, 11206, 11209, 11217, 11255, 11264, 11273, 44117, 11358, 44137, 11388, 11391, 44165, 44166, 44172, 11401, 44179, 44209, 41354, 44224, 44241, 44249, 11502, 11557, 11566, 44350, 11603, 11606, 11615, 44387, 11646, 44414, 44421, 11653, 44464, 11712, 11717, 44492, 11734, 11750, 11752, 11808, 11868, 11875, 44650, 11907, 44687, 44694, 44704, 44720, 11971, 11978, 44749, 44769, 44784, 44795, 41475, 12078, 44849, 12131, 44903, 12230, 44998, 45067, 45071, 45088, 12339, 45143, 12429, 45223, 12467, 12471, 12472, 45248, 12488, 12489, 12492, 12531, 45317, 45392, 45408, 45413, 45450, 45456, 45472, 45477, 45487, 45518, 45520, 45542, 45563, 12832, 45648, 12933, 45712, 45745, 45757, 45766, 45768, 45774, 45779, 13013, 45789, 45808, 45825, 13097, 45904, 45952, 13184, 45967, 45968, 13232, 46008, 13248, 46016, 46021, 46048, 46069, 46073, 46093, 46185, 13450, 13451, 46233, 46272, 46293, 13525, 13531, 46301, 13563, 13569, 13575, 46416, 13648, 46432, 13689, 46496, 13776, 13808, 46624, 13887, 13952, 13951, 13957, 13967, 13984, 46752, 14000, 46768, 14016, 14021, 9301, 14032, 14053, 14064, 46832, 14083, 46855, 46880, 46881, 46889, 46929, 46935, 46995, 14220, 47030, 14270, 47039, 47040, 14272, 47057, 47100, 47146, 47155, 47187, 35433, 14457, 47350, 14593, 14595, 14605, 41990, 14679, 47475, 47483, 47485, 47534, 47536, 47550, 47600, 14838, 47617, 14862, 47669, 14941, 14981, 15032, 15045, 47818, 15052, 47820, 15077, 47856, 15096, 47861, 29079, 48019, 48035, 48063, 15329, 15725, 48501, 48511, 15779, 15806, 15866, 15875, 48682, 48686, 15974, 48759, 48761, 48769, 48782, 48783, 16028, 48809, 48833, 48845, 16078, 48848, 48945, 16234, 16320, 49115, 16399, 16431, 16439, 16467, 16479, 49249, 49251, 49255, 49280, 16522, 16526, 49299, 49313, 16551, 16553, 49325, 49329, 49344, 16586, 49357, 49363, 49367, 16605, 49379, 49383, 16621, 49395, 16635, 49455, 16736, 16741, 16746, 49536, 16784, 16800, 49584, 49583, 16842, 16848, 49627, 16870, 16885, 16886, 16889, 49672, 49678, 16928, 49754, 49766, 49768, 49770, 49774, 17008, 49795, 17032, 17073, 17088, 49870, 17109, 49877, 49880, 49882, 17141, 17152, 17155, 17158, 17160, 17162, 17164, 3419, 17232, 50017, 17249, 17255, 17261, 17260, 17263, 50048, 17281, 17285, 17286, 50055, 50060, 17294, 17296, 17310, 50107, 17342, 17341, 50112, 17349, 17350, 50126, 17365, 17375, 17383, 50161, 17421, 17468, 50264, 17550, 50318, 17560, 17598, 17614, 50389, 50392, 50414, 50416, 17653, 50445, 50464, 17744, 50515, 50527, 17755, 50566, 17820, 50598, 17831, 50630, 50640, 50647, 50672, 17952, 50720, 50736, 17968, 18014, 18032, 18048, 50821, 50837, 50844, 18078, 50848, 50856, 18096, 50864, 18112, 50885, 50896, 18160, 50928, 18169, 18173, 18183, 18186, 18188, 18209, 18215, 10137, 18262, 18266, 18273, 18285, 18312, 18321, 18328, 51101, 18327, 51128, 18362, 51132, 18367, 51147, 18390, 18391, 18394, 51169, 18396, 51175, 18407, 18423, 18424, 51195, 18432, 51237, 18493, 18540, 18550, 18557, 18567, 18583, 18598, 18622, 18637, 51408, 18685, 18697, 51493, 18750, 51589, 18827, 51597, 18830, 51621, 18862, 51637, 18874, 18878, 18883, 51653, 18886, 18889, 18893, 51701, 18937, 18941, 18942, 18944, 51724, 51750, 51851, 19085, 19089, 51894, 19142, 51909, 51969, 19297, 19309, 52113, 52125, 52135, 19391, 19399, 19402, 52172, 29909, 19421, 52200, 19437, 52232, 52316, 19562, 19598, 19600, 19607, 52382, 19621, 19661, 19709, 19712, 52481, 52492, 52494, 19723, 52517, 19829, 19830, 19846, 19849, 19913, 19950, 19974, 52746, 19981, 52819, 52825, 20062, 20063, 52857, 52862, 20101, 20103, 20127, 52908, 20190, 52974, 20214, 20221, 53006, 20273, 20321, 53095, 20333, 53120, 53178, 53184, 20455, 53228, 20474, 10583, 20493, 20561, 20567, 20573, 53383, 53389, 20627, 20631, 20647, 53469, 53489, 20748, 53512, 20773, 20777, 53547, 20781, 53551, 20783, 53557, 53584, 53593, 20831, 20863, 53640, 20875, 20879, 53654, 53656, 20889, 53660, 53664, 20901, 20903, 20904, 53680, 20917, 20926, 20927, 20934, 20943, 20949, 20955, 20959, 53733, 20970, 53743, 53744, 20982, 20981, 20989, 53759, 20990, 20991, 53763, 21095, 21096, 53894, 21155, 53939, 21192, 53968, 10727, 54000, 54003, 21258, 21262, 21280, 21302, 21310, 21337, 21387, 21408, 54183, 54192, 54195, 21446, 21465, 54275, 54278, 54287, 21558, 21562, 54358, 54364, 54374, 21614, 21615, 21613, 21617, 21623, 21630, 54398, 21637, 54406, 21643, 54415, 21647, 54438, 21669, 21677, 21678, 54454, 21686, 54473, 21709, 54480, 21733, 21742, 54527, 54624, 21912, 21916, 54688, 54704, 54736, 21985, 21987, 54794, 22028, 22053, 54829, 22061, 54841, 54864, 22099, 22105, 54895, 54912, 22140, 54917, 22157, 22168, 54945, 22181, 22197, 22203, 54984, 22221, 54992, 55014, 55024, 55029, 22261, 22268, 22284, 22304, 22316, 55149, 55169, 22416, 22432, 55203, 55241, 22499, 55288, 55290, 55311, 22565, 22566, 55376, 55377, 22627, 55401, 55427, 22661, 55433, 22668, 55440, 55446, 22725, 55497, 22735, 22757, 55598, 22830, 22828, 55601, 55646, 22895, 55665, 22894, 22917, 55689, 55701, 22941, 22943, 55717, 22955, 55727, 55728, 22959, 55731, 55733, 55734, 22981, 55760, 55792, 23055, 55848, 55862, 23098, 23128, 23129, 23127, 23189, 23214, 55990, 56025, 56037, 23276, 23292, 23337, 56145, 23385, 23388, 56163, 23443, 23448, 23449, 23452, 56247, 56281, 56291, 23523, 56326, 23598, 56366, 23643, 23660, 23692, 56463, 23775, 56563, 56566, 23853, 23855, 23850, 56657, 23900, 23903, 23913, 23942, 23941, 56725, 23961, 23966, 23967, 23971, 23974, 23978, 23998, 23999, 24017, 24022, 56915, 56921, 56929, 56963, 56965, 56998, 57013, 24250, 57034, 24270, 24288, 24296, 24298, 24297, 24364, 57137, 24412, 57185, 57219, 57225, 24505, 24574, 57383, 57387, 57403, 57443, 57499, 57539, 57543, 24840, 24844, 57637, 24918, 24935, 24936, 24937, 24939, 24943, 24947, 24953, 57727, 24960, 24965, 24969, 24975, 57743, 57756, 24991, 24992, 57765, 25004, 25023, 25024, 25029, 57797, 57802, 25035, 25036, 25037, 25039, 57807, 25043, 25068, 57848, 25084, 57853, 25091, 57910, 57936, 58032, 58065, 25319, 58096, 58144, 58155, 58169, 58217, 58225, 58227, 58240, 58288, 25530, 58304, 58320, 58347, 58355, 25608, 11605, 58410, 58448, 58451, 58456, 25692, 25694, 58467, 25706, 58486, 25719, 25739, 58506, 25741, 58510, 58515, 58517, 58534, 58576, 58587, 58589, 58602, 58614, 25946, 25952, 26016, 58811, 58815, 26096, 58875, 26123, 58924, 58926, 26203, 58969, 58970, 26208, 26245, 26253, 26272, 59050, 26288, 26302, 26303, 26309, 26316, 26342, 26352, 59132, 59192, 59194, 31318, 59279, 59334, 59341, 59355, 59371, 59386, 26719, 26729, 59520, 59523, 26787, 59606, 59686, 59690, 59696, 26937, 59728, 59760, 27001, 27019, 59821, 27056, 59856, 59880, 27120, 59891, 27183, 27224, 27269, 60112, 60259, 60300, 60366, 60410, 60449, 60521, 60614, 27853, 27855, 27871, 27878, 27918, 27919, 27942, 27948, 27950, 27951, 27997, 28048, 28056, 28064, 28089, 60857, 28101, 28153, 60966, 28209, 28265, 28288, 61066, 61119, 61131, 61142, 61158, 61177, 61288, 61420, 44777, 61454, 28759, 61579, 28851, 28848, 61643, 57845, 28915, 28919, 28920, 61701, 61741, 61776, 61781, 61791, 61797, 61807, 61849, 61856, 61871, 61877, 61878, 61894, 61913, 61941, 29181, 29182, 29180, 29191, 61987, 29310, 62080, 62083, 62086, 62091, 62092, 62093, 62134, 62138, 62140, 62144, 62143, 62150, 62156, 62157, 29400, 62172, 62174, 62184, 29432, 62204, 62209, 29489, 62263, 62289, 62336, 62341, 62375, 29616, 62384, 62395, 62400, 62405, 62412, 62453, 62456, 62460, 62475, 62513, 62519, 29783, 62561, 62567, 62597, 29830, 62607, 62645, 62646, 62655, 62683, 29917, 62691, 62696, 62698, 62704, 29944, 29947, 29948, 29953, 62752, 29993, 62800, 30032, 62816, 30085, 62863, 62880, 30131, 62908, 30149, 62923, 62928, 62945, 62967, 62984, 62986, 62990, 30246, 30249, 30255, 30294, 63067, 63071, 63104, 30358, 30389, 63157, 63168, 63173, 30453, 63228, 63231, 63233, 63239, 63265, 30505, 63313, 30547, 30563, 63368, 63383, 30627, 30631, 63399, 63416, 63419, 63424, 30664, 63436, 63441, 30689, 63480, 63528, 63530, 63532, 63534, 63577, 63579, 30839, 63674, 63678, 63692, 63696, 63705, 63710, 63718, 63722, 63731, 63745, 63790, 31086, 63925, 31160, 63965, 31198, 63982, 31216, 63984, 31224, 64008, 31264, 31312, 31313, 31324, 64102, 64104, 64119, 64145, 31424, 64205, 31440, 64213, 64215, 31448, 64221, 31472, 31483, 64369, 64394, 64442, 64456, 31713, 64481, 64497, 64510, 64547, 31825, 31870, 64654, 64703, 64743, 64744, 64759, 64805, 64806, 64813, 64815, 64821, 32080, 32081, 64851, 32083, 32093, 64885, 64901, 64905, 32158, 64928, 64955, 65013, 65016, 65019, 65068, 65081, 65113, 65143, 32384, 32390, 65228, 32486, 32504, 65329, 65422, 65478, 65482], 39359: [76, 185, 193, 203, 263, 267, 272, 274, 277, 279, 285, 287, 288, 289, 297, 298, 299, 324, 329, 332, 336, 346, 352, 370, 384, 385, 395, 402, 416, 427, 432, 434, 453, 481, 491, 495, 496, 498, 533, 577, 608, 626, 644, 690, 693, 737, 752, 757, 771, 775, 784, 1040, 1042, 1045, 1047, 1056, 1058, 1066, 1088, 1091, 1104, 1120, 1139, 1152, 1156, 1162, 1175, 1184, 1187, 1188, 1191, 1200, 1207, 1214, 1218, 1232, 1239, 1250, 1258, 1264, 1266, 1271, 1272, 1273, 1276, 1301, 1345, 1347, 1349, 1350, 1357, 1525, 1557, 1568, 1574, 1601, 1608, 1609, 1611, 1612, 1616, 1621, 1631, 1698, 1712, 1731, 1775, 1776, 1782, 1795, 1799, 1900, 1949, 2043, 2069, 2073, 2077, 2080, 2118, 2128, 2134, 2162, 2164, 2176, 2200, 2204, 2206, 2214, 2224, 2240, 2249, 2258, 2280, 2290, 2325, 2336, 2341, 2355, 2372, 2373, 2377, 2384, 2389, 2400, 2419, 2464, 2480, 2544, 2549, 2581, 2590, 2620, 2625, 2628, 2632, 2633, 2784, 2827, 2833, 2837, 2841, 2896, 2906, 2912, 2961, 2973, 2994, 3020, 3028, 3062, 3064, 3093, 3104, 3135, 3142, 3152, 3163, 3186, 3200, 3228, 3230, 3240, 3248, 3250, 3264, 3331, 3335, 3344, 3349, 3356, 3361, 3384, 3388, 3392, 3393, 3396, 3401, 3424, 3451, 3465, 3474, 3568, 3582, 3608, 3616, 3628, 3649, 3651, 3652, 3655, 3680, 3712, 3717, 3765, 3774, 3776, 3781, 3800, 3802, 3812, 3816, 3836, 3851, 3855, 3861, 3920, 3930, 3936, 3987, 3993, 4088, 4090, 4129, 4142, 4156, 4163, 4171, 4245, 4252, 4375, 4385, 4394, 4395, 4400, 4402, 4437, 4475, 4476, 4488, 4504, 4508, 4536, 4540, 4584, 4601, 4624, 4681, 4682, 4691, 4717, 4739, 4770, 4787, 4802, 4816, 4818, 4820, 4821, 4829, 4838, 4854, 4914, 4973, 5050, 5076, 5148, 5184, 5198, 5204, 5218, 5248, 5263, 5272, 5277, 5300, 5313, 5333, 5344, 5356, 5367, 5368, 5401, 5406, 5420, 5421, 5435, 5444, 5451, 5454, 5457, 5464, 5481, 5540, 5561, 5563, 5586, 5606, 5609, 5612, 5633, 5634, 5645, 5669, 5673, 5698, 5699, 5703, 5719, 5724, 5736, 5774, 5795, 5799, 5869, 5911, 5922, 5924, 5969, 6018, 6035, 6050, 6066, 6074, 6103, 6179, 6188, 6201, 6227, 6234, 6247, 6265, 6294, 6308, 6423, 6425, 6437, 6446, 6458, 6462, 6465, 6479, 6498, 6530, 6537, 6576, 6579, 6588, 6590, 6605, 6640, 6654, 6688, 6731, 6758, 6777, 6798, 6947, 6963, 7029, 7088, 7112, 7140, 7198, 7236, 7241, 7316, 7332, 7446, 7458, 7462, 7477, 7491, 7545, 7547, 7569, 7572, 7619, 7620, 7646, 7700, 7717, 7718, 7723, 7733, 7734, 7753, 7755, 7763, 7779, 7820, 7832, 7834, 7837, 7867, 7877, 7881, 7884, 7957, 8098, 8100, 8141, 8148, 8149, 8201, 8238, 8241, 8289, 8292, 8323, 8326, 8345, 8371, 8390, 8404, 8420, 8441, 8458, 8460, 8475, 8478, 8496, 8543, 8546, 8548, 8562, 8603, 8605, 8616, 8647, 8657, 8662, 8663, 8692, 8751, 8773, 8779, 8821, 8858, 8890, 8942, 9056, 9087, 9102, 9130, 9145, 9224, 9264, 9266, 9285, 9287, 9295, 9362, 9371, 9376, 9392, 9415, 9424, 9440, 9445, 9449, 9509, 9540, 9550, 9554, 9566, 9601, 9605, 9630, 9641, 9664, 9666, 9687, 9689, 9726, 9729, 9732, 9743, 9765, 9769, 9791, 9800, 9801, 9802, 9803, 9804, 9815, 9817, 9823, 9836, 9881, 9911, 9954, 9963, 9964, 10004, 10024, 10046, 10062, 10066, 10085, 10105, 10108, 10127, 10133, 10168, 10171, 10205, 10214, 10247, 10258, 10271, 10277, 10309, 10312, 10318, 10330, 10359, 10387, 10392, 10430, 10453, 10502, 10503, 10507, 10526, 10530, 10533, 10551, 10553, 10594, 10638, 10643, 10664, 10681, 10685, 10713, 10762, 10768, 10773, 10780, 10782, 10829, 10889, 10896, 10919, 10962, 10986, 11035, 11038, 11055, 11059, 11082, 11086, 11112, 11117, 11125, 11141, 11154, 11170, 11200, 11221, 11276, 11278, 11279, 11285, 11289, 11299, 11306, 11318, 11333, 11337, 11338, 11342, 11348, 11354, 11458, 11541, 11543, 11550, 11561, 11568, 11595, 11634, 11642, 11657, 11697, 11738, 11776, 11783, 11798, 11805, 11833, 11842, 11850, 11859, 11891, 11893, 11894, 11987, 11988, 11989, 12032, 12071, 12087, 12094, 12107, 12139, 12141, 12169, 12203, 12226, 12228, 12264, 12269, 12277, 12358, 12359, 12361, 12366, 12417, 12451, 12494, 12530, 12586, 12605, 12608, 12609, 12627, 12631, 12639, 12641, 12650, 12653, 12656, 12670, 12672, 12678, 12679, 12684, 12687, 12688, 12719, 12720, 12728, 12732, 12745, 12756, 12776, 12786, 12797, 12839, 12857, 12869, 12879, 12964, 12982, 13008, 13025, 13040, 13072, 13129, 13236, 13328, 13343, 13344, 13361, 13384, 13396, 13405, 13410, 13418, 13458, 13485, 13534, 13536, 13552, 13567, 13633, 13661, 13758, 13769, 13822, 13863, 13865, 13872, 13882, 13892, 13898, 13933, 13936, 13939, 13964, 14010, 14014, 14019, 14044, 14114, 14116, 14147, 14148, 14149, 14155, 14158, 14159, 14164, 14339, 14377, 14411, 14429, 14505, 14553, 14569, 14586, 14643, 14663, 14720, 14726, 14768, 14800, 14832, 14846, 14882, 14883, 14900, 14919, 14965, 14969, 14975, 14976, 14985, 15027, 15040, 15043, 15075, 15135, 15143, 15232, 15313, 15326, 15351, 15355, 15358, 15381, 15417, 15424, 15425, 15439, 15484, 15500, 15568, 15569, 15573, 15591, 15609, 15648, 15656, 15709, 15716, 15744, 15757, 15798, 15842, 15857, 15869, 15895, 15911, 15918, 15961, 16018, 16024, 16051, 16053, 16056, 16081, 16094, 16120, 16150, 16194, 16202, 16228, 16259, 16263, 16265, 16333, 16414, 16419, 16424, 16425, 16434, 16466, 16468, 16482, 16483, 16484, 16510, 16530, 16562, 16564, 16579, 16585, 16596, 16612, 16632, 16661, 16677, 16681, 16684, 16698, 16709, 16712, 16713, 16723, 16727, 16729, 16749, 16776, 16789, 16812, 16813, 16829, 16871, 16876, 16917, 16918, 16931, 16952, 16966, 17031, 17059, 17074, 17082, 17093, 17104, 17118, 17175, 17176, 17214, 17244, 17251, 17259, 17262, 17303, 17308, 17327, 17366, 17374, 17400, 17427, 17447, 17450, 17456, 17475, 17548, 17551, 17562, 17564, 17587, 17596, 17599, 17616, 17619, 17630, 17635, 17647, 17702, 17706, 17726, 17729, 17730, 17737, 17749, 17765, 17766, 17813, 17838, 17862, 17864, 17874, 17898, 17951, 17967, 17979, 17980, 17995, 17999, 18046, 18076, 18092, 18093, 18132, 18134, 18136, 18137, 18141, 18143, 18152, 18171, 18196, 18274, 18276, 18278, 18280, 18318, 18342, 18364, 18386, 18398, 18425, 18440, 18451, 18453, 18455, 18460, 18465, 18479, 18485, 18487, 18501, 18506, 18510, 18524, 18529, 18531, 18533, 18538, 18555, 18596, 18600, 18639, 18659, 18683, 18695, 18720, 18725, 18731, 18757, 18760, 18761, 18762, 18763, 18773, 18780, 18800, 18853, 18859, 18863, 18867, 18918, 18939, 18960, 18988, 18990, 19009, 19029, 19030, 19036, 19046, 19071, 19079, 19107, 19113, 19127, 19143, 19150, 19190, 19220, 19238, 19239, 19242, 19247, 19254, 19261, 19272, 19274, 19280, 19286, 19305, 19308, 19334, 19366, 19368, 19387, 19393, 19395, 19400, 19429, 19432, 19464, 19509, 19512, 19516, 19525, 19527, 19529, 19548, 19581, 19589, 19593, 19601, 19614, 19627, 19660, 19677, 19695, 19733, 19737, 19745, 19752, 19759, 19781, 19790, 19795, 19807, 19813, 19821, 19833, 19852, 19861, 19873, 19881, 19906, 19909, 19915, 19925, 19926, 19931, 19939, 19944, 19954, 19990, 19998, 20018, 20030, 20037, 20047, 20088, 20116, 20123, 20182, 20249, 20251, 20258, 20260, 20262, 20265, 20267, 20281, 20302, 20306, 20330, 20346, 20352, 20389, 20390, 20412, 20427, 20449, 20521, 20568, 20572, 20577, 20587, 20588, 20589, 20591, 20639, 20649, 20651, 20689, 20699, 20715, 20719, 20740, 20749, 20752, 20756, 20770, 20778, 20788, 20832, 20874, 20880, 20896, 20900, 20912, 20930, 20944, 20954, 20976, 20992, 20995, 21120, 21123, 21137, 21156, 21221, 21250, 21283, 21288, 21315, 21360, 21371, 21378, 21410, 21413, 21461, 21488, 21511, 21515, 21519, 21520, 21530, 21550, 21598, 21602, 21632, 21634, 21685, 21706, 21797, 21828, 21830, 21831, 21832, 21840, 21843, 21844, 21856, 21861, 21865, 21929, 21957, 21993, 22009, 22018, 22064, 22085, 22096, 22098, 22100, 22111, 22114, 22117, 22119, 22128, 22144, 22189, 22191, 22192, 22208, 22224, 22235, 22240, 22242, 22265, 22266, 22305, 22307, 22339, 22400, 22443, 22464, 22495, 22532, 22544, 22549, 22741, 22782, 22785, 22805, 22809, 22813, 22816, 22823, 22825, 22855, 22863, 22901, 22933, 22942, 22944, 22946, 22957, 22960, 22997, 23002, 23010, 23015, 23017, 23024, 23081, 23266, 23280, 23322, 23328, 23392, 23405, 23406, 23434, 23440, 23453, 23456, 23464, 23518, 23573, 23575, 23590, 23597, 23623, 23744, 23787, 23809, 23825, 23844, 23856, 23906, 23909, 23920, 23945, 23956, 23984, 24000, 24048, 24074, 24158, 24174, 24176, 24179, 24183, 24194, 24226, 24261, 24283, 24331, 24356, 24392, 24416, 24448, 24455, 24464, 24477, 24528, 24651, 24657, 24818, 24848, 24860, 24870, 24916, 24948, 24962, 24984, 24995, 25010, 25034, 25040, 25056, 25072, 25104, 25116, 25134, 25155, 25160, 25182, 25300, 25301, 25310, 25314, 25328, 25365, 25481, 25616, 25623, 25715, 25751, 25792, 25808, 25810, 25812, 25813, 25826, 25831, 25840, 25858, 25870, 25899, 25918, 25921, 25926, 25933, 26005, 26085, 26088, 26109, 26149, 26159, 26160, 26172, 26177, 26185, 26188, 26241, 26249, 26312, 26313, 26394, 26444, 26515, 26628, 26658, 26752, 26779, 26792, 26816, 26819, 26896, 26917, 26922, 26950, 26954, 26962, 26964, 27009, 27014, 27018, 27039, 27061, 27064, 27071, 27092, 27125, 27152, 27170, 27185, 27208, 27266, 27302, 27312, 27316, 27334, 27348, 27376, 27459, 27664, 27781, 27786, 27787, 27796, 27845, 27852, 27908, 27920, 27922, 27944, 27952, 27988, 28060, 28096, 28185, 28193, 28203, 28227, 28230, 28255, 28274, 28276, 28298, 28310, 28372, 28373, 28376, 28377, 28384, 28398, 28409, 28553, 28561, 28573, 28721, 28723, 28727, 28737, 28740, 28742, 28750, 28928, 28943, 28960, 28979, 28983, 28989, 28999, 29027, 29045, 29056, 29115, 29116, 29120, 29123, 29136, 29138, 29168, 29214, 29217, 29219, 29260, 29263, 29361, 29414, 29427, 29473, 29665, 29726, 29760, 29763, 29778, 29792, 29802, 29856, 29859, 29863, 29888, 29936, 29951, 30025, 30135, 30177, 30206, 30273, 30312, 30350, 30368, 30380, 30384, 30414, 30427, 30531, 30676, 30738, 30882, 30887, 30903, 31001, 31013, 31024, 31052, 31055, 31106, 31109, 31110, 31113, 31152, 31225, 31235, 31239, 31271, 31353, 31386, 31475, 31539, 31556, 31605, 31651, 31664, 31707, 31727, 31785, 31838, 31895, 31906, 31907, 32042, 32047, 32076, 32117, 32187, 32190, 32194, 32195, 32202, 32203, 32212, 32254, 32256, 32298, 32312, 32325, 32328, 32332, 32333, 32440, 32443, 32462, 32464, 32476, 32482, 32505, 32508, 32676, 32692, 32772, 32787, 32828, 32833, 32843, 32847, 32916, 32923, 32932, 32946, 33015, 33043, 33061, 33136, 33159, 33252, 33294, 33302, 33306, 33315, 33332, 33350, 33351, 33378, 33411, 33423, 33428, 33442, 33473, 33575, 33608, 33687, 33779, 33796, 33808, 33813, 33816, 33924, 33939, 34016, 34062, 34085, 34088, 34097, 34111, 34113, 34117, 34121, 34123, 34184, 34193, 34209, 34212, 34213, 34245, 34254, 34277, 34278, 34282, 34341, 34351, 34366, 34373, 34381, 34469, 34480, 34505, 34536, 34543, 34580, 34612, 34622, 34746, 34824, 34889, 34947, 34962, 34980, 35043, 35189, 35195, 35202, 35237, 35244, 35253, 35318, 35345, 35426, 35532, 35569, 35572, 35588, 35604, 35712, 35717, 35727, 35746, 35748, 35778, 35787, 35967, 36005, 36037, 36048, 36114, 36127, 36133, 36224, 36243, 36248, 36289, 36295, 36339, 36354, 36379, 36380, 36403, 36414, 36424, 36430, 36431, 36434, 36460, 36485, 36524, 36531, 36595, 36673, 36753, 36797, 36861, 36873, 36948, 36953, 36955, 37037, 37068, 37143, 37151, 37152, 37156, 37161, 37162, 37177, 37178, 37180, 37181, 37193, 37194, 37215, 37236, 37280, 37346, 37413, 37450, 37478, 37490, 37497, 37509, 37539, 37555, 37584, 37606, 37668, 37685, 37699, 37769, 37810, 37818, 37875, 37876, 37891, 37902, 37936, 37938, 37952, 37968, 37983, 37986, 37988, 37993, 37997, 38031, 38035, 38047, 38050, 38087, 38107, 38111, 38122, 38131, 38143, 38148, 38159, 38169, 38239, 38249, 38305, 38314, 38331, 38376, 38378, 38402, 38412, 38413, 38415, 38456, 38463, 38467, 38520, 38541, 38569, 38576, 38577, 38590, 38596, 38620, 38645, 38724, 38731, 38834, 38869, 38877, 39009, 39019, 39076, 39079, 39090, 39091, 39113, 39156, 39175, 39182, 39205, 39210, 39217, 39229, 39232, 39239, 39254, 39284, 39293, 39317, 39343, 39350, 39359, 39377, 39456, 39477, 39481, 39498, 39511, 39545, 39552, 39573, 39603, 39667, 39669, 39745, 39751, 39753, 39787, 39825, 39844, 39880, 39893, 39894, 39906, 39914, 40018, 40019, 40069, 40075, 40093, 40103, 40115, 40174, 40180, 40209, 40234, 40256, 40288, 40337, 40342, 40350, 40352, 40386, 40408, 40411, 40414, 40428, 40439, 40441, 40451, 40455, 40466, 40494, 40506, 40562, 40624, 40629, 40645, 40658, 40661, 40671, 40677, 40718, 40755, 40756, 40772, 40850, 40866, 40919, 40930, 40958, 40962, 40964, 40982, 40990, 41011, 41021, 41059, 41090, 41110, 41114, 41118, 41153, 41167, 41182, 41202, 41214, 41234, 41243, 41246, 41256, 41263, 41309, 41311, 41371, 41383, 41395, 41464, 41484, 41536, 41682, 41714, 41775, 41797, 41826, 41864, 41912, 41925, 41932, 41933, 42005, 42007, 42037, 42068, 42080, 42115, 42125, 42131, 42138, 42165, 42176, 42183, 42220, 42233, 42239, 42244, 42249, 42313, 42315, 42354, 42369, 42374, 42436, 42514, 42533, 42543, 42569, 42581, 42585, 42649, 42651, 42692, 42738, 42751, 42888, 42928, 42931, 43015, 43018, 43024, 43068, 43071, 43184, 43206, 43260, 43267, 43285, 43340, 43342, 43380, 43541, 43552, 43554, 43588, 43691, 43695, 43707, 43725, 43779, 43783, 43800, 43978, 44021, 44048, 44049, 44199, 44208, 44309, 44329, 44366, 44425, 44473, 44528, 44544, 44545, 44564, 44581, 44617, 44658, 44723, 44738, 44837, 44910, 44936, 45003, 45004, 45029, 45044, 45083, 45121, 45131, 45165, 45185, 45188, 45259, 45339, 45342, 45360, 45369, 45389, 45429, 45458, 45467, 45474, 45532, 45548, 45554, 45570, 45597, 45635, 45705, 45761, 45822, 45841, 45872, 45903, 46009, 46064, 46080, 46099, 46112, 46128, 46176, 46177, 46192, 46227, 46240, 46466, 46469, 46471, 46478, 46533, 46579, 46598, 46679, 46773, 46776, 46788, 46794, 46822, 46835, 46865, 46878, 46879, 46917, 46946, 47008, 47070, 47091, 47128, 47132, 47152, 47241, 47266, 47268, 47280, 47293, 47306, 47312, 47326, 47335, 47336, 47344, 47348, 47378, 47385, 47408, 47417, 47420, 47422, 47437, 47472, 47494, 47520, 47522, 47547, 47553, 47560, 47587, 47612, 47638, 47640, 47653, 47684, 47703, 47712, 47750, 47752, 47762, 47776, 47810, 47816, 47859, 47865, 47872, 47949, 47952, 47975, 47986, 48000, 48016, 48115, 48120, 48144, 48165, 48195, 48212, 48226, 48236, 48255, 48289, 48292, 48297, 48304, 48325, 48333, 48336, 48359, 48363, 48370, 48371, 48379, 48415, 48432, 48449, 48452, 48459, 48461, 48464, 48480, 48524, 48532, 48626, 48647, 48661, 48675, 48713, 48719, 48722, 48724, 48773, 48774, 48795, 48797, 48800, 48823, 48827, 48859, 48863, 48885, 48898, 48906, 48916, 48948, 49025, 49031, 49188, 49195, 49218, 49228, 49236, 49323, 49324, 49327, 49348, 49355, 49411, 49412, 49423, 49504, 49516, 49572, 49599, 49650, 49683, 49715, 49732, 49735, 49762, 49794, 49828, 49842, 49850, 49890, 50050, 50100, 50129, 50163, 50192, 50279, 50285, 50377, 50453, 50470, 50473, 50505, 50533, 50552, 50565, 50596, 50606, 50616, 50661, 50669, 50777, 50787, 50794, 50860, 50938, 50946, 50948, 50996, 51072, 51138, 51216, 51239, 51272, 51328, 51376, 51396, 51397, 51399, 51403, 51417, 51449, 51477, 51485, 51554, 51566, 51584, 51620, 51628, 51713, 51720, 51732, 51809, 51839, 51911, 51921, 51928, 51985, 52036, 52065, 52126, 52167, 52206, 52240, 52241, 52244, 52264, 52299, 52364, 52367, 52464, 52482, 52484, 52488, 52490, 52513, 52524, 52547, 52600, 52609, 52621, 52815, 52835, 52901, 52919, 52963, 52985, 53021, 53074, 53131, 53132, 53143, 53149, 53188, 53217, 53233, 53252, 53299, 53313, 53316, 53323, 53364, 53371, 53381, 53387, 53388, 53391, 53394, 53448, 53452, 53458, 53491, 53535, 53536, 53546, 53552, 53558, 53562, 53567, 53575, 53580, 53674, 53738, 53751, 53790, 53794, 53824, 53833, 53838, 53852, 53890, 53902, 53906, 53918, 53972, 53978, 54010, 54288, 54305, 54333, 54342, 54350, 54362, 54397, 54432, 54435, 54440, 54460, 54497, 54515, 54545, 54595, 54657, 54669, 54692, 54717, 54725, 54785, 54786, 54788, 54816, 54845, 54914, 55013, 55064, 55075, 55307, 55316, 55343, 55459, 55461, 55472, 55503, 55516, 55546, 55551, 55588, 55600, 55606, 55610, 55614, 55622, 55629, 55630, 55631, 55682, 55712, 55730, 55735, 55795, 55860, 55880, 55931, 55936, 55938, 55965, 55988, 55994, 55995, 56000, 56045, 56054, 56058, 56135, 56181, 56189, 56207, 56245, 56256, 56280, 56310, 56344, 56387, 56459, 56483, 56578, 56757, 56821, 56834, 56863, 56866, 56878, 56880, 56906, 56912, 56981, 56984, 57005, 57010, 57021, 57075, 57078, 57084, 57100, 57280, 57301, 57332, 57348, 57379, 57393, 57394, 57412, 57420, 57495, 57561, 57610, 57615, 57639, 57648, 57650, 57651, 57664, 57667, 57683, 57685, 57696, 57698, 57700, 57704, 57715, 57747, 57754, 57769, 57776, 57788, 57840, 57843, 57877, 57878, 57929, 58005, 58074, 58075, 58153, 58159, 58184, 58313, 58368, 58372, 58373, 58395, 58400, 58416, 58432, 58434, 58439, 58471, 58477, 58542, 58562, 58563, 58586, 58591, 58594, 58598, 58607, 58620, 58623, 58646, 58685, 58686, 58693, 58701, 58702, 58719, 58774, 58785, 58793, 58802, 58864, 58914, 58917, 58940, 58942, 58943, 58961, 58962, 59000, 59001, 59015, 59021, 59023, 59040, 59041, 59067, 59072, 59109, 59124, 59209, 59331, 59365, 59385, 59463, 59474, 59540, 59570, 59600, 59608, 59634, 59644, 59681, 59700, 59708, 59715, 59726, 59745, 59746, 59753, 59845, 59915, 59938, 59947, 59951, 60049, 60069, 60097, 60102, 60104, 60109, 60184, 60187, 60188, 60240, 60444, 60451, 60473, 60491, 60494, 60495, 60503, 60546, 60594, 60612, 60618, 60620, 60675, 60706, 60726, 60730, 60792, 60795, 60805, 60852, 60866, 60928, 60962, 60974, 60980, 60981, 60982, 61000, 61001, 61005, 61013, 61046, 61049, 61077, 61089, 61093, 61104, 61107, 61136, 61163, 61201, 61252, 61272, 61276, 61320, 61328, 61329, 61336, 61444, 61467, 61556, 61569, 61572, 61574, 61728, 61794, 61970, 61972, 61986, 62004, 62041, 62072, 62114, 62130, 62142, 62162, 62280, 62371, 62418, 62467, 62468, 62506, 62530, 62562, 62628, 62650, 62686, 62697, 62743, 62786, 62850, 62857, 62864, 62910, 62974, 63017, 63019, 63022, 63050, 63075, 63100, 63159, 63160, 63195, 63200, 63223, 63308, 63330, 63442, 63475, 63517, 63522, 63655, 63664, 63666, 63670, 63719, 63730, 63800, 63817, 63847, 63975, 63988, 64217, 64244, 64290, 64336, 64451, 64483, 64484, 64498, 64500, 64578, 64586, 64588, 64595, 64692, 64709, 64748, 64825, 65027, 65032, 65036, 65100, 65106, 65167, 65173, 65186, 65188, 65202, 65204, 65211, 65304, 65321, 65361, 65367, 65423, 65424], 40025: [54, 98, 110, 111, 220, 306, 315, 328, 335, 338, 363, 365, 394, 411, 415, 425, 446, 456, 459, 508, 540, 560, 624, 668, 736, 789, 843, 869, 925, 936, 956, 1016, 1055, 1070, 1071, 1074, 1076, 1083, 1095, 1143, 1153, 1159, 1164, 1166, 1167, 1168, 1170, 1179, 1199, 1203, 1210, 1216, 1217, 1223, 1230, 1231, 1256, 1260, 1267, 1269, 1279, 1282, 1284, 1295, 1361, 1364, 1381, 1430, 1547, 1549, 1561, 1595, 1615, 1647, 1710, 1722, 1758, 1813, 1873, 1876, 1892, 2007, 2076, 2104, 2108, 2155, 2272, 2381, 2415, 2842, 2909, 2913, 2939, 2943, 3132, 3136, 3179, 3279, 3282, 3311, 3343, 3473, 3485, 3634, 3729, 3769, 3838, 3868, 3954, 3989, 3996, 4158, 4162, 4174, 4236, 4371, 4386, 4398, 4416, 4418, 4420, 4423, 4447, 4520, 4531, 4535, 4552, 4560, 4576, 4579, 4626, 4642, 4654, 4661, 4834, 4842, 4862, 4900, 4989, 5011, 5040, 5114, 5152, 5156, 5189, 5197, 5216, 5235, 5241, 5243, 5244, 5267, 5284, 5328, 5347, 5351, 5381, 5637, 5664, 5680, 5697, 5744, 5779, 5923, 5959, 6017, 6137, 6200, 6209, 6210, 6211, 6281, 6306, 6353, 6461, 6464, 6468, 6469, 6470, 6471, 6477, 6541, 6560, 6610, 6650, 6653, 6709, 6720, 6722, 6723, 6730, 6740, 6818, 6848, 6929, 7057, 7269, 7378, 7456, 7461, 7472, 7488, 7632, 7651, 7696, 7698, 7712, 7726, 7744, 7816, 7907, 7939, 8004, 8009, 8013, 8066, 8254, 8276, 8291, 8302, 8334, 8360, 8474, 8479, 8483, 8515, 8517, 8521, 8563, 8571, 8579, 8581, 8601, 8607, 8610, 8617, 8618, 8627, 8640, 8658, 8681, 8729, 8776, 8916, 8951, 8976, 8990, 8993, 9006, 9012, 9025, 9034, 9168, 9185, 9193, 9235, 9242, 9253, 9259, 9281, 9283, 9404, 9411, 9412, 9447, 9459, 9638, 9702, 9768, 9776, 9835, 9880, 9895, 9926, 9938, 9944, 10022, 10169, 10226, 10228, 10313, 10315, 10319, 10393, 10463, 10466, 10517, 10531, 10565, 10617, 10626, 10686, 10719, 10785, 10816, 10821, 10974, 10985, 10991, 11027, 11050, 11103, 11156, 11295, 11329, 11331, 11433, 11487, 11505, 11554, 11572, 11581, 11599, 11730, 11742, 11760, 11762, 11792, 11813, 11820, 11879, 11906, 11955, 12005, 12010, 12012, 12023, 12084, 12095, 12102, 12108, 12183, 12234, 12251, 12290, 12292, 12301, 12322, 12430, 12466, 12481, 12576, 12582, 12584, 12591, 12601, 12604, 12611, 12616, 12620, 12640, 12664, 12668, 12683, 12691, 12747, 12751, 12759, 12764, 12773, 12778, 12780, 12781, 12849, 12873, 12977, 13140, 13303, 13338, 13391, 13404, 13415, 13446, 13464, 13491, 13682, 13698, 13833, 13837, 13866, 13888, 13915, 13928, 13932, 13999, 14005, 14023, 14098, 14180, 14289, 14290, 14292, 14402, 14439, 14544, 14613, 14656, 14662, 14669, 14730, 14912, 15088, 15140, 15177, 15287, 15315, 15453, 15664, 15680, 15682, 15687, 15688, 15692, 15694, 15901, 15929, 15942, 15950, 16021, 16144, 16192, 16203, 16207, 16270, 16404, 16427, 16472, 16475, 16540, 16623, 16649, 16656, 16659, 16679, 16687, 16688, 16700, 16710, 16725, 16809, 16823, 16830, 16851, 16854, 16855, 16887, 16892, 16961, 17020, 17187, 17194, 17204, 17216, 17218, 17221, 17223, 17328, 17444, 17461, 17477, 17492, 17520, 17528, 17634, 17641, 17655, 17906, 17936, 17957, 17984, 17993, 18003, 18086, 18087, 18103, 18105, 18150, 18216, 18242, 18245, 18296, 18299, 18300, 18356, 18478, 18502, 18512, 18544, 18608, 18636, 18641, 18668, 18672, 18687, 18727, 18758, 18765, 18769, 18854, 18915, 18922, 18976, 18983, 18985, 18992, 19008, 19058, 19072, 19116, 19170, 19182, 19265, 19270, 19319, 19380, 19390, 19479, 19482, 19485, 19520, 19523, 19526, 19574, 19622, 19646, 19665, 19707, 19751, 19760, 19776, 19782, 19792, 19895, 19989, 19994, 20014, 20032, 20040, 20042, 20085, 20151, 20174, 20178, 20181, 20289, 20290, 20295, 20356, 20417, 20423, 20499, 20501, 20503, 20571, 20580, 20584, 20585, 20629, 20635, 20695, 20709, 20765, 20801, 20809, 20812, 20818, 20868, 20890, 20914, 20938, 20971, 20978, 20986, 21011, 21019, 21020, 21057, 21077, 21141, 21145, 21160, 21285, 21286, 21327, 21349, 21414, 21421, 21471, 21477, 21482, 21529, 21554, 21556, 21574, 21589, 21642, 21655, 21691, 21724, 21726, 21737, 21744, 22037, 22043, 22088, 22177, 22215, 22312, 22345, 22411, 22505, 22552, 22580, 22593, 22658, 22687, 22724, 22762, 22814, 22820, 22869, 22932, 23006, 23007, 23013, 23019, 23059, 23107, 23173, 23227, 23237, 23318, 23329, 23447, 23743, 23829, 23840, 23876, 23883, 23892, 23911, 24021, 24091, 24093, 24105, 24139, 24195, 24197, 24209, 24221, 24253, 24258, 24286, 24292, 24351, 24431, 24594, 24719, 24817, 24851, 24864, 24866, 24875, 24880, 24890, 24917, 24922, 25008, 25016, 25133, 25154, 25157, 25162, 25174, 25214, 25218, 25393, 25403, 25407, 25408, 25416, 25417, 25419, 25467, 25534, 25536, 25621, 25682, 25684, 25688, 25728, 25815, 25819, 25835, 25850, 25864, 25868, 26017, 26053, 26086, 26110, 26144, 26181, 26184, 26187, 26308, 26346, 26349, 26529, 26689, 26701, 26755, 26851, 26898, 26946, 26951, 26952, 26958, 27035, 27037, 27072, 27172, 27228, 27713, 27923, 27935, 27945, 27973, 27979, 27983, 28032, 28086, 28098, 28114, 28144, 28146, 28181, 28188, 28194, 28226, 28235, 28236, 28238, 28281, 28300, 28309, 28316, 28325, 28341, 28383, 28491, 28549, 28652, 28674, 28676, 28809, 28897, 28929, 28951, 28967, 28968, 28995, 29017, 29019, 29020, 29100, 29109, 29144, 29165, 29170, 29171, 29205, 29259, 29508, 29687, 29712, 29723, 29728, 29735, 29766, 29772, 29811, 29828, 29900, 29901, 29973, 30009, 30082, 30217, 30243, 30253, 30431, 30448, 30450, 30463, 30528, 30594, 31040, 31046, 31053, 31058, 31060, 31088, 31107, 31164, 31296, 31922, 31928, 31952, 31963, 31969, 32035, 32040, 32071, 32208, 32240, 32258, 32301, 32303, 32383, 32496, 32711, 32802, 32852, 32959, 32968, 33012, 33080, 33088, 33100, 33184, 33218, 33230, 33347, 33348, 33463, 33569, 33581, 33859, 33874, 33943, 33946, 33971, 34015, 34241, 34348, 34368, 34540, 34588, 34594, 34692, 34744, 34802, 34811, 34852, 34859, 34880, 34973, 35009, 35149, 35239, 35248, 35275, 35363, 35392, 35399, 35413, 35502, 35535, 35536, 35663, 35697, 35709, 35714, 35861, 35865, 35904, 35912, 35916, 36063, 36147, 36148, 36160, 36236, 36260, 36290, 36321, 36383, 36389, 36417, 36421, 36422, 36454, 36522, 36630, 36683, 36687, 36788, 36804, 36862, 36871, 36878, 36884, 37012, 37020, 37138, 37146, 37168, 37172, 37184, 37186, 37188, 37189, 37191, 37216, 37295, 37298, 37303, 37304, 37306, 37328, 37344, 37345, 37362, 37365, 37367, 37375, 37402, 37417, 37444, 37446, 37449, 37521, 37525, 37528, 37532, 37599, 37727, 37744, 37904, 37906, 37907, 37911, 37914, 37916, 37949, 37955, 37957, 37958, 37985, 37989, 37995, 38015, 38016, 38039, 38063, 38083, 38120, 38138, 38140, 38156, 38318, 38389, 38432, 38443, 38448, 38465, 38468, 38496, 38530, 38543, 38581, 38592, 38635, 38639, 38642, 38677, 38681, 38690, 38722, 38805, 38904, 38905, 38991, 39049, 39137, 39158, 39162, 39200, 39220, 39306, 39323, 39333, 39362, 39364, 39373, 39422, 39458, 39488, 39605, 39607, 39746, 39754, 39953, 39961, 40100, 40114, 40129, 40179, 40237, 40240, 40259, 40266, 40268, 40284, 40344, 40348, 40354, 40362, 40365, 40394, 40434, 40437, 40476, 40477, 40487, 40498, 40508, 40518, 40597, 40606, 40656, 40694, 40733, 40775, 40894, 41035, 41106, 41235, 41240, 41247, 41268, 41273, 41285, 41291, 41338, 41351, 41374, 41380, 41451, 41458, 41538, 41585, 41672, 41744, 41780, 41792, 41801, 41807, 41870, 41910, 42020, 42025, 42048, 42055, 42099, 42107, 42134, 42207, 42219, 42229, 42243, 42482, 42494, 42554, 42559, 42729, 42834, 42835, 43001, 43075, 43232, 43296, 43300, 43329, 43331, 43335, 43338, 43388, 43394, 43426, 43429, 43434, 43448, 43453, 43464, 43545, 43559, 43602, 43656, 43766, 43786, 43842, 43844, 43905, 43976, 43980, 44057, 44096, 44101, 44102, 44107, 44256, 44332, 44347, 44360, 44429, 44455, 44530, 44560, 44575, 44606, 44608, 44610, 44618, 44622, 44623, 44677, 44721, 44752, 44865, 44875, 44898, 45204, 45328, 45347, 45349, 45356, 45365, 45376, 45397, 45442, 45488, 45495, 45536, 45552, 45567, 45619, 45623, 45633, 45636, 45637, 45645, 45709, 45719, 45728, 45752, 45860, 46003, 46022, 46025, 46071, 46103, 46110, 46135, 46146, 46147, 46150, 46195, 46231, 46244, 46259, 46261, 46275, 46279, 46563, 46632, 46636, 46666, 46671, 46680, 46716, 46811, 46916, 46919, 46921, 46932, 47173, 47216, 47220, 47294, 47331, 47337, 47392, 47397, 47405, 47427, 47440, 47444, 47559, 47566, 47611, 47663, 47664, 47688, 47693, 47698, 47746, 47748, 47806, 47942, 48007, 48116, 48130, 48148, 48161, 48171, 48175, 48193, 48199, 48273, 48307, 48330, 48335, 48340, 48400, 48408, 48426, 48427, 48448, 48451, 48496, 48498, 48528, 48542, 48544, 48563, 48583, 48631, 48637, 48704, 48709, 48717, 48771, 48784, 48787, 48789, 48805, 48810, 48816, 48820, 48821, 48913, 48935, 49074, 49169, 49185, 49186, 49223, 49252, 49297, 49309, 49352, 49373, 49431, 49436, 49465, 49616, 49686, 49694, 49730, 49743, 49793, 49809, 49881, 49910, 49956, 49989, 49996, 50071, 50099, 50146, 50191, 50240, 50241, 50258, 50270, 50306, 50308, 50338, 50340, 50481, 50494, 50725, 50735, 50763, 50816, 50880, 50918, 50978, 50980, 51012, 51015, 51020, 51058, 51074, 51236, 51241, 51276, 51330, 51394, 51400, 51406, 51441, 51482, 51505, 51523, 51573, 51736, 51751, 51776, 51879, 51888, 51904, 51920, 51942, 51986, 52040, 52044, 52103, 52262, 52294, 52301, 52327, 52432, 52512, 52527, 52531, 52549, 52656, 52675, 52760, 52761, 52763, 52766, 52771, 52793, 52800, 52852, 52927, 52940, 52942, 52978, 53010, 53064, 53185, 53197, 53300, 53417, 53568, 53595, 53635, 53703, 53752, 53766, 53810, 53841, 53842, 53898, 54091, 54293, 54294, 54299, 54304, 54307, 54336, 54341, 54368, 54385, 54482, 54487, 54496, 54503, 54520, 54773, 54832, 54951, 54973, 55048, 55104, 55207, 55361, 55365, 55369, 55388, 55417, 55428, 55450, 55535, 55574, 55582, 55621, 55623, 55680, 55702, 55722, 55806, 55890, 55906, 56048, 56228, 56298, 56330, 56385, 56513, 56600, 56612, 56618, 56640, 56816, 56826, 56896, 56978, 57048, 57053, 57124, 57153, 57216, 57252, 57388, 57411, 57536, 57593, 57624, 57644, 57722, 57752, 57794, 57811, 57816, 57842, 57852, 57888, 57897, 57918, 57922, 57924, 57969, 57982, 58050, 58068, 58076, 58084, 58181, 58188, 58232, 58239, 58299, 58393, 58399, 58435, 58436, 58441, 58464, 58492, 58600, 58904, 58915, 58921, 58928, 58936, 58952, 58953, 59013, 59056, 59170, 59172, 59212, 59251, 59280, 59311, 59313, 59388, 59457, 59572, 59582, 59592, 59598, 59633, 59670, 59674, 59709, 59720, 59722, 59778, 59829, 59841, 59942, 59948, 59961, 60075, 60183, 60214, 60234, 60441, 60485, 60486, 60556, 60599, 60663, 60665, 60697, 60743, 60806, 60848, 60869, 60912, 60949, 60956, 61072, 61113, 61249, 61318, 61578, 61695, 61733, 61768, 61819, 61826, 61870, 61883, 61907, 61909, 61982, 62019, 62025, 62027, 62028, 62034, 62087, 62116, 62139, 62152, 62277, 62285, 62320, 62393, 62433, 62455, 62480, 62485, 62493, 62516, 62532, 62539, 62540, 62548, 62584, 62652, 62706, 62711, 62713, 63008, 63011, 63023, 63040, 63043, 63046, 63047, 63152, 63273, 63296, 63303, 63311, 63316, 63392, 63527, 63554, 63557, 63573, 63709, 63735, 63778, 63779, 63791, 63796, 63801, 63810, 63822, 63864, 63907, 63920, 63944, 64039, 64140, 64188, 64199, 64200, 64339, 64420, 64444, 64446, 64447, 64492, 64514, 64583, 64708, 64720, 64789, 64808, 64810, 64832, 64845, 64967, 65023, 65045, 65048, 65051, 65075, 65088, 65090, 65097, 65139, 65166, 65214, 65224, 65271, 65296, 65315, 65344, 65348, 65354, 65355, 65359, 65363], 40461: [13, 48, 58, 61, 93, 109, 112, 121, 32907, 32996, 32995, 515, 519, 528, 33458, 709, 720, 755, 33533, 778, 864, 958, 34070, 34069, 1328, 1376, 1392, 1395, 1434, 34223, 34244, 1504, 1520, 1532, 1546, 1629, 1632, 1637, 1640, 1661, 1663, 1669, 34452, 1760, 1802, 1808, 1875, 1879, 1888, 34658, 1982, 2063, 2064, 2144, 2147, 2154, 2208, 34983, 2238, 35024, 2303, 35089, 2352, 2405, 2423, 2485, 2487, 2526, 2570, 2656, 35476, 2736, 2757, 2819, 2823, 2832, 2917, 2921, 2960, 2972, 2975, 3007, 3024, 3068, 3088, 35858, 3131, 3168, 3171, 3178, 3232, 3234, 36044, 36079, 36080, 3346, 36183, 3461, 3529, 3552, 3586, 3587, 36372, 3605, 3600, 3632, 36405, 3696, 3715, 3744, 36530, 3792, 3808, 3824, 3856, 36626, 3869, 36705, 3941, 3984, 4044, 4048, 36991, 37007, 37571, 38333, 38335, 38512, 38565, 38900, 39010, 39050, 39826, 39847, 40034, 40130, 40162, 40301, 40383, 40388, 40400, 40535, 47205, 8243, 8253, 41172, 14735, 47314, 8716, 8724, 8952, 9045, 9067, 9101, 9119, 9209, 9495, 9553, 9557, 42351, 9589, 42360, 42381, 9629, 9707, 42527, 9847, 9861, 9930, 9931, 9935, 42742, 42772, 10146, 42938, 10210, 10268, 10343, 10423, 43259, 10580, 10603, 10604, 10641, 43460, 43512, 10750, 10761, 10853, 10980, 43792, 11063, 11168, 11367, 11472, 44292, 11649, 11651, 11683, 11777, 11779, 44557, 11882, 11892, 11909, 11964, 11973, 12061, 12202, 12224, 12227, 12247, 12252, 12312, 45155, 12434, 12498, 12514, 12803, 12807, 45581, 12817, 12830, 12946, 45732, 45794, 45800, 46354, 46359, 13616, 13625, 13705, 46477, 46498, 46519, 13773, 13805, 46589, 46587, 46591, 46640, 13919, 13917, 46704, 46737, 46793, 14025, 14056, 46850, 46930, 46981, 46994, 47122, 47154, 47164, 47218, 47244, 14501, 14537, 14559, 47377, 47390, 47477, 14749, 47606, 14865, 14871, 15091, 15120, 15130, 15296, 48076, 48096, 48308, 15561, 48331, 15559, 15593, 15607, 15633, 15645, 48467, 48471, 48487, 48571, 48671, 48688, 15955, 15959, 15973, 16055, 16069, 16119, 16124, 48923, 16225, 49108, 49122, 49138, 16402, 49171, 16413, 16474, 16538, 16541, 16554, 16556, 16618, 17029, 49837, 17080, 49858, 49864, 17125, 17169, 17178, 17250, 17252, 17256, 17284, 17298, 17309, 17311, 9953, 9956, 17343, 62066, 17362, 17372, 50458, 17717, 50493, 50495, 17795, 17829, 17830, 17841, 17859, 17867, 50654, 17889, 50664, 17917, 50712, 17976, 18002, 18024, 18047, 18113, 50891, 18145, 18163, 18235, 18283, 18287, 18290, 18357, 18365, 18370, 18438, 18480, 18492, 13762, 18597, 18624, 18646, 18698, 18777, 18790, 18820, 18882, 18999, 19051, 51860, 51884, 19157, 19187, 19209, 19311, 19371, 19384, 19413, 19424, 19440, 19504, 19564, 19608, 19664, 52461, 19701, 52532, 52579, 52596, 19858, 52628, 19879, 19882, 52664, 52702, 19948, 19949, 19992, 20024, 20050, 20051, 20066, 20083, 20207, 20320, 20336, 20358, 20376, 20384, 20416, 20464, 20575, 53346, 53402, 20655, 53426, 20676, 20724, 21168, 21232, 21264, 21353, 21358, 21424, 62899, 21772, 54612, 21893, 54665, 54693, 21936, 21968, 54757, 22000, 22030, 22079, 22149, 54933, 22288, 22659, 22664, 22721, 55577, 22832, 22846, 22885, 55677, 23538, 23651, 23715, 56543, 56580, 24126, 24172, 24190, 24213, 24347, 24447, 24463, 24495, 24539, 57506, 57512, 57516, 63586, 57883, 57972, 58078, 58245, 58361, 58715, 58757, 58867, 58988, 59008, 59330, 59333, 59409, 63948, 59782, 60004, 60132, 60136, 60291, 60360, 60623, 60935, 61024, 61027, 61213, 61240, 28685, 28755, 61573, 28875, 61980, 29367, 29371, 62141, 62158, 62164, 29409, 29421, 29435, 62397, 29683, 29966, 62740, 29977, 62853, 30112, 62919, 62921, 30192, 30221, 30222, 30256, 30265, 30301, 30316, 30320, 64645, 30346, 63140, 63314, 30731, 30743, 30817, 63728, 31006, 63861, 31097, 63930, 63933, 31173, 31177, 63981, 31240, 31280, 64100, 64228, 64249, 31604, 31611, 31627, 64530, 31767, 64648, 64691, 64716, 32014, 32082, 32087, 32130, 32382, 32410, 32423, 65231, 32499, 65299, 32615, 65442, 65506], 40861: [126, 179, 286, 320, 351, 357, 359, 390, 448, 478, 480, 489, 559, 562, 1026, 1031, 1063, 1072, 1106, 1107, 1201, 1248, 1672, 2112, 2182, 2245, 2246, 2288, 2326, 2374, 2407, 2416, 2528, 2818, 2838, 2840, 3032, 3036, 3296, 3330, 3612, 3648, 3654, 3670, 3844, 3923, 3932, 4237, 4239, 4264, 4297, 4324, 4337, 4370, 4427, 4460, 4562, 4628, 4632, 4645, 4674, 4678, 4730, 4805, 4806, 4824, 5001, 5123, 5143, 5149, 5186, 5191, 5196, 5219, 5220, 5311, 5397, 5412, 5419, 5426, 5442, 5445, 5589, 5675, 5677, 5732, 5734, 5777, 5819, 5857, 5858, 5860, 5913, 5955, 5986, 6082, 6135, 6197, 6208, 6254, 6261, 6276, 6361, 6430, 6445, 6450, 6459, 6475, 6518, 6529, 6534, 6538, 6593, 6625, 6651, 6708, 6727, 6834, 6838, 6843, 6965, 7033, 7141, 7184, 7209, 7221, 7271, 7294, 7319, 7369, 7524, 7533, 7570, 7604, 7714, 7749, 7794, 7813, 7906, 7961, 8005, 8129, 8246, 8278, 8471, 8556, 8708, 8720, 8825, 9002, 9098, 9227, 9243, 9316, 9461, 9471, 9510, 9527, 9534, 9541, 9600, 9721, 9758, 9772, 9777, 9786, 9792, 10232, 10265, 10361, 10521, 10536, 10552, 10555, 10578, 10599, 10774, 10938, 11025, 11037, 11042, 11045, 11048, 11051, 11072, 11077, 11136, 11179, 11208, 11242, 11520, 11590, 11598, 11718, 11801, 11815, 11853, 12008, 12080, 12091, 12097, 12148, 12260, 12329, 12404, 12544, 12546, 12716, 12722, 12783, 12784, 12792, 12834, 12866, 12877, 13319, 13325, 13335, 13341, 13383, 13556, 13620, 13643, 13838, 14047, 14151, 14276, 14405, 14407, 14415, 14493, 14577, 14624, 14659, 14668, 14890, 14914, 15168, 15169, 15174, 15183, 15186, 15318, 15385, 15427, 15428, 15435, 15601, 15651, 15667, 15837, 15858, 15898, 15936, 15944, 15948, 16145, 16327, 16420, 16498, 16663, 16670, 16706, 16762, 16774, 16788, 16811, 16840, 16843, 16849, 16872, 16965, 16973, 16975, 17115, 17168, 17182, 17189, 17269, 17276, 17368, 17469, 17510, 17580, 17612, 17645, 17698, 17723, 17734, 17738, 17741, 17854, 17883, 17886, 17949, 17994, 17997, 18020, 18065, 18068, 18091, 18106, 18110, 18153, 18212, 18218, 18230, 18253, 18405, 18472, 18496, 18503, 18505, 18613, 18723, 18754, 18766, 18969, 19012, 19016, 19020, 19117, 19221, 19222, 19240, 19279, 19330, 19459, 19472, 19477, 19533, 19555, 19779, 19788, 19875, 19877, 19921, 19935, 20007, 20035, 20039, 20205, 20219, 20246, 20248, 20276, 20284, 20299, 20309, 20325, 20342, 20508, 20532, 20560, 20583, 20628, 20712, 20757, 20852, 20998, 21056, 21290, 21507, 21508, 21510, 21682, 21712, 21746, 21776, 21781, 21809, 21827, 21834, 21849, 21904, 21984, 22035, 22080, 22081, 22132, 22147, 22160, 22239, 22245, 22299, 22507, 22596, 22598, 22618, 22722, 22849, 22854, 22874, 22931, 23312, 23343, 23346, 23360, 23363, 23377, 23454, 23467, 23625, 23626, 23685, 23786, 23849, 23857, 23890, 23929, 23953, 24025, 24064, 24070, 24078, 24080, 24131, 24137, 24146, 24219, 24336, 24346, 24352, 24362, 24465, 24468, 24507, 24524, 24738, 24788, 24850, 24855, 24896, 25069, 25076, 25106, 25109, 25111, 25118, 25119, 25165, 25167, 25294, 25303, 25401, 25409, 25423, 25619, 25664, 25816, 25881, 25893, 25910, 25929, 25931, 25932, 25935, 26065, 26080, 26271, 26276, 26294, 26299, 26336, 26425, 26427, 26445, 26447, 26640, 26733, 26735, 26796, 26848, 26913, 26926, 26957, 27013, 27040, 27129, 27204, 27591, 27673, 27685, 27717, 27725, 27824, 27851, 27883, 27968, 27970, 27981, 28007, 28090, 28229, 28232, 28380, 28436, 28567, 28613, 28653, 28878, 29036, 29051, 29118, 29698, 29700, 29701, 29704, 29708, 29711, 29716, 29755, 29799, 29876, 29911, 30226, 30242, 30394, 30402, 30535, 30763, 30945, 30947, 31481, 31617, 31655, 32046, 32054, 32251, 32277, 32450, 32494, 32801, 32811, 33019, 33284, 33301, 33303, 33344, 33349, 33352, 33562, 33618, 33650, 33985, 34005, 34064, 34093, 34137, 34323, 34674, 34690, 34706, 34738, 34753, 34850, 34895, 34944, 35040, 35095, 35107, 35254, 35360, 35449, 35477, 35650, 35682, 35721, 35871, 35877, 35909, 35992, 36059, 36082, 36165, 36291, 36304, 36305, 36370, 36418, 36498, 36526, 36548, 36638, 36644, 36672, 36680, 36772, 36780, 36959, 37011, 37016, 37097, 37139, 37149, 37250, 37268, 37277, 37315, 37332, 37412, 37447, 37533, 37573, 37609, 37621, 37833, 37877, 37961, 37966, 38002, 38037, 38114, 38158, 38179, 38212, 38219, 38221, 38286, 38325, 38382, 38386, 38433, 38532, 38767, 38787, 38818, 38831, 38852, 38929, 38933, 38981, 39133, 39146, 39169, 39181, 39185, 39190, 39221, 39224, 39236, 39242, 39250, 39282, 39354, 39374, 39465, 39492, 39493, 39497, 39506, 39744, 39871, 39872, 39916, 40296, 40420, 40512, 40563, 40581, 40615, 40659, 40693, 40978, 41085, 41103, 41204, 41244, 41281, 41471, 41486, 41680, 41803, 41828, 41866, 41918, 42003, 42039, 42246, 42254, 42299, 42309, 42317, 42325, 42573, 42577, 42809, 43073, 43085, 43143, 43263, 43297, 43330, 43516, 43702, 43829, 43876, 44031, 44054, 44068, 44109, 44190, 44237, 44271, 44272, 44336, 44345, 44359, 44556, 44613, 44674, 44686, 44750, 44868, 44927, 45069, 45070, 45257, 45421, 45476, 45480, 45564, 45616, 45634, 45680, 45683, 45701, 45776, 46067, 46102, 46104, 46132, 46223, 46377, 46401, 46403, 46404, 46406, 46409, 46410, 46413, 46414, 46448, 46515, 46658, 46724, 47096, 47283, 47407, 47431, 47562, 47675, 47939, 48176, 48197, 48205, 48323, 48402, 48446, 48578, 48684, 48710, 48837, 49012, 49199, 49224, 49282, 49331, 49498, 49507, 49682, 49685, 49736, 49779, 49869, 50004, 50047, 50162, 50255, 50475, 50477, 50501, 50502, 50509, 50516, 50662, 50752, 50825, 50874, 50875, 50942, 50979, 51121, 51186, 51341, 51395, 51486, 51650, 51716, 51737, 51798, 51843, 52004, 52034, 52037, 52179, 52250, 52292, 52361, 52404, 52430, 52486, 52595, 52670, 52707, 52811, 52976, 52980, 52983, 53009, 53140, 53220, 53311, 53523, 53776, 53781, 53832, 53938, 54291, 54325, 54426, 54452, 54569, 54709, 54821, 54851, 54855, 54867, 55266, 55313, 55317, 55363, 55368, 55405, 55482, 55520, 55589, 55617, 55620, 55706, 55797, 55918, 55929, 56074, 56137, 56309, 56348, 56376, 56516, 56647, 56861, 56899, 56900, 56902, 56909, 57032, 57042, 57156, 57284, 57342, 57407, 57496, 57514, 57540, 57666, 57720, 57858, 58027, 58069, 58146, 58380, 58386, 58475, 58479, 58483, 58495, 58499, 58580, 58604, 58640, 58661, 58697, 58703, 58804, 58849, 58871, 58945, 58951, 58957, 58979, 59017, 59203, 59422, 59678, 59813, 60086, 60130, 60133, 60194, 60232, 60236, 60317, 60457, 60482, 60489, 60490, 60511, 60549, 60578, 60616, 60645, 60672, 60711, 60736, 60860, 60862, 60901, 60914, 60952, 60965, 61200, 61253, 61633, 61860, 61967, 62024, 62057, 62082, 62283, 62385, 62602, 62627, 62724, 62787, 62790, 62799, 62843, 62862, 63217, 63255, 63299, 63346, 63504, 63561, 63562, 63860, 63886, 63995, 64297, 64384, 64579, 64582, 64620, 64888, 64953, 65031, 65124, 65160, 65269, 65278, 65440, 65459]}
+def ID_template(GIFT, ROUND, P1, P2, P, conv):
+    """The LPTemplate of ID_lp, rendered once per process."""
+    return cached_template("ID", GIFT, ROUND, lambda: LPTemplate(
+        lambda path, in_bin, out_bin: ID_lp(path, GIFT, ROUND, GIFT // 4, P1, P2, P, conv, in_bin, out_bin),
+        GIFT, "x0", f"x{ROUND}"))
+
+def ID_solver(GIFT, ROUND, P1, P2, P, conv, persistent=False, backend="GUROBI", relax=False, cache=False, filename=None):
+    """solve(in_diff, out_diff) of impossible_diff, on the persistent model or through the LP file filename."""
+    # The rounds are rendered once, only the boundary constraints change between pairs
+    template = ID_template(GIFT, ROUND, P1, P2, P, conv)
+    # LP files are read by gurobipy, the other backends always solve on the persistent model
+    if persistent or backend != "GUROBI":
+        model = cached_model("ID", GIFT, ROUND, lambda: ID_model(GIFT, ROUND, GIFT // 4, P1, P2, P, conv, backend), backend)
+        # The pairs whose LP relaxation is infeasible are settled without solving the MILP
+        solve = (screened(model) if relax else model).solve
+    else:
+        filename = filename or f"Trial_GIFT_{GIFT}_ROUND_{ROUND}.lp"
+        def solve(in_diff, out_diff):
+            template.write(filename, in_diff, out_diff)
+            return solve_lp_file(filename)
+    # Pairs solved before on the same model, by any run or script, are answered without writing any LP file
+    return cached_solve(solve, template.digest) if cache else solve
+
+def ID_pairs(ROUND, potential_ID):
+    """
+    Every (in_diff, out_diff) pair of the classes of the potential pairs, in the order they are solved: for each
+    potential pair (x, y), each difference of the class of x with each difference of the class of y.
+    """
     for x in potential_ID.keys():
         x1 = (x >> 48) & 0xFFFF
         x2 = (x >> 32) & 0xFFFF
         x3 = (x >> 16) & 0xFFFF
         x4 = x & 0xFFFF
-        prod_in = product(ddt1[x1], ddt1[x2], ddt1[x3], ddt1[x4])
+        # The classes of the blocks, whose product is walked again for every y
+        in_classes = (ddt1[x1], ddt1[x2], ddt1[x3], ddt1[x4])
         with open(f"Trial_Impossible_ID_Round_{ROUND}.txt", "a") as file:
             file.write("\nPotential ID key = " + str(x) + "\n")
         for y in potential_ID[x]:
@@ -219,28 +303,49 @@ def impossible_diff(GIFT, ROUND, P1, P2, P, conv, potential_ID):
             y2 = (y >> 32) & 0xFFFF
             y3 = (y >> 16) & 0xFFFF
             y4 = y & 0xFFFF
-            prod_out = product(ddt2[y1], ddt2[y2], ddt2[y3], ddt2[y4])
-            for z1, z2, z3, z4 in prod_in:
+            out_classes = (ddt2[y1], ddt2[y2], ddt2[y3], ddt2[y4])
+            for z1, z2, z3, z4 in product(*in_classes):
                 in_diff = ((z1 << 48) | (z2 << 32) | (z3 << 16) | z4) & 0xFFFFFFFFFFFFFFFF
-                for t1, t2, t3, t4 in prod_out:
+                for t1, t2, t3, t4 in product(*out_classes):
                     out_diff = ((t1 << 48) | (t2 << 32) | (t3 << 16) | t4) & 0xFFFFFFFFFFFFFFFF
-                    in_diff_bin = bin(in_diff)[2:].zfill(GIFT)
-                    out_diff_bin = bin(out_diff)[2:].zfill(GIFT)
-                    filename = f"Trial_GIFT_{GIFT}_ROUND_{ROUND}.lp"
-                    ID_lp(filename, GIFT, ROUND, GIFT // 4, P1, P2, P, conv, in_diff_bin, out_diff_bin)
+                    yield in_diff, out_diff
 
-                    feasible = solve_lp_file(filename)
-                    if feasible is False:
-                        non_feasible_diff[in_diff].append(out_diff)
+def impossible_diff(GIFT, ROUND, P1, P2, P, conv, potential_ID, persistent=False, processes=1, threads=None, prefilter=False,
+                    backend="GUROBI", relax=False, truncated=False, resume=False, cache=False, symmetry=False):
+    non_feasible_diff = defaultdict(list)
+    stage_stats.clear()
+    list_excluded = defaultdict(list)
+    solver = partial(ID_solver, GIFT, ROUND, P1, P2, P, conv, persistent, backend, relax, cache)
+    # Pairs proven impossible by their nibble activity, then by bit propagation, are not solved
+    propagator = ID_propagator(GIFT, ROUND, P1, P2, P, conv)
+    prefilters = []
+    if truncated:
+        prefilters.append(("truncated", TruncatedFilter(propagator.layers, GIFT, backend).impossible))
+    if prefilter:
+        prefilters.append(("propagation", propagator.impossible))
+    # Solved pairs are journaled as they come, and a restarted run on the same model takes them from the journal
+    journal = PairJournal(f"Trial_Impossible_ID_Round_{ROUND}_Journal.db", ID_template(GIFT, ROUND, P1, P2, P, conv).digest) if resume else None
+    # Of the pairs a symmetry of the round model maps onto each other only the first is solved
+    canonical = PairCanonicalizer(layer_automorphisms(propagator.layers, GIFT)) if symmetry else None
+    for in_diff, out_diff, feasible in pair_results(ID_pairs(ROUND, potential_ID), solver, processes, threads,
+                                                    chunk_size=256 if prefilters else 16,
+                                                    scratch_prefix=f"Trial_GIFT_{GIFT}_ROUND_{ROUND}_",
+                                                    prefilters=prefilters, journal=journal, canonical=canonical):
+        if feasible is False:
+            non_feasible_diff[in_diff].append(out_diff)
     total = 0
     with open(f"Trial_Impossible_ID_Round_{ROUND}.txt", "a") as file:
         file.write("non_feasible_diff = " + str(non_feasible_diff) + "\n")
         for i in non_feasible_diff.keys():
             total = total + len(non_feasible_diff[i])
         file.write("number of non_feasible_diff = " + str(total) + "\n")
+        file.write(stage_report() + "\n")
                                     
     print(f"Dictionary of non feasible differences is {non_feasible_diff}")
     print(f"excluded list = {list_excluded}")
+    if journal is not None:
+        journal.close()
+    print(stage_report())
     return non_feasible_diff
     
 if __name__ == "__main__":
@@ -252,22 +357,43 @@ if __name__ == "__main__":
     ROUND = int(sys.argv[2])
     solver = sys.argv[3]
 
-    if solver != "GUROBI":
-        print("Unsupported solver. Only GUROBI is supported.")
+    if solver not in BACKENDS and solver != "BENCHMARK":
+        print(f"Unsupported solver. Supported solvers: {', '.join(BACKENDS)} (or BENCHMARK).")
         sys.exit(1)
 
-    P1 = [0, 5, 10, 15, 12, 1, 6, 11, 8, 13, 2, 7, 4, 9, 14, 3,
-          16, 21, 26, 31, 28, 17, 22, 27, 24, 29, 18, 23, 20, 25, 30, 19,
-          32, 37, 42, 47, 44, 33, 38, 43, 40, 45, 34, 39, 36, 41, 46, 35,
-          48, 53, 58, 63, 60, 49, 54, 59, 56, 61, 50, 55, 52, 57, 62, 51]
-
-    P2_16_byte = [0, 4, 8, 12, 1, 5, 9, 13, 2, 6, 10, 14, 3, 7, 11, 15]
-    P2 = generate_permutation(P2_16_byte, GIFT)
+    # Build the model once per round count and change only the boundary bits between pairs,
+    # instead of writing and reading an LP file for every pair
+    persistent = True
+    # Pairs are spread over this many worker processes, each capped at `threads` Gurobi threads
+    # (None: an equal share of the cores)
+    processes = cpu_count()
+    threads = None
+    # Reject the pairs proven impossible by bit propagation before building any model
+    prefilter = True
+    # Decide each pair of nibble activity patterns once on a word-level model, before the bit propagation.
+    # Off for GIFT: the bit permutation spreads the activity of a nibble over four nibbles, and the
+    # truncated model proves none of the pairs impossible (IVLBC, with the branch number of MC, does)
+    truncated = False
+    # Journal every solved pair and skip those already solved by an interrupted run
+    resume = True
+    # Answer the pairs solved before on the same model, by any run or script, from the solve cache
+    cache = True
+    # Solve one pair per orbit of the nibble permutations and bit rotations the round model is invariant under.
+    # Off for GIFT: its round model only has an involution of the nibbles, which saves next to no solves and
+    # costs a canonicalization of every pair (IVLBC, with 24 automorphisms, does save)
+    symmetry = False
+    # Solve the LP relaxation of each pair first and the MILP only if the relaxation is feasible.
+    # Off by default: on the 4-round models the MILP presolve decides a pair faster than the LP,
+    # and the relaxation settles few of the pairs left by the pre-filter (see the stage report)
+    relax = False
+    # Number of active 16-bit blocks of the potential pairs: 1 for the published ones, 2 or 3 for those merged by
+    # the potential pairs script run with the same setting; the tasks and result files then get an _Active_ suffix
+    active_blocks = 1
+    mode = "" if active_blocks == 1 else f"_Active_{active_blocks}"
 
-    P = [0, 17, 34, 51, 48,  1, 18, 35, 32, 49,  2, 19, 16, 33, 50,  3,
-         4, 21, 38, 55, 52,  5, 22, 39, 36, 53,  6, 23, 20, 37, 54,  7,
-         8, 25, 42, 59, 56,  9, 26, 43, 40, 57, 10, 27, 24, 41, 58, 11,
-        12, 29, 46, 63, 60, 13, 30, 47, 44, 61, 14, 31, 28, 45, 62, 15]
+    P1 = block_permutation(GIFT_P16, GIFT // 16)
+    P2 = generate_permutation(GIFT_P2_16_BYTE)
+    P = GIFT_P64
     
     in_rep = [0, 2006, 2105, 2821, 4133, 12299, 15871, 25552, 30590, 31199, 31868, 32160, 34527, 37043]
     out_rep = [0, 13, 161, 2039, 2480, 4354, 7901, 14777, 30427, 37113, 39359, 40025, 40461, 40861]
@@ -293,8 +419,20 @@ if __name__ == "__main__":
             -2, -2, 0, 0, 2, -1, -1, -1, 5,
              1, -1, -1, 2, -3, -1, -2, -3, 8,     
     )
-    index = int(input("Enter value of task: "))
-    non_feasible_diff = {131465216: [4354, 285343744, 55834574848, 1225542048598196224, 3659174697238528, 18700287606784, 161, 2480], 137953280: [851968, 10551296, 4354, 133627904, 2432237568, 2579431424, 55834574848, 691489734656, 13, 40461, 45317471250415616, 698057942242426880, 1225542048598196224, 2223933790990893056, 10446380810662576128, 11388759032689852416, 11501349023374114816, 40861, 3659174697238528, 10651518894080, 18700287606784, 161, 63466731732992, 2480, 39359, 2623078400, 7901, 37113], 184877056: [851968, 10551296, 4354, 285343744, 55834574848, 691489734656, 13, 45317471250415616, 698057942242426880, 1225542048598196224, 3659174697238528, 10651518894080, 18700287606784, 161, 63466731732992, 2480, 2623078400], 270860288: [851968, 10551296, 4354, 162529280, 285343744, 517799936, 2432237568, 2579431424, 55834574848, 691489734656, 13, 40461, 8757438316544, 45317471250415616, 573927477513027584, 1225542048598196224, 10446380810662576128, 40861, 3659174697238528, 10651518894080, 18700287606784, 161, 63466731732992, 159399121256448, 169045617803264, 173778671763456, 2480, 2623078400, 2651652096, 2677866496, 7901, 37113], 806027264: [851968, 10551296, 4354, 133627904, 285343744, 2432237568, 2579431424, 55834574848, 691489734656, 13, 40461, 45317471250415616, 698057942242426880, 1225542048598196224, 2223933790990893056, 10446380810662576128, 11388759032689852416, 11501349023374114816, 40861, 3659174697238528, 18700287606784, 161, 2480, 39359, 7901, 37113], 2821: [851968, 10551296, 4354, 162529280, 285343744, 55834574848, 691489734656, 13, 45317471250415616, 698057942242426880, 1225542048598196224, 4159355730853363712, 3659174697238528, 18700287606784, 161, 171906066022400, 2480], 1674575872: [4354, 285343744, 55834574848, 1225542048598196224, 3659174697238528, 18700287606784, 161, 2480], 2004746240: [4354, 285343744, 3659174697238528, 18700287606784], 2044657664: [18700287606784], 2088501248: [4354, 285343744, 1225542048598196224, 18700287606784], 12299: [851968, 10551296, 4354, 162529280, 285343744, 517799936, 2432237568, 2579431424, 55834574848, 691489734656, 13, 40461, 8757438316544, 45317471250415616, 1225542048598196224, 40861, 3659174697238528, 18700287606784, 161, 159399121256448, 169045617803264, 2480, 2651652096, 2677866496, 7901, 37113], 2107637760: [4354, 285343744, 1225542048598196224, 18700287606784], 8615704395776: [851968, 4354, 285343744, 55834574848, 45317471250415616, 698057942242426880, 1225542048598196224, 18700287606784], 9040906158080: [851968, 10551296, 162529280, 285343744, 968425472, 55834574848, 691489734656, 13, 45317471250415616, 698057942242426880, 1225542048598196224, 2223933790990893056, 10446380810662576128, 11078573608354709504, 11388759032689852416, 11501349023374114816, 175496658681856, 3659174697238528, 10651518894080, 18700287606784, 161, 33934536605696, 159399121256448, 173778671763456, 39359, 40025, 2039, 37113], 12116102742016: [851968, 10551296, 4354, 162529280, 285343744, 968425472, 55834574848, 691489734656, 13, 45317471250415616, 698057942242426880, 1225542048598196224, 3659174697238528, 10651518894080, 18700287606784, 161, 40025], 148292335828992: [18700287606784], 159098473545728: [851968, 10551296, 285343744, 691489734656, 13, 45317471250415616, 698057942242426880, 1225542048598196224, 2223933790990893056, 10446380810662576128, 11078573608354709504, 11388759032689852416, 11501349023374114816, 175496658681856, 3659174697238528, 10651518894080, 18700287606784, 161, 33934536605696, 159399121256448, 173778671763456, 39359, 2039, 37113], 17751099834368: [851968, 10551296, 4354, 133627904, 162529280, 285343744, 968425472, 2432237568, 2579431424, 55834574848, 691489734656, 13, 40461, 8757438316544, 45317471250415616, 698057942242426880, 1225542048598196224, 2223933790990893056, 10446380810662576128, 11388759032689852416, 11501349023374114816, 40861, 3659174697238528, 18700287606784, 161, 159399121256448, 2480, 39359, 2651652096, 40025, 7901, 37113], 32160: [4354, 285343744, 1225542048598196224, 18700287606784], 52823802773504: [851968, 10551296, 4354, 285343744, 55834574848, 691489734656, 13, 45317471250415616, 698057942242426880, 1225542048598196224, 2223933790990893056, 10446380810662576128, 11078573608354709504, 11388759032689852416, 11501349023374114816, 175496658681856, 3659174697238528, 10651518894080, 18700287606784, 161, 33934536605696, 159399121256448, 173778671763456, 39359, 2039, 37113], 109745004347392: [851968, 4354, 285343744, 55834574848, 45317471250415616, 698057942242426880, 1225542048598196224, 18700287606784], 131383049584640: [4354, 285343744, 55834574848, 1225542048598196224], 4133: [851968, 10551296, 4354, 162529280, 285343744, 517799936, 2432237568, 55834574848, 691489734656, 13, 45317471250415616, 573927477513027584, 698057942242426880, 1225542048598196224, 4159355730853363712, 10446380810662576128, 11078573608354709504, 11388759032689852416, 175496658681856, 3659174697238528, 10651518894080, 18700287606784, 161, 33934536605696, 159399121256448, 169045617803264, 171906066022400, 173778671763456, 2651652096, 2677866496, 2039, 37113], 133998684667904: [285343744], 136872017788928: [4354, 285343744, 1225542048598196224, 18700287606784], 138126148239360: [4354, 285343744, 1225542048598196224, 18700287606784], 37043: [851968, 10551296, 4354, 162529280, 285343744, 517799936, 2432237568, 2579431424, 55834574848, 691489734656, 40461, 8757438316544, 45317471250415616, 1225542048598196224, 40861, 3659174697238528, 161, 159399121256448, 169045617803264, 2480, 2651652096, 2677866496, 7901, 37113], 2105: [851968, 10551296, 4354, 162529280, 285343744, 517799936, 2432237568, 2579431424, 55834574848, 691489734656, 13, 40461, 8757438316544, 45317471250415616, 698057942242426880, 1225542048598196224, 4159355730853363712, 40861, 3659174697238528, 161, 159399121256448, 169045617803264, 171906066022400, 2480, 2651652096, 2677866496, 7901, 37113], 2262761472: [1225542048598196224], 2427650048: [851968, 10551296, 4354, 133627904, 2432237568, 2579431424, 55834574848, 691489734656, 13, 40461, 45317471250415616, 698057942242426880, 1225542048598196224, 2223933790990893056, 10446380810662576128, 11388759032689852416, 11501349023374114816, 40861, 18700287606784, 161, 2480, 39359, 7901, 37113], 25552: [10551296, 4354, 162529280, 285343744, 13, 1225542048598196224, 3659174697238528, 18700287606784], 2006: [10551296, 4354, 162529280, 285343744, 13, 1225542048598196224, 3659174697238528, 18700287606784], 31199: [1225542048598196224], 34527: [4354], 31868: [4354, 285343744, 1225542048598196224, 18700287606784], 30590: [285343744, 13, 1225542048598196224, 18700287606784]}
+    if solver == "BENCHMARK":
+        # Per-pair solve time of every backend on the stored potential pairs of this number of rounds
+        stored = read_potential_pairs(f"Potential_Pairs_Round_{ROUND}.txt")
+        pairs = [(in_diff, out_diff) for in_diff in stored for out_diff in stored[in_diff]]
+        count = int(input(f"Enter the number of pairs to solve (at most {len(pairs)}): "))
+        benchmark(lambda backend: ID_model(GIFT, ROUND, GIFT // 4, P1, P2, P, conv, backend), pairs[:count])
+        sys.exit(0)
+    # The potential pairs of this number of rounds merged by the potential pairs script run with the same
+    # setting, else for one active block the published ones
+    filename = potential_pairs_file(ROUND, mode)
+    if filename is None:
+        print(f"There are no potential pairs of {ROUND} rounds: run the potential pairs script with the same setting first")
+        sys.exit(1)
+    non_feasible_diff = read_potential_pairs(filename)
     print(f"The difference pairs that have potential to contain IDs is {non_feasible_diff}")
     total = 0
     for i in non_feasible_diff.keys():
@@ -304,16 +442,30 @@ if __name__ == "__main__":
     print("Round = ", ROUND, ", input representatives: ", len(in_rep), " and output representatives = ", len(out_rep))
     if total == 0:
         sys.exit(0)
-    with open(f"Trial_Impossible_ID_Round_{ROUND}.txt", "a") as file:
-        file.write("ROUND = " + str(ROUND) + " and index = " + str(index) + "\n")
-    ID = impossible_diff(GIFT, ROUND, P1, P2, P, conv, non_feasible_diff)
-    print("number of keys in ddt = ", non_feasible_diff.keys())
-    total = 0
-    if ID:
-        for i in ID.keys():
-            total = total + len(ID[i])
-        print(f"Total IDs = {total}")
-    else:
-        print("There are no IDs")
-        
-    
+    # The potential pairs are split into shards claimed from a queue shared by the runs of this script on
+    # any machine, and the run finishing the last shard merges the IDs of all of them. The queue is keyed on the
+    # model and on the pairs, so a run on other potential pairs or another model does not reuse the shards done
+    shards = 16
+    pairs = [(in_diff, out_diff) for in_diff in sorted(non_feasible_diff) for out_diff in non_feasible_diff[in_diff]]
+    inputs = {"model": ID_template(GIFT, ROUND, P1, P2, P, conv).digest, "tables": [ddt1.digest, ddt2.digest], "pairs": pairs}
+    queue = ShardQueue(queue_directory(f"Trial_Impossible_ID_Round_{ROUND}{mode}_Tasks", inputs), shards)
+    for index in queue.claimed():
+        part = defaultdict(list)
+        for in_diff, out_diff in pairs[index::shards]:
+            part[in_diff].append(out_diff)
+        with open(f"Trial_Impossible_ID_Round_{ROUND}.txt", "a") as file:
+            file.write("ROUND = " + str(ROUND) + " and index = " + str(index) + "\n")
+        ID = impossible_diff(GIFT, ROUND, P1, P2, P, conv, part, persistent, processes, threads, prefilter, solver, relax, truncated, resume, cache, symmetry)
+        print("number of keys in ddt = ", part.keys())
+        if queue.complete(index, ID):
+            ID = queue.merged()
+            total = 0
+            for i in ID.keys():
+                total = total + len(ID[i])
+            with open(f"Trial_Impossible_IDs_Round_{ROUND}{mode}.txt", "w") as file:
+                file.write(str(ID) + "\n")
+                file.write("number of IDs = " + str(total) + "\n")
+            if ID:
+                print(f"Total IDs = {total}")
+            else:
+                print("There are no IDs")
@@ -0,0 +1,26 @@
+# GIFT-64 bit permutation, and the permutations of the 16-bit super-box and of the super-box columns
+GIFT_P64 = [0, 17, 34, 51, 48,  1, 18, 35, 32, 49,  2, 19, 16, 33, 50,  3,
+            4, 21, 38, 55, 52,  5, 22, 39, 36, 53,  6, 23, 20, 37, 54,  7,
+            8, 25, 42, 59, 56,  9, 26, 43, 40, 57, 10, 27, 24, 41, 58, 11,
+           12, 29, 46, 63, 60, 13, 30, 47, 44, 61, 14, 31, 28, 45, 62, 15]
+GIFT_P16 = [0, 5, 10, 15, 12, 1, 6, 11, 8, 13, 2, 7, 4, 9, 14, 3]
+GIFT_P2_16_BYTE = [0, 4, 8, 12, 1, 5, 9, 13, 2, 6, 10, 14, 3, 7, 11, 15]
+
+def superbox_permutation(n):
+    """
+    GIFT_P16 generalized to a super-box of n / 4 nibbles: bit b of nibble j goes to bit b of nibble
+    (b - j) mod n / 4, so superbox_permutation(16) == GIFT_P16.
+    """
+    m = n // 4
+    return [4 * ((b - j) % m) + b for j in range(m) for b in range(4)]
+
+def block_permutation(P16, blocks):
+    """The 16-bit permutation applied to each of the 16-bit blocks of a state."""
+    return [16 * b + p for b in range(blocks) for p in P16]
+
+def inverse_permutation(permutation):
+    """inverse[j] is the index i with permutation[i] = j, i.e. permutation.index(j) for every j."""
+    inverse = [0] * len(permutation)
+    for i, p in enumerate(permutation):
+        inverse[p] = i
+    return inverse
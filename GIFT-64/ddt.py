@@ -1,97 +1,87 @@
 import sys
 import os
-from gurobipy import GRB, read
-import itertools
-from itertools import product
 from collections import defaultdict
-from multiprocessing import Pool, cpu_count
+import numpy as np
+# The modules shared by both ciphers are in ../common
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from superbox import build_sps_table
+from cipher_layer import GIFT_P16
+from artifact_cache import cached_array, cached_artifact, save_arrays
+from milp_data import save_partition_table
 
-def apply_sbox(input_bits, sbox):
-    return sbox[input_bits]
-
-def apply_permutation(input_bits, permutation, n):
-    """Applies the permutation to a 16-bit input."""
-    output_bits = 0
-    for i in range(n):
-        # Extract the i-th bit from input_bits and place it at the new position
-        if input_bits & (1 << i):
-            output_bits |= (1 << permutation[i])
-    return output_bits
-    
-def SMS(input_value, sbox, permutation, n):
-    blocks = [(input_value >> (4 * i)) & 0xF for i in range(n // 4)]
-    
-    # Apply the S-box to each 4-bit block
-    substituted_blocks = [apply_sbox(block, sbox) for block in blocks]
-    
-    # Combine the substituted blocks into a single 16-bit value
-    substituted_value = 0
-    for i in range(n // 4):
-        substituted_value |= (substituted_blocks[i] << (4 * i))
-    
-    # Apply the permutation to the 16-bit substituted value
-    state_value = apply_permutation(substituted_value, permutation, n)
+def precompute_sms(size, sbox, P, n):
+    # S o P o S of every x < size, computed with a few array operations
+    return build_sps_table(sbox, P, n)[:size]
 
-    # Split input_value into four 4-bit blocks
-    blocks = [(state_value >> (4 * i)) & 0xF for i in range(n // 4)]
-    
-    # Apply the S-box to each 4-bit block
-    substituted_blocks = [apply_sbox(block, sbox) for block in blocks]
+# Label of the differences that are in no class
+UNLABELED = 0xFFFF
 
-    # Combine the substituted blocks into a single 16-bit value
-    output_value = 0
-    for i in range(n // 4):
-        output_value |= (substituted_blocks[i] << (4 * i))
-    
-    return output_value
+def partition_labels(sms_table, size, representatives):
+    """
+    Partition table as a dense label array: labels[d] is the index of the first representative whose DDT
+    row contains d, or UNLABELED. Assigning the labels from the last representative to the first lets the
+    earlier ones overwrite the later ones, which is the order in which the classes take their differences.
+    Also returns the DDT row size of every representative.
+    """
+    labels = np.full(size, UNLABELED, dtype=np.uint16)
+    ddt_sizes = np.zeros(len(representatives), dtype=np.int64)
+    x = np.arange(size)
+    for k in range(len(representatives) - 1, -1, -1):
+        outputs = np.unique(sms_table[x] ^ sms_table[x ^ representatives[k]])
+        labels[outputs] = k
+        ddt_sizes[k] = len(outputs)
+    return labels, ddt_sizes
 
-def precompute_sms_worker(args):
-    x, sbox, P, n = args
-    return SMS(x, sbox, P, n)
+def partition_members(labels, n_classes):
+    """Sorted members of every class: class k is members[offsets[k]:offsets[k + 1]]."""
+    counts = np.bincount(labels[labels != UNLABELED], minlength=n_classes)
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    # A stable sort keeps every class in increasing order
+    members = np.argsort(labels, kind='stable')[:offsets[-1]].astype(labels.dtype)
+    return offsets, members
 
-def precompute_sms(size, sbox, P, n):
-    with Pool(cpu_count()) as pool:
-        sms_table = pool.map(precompute_sms_worker, [(x, sbox, P, n) for x in range(size)])
-    return sms_table
+def save_partition(directory, sms_table, size, representatives):
+    """Computes the partition table and stores it as arrays: H[representatives[k]] = members[offsets[k]:offsets[k + 1]]."""
+    labels, ddt_sizes = partition_labels(sms_table, size, representatives)
+    offsets, members = partition_members(labels, len(representatives))
+    save_arrays(directory, representatives=np.array(representatives, dtype=np.int64), ddt_sizes=ddt_sizes,
+                labels=labels, offsets=offsets, members=members)
 
-def calculate_ddt_worker(args):
-    x, input_diff, sms_table = args
-    return sms_table[x] ^ sms_table[x ^ input_diff]
+def load_partition(partition):
+    representatives = partition["representatives"].tolist()
+    offsets = partition["offsets"]
+    H = defaultdict(list)
+    for k, i in enumerate(representatives):
+        H[i] = partition["members"][offsets[k]:offsets[k + 1]].tolist()
+    return H
 
-def calculate_ddt(sms_table, size, representatives):
-    ddt = defaultdict(list)
-    with Pool(cpu_count()) as pool:
-        for input_diff in representatives:
-            buf = ''
-            if (input_diff%(5)==0):
-                print(input_diff)
-            results = list(set(pool.map(calculate_ddt_worker, [(x, input_diff, sms_table) for x in range(size)])))
-            ddt[input_diff] = results
-    return ddt
 
+# The data folder of this cipher, next to the script whatever the working directory
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
 if __name__ == "__main__":
     m = 16
-    P = [0, 5, 10, 15, 12, 1, 6, 11, 8, 13, 2, 7, 4, 9, 14, 3]
+    P = GIFT_P16
     
     S = [0x1, 0xa, 0x4, 0xc, 0x6, 0xf, 0x3, 0x9, 0x2, 0xd, 0xb, 0x7, 0x5, 0x0, 0x8, 0xe]
     #S = [0xd, 0x0, 0x8, 0x6, 0x2, 0xc, 0x4, 0xb, 0xe, 0x7, 0x1, 0xa, 0x3, 0x9, 0xf, 0x5] # Inverse
     size = 2 ** (m)
     representatives = [0, 13, 161, 2039, 2480, 4354, 7901, 14777, 30427, 37113, 39359, 40025, 40461, 40861]  # <-- ddt2
     #[0, 2006, 2105, 2821, 4133, 12299, 15871, 25552, 30590, 31199, 31868, 32160, 34527, 37043] # <-- ddt1
-    sms_table = precompute_sms(size, S, P, m)
-    ddt = calculate_ddt(sms_table, size, representatives)
-    #print(ddt)
+    # Write the partition table to data/<name>, where the MILP scripts read it, replacing the stored one
+    # (the same classes for the same representatives, with their members in increasing order)
+    store = False
+    name = "ddt2"  # "ddt1" for the input representatives
+    # Tables and partition results are reused across runs from the on-disk cache
+    params = {"sbox": S, "permutation": P, "n": m}
+    sms_table = cached_array("sps_table", params, lambda: precompute_sms(size, S, P, m))
+    partition = cached_artifact("partition_table", {**params, "representatives": representatives},
+                                lambda directory: save_partition(directory, sms_table, size, representatives))
     print(f"representatives = {len(representatives)}")
-    for i in ddt.keys():
-        print(f"ddt[{i}] = {len(ddt[i])}")
+    for i, ddt_size in zip(representatives, partition["ddt_sizes"].tolist()):
+        print(f"ddt[{i}] = {ddt_size}")
     
-    H = defaultdict(list)
-    for i in ddt.keys():
-        H[i] = ddt[i]
-        for j in ddt.keys():
-            if j != i:
-                ddt[j] = [x for x in ddt[j] if x not in H[i]] 
+    H = load_partition(partition)
     total = 0
     for i in H.keys():
        print(f"H[{i}] = {len(H[i])}")
@@ -99,15 +89,14 @@ if __name__ == "__main__":
     print("total = ", total)
     #print("H = ", H)
 
-    X = [x for x in range(size)]
-    for i in ddt.keys():
-        X = [x for x in X if x not in ddt[i]]
+    # Differences in none of the classes
+    X = np.flatnonzero(partition["labels"] == UNLABELED).tolist()
 
     if not X:
         print("X is empty")
     else:
         print("X is not empty \n X = ", X, " with length = ", len(X))
     print("H = ", H)
-        
-    
-        
+    if store:
+        save_partition_table(name, H, DATA_DIR)
+        print(f"Partition table written to data/{name}")
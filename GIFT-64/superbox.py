@@ -0,0 +1,36 @@
+import numpy as np
+
+
+def table_dtype(n):
+    """Smallest unsigned dtype holding an n-bit super-box value."""
+    return np.uint16 if n <= 16 else np.uint32
+
+def permutation_tables(sbox, permutation, n):
+    """Nibble-indexed tables T[i][v] = P(S(v) << 4i), i.e. the first S-box layer and P folded together."""
+    dtype = table_dtype(n)
+    values = np.arange(16, dtype=dtype)
+    substituted = np.asarray(sbox, dtype=dtype)[values]
+    tables = np.zeros((n // 4, 16), dtype=dtype)
+    for i in range(n // 4):
+        shifted = substituted << (4 * i)
+        for bit in range(n):
+            tables[i] |= ((shifted >> bit) & 1) << permutation[bit]
+    return tables
+
+def build_sps_table(sbox, permutation, n):
+    """Computes the whole S o P o S table for all 2^n inputs with a few array operations."""
+    dtype = table_dtype(n)
+    x = np.arange(2 ** n, dtype=dtype)
+    tables = permutation_tables(sbox, permutation, n)
+
+    # First S-box layer and the permutation, one table lookup per nibble
+    state = np.zeros_like(x)
+    for i in range(n // 4):
+        state ^= tables[i][(x >> (4 * i)) & 0xF]
+
+    # Second S-box layer
+    sbox = np.asarray(sbox, dtype=dtype)
+    output = np.zeros_like(x)
+    for i in range(n // 4):
+        output |= sbox[(state >> (4 * i)) & 0xF] << (4 * i)
+    return output
@@ -1,27 +1,29 @@
 import sys
 import os
-from gurobipy import GRB, read
-import itertools
-from itertools import product
+from functools import partial
 from collections import defaultdict
-from multiprocessing import Pool, cpu_count
-
-def generate_permutation(P16_byte, size):
-    return [e * 4 + i for e in P16_byte for i in range(4)]
-
-def initialize_mc_positions(IVLBC):
-    s_boxes = IVLBC // 4
-    positions = []
-    for i in range(16):
-        if i < 4:
-            positions.append([e * 4 + (i % 4) for e in [1, 2, 3]])
-        elif i < 8:
-            positions.append([e * 4 + (i % 4) for e in [0, 2, 3]])
-        elif i < 12:
-            positions.append([e * 4 + (i % 4) for e in [0, 1, 3]])
-        else:
-            positions.append([e * 4 + (i % 4) for e in [0, 1, 2]])
-    return positions
+from multiprocessing import cpu_count
+# The modules shared by both ciphers are in ../common
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from milp_data import PartitionTable, activity_groups
+from lp_template import LPTemplate, cached_template
+from solve_cache import cached_solve, cached_enumeration
+from milp_model import LinearSystem, add_sbox_constraints, add_mc_constraints, cached_model, apply_solver_params, screened, stage_stats, stage_report
+from milp_backend import BACKENDS, build_model
+from milp_journal import PairJournal
+from milp_pool import pair_results, undecided_outputs
+from truncated import TruncatedFilter
+from symmetry import layer_automorphisms, PairCanonicalizer
+from shard_queue import ShardQueue, queue_directory
+from propagation import Propagator, SboxLayer, LinearLayer, sbox_transitions, permutation_rows, mc_rows
+from permutation import generate_permutation
+from cipher_layer import initialize_mc_positions, IVLBC_P16_BYTE
+
+# The data folder of this cipher, next to the script whatever the working directory
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Partition tables of the representatives, memory-mapped on first use
+ddt = PartitionTable("ddt", DATA_DIR)
 
 def potential_ID_lp(filename, IVLBC, ROUND, s_boxes, Perm, conv, IVLBC_MC_pos, in_diff_bin, out_diff_bin):
     try:
@@ -111,10 +113,44 @@ def potential_ID_lp(filename, IVLBC, ROUND, s_boxes, Perm, conv, IVLBC_MC_pos, i
         print(f"Error writing LP file: {e}")
         sys.exit(1)
 
+def potential_ID_model(IVLBC, ROUND, s_boxes, Perm, conv, IVLBC_MC_pos, backend="GUROBI"):
+    """The model of potential_ID_lp for a backend, with x0 and x{ROUND+3} as boundary bits."""
+    system = LinearSystem()
+    x = [system.add_vars(IVLBC, f"x{i}") for i in range(ROUND + 4)]
+    y = {i: system.add_vars(IVLBC, f"y{i}") for i in range(2, ROUND + 2)}
+    z = {i: system.add_vars(IVLBC, f"z{i}", binary=False) for i in range(1, ROUND + 2)}
+
+    system.add_equalities(x[1], [x[0][Perm[j]] for j in range(IVLBC)])
+    add_mc_constraints(system, x[1], z[1], x[2], IVLBC, IVLBC_MC_pos)
+
+    # Constraints for each round
+    for i in range(2, ROUND + 2):
+        add_sbox_constraints(system, x[i], y[i], s_boxes, conv, Perm)
+        add_mc_constraints(system, y[i], z[i], x[i + 1], IVLBC, IVLBC_MC_pos)
+
+    system.add_equalities(x[ROUND + 3], [x[ROUND + 2][Perm[j]] for j in range(IVLBC)])
+    return build_model(backend, system, x[0], x[ROUND + 3])
+
+def potential_ID_propagator(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos):
+    """The layers of potential_ID_model for the bit propagation pre-filter."""
+    sbox = SboxLayer(sbox_transitions(conv))
+    mc = LinearLayer(mc_rows(IVLBC, IVLBC_MC_pos), IVLBC)
+    # x_j = x_{Perm[j]} at the boundaries, and the S-box output bit k is y_{Perm[k]} in the rounds
+    gather = LinearLayer([[Perm[j]] for j in range(IVLBC)], IVLBC)
+    scatter = LinearLayer(permutation_rows(Perm), IVLBC)
+    layers = [gather, mc]
+    for i in range(2, ROUND + 2):
+        layers += [sbox, scatter, mc]
+    layers.append(gather)
+    return Propagator(layers, IVLBC)
+
 def solve_lp_file(filename):
     """Solve the LP file using Gurobi and return the status."""
+    # Imported here so that the data handling does not need gurobipy
+    from gurobipy import GRB, read
     try:
         model = read(filename)
+        apply_solver_params(model)
         model.optimize()
         if model.status == GRB.OPTIMAL:
             return True
@@ -127,48 +163,88 @@ def solve_lp_file(filename):
         print(f"Error solving LP file: {e}")
         return None
 
-def potential_ID(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos, representatives, i, prod_set):
-    total_set = prod_set[4096 * i : 4096 * (i + 1)]
-    print("total input set = ", len(total_set))
-    in_set = set()
-    in_diff = None
-    ddt = {0: [0], 38: [57627, 41243, 57631, 41247, 24898, 24903, 41291, 57675, 41295, 57679, 41307, 57691, 41311, 57695, 24929, 41320, 57704, 57708, 41324, 24949, 57721, 41337, 57725, 41341, 57735, 41351, 24970, 24971, 24974, 24975, 57746, 41362, 24986, 24987, 24990, 24991, 25000, 25005, 57777, 41393, 41397, 57781, 25017, 25020, 57799, 41415, 25034, 25035, 25038, 25039, 41426, 57810, 25050, 25051, 25054, 25055, 25065, 25068, 41457, 57841, 41461, 57845, 25080, 25085, 49946, 33563, 33566, 49951, 25395, 25413, 33610, 49995, 49994, 33611, 33614, 49999, 33615, 49998, 50010, 33627, 33630, 50015, 25442, 25443, 33640, 50025, 50028, 33645, 25463, 33656, 50041, 50044, 33661, 33666, 50055, 25484, 25485, 50066, 33687, 25500, 25501, 33697, 33701, 25518, 25519, 50097, 50101, 25534, 25535, 50114, 33735, 25544, 25545, 33746, 50135, 25560, 25561, 50145, 50149, 25578, 25579, 33777, 33781, 25594, 25595, 34395, 17425, 25618, 17429, 25623, 33817, 58394, 58395, 50201, 50205, 42014, 33821, 58399, 42011, 42015, 42010, 58398, 25653, 17463, 42040, 42041, 33851, 58428, 58429, 50239, 25666, 25667, 58442, 42059, 42058, 58443, 58446, 58447, 42063, 17489, 42062, 25682, 17493, 25687, 50265, 33881, 58459, 42075, 33885, 50269, 42079, 58463, 25697, 17506, 42074, 58462, 42078, 58472, 58473, 50282, 33898, 42092, 42093, 33902, 50286, 50287, 33899, 17523, 33914, 50299, 33915, 50302, 33919, 50303, 50305, 42114, 42115, 58498, 33925, 58503, 42119, 17545, 25738, 25739, 17548, 25742, 25743, 33937, 42130, 42131, 58514, 50325, 42135, 17560, 58519, 25754, 25755, 17565, 25758, 25759, 33954, 17578, 17579, 17582, 33971, 17594, 17595, 17599, 33985, 58562, 58563, 42178, 50373, 58567, 17608, 42183, 25802, 25803, 17613, 25806, 25807, 50385, 58578, 58579, 42194, 34005, 42199, 58583, 17625, 25818, 25819, 17628, 25822, 25823, 50402, 17642, 17646, 17647, 50419, 17659, 17662, 17663, 42266, 58650, 42270, 58654, 25922, 25927, 42314, 58698, 42318, 58702, 58714, 42330, 58718, 42334, 25953, 42345, 58729, 42349, 58733, 25973, 58744, 42360, 58748, 42364, 42370, 58754, 25994, 25995, 25998, 25999, 58775, 42391, 26010, 26011, 26014, 26015, 58785, 42401, 42405, 58789, 26024, 26029, 26041, 26044, 42434, 58818, 26058, 26059, 26062, 26063, 58839, 42455, 26074, 26075, 26078, 26079, 58849, 42465, 42469, 58853, 26089, 26092, 26104, 26109, 26129, 17938, 17943, 42520, 58905, 34330, 50715, 58908, 34331, 50718, 34335, 50719, 50714, 42525, 34334, 26162, 26163, 17973, 50744, 50745, 58938, 58939, 34364, 34365, 42558, 42559, 50792, 26177, 17986, 17987, 34378, 34379, 50763, 50762, 34382, 50766, 50767, 34383, 26193, 18002, 18007, 42584, 58969, 34394, 50779, 50778, 42589, 50782, 34399, 34398, 18017, 26210, 58972, 50783, 34408, 34409, 58986, 42603, 50796, 34412, 42606, 58991, 42602, 50797, 58990, 50808, 34425, 42618, 59002, 42619, 50813, 42622, 59007, 59006, 59009, 50818, 50819, 34428, 59013, 34439, 26248, 26249, 18058, 18059, 26252, 18062, 18063, 42641, 34450, 50835, 50834, 42645, 50839, 26264, 26265, 18074, 18075, 26269, 18078, 18079, 50849, 59042, 59043, 50853, 26282, 26283, 26286, 34481, 59058, 59059, 34485, 26298, 26299, 26303, 42689, 34498, 34499, 42693, 50887, 26312, 18122, 18123, 26316, 26317, 18126, 18127, 59089, 34514, 34515, 50898, 59093, 34519, 26329, 18138, 18139, 26332, 26333, 18142, 18143, 34529, 42722, 42723, 34533, 26346, 26350, 26351, 50929, 42738, 42739, 50933, 26363, 26366, 26367, 18194, 26389, 18199, 59160, 42777, 50970, 34587, 42780, 59165, 34590, 50975, 18229, 26423, 51000, 51001, 59194, 59195, 34620, 34621, 42814, 42815, 18242, 18243, 34634, 51019, 51018, 34635, 51022, 51023, 34638, 34639, 18258, 26453, 18263, 59224, 42841, 51034, 34651, 42844, 59229, 34654, 51039, 18273, 34664, 34665, 42858, 59243, 51052, 51053, 59246, 59247, 42859, 42863, 26483, 42874, 42875, 59259, 59262, 42879, 59263, 42881, 51074, 51075, 42885, 34695, 26505, 18314, 18315, 26508, 18318, 18319, 59281, 51090, 51091, 34706, 59285, 51095, 26520, 18330, 18331, 26525, 18334, 18335, 59298, 59299, 26538, 26539, 26542, 59314, 59315, 26554, 26555, 26559, 59329, 34754, 34755, 59333, 51143, 26568, 18378, 18379, 26573, 18382, 18383, 42961, 34770, 34771, 51154, 42965, 34775, 26585, 18394, 18395, 26588, 18398, 18399, 42978, 42979, 26602, 26606, 26607, 42994, 42995, 26619, 26622, 26623, 34833, 59410, 34837, 59415, 18457, 26650, 26651, 18461, 26654, 26655, 34866, 51251, 34867, 59445, 34871, 18491, 26684, 26685, 51265, 59458, 59459, 43074, 34885, 43079, 59463, 26698, 26699, 26702, 26703, 34897, 59474, 34901, 59479, 18521, 26714, 26715, 18525, 26718, 26719, 59489, 34914, 51299, 51298, 59493, 43109, 26728, 26729, 18538, 18539, 26732, 18542, 43121, 59505, 34931, 51319, 26745, 18554, 18555, 26748, 18559, 18565, 26759, 34952, 43146, 59531, 51340, 34956, 43150, 59535, 43151, 18577, 26770, 34968, 34969, 59546, 43163, 51357, 59550, 43167, 18594, 34986, 34987, 34990, 26801, 18611, 26805, 59577, 35002, 35003, 59580, 35007, 18625, 26818, 26819, 35016, 51400, 59594, 59595, 35020, 43211, 59598, 59599, 43215, 26834, 26835, 18645, 26839, 51417, 43226, 59611, 35036, 35037, 59610, 59615, 59614, 26849, 43230, 26853, 43241, 43244, 59666, 59671, 18712, 26906, 26907, 18716, 26910, 26911, 51506, 35123, 35122, 59701, 18746, 26940, 26941, 51521, 59714, 59715, 43330, 35141, 43335, 59719, 26954, 26955, 26958, 26959, 59730, 59735, 18776, 26970, 26971, 18780, 26974, 26975, 59745, 51554, 35171, 51555, 59749, 43365, 26984, 26985, 18794, 18795, 26989, 18799, 43377, 59761, 27000, 18810, 18811, 27005, 18814, 18817, 27010, 35208, 59786, 43403, 51596, 59790, 43407, 59791, 18837, 27031, 35225, 43418, 59802, 59803, 51613, 43422, 59807, 27041, 18851, 27045, 51627, 35247, 18866, 43449, 51642, 43452, 35262, 27074, 27075, 18885, 27079, 51656, 59850, 59851, 35276, 43466, 43470, 59854, 59855, 18897, 27090, 27091, 51673, 59866, 43483, 59867, 43482, 59870, 59871, 43487, 35293, 59881, 35307, 59884, 51695, 27121, 27125, 35322, 51710, 43537, 51730, 51735, 27160, 18970, 18971, 27165, 18974, 18975, 59954, 43571, 51765, 19000, 19001, 27198, 27199, 59969, 51778, 51779, 35394, 43589, 35399, 51783, 19018, 19019, 19022, 19023, 43601, 51794, 51799, 27224, 19034, 19035, 27229, 19038, 19039, 51809, 43618, 60003, 60002, 51813, 35429, 27242, 27243, 19052, 19053, 27246, 35441, 51825, 27258, 27259, 27262, 19074, 19075, 19079, 60040, 51850, 35466, 43660, 43661, 35470, 35471, 51855, 27281, 19090, 19091, 51854, 27285, 19095, 60057, 51866, 51867, 43676, 35483, 51870, 51871, 35487, 43677, 60078, 60079, 60094, 60095, 27329, 19138, 27333, 19143, 43721, 35531, 51915, 43725, 60108, 51919, 35535, 19154, 19159, 43736, 51930, 35546, 43740, 60125, 51934, 35550, 27362, 27363, 35561, 43754, 60138, 35564, 60139, 43758, 43759, 27378, 27379, 51960, 60154, 60155, 43771, 51965, 43774, 43775, 51986, 43797, 51991, 27417, 19226, 19227, 27420, 19230, 19231, 43826, 43827, 60211, 52021, 43831, 19256, 19257, 27454, 27455, 60225, 52034, 52035, 35650, 43845, 35655, 52039, 19274, 19275, 19278, 19279, 52050, 43861, 52055, 27481, 19290, 19291, 27484, 19294, 19295, 52065, 60258, 43875, 52069, 35685, 27498, 27499, 19308, 19309, 27503, 35697, 52081, 43891, 60279, 27514, 27515, 27519, 27521, 19330, 19331, 27525, 19335, 60297, 52106, 52107, 35723, 43913, 52110, 52111, 35727, 43916, 19346, 19347, 19351, 60312, 43928, 52122, 35738, 52123, 43933, 52126, 35742, 52127, 35752, 43946, 43947, 35757, 52153, 43962, 43963, 52156, 19394, 19399, 43976, 52170, 35787, 35786, 60365, 52174, 35790, 52175, 27601, 19410, 27605, 19415, 43993, 52186, 52187, 60380, 35803, 35807, 52191, 27618, 27619, 44010, 44014, 44015, 27634, 27635, 44027, 44030, 44031, 52241, 44050, 52245, 44055, 19481, 27674, 27675, 19485, 27678, 27679, 52274, 35891, 52275, 44085, 52279, 27704, 27705, 19519, 35905, 44098, 44099, 60482, 52293, 44103, 60487, 27722, 27723, 27726, 27727, 52305, 44114, 52309, 44119, 19545, 27738, 27739, 19549, 27742, 27743, 44129, 52322, 35939, 35938, 60517, 44133, 27752, 19562, 27756, 27757, 19566, 19567, 44145, 60529, 52339, 35959, 27768, 19579, 27773, 19582, 19583, 19585, 27778, 27779, 52360, 44170, 44171, 52364, 60555, 44174, 60559, 44175, 35980, 27794, 27795, 19605, 27799, 52376, 52377, 44186, 60570, 44187, 35997, 44190, 44191, 60574, 27809, 27813, 60584, 60589, 19653, 27847, 52424, 36040, 60618, 44235, 52428, 60619, 60622, 44239, 19665, 27858, 36057, 44250, 60635, 52444, 52445, 44254, 60639, 19682, 52458, 52462, 52463, 27889, 19699, 27893, 44280, 52475, 44285, 52478, 52479, 44306, 44311, 19736, 27930, 27931, 19740, 27934, 27935, 36146, 52531, 52530, 44341, 27960, 27961, 19774, 36161, 60738, 44354, 44355, 52549, 60743, 44359, 27978, 27979, 27982, 27983, 44370, 44375, 19800, 27994, 27995, 19804, 27998, 27999, 44385, 36194, 52579, 36195, 44389, 60773, 28009, 19819, 28012, 28013, 19822, 19823, 44401, 60785, 28025, 19834, 28028, 19838, 19839, 28034, 28035, 19845, 28039, 52616, 44426, 60810, 36236, 44427, 60814, 44430, 44431, 19857, 28050, 28051, 52633, 44442, 60827, 44443, 36253, 60830, 44447, 44446, 60831, 44456, 36267, 44461, 52655, 28081, 28085, 36282, 52670, 19905, 28098, 36296, 44490, 44491, 52684, 60875, 44494, 60879, 19925, 28119, 36313, 60890, 44507, 52701, 44510, 44511, 60894, 28129, 19939, 28133, 52715, 36335, 19954, 60920, 52730, 60925, 36350, 60945, 36370, 36375, 28185, 19994, 19995, 28188, 19998, 19999, 44594, 60979, 36405, 28218, 28219, 20028, 20029, 44609, 36418, 36419, 52802, 60997, 52807, 36423, 20042, 20043, 20046, 20047, 61009, 36434, 36439, 28249, 20058, 20059, 28252, 20062, 20063, 36449, 61026, 44643, 44642, 36453, 52837, 20072, 20073, 28266, 28270, 28271, 36465, 52849, 28282, 28286, 28287, 28289, 20098, 28293, 20103, 44680, 61065, 36491, 52875, 61069, 52879, 36495, 20114, 20119, 61080, 44697, 36506, 52890, 61084, 36510, 52894, 28322, 28323, 52904, 61098, 61099, 52909, 61102, 44719, 44718, 28338, 28339, 36537, 61114, 61115, 36540, 44734, 61119, 44735, 20162, 20163, 20167, 61128, 61129, 36554, 52938, 52939, 44748, 36558, 36559, 52942, 28369, 20178, 20179, 36555, 28373, 20183, 61144, 61145, 36570, 36571, 52955, 44765, 36574, 36575, 52959, 44778, 44779, 44794, 44795, 36626, 61205, 36631, 28440, 20250, 20251, 28445, 20254, 20255, 61234, 61235, 44851, 36661, 61239, 28474, 28475, 20284, 20285, 44865, 36674, 36675, 53058, 61253, 53063, 36679, 20298, 20299, 20302, 20303, 36690, 61269, 36695, 28504, 20314, 20315, 28509, 20318, 20319, 36705, 44898, 61283, 36709, 53093, 20328, 20329, 28523, 28526, 28527, 36721, 53105, 61299, 44919, 28539, 28542, 28543, 20354, 20359, 44937, 36746, 53130, 61324, 36747, 36750, 53134, 53135, 28561, 20370, 28565, 20375, 44952, 36763, 53147, 61341, 36766, 53151, 36767, 28578, 28579, 61354, 61355, 61358, 28594, 28595, 61370, 61371, 61375, 28609, 20418, 20419, 28613, 20423, 61384, 36810, 36811, 53195, 61389, 36814, 36815, 53199, 45005, 20434, 20435, 20439, 61401, 36826, 53210, 36827, 45020, 53214, 36830, 61404, 36831, 53225, 53228, 61422, 61423, 36856, 36861, 61438, 61439, 61722, 45338, 61726, 45342, 20787, 4417, 12610, 20805, 12615, 61770, 45386, 61774, 45390, 45402, 61786, 45406, 61790, 12641, 4450, 45417, 61801, 45421, 61805, 12661, 20855, 45432, 61816, 5774, 61820, 45436, 45442, 61826, 20873, 12682, 12683, 4493, 12686, 12687, 45463, 20888, 61847, 12698, 12699, 4508, 12702, 12703, 61857, 45473, 45477, 61861, 12712, 20906, 12717, 4526, 12729, 20923, 12732, 4543, 45506, 61890, 4553, 12746, 12747, 20941, 12750, 12751, 61911, 4568, 45527, 12762, 12763, 20956, 12766, 12767, 61921, 45537, 61925, 45541, 12777, 4586, 12780, 20974, 12792, 4603, 12797, 20991, 5820, 5834, 5851, 37658, 54043, 54046, 37663, 13106, 13107, 13121, 4930, 21314, 5865, 21319, 4935, 37706, 54091, 37707, 54090, 37710, 54095, 54094, 37711, 37722, 54107, 54110, 37727, 4961, 13154, 21345, 54120, 37737, 37740, 54125, 22155, 21365, 4981, 54136, 37753, 37756, 54141, 54146, 37767, 13192, 13193, 5002, 5003, 21387, 21386, 21390, 5006, 5007, 21391, 37778, 54167, 13208, 13209, 5018, 21403, 5019, 21402, 21406, 21407, 5022, 54177, 5023, 54181, 21416, 5032, 13226, 13227, 21421, 5037, 37809, 37813, 22170, 5049, 13242, 13243, 5052, 21436, 21433, 37826, 54215, 21450, 21451, 13260, 13261, 21454, 5071, 5066, 5070, 5067, 21455, 54226, 37847, 5082, 5083, 13276, 13277, 21470, 5087, 5086, 21466, 21471, 21467, 37857, 37861, 21481, 5097, 5100, 21484, 13294, 13295, 54257, 54261, 21496, 5112, 5117, 13310, 13311, 21501, 29714, 29719, 54296, 37912, 46106, 62490, 37916, 54300, 62494, 46110, 46111, 62491, 62495, 46107, 29749, 46136, 46137, 37946, 62524, 62525, 54334, 29762, 29763, 62538, 46154, 46155, 62539, 62542, 62543, 46159, 46158, 29778, 29783, 37976, 54360, 62554, 46171, 54364, 37980, 62558, 62559, 46174, 29793, 46170, 46175, 62555, 62568, 62569, 37994, 54379, 46188, 46189, 54382, 37999, 54383, 37995, 38490, 38010, 54394, 38011, 54398, 38014, 54399, 38017, 62594, 46210, 46211, 54405, 62599, 46215, 29834, 29835, 29838, 29839, 54417, 46226, 46227, 62610, 38037, 46231, 62615, 29850, 29851, 29854, 29855, 38051, 22218, 38066, 54465, 62658, 62659, 46274, 38085, 46279, 62663, 29898, 29899, 29902, 29903, 38097, 62674, 62675, 46290, 54485, 62679, 46295, 29914, 29915, 29918, 29919, 54499, 54514, 46363, 62747, 46367, 62751, 5427, 21825, 13634, 5445, 13639, 62795, 46411, 62799, 46415, 62811, 46427, 62815, 46431, 13665, 21858, 46440, 62824, 46444, 62828, 13685, 5495, 62841, 46457, 62845, 46461, 62855, 46471, 5513, 13706, 13707, 21901, 13710, 13711, 46482, 62866, 5528, 13722, 13723, 21916, 13726, 13727, 13736, 5546, 13741, 21934, 62897, 46513, 46517, 62901, 13753, 5563, 13756, 21951, 62919, 46535, 21961, 13770, 13771, 5581, 13774, 13775, 46546, 62930, 21976, 13786, 13787, 5596, 13790, 13791, 13801, 21994, 13804, 5614, 62961, 46577, 46581, 62965, 13816, 22011, 13821, 5631, 30229, 63000, 46617, 38426, 54810, 38427, 63005, 54814, 54815, 38430, 38431, 46620, 54811, 13875, 30263, 54840, 54841, 63034, 63035, 38460, 38461, 46654, 46655, 5698, 22082, 13893, 22087, 5703, 54858, 54859, 38474, 38475, 38478, 54862, 38479, 54863, 30293, 63064, 46681, 54874, 54875, 46684, 38491, 38494, 38495, 54879, 5729, 13922, 13923, 22113, 54878, 63069, 38504, 38505, 46698, 46699, 63083, 54892, 54893, 63087, 63086, 38509, 46703, 30323, 22133, 5749, 13943, 38520, 54905, 46714, 63099, 54908, 46715, 63102, 46719, 38525, 46721, 54914, 54915, 38530, 46725, 63103, 54919, 30345, 5770, 22154, 13964, 5771, 13965, 5775, 22159, 22158, 54930, 54931, 30348, 63125, 63121, 38551, 30360, 5786, 22171, 13980, 5787, 22174, 22175, 5790, 13981, 63138, 63139, 30365, 38565, 38561, 5791, 5800, 22184, 30378, 30379, 22189, 13998, 13999, 30382, 54961, 63154, 63155, 5805, 54965, 5817, 30394, 30395, 22204, 22201, 14014, 30399, 14015, 63169, 38594, 38595, 54978, 63173, 54889, 38599, 30408, 14024, 14025, 22219, 5835, 30413, 22222, 5838, 5839, 46801, 38610, 38611, 22223, 46805, 54999, 14040, 14041, 5850, 22235, 30425, 30428, 5854, 5855, 22234, 22239, 46818, 46819, 55009, 55013, 22238, 22249, 14058, 30442, 5868, 14059, 30446, 30447, 22252, 38641, 46834, 46835, 38645, 22264, 5880, 14074, 14075, 30459, 5885, 30462, 30463, 22269, 30481, 46872, 63257, 38682, 55067, 63260, 46877, 55070, 38687, 55096, 55097, 63290, 63291, 38716, 38717, 46910, 46911, 38730, 55115, 38731, 55114, 55118, 55119, 38735, 30545, 38734, 46936, 63321, 38746, 55131, 63324, 46941, 55134, 38751, 30562, 38760, 38761, 46954, 46955, 63338, 55149, 63342, 63343, 55148, 46958, 63354, 46971, 46970, 63358, 46974, 63359, 63361, 55170, 55171, 38786, 63365, 55175, 30601, 30604, 46993, 55186, 55187, 46997, 38807, 30616, 30621, 63394, 63395, 30634, 30635, 30638, 63410, 63411, 30650, 30651, 30655, 47041, 55234, 38851, 38850, 47045, 38855, 30664, 30669, 63441, 38866, 38867, 63445, 55255, 30681, 30684, 47074, 47075, 30698, 30702, 30703, 47090, 47091, 30715, 30718, 30719, 63506, 63511, 30747, 14363, 30750, 14366, 55346, 38963, 38962, 63541, 30780, 30781, 55361, 63554, 63555, 47170, 38981, 47175, 63559, 30794, 14411, 30795, 14410, 30798, 30799, 14414, 14415, 63570, 63575, 14427, 30811, 30814, 14430, 63585, 55394, 39011, 55395, 63589, 47205, 30824, 30825, 14440, 14445, 47217, 63601, 14456, 14461, 14466, 30855, 39048, 63626, 63627, 47243, 55436, 63630, 47247, 30866, 14487, 39065, 47258, 63643, 55453, 63646, 47262, 63647, 14497, 14501, 47272, 55467, 47277, 39087, 55482, 39102, 30914, 30915, 14535, 55496, 63690, 47306, 63691, 39116, 63694, 63695, 47310, 47307, 14546, 30930, 30931, 30935, 55513, 63706, 63707, 47323, 39133, 63710, 47327, 63711, 39147, 55535, 14577, 14581, 63736, 39162, 63741, 55550, 39185, 63762, 39189, 63767, 31002, 14618, 31007, 14623, 39218, 55603, 39219, 63797, 39223, 31036, 31037, 55617, 63810, 63811, 47426, 39237, 47431, 63815, 31050, 14666, 14667, 31051, 14670, 14671, 31055, 39249, 63826, 31054, 39253, 63831, 14682, 31066, 14687, 31071, 63841, 39266, 55651, 55650, 63845, 47461, 31080, 31081, 14697, 14700, 47473, 63857, 39283, 55671, 14713, 14716, 31106, 14727, 39304, 39305, 47498, 63883, 55692, 47502, 63887, 14738, 31127, 39321, 63898, 47515, 39325, 55709, 47519, 63902, 47518, 63912, 39338, 39339, 63917, 39342, 14769, 14773, 39354, 39355, 39359, 31170, 14786, 31171, 31175, 55752, 63946, 63947, 39372, 47563, 63950, 63951, 39373, 47567, 31186, 31187, 14807, 39385, 55769, 63963, 63962, 39389, 47582, 63966, 63967, 14817, 47578, 14821, 47608, 47613, 55826, 47637, 55831, 31257, 23066, 6683, 31260, 23070, 6687, 47666, 64051, 47667, 55861, 47671, 31294, 31295, 64065, 55874, 55875, 39490, 47685, 39495, 55879, 23114, 6731, 23118, 6735, 55890, 47701, 55895, 31321, 23130, 6747, 31324, 23134, 6751, 55905, 64098, 47715, 55909, 39525, 6760, 23145, 31338, 31339, 6764, 23149, 31343, 39537, 55921, 47731, 64119, 23160, 6777, 31354, 31355, 23164, 6781, 31359, 31361, 23170, 31365, 6791, 47753, 55946, 55947, 47756, 64137, 39563, 39567, 55951, 55950, 6802, 23191, 47768, 64152, 39578, 55962, 55963, 47773, 39582, 55967, 55966, 23201, 23205, 55976, 47786, 47787, 55981, 6833, 6837, 39609, 47802, 47803, 39612, 23234, 6855, 47816, 39626, 56010, 56011, 64205, 39630, 56014, 31441, 6866, 31445, 23255, 47833, 39642, 39643, 56027, 64220, 56030, 56031, 39647, 23265, 31458, 31459, 23269, 47850, 47854, 47855, 6897, 31474, 31475, 6901, 47867, 47870, 47871, 51851, 47889, 56082, 56087, 31512, 6938, 23323, 31517, 6942, 23327, 64306, 47923, 56117, 31550, 31551, 64321, 56130, 56131, 39746, 47941, 39751, 56135, 6986, 23371, 6990, 23375, 47953, 56146, 56151, 31576, 7002, 23387, 31581, 7006, 23391, 56161, 47970, 64355, 64354, 56165, 39781, 23400, 7017, 31594, 31595, 23404, 7021, 31598, 39793, 56177, 7032, 23417, 31610, 31611, 7036, 23421, 31614, 7042, 23431, 64392, 39818, 56202, 56203, 48013, 56206, 56207, 39822, 31633, 23442, 48012, 31637, 7063, 64409, 56218, 56219, 48028, 48029, 56222, 56223, 39839, 7073, 39835, 39838, 7077, 64430, 64431, 23473, 23477, 64446, 64447, 31681, 7106, 31685, 23495, 48073, 56267, 64460, 39883, 48077, 56271, 39887, 23506, 7127, 48088, 56282, 39898, 48092, 64477, 39902, 56286, 7137, 31714, 31715, 7141, 56297, 48106, 64490, 64491, 56300, 48110, 48111, 23537, 31730, 31731, 23541, 39928, 64506, 48123, 64507, 39933, 48126, 48127, 48146, 48151, 31770, 15386, 31775, 15391, 39986, 56371, 56370, 48181, 31800, 31801, 40001, 48194, 48195, 64578, 56389, 48199, 64583, 15434, 31818, 31819, 15435, 31822, 31823, 15439, 15438, 48210, 48215, 15450, 31834, 15455, 31839, 48225, 40034, 56419, 40035, 64613, 48229, 15465, 31852, 31853, 15468, 48241, 64625, 15481, 15484, 31874, 31875, 15495, 56456, 48266, 64650, 40076, 48267, 48270, 48271, 64655, 64654, 31890, 31891, 15506, 31895, 56473, 48282, 48283, 64667, 40093, 48286, 48287, 64671, 40107, 56495, 15537, 15541, 48313, 40122, 48316, 56510, 15554, 31943, 40136, 48330, 64715, 56524, 48334, 48335, 64719, 31954, 15575, 40153, 48346, 48347, 64730, 56541, 64734, 48351, 15585, 15589, 58458, 64745, 56555, 64748, 40175, 56570, 40190, 56593, 48402, 56597, 48407, 32027, 15643, 32030, 15646, 56626, 40243, 56627, 48437, 56631, 32056, 32057, 40257, 64834, 48450, 48451, 56645, 64839, 48455, 32074, 32075, 15691, 15690, 15694, 32079, 32078, 56657, 48466, 15695, 56661, 48471, 15707, 32091, 32094, 15710, 48481, 56674, 40291, 40290, 48485, 64869, 15720, 32108, 32109, 15725, 48497, 64881, 56691, 40311, 15736, 15741, 32130, 15746, 32131, 32135, 56712, 56713, 48522, 48523, 40332, 64907, 48526, 48527, 64911, 32146, 32147, 15767, 56729, 48538, 48539, 64922, 56733, 48542, 64926, 40349, 15777, 48543, 15781, 64953, 64956, 32194, 15815, 40392, 64970, 48587, 56780, 56781, 64974, 48591, 15826, 32215, 56793, 64986, 48602, 40409, 56797, 64987, 64991, 48606, 48617, 56810, 48620, 56814, 56815, 15857, 15861, 56827, 56830, 56831, 40466, 65045, 40471, 32280, 24090, 7707, 32285, 24094, 7711, 65074, 48691, 65075, 40501, 65079, 32314, 32315, 48705, 56898, 40514, 40515, 65093, 40519, 56903, 24138, 7755, 24142, 7759, 40530, 65109, 40535, 32344, 24154, 7771, 32349, 24158, 7775, 40545, 48738, 65123, 56933, 40549, 7784, 24169, 32363, 7788, 24173, 32366, 32367, 40561, 56945, 65139, 48759, 24184, 7801, 32379, 24188, 7805, 32382, 32383, 24194, 7815, 48777, 56970, 40586, 65164, 56974, 40590, 40591, 32401, 7826, 32405, 24215, 48792, 40602, 40603, 56987, 65181, 56990, 40607, 56991, 24225, 32418, 32419, 24229, 65194, 65195, 65198, 7857, 32434, 32435, 7861, 65210, 65211, 65215, 32449, 24258, 32453, 7879, 65224, 40650, 40651, 57035, 65229, 40654, 40655, 57039, 48845, 7890, 24279, 65241, 57050, 40666, 40667, 48860, 65244, 40671, 40670, 57054, 24289, 24293, 40681, 40684, 65262, 65263, 7921, 7925, 57080, 57085, 65278, 65279, 65297, 40722, 40727, 32537, 7962, 24347, 32540, 7966, 24351, 48946, 65331, 40757, 32570, 32571, 48961, 57154, 40770, 40771, 65349, 40775, 57159, 8010, 24395, 8014, 24399, 65361, 40786, 40791, 32601, 8026, 24411, 32604, 8030, 24415, 40801, 65378, 48995, 48994, 57189, 40805, 24424, 8041, 32618, 24428, 8045, 32622, 32623, 40817, 57201, 8056, 24441, 32634, 8060, 24445, 32638, 32639, 32641, 8066, 32645, 24455, 49032, 65417, 40843, 57227, 65421, 40847, 57231, 24466, 8087, 65432, 49049, 40858, 57242, 65436, 57246, 40862, 8097, 32674, 32675, 8101, 40872, 65450, 65451, 40877, 49070, 65454, 49071, 24497, 32690, 32691, 24501, 57273, 65466, 65467, 57276, 49086, 65471, 49087, 8130, 24519, 65480, 65481, 57290, 40906, 40907, 49100, 40910, 40911, 57294, 32721, 24530, 32725, 8151, 65496, 65497, 57306, 40923, 57307, 49117, 40926, 57311, 40927, 8161, 40922, 8165, 49130, 49131, 24561, 24565, 49146, 49147], 275: [32842, 32843, 32846, 32847, 32873, 32877, 32889, 32893, 32918, 32919, 32932, 32948, 32982, 32983, 32996, 33012, 275, 33050, 33054, 33055, 33068, 33084, 33085, 338, 339, 33114, 33115, 33148, 33154, 33158, 33159, 394, 398, 399, 33171, 33174, 33175, 411, 414, 415, 33188, 33204, 33218, 33219, 33223, 458, 459, 462, 33234, 33235, 33238, 474, 475, 479, 33252, 33268, 33308, 547, 33323, 33338, 33352, 33353, 33372, 33406, 33407, 33412, 33428, 33443, 33446, 33447, 683, 686, 687, 33458, 33462, 33463, 698, 702, 703, 33476, 33492, 33506, 33507, 33511, 746, 747, 751, 33522, 33523, 33526, 762, 763, 766, 33564, 33565, 33578, 33608, 33609, 33647, 33698, 33702, 938, 942, 33715, 33718, 955, 959, 33748, 33763, 1002, 1006, 33778, 1019, 1023, 33802, 33803, 33806, 33807, 33832, 33833, 33848, 33849, 33870, 33871, 33896, 33897, 33900, 33901, 33912, 33913, 33916, 33917, 33922, 33923, 33926, 33927, 33938, 33939, 33942, 33943, 33952, 33956, 33968, 33972, 33986, 33987, 33990, 33991, 34002, 34003, 34006, 34007, 34016, 34020, 34032, 34036, 1298, 1299, 34074, 34075, 34092, 1362, 34139, 34142, 34143, 34156, 34157, 34172, 34178, 34179, 34182, 1418, 1419, 1423, 34194, 34195, 34199, 1434, 1435, 1438, 34212, 34228, 34243, 34246, 34247, 1483, 1486, 1487, 34258, 34262, 34263, 1498, 1502, 1503, 34276, 34292, 34313, 34317, 34367, 34376, 34377, 34380, 34381, 34396, 34397, 34410, 34427, 34432, 34436, 34452, 34466, 34467, 34470, 1706, 1710, 34482, 34483, 1723, 1727, 34500, 34512, 34516, 34530, 34534, 34535, 1770, 1774, 34547, 34550, 34551, 1787, 1791, 34569, 34573, 34588, 34606, 34607, 34632, 34633, 34636, 34637, 34652, 34667, 1906, 34682, 34683, 34688, 34692, 34708, 34722, 34723, 34727, 1962, 1963, 1967, 34738, 34739, 34742, 34743, 1978, 1979, 1982, 34756, 34768, 34772, 34786, 34787, 34790, 34791, 2027, 2030, 2031, 34802, 34803, 34806, 34807, 2042, 2046, 2047, 34834, 34838, 34839, 2074, 2078, 2079, 34852, 34882, 34883, 34886, 34887, 34898, 34899, 34902, 2138, 2139, 2143, 34912, 34916, 34928, 34932, 34955, 34959, 34970, 34974, 34975, 34988, 34989, 35004, 35005, 2242, 2243, 35018, 35019, 35022, 35023, 2258, 2259, 35034, 35035, 35038, 35039, 35048, 35049, 35064, 35065, 35069, 35078, 35079, 35091, 35094, 35095, 2331, 2334, 2335, 35108, 35138, 35139, 35142, 35143, 35154, 35155, 35159, 2394, 2395, 2398, 35172, 35188, 35210, 35214, 35215, 35227, 35230, 35231, 35244, 35245, 35260, 35261, 2498, 2499, 35274, 35275, 35278, 35279, 2514, 2515, 35290, 35291, 35294, 35295, 35304, 35308, 35309, 35320, 35324, 35325, 35332, 35348, 35363, 35366, 35367, 2603, 2606, 2607, 35378, 35382, 2618, 2622, 35392, 35396, 35412, 35426, 35427, 35430, 2666, 2670, 35442, 35443, 35447, 2682, 2683, 2687, 35468, 35469, 35484, 35485, 35498, 35502, 35503, 35515, 35518, 35519, 35528, 35532, 35533, 35544, 35545, 35548, 35549, 2786, 2787, 35562, 35563, 2802, 2803, 35578, 35579, 35582, 35583, 35588, 35604, 35618, 35622, 35623, 2858, 2862, 2863, 35635, 35638, 2875, 2879, 35648, 35652, 35668, 35682, 35683, 2923, 2927, 35698, 35699, 35702, 35703, 2938, 2939, 2942, 35724, 35725, 35740, 35741, 35755, 35758, 35759, 35770, 35774, 35784, 35788, 35800, 35801, 35804, 35805, 3042, 3043, 35818, 35819, 35822, 35823, 3058, 3059, 35834, 35835, 35858, 35859, 35863, 3098, 3099, 3102, 35876, 35906, 35907, 35910, 35911, 35923, 35926, 35927, 3163, 3166, 3167, 35940, 35956, 3202, 3203, 35978, 35979, 35982, 35983, 3218, 3219, 35994, 35995, 35998, 35999, 36008, 36012, 36013, 36024, 36028, 36042, 36046, 36058, 36059, 36063, 36077, 36093, 36102, 36103, 36114, 36115, 36118, 3354, 3355, 3359, 36132, 36148, 36162, 36163, 36166, 36167, 36178, 36182, 36183, 3418, 3422, 3423, 36192, 36196, 36208, 36212, 3458, 3459, 36234, 36235, 36238, 36239, 3474, 3475, 36250, 36251, 36254, 36255, 36264, 36265, 36268, 36269, 36280, 36281, 36284, 36285, 36298, 36299, 36303, 36314, 36315, 36318, 36328, 36329, 36332, 36333, 36344, 36345, 36348, 36349, 36356, 36372, 36386, 36387, 36391, 3626, 3627, 3631, 36403, 3642, 3646, 36416, 36420, 36436, 36450, 36454, 36455, 3690, 3694, 36466, 36467, 36470, 36471, 3707, 3710, 3711, 36488, 36489, 36504, 36508, 36509, 3746, 3747, 36522, 36523, 3762, 3763, 36538, 36539, 36542, 36543, 36557, 36568, 36569, 36572, 36573, 36587, 36591, 36602, 36607, 36612, 36628, 36642, 36643, 36646, 3882, 3883, 3886, 36658, 3899, 3903, 36672, 36676, 36692, 36707, 36710, 36711, 3947, 3951, 36722, 36723, 36726, 36727, 3962, 3966, 3967, 36744, 36745, 36749, 36760, 36764, 36765, 4002, 4003, 36778, 36779, 36782, 36783, 4018, 4019, 36794, 36795, 36813, 36824, 36825, 36828, 36829, 36842, 36847, 36859, 36863, 4166, 4167, 36938, 36939, 36942, 36943, 4196, 36968, 36972, 4212, 36984, 36988, 36998, 36999, 4238, 4239, 4254, 4255, 37028, 4268, 4269, 37044, 4284, 4285, 37062, 37063, 4298, 4299, 4314, 4315, 37092, 4328, 4329, 37108, 4344, 4345, 37147, 37150, 37151, 37165, 37180, 37181, 37210, 37211, 37245, 37251, 37254, 37255, 37266, 37270, 37271, 37284, 37300, 37314, 37315, 37318, 37330, 37331, 37335, 37348, 37364, 37405, 37418, 37435, 4676, 37448, 37449, 37469, 4727, 37502, 37503, 37508, 4748, 4749, 37524, 4764, 4765, 37538, 37542, 37543, 4782, 4783, 37555, 37558, 37559, 4798, 4799, 37572, 4808, 4809, 37588, 4824, 4825, 37602, 37603, 37606, 4842, 4843, 37618, 37619, 37623, 4858, 4859, 37660, 37661, 37675, 4932, 37704, 37705, 4966, 37742, 5004, 5005, 5020, 5021, 37795, 37798, 5038, 5039, 37810, 37814, 5054, 5055, 37828, 5064, 5065, 5080, 5081, 37858, 5098, 5099, 37875, 5114, 5115, 5126, 5127, 37898, 37899, 37902, 37903, 5156, 37928, 37929, 5172, 37944, 37945, 5186, 5187, 37966, 37967, 5216, 37992, 37993, 37996, 37997, 5232, 38008, 38009, 38012, 38013, 38018, 38019, 38022, 38023, 5258, 5259, 5262, 5263, 38034, 38035, 38038, 38039, 5274, 5275, 5278, 5279, 38048, 38052, 5288, 5289, 5292, 5293, 38064, 38068, 5304, 5305, 5308, 5309, 38082, 38083, 38086, 38087, 5322, 5323, 5326, 5327, 38098, 38099, 38102, 38103, 5338, 5339, 5342, 5343, 38112, 38116, 5352, 5353, 5356, 5357, 38128, 38132, 5368, 5369, 5372, 5373, 38170, 38171, 38189, 38234, 38238, 38239, 38252, 38253, 38269, 38274, 38275, 38279, 38290, 38291, 38294, 38308, 38324, 38338, 38342, 38343, 38355, 38358, 38359, 38372, 38388, 5636, 38408, 38412, 5686, 38462, 5696, 38472, 38473, 38476, 38477, 38492, 38493, 5731, 38507, 38522, 38532, 5768, 5769, 5772, 38544, 38548, 5784, 5785, 5789, 38562, 38563, 5802, 5803, 5807, 38578, 38579, 38582, 5818, 5819, 5822, 38592, 38596, 5832, 5836, 5837, 38612, 5849, 5852, 5853, 38627, 38630, 38631, 5867, 5870, 5871, 38642, 38646, 38647, 5882, 5886, 5887, 5892, 38664, 38668, 38685, 5927, 38702, 38703, 5952, 38728, 38729, 38732, 38733, 38749, 38762, 6002, 38778, 38779, 38788, 6024, 6025, 6028, 38800, 38804, 6040, 6041, 6045, 38818, 38819, 38822, 38823, 6058, 6059, 6063, 38834, 38835, 38839, 6074, 6075, 6078, 38848, 38852, 6088, 6092, 6093, 38868, 6105, 6108, 6109, 38882, 38883, 38886, 38887, 6123, 6126, 6127, 38898, 38899, 38902, 38903, 6138, 6142, 6143, 38918, 38919, 6158, 6159, 38931, 38934, 38935, 38948, 6188, 6189, 6204, 6205, 38978, 38979, 38982, 38983, 6218, 6219, 6222, 6223, 38994, 38995, 38999, 39012, 6248, 6249, 6252, 39028, 6264, 6265, 6268, 6278, 6279, 39050, 39054, 39055, 6294, 6295, 39067, 39070, 39071, 6308, 39084, 39085, 6324, 39100, 39101, 6338, 6339, 6342, 6343, 39114, 39115, 39118, 39119, 6354, 6355, 39130, 39131, 39134, 39135, 6368, 6372, 39145, 39148, 39149, 6384, 6388, 39161, 39164, 39165, 6414, 6415, 39186, 39190, 39191, 39204, 6444, 6445, 6460, 6461, 39234, 39235, 39238, 39239, 6474, 6475, 6478, 6479, 39250, 39251, 39254, 39264, 39268, 6504, 6505, 6509, 39280, 39284, 6520, 6521, 6525, 6534, 6535, 39307, 39310, 39311, 6550, 6551, 39322, 39326, 6564, 39340, 39341, 6580, 39356, 39357, 6594, 6595, 39370, 39371, 39374, 39375, 6610, 6611, 6614, 6615, 39386, 39387, 39390, 39391, 6624, 6628, 39400, 39401, 39404, 6640, 6644, 39416, 39417, 39428, 6668, 6669, 39444, 39458, 39462, 39463, 6702, 6703, 39475, 39478, 6718, 6719, 39488, 39492, 6728, 6729, 6732, 6733, 39508, 39522, 39523, 6762, 6763, 6767, 39538, 39539, 39542, 39543, 6778, 6779, 6783, 6788, 39564, 39565, 6804, 39580, 39581, 6822, 6823, 39595, 39599, 6838, 6839, 39610, 39614, 39615, 6848, 6852, 39624, 39625, 39628, 39629, 6864, 6868, 39641, 39645, 6882, 6883, 39658, 39659, 6898, 6899, 6902, 6903, 39674, 39675, 39678, 39679, 39684, 6924, 6925, 39700, 39715, 39718, 39719, 6958, 6959, 39730, 39734, 6974, 6975, 39744, 39748, 6984, 6985, 6988, 6989, 39764, 39778, 39779, 39782, 7018, 7019, 7022, 39794, 39795, 39799, 7034, 7035, 7038, 7044, 39820, 39821, 7060, 39836, 39837, 7078, 7079, 39850, 39854, 39855, 7094, 7095, 39867, 39870, 39871, 7104, 7108, 39880, 39881, 39884, 39885, 7120, 7124, 39897, 39900, 39901, 7138, 7139, 7142, 7143, 39914, 39915, 39918, 39919, 7154, 7155, 39930, 39931, 39942, 39943, 7178, 7179, 39954, 39955, 39958, 39972, 7208, 7209, 39988, 7224, 7225, 40002, 40003, 40006, 40007, 7242, 7243, 7246, 7247, 40018, 40022, 40023, 40032, 40036, 7272, 7276, 7277, 40048, 40052, 7288, 7292, 7293, 7298, 7299, 7302, 7303, 40074, 40075, 40078, 40079, 7314, 7315, 40090, 40091, 40094, 40095, 7328, 7332, 40104, 40105, 40108, 40109, 7344, 7348, 40120, 40121, 40124, 40125, 7366, 7367, 40138, 40139, 40143, 7382, 7383, 40154, 40155, 40158, 7396, 40168, 40169, 40172, 40173, 7412, 40184, 40185, 40188, 40189, 7434, 7435, 40210, 40211, 40215, 40228, 7464, 7465, 7480, 7481, 40258, 40259, 40262, 40263, 7498, 7499, 7502, 7503, 40275, 40278, 40279, 40292, 7529, 7532, 7533, 40308, 7545, 7548, 7549, 7554, 7555, 40330, 40331, 40334, 40335, 7570, 7571, 7574, 7575, 40346, 40347, 40350, 40351, 7584, 7588, 40361, 40365, 7600, 7604, 40377, 40380, 40381, 7622, 7623, 40394, 40395, 40398, 7638, 7639, 40411, 40415, 7652, 40428, 7668, 40444, 40452, 7688, 7689, 40468, 40482, 40483, 40486, 7722, 7723, 40498, 7738, 7739, 40512, 40516, 7752, 7753, 7756, 7757, 40532, 40547, 40550, 40551, 7787, 7790, 7791, 40562, 40563, 40566, 40567, 7803, 7806, 7807, 7808, 7812, 40585, 40588, 40589, 7824, 7828, 40600, 40601, 40604, 7842, 7843, 40618, 40619, 7858, 7859, 7862, 7863, 40634, 40635, 40638, 40639, 7876, 40648, 40649, 40652, 40653, 7892, 40668, 7910, 7911, 40682, 40686, 7926, 7927, 40699, 40702, 40708, 7944, 7945, 40724, 40738, 40739, 40743, 7978, 7979, 40755, 7994, 7995, 40768, 40772, 8008, 8009, 8012, 8013, 40788, 40802, 40806, 40807, 8042, 8046, 8047, 40818, 40819, 40822, 40823, 8058, 8062, 8063, 8064, 8068, 40841, 40844, 40845, 8080, 8084, 40856, 40857, 8098, 8099, 8102, 8103, 40874, 40875, 40878, 40879, 8114, 8115, 40890, 40891, 8132, 40904, 40905, 40908, 40909, 8148, 40924, 8166, 8167, 40939, 40942, 8182, 8183, 40954, 40958, 41003, 41007, 41018, 41022, 8260, 41033, 41036, 8294, 41066, 41070, 8311, 41083, 41087, 8328, 41108, 8345, 41123, 41126, 8362, 41138, 41143, 8379, 41156, 8396, 8413, 41187, 41190, 8430, 41202, 41207, 8447, 41240, 41244, 41245, 41262, 41278, 41279, 8528, 41304, 41305, 41343, 41344, 41348, 8584, 8588, 8589, 41364, 8601, 8604, 8605, 41382, 41383, 41398, 41399, 41408, 8648, 8649, 8652, 41424, 41428, 8664, 8665, 8669, 41446, 41462, 41463, 41483, 41487, 41502, 41513, 41528, 8775, 41546, 41547, 41566, 8820, 41596, 41597, 41603, 41606, 41607, 8843, 41618, 41622, 41623, 8858, 41636, 8873, 8876, 8877, 41648, 41652, 8888, 8892, 8893, 41666, 8911, 41683, 41686, 41687, 8926, 41696, 8936, 8937, 8941, 41712, 41716, 8952, 8953, 8956, 41738, 41742, 41758, 41759, 41768, 9030, 41802, 41803, 9060, 41836, 41858, 41862, 9098, 41875, 41878, 9115, 9128, 9145, 41923, 9166, 41938, 9183, 41956, 9196, 9213, 9220, 41993, 41996, 9255, 42026, 42027, 9270, 42042, 42043, 42060, 42061, 42090, 42091, 42094, 42095, 42106, 42107, 42110, 42111, 42116, 9352, 9353, 9356, 42132, 9368, 9369, 9373, 42146, 42147, 42151, 9386, 9387, 9391, 42162, 42163, 42166, 9402, 9403, 9406, 42180, 9416, 9420, 9421, 42196, 9433, 9436, 9437, 42210, 42214, 42215, 9451, 9454, 9455, 42227, 42230, 42231, 9466, 9470, 9471, 9488, 42264, 42265, 42286, 42328, 42332, 42333, 42350, 42351, 42367, 42368, 9608, 9609, 9612, 42384, 42388, 9624, 9625, 9629, 42406, 42407, 42423, 42432, 42436, 9672, 9676, 9677, 42452, 9689, 9692, 9693, 42470, 42471, 42486, 42487, 9734, 42506, 42510, 9780, 42556, 42570, 42571, 42574, 42575, 42590, 42591, 42601, 42616, 42617, 42627, 42630, 42631, 9866, 9867, 9870, 42642, 42643, 42647, 9882, 9883, 9887, 9896, 9897, 9901, 42676, 9912, 9913, 9916, 42690, 42694, 42695, 9930, 9934, 9935, 42707, 42710, 42711, 9947, 9950, 9951, 42724, 9961, 9964, 9965, 42740, 9976, 9980, 9981, 9991, 42763, 42767, 42783, 10020, 42796, 42797, 42826, 42827, 42830, 42831, 42847, 42856, 42857, 42873, 42882, 42886, 42887, 10122, 10123, 10127, 42898, 42899, 42902, 42903, 10138, 10139, 10142, 42912, 42916, 10152, 10153, 10156, 42928, 10168, 10169, 10173, 42947, 42950, 42951, 10187, 10190, 10191, 42962, 42966, 42967, 10202, 10206, 10207, 42976, 42980, 10216, 10220, 10221, 42996, 10233, 10236, 10237, 10248, 43024, 43028, 10264, 10268, 10269, 43043, 43046, 43047, 10283, 43058, 43062, 10298, 43076, 10312, 10313, 10316, 43088, 10328, 10329, 10332, 43107, 43110, 43111, 10346, 10347, 10350, 43122, 43126, 43127, 10362, 10363, 10367, 10372, 43144, 43145, 10384, 10388, 43161, 43164, 43165, 10406, 10407, 43179, 43182, 43183, 10422, 10423, 43194, 43198, 10436, 43208, 10448, 43224, 43225, 10470, 10471, 43242, 43243, 43246, 43247, 10486, 10487, 43258, 43259, 43263, 43268, 10505, 43284, 10521, 10524, 10525, 43298, 43302, 43303, 10538, 43315, 43318, 10555, 43332, 10568, 10569, 10573, 43344, 43348, 10584, 10585, 10589, 43362, 43363, 43367, 10602, 10603, 10607, 43378, 43379, 43382, 43383, 10618, 10619, 10622, 10624, 10628, 43401, 43404, 43405, 10644, 10662, 10663, 43434, 43435, 43438, 43439, 10678, 10679, 43450, 43451, 43454, 43455, 10688, 43464, 43465, 10708, 43484, 10726, 10727, 43499, 43502, 43503, 10742, 10743, 43514, 43518, 43523, 43526, 10762, 43542, 43543, 43556, 10793, 10796, 10797, 10808, 43586, 43587, 43591, 10826, 10827, 10831, 43606, 43607, 10856, 10857, 10861, 43632, 43636, 10872, 10873, 10876, 10886, 10887, 43659, 43662, 43663, 10902, 10903, 43674, 43675, 43678, 43679, 10916, 43688, 10928, 10932, 43704, 10950, 10951, 43723, 43726, 43727, 10966, 10967, 43738, 43742, 10976, 43752, 43753, 43756, 43757, 10992, 10996, 43768, 43772, 43778, 43783, 11019, 43798, 43799, 43808, 43812, 11048, 11052, 11053, 11065, 43842, 43843, 43846, 11082, 11083, 11086, 43863, 43876, 11112, 11113, 11116, 43888, 11128, 11129, 11133, 11142, 11143, 43914, 43918, 11158, 11159, 43930, 43931, 43934, 43935, 11168, 11172, 43944, 11188, 43960, 43961, 11206, 11207, 43978, 43982, 43983, 11222, 11223, 43995, 43998, 43999, 11232, 11236, 44009, 44012, 11248, 44024, 44025, 44028, 44029, 44036, 11276, 44048, 11288, 11289, 11292, 44066, 11311, 44083, 11326, 44100, 11336, 11340, 11341, 44112, 44116, 11352, 11356, 11357, 44130, 44134, 44135, 11370, 11374, 11375, 44147, 44150, 44151, 11387, 11390, 11391, 11396, 44168, 11408, 44184, 44185, 11430, 11431, 44203, 44206, 44207, 11446, 11447, 44218, 44222, 44223, 11460, 44232, 11472, 11476, 44249, 44252, 44253, 11494, 11495, 44266, 44270, 44271, 11510, 11511, 44283, 44286, 44287, 11533, 44304, 44308, 11544, 11545, 11549, 44323, 44326, 44327, 11566, 44338, 11583, 44356, 11593, 11596, 11597, 44372, 11609, 11612, 11613, 44387, 44390, 44391, 11627, 11630, 11631, 44402, 44406, 44407, 11642, 11646, 11647, 11648, 44424, 44425, 11668, 44444, 11686, 11687, 44458, 44462, 11702, 11703, 44475, 44478, 44479, 11712, 11716, 44489, 44492, 44493, 11732, 44508, 11750, 11751, 44523, 44526, 44527, 11766, 11767, 44538, 44542, 44543, 44547, 44550, 11790, 44566, 44576, 11816, 11817, 11821, 44596, 11836, 44610, 44614, 44615, 11851, 11854, 11855, 44630, 44631, 44644, 11881, 11884, 11885, 44656, 44660, 11896, 11900, 11901, 11910, 11911, 44682, 44683, 44686, 44687, 11926, 11927, 44699, 44702, 44703, 11936, 44712, 44713, 44716, 44717, 11952, 11956, 44729, 44732, 11974, 11975, 44746, 44750, 44751, 11990, 11991, 44763, 44766, 44767, 12004, 44777, 44780, 12016, 12020, 44792, 44796, 44802, 44807, 12047, 44822, 44823, 44832, 44836, 12072, 12073, 12076, 12093, 44867, 44870, 44871, 12106, 12110, 12111, 44886, 44887, 44900, 12136, 12140, 12141, 44916, 12153, 12156, 12157, 12166, 12167, 44938, 44939, 44943, 12182, 12183, 44954, 44958, 12192, 12196, 44968, 44972, 12208, 44984, 44985, 44988, 44989, 12230, 12231, 45003, 45006, 45007, 12246, 12247, 45018, 45022, 45023, 12256, 12260, 45032, 45036, 12276, 45049, 45052, 12288, 45098, 45102, 45115, 45119, 45128, 45133, 45163, 45167, 45178, 45182, 45188, 45218, 45223, 45235, 45238, 45268, 45282, 45287, 45299, 45302, 12560, 45337, 45340, 45341, 45359, 45374, 45375, 12624, 45400, 45401, 45438, 45444, 12681, 12684, 12685, 45456, 45460, 12696, 12700, 12701, 45478, 45479, 45494, 45495, 45504, 45508, 12744, 12745, 12749, 45520, 12760, 12761, 12764, 45542, 45543, 45558, 45578, 45582, 45599, 12832, 45608, 45625, 45642, 45643, 45663, 45692, 45693, 45698, 45702, 45703, 45715, 45718, 45719, 45728, 45732, 12968, 12972, 12973, 45748, 12985, 12988, 12989, 45763, 45766, 45767, 45778, 45792, 45796, 13032, 13033, 13036, 45808, 13048, 13049, 13053, 45835, 45839, 45854, 45855, 45865, 13104, 45898, 45899, 45933, 45955, 45958, 45970, 45974, 46018, 46035, 46068, 46088, 46093, 46122, 46123, 46138, 46139, 13376, 46156, 46157, 13411, 46186, 46187, 46190, 46191, 13426, 46202, 46203, 46206, 46207, 46212, 46228, 46242, 46243, 46246, 13482, 13487, 46258, 46259, 46263, 13499, 13502, 46276, 46292, 46307, 46310, 46311, 13547, 13550, 46322, 46326, 46327, 13562, 13567, 13584, 46360, 46361, 46383, 13648, 46425, 46428, 46429, 46446, 46447, 46462, 46464, 46468, 13704, 13705, 13709, 46480, 13720, 13721, 13724, 46503, 46518, 46519, 46532, 13769, 13772, 13773, 46544, 46548, 13784, 13788, 13789, 46566, 46567, 46582, 46583, 46603, 46607, 46653, 13891, 46666, 46667, 46670, 46671, 46686, 46687, 13920, 46696, 46712, 46713, 46722, 46723, 46727, 13962, 13967, 46739, 46742, 46743, 13979, 13982, 46756, 46787, 46790, 46791, 14027, 14030, 46802, 46806, 46807, 14042, 14047, 46820, 46836, 46858, 46862, 46878, 46892, 46893, 14146, 46922, 46923, 46926, 46927, 46942, 46952, 46953, 14192, 46968, 46978, 46979, 46982, 46983, 14219, 14222, 46994, 46998, 46999, 14234, 14239, 47008, 14248, 14249, 14253, 47024, 47028, 14264, 14265, 14268, 47042, 47046, 47047, 14282, 14287, 47059, 47062, 47063, 14299, 14302, 47076, 14313, 14316, 14317, 47088, 47092, 14328, 14332, 14333, 47108, 47124, 14361, 14364, 14365, 47138, 47142, 47143, 47155, 47158, 47172, 47184, 47188, 14424, 14425, 14429, 47202, 47203, 47207, 14442, 14447, 47218, 47219, 47222, 47223, 14459, 14462, 14464, 47256, 47260, 47261, 14499, 47274, 47275, 47278, 47279, 14514, 47290, 47291, 47294, 47295, 14528, 47309, 14544, 47320, 47321, 47339, 47343, 47354, 47358, 47359, 47376, 47380, 14616, 14620, 14621, 47395, 47398, 47399, 47410, 47414, 47428, 47440, 14680, 14681, 14684, 47459, 47462, 47463, 14699, 14702, 47474, 47478, 47479, 14714, 14719, 47496, 47500, 47501, 14736, 47512, 47513, 14754, 47531, 47535, 14771, 47546, 47550, 47551, 14784, 47560, 47561, 14800, 47577, 47594, 47595, 47598, 47610, 47611, 47614, 47615, 47618, 47623, 47638, 47639, 47648, 47652, 14888, 14892, 14893, 47682, 47683, 47686, 14922, 14927, 47703, 47716, 47728, 14968, 14969, 14973, 14979, 47754, 47755, 47758, 47759, 14994, 47771, 47775, 15008, 47784, 47785, 47801, 47818, 47822, 47823, 47835, 47838, 47839, 15072, 47848, 47849, 47852, 47853, 15088, 47864, 47869, 47875, 47878, 47894, 47895, 47908, 15145, 15148, 15149, 47938, 47939, 47943, 15179, 15182, 47958, 47959, 47984, 47988, 15224, 15225, 15228, 15234, 48010, 48011, 48014, 48015, 15251, 48026, 48030, 48031, 48041, 15280, 48057, 48075, 48079, 48090, 48094, 48095, 15328, 48105, 48109, 15344, 48120, 48121, 48124, 48125, 48144, 48148, 15384, 15385, 15389, 48163, 48166, 48167, 48178, 48196, 48212, 15449, 15452, 15453, 48227, 48230, 48231, 15467, 15470, 48242, 48246, 48247, 15482, 15487, 15488, 48269, 15504, 48280, 48281, 48298, 48302, 48303, 48315, 48319, 15552, 48333, 48344, 48348, 48349, 15587, 48363, 48366, 48367, 15602, 48378, 48382, 48383, 48388, 48400, 15640, 15641, 15644, 48418, 48435, 48452, 48464, 48468, 15704, 15708, 15709, 48482, 48486, 48487, 15722, 15727, 48499, 48502, 48503, 15739, 15742, 15744, 48520, 48521, 15760, 48537, 48555, 48558, 48559, 48570, 48574, 48575, 48584, 48588, 48589, 15824, 48601, 15842, 48618, 48622, 48623, 15859, 48635, 48638, 48639, 48642, 48647, 48662, 48663, 48672, 48676, 15912, 15913, 15916, 48707, 48710, 48711, 15947, 15950, 48726, 48727, 48740, 48756, 15993, 15996, 15997, 48779, 48783, 48794, 48795, 48798, 16032, 48808, 48809, 48812, 48813, 16048, 48825, 48829, 16067, 48843, 48846, 48847, 16082, 48858, 48862, 48863, 16096, 48872, 48877, 48889, 48893, 48899, 48902, 48918, 48928, 16168, 16169, 16173, 48948, 48962, 48966, 48967, 16202, 16207, 48982, 48983, 48996, 49008, 49012, 16248, 16252, 16253, 49034, 49038, 49039, 49050, 49051, 49054, 49055, 16288, 49064, 49069, 16304, 49080, 49081, 49084, 49085, 16322, 49098, 49102, 49103, 16339, 49115, 49118, 49119, 49129, 49133, 16368, 49144, 49149, 49226, 49227, 49230, 49231, 49257, 49261, 49273, 49277, 49302, 49303, 49316, 49332, 49366, 49367, 49380, 49396, 16662, 49434, 49435, 49438, 16676, 49448, 16692, 49464, 49465, 16726, 16727, 49502, 49503, 16756, 49528, 49538, 49539, 49543, 16778, 16779, 16783, 49554, 49555, 49558, 16794, 16795, 16798, 49572, 16808, 16809, 16812, 16813, 49588, 16824, 16825, 16828, 16829, 49602, 49606, 49607, 16843, 16846, 16847, 49619, 49622, 49623, 16858, 16862, 16863, 49636, 16872, 16873, 16876, 16877, 49652, 16888, 16889, 16892, 16893, 16916, 49688, 49711, 16950, 49726, 49740, 49741, 16980, 49752, 49786, 49787, 49796, 17032, 17033, 17036, 17037, 49812, 17048, 17049, 17052, 17053, 49826, 49827, 49831, 17066, 17067, 17071, 49842, 49843, 49846, 17082, 17083, 17086, 49860, 17096, 17097, 17100, 17101, 49876, 17112, 17113, 17116, 17117, 49891, 49894, 49895, 17131, 17134, 17135, 49906, 49910, 49911, 17146, 17150, 17151, 17172, 49944, 49945, 17190, 49966, 49996, 49997, 50027, 17288, 17289, 50068, 17304, 17305, 50083, 17322, 17323, 50098, 17338, 17339, 17356, 17357, 17372, 17373, 50146, 50150, 17390, 17391, 50163, 50166, 17406, 17407, 50186, 50187, 50190, 50191, 50220, 50221, 50236, 50237, 50250, 50251, 50280, 50281, 50284, 50285, 50296, 50297, 50300, 50301, 50306, 50307, 50310, 50311, 50322, 50323, 50326, 50327, 50336, 50340, 50352, 50356, 50370, 50371, 50374, 50375, 50386, 50387, 50390, 50391, 50400, 50404, 50416, 50420, 17686, 17687, 50462, 50463, 17700, 50472, 17751, 50522, 50523, 50527, 17764, 50536, 50537, 17780, 50552, 50563, 50566, 50567, 17802, 17806, 17807, 50578, 50582, 50583, 17819, 17822, 17823, 50596, 17832, 17833, 17836, 17837, 50612, 17848, 17849, 17852, 17853, 50626, 50627, 50630, 17866, 17867, 17870, 50642, 50643, 50647, 17882, 17883, 17887, 50660, 17896, 17897, 17900, 17901, 50676, 17912, 17913, 17916, 17917, 50697, 50701, 50747, 50760, 50761, 50764, 50765, 18004, 50776, 50777, 50798, 18039, 50815, 50820, 18060, 18061, 50832, 50836, 18076, 18077, 50850, 50854, 50855, 18094, 18095, 50867, 50870, 50871, 18110, 18111, 50880, 50884, 18120, 18121, 50900, 18136, 18137, 50914, 50915, 50918, 18154, 18155, 50930, 50931, 18170, 18171, 50953, 50957, 18196, 50968, 50986, 50987, 51016, 51017, 51020, 51021, 18260, 51032, 18279, 51055, 51070, 51071, 51076, 18312, 18313, 18316, 18317, 51088, 51092, 18328, 18329, 18332, 18333, 51106, 51107, 51110, 51111, 18347, 18350, 18351, 51122, 51123, 51126, 51127, 18362, 18366, 18367, 51136, 51140, 18376, 18377, 18380, 18381, 51156, 18392, 18393, 18396, 18397, 51170, 51171, 51175, 18410, 18411, 18415, 51186, 51187, 51190, 51191, 18426, 18427, 18430, 51218, 51219, 51223, 18458, 18459, 18463, 51236, 18472, 18473, 18476, 18477, 18488, 18489, 51266, 51267, 51270, 51271, 51283, 51286, 51287, 18522, 18526, 18527, 51300, 18540, 18541, 51316, 18552, 18553, 18556, 18557, 18566, 18567, 51338, 51342, 18582, 18583, 51355, 51358, 51359, 18596, 51369, 18612, 51385, 18630, 18631, 51402, 51403, 51406, 51407, 18646, 18647, 51418, 51419, 51422, 51423, 18660, 51432, 51433, 51436, 18676, 51448, 51452, 51462, 51463, 51474, 51475, 51478, 18714, 18715, 18718, 51492, 18728, 18729, 18732, 18733, 51508, 18744, 18745, 51522, 51523, 51526, 51527, 51538, 51542, 51543, 18779, 18782, 18783, 51552, 51556, 18796, 18797, 51568, 51572, 18808, 18809, 18812, 18813, 18822, 18823, 51595, 51598, 51599, 18838, 18839, 51610, 51614, 51615, 18852, 51624, 51625, 51628, 51629, 18868, 51640, 51641, 51644, 51645, 18886, 18887, 51658, 51659, 51662, 51663, 18902, 18903, 51674, 51675, 51678, 51679, 18916, 51688, 51689, 51692, 51693, 18932, 51704, 51705, 51708, 51709, 51716, 51732, 18968, 18969, 18972, 18973, 51746, 51747, 51751, 18986, 18987, 18991, 51763, 19002, 19003, 51776, 51780, 51796, 19032, 19033, 19036, 19037, 51810, 51814, 51815, 19054, 19055, 51826, 51827, 51830, 51831, 19067, 19070, 19071, 19076, 51849, 19092, 51864, 51865, 51868, 51869, 19110, 19111, 51883, 51887, 19126, 19127, 51899, 51902, 19140, 51916, 51917, 19156, 51928, 51929, 51932, 19174, 19175, 51950, 51951, 19190, 19191, 51962, 51963, 51966, 51967, 51972, 51988, 19224, 19225, 19228, 19229, 52002, 52003, 52006, 19242, 19243, 19246, 52018, 19258, 19259, 52032, 52036, 52052, 19288, 19289, 19292, 19293, 52067, 52070, 52071, 19310, 19311, 52082, 52083, 52086, 52087, 19322, 19326, 19327, 19332, 52105, 19348, 52120, 52121, 52124, 52125, 19366, 19367, 52139, 52142, 19382, 19383, 52155, 52159, 19396, 52169, 52172, 52173, 19412, 52184, 52185, 52188, 19430, 19431, 52202, 52203, 52206, 52207, 19446, 19447, 52222, 52223, 52242, 52246, 52247, 19483, 19486, 19487, 52260, 19496, 19497, 19500, 19501, 19516, 19517, 52290, 52291, 52294, 52295, 52306, 52307, 52310, 19546, 19547, 19550, 52320, 52324, 19560, 19561, 52336, 52340, 19576, 19577, 19580, 19581, 19590, 19591, 52362, 52363, 52366, 52367, 19606, 19607, 52378, 52379, 52382, 52383, 19620, 52396, 52397, 19636, 52409, 52412, 52413, 19654, 19655, 52427, 52431, 19670, 19671, 52442, 52443, 52446, 19684, 52456, 52457, 19700, 52472, 52473, 52486, 52487, 52499, 52502, 52503, 19738, 19742, 19743, 52516, 19752, 19753, 19756, 19757, 19772, 19773, 52546, 52547, 52550, 52551, 52562, 52563, 52567, 19802, 19803, 19807, 52580, 19816, 19817, 52596, 19832, 19833, 19836, 19837, 19846, 19847, 52618, 52619, 52622, 52623, 19862, 19863, 52634, 52635, 52638, 52639, 19876, 52648, 52649, 52652, 19892, 52664, 52665, 52668, 19910, 19911, 52682, 52683, 52686, 19926, 19927, 52698, 52699, 52703, 19940, 52712, 52713, 19956, 52728, 52729, 52740, 52756, 19992, 19993, 19996, 19997, 52771, 52774, 52775, 20011, 20014, 20015, 52786, 52790, 20030, 20031, 52800, 52804, 52820, 20056, 20057, 20060, 20061, 52834, 52835, 52838, 20074, 20075, 52850, 52851, 52855, 20090, 20091, 20095, 20100, 52872, 52873, 52876, 20116, 52888, 52889, 52892, 52893, 20134, 20135, 52910, 52911, 20150, 20151, 52922, 52923, 52926, 52927, 20164, 52936, 52937, 20180, 52952, 52953, 20198, 20199, 52970, 52971, 52974, 20214, 20215, 52986, 52987, 52991, 52996, 53012, 20248, 20249, 20252, 20253, 53026, 53030, 53031, 20266, 20270, 20271, 53043, 53046, 20286, 20287, 53056, 53060, 53076, 20312, 20313, 20316, 20317, 53090, 53091, 20330, 20331, 53106, 53107, 53110, 53111, 20346, 20347, 20350, 20356, 53128, 53132, 20372, 53144, 53145, 53148, 53149, 20390, 20391, 53162, 53163, 53166, 53167, 20406, 20407, 53182, 53183, 20420, 53192, 53193, 20436, 53208, 53209, 20454, 20455, 53226, 53227, 53231, 20470, 20471, 53242, 53246, 20550, 20551, 53322, 53323, 53326, 53327, 20580, 53352, 53356, 20596, 53368, 53372, 53382, 53383, 20622, 20623, 20638, 20639, 53412, 20652, 20653, 53428, 20668, 20669, 53446, 53447, 20682, 20683, 20698, 20699, 53476, 20712, 20713, 53492, 20728, 20729, 53530, 53531, 53535, 53545, 53560, 53561, 53598, 53599, 53625, 53634, 53635, 53638, 53650, 53651, 53655, 53668, 53684, 53699, 53702, 53703, 53714, 53718, 53719, 53732, 53748, 53785, 53806, 53823, 53836, 53837, 53849, 53882, 53883, 53892, 53908, 53922, 53923, 53926, 53938, 53939, 53943, 53956, 53972, 53986, 53990, 53991, 54003, 54006, 54007, 54040, 54041, 54063, 54092, 54093, 54122, 54148, 54178, 54195, 54243, 54246, 54258, 54262, 21510, 21511, 54282, 54283, 54286, 54287, 54316, 54317, 54332, 54333, 54346, 54347, 21600, 54376, 54377, 54380, 54381, 21616, 54392, 54393, 54396, 54397, 54402, 54403, 54406, 54407, 21642, 21643, 21646, 21647, 54418, 54419, 54422, 54423, 21658, 21659, 21662, 21663, 54432, 54436, 21672, 21673, 21676, 21677, 54448, 54452, 21688, 21689, 21692, 21693, 54466, 54467, 54470, 54471, 21706, 21707, 21710, 21711, 54482, 54483, 54486, 54487, 21722, 21723, 21726, 21727, 54496, 54500, 21736, 21737, 21740, 21741, 54512, 54516, 21752, 21753, 21756, 21757, 54558, 54559, 54569, 54618, 54619, 54622, 54632, 54633, 54649, 54658, 54662, 54663, 54675, 54678, 54679, 54692, 54708, 54722, 54723, 54727, 54738, 54739, 54742, 54756, 54772, 22020, 54792, 54796, 54842, 22080, 54856, 54857, 54860, 54861, 54872, 54873, 54895, 54910, 54912, 54916, 22152, 22153, 22157, 54932, 22168, 22169, 22172, 54947, 54950, 54951, 54962, 54966, 54967, 54980, 22217, 22220, 22221, 54992, 54996, 22232, 22236, 22237, 55010, 55011, 55026, 55027, 55030, 22276, 55048, 55052, 55065, 55082, 55083, 22336, 55112, 55113, 55116, 55117, 55129, 55150, 55166, 55167, 55168, 55172, 22408, 22409, 22413, 55188, 22424, 22425, 22428, 55202, 55203, 55206, 55207, 55218, 55219, 55222, 55223, 55236, 22473, 22476, 22477, 55248, 55252, 22488, 22492, 22493, 55266, 55267, 55270, 55271, 55282, 55283, 55287, 55302, 55303, 22542, 22543, 55314, 55315, 55318, 55332, 55348, 55362, 55363, 55366, 55367, 22602, 22603, 22606, 22607, 55378, 55382, 55383, 55392, 55396, 22632, 22633, 22637, 55408, 55412, 22648, 22649, 22653, 22662, 22663, 55435, 55438, 55439, 22678, 22679, 55450, 55454, 55455, 22692, 55464, 55465, 55468, 55469, 22708, 55480, 55481, 55484, 55485, 55498, 55499, 55502, 55503, 22742, 22743, 55514, 55515, 55518, 55519, 22752, 22756, 55528, 55529, 55532, 55533, 22768, 22772, 55544, 55545, 55548, 55549, 22798, 22799, 55570, 55571, 55575, 55588, 55618, 55619, 55622, 55623, 22858, 22859, 22862, 22863, 55635, 55638, 55639, 55652, 22888, 22889, 22892, 55668, 22904, 22905, 22908, 22918, 22919, 55690, 55694, 55695, 22934, 22935, 55707, 55711, 22948, 55720, 22964, 55736, 22982, 22983, 55754, 55755, 55758, 55759, 55770, 55771, 55774, 55775, 23008, 23012, 55785, 55789, 23024, 23028, 55800, 55801, 55805, 55812, 23052, 23053, 55828, 55842, 55843, 55846, 55858, 55872, 55876, 23112, 23113, 23116, 23117, 55892, 55907, 55910, 55911, 55922, 55923, 55926, 55927, 23172, 55944, 55945, 55948, 55949, 23188, 55960, 55978, 55982, 55994, 55999, 23232, 23236, 56008, 56009, 56013, 23248, 23252, 56024, 56028, 56029, 56046, 56047, 56058, 56059, 56062, 56063, 56068, 23308, 23309, 56084, 56098, 56099, 56103, 56115, 56128, 56132, 23368, 23369, 23372, 23373, 56148, 56162, 56166, 56167, 56178, 56179, 56182, 56183, 23428, 56200, 56201, 56204, 56205, 23444, 56216, 56234, 56239, 56250, 56254, 23488, 23492, 56264, 56265, 56269, 23504, 23508, 56284, 56285, 56298, 56299, 56302, 56303, 56318, 56319, 56326, 56327, 23562, 23563, 56339, 56342, 56343, 56356, 56386, 56387, 56390, 56391, 23626, 23627, 23630, 23631, 56402, 56403, 56407, 56420, 23657, 23660, 23661, 56436, 23673, 23676, 23677, 56458, 56459, 56462, 56463, 23702, 23703, 56474, 56475, 56478, 56479, 23712, 23716, 56488, 56489, 56493, 23728, 23732, 56504, 56505, 56509, 23750, 23751, 56522, 56523, 56526, 23766, 23767, 56538, 56539, 56543, 23780, 56552, 56553, 23796, 56568, 56569, 23818, 23819, 56594, 56598, 56599, 56612, 56642, 56643, 56646, 56647, 23882, 23883, 23886, 23887, 56658, 56659, 56662, 56672, 56676, 23912, 23916, 23917, 56688, 56692, 23928, 23932, 23933, 23942, 23943, 56714, 56715, 56718, 56719, 56730, 56731, 56734, 56735, 23968, 23972, 56744, 56748, 56749, 23984, 23988, 56764, 56765, 24006, 24007, 56778, 56779, 56783, 24022, 24023, 56794, 56798, 24036, 56808, 56809, 24052, 56824, 56825, 56836, 24072, 24073, 56852, 56866, 56870, 56871, 56883, 56886, 56896, 56900, 24136, 24137, 24140, 24141, 56916, 56930, 56931, 56946, 56947, 56950, 56951, 24192, 24196, 56968, 56969, 56972, 56973, 24208, 24212, 56985, 56989, 57006, 57007, 57018, 57019, 57022, 57023, 24260, 57032, 57033, 24276, 57048, 57049, 57067, 57071, 57082, 57083, 57086, 57092, 24328, 24329, 57108, 57123, 57126, 57127, 57138, 57142, 57152, 57156, 24392, 24393, 24396, 24397, 57172, 57186, 57187, 57190, 57202, 57203, 57207, 24448, 24452, 57224, 57225, 57228, 57229, 24464, 24468, 57240, 57241, 57245, 57258, 57259, 57262, 57263, 57278, 57279, 24516, 57288, 57289, 24532, 57304, 57305, 57322, 57323, 57326, 57338, 57339, 57343, 24576, 57387, 57391, 57402, 57406, 57416, 57421, 57450, 57454, 57467, 57471, 57476, 57507, 57510, 57522, 57527, 57556, 57571, 57574, 57586, 57591, 24852, 57624, 57625, 57628, 24870, 57642, 24886, 57658, 57659, 24916, 57692, 57693, 24951, 57723, 57728, 24968, 24969, 24973, 57744, 57748, 24984, 24985, 24988, 57766, 25002, 25003, 25006, 25007, 57782, 57783, 25018, 25019, 25022, 25023, 57792, 57796, 25033, 25036, 25037, 57812, 25048, 25052, 25053, 57830, 57831, 25066, 25067, 25070, 25071, 57846, 57847, 25082, 25083, 25086, 25087, 57867, 57871, 25110, 57882, 57901, 25140, 57916, 57934, 57935, 25174, 57946, 57976, 57977, 57986, 25226, 25227, 25231, 58003, 58006, 58007, 25242, 25243, 25246, 58016, 25256, 25257, 25261, 58032, 58036, 25272, 25273, 25276, 58051, 58054, 58055, 25291, 25294, 25295, 58066, 58070, 58071, 25306, 25310, 25311, 58084, 25321, 25324, 25325, 58096, 58100, 25336, 25340, 25341, 58122, 58126, 25366, 58138, 58139, 25380, 58156, 58190, 58191, 58216, 58243, 25487, 58258, 25502, 58276, 25516, 25533, 58306, 58310, 25547, 58323, 58326, 25562, 25576, 25593, 58376, 58381, 58414, 58415, 58430, 58431, 58440, 58441, 25698, 25699, 58474, 58475, 58478, 58479, 25714, 25715, 58490, 58491, 58494, 58495, 58500, 58516, 58530, 58534, 58535, 25770, 25771, 25774, 25775, 58547, 58550, 58551, 25786, 25787, 25790, 25791, 58564, 58580, 58594, 58595, 58599, 25834, 25835, 25838, 25839, 58610, 58611, 58614, 25850, 25851, 25854, 25855, 25876, 58652, 58653, 25894, 58666, 25940, 58712, 58713, 58716, 25959, 58730, 58731, 25975, 58747, 58752, 58756, 25993, 25996, 25997, 58772, 26008, 26012, 26013, 58790, 58791, 26026, 26027, 26030, 26031, 58806, 58807, 26042, 26043, 26046, 26047, 58816, 26056, 26057, 26061, 58832, 58836, 26072, 26073, 26076, 58854, 58855, 26090, 26091, 26094, 26095, 58871, 26106, 26107, 26110, 26111, 58890, 58894, 58936, 26178, 26179, 58954, 58955, 58958, 58959, 26199, 58970, 58971, 58989, 26228, 59004, 59005, 59010, 59014, 59015, 26250, 26251, 26254, 26255, 59027, 59030, 59031, 26266, 26267, 26270, 26271, 59044, 26281, 59060, 26296, 59075, 59078, 59079, 26314, 26315, 26318, 26319, 59090, 59091, 59095, 26330, 26331, 26334, 26335, 26349, 59124, 26364, 59147, 59151, 26391, 59163, 59176, 59177, 26434, 26435, 59210, 59211, 59214, 59215, 26455, 59227, 26468, 59244, 59245, 59261, 59267, 59270, 59271, 26506, 26507, 26510, 26511, 59282, 59286, 59287, 26522, 26523, 26526, 26527, 59296, 59300, 26536, 26540, 26541, 59316, 26553, 26556, 26557, 59330, 59334, 59335, 26570, 26571, 26574, 26575, 59346, 59347, 59350, 59351, 26586, 26587, 26590, 26591, 59360, 59364, 26600, 26601, 26604, 59376, 26616, 26617, 26621, 59396, 59408, 26648, 26649, 26653, 59426, 26666, 26667, 26671, 59443, 26687, 59460, 59472, 59476, 26713, 26716, 26717, 59490, 59494, 59495, 26730, 26731, 26734, 26735, 59507, 59510, 59511, 26746, 26747, 26750, 26751, 26756, 59532, 26768, 59544, 59545, 59549, 26786, 26787, 26790, 26791, 59562, 59563, 59566, 26802, 26803, 26806, 26807, 59578, 59579, 59583, 26816, 26820, 59596, 26832, 26836, 59612, 59613, 26854, 26855, 59626, 59627, 59631, 26870, 26871, 59642, 59643, 59646, 59664, 59668, 26904, 26905, 26908, 59683, 59686, 59687, 26922, 26923, 26926, 59698, 26942, 59716, 59732, 26968, 26972, 26973, 59747, 59750, 59751, 26986, 26987, 26990, 26991, 59762, 59766, 59767, 27002, 27003, 27006, 27007, 27008, 59784, 59785, 59789, 27028, 59800, 27042, 27043, 27046, 27047, 59818, 59819, 59823, 27058, 27059, 27062, 27063, 59834, 59835, 59838, 27072, 27076, 59852, 59853, 27088, 27092, 59864, 27110, 27111, 59882, 59886, 27126, 27127, 59898, 59899, 59903, 59907, 59910, 59926, 27162, 27163, 27166, 27167, 59936, 27176, 27177, 27181, 59956, 27196, 59970, 59974, 59975, 27210, 27211, 27214, 27215, 59990, 59991, 27226, 27227, 27230, 27231, 60004, 27241, 60016, 60020, 27256, 27260, 27261, 27266, 27267, 27270, 27271, 60042, 60043, 60046, 27282, 27283, 27286, 27287, 60058, 60059, 60063, 60072, 60077, 27316, 60088, 60092, 27334, 27335, 60106, 60107, 60110, 60111, 27350, 27351, 60122, 60123, 60127, 27364, 60136, 60137, 60140, 60141, 27380, 60152, 60157, 60162, 60167, 60182, 60183, 27418, 27419, 27422, 27423, 60192, 60196, 27432, 27433, 27436, 27453, 60227, 60230, 60231, 27466, 27467, 27470, 27471, 60246, 60247, 27482, 27483, 27486, 27487, 60260, 27496, 60276, 27513, 27516, 27517, 27522, 27523, 27526, 27527, 60298, 60299, 60303, 27538, 27539, 27542, 27543, 60314, 60315, 60318, 27556, 60328, 60332, 60344, 60349, 27590, 27591, 60363, 60366, 60367, 27606, 27607, 60378, 60382, 27620, 60392, 60396, 27636, 60408, 60409, 60412, 60413, 60432, 60436, 27673, 27676, 27677, 60451, 60454, 60455, 27691, 27694, 27695, 60466, 60470, 27707, 60484, 60496, 27736, 27737, 27741, 60515, 60518, 60519, 27754, 27755, 27758, 27759, 60530, 60534, 60535, 27770, 27771, 27774, 27775, 27776, 27780, 60556, 27792, 27796, 60572, 60573, 27814, 27815, 60586, 60587, 60590, 60591, 27830, 27831, 60603, 60606, 60607, 27844, 60620, 60621, 27856, 60632, 60633, 60637, 27874, 27875, 27878, 27879, 60650, 60651, 60655, 27890, 27891, 27894, 27895, 60666, 60670, 60676, 60692, 27928, 27932, 27933, 60706, 60710, 60711, 27946, 27950, 27951, 60723, 60726, 27962, 60740, 60752, 60756, 27992, 27993, 27996, 60770, 60771, 60775, 28010, 28011, 28014, 28015, 60786, 60787, 60790, 60791, 28026, 28027, 28030, 28031, 28032, 28036, 60812, 60813, 28048, 28052, 60824, 28070, 28071, 60842, 60843, 60847, 28086, 28087, 60858, 60862, 28096, 60872, 60873, 60877, 28116, 28130, 28131, 28134, 28135, 60906, 60907, 60910, 60911, 28146, 28147, 28150, 28151, 60922, 60923, 60926, 60927, 60931, 60934, 60950, 60951, 28186, 28187, 28190, 28191, 60964, 28201, 28204, 28205, 28216, 60994, 60995, 60999, 28234, 28235, 28238, 28239, 61014, 61015, 28250, 28251, 28254, 28255, 28269, 61040, 61044, 28280, 28281, 28284, 28294, 28295, 61066, 61067, 61071, 28310, 28311, 61082, 61086, 28324, 61096, 61097, 61100, 61101, 28340, 61112, 61116, 28354, 28355, 28358, 28359, 61130, 61131, 61135, 28370, 28371, 28374, 28375, 61146, 61147, 61150, 61151, 61164, 28404, 61180, 61186, 61191, 61206, 61207, 28442, 28443, 28446, 28447, 61216, 61220, 28456, 28460, 28461, 28473, 61250, 61251, 61254, 28490, 28491, 28494, 28495, 61271, 28506, 28507, 28510, 28511, 61284, 28524, 61296, 28536, 28537, 28541, 28550, 28551, 61322, 61323, 61326, 28566, 28567, 61338, 61339, 61343, 28580, 61352, 61357, 28596, 61368, 61369, 61372, 61373, 28610, 28611, 28614, 28615, 61386, 61390, 28626, 28627, 28630, 28631, 61402, 61403, 61406, 61407, 28644, 61420, 61436, 61437, 61482, 61486, 61499, 61503, 28740, 61513, 61516, 28775, 61547, 61551, 28790, 61562, 61566, 28808, 61588, 28825, 61602, 61607, 28843, 61619, 61622, 28858, 61636, 28876, 28893, 61666, 61671, 28911, 61683, 61686, 28926, 61720, 61721, 61725, 61739, 61754, 61755, 29012, 61788, 61789, 29046, 61818, 61824, 61828, 29064, 29065, 29068, 61840, 29080, 29081, 29085, 61862, 61863, 29098, 29099, 29103, 61878, 29114, 29115, 29118, 61892, 29128, 29132, 29133, 61904, 61908, 29145, 29148, 29149, 61926, 61927, 29163, 29166, 29167, 61942, 61943, 29178, 29182, 29183, 61962, 61966, 61979, 61996, 62013, 62030, 62031, 29271, 62043, 62072, 62073, 62083, 62086, 62087, 29323, 29327, 62098, 29338, 29342, 62112, 62116, 29352, 29353, 29356, 62128, 29368, 29369, 29373, 62146, 62150, 62151, 29387, 29391, 62163, 62166, 62167, 29402, 29406, 62176, 62180, 29416, 29420, 29421, 62196, 29433, 29436, 29437, 62219, 62223, 62234, 62235, 62253, 62286, 62287, 62313, 62338, 62355, 62388, 62403, 62406, 62418, 62422, 29700, 62473, 62476, 62510, 62511, 62526, 62527, 62536, 62537, 62570, 62571, 62574, 62575, 62586, 62587, 62590, 62591, 62596, 29832, 29833, 29837, 62612, 29848, 29849, 29852, 62627, 62630, 62631, 62642, 62646, 62647, 62660, 29897, 29900, 29901, 62676, 29912, 29916, 29917, 62690, 62691, 62694, 62706, 62707, 62711, 29972, 62748, 62749, 29991, 62763, 62808, 62809, 62813, 62826, 62827, 62842, 62852, 30088, 30092, 30093, 62864, 62868, 30105, 30108, 30109, 62886, 62887, 30123, 30126, 30127, 62902, 62903, 30138, 30142, 30143, 62912, 62916, 30152, 30153, 30156, 62928, 30168, 30169, 30173, 62951, 30186, 30187, 30191, 62966, 62967, 30202, 30203, 30206, 30215, 62987, 62991, 63033, 63050, 63051, 63054, 63055, 63066, 63067, 63084, 63100, 63101, 63107, 63110, 63111, 30346, 30347, 30350, 63122, 63126, 63127, 30362, 30363, 30367, 63140, 63156, 63170, 63171, 63175, 30410, 30414, 30415, 63187, 63190, 63191, 30427, 30430, 30431, 63204, 30470, 63242, 63246, 30486, 63258, 63272, 63273, 63306, 63307, 63310, 63311, 63322, 63340, 63341, 63356, 63362, 63366, 63367, 30602, 30603, 30606, 30607, 63379, 63382, 63383, 30618, 30619, 30622, 30623, 63396, 30633, 30636, 30637, 63408, 63412, 30648, 30652, 30653, 63426, 63427, 63430, 63431, 30666, 30667, 30670, 30671, 63442, 63446, 63447, 30682, 30683, 30686, 30687, 63456, 30696, 30697, 30701, 63472, 63476, 30712, 30713, 30716, 30728, 63504, 63508, 30744, 30745, 30748, 63523, 63526, 63527, 30763, 30767, 63538, 63556, 30792, 30793, 30797, 63572, 30808, 30812, 30813, 63587, 63590, 63591, 30826, 30827, 30830, 63602, 63606, 63607, 30842, 30843, 30846, 30847, 30852, 63625, 30868, 63640, 63641, 63644, 30886, 30887, 63658, 63659, 63663, 30902, 30903, 63674, 63675, 63678, 63689, 30932, 63708, 63709, 30950, 30951, 63722, 63723, 63726, 30966, 30967, 63739, 63743, 63748, 30985, 63760, 31000, 31001, 31005, 63778, 31018, 31022, 63795, 63812, 31048, 31049, 31052, 63824, 63828, 31065, 31068, 31069, 63842, 63846, 63847, 31082, 31083, 31087, 63859, 63862, 63863, 31098, 31099, 31102, 31103, 31108, 63880, 63881, 63884, 31124, 63901, 31142, 31143, 63914, 63915, 63918, 31158, 31159, 63930, 63931, 63935, 31172, 63948, 63949, 63965, 31206, 31207, 63978, 63979, 63983, 31222, 31223, 63994, 63995, 63998, 64002, 64007, 31243, 64022, 64023, 31258, 31259, 31263, 64032, 64036, 31272, 31273, 31276, 64067, 64070, 64071, 64086, 64087, 31323, 31326, 31327, 64100, 64116, 31353, 31356, 31357, 31366, 31367, 64138, 64139, 64143, 31382, 31383, 64154, 64155, 64158, 31396, 64169, 64172, 64185, 64189, 31430, 31431, 64203, 64207, 31446, 31447, 64218, 64222, 64223, 31460, 64232, 64233, 64236, 64237, 31476, 64249, 64253, 64259, 64262, 31498, 64278, 31514, 31515, 31518, 64288, 31528, 31529, 31533, 64308, 64322, 64326, 64327, 64342, 64343, 31578, 31582, 31583, 64356, 64368, 64372, 31608, 31612, 31613, 31622, 31623, 64394, 64395, 64398, 31638, 31639, 64410, 64411, 64415, 64425, 64429, 31668, 64441, 64444, 31686, 31687, 64458, 64459, 64462, 31702, 31703, 64474, 64475, 64478, 64479, 31716, 64489, 64492, 31732, 64504, 64505, 64508, 64509, 64516, 31756, 64532, 31768, 31772, 31773, 64546, 64550, 64551, 31787, 31791, 64563, 64566, 64580, 31817, 31820, 31821, 64592, 64596, 31832, 31833, 31836, 64610, 64611, 64615, 31850, 31854, 31855, 64626, 64627, 64630, 64631, 31866, 31867, 31870, 31871, 64649, 31892, 64668, 64669, 31910, 31911, 64683, 64687, 31926, 31927, 64698, 64699, 64702, 31940, 31956, 64728, 64729, 64732, 31974, 31975, 64746, 64747, 64750, 64751, 31990, 31991, 64762, 64763, 64766, 64767, 32013, 64784, 64788, 32025, 32028, 32029, 64803, 64806, 64807, 32042, 32046, 64818, 64822, 64836, 32072, 32076, 32077, 64848, 32088, 32089, 32093, 64867, 64870, 64871, 32107, 32110, 32111, 64882, 64886, 64887, 32122, 32123, 32126, 32127, 32132, 64908, 64909, 64925, 32166, 32167, 64938, 64942, 64943, 32182, 32183, 64954, 64955, 64958, 64959, 32196, 64968, 64969, 64972, 32212, 64988, 64989, 32230, 32231, 65003, 65007, 32246, 32247, 65018, 65019, 65022, 65026, 65031, 32271, 65046, 65047, 32283, 32286, 32287, 65056, 65060, 32296, 32300, 32301, 65090, 65091, 65094, 65111, 32346, 32347, 32351, 65124, 65136, 32376, 32377, 32381, 32390, 32391, 65162, 65163, 65166, 32406, 32407, 65178, 65179, 65183, 32420, 65192, 65193, 65196, 65197, 32436, 65209, 65212, 32454, 32455, 65226, 65227, 65230, 65231, 32470, 32471, 65243, 65247, 32484, 65260, 65261, 65277, 65283, 65286, 32526, 65302, 65303, 32538, 32542, 32543, 65316, 32553, 32556, 32557, 65346, 65347, 65351, 65366, 65367, 32602, 32603, 32606, 65392, 65396, 32632, 32633, 32636, 32646, 32647, 65419, 65423, 32662, 32663, 65434, 65435, 65438, 32676, 65449, 65453, 32692, 65464, 65465, 65468, 65469, 32710, 32711, 65482, 65483, 65486, 65487, 32726, 32727, 65498, 65499, 65502, 65517, 32756, 65533], 282: [32838, 32839, 32868, 32884, 32941, 32957, 32986, 32987, 33043, 33047, 282, 286, 33060, 300, 301, 33076, 316, 317, 33106, 33107, 33110, 33111, 346, 347, 350, 351, 33124, 364, 365, 33140, 387, 390, 391, 33162, 33166, 33167, 402, 406, 407, 33178, 33179, 33182, 33183, 420, 33196, 33197, 436, 33212, 33213, 450, 451, 33226, 33227, 33230, 466, 467, 33242, 33243, 33247, 484, 33260, 500, 33276, 33300, 540, 541, 33315, 558, 559, 33334, 33335, 570, 33348, 33364, 33382, 33383, 618, 33394, 33395, 33398, 33399, 33420, 33421, 33436, 33437, 674, 679, 33450, 33451, 33454, 33455, 691, 694, 33467, 33470, 33471, 33481, 33496, 33497, 33501, 738, 739, 743, 33514, 33515, 33519, 754, 755, 758, 33530, 33531, 33534, 33556, 796, 797, 33574, 33575, 810, 33587, 33604, 33620, 860, 861, 33634, 33635, 33638, 33639, 33654, 33655, 891, 900, 33676, 33677, 916, 33692, 33693, 931, 934, 33707, 33710, 33711, 946, 951, 33722, 33723, 33726, 33727, 964, 33737, 980, 33752, 33753, 33756, 33757, 995, 998, 33770, 33771, 33774, 1010, 1015, 33786, 33787, 33791, 33798, 33799, 33828, 33844, 33858, 33859, 33888, 33904, 33930, 33931, 33934, 33935, 33946, 33947, 33950, 33951, 33960, 33961, 33965, 33976, 33977, 33981, 33998, 33999, 34010, 34011, 34014, 34015, 34024, 34025, 34028, 34029, 34040, 34041, 34044, 34045, 34066, 34067, 34070, 34071, 1306, 1307, 1310, 1311, 34084, 34100, 1340, 1341, 34130, 34134, 1371, 1375, 34148, 1388, 1389, 34164, 1404, 1405, 1410, 1411, 34186, 34187, 34191, 1426, 1427, 34202, 34203, 34206, 1444, 34220, 1460, 34236, 1474, 1478, 1479, 34251, 34254, 34255, 1491, 1494, 1495, 34266, 34267, 34270, 34271, 1508, 34284, 34285, 1524, 34300, 34301, 34308, 34324, 1564, 1565, 34342, 34343, 1578, 34354, 34355, 34358, 34359, 34368, 34388, 1628, 1629, 34402, 34422, 34423, 1659, 1668, 34440, 34441, 1684, 34456, 34457, 34460, 34461, 1699, 1702, 34474, 34475, 34478, 1714, 1719, 34491, 34495, 1732, 34508, 34509, 1748, 34520, 34524, 34525, 1763, 1766, 34538, 34539, 34542, 34543, 1778, 1783, 34554, 34555, 34558, 34559, 34564, 34580, 34594, 34595, 34598, 34599, 34614, 34615, 1851, 34624, 34644, 1884, 1885, 34662, 34663, 1899, 34674, 34675, 1918, 1919, 34696, 34697, 34712, 34713, 34716, 34717, 1954, 1955, 1959, 34730, 34731, 34734, 34735, 1970, 1971, 1974, 34746, 34747, 34750, 34764, 34765, 34776, 34780, 34781, 2018, 2023, 34794, 34798, 34799, 2035, 2038, 34810, 34811, 34814, 34815, 2067, 2070, 2071, 34842, 34846, 34847, 34860, 34861, 2100, 34876, 34877, 34890, 34891, 34894, 34895, 2130, 2131, 34906, 34907, 34911, 2148, 34920, 34921, 34936, 34937, 34946, 34963, 34966, 34967, 34980, 2221, 34996, 35010, 35011, 35014, 35015, 2250, 2251, 35026, 35027, 35030, 35031, 2266, 2267, 35044, 2285, 35060, 2322, 2326, 2327, 35098, 35099, 35102, 35103, 35116, 35117, 2356, 35132, 35133, 35146, 35147, 35150, 35151, 2386, 2387, 35162, 35163, 35166, 2404, 35176, 35177, 35180, 35181, 35192, 35193, 35196, 35197, 35203, 35206, 35207, 35218, 35222, 35223, 2492, 35266, 35267, 35270, 35271, 2506, 2507, 35282, 35283, 35286, 35287, 2522, 2523, 35300, 35316, 2556, 35341, 2580, 35356, 35357, 2594, 2599, 35370, 35371, 35374, 35375, 2611, 2614, 35387, 35390, 35391, 35400, 35401, 35405, 2644, 35420, 2659, 2662, 35434, 35435, 35438, 2674, 2675, 2679, 35450, 35451, 35454, 35455, 35460, 2701, 35490, 35494, 35507, 2747, 35520, 35524, 35540, 2780, 35555, 35558, 35559, 2798, 2799, 35574, 35575, 2810, 2811, 2814, 2815, 35597, 2836, 35612, 35613, 2851, 2854, 35627, 35630, 35631, 2866, 2871, 35642, 35643, 35646, 35647, 35656, 35657, 35661, 2900, 35676, 2914, 2919, 35691, 35695, 2930, 2931, 2934, 35706, 35707, 35710, 35716, 2972, 35747, 2987, 35762, 35766, 35767, 35776, 35780, 3021, 35796, 35810, 35811, 35814, 35815, 3050, 3051, 3054, 3055, 35826, 35830, 35831, 3070, 3071, 3090, 3091, 35866, 35867, 35870, 35881, 3124, 35897, 35918, 35919, 3154, 3158, 3159, 35931, 35934, 35935, 3172, 35948, 35949, 35964, 35965, 35970, 35971, 35974, 35975, 3210, 3211, 35986, 35987, 35990, 35991, 3226, 3227, 36000, 36004, 36016, 36020, 3261, 36035, 36050, 36055, 36068, 36084, 3325, 36106, 36107, 3346, 3347, 36122, 36123, 36127, 36136, 36137, 36141, 3380, 36152, 36153, 36156, 36157, 36170, 36171, 36174, 36175, 3411, 3414, 3415, 36186, 36187, 36190, 36191, 3428, 36200, 36204, 36205, 36216, 36220, 36221, 36226, 36227, 36230, 36231, 3466, 3467, 36242, 36243, 36246, 36247, 3482, 3483, 36260, 3500, 36276, 36290, 36295, 36307, 36310, 3564, 3604, 36380, 3618, 3619, 3623, 36394, 36395, 36399, 3635, 3638, 36410, 36411, 36414, 36424, 36425, 36428, 36429, 3668, 36444, 36445, 3683, 3686, 36458, 36459, 36462, 36463, 3698, 3703, 36474, 36478, 36479, 36484, 3725, 36500, 36515, 36518, 36519, 3758, 3759, 36530, 36531, 36534, 36535, 3770, 3771, 3774, 3775, 36548, 3804, 36579, 36582, 36583, 36594, 36598, 36599, 3834, 3860, 36636, 3874, 3875, 3878, 36650, 36651, 36654, 3890, 3895, 36666, 36667, 36671, 36680, 36681, 36684, 36685, 3924, 36700, 36701, 3938, 3943, 36714, 36715, 36718, 36719, 3955, 3958, 36730, 36731, 36734, 36735, 36740, 36756, 3996, 36774, 36775, 4010, 4011, 4014, 4015, 36786, 36790, 36791, 4030, 4031, 36804, 4045, 36834, 36838, 36839, 4074, 36851, 36934, 36935, 4170, 4171, 4174, 4175, 36964, 4200, 4201, 4205, 36980, 4216, 4217, 4221, 4230, 4231, 37006, 37007, 4246, 4247, 4260, 4276, 4310, 4311, 4324, 37096, 4340, 37112, 37138, 37142, 37156, 37172, 37202, 37203, 37206, 37207, 37220, 37236, 37258, 37259, 37262, 37263, 37274, 37278, 37279, 37292, 37293, 37308, 37309, 37322, 37323, 37327, 37338, 37339, 37342, 37357, 37373, 37396, 37410, 37430, 37431, 37444, 4680, 4681, 4684, 4685, 37460, 37478, 37479, 4714, 4715, 4718, 37490, 37491, 37494, 37495, 4730, 4731, 4734, 4735, 4740, 37516, 37517, 4756, 37532, 37533, 4774, 4775, 37547, 37550, 37551, 4790, 4791, 37562, 37563, 37566, 37567, 4804, 37576, 37577, 37580, 4820, 37592, 4838, 4839, 37610, 37611, 37614, 4855, 37626, 37627, 37631, 37652, 37670, 37671, 37682, 37700, 4936, 4937, 4940, 4941, 37716, 37730, 37731, 37734, 37735, 4970, 4971, 4974, 4975, 37750, 37751, 4986, 4987, 4991, 4996, 37772, 37773, 5012, 37788, 37789, 5030, 5031, 37802, 37803, 37806, 37807, 5046, 5047, 37819, 37823, 5060, 37832, 37833, 37836, 37837, 5076, 37848, 5094, 37866, 37867, 37871, 5110, 5111, 37882, 37883, 37886, 37894, 37895, 5130, 5131, 5134, 5135, 37924, 5160, 5161, 5164, 5165, 37940, 5176, 5177, 5180, 5181, 37954, 37955, 5194, 5195, 5198, 5199, 37984, 5224, 5225, 5228, 5229, 38000, 5240, 5241, 5244, 5245, 5250, 5251, 5254, 5255, 38026, 38027, 38030, 38031, 5266, 5267, 5270, 5271, 38042, 38043, 5280, 5284, 38056, 38057, 38060, 38061, 5296, 5300, 38072, 38073, 38076, 38077, 5314, 5315, 5318, 5319, 38090, 38091, 38094, 38095, 5330, 5331, 5334, 5335, 38106, 38107, 38110, 38111, 5344, 5348, 38120, 38124, 38125, 5360, 5364, 38136, 38140, 38141, 38162, 38163, 38166, 38167, 38180, 38196, 38227, 38231, 38244, 38260, 38282, 38283, 38286, 38298, 38299, 38303, 38317, 38333, 38346, 38347, 38350, 38351, 38363, 38366, 38367, 38380, 38381, 38396, 38397, 38404, 5640, 5641, 5645, 38420, 38438, 38439, 5674, 5675, 5678, 38450, 38451, 38454, 38455, 5690, 5691, 5694, 5695, 38464, 5704, 5705, 5708, 5709, 38484, 38499, 5739, 5742, 5743, 38518, 38519, 5754, 5755, 5758, 5759, 5760, 5764, 38536, 38537, 38540, 38541, 5776, 5780, 38552, 38553, 5794, 5795, 5799, 38570, 38571, 38575, 5810, 5811, 5814, 5815, 38586, 38587, 38590, 5828, 38601, 38604, 38605, 5840, 5844, 38620, 38621, 5858, 5859, 5862, 5863, 38634, 38635, 38638, 38639, 5875, 5878, 5879, 38650, 38651, 38654, 38655, 38660, 5896, 5897, 5901, 38676, 38690, 38691, 38694, 38695, 5930, 5931, 5934, 5935, 38710, 38711, 5946, 5947, 5951, 38720, 5960, 5961, 5964, 5965, 38740, 38758, 38759, 5994, 5995, 5998, 5999, 38770, 38771, 6010, 6014, 6015, 6016, 6020, 38792, 38793, 38796, 38797, 6032, 6036, 38808, 38809, 6050, 6051, 6054, 6055, 38826, 38827, 38830, 38831, 6066, 6067, 6070, 38842, 38843, 38846, 38847, 6084, 38857, 38860, 38861, 6096, 6100, 38876, 38877, 6114, 6118, 6119, 38890, 38891, 38894, 6130, 6131, 6134, 6135, 38906, 38910, 6150, 6151, 38926, 38927, 38938, 38939, 38942, 38943, 6180, 38956, 38957, 6196, 38972, 38973, 6210, 6211, 6214, 6215, 38986, 38987, 38990, 38991, 39002, 39003, 39006, 6240, 6244, 39016, 39017, 39020, 39021, 6256, 6260, 39032, 39033, 39036, 39037, 39043, 39046, 6286, 6287, 39058, 39063, 6302, 6303, 6316, 6317, 6332, 6333, 39106, 39107, 39110, 39111, 6346, 6347, 6350, 6351, 39122, 39123, 39126, 39127, 6362, 6363, 39140, 6376, 6377, 6380, 39156, 6392, 6393, 6396, 6406, 6407, 39194, 39198, 39199, 6436, 39212, 39213, 6452, 39228, 39229, 6466, 6467, 6470, 6471, 39242, 39243, 39258, 39259, 39263, 6496, 6500, 39272, 39273, 6512, 6516, 39288, 39289, 39298, 39303, 6542, 6543, 39315, 39332, 6572, 6573, 39348, 6588, 6589, 39362, 39363, 39366, 39367, 6602, 6603, 39378, 39379, 39382, 39383, 6618, 6619, 6622, 6623, 39392, 39396, 6632, 6637, 39408, 39412, 6648, 6653, 6660, 39452, 39453, 6694, 6695, 39467, 39470, 39471, 6710, 6711, 39482, 39483, 39486, 39487, 6720, 6724, 39496, 39497, 39500, 39501, 39517, 6754, 6755, 6759, 39530, 39531, 39535, 6770, 6771, 6774, 6775, 39546, 39547, 39550, 39551, 6796, 6797, 39572, 6812, 6813, 39587, 39590, 39591, 39602, 39606, 39607, 6846, 6847, 39620, 6856, 6857, 6860, 6861, 39636, 6872, 6873, 6876, 39651, 39654, 39655, 6891, 6894, 6895, 39666, 39667, 39670, 39671, 6907, 6910, 6911, 6916, 39708, 39709, 6950, 6951, 39722, 39723, 39726, 39727, 6966, 6967, 39739, 39743, 6976, 6980, 39752, 39753, 39756, 39757, 39773, 7010, 7011, 7014, 7015, 39786, 39787, 39790, 7026, 7027, 7030, 39802, 39803, 39806, 39807, 7052, 7053, 39828, 7068, 7069, 39842, 39846, 39847, 7086, 7087, 39859, 39876, 7112, 7113, 7116, 7117, 39892, 7128, 7129, 7132, 39910, 39911, 7146, 7150, 7151, 39922, 39926, 39927, 7162, 7166, 7167, 39962, 39963, 39967, 7204, 39976, 39977, 39980, 7220, 39992, 39993, 39996, 39997, 7234, 7235, 7238, 7239, 40010, 40011, 40014, 40015, 40026, 40027, 40030, 40031, 7268, 40041, 40044, 40045, 7284, 40057, 40060, 40061, 40066, 40067, 40070, 40071, 7306, 7307, 7310, 7311, 40082, 40083, 40086, 40087, 7322, 7323, 40100, 7336, 7337, 7340, 7341, 40116, 7352, 7353, 7356, 7357, 40130, 40134, 40135, 7370, 7371, 40147, 40150, 40151, 7386, 7387, 7400, 7416, 7430, 7431, 40218, 40219, 40222, 7460, 40232, 7476, 40248, 7490, 7491, 7494, 7495, 40266, 40267, 40270, 40271, 40283, 40286, 40287, 7520, 7524, 40300, 40301, 7536, 7540, 40316, 40317, 40322, 40323, 40326, 40327, 7562, 7563, 40338, 40339, 40342, 40343, 7578, 7579, 7582, 7583, 40356, 7592, 7593, 7596, 40372, 7608, 7609, 7612, 40387, 40390, 40391, 7626, 7627, 40402, 40420, 7657, 40436, 7673, 7684, 40456, 40477, 7718, 7719, 40490, 40491, 40494, 7734, 40506, 40507, 40511, 7744, 7748, 40520, 40524, 40525, 40540, 40541, 7778, 7779, 7782, 7783, 40554, 40555, 40558, 40559, 7794, 7798, 7799, 40570, 40571, 40574, 40580, 7816, 7817, 7820, 40592, 40596, 7832, 7837, 40611, 40614, 40615, 7851, 7854, 7855, 40630, 40631, 7866, 7870, 7871, 7880, 40660, 7897, 40674, 40678, 7914, 7915, 40691, 7930, 7931, 7940, 40712, 40733, 7975, 40746, 40747, 40751, 7990, 7991, 40762, 40763, 40766, 8000, 8004, 40776, 40780, 40781, 40796, 40797, 8035, 8038, 8039, 40810, 40811, 40814, 40815, 8050, 8051, 8054, 8055, 40826, 40830, 40836, 8072, 8073, 8076, 40848, 40852, 8088, 8093, 40866, 40867, 40870, 40871, 8107, 8110, 8111, 40882, 40886, 40887, 8122, 8126, 8127, 8136, 40916, 8153, 40931, 8170, 8171, 40946, 40950, 40951, 8186, 8187, 40960, 8234, 8238, 8239, 8251, 8254, 8255, 8265, 8269, 8299, 8303, 8314, 8318, 8340, 8354, 8359, 8371, 8374, 8404, 8418, 8419, 8423, 8434, 8435, 8438, 41232, 8473, 8476, 8477, 8494, 41270, 41271, 8510, 8511, 41296, 41300, 8536, 8537, 41334, 41335, 8575, 8580, 41352, 41353, 41356, 41357, 8592, 8596, 41368, 41369, 41372, 41373, 8614, 8615, 8630, 8631, 8640, 8644, 41416, 41417, 8656, 41432, 41433, 8678, 8679, 41454, 41455, 8695, 41470, 41471, 8714, 8718, 8719, 8734, 41504, 8744, 8748, 8749, 41524, 8761, 8764, 8765, 41542, 41543, 8778, 8779, 8782, 41558, 41559, 8798, 41572, 8808, 8809, 8812, 8824, 8825, 8828, 8829, 8834, 8838, 8839, 41611, 41615, 8851, 8854, 8855, 41626, 41630, 41631, 8864, 8868, 41640, 8884, 41657, 8898, 8899, 8902, 8903, 41674, 41678, 41679, 8914, 8915, 8919, 41691, 41694, 41695, 8928, 8932, 8944, 41725, 8971, 8974, 8975, 41750, 41751, 8990, 8991, 41764, 9001, 9004, 9005, 41776, 9016, 9020, 9021, 41798, 41799, 9034, 9035, 9039, 9064, 9065, 9069, 41844, 9080, 9081, 9084, 9091, 9094, 9095, 41866, 41870, 41871, 9106, 9110, 9111, 41883, 41887, 9124, 41896, 9136, 9140, 41912, 41913, 9154, 9155, 9159, 41931, 41935, 9170, 9171, 9174, 41946, 41950, 9184, 41960, 41965, 9200, 9204, 41977, 41980, 9225, 9229, 42022, 42023, 9258, 9259, 9262, 42038, 42039, 9274, 9275, 9279, 42048, 42082, 42083, 9322, 9323, 9326, 9327, 42098, 42099, 9338, 9339, 9342, 9343, 9344, 9348, 42120, 9360, 9364, 42136, 9378, 9379, 42155, 42158, 9394, 9395, 42170, 42175, 9412, 42189, 9428, 42205, 9443, 9446, 9447, 42219, 42222, 9458, 9462, 9463, 42234, 42239, 42256, 42260, 9496, 9497, 42278, 42279, 9518, 42320, 9561, 9564, 9565, 42342, 42343, 9582, 9583, 9599, 9600, 9604, 42376, 42377, 9616, 42392, 42393, 9638, 42414, 42415, 9654, 9655, 42430, 42431, 9668, 42440, 42441, 42444, 42445, 9680, 9684, 42456, 42457, 42460, 42461, 9702, 9703, 9718, 9719, 9739, 9743, 42532, 9768, 9769, 9772, 9784, 9785, 9789, 42562, 42563, 9802, 9803, 9806, 9807, 42582, 42583, 9822, 9823, 42592, 42612, 9849, 9859, 9863, 42634, 42635, 9875, 9878, 9879, 9892, 42665, 42668, 42680, 42685, 9923, 9926, 9927, 42702, 9938, 9942, 9943, 42718, 42719, 9952, 42728, 42729, 42744, 9994, 9998, 42774, 42775, 10015, 10024, 10025, 10028, 10029, 42804, 10040, 10041, 10044, 42818, 42819, 10058, 10059, 10062, 10063, 10079, 42852, 10089, 42864, 10104, 10114, 10118, 10119, 42890, 42891, 42894, 42895, 10130, 10134, 10135, 42910, 42911, 10144, 42925, 10160, 10164, 10178, 10182, 10183, 42958, 10195, 10198, 42974, 42975, 10212, 42985, 10224, 10228, 43000, 10260, 43032, 43033, 43036, 43037, 10274, 10278, 10279, 43051, 43055, 10291, 10294, 10295, 43066, 43070, 43071, 10304, 10308, 43080, 10320, 10324, 43096, 43097, 10339, 10343, 43114, 43115, 10354, 10358, 10359, 43130, 43131, 43134, 43135, 43136, 43140, 43156, 10392, 10396, 10397, 43170, 43174, 10410, 10411, 10414, 10415, 43187, 10426, 10427, 10430, 10431, 43204, 10445, 43216, 43220, 10456, 10457, 43238, 43239, 10474, 10475, 10479, 43254, 10490, 10491, 10494, 10495, 10500, 10512, 10516, 43288, 43289, 43292, 43293, 10531, 10534, 10535, 43306, 43310, 43311, 10546, 10550, 10551, 43323, 43327, 10560, 10564, 43336, 10576, 43352, 43353, 10595, 10598, 10599, 10610, 10614, 10615, 43390, 43391, 43396, 10632, 10636, 10637, 43408, 43412, 10648, 10649, 43427, 43430, 43431, 10667, 10670, 10671, 43442, 43446, 43447, 10682, 10686, 10687, 43456, 43460, 10696, 10697, 43476, 10713, 43494, 43495, 10730, 10731, 10734, 10735, 43510, 43511, 10746, 10747, 10750, 10751, 10754, 10759, 10774, 10775, 10784, 10788, 43560, 10804, 43576, 10818, 10819, 43595, 43598, 10838, 43614, 43615, 10852, 43625, 43628, 10864, 43645, 43650, 43654, 10890, 10891, 10894, 10895, 43667, 43670, 43671, 10907, 10910, 10911, 43680, 10920, 10937, 43718, 43719, 10954, 10955, 10958, 10959, 43734, 43735, 10970, 10971, 10974, 10975, 43748, 10984, 10985, 10988, 10989, 11000, 11001, 11005, 11011, 11014, 11030, 11031, 11044, 43817, 11056, 11060, 43832, 43833, 11074, 11075, 43850, 43855, 11094, 11095, 43870, 43871, 43880, 43885, 11120, 11124, 43907, 11146, 11147, 11150, 11151, 43922, 43926, 43927, 11162, 11166, 11167, 11177, 43952, 11192, 43974, 43975, 11210, 11211, 43990, 11226, 11227, 11230, 11240, 11241, 11245, 44020, 11256, 11257, 11260, 11261, 11280, 11284, 44056, 44057, 11298, 11299, 11302, 11303, 44074, 44078, 44079, 11314, 11315, 11319, 44091, 44095, 11332, 44109, 11348, 44120, 44121, 44124, 44125, 11363, 11366, 11367, 44142, 11378, 11382, 11383, 44158, 44164, 11405, 44176, 44180, 11416, 11417, 44198, 44199, 11434, 11435, 11438, 11439, 44214, 44215, 11450, 11451, 44224, 44228, 44244, 11480, 11484, 11485, 44259, 44262, 44263, 11499, 11502, 11503, 44274, 44278, 44279, 11514, 11518, 11519, 11524, 11536, 44312, 44313, 11554, 11555, 11559, 44331, 44334, 44335, 11570, 11571, 11574, 44346, 44350, 11588, 44365, 11600, 11604, 44376, 44377, 44380, 44381, 11618, 11622, 11623, 44398, 44399, 11635, 11638, 44414, 44415, 44416, 44420, 11656, 11657, 44436, 11673, 44454, 44455, 11690, 11691, 11694, 11695, 44470, 11706, 11707, 11710, 44484, 11720, 11724, 11725, 44496, 44500, 11737, 11740, 44514, 44518, 11754, 11758, 11759, 44531, 11771, 11774, 11775, 11778, 11779, 11783, 11798, 11799, 44574, 44575, 11808, 11812, 11824, 44600, 44605, 11843, 11846, 11847, 44619, 44622, 11862, 11863, 11872, 44648, 44649, 11892, 44665, 44678, 44679, 11914, 11915, 11919, 44694, 44695, 11930, 11931, 11934, 11935, 44708, 11944, 11945, 11948, 11949, 11960, 11961, 11965, 44739, 44742, 44743, 11979, 11982, 11983, 44754, 44758, 11994, 11998, 11999, 44768, 12025, 12034, 12035, 12038, 12055, 44830, 44831, 12064, 44845, 12080, 12084, 44857, 44860, 12098, 12102, 12103, 44874, 44879, 12118, 12119, 44904, 12144, 12148, 44920, 44934, 12170, 12171, 12174, 12175, 44950, 44951, 12186, 12187, 12190, 12191, 12200, 12201, 12205, 44980, 12216, 12217, 12220, 12221, 44994, 44998, 44999, 12234, 12238, 12239, 45011, 12251, 12254, 12255, 12265, 45040, 12280, 12331, 12335, 12346, 12350, 45124, 12361, 12364, 45158, 45159, 12394, 12398, 45174, 45175, 12411, 12415, 45192, 45196, 45197, 12436, 45209, 45212, 45213, 12451, 12454, 45227, 12466, 12471, 45242, 12484, 45256, 45257, 45260, 45272, 45273, 45277, 12515, 12518, 45294, 12530, 12535, 45311, 45332, 12568, 12572, 12573, 45350, 45351, 12590, 45366, 45367, 12606, 12607, 45392, 45396, 12632, 12633, 45430, 45431, 12671, 12672, 12676, 45449, 45452, 45453, 12692, 45464, 45468, 45469, 12710, 12711, 45486, 45487, 12726, 12727, 45502, 45503, 12736, 45512, 45513, 12752, 12756, 45528, 45529, 12774, 45550, 45551, 12790, 12791, 45566, 45567, 12811, 12815, 45590, 45591, 12830, 12841, 45616, 45620, 12856, 45638, 45639, 12874, 12875, 45654, 45655, 12894, 45684, 12924, 12925, 12931, 12934, 12935, 45706, 45710, 45711, 12946, 12950, 12951, 45723, 45726, 45727, 12964, 45737, 12976, 12980, 45752, 12994, 45770, 45775, 13011, 13014, 13015, 45787, 45790, 13024, 45805, 13040, 13044, 45820, 13066, 13070, 45846, 45847, 13086, 13087, 45856, 45860, 13096, 45894, 45895, 13130, 13131, 45924, 13164, 13186, 13190, 45963, 45966, 45967, 13203, 13206, 45978, 45982, 45983, 45992, 46009, 13251, 46027, 46030, 13266, 46042, 46047, 13284, 46056, 46060, 46073, 46077, 46084, 13321, 13324, 46118, 46119, 13354, 13355, 46134, 46135, 13370, 13371, 13388, 13389, 46178, 46179, 13418, 13419, 13422, 13423, 46194, 46195, 13434, 13435, 13438, 13439, 13444, 46220, 13460, 46237, 13474, 13475, 13479, 46251, 46255, 13490, 13491, 13494, 46266, 46270, 13508, 46280, 13524, 46297, 13538, 13542, 13543, 46314, 46318, 13555, 13558, 13559, 46331, 46335, 46352, 46356, 13592, 13593, 46374, 46375, 13614, 46420, 13656, 13660, 13661, 46438, 46439, 13678, 13679, 46454, 46455, 13695, 13696, 46472, 46473, 13712, 13716, 46488, 46489, 13734, 13735, 46510, 46511, 13751, 46526, 46527, 13760, 13764, 46537, 46540, 46541, 13780, 46552, 46556, 46557, 13798, 13799, 46574, 46575, 13814, 13815, 46590, 46591, 46598, 46599, 13834, 13838, 46644, 13884, 46658, 46659, 13898, 13899, 13902, 13903, 46678, 46679, 13918, 13919, 13929, 46708, 13944, 13945, 13955, 13958, 13959, 46731, 46734, 46735, 13970, 13971, 13975, 46746, 46750, 46751, 46761, 46765, 14004, 46776, 46780, 14018, 14022, 14023, 46794, 46795, 46798, 46799, 14035, 14038, 14039, 46810, 46811, 46814, 46815, 14052, 46825, 14068, 46840, 46854, 46855, 14091, 14095, 46870, 46871, 14111, 46884, 14124, 14125, 46914, 46915, 14154, 14155, 14158, 14159, 46934, 46935, 14175, 46948, 14184, 14185, 14201, 14210, 14214, 14215, 46986, 46990, 46991, 14226, 14227, 14230, 14231, 47003, 47006, 47007, 14240, 14244, 47020, 14256, 47037, 14275, 14278, 14279, 47050, 47051, 47054, 47055, 14290, 14294, 14295, 47066, 47067, 47070, 47071, 14304, 14308, 47080, 14324, 47097, 47112, 47116, 47117, 14352, 14356, 47129, 47132, 47133, 14371, 14374, 14375, 47146, 47150, 47151, 14386, 14390, 47163, 47166, 47167, 14404, 47180, 14416, 47192, 47193, 14435, 14438, 14439, 47211, 47214, 47215, 14450, 14454, 14455, 47226, 47230, 47231, 14472, 14473, 47252, 14489, 14492, 14493, 47267, 14507, 14510, 14511, 47282, 47286, 47287, 14522, 14526, 47296, 47300, 14536, 47312, 14552, 14553, 47334, 14570, 14571, 14574, 14575, 47350, 47351, 14586, 14587, 14591, 14596, 47369, 47372, 47373, 14612, 47384, 47388, 47389, 14626, 14630, 14631, 47403, 47406, 47407, 14643, 14646, 47418, 47422, 47423, 14660, 47437, 14672, 14676, 47448, 47449, 14690, 14691, 14695, 47466, 47470, 47471, 14706, 14707, 14710, 14711, 47483, 47486, 47487, 47492, 14729, 14732, 14733, 47522, 47526, 47527, 14762, 14763, 14766, 14767, 47539, 14778, 14779, 14782, 14783, 47552, 14792, 14793, 47568, 47572, 14812, 47590, 47591, 14827, 14830, 14831, 47606, 14842, 14846, 14851, 14854, 47627, 14870, 14871, 47646, 47647, 14884, 47657, 47672, 14914, 14915, 14919, 47691, 47695, 14934, 14935, 47710, 47711, 47721, 47725, 14960, 14964, 47740, 47747, 14987, 14990, 14991, 47762, 47766, 47767, 15002, 15003, 15006, 15007, 15016, 47792, 15032, 47814, 47815, 15051, 15054, 15055, 47830, 15066, 15070, 15080, 15081, 15084, 15085, 47860, 15096, 15100, 15106, 15111, 47882, 15126, 15127, 47902, 47903, 15136, 15140, 47912, 47929, 15170, 15171, 15174, 47946, 47950, 15191, 47966, 47967, 15204, 47976, 47980, 15216, 47997, 48002, 48006, 48007, 15242, 15246, 48019, 15258, 15259, 15262, 15263, 48032, 15272, 15288, 15289, 48070, 15306, 15310, 15311, 48086, 48087, 15323, 15326, 15327, 48100, 15337, 15340, 15352, 15353, 15356, 15357, 15364, 48136, 48137, 48140, 15376, 48152, 48153, 15394, 48170, 48175, 15411, 48187, 48190, 15428, 48200, 15440, 15444, 48217, 48220, 48221, 15458, 15462, 15463, 48234, 48235, 48238, 48239, 15475, 15478, 15479, 48250, 48251, 48254, 48255, 48256, 48260, 15496, 48272, 15512, 15513, 48294, 48295, 15531, 15534, 15535, 48310, 15546, 15550, 15551, 15560, 48340, 15577, 15580, 15581, 48354, 48358, 48359, 15594, 15598, 15599, 48371, 15611, 15614, 15615, 48392, 48393, 48397, 15632, 15636, 48408, 48409, 15651, 15654, 15655, 48427, 48430, 15666, 48442, 48447, 15684, 48457, 15700, 48472, 48476, 48477, 15715, 15718, 15719, 48490, 48491, 48494, 48495, 15730, 15734, 15735, 48506, 48507, 48510, 48511, 48512, 15752, 15753, 48528, 48532, 15772, 48550, 15786, 15790, 48566, 48567, 15803, 15806, 15807, 48580, 15817, 15820, 15821, 15836, 48611, 15851, 15854, 15855, 48626, 48630, 48631, 15866, 15870, 15871, 15875, 15878, 48654, 15894, 48670, 48671, 15904, 48685, 15924, 48696, 48700, 15938, 15942, 15943, 48714, 48718, 15958, 15959, 48734, 48735, 15972, 48745, 15984, 15988, 48760, 48774, 16010, 16011, 16014, 16015, 48790, 48791, 16027, 16030, 16031, 16040, 16041, 16044, 16045, 48820, 16057, 16060, 48834, 48838, 48839, 16074, 16078, 16079, 48851, 16091, 16094, 16095, 16105, 16108, 48880, 16120, 16124, 16130, 16135, 48911, 16150, 16151, 48926, 48927, 16160, 16164, 48940, 48953, 48957, 16195, 16198, 16199, 48971, 48975, 16214, 16215, 48990, 48991, 16228, 49000, 16244, 49017, 49030, 49031, 16266, 16267, 16271, 49046, 16282, 16286, 49060, 16296, 16300, 16312, 16313, 16316, 16317, 49091, 16331, 16334, 16335, 49106, 49110, 49111, 16346, 16350, 16351, 49120, 16360, 16364, 16377, 16380, 49222, 49223, 49252, 49268, 49310, 49311, 49385, 49401, 49426, 49427, 49431, 16667, 16671, 49440, 49444, 16680, 16681, 16684, 16685, 49456, 49460, 16696, 16697, 16700, 16701, 49494, 49495, 16730, 16731, 16734, 16735, 49504, 49508, 16744, 16745, 16748, 16749, 49524, 16760, 16761, 16764, 16765, 16770, 16771, 16774, 16775, 49546, 49547, 49550, 16786, 16787, 16790, 16791, 49562, 49563, 49567, 16800, 16804, 49576, 49577, 49580, 49581, 16816, 16820, 49592, 49593, 49597, 16834, 16838, 16839, 49614, 49615, 16851, 16854, 16855, 49630, 49631, 16864, 16868, 49640, 49644, 49645, 16880, 16884, 49656, 49661, 49680, 49684, 16920, 16921, 16924, 16925, 49698, 49699, 16939, 16943, 49718, 49719, 16954, 16955, 16959, 49732, 49748, 16984, 16985, 16988, 16989, 49766, 49767, 49782, 49783, 17018, 17019, 17022, 17023, 17024, 17028, 49801, 49805, 17040, 17044, 49817, 49820, 49821, 17058, 17059, 49834, 49835, 49838, 49839, 17074, 17075, 49850, 49851, 49855, 17092, 49865, 49868, 49869, 17108, 49880, 49881, 49884, 49885, 17123, 17126, 17127, 49899, 49902, 49903, 17138, 17142, 17143, 49914, 49915, 49918, 49919, 49936, 49940, 17176, 17177, 17180, 17181, 49958, 49959, 17194, 17195, 17199, 17210, 17215, 49988, 50000, 50004, 17240, 17241, 17244, 17245, 50022, 50023, 17258, 17259, 17262, 17263, 50038, 50039, 17280, 17284, 50056, 50060, 50061, 17296, 17300, 50072, 50073, 50076, 50077, 17314, 17315, 17319, 50091, 50094, 50095, 17330, 17331, 17334, 50106, 50110, 50111, 17344, 17348, 50124, 50125, 17360, 17364, 50136, 50137, 50141, 17378, 17382, 17383, 50154, 50155, 50158, 50159, 17395, 17398, 17399, 50171, 50175, 50182, 50183, 50212, 50228, 50242, 50243, 50272, 50288, 50314, 50315, 50318, 50319, 50330, 50331, 50334, 50335, 50348, 50349, 50364, 50365, 50378, 50379, 50382, 50383, 50394, 50395, 50398, 50399, 50408, 50409, 50412, 50413, 50424, 50425, 50428, 50429, 50454, 50455, 17690, 17691, 17694, 17695, 50468, 17704, 17705, 17708, 17709, 50480, 50484, 17720, 17721, 17724, 17725, 50514, 50515, 50518, 17754, 17758, 50528, 50532, 17768, 17769, 17772, 17773, 50544, 50548, 17784, 17785, 17788, 17789, 17795, 17798, 17799, 50574, 50575, 17810, 17814, 17815, 50590, 50591, 17824, 17828, 50600, 50605, 17840, 17844, 50616, 50620, 50621, 17858, 17859, 17862, 17863, 50634, 50635, 50639, 17874, 17875, 17878, 17879, 50650, 50651, 50654, 17888, 17892, 50664, 50665, 50669, 17904, 17908, 50680, 50681, 50684, 50685, 50692, 50704, 50708, 17944, 17945, 17948, 17949, 50726, 50727, 50742, 50743, 17978, 17979, 17982, 17983, 50752, 50768, 50772, 18008, 18009, 18012, 18013, 50786, 50787, 18027, 18030, 50802, 50803, 50806, 50807, 18042, 18043, 18046, 18048, 18052, 50824, 50828, 50829, 18064, 18068, 50840, 50841, 50845, 18082, 18086, 18087, 50858, 50859, 50862, 50863, 18099, 18102, 18103, 50874, 50875, 50878, 50879, 18112, 18116, 50888, 50889, 50892, 18128, 18132, 50904, 50905, 50908, 50909, 18146, 18147, 18151, 50922, 50923, 50926, 50927, 18162, 18163, 18166, 50938, 50939, 50942, 50943, 50948, 50964, 18200, 18201, 18204, 18205, 50982, 50983, 18218, 18219, 18222, 18223, 50998, 50999, 51008, 51024, 51028, 18264, 18265, 18268, 18269, 51042, 51043, 51046, 51047, 18282, 18283, 18286, 51058, 51059, 18298, 18302, 18308, 51080, 51081, 51084, 51085, 18324, 51096, 51097, 51100, 51101, 18339, 18342, 18343, 51114, 51115, 51118, 51119, 18354, 18358, 18359, 51130, 51131, 51134, 51135, 18368, 18372, 51144, 51145, 18384, 18388, 51161, 18402, 18403, 51178, 51179, 51182, 18418, 18419, 51194, 51195, 51199, 18450, 18451, 18454, 18455, 51226, 51227, 51230, 18464, 18468, 51241, 51245, 18480, 18484, 51256, 51260, 51261, 51274, 51275, 51278, 51279, 18515, 18518, 18519, 51294, 51295, 18528, 18532, 51304, 51308, 51309, 18548, 51320, 51321, 51324, 51325, 51330, 51334, 51335, 18570, 18571, 18574, 18575, 51347, 51350, 51351, 18586, 18587, 51360, 51364, 18600, 18601, 18605, 51380, 18616, 18617, 18620, 18621, 51394, 51395, 18634, 18635, 18638, 18639, 51410, 51411, 51414, 51415, 18650, 18651, 18654, 18655, 51428, 18664, 18665, 18668, 18669, 51444, 18684, 18685, 51470, 51471, 18706, 18707, 18710, 18711, 51482, 51483, 51487, 18720, 18724, 51497, 51500, 51501, 18736, 18740, 51512, 51513, 51516, 51517, 51530, 51531, 51534, 51535, 18770, 18774, 18775, 51550, 51551, 18784, 18788, 51560, 51561, 51565, 18804, 51576, 51577, 51580, 51581, 51587, 51590, 51591, 18826, 18827, 51602, 51606, 51607, 18842, 18843, 18846, 18847, 51620, 18856, 18857, 18860, 18861, 51636, 18872, 18873, 18876, 51650, 51651, 51654, 51655, 18890, 18891, 18894, 18895, 51666, 51667, 18906, 18907, 18910, 18911, 51680, 51684, 18924, 18925, 51696, 51700, 18936, 18937, 18940, 18941, 18960, 18964, 51736, 51737, 51740, 51741, 18978, 18979, 51754, 51755, 51758, 51759, 18994, 18995, 18999, 51771, 51774, 51775, 51788, 51789, 19024, 19028, 51800, 51805, 19042, 19046, 19047, 51818, 51819, 51822, 51823, 19059, 19062, 19063, 51834, 51835, 51838, 51839, 51840, 51844, 19080, 19081, 19085, 51860, 19096, 19097, 19100, 19101, 51878, 51879, 19115, 19118, 51894, 51895, 19131, 19135, 19148, 19149, 51920, 51924, 19160, 19161, 19164, 19165, 51938, 51939, 51943, 19178, 19179, 19182, 19183, 51954, 51955, 51958, 51959, 19194, 19195, 19216, 19220, 51992, 51993, 51997, 19234, 19235, 52010, 52011, 52015, 19250, 19251, 19254, 52026, 52030, 52031, 52044, 52045, 19280, 19284, 52056, 52060, 52061, 19299, 19302, 19303, 52074, 52075, 52078, 52079, 19314, 19318, 19319, 52090, 52091, 52094, 52095, 52100, 19336, 19337, 19340, 19341, 52116, 19352, 19353, 19356, 52134, 52135, 19371, 19375, 52150, 19387, 19390, 52164, 19400, 19401, 19404, 19405, 52176, 19420, 19421, 52194, 52195, 52198, 52199, 19434, 19435, 52210, 52211, 52214, 19450, 19451, 19454, 19455, 19474, 19478, 19479, 52254, 52255, 19492, 52265, 52268, 52269, 19504, 19508, 52284, 52285, 52298, 52299, 52302, 52303, 19538, 19539, 19542, 19543, 52314, 52315, 52319, 19552, 19556, 52328, 52329, 52332, 19568, 19572, 52344, 52345, 52354, 52355, 19594, 19595, 19598, 19599, 52370, 52371, 52374, 52375, 19610, 19611, 19614, 19615, 19628, 19629, 52404, 19640, 19641, 19644, 19645, 52419, 52422, 52423, 19658, 19659, 19662, 19663, 52434, 52438, 52439, 19674, 19675, 52452, 19688, 19689, 19692, 19693, 52464, 52468, 19704, 19705, 19709, 19731, 19734, 19735, 52510, 52511, 19748, 52520, 52521, 52524, 52525, 19760, 19764, 52536, 52537, 52541, 52554, 52555, 52558, 52559, 19794, 19795, 19798, 19799, 52570, 52571, 52574, 19808, 19812, 52584, 52585, 52588, 52589, 19824, 19828, 52601, 52610, 52611, 52614, 52615, 19850, 19851, 19854, 19855, 52626, 52627, 19866, 19867, 19870, 19871, 52640, 52644, 19880, 19881, 19884, 19885, 52656, 19900, 19901, 52674, 52678, 52679, 19914, 19915, 52691, 52694, 52695, 19930, 19931, 19934, 19935, 52708, 19944, 19945, 19948, 52724, 19960, 19961, 19964, 19965, 52745, 19984, 19988, 52760, 52764, 52765, 20003, 20006, 20007, 52779, 52782, 52783, 20018, 20022, 20023, 52794, 52795, 52798, 52799, 52808, 52809, 52812, 52813, 20048, 20052, 52824, 52825, 52829, 20066, 20067, 20071, 52842, 52843, 52846, 52847, 20082, 20083, 52858, 52859, 52862, 52868, 20104, 20105, 20108, 20109, 52880, 52884, 20124, 20125, 52898, 52899, 52903, 20138, 20139, 20142, 20143, 52914, 52915, 52918, 52919, 20154, 20155, 52932, 20168, 20169, 20172, 20173, 52948, 20184, 20185, 20188, 52966, 52967, 20202, 20207, 52982, 20218, 20222, 53001, 20240, 20244, 53016, 53021, 20258, 20262, 20263, 53034, 53035, 53038, 53039, 20275, 20278, 20279, 53051, 53055, 53064, 53065, 53068, 53069, 20304, 20308, 53080, 53081, 53084, 53085, 20322, 20323, 20326, 53098, 53099, 53102, 53103, 20338, 20339, 53114, 53115, 53119, 53124, 20364, 20365, 53136, 53140, 20376, 20377, 20380, 20381, 53154, 53155, 53158, 53159, 20394, 20395, 53170, 53171, 53174, 20410, 20411, 20414, 20415, 53184, 53188, 20424, 20425, 20429, 53204, 20440, 20441, 20444, 20445, 53222, 20458, 20462, 53238, 53239, 20474, 20479, 53318, 53319, 20554, 20555, 20558, 20559, 53348, 20584, 20588, 20589, 53364, 20600, 20604, 20605, 20614, 20615, 20644, 53420, 20660, 53436, 20678, 20679, 53450, 53451, 20694, 20695, 20708, 20724, 53522, 53523, 53526, 53536, 53540, 53552, 53556, 53590, 53591, 53600, 53604, 53620, 53642, 53643, 53647, 53658, 53659, 53662, 53672, 53673, 53676, 53688, 53689, 53692, 53693, 53710, 53711, 53726, 53727, 53737, 53740, 53753, 53756, 53757, 53776, 53780, 53794, 53795, 53814, 53815, 53828, 21064, 21065, 21068, 21069, 53844, 53862, 53863, 21098, 21102, 21103, 53878, 53879, 21114, 21115, 21118, 21119, 21124, 53896, 53900, 53901, 21140, 53912, 21158, 53930, 53931, 53934, 53935, 21174, 21175, 53946, 53947, 21188, 53960, 53961, 53964, 53965, 21204, 53976, 53980, 53981, 21222, 21223, 53994, 53995, 53998, 53999, 21238, 21239, 54010, 54011, 54014, 54015, 54032, 54036, 54054, 54055, 54084, 21320, 21321, 21324, 21325, 54096, 54100, 54118, 54119, 21354, 21355, 21358, 21359, 54134, 54135, 21371, 21374, 21375, 21380, 54152, 54153, 54156, 54157, 21396, 54169, 54173, 21414, 21415, 54186, 54190, 21431, 54203, 54206, 54207, 21444, 54216, 54217, 54220, 21460, 54232, 54236, 54237, 21478, 21479, 54250, 54251, 54255, 21494, 21495, 54266, 54270, 54271, 54278, 54279, 21514, 21515, 21518, 21519, 54308, 21544, 21545, 21548, 21549, 54324, 21560, 21561, 21564, 21565, 54338, 54339, 21578, 21579, 21582, 21583, 54368, 21608, 21609, 21612, 21613, 54384, 21624, 21625, 21628, 21629, 21634, 21635, 21638, 21639, 54410, 54411, 54414, 54415, 21650, 21651, 21654, 21655, 54426, 54427, 54430, 54431, 21664, 21668, 54440, 54441, 54444, 54445, 21680, 21684, 54456, 54457, 54460, 54461, 21698, 21699, 21702, 21703, 54474, 54475, 54478, 54479, 21714, 21715, 21718, 21719, 54490, 54491, 54494, 54495, 21728, 21732, 54504, 54505, 21744, 21748, 54520, 54521, 54550, 54551, 54564, 54576, 54580, 54610, 54611, 54615, 54624, 54628, 54640, 54644, 54670, 54671, 54686, 54687, 54697, 54700, 54701, 54713, 54716, 54730, 54731, 54734, 54746, 54747, 54751, 54760, 54761, 54764, 54765, 54776, 54777, 54780, 54788, 22024, 22028, 22029, 54800, 54804, 54822, 54823, 22058, 22062, 22063, 54838, 54839, 22074, 22075, 22078, 22079, 54848, 22088, 22089, 22092, 22093, 54864, 54868, 54882, 54883, 22122, 22123, 22127, 54898, 54899, 54902, 54903, 22138, 22139, 22142, 22143, 22144, 22148, 54920, 54924, 22164, 54940, 54941, 22178, 22182, 22183, 54955, 54958, 54959, 22194, 22195, 22198, 22199, 54970, 54974, 54975, 22208, 22212, 54984, 54985, 54988, 54989, 22224, 22228, 55000, 55001, 55005, 22242, 22243, 22246, 22247, 55018, 55019, 55022, 55023, 22258, 22259, 22262, 55034, 55035, 55038, 55039, 55044, 22280, 22284, 22285, 55060, 55078, 55079, 22314, 22315, 22318, 22319, 55094, 55095, 22331, 22334, 22335, 55104, 22344, 22345, 22348, 22349, 55120, 55124, 55138, 55139, 55142, 55143, 22378, 22379, 22382, 22383, 55154, 55155, 22394, 22395, 22398, 22400, 22404, 55176, 55180, 55181, 22420, 55192, 55196, 55197, 22434, 22435, 22438, 22439, 55210, 55211, 55214, 55215, 22451, 22454, 22455, 55226, 55227, 55230, 55231, 22464, 22468, 55240, 55244, 55245, 22480, 22484, 55256, 55257, 55261, 22498, 22499, 22503, 55274, 55275, 55278, 55279, 22514, 22515, 22518, 22519, 55290, 55291, 55294, 55295, 22534, 22535, 55322, 55323, 55327, 22564, 55336, 55340, 55341, 22580, 55352, 55353, 55356, 55357, 22594, 22595, 22598, 22599, 55370, 55371, 55374, 55375, 55390, 55391, 22624, 22628, 55400, 55404, 22640, 22644, 55416, 55420, 55421, 55427, 55430, 55431, 55442, 55446, 55447, 22686, 22687, 55460, 22700, 55476, 22716, 55490, 55491, 22730, 22731, 22734, 22735, 55506, 55507, 55510, 55511, 22750, 22751, 55520, 55524, 22761, 22764, 22765, 55536, 22777, 22780, 22781, 55578, 55579, 55582, 22820, 55592, 22836, 55609, 55613, 22850, 22851, 22854, 22855, 55626, 55627, 55630, 55631, 55646, 55647, 22884, 55660, 55661, 22900, 55672, 55676, 55677, 55682, 55686, 55687, 22926, 22927, 55699, 55702, 55703, 22942, 22943, 55716, 22957, 55728, 55732, 22973, 55746, 55747, 55750, 55751, 22990, 22991, 55762, 55763, 23002, 23003, 23006, 23007, 23016, 23017, 23020, 23021, 55796, 23032, 23033, 23036, 23037, 23044, 55820, 55832, 55833, 55836, 23078, 55850, 55851, 55854, 55855, 23094, 23095, 55866, 55870, 23104, 23108, 55880, 55881, 55884, 55885, 55897, 55900, 55901, 23138, 23142, 23143, 55915, 55918, 55919, 23154, 23155, 23158, 23159, 55930, 55931, 55934, 55935, 55940, 23180, 55956, 23197, 55974, 55975, 23214, 23215, 55990, 23230, 23231, 56000, 56004, 23240, 23245, 56020, 23257, 23260, 23261, 56034, 56035, 56039, 23274, 23275, 23278, 56050, 56051, 56054, 56055, 23290, 23291, 23295, 23300, 56076, 56088, 56089, 56092, 56093, 23334, 23335, 56106, 56107, 23351, 56123, 56126, 56127, 23360, 23364, 56136, 56137, 56140, 56141, 56153, 56156, 23394, 23395, 23398, 23399, 56170, 56174, 56175, 23411, 23414, 23415, 56186, 56187, 56190, 56191, 56196, 23436, 56208, 56212, 23453, 56230, 23470, 23471, 56246, 56247, 23486, 23487, 56256, 56260, 23496, 23501, 56276, 23513, 23516, 23517, 56290, 56291, 56294, 56295, 23530, 23531, 23534, 56306, 56307, 56310, 23546, 23547, 23551, 23558, 23559, 56330, 56331, 56350, 56351, 23588, 56360, 56361, 56364, 56365, 23604, 56376, 56377, 56380, 23618, 23619, 23622, 23623, 56394, 56395, 56398, 56399, 56410, 56411, 56414, 23648, 23652, 56424, 56425, 56428, 56429, 23664, 23668, 56440, 56444, 56445, 56450, 56451, 23690, 23691, 23694, 23695, 56466, 56467, 56470, 56471, 23710, 23711, 56480, 56484, 23720, 23725, 56496, 56500, 23736, 23741, 56514, 56518, 56519, 56531, 56534, 56535, 23770, 23771, 56548, 23784, 23785, 56564, 23800, 23801, 23814, 23815, 56606, 56607, 23844, 56616, 56620, 56621, 23860, 56632, 56636, 56637, 23874, 23875, 23878, 23879, 56650, 56651, 56654, 56655, 56666, 56667, 56671, 23904, 23908, 56680, 56681, 56685, 23920, 23924, 56696, 56697, 56701, 56706, 56707, 56710, 56711, 23950, 23951, 56722, 56723, 23962, 23963, 23966, 23967, 56740, 23977, 23980, 23981, 56756, 23993, 23996, 23997, 56771, 56774, 56775, 24010, 24011, 56786, 56790, 56791, 24026, 24027, 56800, 56804, 24040, 24041, 56820, 24056, 24057, 24068, 56857, 56860, 24102, 24103, 56874, 56875, 56878, 56879, 24118, 24119, 56890, 56891, 56895, 24128, 24132, 56904, 56905, 56920, 56921, 56924, 56925, 24162, 24163, 24166, 24167, 56938, 56939, 56942, 56943, 24178, 24179, 24183, 56954, 56955, 56958, 56959, 56960, 56964, 24201, 24204, 24205, 24216, 24217, 24220, 24221, 56994, 56995, 56999, 24234, 24235, 24238, 57010, 57011, 57014, 57015, 24250, 24251, 24254, 57028, 24264, 24265, 57040, 57044, 24280, 24281, 57062, 57063, 57078, 57079, 24314, 24315, 24324, 57113, 57116, 57117, 24358, 24359, 57130, 57131, 57134, 57135, 24374, 24375, 57146, 57150, 57151, 24384, 24388, 57160, 57161, 57176, 57177, 57180, 24418, 24419, 24422, 57194, 57195, 57198, 57199, 24434, 24435, 24438, 24439, 57210, 57211, 57214, 57215, 57216, 24457, 24460, 24461, 57236, 24472, 24473, 24476, 24477, 57250, 57251, 57254, 57255, 24490, 24491, 24495, 57266, 57267, 57270, 24506, 24507, 24511, 57284, 24520, 24521, 57300, 24536, 24537, 57318, 57319, 24554, 24555, 57334, 57344, 57378, 57379, 24619, 24623, 57394, 57395, 24634, 24638, 24649, 24652, 24682, 24686, 24699, 24703, 57480, 57481, 24724, 57496, 57497, 24739, 24742, 57518, 57519, 24754, 24759, 57534, 57535, 24772, 57548, 57549, 57564, 57565, 24803, 24806, 57578, 57579, 24818, 24823, 57594, 57595, 57616, 24857, 24861, 57634, 57635, 24875, 24879, 57650, 57651, 24890, 24891, 24895, 57680, 57684, 24920, 24921, 24924, 24925, 57718, 57719, 24954, 24955, 24958, 24959, 24960, 24964, 57736, 57737, 57740, 24976, 24980, 57752, 57753, 57757, 24994, 24995, 24999, 57771, 57774, 57775, 25010, 25011, 25014, 25015, 57787, 57790, 57791, 25028, 57800, 57804, 57805, 25044, 57817, 57820, 57821, 25058, 25059, 25062, 25063, 57834, 57835, 57839, 25075, 25078, 25079, 57850, 57851, 57855, 57858, 57859, 25099, 25103, 57874, 57875, 25115, 25119, 57888, 57904, 25144, 25145, 25149, 57926, 57927, 25166, 25167, 57942, 57943, 25178, 25179, 25182, 25183, 57956, 57972, 25209, 25218, 25219, 25222, 25223, 57994, 57995, 57999, 25235, 25239, 58010, 58011, 58015, 25252, 58024, 58025, 58028, 58029, 58040, 58041, 58044, 58045, 25282, 25283, 25286, 25287, 58059, 58062, 58063, 25298, 25299, 25302, 25303, 58075, 58078, 58079, 25312, 58088, 58089, 58092, 58093, 58104, 58105, 58108, 58109, 58114, 58115, 25354, 25358, 58130, 58131, 25370, 25371, 25375, 58144, 25384, 25385, 25389, 58160, 58182, 58183, 25422, 25423, 58212, 25449, 58228, 25474, 25475, 25478, 58250, 58251, 25490, 25491, 58266, 58267, 58280, 58281, 58284, 58285, 25524, 58296, 58297, 58300, 58301, 25538, 25542, 25543, 58318, 58319, 25555, 25558, 25559, 58334, 58335, 25572, 58344, 58345, 58348, 58349, 25588, 58360, 58361, 58364, 58365, 25609, 25612, 58406, 58407, 25646, 25647, 58422, 58423, 25662, 25663, 25672, 25673, 58466, 58467, 25706, 25707, 25710, 25711, 58482, 58483, 25722, 25723, 25726, 25727, 25732, 58504, 58505, 25748, 58520, 58521, 25762, 25766, 25767, 58538, 58539, 58542, 58543, 25779, 25782, 25783, 58554, 58555, 58558, 58559, 25796, 58572, 58573, 25812, 58588, 58589, 25826, 25827, 25831, 58602, 58603, 58606, 58607, 25842, 25843, 25846, 58618, 58619, 58622, 58623, 58640, 58644, 25880, 25881, 25884, 25885, 58662, 58663, 25898, 25899, 25902, 25903, 58704, 25945, 25949, 58722, 58723, 25962, 25963, 25966, 58738, 58739, 25978, 25982, 25988, 58760, 58764, 58765, 26004, 58777, 58780, 58781, 26018, 26022, 26023, 58794, 58795, 58798, 26034, 26035, 26038, 26039, 58810, 58811, 58814, 26048, 26052, 58824, 58825, 58828, 26064, 26068, 58840, 58841, 58845, 26082, 26083, 26086, 26087, 58858, 58862, 58863, 26098, 26099, 26102, 58874, 58878, 58879, 26122, 26126, 58916, 58932, 26169, 58946, 58947, 26186, 26187, 26190, 26191, 58962, 58963, 26202, 26203, 26206, 58976, 26220, 26232, 26233, 26236, 26237, 26242, 26243, 26247, 59018, 59019, 59022, 59023, 26258, 26259, 26262, 26263, 59034, 59035, 59038, 59039, 26276, 59048, 26292, 59065, 26306, 26307, 26310, 26311, 59082, 59083, 59086, 59087, 26322, 26323, 26326, 26327, 59098, 59099, 59102, 59103, 26340, 59116, 59133, 26379, 26383, 59158, 59159, 26394, 26395, 26398, 26399, 59172, 26409, 59188, 59202, 59203, 26442, 26443, 26446, 26447, 59218, 59219, 26458, 26462, 26472, 26473, 26476, 26477, 26492, 26499, 26502, 59274, 59275, 59278, 59279, 26514, 26518, 26519, 59290, 59291, 59294, 59295, 26532, 59305, 59308, 59309, 26544, 26548, 59320, 59324, 59325, 26562, 26563, 26566, 26567, 59338, 59339, 59342, 59343, 26578, 26579, 26582, 26583, 59354, 59355, 59358, 59359, 59368, 59369, 59373, 26612, 59384, 59385, 59388, 59400, 59401, 26640, 26644, 59416, 59417, 59420, 26658, 26659, 26662, 26663, 59434, 59435, 59439, 26674, 26675, 26678, 59450, 59451, 26692, 59464, 59465, 26708, 59480, 59484, 59485, 26722, 26723, 26727, 59498, 59499, 59502, 59503, 26739, 26742, 59514, 59515, 59518, 59519, 59524, 26760, 26761, 59536, 59540, 26776, 26777, 59555, 59558, 59559, 26794, 26795, 26798, 59570, 59574, 59575, 26810, 26811, 26815, 26824, 26825, 59604, 26840, 26844, 26845, 59618, 59619, 59623, 26858, 26859, 26862, 26863, 59634, 59635, 59638, 26874, 26875, 26878, 26879, 26884, 59656, 59657, 26896, 26900, 59672, 59673, 59677, 26915, 26919, 59690, 59691, 59695, 26930, 26931, 59706, 59707, 26948, 59720, 59721, 26964, 59737, 59740, 59741, 26978, 26979, 26982, 26983, 59754, 59755, 59758, 59759, 26994, 26998, 26999, 59770, 59771, 59774, 59775, 59776, 59780, 27016, 27017, 59796, 27037, 59811, 59814, 59815, 27050, 27051, 27055, 59826, 59830, 59831, 27066, 27070, 59844, 27080, 27084, 27085, 59874, 59875, 59879, 27114, 27115, 27118, 27119, 59890, 59891, 59894, 27130, 27131, 27134, 27135, 27139, 27142, 59918, 59919, 27154, 27155, 27159, 59931, 59934, 59935, 27172, 59944, 59945, 59948, 59949, 59960, 59961, 59964, 59965, 27202, 27206, 27207, 59978, 59979, 59982, 59983, 27218, 27222, 27223, 59994, 59995, 59998, 27236, 60008, 27252, 60025, 60028, 60029, 60035, 60038, 60039, 27274, 27275, 27278, 60051, 60054, 60055, 27290, 27291, 27295, 60068, 27305, 27308, 27321, 27325, 60098, 60099, 60103, 27338, 27339, 27342, 27343, 60114, 60115, 60119, 27355, 27358, 27359, 60128, 27368, 27385, 27394, 27399, 60174, 60175, 27410, 27411, 27414, 27415, 60187, 60190, 60191, 60200, 60201, 60204, 60205, 27444, 60216, 60217, 60220, 60221, 27459, 27462, 27463, 60234, 60235, 60238, 60239, 27474, 27475, 27478, 27479, 60250, 60251, 60254, 27492, 60265, 27504, 27508, 60280, 60284, 60285, 60290, 60294, 60295, 27530, 27531, 27535, 60306, 60310, 60311, 27546, 27550, 27561, 27565, 60340, 27577, 27580, 60354, 60355, 60358, 27595, 27598, 27599, 60370, 60371, 60374, 27610, 27611, 27614, 27615, 27625, 60400, 27640, 27652, 60428, 60429, 27668, 60440, 60444, 60445, 27682, 27683, 27686, 27687, 60459, 60462, 60463, 27698, 27702, 27703, 60478, 60479, 27716, 60492, 60493, 27728, 27732, 60504, 60505, 60508, 27746, 27747, 27750, 27751, 60522, 60523, 60526, 60527, 27762, 27763, 27766, 27767, 60538, 60539, 60542, 60543, 27784, 27785, 60564, 27800, 27804, 27805, 60578, 60579, 60583, 27818, 27819, 27822, 27823, 60594, 60595, 60598, 27835, 27838, 27839, 60612, 27848, 60624, 60628, 27864, 27865, 27868, 60643, 60646, 60647, 27882, 27883, 27886, 27887, 60658, 60662, 60663, 27898, 27899, 27902, 27903, 60684, 60685, 27924, 60697, 60700, 60701, 27938, 27939, 27942, 27943, 60715, 60718, 60719, 27955, 27958, 27959, 60734, 60735, 27972, 60748, 60749, 27984, 27988, 60760, 60761, 60765, 28002, 28003, 28006, 28007, 60778, 60779, 60782, 60783, 28018, 28019, 28022, 28023, 60794, 60795, 60798, 60799, 60804, 28040, 28044, 28045, 60834, 60835, 60839, 28075, 28078, 28079, 60850, 60851, 60854, 28090, 28091, 28094, 28095, 60864, 60868, 28104, 28105, 28108, 60884, 28124, 28125, 60899, 60902, 60903, 28138, 28139, 28142, 28143, 60914, 60918, 60919, 28154, 28155, 28158, 28159, 28163, 28166, 60938, 60939, 28178, 28179, 28182, 28183, 60954, 60955, 60959, 28192, 60968, 60969, 60972, 60973, 28212, 60984, 60985, 60988, 60989, 28226, 28227, 28231, 61002, 61003, 61006, 61007, 28242, 28243, 28246, 28247, 61018, 61022, 61023, 28260, 61036, 61048, 61049, 61053, 61058, 61059, 61063, 28298, 28299, 28302, 28303, 61074, 61075, 61079, 28314, 28315, 28318, 28319, 61088, 28328, 28345, 61123, 61126, 61127, 28362, 28363, 28366, 28367, 61139, 61142, 61143, 28378, 28379, 28382, 28383, 61156, 28396, 28397, 28413, 28418, 28423, 61194, 61195, 28435, 28438, 28439, 61210, 61211, 61215, 61224, 61225, 61228, 61229, 28468, 61240, 61241, 61244, 61245, 28482, 28483, 28486, 61258, 61259, 61262, 61263, 28498, 28499, 28502, 61274, 61278, 61279, 61293, 28532, 61304, 61305, 61308, 61314, 61315, 61318, 28554, 28555, 28558, 28559, 61330, 61331, 61334, 28570, 28571, 28574, 28575, 28585, 61360, 28600, 61378, 61382, 61383, 28618, 28619, 28622, 28623, 61394, 61398, 61399, 28634, 28635, 28638, 28639, 28653, 61428, 28669, 61474, 61475, 28714, 28715, 28718, 61490, 61491, 28730, 28731, 28735, 61508, 28744, 28748, 61542, 61543, 28779, 28783, 61558, 61559, 28794, 28798, 28804, 61576, 28834, 28835, 28839, 61610, 61611, 61614, 61615, 28850, 28851, 28854, 61626, 61627, 61630, 61631, 28868, 61661, 28898, 28903, 61674, 61675, 61678, 61679, 28915, 28918, 61690, 61691, 61694, 61695, 61716, 28952, 28956, 61734, 61735, 28971, 28975, 61746, 61747, 61750, 61751, 28986, 28987, 28991, 61776, 61780, 29016, 29017, 29020, 29021, 61810, 61811, 61814, 61815, 29050, 29051, 29054, 29055, 29056, 29060, 61832, 61833, 61837, 29072, 29076, 61848, 61849, 61852, 29090, 29091, 29094, 29095, 61867, 61870, 61871, 29106, 29107, 29110, 61883, 61886, 61887, 29124, 61897, 61900, 61901, 29140, 61912, 61916, 61917, 29154, 29158, 29159, 61930, 61931, 61934, 29170, 29171, 29174, 29175, 61946, 61947, 61950, 61954, 61955, 29194, 29195, 29198, 61974, 61975, 29211, 29215, 61984, 29224, 29225, 29229, 62000, 62004, 29240, 29241, 29244, 62022, 62023, 29258, 29262, 29263, 62034, 62035, 62038, 62039, 29274, 29275, 29278, 29279, 62052, 29289, 29292, 29293, 62068, 29304, 29308, 29309, 29314, 29315, 29318, 62090, 62091, 62094, 62095, 29330, 29331, 29334, 29335, 62106, 62107, 62110, 62111, 29344, 62120, 62121, 62125, 29360, 29364, 62136, 62137, 62140, 29378, 29382, 29383, 62154, 62155, 62158, 62159, 29395, 29398, 29399, 62170, 62171, 62174, 62175, 29412, 62185, 62188, 62189, 29424, 29428, 62200, 62204, 62205, 62210, 62211, 29450, 29451, 29455, 62226, 62227, 62230, 62231, 29466, 29467, 29471, 62240, 62244, 29480, 29481, 29484, 62256, 29496, 29497, 29501, 62278, 62279, 29515, 29518, 29519, 62308, 29544, 29548, 29549, 62324, 29561, 29564, 29565, 29570, 29571, 29575, 62346, 62347, 62350, 62351, 29586, 29587, 29590, 29591, 62362, 62363, 62366, 62367, 29600, 29604, 62376, 62380, 29616, 62392, 62397, 29634, 29635, 29638, 29639, 62410, 62411, 62414, 62415, 29650, 29651, 29654, 29655, 62426, 62427, 62430, 62431, 29664, 29668, 62440, 62445, 29684, 62457, 62461, 62468, 29704, 29708, 62502, 62503, 29738, 29742, 29743, 62518, 62519, 29755, 29758, 29759, 62562, 62563, 29802, 29803, 29806, 29807, 62578, 62579, 29818, 29819, 29822, 29823, 29828, 62605, 29844, 29859, 29862, 29863, 62634, 62635, 29874, 29878, 29879, 62650, 62651, 29888, 29892, 29904, 29908, 62680, 29922, 29923, 62702, 62703, 29938, 29939, 62718, 62719, 62736, 62740, 29976, 29977, 29980, 29981, 62754, 62755, 62758, 62759, 29994, 29995, 29998, 29999, 62804, 30040, 30044, 62818, 62819, 62822, 62823, 30058, 30059, 30062, 62838, 62839, 30074, 30078, 30084, 62857, 62860, 62861, 30100, 62872, 62876, 62877, 30114, 30115, 30118, 30119, 62890, 62891, 62895, 30131, 30134, 30135, 62906, 62907, 62911, 30144, 30148, 62920, 62921, 62925, 30160, 30164, 62936, 62937, 62940, 30178, 30179, 30183, 62954, 62958, 62959, 30194, 30195, 30198, 30199, 62970, 62974, 62975, 62982, 62983, 30219, 30223, 63012, 30249, 30252, 30253, 63028, 30264, 30268, 30269, 63042, 63043, 30282, 30283, 30286, 30287, 63058, 63059, 63062, 63063, 30298, 30299, 30302, 63072, 63092, 30328, 30329, 30332, 30339, 30342, 63114, 63115, 63118, 63119, 30354, 30358, 30359, 63130, 63131, 63134, 63135, 30372, 63145, 30384, 30388, 63160, 30402, 30403, 30406, 30407, 63178, 63179, 63182, 63183, 30418, 30419, 30422, 63194, 63195, 63198, 63199, 63213, 30452, 63228, 63238, 63239, 30474, 30478, 63250, 63251, 63254, 63255, 30490, 30491, 30494, 30495, 63268, 30504, 30508, 30509, 63284, 30521, 30524, 30525, 63298, 63299, 30538, 30539, 30542, 30543, 63318, 63319, 30554, 30558, 63332, 30568, 30569, 30572, 30594, 30595, 30598, 30599, 63370, 63371, 63374, 63375, 30610, 30611, 30614, 30615, 63386, 63387, 63390, 63391, 30624, 63400, 63404, 63405, 63417, 63420, 63421, 30659, 30662, 30663, 63434, 63435, 63438, 63439, 30675, 30678, 30679, 63450, 63451, 63454, 63455, 30692, 63464, 63465, 63468, 63480, 63481, 63485, 30724, 63496, 30736, 30740, 63512, 63513, 63517, 30754, 30755, 30758, 63530, 63531, 63534, 63535, 30770, 30771, 30775, 63546, 63547, 63550, 63551, 30788, 63565, 30804, 63577, 63580, 63581, 30819, 30822, 63594, 63595, 63598, 63599, 30834, 30835, 30838, 30839, 63610, 63611, 63614, 63615, 63616, 63620, 30857, 30860, 30872, 30873, 63654, 63655, 30890, 30891, 30894, 30895, 63670, 63671, 30906, 30907, 30910, 30911, 63680, 63696, 63700, 30937, 30940, 30941, 63714, 63715, 63718, 63719, 30954, 30958, 30959, 63730, 63731, 63734, 63735, 30970, 30971, 30974, 30975, 30992, 30996, 63768, 63769, 63772, 31010, 31011, 31014, 31015, 63786, 63787, 63790, 63791, 31026, 31027, 31030, 31031, 63802, 63803, 63806, 63807, 31044, 31060, 63832, 63836, 63837, 31074, 31078, 31079, 63850, 63851, 63854, 63855, 31090, 31091, 31094, 31095, 63866, 63867, 63870, 63871, 31112, 31113, 63888, 63892, 31129, 63906, 63907, 63910, 63911, 31146, 31147, 31150, 31151, 63922, 63923, 63926, 63927, 31162, 31163, 31167, 63936, 63940, 31177, 31180, 31181, 63952, 31192, 31193, 63970, 63971, 63974, 63975, 31210, 31211, 31214, 31215, 63986, 63987, 63990, 63991, 31226, 31230, 31231, 31234, 31235, 31239, 64010, 64011, 64014, 64015, 31250, 31251, 31254, 31255, 64027, 64030, 64031, 31264, 64040, 64041, 64045, 31280, 31284, 64056, 64060, 31299, 31302, 31303, 64074, 64075, 31314, 31315, 31318, 31319, 64090, 64091, 64095, 31332, 64105, 31344, 64120, 64124, 64125, 64134, 64135, 31370, 31371, 31374, 31375, 64146, 64147, 64150, 64151, 31386, 31387, 31390, 31391, 31405, 64180, 31420, 64194, 64195, 64198, 64199, 31434, 31435, 31438, 31439, 64210, 64211, 64214, 64215, 31450, 31451, 31454, 31455, 31465, 31468, 31469, 64240, 31480, 31484, 31485, 31490, 31491, 31494, 64266, 64267, 64270, 64271, 31506, 31507, 31510, 64283, 64286, 64287, 31520, 31524, 64296, 64297, 64300, 31536, 64312, 64317, 31554, 31558, 31559, 64330, 64331, 31571, 31574, 31575, 64346, 64347, 64351, 31584, 31588, 64360, 64377, 64380, 64381, 64390, 64391, 31626, 31627, 31630, 31631, 64402, 64403, 64406, 64407, 31642, 31643, 31647, 64420, 31660, 64450, 64451, 64454, 64455, 31690, 31691, 31694, 31695, 64466, 64467, 64470, 64471, 31706, 31707, 31710, 31711, 64480, 31720, 31724, 31725, 31737, 31740, 31741, 31748, 31764, 64537, 64540, 64541, 31778, 31782, 31783, 64554, 64555, 64558, 64559, 31794, 31795, 31798, 31799, 64570, 64571, 64574, 64575, 31808, 31812, 31824, 31828, 64600, 64601, 64605, 31842, 31843, 31846, 31847, 64618, 64619, 64622, 64623, 31859, 31862, 31863, 64634, 64635, 64638, 64639, 64640, 64656, 64660, 31897, 31900, 31901, 64674, 64675, 64678, 64679, 31914, 31915, 31918, 31919, 64690, 64691, 64694, 64695, 31930, 31931, 31934, 31935, 64704, 64708, 31948, 31949, 31960, 31965, 64738, 64739, 64742, 64743, 31978, 31979, 31982, 64754, 64755, 64758, 64759, 31995, 31999, 64781, 32020, 64792, 64796, 64797, 32035, 32038, 32039, 64810, 64811, 64814, 64815, 32050, 32051, 32054, 32055, 64826, 64827, 64830, 64831, 32064, 32068, 64840, 32080, 32084, 64856, 64857, 64860, 32098, 32099, 32102, 64874, 64875, 64878, 64879, 32115, 32118, 32119, 64890, 64891, 64894, 64895, 64896, 64900, 32137, 32140, 32141, 64912, 32152, 32153, 64930, 64931, 64934, 64935, 32170, 32171, 32174, 32175, 64946, 64947, 64950, 64951, 32186, 32187, 32190, 32191, 32200, 32205, 64976, 64980, 32217, 64998, 64999, 32234, 32238, 32239, 65014, 65015, 32250, 32251, 32254, 32255, 32258, 32263, 65034, 65035, 65038, 65039, 32274, 32278, 32279, 65050, 65051, 65054, 32292, 65065, 65068, 65069, 32304, 32308, 65080, 65085, 32322, 32323, 65102, 65103, 32338, 32339, 32343, 65114, 65118, 65119, 65133, 32372, 65144, 65145, 65148, 65154, 65155, 65158, 65159, 32394, 32398, 32399, 65170, 65171, 65174, 65175, 32410, 32411, 32414, 32415, 32425, 32428, 32429, 65200, 32440, 32444, 32445, 65218, 65219, 65222, 65223, 32458, 32459, 32462, 65238, 65239, 32474, 32478, 32479, 32493, 65268, 32508, 32515, 32518, 65290, 65291, 65294, 65295, 32530, 32531, 32534, 32535, 65306, 65307, 65310, 32544, 32548, 65320, 65324, 65325, 32564, 65337, 65341, 32578, 32579, 65358, 65359, 32594, 32595, 32598, 32599, 65370, 65374, 65375, 32612, 65388, 65400, 65401, 65405, 65410, 65411, 65414, 65415, 32650, 32651, 32654, 32655, 65426, 65427, 65430, 65431, 32666, 32670, 32671, 65440, 32680, 32684, 32685, 32697, 32700, 32701, 65474, 65475, 65478, 65479, 32715, 32719, 65494, 65495, 32730, 32731, 32734, 32735, 65508, 32748, 32765], 298: [32789, 32803, 32807, 32818, 32849, 32882, 32908, 32909, 32924, 32925, 32939, 32943, 32954, 32968, 32969, 32984, 32985, 33007, 33018, 33022, 33044, 284, 285, 33058, 33063, 298, 302, 303, 33075, 33078, 33079, 315, 318, 319, 33089, 33093, 33108, 33122, 33138, 33143, 388, 33165, 404, 33181, 418, 423, 33194, 33198, 33199, 435, 439, 33211, 33214, 33215, 33225, 33229, 33240, 33241, 33244, 33245, 482, 483, 486, 33262, 498, 499, 503, 33278, 33279, 33283, 33298, 33303, 542, 543, 33313, 33317, 556, 557, 33332, 33333, 33350, 33366, 33367, 33380, 33381, 33393, 33396, 643, 33418, 33419, 33422, 33423, 658, 33434, 33438, 33439, 673, 677, 33449, 33453, 693, 33464, 33468, 706, 707, 33482, 33483, 33486, 33487, 722, 723, 33498, 33499, 33502, 33503, 737, 33516, 33517, 753, 757, 33532, 33533, 33538, 33555, 33558, 33559, 794, 33572, 812, 813, 33585, 33589, 33602, 33607, 33622, 33623, 859, 33636, 33649, 33652, 33653, 892, 893, 902, 33674, 33675, 33678, 33679, 919, 33694, 33695, 932, 933, 33704, 33708, 945, 948, 33721, 33725, 967, 33738, 33739, 33743, 982, 33754, 33755, 33758, 996, 997, 33773, 1009, 1012, 33788, 33796, 33809, 33831, 33842, 33846, 33856, 33877, 33891, 33895, 33906, 33928, 33929, 33932, 33933, 33944, 33948, 33962, 33963, 33967, 33978, 33979, 33982, 33992, 33993, 33996, 33997, 34008, 34012, 34013, 34027, 34030, 34031, 34042, 34068, 34082, 1322, 1323, 1326, 34098, 34103, 1338, 1339, 1343, 34113, 34117, 34132, 1372, 1373, 34146, 34150, 34151, 34163, 34167, 1403, 34189, 34205, 1442, 1443, 1446, 34218, 34219, 34222, 1458, 1459, 1463, 34234, 34235, 34239, 1476, 34249, 34253, 1492, 34264, 34265, 34268, 34269, 1506, 1511, 34282, 34283, 34286, 34287, 1523, 1527, 34299, 34302, 34303, 34310, 34322, 34326, 34327, 1562, 34337, 34340, 34341, 1580, 1581, 34353, 34356, 34370, 34371, 34375, 34386, 34390, 34391, 1627, 34401, 34405, 34416, 34420, 34421, 1660, 1661, 1670, 34442, 34443, 34447, 1687, 34458, 34459, 34462, 1700, 1701, 34473, 34476, 34477, 1713, 1716, 34488, 34489, 34492, 34493, 1735, 34506, 34507, 34510, 34511, 1750, 34522, 34523, 34526, 34527, 1764, 1765, 34536, 34537, 34541, 1777, 1780, 34552, 34553, 34567, 34578, 34582, 34583, 34593, 34596, 34609, 34612, 34613, 1848, 1849, 34626, 34643, 34646, 34647, 1886, 1887, 34656, 34660, 34661, 34673, 1922, 1923, 34698, 34699, 34702, 1938, 1939, 34714, 34715, 34719, 1953, 34728, 34729, 34732, 34733, 1969, 1973, 34745, 34748, 34749, 1986, 34762, 34763, 34766, 34767, 2003, 34778, 34779, 34782, 34783, 2017, 2021, 34792, 34793, 34796, 2037, 34808, 34809, 34825, 34840, 34844, 34845, 2083, 34858, 34859, 34862, 34863, 2098, 34874, 34878, 34879, 34892, 34893, 34904, 34905, 34908, 34909, 34922, 34923, 34927, 2162, 2163, 34938, 34939, 34942, 34945, 34949, 34960, 34965, 34979, 2219, 2223, 34994, 2234, 2239, 35009, 35012, 35013, 35025, 35028, 35029, 35047, 2287, 35062, 35063, 35080, 35097, 35100, 35101, 2338, 35114, 35118, 35119, 35131, 35134, 35135, 35144, 35145, 35148, 35149, 35160, 35161, 35164, 35165, 35178, 35179, 35182, 2418, 2419, 35194, 35195, 35199, 35200, 35204, 35205, 35217, 35220, 35221, 35234, 2474, 35251, 2491, 35265, 35268, 35269, 35281, 35284, 35285, 35302, 35303, 2538, 35318, 35319, 2554, 35338, 35342, 35343, 2578, 2583, 35354, 35355, 35358, 35359, 2596, 2597, 35368, 35369, 35372, 35373, 2613, 35384, 35385, 35388, 35389, 35402, 35403, 35406, 35407, 2642, 2643, 2647, 35418, 35419, 35432, 35433, 35437, 2676, 35448, 35449, 35452, 35453, 35459, 35463, 2698, 2702, 2703, 35474, 2718, 2719, 35489, 35492, 2729, 2733, 35504, 2744, 2748, 35526, 35542, 35543, 2779, 35556, 35557, 2792, 2796, 35572, 35573, 2809, 2813, 35595, 35598, 35599, 2835, 2838, 35611, 35614, 35615, 2852, 2853, 35624, 35625, 35628, 35629, 2869, 35640, 35641, 35644, 35645, 35658, 35659, 35662, 35663, 2898, 2899, 2902, 35674, 35675, 35688, 35689, 35692, 2932, 35704, 35709, 35714, 35718, 35719, 2958, 2959, 35731, 2970, 2974, 2975, 35744, 35749, 2984, 2988, 2989, 35761, 35764, 3001, 3004, 3005, 35783, 3019, 35794, 35798, 35799, 35812, 35813, 3049, 3052, 3053, 35828, 35829, 3064, 3065, 3068, 35852, 35865, 35868, 35869, 3106, 3107, 3111, 35883, 35887, 35898, 35899, 35902, 35903, 35912, 35913, 35916, 35917, 35928, 35929, 35933, 35946, 35947, 35950, 35951, 3186, 35962, 35963, 35966, 35967, 35969, 35972, 35973, 35988, 35989, 36007, 3242, 36022, 36023, 3258, 36032, 36033, 36037, 36049, 36066, 36067, 3307, 36082, 3322, 36109, 36120, 36124, 36125, 3362, 3363, 36139, 36142, 36143, 3383, 36154, 36155, 36158, 36159, 36168, 36169, 36172, 36173, 36184, 36185, 36188, 36202, 36203, 36206, 36207, 3443, 36218, 36219, 36222, 36223, 36228, 36229, 36241, 36244, 36245, 36262, 36263, 36278, 36279, 3519, 36289, 36292, 36293, 36304, 36305, 36308, 36309, 36322, 3562, 3567, 36339, 3579, 3583, 36362, 36363, 3602, 3603, 3607, 36378, 36379, 36382, 3617, 3620, 36392, 36393, 36397, 3633, 36408, 36409, 36412, 36426, 36427, 36430, 36431, 3666, 3671, 36442, 36446, 36447, 36457, 36460, 36461, 3700, 36472, 36487, 3722, 36502, 36503, 36516, 36517, 3752, 3753, 3757, 36529, 36532, 36533, 3768, 3772, 36547, 36550, 36551, 3790, 3791, 36562, 36567, 3803, 3806, 3807, 36577, 36580, 3816, 3820, 3821, 36593, 36596, 3833, 3837, 36618, 36619, 3858, 3859, 3862, 36634, 36635, 36639, 3873, 3876, 36648, 36649, 36652, 36653, 3889, 36664, 36665, 36669, 36682, 36683, 36686, 36687, 3923, 3926, 36698, 36699, 36702, 36703, 36712, 36716, 36717, 3956, 36729, 36732, 36733, 36738, 36754, 36759, 3994, 36772, 36773, 4008, 4012, 4013, 36788, 36789, 4025, 4029, 36802, 36806, 36807, 4043, 4046, 4047, 36818, 36819, 4062, 4063, 36833, 36836, 36837, 4073, 4076, 4077, 36849, 4088, 4092, 36881, 36885, 4121, 4124, 4125, 36898, 36903, 4138, 4142, 4143, 36915, 4155, 4158, 4159, 4168, 4169, 36945, 36949, 4184, 4185, 4189, 4206, 36978, 36983, 4218, 4219, 4223, 4228, 4229, 37000, 37004, 37005, 4241, 4244, 4245, 37017, 37020, 37021, 4258, 4263, 37034, 4275, 4279, 37051, 37054, 4289, 37064, 37065, 37068, 4305, 4309, 37080, 37081, 37085, 4322, 4323, 4326, 37099, 37102, 4338, 4339, 4343, 37119, 37140, 37155, 37159, 37170, 37174, 37175, 37185, 37189, 37204, 37218, 37223, 37234, 37238, 37260, 37276, 37291, 37294, 37295, 37306, 37310, 37311, 37320, 37321, 37324, 37325, 37336, 37340, 37358, 37359, 37374, 37378, 4618, 4622, 4623, 37395, 37398, 37413, 4648, 4652, 4653, 37425, 37428, 37429, 4665, 4668, 4669, 37446, 37447, 4682, 4683, 4687, 37462, 37463, 37476, 4717, 37489, 37492, 37493, 4728, 4729, 4732, 4738, 4743, 37514, 37515, 37518, 37519, 4755, 4759, 37530, 37531, 37534, 37535, 4768, 4772, 37544, 37549, 4788, 37561, 4802, 4803, 4807, 37578, 37579, 4818, 4819, 4822, 37594, 37595, 37598, 4832, 37612, 37613, 4848, 4852, 37628, 37629, 37635, 4875, 4878, 4879, 37650, 37654, 37655, 37665, 37668, 37669, 4905, 4908, 4909, 4920, 4924, 4925, 37698, 37702, 37703, 4938, 4939, 4942, 37718, 37719, 37729, 37732, 37733, 4968, 4969, 4972, 37745, 37748, 4989, 4995, 4998, 37770, 37774, 37775, 5010, 5014, 37786, 37787, 37790, 37791, 5028, 37801, 37804, 37805, 5040, 5044, 37816, 5058, 5059, 5062, 37834, 37835, 5074, 5075, 5079, 37850, 37851, 37854, 37855, 5088, 5092, 37868, 37869, 5104, 37885, 37892, 5129, 5133, 37905, 37909, 5144, 5145, 5148, 37926, 5162, 5163, 5166, 37938, 37943, 5178, 5179, 5183, 37952, 5192, 5193, 5196, 5197, 37969, 37973, 5208, 5212, 5213, 37986, 37991, 5226, 38003, 5243, 5246, 5247, 5249, 5252, 5253, 38024, 38025, 38028, 5264, 5265, 5268, 38045, 5282, 5283, 5286, 38058, 38059, 38062, 5298, 5299, 5303, 38079, 5313, 5316, 5317, 38088, 38092, 38093, 5328, 5332, 5333, 38105, 38109, 5346, 5351, 38122, 38126, 38127, 5363, 5367, 38139, 38142, 38143, 38164, 38178, 38183, 38194, 38209, 38213, 38228, 38243, 38246, 38247, 38258, 38263, 38284, 38300, 38315, 38319, 38331, 38334, 38345, 38348, 38349, 38360, 38364, 38379, 38382, 38383, 38394, 38395, 38398, 38399, 38407, 5643, 5647, 38422, 38423, 5658, 5659, 5662, 38436, 38437, 5672, 5673, 5676, 38449, 38452, 38453, 5688, 5689, 5693, 38466, 38471, 5710, 5711, 38482, 38483, 38486, 38487, 5722, 5723, 5726, 5727, 38497, 38501, 5737, 5740, 5741, 38512, 38513, 38516, 38517, 5752, 5753, 5756, 5757, 5762, 5763, 5767, 38538, 38539, 38543, 5778, 5779, 5782, 5783, 38554, 38555, 38558, 5793, 5797, 38572, 38573, 5808, 5809, 5813, 38584, 38585, 38588, 38589, 5826, 5830, 5831, 38602, 38603, 38606, 38607, 5843, 5846, 5847, 38618, 38619, 38622, 38623, 5857, 5860, 5861, 38632, 38633, 38636, 5872, 5876, 5877, 38648, 38649, 38652, 38662, 5898, 5902, 38674, 38678, 38679, 5914, 5915, 5918, 5919, 38689, 38692, 38693, 5928, 5929, 5932, 5933, 38705, 38708, 38709, 5944, 5945, 5948, 38723, 5966, 5967, 38738, 38743, 5979, 5982, 5983, 38752, 38753, 38756, 38757, 5992, 5993, 5996, 5997, 38769, 6008, 6009, 6012, 6018, 6019, 6022, 6023, 38794, 38795, 38798, 38799, 6034, 6035, 6038, 6039, 38810, 38811, 38815, 6048, 6049, 38824, 38828, 38829, 6065, 6069, 38841, 38844, 38845, 6082, 6083, 6086, 6087, 38859, 6098, 6102, 38874, 38875, 38879, 6112, 6113, 6116, 6117, 38888, 38889, 38892, 6129, 6132, 6133, 38904, 38905, 38908, 38920, 6165, 38937, 38940, 38941, 6178, 6182, 6183, 38954, 38958, 38959, 6195, 6198, 6199, 38971, 38974, 38975, 38985, 38988, 38989, 6225, 39000, 39001, 39004, 39005, 6242, 6243, 39018, 39019, 39022, 6258, 6259, 6263, 39034, 39035, 39039, 39040, 39044, 39045, 6281, 6285, 39057, 39060, 39061, 6296, 6297, 6300, 39074, 6314, 6318, 6319, 39091, 6331, 6334, 6335, 39105, 39108, 39109, 6345, 6349, 39121, 39124, 39125, 6360, 6364, 39142, 39143, 6378, 6379, 39158, 39159, 6394, 6395, 6399, 6404, 39177, 6417, 6421, 39192, 39196, 39197, 6435, 6438, 6439, 39210, 39211, 39214, 39215, 6450, 6454, 6455, 39226, 39230, 39231, 6464, 39240, 39241, 39244, 39245, 6481, 6485, 39256, 39257, 39260, 39261, 6498, 6499, 6503, 39274, 39275, 39279, 6514, 6515, 6518, 39294, 39297, 39301, 6541, 39312, 39317, 6553, 6556, 6557, 39331, 6571, 6574, 6575, 39346, 6586, 6590, 6591, 39361, 39364, 39365, 6601, 39377, 39380, 39381, 6616, 6617, 6621, 39399, 6634, 6635, 6639, 39414, 6650, 6651, 6654, 6658, 6663, 39438, 39439, 39451, 39454, 39455, 6688, 6692, 39464, 39465, 39468, 39469, 6708, 39480, 39481, 39484, 39485, 6722, 6723, 6726, 6727, 39498, 39499, 39502, 39514, 39515, 6756, 39532, 39533, 6768, 6772, 39544, 39545, 39548, 39549, 39554, 6794, 6795, 6798, 6799, 39571, 39574, 39575, 6811, 6814, 6815, 39588, 39589, 6824, 6828, 6829, 39601, 39604, 39605, 6840, 6841, 6844, 6845, 39618, 39622, 39623, 6858, 6859, 6863, 6874, 6875, 6878, 39652, 39653, 6888, 6889, 6893, 39668, 39669, 6904, 6905, 6908, 6915, 6918, 39694, 39695, 39706, 39707, 39710, 39711, 6948, 39720, 39721, 39724, 39725, 6960, 6964, 39736, 39737, 39740, 39741, 6978, 6979, 6982, 6983, 39754, 39755, 39770, 39771, 7008, 7012, 39784, 39785, 39788, 7028, 39804, 39805, 39811, 7050, 7051, 7054, 7055, 39826, 39830, 39831, 7066, 7070, 7071, 39841, 39844, 39845, 7080, 7081, 7084, 7085, 7096, 7100, 7101, 39874, 39879, 7114, 7115, 7118, 39894, 7130, 7131, 7135, 39908, 39909, 7144, 7145, 7148, 39924, 39925, 7160, 7161, 7165, 39949, 7185, 39960, 39964, 39965, 7202, 7203, 7206, 7207, 39979, 39982, 7218, 7219, 7223, 39994, 39995, 39998, 39999, 40008, 40009, 40013, 7253, 40024, 40025, 40028, 40029, 7266, 40042, 40043, 40046, 40047, 7282, 7283, 40059, 40062, 40063, 40068, 40069, 7305, 40081, 40084, 40085, 7320, 40102, 40103, 7342, 40118, 40119, 7359, 40129, 40132, 7373, 40144, 40145, 40148, 40149, 7388, 7389, 40162, 7402, 40178, 40179, 7419, 7428, 40204, 7441, 40217, 40220, 40221, 7458, 7459, 7463, 40235, 40238, 40239, 7474, 7475, 7478, 40250, 40251, 40254, 40255, 7488, 40264, 40265, 7509, 40280, 40281, 40285, 7523, 40298, 40299, 40302, 40303, 7538, 40314, 40315, 40318, 40319, 40321, 40324, 40325, 7561, 7564, 40340, 40341, 7576, 40359, 7598, 7599, 40374, 7614, 7615, 40384, 40385, 40389, 7624, 7629, 40401, 7644, 40419, 7658, 7659, 40434, 7674, 7675, 7682, 7683, 7687, 40458, 40459, 40463, 7698, 7699, 40474, 40475, 40478, 40479, 7712, 7713, 7716, 7717, 40488, 40489, 40492, 40493, 7728, 7729, 40504, 40505, 40508, 40509, 7746, 7750, 7751, 40522, 40523, 40526, 7762, 7766, 40538, 40539, 40542, 40543, 7780, 7781, 40552, 40553, 40556, 40557, 7792, 7796, 40568, 40572, 40573, 40582, 40583, 7818, 7819, 7823, 40598, 40599, 7834, 7835, 7838, 7839, 40612, 40613, 7848, 7849, 7852, 7853, 40625, 40628, 40629, 7864, 7865, 7869, 40642, 40647, 7882, 7886, 7887, 40659, 40663, 7898, 7899, 7902, 7903, 40673, 40676, 7913, 7916, 7917, 40688, 40689, 7928, 7929, 7932, 7933, 7938, 7939, 7942, 40714, 40715, 40718, 7955, 7959, 40730, 40731, 40735, 7968, 40744, 40745, 40749, 7984, 7985, 7988, 40760, 40761, 40764, 40765, 8003, 8006, 8007, 40778, 40779, 40782, 40783, 8022, 8023, 40794, 40795, 40798, 40799, 8032, 8036, 8037, 40808, 40809, 40812, 40813, 8049, 8052, 8053, 40824, 40825, 40828, 40829, 40834, 40838, 40839, 8074, 8075, 8078, 8079, 40854, 40855, 8090, 8091, 8094, 8095, 40865, 40868, 40869, 8104, 8105, 8108, 8109, 40881, 40884, 40885, 8120, 8121, 40898, 40899, 40903, 8138, 8142, 8143, 40914, 40918, 40919, 8154, 8158, 8159, 40928, 40929, 40933, 8168, 8169, 8172, 8173, 40945, 40948, 8184, 8185, 8188, 8189, 40978, 40983, 8218, 8222, 8223, 40993, 40997, 8233, 8236, 8237, 41042, 41047, 8282, 8283, 8287, 41073, 41077, 8312, 8313, 8317, 8327, 41099, 41102, 8338, 8343, 41114, 41118, 41119, 8353, 8357, 41129, 41133, 8373, 41144, 41148, 41149, 8386, 41163, 41166, 8402, 8407, 41178, 41179, 41183, 8417, 41192, 41193, 41196, 8433, 8437, 41209, 41213, 41218, 41223, 8462, 8463, 8478, 8489, 8492, 8493, 41264, 41268, 41282, 41283, 41287, 41302, 41303, 8543, 41312, 41313, 41317, 41329, 41332, 41333, 8568, 8569, 8578, 8582, 8583, 41355, 41358, 41359, 8595, 8599, 41370, 41374, 41375, 8608, 8612, 41384, 41388, 41389, 8628, 41401, 41404, 41405, 8642, 8643, 8646, 8647, 41418, 41419, 41423, 8658, 8662, 41439, 8672, 41448, 41449, 41453, 8688, 8692, 41464, 41465, 41468, 41469, 41473, 41477, 8713, 8728, 41526, 41527, 41537, 41540, 41556, 8796, 8797, 41574, 41575, 41587, 8833, 8837, 41608, 41609, 41612, 41613, 8848, 8853, 41624, 41625, 41628, 41629, 41646, 41647, 41662, 41663, 8896, 8897, 8901, 41672, 41673, 41676, 8912, 8913, 41688, 41689, 41693, 41707, 41710, 41722, 41723, 41726, 41744, 41748, 8985, 41766, 41767, 9006, 9007, 41793, 41796, 41797, 41808, 41831, 41842, 41846, 41847, 9092, 9093, 41864, 41868, 41869, 9105, 9108, 41880, 41881, 41884, 41885, 41918, 41919, 9153, 41928, 41933, 9173, 41944, 41945, 41948, 41962, 41963, 41967, 9207, 41978, 41979, 41983, 9226, 9227, 9230, 9231, 42002, 42003, 42007, 9242, 9243, 9246, 42017, 42020, 9256, 9257, 9260, 9261, 42033, 42036, 42037, 9272, 9273, 9276, 9277, 42050, 42051, 42066, 42070, 42071, 9307, 9310, 9311, 42081, 42085, 42101, 9336, 9340, 9341, 9347, 9350, 9351, 42122, 42123, 42126, 42127, 9363, 9366, 9367, 42138, 42139, 42142, 42143, 9377, 9381, 42152, 42153, 42157, 9393, 42168, 42169, 42172, 9414, 9415, 42186, 42187, 42190, 42191, 9430, 9431, 42202, 42203, 42206, 42207, 9444, 9445, 42216, 42220, 42221, 9457, 9460, 9461, 42233, 42236, 42237, 42242, 42247, 9482, 9483, 42262, 42263, 9502, 42276, 9512, 9513, 42288, 42306, 42310, 42311, 9567, 42336, 42337, 42340, 42341, 42353, 42357, 9593, 9596, 9597, 9602, 9603, 9606, 9607, 42378, 42379, 42382, 9618, 9622, 42394, 42395, 42398, 42399, 9632, 9636, 42408, 42409, 42412, 9648, 42424, 42425, 42429, 9666, 9670, 9671, 42446, 42447, 9683, 9686, 9687, 42462, 42463, 9700, 42472, 42473, 42476, 42477, 9712, 9716, 42488, 42492, 42493, 9737, 9741, 42512, 42513, 42517, 9752, 9756, 42534, 42535, 9770, 9771, 9774, 42551, 9786, 9787, 9791, 42561, 42565, 42576, 42577, 42580, 42581, 9816, 9817, 9820, 9821, 42594, 42599, 42610, 42611, 42614, 42615, 9851, 9854, 9855, 9857, 9860, 9861, 42632, 42633, 42637, 9876, 9877, 42649, 42652, 9894, 42666, 42667, 42670, 42682, 42683, 42686, 9921, 9924, 9925, 42696, 42697, 42700, 42701, 9937, 9940, 9941, 42712, 42713, 42716, 42717, 42734, 42735, 42746, 42751, 42753, 42757, 9993, 9997, 42769, 42772, 42773, 10008, 10009, 10012, 10013, 42787, 10026, 10027, 10030, 42802, 42806, 42807, 10042, 10043, 10047, 42821, 42833, 42837, 10072, 10076, 42850, 42851, 42854, 42855, 10107, 10110, 10111, 10112, 10113, 10116, 10117, 42888, 42889, 42892, 42893, 10128, 10129, 10132, 42904, 42905, 42908, 42909, 42922, 42923, 42927, 10167, 42938, 42943, 10177, 10180, 10181, 42952, 42953, 42956, 42957, 10192, 10196, 10197, 42968, 42969, 42972, 42973, 42987, 42990, 42991, 10227, 43003, 43006, 43007, 43019, 43022, 10258, 10262, 10263, 43035, 43038, 43039, 10276, 10277, 43048, 43049, 43052, 43053, 10292, 43064, 43068, 43069, 43082, 43083, 43086, 43087, 10326, 10327, 43098, 43099, 43102, 43112, 43113, 43117, 10352, 10353, 10356, 43128, 43129, 43132, 43133, 43142, 10378, 10379, 10383, 43154, 43158, 43159, 10394, 10395, 10398, 10399, 43169, 43172, 10409, 10413, 10424, 43206, 43207, 10442, 10443, 10447, 43222, 43223, 10458, 10459, 10462, 10463, 43236, 43237, 10476, 10477, 43252, 43253, 10489, 10492, 10493, 10498, 10502, 10503, 43274, 43278, 43279, 10515, 10519, 43290, 43294, 43295, 10528, 10529, 10532, 10533, 43304, 43305, 43308, 43309, 10548, 43320, 43321, 43324, 43325, 43338, 43339, 43342, 43343, 10582, 43354, 43355, 43358, 43359, 43369, 43372, 10608, 10609, 10613, 43384, 43385, 43388, 43389, 43394, 43398, 43399, 10634, 10635, 10638, 10639, 43411, 43414, 43415, 10650, 10651, 10654, 10655, 43428, 43429, 10664, 10669, 43441, 43444, 10681, 10685, 43458, 43459, 43463, 10698, 10699, 10702, 43478, 43479, 10714, 10715, 10718, 10719, 43492, 43493, 10729, 10732, 10733, 43505, 43508, 43509, 10744, 10745, 10748, 10749, 10756, 10757, 43529, 43533, 10768, 10772, 43544, 43548, 43549, 10790, 10791, 43566, 43567, 10806, 10807, 43592, 43593, 43597, 10832, 43608, 43609, 43612, 43626, 43627, 43630, 43642, 43643, 43647, 43649, 43652, 10888, 10889, 10892, 10893, 43668, 43669, 10904, 10905, 10908, 10909, 10926, 10927, 10942, 10943, 43716, 43717, 10952, 10953, 10956, 10957, 43732, 43733, 10968, 10969, 10973, 43747, 43750, 10990, 43767, 11006, 11012, 11013, 43784, 43788, 43789, 11028, 43801, 43804, 43805, 11046, 11047, 43822, 43823, 11062, 11063, 43838, 43839, 43848, 43849, 43852, 11088, 11092, 43864, 43865, 43869, 43882, 43883, 43886, 11126, 11127, 43898, 43903, 11144, 11145, 11148, 11149, 43921, 43924, 11160, 11161, 11164, 11165, 11182, 11183, 11198, 11199, 43972, 43973, 11208, 11209, 11213, 43988, 43989, 11224, 11225, 11228, 11229, 44002, 11247, 44018, 44023, 11263, 44043, 44046, 11286, 11287, 44058, 44059, 44063, 11296, 11297, 11300, 44072, 44073, 44076, 11316, 44088, 44093, 44106, 44107, 44110, 44111, 11346, 11350, 11351, 44126, 44127, 44136, 44137, 44140, 44141, 11380, 11381, 44152, 44153, 44156, 44157, 44166, 44167, 11402, 11403, 11406, 44178, 44179, 44183, 11418, 11419, 11423, 44196, 44197, 11436, 11437, 44212, 44213, 11452, 11453, 44230, 44231, 11466, 11470, 11471, 44242, 44246, 44247, 11483, 11486, 11487, 44257, 44260, 11496, 11497, 44273, 44276, 11512, 11513, 11526, 11527, 44298, 44299, 44303, 11543, 44319, 11552, 11553, 11556, 44328, 44329, 44333, 11572, 44344, 44345, 44348, 44362, 44363, 44366, 44367, 11602, 11606, 44382, 44383, 44392, 44393, 44396, 44397, 11632, 11636, 11637, 44408, 44409, 44412, 44413, 44422, 44423, 11658, 11659, 11663, 44438, 44439, 11674, 11675, 11678, 11679, 44452, 44453, 11688, 11689, 11692, 11693, 44468, 44469, 11705, 11708, 11709, 44482, 44486, 44487, 11722, 11723, 11726, 11727, 44498, 44502, 11738, 11739, 11742, 11743, 44513, 44516, 11752, 11753, 44529, 11768, 11769, 11777, 11780, 44552, 44553, 44556, 11792, 11793, 11796, 11797, 44568, 44569, 44573, 11811, 11814, 11815, 44587, 44590, 44602, 44603, 44607, 44616, 44620, 44621, 11860, 44632, 44633, 44636, 44637, 44654, 44655, 11894, 11895, 44667, 44670, 44671, 44676, 44677, 11913, 11916, 44692, 44693, 11928, 11929, 11933, 44707, 44710, 11946, 11947, 11950, 44722, 11962, 11963, 11966, 44737, 44740, 11977, 11980, 11981, 44753, 44756, 11992, 11993, 11996, 11997, 44770, 12010, 12015, 44786, 44791, 12026, 12031, 12033, 12036, 44809, 44813, 12048, 44824, 44825, 44828, 44829, 12067, 44842, 44843, 44846, 12086, 12087, 44858, 44859, 44863, 44873, 44876, 44877, 12112, 12113, 12116, 12117, 44888, 44892, 44893, 44906, 44911, 12150, 12151, 44923, 44926, 44927, 44932, 44933, 12168, 12169, 12173, 44945, 44948, 44949, 12184, 12185, 12188, 12189, 44967, 12202, 12203, 12207, 44978, 44983, 12218, 12219, 12223, 44993, 44996, 12232, 12236, 12237, 45009, 12248, 12249, 12252, 12253, 45026, 45031, 12267, 12270, 12271, 45043, 12283, 12286, 12287, 45075, 45078, 45079, 12315, 12319, 45093, 45105, 45109, 12345, 12348, 45126, 45127, 12362, 12363, 12366, 12367, 45138, 45139, 45142, 12378, 12382, 45153, 45156, 45157, 12392, 12393, 12396, 12397, 45169, 45172, 12409, 12412, 12422, 45194, 45198, 45199, 12435, 12438, 12439, 45211, 45214, 12452, 12453, 45224, 45228, 45229, 12465, 12468, 45241, 45245, 12483, 12486, 12487, 45258, 45263, 12502, 45274, 45275, 45278, 12516, 12517, 45288, 45289, 45293, 12529, 12532, 45304, 45308, 45315, 45318, 45319, 12558, 12559, 45334, 45335, 12574, 45348, 12584, 12588, 12589, 45364, 45378, 45379, 45398, 45399, 12639, 45409, 45425, 45428, 45429, 12664, 12665, 12675, 12678, 12679, 45450, 45454, 45455, 12690, 12694, 12695, 45467, 45470, 45471, 12708, 45480, 45481, 45484, 45485, 12720, 12724, 45496, 45497, 45500, 45501, 12738, 12742, 45518, 45519, 12754, 12755, 12758, 12759, 45530, 45531, 45534, 45535, 12768, 12772, 45544, 45545, 45548, 45549, 12784, 45560, 45561, 45564, 45565, 45573, 12808, 45588, 12825, 45622, 45623, 45633, 45636, 45637, 12876, 45652, 12892, 12893, 45683, 45686, 45687, 12922, 12923, 12928, 12932, 12933, 45704, 45705, 45708, 45709, 12945, 12948, 12949, 45721, 45724, 45725, 45742, 45743, 45758, 45759, 12992, 12993, 45768, 45769, 45773, 13008, 13009, 13013, 45784, 45785, 45788, 45802, 45803, 45807, 13047, 45818, 45823, 45825, 45829, 45844, 13080, 45862, 45863, 13102, 13103, 45889, 45892, 13132, 45922, 45926, 45927, 13162, 13163, 45938, 13185, 13188, 45960, 45961, 45964, 45965, 13204, 13205, 45976, 45977, 45981, 45998, 45999, 13253, 46024, 46028, 13265, 46040, 46041, 46045, 13286, 46062, 46074, 46075, 46078, 46079, 46086, 46087, 46098, 46099, 13338, 13339, 46113, 46116, 46117, 46129, 46132, 13368, 13369, 13372, 46146, 46147, 13386, 13387, 13390, 13391, 46166, 46167, 13406, 13407, 46181, 13416, 13420, 13421, 46193, 46197, 13436, 13437, 13442, 13443, 13447, 46218, 46219, 13458, 13459, 46234, 46235, 46238, 46239, 13473, 46249, 46252, 13489, 13493, 46264, 46265, 46269, 13506, 13507, 13511, 46282, 46283, 46286, 46287, 13522, 13523, 13527, 46298, 46302, 46303, 13537, 13541, 46313, 46316, 46317, 13557, 46328, 46332, 46338, 46339, 46342, 13578, 13579, 46358, 46359, 13598, 46372, 13608, 13609, 46406, 46407, 46422, 46423, 13663, 46433, 46436, 46437, 46452, 46453, 13688, 13692, 13693, 13698, 13702, 46474, 46475, 46478, 46479, 13714, 13715, 13718, 13719, 46490, 46491, 46494, 46495, 13728, 46504, 46505, 46509, 13744, 13748, 46520, 46521, 46524, 13763, 13767, 46543, 13778, 13782, 13783, 46558, 46559, 13792, 13796, 46568, 46569, 46572, 46573, 13812, 46584, 46585, 46588, 46589, 46593, 46596, 46597, 46609, 46642, 46646, 46647, 13887, 46661, 13896, 13897, 46673, 46676, 46677, 13912, 46695, 13930, 13934, 13935, 46706, 46707, 46710, 46711, 13946, 13947, 13950, 13951, 13953, 13957, 46728, 46729, 46732, 13969, 46745, 46749, 13987, 46767, 14002, 14003, 14007, 46778, 46779, 46783, 14017, 14020, 14021, 46792, 46793, 46796, 14036, 14037, 46808, 46809, 46812, 46813, 14050, 14055, 46826, 46827, 46830, 46831, 14067, 14071, 46842, 46843, 46846, 46847, 46849, 46852, 14092, 46865, 46868, 46869, 14108, 14109, 46883, 46886, 46887, 46898, 14138, 14139, 14143, 46913, 46917, 14152, 14153, 46932, 46933, 14169, 46946, 46947, 46950, 46951, 14186, 14187, 14190, 14191, 14203, 14207, 14208, 14209, 14213, 46984, 46985, 46989, 14224, 14225, 14229, 47000, 47001, 47004, 14242, 14243, 47018, 47019, 47022, 47023, 14258, 14263, 47038, 14272, 14273, 14277, 47048, 47052, 47053, 14289, 14293, 47065, 47068, 47069, 14306, 14311, 47082, 47086, 47087, 14323, 47098, 47102, 47103, 14338, 47114, 47119, 14358, 47130, 47134, 47135, 14368, 14372, 47144, 47148, 47149, 14389, 47160, 47161, 47164, 14402, 14403, 14406, 14407, 47178, 47179, 47182, 47183, 47194, 47195, 47198, 47199, 14433, 14436, 47208, 47212, 14448, 14452, 47224, 47225, 47229, 47234, 14474, 14475, 14478, 14479, 47255, 14490, 14491, 14494, 14495, 47264, 47269, 14504, 14508, 47281, 47284, 47285, 14521, 47302, 47303, 14538, 14539, 14542, 14543, 47314, 47315, 14554, 14555, 14558, 14559, 47329, 47332, 47333, 14568, 14569, 14572, 14573, 47344, 47345, 47348, 47349, 14584, 14585, 14588, 14589, 47371, 47374, 47375, 14610, 14614, 14615, 47387, 47390, 47391, 14628, 47400, 47401, 47404, 47405, 14641, 14645, 47416, 47417, 47420, 47421, 14658, 14659, 14662, 14663, 47434, 47435, 14678, 14679, 47450, 47451, 47454, 47455, 14689, 14692, 14693, 47464, 47465, 47469, 14704, 14708, 47480, 47481, 47484, 47491, 47494, 14730, 14731, 14734, 14735, 47506, 14746, 14747, 14750, 14751, 47521, 47524, 47525, 14761, 14764, 14765, 47536, 14776, 14780, 47554, 47555, 47558, 47559, 14794, 14795, 14798, 14799, 47575, 14810, 14811, 14814, 14815, 47584, 47588, 47589, 14825, 14828, 14829, 47601, 47604, 47605, 14840, 14841, 14844, 14845, 14853, 47624, 47628, 14868, 47640, 47641, 47644, 47645, 14886, 14887, 47662, 47663, 14916, 47688, 47689, 47692, 14928, 14932, 47704, 47705, 47709, 14947, 47722, 47723, 47726, 14962, 14963, 14966, 14967, 47743, 47744, 14984, 14985, 14988, 14989, 47761, 47764, 47765, 15000, 15001, 15004, 15005, 47808, 47812, 47813, 15048, 15049, 15053, 47828, 47829, 15064, 15065, 15068, 47842, 47843, 47847, 15083, 15087, 47858, 47863, 15098, 15099, 15103, 15109, 47881, 47884, 47885, 15120, 15124, 47896, 47897, 47900, 47901, 15142, 15143, 47918, 47919, 47934, 47935, 15172, 47944, 47949, 15184, 47960, 47961, 47964, 15202, 15203, 15206, 47982, 15218, 47994, 47995, 47998, 47999, 48001, 48004, 48005, 15240, 15241, 15244, 15245, 48016, 48021, 15256, 15257, 15260, 15261, 15278, 15279, 15294, 15295, 48068, 48069, 15304, 15305, 15308, 48080, 48084, 48085, 15320, 15321, 15325, 48102, 15338, 15339, 15342, 48114, 48115, 15354, 15358, 15367, 48138, 48139, 48143, 48154, 48155, 48158, 48159, 15392, 48168, 48169, 48173, 48184, 48185, 48188, 15426, 15427, 15430, 15431, 48203, 48206, 48207, 15447, 48222, 48223, 15460, 48232, 48233, 48236, 48237, 15472, 15476, 48248, 48252, 48253, 48263, 15498, 15499, 15503, 48274, 48275, 15514, 15518, 15519, 48288, 48292, 48293, 15528, 15532, 15533, 48308, 48309, 15544, 15545, 15548, 15549, 48322, 15563, 15566, 15567, 48342, 15578, 15579, 15582, 48353, 48356, 48357, 15593, 48368, 48369, 15608, 48395, 48398, 15638, 15639, 48414, 48415, 15648, 15652, 48424, 48425, 48428, 48441, 48445, 15682, 15683, 15686, 15687, 48458, 48459, 48462, 48463, 15702, 15703, 48478, 15716, 48488, 48489, 48493, 15732, 48505, 48508, 48509, 48514, 48515, 48518, 48519, 15754, 15755, 15758, 15759, 48534, 48535, 15770, 15771, 15774, 15775, 48548, 48549, 15788, 15789, 48560, 48564, 48565, 15804, 15805, 48578, 48583, 15818, 15822, 15823, 48594, 15834, 15835, 15839, 48608, 48609, 48613, 15848, 15849, 48625, 48628, 15865, 15873, 48649, 48653, 15888, 15889, 48664, 48665, 48668, 48669, 48683, 48686, 15927, 48698, 48699, 48702, 48703, 15940, 48713, 48717, 15952, 15956, 15957, 48728, 48729, 48732, 48733, 15970, 15974, 15975, 48746, 48747, 48750, 48751, 15986, 15990, 15991, 48763, 48766, 48767, 48769, 48772, 48773, 16008, 16009, 16012, 16013, 48784, 48785, 48788, 48789, 16024, 16025, 16028, 48802, 48803, 16042, 16043, 16047, 48818, 48823, 16058, 16063, 48833, 48836, 16072, 16076, 16077, 48848, 48849, 16088, 16089, 16092, 16093, 48866, 48871, 16107, 16110, 16111, 48883, 16122, 16123, 16126, 16127, 16129, 48904, 48905, 48908, 16144, 16145, 16148, 48920, 48921, 48924, 48925, 16166, 16167, 48938, 48939, 48942, 16178, 48959, 16196, 48968, 48972, 48973, 16212, 16213, 48984, 48985, 48988, 48989, 16226, 16227, 16230, 49002, 49003, 49006, 49007, 16243, 16246, 16247, 49019, 49022, 49023, 49024, 49028, 49029, 16264, 16265, 16268, 49041, 49044, 49045, 16280, 16281, 16284, 16285, 49062, 16299, 16302, 16303, 49074, 49075, 49079, 16314, 16318, 49088, 49089, 49093, 16328, 16329, 16332, 16333, 49105, 49108, 49109, 16344, 16348, 16349, 49127, 16362, 49138, 49143, 16378, 16382, 16383, 49152, 49169, 49173, 49186, 49191, 49233, 49237, 49266, 49271, 49289, 49292, 49304, 49305, 49309, 49322, 49342, 49352, 49357, 49369, 49372, 49373, 49387, 49407, 49424, 49428, 16664, 16665, 16668, 16669, 49442, 49458, 49463, 16698, 16699, 16703, 49473, 49477, 16712, 16713, 16716, 16717, 49492, 16728, 16729, 16732, 16733, 49506, 49511, 16746, 16750, 16751, 49522, 49523, 49527, 16763, 16766, 16767, 16769, 16772, 16773, 49544, 49545, 49549, 16785, 16788, 16789, 49560, 49561, 49564, 16802, 16803, 16806, 49582, 16818, 16819, 16823, 49598, 49599, 16833, 16836, 16837, 49609, 49612, 49613, 16849, 16852, 16853, 49628, 49629, 16866, 16871, 49646, 49647, 16883, 16887, 49659, 49662, 49663, 49687, 16923, 16927, 49696, 49697, 49713, 49716, 49717, 16952, 16953, 16956, 16957, 49731, 49734, 49735, 16970, 16971, 16974, 16975, 49746, 49747, 49750, 49751, 16986, 16987, 16990, 16991, 49764, 17000, 17001, 17004, 17005, 49777, 49780, 49781, 17016, 17017, 17020, 17021, 17027, 17030, 17031, 49802, 49803, 49806, 17043, 17046, 17047, 49818, 49819, 49823, 17057, 17061, 49836, 49837, 17073, 49848, 49852, 49853, 17094, 17095, 49866, 49870, 49871, 17110, 17111, 49883, 49886, 49887, 17124, 17125, 49896, 49897, 17137, 17140, 17141, 49912, 49913, 49916, 49917, 49942, 17178, 17179, 17183, 49953, 49956, 49957, 49968, 49986, 49990, 49991, 17226, 17227, 17230, 17231, 50006, 50017, 50020, 50021, 17256, 17257, 17260, 17261, 50036, 50037, 17272, 17273, 17276, 17277, 17282, 17283, 17287, 50058, 50059, 50062, 17298, 17299, 17303, 50074, 50075, 17313, 50088, 50092, 50093, 17329, 17333, 50108, 50109, 17346, 17351, 50123, 50126, 50127, 17362, 17363, 17367, 50138, 50142, 50143, 17377, 17381, 50152, 50153, 50156, 50157, 17397, 50168, 50169, 50172, 50173, 50180, 50193, 50197, 50211, 50214, 50215, 50226, 50230, 50231, 50240, 50257, 50261, 50274, 50279, 50294, 50312, 50329, 50332, 50333, 50347, 50362, 50366, 50367, 50380, 50381, 50392, 50393, 50396, 50397, 50410, 50411, 50415, 50430, 50452, 17688, 17689, 17692, 17693, 50466, 50467, 50471, 50487, 50497, 50501, 17736, 17737, 17740, 17741, 50512, 50516, 17752, 17753, 17756, 17757, 50530, 50534, 17770, 17771, 17774, 50546, 50551, 17786, 17787, 17791, 17793, 17796, 17797, 50569, 50572, 50573, 17809, 17812, 17813, 50584, 50588, 50589, 17826, 17831, 50603, 50606, 50607, 17843, 17847, 50619, 50622, 50623, 17857, 17860, 17861, 50632, 17873, 17876, 17877, 50649, 17890, 17891, 17894, 50667, 50670, 17906, 17907, 17911, 50683, 50687, 50694, 50706, 50711, 50721, 50724, 50737, 50740, 50741, 50754, 50759, 17994, 17995, 17998, 17999, 50770, 50774, 50775, 18010, 18011, 18014, 50784, 50785, 50789, 18024, 18025, 18028, 18029, 50800, 50801, 50804, 50805, 18040, 18041, 18044, 18045, 18050, 18051, 18055, 50826, 50827, 50830, 50831, 18066, 18071, 50843, 50846, 18081, 18085, 50856, 50857, 50860, 50861, 18101, 50872, 50873, 50877, 18114, 18115, 18119, 50890, 50894, 18130, 18131, 18135, 50906, 50907, 50910, 50911, 18145, 50920, 50921, 50924, 50925, 18161, 18165, 50940, 50941, 50951, 50962, 50963, 50966, 50967, 18202, 18203, 18206, 18207, 50977, 50980, 50981, 50993, 50996, 50997, 51014, 18250, 18251, 18254, 18255, 51030, 51031, 18266, 18270, 51040, 51041, 51044, 51045, 18280, 18281, 18284, 18285, 51061, 18296, 18297, 18300, 18301, 18310, 18311, 51082, 51083, 51086, 51087, 18326, 18327, 51098, 51099, 51102, 51103, 18340, 18341, 51112, 51113, 51117, 18353, 18356, 18357, 51128, 51129, 51132, 51133, 18371, 18374, 18375, 51146, 51147, 51151, 18387, 18390, 18391, 51162, 51163, 51166, 18401, 18405, 51176, 51180, 51181, 18417, 51193, 51196, 51197, 51212, 51213, 18452, 51224, 51225, 51228, 51229, 51243, 51247, 18482, 18483, 18486, 51258, 51259, 51262, 18497, 18501, 51272, 51273, 18516, 51288, 51289, 51292, 51293, 18531, 18534, 18535, 51306, 51307, 51310, 51311, 18546, 51322, 51323, 51326, 51327, 51329, 51332, 51333, 18568, 18569, 18572, 18573, 51345, 51348, 51349, 18585, 18588, 51367, 18602, 18603, 18607, 51382, 18622, 51392, 51397, 18633, 18636, 51408, 51409, 51413, 18648, 18652, 18653, 51426, 51427, 18667, 18670, 18671, 51442, 51443, 18682, 18686, 18687, 51465, 51468, 51469, 18708, 51480, 51481, 51484, 51485, 51498, 51499, 51502, 18738, 18739, 18743, 51514, 51515, 51519, 18753, 18757, 51528, 51529, 51532, 18772, 51544, 51545, 51548, 51549, 18786, 18790, 18791, 51562, 51566, 51567, 18803, 51579, 51582, 51583, 51585, 51588, 51589, 18824, 18829, 51601, 51604, 51605, 18841, 18844, 18845, 51622, 51623, 18858, 18859, 18862, 51638, 51639, 18874, 18875, 18879, 51648, 51649, 51652, 51653, 18889, 18892, 18893, 51664, 51669, 18904, 18905, 18908, 18909, 51682, 51683, 18922, 51698, 51699, 18939, 18962, 18963, 18966, 18967, 51738, 51739, 51743, 51752, 51753, 51756, 51757, 18996, 51768, 51769, 51773, 19010, 19014, 19015, 51786, 51787, 51790, 19026, 19030, 19031, 51803, 51806, 19041, 19044, 19045, 51816, 51817, 51820, 51821, 19057, 19061, 51832, 51833, 51836, 51837, 51846, 19082, 19083, 19086, 19087, 51858, 51862, 51863, 19098, 19099, 19102, 51876, 51877, 19112, 19113, 19117, 51888, 51892, 51893, 19128, 19129, 19132, 51907, 19146, 19147, 19150, 51922, 51923, 51926, 19162, 19163, 19166, 19167, 51936, 51940, 51941, 19176, 19180, 19181, 51952, 51953, 51956, 51957, 19193, 19196, 19197, 19218, 19219, 19222, 19223, 51994, 51995, 51998, 52008, 52009, 52012, 52013, 19252, 52024, 52025, 52028, 19266, 19270, 19271, 52043, 52046, 19283, 19286, 19287, 52058, 52062, 19297, 19300, 19301, 52072, 52076, 52077, 19313, 19317, 52088, 52092, 52093, 52102, 19338, 19339, 52114, 52118, 52119, 19354, 19355, 19358, 19359, 52128, 52132, 52133, 19369, 19372, 52148, 52149, 19384, 19385, 19389, 52162, 52163, 52166, 52167, 19402, 19403, 19406, 19407, 52179, 19418, 19423, 52192, 52193, 52196, 52197, 19433, 19436, 52208, 52212, 19448, 19452, 19453, 52232, 52233, 19476, 52248, 52249, 52252, 52266, 52267, 52270, 52271, 19506, 19510, 19511, 52283, 52286, 52287, 19521, 19525, 52297, 52300, 52301, 19540, 52312, 52316, 52317, 19554, 19555, 19559, 52330, 52331, 52334, 52335, 19574, 52350, 52351, 52352, 52353, 19592, 19593, 19596, 19597, 52368, 52369, 52373, 19608, 19612, 19613, 52387, 19627, 52402, 52403, 19642, 52416, 52420, 52421, 19656, 19660, 19661, 52433, 52436, 52437, 19673, 19676, 52455, 19690, 19691, 19695, 52470, 19706, 19707, 19710, 52488, 52489, 19732, 52504, 52505, 52509, 52522, 52523, 52526, 52527, 19763, 19766, 19767, 52538, 52539, 52542, 52543, 19777, 19781, 52552, 52556, 52557, 19796, 52568, 52569, 52572, 52573, 19810, 19811, 19814, 52586, 52587, 52590, 52591, 19831, 52607, 52608, 52609, 52612, 52613, 19849, 19852, 19853, 52624, 52625, 19864, 19869, 52642, 52643, 19882, 19886, 19887, 52658, 52659, 19899, 19902, 19903, 52673, 52676, 52677, 19912, 19917, 52692, 52693, 19928, 19929, 19932, 19933, 52710, 52711, 19946, 19947, 19950, 52726, 52727, 19967, 52750, 19986, 19990, 19991, 52763, 52766, 52767, 52776, 52781, 20020, 52792, 52793, 52796, 52797, 20034, 20035, 20039, 52810, 52811, 52815, 20050, 20051, 20054, 20055, 52826, 52827, 52830, 52831, 20065, 20068, 20069, 52840, 52841, 52844, 52845, 20081, 20085, 52856, 52860, 52861, 52866, 52867, 52870, 52871, 20107, 20110, 20111, 52882, 52883, 52886, 52887, 20122, 20123, 20126, 20127, 52896, 52897, 20137, 20140, 20141, 52912, 52913, 52916, 20152, 20156, 52935, 20170, 20171, 20174, 20175, 52950, 52951, 20186, 20190, 20191, 52964, 52965, 20200, 20201, 20204, 52977, 52980, 52981, 20217, 20221, 53007, 20243, 20246, 20247, 53018, 53019, 53022, 53023, 53032, 53033, 53036, 53037, 20276, 53048, 53049, 53052, 53053, 20290, 20291, 20295, 53066, 53067, 53070, 20306, 20307, 20310, 20311, 53082, 53083, 53086, 20321, 20324, 20325, 53096, 53100, 53101, 20337, 20341, 53112, 53113, 53116, 53117, 53122, 53123, 53126, 53127, 20362, 20363, 20366, 20367, 53138, 53139, 53143, 20379, 20382, 20383, 53152, 53153, 53156, 53157, 20392, 20396, 20397, 53168, 53169, 20409, 20412, 20413, 53190, 53191, 20426, 20427, 20430, 20431, 53202, 53207, 20442, 20443, 20446, 20447, 53217, 53220, 53221, 20456, 20457, 20461, 53233, 53236, 53237, 20472, 20473, 20476, 53248, 53265, 20504, 20505, 20508, 53282, 20522, 20523, 20526, 20538, 20539, 20543, 20556, 20557, 53333, 20568, 20572, 20573, 20586, 53367, 20603, 20606, 20607, 20609, 20613, 53385, 20625, 53400, 53401, 20642, 20643, 20646, 20658, 20659, 20663, 53435, 20673, 20676, 20677, 53453, 20692, 20693, 53468, 53469, 20706, 20711, 53486, 20723, 20727, 53520, 53524, 53538, 53543, 53554, 53558, 53569, 53573, 53588, 53607, 53618, 53619, 53623, 53640, 53641, 53644, 53645, 53656, 53657, 53660, 53678, 53679, 53694, 53708, 53709, 53720, 53724, 53725, 53739, 53742, 53743, 53754, 53758, 53759, 21002, 21003, 21006, 53782, 53792, 53793, 53797, 21032, 21033, 21037, 53809, 53812, 21048, 21049, 21052, 53830, 53831, 21067, 21070, 21071, 53842, 53843, 53846, 53847, 53857, 53860, 21096, 53876, 53877, 21113, 21116, 21117, 21122, 21123, 21127, 53898, 53899, 53902, 53903, 21138, 21139, 21142, 53914, 53915, 53918, 53919, 21152, 21156, 53928, 53929, 53932, 53933, 21168, 53948, 53949, 21186, 21190, 53963, 53966, 53967, 21203, 21206, 53978, 53982, 53983, 21220, 53992, 53993, 53997, 21232, 21236, 54008, 54009, 54012, 21258, 21259, 21263, 54039, 54052, 21288, 21289, 21292, 54064, 54065, 54069, 21304, 21305, 21309, 54082, 54086, 54087, 21322, 21326, 21327, 54103, 54116, 21353, 21356, 21357, 54129, 54132, 54133, 21368, 21378, 21379, 21382, 54154, 54155, 21394, 21395, 21399, 54170, 54171, 54175, 21408, 54188, 54189, 21424, 21428, 54200, 54201, 54204, 54205, 21443, 21447, 54218, 54222, 54223, 21458, 21463, 54235, 54238, 54239, 21472, 21476, 54248, 54249, 54253, 21492, 54264, 54265, 54268, 54269, 54276, 21512, 21516, 54293, 21529, 21532, 21533, 54310, 54311, 21546, 21550, 21551, 54326, 54327, 21563, 21566, 21567, 54336, 21576, 21577, 21580, 21581, 54353, 21592, 21593, 21597, 54370, 21614, 21626, 21627, 21631, 21632, 21636, 21637, 54409, 54413, 21649, 21652, 21653, 54424, 54425, 54428, 54429, 21666, 21671, 54442, 54446, 54447, 21683, 21687, 54459, 21696, 21697, 21700, 54473, 54477, 21713, 21716, 21717, 54488, 54489, 54492, 21730, 21731, 21734, 54510, 21746, 21747, 21751, 54522, 54523, 54527, 54548, 54562, 54563, 54567, 54578, 54583, 54593, 54597, 54608, 54612, 54626, 54631, 54642, 54664, 54665, 54668, 54669, 54680, 54684, 54685, 54699, 54702, 54703, 54715, 54718, 54719, 54728, 54745, 54762, 54763, 54767, 54778, 54779, 54782, 54791, 22027, 22031, 54806, 54807, 22042, 22046, 22047, 54817, 54820, 54821, 22057, 22060, 22061, 54836, 54837, 22072, 22076, 22077, 54850, 54855, 22090, 22091, 54866, 54870, 22106, 22107, 22110, 22111, 54880, 54881, 54885, 22120, 22121, 22124, 54896, 54897, 54900, 22136, 22137, 22140, 22141, 22146, 22150, 54922, 54923, 54926, 54927, 22162, 22163, 22166, 22167, 54938, 54939, 54943, 22176, 22177, 22180, 22181, 54952, 54953, 54956, 54957, 22193, 22196, 22197, 54968, 54969, 54973, 22210, 22211, 22214, 22215, 54986, 54987, 54990, 22226, 22227, 22230, 22231, 55002, 55003, 55006, 55007, 22240, 22241, 55016, 55017, 55020, 55021, 22257, 22261, 55033, 55036, 55037, 55046, 22282, 22286, 55058, 55059, 55062, 55063, 22298, 22299, 22302, 22303, 55076, 55077, 22312, 22313, 22316, 22317, 55089, 55092, 55093, 22329, 22332, 22333, 22346, 22347, 55122, 55127, 22362, 22363, 22367, 55136, 55137, 55140, 22376, 22377, 22380, 22381, 55157, 22393, 22396, 22397, 22403, 22406, 22407, 55178, 55179, 55182, 55183, 22418, 22422, 22423, 55194, 55195, 55198, 55199, 22433, 22436, 22437, 55208, 55209, 22448, 22452, 22453, 55224, 55225, 22466, 22467, 22470, 22471, 55242, 55243, 55246, 55247, 22482, 22483, 22487, 55258, 55259, 55262, 55263, 22497, 22501, 55272, 55273, 55276, 55277, 22512, 22513, 22517, 55288, 55289, 55292, 55293, 22532, 55308, 55309, 22545, 22549, 55320, 55321, 55324, 55325, 22562, 22563, 22566, 55338, 55339, 55342, 55343, 22578, 22579, 22583, 55354, 55355, 55358, 55359, 22592, 55368, 55369, 55372, 55373, 22609, 22613, 55384, 55385, 55388, 55389, 22626, 55402, 55406, 55407, 22643, 55419, 55422, 55423, 55425, 55428, 55429, 22664, 22665, 22668, 55441, 55444, 55445, 22680, 22685, 55462, 55463, 22698, 22699, 22702, 55478, 55479, 22714, 22719, 55488, 55489, 55493, 22728, 22732, 22733, 55504, 55508, 55509, 22745, 22748, 55522, 55523, 22762, 22767, 55539, 22779, 22782, 22783, 55564, 55565, 22801, 55576, 55577, 55580, 55581, 22818, 22819, 22823, 55595, 55598, 55599, 22834, 22835, 22838, 55610, 55611, 55614, 55615, 55624, 55625, 55628, 22869, 55640, 55641, 55644, 55645, 22883, 55658, 55659, 55662, 55663, 22898, 55674, 55675, 55678, 55679, 55681, 55684, 55685, 22920, 22921, 22925, 55696, 55697, 55700, 55701, 22936, 22940, 55719, 22955, 22959, 55734, 55735, 22970, 22971, 22974, 55744, 55749, 22985, 22989, 55760, 55761, 55765, 23000, 23004, 55779, 23019, 23022, 23023, 55794, 55795, 23034, 23038, 23042, 23043, 23047, 55819, 55834, 55835, 55838, 23072, 55848, 55849, 55853, 23088, 23092, 55864, 55865, 55868, 23106, 23110, 23111, 55882, 55883, 55886, 55887, 55898, 55902, 23136, 23140, 55913, 55916, 55917, 23156, 55928, 55929, 55932, 55942, 55943, 23178, 23179, 23194, 23195, 55972, 55973, 23208, 23209, 23212, 55988, 55989, 23224, 23225, 23229, 56002, 56003, 56006, 23243, 23246, 56018, 56022, 56023, 23258, 23262, 56032, 56033, 56048, 56052, 23292, 23293, 23298, 23299, 23302, 56074, 56090, 56091, 56095, 23328, 23332, 56104, 56105, 56108, 23344, 56120, 56121, 56125, 23363, 23366, 23367, 56138, 56139, 56142, 56143, 56155, 56158, 23396, 56168, 56169, 56172, 56173, 23408, 23412, 56185, 56189, 56194, 56199, 23434, 23435, 56215, 23450, 23451, 56228, 56229, 23464, 23465, 23469, 56244, 56245, 23480, 23481, 23484, 56258, 56263, 23498, 23503, 56274, 56275, 56278, 56279, 23515, 23519, 56288, 56292, 56293, 23532, 23533, 56304, 56305, 23556, 56328, 56329, 56332, 23573, 56344, 56345, 56349, 23586, 23590, 23591, 56362, 56363, 56366, 56367, 23603, 23606, 23607, 56378, 56379, 56382, 56383, 23616, 56392, 56393, 56396, 56397, 23633, 56409, 56412, 56413, 23650, 23651, 56426, 56427, 56430, 56431, 23666, 23667, 23671, 56442, 56443, 56446, 56447, 56448, 56449, 56453, 23693, 56464, 56465, 56468, 56469, 23708, 56482, 56483, 23723, 23726, 23727, 56498, 56499, 23738, 23742, 23743, 56513, 56516, 56517, 23753, 56532, 56533, 23768, 56550, 56551, 23786, 23787, 23790, 23791, 56566, 56567, 23802, 23803, 23806, 23807, 56584, 56585, 23829, 56600, 56601, 56604, 23842, 23843, 23846, 23847, 56619, 56622, 56623, 23858, 23862, 23863, 56634, 56635, 56638, 56639, 56652, 56653, 23889, 56664, 56668, 56669, 23906, 23907, 56682, 56683, 56686, 56687, 23922, 23923, 23927, 56702, 56703, 56704, 56705, 23949, 56720, 56721, 56725, 23964, 56738, 56739, 23979, 23982, 23983, 56754, 56755, 23994, 23998, 23999, 56772, 56773, 24009, 24012, 24013, 56785, 56788, 56789, 24024, 24028, 56807, 24042, 24043, 24047, 56822, 56823, 24058, 24059, 24062, 24066, 24071, 24082, 24086, 56858, 56859, 56862, 56863, 24100, 56873, 56876, 56877, 24112, 24116, 24117, 56888, 56892, 56893, 24130, 24131, 24134, 24135, 56906, 56907, 56910, 56911, 24146, 24147, 56922, 56923, 56926, 56927, 24160, 24161, 24164, 56936, 56937, 56941, 24177, 24180, 24181, 56952, 56953, 56956, 56957, 56962, 56963, 56966, 56967, 24202, 24203, 24206, 24207, 56979, 56983, 24218, 24219, 24222, 24223, 56992, 56993, 56996, 24232, 24236, 24237, 57008, 57009, 57012, 24248, 24249, 24252, 24253, 57030, 57031, 24266, 24267, 24270, 57046, 57047, 24282, 24283, 24286, 24287, 57060, 57061, 24296, 24297, 24300, 24301, 57072, 57073, 57076, 57077, 24312, 24313, 24316, 24317, 24323, 24326, 24342, 24343, 57114, 57115, 57118, 57119, 24352, 24353, 24356, 24357, 57128, 57132, 57133, 24372, 24373, 57145, 57148, 57149, 24386, 24387, 24390, 24391, 57162, 57163, 57166, 57167, 24403, 24407, 57178, 57179, 57182, 57183, 24417, 24420, 57192, 57193, 57196, 57197, 24432, 24436, 57208, 57209, 57213, 57218, 57219, 24458, 24459, 24462, 24463, 57234, 57235, 57238, 57239, 24475, 24478, 24479, 57248, 57249, 57252, 57253, 24488, 24489, 24492, 24493, 57264, 57265, 57268, 24504, 24505, 24508, 24509, 57282, 57286, 57287, 24522, 24523, 24526, 24527, 57298, 24538, 24539, 24542, 24543, 57312, 57316, 57317, 24552, 24553, 24556, 24557, 57332, 57333, 24568, 24569, 24573, 57362, 57367, 24603, 24607, 57377, 57381, 24633, 24636, 24650, 24651, 24654, 24655, 57426, 57431, 24666, 24670, 24680, 24681, 24684, 24685, 57457, 57461, 24697, 24700, 24710, 57482, 57483, 57486, 24723, 24726, 24727, 57498, 57503, 24740, 24741, 57512, 57513, 57517, 24753, 24756, 57528, 57532, 24771, 24774, 24775, 57547, 57550, 57551, 24790, 57562, 57567, 24804, 24805, 57576, 57580, 24817, 24820, 57593, 57596, 57597, 57602, 57607, 57618, 57619, 24859, 24863, 57632, 24888, 24889, 24892, 24893, 57666, 57670, 57671, 24906, 24907, 24910, 24911, 57682, 57683, 57686, 57687, 24922, 24923, 24926, 24927, 57697, 57701, 24936, 24937, 24940, 24941, 57713, 57716, 57717, 24952, 24953, 24956, 24957, 24962, 24963, 24966, 24967, 57739, 57743, 24978, 24979, 24983, 57754, 57755, 57759, 24993, 24997, 57768, 57769, 57772, 57773, 25008, 25009, 25013, 57784, 57785, 25026, 25030, 25031, 57802, 57806, 57807, 25043, 25046, 25047, 57818, 57819, 57822, 57823, 25057, 25060, 25061, 57833, 57836, 57837, 25072, 25076, 25077, 57848, 57852, 57853, 57857, 57861, 57872, 25113, 25117, 25146, 25147, 25151, 57924, 57925, 25160, 25161, 25164, 25165, 57940, 25176, 25177, 25180, 25181, 57958, 57959, 25194, 25198, 25199, 57974, 57975, 25211, 25214, 25215, 25220, 57992, 57993, 57996, 57997, 25236, 25237, 58008, 58009, 58013, 25254, 58026, 58027, 58030, 58042, 58043, 58046, 25284, 25285, 58056, 58060, 58061, 25297, 25300, 25301, 58072, 58073, 58076, 58077, 58090, 58106, 25368, 25369, 25372, 25402, 25407, 58177, 58180, 58181, 25417, 25420, 25421, 25432, 25433, 25437, 58210, 58214, 58215, 25450, 25451, 25454, 25455, 58226, 58230, 58231, 25467, 25470, 25471, 25472, 25477, 58253, 25489, 58269, 25507, 58282, 58283, 58287, 25522, 25523, 25527, 58299, 58303, 25537, 25540, 25541, 58312, 58313, 58316, 25552, 25556, 25557, 58328, 58332, 58333, 25570, 25575, 58347, 58351, 25587, 25591, 58363, 58367, 58386, 58390, 58391, 25630, 25631, 58404, 58405, 58417, 58420, 58421, 25657, 25660, 25661, 58434, 58435, 25674, 25675, 25678, 25679, 58450, 58451, 58455, 25690, 25691, 58464, 58465, 58469, 25704, 25705, 25709, 58480, 58481, 25720, 25721, 25730, 25731, 25735, 58510, 58511, 25746, 25747, 25751, 58522, 58523, 58526, 58527, 25761, 25765, 58537, 58540, 58541, 25781, 58552, 58556, 58557, 25794, 25795, 58570, 58571, 58574, 58575, 25810, 25811, 25815, 58586, 58587, 58590, 25825, 58600, 58601, 58604, 25841, 25845, 58616, 58617, 58621, 58626, 58631, 58642, 58643, 58646, 58647, 25882, 25883, 25886, 25887, 58660, 25912, 25913, 25917, 58690, 58691, 58695, 25930, 25931, 25934, 25935, 58706, 58707, 25946, 25950, 58721, 58725, 25960, 25961, 25964, 25965, 58736, 58737, 58741, 25976, 25977, 25980, 25981, 25986, 25987, 25990, 25991, 58763, 58767, 26002, 26006, 26007, 58779, 58782, 58783, 26016, 26017, 26020, 26021, 58792, 58796, 58797, 26033, 26036, 26037, 58808, 58809, 58812, 58813, 26050, 26051, 26054, 26055, 58826, 58827, 58830, 58831, 26066, 26067, 26070, 58842, 58843, 58846, 26080, 26081, 26097, 26101, 58897, 58901, 26136, 26137, 26141, 58918, 58919, 58930, 58934, 58935, 26170, 26171, 26174, 26175, 58944, 58945, 58949, 26184, 26185, 26188, 26189, 58961, 58965, 26200, 26201, 26204, 26205, 58978, 58983, 26218, 26219, 26222, 58994, 58995, 58999, 26234, 26235, 26238, 26239, 26241, 26245, 59020, 26256, 26257, 26261, 59036, 26274, 26279, 59050, 59054, 26291, 59066, 59070, 59071, 26304, 26305, 26309, 59080, 59081, 59085, 26321, 26325, 59096, 59097, 59100, 26338, 26339, 59114, 59115, 59118, 26354, 26359, 59130, 59131, 59134, 59137, 59141, 59153, 59156, 59157, 26392, 26393, 26396, 26397, 59174, 59175, 59186, 59190, 59191, 26427, 26430, 26431, 59200, 59201, 26440, 26441, 26444, 26445, 59216, 59217, 59221, 26457, 26461, 59234, 59235, 59239, 26474, 26475, 26478, 26479, 26490, 26491, 26495, 26500, 26501, 59273, 59276, 59277, 26513, 26516, 26517, 59288, 59292, 59293, 26530, 26535, 59307, 59310, 59311, 26547, 26551, 59323, 59326, 59327, 26561, 26564, 59336, 59337, 59340, 26577, 26580, 26581, 59352, 59353, 59357, 26595, 59370, 59371, 59375, 26610, 26611, 26615, 59386, 59387, 59391, 59402, 59403, 59407, 26642, 26643, 26646, 26647, 59418, 59419, 59422, 59432, 59433, 59436, 26672, 26673, 26676, 26677, 59448, 59452, 59453, 26690, 26691, 26694, 26695, 59466, 59467, 59470, 59471, 26706, 26707, 26710, 26711, 59482, 59483, 59486, 59487, 26721, 26724, 26725, 59497, 59500, 59501, 26740, 26741, 59512, 59516, 59517, 59526, 59527, 26762, 26763, 26766, 26767, 59542, 59543, 26778, 26779, 26782, 59556, 59557, 26793, 26796, 26797, 59569, 59572, 59573, 26808, 26809, 26812, 26813, 59587, 26826, 26827, 26830, 26831, 59602, 59603, 59606, 59607, 26842, 26843, 26846, 26847, 59616, 59620, 59621, 26856, 26857, 26860, 26861, 59632, 59633, 26872, 26873, 26876, 59659, 59662, 26899, 26903, 59674, 59675, 59678, 59679, 59688, 59689, 59692, 59693, 26929, 59704, 59705, 59708, 26946, 26947, 26950, 26951, 59722, 59726, 59727, 26962, 26966, 59738, 59742, 59743, 26976, 26980, 26981, 59752, 59756, 59757, 26996, 26997, 59769, 59772, 59773, 59783, 27018, 27019, 27022, 27023, 59798, 59799, 27034, 27035, 27038, 27039, 59812, 59813, 27052, 27053, 59828, 59829, 27064, 27065, 27068, 27069, 59842, 59843, 59846, 59847, 27082, 27083, 27086, 27087, 27098, 27099, 27102, 27103, 59872, 59873, 27112, 27113, 27116, 27117, 59888, 59892, 27128, 27129, 59912, 59916, 27156, 59928, 59929, 59933, 59950, 27187, 59963, 59967, 27201, 27204, 27205, 59976, 59980, 59981, 27216, 27220, 27234, 27239, 60010, 60014, 60015, 27250, 27254, 60027, 60030, 60031, 60036, 60037, 27272, 27273, 27277, 60052, 60053, 27292, 27293, 60067, 60070, 27306, 27307, 27310, 60082, 60083, 60087, 27322, 27323, 27326, 60096, 60100, 60101, 27336, 27337, 27340, 27341, 60112, 60113, 27353, 27356, 27357, 60130, 27370, 27374, 27375, 60146, 60147, 27386, 27391, 60168, 60169, 60173, 27408, 27412, 60184, 60185, 60188, 60206, 27442, 27443, 27446, 60219, 60223, 27457, 27460, 27461, 60233, 60236, 60237, 27476, 27491, 27495, 60266, 60270, 60271, 27506, 27507, 27510, 60283, 60286, 60287, 60292, 60293, 27528, 27529, 27533, 60308, 60309, 27544, 27545, 27549, 60322, 60323, 27567, 60338, 60343, 27578, 27579, 27583, 60352, 60353, 27592, 27593, 27596, 27597, 60368, 60372, 27609, 27612, 27613, 60386, 60387, 27626, 27627, 27630, 27631, 60403, 27643, 27646, 27647, 60426, 60430, 60431, 27666, 27670, 27671, 60443, 60447, 60456, 60457, 60460, 60461, 27700, 60473, 27714, 27715, 27718, 27719, 60490, 60491, 27730, 27731, 27734, 27735, 60507, 60511, 27744, 27745, 27748, 60520, 27761, 27764, 27765, 60536, 60537, 60541, 60546, 27786, 27787, 27790, 27791, 60562, 60563, 60566, 60567, 27803, 27806, 27807, 60576, 60577, 27816, 27817, 27820, 27821, 60592, 60593, 60596, 27832, 27833, 27836, 60614, 60615, 27850, 27851, 27854, 60631, 27866, 27867, 60644, 60645, 27881, 27884, 27885, 60660, 60661, 27897, 27900, 27901, 60683, 60686, 27923, 27927, 60699, 60702, 60703, 60713, 60716, 60717, 27952, 27956, 60729, 27970, 27971, 27974, 27975, 60746, 60747, 60750, 60751, 27986, 27990, 60762, 60763, 60767, 28001, 28004, 60776, 28017, 28020, 60792, 60793, 60796, 60802, 60803, 60806, 60807, 28042, 28058, 28059, 60832, 60833, 60836, 28072, 28073, 28076, 28077, 60848, 60849, 28088, 28089, 28092, 60870, 60871, 28107, 28110, 28111, 60886, 60887, 28122, 28123, 28126, 28127, 60900, 60901, 28136, 28140, 28141, 60916, 60917, 28156, 28157, 60937, 60940, 60941, 28180, 28181, 60952, 60953, 60956, 60957, 60970, 60974, 60975, 28210, 28214, 28215, 60987, 60990, 60991, 28225, 28228, 28229, 61000, 61001, 61005, 28240, 28241, 28244, 61016, 61017, 61020, 28258, 28259, 28263, 61034, 61038, 28274, 28275, 61050, 61051, 61055, 61056, 61057, 28296, 28297, 28300, 28301, 61072, 61073, 61076, 28313, 28316, 28317, 61090, 28330, 28334, 61106, 61107, 61111, 28346, 28347, 28350, 28351, 61124, 61125, 28360, 28361, 28365, 61140, 61141, 28376, 28377, 28380, 28381, 61155, 61158, 28394, 28395, 61170, 61171, 28410, 28411, 28414, 28415, 61192, 61196, 28432, 28436, 28437, 61212, 61213, 61226, 61230, 61231, 28466, 28467, 28470, 61243, 61247, 28481, 28484, 28485, 61256, 61257, 61260, 28497, 28500, 61272, 61273, 61276, 61277, 28514, 28515, 28519, 61290, 61291, 61294, 28530, 28531, 28534, 61306, 61307, 61311, 61312, 61313, 61316, 28552, 28553, 28556, 28557, 61328, 61329, 28568, 28569, 28573, 61346, 61347, 61351, 28587, 28590, 28591, 61363, 28603, 28606, 28607, 61377, 61380, 61381, 28616, 28617, 28620, 28621, 61396, 61397, 28632, 28633, 28637, 61410, 61411, 61415, 28650, 28651, 28654, 28655, 61426, 61431, 28666, 28671, 61458, 61459, 61462, 28698, 28699, 28702, 61473, 28712, 28713, 28716, 61489, 61493, 61510, 61511, 61523, 61526, 61527, 28763, 28766, 28767, 61537, 61540, 61541, 61556, 61557, 28792, 28796, 28797, 28802, 28807, 61578, 61582, 61583, 28818, 61595, 61598, 28833, 61608, 61612, 61613, 28849, 28853, 61625, 61629, 28866, 28871, 61642, 61647, 28887, 61658, 61659, 61662, 28897, 28901, 61672, 61673, 61677, 28917, 61688, 61692, 61698, 61699, 61702, 61718, 61719, 28955, 28959, 61728, 61732, 61748, 28984, 28985, 28988, 28989, 61766, 61767, 29002, 29003, 29006, 29007, 61782, 61783, 29018, 29019, 29022, 29023, 61797, 29032, 29033, 29036, 29037, 61809, 61812, 61813, 29048, 29049, 29052, 29053, 29058, 29059, 29062, 61834, 61835, 61838, 61839, 29074, 29075, 29078, 29079, 61850, 61851, 61854, 61855, 29088, 29089, 61864, 61865, 61868, 61869, 29105, 29109, 61880, 61881, 61884, 29122, 29126, 29127, 61898, 61899, 61902, 61903, 29138, 29139, 29142, 29143, 61914, 61918, 61919, 29152, 29153, 29156, 29157, 61928, 61932, 61933, 29169, 29172, 29173, 61945, 61948, 61949, 61953, 61968, 61972, 29208, 29212, 62006, 62007, 29242, 29243, 29247, 62017, 62020, 62021, 29257, 29260, 29261, 62036, 29272, 29273, 29276, 29277, 62054, 62055, 29290, 29294, 29295, 62070, 62071, 29307, 29310, 29311, 29313, 29316, 29317, 62088, 62089, 62093, 29329, 29332, 62104, 62105, 62108, 62109, 62122, 62123, 62127, 29367, 62138, 62139, 62143, 29377, 29380, 62152, 62156, 62157, 29396, 62168, 62172, 62173, 62187, 29427, 62203, 62209, 62213, 62228, 29464, 29465, 29469, 62246, 62247, 62258, 62259, 29498, 29503, 62276, 62277, 29512, 29516, 29517, 29528, 29529, 29532, 62306, 62307, 62310, 62311, 29546, 29547, 29550, 29551, 62326, 62327, 29563, 29566, 29567, 29569, 62344, 62345, 62349, 29584, 29585, 29589, 62360, 62361, 62365, 29602, 29603, 62379, 62382, 62383, 29618, 29623, 62395, 62398, 29632, 29637, 62408, 29649, 62424, 62425, 29666, 29671, 62442, 62446, 62447, 29683, 62458, 62462, 62463, 62470, 62471, 29706, 29707, 29710, 29711, 62486, 62487, 29722, 29726, 29727, 62497, 62500, 62501, 29736, 29737, 29740, 29741, 62516, 62517, 29752, 29753, 29756, 29757, 62530, 62531, 62546, 62547, 29786, 29787, 29791, 62560, 62561, 62576, 62577, 62581, 29816, 29817, 29821, 29830, 29831, 62602, 62603, 62606, 62607, 29846, 29847, 62622, 62623, 29860, 29861, 62632, 62636, 62637, 29873, 29876, 29877, 62649, 62653, 29891, 29894, 29895, 62666, 62667, 62670, 29907, 29910, 29911, 62682, 62683, 62686, 62687, 29921, 29925, 62696, 62701, 29937, 62712, 62713, 62716, 62723, 62726, 62727, 62742, 62743, 29978, 29979, 29982, 29983, 62756, 30008, 30009, 30012, 62786, 62787, 30026, 30027, 30030, 30031, 62806, 62807, 30042, 30046, 62817, 62820, 62821, 30056, 30057, 30060, 30061, 62832, 62833, 62836, 30072, 30073, 30076, 30077, 30083, 30086, 30087, 62859, 62862, 62863, 30098, 30102, 30103, 62875, 62878, 62879, 30113, 30116, 30117, 62888, 62889, 62892, 62893, 30128, 30132, 30133, 62904, 62905, 62908, 62909, 30146, 30147, 30151, 62922, 62923, 62926, 62927, 30162, 30163, 30166, 30167, 62938, 62939, 62942, 62943, 30177, 30181, 62952, 62953, 30192, 30193, 30197, 62968, 62969, 62977, 62980, 62981, 30216, 30220, 62997, 30232, 30233, 30236, 30237, 63014, 63015, 30250, 30254, 30255, 63026, 63027, 63030, 63031, 30266, 30267, 30270, 30271, 63040, 63041, 30280, 30281, 30284, 63057, 63060, 63061, 30296, 30297, 30301, 63074, 63075, 30314, 30315, 30318, 63090, 63091, 63094, 63095, 30330, 30331, 30335, 30336, 30340, 30341, 63112, 63116, 30353, 30356, 30357, 63128, 63132, 30370, 30375, 63147, 63150, 63151, 30387, 30391, 63162, 63163, 63166, 63167, 30401, 30404, 63176, 63177, 63180, 63181, 30416, 30417, 30420, 30421, 63192, 63193, 63197, 30435, 63210, 63211, 63214, 63215, 30450, 30451, 30455, 63226, 63231, 63236, 63237, 30472, 30476, 63249, 63252, 63253, 30488, 30489, 30492, 30493, 63270, 63271, 30506, 30510, 30511, 63286, 63287, 30523, 30526, 30527, 63296, 63297, 63301, 30536, 30537, 30541, 63312, 63313, 63316, 30552, 30553, 30556, 30557, 63330, 63331, 63334, 63335, 30570, 30571, 30574, 30586, 30587, 30591, 30593, 30596, 30597, 63368, 63372, 63373, 30609, 30612, 30613, 63384, 63388, 63389, 63402, 63406, 63407, 63418, 63419, 63422, 63423, 30660, 30661, 63432, 63433, 63436, 63437, 30676, 30677, 63448, 63449, 63452, 63453, 30694, 63466, 63467, 63470, 63482, 63483, 63486, 30726, 30727, 63499, 63502, 63503, 30738, 30742, 63514, 63515, 63519, 30753, 30756, 30757, 63528, 63529, 63533, 30772, 63548, 63549, 30786, 63562, 63563, 63566, 63567, 30803, 30807, 63578, 63579, 63582, 63583, 30816, 30820, 30821, 63592, 63596, 63597, 30833, 30837, 63608, 63609, 63612, 63613, 63618, 63622, 63623, 30858, 30859, 30862, 30863, 63634, 63635, 63638, 63639, 30874, 30875, 30878, 30879, 63652, 63653, 30888, 30889, 30892, 30893, 63665, 63668, 63669, 30904, 30908, 30909, 63682, 63683, 30923, 30926, 30927, 63698, 63699, 63702, 30938, 30939, 30942, 30943, 63712, 63713, 63716, 63717, 30952, 30953, 30956, 63728, 63732, 30968, 30969, 30972, 30973, 63754, 63759, 30994, 30995, 30998, 30999, 63770, 63771, 63774, 63775, 31009, 31012, 63784, 63785, 63789, 31024, 31028, 63805, 31043, 63819, 63822, 63823, 31058, 31062, 31063, 63834, 63835, 63838, 63839, 31076, 31077, 63848, 63849, 63852, 63853, 31089, 31093, 63864, 63865, 63868, 63869, 63874, 63875, 31114, 31115, 31119, 63891, 63895, 31130, 31131, 31134, 31135, 63905, 63908, 63909, 31144, 31148, 31149, 63921, 63924, 63925, 31160, 31164, 31165, 63938, 63942, 63943, 31178, 31179, 31182, 31183, 63954, 63955, 31194, 31195, 31198, 31199, 63968, 63972, 63973, 31208, 31209, 31212, 31213, 63984, 63985, 63988, 63989, 31224, 31225, 31228, 31236, 64009, 64013, 31248, 31252, 64024, 64025, 64028, 64046, 31282, 31283, 31286, 31287, 64058, 64059, 64063, 31297, 31301, 64073, 64076, 64077, 31316, 64092, 64093, 31330, 31334, 64106, 64111, 31351, 64123, 64126, 64127, 64132, 64133, 31368, 31369, 31372, 31373, 64148, 64149, 31384, 31385, 31388, 31389, 64167, 31402, 31403, 31407, 64178, 64183, 31423, 64192, 64193, 64196, 64197, 31432, 31433, 31436, 31437, 64208, 64212, 31448, 31449, 31452, 64226, 64227, 31467, 31470, 31471, 31483, 31486, 31487, 31492, 64264, 64268, 64269, 31508, 64280, 64281, 64285, 31526, 31527, 64302, 31538, 64314, 64315, 64319, 31553, 31557, 64328, 64333, 31568, 31572, 64348, 64349, 31586, 31587, 31590, 64362, 64363, 64366, 64367, 31607, 64379, 64382, 64383, 64388, 64389, 31628, 31629, 64404, 64405, 31641, 31644, 64422, 31658, 31659, 31662, 31663, 64434, 31675, 31678, 64448, 64452, 64453, 31688, 31692, 64464, 64465, 64468, 64469, 31705, 31708, 31709, 31722, 31726, 31727, 64498, 64499, 31738, 31742, 31743, 31750, 31751, 64523, 64526, 31762, 31766, 64538, 64539, 64542, 64543, 31780, 31781, 64552, 64553, 64556, 64557, 31792, 31796, 64568, 64572, 64573, 31815, 64586, 64587, 31827, 31831, 64602, 64603, 64606, 31841, 64617, 64621, 31857, 64632, 64633, 64637, 64642, 64643, 31883, 31886, 31887, 64658, 64662, 64663, 31898, 31902, 31903, 64672, 64673, 64676, 64677, 31912, 31913, 31917, 64688, 64689, 64692, 31928, 31929, 64707, 64711, 31946, 31947, 31951, 64722, 64723, 64726, 64727, 31962, 31963, 31966, 31967, 64740, 64741, 31976, 31980, 31981, 64756, 64757, 31993, 31996, 31997, 64778, 64779, 64783, 32018, 32019, 32022, 32023, 64794, 64795, 64798, 64799, 32036, 32037, 64808, 64812, 64813, 32052, 64824, 64828, 64829, 32070, 64842, 64843, 64846, 64847, 32082, 32083, 32086, 32087, 64858, 64859, 64862, 32096, 32097, 32100, 32101, 64873, 64877, 32113, 64888, 64889, 64893, 64898, 64899, 64902, 32138, 32139, 32142, 32143, 64914, 64915, 32154, 32158, 32159, 64928, 64929, 64932, 64933, 32168, 32169, 64944, 64945, 64948, 32184, 32185, 32188, 32189, 64962, 64963, 32202, 32203, 32206, 64978, 64982, 64983, 32218, 32219, 32222, 32223, 64996, 64997, 32232, 32236, 32237, 65012, 65013, 32252, 32253, 32260, 65032, 65036, 32272, 32276, 65049, 65052, 65053, 32294, 32295, 65066, 65070, 65071, 32306, 32310, 32311, 65083, 65086, 32321, 32325, 65096, 65100, 32337, 32340, 32341, 65112, 65113, 65116, 65117, 32354, 32355, 65130, 65131, 65134, 65135, 32371, 32375, 65146, 65147, 65150, 65151, 65152, 65153, 65156, 32392, 32393, 32396, 65168, 65169, 65172, 32408, 32409, 32412, 32413, 65186, 65187, 65191, 32427, 32430, 32431, 65203, 32442, 32443, 32446, 32447, 65217, 65220, 65221, 32460, 65233, 65236, 65237, 32472, 32473, 32476, 65250, 32490, 32491, 32495, 65266, 65271, 32506, 32507, 32511, 32516, 65288, 65289, 65293, 32529, 32532, 32533, 65304, 65305, 65308, 65309, 32550, 32551, 65322, 65326, 65327, 32563, 32566, 32567, 65338, 65339, 65342, 32577, 32581, 65352, 65353, 65357, 32592, 32596, 65368, 65369, 65372, 65373, 32610, 32611, 32614, 65386, 65387, 65390, 32627, 32631, 65402, 65403, 65407, 65408, 65409, 65412, 65413, 32648, 32652, 32653, 65424, 65425, 65428, 65429, 32664, 32665, 32668, 32669, 65447, 32682, 32686, 32687, 65458, 65459, 65463, 32698, 32702, 32703, 65473, 65476, 65477, 32712, 32713, 32716, 32717, 65492, 65493, 32728, 32729, 32732, 65510, 32746, 32747, 32750, 65527, 32762, 32763, 32766], 302: [32768, 32785, 32802, 32853, 32887, 32905, 32920, 32921, 32955, 32973, 32988, 32989, 33006, 33040, 280, 281, 299, 33074, 314, 33127, 33139, 33160, 33161, 33176, 33177, 419, 422, 33195, 434, 33210, 452, 33228, 468, 487, 33258, 33274, 33275, 538, 539, 33312, 552, 553, 33329, 33347, 33351, 33362, 33363, 33397, 642, 659, 33435, 33452, 689, 33465, 33469, 741, 33512, 33513, 33528, 33529, 798, 33569, 33573, 808, 809, 33584, 33606, 863, 33633, 33637, 888, 889, 903, 918, 33690, 33691, 33705, 33709, 33720, 33724, 966, 33742, 983, 33759, 33768, 33769, 33772, 33784, 33785, 33813, 33827, 33830, 33847, 33873, 33890, 33910, 33945, 33949, 33966, 34009, 34043, 34046, 34083, 34087, 1327, 1342, 34128, 1368, 1369, 34162, 1407, 1412, 34188, 1428, 1447, 34223, 34248, 1507, 1510, 1522, 34298, 1566, 1576, 1577, 34357, 1631, 34400, 34417, 1656, 1657, 1671, 34446, 1686, 34463, 34472, 1734, 1751, 34540, 34556, 34557, 34579, 34597, 1852, 1853, 34630, 1882, 1883, 34657, 34677, 34703, 34718, 1957, 34744, 1987, 2002, 34797, 2033, 34812, 34813, 34828, 34829, 2082, 2087, 34875, 34888, 34889, 34926, 34944, 34948, 34961, 34964, 34983, 34998, 2238, 35008, 35024, 35043, 2286, 35058, 35059, 2302, 35084, 35085, 2339, 35115, 2359, 35130, 35183, 35201, 35238, 35239, 2475, 2478, 35254, 35255, 2495, 35264, 35280, 35298, 35299, 35314, 35315, 2555, 2579, 2593, 2609, 35422, 35423, 35436, 2699, 35478, 35479, 2714, 2715, 35493, 2728, 2732, 35505, 35508, 35509, 2745, 2749, 35522, 35523, 35527, 2766, 35538, 35539, 35552, 35553, 2793, 2797, 35568, 35569, 2808, 2812, 2834, 35610, 2849, 2865, 35678, 35679, 35705, 35708, 2954, 2955, 35730, 35735, 2971, 35745, 35748, 2985, 35765, 3000, 35778, 35779, 35782, 35795, 3038, 35808, 35809, 3048, 35824, 35825, 3069, 35848, 35849, 35864, 3122, 35932, 3187, 35968, 35984, 35985, 36002, 36003, 3243, 36018, 36019, 36036, 36052, 36053, 36071, 3311, 36086, 3323, 3326, 36104, 36105, 36121, 36138, 36189, 3442, 36224, 36225, 36240, 36258, 36259, 3502, 36274, 36275, 3518, 36326, 36327, 3566, 36342, 36343, 36383, 3621, 36396, 3637, 36413, 3667, 36456, 36473, 36476, 36477, 36483, 36498, 36499, 3743, 36512, 3756, 36528, 3769, 3773, 3786, 3787, 36566, 3802, 36581, 3817, 36592, 36597, 3832, 3836, 36638, 3877, 3893, 36668, 3922, 36713, 36728, 36739, 36742, 36743, 3983, 36755, 36768, 36769, 4009, 36784, 4024, 4028, 4042, 36822, 36823, 4058, 4059, 36832, 4072, 36852, 36853, 4089, 4093, 36864, 4120, 4139, 4154, 4172, 4173, 4188, 4202, 4222, 4225, 37001, 37016, 4259, 4262, 4274, 4292, 4293, 37069, 4308, 37084, 4327, 37136, 37154, 37235, 37239, 37256, 37257, 37272, 37273, 37290, 37307, 37341, 37354, 37355, 37370, 4619, 37408, 37409, 4649, 4664, 4686, 37458, 37459, 37473, 4713, 4733, 4739, 4754, 4758, 37545, 37548, 4784, 37560, 37564, 37565, 37582, 37583, 4823, 37599, 4836, 37608, 37609, 37624, 37625, 4874, 4904, 37680, 37681, 37685, 4921, 4943, 4973, 37749, 4985, 4994, 37771, 5011, 5015, 5024, 37817, 37820, 37821, 37838, 37839, 5078, 37864, 37865, 5108, 37880, 37881, 37884, 5149, 37927, 5167, 37942, 5182, 5209, 5230, 5242, 38029, 5269, 38040, 38044, 5287, 38075, 38078, 38089, 5329, 38104, 38108, 5347, 5350, 38123, 5362, 38179, 38199, 38224, 38242, 38301, 38318, 38330, 38335, 38344, 38361, 38378, 5663, 38433, 5677, 5692, 5706, 5707, 38496, 5736, 5766, 38542, 38559, 5796, 38568, 38569, 5812, 5827, 5842, 38637, 5873, 38653, 38675, 5949, 5962, 5963, 5978, 38773, 6013, 38814, 6052, 6053, 38825, 6068, 38840, 38858, 38862, 38863, 6099, 6103, 38878, 38893, 38909, 38924, 38925, 6161, 6179, 38955, 6194, 38970, 38984, 6229, 39023, 39038, 39041, 39078, 39079, 39094, 39095, 39104, 39120, 39138, 39139, 39154, 39155, 39180, 39181, 6434, 6451, 39227, 39278, 39290, 39291, 39300, 6537, 6540, 39313, 39316, 6552, 39335, 39350, 39351, 39360, 6600, 6605, 39376, 6620, 39394, 39395, 39410, 39411, 6659, 6674, 6675, 39450, 6689, 6693, 6704, 6705, 39503, 6738, 6742, 39518, 39519, 6757, 39529, 39558, 39559, 6810, 6825, 39600, 39619, 6862, 39635, 39639, 6879, 39648, 39649, 6892, 39664, 39665, 6909, 6914, 6931, 6935, 6944, 6961, 39758, 39759, 6998, 6999, 39774, 39775, 7013, 39789, 7025, 7029, 39801, 39810, 39814, 39815, 7067, 39840, 39860, 39861, 7097, 39875, 7119, 39890, 39891, 39895, 7134, 39904, 39905, 7149, 39920, 39921, 7164, 39944, 39945, 7189, 39961, 39978, 39983, 7222, 40012, 7249, 7267, 7287, 40058, 40064, 40065, 7309, 40080, 7324, 40098, 40099, 7343, 40115, 7355, 7358, 40133, 7369, 7384, 40166, 40167, 7403, 7406, 40182, 40183, 7418, 7423, 40200, 40201, 7445, 40216, 7462, 40234, 7479, 40268, 40269, 7505, 40284, 7522, 7527, 7539, 7542, 40320, 7565, 40336, 40337, 7577, 7580, 7581, 40355, 7595, 40370, 40371, 7610, 40388, 7625, 40400, 40404, 40405, 7640, 7641, 7645, 40423, 7663, 40438, 40439, 7678, 7732, 7747, 40527, 40578, 40579, 7822, 40594, 40608, 40609, 40624, 7868, 40646, 7883, 40677, 7912, 40692, 40693, 40734, 7972, 40748, 8002, 40850, 40851, 40864, 40880, 8124, 8125, 8139, 8155, 40932, 40949, 8219, 8232, 8286, 8316, 8322, 41098, 41103, 41115, 41128, 41132, 8369, 41145, 8391, 41162, 41167, 41182, 8421, 41197, 41208, 41212, 8458, 8459, 41234, 41235, 8474, 41248, 8488, 41286, 41298, 41299, 8539, 8572, 8573, 8579, 41354, 8594, 8598, 41371, 41385, 8624, 41400, 8659, 8663, 41435, 41438, 8676, 41452, 8717, 41488, 8732, 41541, 8792, 8793, 41590, 41591, 8832, 8849, 41677, 8917, 41692, 41706, 41711, 41727, 8989, 9002, 9003, 41826, 41830, 9089, 9109, 41899, 41903, 9143, 41915, 9156, 9157, 41929, 9169, 9172, 41966, 42006, 9247, 42021, 42067, 9306, 42080, 42096, 42097, 9337, 9380, 42156, 9396, 9397, 42173, 9411, 9427, 9441, 42217, 42232, 9486, 9487, 42258, 42259, 9498, 9516, 9517, 42307, 42322, 42323, 9563, 42352, 9592, 42383, 9619, 9623, 9652, 9667, 42443, 9682, 42458, 42459, 9696, 42489, 9775, 42546, 42550, 9790, 42560, 9850, 42636, 9873, 42648, 42653, 42671, 42687, 9958, 42730, 42747, 42750, 42790, 42791, 10031, 10046, 42816, 42817, 42832, 10106, 10133, 42926, 10163, 42939, 42942, 10176, 10193, 42986, 10231, 43002, 43018, 10272, 10273, 10322, 43103, 43116, 10357, 43143, 10382, 43173, 10412, 43188, 43189, 10428, 10429, 43202, 10446, 43218, 43219, 43232, 43233, 10472, 10473, 43248, 43249, 10488, 43291, 10578, 10612, 10668, 43445, 10684, 43462, 10703, 43488, 43489, 10728, 43504, 10753, 43528, 10769, 10773, 43545, 10787, 43562, 43563, 43578, 43579, 43583, 43596, 10836, 43613, 10870, 10871, 43646, 43653, 43683, 43686, 10923, 43698, 43699, 10939, 43712, 43713, 43728, 43729, 10972, 43746, 10986, 10991, 43762, 43763, 11002, 11007, 11009, 11024, 43800, 11043, 43818, 43819, 43835, 43853, 11089, 11093, 43868, 43887, 43899, 43902, 43905, 43908, 43909, 43925, 43938, 43939, 43943, 11178, 11179, 43954, 43959, 11194, 11195, 43968, 43969, 11212, 43984, 43985, 44003, 44007, 11243, 11246, 44019, 11259, 11262, 44047, 11282, 44062, 11301, 44077, 44089, 44092, 44122, 44123, 11376, 11377, 44163, 11407, 44182, 11422, 44192, 11432, 11433, 44208, 44209, 11448, 11449, 11467, 11482, 44261, 11501, 44277, 11516, 11522, 11539, 44314, 44315, 44318, 11557, 44332, 44349, 44378, 44379, 11633, 44418, 44419, 11662, 44448, 44449, 44464, 11704, 44503, 44517, 11756, 44532, 44533, 11773, 11781, 44572, 44586, 11830, 11831, 44617, 11856, 44650, 44651, 44666, 44672, 11912, 11917, 44688, 44689, 11932, 44706, 44723, 44741, 11976, 44757, 44771, 44774, 12011, 44787, 12027, 12037, 44812, 12052, 12070, 12071, 44872, 44907, 44910, 44922, 44928, 44929, 12172, 44944, 44962, 44963, 44979, 44997, 12233, 45012, 45013, 45027, 12266, 45042, 45047, 12282, 45074, 45089, 12344, 12349, 45143, 45173, 12408, 12413, 12419, 12423, 45195, 45210, 45215, 45225, 45240, 45244, 45259, 45262, 12499, 12503, 45279, 45292, 45305, 45309, 45314, 12554, 12555, 12570, 45344, 12585, 45382, 45383, 12635, 45413, 12668, 12669, 12674, 45451, 12691, 45466, 12704, 12739, 12743, 45514, 45515, 12788, 45569, 12812, 45584, 12829, 12872, 12888, 12889, 45670, 45671, 12926, 12927, 12929, 12944, 45720, 12983, 12996, 12997, 45772, 13012, 45789, 45806, 45819, 45822, 13084, 13098, 13099, 45874, 45875, 45893, 13128, 45923, 13166, 13167, 45942, 45943, 13189, 13201, 45980, 13222, 45994, 45995, 46010, 46011, 46014, 13249, 13252, 46025, 46029, 13268, 13269, 46044, 46058, 46059, 46063, 46102, 46103, 13342, 13343, 46133, 13373, 46162, 46163, 13402, 13403, 46176, 46177, 13417, 46192, 13432, 13433, 46222, 46223, 13463, 13477, 46268, 46299, 46312, 13553, 46329, 46333, 46343, 13582, 13583, 13594, 13612, 13613, 46402, 46403, 13659, 46448, 46449, 13689, 13699, 13703, 13732, 46508, 46525, 13762, 13766, 46538, 46539, 13779, 46554, 46555, 13808, 46613, 46630, 46631, 46643, 13883, 46656, 46657, 13900, 13901, 13916, 46690, 46691, 13931, 13956, 46733, 13972, 13973, 46748, 13986, 13991, 46762, 46763, 46766, 46782, 14033, 14051, 14066, 46853, 14088, 14104, 14105, 46902, 46903, 14142, 46912, 14156, 14157, 46928, 46929, 14173, 46988, 47005, 14247, 14259, 47034, 47039, 47049, 14288, 47064, 14307, 47083, 14322, 14327, 47099, 14343, 47131, 47145, 14423, 47209, 47213, 47228, 47235, 47239, 47250, 47251, 47254, 47268, 14509, 14524, 47298, 47299, 47318, 47319, 47328, 47386, 14624, 47438, 47439, 47485, 47490, 47510, 47511, 47540, 47541, 14781, 47570, 47571, 47585, 14824, 47600, 14849, 14864, 14865, 47658, 47659, 14903, 47674, 47679, 14933, 47708, 14946, 14950, 14951, 47727, 47738, 47739, 47742, 47745, 47748, 47749, 47778, 15018, 15019, 15023, 47794, 47799, 15034, 15035, 15038, 15039, 47809, 15052, 47824, 47825, 15069, 15086, 47859, 15102, 15105, 15121, 47914, 47915, 15154, 47930, 47945, 47948, 15188, 15189, 47965, 47978, 47983, 15219, 15222, 15223, 48020, 48038, 48055, 15290, 15291, 48064, 48065, 15309, 48081, 15324, 48103, 15343, 48119, 15362, 15382, 15396, 48172, 15413, 48202, 48218, 48219, 15457, 48249, 48258, 48259, 15502, 48278, 15515, 48289, 15529, 48304, 48326, 48327, 15562, 48338, 48339, 48343, 15583, 15592, 15596, 48372, 48373, 15613, 15634, 48410, 48411, 48429, 15665, 15669, 48474, 48475, 48479, 15713, 15717, 48492, 15728, 48504, 48530, 48531, 48544, 15784, 15785, 48561, 15800, 15801, 48579, 15819, 48595, 48599, 15838, 48612, 15853, 48629, 15864, 15868, 15877, 15892, 15910, 15911, 48682, 48712, 15971, 15987, 48762, 48768, 16029, 16059, 16062, 48837, 16073, 48852, 48853, 48882, 48887, 16133, 48955, 48958, 48969, 16208, 16242, 49018, 16269, 49040, 16298, 49092, 16345, 49126, 16363, 16379, 49187, 49202, 49293, 49308, 49323, 49338, 49353, 49368, 49391, 49406, 49447, 49459, 49462, 16702, 16747, 16762, 49565, 16807, 49578, 49594, 49595, 49625, 16867, 16870, 49642, 49643, 16882, 49658, 49667, 49682, 49701, 49765, 49807, 49822, 17060, 49832, 49833, 17076, 17077, 49849, 17091, 49867, 17107, 49882, 17121, 49901, 49922, 49939, 49943, 17182, 49969, 49973, 50007, 50033, 50063, 50078, 50079, 17317, 50089, 50104, 17347, 50122, 50139, 17393, 50275, 50290, 50313, 50316, 50317, 50328, 50346, 50351, 50376, 50377, 50414, 50426, 50431, 50482, 50535, 17775, 50547, 17790, 50585, 17827, 17830, 50602, 17842, 50618, 50633, 17895, 50666, 50671, 50686, 50710, 50725, 50755, 18015, 18067, 50842, 50847, 18097, 50876, 50891, 50895, 18149, 50936, 50937, 51010, 51027, 51057, 18307, 18323, 18337, 51116, 51150, 51167, 18404, 51177, 18420, 18421, 51192, 51208, 18487, 51263, 51276, 51277, 18530, 18550, 51328, 18584, 18589, 51362, 51363, 18606, 51378, 18618, 18623, 51393, 51396, 18632, 18637, 51412, 18649, 51431, 51446, 51447, 51503, 18742, 51518, 51533, 18787, 51563, 18807, 51578, 18825, 18828, 51600, 18840, 51618, 18863, 51635, 18888, 51665, 51668, 51686, 51687, 18923, 18926, 51702, 51703, 18938, 18943, 51726, 51727, 51742, 51772, 19011, 51791, 19027, 51802, 51843, 51847, 51873, 19116, 51889, 19133, 51911, 19151, 51927, 19177, 19192, 51982, 51983, 51999, 52029, 19267, 52042, 52047, 19282, 52059, 52063, 52073, 52089, 52098, 52103, 19342, 19343, 52115, 52129, 19373, 52145, 19388, 52178, 52183, 19419, 19432, 52213, 19449, 52237, 19507, 52282, 52296, 52313, 19558, 19570, 52346, 52356, 52357, 52372, 19609, 52391, 19626, 19631, 52406, 52407, 19643, 19646, 52417, 19657, 52432, 19672, 19677, 52451, 19694, 52466, 52492, 19762, 52553, 19815, 19827, 52603, 52606, 19848, 52628, 52629, 19865, 19868, 52646, 52647, 52662, 52663, 52672, 19913, 19916, 52689, 52706, 19951, 52723, 19963, 19966, 52746, 52747, 19987, 52762, 52777, 52780, 20038, 52814, 52857, 20106, 52900, 52901, 20136, 52917, 20153, 20157, 52931, 52946, 52961, 20205, 52976, 20216, 20220, 53002, 53003, 20242, 20294, 53071, 53087, 53142, 53172, 53173, 20408, 53186, 53203, 53216, 20477, 53269, 20509, 53287, 20527, 53299, 20542, 20552, 20553, 53329, 20569, 20590, 53362, 20602, 20612, 53384, 53388, 53389, 20628, 20629, 53404, 53405, 20647, 53418, 53423, 53448, 53449, 53452, 20689, 53464, 53465, 20707, 20710, 20722, 53498, 53503, 53539, 53559, 53602, 53622, 53674, 53675, 53690, 53704, 53738, 53755, 53762, 21007, 53779, 21036, 53813, 21053, 21066, 21100, 53873, 21112, 21126, 21172, 53944, 53945, 21187, 21191, 53962, 21202, 53979, 21216, 53996, 54013, 54019, 21262, 54034, 54038, 54049, 54053, 21293, 21308, 21323, 54102, 54113, 54117, 21352, 21372, 21383, 54158, 54159, 54174, 21412, 54184, 54185, 21442, 21446, 54219, 21459, 54234, 21488, 54289, 21528, 21547, 54322, 21562, 54357, 21596, 54375, 21610, 54387, 21630, 21633, 54408, 54412, 21667, 21670, 54443, 21682, 54458, 54463, 21701, 54472, 54476, 21735, 54506, 54511, 54627, 54630, 54647, 54698, 54714, 54744, 54783, 22043, 22056, 54833, 22073, 22094, 22095, 54867, 54871, 22125, 54901, 22147, 22151, 54942, 54972, 54991, 22244, 22245, 22260, 55032, 55073, 22328, 55107, 22350, 22351, 22366, 55141, 55153, 22392, 22402, 22419, 55212, 55213, 22449, 55228, 55229, 22486, 22500, 22516, 55305, 22567, 22582, 22627, 55403, 22642, 22647, 55418, 22669, 55440, 22684, 55458, 22703, 55474, 55475, 22715, 22718, 55492, 22729, 55505, 22744, 55526, 55527, 22763, 55542, 55543, 22778, 55560, 22805, 22822, 55594, 22839, 55629, 22865, 22882, 22899, 22903, 55680, 55715, 22958, 55730, 22975, 55745, 55748, 55764, 55783, 23018, 55798, 23035, 55822, 55823, 23058, 23062, 55839, 23076, 55852, 23093, 55869, 23107, 23122, 23123, 55899, 55903, 23137, 55912, 23153, 23157, 55938, 23182, 23183, 55955, 55959, 23198, 23199, 55969, 23213, 55984, 55985, 23228, 56007, 23242, 23247, 23259, 23263, 56036, 56037, 23272, 23273, 23276, 56049, 56053, 23288, 23289, 56078, 56079, 23318, 23319, 56094, 23329, 23333, 56109, 23348, 23349, 56124, 23362, 23379, 23383, 56154, 56159, 23393, 56184, 56188, 56195, 23438, 23439, 56210, 56214, 23454, 23455, 56224, 56225, 23468, 56241, 23485, 56262, 23499, 23502, 23514, 56289, 23528, 23529, 56308, 56309, 23544, 23545, 23548, 23549, 23569, 23587, 23602, 23637, 56408, 56452, 23688, 23689, 23692, 23704, 23709, 56486, 56487, 56502, 56503, 23739, 56512, 23752, 23756, 23757, 56529, 23769, 23772, 56546, 56563, 56589, 23825, 56618, 23859, 56648, 56649, 23893, 56665, 56698, 56708, 56709, 23945, 56724, 23960, 56743, 23978, 56758, 56769, 56784, 56803, 56818, 24063, 24067, 56842, 56843, 24096, 56872, 56889, 56997, 57013, 57026, 24271, 57043, 24322, 57098, 57099, 57129, 24368, 57144, 57223, 57269, 57283, 57302, 57303, 57313, 24572, 24632, 24637, 24696, 24701, 24707, 24711, 57487, 57499, 57502, 57516, 57529, 57533, 57546, 24787, 24791, 57563, 57566, 57577, 57581, 57592, 57648, 57652, 57667, 57696, 57742, 24982, 24996, 25012, 57788, 57789, 25027, 57803, 25042, 57832, 25073, 57849, 57910, 57911, 25150, 57921, 25195, 57971, 25210, 25221, 25233, 58012, 58031, 58047, 58057, 25318, 58091, 58107, 58128, 58132, 25373, 58150, 58151, 25403, 25406, 25416, 58192, 25436, 25466, 25473, 25476, 58249, 58252, 25488, 25492, 25493, 58264, 58268, 25506, 25511, 58286, 58302, 25536, 25553, 58329, 25571, 25586, 58362, 58387, 25626, 25627, 58401, 25656, 58454, 25694, 25695, 25708, 58485, 25724, 25725, 58506, 58507, 58536, 25777, 58553, 25799, 58591, 25829, 58605, 58620, 58672, 25916, 58694, 58720, 58724, 58762, 26003, 58778, 58793, 26071, 58847, 26084, 26085, 58856, 58860, 58861, 26100, 58873, 58876, 58877, 58896, 26140, 58960, 58964, 26223, 58998, 26240, 59016, 59017, 59021, 59032, 59033, 59037, 26275, 59051, 26290, 26295, 59067, 59084, 26320, 59101, 26343, 59119, 26355, 59135, 59171, 26426, 59205, 59238, 26494, 26497, 59272, 59289, 26531, 59306, 26546, 59322, 26565, 59341, 59356, 26594, 26599, 59374, 59390, 59423, 59437, 59449, 26720, 59496, 26737, 59513, 59538, 26783, 59553, 26792, 59590, 59591, 59636, 59637, 26877, 59663, 26928, 26932, 59709, 59723, 59739, 26977, 59753, 26993, 59768, 59778, 59782, 59794, 59809, 27048, 27049, 59825, 59862, 59863, 59876, 59877, 59893, 27132, 27133, 59917, 27157, 59932, 59946, 59951, 27186, 27190, 27191, 59966, 59977, 27217, 59992, 59993, 59996, 59997, 27235, 60011, 27251, 60026, 60033, 27276, 60049, 27288, 27289, 60066, 27311, 27327, 60116, 60117, 27352, 60131, 60134, 27387, 27390, 27413, 60189, 60202, 60207, 60222, 60232, 27473, 60248, 60249, 60252, 27490, 60267, 60282, 60289, 27532, 60305, 27548, 60327, 27562, 27563, 27566, 60339, 27582, 60356, 60357, 60369, 60373, 60391, 60402, 60407, 27642, 27667, 60442, 27696, 27697, 27701, 60472, 60476, 60494, 60495, 60506, 60510, 27749, 60521, 60524, 60525, 60540, 60550, 60551, 27802, 60580, 60581, 60597, 27837, 27855, 60626, 60630, 27870, 27871, 60641, 27880, 27896, 60682, 60698, 60712, 27953, 60728, 60732, 60733, 60766, 28000, 28005, 60781, 28021, 60797, 28043, 28046, 28047, 60822, 60823, 28062, 28063, 60837, 60852, 60853, 28093, 60866, 28106, 60883, 28137, 60913, 28152, 28153, 60971, 28211, 61004, 61021, 61039, 28278, 61054, 61060, 61061, 61077, 28312, 61091, 61094, 28331, 61121, 28364, 28398, 28399, 61193, 61208, 61209, 61227, 61242, 61261, 61295, 61310, 61317, 61332, 61333, 28586, 61362, 61367, 28602, 61393, 28636, 28667, 28670, 61463, 28703, 61477, 28717, 61522, 28762, 61553, 28793, 61579, 28823, 61594, 61599, 28837, 61609, 61624, 61628, 61643, 61646, 28882, 61663, 61676, 28913, 61689, 61693, 61703, 61762, 61763, 61793, 29063, 29092, 29093, 29108, 61885, 29123, 61915, 61929, 61944, 61957, 29246, 29256, 29291, 62067, 29306, 62092, 62126, 29363, 62142, 29381, 62153, 29393, 62169, 62186, 29431, 62202, 29468, 29499, 29502, 62273, 29513, 29533, 62322, 29562, 29568, 29573, 62348, 62364, 29607, 62378, 29619, 62394, 62399, 29633, 62409, 62412, 62413, 29648, 29653, 62428, 62429, 29667, 62443, 29682, 29687, 62482, 62483, 29723, 62513, 62550, 62551, 29790, 62565, 29820, 29827, 29843, 62618, 62619, 29857, 62633, 62648, 62652, 62671, 29924, 29940, 29941, 62717, 62722, 30013, 62790, 62791, 62837, 30082, 30099, 62874, 30129, 30150, 30180, 62956, 62957, 30196, 62972, 62973, 62993, 30251, 63045, 30285, 30300, 63079, 30319, 30334, 30337, 63117, 30352, 63129, 63133, 30371, 63146, 30386, 30400, 30405, 30434, 30439, 63227, 63230, 63233, 63267, 30507, 63282, 30522, 30540, 63317, 30575, 30590, 63369, 63385, 30630, 63403, 30657, 30673, 63471, 63518, 63532, 30768, 63544, 30791, 30817, 63593, 63649, 63664, 30905, 63687, 30922, 30957, 63733, 31013, 63788, 63801, 31046, 63818, 31059, 31072, 31073, 63879, 31118, 63890, 63904, 31145, 31161, 63939, 63958, 63959, 31229, 64029, 31270, 31271, 64042, 64047, 64062, 31313, 31317, 64088, 64089, 31331, 64107, 64110, 31347, 64122, 64129, 64144, 64145, 64162, 31406, 64179, 31419, 31422, 64209, 64213, 31453, 31466, 64242, 64247, 31482, 31505, 31509, 64284, 64298, 64303, 31539, 31542, 31543, 64329, 64332, 64344, 64345, 31603, 64378, 64384, 64385, 31624, 31625, 64401, 31640, 31645, 64423, 64439, 31674, 31679, 31689, 31704, 64486, 31723, 64503, 31739, 31777, 31810, 64590, 64591, 64607, 31840, 31844, 31845, 64616, 64620, 31861, 64636, 64646, 64647, 31882, 64659, 31899, 31916, 64693, 31932, 31933, 64706, 31950, 64736, 31977, 64753, 31992, 32033, 64809, 32048, 64825, 32067, 64863, 64876, 32117, 64892, 64903, 64919, 32155, 32172, 32173, 64949, 64966, 32207, 64993, 32233, 65008, 32248, 32249, 65048, 65067, 32307, 65101, 32358, 65157, 32397, 65173, 32426, 65202, 65207, 65216, 32456, 32457, 32461, 32477, 32494, 65323, 32562, 65356, 65406, 65446, 32683, 32699, 65488, 32733, 32751, 32767], 307: [32796, 32797, 32811, 32840, 32841, 32856, 32857, 32879, 32894, 32900, 32901, 32916, 32917, 32946, 32961, 32977, 32999, 33014, 33052, 33053, 33066, 307, 33096, 33097, 33134, 33156, 33172, 33186, 33217, 33233, 33254, 33291, 33294, 33321, 33325, 33336, 33340, 33354, 33355, 33358, 33388, 33400, 33401, 33405, 33411, 33415, 33426, 33431, 33444, 33456, 33460, 33475, 33478, 33490, 33495, 33504, 33508, 33546, 33551, 33562, 33576, 33580, 33581, 33593, 33597, 33626, 33641, 33660, 33670, 906, 911, 33683, 33686, 923, 926, 33696, 33700, 936, 941, 33716, 33717, 953, 956, 33730, 971, 974, 33747, 33750, 33751, 986, 991, 33764, 1001, 1004, 33776, 33780, 1016, 1021, 1318, 34124, 34125, 34140, 34141, 1378, 34171, 34231, 34244, 34245, 34260, 34261, 34345, 34349, 34360, 34429, 34435, 34438, 1674, 1679, 34455, 1691, 1694, 34465, 1704, 1709, 34484, 1721, 1724, 34503, 1739, 1742, 1754, 1759, 34532, 1769, 1772, 1784, 1789, 34836, 34854, 34855, 34881, 34900, 34919, 34930, 34934, 34953, 34957, 34972, 34973, 34991, 35006, 35017, 35021, 35032, 35033, 35050, 35051, 35054, 35055, 35066, 35067, 35070, 35071, 35089, 35092, 35093, 35106, 35110, 35111, 35137, 35153, 35156, 35157, 35170, 35186, 35191, 35212, 35213, 35228, 35229, 35242, 35246, 35259, 35263, 35272, 35273, 35288, 35289, 35306, 35311, 35323, 35326, 35331, 35346, 35350, 2586, 2590, 35361, 35364, 35376, 35381, 35398, 35411, 35415, 2650, 2654, 35425, 35428, 35444, 35445, 35467, 35482, 35486, 2721, 2725, 35496, 35497, 35500, 35512, 35516, 35517, 35530, 35534, 35547, 35551, 2785, 2789, 35576, 35581, 35586, 35603, 35606, 35607, 2843, 2847, 35616, 35620, 35621, 35633, 35654, 35666, 35670, 2907, 2911, 35681, 35684, 35700, 35722, 35726, 35739, 35743, 35753, 35756, 2993, 2997, 35768, 35769, 35772, 35791, 35802, 35806, 35816, 35820, 35821, 3057, 3061, 35833, 35836, 35857, 35860, 35861, 35874, 35879, 35909, 35921, 35924, 35925, 35943, 35954, 35958, 35977, 35992, 36010, 36011, 36014, 36015, 36026, 36027, 36030, 36031, 36044, 36045, 36060, 36061, 36074, 36075, 36078, 36079, 36090, 36091, 36094, 36095, 36113, 36116, 36130, 36134, 36165, 36180, 36181, 36199, 36214, 36215, 36233, 36237, 36248, 36252, 36266, 36270, 36271, 36283, 36286, 36287, 36297, 36300, 36301, 36312, 36316, 36317, 36330, 36331, 36334, 36346, 36347, 36351, 36354, 36371, 3610, 3614, 36384, 36388, 36389, 36401, 36422, 36438, 3674, 3678, 36452, 36468, 36469, 36490, 36494, 36507, 36511, 3745, 3749, 36520, 36524, 36525, 36536, 36541, 3809, 3813, 36584, 36588, 36589, 36601, 36604, 36611, 36630, 3867, 3871, 36641, 36644, 36656, 36678, 36691, 3931, 3935, 36708, 36724, 36725, 36751, 36762, 36776, 36777, 36780, 4017, 4021, 36792, 36796, 36797, 36841, 36844, 4081, 4085, 4096, 4113, 4117, 36892, 36893, 4130, 36906, 4147, 4164, 36936, 36937, 4177, 4181, 36952, 36953, 4198, 36974, 4215, 36991, 36996, 36997, 4232, 4236, 4237, 37012, 37013, 4249, 4252, 4253, 37026, 4266, 4270, 4271, 4283, 4286, 4287, 37057, 4296, 4297, 4300, 37073, 4312, 4313, 4317, 37094, 4330, 4331, 4334, 37111, 4346, 4347, 4351, 37148, 37149, 37163, 37192, 37193, 37231, 37252, 37268, 37298, 37313, 37329, 37366, 37386, 37391, 37416, 37420, 37433, 37437, 4679, 37450, 37451, 37455, 37485, 4724, 37496, 37497, 37500, 37506, 37511, 4747, 37523, 37527, 4762, 37536, 37540, 4777, 37556, 4792, 37570, 37575, 4815, 37587, 37590, 4830, 4845, 37616, 37620, 4860, 37643, 37646, 37659, 37673, 37676, 37677, 37688, 37692, 4934, 37723, 4964, 37736, 37757, 37763, 37766, 37782, 37796, 37797, 37808, 37812, 37827, 37830, 37831, 37842, 37856, 37860, 37876, 38220, 38221, 38236, 38237, 38266, 38311, 38340, 38341, 38356, 38357, 38440, 38444, 38457, 38524, 38535, 38547, 38550, 38564, 38577, 38615, 38644, 38929, 38932, 38933, 6169, 6172, 6173, 38946, 38950, 38951, 6186, 6190, 6191, 38977, 38993, 38996, 38997, 6232, 6233, 6237, 39010, 39026, 39031, 6266, 6267, 6271, 6277, 39052, 39053, 6289, 6293, 39068, 39069, 6306, 6311, 39082, 39086, 6327, 39099, 39103, 6337, 39112, 39113, 6353, 6357, 39128, 39129, 6370, 39146, 39151, 6386, 6391, 39163, 39166, 39188, 6424, 6428, 6429, 39206, 39207, 6443, 6446, 6447, 39233, 39252, 6488, 6489, 6492, 39271, 39282, 39286, 6522, 6523, 6526, 6529, 6533, 39308, 39309, 6549, 39320, 39324, 6567, 39343, 6578, 6583, 39358, 6593, 6597, 39368, 39369, 6609, 39384, 39388, 6626, 6631, 39402, 39403, 39406, 39407, 6642, 39418, 39419, 39422, 39423, 39426, 39443, 39446, 39447, 39456, 39460, 39461, 39473, 39494, 6730, 39506, 39510, 39521, 39524, 6765, 39540, 6780, 6790, 39562, 39566, 6807, 39579, 39583, 6820, 39592, 39593, 39597, 39608, 39613, 39627, 39631, 6870, 39646, 39656, 39661, 6900, 39673, 39676, 39677, 39683, 39698, 39702, 39713, 39716, 39728, 39733, 39750, 6987, 39763, 39767, 39777, 39780, 7020, 39796, 39797, 7037, 7047, 39819, 39823, 7062, 39834, 39849, 39852, 39853, 7092, 39864, 39865, 39869, 7110, 39882, 39886, 39899, 39903, 7140, 39913, 39916, 39953, 39956, 7192, 7193, 7197, 39970, 39974, 7210, 7211, 7214, 40005, 40020, 40021, 7257, 7260, 7261, 40039, 40054, 40055, 7291, 7294, 7295, 7297, 40073, 40077, 7313, 7317, 40088, 40092, 7330, 40106, 40110, 40111, 7346, 7351, 40123, 40126, 40127, 7365, 40137, 40140, 40141, 7377, 7381, 40152, 40156, 40157, 7394, 7399, 40170, 40171, 40174, 7415, 40186, 40187, 40191, 40209, 40212, 40213, 7448, 7449, 7452, 40226, 40231, 7466, 7467, 7471, 40261, 40273, 40276, 40277, 7512, 7516, 7517, 40295, 40306, 40310, 7546, 7550, 7551, 7553, 7557, 40329, 7569, 40344, 7586, 7591, 40362, 40363, 40366, 40367, 7602, 40378, 40379, 40382, 40383, 7617, 7621, 40396, 40397, 7637, 40412, 40413, 7655, 40426, 40427, 40430, 40431, 7666, 7671, 40442, 40443, 40446, 40447, 40451, 40470, 40481, 40484, 40496, 40518, 7758, 40531, 40548, 7785, 40564, 40565, 7800, 40587, 7830, 40606, 40617, 40620, 40621, 7860, 40632, 40633, 40637, 7878, 7895, 7908, 40696, 40701, 40706, 40723, 40736, 40740, 40741, 40753, 40774, 8015, 40790, 40804, 8040, 40820, 40821, 8057, 8070, 40842, 40846, 40859, 40863, 8100, 40873, 40876, 40889, 40892, 40893, 8135, 8150, 40936, 40941, 8180, 40953, 40956, 40957, 8210, 40990, 40991, 8225, 41001, 8262, 8263, 41034, 41035, 8279, 41050, 41051, 8292, 41068, 8308, 8309, 41084, 41085, 8334, 8335, 41106, 8350, 8351, 41124, 41125, 8364, 8365, 41140, 41141, 8380, 8381, 41158, 41159, 8394, 8395, 41175, 8410, 8411, 41185, 8424, 8425, 41201, 8440, 8441, 41226, 41230, 41246, 41256, 41290, 41325, 41346, 8586, 8591, 8603, 8606, 41376, 41380, 8616, 8621, 41396, 8633, 8636, 8651, 8654, 41430, 8666, 8671, 41440, 41441, 8681, 8684, 8696, 8701, 8772, 41545, 41548, 41583, 8823, 41594, 41595, 41599, 8845, 41620, 8860, 41639, 8879, 41655, 8894, 41668, 8905, 8920, 8939, 41718, 41719, 8954, 41736, 41741, 41752, 41775, 9028, 41800, 41801, 41804, 41805, 41816, 41817, 9062, 41834, 41835, 41838, 41854, 41856, 41857, 41860, 41861, 9096, 9100, 9101, 41876, 41877, 9113, 9116, 9117, 41894, 9135, 41910, 9150, 41924, 9160, 9161, 9164, 41936, 41940, 9176, 9177, 9181, 41958, 41959, 9195, 41970, 9210, 42251, 42255, 42319, 42335, 42361, 42375, 9610, 9615, 9627, 9630, 9640, 9645, 42416, 9657, 9660, 9675, 9678, 9690, 9695, 42468, 9705, 9708, 42480, 42484, 42485, 9720, 9725, 42505, 42508, 42521, 42543, 42569, 42572, 42573, 42623, 42625, 42629, 9864, 9868, 42640, 42644, 9881, 9885, 42678, 42679, 42688, 42692, 9928, 9932, 42708, 9945, 9949, 42727, 42743, 43011, 43026, 43030, 43031, 10266, 10270, 10271, 43041, 43044, 43045, 10281, 10284, 10285, 43056, 43061, 10296, 10300, 43090, 43091, 43095, 10330, 10331, 10335, 43105, 10344, 10348, 43125, 10360, 10361, 10365, 10371, 10374, 10375, 43147, 10386, 10391, 43162, 43166, 10401, 10405, 43176, 43177, 43180, 10421, 43192, 43193, 43197, 10434, 10435, 10438, 43210, 43214, 10450, 10455, 43227, 43231, 10465, 43240, 10481, 10485, 43256, 43257, 43260, 43261, 43270, 43283, 43286, 43287, 10523, 10526, 10527, 43300, 43301, 10536, 10540, 10541, 43313, 10553, 10557, 43346, 43350, 43351, 10586, 10587, 10590, 43360, 43361, 10601, 10605, 43380, 43381, 10616, 10617, 10620, 10626, 10631, 43402, 43406, 10643, 10646, 10647, 43419, 43423, 10661, 43432, 43433, 43436, 43437, 10673, 10677, 43448, 43453, 10690, 10695, 43467, 43471, 10706, 10707, 10710, 43486, 10721, 10725, 43496, 43497, 43500, 43501, 10737, 43512, 43513, 43516, 43521, 43536, 43540, 10776, 10781, 43558, 43559, 43585, 43588, 10824, 10825, 10828, 10829, 43604, 10840, 10845, 43623, 10858, 10863, 43634, 43638, 43639, 10874, 10879, 10881, 10884, 10885, 43657, 10900, 43672, 10918, 10919, 43695, 43711, 10948, 10961, 10964, 10965, 10998, 10999, 43770, 43781, 43796, 11033, 11036, 43814, 43841, 43844, 11080, 11081, 11084, 11085, 43856, 11097, 11100, 43874, 43878, 43879, 11115, 11118, 43894, 11131, 11134, 11140, 43912, 43917, 11153, 11156, 11157, 43929, 43932, 43950, 11190, 11191, 43966, 11201, 11204, 11205, 43977, 11220, 43992, 11238, 11239, 44011, 44038, 44051, 11290, 11291, 11294, 44065, 44069, 11304, 11305, 11309, 44081, 11320, 11324, 44118, 11355, 11358, 11359, 44128, 11368, 11372, 44148, 44149, 11385, 11388, 11389, 11394, 11395, 11398, 11410, 11415, 11425, 44200, 44201, 44204, 11441, 11445, 44216, 44217, 44221, 11459, 11462, 11463, 44234, 44238, 11474, 11479, 44251, 44255, 11489, 11493, 44264, 44265, 44268, 44269, 11509, 44284, 44291, 44310, 11546, 11547, 11551, 44321, 44324, 11560, 11561, 11564, 44336, 11577, 11581, 44371, 44374, 11610, 11614, 11615, 11625, 11629, 44404, 44405, 11640, 11644, 11645, 11650, 11655, 11666, 11667, 11670, 11681, 11685, 44457, 11697, 44472, 44473, 44476, 11714, 11719, 44495, 11731, 11734, 11735, 44506, 11749, 44520, 44524, 44525, 11761, 11765, 44536, 44537, 44540, 44541, 44545, 44560, 11801, 11804, 44612, 44613, 11848, 11849, 11852, 11853, 44628, 11865, 11868, 44646, 44647, 11883, 11886, 44662, 44663, 11899, 11902, 11908, 44681, 44684, 11921, 11924, 11925, 44696, 44700, 44701, 11958, 11959, 11969, 11972, 11973, 44744, 44745, 11988, 44761, 12006, 12007, 44783, 44798, 44799, 44805, 44820, 12056, 12061, 44838, 44839, 44868, 44869, 12104, 12105, 12108, 12109, 44880, 44884, 12120, 12125, 44903, 12138, 12143, 44914, 44918, 12154, 12159, 12161, 12164, 12165, 44941, 12180, 44956, 12198, 12199, 44974, 44975, 44991, 12228, 45001, 12241, 12244, 12245, 45016, 45034, 12278, 12279, 45050, 45051, 45086, 45087, 45096, 45130, 45131, 45146, 45147, 45165, 45180, 45181, 45186, 45220, 45221, 45236, 45237, 45255, 45270, 45271, 45281, 45297, 45323, 45327, 45343, 45353, 45387, 45420, 45458, 45476, 12713, 12716, 45488, 45492, 12728, 12733, 45510, 12776, 12781, 45552, 45553, 12793, 12796, 45640, 45645, 45678, 45690, 45691, 45694, 45700, 45735, 45751, 45780, 45798, 45799, 45833, 45836, 45849, 45870, 45896, 45897, 45900, 45901, 45912, 45913, 45930, 45931, 45935, 45951, 45956, 45957, 13197, 45968, 45969, 45972, 45973, 13212, 45990, 46006, 46016, 46020, 13257, 46036, 13272, 46050, 46070, 46071, 46346, 46350, 46414, 46430, 46456, 46487, 46496, 13737, 13740, 13752, 13757, 46560, 46564, 46565, 13800, 13805, 46580, 13817, 13820, 46600, 46605, 46616, 46638, 46664, 46668, 46669, 46718, 46720, 46724, 13961, 46737, 46741, 13976, 46758, 46759, 46788, 14029, 46800, 46804, 14044, 46823, 46839, 47110, 47123, 47126, 47127, 47140, 47141, 47153, 14393, 14397, 47186, 47190, 47191, 47200, 47201, 14441, 47220, 47221, 47242, 47246, 14483, 14486, 47259, 47263, 47273, 47276, 14513, 14517, 47288, 47289, 47292, 47293, 47311, 14547, 14550, 47322, 47326, 14561, 14565, 47336, 47337, 47341, 47352, 47353, 47356, 47357, 47363, 47378, 47382, 47383, 47393, 47396, 47397, 47408, 47413, 14648, 14652, 47442, 47443, 47447, 47457, 14696, 47477, 14723, 14726, 47499, 47503, 47514, 14753, 14757, 47528, 47529, 47532, 47544, 47545, 47549, 14787, 14790, 47562, 47566, 47579, 47583, 47592, 47593, 47596, 47597, 14833, 14837, 47609, 47621, 47636, 14873, 14876, 47654, 47681, 47684, 47696, 14937, 14940, 47714, 47718, 47719, 47734, 47752, 47757, 14993, 14997, 47769, 47772, 47791, 47807, 15041, 15045, 47817, 47832, 47866, 47873, 47888, 47892, 15128, 15133, 47910, 47911, 47937, 47940, 47956, 15192, 15197, 47975, 47986, 47990, 47991, 15233, 15237, 48009, 48024, 48046, 48062, 15313, 15317, 48107, 48131, 48150, 48161, 48164, 48176, 15417, 15421, 48211, 48214, 15469, 48244, 48245, 15507, 15510, 15521, 15525, 48296, 48297, 48301, 48312, 48331, 15571, 15574, 48350, 48360, 48361, 48364, 48365, 15601, 15605, 48377, 48380, 48381, 48390, 48403, 48417, 48421, 48433, 15672, 15676, 48470, 48480, 15724, 48500, 48501, 15747, 15750, 48552, 48553, 48556, 15793, 15797, 48568, 48569, 48573, 15811, 15814, 48586, 48590, 48603, 48607, 15841, 15845, 48621, 48632, 48633, 48636, 48637, 48645, 48660, 15896, 15901, 48678, 48679, 48708, 48709, 48720, 48724, 15960, 15965, 48743, 48754, 48758, 16001, 16005, 48781, 48796, 48814, 48830, 48831, 48841, 16081, 16085, 48856, 48874, 48875, 48891, 48897, 48912, 16153, 16156, 48964, 48965, 48980, 16217, 16220, 48998, 48999, 49014, 49015, 49033, 49036, 49037, 16273, 16277, 49048, 49053, 16321, 16325, 49096, 49112, 49113, 49134, 49135, 49150, 49176, 49177, 49199, 49228, 49229, 49244, 49245, 49259, 49274, 49281, 49297, 49319, 49334, 49348, 49349, 49364, 49365, 49394, 16660, 49432, 49433, 16678, 49454, 16705, 49484, 49485, 16738, 49514, 49537, 16781, 49553, 16796, 49574, 16814, 16831, 49604, 16841, 49620, 16856, 49634, 16874, 16891, 49674, 49679, 49705, 49709, 49720, 49724, 49738, 49742, 49743, 49768, 49785, 49788, 49789, 49795, 49798, 49810, 49815, 49824, 49828, 49859, 49863, 49874, 49879, 49892, 49904, 49908, 49931, 49934, 17174, 49950, 17188, 49960, 49961, 49964, 49977, 49981, 17218, 17223, 17238, 17239, 50014, 17249, 17253, 50029, 17268, 17269, 50040, 50050, 17290, 17291, 17294, 17295, 50067, 50070, 50071, 17306, 17307, 17310, 17311, 50084, 17320, 17321, 17324, 17325, 50096, 50100, 17336, 17337, 17340, 17341, 50118, 17354, 17355, 17358, 17359, 50131, 50134, 17370, 17371, 17374, 17375, 50144, 50148, 17384, 17385, 17388, 17389, 50164, 50165, 17400, 17401, 17404, 17405, 17733, 50504, 50505, 17748, 50520, 50521, 17783, 50559, 50564, 50565, 17801, 50580, 50581, 17816, 17834, 17851, 17869, 17884, 17902, 50679, 17919, 17942, 17956, 50729, 50733, 50748, 17991, 18033, 18036, 18037, 50809, 50823, 50852, 18088, 18089, 18092, 18093, 18104, 18105, 18108, 18109, 50883, 50886, 50903, 50913, 18152, 18153, 18156, 18157, 50932, 18168, 18169, 18172, 18173, 51217, 51220, 51221, 18456, 18460, 51234, 51239, 18474, 18475, 18479, 51269, 18504, 18505, 18508, 18509, 51281, 51284, 51285, 18520, 18524, 51303, 18543, 51314, 51318, 18558, 18561, 18564, 51336, 51337, 18580, 18581, 51352, 51353, 18599, 51370, 51371, 51374, 51375, 18610, 18614, 51386, 51387, 51390, 51391, 18628, 18629, 51405, 18641, 18644, 51420, 18662, 18663, 51434, 51435, 51438, 51439, 18674, 18678, 18679, 51450, 51451, 51454, 51455, 51473, 51476, 18713, 18717, 51490, 51494, 18730, 18731, 18734, 51525, 18760, 18761, 18764, 18765, 51540, 51541, 18777, 18781, 51559, 18798, 51574, 51575, 18815, 18820, 18821, 51592, 51593, 51597, 18833, 18836, 51608, 51609, 51612, 18850, 18854, 51626, 51630, 51631, 18871, 51643, 51646, 51647, 18881, 18884, 51657, 51661, 18900, 18901, 51672, 51676, 18914, 18918, 18919, 51690, 51691, 51694, 18934, 18935, 51706, 51707, 51711, 51714, 51731, 51744, 51748, 51749, 18984, 18985, 18988, 18989, 51761, 51782, 51798, 51812, 19048, 51828, 51829, 19064, 19065, 19068, 19069, 19078, 19105, 19108, 51880, 51881, 51884, 19121, 19124, 19125, 51896, 51901, 19142, 51914, 51918, 19158, 51931, 51935, 19172, 19173, 51944, 51945, 51948, 19185, 19188, 19189, 51961, 51964, 51971, 51990, 52001, 52004, 19240, 19241, 19244, 19245, 52016, 52038, 52051, 52068, 19305, 52084, 52085, 19320, 19321, 19324, 19325, 19350, 19361, 19364, 19365, 52136, 52141, 19377, 19380, 19398, 52171, 19414, 52190, 19425, 19428, 19429, 52200, 52204, 52205, 19444, 19445, 52216, 52217, 52220, 52244, 19480, 19484, 52262, 52263, 19499, 19502, 19503, 52289, 19528, 19529, 19532, 19533, 52308, 19544, 19548, 52327, 19563, 52338, 52342, 19578, 19588, 19589, 52361, 52365, 19601, 19604, 52380, 52381, 19622, 19623, 52394, 52395, 52398, 52399, 19634, 19638, 19639, 52410, 52411, 52414, 52415, 19649, 19652, 52425, 52429, 19668, 19669, 52440, 52441, 19687, 52459, 19698, 19702, 52474, 52497, 52500, 52501, 19737, 19741, 52514, 52518, 52519, 19754, 19758, 19759, 52545, 19784, 19785, 19788, 19789, 52561, 52564, 52565, 19801, 19805, 52578, 19818, 52594, 52599, 19835, 19841, 19844, 52620, 52621, 19860, 19861, 52636, 52637, 19874, 19878, 19879, 52651, 52654, 19894, 19895, 52666, 52671, 19908, 19909, 52680, 52681, 19921, 19924, 52696, 52697, 19938, 19942, 52714, 52718, 19959, 52731, 52735, 52739, 52754, 52758, 52769, 52772, 20008, 20009, 20012, 20013, 52784, 52789, 52806, 52819, 52823, 52833, 52836, 20076, 52852, 52853, 20088, 20089, 20092, 20093, 20102, 52874, 52878, 20118, 52891, 52895, 20132, 20133, 20145, 20148, 20149, 52921, 52924, 20166, 52943, 52954, 52958, 20193, 20196, 52968, 52972, 52973, 20209, 20212, 20213, 52984, 52985, 52988, 52994, 53011, 53014, 53015, 53024, 53028, 53029, 20264, 20265, 20268, 20269, 53041, 53062, 53074, 53078, 53089, 53092, 20333, 53108, 20344, 20345, 20348, 20349, 20358, 53131, 20374, 53146, 53150, 20385, 20388, 20389, 53160, 53161, 53164, 20404, 20405, 53176, 53181, 53194, 53198, 20438, 53211, 53215, 20449, 20452, 20453, 53224, 53229, 20465, 20468, 53240, 53244, 53245, 20480, 20497, 53272, 53273, 53294, 53324, 53325, 20565, 53340, 53341, 53354, 53371, 53377, 20617, 20620, 20621, 53393, 20632, 20636, 20637, 53414, 20650, 20651, 20654, 53431, 20666, 20667, 20671, 53444, 53445, 20680, 20681, 20685, 53460, 53461, 20696, 20697, 20700, 53474, 20714, 20718, 20719, 20731, 20734, 20735, 53528, 53529, 53551, 53580, 53581, 53611, 53633, 53649, 53686, 53700, 53716, 53746, 53771, 53774, 53800, 53804, 53817, 53821, 21062, 21063, 53835, 53838, 53839, 21092, 53865, 21108, 53880, 53884, 53885, 53890, 53895, 21130, 21131, 53907, 53910, 21146, 21147, 21160, 21161, 53936, 53940, 21176, 21177, 53954, 53959, 21198, 21199, 53971, 53975, 21214, 21215, 53984, 53988, 21228, 21229, 54004, 21244, 21245, 54026, 54031, 54047, 54056, 54057, 54061, 54072, 54076, 21318, 54111, 21348, 54124, 21364, 54137, 54147, 54150, 54151, 54162, 54176, 54180, 21417, 54196, 21432, 54211, 54214, 54230, 54244, 54245, 21485, 54256, 54260, 21500, 54600, 54601, 54616, 54617, 54654, 54660, 54661, 54676, 54677, 54759, 54824, 54828, 54845, 54904, 54935, 54964, 54983, 54995, 54998, 55012, 55025, 55313, 55316, 22552, 22553, 22556, 55330, 55334, 22570, 22571, 22574, 55365, 55380, 55381, 22616, 22620, 22621, 55399, 55414, 55415, 22651, 22654, 22655, 22657, 22661, 55432, 55433, 55437, 22673, 55448, 55449, 55452, 22690, 55466, 55470, 55471, 22706, 22711, 55483, 55486, 55487, 22721, 22725, 55497, 55501, 22741, 55512, 55516, 22754, 22759, 55530, 55531, 55534, 22775, 55546, 55547, 55551, 55569, 55572, 55573, 22808, 22809, 22813, 55586, 55591, 22826, 22827, 22831, 55621, 55633, 55636, 55637, 22873, 22876, 22877, 55655, 55666, 55670, 22906, 22910, 22911, 22913, 55688, 55689, 22929, 22933, 55704, 55705, 22946, 22951, 55722, 55723, 55726, 55727, 22962, 55738, 55739, 55742, 55743, 22981, 55757, 22993, 22997, 55772, 23015, 55786, 55787, 55790, 55791, 23026, 23031, 55802, 55803, 55806, 55807, 55811, 55830, 55841, 55844, 55856, 55878, 23115, 23119, 55891, 55908, 23144, 23148, 55924, 55925, 23161, 23165, 23174, 23175, 23190, 23204, 23220, 55993, 55996, 23238, 23239, 56015, 23254, 56026, 23268, 56040, 56041, 56045, 23284, 56057, 56060, 56061, 56066, 56083, 56096, 56100, 56101, 56113, 56134, 23370, 23374, 56150, 56164, 23401, 23405, 56180, 56181, 23416, 23420, 23430, 23446, 23447, 23460, 56233, 56236, 23476, 56248, 56249, 56253, 23494, 56266, 56270, 23510, 23511, 56283, 56287, 23524, 56296, 56301, 23540, 56312, 56313, 56317, 56337, 56340, 56341, 23576, 23580, 23581, 56354, 56358, 56359, 23594, 23598, 23599, 56385, 56401, 56404, 56405, 23640, 23641, 23644, 56418, 56434, 56439, 23674, 23675, 23679, 23681, 23685, 56460, 56461, 23701, 56476, 56477, 23714, 23719, 56491, 56494, 23735, 56506, 56511, 23745, 23749, 56520, 56521, 23761, 56536, 56537, 23778, 56554, 56558, 23794, 23799, 56571, 56575, 56596, 23833, 23836, 23837, 56614, 56615, 23851, 23854, 23855, 56641, 56660, 23896, 23897, 23901, 56679, 56690, 56694, 23930, 23931, 23934, 23941, 56716, 56717, 23953, 23957, 56728, 56732, 23975, 56746, 56747, 56750, 56751, 23986, 23991, 56762, 56763, 56766, 56767, 24001, 56776, 56777, 24017, 24021, 56792, 56796, 24034, 24039, 56811, 24050, 56826, 56834, 56851, 56854, 56855, 56864, 56868, 56869, 56881, 56902, 24139, 24143, 56914, 56918, 56929, 56932, 24168, 24172, 56948, 24185, 24189, 24198, 24199, 56971, 56975, 24214, 56986, 24228, 57001, 57004, 24244, 57016, 57017, 57021, 24262, 24263, 57034, 57038, 24278, 57051, 57055, 24292, 57065, 57068, 57069, 24308, 57081, 57084, 57091, 57106, 57110, 57121, 57124, 57136, 57141, 57158, 24394, 24398, 57171, 57175, 57185, 57188, 24425, 24429, 57204, 57205, 24440, 24444, 24454, 57226, 57230, 24470, 24471, 57243, 57247, 24484, 57256, 57261, 24500, 24518, 57291, 57295, 24534, 24535, 57310, 24548, 57320, 57321, 57325, 24564, 57337, 57340, 57341, 57370, 57371, 57389, 57422, 57423, 57438, 57439, 57448, 57464, 57465, 57478, 57479, 57495, 57505, 57521, 57554, 57572, 57573, 57588, 57589, 57610, 57614, 24854, 57626, 24868, 57644, 57678, 57705, 57750, 57760, 57761, 25001, 25016, 57794, 57824, 57828, 25069, 57844, 25084, 57928, 57933, 57963, 57979, 57982, 57983, 57988, 58038, 58039, 58068, 58087, 58103, 58121, 58124, 25364, 58140, 25382, 58155, 25409, 58184, 58185, 58188, 58189, 25428, 58204, 58205, 58218, 58222, 58223, 58234, 58244, 25480, 25481, 58256, 58260, 25496, 25497, 58278, 58279, 25514, 25515, 58290, 25530, 25531, 58304, 58305, 58308, 58309, 25548, 25549, 58324, 58325, 25564, 25565, 58342, 25582, 25583, 58358, 25598, 25599, 58635, 58639, 58699, 25943, 58715, 25972, 58749, 58788, 26028, 58800, 58804, 58805, 26045, 58823, 26088, 58864, 26105, 58888, 58893, 26132, 58909, 26150, 58923, 26181, 58952, 58953, 58957, 26196, 26231, 59003, 59008, 59012, 26253, 59028, 26268, 59047, 26287, 59063, 26302, 59073, 59077, 26313, 59088, 59092, 26328, 26347, 59126, 59127, 26362, 59398, 59411, 59425, 59429, 26664, 26665, 26669, 59441, 26680, 59478, 59488, 26733, 59508, 59509, 26744, 26749, 26754, 26755, 26758, 59530, 59534, 26775, 59547, 59551, 26785, 26788, 26789, 59560, 59561, 59564, 59565, 26804, 59576, 26822, 26823, 26838, 26852, 59624, 59628, 59629, 26865, 26868, 26869, 59641, 59644, 59645, 59651, 59670, 59681, 59684, 26920, 26921, 26924, 59696, 26937, 59731, 59734, 26988, 59764, 59765, 27001, 27004, 27015, 59787, 27026, 27027, 27030, 59806, 27044, 59816, 59817, 59820, 27057, 27060, 27061, 59832, 59833, 59836, 59837, 27078, 27094, 27095, 27105, 27108, 27109, 59885, 27124, 59896, 59900, 59901, 59905, 59920, 27161, 27178, 27179, 27183, 59972, 59973, 27208, 27209, 27212, 27213, 59988, 27228, 60006, 60007, 27247, 60022, 60023, 27263, 27265, 27268, 27269, 60044, 60045, 27284, 60061, 27298, 60075, 27314, 27318, 27319, 60090, 60091, 27332, 60104, 60109, 27345, 27348, 27349, 60120, 60121, 60124, 27366, 27367, 27382, 27383, 60165, 60180, 27416, 60198, 60199, 27434, 27435, 27438, 60228, 60229, 27464, 27465, 27468, 27469, 60240, 60244, 27485, 60263, 27502, 60274, 60278, 27518, 27524, 60301, 27537, 27540, 27541, 60316, 27554, 27558, 27559, 60334, 27570, 60350, 60351, 27585, 27588, 27589, 60361, 27604, 60376, 27622, 27623, 60394, 60395, 27638, 27639, 60411, 60419, 60434, 60438, 60439, 60449, 60452, 60453, 27689, 27692, 27693, 60464, 60469, 27708, 60498, 60499, 60503, 60513, 27753, 60533, 27769, 27772, 27782, 27783, 60554, 60558, 27798, 60571, 60575, 27812, 60588, 27825, 27828, 27829, 60600, 60601, 60604, 60605, 27842, 27843, 27846, 60623, 27863, 60634, 60638, 27873, 27876, 27877, 60648, 60652, 60653, 27892, 60665, 60668, 60669, 60678, 60691, 60694, 60695, 60708, 60709, 27944, 27948, 27949, 60721, 27965, 60754, 60758, 60759, 60768, 60769, 28008, 60788, 60789, 28024, 28029, 28038, 60811, 60815, 28054, 28055, 60826, 28065, 28068, 28069, 60840, 60841, 60844, 60845, 28084, 60856, 60860, 60861, 28103, 60874, 60878, 28114, 28115, 28118, 60891, 60895, 28132, 60904, 60905, 60908, 60909, 28145, 28148, 28149, 60921, 60924, 60929, 60944, 60948, 28189, 60966, 60967, 28203, 28206, 28207, 60993, 60996, 28232, 28233, 28236, 28237, 61012, 28248, 61031, 28267, 61042, 61046, 61047, 28283, 28292, 28305, 28308, 28309, 28326, 28327, 28342, 28343, 61118, 28353, 28356, 28357, 61133, 28372, 61148, 28386, 61163, 28402, 28406, 28407, 61179, 61189, 61204, 28444, 61222, 28458, 28462, 28463, 61249, 61252, 28488, 28489, 28492, 28493, 61264, 28505, 61282, 61286, 61287, 28522, 61302, 28538, 28545, 28548, 28549, 61325, 28564, 61340, 28582, 28583, 61359, 28598, 28599, 28612, 61385, 61388, 28625, 28628, 28629, 61400, 61405, 28642, 28646, 28647, 61418, 28658, 61434, 61466, 61467, 61484, 61518, 61519, 61534, 61535, 61545, 61560, 61561, 61575, 61590, 61591, 61601, 61617, 61634, 61668, 61669, 61684, 61685, 61707, 61711, 61723, 61741, 61775, 61800, 61830, 61872, 61873, 61906, 61924, 61936, 61940, 29252, 62025, 62028, 29287, 62058, 29302, 62074, 62078, 62079, 29325, 62100, 29340, 62118, 62119, 29358, 29375, 62148, 29385, 29400, 62183, 29418, 62199, 29435, 62216, 62221, 62237, 62250, 29508, 29509, 62280, 62281, 62284, 62285, 29524, 62300, 62301, 29543, 62315, 62318, 62319, 29558, 62331, 62336, 62340, 29580, 29581, 62356, 29596, 29597, 62370, 29614, 62390, 62391, 29631, 62404, 62405, 29640, 29641, 62416, 62417, 62420, 62421, 29656, 29657, 62438, 29674, 62454, 29691, 62730, 62734, 62794, 62810, 62844, 62880, 62884, 62885, 62900, 62935, 62944, 62985, 62988, 30228, 63004, 30247, 63018, 30273, 63048, 63049, 63052, 30322, 63098, 63108, 30344, 63120, 63124, 30361, 63143, 63159, 63168, 63172, 30412, 63185, 63189, 30429, 63206, 63207, 63491, 63510, 30746, 30751, 63521, 63524, 30760, 30761, 30764, 63536, 63571, 63574, 30810, 30815, 30828, 30829, 63604, 63605, 30840, 30841, 30844, 30845, 30850, 63631, 30870, 30871, 63642, 30881, 30884, 30885, 63656, 63657, 63660, 63661, 30897, 30900, 30901, 63672, 63673, 63677, 30918, 30919, 30934, 30945, 30948, 30949, 63721, 63724, 63725, 30961, 30964, 30965, 63740, 63750, 63763, 31003, 31006, 63777, 63781, 31016, 31017, 31021, 63793, 63830, 31067, 31070, 63840, 31084, 31085, 63860, 63861, 31096, 31097, 31100, 31101, 31110, 31111, 63882, 63886, 31122, 63899, 63903, 31137, 31140, 31141, 63913, 31153, 31156, 31157, 63928, 63929, 63932, 63933, 31174, 31190, 31191, 31201, 31204, 31205, 63976, 63980, 63981, 31217, 31220, 31221, 63993, 63996, 63997, 64005, 64020, 64038, 64039, 31274, 31279, 64068, 64069, 31304, 31305, 31308, 31309, 64080, 64084, 64103, 31342, 64114, 64118, 31358, 31364, 64141, 31377, 31380, 31381, 64156, 31394, 31398, 31399, 64174, 64175, 31414, 31415, 64191, 31425, 31428, 31429, 64201, 31444, 64216, 31462, 31463, 64234, 31478, 31479, 64250, 64251, 64257, 64272, 31531, 31534, 64324, 64325, 31560, 31561, 31564, 31565, 64340, 64358, 64359, 31599, 64374, 64375, 31615, 31617, 31620, 31621, 64396, 31636, 64412, 64413, 31654, 31655, 64426, 64427, 31666, 31670, 31671, 64442, 31684, 64456, 64457, 64461, 31697, 31700, 31701, 64473, 64476, 31718, 31719, 31734, 31735, 64518, 64531, 64534, 64535, 31771, 31774, 64548, 64549, 31784, 31788, 31789, 64561, 64594, 64598, 64599, 31835, 31838, 64608, 64609, 31848, 31849, 64628, 64629, 31864, 31865, 31868, 31869, 31878, 31879, 64651, 31894, 64666, 64670, 31905, 31908, 31909, 64681, 64684, 64685, 31921, 31924, 31925, 64696, 64697, 64700, 64701, 31938, 64714, 64718, 31958, 31959, 64731, 64735, 31969, 31972, 31973, 64744, 64749, 31985, 31988, 31989, 64760, 64761, 64764, 64765, 64771, 64786, 64790, 64791, 32026, 32031, 64801, 64804, 64805, 32041, 32044, 32045, 64816, 64821, 64850, 64851, 64855, 32090, 32095, 64865, 32104, 32105, 64885, 32120, 32121, 32124, 32125, 32134, 64906, 64910, 32150, 32151, 64923, 64927, 32161, 32164, 32165, 64936, 64937, 64940, 64941, 32177, 32180, 32181, 64957, 32198, 32199, 64971, 64975, 32210, 64990, 32225, 32228, 32229, 65000, 65004, 65005, 32241, 32244, 32245, 65017, 65020, 65021, 65029, 65044, 65062, 32299, 32302, 65089, 65092, 32328, 32329, 32332, 32333, 65104, 65122, 65126, 65127, 32362, 65142, 32378, 32385, 32388, 32389, 65165, 32404, 65180, 32422, 32423, 32438, 32439, 65214, 32452, 65225, 65228, 32465, 32468, 32469, 65240, 65245, 32482, 32486, 32487, 65259, 32502, 32503, 65275, 65281, 65296, 65300, 65318, 65319, 32554, 32559, 65345, 65348, 32584, 32585, 32588, 32589, 65364, 65383, 32619, 65394, 65398, 65399, 32635, 32644, 32657, 32660, 32661, 32678, 32679, 65455, 32694, 32695, 32705, 32708, 32709, 65485, 32724, 65500, 32742, 32743, 65514, 32754, 32758, 32759, 65530], 570: [32786, 32791, 32801, 32805, 32850, 32855, 32881, 32885, 32910, 32922, 32926, 32937, 32956, 32971, 32991, 33000, 33001, 33021, 33046, 33061, 33073, 33077, 33090, 33091, 33095, 33121, 33125, 33136, 33137, 33163, 421, 33192, 33193, 433, 437, 33208, 33209, 455, 33231, 470, 481, 485, 33256, 33257, 33261, 497, 33272, 33273, 33319, 33330, 574, 575, 33345, 33360, 33361, 33365, 604, 605, 33379, 619, 622, 644, 33416, 33417, 660, 33432, 33433, 690, 695, 708, 33480, 33484, 724, 33518, 33553, 33557, 827, 830, 33601, 33605, 874, 875, 879, 33672, 33689, 33736, 33740, 33741, 33810, 33815, 33825, 33841, 33845, 33874, 33879, 33889, 33893, 33909, 33980, 33994, 33995, 34080, 34081, 34085, 1320, 1321, 34097, 34114, 34118, 34119, 34135, 34149, 34161, 34165, 1414, 34190, 1431, 34207, 1441, 1445, 34216, 34217, 1457, 34232, 34233, 34237, 34250, 1509, 34280, 34281, 1521, 1525, 34296, 34321, 34325, 34369, 34373, 34385, 34389, 34407, 34418, 34445, 34479, 34490, 34494, 34504, 34521, 34576, 34577, 34581, 1820, 1821, 1839, 34610, 34629, 34641, 34645, 34658, 34678, 1924, 34700, 34701, 1940, 34751, 1988, 34761, 2004, 34795, 2034, 2039, 34827, 34830, 34843, 2081, 34857, 34872, 34873, 2134, 34910, 34925, 34940, 34941, 34951, 2187, 34962, 34977, 2217, 34992, 2232, 35045, 35061, 2296, 2297, 35082, 35086, 35087, 35112, 2353, 35128, 35129, 2391, 35202, 35219, 2459, 35232, 35249, 2493, 35301, 2540, 2557, 35337, 2581, 35352, 35353, 2615, 2645, 35416, 35417, 35421, 35439, 2697, 35472, 35476, 2712, 2716, 35491, 35495, 2735, 35506, 35510, 2746, 2760, 2764, 35541, 2777, 2781, 2794, 35571, 35592, 35596, 2833, 35608, 35609, 2855, 2870, 2897, 35672, 35673, 35677, 35690, 35711, 35712, 2952, 2956, 2957, 35729, 35732, 2969, 2973, 35746, 35750, 2986, 2991, 35763, 3017, 35793, 35797, 3032, 3036, 3037, 35827, 35851, 35854, 3095, 35871, 35880, 35884, 35885, 3125, 35896, 35901, 35914, 35930, 35944, 35945, 35960, 35961, 3244, 36021, 36034, 36038, 36039, 3274, 36054, 36064, 36065, 3308, 3309, 36081, 36111, 3350, 3365, 36201, 36261, 3496, 3497, 36277, 36306, 3546, 36321, 3561, 36336, 36337, 3576, 36360, 36361, 36364, 3605, 36376, 36377, 36381, 36398, 3634, 36415, 3669, 36441, 3687, 36485, 3721, 36501, 3736, 3740, 3741, 36514, 36544, 3784, 3788, 3789, 36561, 36564, 36565, 3801, 3805, 36578, 36595, 3839, 36617, 36621, 3857, 36632, 36633, 36637, 36670, 3921, 36696, 3942, 3976, 3980, 36753, 3993, 3997, 36787, 4026, 36801, 4041, 36816, 36817, 4056, 4060, 36835, 36850, 36854, 4095, 36887, 4123, 4126, 4127, 36901, 4136, 4140, 4141, 36946, 4186, 4187, 4190, 36977, 4220, 4226, 37019, 4261, 4273, 4277, 37049, 4290, 4295, 4306, 37086, 4321, 4325, 37101, 4337, 37123, 37126, 4363, 4367, 37143, 37153, 37157, 4393, 4396, 4397, 37173, 4408, 4413, 37186, 37187, 37190, 37191, 4426, 4427, 4430, 37217, 4456, 4457, 4460, 37232, 37233, 37237, 4472, 4473, 4476, 4477, 4486, 4499, 4502, 37275, 37288, 37289, 37304, 37305, 37326, 4576, 4577, 37352, 37353, 37356, 4592, 4593, 37368, 37369, 37372, 37393, 37397, 4633, 4636, 4637, 37415, 37441, 37456, 4696, 4697, 4701, 4736, 37512, 37513, 4753, 37528, 37529, 37581, 37593, 37596, 37597, 4851, 4854, 37633, 37637, 4873, 4876, 4888, 4893, 37697, 37701, 37713, 37717, 4953, 4956, 37746, 37769, 37784, 37822, 37849, 37852, 37853, 37906, 37907, 37910, 5146, 5147, 5150, 37921, 37937, 37971, 37974, 37975, 5211, 5214, 5215, 37989, 38005, 38046, 38047, 5281, 5285, 5297, 5349, 5361, 5365, 38137, 38147, 38150, 5386, 5390, 38176, 38177, 5416, 5417, 5421, 38193, 38197, 5433, 5436, 38210, 38211, 38214, 38215, 5451, 5454, 5455, 38230, 38241, 38245, 5480, 5484, 5485, 38261, 5496, 5497, 5500, 5501, 5507, 5523, 5526, 38302, 5536, 38312, 38313, 38316, 5552, 38328, 38332, 38362, 5605, 38376, 5621, 38392, 38393, 38401, 38405, 5644, 38417, 5656, 5657, 5660, 5661, 38435, 38465, 38469, 38485, 5720, 5721, 5725, 38498, 38503, 38515, 5761, 5777, 5781, 38556, 38557, 38574, 5841, 5845, 38616, 38617, 5874, 5900, 38672, 38673, 5912, 5913, 5917, 38706, 38725, 38741, 5977, 5980, 5981, 38755, 38774, 6011, 6033, 6037, 38812, 38813, 6080, 6085, 38856, 6097, 6101, 38872, 38873, 6115, 38907, 38922, 6162, 6167, 6176, 38952, 6193, 38968, 38969, 6226, 6231, 39007, 6245, 39042, 39047, 6282, 39059, 39062, 6299, 39072, 6312, 6313, 39089, 6328, 6329, 6366, 39141, 6381, 39157, 6397, 6403, 39179, 39182, 6423, 39195, 6433, 39209, 39224, 39225, 39247, 6482, 39262, 39277, 6517, 39292, 39302, 6539, 39314, 39318, 39319, 6554, 6558, 6559, 39329, 6568, 6569, 39344, 6584, 6585, 6606, 6633, 39413, 6649, 6652, 6661, 39432, 39436, 39448, 39449, 6721, 6736, 39512, 39513, 6758, 39534, 39552, 39556, 6792, 6793, 39569, 6808, 6809, 39586, 6831, 39603, 39617, 6877, 6890, 6913, 39689, 39692, 39693, 39704, 39705, 39742, 6977, 6992, 39768, 39769, 39772, 39791, 7031, 7048, 7049, 39824, 7064, 7065, 39843, 39858, 39862, 39863, 7102, 39873, 39877, 39893, 7133, 39907, 39923, 7171, 7174, 7175, 39946, 39947, 39951, 7186, 7205, 39981, 7255, 40040, 7280, 7281, 40056, 7326, 7327, 40101, 40131, 40146, 40161, 7401, 7404, 7405, 40176, 40177, 7417, 7420, 7421, 40203, 40206, 7442, 7461, 40233, 40236, 40253, 7511, 40282, 40296, 7537, 40313, 7566, 7567, 40357, 40373, 7613, 40386, 7642, 7643, 40416, 40417, 7656, 7660, 7661, 40433, 7676, 7677, 7685, 40457, 40461, 7696, 7697, 40472, 40476, 7730, 40510, 7749, 40521, 7761, 40536, 40537, 40575, 7821, 40597, 7833, 7836, 40610, 40627, 7867, 40641, 40644, 40645, 7881, 7884, 7885, 40656, 40661, 7896, 7900, 40675, 40679, 7918, 7919, 40690, 40694, 7935, 7937, 40716, 7952, 7957, 40729, 40732, 40750, 7986, 40767, 8005, 40777, 8021, 40793, 40827, 40831, 40833, 8077, 40849, 40853, 8089, 8092, 8123, 40896, 40900, 40901, 8137, 8140, 40913, 8152, 8156, 8157, 40930, 40934, 8174, 8175, 40947, 8191, 40981, 8216, 8220, 8221, 40999, 8235, 41041, 8280, 8281, 8284, 41074, 8315, 8321, 8325, 41097, 41100, 41101, 8341, 41112, 41116, 41117, 41135, 8370, 8375, 8385, 8389, 41160, 41161, 41164, 8401, 41176, 41177, 41181, 41210, 41221, 8456, 41236, 41254, 41255, 41281, 8520, 8521, 8524, 8541, 41314, 41318, 41319, 8555, 8558, 8559, 41330, 41331, 8570, 8571, 8574, 8576, 8581, 8593, 8597, 41391, 41407, 8641, 41421, 8657, 8661, 41436, 41437, 41450, 41451, 8691, 8694, 41466, 41479, 41494, 41495, 8735, 8745, 41539, 8850, 8929, 41704, 41705, 41709, 8945, 41721, 41724, 41794, 41814, 41815, 41824, 41825, 41841, 41886, 41897, 41930, 41934, 41947, 41951, 41961, 42001, 42019, 42034, 42069, 42087, 42102, 42121, 42125, 42137, 42140, 42154, 42159, 42171, 42174, 42185, 42200, 42204, 42238, 42241, 9484, 9501, 42294, 42295, 9534, 42309, 9544, 9548, 9549, 42324, 9579, 42358, 42359, 9595, 9598, 9601, 42380, 9617, 9621, 42397, 9664, 9669, 9681, 9685, 9699, 42474, 42478, 42479, 42494, 42495, 42514, 42518, 42519, 42544, 42545, 42567, 42597, 42613, 42638, 42639, 42650, 42651, 42654, 42655, 42664, 42669, 42684, 42698, 42699, 42703, 42714, 42715, 42732, 42733, 42745, 42748, 42749, 42754, 9995, 42770, 42771, 42801, 42822, 42838, 42839, 10078, 42853, 10088, 10092, 10093, 10105, 10108, 10109, 10115, 10131, 42906, 42921, 42936, 42937, 42954, 42955, 10194, 10199, 42970, 42971, 10213, 42984, 42988, 42989, 10229, 43001, 43004, 43005, 10241, 43017, 43020, 43021, 10256, 10309, 43081, 43085, 43100, 10342, 43118, 43119, 43137, 10377, 10380, 10381, 43152, 43171, 43175, 43186, 43190, 43191, 43205, 10440, 10441, 10460, 43234, 43235, 43251, 43255, 43272, 43276, 43277, 10513, 43326, 43337, 43340, 10581, 43357, 43370, 43371, 43374, 43375, 10611, 43386, 43392, 10633, 43409, 10652, 10653, 43426, 43443, 43461, 10700, 43477, 10712, 43490, 43491, 43506, 43507, 43535, 43551, 43577, 10822, 10823, 43594, 43599, 43624, 43629, 10865, 10868, 43641, 43651, 43655, 43666, 43684, 43696, 10936, 10940, 10941, 43731, 43744, 43745, 43765, 11015, 43807, 11078, 11079, 43851, 43854, 11108, 43884, 11121, 43896, 43897, 43906, 43910, 43911, 43923, 43936, 11176, 11180, 11181, 43956, 43971, 11215, 43991, 11231, 44001, 44016, 11269, 44040, 44041, 44044, 11285, 44061, 44090, 44094, 11329, 44105, 11344, 11345, 44138, 44139, 44143, 11379, 44154, 44155, 44165, 11400, 11401, 44181, 11420, 44211, 44225, 11465, 11469, 44240, 44241, 44258, 11498, 44275, 44296, 44297, 44301, 11541, 44316, 44317, 44347, 44351, 44360, 44364, 11601, 44394, 44395, 11639, 44410, 44411, 11660, 11661, 44437, 11672, 11676, 11677, 44451, 44471, 44480, 44481, 11721, 44497, 11736, 44515, 44519, 44530, 44534, 44570, 44571, 44584, 44585, 44589, 44601, 44634, 44638, 44639, 11876, 11877, 44652, 44653, 44664, 44668, 44669, 44674, 44675, 44690, 44691, 44704, 44705, 44721, 44738, 11978, 44755, 44759, 44772, 12009, 12012, 12013, 44784, 44785, 44789, 12024, 12028, 12029, 44810, 44826, 44841, 44844, 12099, 44878, 44894, 44895, 12132, 12133, 44905, 44908, 44909, 44921, 44924, 44925, 44931, 44935, 44946, 44947, 44965, 44976, 44995, 12235, 45010, 45014, 45024, 45025, 45029, 12264, 12268, 12269, 45044, 45045, 12281, 12284, 45056, 45073, 45077, 45090, 45095, 45137, 45141, 45170, 45226, 45231, 45243, 45261, 45276, 45306, 45313, 45317, 12553, 45328, 45377, 45381, 45410, 45414, 45415, 12655, 45426, 45427, 12673, 12677, 12693, 12737, 12741, 45516, 45517, 12753, 45532, 45533, 45546, 45547, 45562, 45570, 45575, 12814, 12831, 45635, 45668, 12904, 12905, 45685, 12930, 45736, 45740, 45741, 45753, 45756, 45757, 12999, 45774, 13010, 45791, 45800, 45801, 45804, 45816, 45817, 45821, 45872, 45890, 45910, 45911, 45920, 45921, 45925, 45940, 45941, 45993, 46008, 46031, 46046, 46061, 46072, 46097, 46101, 13341, 46115, 13359, 46130, 13374, 46144, 46161, 46165, 13401, 46183, 46198, 13441, 46216, 46217, 13457, 13461, 46232, 46233, 13478, 46250, 46254, 13495, 46267, 46271, 13509, 13521, 13525, 46300, 46301, 46319, 13554, 46334, 46337, 46341, 13581, 46390, 46391, 13630, 46401, 46405, 46416, 46434, 46435, 46450, 46451, 13697, 13701, 46477, 13713, 46492, 13761, 13765, 46536, 13781, 46553, 46570, 46571, 46586, 46587, 13835, 46610, 46614, 46615, 13850, 13851, 46628, 13865, 46640, 46641, 46645, 13880, 13881, 13885, 46663, 46674, 46675, 46688, 46689, 13933, 46704, 46705, 46709, 13954, 46730, 46747, 13985, 13988, 13989, 14001, 14034, 46824, 46828, 46829, 14065, 14069, 46841, 46844, 46845, 46850, 14090, 46866, 46867, 46885, 14121, 46900, 46901, 14136, 14137, 46918, 46930, 46931, 14174, 46944, 46945, 46949, 14188, 46987, 47002, 14241, 14245, 47016, 47017, 47021, 14260, 47032, 47033, 47036, 14274, 14309, 47081, 47084, 47085, 14321, 14325, 47096, 47100, 47101, 14353, 14391, 47176, 47177, 14421, 47197, 14434, 47210, 47227, 47232, 14476, 14477, 47249, 47266, 47270, 47283, 14527, 14537, 14540, 47317, 14557, 47330, 47331, 47335, 47347, 14593, 14647, 47432, 47433, 47452, 47467, 47482, 47489, 47504, 14744, 14748, 14749, 47523, 47538, 47542, 47557, 14797, 47573, 14808, 14809, 47587, 14826, 47603, 47607, 14843, 14855, 47626, 47656, 47660, 47661, 14900, 47673, 47690, 47694, 47736, 47737, 47741, 47746, 47750, 47763, 47776, 15017, 47796, 15033, 47811, 47831, 15067, 47840, 47844, 47845, 47861, 15097, 15110, 47883, 47886, 47913, 47916, 47917, 15156, 47928, 47947, 47951, 47992, 47993, 47996, 48003, 15247, 48018, 48022, 48036, 15273, 48048, 48071, 48083, 15322, 48101, 48112, 48113, 48116, 48141, 48156, 48157, 15399, 48174, 15414, 48191, 48204, 48205, 48216, 48261, 15497, 48277, 15517, 48291, 48311, 48320, 48321, 15565, 48337, 48355, 48370, 48374, 15621, 48396, 48412, 48413, 48431, 15670, 48446, 48473, 48517, 15768, 15769, 48551, 48563, 48577, 48592, 48593, 15832, 48610, 48614, 48627, 15874, 48651, 15890, 48667, 48680, 48681, 48684, 15925, 48697, 48719, 48730, 48731, 15973, 48744, 48748, 48749, 48761, 48764, 48765, 48771, 48775, 48787, 16026, 48800, 48801, 48804, 48821, 16061, 48835, 16075, 48850, 48854, 16090, 48864, 48865, 48869, 16109, 48881, 48884, 16125, 16146, 48922, 48923, 48936, 48937, 48941, 16177, 48956, 48974, 48986, 48987, 16225, 49001, 49004, 49005, 49016, 49020, 49021, 49027, 16270, 49042, 49043, 49047, 16283, 49061, 16297, 49072, 49076, 49077, 49090, 49094, 16330, 49107, 16347, 49121, 49124, 16361, 49136, 49137, 49141, 49170, 49185, 49239, 49269, 49295, 49324, 49354, 49400, 49411, 49414, 49430, 16666, 49441, 49445, 49457, 49474, 49475, 49478, 49479, 16714, 16715, 16718, 16719, 49509, 49521, 49525, 49551, 49566, 16801, 16805, 16817, 49596, 49611, 16850, 49626, 16869, 49641, 16881, 16885, 49657, 49660, 49681, 49685, 49703, 49714, 49733, 49779, 49800, 49804, 49816, 49864, 49921, 49925, 49985, 49989, 17224, 17225, 17228, 17229, 50001, 50005, 50034, 17274, 17275, 17278, 17279, 17281, 17285, 50057, 17297, 17301, 17318, 17335, 17345, 17349, 50120, 50121, 17361, 17365, 17394, 50174, 50195, 50198, 50199, 17434, 17435, 17438, 17439, 50213, 17448, 17449, 17452, 17453, 50229, 50258, 50259, 50262, 17498, 17499, 17502, 17503, 50273, 17512, 17513, 17516, 17517, 50289, 17528, 17529, 17532, 17533, 17539, 17542, 17555, 17558, 17573, 50344, 50345, 17589, 17603, 17606, 17619, 17622, 17632, 17633, 17648, 17649, 50435, 50438, 50469, 50481, 50485, 50498, 50499, 50502, 50503, 17738, 17739, 17742, 17743, 50519, 17755, 50529, 50533, 50545, 17794, 50570, 50571, 50587, 17829, 50601, 50604, 17841, 17845, 17889, 17893, 50668, 17905, 50689, 50693, 50709, 17962, 17963, 17966, 17967, 50753, 50757, 17992, 17993, 17996, 17997, 50769, 50791, 18026, 18031, 18049, 18053, 50825, 18065, 18069, 50844, 18083, 18098, 18113, 18117, 50893, 18129, 18133, 18150, 18167, 50965, 50979, 50994, 51009, 18248, 18249, 18252, 18253, 51025, 18303, 18304, 18320, 18321, 18373, 51148, 51149, 51160, 51164, 51165, 51183, 18422, 51210, 51215, 51231, 51240, 51257, 18503, 51290, 18529, 51305, 18544, 51346, 18590, 18591, 51381, 51399, 51424, 51425, 51440, 18680, 18681, 51467, 51486, 18725, 51496, 18759, 18771, 51547, 51564, 18800, 18801, 18830, 18831, 51603, 51621, 51637, 18877, 51670, 51671, 18920, 18921, 51697, 51720, 51724, 18961, 18982, 18983, 19009, 19013, 51784, 51785, 19029, 51801, 19058, 51857, 19114, 19119, 51891, 19130, 19134, 51908, 19144, 19145, 51942, 19198, 19199, 51977, 51980, 51981, 19217, 51996, 19238, 19239, 52014, 52027, 19265, 19269, 52040, 52041, 19285, 19298, 19315, 52101, 52113, 52117, 52131, 19370, 19374, 52151, 19386, 19391, 52180, 19416, 19417, 19438, 19439, 52215, 52234, 52235, 52239, 19475, 52251, 19489, 52264, 52280, 52281, 19522, 19573, 52348, 52349, 52385, 19624, 19625, 52401, 19678, 19679, 52453, 52469, 19708, 52491, 52494, 52506, 19778, 19813, 52600, 52604, 52630, 52641, 19918, 19919, 52709, 52749, 19989, 52761, 20032, 20033, 20037, 20049, 52828, 20086, 20087, 52864, 52865, 52869, 52881, 52885, 20120, 20121, 52902, 20158, 20159, 52933, 20189, 52962, 52963, 52979, 52983, 20219, 53000, 53004, 20245, 53017, 53020, 20259, 53054, 20288, 20289, 20293, 20305, 20327, 20342, 20343, 53118, 53120, 53121, 20360, 20361, 53141, 20398, 20399, 53175, 53185, 53189, 20428, 53201, 53218, 53219, 53223, 20459, 53234, 53235, 20475, 53266, 53271, 20506, 20507, 20511, 53281, 53285, 20520, 20521, 20525, 53330, 53335, 20570, 20574, 20575, 53361, 53365, 20601, 20610, 53386, 53390, 20626, 20631, 53402, 20641, 20645, 53416, 53417, 20657, 53455, 20690, 53471, 20709, 53480, 20721, 20725, 53500, 53501, 20747, 20751, 53527, 53537, 20776, 20777, 20780, 53553, 53557, 20792, 20797, 53570, 53574, 53575, 20810, 20814, 20815, 53601, 53605, 20841, 20844, 20845, 53621, 20856, 20857, 20860, 20861, 20867, 20870, 53646, 20883, 53663, 20896, 20912, 53706, 53723, 20965, 53741, 20981, 53752, 21016, 21017, 21020, 53810, 53829, 53841, 53845, 21080, 21084, 21085, 21125, 53897, 53913, 53917, 21200, 53977, 21219, 21257, 21260, 54033, 54037, 21272, 21277, 54081, 54085, 21337, 21340, 54114, 54168, 54172, 54221, 54233, 54254, 54290, 54295, 21530, 21534, 21535, 54309, 54321, 54325, 54354, 54359, 21594, 21595, 21599, 54369, 54373, 54385, 21669, 21681, 21685, 21729, 21733, 54508, 54509, 21745, 54524, 54525, 21770, 21774, 54561, 54565, 21800, 21804, 21805, 54581, 21817, 21820, 54594, 54595, 54599, 21834, 21835, 21839, 54614, 54625, 21864, 21865, 21869, 54641, 54645, 21880, 21881, 21884, 21885, 21891, 21894, 54666, 54667, 21910, 54682, 54696, 54717, 21984, 21985, 22000, 22001, 54781, 22025, 54801, 54805, 22040, 22041, 22044, 22045, 54834, 54849, 54853, 54865, 54869, 22104, 22108, 22109, 54887, 22145, 22149, 54921, 54925, 22165, 54936, 54937, 22209, 22213, 55004, 22281, 55057, 55061, 22296, 22300, 22301, 55074, 55090, 55105, 55121, 55125, 22360, 22361, 22364, 22399, 22401, 22405, 55177, 22416, 55193, 22450, 22465, 22469, 55241, 22481, 55307, 55310, 22546, 22565, 55337, 22615, 55387, 55401, 55405, 22641, 55417, 22667, 22670, 22671, 22682, 55461, 22696, 22697, 22713, 22717, 22746, 22747, 22760, 55537, 22776, 22787, 22790, 22791, 55562, 55566, 55567, 22802, 22807, 55583, 55593, 55596, 55597, 22837, 55608, 55612, 22866, 22871, 55642, 55643, 22881, 55656, 55657, 22896, 55673, 22923, 55698, 22938, 22939, 55717, 22952, 22953, 22956, 55733, 22968, 22969, 22972, 22986, 22987, 55767, 55776, 55777, 55792, 23045, 55817, 55821, 23056, 55837, 55867, 23109, 55896, 55941, 23176, 23177, 23181, 23192, 23193, 55971, 55991, 23241, 23256, 56038, 23294, 23297, 56072, 23312, 56110, 23365, 56157, 56171, 56193, 56197, 23432, 23433, 23437, 23448, 23449, 23452, 56231, 56243, 23500, 56311, 23550, 23555, 56334, 23575, 56346, 23585, 56381, 23634, 23669, 56441, 23706, 23707, 56481, 23721, 23724, 56497, 23740, 23754, 23755, 23758, 23759, 23774, 23775, 56549, 23788, 23789, 56565, 23804, 23805, 56586, 56591, 23831, 56603, 23840, 23841, 56633, 23890, 56684, 23925, 23946, 23947, 23976, 56753, 24014, 24015, 24030, 24031, 24044, 56821, 24061, 24069, 56840, 56841, 56844, 24081, 56856, 56861, 56894, 24129, 56908, 56909, 24144, 24145, 24182, 56961, 56965, 24200, 56976, 56980, 56998, 24239, 57029, 24269, 57045, 24284, 24285, 57058, 57059, 24298, 24299, 24302, 57075, 24318, 24319, 24321, 57097, 57101, 24341, 57112, 57147, 24385, 57164, 57165, 24400, 24405, 57181, 24423, 57217, 57220, 24456, 57232, 57233, 24494, 57281, 24524, 24541, 57315, 24558, 24559, 57331, 57335, 24570, 24571, 57361, 57429, 57463, 57484, 57485, 57500, 57501, 57531, 57544, 57545, 57560, 57561, 57582, 57601, 24856, 24874, 57669, 24904, 24908, 24909, 57702, 57703, 24939, 24942, 24943, 24961, 57741, 24977, 24981, 57786, 25029, 57801, 25041, 25045, 57816, 57838, 25074, 57998, 58014, 58058, 25418, 25419, 58198, 58199, 25434, 25435, 25438, 25439, 58213, 25448, 25452, 25453, 58229, 25464, 25465, 25468, 25469, 25479, 58255, 25495, 58270, 25505, 25508, 25509, 25521, 58314, 58315, 25554, 58330, 58331, 25585, 25589, 58389, 25624, 25628, 25629, 25642, 25643, 25658, 25677, 58449, 25688, 25689, 25692, 25729, 25733, 58508, 58509, 25744, 25749, 25763, 25778, 25793, 25797, 58568, 58569, 25809, 25830, 25847, 58629, 58678, 58679, 58689, 25928, 25929, 25932, 25944, 25967, 25979, 25989, 58761, 26001, 26005, 58799, 26049, 58829, 26065, 26069, 58844, 58875, 26127, 58902, 58903, 26138, 26139, 26142, 26143, 26152, 26153, 26156, 26157, 58933, 26168, 26172, 26173, 58977, 26216, 26217, 26221, 58993, 26246, 26277, 59052, 59053, 26289, 26293, 59064, 59069, 26336, 26337, 26341, 59113, 59117, 26352, 26353, 26356, 59128, 59129, 59132, 59143, 26382, 26408, 26412, 26413, 59189, 26428, 26459, 26463, 59233, 26488, 26489, 26493, 26498, 26503, 26533, 59304, 26545, 26549, 59321, 26592, 26593, 26596, 26597, 59372, 26608, 26609, 59389, 59404, 59405, 59421, 59438, 59454, 59455, 26689, 59468, 59469, 59481, 26743, 59525, 59541, 26780, 59554, 26799, 59584, 59585, 26828, 59600, 59622, 59639, 59660, 59661, 26901, 59676, 26918, 26935, 59710, 59711, 26944, 26961, 59736, 26995, 27020, 59797, 27032, 27033, 59810, 27054, 59827, 27067, 27071, 59840, 59856, 59857, 27097, 27100, 27101, 59878, 59895, 59914, 27158, 59930, 27237, 60009, 60013, 27249, 60024, 27279, 27294, 60064, 60065, 27304, 27309, 60080, 60084, 60085, 60102, 60118, 27369, 27373, 60148, 27384, 27389, 27428, 27458, 60255, 27493, 60264, 60268, 60269, 27505, 60281, 60291, 27534, 60307, 27547, 60320, 60321, 60324, 60336, 27581, 60359, 27594, 60375, 60388, 27628, 27641, 27644, 27645, 60424, 60425, 60441, 60458, 60475, 27717, 60488, 60489, 60509, 60544, 60545, 27788, 27789, 60560, 60561, 60582, 60613, 27849, 27853, 60659, 60680, 60681, 60714, 60730, 60800, 60801, 60816, 60817, 28057, 60838, 60855, 60869, 60885, 60915, 28167, 28196, 28197, 28213, 61019, 28256, 28261, 61032, 61033, 28272, 28273, 28276, 61052, 61062, 61078, 28332, 28333, 61105, 61108, 61109, 28348, 28349, 61122, 61138, 61152, 61153, 28392, 28393, 61168, 61169, 61172, 28408, 28409, 28412, 28422, 61199, 61214, 28452, 28453, 28465, 28487, 28503, 28512, 28513, 28517, 61289, 61292, 28528, 28529, 61309, 61335, 61345, 61348, 61349, 28584, 28588, 28589, 61365, 28601, 28604, 61395, 61408, 61412, 61413, 28648, 28649, 28652, 61424, 28664, 28665, 28668, 61440, 61457, 61461, 28696, 28697, 28701, 61479, 28719, 61521, 61525, 28761, 28764, 28765, 61554, 28799, 28801, 61577, 61580, 61581, 28817, 28821, 61592, 61593, 61596, 61597, 28869, 61640, 61641, 61644, 61645, 28881, 28885, 61656, 61657, 61660, 28914, 28919, 61697, 61701, 61712, 28953, 28970, 61761, 61765, 29001, 29004, 29005, 61794, 61795, 61798, 61799, 29034, 29035, 29038, 29039, 29057, 29061, 29073, 61853, 61882, 29121, 29125, 61896, 29136, 29141, 61913, 29155, 61959, 29228, 62019, 62064, 62065, 29305, 29413, 29429, 62274, 29514, 62294, 62295, 29530, 29531, 29534, 29535, 62304, 62305, 62309, 29545, 62321, 29560, 29574, 29601, 29605, 62377, 29620, 62396, 29669, 29681, 29685, 62460, 62481, 62485, 29721, 29724, 29725, 62499, 29739, 62514, 29768, 29769, 29772, 62545, 62549, 29784, 29785, 29789, 62567, 62582, 29824, 62600, 62604, 29841, 62616, 62617, 62638, 62639, 62654, 62655, 62664, 62665, 62668, 62669, 29909, 62685, 62698, 62699, 29942, 62714, 62715, 62721, 62725, 62774, 62775, 62785, 62789, 30024, 30025, 30029, 62800, 30041, 30063, 62834, 30075, 30079, 30081, 30085, 30096, 30101, 62873, 62894, 30130, 30145, 30149, 62924, 30161, 62941, 62971, 62994, 62995, 62998, 62999, 30234, 30235, 30238, 30239, 30248, 63024, 63025, 63029, 63047, 63077, 30312, 30313, 30316, 30317, 63089, 63093, 30333, 30338, 30343, 30373, 63144, 63148, 63149, 30385, 30389, 63164, 63165, 30423, 30432, 30433, 30436, 30437, 63208, 30448, 30449, 63224, 63229, 63234, 63264, 63265, 30505, 63281, 63302, 63314, 30559, 63329, 63333, 30573, 30584, 30585, 30588, 30589, 63401, 30688, 30689, 30704, 30705, 63497, 63500, 63501, 30741, 63516, 30784, 63560, 30801, 63576, 30823, 63621, 30856, 63636, 63637, 30877, 63667, 30920, 63697, 30955, 63752, 63753, 63756, 63757, 63773, 31041, 63816, 63817, 63820, 63821, 31056, 63833, 31075, 63876, 63877, 31117, 31128, 31132, 31166, 63937, 31196, 31197, 31265, 31268, 64057, 31298, 64078, 64079, 64094, 31329, 64104, 64109, 31348, 31349, 64131, 64165, 31401, 64181, 31416, 31417, 31421, 64228, 31464, 64241, 64244, 31511, 31521, 31555, 64334, 64335, 31585, 64365, 31604, 31605, 64387, 31646, 64421, 31656, 31657, 31661, 64433, 31672, 31673, 64481, 64484, 64500, 31736, 64520, 64521, 64524, 64525, 31761, 64536, 31779, 64588, 64589, 31829, 64604, 31858, 64641, 31880, 31881, 31884, 31885, 64657, 31896, 31944, 31945, 64724, 64725, 31961, 31964, 31983, 31998, 64776, 64777, 64780, 32016, 32017, 32069, 64841, 64845, 32085, 32114, 64897, 64913, 32156, 32157, 64964, 64965, 32201, 64981, 32220, 64995, 65011, 65055, 65081, 32326, 32327, 65098, 65099, 32342, 32352, 32353, 32356, 65128, 65129, 32368, 32373, 65185, 65188, 65189, 32424, 65201, 65204, 65235, 32475, 65249, 32488, 32489, 32492, 65269, 32504, 32505, 32509, 65340, 32582, 32583, 65354, 65355, 65371, 32608, 32609, 65384, 65385, 65389, 32624, 32628, 32629, 65404, 32667, 65444, 32681, 65457, 65460, 65461, 32696, 32714, 32718, 65509, 32744, 32745, 32749, 65525, 32760, 32761, 32764], 687: [32794, 32795, 32812, 32813, 32862, 32863, 32888, 32903, 32929, 32945, 32962, 32978, 32997, 33013, 33035, 33039, 274, 278, 33051, 289, 293, 33065, 33069, 305, 33080, 33081, 33099, 33103, 343, 33118, 33119, 353, 33128, 33129, 373, 33144, 33145, 33185, 33189, 33200, 33201, 33205, 440, 444, 33239, 478, 33249, 488, 489, 33264, 33269, 504, 505, 529, 532, 33304, 33305, 33309, 546, 551, 33322, 562, 33339, 33343, 577, 580, 581, 33356, 33357, 596, 597, 33368, 33369, 33373, 614, 615, 33387, 33390, 33391, 626, 630, 631, 33403, 33409, 33424, 33425, 33429, 665, 33459, 699, 33473, 33477, 712, 713, 716, 33489, 33493, 728, 729, 750, 33527, 33544, 33549, 785, 33560, 33561, 802, 33579, 33582, 33583, 33594, 33595, 33598, 836, 33613, 853, 33624, 33625, 33628, 33629, 870, 871, 33642, 33646, 886, 887, 33658, 33659, 33662, 33663, 33665, 33668, 33669, 909, 33680, 33684, 924, 33703, 939, 33714, 33719, 958, 33728, 33729, 33732, 33733, 968, 969, 33745, 33749, 984, 985, 33767, 1007, 33782, 33783, 1018, 33818, 33822, 33823, 33837, 33866, 33867, 33882, 33883, 33887, 33953, 33957, 33969, 33973, 34017, 34021, 34033, 34037, 34058, 34062, 1302, 34078, 34079, 1317, 34088, 1329, 1333, 34104, 34105, 34109, 34122, 34126, 1363, 1367, 34138, 1377, 34152, 34153, 1397, 34173, 34198, 1439, 34208, 34209, 34213, 1448, 1449, 1452, 34225, 34229, 1464, 1465, 34272, 34273, 1516, 1517, 34293, 1532, 1533, 34312, 34316, 34328, 34329, 34332, 34347, 34350, 34351, 34362, 34366, 34392, 34393, 34411, 34414, 34415, 34426, 34431, 34433, 34437, 34471, 34486, 34496, 34497, 34501, 34513, 34517, 34546, 34568, 1812, 34584, 34585, 34589, 1827, 1831, 34602, 1842, 1847, 34622, 34623, 1857, 1861, 1876, 34648, 34649, 34653, 34670, 1907, 34686, 34689, 34693, 34705, 34709, 1944, 34726, 34752, 34753, 34757, 1992, 34769, 34773, 2009, 2012, 34819, 34822, 34823, 34835, 2075, 34849, 34853, 2092, 34865, 34868, 2109, 2126, 2127, 34903, 2142, 34913, 34917, 2153, 34929, 34933, 2179, 2195, 34971, 2213, 34984, 34985, 35000, 35001, 2246, 2276, 2277, 35052, 35053, 2292, 2293, 35068, 35090, 2330, 35104, 35105, 2344, 2345, 35120, 35121, 35125, 2382, 2383, 35158, 35169, 35173, 35189, 2429, 2439, 35211, 35226, 2465, 35240, 35241, 35256, 35257, 2532, 2533, 2548, 2549, 35321, 35333, 35345, 2585, 2589, 35379, 35383, 35393, 35397, 2632, 2633, 2637, 35408, 35409, 35413, 2648, 2652, 35431, 2671, 2686, 2689, 2709, 35480, 35481, 2722, 2727, 2738, 2743, 35514, 2753, 2756, 35529, 2769, 2772, 2773, 2790, 2791, 35566, 35585, 35600, 35601, 35605, 2840, 2841, 2844, 35639, 2874, 35653, 2888, 2889, 35669, 2905, 2909, 35686, 35687, 2926, 2943, 2948, 2949, 2961, 2978, 2982, 35754, 2994, 2998, 35771, 3012, 3013, 35785, 35789, 3025, 3028, 3046, 3047, 3063, 35838, 35839, 35846, 35862, 3103, 35877, 3113, 35888, 35889, 35892, 35893, 3128, 3146, 3147, 35922, 3162, 35936, 35937, 35941, 35952, 35953, 35957, 3197, 3207, 3236, 36009, 3249, 3252, 36029, 3266, 36043, 36047, 3282, 3297, 36072, 36073, 3313, 36092, 36099, 36119, 36129, 36133, 36149, 3388, 3389, 3402, 3403, 36179, 3419, 36193, 3433, 36209, 36213, 3492, 3508, 3509, 3526, 36302, 36319, 3553, 3569, 36357, 36369, 36373, 3608, 3612, 3630, 36406, 36417, 3656, 3657, 3661, 36432, 36433, 36437, 3673, 3677, 36451, 3691, 3695, 3706, 3717, 3729, 36505, 3750, 3751, 36526, 36527, 3766, 3767, 3777, 3780, 3781, 36556, 3793, 3796, 36586, 36590, 3826, 3827, 3831, 36603, 36606, 36609, 36624, 36625, 36629, 3864, 3865, 3869, 3887, 36659, 36662, 3898, 36673, 36677, 3912, 3913, 36689, 36693, 3928, 3932, 3963, 3969, 3972, 3989, 4006, 4007, 4022, 4023, 36798, 36799, 4033, 4036, 4052, 4053, 36843, 4083, 36862, 4114, 36890, 36891, 4129, 36908, 36909, 4183, 36958, 36959, 4213, 36985, 37015, 37025, 37041, 37058, 37074, 37093, 37109, 4354, 4355, 4358, 37130, 37131, 37134, 4375, 37146, 4384, 4388, 37160, 37161, 37164, 4400, 37176, 37177, 4418, 4422, 4423, 37194, 37198, 37199, 4438, 4439, 37214, 37215, 4448, 4452, 4453, 37224, 37225, 37228, 4465, 4468, 4469, 37240, 37241, 37244, 4494, 4495, 4510, 4511, 37280, 37281, 4521, 4524, 4525, 37297, 37301, 4536, 4537, 4540, 4541, 37319, 4554, 4558, 4559, 37334, 4571, 4574, 37344, 4584, 37361, 37365, 4601, 4609, 37389, 4624, 37400, 37401, 37404, 37419, 37422, 4659, 4662, 37434, 37439, 4677, 37452, 37453, 4692, 37464, 37465, 37468, 4707, 4710, 4711, 37483, 37486, 37487, 4726, 37498, 37505, 37509, 4744, 4745, 37520, 37521, 4760, 37539, 37554, 4794, 4795, 37568, 37573, 4813, 37585, 37589, 4828, 4829, 37607, 4846, 4862, 4865, 4869, 37641, 37644, 4880, 37656, 37657, 37674, 37678, 37679, 4915, 4918, 37690, 37691, 37694, 4933, 37708, 37709, 4944, 4948, 37720, 37721, 37724, 37725, 4963, 4967, 37738, 37739, 37743, 4982, 37754, 37755, 37758, 37759, 37760, 37761, 37764, 5001, 37777, 37780, 37781, 5016, 5017, 37794, 37799, 37815, 37825, 37829, 5068, 5069, 37840, 37841, 37844, 37845, 5084, 37862, 37863, 37878, 37879, 5138, 5139, 5143, 37915, 37918, 37919, 5153, 5157, 37932, 5169, 37948, 37949, 37962, 37963, 5202, 5206, 5207, 37978, 37979, 37982, 5221, 5233, 5237, 38049, 38065, 38069, 38113, 38117, 38133, 5379, 5382, 5383, 38155, 38158, 38159, 5398, 5399, 38174, 38175, 5412, 38185, 5424, 5428, 38200, 38201, 38204, 38205, 5442, 5443, 5447, 38218, 38219, 38223, 5462, 38235, 5472, 5473, 5477, 38248, 38249, 5488, 5489, 5492, 38264, 38265, 38268, 38278, 5514, 5515, 5519, 38295, 5530, 5531, 5535, 38305, 38309, 5544, 5545, 5548, 5549, 38320, 38325, 5560, 5561, 5578, 5579, 5582, 5583, 38354, 5595, 5598, 5599, 38369, 38373, 5608, 5609, 5612, 5613, 38384, 5625, 5628, 5629, 5633, 5637, 38413, 5648, 5649, 5652, 5653, 38425, 38428, 5667, 5670, 5671, 38446, 38447, 5682, 5687, 38459, 5697, 5712, 5713, 5717, 38488, 38489, 5730, 5735, 38506, 38510, 5746, 5747, 5750, 38523, 38526, 38527, 38529, 38533, 5773, 5788, 38567, 38583, 38593, 38597, 5833, 38608, 38609, 38613, 5848, 38643, 5893, 38665, 5905, 5908, 5909, 38680, 38681, 38684, 5923, 5926, 38699, 5938, 5942, 5943, 38718, 38719, 5953, 5968, 5969, 5973, 38744, 38745, 5986, 5987, 5991, 38763, 38766, 6003, 6006, 38783, 38784, 38789, 38801, 38805, 6044, 6062, 38838, 6079, 38849, 38853, 6089, 38864, 38865, 38869, 6155, 38930, 6170, 6171, 6175, 38945, 6184, 6185, 38960, 38961, 38998, 6238, 6239, 39024, 39025, 39029, 6269, 6274, 6275, 6290, 6291, 39066, 6304, 6305, 6309, 39080, 39081, 6321, 6325, 39097, 6358, 6359, 6369, 6373, 39144, 6389, 39160, 39171, 39175, 6410, 39187, 6426, 6427, 6430, 6431, 39200, 39201, 39205, 6440, 6441, 39217, 39220, 39255, 6494, 6495, 39269, 6508, 39281, 39285, 6524, 6530, 6531, 39306, 6546, 6547, 39323, 39327, 6561, 6565, 39336, 39337, 6576, 6577, 6581, 39352, 39353, 6598, 6599, 6629, 39405, 6641, 6645, 39425, 6665, 39440, 39441, 39445, 6680, 6681, 6684, 6685, 39459, 39474, 39479, 6714, 6715, 39493, 39505, 39509, 6744, 6745, 6748, 6749, 39526, 39527, 6766, 6782, 6784, 6785, 39561, 6801, 39576, 39577, 6818, 39598, 6834, 39611, 6849, 6853, 6865, 6869, 39640, 39644, 6886, 6887, 39662, 39663, 39681, 39685, 6920, 39697, 39701, 6936, 6937, 6940, 6941, 39731, 39735, 6970, 6971, 39745, 39749, 39760, 39761, 39765, 7000, 7001, 7004, 7005, 39783, 7023, 39798, 7039, 7041, 7045, 7056, 7057, 7061, 7074, 7075, 7090, 7091, 39866, 7105, 7109, 7125, 39896, 7159, 39934, 39939, 7182, 39959, 7194, 7198, 7199, 39968, 39973, 7212, 7213, 39989, 7228, 7229, 40019, 7258, 7259, 7262, 7263, 40033, 40037, 7273, 7289, 7318, 7319, 7329, 7333, 7345, 7349, 7362, 40142, 7378, 7393, 7408, 7409, 40194, 40198, 7439, 40214, 7451, 7454, 7455, 40225, 40229, 7468, 7469, 40240, 40241, 40244, 40245, 7484, 7485, 40274, 7514, 7515, 7518, 7519, 40288, 40289, 40293, 7528, 40304, 40305, 40309, 7544, 7559, 7585, 7589, 40364, 7605, 7618, 40399, 7634, 40414, 7648, 7649, 40424, 40425, 7665, 40440, 40445, 40449, 40453, 7692, 40464, 40465, 40469, 7705, 7708, 7709, 7726, 7727, 40499, 40502, 7742, 7743, 40513, 40517, 40529, 40533, 7768, 7769, 7772, 7773, 40546, 7802, 7809, 7813, 40584, 7825, 7829, 7846, 7847, 40622, 40623, 7873, 7877, 7888, 7889, 7893, 40669, 7907, 40683, 40687, 7923, 40703, 40709, 7949, 40721, 40725, 7960, 7961, 7964, 7965, 40742, 7982, 7983, 40758, 40759, 40769, 40784, 40785, 40789, 8024, 8025, 40803, 8043, 8059, 8065, 8069, 40840, 8081, 8085, 40860, 8118, 8119, 40894, 40895, 8128, 8129, 8133, 8145, 8149, 40920, 40921, 8163, 40938, 8179, 40955, 8192, 8209, 40984, 41006, 8243, 41023, 8277, 41052, 41089, 8332, 8333, 8348, 8349, 8363, 8366, 8378, 8383, 41157, 8392, 8393, 8408, 8409, 41186, 8426, 8431, 41203, 8443, 8446, 8449, 41225, 41228, 8464, 41241, 41274, 41275, 8517, 41288, 41292, 8532, 41308, 41309, 8550, 8551, 41322, 41326, 41327, 8566, 41339, 41342, 41365, 41378, 41379, 8619, 8622, 41394, 41395, 8634, 8635, 8639, 41425, 41429, 41442, 41447, 8682, 8686, 8687, 41459, 8699, 8702, 8706, 8707, 41482, 8723, 41498, 41499, 41503, 8736, 41512, 41516, 8752, 8753, 41529, 41533, 8774, 41550, 8790, 8791, 41563, 8804, 8805, 41576, 41577, 41580, 41581, 8821, 41592, 41593, 8846, 8847, 41619, 8859, 8862, 8863, 41633, 41637, 41649, 8889, 41667, 41670, 41671, 8906, 8907, 8910, 8922, 8923, 41697, 41700, 41701, 8940, 41717, 8962, 8963, 41739, 8979, 41755, 8992, 41769, 9008, 9009, 41784, 41788, 9031, 41806, 41807, 9046, 41818, 41822, 41823, 9061, 41832, 41833, 41837, 9076, 41849, 41852, 41853, 41859, 41863, 9102, 9103, 41874, 41879, 9114, 9118, 9119, 41888, 41889, 41892, 9129, 9132, 9133, 41905, 41909, 9148, 9149, 41922, 9162, 9163, 9167, 41939, 41942, 41943, 9178, 9179, 41957, 9192, 9193, 41968, 41969, 41972, 41973, 9208, 9209, 9212, 42008, 42013, 42030, 42031, 42046, 42047, 42073, 42076, 42113, 42133, 42150, 42167, 42181, 42193, 42211, 42226, 9477, 42248, 42253, 9492, 42268, 42269, 42287, 9526, 9527, 42299, 9537, 42312, 42316, 9552, 42329, 9571, 42346, 42347, 9587, 42362, 42363, 42385, 42402, 9642, 9646, 9647, 42419, 42422, 9663, 42449, 42453, 42466, 42467, 9706, 42482, 42483, 9722, 9723, 9727, 42511, 42523, 42527, 42540, 42541, 42552, 42557, 42586, 42587, 42600, 42604, 42605, 42620, 42626, 42646, 42657, 42660, 42661, 42673, 42677, 42706, 42721, 42725, 42737, 42762, 42766, 10006, 10007, 42778, 42779, 42782, 42792, 10036, 42808, 42812, 42813, 10051, 42842, 42843, 42846, 10081, 42860, 42861, 10096, 10097, 42872, 42876, 42877, 42883, 10126, 10143, 42917, 42929, 42932, 42933, 10172, 42946, 10186, 42963, 10203, 42977, 42981, 10217, 42993, 42997, 43013, 10249, 10252, 10253, 43025, 10265, 43042, 10282, 10286, 43059, 43063, 43073, 43077, 43093, 10333, 43106, 10351, 10366, 10368, 10369, 10373, 43149, 10385, 10402, 10403, 43178, 10418, 43195, 10432, 10433, 10437, 43209, 43213, 10449, 10453, 10466, 43262, 43265, 10504, 10508, 10509, 43281, 43285, 10520, 43299, 10539, 10543, 43314, 10554, 43345, 43349, 10588, 10606, 10623, 10625, 10629, 43400, 10640, 10641, 10645, 43417, 43421, 10658, 10659, 10674, 10693, 43468, 43469, 10704, 10705, 10709, 43481, 43498, 10738, 43515, 43522, 43527, 10763, 43538, 10778, 10779, 43568, 43569, 43572, 10809, 10812, 10813, 43590, 10830, 43603, 10846, 10847, 43617, 43620, 43621, 10860, 43637, 43658, 10899, 10912, 10913, 43693, 10929, 43705, 43708, 43709, 10946, 10947, 10962, 10963, 43739, 43743, 10980, 10981, 10997, 43779, 11018, 43794, 43795, 11034, 11035, 43825, 43828, 43829, 11064, 11068, 11069, 43847, 11087, 43858, 43862, 11102, 11103, 43877, 11117, 43889, 43892, 43893, 11132, 11139, 43919, 11169, 43948, 43949, 11184, 11185, 11202, 11203, 11218, 11219, 43994, 11237, 44008, 11252, 11253, 44033, 11272, 11273, 11277, 44053, 11293, 44070, 44071, 11306, 11310, 44086, 44087, 11327, 44097, 44101, 44113, 11353, 44131, 11371, 44146, 11386, 11392, 11393, 11397, 44173, 11413, 11426, 11456, 11457, 11461, 44233, 11473, 11477, 11490, 44267, 11506, 11507, 44293, 11528, 11529, 11532, 44305, 44309, 11548, 11563, 11567, 44342, 44343, 44369, 44373, 11608, 44386, 11626, 44403, 11643, 11649, 11653, 44428, 44429, 11664, 11665, 11669, 44441, 44445, 44459, 44463, 11698, 44474, 11713, 44488, 11728, 11729, 11733, 44509, 11746, 44522, 11762, 11763, 44539, 44551, 11791, 44563, 44567, 11806, 11807, 44577, 44580, 44581, 44593, 11832, 11833, 11837, 44611, 11850, 44626, 44627, 11866, 11867, 44641, 44645, 11880, 44657, 11897, 11906, 11907, 11922, 11923, 44698, 11940, 11941, 11957, 44728, 44733, 44747, 11987, 44762, 12000, 12001, 44776, 12017, 44793, 44797, 44806, 12046, 44818, 44819, 12062, 12063, 44837, 44848, 44849, 44852, 12088, 12089, 12092, 12107, 44883, 12122, 12123, 44897, 44901, 12137, 44913, 44917, 12162, 12163, 44942, 12178, 12179, 44955, 44959, 12197, 44973, 12212, 12213, 12227, 12257, 45033, 45037, 12272, 12273, 45048, 45053, 12305, 12309, 45080, 45085, 12327, 45099, 45103, 12342, 45114, 45118, 12369, 12373, 45145, 45148, 12387, 12402, 45183, 45185, 12428, 12429, 45205, 12444, 12445, 45219, 12463, 45234, 12478, 45253, 12488, 12489, 45265, 12504, 12505, 45283, 12523, 45298, 45303, 12538, 12545, 12549, 45325, 12564, 45336, 12583, 12598, 12599, 45370, 12609, 12613, 45385, 45388, 12628, 45404, 45405, 12643, 12647, 45419, 45422, 12658, 12659, 12662, 45434, 45439, 45445, 45461, 45474, 45475, 12719, 45491, 12731, 12734, 45505, 45509, 45524, 45525, 45539, 12778, 12779, 12782, 45554, 45559, 12795, 12802, 12807, 45579, 12822, 12823, 45594, 45595, 45609, 45613, 12852, 45624, 45628, 45629, 12867, 12870, 45646, 12886, 12887, 45659, 45662, 12897, 12900, 12901, 45672, 45676, 12912, 12913, 12917, 45688, 45689, 45699, 12943, 45714, 12954, 12958, 45729, 45733, 45745, 45762, 13002, 13003, 45779, 45782, 45783, 13018, 13019, 45793, 45797, 45812, 45813, 13052, 13078, 13079, 45851, 13092, 45864, 45868, 45880, 45881, 45884, 45885, 13122, 13127, 45902, 45903, 13142, 45914, 45918, 45919, 13153, 13157, 45929, 45932, 13169, 13172, 45944, 45945, 45954, 13195, 13198, 13199, 45971, 45975, 13210, 13214, 13215, 13224, 13225, 13228, 13229, 46001, 46004, 46005, 13240, 13241, 13244, 13245, 46019, 46022, 46023, 13258, 13262, 13263, 46034, 46038, 46039, 13275, 13278, 13279, 46052, 13288, 13293, 46065, 46069, 13305, 13308, 13329, 46105, 46109, 13347, 13350, 13351, 46126, 46127, 13362, 13366, 13367, 46142, 46143, 13397, 46169, 46173, 13410, 13415, 13427, 13430, 46208, 13448, 13449, 46225, 46229, 13464, 13465, 46247, 13483, 13486, 46262, 13498, 13503, 13516, 13517, 46289, 46293, 13532, 13533, 46306, 13546, 13551, 46323, 13563, 13566, 13569, 13573, 46345, 13588, 46364, 46365, 46382, 13622, 46394, 13633, 13637, 46408, 46413, 13652, 46424, 13667, 13670, 13671, 46442, 46443, 13686, 46459, 46465, 46481, 46484, 46499, 46502, 13738, 13739, 46514, 13754, 46529, 46533, 46545, 46562, 13802, 13807, 46578, 46579, 13819, 13822, 13823, 46606, 13842, 13843, 13846, 13847, 46619, 46622, 46623, 13857, 13860, 46632, 13873, 13876, 13877, 13890, 13895, 13907, 13910, 13911, 46682, 46683, 13921, 13925, 46697, 46701, 13937, 13940, 13941, 46726, 13963, 13966, 46738, 13978, 13983, 46753, 46757, 13992, 13993, 13996, 13997, 14008, 14009, 14012, 14013, 46786, 14026, 14031, 14043, 14046, 46816, 46817, 46821, 14056, 14057, 14060, 14061, 46832, 46833, 14072, 14073, 14076, 14077, 14082, 14087, 46863, 14098, 14099, 14102, 14103, 46874, 46879, 14112, 14113, 14116, 46889, 14129, 14132, 14133, 46904, 46905, 46908, 46909, 14147, 14150, 14163, 14166, 14167, 46938, 46939, 14177, 14180, 14181, 46956, 14193, 14197, 46969, 46972, 46973, 14218, 14235, 14238, 47012, 47013, 14252, 47025, 47029, 14283, 14286, 47058, 14303, 47072, 47073, 47089, 47093, 14329, 14344, 14345, 14348, 14349, 47121, 47125, 14360, 47139, 14378, 14379, 14383, 47154, 47159, 14394, 14395, 47168, 47173, 14408, 14409, 14412, 47185, 47189, 14428, 47206, 14443, 14446, 14458, 14463, 14465, 14468, 14469, 47241, 47244, 14480, 14481, 14484, 14485, 14498, 14502, 14503, 14515, 14518, 14529, 14533, 47304, 14545, 14548, 14549, 47324, 14563, 14566, 14567, 47338, 47342, 14582, 14583, 47355, 47365, 14600, 14601, 14604, 14605, 47377, 14617, 47394, 14634, 14638, 14650, 47425, 47429, 14665, 14668, 47445, 14685, 47458, 14698, 14715, 14720, 14721, 14725, 47497, 14737, 14740, 14741, 14755, 14758, 14770, 14775, 47547, 14785, 14789, 47564, 47565, 14804, 14805, 47576, 47580, 14819, 14822, 47599, 14835, 14838, 14839, 14863, 47634, 47635, 14875, 14878, 14879, 14889, 47665, 14904, 14905, 14908, 14909, 14923, 14926, 47699, 47702, 14938, 14939, 47713, 47717, 14952, 14953, 14956, 14957, 47732, 47733, 14972, 14982, 14983, 14995, 14998, 14999, 47770, 47774, 15013, 47789, 15028, 15029, 47800, 47804, 15042, 15043, 15046, 15047, 15058, 15062, 47834, 15073, 15076, 15077, 15089, 15092, 15093, 47865, 47868, 47874, 15115, 15118, 47890, 15131, 15134, 15135, 47921, 47924, 47925, 15160, 15161, 15164, 15165, 47942, 15178, 15183, 47954, 15194, 15195, 15199, 47972, 47973, 15208, 15209, 15212, 15213, 47985, 47989, 15238, 15239, 15250, 15254, 15255, 15265, 15268, 15269, 48040, 48044, 15281, 15285, 48056, 15298, 15302, 15303, 48074, 48078, 15314, 15315, 15318, 15329, 15332, 48104, 48108, 15345, 15348, 15349, 15368, 15369, 15372, 15373, 48145, 48149, 15388, 15406, 15407, 15418, 15419, 15423, 48193, 15432, 15436, 48209, 48213, 15448, 48226, 15466, 15471, 48243, 15486, 15489, 15493, 48264, 15505, 15508, 15509, 48284, 15527, 48299, 15538, 48314, 48318, 15553, 15556, 15557, 48332, 15568, 15569, 15573, 15591, 48362, 15603, 15606, 15607, 48385, 15624, 15625, 15628, 15629, 48405, 15645, 48422, 48423, 15662, 15663, 48438, 48439, 15675, 15678, 15679, 48449, 48453, 15688, 15692, 15693, 48465, 15705, 48483, 15723, 15726, 48498, 15738, 15743, 15745, 15749, 48524, 48525, 15761, 15764, 15765, 48540, 48541, 15778, 15782, 15783, 15798, 15799, 15808, 15809, 15812, 15813, 48585, 15825, 15828, 48600, 48604, 15843, 15846, 48619, 15858, 15862, 15863, 48634, 48646, 15883, 15886, 48659, 15898, 15899, 15902, 15903, 48673, 48677, 48693, 15928, 15932, 48706, 15946, 15951, 48722, 48723, 15962, 15966, 15967, 48736, 48737, 48741, 15976, 15977, 15980, 15981, 48752, 48753, 16003, 16006, 48782, 16018, 16019, 16022, 48799, 16033, 16036, 16037, 16049, 16052, 48828, 16066, 16070, 16071, 48842, 16083, 16086, 16087, 48859, 16097, 16100, 16101, 48873, 48876, 16116, 16117, 48888, 48892, 48903, 16138, 48914, 48919, 16154, 16155, 48932, 48933, 16172, 48945, 16185, 16188, 16189, 16203, 16206, 48978, 48979, 16218, 16219, 16222, 16223, 48992, 48993, 16232, 16233, 16236, 16237, 49009, 49013, 16249, 16258, 16259, 16262, 49035, 16275, 16278, 16279, 16289, 16292, 49065, 49068, 16305, 16308, 16323, 16326, 16327, 49099, 16342, 16343, 49114, 16353, 16356, 16357, 49128, 49132, 16372, 16373, 49148, 49182, 49183, 49192, 49193, 49242, 49243, 49276, 49282, 49298, 49317, 49333, 49351, 49377, 49393, 16643, 16646, 49419, 49423, 16658, 16663, 49439, 16673, 16677, 49449, 16688, 16693, 16706, 49482, 49483, 49487, 16722, 16723, 49498, 16736, 16737, 49512, 49516, 49517, 16753, 49529, 49532, 49533, 16782, 49559, 16799, 49569, 49573, 49584, 49585, 49589, 49603, 16842, 49618, 49632, 49633, 49648, 49649, 49673, 49676, 49692, 49693, 49706, 49710, 49727, 49736, 49737, 49753, 49757, 49771, 49790, 49791, 49792, 49793, 49797, 49809, 49813, 49830, 49847, 49857, 49861, 49873, 49877, 49890, 49907, 17153, 17157, 49928, 49933, 17168, 49948, 49949, 17187, 17191, 49963, 49967, 17202, 17206, 49978, 49983, 17217, 17221, 49992, 49993, 17232, 17236, 50008, 50009, 50012, 17250, 17251, 17255, 50026, 50030, 50031, 17266, 17270, 17271, 50042, 50043, 50046, 50047, 50049, 50052, 50053, 17292, 50064, 50065, 50069, 17308, 17309, 50082, 50086, 50087, 17327, 50099, 50102, 50103, 17342, 50112, 50113, 50116, 50117, 17352, 50129, 50132, 50133, 17368, 17369, 50147, 50151, 17386, 50162, 50167, 17402, 17403, 17414, 17415, 17426, 17427, 17430, 17431, 50203, 50206, 50207, 17441, 17445, 50217, 17457, 17461, 50232, 50233, 50254, 50255, 17490, 17491, 17494, 17495, 50266, 50267, 50270, 17504, 17505, 17509, 17520, 17521, 17525, 17546, 17547, 17550, 17551, 17562, 17563, 17566, 17567, 50337, 17576, 17577, 17580, 17581, 50353, 50357, 17592, 17593, 17596, 17597, 17610, 17611, 17614, 17615, 17626, 17627, 17630, 17631, 50401, 50405, 17640, 17641, 17644, 17645, 50421, 17656, 17657, 17660, 17661, 17667, 17670, 50442, 50446, 17682, 17683, 50459, 17697, 50476, 50477, 17712, 17713, 17717, 50492, 50493, 17735, 50506, 50510, 50511, 17747, 17750, 50526, 17760, 17765, 50540, 50541, 17781, 50553, 50556, 17803, 50579, 17818, 50592, 50593, 50597, 50608, 50609, 50613, 50631, 17871, 50646, 17886, 50656, 50661, 50677, 17921, 17924, 17925, 50696, 50700, 17936, 17937, 17940, 17941, 50712, 50713, 50717, 17955, 17958, 17959, 50730, 50734, 50735, 17970, 17971, 17974, 17975, 50746, 50750, 50751, 17984, 17985, 17989, 18000, 18001, 18005, 50781, 18018, 18019, 18023, 50794, 50795, 18034, 18035, 18038, 50810, 50814, 50816, 50821, 50833, 50837, 18072, 18073, 18090, 18091, 50866, 18106, 50881, 50885, 18124, 50896, 50901, 18140, 50919, 18159, 50934, 50935, 18174, 18175, 18180, 50952, 18193, 18197, 50969, 50972, 18211, 18214, 18226, 18231, 51003, 51006, 18240, 18257, 18261, 51033, 51036, 51037, 18274, 51050, 51051, 51054, 18291, 18294, 51067, 51073, 51089, 18346, 51137, 51141, 51153, 51157, 51174, 18431, 51203, 51206, 51207, 18443, 18446, 18447, 51222, 18462, 51232, 51233, 51237, 51249, 51252, 51253, 18492, 18493, 18506, 18507, 18510, 18511, 51282, 18523, 51296, 51297, 51301, 18536, 18537, 51313, 51317, 18562, 18563, 51343, 18578, 18579, 18593, 18597, 51373, 18609, 18613, 51384, 51388, 51389, 18626, 18627, 18642, 18643, 18657, 18661, 18672, 18673, 18677, 51458, 18702, 18703, 18719, 51489, 51493, 51504, 51509, 18762, 18763, 18766, 18767, 51539, 18778, 51557, 51569, 51573, 18818, 18819, 18834, 18853, 18864, 18865, 18869, 18882, 18883, 18898, 18899, 18917, 18933, 51717, 18957, 51729, 51733, 51762, 51766, 19007, 51777, 51781, 19016, 19017, 19020, 51792, 51793, 51797, 51811, 19050, 19051, 19066, 19073, 19077, 51853, 19093, 19106, 51886, 19123, 51898, 51903, 19136, 19137, 19141, 51912, 51913, 19152, 19153, 19157, 51933, 19170, 19171, 51946, 51947, 19186, 19187, 51969, 19208, 51984, 51985, 51989, 19247, 52019, 19262, 19263, 52033, 52037, 19272, 19273, 19276, 19277, 52048, 52049, 52053, 19306, 19329, 19333, 52104, 19344, 19349, 19362, 52138, 52143, 19378, 19379, 52154, 52158, 19392, 19393, 19408, 19409, 19413, 52189, 19427, 19442, 19443, 52226, 52230, 19470, 52243, 52257, 52272, 52273, 19512, 19513, 19530, 19531, 19534, 19535, 52311, 19551, 52325, 19564, 19565, 52337, 52341, 19602, 19616, 19617, 19621, 52392, 52393, 19632, 52408, 19651, 52430, 19666, 19667, 52447, 19685, 52460, 19701, 52476, 52477, 52483, 19722, 52498, 19739, 52513, 52529, 19768, 19769, 19786, 19787, 19790, 19791, 19806, 52576, 52581, 19820, 19821, 52593, 19842, 19843, 19858, 19859, 19872, 19873, 19877, 52653, 19888, 19889, 19893, 52669, 19906, 19907, 52687, 19923, 19936, 19937, 19941, 19953, 19957, 52732, 52733, 52741, 19976, 19977, 19980, 52752, 52753, 52757, 20010, 52787, 52791, 20026, 20027, 52801, 52805, 20040, 20041, 20044, 20045, 52816, 52817, 52821, 52839, 20078, 20079, 52854, 20097, 20101, 52877, 20113, 20117, 20130, 20131, 20146, 20147, 20165, 20176, 20177, 20181, 20195, 20210, 20211, 52990, 52993, 20232, 20233, 53008, 53009, 53013, 53027, 20267, 53042, 53047, 20282, 20283, 53057, 53061, 20296, 20301, 53073, 53077, 53094, 53095, 20334, 20351, 20352, 20353, 20357, 53133, 20369, 20387, 53178, 53179, 20417, 20421, 53196, 53197, 20433, 20437, 53212, 20450, 53230, 20467, 53243, 20503, 53278, 53279, 20517, 53288, 53289, 20562, 53338, 53339, 20593, 53373, 53378, 20618, 20619, 53394, 20634, 20635, 53413, 20648, 20649, 53429, 20664, 20665, 20686, 20687, 53463, 20702, 20703, 53473, 20716, 20717, 53489, 20732, 20733, 20738, 20743, 53514, 53518, 20758, 20759, 53534, 20768, 20772, 53544, 20788, 20802, 20803, 20806, 53578, 53579, 53582, 20822, 20823, 53594, 20833, 20836, 20837, 53612, 53613, 20848, 20849, 20853, 53624, 53628, 53629, 20874, 20875, 20890, 20891, 53664, 53665, 53669, 20904, 20905, 53681, 53685, 20920, 20921, 53698, 20938, 20942, 20943, 53715, 20958, 20959, 53728, 53729, 20972, 20973, 53745, 20985, 20988, 20989, 20993, 20997, 53772, 21008, 21009, 21012, 21013, 53784, 53788, 53789, 53803, 21046, 53822, 21057, 21060, 21061, 53832, 53833, 21072, 21073, 21076, 21077, 53848, 53852, 21091, 21094, 21095, 53866, 53870, 53871, 21110, 21111, 53889, 53893, 21128, 21129, 53909, 21144, 21148, 53927, 21162, 21163, 21166, 53942, 21179, 21182, 21183, 53953, 53957, 21193, 21197, 53969, 53973, 21212, 21213, 53987, 21226, 21230, 21231, 54002, 21242, 21243, 21247, 54025, 54028, 21265, 21268, 21269, 54045, 21286, 54062, 21313, 21316, 54088, 54089, 21329, 21333, 54104, 54105, 54109, 21346, 21350, 54126, 21367, 54138, 54139, 54142, 54143, 54144, 54145, 54149, 54161, 54165, 21401, 21404, 54182, 54183, 21418, 21422, 21423, 54194, 54198, 54199, 21434, 21435, 21439, 54209, 54212, 54213, 21449, 21452, 54224, 54225, 54228, 54229, 54242, 54247, 21482, 21483, 21486, 54259, 54263, 21499, 21502, 21503, 21522, 54298, 54299, 54302, 54303, 21537, 21540, 54312, 21556, 21570, 21571, 54350, 54351, 21591, 54362, 54363, 54366, 54367, 21621, 54433, 54437, 54449, 54501, 54513, 54517, 21762, 21767, 54539, 54543, 21782, 21783, 54555, 21792, 54572, 54573, 21812, 54588, 54589, 21827, 21830, 21831, 54603, 54606, 54607, 21846, 21847, 54623, 21857, 21860, 21861, 54636, 21872, 21873, 21876, 21877, 54648, 54659, 21902, 21903, 54674, 21918, 21919, 54689, 54693, 21929, 21932, 21933, 54704, 54705, 54709, 21948, 21949, 54726, 21963, 21967, 21978, 54757, 21993, 54768, 54773, 22008, 54793, 54797, 22033, 54808, 54809, 54813, 22055, 54826, 54831, 22070, 22085, 22100, 22101, 54877, 22115, 54894, 22130, 22135, 54907, 54911, 54917, 54928, 54929, 54946, 22191, 54963, 54976, 54977, 54981, 22216, 54993, 54997, 22233, 55014, 55015, 22251, 55031, 22273, 22277, 55049, 55053, 22288, 22289, 22292, 55064, 55068, 55069, 22311, 55086, 22326, 22327, 55099, 22337, 22341, 22352, 22356, 22357, 55128, 55132, 55133, 22371, 22375, 55146, 55151, 22386, 22387, 22390, 55162, 55163, 55169, 55173, 22412, 55185, 55189, 22429, 22446, 22459, 22462, 22463, 55233, 55237, 55249, 55253, 22510, 22522, 22538, 55319, 22558, 22559, 55329, 55333, 22568, 22572, 22573, 55344, 55349, 22585, 22588, 22589, 55379, 22618, 22619, 22623, 55393, 55397, 55409, 55413, 22652, 55434, 55451, 22689, 22693, 22704, 22705, 22709, 22722, 22723, 22727, 22738, 22739, 22773, 55555, 55558, 55559, 22795, 55574, 22814, 22815, 55589, 22825, 22828, 22829, 55604, 55605, 55634, 22874, 22875, 22879, 55648, 55649, 55665, 55669, 22909, 55706, 55710, 22944, 22949, 55721, 55724, 55725, 22961, 22965, 55740, 55741, 22978, 22994, 22995, 22999, 23013, 55809, 23048, 55824, 55825, 55829, 23065, 23068, 23069, 23086, 55859, 55862, 23102, 23103, 55873, 55877, 55889, 55893, 23128, 23129, 23132, 23133, 23146, 23147, 23150, 23151, 23162, 23163, 23184, 23189, 55964, 23203, 23206, 23207, 55979, 55983, 23219, 23222, 23223, 55998, 23233, 23237, 23249, 23253, 23266, 23267, 56042, 56043, 23282, 23283, 23287, 56069, 23305, 56081, 56085, 23320, 23321, 23324, 23342, 23343, 56114, 56118, 23354, 23355, 23358, 23359, 56129, 56144, 56145, 56149, 23384, 23385, 56163, 23402, 23403, 23419, 23422, 23423, 23424, 23425, 23429, 23441, 23445, 56217, 23458, 23462, 23463, 56238, 23474, 23478, 23479, 56251, 56255, 23489, 56268, 23505, 23509, 56280, 23522, 23526, 23538, 23539, 23542, 56314, 56315, 56322, 56323, 23567, 56338, 23582, 56353, 23592, 23593, 56369, 23608, 56406, 23643, 23646, 23647, 56416, 56417, 56421, 56433, 56437, 23672, 23682, 23687, 23698, 23713, 23717, 23729, 56508, 23746, 56527, 56542, 23776, 23781, 56556, 56557, 23797, 56572, 56573, 56582, 56583, 23822, 56595, 23838, 23839, 56609, 23848, 23849, 56624, 56625, 23864, 23865, 56663, 23898, 23902, 23903, 56673, 56677, 56693, 23929, 23938, 23939, 23954, 23955, 23959, 23969, 23973, 56745, 23985, 56760, 56761, 24003, 56782, 24018, 56799, 24037, 56812, 56813, 24048, 24053, 56833, 24077, 56848, 56849, 24088, 24089, 24092, 24093, 24106, 24107, 24110, 24111, 56887, 24122, 56901, 56913, 56917, 24152, 24156, 24157, 56934, 24170, 24171, 24174, 24175, 24190, 24191, 24209, 56984, 56988, 24226, 24227, 24231, 57002, 57003, 24242, 24243, 24247, 24256, 24257, 24261, 24273, 24277, 24291, 24294, 24295, 57066, 57070, 24307, 24310, 57087, 57093, 24332, 57105, 57109, 24344, 24345, 24362, 24363, 57139, 57143, 24378, 24379, 24382, 24383, 57153, 57157, 57168, 57173, 24408, 24409, 24412, 24430, 24431, 57206, 24442, 24446, 24447, 24449, 24453, 24465, 24469, 24483, 24486, 24498, 24499, 24502, 57274, 57275, 24513, 24517, 57292, 24528, 24533, 57308, 24550, 24551, 24566, 24567, 57342, 57368, 57373, 57386, 57390, 57403, 57407, 57433, 57436, 57466, 57473, 57493, 57506, 57511, 57523, 57541, 57553, 57570, 57587, 57647, 57662, 57663, 57672, 57676, 57688, 57689, 57707, 57710, 57722, 57727, 57729, 57733, 57745, 57749, 57762, 57767, 57779, 57793, 57809, 57813, 57843, 57883, 57886, 57887, 57897, 57900, 57912, 57913, 57917, 57930, 57947, 57951, 57960, 57961, 57964, 57987, 57991, 58017, 58037, 58050, 58067, 58080, 58081, 58085, 58097, 25350, 25367, 58142, 25381, 58152, 58153, 58157, 58168, 58169, 58172, 58173, 25410, 25415, 58186, 58187, 25426, 25430, 58202, 58206, 25440, 25441, 25445, 58217, 58220, 58221, 25457, 25460, 58232, 58233, 58236, 58246, 25482, 25483, 58259, 58262, 25498, 25499, 25503, 58277, 25512, 25513, 25517, 58289, 58292, 58293, 25528, 25529, 25532, 58307, 58311, 25546, 25550, 25551, 58322, 58327, 25563, 25566, 25567, 58337, 25577, 25580, 25581, 58356, 58357, 25592, 25596, 25597, 25617, 58392, 58396, 25635, 25639, 58410, 58411, 25650, 25654, 58426, 58427, 25685, 58456, 58460, 25703, 25718, 58497, 58501, 25741, 25756, 58531, 58546, 58561, 58565, 25801, 58576, 25816, 58598, 58615, 58648, 58649, 58667, 58670, 58682, 58687, 58696, 58700, 58734, 58735, 58750, 58753, 58757, 58769, 58773, 58786, 58802, 58821, 58833, 58837, 58867, 58870, 26115, 58891, 26130, 26131, 26135, 58906, 58907, 58911, 26145, 26148, 58920, 58921, 58924, 26160, 26161, 26164, 58937, 58940, 58941, 26183, 26198, 58975, 26213, 58988, 26225, 26229, 59000, 59040, 59041, 59045, 26280, 26284, 26285, 59056, 59057, 26297, 26300, 26301, 59094, 59105, 59108, 59109, 26344, 26345, 26348, 59125, 26360, 26361, 26365, 59146, 26386, 26387, 59162, 59166, 26401, 26404, 59181, 26417, 26420, 26454, 59226, 59230, 59231, 26469, 59240, 59241, 26485, 59260, 59266, 59283, 59297, 26537, 59312, 59313, 59317, 26552, 59331, 59365, 59377, 59381, 26620, 26633, 59412, 59413, 26652, 59430, 59431, 26670, 59446, 59447, 26682, 26686, 59461, 26696, 26701, 59473, 26712, 59491, 59506, 26753, 26757, 59529, 59533, 26769, 26772, 26773, 59548, 59567, 59582, 26817, 26821, 59593, 59597, 26833, 59608, 59609, 26850, 26851, 26866, 26867, 26888, 59665, 59669, 26909, 26927, 59703, 26943, 59713, 26952, 26953, 26956, 59729, 59733, 26969, 59746, 27009, 27013, 27025, 27029, 59801, 59804, 59822, 59839, 27073, 27089, 27093, 59869, 27106, 27107, 59887, 27122, 27123, 59902, 59911, 27150, 59923, 59927, 59937, 59941, 59957, 27192, 27193, 27197, 59971, 59986, 60000, 60001, 60005, 27240, 27244, 27245, 60017, 27257, 60062, 27301, 60073, 60076, 27313, 27317, 60089, 60093, 27330, 27331, 27347, 60126, 27360, 27361, 27377, 60153, 60156, 60166, 27407, 60178, 60197, 60209, 60212, 60213, 27448, 27449, 60242, 60243, 60256, 60257, 27497, 27500, 27501, 60272, 60273, 60277, 27512, 60302, 60319, 27557, 60329, 60333, 27572, 27573, 60345, 60348, 27587, 60362, 27603, 60383, 27617, 60393, 60397, 27632, 27633, 27661, 60433, 27672, 60450, 27690, 27706, 60481, 27721, 27724, 60500, 60501, 27740, 27777, 27781, 60553, 60557, 27793, 27797, 60568, 60569, 27810, 27811, 27826, 27827, 60602, 27841, 27845, 60617, 27860, 27861, 60636, 60654, 60667, 27916, 60689, 60693, 27929, 60707, 27947, 60722, 60727, 27963, 27967, 60736, 60741, 27976, 27980, 27981, 60753, 60757, 27997, 60774, 28033, 28037, 28049, 28053, 60828, 60829, 28066, 28067, 60846, 28082, 28083, 60859, 60863, 28101, 28113, 28117, 60889, 60892, 28170, 60947, 60960, 60961, 60965, 28217, 28220, 28221, 60998, 61011, 61025, 61028, 28264, 28265, 28268, 61045, 28291, 28306, 61083, 61087, 28320, 28321, 28337, 61113, 61117, 61134, 28388, 28389, 61165, 28405, 61177, 61181, 28427, 61203, 61217, 28457, 61233, 61236, 61237, 28472, 28476, 28477, 61255, 61270, 61285, 28520, 61297, 61301, 28547, 61327, 28563, 61342, 28577, 28581, 61353, 28592, 28593, 61387, 61391, 28645, 61421, 28660, 28661, 61432, 28672, 61469, 28707, 61483, 28722, 61498, 61529, 61589, 61603, 61618, 61649, 28929, 28933, 61709, 28944, 28948, 28963, 61742, 61743, 28978, 28982, 61758, 61759, 28993, 28997, 61768, 61773, 29008, 61784, 29027, 29030, 29031, 61802, 61803, 61806, 61807, 61819, 61822, 61825, 61829, 61844, 61845, 61859, 29102, 61874, 61875, 61879, 29119, 61888, 61889, 61893, 61905, 61923, 61939, 29186, 29191, 61963, 29206, 29207, 61982, 61983, 29216, 29236, 29237, 62008, 62009, 62012, 29251, 29254, 29255, 62026, 62027, 29267, 29270, 62042, 62047, 29281, 29284, 29285, 62056, 62057, 62060, 62061, 29296, 29297, 29300, 29301, 29322, 62102, 62103, 29339, 62113, 62132, 62133, 62147, 29386, 29390, 62162, 29407, 62177, 62181, 62192, 62193, 29446, 62218, 29462, 29463, 62238, 62239, 29476, 62248, 62249, 62252, 29493, 62264, 62269, 29506, 29510, 29511, 62282, 62283, 29523, 29526, 29527, 62298, 62299, 62302, 29536, 29537, 29540, 29541, 62312, 62317, 29553, 29556, 29557, 62328, 62332, 62333, 62342, 62343, 29578, 29579, 29582, 62358, 62359, 29594, 29595, 29599, 62369, 62372, 62373, 29608, 29609, 29612, 62384, 62385, 62389, 29624, 29625, 29629, 62402, 62407, 29642, 29643, 29646, 29647, 62419, 29662, 29663, 62432, 62433, 62436, 29673, 29676, 29677, 62452, 62453, 29689, 29692, 29693, 29713, 29717, 62488, 62493, 29731, 29734, 62506, 62507, 29746, 29751, 62522, 62523, 29760, 29777, 29781, 62553, 62556, 29794, 29799, 29811, 29814, 62593, 29836, 62613, 29853, 62626, 29866, 29870, 62643, 29887, 62656, 62661, 29896, 62673, 29913, 62695, 29930, 62710, 29947, 29951, 29953, 29957, 62729, 29968, 62744, 62762, 62767, 30006, 30007, 62778, 62779, 62782, 30017, 30021, 62793, 62796, 30032, 30036, 30051, 30055, 62830, 62831, 30066, 30067, 30070, 62843, 62846, 62847, 62848, 62849, 62853, 62865, 62882, 62898, 30139, 62913, 62917, 62932, 62933, 62947, 62950, 30190, 30211, 30214, 30226, 30227, 30230, 30231, 63002, 63003, 63006, 63007, 30241, 30244, 30245, 63016, 63017, 63020, 63021, 30256, 30257, 30261, 63032, 63037, 30274, 30279, 30290, 30291, 30294, 30295, 63070, 63071, 30304, 30305, 30309, 63081, 63085, 30320, 30321, 30324, 30325, 63096, 63097, 63106, 30351, 63123, 30366, 63136, 63137, 63141, 30377, 30380, 30381, 63152, 63157, 30392, 30393, 30396, 30397, 30411, 30426, 63201, 63205, 30440, 30441, 30445, 63220, 63221, 30456, 30457, 30460, 30461, 30466, 30471, 30482, 30483, 30487, 63259, 63262, 30496, 30497, 30501, 30513, 30516, 30517, 63288, 63292, 63293, 30531, 30534, 30546, 30547, 30550, 30551, 63323, 63326, 63327, 30560, 30561, 30564, 30565, 63336, 63337, 30576, 30577, 30581, 63357, 63363, 63378, 63392, 63393, 63409, 63413, 63443, 63457, 63460, 63461, 30700, 63473, 63477, 63505, 63509, 30749, 30762, 30766, 63542, 63543, 30779, 30782, 30783, 63553, 30796, 63568, 63569, 63573, 30809, 63586, 30831, 63603, 30849, 30853, 63624, 63628, 63629, 30865, 30869, 63645, 30882, 30898, 30899, 63679, 30912, 30913, 30916, 63692, 30929, 30933, 63705, 30946, 30947, 63727, 30962, 63742, 63749, 30989, 63764, 63765, 31004, 63782, 63783, 31019, 31023, 63798, 63799, 63813, 31053, 63825, 31064, 63843, 31086, 63858, 31105, 31109, 63885, 31120, 31121, 31125, 63896, 31138, 31154, 31155, 63934, 31169, 31173, 63945, 31185, 31188, 63964, 31202, 31218, 64003, 31242, 31246, 64019, 31262, 64033, 64049, 64052, 64053, 31288, 31289, 64066, 31306, 31310, 31311, 64082, 31322, 64096, 64097, 64101, 31336, 31337, 31340, 31341, 64112, 64113, 31362, 31363, 31378, 31379, 31392, 31393, 31397, 64168, 64173, 31408, 31409, 31413, 64184, 64188, 31426, 31427, 64206, 64219, 31456, 31457, 31473, 31477, 64248, 64252, 64258, 31499, 31502, 31503, 64274, 64275, 64279, 31519, 64292, 64293, 64304, 64305, 64309, 31544, 31545, 31548, 64323, 31563, 31567, 64338, 31579, 64352, 64357, 31593, 31596, 31597, 64369, 64373, 31618, 31619, 64399, 31634, 31635, 64414, 31648, 31649, 31653, 64424, 64428, 31664, 31665, 31669, 64440, 64445, 64463, 31712, 31713, 31717, 64488, 31728, 31729, 31733, 64528, 64529, 64533, 31769, 64547, 31786, 31790, 64562, 64567, 31806, 64576, 64581, 31816, 64593, 64597, 31837, 31851, 31872, 31873, 31876, 31877, 64652, 31889, 31893, 64665, 31906, 64686, 31922, 64703, 31936, 31941, 64712, 64716, 64717, 31953, 31957, 64733, 31970, 64769, 32009, 64785, 32024, 64802, 32043, 32047, 64819, 32059, 32062, 64833, 32073, 64852, 64853, 32092, 32106, 64883, 32129, 32133, 64905, 32145, 32148, 32149, 64924, 32162, 32163, 64939, 32178, 32179, 32193, 32197, 64973, 32208, 32213, 64984, 32227, 65006, 32242, 65023, 32266, 32267, 32270, 65043, 32282, 65057, 65061, 65072, 65073, 65076, 32316, 32317, 65095, 32330, 32331, 32334, 65107, 65110, 32350, 65121, 65125, 32360, 32361, 32365, 65137, 65140, 65141, 32386, 65167, 32403, 32416, 32417, 32421, 32432, 32433, 32437, 65208, 32450, 32451, 32467, 65246, 32480, 32481, 32485, 32497, 32501, 65272, 65276, 32523, 32527, 65299, 32539, 65312, 65313, 65332, 65333, 32569, 32572, 32573, 65350, 32586, 32587, 32591, 32607, 65380, 65381, 32616, 32617, 32621, 65393, 65397, 65422, 32673, 32677, 65448, 65452, 32688, 32689, 32693, 32707, 32722, 32723, 65503, 32737, 32741, 65512, 65516, 32752, 32753, 32757], 1092: [16384, 18440, 18441, 16418, 16419, 38947, 34851, 34850, 55331, 32810, 49194, 49195, 53290, 32815, 53291, 16434, 16435, 32814, 32826, 32827, 49211, 49210, 36923, 32831, 18495, 53306, 36922, 53307, 18494, 32830, 49215, 49214, 53311, 18560, 16520, 16521, 18576, 16536, 16537, 32931, 32930, 49315, 49314, 37027, 53410, 53411, 16554, 16555, 53426, 37043, 53427, 32947, 49331, 49330, 37042, 16570, 16571, 16588, 16589, 49704, 16604, 16605, 32994, 18658, 18659, 32995, 49379, 49378, 53475, 37091, 37090, 16622, 16623, 39150, 33010, 33011, 18675, 49395, 53490, 53491, 37107, 37106, 16639, 39167, 16638, 18696, 18697, 55587, 51491, 39203, 39202, 35107, 18735, 55602, 51507, 50130, 18750, 18751, 56237, 35890, 53805, 18816, 18832, 54227, 33474, 18915, 18931, 18930, 35310, 16898, 51715, 16899, 55810, 39427, 18954, 53770, 49675, 18955, 37387, 33290, 49678, 53775, 33295, 16928, 55840, 35360, 33320, 53801, 49708, 51760, 16944, 37421, 39472, 39596, 37432, 49721, 53820, 19004, 33341, 53816, 33337, 19005, 49725, 37571, 37507, 33410, 53891, 49794, 17038, 17039, 49811, 53906, 37522, 33427, 17054, 17055, 19104, 53920, 33440, 17068, 55980, 49840, 19120, 37552, 35501, 51885, 51900, 17084, 17085, 53955, 19139, 49858, 17098, 17099, 33491, 37586, 53970, 19155, 49875, 17114, 49888, 37600, 17115, 17128, 17129, 54000, 33520, 17144, 17145, 51970, 17155, 56067, 17154, 35587, 19210, 19211, 54027, 49930, 33547, 49935, 54030, 37647, 52000, 17184, 39712, 18478, 37672, 54060, 17200, 56112, 35632, 33592, 54073, 19260, 49980, 37693, 49976, 37689, 54077, 19261, 33550, 37762, 33667, 50051, 54163, 33682, 37779, 50080, 19360, 37792, 52140, 19376, 54192, 33712, 56252, 35773, 52157, 54210, 19395, 50115, 33731, 37642, 37843, 19411, 54240, 39682, 33760, 33577, 50160, 37872, 19468, 19469, 56355, 52258, 52259, 39971, 35875, 19498, 39987, 19514, 19515, 33596, 36857, 55997, 19618, 19619, 56490, 19635, 56507, 19648, 19664, 40952, 19724, 19725, 40227, 36131, 56610, 56611, 52515, 19755, 40242, 36147, 19770, 19771, 36907, 36910, 36911, 19875, 52650, 19890, 19891, 36926, 36927, 19904, 52667, 19920, 49965, 56835, 52738, 36355, 40450, 19982, 19983, 52768, 40480, 56880, 36400, 20024, 20025, 35327, 35330, 20099, 20115, 37390, 57336, 20192, 52969, 49198, 40680, 57064, 20208, 36585, 51235, 33324, 36600, 40697, 57090, 52995, 40707, 36610, 20238, 20239, 57120, 36640, 53040, 40752, 20280, 20281, 51250, 37417, 53295, 17069, 20355, 39868, 20371, 53310, 37436, 55347, 20448, 36840, 40937, 20464, 53241], 4115: [32798, 32799, 32858, 32859, 32963, 32979, 33038, 326, 327, 33098, 33102, 356, 33132, 372, 428, 429, 445, 33222, 33248, 33288, 33386, 33402, 648, 682, 33488, 733, 33510, 767, 768, 33664, 33699, 33744, 33819, 33836, 33886, 34063, 1350, 1351, 34123, 34127, 1380, 1396, 34168, 34169, 34183, 1422, 1453, 1468, 1469, 1482, 1499, 1512, 1513, 34288, 1528, 1529, 1536, 34333, 34346, 34430, 34448, 34487, 34603, 1860, 1895, 34666, 1910, 34687, 1928, 1945, 1996, 2013, 2122, 2123, 2157, 2169, 2173, 2198, 2199, 2212, 2228, 2262, 2263, 2378, 2379, 2408, 2412, 2424, 2428, 2438, 2468, 2484, 2502, 2503, 35305, 35344, 2636, 35446, 35464, 35465, 2708, 2723, 2726, 35499, 35567, 2807, 2893, 35664, 35736, 2983, 2995, 35775, 3062, 3150, 3151, 3177, 3181, 3193, 3222, 3223, 36025, 3286, 3287, 36062, 3300, 36076, 3316, 36088, 3406, 3407, 3432, 3436, 3448, 3452, 3462, 3463, 3527, 3556, 3572, 36368, 3716, 36492, 3811, 3814, 36647, 3916, 3988, 36761, 36809, 4066, 4071, 36846, 4086, 4115, 36894, 36895, 4178, 4179, 36954, 36955, 4234, 4251, 37059, 4302, 37075, 4319, 37135, 37195, 37229, 37360, 37385, 4688, 37482, 37499, 37504, 4761, 4812, 37622, 37776, 37811, 37824, 5142, 37914, 37933, 37983, 5236, 38222, 38368, 38424, 38442, 38443, 5716, 38511, 5751, 38528, 38566, 5806, 5823, 5866, 5883, 38698, 5972, 38748, 38767, 38782, 6174, 6234, 6235, 6490, 6491, 39504, 39594, 39696, 39816, 39832, 39833, 39851, 7158, 39935, 7195, 7379, 40159, 7450, 7558, 40360, 40376, 7619, 40410, 40429, 40441, 7704, 40487, 7872, 40664, 40698, 40720, 8028, 8029, 40861, 8144, 40925, 40943, 8227, 41082, 8367, 8382, 8427, 8442, 41229, 41263, 8516, 41289, 41293, 41323, 8567, 41338, 8623, 8638, 41412, 41443, 8683, 41458, 8698, 41517, 41551, 41772, 41773, 41848, 41952, 9236, 42009, 42012, 9300, 42072, 42077, 9357, 9372, 9417, 9432, 42252, 42313, 42317, 42372, 42448, 9750, 42522, 42526, 42536, 42537, 9814, 42621, 9871, 9886, 9931, 9946, 42793, 10071, 43012, 43072, 43092, 43123, 43148, 43199, 43212, 10452, 43228, 43229, 10467, 10482, 10483, 43328, 43420, 10675, 10692, 43485, 10722, 10723, 10739, 43519, 10767, 10782, 10877, 10883, 10898, 11022, 11039, 11138, 43915, 11155, 43945, 44013, 44052, 44067, 44096, 44169, 11412, 44188, 44189, 11427, 11442, 11443, 44219, 44236, 44237, 44248, 11491, 44282, 44292, 44322, 44352, 11652, 44440, 11682, 11683, 11699, 44504, 11787, 11802, 11971, 11986, 44781, 12042, 12059, 12152, 44969, 12226, 12243, 45179, 12458, 12462, 12475, 12479, 12522, 12526, 12539, 12543, 45324, 45358, 12612, 45384, 45389, 12646, 45418, 45435, 12718, 12735, 45538, 45555, 12794, 45612, 45673, 12938, 12955, 13006, 13023, 45869, 45948, 46000, 46048, 46064, 13332, 46104, 46108, 46168, 46172, 46348, 46349, 46409, 46412, 46528, 46618, 46633, 46636, 46716, 46717, 46875, 46888, 46943, 47245, 47308, 47325, 14578, 47364, 14635, 47424, 14664, 47444, 47475, 47516, 47517, 47530, 47534, 14774, 14788, 47581, 14818, 14858, 14862, 14978, 15119, 15235, 48132, 48162, 48192, 15437, 48265, 48285, 15523, 48329, 48345, 15586, 15590, 48404, 48419, 48448, 15748, 48536, 48554, 15795, 48605, 15882, 48778, 48824, 16139, 16143, 16338, 49145, 49178, 49179, 49246, 49247, 49283, 49299, 16647, 49418, 16707, 49486, 16752, 49542, 49568, 16859, 16900, 49689, 16935, 49756, 49770, 49774, 49775, 49808, 49872, 17216, 50013, 50048, 17387, 50216, 17671, 50443, 50507, 17776, 50557, 50716, 50731, 50799, 50811, 18107, 18158, 50956, 50973, 50991, 51066, 18442, 51339, 51354, 18592, 51368, 51372, 18608, 18656, 51437, 51453, 18698, 18699, 18792, 18793, 51594, 18835, 51611, 18848, 18912, 18928, 18953, 18956, 51728, 19021, 51848, 19107, 19122, 19213, 52007, 19307, 19323, 52109, 19363, 52218, 19466, 19467, 19471, 19586, 19587, 19603, 19650, 19680, 19696, 19723, 19726, 19727, 19922, 19952, 19981, 20094, 52906, 52907, 52940, 52941, 52957, 20194, 52975, 20236, 20297, 53072, 20335, 53129, 20402, 20451, 20466, 53247, 20498, 20499, 53274, 53275, 53342, 53343, 53379, 53395, 53515, 53583, 53609, 53654, 53680, 53773, 53853, 53867, 53886, 53887, 53888, 21132, 21145, 21149, 53952, 21192, 21196, 21209, 21264, 54044, 21328, 54108, 54127, 21384, 21385, 21389, 54160, 21400, 21453, 21464, 21468, 21469, 21526, 21527, 54313, 21604, 21620, 54538, 54602, 54637, 54652, 54653, 54688, 54743, 22036, 54812, 22054, 54830, 54876, 22119, 54890, 54891, 54906, 22156, 22173, 22186, 22187, 22190, 22202, 22203, 22206, 22207, 22250, 22254, 22255, 22266, 22267, 22270, 22271, 55147, 22443, 22447, 22458, 22472, 22489, 22506, 22507, 22511, 55286, 22523, 22526, 22554, 22555, 22622, 22636, 22658, 22659, 22674, 22675, 22726, 22810, 22811, 22878, 22893, 22914, 22915, 55691, 22930, 22931, 55737, 22998, 55788, 55804, 23064, 55847, 23167, 23168, 55995, 56012, 23270, 23271, 23286, 56080, 23388, 23389, 23406, 23407, 23440, 56235, 56281, 23527, 23543, 23583, 23642, 23656, 23683, 23686, 56492, 23747, 23762, 23763, 23899, 23913, 23958, 24002, 24019, 56912, 24153, 56935, 24187, 24230, 24246, 57037, 24272, 24311, 57104, 24348, 24349, 24413, 57191, 24426, 24427, 24487, 24503, 24512, 57309, 57327, 57470, 24746, 24750, 24763, 24767, 24810, 24814, 24827, 24831, 24836, 57608, 57609, 57643, 24896, 57673, 57677, 24931, 57711, 57726, 57732, 24972, 24989, 57763, 57778, 25032, 25049, 25094, 57870, 57896, 57931, 57965, 57980, 57981, 57990, 25230, 25247, 25290, 25307, 25411, 58237, 58272, 58288, 58336, 58393, 58397, 25684, 58457, 58461, 25719, 25740, 25757, 25800, 25817, 25860, 58632, 58633, 25920, 58697, 58701, 25992, 58768, 26009, 58820, 26060, 26077, 58910, 58925, 58974, 59001, 59074, 26375, 59167, 59180, 59256, 59257, 26637, 59427, 59456, 26697, 26700, 26752, 59528, 59647, 59652, 26892, 59682, 59712, 26957, 59763, 27012, 59788, 27024, 59848, 59849, 59868, 27146, 60047, 27403, 27602, 60420, 27657, 60480, 27720, 27725, 60514, 60531, 60552, 27840, 60616, 60671, 27912, 27977, 60808, 60809, 60825, 28100, 28112, 60888, 28174, 28285, 28290, 28307, 28431, 28540, 28562, 61356, 28786, 61567, 28842, 28847, 28859, 28862, 28907, 28910, 28922, 28927, 28932, 61704, 61705, 28967, 61738, 28992, 61769, 61772, 29042, 61823, 61858, 61967, 29220, 61992, 61993, 62076, 62077, 29552, 62368, 29613, 29628, 29659, 62448, 29688, 29716, 62489, 62492, 29780, 62552, 62557, 29867, 29871, 29882, 29886, 29931, 29935, 29946, 29950, 29956, 62728, 30016, 62792, 62797, 30089, 30104, 30157, 30172, 30275, 30308, 30376, 63174, 63186, 30444, 63263, 63276, 63277, 63352, 63353, 63492, 30729, 30733, 63522, 63552, 30848, 30883, 63662, 63693, 30928, 63704, 30963, 30984, 30988, 63779, 63808, 63897, 31139, 63919, 31168, 63944, 31203, 63982, 31219, 31247, 31277, 31307, 31442, 31532, 31562, 31566, 31592, 31682, 31699, 64493, 31753, 31757, 64648, 31888, 64664, 31907, 64682, 31923, 64713, 31971, 31986, 31987, 64772, 32008, 32012, 64832, 64866, 32128, 64904, 64920, 64921, 64985, 32226, 65002, 32243, 32297, 32335, 32364, 32387, 32402, 65213, 32466, 65242, 32496, 32522, 32552, 32590, 32620, 32642, 32659, 32706, 32736], 4123: [32790, 32820, 32851, 32970, 33005, 33030, 33031, 33094, 330, 331, 334, 335, 33120, 360, 361, 376, 377, 380, 454, 33284, 33296, 33318, 555, 33344, 584, 588, 635, 639, 675, 678, 33466, 742, 759, 33535, 33540, 33570, 814, 33590, 831, 840, 845, 33616, 33650, 33651, 890, 894, 33688, 930, 935, 33706, 947, 950, 994, 999, 33775, 1011, 1014, 33790, 33811, 33814, 33824, 33840, 33878, 33892, 33908, 34115, 1354, 1355, 1358, 1359, 1385, 1401, 1430, 34297, 34320, 34339, 1582, 1595, 1599, 34372, 1608, 1613, 34403, 34406, 1643, 1647, 1658, 1662, 34444, 1698, 1703, 1715, 1718, 1762, 1767, 1779, 1782, 1834, 1835, 34611, 1850, 1854, 34628, 1865, 1869, 1898, 1902, 34679, 1915, 1958, 1975, 34760, 2019, 2022, 2118, 2119, 2164, 34947, 2206, 2207, 35040, 2281, 35056, 2374, 2375, 35167, 2420, 2476, 35336, 35340, 2628, 35404, 2663, 2678, 2696, 2700, 2713, 2717, 2731, 35511, 2761, 35536, 2776, 2816, 35751, 35792, 35900, 3142, 3143, 35915, 3188, 3245, 36051, 3290, 3291, 36110, 36126, 36140, 3398, 3399, 3444, 36217, 3470, 3471, 36291, 36311, 36320, 36324, 3560, 36340, 3652, 3702, 36475, 36480, 3737, 3754, 3755, 36560, 3818, 3819, 3822, 3823, 3835, 3838, 3840, 36616, 3891, 3977, 36752, 3992, 36770, 4044, 36820, 4061, 4075, 36855, 4090, 4091, 36883, 36886, 36916, 4156, 4157, 36947, 4191, 4204, 4243, 37052, 4291, 37066, 37067, 4307, 37082, 37083, 37116, 37127, 37216, 37343, 4632, 37414, 4655, 37427, 4670, 4671, 37440, 37475, 37546, 4800, 4816, 37615, 37630, 37648, 4889, 4892, 37667, 4911, 37686, 4926, 4927, 37712, 4952, 4990, 37768, 5008, 37785, 37818, 5056, 5072, 5095, 37870, 37887, 37911, 37920, 37936, 5210, 37988, 38004, 38151, 38240, 38256, 38287, 38416, 38434, 38468, 5724, 5798, 38591, 38707, 5950, 38724, 5976, 38775, 6071, 38895, 38911, 6166, 6227, 6230, 6283, 6298, 6419, 39246, 6483, 6486, 6487, 39299, 6538, 6555, 39433, 39437, 6676, 6740, 6830, 39616, 39632, 6928, 6996, 39812, 39872, 7187, 7190, 39966, 7200, 7216, 7254, 7264, 7374, 7375, 7390, 7391, 40160, 40180, 7443, 7447, 40223, 7456, 7472, 40249, 40252, 7510, 40297, 40312, 40368, 7630, 7631, 40403, 7646, 7647, 7700, 40473, 40495, 7731, 7735, 7760, 7764, 7795, 7850, 40640, 7901, 40695, 40713, 40728, 7970, 7971, 7987, 8016, 8020, 40832, 8106, 40883, 8141, 8190, 40980, 40995, 40998, 41010, 41015, 41044, 41058, 41063, 41075, 41078, 8355, 8358, 41146, 41180, 8422, 41198, 41199, 8439, 41211, 41214, 41215, 41220, 41280, 41284, 8525, 41315, 8554, 41406, 8660, 41467, 41475, 41478, 8715, 41508, 41520, 8760, 41538, 8783, 8799, 8813, 41584, 41588, 8835, 41614, 41627, 41641, 8880, 41656, 41675, 8918, 41690, 41708, 8948, 41720, 41730, 41735, 8970, 41760, 9000, 9017, 41795, 9055, 41828, 41840, 9085, 9090, 41867, 9107, 9120, 9158, 9188, 41964, 41976, 41981, 42000, 42004, 9240, 9241, 9244, 9245, 42018, 42035, 9278, 42064, 42068, 9304, 9305, 9308, 9309, 42086, 42103, 42141, 42188, 42201, 9442, 42218, 42223, 9459, 42235, 42244, 42304, 42308, 9545, 42338, 42339, 42355, 9594, 9620, 9639, 42475, 42490, 42491, 42498, 42503, 9738, 9742, 42515, 9754, 9758, 42548, 9788, 42566, 42578, 42579, 9818, 9819, 42596, 42608, 9848, 9874, 9908, 9922, 9939, 9968, 42755, 42758, 9999, 10010, 10014, 42784, 42788, 42800, 10045, 42823, 42835, 10074, 10075, 42848, 42907, 10148, 42941, 10179, 42959, 10208, 43050, 43054, 43084, 10355, 10461, 10478, 43322, 10580, 43387, 10666, 10683, 43472, 43531, 43550, 43561, 10800, 10839, 43644, 10921, 43764, 11004, 11040, 43816, 43881, 11193, 11214, 44004, 11244, 44045, 44060, 44075, 11318, 44104, 44108, 44159, 44160, 11421, 11454, 11455, 11468, 11481, 11515, 11540, 44330, 11575, 11711, 11741, 11755, 44535, 11770, 44554, 44555, 44558, 44559, 11828, 44604, 44618, 11858, 11859, 44635, 11918, 44724, 11964, 11995, 44814, 44815, 12050, 12051, 44840, 44856, 44861, 44875, 44890, 44891, 44930, 44964, 12204, 12250, 12285, 45076, 12316, 12317, 45107, 45110, 45140, 12380, 12381, 45155, 45171, 12410, 12420, 12450, 12455, 12467, 12470, 12500, 12514, 12519, 45290, 45291, 45295, 12531, 12534, 45310, 45316, 45376, 45380, 12616, 12617, 12620, 12621, 45411, 12650, 12651, 12654, 12666, 12667, 12670, 12740, 12775, 12810, 45600, 45604, 12840, 12844, 12845, 12857, 12860, 12861, 45634, 12878, 12908, 45680, 12920, 12921, 12947, 45722, 12960, 12995, 12998, 45771, 45786, 13028, 45827, 45830, 13067, 13071, 13097, 45891, 13165, 45936, 13187, 45962, 13202, 13250, 13267, 46057, 13300, 46076, 46096, 46100, 13336, 13337, 13340, 46114, 13358, 46131, 46160, 46164, 13400, 13404, 13405, 46182, 46199, 13440, 46221, 13456, 46236, 13504, 46281, 46284, 46285, 13520, 13539, 46315, 46330, 46340, 46400, 46404, 13640, 13641, 13644, 13645, 13674, 13675, 13690, 13694, 13700, 46476, 46493, 13750, 46595, 13839, 46611, 13854, 13864, 13868, 46662, 46692, 13928, 13974, 46760, 46764, 46781, 14019, 46851, 14094, 14106, 14107, 14110, 46880, 14120, 46896, 14140, 46919, 14189, 46960, 14200, 14204, 14205, 14211, 14291, 14320, 47162, 47181, 14420, 47196, 47236, 47271, 14506, 14523, 47316, 14556, 14590, 47402, 47436, 47453, 14694, 47508, 47556, 14796, 14847, 14880, 14918, 14948, 47720, 47724, 47751, 15071, 15101, 15152, 15175, 47981, 15220, 15307, 15336, 15341, 15380, 15398, 48171, 48201, 15500, 48276, 15516, 15530, 15547, 48324, 15561, 15564, 48336, 15576, 15595, 48375, 15610, 48426, 48460, 48461, 15696, 48516, 15756, 15757, 15773, 15787, 15791, 15802, 48576, 15816, 15837, 48615, 15850, 15867, 48650, 48655, 15891, 15895, 48666, 15908, 15920, 48701, 48715, 48770, 48855, 16104, 16121, 16131, 48910, 16147, 16176, 48952, 48970, 16301, 49095, 16365, 16376, 16381, 49171, 49204, 49235, 49238, 49290, 49291, 49306, 49307, 49341, 49405, 49415, 16650, 16651, 16654, 16655, 49520, 16835, 49627, 49668, 16904, 16908, 16938, 49715, 16958, 49744, 49762, 17002, 17003, 17006, 17007, 49854, 17122, 49898, 17139, 17160, 17165, 49955, 49970, 17211, 50019, 50090, 50107, 50140, 17379, 50170, 50224, 50263, 50276, 50292, 50360, 50361, 50439, 17674, 17675, 17678, 17679, 17811, 17928, 17933, 50722, 50723, 50739, 50756, 50790, 18047, 18185, 18189, 50995, 18234, 18238, 18239, 51012, 18287, 51062, 51063, 18299, 18338, 18355, 51198, 18438, 18439, 18498, 18499, 51331, 18604, 18694, 18695, 51466, 18754, 18755, 51546, 51586, 18948, 51721, 18998, 51804, 19043, 19084, 51856, 19255, 19264, 52057, 52112, 52160, 19462, 19463, 19523, 52318, 52388, 52418, 52435, 19718, 19719, 52540, 19779, 52575, 52631, 52660, 52675, 52690, 19949, 19972, 52748, 52778, 52863, 52928, 20206, 20223, 53005, 53200, 20463, 20478, 53267, 20510, 53300, 20540, 20541, 53334, 20611, 53387, 20627, 53403, 20675, 53484, 53571, 53677, 53707, 53722, 53798, 53799, 21039, 53811, 53859, 53874, 21120, 21136, 53916, 21159, 53950, 53951, 21184, 54020, 21273, 54050, 21295, 54067, 21341, 54131, 21376, 21392, 54187, 54191, 21430, 54202, 21456, 54267, 54294, 21531, 54320, 54355, 54358, 54372, 54388, 54534, 54535, 54598, 54683, 54818, 54819, 22059, 54852, 54886, 22179, 54954, 54971, 22263, 22297, 55091, 55108, 22365, 55158, 55159, 55260, 22502, 22547, 22550, 22551, 55326, 22611, 55386, 55426, 22666, 55443, 22683, 55494, 55495, 22803, 22806, 22870, 55683, 22922, 55712, 55780, 55816, 23060, 23079, 55871, 23124, 55914, 55936, 55952, 23244, 23279, 23316, 56111, 56122, 23376, 56152, 56192, 23497, 56272, 23512, 23574, 23600, 23635, 23639, 56415, 56454, 56455, 56515, 56530, 23830, 23856, 23891, 23894, 56670, 56770, 56787, 24045, 24060, 24080, 24084, 24098, 24099, 24148, 24303, 57074, 57100, 24336, 24340, 57271, 57280, 57314, 24574, 24575, 57364, 24604, 24605, 57382, 57399, 57428, 24668, 24669, 57442, 57447, 57459, 57462, 24698, 24708, 24738, 24743, 24755, 24758, 57530, 24788, 24802, 24807, 24819, 24822, 57604, 24840, 24841, 24844, 57639, 57654, 57655, 24894, 57664, 57668, 24905, 57699, 24938, 57714, 57715, 24998, 25024, 57862, 25098, 25102, 57879, 25128, 25129, 25133, 57908, 25148, 57922, 25162, 25163, 57968, 25208, 25268, 25328, 58119, 25355, 25359, 58134, 58135, 58148, 25405, 58179, 25494, 25539, 58384, 58388, 25625, 58402, 58419, 25659, 58448, 58452, 25693, 58470, 25728, 58524, 58525, 25792, 25808, 58584, 58585, 58628, 25865, 25868, 25869, 25914, 25915, 25918, 25919, 58688, 58692, 25933, 58726, 58742, 58743, 25983, 26000, 58776, 26019, 26103, 58882, 58887, 26123, 58899, 58950, 58966, 26207, 58996, 59049, 59139, 59142, 26378, 59154, 59155, 59168, 26425, 26429, 59222, 59223, 59236, 26515, 26528, 26628, 26679, 26688, 59520, 26781, 59571, 26814, 59588, 26829, 26934, 59724, 59725, 27021, 27081, 59860, 27143, 27188, 27203, 59999, 27320, 27324, 27354, 60144, 27488, 27564, 27576, 60384, 27664, 27712, 60548, 27801, 60599, 27834, 27852, 27869, 27908, 27920, 27968, 60744, 60745, 60764, 28041, 60820, 28060, 28061, 28074, 28109, 60880, 28120, 28121, 60942, 60943, 61037, 28329, 61104, 28344, 61275, 61344, 61460, 61494, 61524, 61539, 28778, 28838, 28855, 28899, 28902, 61700, 28936, 28937, 28940, 28974, 28990, 61760, 61764, 29000, 61836, 29111, 29120, 29199, 29214, 61988, 29245, 29259, 62048, 29288, 29319, 29348, 62124, 62141, 29379, 29394, 29408, 62184, 62214, 29454, 29470, 29485, 62260, 62320, 62381, 62393, 62441, 29680, 62456, 62480, 62484, 29720, 62544, 62548, 29788, 62620, 62621, 29858, 29875, 62681, 62684, 62724, 29961, 29964, 29965, 30010, 30014, 30015, 62784, 62788, 30028, 62835, 62856, 30182, 62955, 62979, 30218, 30222, 63008, 30303, 63076, 30355, 30368, 63161, 63212, 30475, 30479, 63280, 30520, 63315, 30555, 63348, 30640, 63416, 63469, 30708, 63484, 30759, 30774, 63561, 63564, 30876, 63684, 30924, 30925, 30936, 30980, 31040, 31116, 63956, 31227, 31238, 64044, 64061, 64121, 64164, 31404, 64224, 31481, 31540, 64313, 64316, 64361, 31600, 64376, 64436, 31676, 31721, 64496, 64584, 64585, 31994, 32004, 64793, 64844, 32103, 32136, 64916, 32216, 32235, 32262, 32275, 65064, 65084, 65115, 65132, 65149, 32395, 65184, 32441, 32463, 65234, 65252, 65321, 65336, 65456, 65491, 65524], 4138: [32883, 32959, 33045, 33062, 328, 329, 33105, 344, 345, 349, 33123, 366, 378, 379, 383, 389, 401, 405, 33180, 449, 465, 469, 33259, 33302, 33316, 602, 603, 607, 33392, 632, 633, 637, 647, 663, 727, 795, 799, 33568, 825, 828, 33603, 842, 843, 846, 847, 858, 862, 872, 873, 876, 877, 33648, 915, 963, 33789, 33812, 33843, 33857, 33861, 33876, 33894, 34047, 34052, 34065, 34069, 1304, 1305, 1308, 34086, 34099, 34112, 1356, 1357, 34129, 34133, 1386, 1406, 1409, 1413, 34184, 34185, 1425, 34200, 1473, 1477, 34252, 1493, 34323, 1563, 1567, 34352, 1593, 1596, 34374, 1610, 1611, 1614, 1615, 34387, 1626, 1630, 34404, 1640, 1641, 1644, 1645, 1683, 1731, 34566, 1818, 1819, 1822, 1832, 1833, 1836, 1912, 1916, 1917, 1927, 1991, 2007, 2069, 2129, 2188, 2189, 2204, 2205, 2248, 2249, 2264, 2265, 2298, 2321, 2325, 2343, 2355, 2385, 2389, 2423, 2440, 2444, 2445, 2457, 2460, 2461, 2494, 2504, 2505, 2508, 2520, 2521, 2525, 2539, 2542, 2559, 35339, 2673, 2677, 35462, 2763, 2778, 2783, 35594, 2839, 2886, 2887, 2913, 2916, 2917, 2929, 3018, 3023, 3034, 3035, 3072, 35853, 3089, 3093, 3153, 3157, 3191, 3209, 3212, 3224, 3225, 3229, 3262, 3272, 3277, 36048, 3289, 3292, 3293, 36083, 3327, 3328, 36108, 3345, 3413, 3447, 3465, 3480, 3481, 3515, 36288, 3533, 3548, 3549, 36323, 36367, 36443, 3697, 3701, 36486, 3723, 3726, 3738, 36563, 36576, 36622, 36623, 3910, 3911, 3927, 3937, 3940, 3941, 3957, 3978, 3982, 36758, 3995, 3998, 36785, 36803, 36848, 36979, 37098, 37114, 37124, 37137, 37141, 37158, 37184, 37201, 37205, 37219, 37261, 37277, 37337, 37371, 37382, 37383, 37399, 4638, 37412, 4703, 37488, 4742, 4806, 4894, 37699, 4959, 37744, 4984, 4999, 37908, 37939, 37953, 37957, 37972, 37990, 5231, 38041, 38074, 38161, 38195, 38198, 38229, 38280, 38281, 38285, 38296, 38419, 38467, 38470, 38500, 38704, 38742, 6164, 6209, 6213, 6228, 6301, 6361, 6365, 6382, 6398, 6420, 6465, 6469, 6484, 6604, 6638, 39434, 6743, 6752, 6753, 6769, 6773, 39638, 6919, 39691, 6934, 7009, 39800, 39856, 39878, 39948, 7184, 7188, 7233, 7237, 7252, 7271, 7304, 7321, 40128, 7372, 40163, 7407, 7422, 40205, 7440, 7444, 7489, 7493, 7508, 7543, 7560, 40375, 7628, 7662, 40435, 7679, 40462, 7763, 7767, 7777, 7793, 7797, 40569, 40643, 40672, 40719, 7958, 40835, 40902, 40915, 40944, 40996, 41013, 41043, 41076, 8323, 8387, 8403, 41252, 8505, 8508, 8509, 8522, 8523, 8527, 41316, 8557, 41328, 41434, 41476, 41492, 41510, 41511, 41552, 41733, 8968, 9036, 41812, 9052, 9053, 41827, 41843, 9082, 9083, 9088, 41865, 9152, 9168, 42054, 42055, 9290, 9291, 9294, 9295, 42084, 9320, 9321, 9324, 9325, 42243, 42272, 42292, 9528, 9529, 9532, 9547, 9550, 9551, 9576, 42356, 42516, 9753, 9757, 42547, 42564, 9800, 9801, 9804, 9805, 9834, 9838, 9839, 42756, 42768, 42803, 10057, 10060, 10061, 42836, 10073, 10077, 10090, 10094, 10095, 42871, 10243, 43023, 43034, 10293, 43065, 10310, 10340, 10341, 43139, 43184, 10518, 10545, 10549, 10566, 10567, 10583, 10596, 43373, 10817, 10820, 10854, 10855, 10867, 10987, 11003, 11073, 11076, 11077, 11123, 43904, 11242, 11258, 11313, 11317, 11331, 11334, 11335, 11347, 11364, 44227, 44243, 44256, 44272, 11517, 11542, 11569, 11590, 11591, 11603, 11607, 11617, 11620, 44483, 44512, 11757, 44528, 11772, 11844, 11845, 11878, 11879, 44727, 44736, 44752, 12097, 12100, 12101, 12134, 12135, 44992, 45008, 12314, 45092, 12332, 12333, 12379, 45360, 12600, 12604, 12605, 12618, 12619, 12622, 45408, 45412, 12648, 12649, 12652, 45572, 45606, 45607, 12846, 12847, 45648, 45840, 45904, 46015, 46150, 46151, 46180, 46368, 46384, 13624, 13625, 13629, 13642, 13646, 13647, 13673, 13676, 13677, 46608, 46612, 13848, 13849, 13852, 13882, 46660, 13913, 13917, 13952, 46744, 46797, 14032, 14168, 14172, 46967, 14206, 47035, 47115, 47118, 14355, 14359, 14385, 47165, 14422, 14449, 14453, 47238, 14525, 14595, 14625, 14629, 47468, 14705, 47574, 47629, 47678, 14913, 14917, 15082, 15169, 15207, 15355, 15359, 15393, 15397, 15408, 15446, 15461, 15477, 48262, 48279, 48323, 48352, 15597, 15609, 15612, 48394, 15664, 48440, 15729, 15733, 48598, 48624, 15869, 48648, 15937, 15941, 48716, 48832, 48867, 48909, 16179, 48954, 16197, 16231, 16315, 49104, 16366, 16367, 49139, 49402, 16649, 16653, 49425, 49443, 49446, 16682, 16683, 16686, 49493, 16784, 16848, 16906, 16907, 16910, 16911, 49686, 16922, 16926, 49700, 16936, 16937, 16940, 16941, 49927, 49952, 17208, 17209, 17212, 49987, 17246, 17247, 50032, 50105, 50196, 50241, 50245, 50260, 50427, 50436, 17672, 17676, 50453, 50470, 17706, 17710, 17711, 50483, 50486, 17723, 17726, 17727, 50496, 50513, 50531, 17792, 17856, 50648, 50682, 17950, 17951, 17977, 17980, 17981, 50758, 50771, 50788, 50950, 18186, 18187, 18190, 18191, 18216, 18217, 18220, 18221, 50992, 18232, 18233, 18236, 18237, 51015, 18267, 18271, 18436, 18449, 18471, 18496, 18517, 51383, 18619, 18692, 18705, 18709, 18726, 18752, 18769, 18773, 18927, 18942, 51723, 18977, 18980, 18993, 18997, 51807, 51859, 19103, 51910, 51937, 19206, 19207, 51978, 51979, 19233, 19236, 19237, 19249, 52182, 19422, 19437, 52209, 19460, 19473, 19477, 19491, 19494, 19495, 19520, 19537, 19541, 19647, 19716, 19733, 19750, 19751, 19776, 19793, 52602, 19962, 52751, 20004, 20005, 20017, 20021, 20064, 20080, 52934, 20187, 20230, 20231, 53006, 20257, 20260, 20261, 20277, 20320, 53097, 20336, 53187, 53206, 53283, 53303, 53363, 53439, 53482, 53487, 53499, 53508, 53521, 53555, 53568, 53589, 53603, 53695, 53766, 53767, 53783, 21022, 53796, 21087, 53872, 21207, 21278, 54048, 54083, 21343, 21373, 21398, 21462, 54292, 54323, 54337, 54341, 54356, 54371, 54374, 21611, 54391, 54462, 54493, 54507, 54549, 54566, 54582, 54609, 54643, 54729, 54732, 54733, 54748, 54803, 54832, 54851, 54854, 54884, 55110, 55123, 55126, 22548, 22593, 22597, 22612, 22630, 22631, 22749, 22766, 22804, 22849, 22853, 22868, 22886, 22887, 22924, 22988, 23039, 55818, 23063, 23141, 55933, 55958, 23277, 56075, 23382, 23397, 23413, 56198, 56240, 23518, 23572, 23617, 23621, 23632, 23636, 23654, 23828, 23873, 23877, 23888, 23892, 23911, 23944, 23948, 23965, 23995, 24008, 24025, 56846, 24083, 24087, 24165, 24176, 24327, 57103, 24406, 24421, 24433, 57222, 57363, 24602, 57380, 24620, 24621, 57393, 24667, 57460, 57603, 24843, 24847, 24858, 24862, 57633, 57636, 57637, 24872, 24873, 24876, 57649, 57700, 57712, 57738, 57758, 57860, 25097, 25101, 57873, 57876, 57877, 25112, 25116, 57891, 57894, 57895, 25130, 25131, 25134, 25217, 25281, 58095, 58111, 58113, 58129, 58167, 58196, 58197, 58248, 58265, 58298, 58317, 58350, 58366, 58439, 58468, 25867, 25871, 25897, 25900, 25901, 58676, 58677, 25947, 25951, 58740, 58766, 58857, 58872, 58900, 58948, 58979, 59140, 26376, 26380, 59152, 26410, 26414, 26415, 59220, 26456, 59251, 59255, 26496, 26576, 26630, 26657, 26660, 26661, 26736, 59617, 26887, 59658, 26902, 26916, 26917, 26933, 26963, 26967, 26992, 59859, 59889, 59913, 27152, 27153, 27174, 27175, 59947, 59962, 27221, 27255, 60097, 60151, 27393, 27396, 27397, 27409, 60203, 27447, 60218, 27477, 60253, 27511, 60304, 27608, 27654, 60446, 27681, 27684, 60477, 27760, 60547, 60657, 27911, 27926, 27937, 27940, 27941, 27957, 60777, 28016, 60819, 60912, 28177, 28198, 28199, 28224, 28245, 28279, 28417, 28420, 28421, 28454, 28455, 28471, 61246, 28480, 28501, 28535, 28572, 61476, 28728, 28729, 28803, 28819, 28883, 28938, 28942, 61715, 28954, 28958, 28968, 28969, 28972, 28973, 61744, 61745, 61792, 61796, 61956, 29193, 29197, 29209, 29213, 61987, 29226, 29227, 29230, 62032, 62033, 62037, 29312, 29328, 29392, 29397, 62190, 62191, 62206, 62207, 29452, 62224, 62225, 62292, 62293, 62323, 62535, 29770, 29771, 29774, 29775, 62564, 29800, 29801, 29804, 29805, 62697, 29962, 29966, 62752, 62753, 62757, 29992, 29993, 29996, 29997, 62772, 62773, 62803, 30043, 30047, 62858, 62992, 62996, 63044, 63113, 63283, 63347, 63351, 63498, 30743, 30769, 30773, 63545, 30806, 63686, 63729, 30982, 63755, 63758, 31025, 31029, 63800, 63804, 63878, 63894, 63969, 31233, 31237, 31249, 31253, 31267, 64043, 31335, 31418, 64231, 64243, 31489, 64265, 31523, 64299, 31573, 31591, 64435, 64449, 31693, 64487, 64527, 31763, 31767, 31793, 31797, 64569, 31814, 31830, 64710, 64737, 32006, 32049, 32053, 64872, 64918, 64967, 64992, 32257, 32261, 32273, 32277, 65087, 32320, 65097, 32336, 32359, 65251, 65255, 32517, 32576, 32593, 32615], 4142: [32958, 33041, 33059, 332, 333, 33109, 348, 362, 382, 385, 453, 606, 636, 711, 33543, 824, 829, 899, 979, 33983, 1309, 34102, 1352, 1353, 34147, 1390, 1402, 1429, 34204, 34238, 1489, 1592, 1597, 1667, 1747, 1823, 1837, 34608, 34631, 1913, 1943, 2048, 2065, 2133, 2167, 2185, 2200, 2201, 2235, 2253, 2268, 2269, 2304, 35198, 2441, 2456, 2509, 2524, 2762, 2767, 2782, 2903, 35693, 2933, 35715, 35734, 3022, 3039, 3213, 3228, 3273, 3288, 36087, 3349, 3367, 3379, 3409, 3464, 3468, 3469, 3484, 3485, 3498, 3503, 3528, 3529, 3532, 3544, 3545, 3578, 3727, 3739, 3742, 36513, 3863, 3953, 3979, 3999, 36899, 36919, 37035, 37038, 37055, 37115, 37171, 4634, 4699, 4890, 37664, 4955, 4988, 5063, 37987, 5227, 38007, 38063, 38138, 38165, 38182, 38225, 38259, 38448, 38726, 38739, 6160, 6247, 6280, 6315, 6330, 6348, 6416, 6519, 6536, 6570, 6587, 6739, 7325, 7338, 7354, 7385, 7594, 7776, 40662, 7943, 8033, 40979, 41009, 8339, 41219, 41249, 41253, 41265, 8504, 8526, 8553, 41422, 41489, 41493, 41507, 41643, 41659, 41729, 8972, 41745, 41783, 9032, 41813, 9048, 9049, 9086, 9087, 9104, 41898, 41914, 41932, 41949, 41982, 42293, 9533, 9546, 9580, 42413, 42428, 42442, 42595, 9835, 10056, 10091, 42867, 10289, 10307, 10311, 10323, 43185, 10425, 43203, 10579, 10593, 10665, 43440, 10680, 43475, 10821, 43834, 11110, 11111, 11267, 11365, 44193, 44302, 11573, 44435, 44465, 44557, 44591, 44606, 11841, 11891, 44673, 11951, 11967, 44847, 44862, 44889, 12147, 12206, 12222, 12318, 12328, 12329, 12383, 45331, 45361, 12601, 12623, 12653, 45603, 12842, 12843, 45649, 45653, 45738, 45739, 45754, 45755, 45841, 45908, 45909, 45939, 46253, 46369, 46373, 46388, 46389, 13628, 13643, 46419, 13672, 46542, 13853, 13886, 13968, 14016, 46899, 46963, 14202, 14369, 14373, 14384, 14437, 47265, 14505, 14520, 14640, 14709, 47495, 47520, 14777, 47675, 47693, 47779, 47783, 15155, 15173, 15274, 15275, 48142, 15379, 15383, 15409, 48189, 15473, 48305, 15619, 48399, 15649, 15653, 48444, 48545, 48582, 48687, 48807, 16046, 48819, 48943, 16193, 49025, 49063, 16319, 49267, 49403, 49429, 16687, 49489, 49507, 49583, 49624, 49776, 17213, 17242, 17243, 50227, 50278, 50363, 50449, 17707, 17722, 50517, 50568, 50636, 50637, 50652, 50707, 17946, 17947, 50736, 17976, 51209, 18453, 18467, 18470, 18513, 51344, 51379, 18683, 51464, 18727, 51584, 51619, 18878, 18981, 19040, 19056, 51872, 19253, 19296, 19312, 52099, 52144, 19711, 19729, 19797, 19883, 19898, 20001, 20273, 20378, 20393, 53422, 53438, 53525, 53542, 53585, 53661, 53705, 53721, 21018, 21083, 21143, 21274, 21339, 54128, 21369, 21615, 54526, 54545, 54579, 54613, 55088, 55304, 22608, 55424, 55459, 55561, 22864, 22941, 55731, 22984, 23001, 55799, 23059, 23152, 55939, 55968, 23303, 23409, 56211, 56259, 23655, 23705, 23722, 23910, 56982, 24233, 24437, 57212, 24474, 57328, 24606, 24616, 24617, 57397, 57427, 24671, 24877, 25135, 57936, 58117, 58211, 58227, 58438, 58627, 58656, 25896, 58931, 26411, 59187, 26460, 26512, 26560, 59523, 59539, 59552, 59568, 26913, 59779, 59808, 59824, 27200, 60032, 60048, 27430, 27431, 27456, 60288, 60427, 27685, 60611, 60656, 27987, 27991, 28176, 28433, 61376, 28732, 28733, 28867, 61990, 61991, 29231, 29333, 29376, 29448, 62288, 62459, 62534, 62768, 63196, 63487, 30739, 30790, 63619, 63648, 63703, 63920, 64012, 31296, 64072, 31312, 64128, 64163, 31493, 64318, 31552, 31569, 64400, 64522, 65033, 32291, 65082, 32510, 32513, 32547, 32597, 32649], 4147: [256, 273, 277, 33049, 290, 33070, 33071, 324, 337, 341, 33112, 33113, 33117, 358, 375, 33146, 33147, 33151, 33157, 392, 396, 397, 33169, 33173, 409, 412, 413, 33191, 426, 430, 431, 33207, 443, 446, 447, 456, 457, 460, 33237, 472, 473, 477, 33250, 490, 491, 494, 33266, 33271, 506, 507, 511, 530, 33306, 33310, 33311, 545, 582, 583, 599, 33370, 33371, 33375, 612, 33384, 628, 629, 33414, 654, 655, 670, 671, 33441, 33445, 684, 685, 33461, 700, 701, 714, 715, 730, 731, 33505, 744, 745, 33521, 33525, 760, 761, 33713, 33761, 33765, 33816, 33820, 33834, 33835, 33839, 33864, 33865, 33868, 33869, 33880, 33884, 33903, 33918, 33921, 33924, 33940, 33941, 33959, 33970, 33974, 33988, 33989, 34001, 34004, 34022, 34023, 34034, 34038, 34039, 1280, 1297, 34072, 34073, 34076, 34090, 34091, 34094, 1365, 34136, 34174, 34175, 34177, 34181, 1417, 1420, 1421, 34193, 1432, 1436, 1437, 34210, 1450, 1451, 1454, 34226, 1466, 1467, 1471, 34241, 1480, 1481, 1485, 1496, 1497, 1500, 34274, 34279, 1514, 1518, 1519, 34295, 1531, 1534, 1535, 34344, 34413, 34424, 34434, 34468, 34469, 34502, 34518, 34545, 34548, 34549, 34586, 34591, 34600, 34601, 34604, 34650, 34655, 34668, 34669, 34680, 34681, 34684, 34685, 34690, 34710, 34711, 34721, 34724, 34725, 34737, 34740, 34741, 34758, 34759, 34774, 34785, 34788, 34789, 34801, 34804, 34805, 2076, 2077, 2091, 2120, 2121, 2136, 2137, 2159, 2174, 2180, 2181, 2196, 2197, 2226, 2241, 2257, 2279, 2294, 2332, 2333, 2346, 2376, 2377, 2392, 2393, 2414, 2431, 2436, 2437, 2452, 2453, 2466, 2497, 2513, 2534, 2551, 35351, 2591, 35365, 2601, 2634, 2635, 35410, 2651, 2668, 2684, 2685, 2706, 2724, 2740, 2741, 35513, 2758, 2759, 2775, 35560, 2801, 35577, 35580, 35590, 2846, 2856, 2890, 2891, 35671, 2906, 35680, 2925, 35701, 2940, 2941, 2946, 2980, 2981, 2996, 3015, 3030, 3031, 3041, 35817, 35832, 35837, 3096, 3097, 3119, 3148, 3149, 3164, 3165, 3179, 3194, 3201, 35976, 3217, 35993, 3239, 3254, 3268, 3269, 3284, 3285, 3314, 3352, 3353, 3374, 3404, 3405, 3420, 3421, 3434, 3451, 3457, 36232, 3473, 36249, 3494, 3511, 3524, 3525, 3540, 3541, 3554, 36358, 3611, 36385, 3629, 3662, 3663, 3679, 36448, 3688, 3704, 3705, 3718, 3719, 3735, 36521, 3761, 3794, 3812, 3828, 3829, 36605, 3866, 3884, 3918, 3919, 36694, 3934, 3945, 3960, 3961, 3975, 3990, 3991, 4001, 36781, 36793, 4034, 4068, 4069, 36845, 4084, 36860, 37144, 37166, 37167, 37208, 37209, 37212, 37242, 37243, 37246, 37249, 37253, 37269, 37287, 37303, 37317, 37346, 37351, 37362, 37403, 37406, 37407, 37466, 37467, 37470, 37481, 4746, 4751, 37526, 4763, 4766, 37541, 4776, 4781, 37553, 37557, 4793, 4796, 4811, 4814, 4826, 4831, 37601, 37605, 4841, 4844, 37617, 4856, 4861, 37793, 5033, 5036, 5048, 5053, 5096, 5101, 37873, 37877, 5113, 5116, 5140, 37913, 37917, 5158, 37930, 37931, 37934, 5185, 37960, 37961, 37964, 37965, 37977, 37981, 5218, 37998, 38015, 38020, 38021, 5261, 38033, 38036, 5276, 38050, 38054, 5294, 38071, 5311, 38081, 38084, 5321, 38100, 38101, 5336, 38114, 38118, 38119, 5354, 38134, 38135, 5371, 38168, 38169, 38173, 38186, 38187, 38191, 38233, 38270, 38271, 38273, 38289, 38293, 38306, 38322, 38353, 38375, 38386, 38391, 5654, 5668, 38441, 38508, 38521, 38546, 5801, 38580, 38581, 5816, 38598, 38614, 38625, 38628, 38629, 5869, 5884, 38683, 38686, 38696, 38697, 38701, 38747, 38750, 38764, 38765, 38776, 38777, 38780, 38781, 38790, 38791, 38802, 38817, 38820, 38821, 38833, 38836, 38837, 38854, 38870, 38871, 38881, 38884, 38885, 38897, 38900, 38901, 6216, 6217, 6254, 6276, 6292, 6374, 6472, 6473, 6511, 6532, 6548, 6646, 39430, 6666, 6670, 6686, 6696, 39511, 39520, 39541, 6786, 6816, 6836, 6880, 6881, 39657, 39660, 39672, 6923, 6927, 39703, 6943, 39717, 6953, 39762, 7058, 7076, 39848, 7088, 39912, 39917, 7152, 7153, 39929, 7244, 7245, 7274, 40072, 40089, 7334, 7364, 7380, 7500, 7501, 7531, 40328, 40345, 7606, 7620, 7636, 7690, 7694, 7706, 7724, 40534, 7840, 7841, 40616, 40636, 7874, 7904, 40685, 7924, 40700, 40710, 7947, 7951, 7963, 40737, 7981, 40800, 8112, 8113, 40888, 8146, 8164, 40940, 8176, 40986, 41054, 41121, 41189, 8519, 8564, 41340, 41350, 8587, 41367, 8602, 8617, 8632, 8655, 8670, 8685, 41460, 8700, 41496, 41501, 41544, 41549, 41560, 41565, 41578, 41601, 41604, 41605, 41638, 41681, 41684, 41685, 41753, 41756, 41820, 41873, 41921, 41925, 42024, 42025, 42028, 42029, 42088, 42104, 42105, 42108, 42109, 42118, 42145, 42148, 42161, 42164, 42165, 42182, 42198, 42212, 42213, 42225, 42228, 42229, 9542, 9543, 42315, 9572, 42344, 42348, 9588, 42365, 42374, 9611, 42390, 9626, 42404, 9641, 42420, 9656, 42438, 42439, 9679, 42454, 9694, 9709, 9724, 42538, 42539, 42568, 42588, 42607, 42628, 42658, 42674, 42705, 42709, 42726, 42742, 42794, 42799, 10052, 42824, 42825, 42828, 42829, 10087, 42862, 10102, 42878, 42884, 10125, 42897, 42900, 42901, 10140, 42914, 42918, 42919, 10158, 42934, 42935, 10175, 42945, 42948, 42949, 10185, 42964, 10200, 42982, 42983, 10218, 42998, 42999, 10235, 10251, 10254, 43078, 10314, 10315, 10318, 43108, 43124, 10404, 10416, 10420, 43196, 10464, 10468, 43266, 10506, 10511, 43296, 43334, 10570, 10571, 10575, 43364, 10656, 10660, 10676, 10736, 10740, 43517, 10875, 10935, 11130, 11175, 43951, 43967, 44026, 44034, 11274, 11279, 44064, 44068, 44102, 11338, 11342, 11343, 44132, 11424, 11428, 11492, 11504, 11508, 44281, 11531, 11534, 44358, 11595, 11598, 11599, 44388, 11696, 11700, 11744, 11748, 44521, 11764, 11903, 44685, 44715, 44730, 44731, 44749, 44760, 44764, 12023, 12158, 12263, 45083, 45151, 12426, 12431, 12443, 12446, 12456, 12461, 45233, 12473, 12476, 12491, 12494, 12506, 12511, 12521, 12524, 45301, 12536, 12541, 12614, 12644, 45437, 45447, 45462, 45540, 45593, 45596, 12868, 45641, 45644, 45657, 45660, 12902, 45675, 12936, 12940, 12941, 45713, 45716, 45717, 12953, 12956, 12957, 12975, 45750, 12990, 45761, 45764, 45765, 13000, 13001, 13004, 13016, 13017, 13021, 13035, 13050, 45848, 45853, 45917, 45953, 46033, 46037, 13334, 13348, 46120, 46121, 46124, 46125, 13378, 13383, 13398, 13399, 13409, 13413, 46185, 13428, 13429, 46200, 46201, 46204, 46205, 13450, 13451, 13454, 13455, 46230, 13466, 13467, 13470, 13471, 46241, 46244, 46245, 13480, 13481, 13484, 13485, 46257, 46260, 13496, 13497, 13500, 13501, 46278, 13514, 13515, 13518, 13519, 46294, 13530, 13531, 13534, 13535, 46305, 46308, 46309, 13544, 13545, 13548, 13549, 46324, 46325, 13560, 13561, 13564, 13565, 13638, 46410, 13668, 46441, 46445, 13684, 46460, 46470, 46486, 46500, 46516, 46534, 46550, 46551, 13844, 13862, 46634, 46635, 13889, 46665, 13908, 46685, 46702, 13960, 46740, 13977, 46754, 13994, 13995, 46770, 14010, 14011, 46785, 46789, 14028, 14045, 46822, 14062, 14063, 46838, 14078, 14079, 46891, 46894, 14148, 14149, 46920, 46921, 46924, 46925, 14164, 14183, 46959, 14198, 46975, 46977, 46980, 46981, 14220, 14221, 46996, 14236, 14237, 47014, 47015, 14254, 47026, 47030, 47031, 14271, 47044, 14280, 14281, 47057, 47060, 47061, 14296, 14297, 47078, 47079, 14314, 47094, 47095, 14331, 47106, 14346, 14351, 14362, 47136, 14376, 14380, 14381, 47174, 14426, 47204, 14460, 14470, 14496, 14500, 14516, 14530, 14551, 14564, 47340, 14576, 14580, 14603, 14606, 14619, 14633, 14636, 14637, 47430, 14683, 47460, 47476, 14717, 14742, 14756, 47533, 14768, 14772, 14791, 14802, 14816, 14820, 14836, 14856, 14861, 14872, 14895, 14920, 14921, 14924, 14925, 14936, 14954, 14955, 14958, 14974, 14976, 14977, 14980, 14981, 14996, 15014, 47790, 15030, 47806, 15044, 15056, 15060, 15078, 15079, 47851, 15090, 15113, 15116, 15129, 15150, 15176, 15177, 15180, 15181, 15193, 15210, 15211, 15215, 15231, 15236, 15248, 15249, 15252, 15253, 15270, 15286, 15296, 15300, 15316, 15330, 15350, 15351, 15371, 15374, 15390, 15400, 15401, 15404, 48198, 15454, 48228, 15480, 15490, 15511, 15524, 15536, 15540, 15558, 15584, 15588, 15604, 48376, 48386, 15626, 15631, 15647, 48416, 48420, 15656, 15657, 15661, 48454, 15711, 48484, 15737, 15751, 15762, 15776, 15780, 15796, 15830, 15844, 48616, 15856, 15860, 15881, 15884, 15900, 15915, 15944, 15945, 15948, 15949, 15964, 15978, 15982, 15983, 15994, 16004, 16016, 16020, 16038, 16039, 16050, 16064, 16065, 16068, 16069, 16084, 16102, 16118, 16136, 16141, 16157, 16170, 16200, 16201, 16204, 16205, 16221, 16235, 16238, 16239, 16251, 16256, 16260, 16276, 49052, 16290, 49066, 49067, 16310, 16311, 49082, 16324, 49097, 49101, 16336, 16337, 16340, 16341, 49116, 16358, 16374, 49437, 49450, 49451, 49497, 49500, 49501, 49531, 49534, 49535, 49557, 49570, 49586, 49591, 49605, 49617, 49621, 49639, 49655, 49690, 49691, 49694, 49755, 49758, 49759, 49772, 49825, 49841, 49845, 49862, 49889, 49893, 49909, 50081, 50085, 50161, 50200, 50204, 50219, 50222, 50223, 50248, 50249, 50252, 50253, 50264, 50268, 50283, 50298, 50308, 50309, 50321, 50324, 50342, 50343, 50354, 50358, 50359, 50369, 50372, 50388, 50389, 50407, 50418, 50422, 50456, 50460, 50461, 50474, 50478, 50479, 50524, 50554, 50555, 50561, 50594, 50599, 50615, 50625, 50629, 50641, 50658, 50674, 50732, 50793, 50812, 50822, 50838, 50865, 50868, 50869, 50882, 50916, 50917, 50971, 50974, 50984, 50988, 50989, 51035, 51038, 51048, 51049, 51064, 51065, 51068, 51069, 51078, 51079, 51094, 51105, 51108, 51109, 51121, 51124, 51125, 51138, 51158, 51159, 51169, 51172, 51173, 51185, 51188, 51189, 51404, 51421, 51660, 51677, 51718, 51745, 51808, 51897, 51949, 52054, 52137, 52152, 52201, 52221, 52759, 52773, 52818, 52908, 52920, 52925, 52989, 52998, 53079, 53088, 53109, 53165, 53177, 53180, 20518, 20578, 53532, 53546, 53547, 53592, 53596, 53597, 53626, 53630, 53631, 53637, 53666, 53671, 53682, 53697, 53701, 53717, 53735, 53751, 53786, 53787, 53791, 53850, 53854, 53855, 53869, 21135, 21150, 53921, 53925, 21165, 53937, 21180, 21195, 53974, 21210, 53989, 21225, 54001, 54005, 21240, 21420, 54193, 54197, 21437, 54241, 21480, 21497, 54297, 54301, 54314, 54318, 54319, 21573, 54344, 54345, 54348, 54349, 21588, 54361, 54365, 54378, 21623, 54395, 54401, 54404, 21641, 54420, 54421, 21656, 54434, 54438, 54439, 21674, 54454, 54455, 21691, 54468, 54469, 21709, 54481, 54484, 21724, 54498, 54502, 21742, 54519, 21759, 54553, 54556, 54557, 54571, 54574, 54575, 54621, 54650, 54651, 54673, 54695, 54706, 54711, 54721, 54737, 54741, 54754, 54770, 54829, 22103, 54888, 22132, 54909, 54918, 54934, 54945, 54948, 54949, 22188, 22205, 54994, 22248, 55028, 55029, 22265, 55066, 55071, 55081, 55084, 55085, 55130, 55135, 55144, 55145, 55160, 55161, 55164, 55165, 55174, 55190, 55191, 55201, 55204, 55205, 55217, 55220, 55221, 55238, 55239, 55250, 55265, 55268, 55269, 55281, 55284, 55285, 22604, 22605, 22724, 55500, 22740, 55517, 22860, 22861, 22980, 55756, 22996, 55773, 23051, 23055, 55894, 23135, 55977, 23216, 55992, 56044, 23280, 23285, 56056, 56070, 23306, 23310, 56097, 23390, 56160, 23456, 56232, 23520, 23525, 56316, 23624, 23625, 23684, 23700, 23880, 23881, 23940, 23956, 56838, 24075, 24079, 56919, 24155, 56928, 56949, 57000, 57005, 24240, 24245, 57020, 24304, 24330, 24334, 57111, 57125, 57170, 24410, 24480, 24485, 57257, 57260, 57277, 24544, 57324, 57374, 57434, 24714, 24719, 24731, 24734, 57509, 24744, 24749, 24761, 24764, 24779, 24782, 24794, 24799, 57569, 24809, 24812, 24824, 24829, 57720, 57780, 57798, 57815, 57881, 57884, 57929, 57932, 57945, 57948, 57966, 25224, 25228, 58001, 58004, 58005, 25241, 25245, 58049, 58052, 58053, 25288, 25292, 25305, 25309, 58086, 58136, 58141, 58200, 58241, 58245, 58321, 25622, 25636, 58408, 58409, 58412, 58413, 25671, 58476, 25713, 25716, 25717, 58488, 58489, 58492, 58493, 58502, 58518, 58532, 58533, 25768, 25769, 25772, 25773, 58545, 58548, 58549, 25784, 25785, 25788, 25789, 58566, 58593, 58596, 25832, 25833, 25836, 25837, 58609, 58612, 58613, 25848, 25849, 25852, 25853, 58703, 58728, 58732, 58745, 58758, 58759, 58774, 58822, 58838, 58852, 58868, 58926, 58927, 58956, 58968, 58987, 59025, 59029, 59046, 59062, 59076, 59106, 59122, 26388, 26407, 59179, 59182, 26433, 59208, 59209, 59212, 59213, 59242, 26482, 59258, 59265, 59268, 59269, 26504, 59284, 26521, 59302, 59303, 59318, 59319, 59332, 26572, 59345, 59348, 59349, 26589, 59362, 59366, 59367, 59382, 59383, 59394, 59424, 59428, 59462, 59492, 59581, 59718, 59748, 59821, 27145, 27148, 60041, 27280, 60056, 60060, 27328, 60105, 60143, 60158, 60159, 27400, 27405, 27520, 27600, 60486, 60516, 60532, 60664, 60674, 60704, 60742, 60772, 60857, 28168, 28173, 28288, 28368, 28425, 28428, 28560, 61374, 28608, 61419, 61435, 61471, 61531, 61621, 61681, 61817, 61860, 61895, 61910, 61976, 61981, 62024, 62029, 62040, 62045, 62063, 62081, 62084, 62085, 62161, 62164, 62165, 62198, 62233, 62236, 62297, 62353, 62357, 62401, 62504, 62505, 62508, 62509, 62573, 62584, 62585, 62588, 62589, 62598, 62614, 62625, 62628, 62629, 62644, 62645, 62678, 62689, 62692, 62693, 62705, 62708, 62798, 62825, 62829, 62840, 62854, 62870, 62871, 62918, 62934, 62948, 62964, 63022, 63023, 63053, 63065, 63082, 63105, 63109, 63142, 63158, 63188, 63202, 63218, 63274, 63279, 63304, 63305, 63308, 63309, 63339, 63355, 63364, 63377, 63380, 63381, 63398, 63399, 63414, 63415, 63425, 63428, 63429, 63444, 63462, 63463, 63474, 63478, 63479, 63558, 63588, 63676, 63746, 63776, 63780, 63814, 63844, 63916, 64393, 64397, 64408, 64472, 64494, 64495, 64510, 64514, 64544, 64582, 64612, 64680, 64838, 64868, 64884, 65001, 65199, 65258, 65274], 4355: [32808, 48, 96, 33034, 33064, 33133, 33184, 1046, 1047, 1060, 1110, 1111, 1140, 1162, 1163, 1166, 1167, 1178, 1179, 1182, 1183, 1193, 1196, 1208, 1213, 1226, 1227, 1230, 1231, 1242, 1243, 1246, 1247, 1256, 1261, 1273, 1276, 34059, 34089, 34224, 1556, 1574, 1620, 1655, 1673, 1677, 1688, 1692, 1737, 1741, 1752, 1756, 34619, 34671, 1929, 1933, 1948, 1993, 1997, 2008, 2088, 34864, 2168, 2399, 35168, 2425, 2588, 2602, 2653, 2692, 2845, 2859, 35634, 2908, 2964, 35842, 35843, 3116, 3196, 36089, 36098, 36128, 3373, 36144, 3453, 3609, 36390, 3672, 3732, 36552, 36553, 36688, 3929, 36808, 36812, 36905, 4490, 4507, 4520, 37296, 4555, 4570, 4575, 4585, 4588, 4600, 4605, 5378, 38154, 5408, 38184, 5446, 5476, 38304, 38429, 38714, 5956, 6154, 38944, 6201, 39008, 6253, 39096, 6411, 39216, 6456, 39421, 39938, 39984, 7392, 40195, 7664, 40528, 7786, 40665, 40988, 40989, 41002, 41053, 41092, 41172, 41486, 41532, 41682, 42112, 42128, 42176, 42192, 9540, 9574, 9591, 42366, 42809, 10157, 10232, 10317, 10572, 43366, 43480, 10766, 10783, 43769, 11023, 11038, 43979, 11337, 44172, 11592, 44368, 44546, 11786, 44562, 11803, 44592, 44803, 12043, 12058, 45002, 45019, 45084, 45149, 45204, 45252, 45423, 45583, 45598, 46224, 46272, 46288, 46458, 46463, 46859, 46957, 46995, 47043, 47305, 47411, 47687, 47819, 47920, 48027, 48208, 48268, 48379, 48643, 48658, 48688, 48898, 48915, 48944, 16406, 16407, 16420, 49196, 16470, 16471, 16500, 16522, 16523, 16526, 16527, 16538, 16539, 16542, 16543, 16553, 16556, 16568, 16573, 16586, 16587, 16590, 16591, 16602, 16603, 16606, 16607, 16616, 16621, 16633, 16636, 49422, 49452, 49469, 49513, 50202, 17456, 50271, 50447, 50489, 50672, 50780, 18056, 18057, 18125, 18141, 18192, 50990, 51002, 51007, 18256, 18275, 18363, 18414, 51202, 51248, 51449, 51459, 51488, 51750, 19072, 51852, 19088, 19328, 52108, 52219, 19482, 52461, 52512, 52566, 52717, 20096, 20112, 20160, 20368, 20416, 20432, 53293, 20739, 53519, 53549, 20784, 53564, 20807, 53608, 20852, 53744, 54542, 21808, 54584, 21899, 21914, 21928, 21945, 21962, 21979, 21982, 54752, 21992, 21996, 22009, 22013, 54827, 54847, 22084, 55087, 55102, 22340, 55298, 55299, 22539, 55328, 22569, 22584, 22688, 55554, 22794, 22824, 55600, 22840, 22841, 22844, 22960, 55784, 55888, 23166, 55961, 55965, 56102, 23418, 56220, 56221, 23566, 56352, 23596, 23597, 23609, 23612, 23613, 23792, 23823, 23852, 23853, 23868, 23869, 24032, 56828, 56829, 56882, 24186, 24443, 57244, 24596, 57369, 24614, 24660, 57432, 24695, 24713, 24717, 57492, 24728, 24732, 57540, 24777, 24781, 24792, 24796, 57706, 57866, 58002, 25616, 25651, 25680, 58496, 25736, 25737, 58512, 25752, 25753, 58560, 25804, 25805, 25820, 25821, 25924, 58746, 58751, 59150, 59193, 59196, 59197, 26439, 26605, 59592, 26939, 59728, 59865, 59906, 59922, 59952, 60163, 60179, 60208, 60379, 60467, 27710, 60976, 28692, 61464, 61465, 28711, 61487, 28756, 61528, 61572, 28809, 28813, 28824, 28828, 28873, 28877, 61652, 28888, 28892, 28996, 61978, 62082, 29326, 62099, 29343, 29357, 29372, 29403, 29417, 29432, 29712, 29776, 29795, 62592, 62608, 29883, 62672, 29934, 30020, 63247, 30512, 63688, 31034, 31039, 63960, 63961, 64018, 64048, 31293, 64142, 64159, 64202, 31443, 31683, 31698, 31802, 31807, 64614, 64653, 32313, 65182, 65328, 32568, 32643, 32658]}
+def potential_ID_template(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos):
+    """The LPTemplate of potential_ID_lp, rendered once per process."""
+    return cached_template("potential_ID", IVLBC, ROUND, lambda: LPTemplate(
+        lambda path, in_bin, out_bin: potential_ID_lp(path, IVLBC, ROUND, IVLBC // 4, Perm, conv, IVLBC_MC_pos, in_bin, out_bin),
+        IVLBC, "x0", f"x{ROUND + 3}"))
+
+def potential_ID_solver(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos, persistent=False, backend="GUROBI", relax=False, cache=False, filename=None):
+    """solve(in_diff, out_diff) of potential_ID, on the persistent model or through the LP file filename."""
+    # The rounds are rendered once, only the boundary constraints change between pairs
+    template = potential_ID_template(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos)
+    # LP files are read by gurobipy, the other backends always solve on the persistent model
+    if persistent or backend != "GUROBI":
+        model = cached_model("potential_ID", IVLBC, ROUND, lambda: potential_ID_model(IVLBC, ROUND, IVLBC // 4, Perm, conv, IVLBC_MC_pos, backend), backend)
+        # The pairs whose LP relaxation is infeasible are settled without solving the MILP
+        solve = (screened(model) if relax else model).solve
+    else:
+        filename = filename or f"Trial_IVLBC_{IVLBC}_ROUND_{ROUND}.lp"
+        def solve(in_diff, out_diff):
+            template.write(filename, in_diff, out_diff)
+            return solve_lp_file(filename)
+    # Pairs solved before on the same model, by any run or script, are answered without writing any LP file
+    return cached_solve(solve, template.digest) if cache else solve
+
+def potential_ID_enumerator(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos, cache=False, filename=None):
+    """feasible_outputs(in_diff, out_diffs) of potential_ID on the persistent model."""
+    feasible_outputs = cached_model("potential_ID", IVLBC, ROUND, lambda: potential_ID_model(IVLBC, ROUND, IVLBC // 4, Perm, conv, IVLBC_MC_pos)).feasible_outputs
+    # Only the outputs not in the solve cache are enumerated
+    return cached_enumeration(feasible_outputs, potential_ID_template(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos).digest) if cache else feasible_outputs
+
+def potential_ID(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos, representatives, i, groups, persistent=False, processes=1, threads=None,
+                 enumerate_outputs=False, prefilter=False, backend="GUROBI", relax=False, truncated=False, resume=False, cache=False, symmetry=False):
     print("length of ddt = ", len(ddt))
-    for x1, x2, x3, x4 in total_set:
-        if ((len(ddt[x1]) == 1 and len(ddt[x2]) == 1 and len(ddt[x3]) == 1 and len(ddt[x4]) > 1)
-            or (len(ddt[x1]) == 1 and len(ddt[x2]) == 1 and len(ddt[x3]) > 1 and len(ddt[x4]) == 1)
-            or (len(ddt[x1]) == 1 and len(ddt[x2]) > 1 and len(ddt[x3]) == 1 and len(ddt[x4]) == 1)
-            or (len(ddt[x1]) > 1 and len(ddt[x2]) == 1 and len(ddt[x3]) == 1 and len(ddt[x4]) == 1)):
-
-            in_diff = ((x1 << 48) | (x2 << 32) | (x3 << 16) | x4) & 0xFFFFFFFFFFFFFFFF
-            print(f"in_diff = {in_diff}")
-        if in_diff is not None:
-            in_set.add(in_diff)
-    out_set = set()
-    out_diff = None
-    for x1, x2, x3, x4 in prod_set:
-        if ((len(ddt[x1]) == 1 and len(ddt[x2]) == 1 and len(ddt[x3]) == 1 and len(ddt[x4]) > 1)
-            or (len(ddt[x1]) == 1 and len(ddt[x2]) == 1 and len(ddt[x3]) > 1 and len(ddt[x4]) == 1)
-            or (len(ddt[x1]) == 1 and len(ddt[x2]) > 1 and len(ddt[x3]) == 1 and len(ddt[x4]) == 1)
-            or (len(ddt[x1]) > 1 and len(ddt[x2]) == 1 and len(ddt[x3]) == 1 and len(ddt[x4]) == 1)):
-
-            out_diff = ((x1 << 48) | (x2 << 32) | (x3 << 16) | x4) & 0xFFFFFFFFFFFFFFFF
-            print(f"out_diff = {out_diff}")
-        if out_diff is not None:
-            out_set.add(out_diff)
-        
-    non_feasible_diff = defaultdict(list)
+    # The input differences of task i are those at positions 4096 * i .. 4096 * (i + 1) - 1 of the product of the representatives.
+    # They stay grouped by activity pattern and the pairs are generated group by group as they are solved
+    in_set = [in_diff for _, differences, positions in groups
+              for in_diff in differences[(positions >= 4096 * i) & (positions < 4096 * (i + 1))].tolist()]
+    out_set = [out_diff for _, differences, _ in groups for out_diff in differences.tolist()]
+
+    stage_stats.clear()
     print(f"length of in_set = {len(in_set)} and length of out_set = {len(out_set)}")
+    # Pairs proven impossible by their nibble activity, then by bit propagation, are not solved
+    propagator = potential_ID_propagator(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos)
+    prefilters = []
+    if truncated:
+        prefilters.append(("truncated", TruncatedFilter(propagator.layers, IVLBC, backend).impossible))
+    if prefilter:
+        prefilters.append(("propagation", propagator.impossible))
+    # Solved pairs are journaled as they come, and a restarted run on the same model takes them from the journal
+    journal = PairJournal(f"Trial_Potential_ID_Round_{ROUND}_Journal.db", potential_ID_template(IVLBC, ROUND, Perm, conv, IVLBC_MC_pos).digest) if resume else None
+    # Of the pairs a symmetry of the round model maps onto each other only the first is solved. Only when
+    # solving pair by pair: the enumeration decides all the outputs of an input on one model
+    canonical = PairCanonicalizer(layer_automorphisms(propagator.layers, IVLBC)) if symmetry and not enumerate_outputs else None
+    if enumerate_outputs:
+        # One task per input, the outputs reachable from it enumerated on one model
+        solver = partial(potential_ID_enumerator, IVLBC, ROUND, Perm, conv, IVLBC_MC_pos, cache)
+        tasks = ((in_diff, undecided_outputs(prefilters, in_diff, out_set)) for in_diff in in_set)
+        results = pair_results(tasks, solver, processes, threads,
+                               scratch_prefix=f"Trial_IVLBC_{IVLBC}_ROUND_{ROUND}_", journal=journal)
+    else:
+        solver = partial(potential_ID_solver, IVLBC, ROUND, Perm, conv, IVLBC_MC_pos, persistent, backend, relax, cache)
+        pairs = ((in_diff, out_diff) for in_diff in in_set for out_diff in out_set)
+        results = pair_results(pairs, solver, processes, threads, chunk_size=256 if prefilters else 16,
+                               scratch_prefix=f"Trial_IVLBC_{IVLBC}_ROUND_{ROUND}_",
+                               prefilters=prefilters, journal=journal, canonical=canonical)
+    # Each input is yielded with its impossible outputs as soon as they are decided, instead of keeping those of the whole task
     for in_diff in in_set:
-        in_diff_bin = bin(in_diff)[2:].zfill(IVLBC)
-        for out_diff in out_set:
-            out_diff_bin = bin(out_diff)[2:].zfill(IVLBC)
-            filename = f"Trial_IVLBC_{IVLBC}_ROUND_{ROUND}.lp"
-            potential_ID_lp(filename, IVLBC, ROUND, IVLBC // 4, Perm, conv, IVLBC_MC_pos, in_diff_bin, out_diff_bin)
-            feasible = solve_lp_file(filename)
-            if feasible is False:
-                non_feasible_diff[in_diff].append(out_diff)
-    return non_feasible_diff
+        out_diffs = []
+        if enumerate_outputs:
+            # Every candidate not found is impossible, none if the enumeration did not finish
+            _, _, found = next(results)
+            if found is not None:
+                out_diffs = [out_diff for out_diff in out_set if out_diff not in found]
+        else:
+            for out_diff in out_set:
+                _, _, feasible = next(results)
+                if feasible is False:
+                    out_diffs.append(out_diff)
+        if out_diffs:
+            yield in_diff, out_diffs
+    if journal is not None:
+        journal.close()
+    print(stage_report())
 
 if __name__ == "__main__":
     if len(sys.argv) != 4:
@@ -179,15 +255,45 @@ if __name__ == "__main__":
     ROUND = int(sys.argv[2])
     solver = sys.argv[3]
 
-    if solver != "GUROBI":
-        print("Unsupported solver. Only GUROBI is supported.")
+    if solver not in BACKENDS:
+        print(f"Unsupported solver. Supported solvers: {', '.join(BACKENDS)}.")
         sys.exit(1)
 
-    P16_byte = [6, 9, 12, 3, 10, 13, 0, 7, 14, 1, 4, 11, 2, 5, 8, 15]
-    Perm = generate_permutation(P16_byte, IVLBC)
-    IVLBC_MC_pos = initialize_mc_positions(IVLBC)
+    # Build the model once per round count and change only the boundary bits between pairs,
+    # instead of writing and reading an LP file for every pair
+    persistent = True
+    # Pairs are spread over this many worker processes, each capped at `threads` Gurobi threads
+    # (None: an equal share of the cores)
+    processes = cpu_count()
+    threads = None
+    # Solve one model per input, enumerating its reachable outputs with no-good cuts,
+    # instead of one model per pair (on the persistent Gurobi model)
+    enumerate_outputs = solver == "GUROBI"
+    # Reject the pairs proven impossible by bit propagation before building any model
+    prefilter = True
+    # Decide each pair of nibble activity patterns once on a word-level model, before the bit propagation
+    truncated = True
+    # Journal every solved pair and skip those already solved by an interrupted run
+    resume = True
+    # Answer the pairs solved before on the same model, by any run or script, from the solve cache
+    cache = True
+    # Solve one pair per orbit of the nibble permutations and bit rotations the round model is invariant under.
+    # Only on the pair by pair path, so off when the outputs are enumerated
+    symmetry = not enumerate_outputs
+    # Solve the LP relaxation of each pair first and the MILP only if the relaxation is feasible.
+    # Off by default: on the 4-round models the MILP presolve decides a pair faster than the LP,
+    # and the relaxation settles few of the pairs left by the pre-filter (see the stage report)
+    relax = False
+    # Number of active 16-bit blocks of the differences searched. With 2 or 3 the pairs outnumber the memory
+    # by far, and are streamed to the solvers; the tasks and result files of such a search get an _Active_ suffix
+    active_blocks = 1
+    mode = "" if active_blocks == 1 else f"_Active_{active_blocks}"
+
+    Perm = generate_permutation(IVLBC_P16_BYTE)
+    IVLBC_MC_pos = initialize_mc_positions()
     representatives = [0, 38, 275, 282, 298, 302, 307, 570, 687, 1092, 4115, 4123, 4138, 4142, 4147, 4355]
-    prod_set = list(product(representatives[:], repeat=4)) #[((x1 << 48) | (x2 << 32) | (x3 << 16) | x4) & 0xFFFFFFFFFFFFFFFF for x1, x2, x3, x4 in product(representatives, repeat=4)]
+    # The differences with this many active blocks, generated once for all the tasks
+    groups = activity_groups(representatives, ddt, active_blocks)
     conv = (
         0, 1, -1, 0, -1, 0, 1, -1, 2,
         -2, -2, -1, -1, -1, -1, 1, 2, 6,
@@ -211,20 +317,33 @@ if __name__ == "__main__":
         -1, 0, 1, -1, 0, 1, -1, 0, 2,
         -2, -2, -1, 1, -1, 1, 1, 2, 4,
     )
-    for k in range(16):
-        task = int(input("Enter the value of task from 0 to 15: "))
-        non_feasible_diff = potential_ID(IVLBC, ROUND - 4, Perm, conv, IVLBC_MC_pos, representatives, task, prod_set)
-        print(f"The difference pairs that have potential to contain IDs is {non_feasible_diff}")
+    # The 16 tasks are claimed from a queue shared by the runs of this script on any machine, and the
+    # run finishing the last task merges the potential pairs of all of them. The queue is keyed on the model and
+    # on the differences searched, so a run with another table or another model does not reuse the tasks done
+    inputs = {"model": potential_ID_template(IVLBC, ROUND - 4, Perm, conv, IVLBC_MC_pos).digest,
+              "representatives": [representatives, ddt.digest], "active_blocks": active_blocks}
+    queue = ShardQueue(queue_directory(f"Trial_Potential_ID_Round_{ROUND}_Rep_{len(representatives)}{mode}_Tasks", inputs), 16)
+    for task in queue.claimed():
+        with open(f"Trial_Potential_ID_Round_{ROUND}_Rep_{len(representatives)}{mode}_set.txt", "a") as file:
+            file.write("The potential IDs input-output difference pairs from " + str(4096 * task) + " to " + str(4096 * (task + 1)) + " are:\n")
+        # The impossible outputs of each input go to the task file and to the shard of the queue as they come
         total = 0
-        for i in non_feasible_diff.keys():
-            total = total + len(non_feasible_diff[i])
-            print(f"length of non_feasible_diff[{i}] = ", len(non_feasible_diff[i]))
+        for in_diff, out_diffs in potential_ID(IVLBC, ROUND - 4, Perm, conv, IVLBC_MC_pos, representatives, task, groups, persistent, processes, threads, enumerate_outputs, prefilter, solver, relax, truncated, resume, cache, symmetry):
+            part = defaultdict(list, {in_diff: out_diffs})
+            with open(f"Trial_Potential_ID_Round_{ROUND}_Rep_{len(representatives)}{mode}_set.txt", "a") as file:
+                file.write(str(part) + "\n")
+            queue.append(task, part)
+            total = total + len(out_diffs)
+            print(f"length of non_feasible_diff[{in_diff}] = ", len(out_diffs))
         print(f"Total difference pairs that have potential to contain IDs = {total}")
         print("Last value of task = ", task)
-        with open(f"Trial_Potential_ID_Round_{ROUND}_Rep_{len(representatives)}_set.txt", "a") as file:
-            file.write("The potential IDs input-output difference pairs from " + str(4096 * task) + " to " + str(4096 * (task + 1)) + " are:\n")
-            file.write(str(non_feasible_diff) + "\n")
+        with open(f"Trial_Potential_ID_Round_{ROUND}_Rep_{len(representatives)}{mode}_set.txt", "a") as file:
             file.write("Total difference pairs that have potential to contain IDs = " + str(total) + "\n")
             file.write("-------------------------------------------------------------------------------" + "\n")
+        if queue.complete(task):
+            # Merged a part at a time, as lines the IDs script reads back with read_potential_pairs
+            with open(f"Trial_Potential_Pairs_Round_{ROUND}{mode}.txt", "w") as file:
+                for part in queue.parts():
+                    file.write(str(defaultdict(list, part)) + "\n")
     print("Round = ", ROUND, " and representatives: ", len(representatives))
  
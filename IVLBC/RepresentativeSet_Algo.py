@@ -1,168 +1,102 @@
 import time
 import sys
-from multiprocessing import Pool, cpu_count
-from itertools import combinations
+import os
+# The modules shared by both ciphers are in ../common
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from superbox import build_sms_table
+from cipher_layer import superbox_mc
+from ddt_bitset import calculate_ddt_bitset, calculate_ddt_memmap, ddt_column_mask
+from set_cover import find_minimum_columns_lazy, improve_cover
+from symmetry import superbox_automorphisms, orbit_ddt_bitset, expand_orbits
+from artifact_cache import cached_array, cached_artifact, save_arrays
+from ddt_compose import ddt_support_upper_bound, check_ddt_support
 
 sys.set_int_max_str_digits(0)
 
-def apply_sbox(input_bits, sbox):
-    return sbox[input_bits]
-
-def apply_matrix_to_column(matrix, input_value, n):
-    input_value = input_value & ((1 << n) - 1)
-
-    blocks = []
-    for i in range(4):
-        shift_amount = 12 - 4 * i
-        block = (input_value >> shift_amount) & 0xF
-        blocks.append(block)
-    
-    # Initialize result as 0
-    result = 0
-    
-    # Iterate through each row of the matrix
-    for row in range(4):
-        row_value = 0
-        # XOR corresponding nibble where matrix[row][col] is 1
-        for col in range(4):
-            if matrix[row][col] == 1:
-                row_value ^= blocks[col]
-        
-        # Combine row results into the final 16-bit output
-        result |= (row_value << (12 - 4 * row))
-    
-    return result
-
-def SMS(input_value, sbox, MC, n):
-    # Split input_value into four 4-bit blocks
-    blocks = [(input_value >> (4 * i)) & 0xF for i in range(n // 4)]
-    
-    # Apply the S-box to each 4-bit block
-    substituted_blocks = [apply_sbox(block, sbox) for block in blocks]
-    
-    # Combine the substituted blocks into a single 16-bit value
-    substituted_value = 0
-    for i in range(n // 4):
-        substituted_value |= (substituted_blocks[i] << (4 * i))
-    
-    # Apply the MC to the 16-bit substituted value
-    state_value = apply_matrix_to_column(MC, substituted_value, n)
-
-    # Split state_value into four 4-bit blocks
-    blocks = [(state_value >> (4 * i)) & 0xF for i in range(n // 4)]
-    
-    # Apply the S-box to each 4-bit block
-    substituted_blocks = [apply_sbox(block, sbox) for block in blocks]
-
-    # Combine the substituted blocks into a single 16-bit value
-    output_value = 0
-    for i in range(n // 4):
-        output_value |= (substituted_blocks[i] << (4 * i))
-    
-    return output_value
-
-def precompute_sms_worker(args):
-    x, sbox, MC, n = args
-    return SMS(x, sbox, MC, n)
-
 def precompute_sms(size, sbox, MC, n):
-    with Pool(cpu_count()) as pool:
-        sms_table = pool.map(precompute_sms_worker, [(x, sbox, MC, n) for x in range(size)])
-    return sms_table
-
-def calculate_ddt_worker(args):
-    x, input_diff, sms_table = args
-    return sms_table[x] ^ sms_table[x ^ input_diff]
+    # S o MC o S of every x < size, computed with a few array operations
+    return build_sms_table(sbox, MC, n)[:size]
 
-def calculate_ddt_bitwise_or_precomputed(sms_table, size):
-    ddt = [0] * size  # Initialize a list of zeros for each possible column difference
-
-    with Pool(cpu_count()) as pool:
-        for input_diff in range(size):
-            results = pool.map(calculate_ddt_worker, [(x, input_diff, sms_table) for x in range(size)])
-            for output_diff in results:
-                ddt[output_diff] |= (1 << input_diff)
-
-    return ddt
-
-def print_ddt_summary(ddt, num_entries=2 ** (10)):
+def print_ddt_summary(ddt_matrix, num_entries=2 ** (10)):
     print("DDT Summary:")
-    for index, row_mask in enumerate(ddt[:num_entries]):
-        print(f"Column {index:2}: {bin(row_mask)}")
-    if len(ddt) > num_entries:
-        print(f"... {len(ddt) - num_entries} more entries")
-
-def find_minimum_columns(ddt, n):
-    target = (1 << (2**n)) - 1  # All bits set to 1
-    covered_bits = 0
-    selected_columns = []
-
-    while covered_bits != target:
-        # Find the column that covers the most new bits
-        best_column = -1
-        best_new_coverage = 0
-
-        for i, column in enumerate(ddt):
-            new_coverage = column | covered_bits
-            # Newly covered bits (use bitwise AND to isolate new bits)
-            newly_covered_bits = new_coverage & ~covered_bits  # Only the new bits
-
-            # Count the number of newly covered bits using bit_count()
-            new_bit_count = newly_covered_bits.bit_count()
-
-            # Update if this column covers more new bits
-            if new_bit_count > best_new_coverage:
-                best_new_coverage = new_bit_count
-                best_column = i
-
-        if best_column == -1:
-            print("No combination found to cover all bits!")
-            return []
-
-        # Update covered_bits and add the selected column
-        covered_bits |= ddt[best_column]
-        selected_columns.append(best_column)
-    if covered_bits == target:
-        print("All bits covered!")
-        print("Length of covered bits:", covered_bits.bit_length())
-
-    return selected_columns
+    for index in range(min(num_entries, ddt_matrix.shape[-2])):
+        print(f"Column {index:2}: {bin(ddt_column_mask(ddt_matrix, index))}")
+    if ddt_matrix.shape[-2] > num_entries:
+        print(f"... {ddt_matrix.shape[-2] - num_entries} more entries")
 
 if __name__ == "__main__":
     n = int(input("Enter the value of n: "))
     size = 2**(n)
-    MC = [
-    [0, 1, 1, 1],
-    [1, 0, 1, 1],
-    [1, 1, 0, 1],
-    [1, 1, 1, 0],
-    ]
+    if n % 4 != 0:
+        print("n must be a multiple of 4")
+        sys.exit(1)
+
+    # IVLBC_MC for n = 16, the same kind of invertible binary matrix on n / 4 nibbles otherwise
+    MC = superbox_mc(n)
     
     S = [0x0, 0xf, 0xe, 0x5, 0xd, 0x3, 0x6, 0xc, 0xb, 0x9, 0xa, 0x8, 0x7, 0x4, 0x2, 0x1]
-    
+
     # Precompute SMS values
     # Time measurement for precomputing SMS values
     start_time = time.time()
-    sms_table = precompute_sms(size, S, MC, n)
-    print("sms_table = ", sms_table)
+    # Tables, DDT supports and covers are content-addressed on disk and reused across runs
+    params = {"sbox": S, "MC": MC, "n": n}
+    sms_table = cached_array("sms_table", params, lambda: precompute_sms(size, S, MC, n))
+    print("sms_table = ", sms_table.tolist())
     end_time = time.time()
     print(f"Time taken to precompute SMS table: {end_time - start_time:.2f} seconds")
 
+    # Upper bound on the DDT support from the 4-bit S-box DDT support through the linear layer, compared with
+    # the brute-force support. It treats the nibbles as independent, so it only screens out impossible transitions
+    check_support_bound = False
+    if check_support_bound:
+        start_time = time.time()
+        bound_matrix = ddt_support_upper_bound(S, build_sms_table(list(range(16)), MC, n), n)
+        end_time = time.time()
+        print(f"Time taken to bound the DDT support: {end_time - start_time:.2f} seconds")
+        total, missing, extra = check_ddt_support(sms_table, bound_matrix)
+        print(f"Brute-force transitions: {total}, missing from the upper bound: {missing}, extra in it: {extra}")
+
+    # Cover the orbits of the super-box automorphism group instead of all 2^n differences
+    use_symmetry = False
+    if use_symmetry:
+        start_time = time.time()
+        group = superbox_automorphisms(sms_table, n)
+        orbit_matrix, in_reps, out_reps, out_canonical = orbit_ddt_bitset(sms_table, n, group)
+        orbit_columns = find_minimum_columns_lazy(orbit_matrix, n, size=len(in_reps))
+        exact_selected_columns = expand_orbits(out_reps[orbit_columns], out_canonical)
+        end_time = time.time()
+        print(f"Automorphism group order: {len(group)}, input orbits: {len(in_reps)} and output orbits: {len(out_reps)}")
+        print(f"Time taken to find minimum columns over orbits: {end_time - start_time:.2f} seconds")
+        print("Orbit representatives of the selected columns:")
+        print(out_reps[orbit_columns].tolist())
+        print("Minimum columns required to cover all bits, orbits expanded:")
+        print(exact_selected_columns)
+        print("Minimum selected columns: ", len(exact_selected_columns))
+        sys.exit(0)
+
     # Time measurement for calculating DDT
     start_time = time.time()
-    # Calculate DDT using bitwise OR with precomputed SMS values
-    ddt = calculate_ddt_bitwise_or_precomputed(sms_table, size)
+    # Calculate DDT as a packed bit matrix from the precomputed SMS values,
+    # kept out of core in a memory-mapped file beyond 16 bits
+    if n > 16:
+        ddt_matrix = cached_artifact("ddt_support", params,
+                                     lambda directory: calculate_ddt_memmap(sms_table, os.path.join(directory, "matrix.npy")))["matrix"]
+    else:
+        ddt_matrix = cached_artifact("ddt_support", params,
+                                     lambda directory: save_arrays(directory, matrix=calculate_ddt_bitset(sms_table)))["matrix"]
     end_time = time.time()
     print(f"Time taken to calculate DDT: {end_time - start_time:.2f} seconds")
     
-    print_ddt_summary(ddt)  # Print only the first `num_entries=2 ** (10)` entries
-    print("length of ddt: ", len(ddt))
+    print_ddt_summary(ddt_matrix)  # Print only the first `num_entries=2 ** (10)` entries
+    print("length of ddt: ", ddt_matrix.shape[-2])
 
     # Time measurement for finding minimum columns using greedy approach
     start_time = time.time()
     
-    # Find the minimum columns required
-    exact_selected_columns = find_minimum_columns(ddt, n)
+    # Find the minimum columns required, lazy greedy on the packed matrix
+    exact_selected_columns = cached_array("greedy_cover", params,
+                                          lambda: find_minimum_columns_lazy(ddt_matrix, n)).tolist()
     end_time = time.time()
     print(f"Time taken to find minimum columns using greedy approach: {end_time - start_time:.2f} seconds")
     
@@ -170,3 +104,14 @@ if __name__ == "__main__":
     print("Minimum columns required to cover all bits using greedy approach:")
     print(exact_selected_columns)
     print("Minimum selected columns: ", len(exact_selected_columns))
+
+    # Local search and lower bounding on top of the greedy cover, 0 seconds disables it
+    improve_time_limit = 0
+    if improve_time_limit > 0 and ddt_matrix.ndim == 2:
+        start_time = time.time()
+        improved_columns, lower_bound = improve_cover(ddt_matrix, n, exact_selected_columns, improve_time_limit)
+        end_time = time.time()
+        print(f"Time taken to improve the greedy cover: {end_time - start_time:.2f} seconds")
+        print("Improved columns required to cover all bits:")
+        print(improved_columns)
+        print("Improved selected columns: ", len(improved_columns), " and lower bound: ", lower_bound)
@@ -0,0 +1,30 @@
+# IVLBC MixColumns matrix and nibble permutation
+IVLBC_MC = [
+    [0, 1, 1, 1],
+    [1, 0, 1, 1],
+    [1, 1, 0, 1],
+    [1, 1, 1, 0],
+]
+IVLBC_P16_BYTE = [6, 9, 12, 3, 10, 13, 0, 7, 14, 1, 4, 11, 2, 5, 8, 15]
+
+def superbox_mc(n):
+    """
+    IVLBC_MC generalized to a super-box of n / 4 nibbles: all ones but the diagonal, so superbox_mc(16) == IVLBC_MC.
+    For an odd number of nibbles that matrix sends the all-ones column to zero, so entry (0, 1) is cleared as well
+    to keep it invertible over GF(2).
+    """
+    m = n // 4
+    return [[0 if col == row or (m % 2 and (row, col) == (0, 1)) else 1 for col in range(m)] for row in range(m)]
+
+def initialize_mc_positions():
+    positions = []
+    for i in range(16):
+        if i < 4:
+            positions.append([e * 4 + (i % 4) for e in [1, 2, 3]])
+        elif i < 8:
+            positions.append([e * 4 + (i % 4) for e in [0, 2, 3]])
+        elif i < 12:
+            positions.append([e * 4 + (i % 4) for e in [0, 1, 3]])
+        else:
+            positions.append([e * 4 + (i % 4) for e in [0, 1, 2]])
+    return positions
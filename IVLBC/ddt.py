@@ -1,90 +1,85 @@
 import sys
 import os
-from gurobipy import GRB, read
-import itertools
-from itertools import product
 from collections import defaultdict
-from multiprocessing import Pool, cpu_count
+import numpy as np
+# The modules shared by both ciphers are in ../common
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from superbox import build_sms_table
+from cipher_layer import IVLBC_MC
+from artifact_cache import cached_array, cached_artifact, save_arrays
+from milp_data import save_partition_table
 
-def apply_matrix_to_column(matrix, input_value, n):
-    input_value = input_value & ((1 << n) - 1)
-    blocks = []
-    for i in range(4):
-        shift_amount = 12 - 4 * i
-        block = (input_value >> shift_amount) & 0xF
-        blocks.append(block)
-    result = 0
-    for row in range(4):
-        row_value = 0
-        for col in range(4):
-            if matrix[row][col] == 1:
-                row_value ^= blocks[col]
-        result |= (row_value << (12 - 4 * row))
-    return result
+def precompute_sms(size, sbox, MC, m):
+    # S o MC o S of every x < size, computed with a few array operations
+    return build_sms_table(sbox, MC, m)[:size]
 
-def SMS(input_value, sbox, MC, n):
-    blocks = [(input_value >> (4 * i)) & 0xF for i in range(n // 4)]
-    substituted_blocks = [sbox[block] for block in blocks]
-    substituted_value = 0
-    for i in range(n // 4):
-        substituted_value |= (substituted_blocks[i] << (4 * i))
-    state_value = apply_matrix_to_column(MC, substituted_value, n)
-    blocks = [(state_value >> (4 * i)) & 0xF for i in range(n // 4)]
-    substituted_blocks = [sbox[block] for block in blocks]
-    output_value = 0
-    for i in range(n // 4):
-        output_value |= (substituted_blocks[i] << (4 * i))
-    return output_value
+# Label of the differences that are in no class
+UNLABELED = 0xFFFF
 
-def precompute_sms_worker(args):
-    x, sbox, MC, m = args
-    return SMS(x, sbox, MC, m)
+def partition_labels(sms_table, size, representatives):
+    """
+    Partition table as a dense label array: labels[d] is the index of the first representative whose DDT
+    row contains d, or UNLABELED. Assigning the labels from the last representative to the first lets the
+    earlier ones overwrite the later ones, which is the order in which the classes take their differences.
+    Also returns the DDT row size of every representative.
+    """
+    labels = np.full(size, UNLABELED, dtype=np.uint16)
+    ddt_sizes = np.zeros(len(representatives), dtype=np.int64)
+    x = np.arange(size)
+    for k in range(len(representatives) - 1, -1, -1):
+        outputs = np.unique(sms_table[x] ^ sms_table[x ^ representatives[k]])
+        labels[outputs] = k
+        ddt_sizes[k] = len(outputs)
+    return labels, ddt_sizes
 
-def precompute_sms(size, sbox, MC, m):
-    with Pool(cpu_count()) as pool:
-        sms_table = pool.map(precompute_sms_worker, [(x, sbox, MC, m) for x in range(size)])
-    return sms_table
+def partition_members(labels, n_classes):
+    """Sorted members of every class: class k is members[offsets[k]:offsets[k + 1]]."""
+    counts = np.bincount(labels[labels != UNLABELED], minlength=n_classes)
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    # A stable sort keeps every class in increasing order
+    members = np.argsort(labels, kind='stable')[:offsets[-1]].astype(labels.dtype)
+    return offsets, members
 
-def calculate_ddt_worker(args):
-    x, input_diff, sms_table = args
-    return sms_table[x] ^ sms_table[x ^ input_diff]
+def save_partition(directory, sms_table, size, representatives):
+    """Computes the partition table and stores it as arrays: H[representatives[k]] = members[offsets[k]:offsets[k + 1]]."""
+    labels, ddt_sizes = partition_labels(sms_table, size, representatives)
+    offsets, members = partition_members(labels, len(representatives))
+    save_arrays(directory, representatives=np.array(representatives, dtype=np.int64), ddt_sizes=ddt_sizes,
+                labels=labels, offsets=offsets, members=members)
 
-def calculate_ddt(sms_table, size, representatives):
-    ddt = defaultdict(list)
-    with Pool(cpu_count()) as pool:
-        for input_diff in representatives:
-            buf = ''
-            if (input_diff%(5)==0):
-                print(input_diff)
-            results = list(set(pool.map(calculate_ddt_worker, [(x, input_diff, sms_table) for x in range(size)])))
-            ddt[input_diff] = results
-    return ddt
+def load_partition(partition):
+    representatives = partition["representatives"].tolist()
+    offsets = partition["offsets"]
+    H = defaultdict(list)
+    for k, i in enumerate(representatives):
+        H[i] = partition["members"][offsets[k]:offsets[k + 1]].tolist()
+    return H
 
 
+# The data folder of this cipher, next to the script whatever the working directory
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
 if __name__ == "__main__":
     m = 16
     S = [0x0, 0xf, 0xe, 0x5, 0xd, 0x3, 0x6, 0xc, 0xb, 0x9, 0xa, 0x8, 0x7, 0x4, 0x2, 0x1]
-    MC = [
-        [0, 1, 1, 1],
-        [1, 0, 1, 1],
-        [1, 1, 0, 1],
-        [1, 1, 1, 0],
-    ]
+    MC = IVLBC_MC
     size = 2 ** (m)
     representatives = [5774, 10413, 9647, 10415, 6636, 36263, 26527, 21198, 54010, 11038, 8168, 48377, 47849, 49593, 40941, 47644, 35566, 27165, 31630, 50078, 26769, 37778, 39273, 32733, 36345, 55722, 39047, 31947, 40094, 47276, 570, 17016, 687, 8234, 8367, 8714, 8864, 10767, 10992, 17949, 298, 302, 307, 4138, 4142, 4147, 4618, 4622, 4768, 4832, 4867, 4912, 0, 38, 275, 282, 1092, 4115, 4123, 4355, 4363, 4400, 4528, 16452, 16480, 17412, 17472, 17476]
     representatives.sort()
-    sms_table = precompute_sms(size, S, MC, m)
-    ddt = calculate_ddt(sms_table, size, representatives[:16])
+    # Write the partition table to data/<name>, where the MILP scripts read it, replacing the stored one
+    # (the same classes for the same representatives, with their members in increasing order)
+    store = False
+    name = "ddt"
+    # Tables and partition results are reused across runs from the on-disk cache
+    params = {"sbox": S, "MC": MC, "n": m}
+    sms_table = cached_array("sms_table", params, lambda: precompute_sms(size, S, MC, m))
+    partition = cached_artifact("partition_table", {**params, "representatives": representatives[:16]},
+                                lambda directory: save_partition(directory, sms_table, size, representatives[:16]))
     print(f"representatives = {representatives} with length = {len(representatives)}")
-    for i in ddt.keys():
-        print(f"ddt[{i}] = {len(ddt[i])}")
+    for i, ddt_size in zip(representatives[:16], partition["ddt_sizes"].tolist()):
+        print(f"ddt[{i}] = {ddt_size}")
     #print(ddt)
-    H = defaultdict(list)
-    for i in ddt.keys():
-        H[i] = ddt[i]
-        for j in ddt.keys():
-            if j != i:
-                ddt[j] = [x for x in ddt[j] if x not in H[i]] 
+    H = load_partition(partition)
     total = 0
     for i in H.keys():
         print(f"H[{i}] = {len(H[i])}")
@@ -92,3 +87,6 @@ if __name__ == "__main__":
     print("total = ", total)
     
     print("H = ", H)
+    if store:
+        save_partition_table(name, H, DATA_DIR)
+        print(f"Partition table written to data/{name}")
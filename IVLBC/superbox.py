@@ -0,0 +1,38 @@
+import numpy as np
+
+
+def table_dtype(n):
+    """Smallest unsigned dtype holding an n-bit super-box value."""
+    return np.uint16 if n <= 16 else np.uint32
+
+def matrix_tables(sbox, MC, n):
+    """Nibble-indexed tables T[i][v] = MC(S(v) << 4i), i.e. the first S-box layer and MC folded together."""
+    dtype = table_dtype(n)
+    m = n // 4
+    substituted = np.asarray(sbox, dtype=dtype)[np.arange(16)]
+    tables = np.zeros((m, 16), dtype=dtype)
+    for i in range(m):
+        # MC numbers the nibbles from the most significant one
+        col = m - 1 - i
+        for row in range(m):
+            if MC[row][col] == 1:
+                tables[i] ^= substituted << (4 * (m - 1 - row))
+    return tables
+
+def build_sms_table(sbox, MC, n):
+    """Computes the whole S o MC o S table for all 2^n inputs with a few array operations."""
+    dtype = table_dtype(n)
+    x = np.arange(2 ** n, dtype=dtype)
+    tables = matrix_tables(sbox, MC, n)
+
+    # First S-box layer and MC, one table lookup per nibble
+    state = np.zeros_like(x)
+    for i in range(n // 4):
+        state ^= tables[i][(x >> (4 * i)) & 0xF]
+
+    # Second S-box layer
+    sbox = np.asarray(sbox, dtype=dtype)
+    output = np.zeros_like(x)
+    for i in range(n // 4):
+        output |= sbox[(state >> (4 * i)) & 0xF] << (4 * i)
+    return output
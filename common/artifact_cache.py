@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+
+# Where the tables are kept and how large the cache may grow, overridable per run
+CACHE_DIR = os.environ.get("SUPERBOX_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".superbox_cache"))
+CACHE_LIMIT = int(os.environ.get("SUPERBOX_CACHE_LIMIT", 8 * 2 ** 30))
+
+def artifact_key(kind, params):
+    """Content hash of an artifact: its kind and everything it is computed from (S-box, P or MC, width, ...)."""
+    blob = json.dumps({"kind": kind, "params": params}, sort_keys=True, default=int)
+    return hashlib.sha256(blob.encode()).hexdigest()[:32]
+
+def save_arrays(directory, **arrays):
+    for name, array in arrays.items():
+        with open(os.path.join(directory, name + ".npy"), "wb") as f:
+            np.save(f, np.asarray(array))
+
+def load_arrays(directory):
+    """All arrays of a cached artifact, memory-mapped read-only."""
+    return {name[:-4]: np.load(os.path.join(directory, name), mmap_mode='r')
+            for name in os.listdir(directory) if name.endswith(".npy")}
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+def evict(cache_dir, limit, keep=None):
+    """Removes the least recently used artifacts until the cache fits into `limit` bytes."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if os.path.isdir(path) and ".tmp-" not in name and path != keep:
+            entries.append((os.path.getmtime(path), directory_size(path), path))
+    total = sum(size for _, size, _ in entries) + (directory_size(keep) if keep else 0)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+def cached_artifact(kind, params, build, cache_dir=None, limit=None):
+    """
+    Loads the artifact identified by (kind, params) from the cache, or calls build(directory) to write
+    its .npy files into a fresh directory and stores it. The build happens in a temporary directory
+    that is renamed into place, so concurrent runs never see half-written tables. Every hit refreshes
+    the artifact's modification time, which orders the LRU eviction.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    limit = CACHE_LIMIT if limit is None else limit
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{kind}-{artifact_key(kind, params)}")
+    if os.path.isdir(path):
+        os.utime(path)
+        return load_arrays(path)
+
+    tmp = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    build(tmp)
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        # Another run stored the same artifact first
+        shutil.rmtree(tmp, ignore_errors=True)
+    evict(cache_dir, limit, keep=path)
+    return load_arrays(path)
+
+def cached_array(kind, params, compute, cache_dir=None, limit=None):
+    """Single-array form of cached_artifact: compute() returns the array."""
+    arrays = cached_artifact(kind, params, lambda directory: save_arrays(directory, array=compute()), cache_dir, limit)
+    return arrays["array"]
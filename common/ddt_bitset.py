@@ -0,0 +1,110 @@
+import numpy as np
+from multiprocessing import Pool, cpu_count
+
+# Super-box table (and output file) of the current worker process, set once by the pool initializer
+_table = None
+_path = None
+
+def _init_worker(table, path=None):
+    global _table, _path
+    _table = table
+    _path = path
+
+# Multiplier gathering the low bit of each byte of a word into its top byte, flag b to bit 56 + b
+_GATHER = np.uint64(0x0102040810204080)
+
+def _fill_words(word_range, rows=1 << 20):
+    """
+    Computes the words [start, stop) of every column, i.e. the input differences 64 * start to 64 * stop - 1.
+    The bits are packed a byte at a time straight into the words and the 2^n inputs x are taken `rows` at a
+    time, so besides the block it returns a worker only holds a (2^n, 8) bool scratch, eight bytes per output
+    difference, and the images of one batch of rows.
+    """
+    start, stop = word_range
+    size = len(_table)
+    block = np.zeros((size, stop - start), dtype='<u8')
+    # Byte k of word w is column 8 * w + k of the little-endian bytes of the block
+    block_bytes = block.view(np.uint8)
+    bits = np.zeros((size, 8), dtype=bool)
+    for low in range(0, size, rows):
+        x = np.arange(low, min(low + rows, size), dtype=_table.dtype)
+        image = _table[x]
+        for byte in range(8 * start, min(8 * stop, (size + 7) // 8)):
+            bits[:] = False
+            for b in range(min(8, size - 8 * byte)):
+                # Scatter: every output difference reached from input difference 8 * byte + b gets bit b
+                bits[image ^ _table[x ^ (8 * byte + b)], b] = True
+            # The 8 flags of a row read as one little-endian word; the multiply gathers flag b into bit 56 + b
+            packed = (bits.view('<u8')[:, 0] * _GATHER) >> np.uint64(56)
+            block_bytes[:, byte - 8 * start] |= packed.astype(np.uint8)
+    return start, block
+
+def word_ranges(n_words, chunk_words):
+    return [(w, min(w + chunk_words, n_words)) for w in range(0, n_words, chunk_words)]
+
+def calculate_ddt_bitset(table, processes=None, chunk_words=8):
+    """
+    DDT support of a super-box table as a packed bit matrix of shape (2^n, 2^n / 64) and dtype uint64.
+    Row c is the column mask of output difference c: bit a is set iff input difference a can reach c.
+    """
+    table = np.asarray(table)
+    size = len(table)
+    n_words = (size + 63) // 64
+    matrix = np.zeros((size, n_words), dtype='<u8')
+    # The table is shipped once per worker instead of once per task
+    with Pool(processes or cpu_count(), initializer=_init_worker, initargs=(table,)) as pool:
+        for start, block in pool.imap_unordered(_fill_words, word_ranges(n_words, chunk_words)):
+            matrix[:, start:start + block.shape[1]] = block
+    return matrix
+
+def _fill_tile(args):
+    """Computes one tile of the on-disk matrix and writes it straight into the memory-mapped file."""
+    tile, tile_words = args
+    n_words = (len(_table) + 63) // 64
+    start, block = _fill_words((tile * tile_words, min((tile + 1) * tile_words, n_words)))
+    tiles = np.load(_path, mmap_mode='r+')
+    tiles[tile, :, :block.shape[1]] = block
+    tiles.flush()
+    del tiles
+    return tile
+
+def calculate_ddt_memmap(table, path, processes=None, tile_bytes=2 ** 28):
+    """
+    Out-of-core version of calculate_ddt_bitset for widths beyond 16 bits.
+    The matrix is stored in the .npy file `path` as tiles of shape (2^n, tile_words): tile t holds the
+    words t * tile_words to (t + 1) * tile_words - 1 of every column, so each tile is one contiguous
+    block of about tile_bytes, which bounds the memory of every worker. Returns the memory-mapped
+    array of shape (tiles, 2^n, tile_words).
+    """
+    table = np.asarray(table)
+    size = len(table)
+    n_words = (size + 63) // 64
+    tile_words = min(n_words, max(1, tile_bytes // (8 * size)))
+    n_tiles = (n_words + tile_words - 1) // tile_words
+    tiles = np.lib.format.open_memmap(path, mode='w+', dtype='<u8', shape=(n_tiles, size, tile_words))
+    del tiles
+    with Pool(processes or cpu_count(), initializer=_init_worker, initargs=(table, path)) as pool:
+        for _ in pool.imap_unordered(_fill_tile, [(tile, tile_words) for tile in range(n_tiles)]):
+            pass
+    return np.load(path, mmap_mode='r')
+
+def matrix_rows(matrix, rows):
+    """
+    Rows (column masks) of a packed bit matrix, either held in memory with shape (2^n, words) or tiled
+    on disk with shape (tiles, 2^n, tile_words).
+    """
+    if matrix.ndim == 2:
+        return matrix[rows]
+    block = matrix[:, rows, :]
+    return np.moveaxis(block, 0, -2).reshape(*block.shape[1:-1], -1)
+
+def matrix_words(matrix):
+    """Number of uint64 words in one row of a packed bit matrix."""
+    return matrix.shape[1] if matrix.ndim == 2 else matrix.shape[0] * matrix.shape[2]
+
+def ddt_column_mask(matrix, column):
+    """Column mask of one output difference as a Python int: bit a is set when input difference a reaches it."""
+    return int.from_bytes(matrix_rows(matrix, column).astype('<u8').tobytes(), 'little')
+
+def ddt_column_masks(matrix):
+    return [ddt_column_mask(matrix, column) for column in range(matrix.shape[-2])]
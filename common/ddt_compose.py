@@ -0,0 +1,71 @@
+import numpy as np
+from ddt_bitset import calculate_ddt_bitset
+from set_cover import popcount
+
+def sbox_ddt_support(sbox):
+    """4-bit DDT support of the S-box as a 16 x 16 boolean matrix: R[a][b] iff a can reach b."""
+    sbox = np.asarray(sbox)
+    x = np.arange(16)
+    support = np.zeros((16, 16), dtype=bool)
+    for a in range(16):
+        support[a, sbox[x] ^ sbox[x ^ a]] = True
+    return support
+
+def _nibble_layer(words, support, n):
+    """
+    Pushes packed sets through one S-box layer. words[v] holds the set reaching the n-bit difference v,
+    the result holds the set reaching each output difference: bitwise ORs over the S-box DDT support, one
+    nibble at a time.
+    """
+    m = n // 4
+    words = words.reshape((16,) * m + words.shape[1:])
+    for i in range(m):
+        # Axis m - 1 - i is nibble i, the nibbles being numbered from the least significant one
+        axis = m - 1 - i
+        source = np.moveaxis(words, axis, 0)
+        target = np.zeros_like(source)
+        for a, b in zip(*np.nonzero(support)):
+            target[b] |= source[a]
+        words = np.moveaxis(target, 0, axis)
+    return np.ascontiguousarray(words).reshape((2 ** n,) + words.shape[m:])
+
+def ddt_support_upper_bound(sbox, linear, n, chunk_words=64):
+    """
+    Upper bound on the DDT support of S o L o S from the 4-bit S-box DDT support, without touching the
+    super-box table: in the layout of calculate_ddt_bitset, row c holds the input differences a that reach c
+    through some nibble-wise S-box transition, the linear layer `linear` (the table of L on all 2^n values)
+    and a second nibble-wise S-box transition.
+    The nibbles of both S-box layers are treated as independent, so this is not the DDT support: it contains
+    every possible transition but also many impossible ones (about twice as many entries for the 16-bit
+    GIFT super-box). It is only a screen: a transition outside of it is impossible, one inside of it still
+    has to be checked, e.g. with check_ddt_support against the brute-force support.
+    The input differences are processed as packed words, chunk_words words (64 * chunk_words differences)
+    at a time, so every step is a bitwise OR over uint64 arrays.
+    """
+    size = 2 ** n
+    n_words = (size + 63) // 64
+    support = sbox_ddt_support(sbox)
+    # L maps the difference d to linear[d], so the set reaching linear[d] is the set reaching d
+    inverse = np.empty(size, dtype=np.int64)
+    inverse[np.asarray(linear, dtype=np.int64)] = np.arange(size)
+    matrix = np.zeros((size, n_words), dtype='<u8')
+    for start in range(0, n_words, chunk_words):
+        stop = min(start + chunk_words, n_words)
+        # Input difference a starts as its own bit in word a // 64 of the chunk
+        a = np.arange(64 * start, min(64 * stop, size))
+        words = np.zeros((size, stop - start), dtype='<u8')
+        words[a, a // 64 - start] = np.uint64(1) << (a % 64).astype('<u8')
+        words = _nibble_layer(words, support, n)
+        words = _nibble_layer(words[inverse], support, n)
+        matrix[:, start:stop] = words
+    return matrix
+
+def check_ddt_support(table, matrix, processes=None):
+    """
+    Compares a DDT support matrix with the brute-force one of the super-box table.
+    Returns (transitions in the brute-force support, missing from matrix, extra in matrix).
+    """
+    reference = calculate_ddt_bitset(table, processes)
+    missing = int(popcount(reference & ~matrix).sum())
+    extra = int(popcount(matrix & ~reference).sum())
+    return int(popcount(reference).sum()), missing, extra
@@ -0,0 +1,64 @@
+import os
+import sys
+import hashlib
+import tempfile
+
+# Templates rendered so far, one per (kind, block size, rounds)
+_templates = {}
+
+def boundary_lines(name, size):
+    """Both versions of every boundary constraint: lines[i][bit] is the line fixing name_i to bit."""
+    return [(f"{name}_{i} = 0\n".encode(), f"{name}_{i} = 1\n".encode()) for i in range(size)]
+
+class LPTemplate:
+    """
+    The LP file of a writer rendered once, split around its input and output boundary constraints.
+    The file of a pair is the fixed text with only the 2 x size boundary lines chosen per pair, so
+    it is byte-identical to what the writer produces for that pair.
+    """
+    def __init__(self, write, size, in_name, out_name):
+        # Render the writer once with all boundary bits 0
+        fd, path = tempfile.mkstemp(suffix=".lp")
+        os.close(fd)
+        try:
+            write(path, "0" * size, "0" * size)
+            with open(path, "rb") as f:
+                text = f.read()
+        finally:
+            os.remove(path)
+
+        self.in_lines = boundary_lines(in_name, size)
+        self.out_lines = boundary_lines(out_name, size)
+        in_block = b"\n" + b"".join(zero for zero, _ in self.in_lines)
+        out_block = b"\n" + b"".join(zero for zero, _ in self.out_lines)
+        if text.count(in_block) != 1 or text.count(out_block) != 1:
+            raise ValueError(f"Boundary constraints of {in_name} and {out_name} not found in the LP file")
+        start = text.index(in_block) + 1
+        end = text.index(out_block) + 1
+        self.parts = (text[:start], text[start + len(in_block) - 1:end], text[end + len(out_block) - 1:])
+        # The model without its boundary bits, as the 64-bit key of its outcomes in the solve cache
+        self.digest = int.from_bytes(hashlib.sha256(text).digest()[:8], "big")
+
+    def render(self, in_diff, out_diff):
+        """The LP file of a pair as bytes, bit i of a difference fixing variable i."""
+        head, body, tail = self.parts
+        return b"".join((head,
+                         b"".join(lines[(in_diff >> i) & 1] for i, lines in enumerate(self.in_lines)),
+                         body,
+                         b"".join(lines[(out_diff >> i) & 1] for i, lines in enumerate(self.out_lines)),
+                         tail))
+
+    def write(self, filename, in_diff, out_diff):
+        try:
+            with open(filename, "wb") as f:
+                f.write(self.render(in_diff, out_diff))
+        except IOError as e:
+            print(f"Error writing LP file: {e}")
+            sys.exit(1)
+
+def cached_template(kind, size, rounds, build):
+    """The template of (kind, size, rounds), built by build() on first use."""
+    key = (kind, size, rounds)
+    if key not in _templates:
+        _templates[key] = build()
+    return _templates[key]
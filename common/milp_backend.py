@@ -0,0 +1,134 @@
+import copy
+import time
+import numpy as np
+from milp_model import gurobi_model, solver_param
+
+class HighsModel:
+    """The system solved by HiGHS through scipy.optimize.milp, the boundary bits fixed through the variable bounds."""
+    def __init__(self, system, inputs, outputs):
+        from scipy.optimize import LinearConstraint
+        from scipy.sparse import csr_array
+        rows, columns, data, lower, upper = [], [], [], [], []
+        for r, (indices, coefficients, sense, rhs) in enumerate(system.constraints):
+            rows += [r] * len(indices)
+            columns += indices
+            data += coefficients
+            lower.append(-np.inf if sense == "<" else rhs)
+            upper.append(np.inf if sense == ">" else rhs)
+        n = len(system.binary)
+        matrix = csr_array((data, (rows, columns)), shape=(len(system.constraints), n))
+        self.constraints = LinearConstraint(matrix, lower, upper)
+        self.c = np.zeros(n)
+        self.integrality = np.ones(n)
+        self.lb = np.zeros(n)
+        self.ub = np.where(system.binary, 1.0, np.inf)
+        self.inputs = np.array(inputs)
+        self.outputs = np.array(outputs)
+
+    def relaxation(self):
+        """The LP relaxation: the same constraints without integrality."""
+        relaxed = copy.copy(self)
+        relaxed.integrality = np.zeros_like(self.integrality)
+        return relaxed
+
+    def solve(self, in_diff, out_diff):
+        """Same statuses as solve_lp_file: True if feasible, False if infeasible, None otherwise."""
+        from scipy.optimize import Bounds, milp
+        lb, ub = self.lb.copy(), self.ub.copy()
+        for variables, diff in ((self.inputs, in_diff), (self.outputs, out_diff)):
+            bits = [(diff >> i) & 1 for i in range(len(variables))]
+            lb[variables] = bits
+            ub[variables] = bits
+        try:
+            result = milp(self.c, constraints=self.constraints, integrality=self.integrality, bounds=Bounds(lb, ub))
+        except Exception as e:
+            print(f"Error solving the model: {e}")
+            return None
+        if result.status == 0:
+            return True
+        elif result.status == 2:
+            return False
+        else:
+            print(f"Solver stopped with status: {result.status}")
+            return None
+
+class CpSatModel:
+    """The system solved by OR-Tools CP-SAT, the boundary bits fixed by assumptions on their literals."""
+    # Upper bound of the integer variables, which are only the MC carries (0 or 1)
+    INTEGER_BOUND = 1 << 16
+
+    def __init__(self, system, inputs, outputs):
+        from ortools.sat.python import cp_model
+        self.model = cp_model.CpModel()
+        variables = []
+        for name, first, n, binary in system.groups:
+            for j in range(n):
+                if binary:
+                    variables.append(self.model.new_bool_var(f"{name}[{j}]"))
+                else:
+                    variables.append(self.model.new_int_var(0, self.INTEGER_BOUND, f"{name}[{j}]"))
+        for indices, coefficients, sense, rhs in system.constraints:
+            expr = sum(c * variables[i] for i, c in zip(indices, coefficients))
+            if sense == ">":
+                self.model.add(expr >= rhs)
+            elif sense == "<":
+                self.model.add(expr <= rhs)
+            else:
+                self.model.add(expr == rhs)
+        self.inputs = [variables[i] for i in inputs]
+        self.outputs = [variables[i] for i in outputs]
+        self.solver = cp_model.CpSolver()
+        threads = solver_param("Threads")
+        if threads:
+            self.solver.parameters.num_workers = threads
+
+    def solve(self, in_diff, out_diff):
+        """Same statuses as solve_lp_file: True if feasible, False if infeasible, None otherwise."""
+        from ortools.sat.python import cp_model
+        assumptions = []
+        for variables, diff in ((self.inputs, in_diff), (self.outputs, out_diff)):
+            assumptions += [v if (diff >> i) & 1 else v.Not() for i, v in enumerate(variables)]
+        try:
+            self.model.clear_assumptions()
+            self.model.add_assumptions(assumptions)
+            status = self.solver.solve(self.model)
+        except Exception as e:
+            print(f"Error solving the model: {e}")
+            return None
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return True
+        elif status == cp_model.INFEASIBLE:
+            return False
+        else:
+            print(f"Solver stopped with status: {self.solver.status_name(status)}")
+            return None
+
+# Model of a LinearSystem for each solver: BACKENDS[solver](system, inputs, outputs) has solve(in_diff, out_diff)
+BACKENDS = {"GUROBI": gurobi_model, "HIGHS": HighsModel, "CPSAT": CpSatModel}
+
+def build_model(backend, system, inputs, outputs):
+    return BACKENDS[backend](system, inputs, outputs)
+
+def benchmark(build, pairs, backends=tuple(BACKENDS)):
+    """
+    Per-pair solve time of each backend on pairs, build(backend) returning its model. Backends whose
+    package is not installed are skipped, and the outcomes are compared with those of the first backend.
+    """
+    reference = None
+    for backend in backends:
+        try:
+            start = time.perf_counter()
+            model = build(backend)
+            build_time = time.perf_counter() - start
+        except ImportError as e:
+            print(f"{backend}: not available ({e})")
+            continue
+        start = time.perf_counter()
+        outcomes = [model.solve(in_diff, out_diff) for in_diff, out_diff in pairs]
+        solve_time = time.perf_counter() - start
+        if reference is None:
+            reference = outcomes
+        mismatches = sum(1 for a, b in zip(outcomes, reference) if a is not None and b is not None and a != b)
+        print(f"{backend}: build {build_time:.2f} s, {1000 * solve_time / max(1, len(pairs)):.2f} ms per pair, "
+              f"{outcomes.count(True)} feasible, {outcomes.count(False)} infeasible, {outcomes.count(None)} undecided, "
+              f"{mismatches} mismatches")
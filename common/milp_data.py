@@ -0,0 +1,118 @@
+import os
+import ast
+import hashlib
+from itertools import combinations
+from collections.abc import Mapping
+import numpy as np
+from artifact_cache import save_arrays, load_arrays
+
+# Partition tables used by the MILP scripts, stored as .npy files under the data folder each cipher script passes
+
+def save_partition_table(name, table, data_dir):
+    """Stores a partition table {representative: [differences]} in data_dir/name: class k is members[offsets[k]:offsets[k + 1]]."""
+    directory = os.path.join(data_dir, name)
+    os.makedirs(directory, exist_ok=True)
+    save_arrays(directory, representatives=np.array(list(table.keys()), dtype=np.int64),
+                offsets=np.cumsum([0] + [len(v) for v in table.values()], dtype=np.int64),
+                members=np.array([x for v in table.values() for x in v], dtype=np.uint16))
+
+class PartitionTable(Mapping):
+    """
+    Read-only {representative: [differences]} view of a stored partition table. The arrays are
+    memory-mapped on first access, so worker processes share the pages instead of copying a dict.
+    The classes are returned as lists of Python ints, which can be shifted into 64-bit differences.
+    """
+    def __init__(self, name, data_dir):
+        self.directory = os.path.join(data_dir, name)
+        self._arrays = None
+        self._index = None
+
+    def _load(self):
+        if self._arrays is None:
+            self._arrays = load_arrays(self.directory)
+            self._index = {r: k for k, r in enumerate(self._arrays["representatives"].tolist())}
+        return self._arrays
+
+    def __getitem__(self, representative):
+        arrays = self._load()
+        k = self._index[representative]
+        return arrays["members"][arrays["offsets"][k]:arrays["offsets"][k + 1]].tolist()
+
+    @property
+    def digest(self):
+        """Content hash of the stored arrays, as part of the key of the results computed from the table."""
+        arrays = self._load()
+        h = hashlib.sha256()
+        for name in ("representatives", "offsets", "members"):
+            h.update(np.ascontiguousarray(arrays[name]).tobytes())
+        return h.hexdigest()[:32]
+
+    def class_size(self, representative):
+        offsets = self._load()["offsets"]
+        k = self._index[representative]
+        return int(offsets[k + 1] - offsets[k])
+
+    def __iter__(self):
+        self._load()
+        return iter(self._index)
+
+    def __len__(self):
+        self._load()
+        return len(self._index)
+
+def pattern_differences(representatives, table, pattern):
+    """
+    The differences of len(pattern) 16-bit blocks, the first block the most significant, each block a
+    representative of table: an active one (class of more than one difference) where pattern is true,
+    an inactive one elsewhere. Returned as a uint64 array in the order of product(representatives,
+    repeat=len(pattern)), with the position of each difference in that product.
+    """
+    sizes = np.array([table.class_size(r) for r in representatives])
+    choices = [np.flatnonzero(sizes > 1 if active else sizes == 1) for active in pattern]
+    grid = np.stack(np.meshgrid(*choices, indexing="ij"), axis=-1).reshape(-1, len(pattern))
+    blocks = len(pattern)
+    positions = grid @ (len(representatives) ** np.arange(blocks - 1, -1, -1, dtype=np.int64))
+    values = np.asarray(representatives, dtype=np.uint64)[grid]
+    differences = np.zeros(len(grid), dtype=np.uint64)
+    for b in range(blocks):
+        differences |= values[:, b] << np.uint64(16 * (blocks - 1 - b))
+    return differences, positions
+
+def activity_groups(representatives, table, active=1, blocks=4):
+    """
+    pattern_differences for every pattern of `active` active blocks out of `blocks`: a list of
+    (pattern, differences, positions), the groups in the order of their first position. Every group is
+    small, but their pairs grow with the number of active blocks and are to be streamed.
+    """
+    groups = []
+    for chosen in combinations(range(blocks), active):
+        pattern = tuple(b in chosen for b in range(blocks))
+        differences, positions = pattern_differences(representatives, table, pattern)
+        if len(differences):
+            groups.append((pattern, differences, positions))
+    return sorted(groups, key=lambda group: group[2][0])
+
+def read_potential_pairs(filename):
+    """
+    The potential pairs of a Potential_Pairs_Round_*.txt file written by the potential pairs script,
+    the dictionaries of all its parts merged into {input difference: [output differences]}.
+    """
+    pairs = {}
+    with open(filename) as f:
+        for line in f:
+            if line.startswith("defaultdict("):
+                part = ast.literal_eval(line[line.index("{"):line.rindex("}") + 1])
+                for in_diff, out_diffs in part.items():
+                    pairs.setdefault(in_diff, []).extend(out_diffs)
+    return pairs
+
+def potential_pairs_file(rounds, mode=""):
+    """
+    The file the IDs scripts read the potential pairs of `rounds` rounds from: the one merged by the potential
+    pairs script run with the same mode, else for one active block the published Potential_Pairs_Round_<rounds>.txt.
+    None if there is neither.
+    """
+    candidates = [f"Trial_Potential_Pairs_Round_{rounds}{mode}.txt"]
+    if not mode:
+        candidates.append(f"Potential_Pairs_Round_{rounds}.txt")
+    return next((filename for filename in candidates if os.path.exists(filename)), None)
@@ -0,0 +1,92 @@
+import time
+import sqlite3
+import threading
+
+def _signed(diff):
+    # SQLite integers are signed 64-bit
+    return diff - (1 << 64) if diff >= 1 << 63 else diff
+
+def _unsigned(value):
+    return value & 0xFFFFFFFFFFFFFFFF
+
+class PairJournal:
+    """
+    Crash-safe record of the solved pairs in an SQLite database in WAL mode: one row per pair with its
+    feasibility and solve time. Rows are buffered and committed in batches of batch_size, or after
+    interval seconds, so a crash loses at most the last batch. Undecided results (None) are not recorded.
+    The rows are keyed by the model as well, a 64-bit key such as LPTemplate.digest (as in the solve cache):
+    a run on another model sharing the file neither reads nor overwrites them.
+    The journal may be used from several threads, the pool looking pairs up while they are fed to it.
+    """
+    def __init__(self, filename, model=0, batch_size=1000, interval=5.0):
+        self.lock = threading.Lock()
+        # Runs on the same machine may share a journal, waiting for the lock of each other's commits
+        self.connection = sqlite3.connect(filename, timeout=60, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # With WAL a commit only syncs at checkpoints, the database stays consistent on a crash
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS model_pairs (model INTEGER, in_diff INTEGER, out_diff INTEGER, "
+                                "feasible INTEGER, seconds REAL, PRIMARY KEY (model, in_diff, out_diff)) WITHOUT ROWID")
+        self.connection.commit()
+        self.model = _signed(model)
+        self.batch_size = batch_size
+        self.interval = interval
+        self.pending = []
+        self.flushed = time.monotonic()
+
+    def __len__(self):
+        self.flush()
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM model_pairs WHERE model = ?", (self.model,)).fetchone()[0]
+
+    def feasible(self, in_diff, out_diff):
+        """The recorded result of a pair, None if it is not recorded."""
+        with self.lock:
+            row = self.connection.execute("SELECT feasible FROM model_pairs WHERE model = ? AND in_diff = ? AND out_diff = ?",
+                                          (self.model, _signed(in_diff), _signed(out_diff))).fetchone()
+        return None if row is None else bool(row[0])
+
+    def feasible_outputs(self, in_diff, out_diffs):
+        """The recorded feasible outputs among out_diffs, None unless all of them are recorded."""
+        with self.lock:
+            rows = dict(self.connection.execute("SELECT out_diff, feasible FROM model_pairs WHERE model = ? AND in_diff = ?",
+                                                (self.model, _signed(in_diff))))
+        rows = {_unsigned(out_diff): feasible for out_diff, feasible in rows.items()}
+        if any(out_diff not in rows for out_diff in out_diffs):
+            return None
+        return {out_diff for out_diff in out_diffs if rows[out_diff]}
+
+    def lookup(self, tasks):
+        """The recorded result of each task of pair_results, None for the tasks still to solve."""
+        return [self.feasible_outputs(*task) if isinstance(task[1], list) else self.feasible(*task[:2]) for task in tasks]
+
+    def record(self, task, result, seconds):
+        """
+        Record the result of a task: a pair and its feasibility, or an input, its candidate outputs and the
+        feasible ones among them, the time of the enumeration being shared among the outputs.
+        """
+        if result is None:
+            return
+        in_diff, out_diffs = task[0], task[1]
+        if isinstance(out_diffs, list):
+            share = seconds / max(1, len(out_diffs))
+            rows = ((self.model, _signed(in_diff), _signed(out_diff), int(out_diff in result), share) for out_diff in out_diffs)
+        else:
+            rows = [(self.model, _signed(in_diff), _signed(out_diffs), int(result), seconds)]
+        with self.lock:
+            self.pending.extend(rows)
+        if len(self.pending) >= self.batch_size or time.monotonic() - self.flushed >= self.interval:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if self.pending:
+                with self.connection:
+                    self.connection.executemany("INSERT OR REPLACE INTO model_pairs VALUES (?, ?, ?, ?, ?)", self.pending)
+                self.pending = []
+            self.flushed = time.monotonic()
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.connection.close()
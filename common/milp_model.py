@@ -0,0 +1,235 @@
+import time
+from collections import Counter
+
+# Gurobi environment shared by all models of the process, created on first use
+_env = None
+
+# Models built so far, one per (kind, backend, block size, rounds)
+_models = {}
+
+# Parameters set on every model of the process, e.g. the Threads cap of a pool worker
+_params = {}
+
+# Pairs seen, pairs settled and seconds spent at each stage of the checks, keyed by (stage, field)
+stage_stats = Counter()
+
+# Two-stage versions of the models built so far, keyed by the id of the model
+_screened = {}
+
+def gurobi_env():
+    global _env
+    if _env is None:
+        import gurobipy as gp
+        _env = gp.Env(empty=True)
+        _env.setParam("OutputFlag", 0)
+        for name, value in _params.items():
+            _env.setParam(name, value)
+        _env.start()
+    return _env
+
+def set_solver_param(name, value):
+    """Set a parameter on the shared environment and on the models read from LP files."""
+    _params[name] = value
+    if _env is not None:
+        _env.setParam(name, value)
+
+def solver_param(name, default=None):
+    return _params.get(name, default)
+
+def apply_solver_params(model):
+    for name, value in _params.items():
+        model.setParam(name, value)
+
+class LinearSystem:
+    """
+    A model independent of the solver: binary and integer variables in named groups, and linear
+    constraints over their indices. Each backend translates it once into its own model.
+    """
+    def __init__(self):
+        self.groups = []
+        self.binary = []
+        self.constraints = []
+
+    def add_vars(self, n, name, binary=True):
+        """n new variables x{name}[0..n-1], binary or non-negative integers; returns their indices."""
+        first = len(self.binary)
+        self.groups.append((name, first, n, binary))
+        self.binary += [binary] * n
+        return list(range(first, first + n))
+
+    def add_constr(self, indices, coefficients, sense, rhs):
+        """sum of coefficients[k] * variable indices[k] `sense` rhs, sense being ">", "<" or "="."""
+        self.constraints.append((indices, coefficients, sense, rhs))
+
+    def add_equalities(self, left, right):
+        for a, b in zip(left, right):
+            self.add_constr([a, b], [1, -1], "=", 0)
+
+def add_sbox_constraints(system, x, y, s_boxes, conv, y_index=None):
+    """
+    The 21 inequalities of `conv` for every S-box, between the input bits x and the output bits y,
+    as written by the LP writers. y_index maps the output bit 4 * j + 7 - l to the index of its variable.
+    """
+    for j in range(s_boxes):
+        for k in range(21):
+            coff = conv[9 * k:9 * k + 9]
+            indices, coefficients = [], []
+            for l in range(4):
+                if coff[l]:
+                    indices.append(x[4 * j + 3 - l])
+                    coefficients.append(coff[l])
+            for l in range(4, 8):
+                if coff[l]:
+                    indices.append(y[y_index[4 * j + 7 - l] if y_index else 4 * j + 7 - l])
+                    coefficients.append(coff[l])
+            system.add_constr(indices, coefficients, ">", -coff[8])
+
+def add_mc_constraints(system, y, z, x, IVLBC, IVLBC_MC_pos):
+    """MC over GF(2) as written by the LP writers: the sum of the three input bits of x_j is x_j + 2 z_j."""
+    for j in range(IVLBC):
+        inputs = [y[(15 - p) + int(j / 16) * 16] for p in IVLBC_MC_pos[15 - (j % 16)]]
+        system.add_constr(inputs + [z[j], x[j]], [1] * len(inputs) + [-2, -1], "=", 0)
+
+class BoundaryModel:
+    """
+    A model built once for a number of rounds. The input and output differences of a pair are set by
+    fixing the bounds of the boundary bit variables, bit i of a difference being variable i.
+    """
+    def __init__(self, model, inputs, outputs):
+        self.model = model
+        self.inputs = inputs
+        self.outputs = outputs
+
+    def fix(self, variables, diff):
+        bits = [(diff >> i) & 1 for i in range(len(variables))]
+        self.model.setAttr("LB", variables, bits)
+        self.model.setAttr("UB", variables, bits)
+
+    def solve(self, in_diff, out_diff):
+        """Same statuses as solve_lp_file: True if feasible, False if infeasible, None otherwise."""
+        from gurobipy import GRB
+        try:
+            self.fix(self.inputs, in_diff)
+            self.fix(self.outputs, out_diff)
+            self.model.optimize()
+            if self.model.status == GRB.OPTIMAL:
+                return True
+            elif self.model.status == GRB.INFEASIBLE:
+                return False
+            else:
+                print(f"Solver stopped with status: {self.model.status}")
+                return None
+        except Exception as e:
+            print(f"Error solving the model: {e}")
+            return None
+
+    def relaxation(self):
+        """The LP relaxation on its own copy of the model, with the same boundary bits."""
+        relaxed = self.model.relax()
+        # Dual simplex restarts from the previous basis after the bounds of the boundary bits change
+        relaxed.Params.Method = 1
+        return BoundaryModel(relaxed, [relaxed.getVarByName(v.VarName) for v in self.inputs],
+                             [relaxed.getVarByName(v.VarName) for v in self.outputs])
+
+    def feasible_outputs(self, in_diff, out_diffs):
+        """
+        The outputs of out_diffs reachable from in_diff, enumerated on one model: a selector per candidate
+        restricts the output to out_diffs, and each output found is excluded by a no-good cut on its
+        selector until the model is infeasible. None if the solver stops with another status.
+        """
+        import gurobipy as gp
+        from gurobipy import GRB
+        model = self.model
+        self.fix(self.inputs, in_diff)
+        model.setAttr("LB", self.outputs, [0] * len(self.outputs))
+        model.setAttr("UB", self.outputs, [1] * len(self.outputs))
+        select = model.addVars(len(out_diffs), vtype=GRB.BINARY)
+        constrs = [model.addLConstr(select.sum(), GRB.EQUAL, 1)]
+        for j, x in enumerate(self.outputs):
+            expr = gp.quicksum(select[c] for c, out_diff in enumerate(out_diffs) if (out_diff >> j) & 1)
+            constrs.append(model.addLConstr(x - expr, GRB.EQUAL, 0))
+        found = set()
+        try:
+            while True:
+                model.optimize()
+                if model.status == GRB.INFEASIBLE:
+                    return found
+                elif model.status != GRB.OPTIMAL:
+                    print(f"Solver stopped with status: {model.status}")
+                    return None
+                c = next(c for c in select if select[c].X > 0.5)
+                found.add(out_diffs[c])
+                select[c].UB = 0
+        except Exception as e:
+            print(f"Error solving the model: {e}")
+            return None
+        finally:
+            model.remove(constrs)
+            model.remove(list(select.values()))
+            model.update()
+
+def gurobi_model(system, inputs, outputs):
+    """The system as a gurobipy model on the shared environment, with the variables inputs and outputs as boundary bits."""
+    import gurobipy as gp
+    from gurobipy import GRB
+    model = gp.Model(env=gurobi_env())
+    variables = []
+    for name, first, n, binary in system.groups:
+        group = model.addVars(n, vtype=GRB.BINARY if binary else GRB.INTEGER, name=name)
+        variables += [group[j] for j in range(n)]
+    for indices, coefficients, sense, rhs in system.constraints:
+        model.addLConstr(gp.LinExpr(coefficients, [variables[i] for i in indices]), sense, rhs)
+    model.update()
+    return BoundaryModel(model, [variables[i] for i in inputs], [variables[i] for i in outputs])
+
+def record_stage(stage, pairs, settled, seconds):
+    stage_stats[stage, "pairs"] += pairs
+    stage_stats[stage, "settled"] += settled
+    stage_stats[stage, "seconds"] += seconds
+
+def stage_report():
+    """One line per stage: the pairs it settled out of those it saw, and the time it took."""
+    lines = []
+    for stage in ("symmetry", "truncated", "propagation", "relaxation", "milp"):
+        pairs = stage_stats[stage, "pairs"]
+        if pairs:
+            settled = stage_stats[stage, "settled"]
+            lines.append(f"{stage}: {settled} of {pairs} pairs settled ({100 * settled / pairs:.1f}%), "
+                         f"{stage_stats[stage, 'seconds']:.2f} s")
+    return "\n".join(lines)
+
+class ScreenedModel:
+    """
+    Two-stage check of a model: the LP relaxation first, which the solver warm-starts from the previous
+    pair, and the MILP only for the pairs whose relaxation is feasible, an infeasible relaxation proving
+    the pair infeasible.
+    """
+    def __init__(self, model):
+        self.model = model
+        self.relaxed = model.relaxation()
+
+    def solve(self, in_diff, out_diff):
+        start = time.perf_counter()
+        relaxed = self.relaxed.solve(in_diff, out_diff)
+        record_stage("relaxation", 1, relaxed is False, time.perf_counter() - start)
+        if relaxed is False:
+            return False
+        start = time.perf_counter()
+        feasible = self.model.solve(in_diff, out_diff)
+        record_stage("milp", 1, feasible is not None, time.perf_counter() - start)
+        return feasible
+
+def screened(model):
+    """The two-stage version of a model, built once; the model itself if it has no relaxation."""
+    if not hasattr(model, "relaxation"):
+        return model
+    if id(model) not in _screened:
+        _screened[id(model)] = ScreenedModel(model)
+    return _screened[id(model)]
+
+def cached_model(kind, size, rounds, build, backend="GUROBI"):
+    """The model of (kind, size, rounds) for a backend, built by build() on first use."""
+    key = (kind, backend, size, rounds)
+    if key not in _models:
+        _models[key] = build()
+    return _models[key]
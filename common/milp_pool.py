@@ -0,0 +1,162 @@
+import os
+import time
+import shutil
+import tempfile
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+from milp_model import set_solver_param, record_stage, stage_stats
+
+# Pair solver and pre-filters of a pool worker, built once per worker process
+_solve = None
+_prefilters = ()
+
+def _init_worker(build, threads, scratch, prefilters):
+    global _solve, _prefilters
+    _prefilters = prefilters
+    if threads:
+        set_solver_param("Threads", threads)
+    # Each worker writes its LP files to its own scratch file
+    _solve = build(filename=os.path.join(scratch, f"worker_{os.getpid()}.lp"))
+
+def _solve_chunk(chunk):
+    # The stage statistics of the chunk go back with its results
+    results = list(chunk_results(chunk, _solve, _prefilters))
+    stats = dict(stage_stats)
+    stage_stats.clear()
+    return results, stats
+
+def _merged_stats(chunk_stats):
+    # The results of the chunks solved by the workers, their stage statistics added to ours
+    for results, stats in chunk_stats:
+        stage_stats.update(stats)
+        yield results
+
+def chunk_results(chunk, solve, prefilters=()):
+    """
+    (task, result, seconds) for each pair of a chunk. Each (stage, prefilter) in turn gets the pairs not
+    proven impossible yet, and the pairs it proves impossible are False without a solve.
+    """
+    proven = [False] * len(chunk)
+    for stage, prefilter in prefilters:
+        undecided = [k for k in range(len(chunk)) if not proven[k]]
+        if not undecided:
+            break
+        start = time.perf_counter()
+        result = prefilter([chunk[k][0] for k in undecided], [chunk[k][1] for k in undecided])
+        for k, impossible in zip(undecided, result):
+            proven[k] = bool(impossible)
+        record_stage(stage, len(undecided), int(sum(result)), time.perf_counter() - start)
+    for task, impossible in zip(chunk, proven):
+        if impossible:
+            yield task, False, 0.0
+        else:
+            start = time.perf_counter()
+            result = solve(*task)
+            yield task, result, time.perf_counter() - start
+
+def undecided_outputs(prefilters, in_diff, out_diffs):
+    """
+    The outputs of out_diffs that no prefilter proves impossible from in_diff, each stage recorded as
+    in chunk_results.
+    """
+    for stage, prefilter in prefilters:
+        if not out_diffs:
+            break
+        start = time.perf_counter()
+        proven = prefilter([in_diff] * len(out_diffs), out_diffs)
+        undecided = [out_diff for out_diff, impossible in zip(out_diffs, proven) if not impossible]
+        record_stage(stage, len(out_diffs), len(out_diffs) - len(undecided), time.perf_counter() - start)
+        out_diffs = undecided
+    return out_diffs
+
+def chunks(pairs, size):
+    pairs = iter(pairs)
+    while True:
+        chunk = list(islice(pairs, size))
+        if not chunk:
+            return
+        yield chunk
+
+def pair_results(pairs, build, processes=1, threads=None, chunk_size=16, scratch_prefix="Trial_", prefilters=(),
+                 journal=None, canonical=None, window=1 << 20):
+    """
+    Yield (in_diff, out_diff, feasible) for every pair, in the order of pairs. build(filename=...)
+    returns the solve(in_diff, out_diff) of a process. With processes > 1 the pairs are spread over
+    a pool of workers, each with its own solver and scratch LP file and at most `threads` Gurobi
+    threads, by default an equal share of the cores. A pair may be any tuple of arguments of solve,
+    its result then follows them.
+    prefilters is a sequence of (stage, prefilter), prefilter(in_diffs, out_diffs) marking the pairs of a
+    chunk it proves impossible, which are not solved.
+    With a PairJournal the pairs it has recorded take their result from it, and the others are recorded
+    once solved.
+    canonical(in_diffs, out_diffs) gives the orbit of each pair under symmetries of the model (see
+    PairCanonicalizer): only the first pair of an orbit is solved, the others take its result.
+    pairs may be a lazy stream of any length: it is read as the workers take the chunks, and the orbits
+    are forgotten every `window` orbits, a pair whose orbit was forgotten being solved again.
+    """
+    # The chunks sent to the solvers, waiting for their results
+    pending = deque()
+    # The orbits met by the feeder, and the result of each once its first pair is merged
+    seen = set()
+    orbits = {}
+    def unsolved():
+        for chunk in chunks(pairs, chunk_size):
+            # Past `window` orbits start afresh, merged() dropping their results when it reaches this chunk
+            forget = len(seen) >= window
+            if forget:
+                seen.clear()
+            known = [None] * len(chunk) if journal is None else journal.lookup(chunk)
+            start = time.perf_counter()
+            keys = [None] * len(chunk)
+            if canonical is not None:
+                keys = canonical([task[0] for task in chunk], [task[1] for task in chunk])
+            # Whether each pair is solved, rather than journaled or left to the first pair of its orbit
+            solving = []
+            for key, result in zip(keys, known):
+                solving.append(result is None and (key is None or key not in seen))
+                if key is not None:
+                    seen.add(key)
+            pending.append((chunk, known, keys, solving, forget, time.perf_counter() - start))
+            yield [task for task, solve in zip(chunk, solving) if solve]
+
+    def merged(solved):
+        for results in solved:
+            chunk, known, keys, solving, forget, seconds = pending.popleft()
+            if forget:
+                orbits.clear()
+            if canonical is not None:
+                record_stage("symmetry", len(chunk), sum(not solve and result is None for solve, result in zip(solving, known)),
+                             seconds)
+            results = iter(results)
+            for task, result, key, solve in zip(chunk, known, keys, solving):
+                if solve:
+                    task, result, seconds = next(results)
+                    if journal is not None:
+                        journal.record(task, result, seconds)
+                elif result is None:
+                    result = orbits[key]
+                    if journal is not None:
+                        journal.record(task, result, 0.0)
+                if key is not None:
+                    orbits.setdefault(key, result)
+                yield (*task, result)
+
+    try:
+        if processes <= 1:
+            if threads:
+                set_solver_param("Threads", threads)
+            solve = build()
+            yield from merged(list(chunk_results(chunk, solve, prefilters)) for chunk in unsolved())
+            return
+
+        threads = threads or max(1, cpu_count() // processes)
+        scratch = tempfile.mkdtemp(prefix=scratch_prefix, dir=".")
+        try:
+            with Pool(processes, _init_worker, (build, threads, scratch, prefilters)) as pool:
+                yield from merged(_merged_stats(pool.imap(_solve_chunk, unsolved())))
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+    finally:
+        if journal is not None:
+            journal.flush()
@@ -0,0 +1,5 @@
+# Bit permutations built from nibble permutations, shared by both ciphers
+
+def generate_permutation(P16_byte):
+    """Nibble permutation expanded to bits: nibble k of the result holds the four bits of nibble P16_byte[k], in order."""
+    return [e * 4 + i for e in P16_byte for i in range(4)]
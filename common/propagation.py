@@ -0,0 +1,150 @@
+import numpy as np
+
+def sbox_transitions(conv):
+    """allowed[a, b]: the nibble transition a -> b satisfies the 21 inequalities of conv, as in the models."""
+    a = np.arange(16)[:, None]
+    b = np.arange(16)[None, :]
+    allowed = np.ones((16, 16), dtype=bool)
+    for k in range(21):
+        coff = conv[9 * k:9 * k + 9]
+        expr = sum(coff[l] * ((a >> (3 - l)) & 1) for l in range(4)) + sum(coff[l] * ((b >> (7 - l)) & 1) for l in range(4, 8))
+        allowed &= expr >= -coff[8]
+    return allowed
+
+def _known_bits(matches, relation):
+    """The pattern of the bits shared by all the nibbles related to a nibble matching each pattern."""
+    reach = (matches.astype(np.int32) @ relation.astype(np.int32)) > 0
+    bits = (np.arange(16)[:, None] >> np.arange(4)) & 1
+    ones = reach.astype(np.int32) @ bits
+    total = reach.sum(axis=1)[:, None]
+    mask = ((ones == 0) | (ones == total)) & (total > 0)
+    value = mask & (ones > 0)
+    weights = 1 << np.arange(4)
+    return (mask @ weights) << 4 | (value @ weights)
+
+class SboxLayer:
+    """
+    The S-box layer on the nibbles of a state. The known bits of a nibble are a pattern mask << 4 | value:
+    forward[p] / backward[p] are the patterns implied on the other side, and compatible[p, q] tells if
+    some allowed transition matches p on the input and q on the output.
+    """
+    def __init__(self, allowed):
+        self.allowed = allowed
+        masks, values = np.arange(256) >> 4, np.arange(256) & 0xF
+        matches = (np.arange(16)[None, :] & masks[:, None]) == values[:, None]
+        self.forward_table = _known_bits(matches, allowed)
+        self.backward_table = _known_bits(matches, allowed.T)
+        m = matches.astype(np.int32)
+        self.compatible = (m @ allowed.astype(np.int32) @ m.T) > 0
+
+    @staticmethod
+    def patterns(known, value):
+        weights = 1 << np.arange(4)
+        n = known.shape[1]
+        return (known.reshape(-1, n // 4, 4) @ weights) << 4 | (value.reshape(-1, n // 4, 4) @ weights)
+
+    @staticmethod
+    def state(patterns):
+        bits = (patterns[:, :, None] >> np.arange(8)) & 1
+        known, value = bits[:, :, 4:].astype(bool), bits[:, :, :4].astype(bool)
+        return known.reshape(len(patterns), -1), value.reshape(len(patterns), -1)
+
+    def forward(self, known, value):
+        return self.state(self.forward_table[self.patterns(known, value)])
+
+    def backward(self, known, value):
+        return self.state(self.backward_table[self.patterns(known, value)])
+
+    def consistent(self, inputs, outputs):
+        return self.compatible[self.patterns(*inputs), self.patterns(*outputs)].all(axis=1)
+
+def _gf2_inverse(rows, n):
+    """The rows of the inverse of the GF(2) map given by rows, None if it is not invertible."""
+    m = np.zeros((n, 2 * n), dtype=np.uint8)
+    for j, row in enumerate(rows):
+        for i in row:
+            m[j, i] ^= 1
+        m[j, n + j] = 1
+    for c in range(n):
+        pivots = np.flatnonzero(m[c:, c])
+        if len(pivots) == 0:
+            return None
+        m[[c, c + pivots[0]]] = m[[c + pivots[0], c]]
+        others = np.flatnonzero(m[:, c])
+        others = others[others != c]
+        m[others] ^= m[c]
+    return [np.flatnonzero(m[j, n:]).tolist() for j in range(n)]
+
+def _padded(rows, n):
+    # Missing inputs point to an extra column, always known and 0
+    width = max(1, max(len(row) for row in rows))
+    return np.array([list(row) + [n] * (width - len(row)) for row in rows])
+
+class LinearLayer:
+    """A GF(2)-linear layer, output bit j being the XOR of the input bits rows[j]."""
+    def __init__(self, rows, n):
+        self.row_lists = [list(row) for row in rows]
+        self.rows = _padded(rows, n)
+        self.inverse_lists = _gf2_inverse(rows, n)
+        self.inverse_rows = None if self.inverse_lists is None else _padded(self.inverse_lists, n)
+
+    @staticmethod
+    def apply(rows, known, value):
+        pad = np.ones((len(known), 1), dtype=bool)
+        known = np.concatenate([known, pad], axis=1)[:, rows].all(axis=2)
+        value = np.bitwise_xor.reduce(np.concatenate([value, ~pad], axis=1)[:, rows], axis=2)
+        return known, value & known
+
+    def forward(self, known, value):
+        return self.apply(self.rows, known, value)
+
+    def backward(self, known, value):
+        if self.inverse_rows is None:
+            return np.zeros_like(known), np.zeros_like(value)
+        return self.apply(self.inverse_rows, known, value)
+
+    def consistent(self, inputs, outputs):
+        return np.ones(len(inputs[0]), dtype=bool)
+
+def permutation_rows(permutation):
+    """The rows of the layer x_j = y_{P^-1(j)} of the models, i.e. bit i moved to P[i]."""
+    rows = [None] * len(permutation)
+    for i, p in enumerate(permutation):
+        rows[p] = [i]
+    return rows
+
+def mc_rows(IVLBC, IVLBC_MC_pos):
+    """The rows of MC as in the models: x_j is the XOR of the three bits of y given by IVLBC_MC_pos."""
+    return [[(15 - p) + int(j / 16) * 16 for p in IVLBC_MC_pos[15 - (j % 16)]] for j in range(IVLBC)]
+
+def bits(diffs, n):
+    diffs = np.asarray(diffs, dtype=np.uint64)
+    return ((diffs[:, None] >> np.arange(n, dtype=np.uint64)) & np.uint64(1)).astype(bool)
+
+class Propagator:
+    """
+    Miss-in-the-middle on the bits of the differences: the known bits of the input are propagated forward
+    through the layers and those of the output backward, and a pair is impossible if the two disagree on a
+    bit or no S-box transition matches them. It only proves impossibility, pairs it does not reject are undecided.
+    """
+    def __init__(self, layers, n):
+        self.layers = layers
+        self.n = n
+
+    def impossible(self, in_diffs, out_diffs):
+        """Boolean array, True for the pairs proven impossible."""
+        known = np.ones((len(in_diffs), self.n), dtype=bool)
+        forward = [(known, bits(in_diffs, self.n))]
+        for layer in self.layers:
+            forward.append(layer.forward(*forward[-1]))
+        backward = [(known, bits(out_diffs, self.n))]
+        for layer in reversed(self.layers):
+            backward.append(layer.backward(*backward[-1]))
+        backward.reverse()
+
+        impossible = np.zeros(len(in_diffs), dtype=bool)
+        for (fk, fv), (bk, bv) in zip(forward, backward):
+            impossible |= (fk & bk & (fv != bv)).any(axis=1)
+        for i, layer in enumerate(self.layers):
+            impossible |= ~layer.consistent(forward[i], backward[i + 1])
+        return impossible
@@ -0,0 +1,227 @@
+import time
+from itertools import combinations
+import numpy as np
+from ddt_bitset import matrix_rows, matrix_words
+
+# Number of set bits in every byte value, for NumPy versions without np.bitwise_count
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def popcount(words):
+    """Number of set bits along the last axis of a uint64 array."""
+    words = np.ascontiguousarray(words, dtype='<u8')
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _POPCOUNT8[words.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+def row_popcounts(matrix, block_rows=4096):
+    """Popcount of every row of a packed bit matrix, computed in blocks of rows (and tiles, for on-disk matrices)."""
+    counts = np.zeros(matrix.shape[-2], dtype=np.int64)
+    for tile in (matrix if matrix.ndim == 3 else matrix[None]):
+        for start in range(0, len(tile), block_rows):
+            counts[start:start + block_rows] += popcount(tile[start:start + block_rows])
+    return counts
+
+def full_mask(size, n_words):
+    """Packed bitset with the bits 0 to size - 1 set."""
+    mask = np.zeros(n_words, dtype='<u8')
+    mask[:size // 64] = np.uint64(0xFFFFFFFFFFFFFFFF)
+    if size % 64:
+        mask[size // 64] = np.uint64((1 << (size % 64)) - 1)
+    return mask
+
+def find_minimum_columns_lazy(matrix, n, batch=256, size=None, batch_bytes=2 ** 28):
+    """
+    Lazy greedy set cover over the rows of a packed DDT bit matrix.
+    Coverage counts only ever shrink, so the count of a column from an earlier iteration is an upper bound.
+    Each iteration walks the columns by decreasing bound (the array form of a max-heap, with the column as
+    tie-break) and recounts them a batch at a time with one vectorized popcount, stopping as soon as no
+    remaining bound can beat the best fresh count. On ties the smallest column wins, exactly like a full
+    rescan of every column with the Python int masks of ddt_column_masks.
+    The elements are the bits 0 to size - 1, by default all 2^n of them. The matrix may be tiled on disk
+    (see calculate_ddt_memmap): the recounts then read at most batch_bytes of rows at a time.
+    """
+    size = size or 2 ** n
+    uncovered = full_mask(size, matrix_words(matrix))
+    bounds = row_popcounts(matrix)
+    columns = np.arange(matrix.shape[-2])
+    max_step = max(batch, batch_bytes // (8 * matrix_words(matrix)))
+    remaining = size
+    selected_columns = []
+
+    while remaining:
+        # Columns that cannot cover anything new are dropped for good
+        columns = columns[bounds[columns] > 0]
+        order = columns[np.lexsort((columns, -bounds[columns]))]
+        best_column = -1
+        best_new_coverage = 0
+        step = batch
+        start = 0
+        while start < len(order):
+            top = order[start]
+            if bounds[top] < best_new_coverage or (bounds[top] == best_new_coverage and top > best_column):
+                break
+            candidates = order[start:start + step]
+            if matrix.ndim == 3:
+                # Sorted rows read the tiles in file order
+                candidates = np.sort(candidates)
+            counts = popcount(matrix_rows(matrix, candidates) & uncovered)
+            bounds[candidates] = counts
+            # Greatest count, smallest column among equal counts
+            i = np.lexsort((candidates, -counts))[0]
+            if counts[i] > best_new_coverage or (counts[i] == best_new_coverage and candidates[i] < best_column):
+                best_new_coverage = int(counts[i])
+                best_column = int(candidates[i])
+            start += step
+            step = min(2 * step, max_step)
+
+        if best_column == -1:
+            print("No combination found to cover all bits!")
+            return []
+
+        uncovered &= ~matrix_rows(matrix, best_column)
+        bounds[best_column] = 0
+        remaining -= best_new_coverage
+        selected_columns.append(best_column)
+    print("All bits covered!")
+    print("Length of covered bits:", size)
+
+    return selected_columns
+
+def element_counts(matrix, size, block_rows=4096):
+    """Number of columns covering each element (bit position) of a packed bit matrix."""
+    counts = np.zeros(matrix.shape[1] * 64, dtype=np.int64)
+    for start in range(0, len(matrix), block_rows):
+        block = np.ascontiguousarray(matrix[start:start + block_rows], dtype='<u8')
+        counts += np.unpackbits(block.view(np.uint8), axis=1, bitorder='little').sum(axis=0, dtype=np.int64)
+    return counts[:size]
+
+def covering_columns(matrix, element):
+    """Columns whose mask contains the given element."""
+    return np.flatnonzero((matrix[:, element >> 6] >> np.uint64(element & 63)) & np.uint64(1))
+
+def mask_elements(mask):
+    """Bit positions set in a packed bitset."""
+    return np.flatnonzero(np.unpackbits(np.ascontiguousarray(mask, dtype='<u8').view(np.uint8), bitorder='little'))
+
+def cover_union(matrix, cover):
+    if len(cover) == 0:
+        return np.zeros(matrix.shape[1], dtype='<u8')
+    return np.bitwise_or.reduce(matrix[sorted(cover)], axis=0)
+
+def columns_covering_all(matrix, counts, missing):
+    """Columns whose mask contains every element of the bitset `missing`."""
+    elements = mask_elements(missing)
+    # Only the columns covering the rarest missing element are candidates
+    candidates = covering_columns(matrix, int(elements[np.argmin(counts[elements])]))
+    words = np.flatnonzero(missing)
+    hits = (matrix[np.ix_(candidates, words)] & missing[words]) == missing[words]
+    return candidates[hits.all(axis=1)]
+
+def remove_redundant_columns(matrix, cover, size):
+    """Drops columns whose elements are all covered by the other columns, last selected first."""
+    target = full_mask(size, matrix.shape[1])
+    cover = list(cover)
+    for column in reversed(list(cover)):
+        others = [c for c in cover if c != column]
+        if np.array_equal(cover_union(matrix, others) & target, target):
+            cover = others
+    return cover
+
+def packing_lower_bound(matrix, counts, max_elements=4096):
+    """
+    Lower bound on the cover size: elements whose covering columns are pairwise disjoint each need
+    their own column. Elements are packed greedily from the rarest ones.
+    """
+    used = np.zeros(len(matrix), dtype=bool)
+    packed = []
+    for element in np.argsort(counts, kind='stable')[:max_elements].tolist():
+        columns = covering_columns(matrix, element)
+        if not used[columns].any():
+            used[columns] = True
+            packed.append(element)
+    return len(packed), packed
+
+def core_lower_bound(matrix, counts, core_elements, time_limit):
+    """
+    Lower bound from the exact set cover ILP restricted to a core of elements, solved with Gurobi
+    within the time limit. Any cover of all elements covers the core, so the ILP bound is valid.
+    Returns None when gurobipy is not available.
+    """
+    try:
+        import gurobipy as gp
+        from gurobipy import GRB
+    except ImportError:
+        return None
+    rows = {element: covering_columns(matrix, element) for element in core_elements}
+    columns = sorted(set(np.concatenate(list(rows.values())).tolist()))
+    try:
+        with gp.Env(params={"OutputFlag": 0}) as env, gp.Model(env=env) as model:
+            model.Params.TimeLimit = time_limit
+            x = model.addVars(columns, vtype=GRB.BINARY)
+            for element, cols in rows.items():
+                model.addConstr(gp.quicksum(x[c] for c in cols.tolist()) >= 1)
+            model.setObjective(gp.quicksum(x.values()), GRB.MINIMIZE)
+            model.optimize()
+            return int(np.ceil(model.ObjBound - 1e-6))
+    except gp.GurobiError as e:
+        print(f"Error solving the core set cover: {e}")
+        return None
+
+def improve_cover(matrix, n, cover, time_limit=60, core_size=256, seed=0):
+    """
+    Tries to shrink a (greedy) cover within a time budget and reports a lower bound on the minimum.
+    Local search: drop redundant columns, replace two columns by one that covers what they alone
+    covered, and otherwise walk the plateau by swapping one column for another one that keeps the
+    cover complete. Returns (best cover found, lower bound).
+    """
+    start_time = time.time()
+    size = 2 ** n
+    target = full_mask(size, matrix.shape[1])
+    rng = np.random.default_rng(seed)
+
+    counts = element_counts(matrix, size)
+    lower_bound, packed = packing_lower_bound(matrix, counts)
+    core = sorted(set(packed) | set(np.argsort(counts, kind='stable')[:core_size].tolist()))
+    core_bound = core_lower_bound(matrix, counts, core, time_limit / 4)
+    if core_bound is not None:
+        lower_bound = max(lower_bound, core_bound)
+    print(f"Lower bound on the number of columns: {lower_bound}")
+
+    current = remove_redundant_columns(matrix, cover, size)
+    best = list(current)
+    while len(best) > lower_bound and time.time() - start_time < time_limit:
+        improved = False
+        for i, j in combinations(range(len(current)), 2):
+            others = [c for k, c in enumerate(current) if k != i and k != j]
+            missing = target & ~cover_union(matrix, others)
+            if not missing.any():
+                current = others
+                improved = True
+                break
+            replacements = columns_covering_all(matrix, counts, missing)
+            if len(replacements):
+                current = others + [int(replacements[0])]
+                improved = True
+                break
+            if time.time() - start_time >= time_limit:
+                break
+        if improved:
+            current = remove_redundant_columns(matrix, current, size)
+            if len(current) < len(best):
+                best = list(current)
+                print(f"Found a cover with {len(best)} columns")
+            continue
+
+        # Plateau move: swap a random column for another one keeping the cover complete
+        k = int(rng.integers(len(current)))
+        others = current[:k] + current[k + 1:]
+        missing = target & ~cover_union(matrix, others)
+        if not missing.any():
+            current = others
+            continue
+        swaps = columns_covering_all(matrix, counts, missing)
+        swaps = swaps[swaps != current[k]]
+        if len(swaps):
+            current = others + [int(rng.choice(swaps))]
+
+    return best, lower_bound
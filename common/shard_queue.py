@@ -0,0 +1,149 @@
+import os
+import ast
+import json
+import time
+import fcntl
+import socket
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
+from artifact_cache import artifact_key
+
+def queue_directory(name, inputs):
+    """
+    Directory of the queue of a task: name followed by a digest of everything its shards are computed from
+    (the pairs or representatives, the model digest, ...). A run on other inputs or another model then gets
+    a queue of its own, instead of taking the shards done by the earlier run as its own results.
+    """
+    return f"{name}_{artifact_key(name, inputs)[:16]}"
+
+class ShardQueue:
+    """
+    Work queue of the shards 0 .. count - 1 of a task, kept in a directory of a shared filesystem so
+    that workers on several machines can take part. The state file is only read and written under an
+    fcntl lock of the directory. A worker claims a free shard with a lease, which it renews while it
+    works on it. A shard whose lease expired, its worker being gone, can be claimed again by any worker;
+    the worker that held it finds out at its next renewal and stops claiming shards.
+    The results of a shard, dicts {input difference: [output differences]} appended as they are produced,
+    are kept in its own file, one dict per line.
+    """
+    def __init__(self, directory, count, lease=600.0):
+        self.directory = directory
+        self.count = count
+        self.lease = lease
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        # Shards whose results this worker has started to write
+        self._written = set()
+        os.makedirs(directory, exist_ok=True)
+        with self._state() as state:
+            if state.get("count", count) != count:
+                raise ValueError(f"{directory} holds a queue of {state['count']} shards, not {count}")
+            state["count"] = count
+
+    @contextmanager
+    def _state(self):
+        # The state is {"count": ..., "leases": {shard: [owner, expiry]}, "done": [shards]}
+        with open(os.path.join(self.directory, "queue.lock"), "a") as lock:
+            fcntl.lockf(lock, fcntl.LOCK_EX)
+            try:
+                filename = os.path.join(self.directory, "queue.json")
+                state = {"leases": {}, "done": []}
+                if os.path.exists(filename):
+                    with open(filename) as f:
+                        state = json.load(f)
+                yield state
+                temporary = f"{filename}.{self.owner}"
+                with open(temporary, "w") as f:
+                    json.dump(state, f)
+                os.replace(temporary, filename)
+            finally:
+                fcntl.lockf(lock, fcntl.LOCK_UN)
+
+    def claim(self):
+        """A shard that is neither done nor leased by a live worker, leased to this worker; None if there is none."""
+        now = time.time()
+        with self._state() as state:
+            for shard in range(self.count):
+                lease = state["leases"].get(str(shard))
+                if shard not in state["done"] and (lease is None or lease[1] < now):
+                    state["leases"][str(shard)] = [self.owner, now + self.lease]
+                    return shard
+        return None
+
+    def renew(self, shard):
+        """Extend the lease of a shard of this worker; False if it is no longer leased to this worker."""
+        with self._state() as state:
+            lease = state["leases"].get(str(shard))
+            if lease is None or lease[0] != self.owner:
+                return False
+            lease[1] = time.time() + self.lease
+            return True
+
+    def _filename(self, shard):
+        return os.path.join(self.directory, f"shard_{shard}.txt")
+
+    def append(self, shard, part):
+        """Add a part of the results of a shard to its file, private to this worker until the shard is complete."""
+        with open(f"{self._filename(shard)}.{self.owner}", "a" if shard in self._written else "w") as f:
+            f.write(repr({key: list(values) for key, values in part.items()}) + "\n")
+        self._written.add(shard)
+
+    def complete(self, shard, result=None):
+        """Store the results of a shard, with the last part `result` if any; True if it was the last shard to be done."""
+        if result is not None:
+            self.append(shard, result)
+        elif shard not in self._written:
+            # A shard without results has an empty file
+            open(f"{self._filename(shard)}.{self.owner}", "w").close()
+        os.replace(f"{self._filename(shard)}.{self.owner}", self._filename(shard))
+        self._written.discard(shard)
+        with self._state() as state:
+            # The lease of a worker that took the shard over after this one's expired is left to it
+            if state["leases"].get(str(shard), [None])[0] == self.owner:
+                del state["leases"][str(shard)]
+            if shard not in state["done"]:
+                state["done"].append(shard)
+            return len(state["done"]) == self.count
+
+    def claimed(self):
+        """
+        Yield the shards claimed by this worker one after the other, renewing the lease of each while it is
+        processed. Stops after the current shard if its lease expired and another worker claimed it.
+        """
+        while True:
+            shard = self.claim()
+            if shard is None:
+                return
+            stop = threading.Event()
+            lost = threading.Event()
+            def heartbeat():
+                while not stop.wait(self.lease / 3):
+                    if not self.renew(shard):
+                        lost.set()
+                        return
+            renewer = threading.Thread(target=heartbeat, daemon=True)
+            renewer.start()
+            try:
+                yield shard
+            finally:
+                stop.set()
+                renewer.join()
+            if lost.is_set():
+                return
+
+    def parts(self):
+        """The parts of the results of all the shards done, read one at a time in the order of the shards."""
+        with self._state() as state:
+            done = sorted(state["done"])
+        for shard in done:
+            with open(self._filename(shard)) as f:
+                for line in f:
+                    yield ast.literal_eval(line)
+
+    def merged(self):
+        """The results of all the shards done, merged into one defaultdict(list)."""
+        pairs = defaultdict(list)
+        for part in self.parts():
+            for in_diff, out_diffs in part.items():
+                pairs[in_diff].extend(out_diffs)
+        return pairs
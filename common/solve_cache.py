@@ -0,0 +1,105 @@
+import os
+import time
+import atexit
+import sqlite3
+from collections import OrderedDict
+
+# Where the outcomes are kept, shared by every run, round count and script of both ciphers
+CACHE_DIR = os.environ.get("SOLVE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".solve_cache"))
+
+# The cache of each process, a connection not being shared with forked workers
+_caches = {}
+
+def _signed(value):
+    # SQLite integers are signed 64-bit
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+class SolveCache:
+    """
+    Outcomes of solved pairs keyed by (model, in_diff, out_diff), model being a digest of the model
+    definition (see LPTemplate.digest), so a model rebuilt identically by another run or script shares
+    its outcomes and a changed model starts afresh. On disk an SQLite table clustered on its key; in
+    memory the last `capacity` outcomes looked up or recorded. Outcomes are committed in batches, so
+    the ones of the last `interval` seconds of a process may be lost, they are only solved again.
+    """
+    def __init__(self, filename, capacity=1 << 20, batch_size=1000, interval=1.0):
+        self.connection = sqlite3.connect(filename, timeout=60)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS outcomes (model INTEGER, in_diff INTEGER, out_diff INTEGER, "
+                                "feasible INTEGER, PRIMARY KEY (model, in_diff, out_diff)) WITHOUT ROWID")
+        self.connection.commit()
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.interval = interval
+        self.memory = OrderedDict()
+        self.pending = []
+        self.flushed = time.monotonic()
+
+    def _remember(self, key, feasible):
+        self.memory[key] = feasible
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
+
+    def get(self, model, in_diff, out_diff):
+        """The recorded outcome of a pair on a model, None if it is not recorded."""
+        key = (model, in_diff, out_diff)
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        row = self.connection.execute("SELECT feasible FROM outcomes WHERE model = ? AND in_diff = ? AND out_diff = ?",
+                                      (_signed(model), _signed(in_diff), _signed(out_diff))).fetchone()
+        if row is None:
+            return None
+        self._remember(key, bool(row[0]))
+        return bool(row[0])
+
+    def put(self, model, in_diff, out_diff, feasible):
+        if feasible is None:
+            return
+        self._remember((model, in_diff, out_diff), feasible)
+        self.pending.append((_signed(model), _signed(in_diff), _signed(out_diff), int(feasible)))
+        if len(self.pending) >= self.batch_size or time.monotonic() - self.flushed >= self.interval:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            with self.connection:
+                self.connection.executemany("INSERT OR REPLACE INTO outcomes VALUES (?, ?, ?, ?)", self.pending)
+            self.pending = []
+        self.flushed = time.monotonic()
+
+def solve_cache(cache_dir=None):
+    """The SolveCache of this process."""
+    if os.getpid() not in _caches:
+        cache_dir = cache_dir or CACHE_DIR
+        os.makedirs(cache_dir, exist_ok=True)
+        _caches[os.getpid()] = SolveCache(os.path.join(cache_dir, "outcomes.db"))
+        atexit.register(_caches[os.getpid()].flush)
+    return _caches[os.getpid()]
+
+def cached_solve(solve, model):
+    """solve(in_diff, out_diff) answering from the cache the pairs already solved on the model."""
+    def cached(in_diff, out_diff):
+        cache = solve_cache()
+        feasible = cache.get(model, in_diff, out_diff)
+        if feasible is None:
+            feasible = solve(in_diff, out_diff)
+            cache.put(model, in_diff, out_diff, feasible)
+        return feasible
+    return cached
+
+def cached_enumeration(feasible_outputs, model):
+    """feasible_outputs(in_diff, out_diffs) enumerating only the outputs not in the cache."""
+    def cached(in_diff, out_diffs):
+        cache = solve_cache()
+        known = {out_diff: cache.get(model, in_diff, out_diff) for out_diff in out_diffs}
+        unknown = [out_diff for out_diff, feasible in known.items() if feasible is None]
+        found = feasible_outputs(in_diff, unknown) if unknown else set()
+        if found is None:
+            return None
+        for out_diff in unknown:
+            cache.put(model, in_diff, out_diff, out_diff in found)
+        return {out_diff for out_diff, feasible in known.items() if feasible or out_diff in found}
+    return cached
@@ -0,0 +1,184 @@
+from itertools import permutations
+import numpy as np
+
+def nibble_transforms(n):
+    """
+    Candidate symmetries of n-bit values: a permutation of the nibbles combined with the same rotation of
+    the bits inside every nibble. Each one is the list of target positions of the bits 0 to n - 1.
+    """
+    transforms = []
+    for perm in permutations(range(n // 4)):
+        for rot in range(4):
+            transforms.append(tuple(4 * perm[i // 4] + (i % 4 + rot) % 4 for i in range(n)))
+    return transforms
+
+def apply_bit_map(values, positions):
+    """Moves bit i of every value to bit positions[i]."""
+    output = np.zeros_like(values)
+    for i, p in enumerate(positions):
+        output |= ((values >> i) & 1) << p
+    return output
+
+def superbox_automorphisms(table, n, samples=64, seed=0):
+    """
+    All pairs (sigma, tau) of candidate transforms with T[sigma(x)] = tau(T[x]) for every x.
+    They form a group, and the DDT support satisfies D(sigma(a)) = tau(D(a)).
+    """
+    table = np.asarray(table)
+    candidates = nibble_transforms(n)
+    xs = np.random.default_rng(seed).integers(0, 2 ** n, samples).astype(table.dtype)
+
+    # Match sigma and tau on a sample first, then check the survivors on all inputs
+    by_image = {}
+    for tau in candidates:
+        by_image.setdefault(apply_bit_map(table[xs], tau).tobytes(), []).append(tau)
+    x = np.arange(2 ** n, dtype=table.dtype)
+    group = []
+    for sigma in candidates:
+        for tau in by_image.get(table[apply_bit_map(xs, sigma)].tobytes(), []):
+            if np.array_equal(table[apply_bit_map(x, sigma)], apply_bit_map(table, tau)):
+                group.append((sigma, tau))
+    return group
+
+def canonical_values(n, transforms, dtype):
+    """Smallest image of every value under the given transforms (the identity must be one of them)."""
+    x = np.arange(2 ** n, dtype=dtype)
+    canonical = x.copy()
+    for positions in transforms:
+        np.minimum(canonical, apply_bit_map(x, positions), out=canonical)
+    return canonical
+
+def orbit_ddt_bitset(table, n, group):
+    """
+    DDT support between orbits: the DDT is only computed for one input difference per sigma-orbit.
+    Row j of the packed matrix belongs to the j-th tau-orbit of output differences, bit i to the i-th
+    sigma-orbit of input differences. Returns (matrix, input orbit representatives, output orbit
+    representatives, output canonical values).
+    """
+    table = np.asarray(table)
+    in_canonical = canonical_values(n, [sigma for sigma, _ in group], table.dtype)
+    out_canonical = canonical_values(n, [tau for _, tau in group], table.dtype)
+    in_reps = np.unique(in_canonical)
+    out_reps = np.unique(out_canonical)
+
+    out_index = np.searchsorted(out_reps, out_canonical)
+    x = np.arange(2 ** n, dtype=table.dtype)
+    reached = np.zeros((len(in_reps) + (-len(in_reps)) % 64, len(out_reps)), dtype=bool)
+    for i, a in enumerate(in_reps.tolist()):
+        reached[i, out_index[table ^ table[x ^ a]]] = True
+    matrix = np.ascontiguousarray(np.packbits(reached, axis=0, bitorder='little').T).view('<u8')
+    return matrix, in_reps, out_reps, out_canonical
+
+def expand_orbits(columns, out_canonical):
+    """All output differences in the orbits of the given representatives, in increasing order."""
+    return np.flatnonzero(np.isin(out_canonical, columns)).tolist()
+
+def _bit_image(image, rot, i):
+    return 4 * image[i // 4] + (i % 4 + rot) % 4
+
+def _sbox_invariant(allowed, rot):
+    # allowed[r(a), r(b)] = allowed[a, b] for the rotation r of the nibble bits by rot
+    r = np.array([((a << rot) | (a >> (4 - rot))) & 0xF for a in range(16)])
+    return np.array_equal(allowed[np.ix_(r, r)], allowed)
+
+def _forced(image, rot, layers):
+    """
+    Extend a partial nibble map by the images the rows of the layers force, None on a contradiction.
+    The row of sigma(j) is the image of the row of j: a known image of the nibble of j leaves each input
+    nibble of its row the nibbles of the image row as candidates, and known images of all the inputs of
+    a row give the bit whose row they form, hence the image of j.
+    """
+    image = list(image)
+    n = 4 * len(image)
+    changed = True
+    while changed:
+        changed = False
+        domains = [{k} if k is not None else set(range(len(image))) - set(image) for k in image]
+        for rows, index in layers:
+            for j, row in enumerate(rows):
+                known = all(image[i // 4] is not None for i in row)
+                if image[j // 4] is not None:
+                    target = rows[_bit_image(image, rot, j)]
+                    if len(target) != len(row):
+                        return None
+                    for i in row:
+                        domains[i // 4] &= {t // 4 for t in target if t % 4 == (i % 4 + rot) % 4}
+                    if known and sorted(_bit_image(image, rot, i) for i in row) != sorted(target):
+                        return None
+                elif known:
+                    t = index.get(tuple(sorted(_bit_image(image, rot, i) for i in row)))
+                    if t is None or t % 4 != (j % 4 + rot) % 4:
+                        return None
+                    domains[j // 4] &= {t // 4}
+        for k, domain in enumerate(domains):
+            if not domain:
+                return None
+            if image[k] is None and len(domain) == 1:
+                (target,) = domain
+                if target in image:
+                    return None
+                image[k] = target
+                changed = True
+    return image
+
+def layer_automorphisms(layers, n):
+    """
+    The transforms of nibble_transforms that commute with every layer of a Propagator: the S-box layers
+    when their transitions are invariant under the rotation of the nibble bits, the linear layers when
+    the row of every image bit is the image of the row. A pair of differences and its image under one of
+    them are both feasible or both infeasible in the model of these layers.
+    """
+    linear = [layer for layer in layers if hasattr(layer, "row_lists")]
+    forcing = []
+    for layer in linear:
+        for rows in (layer.row_lists, layer.inverse_lists):
+            if rows is not None:
+                forcing.append((rows, {tuple(sorted(row)): j for j, row in enumerate(rows)}))
+    group = []
+    for rot in range(4):
+        if not all(_sbox_invariant(layer.allowed, rot) for layer in layers if hasattr(layer, "allowed")):
+            continue
+        def search(image):
+            image = _forced(image, rot, forcing)
+            if image is None:
+                return
+            if None not in image:
+                sigma = tuple(_bit_image(image, rot, i) for i in range(n))
+                if all(sorted(sigma[i] for i in layer.row_lists[j]) == sorted(layer.row_lists[sigma[j]])
+                       for layer in linear for j in range(n)):
+                    group.append(sigma)
+                return
+            k = image.index(None)
+            for target in range(n // 4):
+                if target not in image:
+                    search(image[:k] + [target] + image[k + 1:])
+        search([None] * (n // 4))
+    return group
+
+class PairCanonicalizer:
+    """
+    Orbit representative of pairs of differences under a group of transforms: the smallest image
+    (out_diff, in_diff) over the group, applied to 64-bit values through one 256-entry table per byte.
+    """
+    def __init__(self, group, n=64):
+        self.group = group
+        bytes_ = np.arange(256, dtype=np.uint64)
+        self.tables = [np.stack([apply_bit_map(bytes_ << np.uint64(8 * t), positions) for t in range(n // 8)])
+                       for positions in group]
+
+    def apply(self, tables, values):
+        output = np.zeros_like(values)
+        for t, table in enumerate(tables):
+            output |= table[(values >> np.uint64(8 * t)) & np.uint64(0xFF)]
+        return output
+
+    def __call__(self, in_diffs, out_diffs):
+        """The representative (in_diff, out_diff) of every pair."""
+        a = np.asarray(in_diffs, dtype=np.uint64)
+        b = np.asarray(out_diffs, dtype=np.uint64)
+        best_a, best_b = a.copy(), b.copy()
+        for tables in self.tables:
+            ga, gb = self.apply(tables, a), self.apply(tables, b)
+            better = (gb < best_b) | ((gb == best_b) & (ga < best_a))
+            best_a[better], best_b[better] = ga[better], gb[better]
+        return list(zip(best_a.tolist(), best_b.tolist()))
@@ -0,0 +1,119 @@
+import numpy as np
+from milp_model import LinearSystem
+from milp_backend import build_model
+from propagation import SboxLayer
+
+def activity(diffs, n):
+    """The nibble activity patterns of differences: bit k is set if nibble k is non-zero."""
+    diffs = np.asarray(diffs, dtype=np.uint64)
+    nibbles = (diffs[:, None] >> (4 * np.arange(n // 4, dtype=np.uint64))) & np.uint64(0xF)
+    return ((nibbles != 0) << np.arange(n // 4)).sum(axis=1).tolist()
+
+def _supports(rows):
+    """For every output nibble, the input nibbles its bits depend on."""
+    return [sorted({i // 4 for j in range(4 * k, 4 * k + 4) for i in rows[j]}) for k in range(len(rows) // 4)]
+
+def _components(supports):
+    """The groups of input and output nibbles connected through the supports, as (inputs, outputs)."""
+    parent = list(range(2 * len(supports)))
+    def find(u):
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+    for k, support in enumerate(supports):
+        for s in support:
+            parent[find(len(supports) + k)] = find(s)
+    groups = {}
+    for u in range(2 * len(supports)):
+        inputs, outputs = groups.setdefault(find(u), ([], []))
+        (inputs if u < len(supports) else outputs).append(u % len(supports))
+    return list(groups.values())
+
+def branch_number(rows, inputs, outputs):
+    """Minimum number of active input and output nibbles of the layer restricted to a component of at most 16 input bits."""
+    bits = [4 * s + b for s in inputs for b in range(4)]
+    values = np.arange(1, 1 << len(bits), dtype=np.int64)
+    state = np.zeros((len(values), max(bits) + 1), dtype=bool)
+    for t, i in enumerate(bits):
+        state[:, i] = (values >> t) & 1
+    active = sum((values >> (4 * t)) & 0xF != 0 for t in range(len(inputs)))
+    for k in outputs:
+        nibble = np.zeros(len(values), dtype=bool)
+        for j in range(4 * k, 4 * k + 4):
+            nibble |= np.bitwise_xor.reduce(state[:, rows[j]], axis=1)
+        active = active + nibble
+    return int(active.min())
+
+def add_sbox_activity(system, a, b, allowed):
+    # Zero goes to zero and non-zero to non-zero for the transitions allowed by conv
+    for k in range(len(a)):
+        if not allowed[0, 1:].any():
+            system.add_constr([a[k], b[k]], [1, -1], ">", 0)
+        if not allowed[1:, 0].any():
+            system.add_constr([b[k], a[k]], [1, -1], ">", 0)
+
+def add_linear_activity(system, a, b, layer, name):
+    """An active output nibble needs an active input nibble in its support, and the converse through the inverse."""
+    supports = _supports(layer.row_lists)
+    for k, support in enumerate(supports):
+        system.add_constr([b[k]] + [a[s] for s in support], [-1] + [1] * len(support), ">", 0)
+    if layer.inverse_lists is not None:
+        for s, support in enumerate(_supports(layer.inverse_lists)):
+            system.add_constr([a[s]] + [b[k] for k in support], [-1] + [1] * len(support), ">", 0)
+    # Branch number of the small components, e.g. the 16-bit blocks of MC
+    for c, (inputs, outputs) in enumerate(_components(supports)):
+        if len(inputs) > 4 or not outputs:
+            continue
+        bound = branch_number(layer.row_lists, inputs, outputs)
+        if bound <= 2:
+            continue
+        d = system.add_vars(1, f"d{name}_{c}")[0]
+        for u in [a[s] for s in inputs] + [b[k] for k in outputs]:
+            system.add_constr([d, u], [1, -1], ">", 0)
+        system.add_constr([a[s] for s in inputs] + [b[k] for k in outputs] + [d],
+                          [1] * (len(inputs) + len(outputs)) + [-bound], ">", 0)
+
+class TruncatedFilter:
+    """
+    Word-level first stage: the nibble activity of the states through the layers of a Propagator, the
+    S-boxes keeping activity and the linear layers bounded by their supports and branch numbers. It is
+    a relaxation of the bit-level model, so a pair whose activity patterns are impossible is impossible.
+    Each pair of patterns is decided once on the small model and remembered.
+    """
+    def __init__(self, layers, n, backend="GUROBI"):
+        self.layers = layers
+        self.n = n
+        self.backend = backend
+        self.decided = {}
+        self._model = None
+
+    def __getstate__(self):
+        # The solver model is built again in each worker process
+        state = dict(self.__dict__)
+        state["_model"] = None
+        return state
+
+    def model(self):
+        if self._model is None:
+            system = LinearSystem()
+            a = system.add_vars(self.n // 4, "a0")
+            inputs = a
+            for r, layer in enumerate(self.layers, 1):
+                b = system.add_vars(self.n // 4, f"a{r}")
+                if isinstance(layer, SboxLayer):
+                    add_sbox_activity(system, a, b, layer.allowed)
+                else:
+                    add_linear_activity(system, a, b, layer, r)
+                a = b
+            self._model = build_model(self.backend, system, inputs, a)
+        return self._model
+
+    def impossible(self, in_diffs, out_diffs):
+        """Boolean array, True for the pairs whose activity patterns are impossible."""
+        result = np.zeros(len(in_diffs), dtype=bool)
+        for i, key in enumerate(zip(activity(in_diffs, self.n), activity(out_diffs, self.n))):
+            if key not in self.decided:
+                self.decided[key] = self.model().solve(*key) is False
+            result[i] = self.decided[key]
+        return result
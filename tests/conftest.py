@@ -0,0 +1,126 @@
+import os
+import ast
+import sys
+import functools
+import importlib.util
+import numpy as np
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+# The modules shared by both ciphers are in ../common
+sys.path.insert(1, os.path.join(ROOT, "common"))
+
+# Modules of the same name in both cipher folders, imported by the scripts of each
+_CIPHER_MODULES = ("superbox", "cipher_layer")
+
+# S-boxes of the super-boxes, as in RepresentativeSet_Algo.py
+GIFT_SBOX_INV = [0xd, 0x0, 0x8, 0x6, 0x2, 0xc, 0x4, 0xb, 0xe, 0x7, 0x1, 0xa, 0x3, 0x9, 0xf, 0x5]
+IVLBC_SBOX = [0x0, 0xf, 0xe, 0x5, 0xd, 0x3, 0x6, 0xc, 0xb, 0x9, 0xa, 0x8, 0x7, 0x4, 0x2, 0x1]
+
+@functools.lru_cache(maxsize=None)
+def load_cipher_module(cipher, name):
+    """Module `name` of a cipher folder (GIFT-64 or IVLBC), imported under a name of its own so both ciphers can be loaded."""
+    directory = os.path.join(ROOT, cipher)
+    sys.path.insert(0, directory)
+    for shadowed in _CIPHER_MODULES:
+        sys.modules.pop(shadowed, None)
+    try:
+        spec = importlib.util.spec_from_file_location(f"{cipher.replace('-', '_')}_{name}", os.path.join(directory, f"{name}.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(directory)
+        for shadowed in _CIPHER_MODULES:
+            sys.modules.pop(shadowed, None)
+    return module
+
+def script_literal(cipher, script, name):
+    """The literal assigned to `name` in a script of a cipher folder, e.g. the conv inequalities of its main block."""
+    with open(os.path.join(ROOT, cipher, f"{script}.py")) as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == name for t in node.targets):
+            try:
+                return ast.literal_eval(node.value)
+            except ValueError:
+                continue
+    raise KeyError(f"No literal {name} in {cipher}/{script}.py")
+
+def cipher_layers(cipher):
+    """The arguments the MILP scripts of a cipher pass after the block size and rounds: (P1, P2, P, conv) or (Perm, conv, IVLBC_MC_pos)."""
+    from permutation import generate_permutation
+    cipher_layer = load_cipher_module(cipher, "cipher_layer")
+    if cipher == "GIFT-64":
+        conv = script_literal(cipher, "GIFT_IDs_MILP", "conv")
+        return (cipher_layer.block_permutation(cipher_layer.GIFT_P16, 4), generate_permutation(cipher_layer.GIFT_P2_16_BYTE),
+                cipher_layer.GIFT_P64, conv)
+    conv = script_literal(cipher, "IVLBC_IDs_MILP", "conv")
+    return generate_permutation(cipher_layer.IVLBC_P16_BYTE), conv, cipher_layer.initialize_mc_positions()
+
+def one_block_differences(rng, count, blocks=4):
+    """Random 64-bit differences with one active 16-bit block."""
+    return [int(rng.integers(1, 1 << 16)) << (16 * int(rng.integers(blocks))) for _ in range(count)]
+
+def random_trail(layers, in_diff, n, rng):
+    """The output difference of a random trail from in_diff through the layers of a Propagator, so a feasible pair."""
+    from propagation import SboxLayer, bits
+    state = bits([in_diff], n)[0]
+    for layer in layers:
+        if isinstance(layer, SboxLayer):
+            nibbles = state.reshape(-1, 4) @ (1 << np.arange(4))
+            outputs = np.array([rng.choice(np.flatnonzero(layer.allowed[a])) for a in nibbles])
+            state = ((outputs[:, None] >> np.arange(4)) & 1).astype(bool).reshape(-1)
+        else:
+            state = np.array([np.bitwise_xor.reduce(state[row]) if row else False for row in layer.row_lists])
+    return sum(1 << i for i in np.flatnonzero(state).tolist())
+
+def sample_pairs(propagator, seed, count=30):
+    """Feasible pairs along random trails, then as many random pairs of one-block differences, mostly impossible."""
+    rng = np.random.default_rng(seed)
+    in_diffs = one_block_differences(rng, count)
+    out_diffs = [random_trail(propagator.layers, in_diff, propagator.n, rng) for in_diff in in_diffs]
+    return in_diffs + one_block_differences(rng, count), out_diffs + one_block_differences(rng, count)
+
+@pytest.fixture(params=[("GIFT-64", "GIFT_Potential_Pairs_MILP", "potential_ID", 1), ("IVLBC", "IVLBC_Potential_Pairs_MILP", "potential_ID", 1),
+                        ("GIFT-64", "GIFT_IDs_MILP", "ID", 4), ("IVLBC", "IVLBC_IDs_MILP", "ID", 2)],
+                ids=lambda param: f"{param[0]}-{param[2]}-r{param[3]}")
+def round_model(request):
+    """(cipher, script module, kind, rounds, layers) of a model small enough for a size-limited Gurobi license."""
+    pytest.importorskip("gurobipy")
+    cipher, script, kind, rounds = request.param
+    return cipher, load_cipher_module(cipher, script), kind, rounds, cipher_layers(cipher)
+
+@pytest.fixture(autouse=True)
+def fresh_models():
+    """Models and LP templates are cached per process by kind, size and rounds, which both ciphers share."""
+    import milp_model
+    import lp_template
+    milp_model._models.clear()
+    milp_model._screened.clear()
+    lp_template._templates.clear()
+    yield
+
+@functools.lru_cache(maxsize=None)
+def superbox_table(cipher, n):
+    """The S o P o S (GIFT-64) or S o MC o S (IVLBC) table of an n-bit super-box."""
+    superbox = load_cipher_module(cipher, "superbox")
+    cipher_layer = load_cipher_module(cipher, "cipher_layer")
+    if cipher == "GIFT-64":
+        return superbox.build_sps_table(GIFT_SBOX_INV, cipher_layer.superbox_permutation(n), n)
+    return superbox.build_sms_table(IVLBC_SBOX, cipher_layer.superbox_mc(n), n)
+
+def brute_force_ddt(table):
+    """reached[c, a]: some x has table[x] ^ table[x ^ a] == c, computed one input difference at a time."""
+    table = np.asarray(table)
+    x = np.arange(len(table))
+    reached = np.zeros((len(table), len(table)), dtype=bool)
+    for a in range(len(table)):
+        reached[table[x] ^ table[x ^ a], a] = True
+    return reached
+
+@pytest.fixture(params=[("GIFT-64", 8), ("GIFT-64", 12), ("IVLBC", 8), ("IVLBC", 12)],
+                ids=lambda param: f"{param[0]}-n{param[1]}")
+def superbox(request):
+    """(n, table) of a small super-box of each cipher."""
+    cipher, n = request.param
+    return n, superbox_table(cipher, n)
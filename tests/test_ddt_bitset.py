@@ -0,0 +1,32 @@
+import numpy as np
+from conftest import brute_force_ddt
+from ddt_bitset import calculate_ddt_bitset, calculate_ddt_memmap, ddt_column_masks, matrix_rows
+
+def unpacked(rows):
+    """The bits of packed rows as a bool array, bit a of a row in column a."""
+    rows = np.ascontiguousarray(rows, dtype='<u8')
+    return np.unpackbits(rows.view(np.uint8), axis=-1, bitorder='little').astype(bool)
+
+def test_bitset_matches_brute_force(superbox):
+    n, table = superbox
+    matrix = calculate_ddt_bitset(table, processes=1)
+    assert matrix.shape == (2 ** n, max(1, 2 ** n // 64))
+    assert np.array_equal(unpacked(matrix)[:, :2 ** n], brute_force_ddt(table))
+
+def test_bitset_with_several_workers(superbox):
+    n, table = superbox
+    assert np.array_equal(calculate_ddt_bitset(table, processes=2, chunk_words=1), calculate_ddt_bitset(table, processes=1))
+
+def test_memmap_matches_brute_force(superbox, tmp_path):
+    n, table = superbox
+    # Tiles of one word, so the matrix is split over several of them
+    matrix = calculate_ddt_memmap(table, str(tmp_path / "matrix.npy"), processes=2, tile_bytes=8 * 2 ** n)
+    assert matrix.ndim == 3 and matrix.shape[0] == max(1, 2 ** n // 64)
+    rows = matrix_rows(matrix, np.arange(2 ** n))
+    assert np.array_equal(unpacked(rows)[:, :2 ** n], brute_force_ddt(table))
+
+def test_column_masks_match_brute_force(superbox):
+    n, table = superbox
+    reached = brute_force_ddt(table)
+    expected = [sum(1 << a for a in np.flatnonzero(row).tolist()) for row in reached]
+    assert ddt_column_masks(calculate_ddt_bitset(table, processes=1)) == expected
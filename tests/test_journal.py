@@ -0,0 +1,60 @@
+from milp_journal import PairJournal
+from milp_pool import pair_results
+
+def parity(in_diff, out_diff):
+    """A stand-in pair solver, feasible when the pair has an even weight."""
+    return bin(in_diff ^ out_diff).count("1") % 2 == 0
+
+def test_records_survive_reopening(tmp_path):
+    filename = str(tmp_path / "journal.db")
+    journal = PairJournal(filename, model=7, batch_size=2)
+    # Differences with the top bit set do not fit a signed SQLite integer as they are
+    journal.record((1 << 63 | 5, 3), True, 0.5)
+    journal.record((2, 1 << 64 - 1), False, 0.5)
+    journal.record((4, [8, 9, 10]), {9}, 3.0)
+    # An undecided result is left to solve again
+    journal.record((6, 7), None, 1.0)
+    journal.close()
+
+    journal = PairJournal(filename, model=7)
+    assert len(journal) == 5
+    assert journal.feasible(1 << 63 | 5, 3) is True
+    assert journal.feasible(2, 1 << 64 - 1) is False
+    assert journal.feasible(6, 7) is None
+    assert journal.feasible_outputs(4, [8, 9, 10]) == {9}
+    assert journal.feasible_outputs(4, [8, 11]) is None
+    assert journal.lookup([(1 << 63 | 5, 3), (4, [8, 10]), (6, 7)]) == [True, set(), None]
+    journal.close()
+
+def test_rows_are_kept_per_model(tmp_path):
+    filename = str(tmp_path / "journal.db")
+    journal = PairJournal(filename, model=1)
+    journal.record((1, 2), True, 0.1)
+    journal.close()
+    other = PairJournal(filename, model=2)
+    assert len(other) == 0 and other.feasible(1, 2) is None
+    other.record((1, 2), False, 0.1)
+    other.close()
+    assert PairJournal(filename, model=1).feasible(1, 2) is True
+
+def test_pair_results_resume_from_the_journal(tmp_path):
+    filename = str(tmp_path / "journal.db")
+    pairs = [(a, b) for a in range(1, 9) for b in range(1, 9)]
+    journal = PairJournal(filename, batch_size=1 << 20, interval=1e9)
+    results = pair_results(pairs, lambda: parity, chunk_size=4, journal=journal)
+    # The run stops after a few chunks, the journal being flushed as the stream is closed
+    first = [next(results) for _ in range(10)]
+    results.close()
+    journal.close()
+
+    solved = []
+    def solve(in_diff, out_diff):
+        solved.append((in_diff, out_diff))
+        return parity(in_diff, out_diff)
+    journal = PairJournal(filename)
+    resumed = list(pair_results(pairs, lambda: solve, chunk_size=4, journal=journal))
+    journal.close()
+    assert resumed == [(a, b, parity(a, b)) for a, b in pairs]
+    assert resumed[:10] == first
+    # Only the pairs after the last one returned before the stop are solved again
+    assert solved == pairs[10:]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from conftest import load_cipher_module, superbox_table
+from artifact_cache import load_arrays
+from milp_data import PartitionTable, save_partition_table
+
+def quadratic_partition(table, representatives):
+    """The classes as ddt.py built them first: each DDT row without the differences of the classes before it."""
+    x = np.arange(len(table))
+    ddt = {i: set((table[x] ^ table[x ^ i]).tolist()) for i in representatives}
+    H = {}
+    for i in representatives:
+        H[i] = ddt[i]
+        for j in representatives:
+            if j != i:
+                ddt[j] = ddt[j] - H[i]
+    return H
+
+@pytest.mark.parametrize("cipher", ["GIFT-64", "IVLBC"])
+@pytest.mark.parametrize("n", [8, 12])
+def test_partition_matches_quadratic_filter(cipher, n, tmp_path):
+    ddt = load_cipher_module(cipher, "ddt")
+    table = superbox_table(cipher, n)
+    rng = np.random.default_rng(n)
+    representatives = [0] + sorted(rng.choice(np.arange(1, 2 ** n), 12, replace=False).tolist())
+    expected = quadratic_partition(table, representatives)
+
+    ddt.save_partition(str(tmp_path), table, 2 ** n, representatives)
+    partition = load_arrays(str(tmp_path))
+    H = ddt.load_partition(partition)
+    assert list(H) == representatives
+    for i in representatives:
+        assert H[i] == sorted(expected[i])
+    assert partition["ddt_sizes"].tolist() == [len(np.unique(table ^ table[np.arange(2 ** n) ^ i])) for i in representatives]
+    # The differences in no class are labeled as such
+    covered = set().union(*expected.values())
+    unlabeled = np.flatnonzero(partition["labels"] == ddt.UNLABELED).tolist()
+    assert unlabeled == [d for d in range(2 ** n) if d not in covered]
+
+@pytest.mark.parametrize("cipher", ["GIFT-64", "IVLBC"])
+def test_partition_table_round_trip(cipher, tmp_path):
+    ddt = load_cipher_module(cipher, "ddt")
+    table = superbox_table(cipher, 8)
+    representatives = [0, 3, 17, 64, 200]
+    directory = tmp_path / "partition"
+    directory.mkdir()
+    ddt.save_partition(str(directory), table, 256, representatives)
+    H = ddt.load_partition(load_arrays(str(directory)))
+    save_partition_table("ddt", H, str(tmp_path))
+    stored = PartitionTable("ddt", str(tmp_path))
+    assert dict(stored) == {i: H[i] for i in representatives}
+    assert [stored.class_size(i) for i in representatives] == [len(H[i]) for i in representatives]
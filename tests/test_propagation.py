@@ -0,0 +1,30 @@
+import numpy as np
+from conftest import sample_pairs
+
+def solvers(module, kind, rounds, layers, tmp_path):
+    """solve(in_diff, out_diff) on the persistent model and through an LP file, as the scripts build them."""
+    solver = getattr(module, f"{kind}_solver")
+    return (solver(64, rounds, *layers, True),
+            solver(64, rounds, *layers, False, filename=str(tmp_path / "pair.lp")))
+
+def test_persistent_model_matches_lp_file(round_model, tmp_path):
+    cipher, module, kind, rounds, layers = round_model
+    persistent, lp_file = solvers(module, kind, rounds, layers, tmp_path)
+    in_diffs, out_diffs = sample_pairs(getattr(module, f"{kind}_propagator")(64, rounds, *layers), seed=rounds, count=20)
+    # Solved in turn on the same model, only the boundary bits changing between pairs
+    results = [persistent(in_diff, out_diff) for in_diff, out_diff in zip(in_diffs, out_diffs)]
+    assert results == [lp_file(in_diff, out_diff) for in_diff, out_diff in zip(in_diffs, out_diffs)]
+    # The pairs along trails are feasible
+    assert all(results[:20])
+
+def test_propagator_never_rejects_a_feasible_pair(round_model, tmp_path):
+    cipher, module, kind, rounds, layers = round_model
+    persistent, _ = solvers(module, kind, rounds, layers, tmp_path)
+    propagator = getattr(module, f"{kind}_propagator")(64, rounds, *layers)
+    in_diffs, out_diffs = sample_pairs(propagator, seed=rounds + 1)
+    impossible = propagator.impossible(in_diffs, out_diffs)
+    feasible = np.array([persistent(in_diff, out_diff) is True for in_diff, out_diff in zip(in_diffs, out_diffs)])
+    assert not (impossible & feasible).any()
+    assert feasible[:30].all() and not impossible[:30].any()
+    # It does reject pairs, all of them infeasible
+    assert impossible.any()
@@ -0,0 +1,53 @@
+import numpy as np
+from ddt_bitset import calculate_ddt_bitset, calculate_ddt_memmap, ddt_column_masks
+from set_cover import find_minimum_columns_lazy, improve_cover, cover_union, full_mask
+
+def greedy_cover(masks, n):
+    """The greedy cover of the column masks as Python ints, rescanning every column at each step."""
+    target = (1 << 2 ** n) - 1
+    covered = 0
+    selected = []
+    while covered != target:
+        best_column, best_count = -1, 0
+        for column, mask in enumerate(masks):
+            count = (mask & ~covered).bit_count()
+            if count > best_count:
+                best_column, best_count = column, count
+        if best_column == -1:
+            return []
+        covered |= masks[best_column]
+        selected.append(best_column)
+    return selected
+
+def is_cover(matrix, n, cover):
+    target = full_mask(2 ** n, matrix.shape[1])
+    return np.array_equal(cover_union(matrix, cover) & target, target)
+
+def test_lazy_greedy_matches_greedy(superbox):
+    n, table = superbox
+    matrix = calculate_ddt_bitset(table, processes=1)
+    assert find_minimum_columns_lazy(matrix, n, batch=4) == greedy_cover(ddt_column_masks(matrix), n)
+
+def test_lazy_greedy_on_tiles(superbox, tmp_path):
+    n, table = superbox
+    tiles = calculate_ddt_memmap(table, str(tmp_path / "matrix.npy"), processes=1, tile_bytes=8 * 2 ** n)
+    assert find_minimum_columns_lazy(tiles, n, batch=4) == find_minimum_columns_lazy(calculate_ddt_bitset(table, processes=1), n)
+
+def test_improve_cover_keeps_a_cover(superbox):
+    n, table = superbox
+    matrix = calculate_ddt_bitset(table, processes=1)
+    greedy = find_minimum_columns_lazy(matrix, n)
+    cover, lower_bound = improve_cover(matrix, n, greedy, time_limit=2)
+    assert is_cover(matrix, n, cover)
+    assert len(set(cover)) == len(cover)
+    assert lower_bound <= len(cover) <= len(greedy)
+
+def test_improve_cover_drops_redundant_columns(superbox):
+    n, table = superbox
+    matrix = calculate_ddt_bitset(table, processes=1)
+    greedy = find_minimum_columns_lazy(matrix, n)
+    # Every column added to the greedy cover is redundant
+    padded = greedy + [c for c in range(2 ** n) if c not in greedy][:8]
+    cover, _ = improve_cover(matrix, n, padded, time_limit=2)
+    assert is_cover(matrix, n, cover)
+    assert len(cover) <= len(greedy)
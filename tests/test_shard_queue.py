@@ -0,0 +1,79 @@
+import time
+import pytest
+from shard_queue import ShardQueue, queue_directory
+
+def worker(directory, owner, count=3, lease=600.0):
+    """A queue of another worker, as on another machine."""
+    queue = ShardQueue(str(directory), count, lease)
+    queue.owner = owner
+    return queue
+
+def test_shards_are_claimed_once(tmp_path):
+    first, second = worker(tmp_path, "a"), worker(tmp_path, "b")
+    assert [first.claim(), second.claim(), first.claim(), second.claim()] == [0, 1, 2, None]
+    assert first.complete(0) is False
+    assert second.complete(1) is False
+    assert first.complete(2) is True
+    assert second.claim() is None
+
+def test_queue_of_another_shard_count(tmp_path):
+    worker(tmp_path, "a", count=3)
+    with pytest.raises(ValueError):
+        worker(tmp_path, "b", count=4)
+
+def test_expired_lease_is_taken_over(tmp_path):
+    first, second = worker(tmp_path, "a", lease=0.05), worker(tmp_path, "b", count=3, lease=600.0)
+    assert first.claim() == 0
+    assert second.claim() == 1
+    time.sleep(0.1)
+    # Shard 0 is free again, its worker being gone
+    assert second.claim() == 0
+    assert first.renew(0) is False
+    assert second.renew(0) is True
+    # The late worker completing the shard leaves the lease of the new one alone
+    first.complete(0, {1: [2]})
+    assert second.renew(0) is True
+
+def test_claimed_stops_after_a_lost_lease(tmp_path):
+    first, second = worker(tmp_path, "a", lease=0.3), worker(tmp_path, "b")
+    shards = []
+    for shard in first.claimed():
+        shards.append(shard)
+        # The lease expires and another worker claims the shard before the heartbeat renews it
+        with second._state() as state:
+            state["leases"][str(shard)] = ["b", time.time() + 600]
+        time.sleep(0.3)
+    assert shards == [0]
+    assert second.renew(0) is True
+
+def test_claimed_renews_the_leases(tmp_path):
+    first, second = worker(tmp_path, "a", count=1, lease=0.3), worker(tmp_path, "b", count=1)
+    shards = []
+    for shard in first.claimed():
+        shards.append(shard)
+        # Past the lease, the heartbeat keeps the shard from the other worker
+        time.sleep(0.5)
+        assert second.claim() is None
+        assert first.complete(shard) is True
+    assert shards == [0]
+
+def test_results_of_the_shards(tmp_path):
+    first, second = worker(tmp_path, "a"), worker(tmp_path, "b")
+    assert first.claim() == 0 and second.claim() == 1 and first.claim() == 2
+    first.append(0, {1: [2, 3]})
+    second.append(1, {4: [5]})
+    first.append(0, {6: [7]})
+    # The parts of a shard are not read until it is complete
+    assert list(first.parts()) == []
+    first.complete(0, {1: [8]})
+    second.complete(1)
+    first.complete(2)
+    assert list(second.parts()) == [{1: [2, 3]}, {6: [7]}, {1: [8]}, {4: [5]}]
+    assert second.merged() == {1: [2, 3, 8], 6: [7], 4: [5]}
+
+def test_queue_directory_depends_on_the_inputs():
+    inputs = {"model": "0" * 32, "pairs": [(1, 2)]}
+    assert queue_directory("IDs", inputs) == queue_directory("IDs", dict(inputs))
+    assert queue_directory("IDs", inputs) != queue_directory("IDs", {**inputs, "model": "1" * 32})
+    assert queue_directory("IDs", inputs) != queue_directory("IDs", {**inputs, "pairs": [(1, 3)]})
+    assert queue_directory("IDs", inputs).startswith("IDs_")
@@ -0,0 +1,51 @@
+import pytest
+import solve_cache
+from solve_cache import SolveCache, cached_solve, cached_enumeration
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """A cache directory of the test, with no cache opened in this process yet."""
+    monkeypatch.setattr(solve_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(solve_cache, "_caches", {})
+    return tmp_path
+
+def unsolvable(in_diff, out_diff):
+    raise AssertionError(f"({in_diff}, {out_diff}) solved again")
+
+def test_outcomes_survive_reopening(tmp_path):
+    filename = str(tmp_path / "outcomes.db")
+    cache = SolveCache(filename, capacity=2, batch_size=1 << 20, interval=1e9)
+    cache.put(1 << 63 | 1, 1 << 64 - 1, 2, True)
+    cache.put(5, 3, 4, False)
+    cache.put(5, 3, 6, None)
+    cache.flush()
+    cache = SolveCache(filename, capacity=1)
+    assert cache.get(1 << 63 | 1, 1 << 64 - 1, 2) is True
+    assert cache.get(5, 3, 4) is False
+    assert cache.get(5, 3, 6) is None
+    # Another model does not share them
+    assert cache.get(6, 3, 4) is None
+
+def test_cached_solve_resumes_from_the_cache(cache_dir):
+    solve = cached_solve(lambda in_diff, out_diff: in_diff < out_diff, model=11)
+    assert [solve(a, b) for a, b in [(1, 2), (2, 1), (3, 3)]] == [True, False, False]
+    solve_cache.solve_cache().flush()
+
+    # A later run opens the cache again and does not solve these pairs
+    solve_cache._caches.clear()
+    solve = cached_solve(unsolvable, model=11)
+    assert [solve(a, b) for a, b in [(1, 2), (2, 1), (3, 3)]] == [True, False, False]
+    with pytest.raises(AssertionError):
+        cached_solve(unsolvable, model=12)(1, 2)
+
+def test_cached_enumeration_only_enumerates_unknown_outputs(cache_dir):
+    asked = []
+    def feasible_outputs(in_diff, out_diffs):
+        asked.append(list(out_diffs))
+        return {out_diff for out_diff in out_diffs if out_diff % 2}
+    enumerate_outputs = cached_enumeration(feasible_outputs, model=3)
+    assert enumerate_outputs(1, [1, 2, 3]) == {1, 3}
+    assert enumerate_outputs(1, [2, 3, 4, 5]) == {3, 5}
+    assert asked == [[1, 2, 3], [4, 5]]
+    assert enumerate_outputs(1, [1, 4]) == {1}
+    assert len(asked) == 2